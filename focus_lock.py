@@ -2,32 +2,398 @@ import sys
 import os
 import subprocess
 import time
-import threading
-import pygetwindow as gw
-import keyboard
+import math
+import re
+import struct
+import functools
+import logging
+import concurrent.futures
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QPushButton, QLabel, QVBoxLayout,
     QFileDialog, QComboBox, QMessageBox, QHBoxLayout, QSizePolicy, QFrame
 )
-from PyQt5.QtCore import QTimer, Qt, QSize, QPoint
+from PyQt5.QtCore import QTimer, Qt, QSize, QPoint, QFile, QTemporaryFile, QDir, QUrl
 from PyQt5.QtGui import QIcon, QPixmap, QColor, QPalette
+import resources_rc # Registers the embedded, pre-scaled icons under :/icons (built from resources.qrc)
 import ctypes # Needed for taskbar and task manager hiding/showing
 
+# Session setup, enforcement and transition messages go through this logger rather than print(),
+# since the enforcement tick can repeat them every half second. Silent unless the app configures
+# logging, e.g. logging.basicConfig(level=logging.DEBUG). Only the one-off missing-icon warnings
+# printed while building the UI at startup still use print().
+log = logging.getLogger("focus_lock")
+log.addHandler(logging.NullHandler())
+
 # Import winsound for playing system sounds on Windows
 try:
     import winsound
 except ImportError:
     winsound = None # winsound is Windows-specific, set to None if not available
 
+# Window titles that mark the session windows, matched case-insensitively without lowercasing each title
+_SESSION_TITLE_RE = re.compile(r"(?P<pdf>\.pdf)|(?P<spotify>spotify)", re.IGNORECASE)
+
+# Minimum time between relaunches of a session app while nothing allowed has focus
+RELAUNCH_COOLDOWN_SECONDS = 10
+
+# Minimum time between attempts to bring the overlay forward when no session app is left
+OVERLAY_RAISE_INTERVAL_SECONDS = 2
+
+# Transition tones (frequency in Hz, duration in ms), synthesized once at startup
+BREAK_START_TONE = (880, 500)
+BREAK_END_TONE = (660, 500)
+
 # Constants for ShowWindow (Windows API)
 SW_HIDE = 0
+SW_MAXIMIZE = 3
 SW_SHOW = 5
+SW_MINIMIZE = 6
+SW_RESTORE = 9
+
+# Constants for the F6 Spotify hotkey (Windows API)
+WM_HOTKEY = 0x0312
+VK_F6 = 0x75
+F6_HOTKEY_ID = 1
+
+# Constant for the synthetic key events sent with keybd_event (Windows API)
+KEYEVENTF_KEYUP = 0x0002
+
+# Constants for the low-level keyboard hook that blocks shortcuts (Windows API)
+WH_KEYBOARD_LL = 13
+HC_ACTION = 0
+VK_TAB = 0x09
+VK_CONTROL = 0x11
+VK_MENU = 0x12 # Alt
+VK_ESCAPE = 0x1B
+VK_LWIN = 0x5B
+VK_RWIN = 0x5C
+VK_F5 = 0x74
+VK_F11 = 0x7A
+VK_LCONTROL = 0xA2
+VK_RCONTROL = 0xA3
+VK_LMENU = 0xA4
+VK_RMENU = 0xA5
+
+# System shortcuts blocked during focus segments: Alt, Tab, Win, Esc, Ctrl, F11.
+# The hook reports the left/right virtual keys for Ctrl and Alt, so those are listed too.
+# F5 is blocked separately, once it has been sent to SumatraPDF.
+BLOCKED_SHORTCUT_VKS = frozenset({
+    VK_MENU, VK_LMENU, VK_RMENU, VK_TAB, VK_LWIN, VK_RWIN,
+    VK_ESCAPE, VK_CONTROL, VK_LCONTROL, VK_RCONTROL, VK_F11,
+})
+
+# Constants for SetWindowPos/DeferWindowPos (Windows API)
+HWND_TOP = 0
+HWND_TOPMOST = -1
+SWP_NOSIZE = 0x0001
+SWP_NOMOVE = 0x0002
+SWP_NOACTIVATE = 0x0010
+
+# Constants for window discovery and foreground tracking (Windows API)
+EVENT_SYSTEM_FOREGROUND = 0x0003
+EVENT_OBJECT_CREATE = 0x8000
+EVENT_OBJECT_NAMECHANGE = 0x800C
+WINEVENT_OUTOFCONTEXT = 0x0000
+OBJID_WINDOW = 0
+GWL_STYLE = -16
+WS_CHILD = 0x40000000
+
+# Session deadlines are kept as integer nanoseconds on the monotonic clock
+NS_PER_SECOND = 1_000_000_000
+NS_PER_MS = 1_000_000
+
+# Win32 functions, bound once with explicit prototypes so ctypes does no per-call inference.
+# A private WinDLL instance is used so the shared ctypes.windll.user32 is left untouched.
+if sys.platform.startswith('win'):
+    from ctypes import wintypes
+
+    WNDENUMPROC = ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HWND, wintypes.LPARAM)
+    WINEVENTPROC = ctypes.WINFUNCTYPE(None, wintypes.HANDLE, wintypes.DWORD, wintypes.HWND,
+                                      wintypes.LONG, wintypes.LONG, wintypes.DWORD, wintypes.DWORD)
+    LowLevelKeyboardProc = ctypes.WINFUNCTYPE(wintypes.LPARAM, ctypes.c_int, wintypes.WPARAM, wintypes.LPARAM)
+
+    class KBDLLHOOKSTRUCT(ctypes.Structure):
+        """Key event passed to a WH_KEYBOARD_LL hook through its lParam."""
+        _fields_ = [
+            ("vkCode", wintypes.DWORD),
+            ("scanCode", wintypes.DWORD),
+            ("flags", wintypes.DWORD),
+            ("time", wintypes.DWORD),
+            ("dwExtraInfo", ctypes.c_size_t),
+        ]
+
+    _user32 = ctypes.WinDLL('user32', use_last_error=True)
+    _kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+
+    def _bind(name, restype, *argtypes, dll=_user32):
+        """Looks up a user32 (or other dll) function and declares its prototype."""
+        func = getattr(dll, name)
+        func.argtypes = argtypes
+        func.restype = restype
+        return func
+
+    _FindWindowW = _bind('FindWindowW', wintypes.HWND, wintypes.LPCWSTR, wintypes.LPCWSTR)
+    _ShowWindow = _bind('ShowWindow', wintypes.BOOL, wintypes.HWND, ctypes.c_int)
+    _IsWindow = _bind('IsWindow', wintypes.BOOL, wintypes.HWND)
+    _IsIconic = _bind('IsIconic', wintypes.BOOL, wintypes.HWND)
+    _IsZoomed = _bind('IsZoomed', wintypes.BOOL, wintypes.HWND)
+    _RegisterHotKey = _bind('RegisterHotKey', wintypes.BOOL, wintypes.HWND, ctypes.c_int, wintypes.UINT, wintypes.UINT)
+    _UnregisterHotKey = _bind('UnregisterHotKey', wintypes.BOOL, wintypes.HWND, ctypes.c_int)
+    _GetForegroundWindow = _bind('GetForegroundWindow', wintypes.HWND)
+    _SetForegroundWindow = _bind('SetForegroundWindow', wintypes.BOOL, wintypes.HWND)
+    _keybd_event = _bind('keybd_event', None, wintypes.BYTE, wintypes.BYTE, wintypes.DWORD, ctypes.c_size_t)
+    _EnumWindows = _bind('EnumWindows', wintypes.BOOL, WNDENUMPROC, wintypes.LPARAM)
+    _IsWindowVisible = _bind('IsWindowVisible', wintypes.BOOL, wintypes.HWND)
+    _GetWindowLongW = _bind('GetWindowLongW', wintypes.LONG, wintypes.HWND, ctypes.c_int)
+    _GetWindowTextLengthW = _bind('GetWindowTextLengthW', ctypes.c_int, wintypes.HWND)
+    _GetWindowTextW = _bind('GetWindowTextW', ctypes.c_int, wintypes.HWND, wintypes.LPWSTR, ctypes.c_int)
+    _SetWinEventHook = _bind('SetWinEventHook', wintypes.HANDLE, wintypes.DWORD, wintypes.DWORD,
+                             wintypes.HMODULE, WINEVENTPROC, wintypes.DWORD, wintypes.DWORD, wintypes.DWORD)
+    _UnhookWinEvent = _bind('UnhookWinEvent', wintypes.BOOL, wintypes.HANDLE)
+    _BeginDeferWindowPos = _bind('BeginDeferWindowPos', wintypes.HANDLE, ctypes.c_int)
+    _DeferWindowPos = _bind('DeferWindowPos', wintypes.HANDLE, wintypes.HANDLE, wintypes.HWND, wintypes.HWND,
+                            ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int, wintypes.UINT)
+    _EndDeferWindowPos = _bind('EndDeferWindowPos', wintypes.BOOL, wintypes.HANDLE)
+    _SetWindowPos = _bind('SetWindowPos', wintypes.BOOL, wintypes.HWND, wintypes.HWND,
+                          ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int, wintypes.UINT)
+    _SetWindowsHookExW = _bind('SetWindowsHookExW', wintypes.HHOOK, ctypes.c_int, LowLevelKeyboardProc,
+                               wintypes.HINSTANCE, wintypes.DWORD)
+    _UnhookWindowsHookEx = _bind('UnhookWindowsHookEx', wintypes.BOOL, wintypes.HHOOK)
+    _CallNextHookEx = _bind('CallNextHookEx', wintypes.LPARAM, wintypes.HHOOK, ctypes.c_int,
+                            wintypes.WPARAM, wintypes.LPARAM)
+    _GetModuleHandleW = _bind('GetModuleHandleW', wintypes.HMODULE, wintypes.LPCWSTR, dll=_kernel32)
+    _GetConsoleWindow = _bind('GetConsoleWindow', wintypes.HWND, dll=_kernel32)
+
+# Stylesheet for the main window, modified navy color scheme with subtle accents.
+# Kept at module level so the string is built once rather than on every call.
+_STYLESHEET = """
+QWidget {
+    background-color: #0E1A3C;  /* Darker Navy Blue */
+    color: #E0EBF5;             /* Light Grayish Blue */
+    font-family: 'Segoe UI', Arial, sans-serif;
+    font-size: 15px;
+}
+QFrame#mainFrame { /* Main container for better grouping */
+    background-color: #1A2E50; /* Slightly lighter shade for content area */
+    border-radius: 15px;
+    padding: 25px;
+    margin: 15px; /* Margin around the central frame */
+    border: 1px solid #3F51B5; /* Accent border */
+}
+
+QLabel#titleLabel {
+    font-size: 32px;
+    font-weight: bold;
+    color: #90CAF9; /* Light Blue */
+    margin-bottom: 5px;
+    letter-spacing: 1px;
+}
+QLabel#subtitleLabel {
+    font-size: 13px;
+    color: #B0BEC5; /* Muted Blue-Gray */
+    margin-bottom: 20px;
+    font-style: italic;
+}
+QLabel { /* General QLabel styling for other labels */
+    font-size: 15px;
+    color: #E0EBF5;
+}
+QLabel#fileLabel { /* Specific style for selected file path */
+    font-size: 14px;
+    color: #BBDEFB;
+    padding: 8px 10px;
+    border: 1px solid #3F51B5;
+    border-radius: 8px;
+    background-color: #0B1630; /* Very dark background for input */
+    min-height: 35px;
+    qproperty-alignment: AlignLeft | AlignVCenter;
+}
+QLabel#timerLabel { /* This will now be primarily for initial state/reset */
+    font-size: 28px;
+    font-weight: bold;
+    color: #81C784;
+    margin-top: 15px;
+    letter-spacing: 1.5px;
+}
+QLabel#statusMessageLabel {
+    font-size: 14px;
+    color: #CFD8DC;
+    margin-top: 5px;
+    min-height: 20px;
+}
+/* Status colors, selected with the label's "state" property */
+QLabel#statusMessageLabel[state="ok"] { color: #4CAF50; }     /* Green for success */
+QLabel#statusMessageLabel[state="warn"] { color: #FF5252; }   /* Red for warning */
+QLabel#statusMessageLabel[state="active"] { color: #FFC107; } /* Amber for active session */
+QLabel#statusMessageLabel[state="break"] { color: #F44336; }  /* Red for break */
+QLabel#statusMessageLabel[state="reset"] { color: #E0EBF5; }  /* Default color for reset */
+QLabel#statusMessageLabel[state="done"] { color: #81C784; }   /* Green for completion */
+
+QPushButton {
+    background-color: #2196F3; /* Bright Blue */
+    color: white;
+    border-radius: 15px; /* Smoother, more rounded corners */
+    font-size: 16px;
+    font-weight: bold;
+    padding: 12px 25px; /* Increased padding for smoother feel */
+    border: 2px solid #3F51B5; /* Distinct border for samurai-like edge */
+    min-width: 120px;
+    letter-spacing: 0.5px; /* Subtle letter spacing */
+}
+QPushButton:hover {
+    background-color: #1976D2; /* Darker Blue on hover */
+    border-color: #90CAF9; /* Lighter border on hover */
+    color: #E0EBF5; /* Slight color change on hover */
+}
+QPushButton:pressed {
+    background-color: #1565C0; /* Even darker on press */
+    border-color: #2196F3; /* Revert border to primary on press */
+}
+QPushButton#selectPdfButton { /* Separate style for Select PDF button */
+    background-color: #64B5F6; /* Lighter Blue */
+    color: white;
+    padding: 10px 18px; /* Adjusted padding */
+    font-size: 14px;
+    border-radius: 12px; /* Smoother */
+    border: 1px solid #3F51B5; /* Consistent border style */
+}
+QPushButton#selectPdfButton:hover {
+    background-color: #42A5F5;
+    border-color: #90CAF9;
+}
+QPushButton#resetButton { /* Style for the new Reset button */
+    background-color: #FF5252; /* Red for reset */
+    border-color: #FF1744;
+    color: white;
+    font-size: 15px;
+    font-weight: bold;
+    padding: 10px 20px;
+    border-radius: 12px;
+}
+QPushButton#resetButton:hover {
+    background-color: #D32F2F;
+    border-color: #FF5252;
+}
+QComboBox {
+    background-color: #E3F2FD; /* Very Light Blue */
+    color: #212121; /* Dark text for contrast */
+    border: 1px solid #90CAF9;
+    border-radius: 5px;
+    padding: 5px 10px;
+    font-size: 14px;
+    min-height: 30px;
+}
+QComboBox::drop-down {
+    subcontrol-origin: padding;
+    subcontrol-position: top right;
+    width: 20px;
+    border-left-width: 1px;
+    border-left-color: #90CAF9;
+    border-left-style: solid;
+    border-top-right-radius: 5px;
+    border-bottom-right-radius: 5px;
+}
+QComboBox::down-arrow {
+    image: url(data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAAhElEQVR42mNkGDsgAWMYGBgY/f///4Hw39+/L+BhYGDg4B+IgXgQGZiB+C0YGNjAAYgZEwQGwQJmZhgYmBgiBsbAYGAEIGYAYyG2AEJgYsLAD/I8cEAAJkZlYGBgYWBg/k/wFwMDAwMDzP7gA+Z/YGNgYGJmYGBgYAApBQAALxZ6g1Uv4wMAAAAASUVORK5CYII=);
+    width: 14px;
+    height: 14px;
+}
+QComboBox QAbstractItemView {
+    background-color: #E3F2FD;
+    selection-background-color: #90CAF9;
+    color: #212121;
+    font-size: 14px;
+    border: 1px solid #90CAF9;
+    border-radius: 5px;
+}
+"""
+
+# Candidate install locations, expanded once at import time
+if sys.platform.startswith('win'):
+    _SUMATRA_CANDIDATES = tuple(os.path.expandvars(path) for path in (
+        r"C:\Program Files\SumatraPDF\SumatraPDF.exe",
+        r"C:\Program Files (x86)\SumatraPDF\SumatraPDF.exe",
+        r"%LOCALAPPDATA%\SumatraPDF\SumatraPDF.exe",
+    ))
+    _SPOTIFY_CANDIDATES = tuple(os.path.expandvars(path) for path in (
+        r"C:\Users\ahmed\AppData\Roaming\Spotify\Spotify.exe", # User-provided specific path from previous conversation
+        # Fallback to common install paths for Spotify
+        r"%APPDATA%\Spotify\Spotify.exe",
+        r"%LOCALAPPDATA%\Spotify\Spotify.exe",
+        r"%ProgramFiles(x86)%\Spotify\Spotify.exe",
+    ))
+elif sys.platform.startswith('darwin'):
+    _SUMATRA_CANDIDATES = ()
+    _SPOTIFY_CANDIDATES = ("/Applications/Spotify.app/Contents/MacOS/Spotify",)
+else: # Linux
+    _SUMATRA_CANDIDATES = ()
+    _SPOTIFY_CANDIDATES = ("/usr/bin/spotify",)
+
+@functools.lru_cache(maxsize=1)
+def _find_sumatra_path():
+    """
+    Returns the likely path to SumatraPDF executable on Windows.
+    Cached, since install locations do not change while the app runs.
+    """
+    return next((path for path in _SUMATRA_CANDIDATES if os.path.isfile(path)), None)
+
+@functools.lru_cache(maxsize=1)
+def _find_spotify_path():
+    """
+    Determines and returns the likely path to the Spotify executable based on the OS.
+    Includes a direct check for the user-provided path from previous conversations.
+    Cached, since install locations do not change while the app runs.
+    """
+    return next((path for path in _SPOTIFY_CANDIDATES if os.path.isfile(path)), None)
+
+def _make_tone_wav(frequency, duration_ms, sample_rate=22050):
+    """
+    Returns a mono 16-bit PCM WAV file (header + samples) holding a sine tone.
+    The first and last few milliseconds are faded to avoid audible clicks.
+    """
+    n_samples = sample_rate * duration_ms // 1000
+    fade = max(1, sample_rate // 200) # 5ms ramp at each end
+    step = 2 * math.pi * frequency / sample_rate
+    samples = [
+        int(16000 * math.sin(step * i) * min(1.0, i / fade, (n_samples - 1 - i) / fade))
+        for i in range(n_samples)
+    ]
+    data = struct.pack(f"<{n_samples}h", *samples)
+    header = struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", 36 + len(data), b"WAVE",
+        b"fmt ", 16, 1, 1, sample_rate, sample_rate * 2, 2, 16,
+        b"data", len(data),
+    )
+    return header + data
 
 class TimerOverlay(QWidget):
     """
     A small, frameless, always-on-top, and movable window
     to display the timer during a focus session.
     """
+    # Label stylesheets, formatted with the current mode color
+    _TIMER_QSS_TMPL = """
+        QLabel {{
+            color: {color};
+            font-size: 26px;
+            font-weight: bold;
+            letter-spacing: 1px;
+            background-color: rgba(26, 46, 80, 0.8); /* Semi-transparent background */
+            border-radius: 10px;
+            padding: 5px;
+        }}
+    """
+    _MODE_QSS_TMPL = """
+        QLabel {{
+            color: {color};
+            font-size: 12px;
+            font-weight: bold;
+            letter-spacing: 0.5px;
+            background-color: transparent;
+        }}
+    """
+
     def __init__(self):
         super().__init__()
         # Added Qt.WindowDoesNotAcceptFocus to prevent it from gaining keyboard focus
@@ -41,60 +407,36 @@ class TimerOverlay(QWidget):
 
         self.timer_display_label = QLabel("00:00:00")
         self.timer_display_label.setAlignment(Qt.AlignCenter)
-        self.timer_display_label.setStyleSheet("""
-            QLabel {
-                color: #81C784; /* Green for focus */
-                font-size: 26px;
-                font-weight: bold;
-                letter-spacing: 1px;
-                /* text-shadow: 0 0 8px rgba(129, 199, 132, 0.7); /* Subtle glow */
-                background-color: rgba(26, 46, 80, 0.8); /* Semi-transparent background */
-                border-radius: 10px;
-                padding: 5px;
-            }
-        """)
+        self.timer_display_label.setStyleSheet(self._TIMER_QSS_TMPL.format(color="#81C784")) # Green for focus
         self.layout.addWidget(self.timer_display_label)
 
         self.mode_label = QLabel("FOCUS")
         self.mode_label.setAlignment(Qt.AlignCenter)
-        self.mode_label.setStyleSheet("""
-            QLabel {
-                color: #FFC107; /* Amber for active mode */
-                font-size: 12px;
-                font-weight: bold;
-                letter-spacing: 0.5px;
-                background-color: transparent;
-            }
-        """)
+        self.mode_label.setStyleSheet(self._MODE_QSS_TMPL.format(color="#FFC107")) # Amber for active mode
         self.layout.addWidget(self.mode_label)
 
         self.old_pos = None # For window dragging
+        self._last_color = None # Last mode color applied, so the QSS is only re-parsed on transitions
+        self._hwnd = int(self.winId()) # Native handle, used to re-assert topmost on Windows
 
     def update_timer_text(self, text, mode_text, mode_color):
         """Updates the timer and mode display."""
         self.timer_display_label.setText(text)
-        self.timer_display_label.setStyleSheet(f"""
-            QLabel {{
-                color: {mode_color};
-                font-size: 26px;
-                font-weight: bold;
-                letter-spacing: 1px;
-                /* text-shadow: 0 0 8px {mode_color.replace('rgb', 'rgba').replace(')', ', 0.7)')}; */
-                background-color: rgba(26, 46, 80, 0.8);
-                border-radius: 10px;
-                padding: 5px;
-            }}
-        """)
         self.mode_label.setText(mode_text)
-        self.mode_label.setStyleSheet(f"""
-            QLabel {{
-                color: {mode_color};
-                font-size: 12px;
-                font-weight: bold;
-                letter-spacing: 0.5px;
-                background-color: transparent;
-            }}
-        """)
+        # Restyling forces Qt to re-parse and repolish, so only do it when the mode color changes
+        if mode_color != self._last_color:
+            self.timer_display_label.setStyleSheet(self._TIMER_QSS_TMPL.format(color=mode_color))
+            self.mode_label.setStyleSheet(self._MODE_QSS_TMPL.format(color=mode_color))
+            self._last_color = mode_color
+
+    def reassert_topmost(self):
+        """
+        Puts the overlay back at the top of the topmost band without activating it.
+        Windows lets WindowStaysOnTopHint degrade as other topmost windows claim the top,
+        so this is called after showing the overlay and on every segment transition.
+        """
+        if sys.platform.startswith('win'):
+            _SetWindowPos(self._hwnd, HWND_TOPMOST, 0, 0, 0, 0, SWP_NOMOVE | SWP_NOSIZE | SWP_NOACTIVATE)
 
     def mousePressEvent(self, event):
         """Records the initial mouse position for dragging."""
@@ -133,189 +475,181 @@ class ZenFocus(QWidget):
         super().__init__()
         self.setWindowTitle("Silragon Focus Lock")
         self.setFixedSize(520, 420) # Main window size
-        self.setWindowIcon(self.load_icon("dragon_icon.png"))
+        self.setWindowIcon(self.load_icon(":/icons/dragon_icon_512.png"))
 
         self.pdf_path = None
         self.total_session_duration_minutes = 45
         self.focus_interval_minutes = 25
         self.break_interval_minutes = 5
-        self.session_end_absolute_time = None
+        self.session_end_ns = None
 
         self.session_active = False
         self.is_on_break = False
-        self.current_segment_end_time = None
+        self.current_segment_end_ns = None
 
-        self.spotify_window_ref = None
+        # Raw handles of the session windows, validated once when they are found
+        self._pdf_hwnd = None
+        self._spotify_hwnd = None
         self.f6_hotkey_id = None
+        self._hotkey_hwnd = None # Window the F6 hotkey was registered against
+
+        # One low-level keyboard hook swallows every blocked key; it is set while anything is blocked
+        self._shortcuts_blocked = False
+        self._f5_blocked = False
+        self._blocked_vks = frozenset() # Replaced whole, so the hook always reads a consistent set
+        self._keyboard_hook = None
+        self._keyboard_hook_proc = None # Keeps the ctypes callback alive while the hook is set
+
+        # Session apps, launched at session start and relaunched by the enforcement tick if needed
+        self._pdf_process = None
+        self._spotify_process = None
+        self._last_relaunch_ns = None
+        self._last_overlay_raise_ns = None
+        # Relaunches spawn processes off the GUI thread so the enforcement tick never waits on them
+        self._launcher = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+
+        # Window discovery state; _discovery_found is None whenever no discovery is running
+        self._discovery_found = None
+        self._discovery_deadline_ns = None
+        self._discovery_hooks = []
+        self._discovery_proc = None # Keeps the ctypes callback alive while the hooks are set
+
+        # Current foreground window, kept up to date by a WinEvent hook while a session runs
+        self._foreground_hwnd = None
+        self._foreground_hook = None
+        self._foreground_hook_proc = None # Keeps the ctypes callback alive while the hook is set
+
+        # Timer overlay, created once and shown/hidden per session rather than rebuilt each time
+        self.timer_overlay = TimerOverlay()
 
-        self.timer_overlay = None # Instance of the new TimerOverlay window
+        # Native handles of the overlay and this window, captured on the GUI thread
+        self._overlay_hwnd = self.timer_overlay._hwnd
+        self._main_hwnd = None
+        self._allowed_hwnds = frozenset()
 
-        self.setStyleSheet(self.get_stylesheet())
+        self._cached_hwnds = {} # Shell window handles, only touched from _shell_executor
+        # FindWindowW/ShowWindow on shell windows can stall while Explorer is busy, so they run on
+        # their own thread. A single worker keeps hide/show requests in the order they were made.
+        self._shell_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        if sys.platform.startswith('win'):
+            # Look up the taskbar and Start button now, so the first hide at session start is just ShowWindow
+            self._shell_executor.submit(self._prefetch_shell_windows)
+
+        self._pending_status = None # (text, state) status update waiting for the window to be shown
+        self._last_timer_display = None # (remaining seconds, on break) last shown, to skip unchanged refreshes
+
+        # Pre-decoded transition tones keyed by (frequency, duration_ms), so playing one never blocks.
+        # Loaded when the first session starts, which keeps QtMultimedia out of startup.
+        self._sound_files = {} # Temporary WAV files holding the tones
+        self._sound_effects = {} # QSoundEffects loaded from those files, if QtMultimedia is available
+        self._sounds_loaded = False
+
+        self.setStyleSheet(_STYLESHEET)
         self.init_ui()
 
+        # Resolve the app paths up front, so a missing install is reported before Start is pressed
+        missing_apps = [name for name, path in (("SumatraPDF", self.get_sumatra_path()),
+                                                ("Spotify", self.get_spotify_path())) if not path]
+        if missing_apps:
+            self._set_status(f"WARNING: {' and '.join(missing_apps)} not found.", "warn")
+
+        # Refreshes the overlay display only; it runs while the overlay is visible
         self.timer = QTimer(self)
+        # A once-a-second clock needs no precision; whole-second granularity lets Qt coalesce wake-ups
+        self.timer.setTimerType(Qt.VeryCoarseTimer)
         self.timer.timeout.connect(self.update_timer)
 
+        # Single-shot timers for focus/break transitions and the end of the session,
+        # so nothing has to poll the clock to notice them
+        self.segment_timer = QTimer(self)
+        self.segment_timer.setSingleShot(True)
+        self.segment_timer.timeout.connect(self._on_segment_boundary)
+
+        self.session_timer = QTimer(self)
+        self.session_timer.setSingleShot(True)
+        self.session_timer.timeout.connect(self.end_session)
+
+        # Session setup and focus enforcement run on this thread from timers, so no worker
+        # thread ever touches Qt. discovery_timer rescans for the session windows while they
+        # are being opened; enforce_timer checks the foreground window every half second.
+        self.discovery_timer = QTimer(self)
+        self.discovery_timer.timeout.connect(self._on_discovery_tick)
+
+        self.enforce_timer = QTimer(self)
+        self.enforce_timer.setTimerType(Qt.CoarseTimer) # A few tens of ms of jitter is fine for enforcement
+        self.enforce_timer.timeout.connect(self._enforce_focus)
+
     def load_icon(self, filename):
         """
-        Loads an application icon from the specified filename.
+        Loads an application icon from the specified filename or resource path.
         Warns if the file is not found.
         """
-        if os.path.exists(filename):
+        if QFile.exists(filename):
             return QIcon(filename)
         else:
             print(f"Warning: Icon file '{filename}' not found. Using default icon.")
             return QIcon()
 
+    def _load_sound_effects(self, tones):
+        """
+        Writes each tone to a temporary WAV file and loads it into a QSoundEffect.
+        Without QtMultimedia the files are still written for winsound.PlaySound to play.
+        """
+        self._sounds_loaded = True
+        # QtMultimedia is a separate PyQt5 module that loads its own plugins, so it is only
+        # imported here rather than at module level
+        try:
+            from PyQt5.QtMultimedia import QSoundEffect
+        except ImportError:
+            QSoundEffect = None
+        if QSoundEffect is None and not winsound:
+            return # Nothing here could play the files
+        for frequency, duration_ms in tones:
+            wav_file = QTemporaryFile(QDir.temp().filePath("focus_lock_XXXXXX.wav"), self)
+            if not wav_file.open():
+                log.warning("Could not create a temporary file for the %sHz tone.", frequency)
+                continue
+            wav_file.write(_make_tone_wav(frequency, duration_ms))
+            wav_file.close() # Closed but kept (and removed on exit) by the QTemporaryFile
+            self._sound_files[(frequency, duration_ms)] = wav_file
+
+            if QSoundEffect is not None:
+                effect = QSoundEffect(self)
+                effect.setSource(QUrl.fromLocalFile(wav_file.fileName()))
+                self._sound_effects[(frequency, duration_ms)] = effect
+
     def play_system_sound(self, frequency, duration_ms):
-        """Plays a system sound using winsound on Windows, or prints a message otherwise."""
-        if winsound:
+        """
+        Plays a transition tone without blocking. Uses the preloaded QSoundEffect when there
+        is one, otherwise has winsound play the tone's WAV file asynchronously. winsound.Beep,
+        which blocks for the whole tone, is only used if the file could not be written.
+        """
+        tone = (frequency, duration_ms)
+        effect = self._sound_effects.get(tone)
+        if effect is not None:
+            effect.play()
+        elif winsound and tone in self._sound_files:
+            try:
+                # SND_MEMORY cannot be combined with SND_ASYNC, so the tone is played from its file
+                winsound.PlaySound(self._sound_files[tone].fileName(),
+                                   winsound.SND_FILENAME | winsound.SND_ASYNC | winsound.SND_NODEFAULT)
+            except Exception as e:
+                log.warning("Error playing sound: %s", e)
+        elif winsound:
             try:
                 winsound.Beep(frequency, duration_ms)
             except Exception as e:
-                print(f"Error playing sound: {e}")
+                log.warning("Error playing sound: %s", e)
         else:
-            print(f"Playing sound (freq: {frequency}Hz, dur: {duration_ms}ms) - (winsound not available on this OS)")
+            log.debug("Playing sound (freq: %sHz, dur: %sms) - (winsound not available on this OS)", frequency, duration_ms)
 
     def get_stylesheet(self):
         """
         Returns the stylesheet with the modified navy color scheme
         and subtle accents, adapted for new buttons and layout.
+        Kept for callers outside this class; __init__ applies _STYLESHEET directly.
         """
-        return """
-        QWidget {
-            background-color: #0E1A3C;  /* Darker Navy Blue */
-            color: #E0EBF5;             /* Light Grayish Blue */
-            font-family: 'Segoe UI', Arial, sans-serif;
-            font-size: 15px;
-        }
-        QFrame#mainFrame { /* Main container for better grouping */
-            background-color: #1A2E50; /* Slightly lighter shade for content area */
-            border-radius: 15px;
-            padding: 25px;
-            margin: 15px; /* Margin around the central frame */
-            border: 1px solid #3F51B5; /* Accent border */
-        }
-
-        QLabel#titleLabel {
-            font-size: 32px;
-            font-weight: bold;
-            color: #90CAF9; /* Light Blue */
-            margin-bottom: 5px;
-            letter-spacing: 1px;
-        }
-        QLabel#subtitleLabel {
-            font-size: 13px;
-            color: #B0BEC5; /* Muted Blue-Gray */
-            margin-bottom: 20px;
-            font-style: italic;
-        }
-        QLabel { /* General QLabel styling for other labels */
-            font-size: 15px;
-            color: #E0EBF5;
-        }
-        QLabel#fileLabel { /* Specific style for selected file path */
-            font-size: 14px;
-            color: #BBDEFB;
-            padding: 8px 10px;
-            border: 1px solid #3F51B5;
-            border-radius: 8px;
-            background-color: #0B1630; /* Very dark background for input */
-            min-height: 35px;
-            qproperty-alignment: AlignLeft | AlignVCenter;
-        }
-        QLabel#timerLabel { /* This will now be primarily for initial state/reset */
-            font-size: 28px;
-            font-weight: bold;
-            color: #81C784;
-            margin-top: 15px;
-            letter-spacing: 1.5px;
-        }
-        QLabel#statusMessageLabel {
-            font-size: 14px;
-            color: #CFD8DC;
-            margin-top: 5px;
-            min-height: 20px;
-        }
-
-        QPushButton {
-            background-color: #2196F3; /* Bright Blue */
-            color: white;
-            border-radius: 15px; /* Smoother, more rounded corners */
-            font-size: 16px;
-            font-weight: bold;
-            padding: 12px 25px; /* Increased padding for smoother feel */
-            border: 2px solid #3F51B5; /* Distinct border for samurai-like edge */
-            min-width: 120px;
-            letter-spacing: 0.5px; /* Subtle letter spacing */
-        }
-        QPushButton:hover {
-            background-color: #1976D2; /* Darker Blue on hover */
-            border-color: #90CAF9; /* Lighter border on hover */
-            color: #E0EBF5; /* Slight color change on hover */
-        }
-        QPushButton:pressed {
-            background-color: #1565C0; /* Even darker on press */
-            border-color: #2196F3; /* Revert border to primary on press */
-        }
-        QPushButton#selectPdfButton { /* Separate style for Select PDF button */
-            background-color: #64B5F6; /* Lighter Blue */
-            color: white;
-            padding: 10px 18px; /* Adjusted padding */
-            font-size: 14px;
-            border-radius: 12px; /* Smoother */
-            border: 1px solid #3F51B5; /* Consistent border style */
-        }
-        QPushButton#selectPdfButton:hover {
-            background-color: #42A5F5;
-            border-color: #90CAF9;
-        }
-        QPushButton#resetButton { /* Style for the new Reset button */
-            background-color: #FF5252; /* Red for reset */
-            border-color: #FF1744;
-            color: white;
-            font-size: 15px;
-            font-weight: bold;
-            padding: 10px 20px;
-            border-radius: 12px;
-        }
-        QPushButton#resetButton:hover {
-            background-color: #D32F2F;
-            border-color: #FF5252;
-        }
-        QComboBox {
-            background-color: #E3F2FD; /* Very Light Blue */
-            color: #212121; /* Dark text for contrast */
-            border: 1px solid #90CAF9;
-            border-radius: 5px;
-            padding: 5px 10px;
-            font-size: 14px;
-            min-height: 30px;
-        }
-        QComboBox::drop-down {
-            subcontrol-origin: padding;
-            subcontrol-position: top right;
-            width: 20px;
-            border-left-width: 1px;
-            border-left-color: #90CAF9;
-            border-left-style: solid;
-            border-top-right-radius: 5px;
-            border-bottom-right-radius: 5px;
-        }
-        QComboBox::down-arrow {
-            image: url(data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAAhElEQVR42mNkGDsgAWMYGBgY/f///4Hw39+/L+BhYGDg4B+IgXgQGZiB+C0YGNjAAYgZEwQGwQJmZhgYmBgiBsbAYGAEIGYAYyG2AEJgYsLAD/I8cEAAJkZlYGBgYWBg/k/wFwMDAwMDzP7gA+Z/YGNgYGJmYGBgYAApBQAALxZ6g1Uv4wMAAAAASUVORK5CYII=);
-            width: 14px;
-            height: 14px;
-        }
-        QComboBox QAbstractItemView {
-            background-color: #E3F2FD;
-            selection-background-color: #90CAF9;
-            color: #212121;
-            font-size: 14px;
-            border: 1px solid #90CAF9;
-            border-radius: 5px;
-        }
-        """
+        return _STYLESHEET
 
     def init_ui(self):
         """Initializes the user interface elements and their layout."""
@@ -331,14 +665,18 @@ class ZenFocus(QWidget):
         # --- Header Section (Logo beside Title) ---
         header_layout = QHBoxLayout()
         
-        # Dragon Icon
+        # Dragon Icon (embedded already scaled to fit 48x48, so no resampling at startup)
         dragon_icon_label = QLabel(self)
-        pixmap = QPixmap('dragon_icon.png')
+        pixmap = QPixmap(':/icons/dragon_icon_48.png')
         if pixmap.isNull():
-            print("Warning: 'dragon_icon.png' not found or invalid. No icon displayed.")
+            print("Warning: ':/icons/dragon_icon_48.png' not found or invalid. No icon displayed.")
         else:
-            pixmap = pixmap.scaled(48, 48, Qt.KeepAspectRatio, Qt.SmoothTransformation) # Scale for header
             dragon_icon_label.setPixmap(pixmap)
+            # Reuse the decoded 48px pixmap as the window icon's small size so the
+            # title bar and taskbar don't resample the 512px image
+            window_icon = self.windowIcon()
+            window_icon.addPixmap(pixmap)
+            self.setWindowIcon(window_icon)
         dragon_icon_label.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
         dragon_icon_label.setFixedSize(QSize(48, 48))
 
@@ -428,101 +766,340 @@ class ZenFocus(QWidget):
             if len(display_path) > 30: # Adjust truncation length for smaller window
                 display_path = "..." + display_path[-27:]
             self.file_label.setText(f"Selected: {display_path}")
-            self.status_message_label.setText("PDF selected. Ready to lock focus.")
-            self.status_message_label.setStyleSheet("color: #4CAF50;") # Green for success
+            self._set_status("PDF selected. Ready to lock focus.", "ok") # Green for success
         else:
-            self.status_message_label.setText("PDF selection cancelled.")
-            self.status_message_label.setStyleSheet("color: #FF5252;") # Red for warning
+            self._set_status("PDF selection cancelled.", "warn") # Red for warning
+
+    def _set_status(self, text, state=None):
+        """
+        Sets the status message and, if given, its color state. While the window is hidden
+        (which it is for the whole session) the update is only recorded, and showEvent
+        applies the latest one, so Qt does no style or layout work on an invisible label.
+        """
+        if self.isVisible():
+            self._apply_status(text, state)
+        else:
+            if state is None and self._pending_status:
+                state = self._pending_status[1] # Keep the color of an earlier queued update
+            self._pending_status = (text, state)
+
+    def _apply_status(self, text, state):
+        """Applies a status message and optional color state to the label."""
+        self.status_message_label.setText(text)
+        if state is not None:
+            self._set_status_state(state)
+
+    def showEvent(self, event):
+        """Flushes any status update that arrived while the window was hidden."""
+        super().showEvent(event)
+        if self._pending_status:
+            self._apply_status(*self._pending_status)
+            self._pending_status = None
+        if self.session_active:
+            # The timer label is not kept current while hidden, so refresh it now
+            self._last_timer_display = None
+            self.update_timer()
+
+    def _set_status_state(self, state):
+        """
+        Colors the status label by setting its "state" property, which the stylesheet
+        matches on. Only this label is repolished; no stylesheet is re-parsed.
+        """
+        self.status_message_label.setProperty("state", state)
+        self.status_message_label.style().unpolish(self.status_message_label)
+        self.status_message_label.style().polish(self.status_message_label)
+
+    def _find_shell_window(self, class_name, window_name):
+        """
+        Returns the HWND of a shell window (taskbar or Start button), only searching
+        for it the first time. The handle is looked up again if Explorer has recreated it.
+        """
+        key = (class_name, window_name)
+        hwnd = self._cached_hwnds.get(key)
+        if not hwnd or not _IsWindow(hwnd):
+            hwnd = _FindWindowW(class_name, window_name)
+            if hwnd:
+                self._cached_hwnds[key] = hwnd
+        return hwnd
+
+    def _prefetch_shell_windows(self):
+        """Caches the taskbar and Start button handles ahead of the first session. Runs on _shell_executor."""
+        self._find_shell_window("Shell_TrayWnd", None)
+        self._find_shell_window("Button", "Start")
 
     def _hide_taskbar(self):
-        """Hides the Windows taskbar and Start button, and Task Manager."""
+        """Hides the Windows taskbar and Start button, and Task Manager, without blocking the caller."""
+        self._shell_executor.submit(self._do_hide_taskbar)
+
+    def _show_taskbar(self):
+        """Shows the Windows taskbar and Start button, and Task Manager, without blocking the caller."""
+        self._shell_executor.submit(self._do_show_taskbar)
+
+    def _do_hide_taskbar(self):
+        """Hides the Windows taskbar and Start button, and Task Manager. Runs on _shell_executor."""
         if sys.platform.startswith('win'):
             try:
                 # Hide Taskbar
-                taskbar_hwnd = ctypes.windll.user32.FindWindowW("Shell_TrayWnd", None)
+                taskbar_hwnd = self._find_shell_window("Shell_TrayWnd", None)
                 if taskbar_hwnd:
-                    ctypes.windll.user32.ShowWindow(taskbar_hwnd, SW_HIDE)
-                    print("Taskbar hidden successfully.")
+                    _ShowWindow(taskbar_hwnd, SW_HIDE)
+                    log.debug("Taskbar hidden successfully.")
                 else:
-                    print("Taskbar window not found.")
+                    log.warning("Taskbar window not found.")
 
                 # Hide Start button
-                start_button_hwnd = ctypes.windll.user32.FindWindowW("Button", "Start")
+                start_button_hwnd = self._find_shell_window("Button", "Start")
                 if start_button_hwnd:
-                    ctypes.windll.user32.ShowWindow(start_button_hwnd, SW_HIDE)
-                    print("Start button hidden successfully.")
+                    _ShowWindow(start_button_hwnd, SW_HIDE)
+                    log.debug("Start button hidden successfully.")
                 else:
-                    print("Start button window not found.")
+                    log.warning("Start button window not found.")
                 
-                # Hide Task Manager
+                # Hide Task Manager (not cached, since it comes and goes with the user)
                 # FindWindowW can take class name or window title.
                 # Common Task Manager class names: "TaskManagerWindow", "Task Manager" (title)
-                task_manager_hwnd = ctypes.windll.user32.FindWindowW("TaskManagerWindow", None) 
+                task_manager_hwnd = _FindWindowW("TaskManagerWindow", None) 
                 if not task_manager_hwnd:
-                    task_manager_hwnd = ctypes.windll.user32.FindWindowW(None, "Task Manager") # Fallback by title
+                    task_manager_hwnd = _FindWindowW(None, "Task Manager") # Fallback by title
                 
                 if task_manager_hwnd:
-                    ctypes.windll.user32.ShowWindow(task_manager_hwnd, SW_HIDE)
-                    print("Task Manager hidden successfully.")
+                    _ShowWindow(task_manager_hwnd, SW_HIDE)
+                    log.debug("Task Manager hidden successfully.")
                 else:
-                    print("Task Manager window not found.")
+                    log.warning("Task Manager window not found.")
 
             except Exception as e:
-                print(f"Error hiding system UI elements: {e}")
+                log.warning("Error hiding system UI elements: %s", e)
 
-    def _show_taskbar(self):
-        """Shows the Windows taskbar and Start button, and Task Manager."""
+    def _do_show_taskbar(self):
+        """Shows the Windows taskbar and Start button, and Task Manager. Runs on _shell_executor."""
         if sys.platform.startswith('win'):
             try:
                 # Show Taskbar
-                taskbar_hwnd = ctypes.windll.user32.FindWindowW("Shell_TrayWnd", None)
+                taskbar_hwnd = self._find_shell_window("Shell_TrayWnd", None)
                 if taskbar_hwnd:
-                    ctypes.windll.user32.ShowWindow(taskbar_hwnd, SW_SHOW)
-                    print("Taskbar shown successfully.")
+                    _ShowWindow(taskbar_hwnd, SW_SHOW)
+                    log.debug("Taskbar shown successfully.")
                 else:
-                    print("Taskbar window not found for showing.")
+                    log.warning("Taskbar window not found for showing.")
 
                 # Show Start button
-                start_button_hwnd = ctypes.windll.user32.FindWindowW("Button", "Start")
+                start_button_hwnd = self._find_shell_window("Button", "Start")
                 if start_button_hwnd:
-                    ctypes.windll.user32.ShowWindow(start_button_hwnd, SW_SHOW)
-                    print("Start button shown successfully.")
+                    _ShowWindow(start_button_hwnd, SW_SHOW)
+                    log.debug("Start button shown successfully.")
                 else:
-                    print("Start button window not found for showing.")
+                    log.warning("Start button window not found for showing.")
 
                 # Show Task Manager
-                task_manager_hwnd = ctypes.windll.user32.FindWindowW("TaskManagerWindow", None)
+                task_manager_hwnd = _FindWindowW("TaskManagerWindow", None)
                 if not task_manager_hwnd:
-                    task_manager_hwnd = ctypes.windll.user32.FindWindowW(None, "Task Manager")
+                    task_manager_hwnd = _FindWindowW(None, "Task Manager")
                 
                 if task_manager_hwnd:
-                    ctypes.windll.user32.ShowWindow(task_manager_hwnd, SW_SHOW)
-                    print("Task Manager shown successfully.")
+                    _ShowWindow(task_manager_hwnd, SW_SHOW)
+                    log.debug("Task Manager shown successfully.")
                 else:
-                    print("Task Manager window not found for showing.")
+                    log.warning("Task Manager window not found for showing.")
 
             except Exception as e:
-                print(f"Error showing system UI elements: {e}")
+                log.warning("Error showing system UI elements: %s", e)
+
+    def _apply_window_ops(self, ops):
+        """
+        Applies several window position/z-order changes as one atomic reposition
+        with BeginDeferWindowPos/DeferWindowPos/EndDeferWindowPos.
+        ops is a list of (hwnd, insert_after, x, y, cx, cy, flags) tuples,
+        matching the arguments of SetWindowPos.
+        """
+        if not sys.platform.startswith('win') or not ops:
+            return
+        hdwp = _BeginDeferWindowPos(len(ops))
+        for hwnd, insert_after, x, y, cx, cy, flags in ops:
+            if not hdwp:
+                break
+            hdwp = _DeferWindowPos(hdwp, hwnd, insert_after, x, y, cx, cy, flags)
+        if hdwp:
+            _EndDeferWindowPos(hdwp)
+        else:
+            log.warning("Error batching window position changes.")
+
+    def _force_foreground(self, hwnd):
+        """
+        Restores hwnd if it is minimized and brings it to the foreground.
+        Windows ignores SetForegroundWindow from a process that did not receive the last
+        input event, so an empty key press is sent first to satisfy that rule.
+        Returns True if the window was brought to the foreground.
+        """
+        if _IsIconic(hwnd):
+            _ShowWindow(hwnd, SW_RESTORE)
+        _keybd_event(0, 0, 0, 0)
+        _keybd_event(0, 0, KEYEVENTF_KEYUP, 0)
+        return bool(_SetForegroundWindow(hwnd))
+
+    def _match_session_window(self, hwnd, found):
+        """
+        Records a visible top-level window in found under "pdf" or "spotify"
+        if its title matches and that slot is still empty.
+        """
+        if not _IsWindowVisible(hwnd) or _GetWindowLongW(hwnd, GWL_STYLE) & WS_CHILD:
+            return
+        length = _GetWindowTextLengthW(hwnd)
+        if not length:
+            return
+        buf = ctypes.create_unicode_buffer(length + 1)
+        _GetWindowTextW(hwnd, buf, length + 1)
+        for match in _SESSION_TITLE_RE.finditer(buf.value):
+            found.setdefault(match.lastgroup, hwnd)
+
+    def _start_window_discovery(self, timeout):
+        """
+        Starts looking for the SumatraPDF and Spotify windows. Windows that already exist are
+        found with a single EnumWindows pass. For the rest, a WinEvent hook reports windows as
+        they are created or retitled, and discovery_timer rescans every 100ms, until both are
+        found or timeout seconds pass. Either way _setup_session_windows is called with the
+        handles found. The hooks are delivered through the Qt event loop, so nothing blocks.
+        """
+        if not sys.platform.startswith('win'):
+            self._setup_session_windows(None, None)
+            return
+
+        self._discovery_found = {}
+        self._scan_session_windows()
+        if len(self._discovery_found) == 2:
+            self._finish_window_discovery()
+            return
+
+        # Titles are usually set after creation, so watch for name changes as well
+        self._discovery_proc = WINEVENTPROC(self._on_discovery_event)
+        self._discovery_hooks = [_SetWinEventHook(event, event, None, self._discovery_proc, 0, 0, WINEVENT_OUTOFCONTEXT)
+                                 for event in (EVENT_OBJECT_CREATE, EVENT_OBJECT_NAMECHANGE)]
+        self._discovery_deadline_ns = time.monotonic_ns() + timeout * NS_PER_SECOND
+        self.discovery_timer.start(100)
+
+    def _scan_session_windows(self):
+        """Matches every existing top-level window in one EnumWindows pass, stopping once both are found."""
+        found = self._discovery_found
+
+        def on_enum(hwnd, lparam):
+            self._match_session_window(hwnd, found)
+            return len(found) < 2
+
+        _EnumWindows(WNDENUMPROC(on_enum), 0)
+
+    def _on_discovery_event(self, hook, event, hwnd, id_object, id_child, thread_id, event_time):
+        """WinEvent callback for window creation and title changes during discovery."""
+        if self._discovery_found is None or not hwnd or id_object != OBJID_WINDOW or id_child != 0:
+            return
+        self._match_session_window(hwnd, self._discovery_found)
+        if len(self._discovery_found) == 2:
+            # Finish once this callback has returned rather than unhooking from inside it
+            QTimer.singleShot(0, self._on_discovery_tick)
+
+    def _on_discovery_tick(self):
+        """
+        Runs every 100ms during discovery, and right after the hook finds the last window.
+        Rescans in case a window got its title between the first pass and the hooks going in;
+        EnumWindows is a cheap native walk, so the rescans cost next to nothing.
+        """
+        if self._discovery_found is None:
+            return # Already finished or stopped
+        if len(self._discovery_found) < 2 and time.monotonic_ns() < self._discovery_deadline_ns:
+            self._scan_session_windows()
+            if len(self._discovery_found) < 2:
+                return
+        self._finish_window_discovery()
+
+    def _finish_window_discovery(self):
+        """Stops discovery and hands the windows found over to the session setup."""
+        found = self._discovery_found
+        self._stop_window_discovery()
+        self._setup_session_windows(found.get("pdf"), found.get("spotify"))
+
+    def _stop_window_discovery(self):
+        """Removes the discovery hooks and stops the rescans, if discovery is running."""
+        self.discovery_timer.stop()
+        for hook in self._discovery_hooks:
+            if hook:
+                _UnhookWinEvent(hook)
+        self._discovery_hooks = []
+        self._discovery_proc = None
+        self._discovery_found = None
+
+    def _register_f6_hotkey(self):
+        """
+        Registers F6 as a system hotkey with RegisterHotKey. Unlike a global keyboard
+        hook, the process is only woken when F6 itself is pressed; the press arrives
+        as WM_HOTKEY in nativeEvent.
+        """
+        if sys.platform.startswith('win') and self.f6_hotkey_id is None:
+            self._hotkey_hwnd = int(self.winId())
+            if _RegisterHotKey(self._hotkey_hwnd, F6_HOTKEY_ID, 0, VK_F6):
+                self.f6_hotkey_id = F6_HOTKEY_ID
+                log.debug("F6 hotkey registered for Spotify.")
+            else:
+                log.warning("Error registering F6 hotkey: Windows error %s", ctypes.get_last_error())
+
+    def _unregister_f6_hotkey(self):
+        """Unregisters the F6 hotkey if it is registered."""
+        if self.f6_hotkey_id is not None:
+            if _UnregisterHotKey(self._hotkey_hwnd, self.f6_hotkey_id):
+                log.debug("F6 hotkey unregistered.")
+            else:
+                log.warning("Error unregistering F6 hotkey: Windows error %s", ctypes.get_last_error())
+            self.f6_hotkey_id = None
+            self._hotkey_hwnd = None
+
+    def _install_foreground_hook(self):
+        """
+        Sets an EVENT_SYSTEM_FOREGROUND hook that records the new foreground HWND whenever
+        it changes, so the enforcement tick never has to poll for it. Out-of-context hooks
+        are delivered through the installing thread's messages, which Qt's event loop pumps.
+        """
+        if not sys.platform.startswith('win') or self._foreground_hook:
+            return
+
+        def on_foreground(hook, event, hwnd, id_object, id_child, thread_id, event_time):
+            self._foreground_hwnd = hwnd or 0
+
+        self._foreground_hook_proc = WINEVENTPROC(on_foreground)
+        self._foreground_hook = _SetWinEventHook(EVENT_SYSTEM_FOREGROUND, EVENT_SYSTEM_FOREGROUND, None,
+                                                 self._foreground_hook_proc, 0, 0, WINEVENT_OUTOFCONTEXT)
+        if not self._foreground_hook:
+            log.warning("Error setting foreground hook: Windows error %s", ctypes.get_last_error())
+            self._foreground_hook_proc = None
+
+    def _remove_foreground_hook(self):
+        """Removes the foreground hook if it is set."""
+        if self._foreground_hook:
+            _UnhookWinEvent(self._foreground_hook)
+            self._foreground_hook = None
+            self._foreground_hook_proc = None
+
+    def nativeEvent(self, eventType, message):
+        """Dispatches WM_HOTKEY for the registered F6 hotkey to its callback."""
+        if self.f6_hotkey_id is not None and bytes(eventType) == b"windows_generic_MSG":
+            msg = wintypes.MSG.from_address(int(message))
+            if msg.message == WM_HOTKEY and msg.wParam == self.f6_hotkey_id:
+                self.activate_spotify_hotkey_callback()
+                return True, 0
+        return super().nativeEvent(eventType, message)
 
     def activate_spotify_hotkey_callback(self):
         """
         Callback function for the F6 hotkey to toggle Spotify's minimized/restored state.
         """
-        if self.session_active and self.spotify_window_ref and isinstance(self.spotify_window_ref, gw.Win32Window):
-            try:
-                if self.spotify_window_ref.isMinimized:
-                    self.spotify_window_ref.restore()
-                    self.spotify_window_ref.activate()
-                    self.spotify_window_ref.raise_()
-                    print("F6 pressed: Restored and activated Spotify.")
-                else:
-                    # If it's not minimized, minimize it
-                    self.spotify_window_ref.minimize()
-                    print("F6 pressed: Minimized Spotify.")
-            except Exception as e:
-                print(f"Error toggling Spotify via F6: {e}")
+        spotify_hwnd = self._spotify_hwnd
+        if self.session_active and spotify_hwnd and _IsWindow(spotify_hwnd):
+            if _IsIconic(spotify_hwnd):
+                self._force_foreground(spotify_hwnd) # Restores it as well
+                log.debug("F6 pressed: Restored and activated Spotify.")
+            else:
+                # If it's not minimized, minimize it
+                _ShowWindow(spotify_hwnd, SW_MINIMIZE)
+                log.debug("F6 pressed: Minimized Spotify.")
         else:
-            print("F6 pressed, but Spotify window not found or session not active.")
+            log.warning("F6 pressed, but Spotify window not found or session not active.")
 
     def start_focus(self):
         """Initiates the focus lock session."""
@@ -531,21 +1108,24 @@ class ZenFocus(QWidget):
             return
 
         self.total_session_duration_minutes = int(self.duration_combo.currentText())
-        self.session_end_absolute_time = time.time() + self.total_session_duration_minutes * 60
+        # monotonic_ns is immune to NTP/DST clock jumps and stays an exact int
+        now = time.monotonic_ns()
+        self.session_end_ns = now + self.total_session_duration_minutes * 60 * NS_PER_SECOND
+        self._last_relaunch_ns = None
+        self._last_overlay_raise_ns = None
         self.session_active = True
         self.is_on_break = False # Start in focus mode
-        self.current_segment_end_time = time.time() + (self.focus_interval_minutes * 60) # Initial focus segment end
+        self.current_segment_end_ns = now + self.focus_interval_minutes * 60 * NS_PER_SECOND # Initial focus segment end
 
-        # Create and show the Timer Overlay window
-        self.timer_overlay = TimerOverlay()
-        # Position it in the top-right corner, adjusted slightly
+        # Show the Timer Overlay window, positioned in the top-right corner, adjusted slightly
         screen_geometry = QApplication.desktop().screenGeometry()
         self.timer_overlay.move(screen_geometry.width() - self.timer_overlay.width() - 20, 20)
         self.timer_overlay.show()
+        self.timer_overlay.reassert_topmost()
         
-        # Main UI window hides during session
-        self.showMinimized()
-        self.setVisible(False)
+        # Main UI window hides during session. Hiding keeps the native window, so its handle
+        # stays the same across sessions.
+        self.hide()
 
         # Disable input controls and enable reset button
         self.start_btn.setEnabled(False)
@@ -553,296 +1133,374 @@ class ZenFocus(QWidget):
         self.duration_combo.setEnabled(False)
         self.reset_btn.setEnabled(True)
         
-        self.status_message_label.setText("FOCUS MODE ACTIVE. Stay strong!")
-        self.status_message_label.setStyleSheet("color: #FFC107;") # Amber for active session
+        self._set_status("FOCUS MODE ACTIVE. Stay strong!", "active") # Amber for active session
+
+        self._main_hwnd = int(self.winId())
 
-        self.timer.start(1000) # Start the timer for display updates
-        threading.Thread(target=self.run_focus_session, daemon=True).start()
+        self._register_f6_hotkey()
+        self._install_foreground_hook()
 
-    def run_focus_session(self):
+        if not self._sounds_loaded:
+            self._load_sound_effects((BREAK_START_TONE, BREAK_END_TONE)) # Ready long before the first break
+
+        self._last_timer_display = None
+        self.update_timer() # Show the starting time immediately
+        self.timer.start(1000) # Refresh the overlay display while it is visible
+        self.segment_timer.start(self.focus_interval_minutes * 60 * 1000) # First focus -> break transition
+        # End of the whole session, measured from session_end_ns since setup above took some time
+        self.session_timer.start(max(0, self.session_end_ns - time.monotonic_ns()) // NS_PER_MS)
+        self._begin_session()
+
+    def _spawn_app(self, args):
         """
-        Manages the focus session in a separate thread, alternating between focus and break.
+        Starts an app from an argument list and returns its Popen object. No shell is needed
+        for a list, which saves starting cmd.exe first on Windows, and the standard streams go
+        to DEVNULL so the app inherits none of this process's handles.
         """
-        self.block_shortcuts() # Block general shortcuts at session start
-        self._hide_taskbar() # Hide taskbar at session start
+        return subprocess.Popen(args, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                                stderr=subprocess.DEVNULL)
 
+    def _launch_session_apps(self, sumatra_path, spotify_path):
+        """
+        Launches SumatraPDF with the selected PDF and Spotify without waiting on either.
+        Returns the (pdf_process, spotify_process) Popen objects; either may be None.
+        """
         # Launch SumatraPDF
-        sumatra_path = self.get_sumatra_path()
         pdf_process = None
         if sumatra_path:
             try:
                 # Launch without -fullscreen initially, as we'll send F5 later
-                pdf_process = subprocess.Popen([sumatra_path, self.pdf_path], shell=True if sys.platform.startswith('win') else False)
-                print(f"Launched SumatraPDF: {self.pdf_path}")
+                pdf_process = self._spawn_app([sumatra_path, self.pdf_path])
+                log.debug("Launched SumatraPDF: %s", self.pdf_path)
             except Exception as e:
-                print(f"Error launching SumatraPDF: {e}")
-                self.status_message_label.setText(f"ERROR: Could not launch PDF viewer. {e}")
+                log.warning("Error launching SumatraPDF: %s", e)
+                self._set_status(f"ERROR: Could not launch PDF viewer. {e}")
         else:
-            print("SumatraPDF not found at expected paths.")
-            self.status_message_label.setText("WARNING: SumatraPDF not found. PDF may not open.")
-
+            log.warning("SumatraPDF not found at expected paths.")
+            self._set_status("WARNING: SumatraPDF not found. PDF may not open.")
 
         # Launch Spotify
         spotify_process = None
-        spotify_path = self.get_spotify_path()
         if spotify_path:
             try:
-                spotify_process = subprocess.Popen([spotify_path], shell=True if sys.platform.startswith('win') else False)
-                print("Launched Spotify.")
+                spotify_process = self._spawn_app([spotify_path])
+                log.debug("Launched Spotify.")
             except Exception as e:
-                print(f"Error launching Spotify: {e}")
-                self.status_message_label.setText(f"WARNING: Could not launch Spotify. {e}")
+                log.warning("Error launching Spotify: %s", e)
+                self._set_status(f"WARNING: Could not launch Spotify. {e}")
         else:
-            print("Spotify not found at expected paths.")
-            self.status_message_label.setText("WARNING: Spotify not found. Audio may not play.")
-
-        # Give apps time to open and load
-        time.sleep(6)
-
-        pdf_window = None
-        spotify_window = None
-        # Max attempts to find windows
-        for _ in range(15):
-            all_windows = gw.getAllWindows()
-            for w in all_windows:
-                try:
-                    title = w.title.lower()
-                    if ".pdf" in title and pdf_window is None:
-                        pdf_window = w
-                    if "spotify" in title and spotify_window is None:
-                        spotify_window = w
-                except gw.PyGetWindowException:
-                    pass
-            if pdf_window and spotify_window:
-                break
-            time.sleep(1)
-        
-        # Store spotify_window_ref for the hotkey callback
-        self.spotify_window_ref = spotify_window
-        if self.spotify_window_ref:
-            self.f6_hotkey_id = keyboard.add_hotkey('f6', self.activate_spotify_hotkey_callback)
-            print("F6 hotkey registered for Spotify.")
+            log.warning("Spotify not found at expected paths.")
+            self._set_status("WARNING: Spotify not found. Audio may not play.")
 
+        return pdf_process, spotify_process
 
-        # Ensure PDF is maximized and activated, then send F5 for full-screen and block F5
-        if pdf_window and isinstance(pdf_window, gw.Win32Window):
-            try:
-                if not pdf_window.isMaximized:
-                    pdf_window.maximize()
-                pdf_window.activate()
-                try:
-                    pdf_window.alwaysOnTop(True)
-                except Exception as e:
-                    print(f"Could not set PDF window always on top: {e}")
-                
-                time.sleep(1) # Give it a moment to fully activate
-                
-                # Activate again right before sending key to ensure focus
-                pdf_window.activate()
-                pdf_window.raise_()
-                time.sleep(0.1) # Small delay for focus change
-
-                # Send F5 ONCE and then immediately block it for the rest of the session
-                try:
-                    keyboard.send('f5') # Send F5 to SumatraPDF
-                    print("Sent F5 to SumatraPDF for full-screen activation.")
-                    time.sleep(0.1) # Short delay to allow keypress to register
-                    keyboard.block_key('f5') # Block F5 immediately after sending it
-                    print("F5 key blocked for user input for the session duration.")
-                except Exception as e:
-                    print(f"Error sending F5 to SumatraPDF or blocking F5: {e}")
-
-            except gw.PyGetWindowException:
-                print("PDF window became inaccessible during initial activation.")
-                pdf_window = None
-
-
-        # Store handles of allowed windows for focus enforcement
-        allowed_handles = set()
-        if pdf_window and isinstance(pdf_window, gw.Win32Window):
-            allowed_handles.add(pdf_window._hWnd)
-        if spotify_window and isinstance(spotify_window, gw.Win32Window):
-            allowed_handles.add(spotify_window._hWnd)
-
-        # Main session loop (alternating focus and break)
-        while time.time() < self.session_end_absolute_time and self.session_active:
-            current_time = time.time()
-
-            # Check for segment transition
-            if current_time >= self.current_segment_end_time:
-                if not self.is_on_break: # End of focus segment, start break
-                    self.is_on_break = True
-                    self.play_system_sound(880, 500) # Higher pitch for break start
-                    # Updated: Status message for main window in red for break
-                    self.status_message_label.setText("BREAK TIME! 5 minutes. Relax.")
-                    self.status_message_label.setStyleSheet("color: #F44336;") # Red for break
-                    self.unblock_shortcuts() # Unblock general shortcuts for break
-                    self._show_taskbar() # Show taskbar for break
-                    
-                    # F5 is *not* in the general unblock_shortcuts list, so it remains blocked.
-                    # This is correct if it should be blocked during breaks too.
-
-                    # Optionally minimize/deactivate focus apps during break
-                    if pdf_window and isinstance(pdf_window, gw.Win32Window):
-                        try:
-                            pdf_window.minimize()
-                        except gw.PyGetWindowException:
-                            pass
-                    if spotify_window and isinstance(spotify_window, gw.Win32Window):
-                        try:
-                            spotify_window.minimize()
-                        except gw.PyGetWindowException:
-                            pass
-                    self.current_segment_end_time = current_time + (self.break_interval_minutes * 60)
-                    print("Transitioned to break mode.")
-                else: # End of break segment, resume focus
-                    self.is_on_break = False
-                    self.play_system_sound(660, 500) # Lower pitch for break end
-                    self.status_message_label.setText("BACK TO FOCUS! Resume work.")
-                    self.status_message_label.setStyleSheet("color: #4CAF50;") # Green for focus
-                    self.block_shortcuts() # Re-block general shortcuts for focus
-                    self._hide_taskbar() # Hide taskbar for focus
-
-                    # F5 remains blocked from its initial block_key call throughout.
-                    # We do NOT send F5 again here, as per "only once".
-
-                    # Aggressively re-activate PDF (without sending F5 again)
-                    if pdf_window and isinstance(pdf_window, gw.Win32Window):
-                        for _ in range(3): # Try a few times to re-assert focus
-                            try:
-                                if pdf_window.isMinimized:
-                                    pdf_window.restore()
-                                pdf_window.activate()
-                                pdf_window.raise_()
-                                time.sleep(0.5) # Give some time for window to react
-                                print("Re-activated SumatraPDF after break (F5 not re-sent).")
-                                break # Break from retry loop if successful
-                            except gw.PyGetWindowException:
-                                print("PDF window inaccessible during post-break activation attempt.")
-                                pdf_window = None # Mark as inaccessible if consistent failure
-                                break # Exit retry loop
-                            except Exception as e:
-                                print(f"Error during post-break PDF re-activation: {e}")
-                                time.sleep(0.5) # Wait before next retry
-
-                    if spotify_window and isinstance(spotify_window, gw.Win32Window):
-                        try:
-                            spotify_window.restore()
-                            spotify_window.activate()
-                            spotify_window.raise_()
-                        except gw.PyGetWindowException:
-                            pass
-                    
-                    # Ensure the timer overlay is still on top
-                    if self.timer_overlay and self.timer_overlay.isVisible():
-                        self.timer_overlay.activateWindow()
-                        self.timer_overlay.raise_()
-                        time.sleep(0.1) # Brief pause after main app activation
-
-
-                    # Calculate next focus segment end, respecting total session duration
-                    remaining_total = self.session_end_absolute_time - current_time
-                    next_focus_duration = min(self.focus_interval_minutes * 60, remaining_total)
-                    if next_focus_duration > 0:
-                        self.current_segment_end_time = current_time + next_focus_duration
-                    else:
-                        break # End session if no more focus time left
-                    print("Transitioned to focus mode.")
-
-            # Focus enforcement only during focus mode
-            if not self.is_on_break:
-                current_active_window = gw.getActiveWindow()
-                is_allowed = False
-                if current_active_window is not None and isinstance(current_active_window, gw.Win32Window):
-                    try:
-                        # Check if the active window is one of our allowed focus apps OR the timer overlay itself
-                        if current_active_window._hWnd in allowed_handles or \
-                           (self.timer_overlay and self.timer_overlay.isVisible() and current_active_window._hWnd == self.timer_overlay.winId()):
-                            is_allowed = True
-                    except Exception:
-                        pass
-                
-                if not is_allowed:
-                    # Prioritize activating PDF
-                    if pdf_window and isinstance(pdf_window, gw.Win32Window):
-                        try:
-                            if pdf_window.isMinimized: pdf_window.restore()
-                            pdf_window.activate()
-                            pdf_window.raise_()
-                        except gw.PyGetWindowException:
-                            print("PDF window inaccessible, assuming closed during focus.")
-                            pdf_window = None
-                    # Fallback to Spotify if PDF fails
-                    elif spotify_window and isinstance(spotify_window, gw.Win32Window):
-                        try:
-                            if spotify_window.isMinimized: spotify_window.restore()
-                            spotify_window.activate()
-                            spotify_window.raise_()
-                        except gw.PyGetWindowException:
-                            print("Spotify window inaccessible, assuming closed during focus.")
-                            spotify_window = None
-                    # If all specific apps are gone, try to relaunch or just let the main app serve as a blocker
-                    else:
-                        if pdf_process and pdf_process.poll() is None: # If PDF process is still running
-                            try: subprocess.Popen([sumatra_path, self.pdf_path], shell=True if sys.platform.startswith('win') else False)
-                            except Exception as e: print(f"Error re-launching SumatraPDF: {e}")
-                        elif spotify_process and spotify_process.poll() is None:
-                            try: subprocess.Popen([spotify_path], shell=True if sys.platform.startswith('win') else False)
-                            except Exception as e: print(f"Error re-launching Spotify: {e}")
-                        
-                        # Ensure the timer overlay is still on top if other apps fail
-                        if self.timer_overlay and self.timer_overlay.isVisible():
-                            self.timer_overlay.activateWindow()
-                            self.timer_overlay.raise_()
-                        time.sleep(0.1) # Brief pause
-
-            time.sleep(0.5) # Check every half second
-
-        # Session ended naturally or forced out of loop
-        self.unblock_shortcuts() # This unblocks all general shortcuts
-        # Explicitly unblock F5 one last time
+    def _begin_session(self):
+        """
+        Locks down the desktop and launches the session apps, then starts looking for
+        their windows. Everything after that is driven by timers and WinEvent hooks.
+        """
+        self.block_shortcuts() # Block general shortcuts at session start
+        self._hide_taskbar() # Hide taskbar at session start
+
+        # Launch both apps back to back, then wait only as long as their windows take to appear
+        self._pdf_process, self._spotify_process = self._launch_session_apps(self.get_sumatra_path(),
+                                                                             self.get_spotify_path())
+
+        # Find the windows, waiting up to 15 seconds for any that are not open yet
+        self._start_window_discovery(15)
+
+    def _setup_session_windows(self, pdf_hwnd, spotify_hwnd):
+        """
+        Called once discovery has finished, with whichever handles were found.
+        Puts the PDF in front, full-screen, and starts focus enforcement.
+        """
+        if not self.session_active:
+            return
+
+        # Store the Spotify handle for the hotkey callback
+        self._spotify_hwnd = spotify_hwnd
+
+        # Ensure PDF is maximized and activated; F5 for full-screen follows once it has settled
+        if pdf_hwnd and _IsWindow(pdf_hwnd):
+            if not _IsZoomed(pdf_hwnd):
+                _ShowWindow(pdf_hwnd, SW_MAXIMIZE)
+            # Making the PDF topmost also raises it, so both happen in one reposition
+            self._apply_window_ops([
+                (pdf_hwnd, HWND_TOPMOST, 0, 0, 0, 0, SWP_NOMOVE | SWP_NOSIZE | SWP_NOACTIVATE),
+            ])
+            self._force_foreground(pdf_hwnd)
+            QTimer.singleShot(1000, lambda: self._send_pdf_fullscreen(pdf_hwnd)) # Give it a moment to fully activate
+        elif pdf_hwnd:
+            log.warning("PDF window became inaccessible during initial activation.")
+            pdf_hwnd = None
+
+        # Store the PDF handle for enforcement and the segment transitions
+        self._pdf_hwnd = pdf_hwnd
+
+        # Handles of the windows allowed to hold the foreground during focus: the focus apps,
+        # the timer overlay and this window. Raw HWND ints in an immutable set, so each check
+        # is one hash lookup.
+        self._allowed_hwnds = frozenset(
+            hwnd for hwnd in (pdf_hwnd, spotify_hwnd, self._overlay_hwnd, self._main_hwnd) if hwnd
+        )
+
+        # Foreground changes arrive from the hook, so the foreground window is read only once
+        # here and otherwise tracked from the hook's events instead of polled every tick
+        self._foreground_hwnd = _GetForegroundWindow() if sys.platform.startswith('win') else None
+
+        # Focus/break transitions are driven by segment_timer; this tick only enforces
+        # focus while not on a break
+        self.enforce_timer.start(500)
+
+    def _send_pdf_fullscreen(self, pdf_hwnd):
+        """Activates the PDF again right before sending F5, so the key reaches SumatraPDF."""
+        if not self.session_active or self._pdf_hwnd != pdf_hwnd:
+            return
+        if not _IsWindow(pdf_hwnd):
+            log.warning("PDF window became inaccessible before F5 could be sent.")
+            return
+        self._force_foreground(pdf_hwnd)
+        QTimer.singleShot(100, lambda: self._send_pdf_f5(pdf_hwnd)) # Small delay for focus change
+
+    def _send_pdf_f5(self, pdf_hwnd):
+        """Sends F5 ONCE and then blocks it for the rest of the session."""
+        if not self.session_active or self._pdf_hwnd != pdf_hwnd:
+            return
+        _keybd_event(VK_F5, 0, 0, 0) # Send F5 to SumatraPDF
+        _keybd_event(VK_F5, 0, KEYEVENTF_KEYUP, 0)
+        log.debug("Sent F5 to SumatraPDF for full-screen activation.")
+        QTimer.singleShot(100, self._block_f5) # Short delay to allow keypress to register
+
+    def _block_f5(self):
+        """Blocks F5 for user input for the session duration."""
+        if not self.session_active:
+            return
+        self._f5_blocked = True
+        self._update_keyboard_hook()
+        log.debug("F5 key blocked for user input for the session duration.")
+
+    def _unblock_f5(self):
+        """Unblocks F5 if it was blocked during the session."""
+        if self._f5_blocked:
+            self._f5_blocked = False
+            self._update_keyboard_hook()
+            log.debug("F5 unblocked at session end.")
+
+    def _relaunch_app(self, name, args):
+        """Starts a session app again. Runs on _launcher, so a slow process start never stalls the GUI."""
         try:
-            keyboard.unblock_key('f5')
-            print("F5 unblocked at session end.")
-        except Exception:
-            pass
-        self.end_session() # This will run cleanup
+            self._spawn_app(args)
+        except Exception as e:
+            log.warning("Error re-launching %s: %s", name, e)
+
+    def _keep_overlay_on_top(self):
+        """
+        Brings the overlay to the foreground when neither session app can hold it.
+        Throttled to one attempt every OVERLAY_RAISE_INTERVAL_SECONDS, since the enforcement
+        tick would otherwise retry it every half second while focus keeps being lost.
+        """
+        now = time.monotonic_ns()
+        if (self._last_overlay_raise_ns is not None
+                and now - self._last_overlay_raise_ns < OVERLAY_RAISE_INTERVAL_SECONDS * NS_PER_SECOND):
+            return
+        self._last_overlay_raise_ns = now
+        # The visibility check uses the overlay handle cached at creation instead of going through Qt
+        if _IsWindowVisible(self._overlay_hwnd) and self._force_foreground(self._overlay_hwnd):
+            self._foreground_hwnd = self._overlay_hwnd
+
+    def _enforce_focus(self):
+        """
+        Run by enforce_timer every half second during a session. Pulls focus back to the
+        PDF (or Spotify) whenever some other window is in the foreground.
+        """
+        # Focus enforcement only during focus mode (Windows only)
+        if not self.session_active or self.is_on_break or not sys.platform.startswith('win'):
+            return
+        if self._foreground_hwnd in self._allowed_hwnds:
+            return
+
+        pdf_hwnd = self._pdf_hwnd
+        spotify_hwnd = self._spotify_hwnd
+
+        # Prioritize activating PDF. A successful switch is recorded right away,
+        # so the next tick does not repeat it before the hook reports the change.
+        if pdf_hwnd:
+            if not _IsWindow(pdf_hwnd):
+                log.warning("PDF window inaccessible, assuming closed during focus.")
+                self._pdf_hwnd = None
+            elif self._force_foreground(pdf_hwnd):
+                self._foreground_hwnd = pdf_hwnd
+        # Fallback to Spotify if PDF fails
+        elif spotify_hwnd:
+            if not _IsWindow(spotify_hwnd):
+                log.warning("Spotify window inaccessible, assuming closed during focus.")
+                self._spotify_hwnd = None
+            elif self._force_foreground(spotify_hwnd):
+                self._foreground_hwnd = spotify_hwnd
+        # If all specific apps are gone, try to relaunch or just let the main app serve as a blocker
+        else:
+            now = time.monotonic_ns()
+            if self._last_relaunch_ns is None or now - self._last_relaunch_ns >= RELAUNCH_COOLDOWN_SECONDS * NS_PER_SECOND:
+                # One check over both apps, PDF first: relaunch the first whose process is still running
+                candidates = (
+                    ("SumatraPDF", self._pdf_process, (self.get_sumatra_path(), self.pdf_path)),
+                    ("Spotify", self._spotify_process, (self.get_spotify_path(),)),
+                )
+                for name, process, args in candidates:
+                    if process and process.poll() is None:
+                        self._launcher.submit(self._relaunch_app, name, list(args))
+                        self._last_relaunch_ns = now
+                        break
+
+            # Ensure the timer overlay is still on top if other apps fail
+            self._keep_overlay_on_top()
+
+    def _on_segment_boundary(self):
+        """
+        Fired by segment_timer when the current focus or break segment ends.
+        Switches modes and schedules the next transition.
+        """
+        if not self.session_active:
+            return
+
+        now = time.monotonic_ns()
+        # A segment that reaches the session end finishes the session instead of switching
+        # modes; segment_timer can fire just before session_timer, and coarse timers may
+        # fire slightly early, so compare the scheduled segment end as well as the clock.
+        if max(now, self.current_segment_end_ns) >= self.session_end_ns:
+            self.end_session()
+            return
+
+        pdf_hwnd = self._pdf_hwnd
+        spotify_hwnd = self._spotify_hwnd
+
+        if not self.is_on_break: # End of focus segment, start break
+            self.is_on_break = True
+            self.play_system_sound(*BREAK_START_TONE) # Higher pitch for break start
+            # Updated: Status message for main window in red for break
+            self._set_status("BREAK TIME! 5 minutes. Relax.", "break") # Red for break
+            self.unblock_shortcuts() # Unblock general shortcuts for break
+            self._show_taskbar() # Show taskbar for break
+            
+            # F5 is *not* in the general unblock_shortcuts list, so it remains blocked.
+            # This is correct if it should be blocked during breaks too.
+
+            # Optionally minimize/deactivate focus apps during break
+            if pdf_hwnd:
+                _ShowWindow(pdf_hwnd, SW_MINIMIZE)
+            if spotify_hwnd:
+                _ShowWindow(spotify_hwnd, SW_MINIMIZE)
+
+            # Keep the overlay above everything for the break countdown
+            self.timer_overlay.reassert_topmost()
+
+            self.current_segment_end_ns = now + self.break_interval_minutes * 60 * NS_PER_SECOND
+            self.segment_timer.start(self.break_interval_minutes * 60 * 1000)
+            log.debug("Transitioned to break mode.")
+        else: # End of break segment, resume focus
+            self.is_on_break = False
+            self.play_system_sound(*BREAK_END_TONE) # Lower pitch for break end
+            self._set_status("BACK TO FOCUS! Resume work.", "ok") # Green for focus
+            self.block_shortcuts() # Re-block general shortcuts for focus
+            self._hide_taskbar() # Hide taskbar for focus
+
+            # F5 remains blocked from its initial block_key call throughout.
+            # We do NOT send F5 again here, as per "only once".
+
+            # Z-order changes for the restored windows, applied together in one reposition
+            window_ops = []
+
+            # Aggressively re-activate PDF (without sending F5 again), retrying twice more if refused
+            if pdf_hwnd:
+                self._reactivate_pdf(pdf_hwnd, 2, window_ops)
+
+            if spotify_hwnd and _IsWindow(spotify_hwnd):
+                _ShowWindow(spotify_hwnd, SW_RESTORE)
+                self._force_foreground(spotify_hwnd)
+                window_ops.append((spotify_hwnd, HWND_TOP, 0, 0, 0, 0, SWP_NOMOVE | SWP_NOSIZE | SWP_NOACTIVATE))
+
+            self._apply_window_ops(window_ops)
+            
+            # Ensure the timer overlay is still on top of the re-raised PDF
+            self.timer_overlay.reassert_topmost()
+
+            # Calculate next focus segment end, respecting total session duration
+            remaining_total_ns = self.session_end_ns - now
+            next_focus_ns = min(self.focus_interval_minutes * 60 * NS_PER_SECOND, remaining_total_ns)
+            if next_focus_ns <= 0:
+                self.end_session() # End session if no more focus time left
+                return
+            self.current_segment_end_ns = now + next_focus_ns
+            self.segment_timer.start(next_focus_ns // NS_PER_MS)
+            log.debug("Transitioned to focus mode.")
+
+    def _reactivate_pdf(self, pdf_hwnd, attempts_left, window_ops=None):
+        """
+        Restores and activates the PDF after a break. Its topmost z-order change is added to
+        window_ops, or applied right away when there is no batch to join. If Windows refuses
+        the activation, it is repeated from a single-shot timer 500ms later, up to attempts_left
+        more times, so the GUI thread never sleeps between tries.
+        """
+        if not self.session_active or self.is_on_break or self._pdf_hwnd != pdf_hwnd:
+            return # Session ended, went back on a break, or lost the window before this retry
+        if not _IsWindow(pdf_hwnd):
+            log.warning("PDF window inaccessible during post-break activation attempt.")
+            self._pdf_hwnd = None # Mark as inaccessible
+            return
+        if not self._force_foreground(pdf_hwnd): # Restores it as well
+            log.warning("Post-break PDF re-activation was refused.")
+            if attempts_left > 0:
+                QTimer.singleShot(500, functools.partial(self._reactivate_pdf, pdf_hwnd, attempts_left - 1))
+            return
+
+        op = (pdf_hwnd, HWND_TOPMOST, 0, 0, 0, 0, SWP_NOMOVE | SWP_NOSIZE | SWP_NOACTIVATE)
+        if window_ops is not None:
+            window_ops.append(op)
+        else:
+            self._apply_window_ops([op])
+            self.timer_overlay.reassert_topmost() # Keep the overlay above the re-raised PDF
+        log.debug("Re-activated SumatraPDF after break (F5 not re-sent).")
 
     def update_timer(self):
         """Updates the remaining time displayed on the UI based on current segment."""
+        if not self.session_active:
+            return
+
+        now = time.monotonic_ns()
+
         # Remaining time for the current segment
-        remaining_segment = max(0, int(self.current_segment_end_time - time.time()))
+        remaining_segment = max(0, (self.current_segment_end_ns - now) // NS_PER_SECOND)
+
+        # Nothing to rebuild or repaint until the displayed second or the mode changes
+        if (remaining_segment, self.is_on_break) == self._last_timer_display:
+            return
+        self._last_timer_display = (remaining_segment, self.is_on_break)
         
         # Total remaining time for the entire session (for information, not controlling loop)
-        total_remaining = max(0, int(self.session_end_absolute_time - time.time()))
+        total_remaining = max(0, (self.session_end_ns - now) // NS_PER_SECOND)
 
-        if self.session_active:
-            mode_text = "FOCUS MODE" if not self.is_on_break else "BREAK TIME"
-            
-            hrs_seg, rem_seg = divmod(remaining_segment, 3600)
-            mins_seg, secs_seg = divmod(rem_seg, 60)
-            segment_time_str = f"{hrs_seg:02}:{mins_seg:02}:{secs_seg:02}"
-
-            # Only update the TimerOverlay if it exists
-            if self.timer_overlay:
-                # Updated: Use red for break time in the overlay
-                mode_color = "#F44336" if self.is_on_break else "#81C784" # Red for break, Green for focus
-                self.timer_overlay.update_timer_text(segment_time_str, mode_text, mode_color)
-
-            # Update the main window's timer label as well (optional, since it's hidden)
-            # This is more for consistency in data, if the main window were to be unhidden during session
-            hrs_total, rem_total = divmod(total_remaining, 3600)
-            mins_total, secs_total = divmod(rem_total, 60)
-            self.timer_label.setText(
-                f"{mode_text}: {hrs_seg:02}:{mins_seg:02}:{secs_seg:02}\n"
-                f"(Total Left: {hrs_total:02}:{mins_total:02}:{secs_total:02})"
-            )
-            # The main window's timer label styling is largely irrelevant if it's hidden.
-
-        if total_remaining == 0 and self.session_active: # Ensure it only triggers once at the very end
-            self.timer.stop() # Stop timer when entire session runs out
-            # Call end_session immediately here to ensure prompt cleanup
-            self.end_session()
+        mode_text = "FOCUS MODE" if not self.is_on_break else "BREAK TIME"
+        
+        hrs_seg, rem_seg = divmod(remaining_segment, 3600)
+        mins_seg, secs_seg = divmod(rem_seg, 60)
+        segment_time_str = f"{hrs_seg:02}:{mins_seg:02}:{secs_seg:02}"
+
+        # Updated: Use red for break time in the overlay
+        mode_color = "#F44336" if self.is_on_break else "#81C784" # Red for break, Green for focus
+        self.timer_overlay.update_timer_text(segment_time_str, mode_text, mode_color)
+
+        # The main window is hidden during a session, so its label is only kept current while
+        # visible; showEvent brings it up to date if the window is unhidden mid-session
+        if not self.timer_label.isVisible():
+            return
+        hrs_total, rem_total = divmod(total_remaining, 3600)
+        mins_total, secs_total = divmod(rem_total, 60)
+        self.timer_label.setText(
+            f"{mode_text}: {hrs_seg:02}:{mins_seg:02}:{secs_seg:02}\n"
+            f"(Total Left: {hrs_total:02}:{mins_total:02}:{secs_total:02})"
+        )
+        # The main window's timer label styling is largely irrelevant if it's hidden.
+        # Session end is handled by session_timer, not by this display refresh.
 
 
     def reset_session(self):
@@ -852,25 +1510,22 @@ class ZenFocus(QWidget):
         # Reverting to enable reset functionality for debugging/user control, but can be re-disabled if strictness is paramount.
         # This function should terminate the running session and revert the UI.
         
-        # Ensure session_active is set to False to stop the threading.Thread loop
+        # Ensure session_active is set to False so no pending setup step or tick runs on
         self.session_active = False 
+        self._stop_window_discovery()
+        self.enforce_timer.stop()
         self.unblock_shortcuts()
+        self._unblock_f5()
         self._show_taskbar()
-        if self.f6_hotkey_id:
-            try:
-                keyboard.remove_hotkey(self.f6_hotkey_id)
-                self.f6_hotkey_id = None
-            except Exception as e:
-                print(f"Error unregistering F6 hotkey during reset: {e}")
-        self.spotify_window_ref = None
+        self._unregister_f6_hotkey()
+        self._remove_foreground_hook()
+        self._pdf_hwnd = None
+        self._spotify_hwnd = None
 
-        if self.timer_overlay:
-            self.timer_overlay.close()
-            self.timer_overlay = None
+        self.timer_overlay.hide()
 
-        self.setVisible(True)
-        self.setWindowFlags(Qt.Window)
-        self.showNormal()
+        self.show()
+        self.raise_()
         self.activateWindow()
 
         self.start_btn.setEnabled(True)
@@ -879,45 +1534,43 @@ class ZenFocus(QWidget):
         self.reset_btn.setEnabled(False)
         
         self.timer.stop()
+        self.segment_timer.stop()
+        self.session_timer.stop()
         self.timer_label.setText("Time Remaining: --:--:--")
-        self.status_message_label.setText("Session reset. Ready for new focus.")
-        self.status_message_label.setStyleSheet("color: #E0EBF5;") # Default color for reset
+        self._set_status("Session reset. Ready for new focus.", "reset") # Default color for reset
         
-        QMessageBox.information(self, "Session Reset", "The focus session has been reset.")
+        # Opened once this call has unwound, so the modal's event loop never runs mid-teardown
+        QTimer.singleShot(0, lambda: QMessageBox.information(self, "Session Reset", "The focus session has been reset."))
 
 
     def end_session(self):
         """Resets the UI and unblocks shortcuts when the focus session ends."""
-        # This function is primarily called when the timer runs out naturally
-        # or if an unrecoverable error occurs in run_focus_session.
+        # This function is primarily called when session_timer runs out naturally.
         # If reset_session is called, it will handle most of this.
 
         if not self.session_active: # Only proceed if session was marked active (and not already ended by reset_session)
             return
 
-        self.session_active = False # Mark as inactive (important for loop termination)
+        self.session_active = False # Mark as inactive so no pending setup step or tick runs on
+        self._stop_window_discovery()
+        self.enforce_timer.stop()
         self.unblock_shortcuts() # Ensure shortcuts are unblocked immediately
+        self._unblock_f5()
         self._show_taskbar()     # Show taskbar at session end
 
         # Unregister F6 hotkey
-        if self.f6_hotkey_id:
-            try:
-                keyboard.remove_hotkey(self.f6_hotkey_id)
-                self.f6_hotkey_id = None
-                print("F6 hotkey unregistered.")
-            except Exception as e:
-                print(f"Error unregistering F6 hotkey: {e}")
-        self.spotify_window_ref = None # Clear reference to Spotify window
+        self._unregister_f6_hotkey()
+        self._remove_foreground_hook()
+        self._pdf_hwnd = None # Clear the session window handles
+        self._spotify_hwnd = None
 
-        # Close the timer overlay if it exists
-        if self.timer_overlay:
-            self.timer_overlay.close()
-            self.timer_overlay = None
+        # Hide the timer overlay until the next session
+        self.timer_overlay.hide()
 
         # Restore main window to normal state
-        self.setVisible(True)
-        self.setWindowFlags(Qt.Window) # Revert to a normal window type
-        self.showNormal() # Restore to normal windowed mode
+        # The window flags never change, so showing it again needs no native window rebuild
+        self.show()
+        self.raise_()
         self.activateWindow() # Bring app back to normal attention
 
         self.start_btn.setEnabled(True)
@@ -926,84 +1579,79 @@ class ZenFocus(QWidget):
         self.reset_btn.setEnabled(False) # Disable reset button until session starts again
         
         self.timer.stop()
+        self.segment_timer.stop()
+        self.session_timer.stop()
         self.timer_label.setText("Time Remaining: 00:00:00")
         
-        # Updated: Personalized congratulatory message
-        QMessageBox.information(self, "Focus Session Complete", "Congrats Master Ryu for finishing your study session!")
-        self.status_message_label.setText("Congrats Master Ryu for finishing your study session!")
-        self.status_message_label.setStyleSheet("color: #81C784;") # Green for success/completion
+        self._set_status("Congrats Master Ryu for finishing your study session!", "done") # Green for success/completion
+
+        # Updated: Personalized congratulatory message, opened once this call has unwound
+        # so the modal's event loop never runs while the session is still being torn down
+        QTimer.singleShot(0, lambda: QMessageBox.information(self, "Focus Session Complete", "Congrats Master Ryu for finishing your study session!"))
 
 
     def get_sumatra_path(self):
-        """
-        Returns the likely path to SumatraPDF executable on Windows.
-        """
-        if sys.platform.startswith('win'):
-            paths = [
-                os.path.expandvars(r"C:\Program Files\SumatraPDF\SumatraPDF.exe"),
-                os.path.expandvars(r"C:\Program Files (x86)\SumatraPDF\SumatraPDF.exe"),
-                os.path.expandvars(r"%LOCALAPPDATA%\SumatraPDF\SumatraPDF.exe"),
-            ]
-            for path in paths:
-                if os.path.exists(path):
-                    return path
-        return None
+        """Returns the likely path to SumatraPDF executable on Windows."""
+        return _find_sumatra_path()
 
     def get_spotify_path(self):
-        """
-        Determines and returns the likely path to the Spotify executable based on the OS.
-        Includes a direct check for the user-provided path from previous conversations.
-        """
-        if sys.platform.startswith('win'):
-            # User-provided specific path from previous conversation
-            user_spotify_path = r"C:\Users\ahmed\AppData\Roaming\Spotify\Spotify.exe"
-            if os.path.exists(user_spotify_path):
-                return user_spotify_path
-
-            # Fallback to common install paths for Spotify
-            appdata_path = os.path.expandvars(r"%APPDATA%\Spotify\Spotify.exe")
-            localappdata_path = os.path.expandvars(r"%LOCALAPPDATA%\Spotify\Spotify.exe")
-            programfiles_x86_path = os.path.expandvars(r"%ProgramFiles(x86)%\Spotify\Spotify.exe")
-
-            if os.path.exists(appdata_path):
-                return appdata_path
-            elif os.path.exists(localappdata_path):
-                return localappdata_path
-            elif os.path.exists(programfiles_x86_path):
-                return programfiles_x86_path
-            else:
-                return None
-        elif sys.platform.startswith('darwin'):
-            return "/Applications/Spotify.app/Contents/MacOS/Spotify"
-        else: # Linux
-            if os.path.exists("/usr/bin/spotify"):
-                return "/usr/bin/spotify" # Corrected path
-            return None
+        """Returns the likely path to the Spotify executable based on the OS."""
+        return _find_spotify_path()
 
     def block_shortcuts(self):
         """Blocks common system shortcuts (Alt, Tab, Win, Esc, Ctrl, F11).
         F5 is handled separately for specific blocking logic."""
-        for key in ['alt', 'tab', 'win', 'esc', 'ctrl', 'f11']: # F5 removed from this list
-            try:
-                keyboard.block_key(key)
-            except Exception:
-                pass
+        if self._shortcuts_blocked:
+            return # Already blocked, nothing to rebuild
+        self._shortcuts_blocked = True
+        self._update_keyboard_hook()
 
     def unblock_shortcuts(self):
         """Unblocks previously blocked system shortcuts (excluding F5, which is separate)."""
-        for key in ['alt', 'tab', 'win', 'esc', 'ctrl', 'f11']: # F5 removed from this list
-            try:
-                keyboard.unblock_key(key)
-            except Exception:
-                pass
+        if not self._shortcuts_blocked:
+            return # Already unblocked, e.g. session ended during a break
+        self._shortcuts_blocked = False
+        self._update_keyboard_hook()
+
+    def _update_keyboard_hook(self):
+        """
+        Rebuilds the set of blocked virtual keys, and sets or removes the WH_KEYBOARD_LL hook
+        so it is only installed while something is blocked. The hook runs on this thread,
+        whose Qt event loop pumps the messages low-level hooks are called through.
+        """
+        blocked = set()
+        if self._shortcuts_blocked:
+            blocked |= BLOCKED_SHORTCUT_VKS
+        if self._f5_blocked:
+            blocked.add(VK_F5)
+        self._blocked_vks = frozenset(blocked)
+
+        if not sys.platform.startswith('win'):
+            return
+        if blocked and not self._keyboard_hook:
+            self._keyboard_hook_proc = LowLevelKeyboardProc(self._on_keyboard_event)
+            self._keyboard_hook = _SetWindowsHookExW(WH_KEYBOARD_LL, self._keyboard_hook_proc,
+                                                     _GetModuleHandleW(None), 0)
+            if not self._keyboard_hook:
+                log.warning("Error setting keyboard hook: Windows error %s", ctypes.get_last_error())
+                self._keyboard_hook_proc = None
+        elif not blocked and self._keyboard_hook:
+            _UnhookWindowsHookEx(self._keyboard_hook)
+            self._keyboard_hook = None
+            self._keyboard_hook_proc = None
+
+    def _on_keyboard_event(self, n_code, w_param, l_param):
+        """Low-level keyboard hook: swallows blocked keys (returns 1) and passes the rest on."""
+        if n_code == HC_ACTION and KBDLLHOOKSTRUCT.from_address(l_param).vkCode in self._blocked_vks:
+            return 1
+        return _CallNextHookEx(None, n_code, w_param, l_param)
 
 if __name__ == "__main__":
     if sys.platform.startswith('win'):
-        try:
-            # This line had a typo: `type.windll` should be `ctypes.windll`
-            ctypes.windll.user32.ShowWindow(ctypes.windll.kernel32.GetConsoleWindow(), 6)
-        except AttributeError:
-            pass
+        # Minimize the console window, if the app was started from one
+        console_hwnd = _GetConsoleWindow()
+        if console_hwnd:
+            _ShowWindow(console_hwnd, SW_MINIMIZE)
 
     app = QApplication(sys.argv)
     window = ZenFocus()
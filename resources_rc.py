@@ -0,0 +1,12432 @@
+# -*- coding: utf-8 -*-
+
+# Resource object code generated from resources.qrc.
+#
+# Regenerate with: pyrcc5 resources.qrc -o resources_rc.py
+#
+# WARNING! All changes made in this file will be lost!
+
+from PyQt5 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x09\xd2\x89\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\
+\x49\x48\x44\x52\x00\x00\x00\x30\x00\x00\x00\x2a\x08\x06\x00\x00\
+\x00\xf5\x4f\xd8\x7a\x00\x00\x09\x99\x49\x44\x41\x54\x78\xda\xb5\
+\x59\x67\x58\x55\x57\x16\xe5\xe7\x88\x49\xd4\xd1\x87\x8a\x88\xa0\
+\xa0\x88\xed\xdd\xfb\x00\xb1\x00\x82\x74\x50\x54\x04\x75\x94\x62\
+\x43\x89\x0e\x18\x04\x85\x88\x5d\x10\x15\xd0\x41\x34\x12\x46\x6c\
+\xc1\x96\x4f\xd4\xa8\xd1\xd8\x82\x31\x7c\x2a\x49\x30\xb1\xf7\x44\
+\x63\x2c\x19\x27\x46\x67\xfe\xaf\xd9\xe7\x3c\x1e\xef\xd6\xc7\x03\
+\x99\x1f\xe7\xbb\xfd\x9c\x5d\xd6\xde\x7b\xed\x73\x1d\x1c\x0d\x22\
+\x54\xa3\x8b\x60\x1e\x74\xde\x8e\x8e\xed\xf8\x39\x3b\x5a\xae\x8d\
+\x4d\xf7\xdb\x49\xde\x95\x0f\xa1\x71\x58\xae\x4d\x8d\xf3\x89\x92\
+\x79\xcc\xe7\x96\x75\xe4\xcf\x45\xd9\x73\xcb\xb0\xde\x33\xf1\x6f\
+\x1c\xcc\x13\x2b\x87\x7c\x01\xeb\x22\xd2\xc5\x05\x9d\x85\xac\x73\
+\x98\x17\x91\x1f\x9b\x06\xbb\xee\x62\x52\x08\x68\x6a\x7a\x57\x5b\
+\x11\xf3\x77\xd2\x39\x1d\xa4\x13\x4b\x27\x93\xbe\x24\x17\x5a\x6a\
+\x79\xb1\x69\x42\xcb\xb5\x54\x11\xf5\xb9\x49\xe6\x09\x47\xa9\x70\
+\x5d\xf4\x15\xb0\xa5\x98\x83\xca\x32\x8d\xee\x6f\x12\xd4\x20\x77\
+\xb3\x4a\x89\x46\x57\xaa\x5d\x6d\x86\x9a\x96\x65\x95\x1e\x57\x7a\
+\x59\x89\x02\x99\x67\xb5\x14\x90\x7e\x64\x15\x48\xd0\x85\x8a\xf4\
+\xbe\xd2\x73\x72\xbc\x0b\x0a\xc3\x28\xde\xd7\x83\x8a\xce\x3d\xad\
+\x6f\x1c\xac\x02\x4a\x85\x95\x06\xaa\x15\x1e\x56\x0b\x08\x72\xc8\
+\xc8\x02\x5e\x8d\x55\x39\xee\x45\xcd\x60\xd5\x53\x46\x09\xa5\x76\
+\x7a\x1e\x90\xbb\xd1\xa8\xa1\x90\x04\xf7\x06\xc1\x2a\x90\x41\xdf\
+\xfa\x32\x05\x14\xca\xd8\x8b\x73\x47\x1d\xc1\x35\x20\xa4\xd4\x52\
+\x02\x1d\x85\x70\x5a\x41\x2a\xcf\x40\xf6\x0c\x45\x6a\x35\x88\x36\
+\xb2\x9e\xa8\x4a\x30\x0a\x05\x6c\xe1\xdc\x0a\x27\x47\xd5\x7d\x69\
+\x7a\x13\xd0\xad\x4f\x20\x3a\xf5\xf0\xd7\x49\xcb\x6a\x08\x6a\x43\
+\x57\xbb\x56\xe8\x29\xe5\xa0\x5d\x4c\xcc\xc5\x49\x09\x1d\xa9\x42\
+\xd6\x98\x90\x0b\x9b\x91\x53\x88\xf6\x4e\x26\xbc\xdf\xcd\x0f\xde\
+\x3e\x63\xad\x96\x56\xe4\x7b\xb9\x70\xb6\x12\x86\xed\xe1\xa0\xac\
+\x6c\xda\x41\xac\xae\x86\xea\xaa\x68\x3e\x86\xc4\x4c\x47\xc9\xe6\
+\x9d\xfc\xf9\xfc\xec\x35\xe8\xe4\x32\x4c\x06\xcb\x26\x05\x0c\xfa\
+\x82\x3b\x6a\x40\x4a\x7b\x08\xca\x20\x56\xc3\x46\x1d\xd0\x46\xcd\
+\x6a\xdc\xe4\x11\x27\x1f\x54\xed\xa9\xc1\xee\xbd\x47\x30\x29\x75\
+\x21\xd6\xff\xa3\x0a\x2e\x7d\x43\xf0\x41\x77\xbf\xc6\x34\x68\x82\
+\x3e\x6c\x45\x3b\x9e\xd9\x8c\x01\xad\xfc\xaf\xc6\xa8\x12\xc7\x4c\
+\xa8\x0e\xdd\x87\x22\x36\x21\x1d\x81\x11\xc9\x88\x9f\x96\x81\xe5\
+\x85\x5b\x70\xeb\xce\x7d\x2c\x59\xb1\x11\xf3\x16\xae\xc6\x9c\xcc\
+\x15\xf0\x09\x48\x84\x9b\x77\x98\x2e\xe7\xd1\x8f\x05\x9b\x0a\xc8\
+\x73\xba\x5a\x09\xa3\xc2\x1b\xda\xc5\xac\xaf\x31\x1a\x89\x29\x59\
+\x48\x99\xb3\x98\x20\xb4\x03\x4b\x56\x96\x22\x74\x4c\x2a\x76\xed\
+\x3f\x8a\xda\x8b\x97\x71\xe2\xab\x0b\xf0\x0f\x9e\x84\x9e\xfd\x82\
+\xe1\x37\x6a\x12\x0c\x6e\x23\x5b\x80\x7f\xa1\x39\x05\xb4\x69\x82\
+\x5e\x2d\x90\xc2\xc6\x27\x30\x11\x85\x25\x9f\xe2\xdc\x85\x4b\x74\
+\xac\x40\xfe\x9a\x32\x24\x24\x65\xe2\xf6\xdd\x87\x78\xfb\x9f\xff\
+\xd2\xfd\xcb\xb8\x7a\xed\x36\x2e\xd5\x5f\xc5\xd3\x67\x2f\x91\x93\
+\x5f\x8c\x0e\xce\x7e\x18\x34\x34\x0e\x6e\x03\xc2\x35\x84\x17\x5a\
+\xaa\x80\xa8\x11\xb8\x8d\xc7\xce\x46\x8d\x18\xb0\x0a\xdf\x83\xb0\
+\xdd\xb5\xf7\x48\xac\x28\x2c\x47\xdd\x95\x1f\xb0\x7b\xff\x11\x64\
+\xe5\x15\xe1\x9b\xba\xef\x51\xff\xc3\x75\x2e\xf0\x1f\xaf\xdf\xe0\
+\xd5\xbf\xff\xc4\xfa\x4d\xdb\x51\xb9\xe3\x20\xae\x5e\xbf\x83\x98\
+\xf8\xb9\xdc\x6b\xfd\xc5\x31\xe8\xe9\x35\x5a\xc7\x03\x42\xcb\xb2\
+\x90\x6d\x0f\xa8\xe3\xa0\x23\xe5\xfb\x7e\x62\x34\xd6\x6d\xdc\x8e\
+\x6b\x37\xef\xa2\xbe\xe1\x1a\xaa\x0f\x1d\xc3\xe6\xca\x3d\x48\x4c\
+\xcd\xc2\x9a\x0d\xdb\x70\xb6\xf6\x12\x5e\xbc\x7c\x85\xa7\xcf\x7f\
+\xc7\xad\x7b\x8f\x70\xe8\xd8\x59\x14\x6d\xac\x44\x45\xd5\x41\x74\
+\xee\x39\x8c\x57\x74\x53\x40\x02\x0f\x70\x7d\x28\x09\x36\xe9\x46\
+\x33\x0a\x68\x73\x7f\x16\x84\x83\x87\xc7\x63\x74\xec\x0c\x9c\xf9\
+\xfa\x12\xee\x3c\xf8\x99\x2c\x7b\x1b\x27\xcf\x5d\xa4\x18\xc8\xc5\
+\xec\x8c\xe5\x74\x5e\x87\x5d\x07\xbe\xc0\x59\x82\xd0\xf5\xdb\xf7\
+\xb1\xef\xd0\x97\x28\x29\xdf\xc1\xdf\xfb\xe5\xc9\x33\x7c\x7f\xf5\
+\x06\x8a\xcb\x76\x50\xbd\xf0\x85\x30\x7c\x82\x82\xed\xca\x15\xb0\
+\x06\xbd\x60\xaf\x02\xa2\x2e\x23\x65\x93\x75\x75\x0f\xa0\x60\x0c\
+\xc1\xcc\x0f\x97\xa1\x60\x43\x05\xee\x3d\x7c\x8c\xfb\x8f\x1e\xa3\
+\x81\x84\x4b\x4d\xcf\xc7\xd4\x59\x39\x78\xaf\xab\x0f\xba\xf4\x1a\
+\xc1\x2d\xbc\x7a\xfd\x36\xd4\x51\x0c\xb0\x94\xea\xe4\x36\x02\xa5\
+\x4c\x91\x1b\x77\x70\xf2\xf4\x45\xb8\x78\x8e\x42\x7f\x9f\x31\xdc\
+\xa3\xef\x50\xc8\x94\xf8\x37\x6a\x5c\x9b\x85\xf7\xa6\xc5\xbc\xc4\
+\x58\x7e\xde\xa9\x87\x1f\xbe\x23\xac\x3f\x7b\xfe\x12\xbf\xfe\xf6\
+\x1c\x6b\x4b\x2a\x31\x73\x7e\x3e\x52\xe7\xe6\x71\x8c\x33\x05\x7a\
+\x0f\x8a\xe0\x95\xd9\x40\x82\x97\x6d\xab\x46\xe5\xce\xcf\xb1\x20\
+\xb7\x08\x1e\x83\xc2\xe1\x4e\x41\x6c\xa9\x1d\x03\xfd\xe2\x24\xe9\
+\xd9\xfe\x4c\xa4\x50\x40\x54\x08\x2f\xa8\xd2\xa5\xb3\x47\x10\x3c\
+\x86\x44\x72\xfc\x76\xea\x31\x94\x02\xf4\x0f\xbc\x7e\xf3\x06\x2f\
+\x7e\x7f\x85\xe4\xb4\x5c\x82\xca\x71\x6c\xdc\xba\x8b\x84\x36\xcf\
+\xd5\xbe\xab\x09\x43\x86\x8f\xa7\x1a\x90\x40\x69\x75\x06\x0e\x1c\
+\x3e\x85\xc5\xcb\x4b\x39\x74\xd8\x7c\x1d\xa9\x52\xf7\xa2\xda\x30\
+\x3c\xf4\x6f\x10\x47\xc6\xb7\xd8\x0b\x0e\xda\x7d\xae\x36\x7c\x06\
+\x0d\x1d\x87\x91\x54\xa8\xbc\x7d\xc7\x12\x44\x7c\x39\x1c\x4e\x7c\
+\x55\x8b\xba\xcb\x0d\x78\xfd\xe7\x1b\x2a\x56\xcb\x11\x39\x3e\x8d\
+\x82\xf4\x00\x87\x96\xb3\x47\x20\xfe\x62\x10\x9a\x68\x83\xa3\x93\
+\x82\xcd\x36\x12\xbd\x7e\x62\x0c\xa2\x26\xa6\xc3\xd3\x18\x83\x5e\
+\xfd\x47\xb7\x56\x01\xb5\xf5\x3f\x20\x42\xd6\xdd\x33\x98\xe3\xbd\
+\xbf\x4f\x1c\x87\x8e\x2b\xa5\xbd\xe1\xa1\xd3\xd0\xd1\xd9\x9f\x43\
+\x63\x4e\xc6\x4a\x44\x90\xd0\xac\x78\x95\xd2\x48\x4d\xff\x18\x13\
+\x93\x33\x31\x2f\x67\x35\x96\x16\x6c\xc6\xaa\x75\x5b\xb1\x60\xf1\
+\x5a\x4c\x4e\xcd\xa6\x60\x8d\xa7\x6f\x7c\x1a\x89\xa2\x79\xcd\xae\
+\xbd\x03\xe0\xed\x37\x0e\xde\x26\x9a\xdb\x3b\x1c\xa6\xa0\x49\x3c\
+\xb5\xba\xf6\x0f\xe5\x83\xad\x61\x47\x1d\xd0\xab\xbc\xe6\x6b\x56\
+\x78\x3c\x86\x44\x51\xb5\x8d\xa2\x49\xc3\x10\x10\x91\xd4\x08\x23\
+\x13\xb7\x58\x6f\xc2\xf3\xaa\xe2\x4f\x90\x96\xb9\x0c\x59\xf9\x1b\
+\xb0\xa9\x62\x0f\x16\xe4\xad\x43\xfe\xea\x32\x9c\x3c\x73\x01\xb7\
+\xef\x3f\xc2\xd5\x9f\x6e\xa1\x9a\xb2\x52\xf6\x92\x22\x38\x53\xe0\
+\x5a\x84\x62\x71\xd2\x57\x88\x86\x71\x44\x3c\x41\x29\x94\x1b\xc8\
+\x99\x8c\x66\x6f\x2d\x70\xd0\xeb\x75\xb5\x78\x09\x13\xd8\x85\xbc\
+\x11\x10\x99\xcc\x71\x2b\xe5\xfb\xbe\x44\x0f\x4a\xb6\xee\x44\x79\
+\xd5\x5e\xec\xfe\xfc\x18\x8e\x9e\x3c\x8f\x2f\x49\xf8\xd2\x2d\x3b\
+\x31\x7f\xe1\x1a\x8c\x8a\x4a\xa1\xfa\x90\x89\xcf\x0e\x1e\x25\xa5\
+\xbe\xe1\xa9\xd3\xd2\xc8\xfc\xb5\xa7\x3f\xbc\x4c\x31\x12\x7a\xd1\
+\x6a\x08\xd9\x56\xc6\xc2\xfd\x3d\x89\xf7\x28\xfb\x5b\x76\xde\xcb\
+\x7b\x34\x72\x96\x6e\xc0\x81\x23\xa7\x70\xfc\x74\x2d\x6a\xeb\xea\
+\xf1\x5d\xc3\x75\xdc\xa0\x3a\xf0\xe8\xf1\x53\x22\x77\x0f\x50\xb0\
+\xfe\x13\x14\x95\x56\x62\x57\x75\x0d\x0c\x64\xfd\xf6\x94\x6e\xdd\
+\x06\x46\x60\x30\x51\x0b\x46\xbd\xdb\x40\x01\xdb\xc4\x8a\x09\xdc\
+\xd9\x75\x04\xe1\x34\x54\xf5\x8c\x41\x2d\x64\xcc\x74\xa4\x7d\xb4\
+\x12\x8b\x96\x16\x13\xbd\x68\xc0\xcd\xbb\x0f\xf0\xe0\xe7\x27\x78\
+\xfc\xeb\x33\x9e\x6e\xdf\xbc\x7d\x8b\x0b\x17\xeb\x11\x37\x79\x1e\
+\x8f\x1d\xb6\x56\x9f\xc1\x91\x8d\xd5\x58\x6c\x2b\x05\x6c\x53\x5b\
+\xce\x3e\x85\x68\x6b\x69\x27\xa5\x3c\x06\x47\x60\x6e\xd6\x6a\x44\
+\x4e\x48\x6b\xaa\xaa\x9d\x5d\x87\x11\xad\x2e\x27\xe1\x7f\xc3\x53\
+\xaa\x13\x6c\xbc\x78\xf9\x2f\xae\xc8\x36\xca\x54\xeb\x36\x55\xf2\
+\xb9\xbc\x28\x80\x5b\x23\xbc\x0d\x08\xa9\x3b\x32\xe5\x60\x95\x93\
+\x05\xb6\x05\x4a\x7b\xf6\x1d\xc5\x92\x55\x9b\x24\x7b\xa8\xd6\xb9\
+\xb2\x3f\x5e\xcf\x2b\xf5\xbd\x87\xbf\xd0\xf1\x09\xee\xdc\x37\x53\
+\x8f\x69\x33\x17\xf1\x14\xca\xaa\x76\x1b\x2b\x20\xda\xe4\x42\x96\
+\x78\xe8\x4e\x45\xcd\x95\xa0\xc4\xa8\x05\xc3\xf9\xd7\x17\xaf\x50\
+\x7a\xf5\x93\xbd\xdf\xc9\xc5\x1f\x41\x51\xc9\xf8\x91\xa8\x43\xc3\
+\x4f\x37\x71\x85\x48\x1f\xa3\x15\x0c\x5e\xa3\xa2\x53\x28\x8d\x06\
+\xb6\x5a\xf8\x66\x3c\x60\x07\xb5\x25\xa8\xb0\x94\xe8\x69\x8c\xc4\
+\xbe\x9a\x13\x94\x79\xce\xa1\xfc\xd3\x6a\xb8\x0f\x0c\xe3\x56\xf5\
+\x0f\x99\x8c\xdc\x55\xa5\x98\x90\x94\x81\xf3\xd4\xd4\xd4\xd6\x5d\
+\x41\xcd\x89\xb3\x38\x75\xfe\x5b\x6c\xff\xec\x10\x55\x63\xd3\x3b\
+\x09\x6f\x47\x25\xb6\x8f\x9b\xbb\x0f\x08\x43\x61\x71\x05\x65\x97\
+\x0a\x14\xd0\x71\x0b\x29\x51\x73\xfc\x0c\x0e\xd1\x28\x2a\xfb\x27\
+\x52\x88\x1b\x31\xc1\x77\xec\x3f\x8c\xed\x7b\x6b\xb0\x69\xdb\x1e\
+\xf2\x5c\x70\xab\xc8\x9b\x1d\x0d\x4d\x73\x0a\x68\x2f\xea\xe2\x19\
+\x84\x55\x45\x5b\x71\x8e\x7a\x80\x4b\xf5\x3f\xe2\xf0\xf1\xd3\xc8\
+\x5d\x51\x82\xc9\xd3\xb3\x51\x56\x59\x8d\x0d\xe5\x55\xf8\xfb\xa2\
+\x02\x0e\x9b\xf7\x9a\xa9\xae\xef\x00\xa1\x96\xb5\x94\xda\x81\xcf\
+\x76\xa4\xcd\x24\x8e\x35\x3c\x62\x40\x3c\x41\x2c\x8a\x9a\x7e\x5f\
+\xc9\xae\xb7\xf8\xff\x50\xc0\x9e\x8e\xcc\xda\xd4\x47\x8c\x9b\x8d\
+\x01\x8c\x5a\x53\x3a\xf5\xa4\x6c\xe4\x46\xbc\x65\x52\xf2\x47\x70\
+\xa2\x80\x36\x11\xab\x64\x7c\x87\x55\x5f\xd6\xc0\xb3\x22\x15\x49\
+\xef\x7b\x89\x51\x3c\xa8\xfb\x91\x42\x2c\x01\x70\x7e\x44\x14\xc2\
+\xc9\x7d\x24\xb1\xd5\x89\x7c\xfb\x85\xd1\x95\x36\x2a\x64\xb6\x3b\
+\x33\xb6\x03\x17\x10\x3e\x15\x33\xd2\xf3\x48\xf0\x2c\xc4\x12\x9b\
+\xcc\xcc\x29\x40\xc4\xd8\x99\x28\xa6\xc6\x65\x0a\x09\x97\x44\x8d\
+\xcd\x94\xd4\x85\x48\x9b\xbf\x0c\x61\x63\x67\x60\xe5\xda\x2d\x48\
+\xcf\x5c\x81\xe4\xd9\xb9\xf0\x0d\x4c\x40\xee\xb2\x12\x24\x26\x2d\
+\x20\x12\x58\x45\xca\xa6\x62\x14\x51\x94\xa4\x59\x8b\x5a\xb3\xad\
+\xa2\xb7\xa9\xa5\xaf\xcc\xc4\xa9\x19\x08\x8f\x9b\x85\xe0\xe8\x54\
+\x64\x64\xaf\xc1\xd8\x84\x74\x6e\x79\xd6\xb0\x33\x6b\x47\x8f\x9f\
+\x8d\x94\xb4\x3c\x8c\x9f\x32\x1f\x63\xe8\xd9\xf4\x39\x79\x08\x8d\
+\x9d\xce\x1b\x99\x30\xea\x0b\xfa\x92\xd7\xfc\x83\x27\x73\x45\x82\
+\x48\xf0\xf7\xbb\xf9\x60\x36\x29\xca\xce\x5b\xb1\xb1\x25\xda\x10\
+\xdc\x68\x13\xff\x1e\x44\x03\xdc\x07\x84\xa2\x7b\x9f\x00\x0e\x0f\
+\x76\xed\xea\x15\xc2\x37\x7a\x3d\x86\x44\x73\xa2\xd6\x9b\x9e\xb3\
+\xc2\xd7\x81\x3a\x38\xc6\x5e\xfb\x0c\x8e\xe2\x55\xba\x23\x35\x44\
+\xf6\xd0\x97\x16\x06\xb1\xb1\x99\x8d\x57\xf9\x75\x70\x54\x12\x22\
+\xe2\x66\x92\x27\x52\xe0\x43\xd6\x1c\x46\xb9\xdf\x2f\x28\x91\xac\
+\xfe\x21\xc4\x11\xe3\xb9\x45\x99\x57\xbc\x89\x6d\x0e\x0b\x99\xc2\
+\xad\x1e\x18\x3e\x8d\x20\x37\xb7\x55\xec\xb3\x59\x05\x1c\x75\x33\
+\x8e\x9e\x12\x46\x8d\x9f\x1e\xa6\xa6\xdf\x41\x96\xad\x77\xeb\xef\
+\x21\x41\xb1\xcd\x2e\xb6\x71\x25\x36\x88\x3a\xfd\xb0\xf2\xe7\x87\
+\xa0\xf9\x87\xd1\xf6\xcf\x0e\xdb\xbf\x8b\xda\x08\x42\xa2\x0d\xcb\
+\xab\x61\xc5\x85\x32\x88\xcd\xfe\xa1\xb1\xfe\xe9\x69\x1b\xc1\x2d\
+\xe3\x7f\xa1\xb7\x1b\x6c\x0a\xa6\x95\xf2\x00\x00\x00\x00\x49\x45\
+\x4e\x44\xae\x42\x60\x82\x00\x02\xfb\xb7\x89\x50\x4e\x47\x0d\x0a\
+\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\x00\x02\x00\x00\x00\
+\x01\xc6\x08\x06\x00\x00\x00\x02\x21\x33\xce\x00\x02\xfb\x7e\x49\
+\x44\x41\x54\x78\xda\xcc\xbd\x7b\xf0\x2d\xd9\x55\x1e\xf6\xfb\x8b\
+\xdb\x8f\xb1\x41\xb7\xbb\xcf\x08\x93\xe0\x72\xd9\x0e\x05\x7a\x9c\
+\x5e\x7b\xf7\x9d\x11\x76\x20\xb8\xca\xa2\xa0\x8c\x0d\xa9\xb8\x28\
+\x70\xc2\xc3\x31\xe5\x18\x27\xa9\x38\x15\xa8\xc2\xaf\x4a\xc5\x95\
+\x10\x97\x9d\xaa\x38\x2e\x87\xc4\x76\x52\x49\xec\x38\xd8\x98\xc2\
+\x8e\x6d\xb0\xcd\xc3\x60\x54\x08\x89\x47\xc0\x20\x84\x84\x34\xcc\
+\x68\x66\x34\x3c\x84\x00\xdb\x58\x9a\x91\x46\xea\x9c\x73\xba\xf7\
+\xde\x6b\xad\xbd\xd6\xde\xbb\xfb\x9c\xdf\x95\x10\xa7\xee\xdc\x7b\
+\x7f\xf7\x9c\x3e\xdd\x7b\xef\xb5\xd6\xb7\xbe\xf5\x7d\x77\x55\x37\
+\xce\xe7\x57\xdd\x83\xf0\x32\xec\xe5\xfe\x7c\x44\x7f\x1f\x7e\xbe\
+\x19\x8c\xf0\xef\x46\xf4\xf3\xf8\xdf\x1b\xe1\xbd\x96\x9f\x7d\x70\
+\xfa\x7d\xe5\xfe\x8e\x5c\xdb\xc8\x5e\xe8\xcf\x87\x91\xbd\x1f\xfa\
+\xf7\xdd\x88\x7e\x66\xeb\xeb\xfc\xbd\x96\xd7\xe5\xbf\xd7\xdf\x9f\
+\xdf\xab\x15\xaf\x89\xbd\x1e\x9e\x7f\x3d\x26\xdf\x3f\xbe\x37\xf8\
+\x65\x84\xbf\x43\xef\x37\x1c\xc9\x3d\x5f\x9e\x25\x7f\x66\x46\x78\
+\x2f\xe9\xf3\x0c\xf9\x7d\xd5\x09\xd7\x3d\x84\x7f\x57\x65\xbf\x8f\
+\x11\xfe\xdb\x5e\x7e\xad\x3a\xf7\x19\xf8\x73\x8f\x97\xf7\x5c\xd6\
+\xe4\x71\xf9\x9e\xdd\xe9\x3b\xf5\xcb\x8b\x5f\x5f\xf4\xac\x95\xe7\
+\xb1\xbc\x97\xf4\x9d\xd9\xef\x87\xd4\xcf\xad\xd7\xe9\xf7\x0b\x5a\
+\x53\x6e\x5d\xad\x7f\xde\x9c\x7e\x6d\xd6\x9f\x17\xef\xa1\xf4\xf2\
+\x9f\x1d\xfe\xac\xe9\xf8\xf7\x34\xc2\x77\xa5\x6b\xbe\x62\x7b\xa1\
+\x8a\xbe\x83\xbb\x36\x58\xef\xe9\xc8\xf6\x8f\x5b\xeb\xa3\xff\x15\
+\xff\x4c\xb3\x3e\xa3\xf0\x2c\x72\xe7\x06\xff\x33\xf4\x7e\x5d\xea\
+\x39\x6a\x2f\x7e\x3f\xce\xf7\x18\xc8\xe7\xf1\xdf\xd3\xcf\x87\xf8\
+\x99\x8a\xd7\x0b\x05\xeb\x4b\xfa\xbd\x49\xbe\x67\x25\xee\x41\x7d\
+\xff\x57\xc9\x7b\x3c\x0a\xfb\x5c\xfa\x95\xdf\xff\xf0\x67\x7e\x5f\
+\x75\xa3\x72\x3f\x4c\xe2\xb9\x98\xc4\xcf\x9b\xc4\xb5\xda\xe8\xdf\
+\x9f\x9f\x19\x7e\x6e\xf4\x19\xea\xf7\xb4\x12\xe2\x90\x7c\xae\xc9\
+\x3f\xf3\xe0\xb2\xa6\xb5\x58\x14\xaf\x9b\x8a\xbd\xc7\xe5\xbc\x1a\
+\xa4\x75\x6c\x94\xfb\x34\xb1\x67\x21\xdd\x37\x23\x3c\x2f\xe1\x1e\
+\x74\xb9\xfb\x23\x9c\x83\xe7\xd7\xc3\xe3\xe5\xbf\xcf\xaf\xbb\xe5\
+\x61\x18\x75\x11\x37\xc3\xb4\x1e\x04\x66\x7b\x00\xeb\x60\x53\xa0\
+\xcd\xfd\x5d\xd3\xf1\x80\xbc\x1e\xb6\x9d\xb0\x69\x1e\xae\xff\xbd\
+\x21\xe8\x37\xee\x57\x74\xa8\x5f\x3e\xeb\x30\x2e\xaf\x61\x09\x80\
+\xcb\xe7\x8f\x4b\x32\x80\xae\xbb\xe2\x87\xdb\x7a\xf8\xf3\xeb\xdb\
+\x9a\x80\xd0\x7b\x7a\x5c\xef\xc1\xb8\x26\x5c\x25\xff\x1e\x94\x85\
+\x64\x49\xf0\xe5\xc1\x87\x5e\xb7\x0b\xc8\x47\xf1\xe7\xf5\x35\x31\
+\x0a\x49\x9f\x14\x5c\x41\x48\xf6\x00\x1d\xea\x7b\xd7\xce\x98\x08\
+\xaa\xa9\x75\x70\xf4\xf7\x3a\xfb\x19\xc3\x1a\xc0\x4f\x2f\xb7\x4e\
+\x9a\xe2\xe7\x4e\xef\x45\xd3\x87\xf5\xd5\x8a\x01\x26\x9d\x00\x34\
+\x28\xd1\x0d\x9f\x1f\x7f\x87\xca\x7d\xcf\x61\xbd\xde\x61\x0c\xeb\
+\xfa\xb0\xae\x79\xb4\xcf\xf2\xf7\x38\x95\x60\xb9\xe2\xc0\x9d\x29\
+\x16\xbd\x8c\x4f\xa8\xfd\x75\xb9\xb5\xd7\xb9\xeb\x0b\x87\x61\x33\
+\x68\xdf\xdd\x64\x12\x0f\xb3\x69\x9d\x84\xa4\x6c\xeb\x5e\x05\x25\
+\x09\x4e\x7d\x7e\xaa\x00\x28\xd9\x5b\x72\x50\x6e\x3a\xa3\x5c\x8b\
+\xf0\x3e\x1d\x2f\xb6\x20\x93\x0c\x83\x12\xb8\xe4\xeb\x5b\xce\x4a\
+\xe1\x39\x0c\x52\xe0\xcc\x25\x16\x5a\x51\xaa\xbd\xe4\x33\xeb\xbc\
+\xee\xaa\xf5\x1c\xbf\xbc\xc7\x30\x26\x92\xc3\xf4\xe7\x34\x28\x7e\
+\xc4\x7b\xb5\x24\x51\xd2\xd6\xae\x7c\x4f\xaa\x61\x79\x95\x24\x49\
+\xf8\x5a\x5c\x12\x80\x12\x00\x9a\xad\xd0\xcd\x89\x36\xa8\xcf\xda\
+\x68\xa5\xb0\xfc\x7d\xf8\xf9\x50\x39\xd0\xe0\x18\x2d\xa0\x2e\x17\
+\x44\xd6\x03\x98\x55\x5b\xcd\x00\xe8\x65\xfc\x8d\x6f\xd6\xc3\xaf\
+\x71\x0f\xf2\xf4\x6f\x97\x4a\x2c\xbd\x38\xc8\x21\xd7\x85\x04\xa0\
+\x89\x3e\xcb\x55\xfe\x26\x24\x01\x2c\x19\x89\x82\x48\xb7\xf7\x20\
+\xc1\xd7\x77\x44\xef\x09\xe8\xda\x46\x7f\x48\xc7\x1b\xa9\x64\x33\
+\x80\xb0\x11\x8d\x98\x00\xb8\xcf\xbb\xfc\xdb\xf5\xbe\xec\x45\x53\
+\xf4\xc3\x45\xae\xf0\x96\x4a\x40\x4f\x00\x9a\x92\xeb\x19\xd2\x09\
+\x9f\xb8\x99\x07\x7c\x20\xea\xef\x13\xf6\x00\x84\x64\x71\xfd\xef\
+\x36\xb1\x3e\xa2\xca\xda\x25\xb4\x3d\x88\xeb\x2e\x7a\x1f\xb2\x3e\
+\x51\x62\xec\x50\x9a\x21\xfe\x7e\xee\x79\x56\xe8\x3b\xe2\xeb\x25\
+\xfb\x6a\x28\xbc\x76\x72\x70\x1a\x76\x6e\xb8\x33\xc1\x08\xe7\x0a\
+\x3d\x5f\xce\x49\x87\xbf\x66\x97\x68\x77\xee\x1a\x2c\xbb\x26\x2b\
+\x26\x4f\xe9\x40\xb4\xfe\xf9\x80\xf6\x41\x6e\xcd\x14\xee\xdb\x80\
+\xf2\x98\x4d\xfb\xa0\xe9\x46\x52\xd8\x54\xca\xd9\xe4\xce\x36\x9a\
+\x28\x8f\x09\x54\x74\x14\x93\xc3\xe5\xd9\x27\xbe\x53\xa7\xbc\xd7\
+\x20\x24\x46\x43\x59\x01\xb0\x7c\x9e\x94\x44\x1e\x85\xa0\x9b\xaa\
+\x9c\x4d\x26\x81\x86\x70\x1e\xf4\xa0\xec\x7f\xbc\xb6\xd1\xfd\xed\
+\xf0\x3e\x0a\xff\x46\xbc\x57\x1d\x7b\x36\x03\x2e\x18\x8f\x05\x09\
+\x40\x2e\x29\x35\x24\x59\xc6\x49\xb3\x4b\xea\xdc\xde\xa9\x0e\x96\
+\xec\xb1\xb2\x17\x5d\xb7\x77\xf8\x66\xf3\x8d\xbb\x54\xff\xcb\x2b\
+\xce\xde\x8d\x92\x30\x58\xb6\xf1\x0d\x3b\x5c\x71\xf0\x06\x39\xe3\
+\x1e\x70\x05\x16\xb2\xb7\xe5\xd0\x32\xe8\x1a\x4d\x38\x74\x7d\x02\
+\x40\x2b\xb0\xc6\x6d\xb4\xd3\xab\x45\xd0\x66\x08\xe8\xa3\x7f\xf0\
+\xfa\xc1\x6b\xd8\x01\x74\xba\x1f\x97\xfb\x62\xc2\xe7\xb2\x83\x32\
+\x54\x80\x68\xb3\xec\x48\x04\x1a\x74\x50\x5d\xbe\xcf\x80\x0f\xff\
+\x31\x4a\xba\x6a\x5c\x2d\x75\xa3\x92\xfd\x6f\xab\x72\xf0\x42\xbf\
+\xbc\x50\xf2\xd6\xac\x07\x52\x51\x65\x9d\x84\xca\x46\xba\x48\xd7\
+\xeb\xaa\x78\x1b\x47\x48\x68\xc2\xbd\x3f\x16\x5f\x83\x4f\x1a\x50\
+\xb2\xb7\xdc\xbf\x73\x55\xb0\xbc\x6a\xb6\x4e\x08\xd4\x3f\x84\xac\
+\xff\x52\x31\x93\x03\xc1\x5c\x9e\x83\x16\xbc\x49\xb5\x30\x04\x74\
+\xc9\xaf\xe3\x54\x02\x30\xd0\xc4\x27\xaa\xde\x87\x80\x5a\x2d\x7b\
+\x28\xc0\xfb\x0e\xfa\x5f\xd6\x11\xb0\x24\xc2\xa8\x2f\xd2\x3e\x20\
+\x9f\x67\xfc\xaf\xf4\x6c\x70\xe7\x86\x65\xfb\xf5\xb4\x56\xa3\x73\
+\x02\xd0\xe7\x8c\xeb\x7d\x77\xf7\x8f\xbf\x27\x4d\x1c\xea\x21\x57\
+\x51\x1b\x01\xd1\xdc\x82\x6a\x48\xad\x9e\x54\xb2\x69\xb2\x01\x8a\
+\x04\x2b\x15\x6d\x8b\x93\xd1\xf3\xf7\x6d\x07\x94\xe4\xe1\xb5\x1e\
+\xed\x0f\x43\x0a\x30\x1c\xdc\x48\x32\x31\x8c\x22\xea\x87\x5f\x0e\
+\xc9\x6d\xba\x92\x64\x03\x3c\xaa\x48\xe3\x84\xb9\x54\xff\x4d\x4f\
+\x13\x39\xb9\x10\x30\x4a\xab\x63\x14\x5a\xc7\xe8\x7c\x72\xeb\x1a\
+\x9d\xff\x35\xfb\xfe\x78\xbd\x92\xe4\xaa\x0b\x7b\x9f\x26\x09\x96\
+\x20\x58\x21\x96\xe1\xcf\x43\xfb\x84\xc4\x09\xcb\xbe\x93\x4d\xb4\
+\x4f\x2c\x59\xab\x38\xa0\x2f\xf7\x2c\x7e\xb5\xe7\x3f\xef\x4b\x13\
+\x00\x7d\x9d\xdf\xe1\x0f\xa9\x13\xc1\x3c\x0a\xee\x89\x9f\x0f\x81\
+\x1f\x0a\xaa\x00\x74\xc8\x0c\x71\xb5\xd5\xa0\x43\xb7\x2d\xba\xb6\
+\x38\x73\x6e\x3b\x40\x87\x0d\x7b\x25\x0f\x5c\x29\x29\x12\x0e\xb0\
+\xde\xa0\x8d\x8a\xaa\xbf\x0e\x76\xb5\x3e\x1a\xde\xb3\x1d\x20\xae\
+\x0a\x06\x10\xef\xfb\x39\x2b\xac\xd1\xfd\xe6\xfd\x7f\x8f\x62\x5c\
+\xee\x77\x3a\x39\x71\x2d\x8f\xda\xb7\x3c\x50\x75\x4c\x36\x9f\x5e\
+\x4d\x73\xb8\x70\x79\xd6\x36\x01\x5f\xa6\x7a\xe0\x0a\x72\x31\x18\
+\xbd\x9a\xee\x51\x05\xc5\x0e\x70\x3d\xd1\x33\x51\xe0\xa2\x01\x6b\
+\xbd\x27\x3e\x21\xb5\x42\x92\x68\x59\xb5\x61\xc8\x7a\x8b\x13\xab\
+\x5c\xf2\xc9\xaf\x07\x18\x6c\x3f\x8a\x09\x47\x83\xef\x87\xfa\xbe\
+\xd2\x9e\xb4\xec\x7b\xad\xaf\x03\x0f\xfe\xb9\xfd\x78\x0a\x5c\x87\
+\xf2\x73\x25\xbe\x97\xf2\xb5\x2d\xe7\x8f\x11\x02\xaf\xde\xa3\x0e\
+\x87\xf4\x72\x78\xb6\x9d\x51\x02\xb7\x29\x48\x24\xad\x7f\x9f\x86\
+\x1c\xee\x71\xd5\x26\x1d\xc6\xf8\xdc\x2b\x3e\x73\xd1\x39\x23\x23\
+\x52\xe0\xbf\x67\xfc\xec\xf8\xb9\xb7\x24\xae\xd1\xf9\xd2\x8f\xe1\
+\x3c\x73\xdf\xd3\x25\x13\x5d\xbe\xff\xaf\x22\x3c\x2e\x89\xc3\x01\
+\xad\xb7\x05\xb0\x75\x59\x65\x1b\xde\x33\x77\x66\x1b\xb4\x7f\xec\
+\x86\x75\x9c\x5b\xaf\x42\x7c\x2c\x6e\x6d\x18\x86\x00\xe0\x04\xc0\
+\xd0\x38\x13\xad\x89\x5c\x12\x00\x6a\x02\x75\x46\x38\xee\xd2\xf0\
+\x5c\x2e\x01\x30\x89\xcd\x6b\x32\x81\xd3\xb2\xa0\xcc\xb3\xfc\xd0\
+\x7b\xaf\x7d\x90\xdd\xf1\x70\xfc\xe1\x6f\x94\x8a\x0a\x6d\x88\xa8\
+\xda\xb7\x4a\x55\xa3\x25\x31\x2c\xf9\xe8\x42\x76\x9a\xad\x2e\x48\
+\xe0\xa3\x70\xb0\x7c\x00\x19\xf5\xb9\xd0\x64\x0e\x43\x4a\xb4\x32\
+\x3a\x2f\x80\x33\x09\x66\xa9\xba\x8e\x0c\x4a\x03\x54\xe5\x42\x40\
+\x54\x3a\x81\xfc\x96\x7d\x19\x72\x30\x85\x9e\x70\x8c\x42\x54\x22\
+\x01\xd1\x44\x9c\x80\x06\x21\x22\x14\x82\x87\x70\x10\xb0\xc3\x35\
+\x5c\x03\xae\x5a\x41\x59\xab\xa9\xe0\x68\x58\x35\x61\xe4\xc3\x4e\
+\x3c\x74\x04\x34\xa0\xf8\x00\x9a\xd8\xaf\xa7\xf7\x59\xd1\x87\xfa\
+\x30\xca\x07\xfd\x01\x23\x6e\x66\xe3\xe7\x48\xfb\x19\x76\x1e\x90\
+\xe6\xca\x43\x96\x27\x00\x9c\x48\x35\x0a\x24\xae\x38\x40\xd4\x83\
+\x5c\xa1\xca\xe8\x41\x9c\x7c\xba\x33\x23\x2a\x80\x24\x78\xb7\xd3\
+\x92\x01\x2d\x01\x9b\x0a\x12\x00\xc3\xaa\xf8\x23\x0d\xfe\x3d\x44\
+\xe8\x8c\xbe\xbe\xa5\xf3\x03\x27\x7b\x10\x05\x17\x8a\x0a\x81\x1a\
+\x8c\x31\xe9\x4d\x0c\x90\xd9\x44\x69\xdf\xeb\xba\x75\x65\x6e\x96\
+\x08\xc8\xc4\x47\x5b\x50\xa5\xb3\xef\xd2\xf3\xb3\x46\x4f\xb0\xb4\
+\x7b\x40\x93\x00\x43\xce\xff\x3b\x4f\xcc\x38\xc3\x0a\x85\x81\x9f\
+\x64\xbf\xc9\x9b\x79\xed\x0d\x45\x07\x75\x0f\x1b\x0e\x30\xfe\x40\
+\xd0\xc6\x90\xe0\xed\x33\xba\xb0\xc2\x68\xfa\x75\xe7\x13\x00\xb9\
+\x5d\x00\x89\xfe\x9a\x3e\xdd\x50\x0d\x29\x88\xf2\x28\xf4\x5c\xd7\
+\x6a\x4b\xb8\xb6\x18\x0a\x0d\x9f\xf3\x60\x80\x04\x51\x72\xbd\x5f\
+\x1d\x14\xf7\xcf\x53\x09\x40\xcc\x00\x66\x1c\x80\x01\x91\xbf\x1e\
+\x1e\x33\x49\xcf\xfa\x4c\x0f\x52\x9b\xc2\x55\x66\x40\x12\x81\xfa\
+\xe0\x9e\xd5\xa8\x1c\x92\xf9\x03\x52\x5e\xdb\x26\x11\x40\x1f\x09\
+\x9b\x15\xc3\x95\x01\x95\x69\x0e\x5b\x02\xb3\x83\xc1\xad\xda\x72\
+\xa0\x15\x5f\x79\xf5\xa2\x21\x4c\x79\x34\xec\xfe\x5e\xed\x61\x0a\
+\xe7\x4f\x8f\xab\x47\xad\x6f\x6c\xe3\xfe\x29\xaf\x12\xa3\x29\x19\
+\x6d\xc2\xc9\xf8\xf5\x57\xfb\x44\xca\xf8\xfd\xa6\x06\xa2\xde\x2a\
+\x87\xb1\xd9\xfd\xfd\x31\xd7\x4a\x24\x5b\xf6\x38\x49\x03\x65\x7d\
+\x1b\xd2\xb6\xd1\x51\x03\x2b\xc0\xd1\x90\xac\x6c\xe3\x60\x6e\x23\
+\xd4\x72\x1b\x71\x6d\x63\x02\xd0\x21\xd2\xe9\xa6\xb5\xba\xe1\x67\
+\x31\xfc\xde\x4b\x67\xad\xc4\x59\xd8\xf9\x7d\xc4\x42\x22\x13\x2b\
+\xd9\x7a\xe7\x08\x03\xbe\xbe\xbb\xca\x67\x95\xa6\xa8\x05\x50\x8b\
+\x55\xe6\x35\x08\x40\x01\xfc\xb7\xde\xf0\x36\x93\x21\xcb\xd5\x9e\
+\x7b\x30\x47\xdf\xaf\xe6\x84\x8e\xb6\x1b\x29\xc9\x06\x11\x46\x68\
+\xc6\x9e\x3a\x94\x8d\x5e\x3d\x89\x84\xb7\x14\xeb\x73\x2c\x64\xb7\
+\x9a\x18\x6a\x75\x07\x45\x6f\xc9\x61\xe0\x7e\xbe\x72\xc8\x44\x07\
+\x45\xec\xe4\x66\x50\xae\xa3\xa3\x53\x17\x55\xc1\x78\x1b\x46\x00\
+\x68\x95\x24\x4f\x4f\xd0\xf7\x58\x0e\x93\xea\x4c\x7e\x21\x2d\x26\
+\x58\xd9\xce\x66\xe9\x55\xf6\xb0\xae\x15\x8b\x0e\x2c\xc3\xa0\x41\
+\xad\x5a\xc0\x15\xf6\x35\x81\x6e\x8a\x13\x50\xbe\x3e\xbb\x40\x3e\
+\x5a\x92\x9f\xd4\x7e\xd2\x2a\x15\xe3\x51\x2e\xcf\xa2\x77\x93\x27\
+\xa4\xc5\x65\x8a\x2a\x4c\xe9\x33\x78\xe0\xa1\xef\xf5\x89\x49\x06\
+\x1c\x9a\xd1\x92\x7e\x33\x0e\xe6\xbc\x15\x69\x3c\x03\x9d\x9f\x63\
+\xf5\xba\x5e\xd2\xa3\x81\x12\x54\x8f\x12\xb7\xc1\x46\x15\x5e\xaa\
+\xe2\xa5\xeb\x51\x3f\xe0\xe3\x7b\x1f\xf6\x75\xdc\xb6\x93\x10\x52\
+\xfd\xf9\xb4\x83\x45\xd3\x5d\x6c\x4d\xad\x2d\x00\x57\x18\xee\xa9\
+\xc0\xe3\x7b\x17\x93\xdb\xaa\x1b\x55\xfd\xf2\x6b\xcb\x1e\x05\xf1\
+\x59\xa5\xaa\x6a\xff\xea\xe8\x9a\xaa\xc4\x11\x3e\xb8\x0a\xcd\xc0\
+\xc8\x4b\xee\xfb\xe8\xc9\x98\xcc\x45\xb9\x3b\xff\xc3\xca\x05\xa9\
+\x28\x4b\x84\x38\xe3\x19\x4c\x82\xc8\x33\x29\x90\xe1\x9e\x4c\x6c\
+\x52\xde\x6f\x2f\x34\x13\x2a\xaf\x68\xe4\xcf\xb1\x3e\x07\xbd\x72\
+\x6d\x86\x52\x9e\x04\xfe\xde\xd3\x55\xf0\x56\xf8\xb7\x80\xfa\xdb\
+\xa3\x90\xe8\xe4\xef\x71\x78\x3f\x40\x9b\x03\x50\x1f\x09\x65\x8e\
+\x7d\x80\x9e\x6a\xb5\x0d\x81\x35\x18\x8e\x09\x7d\x02\xc8\x1c\x0e\
+\x26\x31\x1e\x48\xc9\x41\xea\x77\xec\x2d\x6a\x2d\x40\xa2\xaa\xdf\
+\xdb\xea\xb2\x37\x5c\x8b\xe8\x9a\xbb\x5c\x46\xbf\x2d\x69\xc6\x01\
+\xc1\x27\x3e\x39\x64\xec\xfc\xef\x0e\x78\x8f\x4b\x5c\x83\xfb\x84\
+\xf4\xaf\x7c\x3e\x51\x60\xe5\xe7\x55\xea\x19\x18\xd4\xa2\xdb\x0b\
+\x2f\x97\x40\xf8\xe6\x12\xcc\xf5\xf7\x4b\xdd\x4f\x10\xff\x4c\x62\
+\x96\x5f\x7b\x0f\xe5\xf3\x02\x9f\x45\xf6\x36\xf0\x7c\x7f\xfd\x7b\
+\x65\x3f\x2b\x99\x04\x98\xed\xeb\x2a\x8b\x08\xd0\x44\x53\x64\xf0\
+\x6f\x6c\x7d\x5c\x83\x10\xc9\xad\x1b\x56\x84\x9e\xce\x9f\x3b\x37\
+\x53\xd8\x10\xb8\x81\xc1\xdd\x68\x43\x2d\x10\x18\x0f\x84\xf7\x7d\
+\x20\x4c\x1b\xaa\x97\xdc\x01\x01\x09\x48\x5d\x23\xae\x85\xf7\x6a\
+\xc9\x81\x9b\x4b\x38\xf2\x2c\x4d\x5d\xf0\x02\x02\x04\xd4\x19\xda\
+\xc6\x28\x1a\xaf\xd2\x32\xda\x51\x38\xac\x26\xb9\xad\xc3\x93\x90\
+\x92\x29\x06\x4f\xb4\x3b\xfa\xaa\x29\x1d\xfc\xa5\x51\x40\x93\x25\
+\x55\xf1\x56\x80\x23\x84\x55\x3d\xe6\x4f\x5c\xdb\x17\x74\xef\xbf\
+\x26\x49\xea\xa8\xec\x15\x49\xc0\x2d\x20\xc9\x41\x86\x1c\xcb\x50\
+\x32\xd4\x17\xef\xcd\xfc\x89\xe9\xeb\x5f\x79\x0f\xf9\x41\xeb\x5e\
+\x9d\x29\x42\x12\x52\x07\xf6\x96\x7d\x46\x8a\x84\x02\x86\x76\xd9\
+\xc1\x6e\xd4\x36\x42\xea\xfd\x78\x40\xd0\x02\x84\x96\x04\xdc\x47\
+\x7f\x3e\xf5\xfe\x5a\x90\xdc\xfb\xaa\x50\x02\x20\xa3\x58\xfa\x74\
+\xca\x55\xbc\x02\x76\x0d\xda\xfa\xb9\x9e\xd3\xb0\x93\xbb\xc7\x0a\
+\xdb\xbb\xba\x04\xfa\x27\x15\xb0\x4b\x00\x4c\xc1\xe1\x60\x6e\x94\
+\xe5\x5f\x57\x21\xc4\x37\x9c\x31\xcd\x23\xb5\xb6\xc4\xc3\xc0\x93\
+\x0d\x89\x2a\x0d\xb7\x0d\xae\x5b\xcc\x61\x4c\xa5\x15\x1f\x3c\x6c\
+\xcc\x08\x81\x41\x71\x20\x1e\x76\x21\x9b\x65\x2a\x6b\x49\x61\x1c\
+\xc8\x90\xb0\x4a\x04\x31\xc6\x88\xb3\x90\x7e\x9e\x10\x20\xd1\x3e\
+\xb4\x36\x2a\xf6\xef\x73\x07\xa0\x7e\x28\x22\xcd\x8b\x1e\xae\x5a\
+\xdb\x65\xd7\x60\x36\x06\x58\x9c\xdd\x1f\x29\x5f\xa2\x4f\x7d\x2e\
+\xad\x9a\xe5\xaa\xf4\xba\x6a\x32\x77\x78\x5e\x9f\x9c\xd1\x97\x17\
+\x47\x19\xf4\x1e\x7c\x2b\x92\x63\xe5\x44\x60\x7b\x10\x30\xfe\x3a\
+\x9a\x28\xd8\xc1\xcd\xde\xff\x56\xe4\xb7\x62\x98\x7b\x47\x1b\x20\
+\x15\x98\xb5\xe7\x7f\x8b\xe4\x02\x0b\xe5\xc4\x23\x89\x2e\x96\x4c\
+\xa4\x4d\x54\x23\x52\xe9\x96\xfb\x2b\x06\xf6\x75\x0d\xb6\xbd\xdd\
+\x74\x5f\xe4\xf6\xd0\xed\x39\x37\x35\xe2\x8f\x54\x6e\x0c\x90\xb2\
+\xa3\x63\xd5\xae\x36\x11\xdc\xf5\x85\xc3\x89\x44\xa5\x07\xda\xa4\
+\x70\x09\xcc\xae\xc5\x9d\xaa\x3c\xab\x41\x43\x00\xd2\xbd\xa5\xf4\
+\x66\x71\xba\x09\x90\x08\x78\xe5\xc1\x9f\x8f\x31\xe9\xf7\xd9\x64\
+\xd1\x81\xb6\x97\xb2\x7d\x13\x41\x8a\xe1\xba\x6d\x34\xa3\x9a\x57\
+\x34\x33\x09\xe6\x2b\x24\x46\x60\x20\x29\x27\x9c\xe4\x79\x64\x08\
+\x44\xd7\x22\x47\x95\x53\x41\xec\xcd\x8d\x50\x85\xdc\x21\x3f\x09\
+\xed\xb5\xf4\xcf\xc7\x24\xcd\xf0\xbc\x53\xa8\x41\x73\x66\x69\x8b\
+\x41\x5b\x9b\x6e\xf8\xc4\x13\x02\xf5\xef\x52\x42\xe4\x3c\xb7\x3c\
+\x0c\xfa\xd5\x66\x03\xca\x56\xf6\x77\x2e\x29\x8a\x3f\x07\x0a\x5b\
+\x3e\x80\x9e\xf7\xb6\x09\x82\xd2\xb3\x52\x4e\x04\xa1\x28\x89\x29\
+\xaa\xcc\x31\x91\xb2\xbf\x5d\xf0\x17\x5b\x41\xe8\x9e\xe4\x02\x70\
+\xee\x39\x65\x11\xb4\x03\x46\x7f\x96\x04\xa0\xed\x6d\x01\x02\x9a\
+\x4b\x0a\x61\xbe\x0d\x1f\x49\x22\x85\xfb\x04\x00\x43\x80\x9f\x58\
+\x68\xcf\xb3\x7d\xa3\xc4\xc4\x6c\x58\xe4\x48\x7a\x72\x30\x81\x24\
+\x86\xe7\x70\x45\x41\x0f\xd8\x94\x65\xaa\x87\x0c\xab\x28\xaa\x21\
+\x5f\x61\xe4\x48\x31\x79\x52\x58\x66\x6c\xad\x8f\xb3\xd2\x30\x26\
+\xa9\xc3\x9e\x7b\xc4\x25\xd2\xf7\x11\x05\xf8\x6e\xcc\x24\x3d\x4c\
+\x2f\x3c\xb9\x89\x46\x95\x95\x5c\xa2\x43\x81\xd7\x56\xdb\x5b\x41\
+\xb6\x14\x6e\x18\xf8\x0d\x69\x2f\xec\x9f\x90\x61\x3a\x1a\x4e\x9c\
+\x49\x3a\xac\x0e\xe1\x90\xca\x91\xd3\xe8\x59\x90\xd7\xc3\xa8\xd9\
+\xc8\x65\xbd\xa9\xda\x2f\xd1\x5d\x30\x85\x28\x88\x51\x5a\x71\x46\
+\x3d\x0c\x55\x82\x1e\x41\xfc\x0a\x93\xbe\x5e\x78\x15\x42\xdb\xb9\
+\x16\x4b\xd0\x31\x58\xb8\x23\x55\x62\xac\x73\xdb\x3a\x9d\x48\x5f\
+\x3e\xc7\x59\xd1\x75\xec\x8d\x22\x6e\x13\x9f\x6d\x78\x82\xa2\x59\
+\xab\xe5\x20\x5b\x7c\x9b\xd6\x82\xc8\xdb\x2a\x7a\x1e\x4b\x6f\x1c\
+\x9f\x89\x67\xbd\x08\x77\x26\xb4\xfd\xce\xaa\x3b\xf9\xfc\xed\x4d\
+\x78\x00\x6a\xa2\xc2\x9e\x37\xfe\xae\x77\x31\xf4\x60\x10\x64\xb8\
+\xad\x6f\x74\x1f\x04\x1f\x0a\xe5\x15\xf6\xbc\x7d\xd0\xb3\x0c\xde\
+\x03\xa2\xa7\xbf\x25\xf0\x8b\x09\x40\x34\x21\x60\x48\x02\x20\x1e\
+\x2e\x9d\x0c\xbd\x96\x2f\xf0\x2b\x7a\xd0\x29\xc2\xcc\xc0\x98\xd2\
+\xfe\xfa\xe2\xd1\x2a\x99\xb7\x10\xb3\x92\xe5\x16\xca\x76\xf4\x23\
+\x90\x57\x72\x62\x17\xb0\x73\x03\x81\x38\x1a\xa5\x25\x17\xd7\x07\
+\x7f\x73\x25\x04\x0e\x8a\x5c\x37\x97\xe8\x9e\x76\xc3\xb9\x84\x24\
+\x97\xd9\x7b\x62\xe5\x34\xc8\xfd\x5d\xf9\x90\x2e\x15\x25\xba\x15\
+\x69\x30\x3d\x93\xde\x90\x19\x7e\x5b\x84\x0a\xb4\x82\xd6\x84\x34\
+\x8a\x98\x47\x1b\xe4\x7b\x41\x46\xc2\xd8\xf9\x91\xaa\xe6\x73\x7c\
+\x13\x2a\xda\x66\x0a\xce\x0f\xb8\x01\x3f\x80\x4d\x4c\x10\x9f\x80\
+\xfb\xd3\x03\xa8\x77\xf4\xdf\x6b\x7c\x16\x1e\x68\xeb\xbb\x3e\x14\
+\xc6\xb0\x44\x3c\xc8\x21\x2b\xdb\xf9\x36\xc2\xda\xec\x18\x27\x05\
+\x4d\xcc\xdc\x11\x56\x78\xe1\x86\x7f\xec\x23\x3f\x85\x24\xc0\xe8\
+\xc1\xf3\x80\xd1\x21\x19\xcd\xee\x7a\x38\x6b\x39\x24\x84\x8c\x9d\
+\x3d\xf0\x46\x4d\x00\x56\xa2\xd2\x96\xfe\xd0\x86\xe7\x22\x89\x51\
+\xc4\xb3\xbd\x53\xa6\x4f\x09\x1b\x7e\x0f\x9b\x13\xaa\xf2\x64\x40\
+\x4b\x00\x46\x55\x44\xa3\x3c\x60\x4f\x24\xb9\xa2\x24\xcd\x31\xdb\
+\x8a\xd8\x16\xb0\x74\xad\xef\x7d\x09\x80\x61\xe4\xb0\xb2\x6b\xc9\
+\x56\x41\x11\xe2\x21\x07\xa5\x9a\x91\xde\x48\xc5\x57\x04\x8b\x5f\
+\x9b\x0c\x6d\x27\x29\xe6\x59\xdd\x78\xcf\xee\x45\x7f\xcc\x66\xa6\
+\x7b\x3a\x09\xc8\x8b\x30\x95\xbd\xb7\x4d\xa0\x24\xe5\x67\x6c\x2d\
+\x20\x23\x75\x94\x98\xc4\x9f\x1f\x7a\xf3\xb6\x38\x08\x5e\x2d\x04\
+\xe4\x3e\x6b\xd8\xd3\xb2\xa0\x6d\xb1\x07\x43\x58\xf3\xd5\x60\x36\
+\xb7\x13\xf7\x27\x00\x3b\xf5\x0c\xd6\x56\x44\xdb\xa1\x91\x61\xb4\
+\xbf\xef\x74\xf2\xc1\xb4\xe9\xcb\xdd\x6f\x12\x30\xed\x82\x5d\x78\
+\xd6\xe3\xc7\x9c\x18\xec\x1d\xc6\xe0\xc6\xdb\xf4\x68\xf8\x58\x88\
+\x4b\x36\x3a\xca\xba\xc6\x53\x05\xe5\x87\x05\x6c\xee\xe7\x95\x09\
+\x68\x6c\x9d\xcb\x4d\x6f\xe2\x60\xe9\x6b\x36\x42\x5f\x56\xff\xfb\
+\x4e\x43\x1f\x62\x43\x1a\xed\x79\xb5\xea\xfa\x02\x85\x15\x0e\x45\
+\x73\xb8\x01\x35\x03\xa5\x7a\x93\x58\xdc\xc0\x20\xf7\xad\x63\xad\
+\x82\x9c\xf6\x06\x02\x51\x2e\x09\x68\xd0\x73\x4e\x05\x9f\x1a\x8f\
+\xbb\x0e\xdb\x10\x2e\x9c\x7c\xde\x4f\xd1\x31\xb1\x11\xc7\x02\x24\
+\x46\x1b\xe7\x2a\x3a\xeb\x20\x8c\xd1\xf6\xfb\xfa\xdb\x39\xd5\xc5\
+\x7a\x07\x73\x9e\x4f\x4b\xf0\xb3\x35\xa7\xb1\x12\xd6\xb7\xc9\x10\
+\x4a\xa9\x80\x0d\x5f\x0b\x55\xb6\x80\xd8\x4f\xfc\x4b\xb6\x04\x86\
+\x52\xc4\x15\xc4\x76\xac\xbb\x7f\x95\x4b\x02\x4a\x39\x22\xc5\x67\
+\x69\x49\xc1\x67\x76\xa1\xbe\xf8\x7b\x57\xac\x40\xbb\x2b\x17\xbc\
+\xb1\xc9\x71\x94\xe2\x40\xdd\x1b\xa2\xea\x75\xf3\x51\x87\x48\x6b\
+\x1a\xb2\x95\x40\xba\x8f\x0c\xd9\x87\x17\xd4\xde\x26\xf1\xa6\xe7\
+\xe6\x42\x9b\x01\xf7\x97\x96\x87\x5e\x89\x0b\xa4\xac\x52\xda\x5f\
+\x4d\x97\xfc\xbb\x14\x79\x0f\x8b\xd1\x6c\x57\xf3\xaa\x86\x3d\xf2\
+\xa0\x63\x96\xc0\x19\x99\x59\xf5\xf1\x28\x58\xf0\x48\x30\xea\x58\
+\xa2\x4b\x24\xdb\xcb\x81\x69\x54\xe5\x4c\x07\x0d\x56\xea\xa8\x68\
+\x8c\x02\x34\x37\x49\xa2\xcd\xf6\x6a\xd8\x57\x05\x66\x91\x84\x56\
+\x50\xa0\xd2\x76\xc4\xe3\x93\x70\x2d\x44\xc3\x0e\x68\x94\x33\xd9\
+\x62\x28\x60\xa4\x97\x4c\x36\x20\xf1\xaf\xa6\x2b\x5d\xbf\x50\xc0\
+\x07\xc8\xac\x9f\x41\xdb\xd3\x70\xa5\x8c\x73\xc9\x79\x1b\xa6\x1f\
+\x08\xd2\xb9\xb9\xfa\xb5\x57\x89\x03\xdd\x62\xe2\xaa\xe4\x8c\x3a\
+\xfb\xad\x3c\xb8\x9c\x17\x25\xa3\x96\xb7\xd1\x34\xe0\x23\xe0\x7b\
+\xc7\xe0\xf9\xf7\xbc\xe3\x07\xbc\x46\x8c\xba\x8f\xf9\x5f\x3e\x1e\
+\x46\xfa\xf6\x6c\xfc\xf0\xd6\x2d\x04\x7d\x33\xe2\xfb\x61\x8b\xc6\
+\x77\x6a\x4e\x80\xca\x8c\x15\x89\xf7\xb0\x97\x46\x87\x38\x03\x37\
+\xaf\x91\xb0\x2d\x90\x43\x42\x87\xc0\x28\xce\x5c\x39\x7b\xce\x12\
+\xfb\x5f\x53\x0c\x57\xde\x77\x5f\x90\x32\x91\xad\xfe\xbd\xbc\xa3\
+\x5e\x39\x2c\x57\x17\xcd\x00\xdb\xd0\x4a\xea\xef\xb3\x8d\x66\xa2\
+\x89\x90\x76\x83\x20\x4b\xd3\x9b\x62\x3e\xc2\xe3\xd7\x71\xbf\x05\
+\x82\x68\x0a\x84\x60\x8c\x3a\x9a\x1a\xa1\x1e\x3e\x20\xca\xa3\xad\
+\xb9\xa0\x23\x56\xd7\xbb\xc7\xf3\xd2\xd3\x51\xd7\x8f\x95\x09\xe7\
+\x75\xc4\x23\xb9\x4f\xd5\xbf\x9c\x12\x21\x4f\xec\x6d\xd1\xd9\xae\
+\xae\xcd\xde\x14\x1a\xd3\xc5\x5e\x31\xfb\x13\x80\xeb\x47\x73\xa5\
+\x18\x70\x17\x13\xae\x72\xbd\xa0\x12\xa5\xb0\x32\x4d\x81\x07\x91\
+\xa1\x47\x60\xee\xd7\xc3\xb6\xf9\x4b\xed\x33\xb8\x04\x6c\xab\xea\
+\x73\xef\x61\xb4\x73\xe8\x15\x92\x7d\xa6\x52\x4d\x67\x59\x10\x07\
+\xc4\xf1\xa1\x4d\x95\x7c\xb7\xb7\x4f\x0f\x09\xf6\x2f\x97\x08\x5e\
+\x2d\x68\x45\x29\x63\x8d\xf9\x6f\x50\x8b\xc4\x64\x17\xed\xad\x0e\
+\x0a\x7a\x60\xd8\x74\x62\xc3\x94\x0d\xa5\xc0\x72\xa9\x00\x36\xc3\
+\xbe\x6e\x22\x62\xbb\xd7\x85\xa6\x2e\x56\x9a\x00\x38\x81\xa9\xb4\
+\x8d\x6d\x2e\xe1\x01\x25\x61\xbd\xcf\x24\xa0\x5c\xd2\xd8\x41\xbf\
+\x6d\x46\xee\x18\x57\x6f\xf2\xda\xb7\x45\xa4\xbe\xa6\x8b\x8b\x83\
+\x74\x02\x50\x3a\x6d\x24\x4f\x4d\x94\xc2\xcb\xb9\x31\xc5\x5d\x2e\
+\xb0\x0a\xab\xbe\x89\x84\xd7\x76\x56\xdd\xdd\xad\x13\x04\x8c\x7e\
+\x4a\xf6\xbc\x76\xbe\x25\x07\x4b\x26\x5b\xee\x1b\x69\xbc\xd5\x48\
+\x33\x3d\x97\x8f\x94\x03\x50\x4a\x20\x8a\x64\x7e\xfb\x0d\x3d\x47\
+\xa2\x3e\x66\x05\x33\x0e\xa3\x48\x92\x6e\x18\x79\xe8\x59\x35\x8e\
+\x46\x4e\xb8\x3a\x58\x7c\xf8\x1d\x23\x75\xba\xa6\x08\xc2\x5b\x4d\
+\x7c\xa4\x4d\xb0\x65\x93\xf5\xbc\x6f\x14\x74\xf4\xcb\x0d\x77\xa4\
+\xd1\x16\xc9\x5e\x17\x36\x26\x00\x63\x52\x2b\x7d\xf9\x9c\x63\x6c\
+\x7c\xd4\x71\xe1\x25\xf9\x3d\x5a\x9e\xe5\x0a\xef\xbf\xbf\x92\x90\
+\x61\xd6\xea\x20\x09\xff\xe8\xf7\xb9\xf2\x76\xa9\x4a\xa2\xdc\x27\
+\x7a\x7f\x1d\x26\x17\x9a\x88\xa0\xba\x77\xc2\xa3\xf6\xa6\x53\xdb\
+\x5a\x00\x35\x27\x75\x89\xf6\xd5\x66\xce\x9b\x90\x58\x36\xd3\x6e\
+\x99\xd2\x25\xcc\xa5\x42\x38\xdc\x7f\xfd\x3a\xd4\x03\xb9\x20\xee\
+\x52\xcd\x5c\x93\xd2\x4e\xde\xd3\x5a\xa2\xda\x5c\x61\x66\x13\x27\
+\x01\xa5\x48\xc5\x94\x21\x93\x5d\xeb\xcd\xa2\xfc\x7b\xd2\x5f\x5e\
+\x89\x71\x5d\x59\x7f\x3b\x25\xfe\x95\x4f\x00\x0a\xd1\x44\x32\x96\
+\xc9\x8d\x9e\x78\x0b\xa6\x80\x4c\x49\xc6\x6c\xb7\x8e\x5b\x4e\x51\
+\x2c\xcc\x69\x0f\xa4\xe4\x85\xf7\x57\xff\x41\xd9\xf5\x4e\x76\x1f\
+\xca\x8c\x11\x21\xa2\x8b\x83\x2e\x6b\x2e\x44\x13\xcd\x60\x1a\x64\
+\xd0\x92\x10\xa0\xe8\x81\xba\xb8\x89\x04\x1d\x0e\xc3\x4c\xc5\x2e\
+\x49\xc4\xce\x53\x31\xdc\x71\x1b\xb8\x72\xca\x55\x5d\x2c\x31\xb9\
+\x47\xcb\xba\xe9\xf3\x0e\x55\x2d\x36\x0f\xea\xa0\xd0\x14\x48\x90\
+\x2f\xee\xf0\x75\xbb\xf1\x47\x40\xd3\x0f\xdc\x68\x67\xbc\xe2\xb0\
+\xb2\x59\x5e\x80\x7c\x9d\x40\xee\x4d\x8b\x12\xb7\xb3\xb1\x51\xdb\
+\x1b\xa1\x8f\xba\x67\x0c\x29\xb6\xc3\x8c\x78\x00\xc8\x58\xa7\x21\
+\x46\x47\x10\x2c\x8a\x89\x5d\xb2\x15\x1d\xd3\xd2\x55\x0c\xd0\x89\
+\x94\x4e\xaf\x1c\xb7\x1c\x2c\x0b\xe7\x00\x98\x4d\xab\x74\x48\x19\
+\x72\x68\xfb\x44\x65\x48\x43\xa2\xfe\x99\xf4\x7b\xfa\x8d\x56\x39\
+\xac\x29\xd9\xea\xc1\x50\x66\x46\x96\x54\xf8\xeb\x63\x93\x97\xed\
+\x0c\x7e\x46\x0e\xec\x64\x22\xdd\xf6\xe4\x73\xff\x74\x4c\xdc\x5a\
+\xb1\x45\x3e\x23\xf8\x67\xf6\xc3\xfd\x89\x04\xa0\xd7\x51\x90\xb6\
+\x17\xda\x9b\xdd\xad\xaa\x78\x53\x90\xec\xe8\x6a\x91\x29\x6e\x42\
+\xb3\x26\xc2\xdc\x1c\xaf\x78\xba\xe8\xec\xf9\x40\x7c\x43\x14\x1e\
+\x1c\x13\x0b\xba\x70\x55\x7a\x53\xbc\xbe\x34\x4e\x87\xd7\x1c\x18\
+\x0c\x1b\x7b\x04\x24\x95\xbe\x92\xa6\xe5\x04\x40\x6e\x05\x50\x02\
+\x15\x85\x4e\x43\x60\x33\xb1\x55\x22\xae\x88\x4a\x20\x4c\xcf\xe8\
+\x06\x71\xc3\xe1\xb1\xb9\x9c\xe3\x1a\x1d\xab\x99\xc2\x0c\xa4\x93\
+\xfe\x1d\x84\xa0\x84\xe0\x6b\x29\xf3\xc7\x10\xd2\x9e\x05\x4d\x61\
+\x58\x23\x40\x7a\x80\x36\x16\x27\xd6\x15\x68\xf1\xa7\x90\x8a\x8e\
+\xdb\x12\xeb\xd2\xbd\xfb\x37\xe5\xb1\xc0\xcd\x50\xde\xc4\x8d\x50\
+\xb1\xe0\x03\x9c\x2b\xf1\xc9\x0a\x5e\x93\xb7\x02\xd6\x0f\x27\xb3\
+\xb2\x9e\x25\x97\x3e\x9e\x30\x1d\x97\x7b\xdf\x1d\x97\x0a\xa2\x60\
+\xda\x20\xae\xec\x73\xc9\x93\x3b\x74\x76\x40\xb2\x1b\xc8\x64\x35\
+\x52\xfd\xc3\xec\x68\xbf\x87\x15\xb4\xcb\x7b\x7f\xf4\xd7\xc8\xc4\
+\xea\x6c\xef\xb0\xcf\x16\x02\x65\x2e\xd1\x68\xd7\x03\x94\x24\xf6\
+\x88\xe9\x5f\xd2\xb7\xcf\x91\xf8\x6a\x21\x60\xf9\x24\xf5\xa6\xc4\
+\x32\xd8\xd4\x0a\x90\x15\x3b\x4d\x19\xf9\xf5\xc6\xe4\xbf\x74\xcf\
+\xfa\x3a\x1d\x7f\x27\x76\xb4\x4b\x01\xb0\xb7\xa2\xd0\x56\xcd\xdd\
+\x6c\xf1\x74\x50\x1f\x2b\xa5\x52\x0d\x92\x42\x44\xb7\x8f\xdd\x3a\
+\x49\xf2\xcc\xfe\xbe\x45\xaf\xb2\xe2\xc6\x92\x22\x44\x4b\x4a\x6a\
+\xf5\x8c\x18\x53\x2d\x00\xe7\x8e\xe5\xe6\xc3\x13\xbd\x23\xd6\x67\
+\xaf\xd4\x83\x3c\x4f\x6e\xd2\xfd\xe2\x91\xd8\x8e\x10\x2c\xf2\x8a\
+\x61\x52\xaf\x17\x3c\xca\x20\x07\xaa\xa0\x79\xdf\x08\x70\x60\xed\
+\xa4\x38\x85\xef\xb5\x75\x04\xaf\x89\x44\x38\x28\x1b\xb6\xda\x1c\
+\xfc\x33\x41\xbc\x8b\xe1\xec\xd4\x41\x54\x4e\xc6\x43\xf7\x71\x90\
+\x12\x0b\x6a\x55\x9b\xbb\x27\x67\xe1\x8a\x2d\xd0\x25\x85\x49\x27\
+\x32\x7a\xd9\x60\xc8\x7e\x4d\xea\x92\xef\xe7\xd8\xf0\x97\x64\x69\
+\xb9\x67\xfe\xfe\x77\xa3\xea\x39\x9f\x42\x00\x02\xd1\x12\x94\x9e\
+\x31\x9d\xcc\xd8\x25\x83\x3b\xe8\x15\x4a\xd0\x37\x88\x89\xb5\x35\
+\x33\x3b\x8a\xe7\xfb\x4d\x98\x6c\xe8\xaf\x61\x1d\x83\xd0\x6e\xdb\
+\xe1\xe0\xc7\x0e\xeb\x14\x3f\x00\x13\x9b\x29\x0a\xa7\xbb\x7a\xe6\
+\xaa\x4c\x6c\x9d\x7e\x1f\x2c\xf3\xf2\x51\x60\xc3\x2c\x90\x4d\xd2\
+\x44\xeb\xd6\x81\xbf\xba\x51\x45\x2f\xf5\xa8\xab\x0d\x63\xc9\x8d\
+\x32\xc2\x5e\x67\x15\xf1\xe2\x16\xa0\xb8\xa6\x32\xad\x86\x34\xb1\
+\x72\x12\xcc\xd5\x30\x0a\xbc\x9e\x77\x83\x21\x89\x01\x17\x4d\xdb\
+\x2c\x20\x84\xbc\x0d\xb4\xb3\xfa\xd2\xee\x7b\x28\x25\x00\xfc\x95\
+\x24\xa3\x58\x04\x55\xb3\xcc\xd4\x09\x3f\x1c\x68\xc6\xd5\xf4\xe5\
+\x0c\x45\x6e\xf4\x52\xce\x4c\xa6\x3d\xc0\x9a\x30\x51\xc3\x01\xd4\
+\x92\x7e\xa3\x8d\xbf\x3f\x99\x23\x45\xe8\x47\xe7\xaa\xcc\x69\x7b\
+\x25\x34\xa4\x0f\x6b\x97\xb5\x57\xeb\xf7\xae\x5c\x4f\x9d\x19\x16\
+\x55\xdd\x71\x33\x61\x31\x26\xb4\x71\x11\x1d\x5b\xac\x8d\x1d\x57\
+\xb9\x23\x79\x7e\x55\x87\x6d\x69\x47\x66\x53\x9b\x80\xf1\x4e\xef\
+\xd5\x76\x0a\x09\xb4\xd7\xfa\xa0\x96\xe8\xa3\xd3\x59\x74\x9c\x55\
+\x8f\x04\xad\x0a\x1b\x7e\x62\x09\xe2\xc8\xac\x33\x8f\x54\xe5\x70\
+\x38\x96\x23\x26\xa5\x82\x53\xaa\x46\xc1\x06\x51\xa0\x9e\xeb\x5a\
+\x48\xe3\x62\xc2\x81\xb5\xde\x83\x56\xf3\x8f\x20\xeb\x7f\xcf\xf8\
+\x29\x5e\x1f\x74\xad\x56\x37\x0f\x52\x93\x6a\xc2\x43\xb8\x19\x4a\
+\x02\x7f\x7b\x12\x9a\xbd\xe7\xa4\x40\x53\xc0\xbc\x47\x85\x56\xf7\
+\xdf\x37\x4a\x00\x64\x12\xb4\xc9\x54\xc0\x56\xe0\x0f\xf1\x0a\x7b\
+\x8a\x47\xf3\xb6\x24\x9a\x1d\x6c\xfe\x8e\xad\xef\xaf\xdb\x45\xba\
+\x1c\x21\x0c\x78\x3f\xb9\x3d\xd5\xf6\x82\x6e\x8d\x23\xe8\x76\x25\
+\x53\x0d\x89\xe0\x2f\xc8\x49\x73\x29\xf6\x3b\x8d\x71\x18\xc8\x7a\
+\xeb\x9f\x1f\xd2\xc4\x3e\x9f\x6d\x3b\x27\x32\x52\x3d\xe2\x6a\x65\
+\xdc\xc8\x5e\x8f\x35\xfb\x2b\xc7\x34\x16\xc4\x2a\xa8\x60\x05\x37\
+\xca\x31\xe4\x50\x6f\xce\xaf\x01\x68\x56\xad\x68\x79\x47\x6d\x88\
+\xc4\x98\x62\x30\xbd\xe0\x99\x98\x2d\xea\x59\xd1\x6c\x18\x33\xe8\
+\x21\x54\xf1\x88\x6c\x57\xad\xd5\x69\xe5\xc9\x82\x46\x30\xf1\xe1\
+\xb6\xbe\x12\xf9\xd2\x6c\xa8\xe6\x10\xab\xdf\x5f\xd3\xf9\xd0\xb4\
+\xcc\x73\x61\x64\x93\x0d\x50\x74\x80\x95\x56\x2f\x2a\x81\x46\x9b\
+\x85\xc6\x8e\x64\xbe\x22\x9e\x58\xe2\x00\x31\x5c\xb6\x22\x1b\x67\
+\x03\xa9\x4a\xfc\x2e\x57\x1c\xe4\xa4\x17\x2f\xd9\x6d\x97\x24\x01\
+\x12\x19\x6f\x41\x33\xf0\x94\x83\x23\xc4\xd6\xa5\x87\xfc\x55\xf3\
+\xc6\x14\xb2\x4c\xe9\x34\xdc\xa7\x94\xf8\xfe\x2a\x5d\x87\x61\x1d\
+\x4a\xba\x4d\x34\x8b\xdf\x83\x91\x8d\x1b\xc3\x55\x09\x00\x6e\xa5\
+\x94\x4c\x72\x51\xd2\x69\x59\xd2\x40\xe0\xf3\x2b\x47\xfb\x9a\x08\
+\xf9\x84\xc7\xa0\x27\x31\x29\x53\x21\x39\x32\xf6\x16\x9e\x97\xac\
+\x01\x52\xfb\xbe\xbf\xb9\x54\xe0\x2d\x46\xe4\x7a\x9c\x78\x18\x8a\
+\x54\x76\x21\x61\xdd\x7b\x1f\xf8\xb4\x9d\xe8\x05\x50\x6b\xb3\xe8\
+\xc5\x16\x8e\x98\xc0\x67\x90\x10\xcf\xa4\x1a\x70\xa4\x32\xac\xf0\
+\xe5\x01\xc1\xb2\x88\x99\xbf\xc9\x4d\xd0\x5d\x1b\x1d\xed\x92\x82\
+\x93\xc8\x3d\x20\x9c\x07\xab\xab\xca\xf5\x96\x25\x52\x36\x18\x4c\
+\x74\x39\x08\x89\xc9\x09\x77\x26\x6a\x51\xf8\xd6\x45\x17\x58\xf5\
+\xee\x45\x21\x7e\x23\x8a\xd9\x48\x55\x18\x3d\x88\x0a\x84\x35\x3a\
+\x46\xf6\xf3\x09\xc0\x19\x56\x02\x76\x8d\x10\x25\x7d\x31\x84\x0d\
+\x45\x1e\xe7\x5a\x3b\x69\x7b\xc0\xa5\xa4\x4c\x0f\x7f\xab\xe3\x8d\
+\xb4\x05\xd3\xac\x1b\xb8\xb9\x42\x4e\xba\xea\xf8\xc4\x8b\xa5\x7b\
+\xa7\x80\x74\x97\xf7\xfd\x86\xb4\xd1\xcd\x3d\x04\xdc\x64\x7b\x48\
+\xf2\x53\xf0\x81\x60\xba\x69\xd5\x5a\x0f\x76\xe7\x08\xe9\x94\x31\
+\xbc\x41\xeb\xb8\x9f\x36\xae\xbf\x51\x49\x1a\xaf\x49\x00\xe2\x76\
+\xa9\x33\xb3\x49\x9b\x0c\xed\xd5\x9a\x2f\x41\x7b\x4a\x27\x3f\xf4\
+\x29\x85\xfb\x1b\x21\x8d\xd7\x3f\x45\x09\x50\x42\x7e\x85\x00\x51\
+\x8a\x07\x41\xee\x7f\xcf\x90\xe7\x4e\xfe\x4e\x6d\xbf\xcd\xcb\x00\
+\x23\xee\x29\xce\xd6\x5d\x89\xe1\x4d\xc3\x0c\x3e\xb2\x9e\xd2\xd1\
+\x7c\x68\x62\x6c\xa2\x33\x09\x92\x4b\xc8\x9a\xdc\xa1\x1b\x7a\x18\
+\x9a\x93\x9a\x91\xad\x72\xc9\xe1\x17\x82\x52\x33\x8c\xba\x9e\x7c\
+\x27\x3b\x4b\xb5\x89\x0c\xb2\xe5\x32\xc0\x07\x9b\x21\xd9\x49\xd6\
+\xab\xac\x27\xd5\xbb\xc9\x8b\x25\xa8\x36\x88\xc7\xd0\x48\xb3\xf6\
+\xa4\xaa\xd0\x48\x77\xa3\x4a\xc6\xca\x66\xb8\x9d\x80\x04\xa4\x78\
+\x09\x24\xd1\x32\x85\x7d\xd7\xb1\xdc\xfc\xa9\x60\x7e\x36\x47\xac\
+\xc1\xf3\xeb\x3e\xf1\xea\x74\x02\xe3\xad\x6c\x4c\xfd\xe8\xa3\x4f\
+\x42\x46\x9f\xb0\xb6\x57\x05\x41\x60\xd6\x9f\xf8\x33\xf2\x64\xc3\
+\x76\x63\x20\xc8\x8b\x6b\xd9\x8c\xd2\xdd\xe4\x3f\xb3\xbd\xb7\x24\
+\xe0\x76\x2c\x74\x69\x0c\x74\x3f\x07\xc0\x32\xd9\x69\x9b\x1d\x0d\
+\x4b\x89\x92\xd5\x8a\x70\xcc\x39\xd0\xd1\x11\x4b\x43\x8c\xb0\xb6\
+\x88\xcd\x5c\xc3\xd2\xd7\x88\xa1\xd7\xee\xa7\xb2\x75\x3c\x95\xf1\
+\x1c\x86\x7d\x5c\x86\x66\x23\x09\x32\x3a\xa3\x3a\x50\x5b\xdd\xbb\
+\xee\xc5\xae\x04\xa0\x37\x91\x26\xb6\x56\x71\xd7\x43\x2c\xa6\xd2\
+\x0a\x24\x1c\x1a\xdc\xf8\x3c\xa4\x5e\x71\xbb\x6b\x59\xec\x2f\x47\
+\x34\x9b\x9f\x82\x29\xa9\x2e\x7b\x4d\x5a\x01\x9c\x23\x30\x22\xe2\
+\xda\x58\x7c\x53\xf3\x93\x07\x42\x4f\xaa\x97\x1e\x48\x6e\x4c\x69\
+\x0a\xec\xe6\x21\x90\x21\x1b\xcc\xec\x8f\xaa\xd5\x80\x00\x54\x11\
+\x2b\xbf\x64\xa6\xdf\xe4\xa7\x09\xdc\xfb\x32\x67\xc5\x26\x31\xfa\
+\x97\x86\x26\x79\x65\x92\x90\xa5\xee\x0b\xdd\xbd\xba\x8d\x62\x47\
+\x03\x85\x52\xb9\x70\x12\x97\xbf\xc6\xed\x26\x8d\x88\x57\x4a\x62\
+\xe2\x5a\x0f\x25\x23\xa3\x69\xf8\x76\xd5\x06\x20\x6d\x23\xe3\x13\
+\x00\x5d\xe5\xcc\x16\x11\x77\x4b\x02\x02\xbf\x5f\x29\xde\x8b\xea\
+\xa5\x71\x6f\xc8\xc4\x95\x13\x2f\x07\xa3\x12\x52\xef\x4b\xdd\x4e\
+\x9a\xc8\xd2\xb8\x0a\xf9\x89\x0d\x20\xad\xa3\x06\x09\x43\x25\x9d\
+\xe5\x94\x39\xf6\x52\xee\x43\xd3\x5d\x3b\xd2\xbb\x31\x09\xe8\xb7\
+\x29\xd9\x7a\x87\xbf\x4d\xcf\xd1\x16\xdb\xba\x47\x66\x5b\x18\x55\
+\xed\x78\x12\x58\x72\x9f\xf7\x24\x9d\x99\x04\x40\x53\x8e\x92\xe1\
+\xdb\x49\xf7\x91\x8e\x2c\x2b\x8d\x27\x1c\xc9\x6c\x66\x10\xa0\x71\
+\xe6\x56\x37\x1c\xd7\xfe\x3d\x55\xf2\xd2\x48\x80\xcb\xc1\x3a\x2a\
+\x46\x20\x86\x91\xbd\xb6\x8d\xe4\x88\xc4\x23\xc4\x2e\xad\xd9\x74\
+\x42\x4a\xd4\xa1\x4e\xc2\x52\x0e\x59\xb0\xa4\x6f\x16\x6f\xea\x63\
+\xa2\x22\x67\x90\xdc\x20\xb5\x07\xc6\xe5\xba\x45\x0e\x81\x2c\x7c\
+\xe4\xdb\x32\xeb\x6b\xe1\x23\xa0\xeb\x18\x8e\x28\xb8\x81\x38\x9d\
+\xd1\x1e\xe2\x80\x5f\xab\xe2\x35\x3c\xdb\xa6\xb3\xf5\x15\xfa\x4e\
+\x67\x98\xbd\xda\x94\x04\x8c\x21\x0b\x1f\x80\x05\x21\x5d\x08\xa5\
+\x11\x05\xb4\x4e\xcf\xaf\xa3\x48\x5a\xa5\x40\xa4\xb4\x5a\xdd\xe0\
+\x3f\x9f\x55\xc1\x3b\x66\x49\xa2\x4d\x87\x98\xfe\xae\x55\xb3\x2a\
+\x5a\xf2\x04\xff\x56\x26\x54\x8d\xeb\x83\xf2\x11\x3e\x56\x79\xed\
+\xd7\x46\x90\xa7\x80\x74\x0e\x8e\x4d\xb8\x2b\xe6\x64\x61\x6d\xe8\
+\x29\x8b\x81\xcc\x26\x13\xed\x26\x83\xbe\xf1\x33\x00\xaf\xc7\xb6\
+\xb7\x3b\x0d\x8b\x38\x21\x7b\xca\xde\xc3\xfd\xa3\x9f\xb6\x80\x03\
+\x75\x4d\xa2\x06\x2a\x87\xa9\x4c\xd7\x60\xba\x49\xe2\xd8\x44\x5a\
+\x1a\x76\xf3\xf5\x5f\x43\x30\xad\x76\xf2\x31\xee\xca\xc5\x27\x0a\
+\x32\x52\x66\x54\xb1\xc5\xd4\x22\x15\x5c\x49\xef\x64\xbd\x61\x58\
+\x54\x48\x4e\x00\xdc\x21\x38\xb2\xe0\x62\x04\x1b\x4c\xbb\x3b\xcb\
+\xe4\x32\xa2\x78\xa3\x6a\xe2\x2a\x39\x18\x4f\x85\x67\x95\xde\x5e\
+\x8d\x0e\x70\x3a\x95\x01\x99\x79\x61\x50\xfa\x76\xa3\x42\x86\x2b\
+\xf4\x03\xf0\xaa\x83\x80\xfa\xe7\x90\xb4\x3f\xf5\xc9\x1e\x27\x5a\
+\x0e\x46\x21\x21\x49\x4c\xe4\x71\x97\x09\x51\x1c\x14\x41\x90\x34\
+\x35\x28\x81\x4d\x93\xe4\xe4\x03\x10\x74\x93\x21\x84\x82\xdd\x82\
+\x10\x17\xad\x07\xec\x67\xd0\xa5\xf4\x02\xc0\x07\x66\xe7\x21\x5e\
+\xdf\xc8\x80\x24\xe6\xba\x70\xd5\x47\xab\xb6\x6d\xee\x8b\xa7\xb0\
+\xc5\x17\x60\xfb\xfd\x87\x18\x96\x1f\x6c\xd6\x6b\x21\xd9\x96\xe9\
+\x53\xc9\x8d\x34\x07\x9f\x1e\x75\xcc\x7f\x37\x79\x3d\x46\x63\x7b\
+\x1d\x64\xb4\x09\xc6\x04\xbb\x7f\xdc\xa8\xee\xc9\x49\xd2\x41\x30\
+\xad\x1c\xb5\x92\x12\x00\x53\x66\x08\x95\x3c\xb3\xb1\x16\x85\x9d\
+\x6f\x69\x71\x7c\x3f\x92\xc8\x89\x04\x40\xeb\xcb\x50\x71\x9d\x12\
+\x38\x52\xa9\xce\x09\xe4\x64\x12\x9f\x63\x05\xc1\x0f\xd8\xe1\x43\
+\x10\xc3\x5b\xd2\x03\xbc\x9a\x6c\x82\xaf\xef\x16\x0f\x0b\x55\xbe\
+\x41\xa7\xc1\xb2\xe0\x64\x15\xdf\x80\x51\x0d\x6e\x52\xe0\xe7\x23\
+\x7b\xb1\x42\xe2\x98\x09\x6c\x2e\xc8\x1c\x2f\x33\xa6\xbe\x02\x1d\
+\x4a\x7b\xe7\x01\x8a\xcc\x69\x00\xc4\x1b\x03\x50\xd2\x51\xd6\xd2\
+\x49\xf7\x2a\x41\x64\x2c\x5f\x84\x6a\x1c\x17\x44\x4a\x3e\xa3\x99\
+\x66\xf0\x24\xcd\x6a\x38\xca\xfe\x08\xa8\xc5\xd0\x64\x64\x70\xe3\
+\x64\xd7\x28\x66\x3c\x92\xd2\xe5\x91\xb5\x69\x14\x89\x64\x2f\xa6\
+\xc4\x66\x96\x37\xf7\x87\x47\x55\x55\x10\x43\xe8\x71\x10\x83\x75\
+\xdd\xdf\x5f\x02\x50\x3a\x55\x71\x9d\x2b\xa3\x29\x46\x47\x24\xb9\
+\x74\x6e\xd1\xdb\xf6\xda\x67\x94\x4b\xfd\xd6\xa8\x5d\xd5\x8a\x09\
+\xc0\x23\x61\x8a\x0a\xa2\xb5\xa7\x4f\x79\x8c\xe2\xdf\xeb\x9e\x00\
+\xd7\x0a\x90\x8d\xa2\x6e\xcb\xb6\xb1\x51\x99\x84\x98\x16\x61\x92\
+\xe3\x1b\x16\xd6\x2a\x23\x09\xc3\xcd\x5b\x46\xf9\x04\x2a\x90\xbe\
+\xef\xf6\xbc\x41\x5a\xca\x96\x32\xf1\x6b\x76\x73\x5a\xbc\xb8\x7a\
+\x1b\x1f\xb0\x22\x24\x07\xac\x0d\x00\x2a\x44\xbc\x65\x43\x97\x64\
+\xe6\x5a\x0f\x8b\x56\x81\xac\xcf\x8f\xbe\x7b\x6a\xc3\x57\x59\xf7\
+\x27\xeb\x61\x63\x6f\x31\x1a\x05\x08\x04\xdf\x8a\x6a\x4f\x2c\x29\
+\xf0\x72\xc0\x47\x05\x01\x40\x3d\xfb\x4e\x17\x19\x5a\x90\x19\x79\
+\xd4\xa4\x71\x12\xc6\xc3\x91\x79\x2b\x80\x52\xbd\x40\x34\x1b\x9e\
+\x4b\xe0\xe2\x5e\x5b\xce\xd0\x09\x36\xcc\x51\x83\x22\x46\x55\xb0\
+\xde\xba\x92\xeb\x91\x12\x2b\xd8\x59\xf1\x72\x7f\x84\x51\x11\xdd\
+\xc9\xcb\x32\x7b\xcf\x73\xa6\x12\x18\x2a\xb5\x51\x60\x8f\xa7\x2a\
+\xa6\x51\x0c\xfe\x4d\x42\x16\x1b\xa3\x2d\xfb\xb5\xeb\x13\xd2\xbe\
+\x45\x49\xc0\x54\x00\x8b\x6b\xde\x0d\x61\xfc\x37\x20\x8c\x8f\x36\
+\x15\x14\xad\xc2\xc3\x70\x6d\x40\x37\x4a\xf6\x44\x7f\x5d\xf2\x93\
+\x36\x1a\x42\xd2\xe4\x2e\xd9\x4d\x24\xdf\x7c\xd4\x93\xdc\xcb\xee\
+\x56\x32\xc0\x29\x89\x65\x28\x42\x51\xe4\xf3\xc4\xec\x5c\x27\xb1\
+\x57\x03\x69\x71\xef\x88\x2f\xe5\xdf\xf9\x36\x9c\x80\xbb\xf4\xfc\
+\xb4\x11\x05\x7e\xb0\xae\xf2\x55\x46\x12\x78\x2c\x63\x83\xcf\x7d\
+\xbe\x2a\xe2\xa4\xbf\xe0\x6d\x10\x2a\x5d\x50\x2c\x6b\x53\x46\x38\
+\x31\xb4\x1e\x1c\xc7\x4c\x54\x81\x49\xd0\x56\x23\x8c\xa3\x25\x99\
+\xb1\x3e\x98\x5a\x94\x00\x80\x30\xfb\x3d\x8a\x50\x3e\x1d\x73\x1c\
+\x05\x8e\x80\xd1\x03\xe6\xc0\x15\x08\x81\x9a\xd6\x78\xd8\x9e\x56\
+\x9b\x15\xff\x37\xab\x96\x03\x4d\xe6\xb4\xeb\x4a\x25\x9a\x46\x31\
+\x41\x31\x89\xc3\xa8\x44\x20\x49\x52\x85\x34\x32\xbc\xaa\x9a\xff\
+\xc4\x28\x10\x11\x6c\xea\x30\x32\xb2\xea\x23\x90\x49\x14\xa3\x54\
+\x26\x39\xd7\x4b\x50\x24\x81\x47\x61\x42\x24\x31\xd5\x80\x50\xa0\
+\x6a\x00\xa6\x14\x19\xd0\x9d\x54\x75\xac\x9b\x47\x95\xfb\xdd\xeb\
+\x92\xa6\xa5\x87\x3a\x08\x9e\x24\x13\xe9\xd1\xdf\xc2\xd2\xbc\x56\
+\x0d\xa1\x8c\x8a\x82\x62\xd3\x1e\xea\x9a\x38\xa1\xc2\x28\xa3\xcb\
+\xd0\x5b\xa6\x61\xa1\x4c\x54\x1c\x26\x74\x1f\x14\x3e\x4d\xbf\x8d\
+\xdb\xa1\xcf\x96\x73\xa2\x6c\x8c\xaa\xea\xee\x85\x23\x23\xd0\x5d\
+\xaf\xad\x41\x2d\xda\x41\x5d\x6b\x12\x9a\x56\x23\x3e\x5a\x56\xe9\
+\x35\x57\x08\x77\xe5\xbc\xa3\x32\x23\x36\xb8\x3a\x79\xf0\xf7\x77\
+\x25\x1d\xde\xe5\xfa\x51\xba\x7c\x69\xc6\xbc\x43\xb4\xc0\x85\x02\
+\x3f\xf1\x5b\xf9\x9f\x63\x44\x22\xc0\xb7\x4d\xc2\x04\x08\x2f\xe6\
+\x58\x69\x2f\x41\x14\x1c\xac\x60\xbf\x09\x49\x1d\x72\xbd\xc7\xc3\
+\x02\x51\x87\x7a\xc4\x68\x6c\xb1\x25\xa2\x19\xb1\x9a\x1f\x9d\xaf\
+\x97\xbe\xaf\x41\xde\xd8\xa3\x92\x1c\x60\x03\x1c\xf0\x73\xaa\x58\
+\xe7\xa1\x45\x15\x62\xe5\x14\xf3\xce\xba\xf9\x1d\x7d\xbf\x18\xcd\
+\xe1\xad\x83\xa3\x52\x41\x5c\xa3\x3c\x37\x32\xcf\x87\x02\xc1\xa9\
+\x61\x24\x7d\x49\x37\x6e\x2a\x1a\x57\x0d\x29\x4d\x08\x43\x5b\x2a\
+\x9d\x13\x9f\x1a\xd9\x2c\xb2\x0b\x22\x8f\x54\xe4\xab\x29\xd8\x67\
+\x51\x22\x37\x8c\xe2\x18\x63\xc3\x5c\x21\x9b\x01\x3b\x5e\x82\xd2\
+\x3a\x18\x23\xb3\xa1\x72\xcb\x51\xc9\x35\x54\x08\x98\x5c\xb2\x37\
+\xf2\x7c\x80\xa8\x6d\x50\xc6\x33\x62\x86\x34\xb7\x14\x19\x8a\xc6\
+\x29\xcd\x06\xfe\x81\x51\x03\x79\xd2\x6e\xb8\x67\x9c\x09\xb2\x46\
+\x20\x22\x55\x6b\xe3\x9a\xdb\x5a\x22\xa5\xc9\x9e\x21\xa6\x38\xa1\
+\x8d\x61\xd0\xc8\xf2\xe3\x82\xba\x61\xde\x4a\x5e\x2d\x21\xb5\x6e\
+\x99\x8e\x69\x8b\x5a\xca\xe3\xbc\x75\xca\xe0\x1a\xe4\xa0\x62\x53\
+\x07\x3a\x02\x30\x64\xc6\x96\xba\x54\x3b\xc0\x90\x79\xe3\xbc\x7d\
+\x62\x61\xff\xaa\x78\xb1\xca\x8c\xff\x05\x9a\xcb\x55\x44\x47\x21\
+\x01\x90\x10\x00\x2a\x1c\x14\x7b\x20\x4c\x49\x58\xb7\x56\xf5\xc4\
+\x19\x0c\x4f\x10\x92\x50\xe1\xb4\xe4\xf3\x80\xfe\x7c\xc4\x69\x18\
+\x15\x04\x00\xe4\xc0\x81\xbe\x5f\x75\x09\x8a\xeb\x7c\x3a\xee\x53\
+\xf7\x10\x1c\xa7\xf0\xcc\xfc\x29\x90\x57\x44\x36\xd7\x44\x95\x17\
+\xe5\x0f\x68\x49\x58\x7e\x8d\xe8\xa2\x54\x5a\x02\x90\x42\x04\x58\
+\xa0\x44\xca\x81\x49\x36\x78\x9f\x9e\x5d\xe7\x4a\x82\xf4\x7b\x4c\
+\x69\x97\xbf\xbe\xcc\x5e\x5b\xbe\x97\xb2\x77\x04\x17\x8d\xf2\x93\
+\x32\xc4\xc7\x21\x4e\xca\xc8\xbc\x38\x42\xa0\x6a\x16\x60\x97\x84\
+\x75\x5d\x1f\x6b\xbb\xa9\xbc\x72\xb7\xb1\xd3\x99\x87\x76\x41\x34\
+\x82\x8a\x75\x3f\x34\x73\x16\xb8\x69\xb1\x91\x26\x37\xa6\xcf\x22\
+\x2e\x4d\xdc\x20\xed\x78\x2c\x12\x55\x3c\x7b\x1e\x7d\x37\xd9\x64\
+\x8c\x7a\x08\x48\xb2\xc9\x26\xb9\xaf\x52\xfa\x1d\x59\x14\xf8\x60\
+\x32\xf6\xb4\x46\x51\x4a\xdc\x4b\x9c\x83\x28\x91\xd4\xee\x8d\x58\
+\xb8\x26\xf4\x18\x4a\x83\xff\xed\xc6\x50\xed\x2e\x14\x44\x9e\x48\
+\x31\xf9\x16\x40\x93\x18\xd7\xf0\xd6\xa1\x49\x26\xb4\x41\x55\x5f\
+\x69\xf6\x95\xae\x78\xf2\xea\x79\x46\x80\xfc\x8d\xd8\xeb\x49\x09\
+\xd6\x94\x41\xa6\x71\x6f\xbc\x12\x48\x55\x25\x87\xb8\xae\xa8\x88\
+\xb8\x02\x2e\x10\x75\xa3\x47\x00\x16\xb2\x5c\x8c\x1c\xc4\x1b\xdf\
+\x24\x58\xe8\xa0\x6c\xc0\x58\xb7\x9d\x1e\xfe\x63\x80\xad\xb1\x03\
+\xe0\x39\xf8\xfb\x31\x40\xf7\x67\x20\xc0\x80\x96\xc9\x32\xcb\x70\
+\xf1\xf6\x03\x1b\xa2\x35\x48\xde\x77\xd0\x4c\x93\xb8\xc8\x0f\x6f\
+\x13\x8d\x49\x3f\x0a\xbe\x8e\x6b\x14\xe0\x45\x32\x9b\xa0\xd3\x2d\
+\x41\xe1\xa9\x39\x6c\xb9\xea\x1e\xe9\x78\x66\x6e\x2d\x0f\x10\x60\
+\x7d\x7c\x1f\x3a\xde\x46\xc2\x49\xd9\x44\xf6\x53\x1d\xcd\xee\x8f\
+\xec\x1e\xec\x09\xac\xf1\xba\x68\xd6\x35\x2f\x09\xe5\xd0\x40\xc8\
+\xce\x04\x04\xaf\xfb\x19\xef\x2b\x27\x2d\x02\x92\xa8\x4f\x4b\xa5\
+\xdb\x38\x92\x45\xf3\x94\x75\xd8\x2b\x3f\xf4\x21\x49\xba\xcd\x8d\
+\x99\x6e\x3d\xb3\xc2\x3d\x50\xec\xcd\x07\x48\x88\xe3\x58\x81\x50\
+\x4c\x67\xe2\x77\x09\x35\x0d\x94\xd8\xdc\x14\x91\x59\x65\xe2\xdf\
+\x56\x97\xce\xb6\x2f\x45\x2a\xef\x93\x10\x28\xad\xcb\x58\xa4\xe9\
+\x4e\xeb\xbb\x66\xb3\x8a\xb3\xce\x78\x6f\x23\x48\xab\xc5\xde\xdc\
+\xbd\x65\x59\xfc\x16\x86\x2d\x90\x4d\xc4\x03\x11\xad\x76\x51\x85\
+\xc0\xd9\xab\x0c\x9a\x5a\x74\x9a\x25\x85\x3c\x21\xd0\x13\xe5\x41\
+\x26\x7a\x33\x1c\xd9\x7b\x60\xe1\x06\xcc\xe6\x9e\x8a\x83\x56\xba\
+\x2d\x20\xf9\x40\x1b\x21\xd9\x89\xb5\xbe\xe5\x5e\xf7\xa8\x68\x91\
+\x23\x5d\x7f\x44\xd0\x6c\xd1\xfd\xa5\xac\x75\x83\x82\xbf\x66\x54\
+\x64\x62\x73\xa6\xd4\x18\x21\xd2\xe7\xbf\xc6\xbf\xbc\x8c\x18\x38\
+\x0a\x32\xb5\xeb\x7d\x1b\x46\x82\x66\x54\xbe\x3a\x8b\x0f\xbf\xed\
+\xd7\x3a\x51\xb8\xf4\x80\x0e\xcb\x03\xff\x2e\x61\x2d\x47\x95\x57\
+\x87\x50\x9c\x4e\xd0\x81\x60\x3a\x0d\x9e\x74\xe8\x26\x26\x86\x18\
+\xed\x6b\x06\x99\x70\xa4\x07\x33\xdc\x77\x95\xc7\x6c\xcb\x4d\x66\
+\xd8\x67\x33\xbd\x8a\x14\xfa\x43\x24\xcb\x8b\xb5\x14\x26\x55\x89\
+\x73\xef\x78\x61\xd5\x07\x7d\x92\xfa\x70\x5f\x42\x45\x10\xa9\x7e\
+\x72\x4d\x7d\x29\x49\x4d\xe9\x8f\x60\x54\x32\x4c\xa4\xdc\x9f\x37\
+\x83\x4e\x1c\xd5\xd4\x4b\xa1\x38\x09\x8a\x89\xa4\x3c\x29\x9b\x92\
+\x89\x10\xb7\x99\x6e\x23\xf9\xea\x58\xc8\x2e\x24\x3c\x46\x20\x06\
+\x83\x58\x8d\xdf\x92\x20\x18\xde\x2b\x35\xd1\x46\xcf\xba\x3b\x8d\
+\x1d\x9a\xec\xad\x74\x46\x70\x1e\xd3\x33\xeb\x56\x92\x9d\x2c\xd4\
+\x33\x0f\x37\x1a\x48\xe5\xa2\x05\xd2\x7a\xa0\x24\x39\x4e\x4e\xb9\
+\x24\x00\xa2\x44\x2e\xf2\x80\xc7\x0c\xf9\x61\x64\x3a\xfc\x20\x04\
+\x2b\xec\xfd\xbc\xba\x3c\xad\x87\x7a\xde\xe2\xb5\xc4\xff\x99\xf7\
+\xb5\x42\x32\x75\x16\xd1\x59\x5e\x96\x1d\x00\x26\x33\xda\x67\x12\
+\xfc\x80\x31\x62\xc1\xb7\x07\x46\xfe\xeb\x10\x1f\xc4\x99\x12\x29\
+\xed\x15\x8e\xcc\xe4\x99\xfb\xd7\x1c\xc6\x86\x54\xd8\xde\x38\x4a\
+\x44\x3e\x20\x92\xf7\x8d\x21\x48\xaa\x6f\x50\xb1\xd6\x89\xac\x78\
+\x99\x0b\x32\x48\x43\xe2\x82\x12\x4c\x7e\xe4\xeb\xfc\x1c\x2f\x81\
+\xc3\x5f\x3b\x78\xc2\x20\x25\xf6\x01\x0a\x38\x41\x73\xa1\xea\x8e\
+\xea\x33\x6d\x70\x6b\x60\x40\x09\x00\x39\xf8\x25\x7d\x76\x88\x88\
+\x53\x29\xed\x0d\x6c\xa5\x9a\x7b\x86\x2d\xda\x33\x75\xa4\x0b\x11\
+\x27\x20\xba\xfc\xaa\x80\x4c\x16\xd9\x91\x4f\x9b\xa4\x62\x9d\xee\
+\x07\xd7\xff\x28\x1f\x15\x9e\x44\xe4\x20\x0f\x8f\xcb\x96\xc0\xe1\
+\x7c\x3a\x0a\x67\xda\xd6\xb6\x29\x90\x60\xf5\x60\x28\xd4\x27\x61\
+\xeb\x01\xaf\x11\x3f\x2a\x7b\x7a\x55\x85\xe8\x67\xd9\xf4\x8e\x2e\
+\x32\xd5\xf4\x56\x2c\x8a\xda\x83\x25\x7b\xac\x04\x09\xaa\x0e\xa8\
+\xa5\x9d\xfb\xf9\x3e\x45\xb8\x84\xf8\xd9\xdd\x70\xce\x9f\x16\x06\
+\xdc\x06\x3c\x31\x05\x80\x05\x2b\x4a\x2a\xff\x46\x90\xee\x4d\xc1\
+\x5d\xb4\x72\xb8\xc6\x70\x02\x89\xca\x0c\x23\x51\x0e\x8c\x95\xe2\
+\x02\x4c\xcd\xd9\xf2\x8d\xd8\x17\xd7\xfb\xfd\x0e\x7d\xa8\xfa\x63\
+\x41\xb0\x5a\x14\x99\xaa\x21\xb6\xa5\x4d\x72\x01\x36\x2a\x45\xf9\
+\xfb\x7d\x00\x81\x69\x5c\xa2\xcf\x9f\x0a\xc2\xe1\x00\xa9\x90\xad\
+\x64\x8d\xb5\xfc\x9d\x01\x91\x53\x8d\xe3\xfc\x09\x4f\x1e\xe4\x48\
+\x09\xaf\xb4\x83\xe5\x31\x45\x0d\xf6\x8e\xc4\xa1\xd7\xc1\x22\x46\
+\xbb\x11\x54\x0f\x05\x31\x9e\xc1\x52\x77\x48\x74\x5f\x1e\x90\x83\
+\x36\x4e\x00\x72\xb0\xa2\x2c\x80\x35\x46\x50\xf9\xc5\x3b\x42\x4b\
+\xda\xba\x78\xbc\xb3\xc2\x2d\x18\x4f\x60\xd5\x9f\x7f\x13\x3d\x1f\
+\xb3\x12\x10\x0d\x52\x59\xd4\x24\xbc\xf3\xaf\x6a\xd3\x1e\x67\x15\
+\xbb\xd6\xba\x49\xea\xcb\x43\xec\x64\xca\xc9\x75\x8a\x0d\x79\xdc\
+\x43\x4f\x8d\xf7\xc9\x41\x4e\xe6\x9f\x40\x52\xb0\x4b\xd3\x22\xd9\
+\x56\xf9\x8f\x8a\x63\x2a\x20\x62\x6f\x9e\x3b\xa5\xa3\x83\xf2\x18\
+\x67\x2a\x31\x52\x51\x9d\x83\x25\xc8\x42\xce\xef\x40\x16\x24\xdb\
+\x0a\x7d\x53\x56\xff\xe2\xad\x61\x36\xb4\xa3\xf5\x56\x5c\xa9\x88\
+\x54\x64\x32\x14\x7d\x3f\x9b\x1c\x15\xbf\x85\x60\x50\x6e\x5d\xdd\
+\x6d\x37\x58\x11\x3c\xd7\x53\x99\x91\xff\xf9\x69\x07\x0b\x97\x7b\
+\xd8\x1f\xd9\x21\x1c\x93\xab\x02\x02\xa0\x04\x6a\x2f\xcb\x8a\x2a\
+\xc3\x61\x14\x8d\x73\xc2\x2c\xe7\x7a\xb0\x0e\x47\x45\x5e\x15\x02\
+\xec\xb2\x56\x74\xf5\xa0\x57\x2d\xfa\x3d\x9e\xf2\xe8\x4b\x96\x1d\
+\x6e\x12\x63\x7f\x31\x3f\x21\x96\x2a\x45\x87\x2d\xf6\x95\x3e\x40\
+\xa2\x65\x12\xee\x4f\xe5\x78\x00\x62\x02\x40\xd9\xc2\xe9\x59\xf5\
+\x6b\xe1\x47\x23\x24\x1b\x90\x44\x58\xbc\xf2\x5d\x67\x10\xf1\x71\
+\x9c\xdb\x6e\x24\x3e\x14\x32\x1c\x6d\x0a\x0f\x16\x43\xaf\x6f\x40\
+\xef\x8d\x34\x1d\x2a\x87\xa8\x0c\x61\x8c\x70\x09\xec\xa1\xe5\x52\
+\xbb\x24\x97\xf4\xfc\x0b\x0d\x9a\x3c\x07\x00\x88\xdf\x44\xca\xa1\
+\x4d\x96\x66\xa6\x63\x65\x8b\x95\xa9\x56\x10\x4c\x71\xc5\x89\x15\
+\xd3\x06\xa3\xb8\x58\xe6\xa6\x38\xac\xe8\x5f\xc2\x5b\x9a\xba\x76\
+\x3f\x24\xc5\x7b\xb6\xf2\x17\x28\x69\x17\x49\x5e\x27\x93\x90\xad\
+\x16\xc6\xda\x7e\x04\xd5\x58\xa8\x1c\xed\x05\xd9\x1c\x2d\x99\x00\
+\xd8\xe4\x28\xe7\xd2\x7a\x4d\xa3\x25\xe4\x3c\x1a\xdc\x39\x6f\x54\
+\x34\x40\x1c\xb3\x1b\x6c\x36\x29\xaf\xfb\x52\xc5\x5a\xea\x4b\xd2\
+\x22\x9f\x9b\x34\x02\x49\xdb\x27\xb5\x22\x0e\xe5\x91\x37\x62\x1b\
+\x5f\xee\xa6\x98\xb3\x96\x2f\xf9\xf7\x77\x74\xe1\xad\x9b\xf6\x00\
+\x49\x0b\x43\x51\xa1\x6f\x67\x2f\x08\xc3\x27\x6d\x92\x69\x2a\x1f\
+\x6a\x55\xe4\x3a\x37\x32\xa3\x0b\x67\x2b\x0c\xc2\x7b\x42\x68\x07\
+\x28\x86\x40\xf2\x1c\xbd\x0e\x51\x35\x83\x65\x73\xa8\x56\x50\x94\
+\x9b\x44\x4f\xed\x26\xa1\x06\x48\x5c\xea\x8a\x34\x13\x94\x11\xc6\
+\x62\x37\x37\x20\xfd\x7b\xb9\x65\x62\xd8\x18\xa1\x70\x9f\xa2\x04\
+\x40\x42\x35\x00\x55\x31\x40\x21\x32\xa2\x88\x36\x6d\x5e\x67\x95\
+\x52\x3d\x96\x11\x52\xd1\x88\x9a\x20\x59\xaa\xb7\xbe\x78\xcb\x66\
+\x42\xc2\x49\x13\x6d\x5b\x1d\x4e\xef\x7b\x08\x89\xe5\x03\x94\xb8\
+\xca\x2d\x15\x36\x25\x72\x70\xe8\xd6\x91\x28\x2e\x52\x74\x4b\x4f\
+\x06\x38\xbb\x5e\xdd\x9f\x85\x73\xf1\x25\x3a\x1d\xdb\xab\x95\xed\
+\x33\xd0\x31\x49\x0f\xd4\x29\x8d\x4a\x4a\x76\x30\x01\xb7\x10\x05\
+\xe1\xc9\x26\xf5\x04\x91\x5c\x52\x4b\xfd\xe5\x53\xf7\x49\xd3\xbd\
+\xb0\x04\x01\x50\xc9\x7b\x84\xab\x95\x17\x2a\xd2\xa4\xb0\xdb\x83\
+\x25\xed\x3e\x1a\x64\xad\x60\x10\x05\x8a\x47\xbd\x51\xce\x13\xcd\
+\x6c\x6b\xe1\x74\x61\x61\x29\xd9\xa8\xcb\x96\x55\xca\x57\x73\x1c\
+\xb4\x24\x3a\x2d\x35\x7c\x1f\xc6\x55\xd4\x4e\x5e\x2e\x80\xee\x34\
+\x65\x31\xae\x19\xbd\xc5\x28\x62\xf7\xab\x4f\x6d\xaa\x40\xcc\x8a\
+\xa5\x69\x03\xdc\x5f\x0f\x47\x22\x6d\x4b\x13\x01\x23\x24\x15\x68\
+\x1c\x2a\x7a\x70\xc0\xe6\x9f\x47\x11\x26\xcb\xf7\x7c\x24\xd2\x8e\
+\x36\x67\x1a\x93\xfd\xe2\x03\x00\x96\x8c\xfb\xa0\x1f\xb6\x32\xa3\
+\x9f\x7e\x66\xab\x8c\x11\xa5\x0f\x1b\xab\x90\x73\x04\xdd\xf9\xe1\
+\xa8\x54\x26\x50\xd0\xf7\x03\xda\xc7\xca\xb0\xe6\x53\xec\xe4\x0b\
+\x71\xcf\xa3\x56\x50\xc0\x45\xc1\x63\x44\x53\x86\xe8\xc7\x85\x47\
+\xb8\x50\x54\x9c\x5c\x70\xe9\xe5\x66\xa0\xa3\x8a\x2a\x6f\x03\xa1\
+\x60\x98\xe5\x4c\x9f\x37\xc4\x9c\x19\x45\xf0\x29\x24\x76\x26\x0b\
+\xe5\x96\xee\xf9\x52\x23\x9a\xed\x15\x4d\x1e\x0a\xde\xaa\xdf\xce\
+\xc9\xcf\xb5\x64\x1f\x3d\xc8\x81\x54\x85\xbc\x19\x09\x2b\xb4\x04\
+\xed\x5c\x4c\x60\xe3\x3f\x8b\xd6\xae\xfc\xb3\xf1\xc8\xaf\xea\xe3\
+\xc2\xbc\x02\x38\x07\xa4\xc8\xee\x56\xf5\xc3\x00\x61\xd2\x27\x26\
+\xa8\xc5\xf7\x7a\x54\x26\x82\x4c\x56\xad\xd5\xef\x3d\x62\x81\x0c\
+\x82\xbb\x68\xbe\xe8\xd9\x9b\xfc\xca\xf2\xc8\x58\x68\xc9\x44\xf7\
+\x28\x9c\xd3\x66\x73\x52\xb8\x7d\xfc\x2f\x89\x00\x80\x30\x56\x07\
+\x0c\x4a\xbe\xbd\x26\xf7\x76\x66\xb7\x24\x79\xca\x44\x5b\x06\x5a\
+\xb1\xd3\xec\xdf\x90\xfe\xae\xf4\x1e\x4d\xaf\x19\x1b\x49\x64\xba\
+\xa3\x70\x7f\x38\xf4\x97\x57\xa5\x8b\x16\x41\x34\xf3\x2f\x31\xce\
+\xa1\x60\x9a\x02\x13\x20\x47\x75\x66\x57\x9e\x23\xe6\x87\x99\xcc\
+\xd4\x25\xfd\x72\xff\x7c\xd0\xc8\x9d\xda\x2e\x11\xc8\x4c\x22\x41\
+\x0f\x4b\xd4\x8e\xbb\x12\x50\x7e\x88\x16\xab\x53\x0e\x26\x23\x1b\
+\xca\x0d\x53\xc0\x8f\xd5\xd1\xf5\xc6\xf9\x02\x8e\xc4\xca\x6d\x8f\
+\xf1\x6c\x3d\x9e\x60\x49\xc1\xf7\x6c\xf4\x95\x54\x54\xd2\x9a\x1b\
+\xa3\x67\x97\x92\xf6\xdd\x9a\x00\x64\xa1\xe2\xbe\x44\x08\xcb\x28\
+\x08\x9c\xe6\x77\x71\x6d\xcf\x14\x44\x46\x76\x08\x72\x80\x1c\x2b\
+\x4b\x93\x1f\xfd\xbb\x35\xc5\xa8\x05\xba\x4f\x9e\x17\x92\x42\x00\
+\xb4\x49\x0e\x23\x4e\x04\xf8\xcf\xe9\x9c\x92\x69\xde\xbb\x44\x37\
+\xc1\x9a\x84\x33\xcf\x10\xc5\x43\x5a\xbc\x81\x32\x89\x53\x20\xba\
+\x96\x40\x48\x72\xea\xb3\x5b\x7b\xe7\x5b\x92\xdb\xf3\xfa\x28\xf1\
+\x3b\x89\x5c\x4f\xef\xc1\x36\x7a\x93\x1b\xa0\xde\xe3\xcb\xc1\xa6\
+\x66\xbe\x0f\xb3\x0e\x9a\x61\x4f\x2c\xa0\xe1\x6c\x1a\x56\x45\x3c\
+\x0e\x3d\x42\xf4\x5a\xc4\x48\x40\x14\xce\x89\x61\x33\xa3\x24\x01\
+\x1c\xce\x1e\x85\x00\xc9\xdd\xd6\xc6\xbc\x25\x6b\xa7\x40\x50\x7d\
+\x18\x11\x6b\x89\xb2\x62\xa9\x4e\x3a\x1d\xa5\xf2\x01\x29\x9b\xdd\
+\x4a\x0b\x14\x04\xe3\x20\xe9\xc0\x04\x56\x05\x8c\xe9\xe9\x02\xd1\
+\x0d\x52\x17\x59\x2a\xd3\x7d\xb7\xa2\xa2\x9c\xe3\x34\x6c\x1d\xd5\
+\x23\xc4\xb4\x01\x64\x0b\xe8\xde\x8a\x93\x27\xb4\xd2\x07\x92\x28\
+\x05\xa6\x34\x3e\xb8\x46\x36\xc2\x1a\x6b\x12\xe8\xca\x6f\x96\xb5\
+\x6a\xe2\x89\x0f\x9a\xc4\x9a\x9b\x23\x7a\x55\x26\x09\xd8\x3f\x1f\
+\x3d\x2a\x48\x5a\x69\xf5\x6f\xb3\x53\x4d\x98\xb8\x47\x7a\xc9\x07\
+\xb9\xcf\x5d\x8c\x80\x60\xcb\xd6\x3d\x26\x63\x3d\x92\x00\xcf\xce\
+\x8e\x5b\x64\xcf\x9e\xb6\x31\xaf\xa5\x09\x89\x3e\xdf\xa2\xa1\xd3\
+\x1b\x31\xaf\x23\x6e\xe9\x6d\xf1\xa6\x80\x8c\x6b\xa8\xa6\x8e\x08\
+\xe8\x7a\xb8\x4b\xab\x49\xba\xda\xa6\x14\xff\x62\x55\xdc\x3c\x67\
+\x20\x46\x1e\x4c\xb6\xe8\xbb\x45\xd0\x2f\x7b\x2f\xab\xb5\x00\x8c\
+\x6a\xcd\xbb\xcf\x9a\xd3\x6c\xe6\x03\x94\x8d\xe8\x58\x32\x62\x44\
+\x7b\x4e\x38\x08\x8d\x34\x18\x45\x1b\x08\xbb\x48\x8d\x62\x7f\x37\
+\xd6\xb3\xe6\xd6\xb6\x63\xc2\x4c\x07\x13\xe9\x8e\x0a\x41\x4b\xee\
+\xcf\x54\x7d\x8a\xd4\x87\xe0\xc0\x21\xdf\xaf\xa2\x90\x20\xdd\xe0\
+\xc9\x2c\xb7\xb0\x5a\xd1\x46\x9b\x2a\xb1\x42\x61\xc1\x27\x27\x77\
+\xca\x04\xa9\xca\x3d\x27\x90\x7a\x62\x97\x60\x8c\x97\x1a\x85\x38\
+\xa5\xbf\xde\xa8\xce\x7b\xe1\x7a\x63\x19\xe9\x6a\x85\xf7\x97\x5f\
+\x4b\x0c\xab\x04\xfe\x4a\x84\xd6\x98\xc4\x77\x0f\x9a\xfd\xf1\xfa\
+\xb2\x1b\xa5\x60\xcd\x0d\xf6\xb0\x60\xff\xbb\x7e\xe6\x83\xa1\x84\
+\xe8\x96\x1e\x8b\x6b\x10\x31\x6b\x8f\xa9\x59\x8d\xef\x2b\x57\xb8\
+\x8c\x2c\x71\x21\x7b\x46\x15\x39\xff\xf9\xbd\xa5\x5b\xa0\x63\x45\
+\x55\x77\x8d\xd5\x66\x51\x19\x90\xfb\xdf\x83\x4c\x4a\x8c\xc6\x99\
+\x13\xa4\x59\x8d\xf3\x12\xef\xf7\xa3\xa0\x67\x0f\xc2\x04\xd6\xd6\
+\x51\x37\x53\x3e\xe6\x98\x48\x00\x2b\x41\x00\x0f\x73\x22\x1a\x69\
+\xc2\xa4\x48\xce\x1e\x90\x94\xf8\x9e\x96\x95\x6c\xfa\x53\x69\x67\
+\xf0\xce\x89\x82\xbb\x52\xe8\x40\x36\x29\x99\x6e\xac\x26\xb5\xd5\
+\x50\xc8\x28\xec\x4a\x88\xf4\xd6\x6b\xd1\x06\x77\x5c\x09\x24\x23\
+\xeb\x9d\x81\x90\xa5\x01\x93\x0a\x1e\x99\x5a\x9a\x42\x5e\xe9\x8e\
+\x09\x8b\x5a\x01\xf2\xee\x78\xb5\xab\x8d\xad\x01\xb1\x6a\x8d\x19\
+\xa0\x98\x08\x62\xbd\x72\x60\x93\xeb\x75\xb9\xde\x55\x94\x00\x00\
+\x51\x77\x8c\xab\x09\xd4\x8f\xf6\x32\xc8\xc2\x2c\xba\x7b\x0e\x03\
+\x88\xca\x61\xb5\x3b\x98\x3a\x53\x68\x00\x65\x64\x65\xba\x02\x33\
+\x8e\x32\xa7\xb0\x29\x68\x0b\x1c\xe2\xbe\x3f\x4d\x00\x64\x19\xde\
+\x6d\x82\x38\x80\x50\x01\x1b\x4c\x6c\x7a\x53\x98\xfc\x8c\xa4\x95\
+\x10\xb5\xa9\x70\x6f\xfb\x46\xed\xb9\xb2\xb1\x28\x84\xe8\x11\xc9\
+\x71\x09\x9e\x06\x55\x95\x2d\xad\xc2\x68\x37\x06\x46\x13\x91\xb7\
+\x22\x22\xe0\xe1\xf6\x62\x38\xf9\x35\x88\x66\xd7\x2f\xb2\xdf\x6e\
+\x4f\x6e\xaf\x8e\x37\xad\x7b\xb4\xef\x9b\x84\x80\x50\xdc\x32\xe2\
+\x95\x6e\x4a\x69\xf4\x56\xea\x77\x50\x9c\xd0\x17\x27\x17\xb8\x98\
+\xe9\xe2\xa4\x40\x0e\xbc\xa0\xb4\x07\x01\x49\x89\xf3\xe7\x65\x13\
+\xdf\x3f\x65\xa7\x0d\x3e\x01\x88\x0a\xc5\xde\xee\x72\x5c\xbc\x2b\
+\xed\x21\xc4\x55\x36\x5c\x11\xd4\xb9\xc5\xa5\x51\x47\x4a\x9c\xc0\
+\x4d\x8e\xf0\x25\x5b\x42\x1a\x02\xfd\x37\x11\xa3\xdd\x25\x00\x20\
+\xe8\x9d\xf3\x3e\x35\x24\xc7\x6d\xa2\x00\xef\x18\x98\x6b\x02\x50\
+\x75\xc7\xa2\xbe\x56\x83\x54\xc4\x24\x77\xb1\x36\xea\x15\x5b\x12\
+\x30\xb6\x2c\xfe\x46\x7a\xf6\xd8\xc1\xab\x37\x62\x42\xa4\x27\x7a\
+\xeb\xfd\x3b\x4c\x48\x43\x9f\xde\xb7\x4b\xc5\xd6\x5b\xc5\x49\x2d\
+\xc8\x1e\xe7\xd0\x07\x99\x84\x65\x82\xf0\x88\x87\x70\x63\x66\x77\
+\xbe\xe7\x0f\xc1\x1d\xaf\xc7\x53\x24\x52\xd0\xc8\x99\x4b\x8d\xde\
+\x17\xa3\x95\x84\x52\x88\xa0\xcc\x84\x44\x4a\xb6\xcc\x1d\x23\xfe\
+\xcb\x80\xa4\x73\x07\xa4\xf5\x8f\x13\x8a\x55\xa1\xae\x16\xc5\x6d\
+\x32\x44\xc0\xf3\xda\xe8\xf8\xbd\xb2\xe2\xd8\x1b\x2d\x12\x56\x0f\
+\x8b\xc3\x44\x44\x7f\xf0\x18\x94\xec\x50\xa7\xb5\x9b\xec\xbc\x87\
+\xfc\x47\xfb\xd3\x41\xa3\xde\xa9\x97\xb6\x9a\x5c\xf3\x21\x7c\x17\
+\xfc\xcc\x28\x99\x6b\x1b\x01\xb2\x58\xd5\xd2\xa3\x97\x7b\xc8\x95\
+\xa0\xea\x11\xd4\xa9\xd1\x6d\x41\x12\x5e\xf3\x6f\x58\xd6\x0c\xe7\
+\xb3\x58\xa6\xa5\x02\xc8\x7c\xcc\x5e\x25\x85\x8b\x8d\xb6\xb6\x88\
+\x35\x49\x53\x28\x98\xa0\xd9\x60\x21\x29\xde\x7a\xec\x34\xa6\x7d\
+\x30\x9a\xab\x0e\x12\xa7\xc7\x46\x84\x3f\xda\x9e\x81\x9d\x09\x11\
+\x1f\xc1\xd5\x5b\x1d\x85\x09\x80\x9d\x6f\xc5\xb0\x15\xe1\x99\x5e\
+\x93\xfe\x94\x60\x4f\x48\xb3\xbc\xf1\x38\x0a\x23\xc7\xd5\x44\x45\
+\x10\x54\x05\x38\x37\xab\x5e\x0d\x23\x22\x4f\x1d\x75\xf1\x91\xe1\
+\x28\xd8\xe8\x26\x6c\x65\x3b\x50\x47\xb7\xc2\xfd\x89\x1f\x76\x35\
+\x8c\xca\xec\x35\x1a\x23\x74\x70\x73\x09\x29\x09\xb3\x51\xc5\xca\
+\xde\x24\x84\x97\xe2\xfe\x3e\x17\x17\x89\x95\x0a\x57\x34\xa4\x53\
+\xfa\xad\x07\xae\xfa\x96\x9a\x2b\xdf\xd6\x82\xf2\x9b\xfd\x10\x07\
+\x90\x54\xe0\x20\xed\xaf\x1e\xeb\x48\x80\x87\x60\x65\x5b\x69\x77\
+\x7f\x05\xc3\xa1\xe1\x48\xdc\x14\xf3\x8a\x74\xd7\x10\x64\x79\xfb\
+\x23\x98\x37\x45\x53\x15\xee\x75\xb0\x45\x3c\x12\x31\xa1\x77\xf7\
+\xee\x60\x89\x39\x94\x44\x9c\x4d\x16\x04\xbd\x59\xd7\x83\xf0\x1d\
+\x86\xb8\x6d\xa1\x9a\x31\xad\xae\x94\x6d\xcf\x2d\x68\x6d\x42\x4b\
+\x63\x7d\x0f\x26\xa6\xd5\x32\x43\xb3\x0a\xf3\x01\x92\x08\x88\x49\
+\xba\x7f\x8a\x7a\x01\x8a\x63\x68\x5c\xe1\x8e\x8a\xaa\x9b\x26\x03\
+\x9b\x1e\xa1\x74\xeb\xb0\x72\x50\xff\xc1\x12\x3d\x05\x1e\xa4\xd3\
+\x2d\x61\x3e\xa5\x91\xb2\x85\xbe\x85\xa5\xed\xc8\x88\xc3\x19\x5f\
+\x83\x42\x12\xa0\x3a\x06\x98\x89\x7d\x95\x17\x19\xe2\xe7\x50\xda\
+\x3c\x89\x4e\x44\x94\x06\xff\x10\x3b\x1e\xf4\x8b\xb6\xce\x83\xf3\
+\x0b\xa3\xc2\xd7\x20\x00\xf7\xf1\x0a\xae\x5e\xbc\xe7\x66\x89\x4a\
+\x53\x74\x58\x28\xa2\x0b\x6d\xaf\x8f\x0d\xd2\x2c\x9c\x8f\xef\x29\
+\x06\x2f\xa2\xb8\xcf\xa8\xf4\xab\x46\x65\x0e\x1e\x13\x00\x47\xd6\
+\xf7\x67\x2d\x81\x87\xc0\xda\x11\x46\x1c\xf9\x69\x7a\xce\x22\x97\
+\x48\x85\x90\x45\x6f\x1a\xb2\xe9\x4b\x4c\x45\x62\x02\x5e\x8a\x48\
+\xc2\x2b\xe0\x86\xcc\xf2\xcb\x5e\xd6\xba\xcf\xbb\xac\x47\xe0\xcc\
+\x52\x38\xeb\x5d\x9d\xe9\x3f\x94\x6f\x7e\xf9\x3b\x51\xed\xfd\x24\
+\xe1\x87\xcb\x08\x0b\xeb\xa9\x54\x16\x37\x77\x80\x95\xbf\x46\xa4\
+\x0b\x30\x26\x20\xd3\xd2\x8a\xd5\x46\xe4\xb8\xf0\x9d\x20\xc0\x8f\
+\x43\x18\x41\x5d\x9e\xcf\x51\x40\xd6\x34\xee\x83\x11\xe6\xb6\xf3\
+\x7c\x85\x1c\x63\x5b\xf2\xd5\x70\x48\x51\x4e\xc9\x4e\xd2\x13\x88\
+\xd1\x19\xc9\xf1\xb1\x84\x43\x81\xb9\x49\x10\xe9\xcb\xc7\x86\x2e\
+\x53\xf2\xbb\xa7\x0a\xb6\xed\x73\xe7\xb6\xd8\x85\xae\xc1\xfc\x89\
+\xa4\x8e\xc3\x38\xdf\x9a\xf1\x5e\xa4\xb2\x3a\x14\xf6\xc6\x25\x9b\
+\x6d\x57\xf9\x77\x19\x71\xb6\x24\x2a\x89\x14\x6a\xef\xc1\x0e\xf9\
+\xc1\x69\x5d\x54\x44\x40\x0e\x84\x44\x4c\xbf\xf6\xbb\xfb\x0d\xfe\
+\x36\x52\x10\x6c\x23\x28\x96\x49\xf5\x16\xa8\x45\x39\xa8\x46\x27\
+\xb1\x00\xab\x4a\x1c\x2b\x15\x32\x16\xb4\x69\x4d\x7c\xd1\xb5\x0a\
+\xdf\xf8\xb5\xea\xf7\x7e\xeb\x9d\xa4\xc7\x5e\x8a\x9c\xf0\x8c\x4e\
+\x83\x97\x65\x6d\x69\x7a\x80\x21\x18\xb0\x83\x44\x62\x23\x5d\x0b\
+\x28\xa3\x7a\x9c\xe5\x2a\xb5\x48\x8e\xd1\x01\x80\x93\x90\xa4\x34\
+\x2c\xdf\x60\x05\x52\xca\x5a\xf0\xd4\x85\x8e\x60\xad\xf2\x96\x57\
+\xb4\x2e\x0f\x63\x7a\x2c\xb5\xb7\xa4\xea\xf6\xa3\x8f\x24\x01\x38\
+\xaa\x01\x21\x07\xb5\xbb\x84\x57\xfb\x39\x2e\x35\x1a\x4d\x7f\x88\
+\xbf\xda\x6d\x2e\x8b\x5c\xf7\x41\xea\x17\xe3\xcf\xef\x02\x8a\x82\
+\x13\xd6\xa6\x87\x22\x87\xd0\x2d\x63\x5b\x69\xee\xd1\x44\x94\x35\
+\xf9\x1c\x3a\xb9\xc7\x87\x3c\x97\x29\xbd\xb7\x62\xa4\x25\xad\x9c\
+\x88\xa0\xfd\x48\x9f\xc4\x10\x94\x49\x9a\x89\xbf\x15\x4a\x9b\x96\
+\xe1\x2d\x84\xe3\x89\x46\xcb\xed\x84\x9c\x6e\x15\x7b\x48\xd1\x99\
+\x43\xb9\x2f\x28\xd2\x14\x15\xab\xd9\x51\x55\x3f\x8e\x98\x6a\xe3\
+\x98\x7b\xb9\x07\x55\x92\x1b\x91\x6f\xb5\x3c\x06\x04\x60\x42\xcc\
+\x5f\x60\xfd\x6c\x85\x39\x59\xc0\x43\xd0\x5d\xb6\x4c\xe4\x18\x58\
+\x0f\x25\xe3\x27\xa6\xc8\xfe\x55\x9e\xeb\x07\x64\xa1\x8a\x13\x80\
+\xd5\x28\xa7\x73\x88\xc0\xc6\x3e\xe5\xc0\xb5\xbe\x21\x83\x52\x98\
+\x0c\x39\xd2\x08\x09\x80\x66\x90\x23\x13\x15\x31\x54\xae\x09\xf8\
+\xe4\x24\x69\x1b\xd1\x70\xc8\x2a\x3d\xac\xd0\xf2\x28\xe2\x9b\xf4\
+\x79\xef\x76\xf2\xbd\xbc\xc1\x8f\x24\xc2\x64\x54\x03\x1b\x3f\xce\
+\xb7\x7a\x32\xa4\x92\xcb\xa6\x77\x52\xd8\x5b\x44\xb1\x4c\x2c\x2f\
+\xda\xa5\xc9\x80\x91\x2c\x75\x6f\x65\x1e\x86\xb7\xeb\x2e\x50\x56\
+\xec\xe4\xca\x82\xea\xed\x87\xe7\xd5\xf6\x36\xb4\x45\x90\x20\x54\
+\x20\x27\x1a\xc4\xeb\xd9\x96\x08\x6c\xd1\x1b\xd0\x7b\xcd\x7b\x5a\
+\x2c\x36\x31\x3a\xb6\x26\xfa\x1d\x24\xc7\xd8\x62\x88\xd9\x10\xf9\
+\xe2\x74\xe5\xbc\x47\x13\x9f\x71\x7c\x76\x58\xea\x96\xbc\x5a\xc4\
+\x82\xaf\x06\xf3\x58\x83\x7c\xa9\x70\x91\x34\x2d\x20\x4e\x93\x74\
+\x96\xaa\x23\xf6\x53\x26\x19\x74\xf0\x3f\x30\xbb\x69\x4d\x1c\xe9\
+\x3e\x5e\xa0\x16\x90\xba\x77\xc6\x78\x7f\x09\x80\xea\xd5\xed\xa5\
+\x35\x11\xa9\xe7\x60\x99\x18\x8c\xbc\x88\x34\x88\x37\xcb\x3c\x26\
+\x6e\x7e\xb1\x69\x4d\xa8\xd6\x24\x22\x9f\xb4\xf1\x14\x8d\x7d\x17\
+\xe0\x3b\x67\xa3\xbb\xb2\xdd\xdd\xe1\xf9\x30\x9f\x00\xc8\xc6\x1c\
+\xd2\x75\xa4\x13\x00\x49\x41\xcd\xe9\xad\x63\xa6\x68\xe5\xfb\xf4\
+\x56\x7d\xef\x6a\x90\x79\x0c\x8d\x5a\xf1\x6b\xc6\x43\x23\x11\xb5\
+\x69\x3a\x4a\x90\xab\xdc\xb4\x82\xaa\x5e\x06\x04\x6a\xc7\xa3\x59\
+\xd1\xfd\xeb\x4c\x14\x40\xb7\x98\x8d\x34\x8a\xb2\x23\x17\xfe\x89\
+\x83\x98\xf1\x9c\x16\x49\xbd\xef\xc1\x60\x18\x79\x2e\xed\x90\xb7\
+\x8f\x89\xef\x5a\x37\x13\x5a\xcf\x47\xfa\x3d\x87\x63\x71\x45\x4d\
+\x0f\x50\x97\x00\x4e\x2c\x49\x99\x14\x42\x13\x5a\x13\x84\xdb\x43\
+\x47\xd1\xd2\x63\x75\x3a\x5f\x65\x2b\xe1\x2e\x46\x7e\x4a\x93\x0f\
+\x1d\xb5\xf3\x3e\x06\x1d\xd6\xff\x28\x09\x9e\x16\x25\xd1\x96\x4c\
+\xff\xc4\xeb\x13\x98\x65\xf7\x75\x15\x7f\xf9\xa4\x44\xa1\x32\xe0\
+\xc0\x09\xc4\x9f\x3c\xc1\xbf\x98\xdf\xe6\x58\xff\x1d\x1b\x81\x4e\
+\xb6\xe0\x4c\xd4\xbe\x12\x8d\xb0\x0e\xe8\xec\x7a\xac\xf7\x01\x8a\
+\xda\x31\x77\xf9\x7e\x0d\xaf\x1e\x73\xa6\x14\x26\xe3\xfa\xc4\x14\
+\xcc\x10\x8c\x1d\x12\x82\x2b\xe4\x19\x91\x7b\x5d\x98\xcd\x46\x01\
+\xae\x8b\xc7\xb4\xa2\x0a\x58\xe9\xb3\xeb\x90\xb9\x33\x63\xb1\x14\
+\x7e\xe9\x0c\x23\x05\x42\xe1\x8c\xab\x84\x40\xa4\x4c\x5e\xc2\xe1\
+\x5c\xa3\x31\xbe\x9a\x71\x2f\x1a\xcd\x40\x43\xac\xde\x41\x50\x5b\
+\x84\x84\x2e\x3d\x23\xbf\x79\xd4\x83\xb7\x0c\xe0\xb2\x8e\xaa\xb5\
+\x72\x6a\x88\xa2\xe0\xba\xe9\x3a\x6e\xe8\x62\xd8\x3c\x36\x9d\x1a\
+\xa8\x06\xbd\xca\xe1\xf3\xf0\xd5\xaa\x8a\x58\x31\x11\xa6\xeb\x04\
+\xae\x28\xea\x44\x13\x4b\x96\x6c\x24\x7a\xfd\xf8\x79\xb5\x91\x48\
+\x8b\x89\x84\x5a\x24\x01\x17\x67\x66\xd4\x74\x26\x8b\x78\x55\xec\
+\x79\xcb\x63\x61\x14\xf2\x6f\xfb\x58\x30\x26\xad\x22\x87\x27\x21\
+\x4c\x81\x82\xa5\xa4\xf7\x11\x14\x21\x23\x6e\x91\xc0\x0d\xc2\xad\
+\x9f\xea\x62\xff\x8d\xd6\x88\x30\xb2\x46\x5b\x4f\x96\xf9\x79\xd0\
+\xe4\xbf\x2a\xd0\x2e\xa8\xba\x5b\xa9\x15\x02\xd2\x2a\x51\x0c\x7e\
+\x98\xd0\x50\x95\x40\x01\xf8\x3e\x29\x0b\x48\x36\xd9\x57\xd6\xec\
+\x8e\xf7\x43\xd8\xfb\xc6\x00\xaf\x81\xd0\x69\x02\x00\xe1\xf7\x9e\
+\x14\x1a\x88\xaa\xe2\xd4\x93\xc8\x19\xe1\x23\x92\x9f\x9c\xaf\xbb\
+\xbc\xf2\x56\x39\x33\x53\x26\x88\x65\x08\x17\xbd\xa0\xc2\x55\x50\
+\x9d\xc8\x7d\xbb\xe9\xd2\xc3\xa9\x51\xff\xac\x51\x74\xd0\x65\x7b\
+\xd5\x54\xbf\x5d\x81\xc7\xbb\x58\xd5\x0f\x57\xae\x21\x39\x00\x51\
+\x00\x48\xae\x58\x34\x0d\x77\x48\x1e\xe8\xa1\xdd\x62\x89\xe8\x47\
+\x8d\xfa\x50\x6d\x9f\x1f\x19\x4a\x23\x11\x52\x72\x82\xcd\x99\x8e\
+\xc1\xa0\xa9\x73\x3d\x70\x20\x4c\xf8\xb6\x5f\x74\x19\xb0\x02\x9b\
+\x66\xe5\xaa\x8d\x20\x91\xef\xb7\x69\x32\x05\xc4\x03\xf0\xba\x04\
+\x60\xa2\x9b\x7c\x00\x51\xfc\x44\x7c\xdf\x1e\x8d\x1d\x39\x47\x3d\
+\x1f\x74\xa7\x90\x08\x90\x51\x3b\xd6\x46\xeb\x72\x87\x39\x43\x6a\
+\x04\x75\x4a\xe9\xda\x5a\xc1\x2c\x46\x45\x2b\x14\xab\xf0\xca\xef\
+\xc3\x20\x99\xbc\x0d\x7a\xc7\xc9\x25\xd2\xb4\x70\x23\x79\x7d\x4c\
+\x96\xf4\x49\x0a\x77\x03\xec\x4a\xaa\x46\x2b\x8c\xff\x6e\x1c\xcf\
+\x72\x3e\x00\x57\x32\xdd\x63\x0e\x8e\x29\xe7\x49\x74\xba\x08\x4d\
+\xb3\xab\x2d\x90\xd7\x14\xc0\xe3\x6e\xc5\x24\xc2\xce\xec\x9a\x5f\
+\xdf\x17\xa7\x94\x57\x87\x47\x8f\x99\x52\xa9\xe3\x04\xf4\x65\x02\
+\x40\xb1\x0f\xc0\x54\x48\xc8\x7b\xdc\xe8\x00\x68\x09\x00\x28\x73\
+\xee\xdb\x33\xb1\x1c\x51\xcb\xfb\x21\x0f\x65\x19\x5d\x0e\x2e\xf5\
+\x0f\x6d\x85\xb6\x2b\x55\x1b\x1d\x05\xa8\x41\x9b\xcf\xcf\x08\xf6\
+\x48\x0b\xb0\xa3\x88\x40\xe3\x33\x78\x93\xcd\xa0\xf3\x81\x57\xa8\
+\xd2\x3b\x66\x5f\x2c\x12\xe1\x26\xd4\x63\x9f\x56\x51\x91\x72\xe5\
+\x29\x49\xd8\x26\xf6\x0b\x5f\x75\x0e\xd6\xaa\xff\x32\x62\xc9\xa6\
+\x20\x42\x65\x6b\x82\x2f\x77\x3f\x45\x09\x49\xa3\x06\x66\x2b\x5a\
+\x5e\x72\xfb\x4b\xbd\x95\x82\x38\x1a\x2c\xe1\x48\x25\x00\x6d\xb1\
+\x7f\xb8\x89\xaa\xc5\x78\x0f\x71\xa5\x31\xe1\x60\x61\x33\xf5\xf8\
+\x3a\xda\xde\x8a\x3c\x8f\xb2\x3e\x2f\x4a\x46\x2f\x08\xc5\x1b\x91\
+\x93\x66\xb8\xd6\x56\xe1\x51\xb4\x44\xfe\x75\x8b\x3b\x60\xa8\xfe\
+\xeb\x1d\xa8\x0a\x11\xdf\x1a\x00\x41\xb6\xe1\x90\x6d\x59\xf0\x8f\
+\xd0\x80\x28\xf8\x8f\x1b\x98\xe9\xa3\x7a\xce\x95\x2a\x19\x4a\xcf\
+\xa5\x4a\x4d\x02\x79\x14\xc1\x7a\x37\x4b\x75\xc4\x50\xb1\xc7\x4d\
+\x05\xd6\xfb\x4a\x00\x62\xd5\xbd\xb2\x04\xe0\xb6\x10\xf7\xc6\xeb\
+\x77\xd3\x15\xd9\x1e\x3a\xa0\x56\x96\x15\x35\x5a\x68\x12\x60\x04\
+\xa3\xa6\x4f\xa6\xe0\x0f\x39\x04\x00\x22\x55\xa2\x6a\x28\x6f\x01\
+\xd4\x85\xbd\x3b\xdc\x67\x6c\x0a\xb3\xb5\x48\x88\x21\xaa\xf0\x10\
+\xcc\x9b\x81\xaa\x29\x6b\x5b\x13\xfb\xe1\x01\x7c\x49\x1e\x5c\x2f\
+\xbb\xb9\xfc\xb7\x09\x73\xdf\x11\xfc\xad\x55\x81\xa6\xc0\xca\x77\
+\x94\x49\x7a\xe7\xf7\x7f\x78\xaa\xae\x1f\x8e\xbe\xbd\x50\x0d\x61\
+\x42\x82\xcb\xd9\xa6\x37\x9c\x55\x90\x90\x54\x9f\x3f\x56\x30\x5c\
+\xae\xe7\xb8\x24\x03\x0f\x47\x36\x1d\x61\x42\xcf\x18\xf7\xcf\x5c\
+\x30\xee\x0c\x95\xce\x14\x47\xc5\xd2\xf6\xa6\x22\xf4\x7c\x7e\x36\
+\xe7\x6b\x59\x5f\x97\xdf\xf7\x36\x52\x39\xd3\x12\x00\x2e\x4f\xac\
+\x33\xbe\xa9\xf1\x54\x7c\x1f\xd1\xaf\x1d\x44\x92\xa3\xe4\x33\x5c\
+\xf2\x38\x60\xa3\x96\x4c\xaf\x7b\x70\xeb\x1d\xaf\x1f\xe1\xde\x74\
+\xdc\xc8\x6a\xa4\x7d\x71\x7c\x5d\x24\x88\xda\x22\x05\xc1\x1a\xf1\
+\x6f\xdc\x7b\xb5\x5b\x35\x10\x9c\xea\xdd\xba\x8f\x9a\xcb\x7a\x3a\
+\x12\x92\xed\x92\x00\x80\x3e\x12\xcc\x9c\xee\x30\x53\x5b\x5e\xcf\
+\xb2\x78\x8e\x78\xb6\x3d\x5c\xd0\xab\x54\x3b\xe0\xfc\xf7\xed\x79\
+\xe4\xf7\xe1\x95\x81\xca\x3d\xff\x01\x44\x33\xa5\xfd\x01\x34\x37\
+\xde\x26\xb5\x00\x32\x67\xfb\xaa\x36\x9a\x1c\x73\x26\x67\xcc\x74\
+\x83\x56\xc0\x0d\x12\x80\xce\x0a\xad\x01\x47\xee\x1c\x23\x1f\x8f\
+\x6d\x86\x50\x50\xfc\x0c\xaa\x4f\x4c\x02\xb0\x04\xaf\x8a\x64\x41\
+\xfb\xc6\x36\xf8\x7c\x76\x58\x3c\x96\xc9\x7c\x02\xe9\xe1\x8a\x15\
+\xb4\x53\xea\xf3\x41\x75\x35\xf5\xe9\xac\xd0\xe3\x35\x08\x76\xc3\
+\x70\x74\x8e\xfd\xaf\x93\xd6\x1e\x0c\xc8\x87\xba\x43\xb3\xfb\x1d\
+\x0b\x8c\x92\xe1\x45\xe7\xae\x57\xd2\xe1\x96\x98\xde\x1c\x8a\xcc\
+\x41\xee\x10\x2a\xec\xd3\xe1\xb8\x24\x41\x8a\x30\x10\x1f\x7b\xea\
+\xd8\x41\x1f\x8d\xc7\x80\x20\x42\xa2\xb5\x42\xf0\x77\x46\x3c\x87\
+\x0e\x3f\xbf\x75\xf3\x74\xeb\x4b\x10\xd8\x88\xd8\xef\x9d\x21\x23\
+\x76\x39\x5b\xea\x58\x6d\x6c\xa4\x49\x5a\xe7\xfe\x7b\xb9\x86\xb6\
+\x40\x51\x2d\x46\xae\x0c\x62\x6e\x2f\x70\xf4\x25\x10\x69\x06\x4c\
+\xd2\xbd\xeb\x18\x01\x8d\xfb\xc7\xa3\xe0\x1b\xa0\xed\x6d\x2a\x8f\
+\x79\x92\x97\x72\x98\x63\x44\xa2\x33\xaa\xf0\x56\x6a\x64\xb1\xce\
+\x2a\x82\x9a\xf2\x09\x08\xf2\xdc\x90\x0d\x72\xe7\x5e\x50\x40\xd6\
+\x04\xe6\x47\x0f\xab\x9e\x3e\x14\x24\xd9\xa0\xea\xce\xa7\x82\x67\
+\x95\xfd\x19\xb8\xe2\x7c\xbd\xa5\x8b\x1c\x14\x4e\x26\x41\xd9\xb9\
+\xef\xa7\x54\xc2\xba\xae\xfa\x12\xbe\xd1\x2d\xc9\x7e\x26\xe2\x43\
+\x34\x9b\x5b\x0a\x3a\xb9\x3a\x67\x6e\xa5\x4d\xc6\xdc\x2c\x59\xe9\
+\x6e\xc1\x8f\x00\x3e\x06\xc8\xfa\xd8\x91\x66\xfd\x86\x99\x50\x51\
+\xcc\x05\x22\xd7\x3b\xf5\xc1\xad\xa2\x0b\x0d\x0e\x24\xa7\xcd\xdf\
+\xa2\xc3\x3b\x26\xec\x39\x8d\x64\x60\xb0\x73\x4a\xcc\x27\x97\x00\
+\xb8\xa0\x15\xa0\xf6\x06\xc1\xed\xee\x3a\x9a\x0e\x44\x9d\xff\x10\
+\xc0\xf4\x96\x05\x95\x3f\xcd\xf5\xdb\x21\x8c\x15\x7a\xb8\x7f\xad\
+\x70\x1f\x1e\x23\x19\xe4\xb4\x33\x19\x75\x8e\x23\x72\xbf\x9d\x02\
+\x7d\x65\x09\x83\xca\xfd\xee\x90\x38\x52\x41\xf5\x40\x74\xf5\x51\
+\x05\x17\xe6\xa2\x8d\x62\x7b\xca\x99\xf7\x71\x22\xe0\xaa\xea\xb6\
+\x2f\xab\x46\xb5\xef\xdc\xac\xbc\x92\x8a\xf9\x2f\xd4\x91\x7f\x83\
+\x80\xa2\x5c\xa6\x41\x20\x6a\x77\x10\x8d\x7c\x8d\xf3\x12\xb5\x23\
+\x4a\x0f\x19\xfd\x20\xf0\x93\x0b\xbc\xcf\x7f\x53\xc5\x42\x21\x50\
+\xf7\x41\x92\x58\xe4\xf2\x74\x68\xed\xe0\x17\xf6\x56\x70\xfb\x72\
+\x93\x29\x19\x42\x0b\x3b\xec\xd3\x01\x22\x2f\x27\x56\xb3\x53\x0e\
+\xe5\x6e\x7f\x05\x56\x66\x5a\x54\xee\x79\x50\x1e\x24\x4a\x93\x10\
+\x28\x0e\xc4\x8d\xd0\x7a\x88\x66\xef\x3b\xc8\x24\x42\x37\xd4\x0c\
+\x18\xec\xce\x04\x00\xc4\xeb\x2a\x37\xc7\x82\x88\xb4\x5a\xae\xa9\
+\x60\x3f\x91\x2d\x80\x5c\x46\xbc\x05\xe2\x67\x3d\x15\x0f\x7b\x0a\
+\x1b\xae\x13\x08\x19\x8e\x21\xee\x37\xaa\x96\x99\x59\xe5\xe1\x49\
+\x49\x4c\x3e\x01\xa8\x86\xf8\xb3\x70\xd5\x11\x14\xf9\x46\x85\x39\
+\x8f\x61\xf8\xf2\x51\x23\xff\xf9\xdd\x91\xb8\xc9\xc9\xfe\xd9\xe8\
+\x5e\xba\xe4\x08\xb3\xc4\x87\x60\x25\x2c\x92\x54\x88\x2d\x30\xcd\
+\xda\xe9\xe4\x04\xef\x55\xc6\x96\xbd\xd5\x80\x5a\x1b\xdd\xc8\xe6\
+\xa1\x47\x9f\x24\x55\x4a\x4f\x90\x07\x9c\x9a\xa9\xc3\xe1\xea\x5f\
+\x16\x85\xd2\x66\xef\x47\x21\x21\x2c\x19\xff\x4a\x8d\x0c\x86\x71\
+\x46\x37\x4d\x90\x12\xb1\x0a\xcf\x76\x7d\x9f\x28\x01\x40\x2e\x6f\
+\x25\x33\xf9\xe2\xd4\xc1\x88\x94\xf7\xca\x46\xd0\xc4\xb5\x92\xd0\
+\x51\x90\xd0\x80\x72\x33\x21\xe6\x0b\x70\x98\x8a\x0e\xd0\xa6\xa7\
+\x2d\xb6\x0a\x71\x76\x2a\x37\x8a\xda\x41\x42\x17\x41\x51\x09\xed\
+\x21\x5a\xe3\x8d\x30\x0d\x40\xd7\x03\x1d\xc1\xf3\x04\xbb\x2e\xdd\
+\x77\xaf\x76\x04\xd4\xad\x04\xd4\xab\x24\x75\x6f\x84\x00\x68\xc2\
+\x38\x34\x11\x30\x19\x89\xe0\x42\x94\x21\xa9\xf2\x98\xe7\x3a\xf0\
+\x24\x25\x3f\x2a\x6c\xa2\x7d\x9e\x73\xb0\x95\xce\x35\x82\xf2\x5e\
+\x89\x6e\xdc\x32\x11\x10\x13\x80\xaa\xd3\x82\x4e\x49\x02\xc0\xbf\
+\xf0\x84\x7a\x8f\x46\x26\x94\x75\x74\x21\x54\x78\x71\x78\x21\x9d\
+\xa3\x4a\x4e\xac\x1e\x06\xd8\xbd\x91\x04\x79\x06\xa1\x2a\x4c\xbc\
+\x9a\x0e\xdb\x05\x83\x87\x23\x1b\xc4\x5c\xaf\x89\xd8\xcf\x91\x7d\
+\xbe\x73\x6b\x9a\x14\x62\x13\x36\x98\x28\xf5\xc8\x1e\x7d\x20\x25\
+\x42\x27\xeb\xb3\xf2\xd0\x3e\x76\xd5\x43\x9f\x7f\x21\x90\x1d\x34\
+\xf9\x5d\x23\x58\xdb\x72\xd6\xb9\xcd\x54\x32\x16\xdd\x2f\x88\xfa\
+\x67\x94\xb0\x68\x62\xeb\xe1\x35\x5b\xaf\x90\xb9\x4c\x2b\x38\x6d\
+\xc5\xff\xde\x22\xad\x01\x20\xbd\xe3\xa5\x3d\x82\xa1\xe4\x31\xd9\
+\x37\x6e\xfc\xfd\x64\xf7\x9f\x48\xeb\x42\x48\x14\x3b\x19\xc6\x8c\
+\x51\x1d\x17\x20\xc6\x28\x01\x68\x06\x99\x65\x5c\x27\x25\x81\x63\
+\xf3\x9f\x2d\xd5\x9c\x0f\x5e\x4e\x4b\xe1\x5a\x87\xbb\x1b\x7a\x1b\
+\x54\x87\xd0\x02\x68\x30\x0a\xe7\x10\x2b\x3c\x73\xbf\x72\x6f\xf2\
+\x49\xc0\xc4\x14\x1c\xcd\xc5\x2f\xa2\x66\xce\x7f\x32\x31\x77\x1f\
+\x91\x2b\x3f\x69\xa3\x6b\xc3\x6f\xb5\x59\xdf\x6b\x8a\xd4\xf4\xf7\
+\x93\x00\xa4\x45\x89\x52\x9a\x2a\x26\x2b\xa6\xc4\x75\x65\xd4\x44\
+\xa0\x03\x35\x31\x6b\x3b\x2b\x92\x8d\x69\x62\x6e\xe5\xef\x9f\x1b\
+\x47\xc7\x48\x5a\x17\x7b\xdd\x6c\xd6\xd3\xe9\x1e\x4b\x02\x30\x52\
+\xf8\xa5\x83\xcd\x0f\x5f\xf6\x4a\xcf\x4b\xd9\x26\x55\xf9\xd0\x46\
+\x8f\xe1\x3a\xbb\x26\x2a\x31\x7c\x82\xf5\xb5\x83\xaa\x9e\x92\x00\
+\x08\xd2\xad\x51\x0f\xd0\x43\x92\xb0\x90\xc9\x5c\x32\xd2\xa1\xe4\
+\x00\xf3\x16\xba\x91\x99\xe8\x18\x22\x1c\x11\x2b\xe2\xf1\xb1\x44\
+\x59\x51\xcf\x57\xeb\x6e\x5e\xb9\x9f\x68\xc6\x1d\x05\xb4\x69\xde\
+\xac\x76\x26\x68\xb2\x73\xa6\xbd\xce\xf2\x85\x4b\xe2\x13\x82\x3f\
+\x6e\x5f\xa0\x59\x7c\x4f\xc8\x52\xa4\x52\x7b\x41\x09\x6f\xd0\xe0\
+\x76\x1b\xfa\xfd\x1e\x6a\x5f\x7e\xdf\xf6\x18\x42\x5e\xe7\xe3\x15\
+\x3d\x01\xfe\x5e\x74\x9d\x1c\x95\x49\x88\x91\xf2\x54\x88\x8d\x2d\
+\x64\xd0\x9b\x9c\x1c\xb2\x29\x84\xd5\x41\x1d\x31\x55\xa7\x73\x92\
+\xd2\xa5\xf7\xff\x92\xd1\x83\x29\xea\xaf\x52\xe2\xa2\x51\x8a\x86\
+\xfd\x76\xbd\x75\x42\x5b\xe1\x96\x82\x68\xd2\x24\x54\xc9\xef\x1b\
+\x45\xef\x41\xe6\xee\xec\xbd\xee\x94\x72\xdc\x4e\x0d\xff\x8e\x4f\
+\xf4\x4c\x89\xb6\x72\x59\x4b\x84\xae\x1d\x7c\xbe\xc7\xfa\x08\x7b\
+\x26\x18\xb4\x96\x24\x61\xfe\xb3\x3d\xd3\x6a\x3a\x34\x38\x99\xeb\
+\x90\x3a\xe6\xf0\xc9\x35\x0d\x70\xe6\x32\xdd\x49\x23\x2f\xcd\x06\
+\x43\x01\x0f\x79\x44\x0a\x61\x56\x58\x5c\x63\xa1\xd4\xae\xa1\x4e\
+\x7e\x24\x01\x08\x3c\x81\xa6\x1b\x29\xdc\xd2\xe7\xfa\x32\x7b\x48\
+\x81\xe0\xc7\xdc\x96\xcf\x3c\xae\x6c\x72\x88\x7a\x93\x74\x26\xdf\
+\x44\x81\xbf\xc1\x56\xad\x42\x10\x91\x5a\x1d\x4e\xca\x38\x0e\x08\
+\xab\xbf\x3a\xf3\xef\x6e\x10\x79\x2c\x4d\x76\x33\x42\xbb\x06\x22\
+\xc5\x3b\xdd\x18\xc6\xb2\xf6\x8b\x09\x09\x51\x24\x5e\x82\x13\x24\
+\x5a\xf1\x4b\x4c\x7a\xf7\x6a\x7b\xa3\x06\x44\x92\x9c\x78\x45\x36\
+\x40\x5c\x86\x11\x55\xdc\x88\x3c\x46\xbe\xd7\x54\x30\x81\x91\x33\
+\x8c\x1a\x09\x9c\x1a\x5a\x17\x63\x94\x50\xe3\xa4\x74\x39\x18\x52\
+\xfd\x76\x53\x50\x09\x4e\x54\x77\x3f\x3a\x60\x41\x0f\xfe\xd8\x20\
+\x4a\x09\xc2\xf7\x11\xf8\xa3\x99\x7d\x7e\x90\xf6\xd4\x8c\x65\x51\
+\x07\x05\x94\x08\x70\x49\x69\x23\x4a\x5f\xeb\xa6\x43\x76\x53\xb0\
+\xbe\x35\x41\x6d\xeb\x67\xe8\x09\x80\x15\xcc\x83\xae\xa9\x06\xc7\
+\x9b\x24\x00\x8d\xc2\x05\xd0\x47\x2a\x61\x77\x9b\xe1\x1a\xd8\x5c\
+\xe5\xba\xf4\x1a\x67\x0a\x3b\xb2\x1a\x6a\x85\xad\x3d\x6b\x77\x9d\
+\x1d\x7c\x52\x05\x7e\xdc\xea\xbd\xd3\x67\xdd\x21\x79\x63\x79\x40\
+\x90\xa0\xe5\x6d\x3d\x78\x2c\x1c\x62\x10\x09\x6f\x64\x52\x9b\x4e\
+\x83\x1a\x88\x3e\x7c\x9d\xb0\xeb\x6c\xb6\xc0\xff\x88\xbc\xd6\x60\
+\x7b\x60\x04\x23\x7b\x16\xb2\x54\xc5\x0b\x23\x23\xfe\xf7\x02\x4b\
+\x5d\xab\x6a\x82\x71\x8b\x49\xba\xa9\xd5\x43\xb0\x43\xc5\x8b\xb7\
+\xed\x4b\x67\xd7\x6d\xe2\x57\xd9\x19\x0e\x43\xdc\x15\x81\xf7\x97\
+\xaa\xdb\x1b\xe3\x78\xe2\x0c\x0a\xd2\x3d\x93\xdc\x24\xd7\x05\x4c\
+\x8f\xdf\xa8\x5a\xec\x34\x01\x30\x71\xd2\x48\xd0\x87\x31\x40\xca\
+\x9e\x07\x60\x14\x51\x1a\xc5\x31\x52\x45\x00\x8e\x02\x52\x03\x48\
+\xfc\x08\x27\x39\x78\x6c\x15\x14\xd5\x3d\x93\x1f\x91\xeb\x02\x9c\
+\xe8\x27\x40\x08\xb4\x3c\x26\x13\x00\x07\x65\xb6\x44\xc0\xe5\xfc\
+\x7a\xb4\x61\x4c\xaf\x30\xe8\x1f\x2c\xa9\x80\x9a\x03\x0e\xee\x06\
+\xd9\x09\x07\xd1\x95\x1a\x49\x43\x2f\xa8\x0d\x42\x77\xba\x98\xa8\
+\x55\x96\x00\x98\x68\x94\xb4\x2e\x30\x98\x92\xed\x6d\xb7\x57\x96\
+\x5b\x03\x55\xca\x80\x48\x13\x68\xba\x15\x31\xec\xb6\x2e\x7e\x12\
+\x22\x05\x82\xff\xca\x7e\x0d\x82\x52\x07\xc4\x08\xa1\x28\x4a\x5a\
+\xb1\x7e\x87\x84\xca\xa4\x0d\xa2\xaa\x4c\x7b\x2e\xb4\x95\x1f\xd3\
+\x6b\xa0\xdc\x97\x3b\x99\x98\x41\x67\x5c\xd3\x8b\x0b\x04\xe9\x43\
+\xcb\x10\x80\x92\x16\x00\x3e\xc4\x69\x02\xd0\x44\xf0\xf8\x98\x50\
+\x14\xe3\x66\x40\x16\xd9\xb6\x6e\x49\x00\x80\x91\xc7\x18\xb1\x6c\
+\x60\x23\x4a\x91\xc4\x30\x50\x35\xb1\xa1\x60\x34\xb1\xa3\xb2\xac\
+\xb5\x87\xf0\x21\x39\x4d\xe0\x0e\xd1\xb6\x07\x22\xac\x23\x19\xe8\
+\xc8\x55\x8f\x11\x12\x0d\x23\x7c\x76\xa2\x7f\x77\x36\x7c\xb9\x7c\
+\xfe\x88\x8c\x5f\xe2\x04\x80\xaa\xdf\x71\xeb\xe6\x84\x78\x89\xe6\
+\x10\x49\x36\xa7\x45\x3d\xfa\xd8\xbf\xc0\x05\x4b\xaf\x22\xa7\xda\
+\xb4\x62\x82\x9d\xe4\x70\x38\x06\xa2\x66\x47\xc7\xfc\x48\xc2\xc7\
+\xfc\x18\xe8\xbd\x5d\x9e\x0f\xae\x80\x17\xb1\x9f\x0c\x11\xcc\x25\
+\x00\x87\x55\x65\xb1\x1b\xd9\x34\x4a\x42\x03\x00\x25\x70\x81\x7d\
+\x3f\x11\x25\xb7\xb6\x80\xa4\xd7\x1c\xca\x08\x83\xa2\x6d\x2d\x96\
+\x0e\x1e\x4c\x98\x86\xc1\xe6\x2b\x44\x0d\xd1\x7a\x15\xc0\x30\xa5\
+\x32\xb2\x03\xd6\xc4\x28\xe4\x15\xfc\x05\x79\x0e\xde\x96\x31\xe2\
+\xef\x89\xc0\x85\x03\x4d\x2b\x48\x45\xb7\x1b\x25\x78\xcb\x12\x9c\
+\xf2\x04\xa0\x61\xa4\xbb\x70\x0f\x46\x86\xea\x1a\x61\xcc\xd8\x24\
+\x7d\x0e\xa2\x16\x89\xa8\x88\x68\xb3\xbe\x16\xdc\xc7\x21\x4e\xb8\
+\x8d\xe8\xdc\x88\x11\x4f\x22\x87\xdd\x83\xe8\x5e\x8a\x13\x1b\x9c\
+\x00\x34\x82\xde\x00\x25\x97\xdf\xaf\x3f\x02\x57\x4e\x5d\x11\x00\
+\xd8\x0c\x1f\xe8\x8e\x6d\xcc\xf0\x43\x18\x6f\xf3\x2c\xf7\x87\x0b\
+\x9b\xf7\xc1\x70\x9c\x55\x7b\x5d\xff\x6f\x8f\x04\x62\xcd\x67\x6f\
+\x52\xbf\x18\xf4\x0a\x0e\x71\x0d\x2a\xdc\x6a\xb8\x40\xff\x34\x83\
+\xab\x3a\x56\x19\x76\xc7\x62\x99\xdc\x2c\x8c\x1c\x25\x0f\xd4\xde\
+\xb4\x49\x2d\xec\x15\x7e\xe7\x9e\xd3\x44\x55\xae\x37\x59\x96\x74\
+\xeb\x03\xfe\x44\x99\xad\x07\x4b\x2a\xfb\x20\x76\x14\x48\x9a\x38\
+\x61\x6b\xd0\x04\x80\xd6\xbb\x97\xc9\x7d\x13\xab\xd6\x8c\xea\xcc\
+\x26\x1f\x40\x98\xc4\x8a\x92\xb9\x55\x00\xa8\xcc\x0d\x0e\x08\x6c\
+\x9c\x7c\x86\x1d\x6f\xfd\x64\xd8\xda\x4c\x3a\xb7\xee\x81\x7d\xa6\
+\x91\xa1\x7e\xd2\xfb\x07\xf9\xda\x44\x97\xc5\x75\x92\xe3\xec\xbf\
+\xd0\x71\xd6\x7b\xb0\xf8\xcd\x1b\x6c\xe9\xf2\xa7\x34\x71\x98\x74\
+\x2b\x5c\xed\x3c\xe9\x52\x10\xaf\x15\x47\x85\x75\xc1\x1c\x94\xd8\
+\xa9\xc9\x8c\xec\x7d\x50\x6f\x56\xec\x4b\xad\x43\xb8\x52\xc7\x1e\
+\x44\x79\x61\xd1\xf9\x12\x2b\x5b\x76\xb7\x50\xd9\xdb\xa6\xd7\x5f\
+\x75\x10\xee\x13\x1b\x99\xde\x03\xf1\x27\x9f\x87\xc0\x09\x68\xb0\
+\x85\x6f\x42\xea\x37\xa7\x2a\x2b\x26\xb9\x92\xc6\x7f\x07\xc8\xf5\
+\x72\x8a\xce\xe1\xcb\xfd\x78\xe8\xf6\xdc\xe8\xe3\xc8\xe5\x85\x25\
+\xe4\x6f\xf2\x7c\xac\xa2\x7a\xaa\xf1\x33\x68\x51\xb4\x21\x01\x80\
+\xec\xdc\xb1\x3c\x46\x55\xa2\x29\x8f\x16\x89\xd3\x4e\x8e\x7a\xec\
+\xb1\x2d\x6d\x4c\x54\x83\xa8\xca\xaa\x07\x6e\x04\x34\xea\x86\x36\
+\x5d\xe1\x4d\xc4\x95\xa5\x5f\xf0\xc7\xf4\x7b\xef\x12\x24\xb2\x08\
+\x22\x95\x2b\x97\x16\x27\x5a\x9d\xfe\x99\x4d\xaf\x31\xd6\x59\xd6\
+\x7d\x00\xe2\xf5\xde\xfa\xcc\xd7\x22\x74\xe4\x88\x60\xf5\x91\x30\
+\xee\x17\xb8\x16\xc1\xed\xbc\x12\x16\x83\xa3\x2d\x1a\x87\xd2\x1c\
+\xd9\xa8\xda\xe1\x24\x06\x0d\x62\xa7\xdb\xeb\x73\xea\xc4\x03\xbc\
+\xcf\x05\x5a\x89\xfb\xb1\xa1\xe2\xec\x2d\x4b\x78\x24\x3b\xe7\x09\
+\xad\xe5\xe3\x86\xe4\x91\x8b\xd1\x84\x29\x12\x37\x3e\x57\x0f\xac\
+\x9a\xda\x34\xff\x3f\x89\x89\x62\xa8\x4e\x61\x45\x33\x6c\x46\xf2\
+\x5a\x6e\x07\x71\x25\xbe\x06\x19\x45\xa5\xf5\x20\x0c\x3b\xc4\x27\
+\x72\x0f\xf1\x68\xe6\x6d\xc7\xea\x78\xb0\xb9\x56\x02\xb6\x4c\x79\
+\xcf\xc9\x37\xb7\xc8\xbe\xb9\xba\xd1\xe7\xec\x17\x18\xda\x2f\x76\
+\xb4\xc5\x3b\x80\xac\xc5\xbe\xe0\x8c\x48\x16\x21\x7a\xdb\x54\x43\
+\x3a\x70\xf0\x0f\x6e\xa4\x3c\x96\x18\x94\x00\x40\x34\xa1\x90\xd6\
+\x5c\xd9\x2b\xf4\x95\xe2\x4d\x58\x41\x08\xe8\x0a\x42\x45\x93\xfd\
+\xf7\x38\x70\x1f\x45\xe2\x5c\xd3\xd1\x7e\x9e\xb7\x65\x65\xf3\xfc\
+\x94\x61\x0d\x22\x74\x1d\x04\x82\xc6\xfd\xd3\x07\xea\x58\x0a\xee\
+\x7d\xf3\x91\xc1\x51\x17\xc7\x29\x39\xb8\xf9\x3d\x19\x68\xc5\xd8\
+\x7a\x63\x1f\xab\xcc\x97\x0a\x09\xce\x70\xcc\x88\x5b\xc4\xa2\x4d\
+\x81\x28\x15\x08\x7d\xd8\xb7\xbc\x11\x84\x59\x38\x31\x0b\x07\x4e\
+\xce\x5f\x68\x45\x6d\x02\x23\xeb\x29\x64\x3c\xe1\xa9\x9a\x5e\xcc\
+\xb2\xe5\xb3\xb7\x3e\x09\x10\x84\x9a\xf4\x76\x88\xe3\x6f\x60\x1b\
+\x63\x23\x3c\x6f\xc5\xab\x22\x0b\xa9\x9b\x04\x1f\x81\x92\x57\x43\
+\xab\x04\x44\x8f\x06\x55\x0b\x20\x6a\x67\x2d\xc1\x19\x57\xcd\xaa\
+\xb2\x59\x92\x9c\xc8\x9d\xfd\xb0\x0c\x30\x88\x55\x97\xac\x05\xa1\
+\xb4\xa7\xd0\x33\x6e\x15\xe9\x5d\x9f\x20\x0f\xa1\xe5\x55\x93\x7b\
+\x3a\x89\x6d\xc1\xd2\x7e\xfd\xde\x19\xf8\xf4\x59\x5a\x02\xad\xc3\
+\x26\x52\x60\x3b\xa4\xfd\x0f\x72\x63\x89\x69\x55\xbd\x2d\x81\x7c\
+\xdc\x45\xf2\xbb\x8a\x1c\x29\x4e\x0e\xd9\xa4\x3e\x87\xb8\x57\xfb\
+\xb4\x15\x37\x46\x55\x24\xa4\x4b\x14\x3e\xba\xf7\xa4\x6b\x4f\xa2\
+\x15\xce\xad\xab\x13\x00\x9c\xcd\x54\x49\x7f\x7b\x20\x84\xbe\x0a\
+\xf5\xbc\xbd\x90\x8d\x9f\x01\xb7\xc2\x28\x15\xf7\x8b\x07\x1a\xf0\
+\x37\xa9\xfd\x15\x68\xed\x47\x62\x15\x68\x8c\xcd\x43\x3b\x34\xd8\
+\x57\x83\xa6\x90\x07\x8a\xd0\x52\xfa\x5a\x42\x3f\x1a\x50\xb0\x5b\
+\x0f\x7a\xe6\xa6\xb8\xbd\xcd\x20\x57\x8c\x8d\x37\xcb\x59\x93\xa8\
+\x01\x93\xe7\x28\xf1\xb1\xe2\xb2\xbb\x2e\x01\x18\xc6\x30\xf1\x90\
+\x20\x30\x46\x41\x6e\x40\xd6\xc0\xa5\xfd\x5c\x24\xb7\x5c\x0d\x52\
+\x6b\x0a\x58\x1f\xd7\x2a\xc6\x49\x40\xa4\x63\xe9\xbd\x77\xcf\x62\
+\x14\xdc\xe1\x46\xd5\x88\x69\x49\x00\xca\x04\x6a\xfc\xaf\xd8\xe9\
+\xd0\xaf\x83\xcc\x33\xf4\xf7\x4d\x4b\x66\xa5\xb5\x15\x57\xfd\x6a\
+\x02\xd0\x9b\xc4\x5c\x3d\x9b\x26\xc1\x5e\x0f\xe2\x61\x98\x80\xb2\
+\x85\x43\xbd\xf5\xa4\x47\x49\xe0\x45\x48\xa2\x5c\x62\x73\xe0\x6d\
+\x24\xae\x54\xaa\xf4\x8c\x6f\x94\x04\x54\x43\xca\x0c\x67\x4b\x0b\
+\x00\xd8\x99\xa7\x19\x48\xd9\x8c\x31\xcf\x35\xa8\xc6\x16\x18\x1f\
+\x02\x39\xb8\xdf\x3e\xf7\x5e\x1a\x7f\xb8\x93\x66\x3b\xa4\xd7\xee\
+\xd2\xc2\x2c\xb4\x94\xc7\x62\x57\x92\x51\xd3\x00\xc8\x1e\x18\x18\
+\xb2\x37\xed\x48\x00\x1e\xf7\x94\x00\x60\x1d\x00\xc8\x92\x30\xf2\
+\xa3\x23\xdb\x17\x88\x3c\x36\x17\x67\x6d\xc1\x01\x0c\x94\x59\x57\
+\x21\xe8\x0e\x23\x11\x6d\x49\x2a\xff\xa1\xaa\x28\x26\x0a\x0a\x19\
+\x7b\x37\x52\x1e\x80\x27\x86\x29\xc2\x49\xc3\x88\x02\xcf\x98\x90\
+\xd1\x55\xee\x0b\x3b\x9c\xc2\xaf\x34\x40\x65\x65\x84\x93\x49\x07\
+\x3a\x50\x3b\x44\xbe\x1c\x56\x07\x2c\x17\xf4\x07\xb8\x90\xeb\x52\
+\xbd\x67\x4f\xfe\x3b\x8c\x02\x02\x60\x92\xf3\xf7\xa1\x75\x90\x10\
+\x98\x21\x2a\x8b\x26\xe8\xd6\xf7\xfc\x60\xe7\x55\x19\x9d\x1b\x5e\
+\x3e\x4b\x49\x00\x50\xe0\xc0\x15\x7c\x4c\x4e\x32\x19\x68\x31\x1e\
+\xb3\x0b\x8c\x7b\x7c\x48\x3b\x62\xab\x45\xec\x78\x3a\x55\xe0\xc5\
+\x88\x70\xd5\x3f\xac\xeb\x77\x00\x15\x91\x91\xf7\x28\x64\xab\xa1\
+\x8b\x2d\xf1\x21\x51\x39\x1d\x12\x07\x27\x5a\x9f\x5b\xb5\x43\xe2\
+\xe7\x4d\x09\x64\x04\xed\x43\xe2\x2a\x98\x9f\x50\x67\xfd\x1d\x18\
+\x7a\xc6\xaa\xe9\xed\x5a\xeb\x5b\x99\xec\x50\x6c\xb4\x53\x6f\xea\
+\x5d\x1b\x35\x08\x4a\x9c\x80\xe6\x93\x60\x2e\xbd\x1a\xc2\xb8\x27\
+\x36\x07\x4a\x3d\x87\x94\xdc\x79\xf1\x3d\xea\x4b\x89\xa0\x99\xc2\
+\x49\xd0\x07\xb8\xae\xd5\x03\x2a\x31\xf2\x36\x2d\x9d\x91\x27\x00\
+\x7b\x3f\xac\xb4\x5f\x9e\x37\x83\x08\x8c\x6b\xaa\xd0\x44\xe1\xbc\
+\x1c\x4c\x34\x26\xb4\xe9\xc7\x42\x08\x1e\xd8\x58\x97\xc6\x61\x60\
+\xee\x81\x82\x2c\xac\x04\x43\xd7\x29\x77\xc2\xc8\x3f\x3e\x21\x87\
+\xd9\x97\xf8\x07\x8c\x05\x15\x21\x4f\x36\x2c\x82\xb9\xc7\xe0\x15\
+\xd0\x2f\x33\xeb\x67\x05\xad\xd6\x07\x53\x2c\x7e\xc3\xb9\x19\x12\
+\x34\xcc\x60\xb3\x83\x83\xc7\x39\xe3\x1e\x10\x21\x51\x22\x3c\x4d\
+\x6c\x84\x4c\xf7\x63\xc7\x04\xb1\x5a\x84\xfa\x2d\x23\x28\x86\xa0\
+\x92\xaf\xda\xa7\x2c\xf3\x38\x3b\xc3\x1f\xad\x6f\x43\xc6\x67\x49\
+\xdf\x5f\x40\x01\x16\x53\xa2\x55\xa1\xb0\xe3\x63\xbb\xcc\x8f\xa1\
+\xc3\xd2\xaf\x78\xc4\x34\x7f\xed\x92\xd7\x47\xba\xbd\x11\xce\x13\
+\x32\x4d\xd4\xa5\xe4\xc3\x8d\x82\x2e\x4c\xec\x39\x81\x20\xb2\xc5\
+\xd0\x96\x43\x4e\x36\xd7\x8a\x09\xc8\xbe\xc0\x68\x45\xe2\x6e\x99\
+\x1a\xe0\x76\x6f\x80\xc8\xdc\xab\x48\x3b\xc2\x08\xc2\x41\xb7\x4d\
+\x00\xf6\xa2\x0d\xd4\x64\xcb\x5c\xd5\x06\x28\x49\x92\x5a\x3e\x65\
+\x12\x8d\x91\x9b\xc2\xc9\x35\x20\x67\x31\x7e\x6f\x1d\x01\x2f\x4f\
+\x2e\x63\x21\xbd\x5b\x25\x00\x34\x76\xdd\x5d\x07\x43\x70\xc2\xda\
+\x54\xf8\x00\xf1\x41\x0f\xe5\x8b\x24\xb9\x59\x21\x01\xe7\x97\x04\
+\x7e\xa9\x0a\x57\x60\xfb\xf5\x50\xa6\x1a\xe2\xa0\x5e\x63\x16\xb1\
+\x60\xd5\x59\x95\x60\xde\xe2\x0a\x1d\x4f\x56\xc8\xbd\x7f\x10\x46\
+\xc2\x94\xde\xfd\x00\xde\xe9\xd0\x55\x9f\x7e\x43\x0e\xcc\x28\xc6\
+\xfb\xbb\x6b\x64\x4c\xb9\xcf\xdd\x1e\xe2\xa0\x21\x26\x46\x18\xe5\
+\xd0\xc8\x67\xcc\x85\xac\x46\xc2\x1d\xd1\x21\xb7\x42\x80\x75\x34\
+\x92\x66\x62\x89\x4e\x44\x1e\x6d\x93\x73\xf1\xdb\x75\xdb\x75\x88\
+\x92\x93\x56\x8d\xc2\x35\x90\xd7\x6f\x13\xe9\x0d\xa0\x43\x28\x52\
+\xaa\x04\xd2\x72\xd0\x58\xfe\x17\x72\xd9\x61\x79\x71\x39\xd3\xec\
+\x98\xe2\x10\xd6\x31\x9f\x8b\x2e\xaf\x64\xd7\xcf\x3a\x48\x82\x5a\
+\xd7\xea\xe5\xc7\x09\x40\xad\x2a\xba\xa5\x0e\x58\x2c\x15\x3d\x2a\
+\x15\xea\xc8\xf8\x49\x36\xd3\x2f\x2f\x1f\x07\xa4\x2d\x10\x58\x51\
+\xb7\x74\x1f\xfb\xd6\x42\x47\x0d\x22\xd8\xb6\xbd\x2d\x76\xc1\x6b\
+\xd8\x34\x4c\x53\x18\x0b\x36\x31\xf9\xc5\x04\x60\xb9\xce\xb6\x67\
+\x16\xd6\x3d\xb3\x4d\x1f\xa0\x20\x01\x58\x8b\x94\x5e\x6e\xc5\xf0\
+\x22\xf0\xf1\x20\x2e\x25\x08\x40\xf8\xd9\xbb\x52\xad\xff\xe4\x06\
+\x60\x5e\xf7\xfb\x24\x0f\xe5\xcf\x6e\xdd\xc3\x28\xce\xd6\x4b\xd4\
+\x07\xe5\x04\xa0\x2a\xea\xd5\x1b\x2a\xcd\x5b\x04\x6f\xa7\x20\xc4\
+\x31\x7d\xef\x39\xa2\xb0\xaa\x20\x26\xf5\x04\x5c\x55\x18\x1d\x78\
+\x36\x99\x00\x60\x11\x1e\x0f\xff\xfa\xc0\xc4\x83\x66\x1c\xec\x71\
+\x45\x2f\xcb\xf8\x02\x22\x66\x4d\xa4\x67\x8c\xa7\x2a\x3c\xe4\x9b\
+\x14\xa2\x59\x91\x09\x3c\x57\x2e\xc0\xbb\x61\x2e\xdf\x0a\xa4\xc1\
+\xa0\xb4\x88\x0f\xe7\x66\x30\xc5\x26\x33\xdb\xaa\x7e\x79\x4c\xb5\
+\x66\x3c\x09\xe2\xcb\x81\x11\x27\xd4\xd6\x6a\x06\xcc\x3d\x58\x9f\
+\xd1\x41\x66\xd0\x87\x9e\xec\xfa\x67\x03\x24\x13\x00\x1a\xf8\x63\
+\xc8\x9e\x3f\x67\x9c\xd4\xb5\x38\x01\xe0\x56\xdf\x1d\x28\xca\x8f\
+\x7a\x05\x5b\x1f\xf0\xfe\x97\x90\x82\xbd\x32\xc0\xf2\x54\x46\x9e\
+\x0b\xc5\xce\x3f\xa7\x12\xb9\xfa\x8d\x34\x91\x6a\xa7\xa1\xc2\x50\
+\x9d\x45\x48\xc8\x98\xdf\xff\xc5\x81\x6f\x62\x9a\x0e\x16\x25\xdc\
+\x26\x4a\x0c\xee\x4b\xed\xb0\xd9\xf8\x1d\x6a\x37\x62\x3c\x94\x27\
+\x0f\x57\x25\x02\x07\xb3\x72\x06\x26\x4a\x36\xc5\xcf\xde\x73\x98\
+\xf2\x2d\x80\xd0\x36\xb4\x0a\xb1\x38\x26\xbf\xca\xba\x01\xa9\x36\
+\xd1\x16\x3f\x0a\x28\x40\xac\x2c\x4f\x00\xc6\x0d\x1c\x00\x79\x6c\
+\x81\x2c\xac\x41\x50\xfb\x52\x34\xb1\xf9\xa1\xdc\x78\x71\x10\xbb\
+\x18\xcb\x10\x2d\xe6\x1c\xbc\x86\xbf\x8b\x55\xcc\x87\x20\x41\x8e\
+\x32\x89\x04\xc0\x28\x6d\x00\x53\x5c\x0d\xee\xcf\xe8\x6c\xc2\x44\
+\x43\x4e\x54\xe2\xca\x9c\x43\x53\x21\xc0\x34\xdc\x8b\x3e\xc9\x5c\
+\x3f\x57\x1a\xc0\x66\xe5\x0d\x33\x1a\x82\x0c\x1a\x80\x36\xfc\x00\
+\x51\x02\x40\xf4\x0c\x0e\x42\xa2\xe1\x2b\x67\x1c\xc8\x12\xa2\x47\
+\x44\xfa\x93\x55\x90\x8e\xfb\xb1\x0a\x19\xf9\x2a\x5c\x11\xc9\x29\
+\x12\xca\xd9\xe5\xea\x27\x30\xaf\x07\xad\xe2\x1f\x55\xf7\x3a\x29\
+\xa0\x49\x15\x89\xbe\x66\x73\x95\x7e\x89\xea\x9e\x20\xd0\xd2\x9b\
+\xbc\xc8\x91\x78\x5d\x65\x1c\x12\x59\xab\xc0\x5c\xf5\x6c\xd2\x87\
+\x29\x55\x89\xf4\x7c\x19\x69\x1d\x0e\xf4\xbe\x47\x96\xe3\xdd\x58\
+\x4c\x0c\xd3\x54\x2c\xe5\xd6\x96\xde\xee\xba\xde\xf1\xcf\x6e\xd2\
+\x19\x68\x10\xaa\x59\x0d\x88\x98\x27\xac\xbb\x92\x0a\x16\xb7\x41\
+\xfd\xf3\x3a\x6c\xf1\xd3\x10\xee\x47\x84\x56\xc1\x5c\x3a\xf6\xeb\
+\xce\x85\xf2\x84\x24\x65\x0a\xb5\x55\x3b\x61\xab\x62\xa3\x95\x10\
+\x80\x0d\xaa\x4f\x83\x04\xb5\x1a\x62\x56\x93\x73\x09\x93\xc6\xb8\
+\xf8\x21\x50\x45\x3d\xbe\x49\xa8\x36\xa5\x4c\x9b\xde\x9c\x0b\x44\
+\x9e\x95\x73\x05\x39\xe8\x7b\x1d\x78\x34\x7a\x35\x60\x72\xd6\x0a\
+\x2f\x9f\x82\x62\x7d\x30\x24\x48\xd0\x60\xb1\x15\xe2\x4a\x2d\x02\
+\x47\x74\x3c\x92\x0a\xe4\x0c\x01\x56\xb8\x72\x3b\x98\x88\x85\x5e\
+\xe3\x96\x89\x67\xf9\x8f\xbe\x62\xcb\x2f\x62\xa3\x4a\xbe\xd6\x5c\
+\xcb\x1f\x05\xcd\xf0\xc2\xc4\x3a\x0e\xff\x21\xdd\x7e\x56\xcd\x13\
+\xfe\x83\x0f\x70\xa3\x92\x74\x84\x03\xa0\x75\x07\xcd\x81\xf6\x89\
+\xfd\x35\x5c\xae\x7b\x25\xd4\x0d\xe3\x2e\x88\xb9\x54\x94\x0a\xcb\
+\xee\xe2\xcf\xf7\xf7\x6b\x58\x2a\xef\x1a\x21\x03\x21\x01\x9c\x08\
+\x0f\xa4\xdd\x90\x68\xc6\xe3\x96\xda\x64\x46\x80\xfd\x5d\xf5\x88\
+\xd7\xb2\xbc\xae\xcb\x02\x39\x85\xaf\x4d\x46\xb2\x57\x1f\xa5\xf4\
+\xd7\x91\xb8\x9e\x6d\x49\x1a\xbb\x16\xa2\xde\x09\x42\xe2\x1c\x8f\
+\xf8\xba\xef\xd5\x1e\xac\xa0\xdf\x90\xb2\x9c\x86\xc8\x09\x55\x0b\
+\xc8\x9c\x08\x1c\x9f\x85\x31\x12\xe0\xee\x93\x13\x45\x6a\x87\xe9\
+\x46\xad\x80\x34\x62\xac\xf1\x0f\x22\x4f\x88\x43\xce\x9b\xc4\x0a\
+\xf7\xc9\xac\x2d\xd2\xf0\x67\x8d\x73\x8b\x44\x9c\x91\xf6\xf0\x48\
+\x39\x7f\x26\x84\x90\x4c\xa2\x94\xbc\x28\xfa\xd6\x73\x59\xfa\x71\
+\x31\x3e\xe3\x1e\x2c\xc5\x44\x4d\x87\xb2\xc5\xe2\x64\x64\x24\xbb\
+\x8f\x27\x12\x74\x22\x7c\x69\xb2\x10\xbe\xdf\x5d\x38\x60\xc6\x42\
+\x08\x06\x04\xf8\xdb\x46\x95\x7a\x79\x0f\x54\xd9\x90\x07\x2b\x13\
+\x7c\x92\x87\x0d\x82\xae\xc9\x0d\x39\x26\x47\xa2\xe4\x91\x3f\xb6\
+\x19\x87\x51\xee\xdd\xaf\xd7\x7a\x81\x2a\x0f\x26\x21\xa9\x1a\x7b\
+\xc7\x17\x4d\x58\xf8\x0a\xc2\x05\x68\x10\x50\x88\x55\x16\xf6\x1c\
+\xc4\x0e\x41\x26\xb9\x3e\x08\x28\xc0\xc0\xd1\x16\x40\xf3\xd3\x56\
+\x35\x48\x91\x21\x47\x88\x13\x80\x83\xf5\x55\xbd\xa4\xc4\xd6\x1e\
+\x28\x8c\xdc\xae\x0a\x87\xb5\x32\x81\x41\xe4\x3a\xd7\xff\xae\x06\
+\xc3\xa4\x50\x25\x11\xa8\x10\x68\x7d\x02\x10\x1d\x94\xe6\x82\x66\
+\x2c\x09\x80\xf5\x68\x83\xee\x0d\x7f\x8b\x36\x00\x43\x40\x50\xd5\
+\xd2\xa2\x09\x04\x4d\xd3\xa0\xc8\x2b\xc0\x4f\xd0\x48\x07\x33\xf7\
+\xaa\x90\x21\xf8\xf2\x60\x9f\xe8\xdf\x47\x84\x3e\x88\x44\x79\x72\
+\x09\x80\x14\xfc\xf9\x59\xa0\x07\xc3\x1d\x09\x00\xe2\x1e\xd4\x43\
+\xc9\x14\xd3\x78\xb9\xcf\x97\xc4\xfb\xb0\xfc\xbb\x36\xa3\x88\x18\
+\x25\x01\x85\x5c\x80\xa0\x79\xc0\x82\xbc\xd6\xef\x3e\x4c\x21\x59\
+\x3e\xa4\xa6\x22\xf6\x26\x00\x63\xd6\x09\xf1\x72\x6f\x2e\x6d\xbe\
+\x70\xbd\x7e\xcd\x27\xd6\x58\x2c\x51\xac\xf1\xb2\x96\x69\x9e\x6a\
+\x88\x9d\x3e\xc3\xbe\x37\x6a\x1b\xae\x16\xc9\x83\xe8\x73\x07\xa0\
+\x89\x00\x41\x6c\xe2\x16\x82\xf6\x1c\x48\xb2\x71\x10\x24\xeb\x45\
+\xd2\x38\x04\xc9\xf7\x5e\x5b\x8f\x7b\xd5\x03\x17\xc2\xfb\xdd\x56\
+\x25\xa2\x3a\xea\xb7\x86\xcc\x82\x56\x74\xdb\x13\x01\x1f\x9c\x50\
+\x46\xe7\x2b\x21\x16\x3c\xd3\xb0\x23\xcb\xa6\x23\x52\xdc\x98\xe9\
+\xbd\x8c\x8a\x83\x55\x9c\x6d\x35\xfd\x58\x68\xa2\x63\x76\xb4\x04\
+\xf0\x81\x3d\xd2\x7e\xaf\x30\x0b\x1e\xe6\xee\x81\x91\xe8\x84\x16\
+\x0d\xe9\xe9\x3b\x1d\x76\x7a\x90\xd6\x09\xa7\xba\xf6\xc0\xa6\x1e\
+\xdc\xa8\xda\x80\xe7\xb0\x6d\x41\x0b\x00\xeb\x53\x03\xd2\xf0\xa7\
+\x62\x53\x0d\x0b\x86\x2d\xd9\x74\x26\x09\x5d\x47\x8e\x73\xf8\x70\
+\x5e\xe7\x7a\x1b\x84\x8a\xa4\xfa\xcc\xdb\xc9\x47\x86\xb5\x63\x20\
+\xea\x6f\x4b\xea\x95\x71\x12\x1b\xfb\xc5\xd7\x1a\xcb\x99\x3c\x67\
+\x7e\xb0\x00\x31\x2c\x72\xbd\xe2\x7d\xa4\xc6\x49\xf9\x33\xc9\x59\
+\xd2\x08\xcc\x7e\xfa\x3e\xed\xc1\x24\x38\x24\x34\x81\xdc\xce\xbb\
+\xd8\xc2\xcf\xb0\x05\x6e\x7e\x10\x0a\x00\xbf\x96\x5d\x02\x37\x45\
+\x2d\x8c\x96\x24\x04\x53\xc4\x51\x89\x09\x82\xa0\x20\x00\x10\x15\
+\x12\x74\x8a\xc5\x30\xa5\x54\xf0\x7c\x97\x5a\xe4\x4f\x6d\x9f\xfe\
+\xf2\xd3\x29\x97\x73\x15\x55\xea\x83\x6c\x3e\x53\x0d\x18\x1d\x0c\
+\x95\xbf\x2c\x3f\x3d\x29\xee\xa3\x8a\x13\xe4\x4a\x1a\xe6\xad\xd8\
+\xcb\xe7\x1e\xdc\x1e\x00\xb1\x65\x12\xc6\x10\x37\xa8\xd7\x92\x69\
+\x1a\xab\xba\x12\xea\x28\xd6\x72\xce\xd6\x83\x11\xb8\x72\x72\x25\
+\x5f\x31\x8e\xc1\xf5\x24\x41\x9b\x26\x01\x16\x89\x30\x14\x38\x5e\
+\xe5\x0e\x2b\xdd\x7d\x09\x02\x59\x89\x91\x6a\x2a\xc7\xe2\xdc\x4c\
+\xb8\x03\x51\xbd\x6d\x1b\xa9\xc2\x06\x86\x3e\x49\x7c\x4a\xda\x1d\
+\xdc\xbf\x7d\x23\xb9\x86\x25\x41\x12\x7b\xde\x41\xe7\x9e\x7f\x41\
+\x34\xe4\x21\x3b\x37\x8b\xdb\x3b\x69\x77\x38\xc3\x84\x73\x50\xff\
+\x6e\x18\x95\x91\x37\x6d\x6e\x3e\x67\x9d\x6a\x48\x62\x19\xdb\x09\
+\x53\xf6\xbe\x54\x41\xb6\xac\x37\x48\x67\xfb\xb1\x08\x91\xa1\x0e\
+\x86\x37\xaa\xfe\x17\x58\x1f\x08\xa9\xb3\xe9\x81\x79\x21\xc4\x9e\
+\x09\xe5\x68\x0c\xb5\x6f\xd6\x6d\x6e\x47\x22\x87\xcb\x93\x0f\xda\
+\x9e\xf9\x44\xbe\xf2\x2d\xa8\xdb\x5e\x67\xaa\x02\x85\xe8\x19\xa9\
+\x33\xe9\xa2\x57\x7c\x69\x82\x31\x96\x69\x35\xe0\x04\x20\x6a\xc1\
+\x85\xb1\xcb\x26\x31\x49\x55\xaa\xbc\xd7\x74\x12\xa9\x0f\x4f\x42\
+\x95\x8c\xb7\x8d\x24\x49\x6f\x0f\xf9\xbd\xb5\x3c\x5b\x60\xf2\xf2\
+\x38\xf0\x73\xdd\x91\x58\xe5\x91\x12\x58\xb5\xbd\x35\x16\xf4\xd5\
+\x4b\xcd\xeb\x94\x75\xea\x26\x6a\xa4\x64\x39\xd2\xa6\x48\xa3\x29\
+\xcd\x61\x52\x2d\xad\xb7\x5b\x29\x2f\xa4\xf7\x3b\x09\xca\x29\xe9\
+\x31\x14\x2d\xa0\x1d\x2d\x81\xd6\x8b\x7f\x00\xb3\x58\x45\x95\xc3\
+\x21\x2d\x5b\xaa\x2b\x6a\x8d\xa2\xb2\x96\x9e\x30\x94\xa1\x23\x5a\
+\x92\xc3\x83\x55\xeb\x1f\x9e\xc6\xe8\x1c\x59\xe5\x04\x48\xeb\x1b\
+\x25\x43\x3d\x92\x05\x16\x8d\x61\x00\x65\x98\xc0\x82\x75\x3a\x81\
+\x2b\xaf\x72\x81\x68\xb0\x87\xcf\x18\x23\x73\x99\xf6\x60\x8b\x10\
+\x12\xcd\xee\x37\x82\xbe\x49\x02\x00\x11\xfb\x3f\x75\xb0\xc4\xed\
+\x19\x77\xaf\x56\x41\x1d\x85\x40\xb9\x2d\xe0\x4b\x41\x79\x0c\x2a\
+\x62\x22\x11\x4f\xfe\xac\x2a\xd9\x2e\xe3\xa3\x84\x39\xc4\x02\x84\
+\xfe\xb4\x49\xba\x01\xd6\xf7\x9c\x10\xc8\xad\x32\x9b\xa8\xf8\x29\
+\xc7\xe4\x76\xc1\x1f\x84\x24\x0a\xed\xab\x88\xdd\x8f\xf6\xe7\xa5\
+\xd7\xbe\x2f\x29\x09\x9a\x12\xa3\x5a\x78\x34\x02\xaa\x43\x90\xad\
+\x43\x3c\xbe\x58\xf5\x26\x9a\x78\xd8\x4a\x4e\x96\x89\x7e\x52\x02\
+\x90\xb7\x31\xc6\x49\x7a\xd9\x7d\x82\x48\xfb\x21\x2e\xe4\x00\x25\
+\xd3\x46\x9c\x7e\x11\xa7\x6e\x92\x67\x3a\x17\xe2\x19\xd5\xf6\xa4\
+\x1b\xcb\x96\x65\xca\x4d\x9c\x08\x5e\x5a\x44\x74\x24\x31\x45\x36\
+\x15\x6d\xa0\x6f\xd0\x06\x68\xd0\x64\xd0\x5d\x99\x8a\x15\xec\xee\
+\x35\x34\xc9\x99\x6e\x19\x01\x70\x50\x96\xef\x79\xfb\xcd\x37\x11\
+\x8f\xf1\xfa\xb0\x25\x01\xa0\x02\x28\xa5\x95\x7f\xd8\x40\x40\xe0\
+\x59\xd1\x0f\x5a\x1d\x55\x34\xc2\x48\x88\x4d\x38\x20\xc6\xf3\xa3\
+\xad\xe3\x19\x70\x33\xa0\x83\xf5\xa4\xad\x58\xc8\x08\xd2\x70\x62\
+\x06\x09\xc8\x1f\x1a\xd4\x8f\x81\x5f\x63\x4c\xbe\xc9\xb4\x48\x32\
+\xa3\x2b\x98\x4c\x56\x47\x4a\x73\x74\x14\x95\x07\x0e\x29\xb8\x05\
+\x1e\x02\x23\x7f\x5d\xc5\x01\x30\x4a\x65\x4e\xc7\xe6\x1c\x3f\x23\
+\x37\x5d\x50\x97\xf2\x68\x8a\x5d\x0e\x8d\x00\x51\xc7\x3c\x1b\x77\
+\x4d\xf5\x93\x53\xc2\x55\xef\x7e\x92\x00\xa9\xcf\x2f\x27\x00\xf6\
+\x86\x68\x00\xc4\xed\x29\xa4\x2a\xea\xfe\xae\xba\x1c\xe2\x21\xe0\
+\x93\xe7\x27\x5e\x87\x49\x72\x2d\x74\x98\x5d\xde\x87\x2d\xfe\xf7\
+\x87\x00\xed\x7b\x76\x7d\x6f\x84\xef\x01\xc9\xc9\x81\x5d\xfd\xff\
+\x61\x44\xd7\x09\x0a\xe2\xb4\x24\x11\xd5\xda\x8b\xaf\xfb\x3c\x7a\
+\x83\x11\xcf\xd4\x39\x4d\xfa\xee\xc2\xf9\x51\xa6\xd9\x01\x19\xf2\
+\xb5\x42\x0c\x67\x3a\x08\x75\x1f\x8b\x08\x49\xeb\x17\xf3\xc4\xea\
+\x42\xd1\x23\x7a\x3e\x72\x32\xef\xbe\x16\x80\x43\x2d\xaa\x60\x06\
+\x34\xde\x88\x5c\x20\xbb\x07\x86\xc0\x59\xd0\x17\x66\x62\x17\xa1\
+\x0f\x3e\xd2\xc3\x6a\x98\xd4\xc3\xb1\x56\xdc\xc5\xe2\x40\x38\xcd\
+\x9b\x75\x0a\x06\xac\x2e\x67\x84\x0c\x97\x5f\xc7\x28\xcc\x74\xc6\
+\xd2\xac\x8b\x53\x14\x1f\x75\x9c\x50\xc6\x8f\x88\x34\xeb\xec\xec\
+\xf9\xef\x1e\xe0\x7b\xdb\x63\xf7\x43\x3e\xff\x5f\x56\x09\xe4\xff\
+\x1e\x84\xea\xdf\x50\x52\x0d\x51\xb8\x2b\xa9\xfe\x33\x2d\x19\xf1\
+\x7d\x8d\x17\x23\xaa\x49\xff\x15\xd6\xcd\x07\x05\xfd\x6a\xa4\xdf\
+\xbd\x8e\x37\x52\x78\xd1\x5c\xd5\xf3\x8f\xbf\x3f\x66\x1d\x73\xff\
+\x80\x6b\x46\x0c\x21\xa9\x5b\x70\x66\x44\xcb\x64\x49\x2b\x4e\xd5\
+\x90\x84\xe4\x60\x19\x79\xe9\x76\xd0\xbe\x7c\x50\x63\x9e\x49\xae\
+\x72\xbf\x55\xe0\xb7\xba\xb1\xd8\x10\xc8\xb8\x58\x1e\x9a\x5c\xdb\
+\x21\xad\x3e\x28\x7b\x28\xe4\xc4\xc2\xb4\xfd\x88\xbd\x29\xe8\x1c\
+\x3a\x86\xae\x83\x2f\x87\xc9\xaa\x1e\xa6\xdd\x36\x53\x73\xe4\x56\
+\x14\x73\xe3\x93\x1f\xd5\x01\x42\xe0\xcb\x9e\x31\x29\x5e\x02\xf7\
+\xb3\x0f\x0e\x77\x4d\x9f\x52\x60\x8d\x45\xa8\xf2\x41\x14\x14\x82\
+\xa6\x34\xc2\x9e\x3e\xef\x6a\x32\x69\x60\xe8\xa8\x7c\x2f\x8d\x88\
+\x9a\xc8\x3e\xbc\x1e\xb6\x1b\x26\xa9\xce\xaf\x6b\xac\x59\x13\x80\
+\x98\x70\xc0\x7b\xc6\xf9\x79\xc2\xb4\x99\x45\xe4\xf9\x8e\xd8\xdd\
+\x95\x02\x83\x04\xbd\x7b\x20\x63\x77\x3a\x91\x28\x0f\x27\xe7\x33\
+\xa9\x58\x3a\x57\x47\x15\x80\x09\xcd\xc8\x6e\x65\xf9\x31\x0d\x36\
+\xcf\x8a\x89\x6e\xbe\xea\x58\xb3\x68\xd5\x8e\x75\x42\x70\x76\x01\
+\xac\xb7\x25\xa8\x11\x5d\x77\xec\xb5\x60\xd0\x28\x1e\x90\xf1\x9a\
+\x2d\x44\xac\x3a\xa1\xb1\xef\xfb\x90\xb9\x79\x6d\xe2\x9c\xb8\xf6\
+\xb2\xd1\x35\xe1\xaa\x52\x87\x9c\x71\x7f\xd1\x64\xa4\x45\x27\x42\
+\x62\x0c\x2c\xfe\xbc\x8c\xf0\x36\x38\xfc\x3a\x6d\x01\x3d\xc8\x4f\
+\x04\xea\x4e\x11\xec\x6a\xd1\x34\xa9\x54\xc8\xc7\x88\x8e\x90\x65\
+\x1e\x0a\xb7\xe9\xe5\x6f\xbb\x5f\x10\x2c\x92\x91\x21\x56\xc5\x9e\
+\x73\x64\x81\x7c\x30\xbb\x93\xea\x9c\x00\x0e\x9e\x82\xa9\x99\x4b\
+\xe5\xa5\x8f\x7b\x0a\xae\x0f\x06\x20\xbd\xdd\xa4\xa5\x36\x43\x31\
+\x73\x66\x3c\xfc\xcf\x3d\x69\x6e\x30\xd9\x24\xa2\x91\xce\xe2\xc1\
+\x88\xad\xd2\x32\xfb\xdd\x42\x5e\xda\xe6\x39\x7a\xa9\x4a\xa6\xe4\
+\x76\xfd\x2c\xd0\x79\x3b\xdc\xbf\x64\x97\xf3\x21\x36\x26\x1a\xcc\
+\xcd\x0b\xf5\x3b\x11\x72\x38\x18\x75\x51\x6e\xd3\x7c\x06\xc2\x64\
+\x27\xd3\x02\xa8\x12\x4a\xcf\x95\x1e\xd1\x18\x5f\x81\x79\x48\xb1\
+\xc8\x87\x4d\x40\x3e\xe9\x05\x54\x09\xfc\x80\x46\xdd\x54\x50\xd8\
+\x5a\xa1\x95\x46\x4b\xb2\xc5\x09\xf5\x82\x8d\xd0\xbb\xb4\x49\x7b\
+\x4c\xd5\x3e\xb3\xe4\x50\xec\xf1\x33\xa2\xba\x09\xc4\x8a\x35\xba\
+\x3e\x28\x4e\x30\xea\xde\x88\xae\x73\xc5\x1a\xf5\x3b\xa5\x41\x6b\
+\x94\x64\x3a\x89\x63\x2c\xa4\xb4\x4c\x42\xa4\x13\x00\x6d\xd4\x73\
+\x3f\x2b\xfd\xbe\x13\x86\x29\xd2\xa5\xb8\xee\x1a\xcd\x46\x79\x64\
+\x6e\xb5\x5c\x86\x4e\xe5\x10\x8c\x9b\xbd\x48\xf5\xe8\x18\xdf\x56\
+\x21\x7a\x4d\x45\xf7\x2d\x54\x5f\x56\x09\xce\x39\x8d\x7d\x6e\x73\
+\x1c\x50\xc4\xca\xc1\xff\x5d\xc2\xe1\x53\x53\xa1\xcc\x4c\x2b\xdd\
+\x52\x8a\x56\x6b\x6d\xb5\xbd\xac\xa0\xb7\x6f\x6a\x6a\x9b\x05\x71\
+\xba\xa8\x2b\x15\x13\x02\x91\x4b\x46\xae\xb9\x83\x82\x82\x59\xe1\
+\x50\x6c\x54\x58\xdc\xaa\xde\x78\x97\x33\x9b\xd0\xd8\xa1\x12\x23\
+\x56\x97\xb9\x65\xe4\xb6\x83\x24\x4c\x62\x11\x33\x9a\x8f\xf4\x8d\
+\x7e\x2a\x40\xef\xab\xe5\x33\x6f\x59\x9b\x79\xa4\x92\x9e\x3d\xa0\
+\xac\x4f\x1e\x1d\xa9\x15\xb1\x98\x9a\xb5\x2e\xf0\x67\x55\x9d\xb6\
+\x20\xa7\x48\xb7\x7e\xa9\x2a\x96\xaa\x3f\x78\x4f\xf3\x0a\x9b\x0b\
+\x5a\xac\xb0\xe4\x21\x26\x6e\x49\x44\xc5\xba\x78\x74\x4d\xd6\xa2\
+\xa7\x86\x3e\x78\xbe\xd7\xb0\x4a\xb3\xb0\x7f\xdd\xf3\xc3\xb7\x30\
+\xa8\x4b\x1a\xe9\xa4\x3a\xc3\x3c\x09\x23\xf4\xdb\x43\xc6\xef\x0e\
+\xdb\xaa\x1b\x13\x84\xc8\x74\x10\xe2\x28\x03\x86\x8b\xb9\xb8\xce\
+\xe3\x7c\x85\xcf\xc5\xb3\xf4\xd4\x9f\x81\x5f\x5b\xc9\x75\x96\x8b\
+\x46\xf1\xde\xbd\x11\x92\x47\x50\x44\x5b\xf0\x75\x71\x25\xc7\x2d\
+\x1c\x88\xf4\xa4\x06\x25\xcb\x3a\x71\x28\xaa\x78\xe9\xd6\x52\x29\
+\xa9\x8e\x4f\x14\xe4\x82\xa6\x56\x44\x04\xa3\x2a\x13\xf5\xf6\x75\
+\x65\x50\x10\x2a\x7a\xc3\x90\xab\x74\x25\x1e\xdb\x25\x5b\x35\x61\
+\x8f\x5a\x14\x83\xc6\x0b\x40\xfd\xfb\xae\xb0\xc2\x2f\x68\x35\xe3\
+\xf3\x99\x8e\x68\xa6\x78\x0f\xb2\x09\xdb\xde\x62\x22\x3a\xcb\xfb\
+\x7d\x46\x47\x8f\xeb\x75\x97\x63\x1f\xc6\xde\xd0\x86\x39\xc0\x69\
+\x6e\x77\x46\x15\xdd\x09\xd0\x2f\x50\xe2\x95\xda\xa7\xa1\x95\x19\
+\xb1\x62\xdc\x55\xfd\x1b\x41\x88\x83\xcf\xd5\x83\x2c\x0e\xc1\x66\
+\xb5\xf9\xc2\x56\x49\x6b\x18\x41\xe8\x4c\xe4\x4f\x8f\x5b\x00\xad\
+\x67\x90\x9a\xac\x9b\x5c\x3c\x9f\x7f\x8b\xd9\x75\x29\x01\x1b\xd7\
+\x19\x7d\x54\x21\x33\xa2\x5f\x7d\xb0\x0a\xcc\x9e\x08\x7c\x02\xa9\
+\x27\xf0\x46\xa4\xd6\x87\xfc\x3c\x2b\xc4\x85\x38\x23\x58\x35\xeb\
+\xcb\xb6\x07\xab\x4a\xe7\x62\xbb\x69\xfc\xd2\x13\x4c\x59\x6b\x20\
+\xdd\x53\xdf\x5f\xb9\xb7\x43\x7a\xea\xa5\x84\xdc\x46\x03\xbb\xbb\
+\x1f\xd3\x0e\x64\x61\x12\x98\xd9\xa6\x10\x01\x70\xbd\xe0\x89\x68\
+\x55\xf0\xf9\x7f\xae\xd8\x96\x73\x1e\xbc\x9d\x40\x93\x9b\x5b\x0f\
+\x96\xd1\x84\xe8\x76\x30\xe4\x9a\x6a\x36\x7d\xa1\x27\xf8\x39\xf6\
+\x79\x7a\xfc\x9a\xea\x43\x00\x1d\x27\xce\xd8\x40\xe7\xda\x97\xa9\
+\xb1\xd3\x54\x20\x6e\xd4\xa9\x21\x23\xc2\xe2\xda\x59\xb8\x85\xb9\
+\x5e\xda\x0a\xa8\x57\x15\xd9\xba\x88\xec\x08\x02\xd4\xbf\xe7\x9c\
+\x04\xda\x3e\x5c\x47\xd6\xb1\x86\x49\xd3\x5f\xdf\xc7\xbf\x79\x02\
+\x90\x9a\xc1\xde\xa7\x0c\x25\x67\xa2\x52\x0f\x30\x26\xc4\x41\x82\
+\xc5\x8f\xe7\x40\x61\x9d\xc5\xb7\xe2\x68\x4e\x09\x0c\x49\x15\x91\
+\x24\x27\xbd\x51\xe1\x07\x28\xfd\xb9\x88\x74\x27\xfd\xde\x25\x51\
+\xd4\xbe\xd5\x67\xab\x7d\x80\xce\xdd\x2c\xac\x2c\xad\x6c\x12\xf0\
+\xe8\xc6\x91\x4b\x32\x16\x06\xcc\x92\x59\xd0\xc5\x46\x8c\xe8\x5b\
+\x54\xb2\xbe\x27\x29\xf5\x0c\xb5\xa0\x72\x08\x64\x48\x4c\x40\x6a\
+\x56\xe5\x2c\x99\x33\x91\x5a\x03\xe1\x33\x2b\xaf\xf7\x60\x95\xd9\
+\x5e\x6e\x6e\xb4\x0f\xa2\xd7\x65\x50\xf7\x26\x00\xda\xf5\xdc\x56\
+\xd5\x50\x92\x4c\xad\x11\x2b\x3d\x79\xbf\x0f\x96\xf2\x81\x06\xb3\
+\xa3\xc5\xb0\xb3\xc2\xef\x79\x82\x9c\x52\xe8\xe3\x02\x5b\x20\x18\
+\x4c\x19\x81\xd8\xab\x55\xf9\x36\x63\x09\x9e\x6a\x0b\x52\xe2\x5d\
+\x1c\x40\x34\xed\xfa\x52\xad\x91\x9c\x26\x07\x44\x5a\x28\x1c\x49\
+\x20\x3c\x1e\x51\x94\x0a\xf2\x3c\x87\x4e\x77\x40\xcd\x41\xfa\xb2\
+\xb4\x7c\x49\x0c\x1b\xc5\xa9\xa9\xe2\xf5\xd8\x07\x0e\x52\xa3\x5e\
+\x17\x3c\x86\x40\xbe\x9f\xf3\x70\x77\xfb\x8b\xd0\x4d\x75\xd2\x56\
+\xbe\x26\x33\x9e\x37\x46\x73\xee\x29\xe8\x4f\x82\xef\xe5\x45\x8e\
+\x37\x3a\xd7\xfd\x1f\x23\x88\x28\xae\xf2\xa7\x88\x15\x9b\x65\xd7\
+\x5e\x12\x80\xe3\x2a\xc6\x70\x24\xef\xcd\x05\x30\x88\x4c\x6f\xa6\
+\x22\x2b\xae\xf8\xfb\xb4\xf9\x09\x0d\xc6\x92\x88\xd2\x2d\x02\xca\
+\x94\x6c\x33\x89\x55\x10\x57\x31\x3c\x70\x9f\x80\x2d\xf0\x9d\x74\
+\x80\x5b\xa6\xf2\x58\x42\x6a\x83\xdd\x81\xb4\xb8\x77\xde\x6f\xef\
+\xc7\x97\xf7\x30\xf7\x22\x43\x82\x45\xad\xa4\x87\xce\xc9\xb4\x43\
+\xd0\xd9\x7f\x3c\x09\xc0\x94\x20\x09\x82\x38\xda\xaa\x05\x53\xbd\
+\x8d\x37\xe6\xa7\x59\xce\xff\xb6\x03\x21\xf0\x8c\x62\x80\x2d\x1f\
+\xf5\x92\x50\x56\x93\x68\xdd\xde\xa2\xa7\x4f\x11\xb2\x3a\x37\x46\
+\x9c\x78\x7f\x4d\xb8\xe8\xda\x00\x17\xc1\xf1\xda\xbd\x23\xca\x7e\
+\xa3\xe0\x56\x99\x5f\x9b\x97\xef\xd0\x95\x5c\xff\x6d\x8c\x98\xae\
+\x7f\x0f\xb8\xaf\x04\x20\xc7\xaa\x37\x51\xeb\x20\xee\x65\x15\x20\
+\x0c\x1d\x04\x3b\x58\xd2\x3f\xe6\xbe\xe8\x52\x46\x36\x16\xa0\x16\
+\x0a\x9f\x81\x89\xed\x34\x3c\x2b\xe6\x84\xc0\x5e\xe2\x52\x80\xe2\
+\xe0\xa7\xcd\xec\x83\x0c\x55\xfa\x8c\x7b\x62\x55\x8b\xd6\xc7\xca\
+\x8d\x4d\x61\x24\x42\x3e\x58\x6e\xc9\xda\xa6\x12\x9f\x80\xda\x4b\
+\x9c\x70\x89\x3e\x0f\x4f\x04\x38\x9d\xf3\x7e\x3f\xf4\x1b\x89\xbd\
+\xb8\xef\xe9\xec\x42\x7b\x23\xa8\x18\x9a\x44\x40\x29\x47\x44\xea\
+\x83\xa4\xa7\x70\x6d\x02\x70\x2b\x22\x5c\xfa\x73\x23\x09\xd3\xce\
+\x88\x5e\xe8\x9c\x24\x4a\x7a\xe1\x57\x4c\x4b\xec\x4e\x00\xfa\x34\
+\x61\x51\xaf\xa8\xa1\xf0\xec\x1b\x13\x55\x33\x4f\xa2\x8f\xa2\xbb\
+\x5c\xba\xb0\xda\x1e\x2c\xaa\x9b\x06\x91\x98\xcc\x76\x46\x7d\x2a\
+\xa5\xe8\x29\x51\x1d\x2c\x4b\x4a\xb6\x7c\x77\x50\xb9\x27\xea\x7b\
+\x77\x5b\xcf\xb9\x89\xc6\xad\xe1\x9a\x04\xe6\xba\x04\x20\x24\xa5\
+\xda\x1a\x49\xaf\x9d\xbb\xfb\x83\x24\x8c\xb2\x89\x20\x11\xf0\x6d\
+\xe2\x86\xd1\x04\x60\x49\x02\x56\xa5\xaa\x0e\x22\x89\x48\xdd\x51\
+\xcb\xb0\x03\x7f\x54\x84\x73\xc6\x44\x35\x80\x36\xc2\xb9\x92\xef\
+\xe2\x80\xde\xa0\x11\x36\x75\xa1\x76\x46\x3d\x68\x62\x08\x97\x3a\
+\x1d\xc6\x73\xf4\x23\x21\x30\xd2\x91\xa5\x29\x3e\xf4\xa2\x71\x40\
+\x10\x0e\x1b\x4c\xe0\x9c\x22\x72\xe3\x1e\x82\x58\xcd\x8d\x3e\xba\
+\x20\x4a\x51\x73\x0b\xdf\x2e\xa1\x4e\x78\xb0\x51\x8f\xaf\x68\x72\
+\x80\xa9\x8b\x85\xef\x3e\x26\x60\x69\xc3\x94\x14\xcd\x4d\xa0\x74\
+\x69\xf4\xb1\x1c\x35\x90\x20\xfe\xb2\xeb\x72\xca\x75\xd7\x30\xe5\
+\xb5\x91\xa5\x08\x1d\xe8\xa8\xfa\x18\x25\x7d\xde\x5f\xe0\xa7\xfb\
+\x0c\x7c\x4f\x5f\x23\xa7\xc5\x48\xd8\x58\x3c\x15\x14\xd9\xfb\x46\
+\xda\x1f\xab\x40\x57\x97\xb3\x98\xe5\x07\xb6\x2d\xb0\x7b\xcd\x04\
+\x97\xce\x6c\x48\x5e\xa0\xa8\x5d\x80\x47\xb2\x7d\xaf\x9b\xaf\xd3\
+\xde\x0a\xc2\x67\x99\x6b\xe9\xae\x4b\x00\xa4\x33\xa0\x3d\xd8\x88\
+\x1f\x90\x33\x37\x4a\x23\x89\x5c\xe8\x2e\x87\x32\x3c\x8e\x16\x80\
+\x49\x98\xd9\xa5\xaf\x27\x61\x06\x04\xba\x43\x5d\xc4\x5c\xd5\x16\
+\x93\xcd\x6e\xa2\x06\x3d\xf8\x2a\x9b\xe9\xa2\x2f\xe8\x60\x9b\x0e\
+\x41\xd6\x28\x93\xbb\xf4\x94\x86\x1c\xc1\x31\x55\xf1\x6b\xca\x50\
+\x9a\x2f\xf8\x18\xe6\x4f\x4f\xd7\xd1\x76\x31\x2c\x2a\xdf\x4b\x48\
+\xde\x5b\xa7\xf1\x1f\x10\x07\x46\xe0\x19\xe4\xa0\x1d\x31\xac\xfb\
+\xd0\x07\x6d\x56\x3f\x05\xc7\xc0\xa5\x8b\x5a\xd1\xbc\x4e\xd8\x56\
+\xf2\x75\x53\x11\xd8\x7e\x42\x7d\x7e\xe6\x50\xd7\x19\xc5\x0b\x5d\
+\x67\xf9\xea\xbd\x4a\xea\x4a\xa8\x2a\x1e\x0e\xb1\x52\x19\xbe\x67\
+\x17\xeb\xe8\x5e\x72\xba\xa4\x02\x48\xe4\xbf\x7b\x6e\xf8\xf2\x38\
+\xb5\xf1\x37\xbe\x56\xc5\xba\x7a\x28\xed\xc1\x67\x12\x97\x6e\x0d\
+\xf2\x0a\xd9\x4a\x62\x79\x97\x7e\xcf\x2a\x42\x13\x38\xca\x82\xe6\
+\xca\x23\x31\x98\x51\xd5\x74\xa7\xbe\x18\x86\xb5\x83\xb4\x43\x14\
+\x98\x95\x2a\x24\x09\x7d\x6e\x1f\x5c\xdc\xf0\xdc\xbf\xed\x24\x43\
+\x9b\xe3\x06\x21\xb6\x32\xb3\xb6\x0a\x9f\xa5\xdd\x88\x92\x92\xbd\
+\x41\x65\xdb\x68\x59\x84\x52\x6e\xfa\x4e\xd2\x39\x48\xdd\xf7\xea\
+\xc1\x24\xfc\x2e\xd2\x6b\xcc\xad\xdf\xaa\x24\x11\x51\x92\x6f\x1d\
+\xf1\xbe\x3f\xa6\x7f\xd3\xdf\xdb\x14\xc0\x16\x37\x40\x50\x82\xa2\
+\x54\x21\x8f\x89\x59\x7b\xae\x78\x85\xfe\x9d\xf3\x78\xe6\x24\x39\
+\xff\xf7\x71\xc0\x3c\x6f\xc6\xaa\x2b\xf9\x1e\x63\xc2\x62\xb2\x44\
+\x1f\x5a\xeb\xef\x61\x8b\xc8\x75\x63\x77\x80\x2a\x1e\xc3\x5a\x01\
+\xda\xfd\x02\xd1\xc1\x30\x69\x97\x3b\x60\x25\x2e\x88\xb9\x04\x42\
+\xc5\x25\xeb\x3a\x80\x62\x99\x8c\x83\xb0\xcd\xc3\x5c\xdd\xe8\x2b\
+\xae\x88\x29\xae\x64\xf9\x4d\x82\xe5\x2b\x56\x74\x82\xf9\x47\x76\
+\xe3\xa7\x8c\x96\xb0\x72\x5a\x77\x5c\x2b\x45\xa9\xe2\x16\xfa\xfe\
+\xa7\x7f\xff\x3b\xc7\xdf\xe7\xbd\x04\xb6\x8d\x0d\xd9\xdb\x06\xf6\
+\xd2\x89\x82\x61\x4f\x05\x3e\xa9\x6c\x77\xcf\xcd\x90\xd6\x47\x57\
+\x6e\x2a\x16\x25\x3a\xbd\xd4\x9a\x70\xd7\x30\x89\xeb\x91\x7a\x62\
+\x48\x7b\x8c\xed\xf9\x61\x8c\x90\x3f\x7d\xc2\x09\xf2\xc1\xb2\x73\
+\x28\xc0\x8a\x94\x74\xa0\x90\xcd\x38\x6a\x59\xe2\x4c\xba\xe1\xd5\
+\xd1\x04\xa0\xe9\x24\x23\xb4\xe9\x06\x49\x00\x9e\x60\x98\x84\x49\
+\x1a\xbb\x09\x1a\xaf\xba\x51\x54\x4a\x8d\x0a\x81\x0d\x26\x75\xd1\
+\x08\xa2\x2b\xce\xba\xd2\x04\xc0\x24\x55\x24\xc3\xf5\x4c\xf3\xe3\
+\x21\xfc\xdd\x8e\x5c\x78\x97\xaf\xfa\x4d\x62\x76\x52\xaa\x66\x47\
+\x95\x40\x57\x46\x62\x19\x23\x22\x96\xbc\x20\x46\x65\x6c\x30\x75\
+\xd8\x80\x52\x15\x40\xc6\x3c\x28\x05\xad\x58\xc1\xaa\x12\x07\x6f\
+\x2b\x90\xea\xc6\x44\x8b\x81\x4f\x23\x00\xd3\x29\x18\xf3\x72\xb5\
+\x7d\xac\x52\x55\x0f\xa9\xb1\x49\x93\x81\x25\xc7\xb9\x8c\xfc\x09\
+\x0c\x0d\x19\x03\x1a\xc1\x14\x18\x9b\x1e\x4b\x17\x6f\x1f\x93\x21\
+\x72\xc0\xec\xb0\xcc\x43\xe2\x6b\x10\xef\xc2\xb8\x57\xb3\x56\x68\
+\x2d\x1a\xff\xca\x43\xee\x4b\x92\xf0\x86\xa7\xbf\x6c\xfe\x82\x2f\
+\xfe\x5a\x65\xee\xba\x4c\xb7\xa2\x4c\xa9\xce\x2a\xbf\xee\x79\xff\
+\xad\x04\x46\x23\x06\x68\x6f\xcb\x2c\x71\x03\xb6\x2a\xb8\xf1\xd1\
+\xca\x5e\x13\xb7\x32\x8a\x80\xce\x98\x98\xe8\x19\x65\x4d\x8b\xe1\
+\x28\x8c\x2d\x8f\xf3\x3e\x62\x15\xaf\xb6\x61\x45\x40\x46\x64\x36\
+\xc5\x5b\x13\x29\x14\xf2\x8a\xbe\xff\xba\xa7\x2f\xa3\xbb\x04\x05\
+\xc8\x71\x0a\xf6\x24\x3e\xbc\x7d\x02\x85\x23\x7d\x80\x8a\x3d\x48\
+\x27\x6a\x57\x06\x3c\x9e\x00\xe8\xfc\x03\x16\x57\xc4\xf6\xdc\x14\
+\xef\xa1\x7b\x86\xfb\x9b\x6c\x02\xb0\x6f\xad\x14\x27\x00\xba\x5b\
+\x12\x64\x02\xfa\x14\x57\xa7\x58\x20\x27\x52\x98\x5b\x17\x2c\xce\
+\x62\x71\x26\xdd\x01\xe9\xb9\x37\xc2\x0c\xf9\xc2\x2e\x45\x63\x1a\
+\xd1\xc4\x81\x63\xfd\x8f\x99\x8d\x90\x22\x08\xa2\x04\xa0\x5b\x37\
+\x5b\x87\x58\xa5\x7c\xd4\x0f\xab\x8b\x0d\x58\xd9\x70\xcc\xf4\x05\
+\x85\xfb\x43\x7e\x6f\x02\x1f\x82\xc8\x4e\xb2\xc4\xc3\x4f\x15\xb0\
+\x8a\x8e\x6d\x46\x0d\x01\xc8\x1d\x7c\xb1\x5f\x36\xf8\x69\x87\x6a\
+\xb5\x9e\x24\xa4\x31\xf7\xba\xdc\x3f\x40\x24\x4e\x59\x58\x44\x7d\
+\x4e\xfc\xb9\x22\x29\x4f\xee\xd4\x15\x31\xfb\xdd\xcf\x74\x61\xdd\
+\x55\x1d\xb0\x35\x22\x05\x60\x74\x00\x5c\xfe\xfe\x38\xff\xd5\xff\
+\xf3\x3b\xe6\xcf\x1a\xbf\x48\x0f\x70\x48\xb7\x7c\x5b\xf5\x2f\x07\
+\xfe\xd8\xe9\xec\x7a\x6e\x02\x46\x84\x92\x48\x05\x21\x09\x42\x30\
+\x67\xba\x55\x02\xb0\xb6\xab\xe2\x04\x60\x69\x29\x35\x48\xd2\x9a\
+\xb2\xec\xe3\x3d\xb3\xb4\x74\xf0\x6b\x14\xc6\xfc\xc2\xbf\x3b\x4f\
+\xe5\x54\xfd\xf1\xba\x04\xc0\x31\xfe\x3b\x8b\xda\x01\x61\xa4\xaf\
+\x1a\xb6\x92\xa9\x37\xde\xd3\x2e\x20\xa5\x95\xe3\x28\x3d\x3c\x22\
+\x14\x20\x95\x00\x8c\x0a\x4a\x5b\x22\x64\x64\x0b\x02\x12\xd0\x51\
+\xe8\x6e\x44\x68\x05\x24\xa6\x23\xee\xe1\xd5\xa5\xd0\x5c\x1a\x78\
+\xe9\x5a\xa4\x8a\x8c\x4d\x91\x34\xfe\x27\xe7\xeb\x6e\x7b\xe6\x90\
+\x82\xd7\xf0\xcf\xe8\x30\x45\xd4\xb3\xf7\x36\xb2\x20\xc2\xc1\x15\
+\xff\xfc\xd3\x62\xbe\xbc\x30\x14\xae\xf6\x1a\xa7\x44\x0f\x7e\x4c\
+\x8c\x2d\x8e\x31\x6b\xf7\xb2\x91\x70\x60\x5f\x37\x79\xc7\xfe\xfd\
+\xba\xb0\x1b\xc6\x2c\xad\x84\xcf\x96\x21\x4b\xf9\xb5\x6c\xe6\x63\
+\xd8\xcc\x97\x5f\x39\xb9\x6a\x22\x53\x09\xcb\x81\xa4\x10\xcd\x7a\
+\x6a\xc0\x51\xa9\xc9\x8e\xcd\x3f\xff\xf5\x7a\x3c\x29\x72\xbd\xce\
+\xe5\xf7\xb0\x06\xfd\xd8\x08\xa9\x45\xcf\x4e\xd7\x37\x30\x45\x1e\
+\x0f\x91\x58\x49\x27\xfd\xb9\xa5\x16\xbd\xeb\x33\x6d\xdc\x35\x9f\
+\x5b\x00\x1d\x17\x9f\x4a\x40\x81\x67\xa3\x9d\x27\x1f\xcd\x5f\xf0\
+\xc5\x5f\x35\xbf\xed\xc7\xdf\x31\xf7\xbf\xf5\x29\x94\xfc\xb0\x36\
+\x90\x9b\x2e\x20\x64\x4c\x88\x2a\xde\xba\xc0\x05\x90\x0a\x15\x01\
+\xf1\xef\xd8\xd5\xd7\xc7\x53\x35\xfc\xf3\x7b\xdc\x63\xb7\x6c\xce\
+\x1a\xa9\x78\xe2\x76\xce\x60\x64\xae\xd0\xc0\xfd\xd4\x63\xcb\x70\
+\x22\x0f\xdb\xc7\x02\x32\xd8\x0e\x9a\x9c\x15\x9d\x5b\xef\x63\xf1\
+\x9e\x8a\x5f\xc7\x35\x69\x70\x7b\xd9\x05\x4e\x99\x51\x4f\xd6\x58\
+\x87\x8a\x95\xae\x94\xe1\x7e\x8b\x40\x07\x14\x42\xef\x46\x94\xd0\
+\x1e\x51\x41\xb2\xee\xc7\x1e\x94\x29\x04\xab\x10\xb2\xc7\x9b\xd8\
+\xd0\xe6\x11\x44\x5e\xe4\xd8\xab\xda\x21\x4d\x47\xab\xfd\x8a\x25\
+\x26\x95\x53\xfd\x24\xe7\x39\xb0\xfb\x64\xb2\x68\x18\xd7\xc3\x90\
+\x13\x01\x9b\x4d\x42\xaa\x9b\xdf\x5b\x7b\x1f\x09\x40\x6a\x11\x83\
+\x80\x10\xe4\xc4\x1b\x26\x62\x38\x23\xf5\xff\xbc\xdb\xd3\x7a\x68\
+\xd3\x9e\x96\xd1\x35\xbd\x3b\x23\x4a\x61\xea\x95\x6e\x0c\x95\x35\
+\x5c\x3d\xab\x63\x64\xbc\xce\xfa\x0d\x4f\xe7\x7c\xd1\x3d\x19\x30\
+\xb4\x94\x80\x23\x4b\x5f\x0f\x8f\x08\xd6\x5b\x14\x14\x9b\xb5\xda\
+\x68\x99\x87\xf7\xe5\x7a\x3b\x83\x08\x80\xb1\x91\xce\x85\x9c\x27\
+\x24\x45\xb1\x90\x85\x15\xdb\x3c\xfe\x79\x3c\x3c\x32\x04\x04\x21\
+\x3a\x0a\x19\x29\x1d\xfc\x6d\xe4\xd8\xb8\x49\x51\x4c\x10\x83\x09\
+\xd2\xca\xb4\xf5\xe1\x13\x80\xf5\x00\x6a\x3c\x59\x0c\x29\xd7\x49\
+\x01\xf6\xdc\x7b\x7f\xf2\xe9\xd3\x0b\xe6\xef\xfa\xbe\xb7\xce\xff\
+\xcf\xb7\x7f\xe7\xe9\x7d\x5e\x37\x3f\x78\xf8\xc6\xb9\x3a\xdd\x8f\
+\xea\x21\x9d\x2d\x76\x01\xf6\xa2\x26\x77\x79\x5e\xc8\xc2\xb8\xd7\
+\x15\xea\x64\x18\xde\x5c\x15\xf8\xc9\x3e\xeb\x0c\xe1\x8c\xb4\xa4\
+\xd2\x9f\x58\xff\x5d\xd8\xa7\x6e\x1d\xa2\x71\xbb\x5a\x15\xdc\x02\
+\x4a\xdc\x8c\x74\xcf\xa9\x8f\x05\x31\x10\x73\x95\x3f\x9e\x3f\xef\
+\xd8\xe8\x6a\x22\x01\x68\xf8\x34\x51\x2a\xd9\xf6\x09\xe2\x71\x5d\
+\xbf\xcb\x7e\xaa\x0a\xf8\x0d\xe5\xc4\xad\x12\x47\xba\xc2\x7e\xbf\
+\xff\x37\xc7\x88\x04\x19\x27\x46\x47\xf1\x79\x88\x9f\x3b\x1c\x77\
+\x11\x12\x8b\x13\x20\xb1\x55\x33\xaa\x93\x5c\x71\x70\x07\xf1\x7e\
+\xe7\x3e\xbf\xe1\xc1\x1f\x3f\x77\x46\x80\x2e\x4a\x00\x54\xae\x9c\
+\xfd\x04\xa0\x03\xf9\xe7\x73\x3e\xf3\xef\xae\x27\x9c\xa4\x7a\xfd\
+\x90\x61\x8b\xb2\x71\x34\xee\x45\x80\x35\xef\x79\x60\x63\x15\x8b\
+\x94\x00\xb4\xbd\x2d\x80\xf5\x69\xaf\xbf\x91\xd8\xef\x92\xf0\xc9\
+\x1a\x58\x97\x31\x44\x13\x2d\x24\x09\x66\x6c\x3a\x29\x09\xd8\xfe\
+\x6a\xfa\x91\x24\x00\xbe\x8f\xd6\x81\xa0\x56\x08\xc4\x7d\x91\x6a\
+\x14\xa0\x4a\xae\xd3\x12\x00\xa3\x30\x5f\x47\x72\xb8\xf8\x00\x8f\
+\x5f\x3d\xfd\xfd\x72\xbd\x47\xa6\x00\xa9\x33\x7a\xb9\xf6\xf8\x16\
+\xb6\x2d\xad\x46\xa9\x1a\x1c\x0d\x64\x40\xcc\x5f\x1a\x37\x52\x1a\
+\x91\xfa\x68\xef\x1f\x7b\xc0\x5f\xec\x76\x9f\x9c\xe6\xdf\xf3\x25\
+\x5f\x33\xff\xcb\x7f\xfd\xf2\xfc\x67\xfe\xdc\xff\x38\x7f\xca\xa7\
+\x7e\xce\x5c\xbd\x66\x49\x02\x2e\xdf\x3d\x4a\x46\x60\x5d\x43\xa3\
+\xe7\xa6\x44\x53\x1a\xa2\x65\x2d\xc8\x63\x9d\x3b\x8d\x83\xda\x81\
+\x26\x00\xd5\x60\x42\x02\x40\xda\x1c\x8a\xae\xbf\x74\x28\x26\xce\
+\x8a\x4a\x9c\x2e\x49\x55\x4e\x1a\xcb\x9f\xa3\x84\x10\xc8\xb7\x1d\
+\x28\x7d\xfd\x2d\x49\xb7\x94\x00\x8c\x1e\x0d\xb8\xbc\x1e\xde\x5a\
+\x74\x67\x3b\x03\xbf\x8e\xf6\x1c\x82\xd3\xbb\x31\x4e\x8a\x18\x61\
+\x59\x9f\x78\x90\x82\xd8\x36\x3d\x82\x32\x9d\x7f\x40\x2d\x51\x48\
+\xb6\x28\x22\x03\xb0\x87\x19\xe3\x21\xb5\xd7\x8f\xb9\x07\x96\x26\
+\xa8\xdd\x58\x90\x00\x68\x52\xe6\xd7\x99\x12\xd1\x91\xd9\x6b\x83\
+\x7f\x19\xb2\x74\xb7\xbd\xe7\x5d\x62\xfe\x63\x15\x86\xae\xae\x94\
+\xe7\xb5\xec\x7b\x7e\x50\x9a\xf0\xab\x64\xeb\x2b\x18\xdd\xe8\x73\
+\x9b\xda\x46\x07\x45\x9e\x73\x0a\x87\x9c\x77\x8b\x33\x9e\xe9\xbb\
+\x1c\xe0\x80\x7a\x7e\x80\x34\x0a\xc0\xf7\x1d\x97\x6a\x92\xfa\x74\
+\xd3\xde\xe3\xc6\x57\xc7\xaa\xea\x01\x5f\xcb\x48\x0e\x40\x02\xb1\
+\x73\x21\x94\x9e\xcf\xff\x3b\xa9\x5f\x6e\xe0\x54\xd2\x0a\x42\x15\
+\x7e\x27\x5c\x63\x37\x6e\x52\x2d\xc3\x09\x8c\x87\xec\x86\x52\xaf\
+\x0a\x5a\x31\x52\xe9\x66\x40\xc8\x82\x65\xb0\x37\xfe\x19\x29\xe0\
+\x4d\x8a\xf9\xcf\xa3\xf9\x89\x27\x1f\xcd\xf5\x61\x9c\xbf\xfd\x1f\
+\x7c\xdf\x25\x09\xf8\xd2\x2f\xff\x63\x73\xf5\x69\xaf\x9b\xeb\xd7\
+\xbc\x01\xb5\xba\x42\xb5\xdc\xf6\xe3\xe5\xd9\x78\x0b\xe1\x1e\x25\
+\x65\xee\xb9\xa9\x09\x00\x14\x0b\x0f\xb5\x87\xc2\x16\x40\x47\x5b\
+\x27\x17\xd4\x68\xfd\xbb\x36\x45\x22\xcc\xb2\xf9\x39\x0a\x20\xcf\
+\x63\x3b\x16\x39\x11\x7b\xea\x28\xdc\xcf\x49\x5c\x55\x44\x14\x96\
+\x91\xbb\x46\xda\x3f\x59\x62\x20\x45\xaf\xc4\xc0\xd0\xdd\x3a\xe0\
+\x9b\xcd\x64\xc4\xa5\xa8\x70\x13\x2c\x81\xc0\xd6\xf8\x11\x5b\x8c\
+\xbc\xb9\xef\x91\x12\x21\xd2\x8a\x38\x5b\x26\xcb\xdb\x6d\x4d\x84\
+\x46\xc4\x15\x03\x45\x0a\x39\x05\x69\x03\xfa\x0c\xa6\x93\xd2\x49\
+\x84\x3f\x2b\x9c\x45\x58\xc7\x21\x26\x21\x16\x71\x67\x3a\x0d\x82\
+\x87\x7c\xd0\xef\xee\xa3\xfa\x2f\x8b\xdf\x89\x04\x20\x37\xbe\x91\
+\x27\x7c\x78\x4f\xed\x9d\x0e\x4b\x1e\x76\xec\x43\x8f\xb1\xf6\x33\
+\xc7\x4b\xff\x3d\x4f\x6a\xc2\x07\x88\x0e\xa7\x7b\xe8\x0f\x57\xc0\
+\x91\x51\x4d\xa8\xda\x7c\xaf\x18\x89\xf9\x38\x59\xdf\xeb\xfb\x90\
+\x0c\x8e\xec\x8f\xb1\x58\x88\x1f\x37\x32\x01\xb6\x26\x48\x44\x6a\
+\x41\xe2\x11\x9d\x23\x4b\x46\x8e\xc5\x2c\x61\x97\x7c\x84\x60\x8f\
+\xfa\xff\x08\x52\x77\xed\x81\x4a\xd9\x74\x1c\x0a\xa6\x23\x5d\x85\
+\x66\x55\x78\x13\x0d\x26\xc0\xd6\x98\x34\xe6\xd7\x12\x9b\x29\xef\
+\x05\xa7\xb3\xc4\x14\x01\x37\xab\x39\x27\x00\xce\xbb\xe1\x77\x7f\
+\xe1\x57\xce\xbf\xf0\xcb\xbf\x3e\xff\xd2\xe9\x65\x9e\xfe\x92\x0b\
+\x0a\xf0\xa0\x1b\xd1\xd8\xd5\xa4\xaa\x33\x46\xc8\x45\x6f\x13\x6e\
+\x6b\x36\x52\x29\x6c\x4f\x49\x48\xfb\xe4\xf2\x9e\xf5\xf0\x88\x19\
+\x30\x4d\x97\x7b\x71\xf9\x33\x9e\x38\xa8\x09\x54\xe0\xaf\xb4\x8e\
+\xf1\xbf\xc3\x85\x33\xd6\x61\x30\x22\xe1\x30\xba\x07\x83\xe3\xb4\
+\x48\x3d\x52\x2b\xb0\xc6\x59\x22\x40\x38\x24\xa0\x24\xff\xc2\x14\
+\x40\x87\x02\x65\x87\x78\x00\xfe\xac\xe0\x28\x83\x06\xbd\xda\x2b\
+\x0f\xef\xf5\x3c\x92\xb4\x32\x3c\xdf\xe1\x18\x38\x2c\x1e\x01\xc1\
+\xe3\x87\x28\xa8\x75\xdb\x13\xf0\xfc\x75\x1a\x51\xbc\xeb\x76\x89\
+\x11\x64\x26\xd2\x6c\x96\xf5\x9f\x86\xc6\x2d\x7a\x96\xc0\xd6\x83\
+\xd2\x82\x70\x52\xd6\x7b\x67\xff\x51\x02\x5b\x21\x2d\x9b\xea\x31\
+\x13\x00\x59\x0b\xc0\x64\x04\x69\x36\xf4\x1c\xa2\xac\x66\xab\xb0\
+\x89\x21\x2a\x52\xe1\x30\x87\x68\xc6\x5c\x1c\x83\x63\xe6\x14\x61\
+\x46\x59\x0a\xae\xf1\x7f\x7b\xd8\xb3\xb7\x14\x42\xef\x30\xf4\x8f\
+\x93\x01\x37\xfa\xb7\x6c\xc6\xab\x7b\xfc\xea\x48\x25\xa0\xcd\x0f\
+\x64\x52\xc2\x23\x00\x4e\x17\x41\xd5\x5d\x90\x14\x0f\x8f\x89\xde\
+\xe0\x98\x16\x40\x42\xfd\x7e\xc2\x05\x20\xac\x63\x6d\xa4\x10\xc4\
+\x6a\x43\xb5\xd7\x2c\x11\x21\xe9\x11\x12\xe4\x98\xe4\x68\x0c\xb2\
+\xee\x05\x1b\xd3\x9e\xb7\x45\xb6\xad\xd5\x10\x68\xcf\xf7\xfd\x0d\
+\xf3\xdf\xf9\x7b\xdf\x33\xff\xeb\xdf\xf8\xd0\xfc\xb3\x3f\xf7\xdc\
+\xfc\x99\xff\xce\xe7\x23\x4b\x59\x97\x00\x9c\x82\x33\x0f\xd0\x7d\
+\x4c\xca\xab\x33\xee\x63\xb8\xf7\xbf\x54\xfa\x30\x8f\x9f\xf7\x15\
+\x73\x73\x78\xea\xf4\x7a\xfa\xf4\xef\x4f\xbf\x9e\x5e\xf5\xb9\x45\
+\x71\x7e\x49\x88\x41\x8f\xee\x53\x67\x22\x7b\xd3\x05\x8d\x98\x6e\
+\x2b\x48\xe4\xb5\x2a\xa6\x22\xcd\x02\xd1\x3c\xa6\x4f\x29\x57\x22\
+\x35\x4e\x86\x58\x70\x83\x32\x5d\xd3\x04\x3c\x89\xae\xc2\xc4\x5b\
+\xbc\xef\x3a\xd8\x14\x20\xcb\x47\xee\x34\x62\x22\x9b\x78\x89\x50\
+\x36\x40\xc5\x01\x3f\x2b\x71\xf5\x7f\x3b\x76\x3d\x0e\x5c\x4d\x77\
+\x6b\x24\xe4\x3a\x45\x3d\x7e\x36\x54\x92\x8c\xee\x7a\x9e\x87\xa4\
+\x09\x92\x93\x2a\xf5\xc0\x8c\x90\xae\x18\xe9\xab\xee\x59\xe4\xe7\
+\x0a\x33\xa0\xf1\x8a\xac\x42\x1a\xcb\x2b\x31\xea\xb0\x11\xbc\xcf\
+\xfb\x48\x14\x9a\x96\xfa\xff\xca\xfb\x0d\x46\x25\xfc\x54\x12\xb4\
+\xde\x03\x79\xc0\xae\x1a\x72\x81\xff\xd2\x7b\x7a\xb8\xf6\x06\x23\
+\x23\x10\xb8\x41\x02\x90\xf2\x0d\x30\x7e\xd1\x6e\xcb\xb6\x41\xa8\
+\x92\x12\xd0\xa8\x27\xe6\x1c\x55\xa9\xe4\xb8\xef\x7f\x44\x6c\x7a\
+\x4e\xfc\x1b\x13\x3c\x82\x7c\xa5\xdf\x64\x10\x00\xca\x8e\x0f\x8c\
+\xf5\xd6\x27\x90\x93\xdc\x2a\x72\x07\xc5\x41\x37\x49\x92\x85\x77\
+\x94\x7e\xe0\x69\x4d\xbc\xf9\xf7\x7f\xed\xfc\xfc\x2f\x7c\x60\x7e\
+\xe5\x23\x1f\x9d\xdf\xfa\xb6\x9f\x98\xfb\xcf\x7c\xd3\xc5\xb3\xe1\
+\x5c\x95\x5f\x82\xf3\xf9\xd7\x4b\x02\xb0\xbc\x54\x12\xeb\x06\x91\
+\x9e\x73\x0b\xe2\x89\x53\xf5\xff\x55\x7f\xec\xbf\x9e\xbb\xcf\xfc\
+\xdc\xb9\x79\xf2\x4d\x97\xcf\xaa\xcf\x89\xc0\x61\x4d\x02\xa4\x16\
+\x46\x1f\x8f\xdd\xd5\xc9\x4a\x7f\xdf\xb8\xa1\x2c\x6f\x5d\x26\x77\
+\x5c\x33\x44\xa4\x8d\x0a\x01\x88\xaa\xfc\xe0\xa4\x99\x1b\x93\x94\
+\xc5\xac\xfc\xf8\x1e\x23\xb2\xf2\x24\x3a\x9e\x56\x82\x2b\x83\x9a\
+\xb0\x37\xbb\xa3\x4f\x68\x02\x59\x0d\x18\x27\x48\xb0\x6c\x57\xcf\
+\xa4\xdb\xab\xd7\x55\x9b\x12\x80\x2d\x33\xfe\x36\x83\xa6\x80\x32\
+\x86\xb8\xe5\xbb\x41\x36\x61\xe3\xe3\xbc\xd1\x18\xea\xc6\xe9\x84\
+\xc7\x4b\x06\xd4\xdb\xf2\x77\xd7\xbd\xb1\xcd\xdc\xac\x9d\x76\xa4\
+\xb8\x6f\xeb\x66\x43\x87\x23\x25\xe9\x1d\x4c\xd1\x21\xd9\x0e\x39\
+\x8e\x03\xea\xcd\x23\x92\x1e\xb1\x6c\xc5\x6a\x71\x1d\x20\x42\x50\
+\x7a\x84\xb0\xba\x2a\xf8\xcb\x42\x3b\xb8\x2d\x41\x0f\xec\x29\x22\
+\x4a\xea\x3d\x21\x39\xf8\x37\x5d\x4e\x44\xc5\x41\xab\x88\x51\xdd\
+\xc5\x87\x4c\xe4\xcb\xa0\x3a\x23\xca\x23\x48\x1c\xd5\xa9\x55\x49\
+\x65\x65\x83\x12\xd5\x38\x43\xd7\x82\xc2\x82\xaf\xaf\xac\x6a\x5b\
+\x77\xff\x2f\xdf\xe7\xf5\xf3\x77\x7e\xcf\x5b\xe7\x5f\xfb\x97\xff\
+\x6a\x7e\xf5\x63\xaf\xce\xdf\xf6\x1d\xff\x78\xfe\x4d\xaf\x9d\x16\
+\x88\xfe\x52\x9d\x3f\xf2\x6d\x03\x47\x24\xd4\xc5\x6e\x72\x41\x72\
+\x85\xf5\xcf\xef\xfd\xda\x37\xcd\xbf\xeb\xcd\xff\xd1\xfc\x8d\x7f\
+\xf6\x2f\x2d\x89\x05\x49\x00\x9e\x22\x9f\xd9\xb2\xef\xdf\x22\x98\
+\xbf\xed\x83\xbc\xf1\xad\xf4\xfa\x4b\xdc\x09\x65\xa2\xa2\x61\xa3\
+\x81\x06\x21\x81\x06\xed\x43\xb8\x88\xde\xb8\xd1\xd7\xb6\x37\x8c\
+\x3f\x31\x45\x32\xc2\xb1\xb5\x6b\x3c\x91\x10\xfa\xc0\x40\x46\x1d\
+\x43\xa2\xb9\x75\x8c\x2b\x07\xbd\x83\x9e\x98\x77\x38\xa8\x1b\x44\
+\x2c\x1e\x13\xfb\x3e\x25\xd0\x16\x13\x9d\xcb\x93\x01\x88\xc6\x39\
+\xcb\xab\x59\xad\x20\x28\x49\x04\x6e\x57\xac\xee\x4f\xdc\xca\x3e\
+\x5b\x45\x2d\x1f\x6b\x12\x90\x6e\x49\xdd\xdd\x6e\x16\xd5\x14\xf6\
+\x04\x21\x5d\x51\x78\x78\x6f\xa4\x19\x38\x0b\x4a\x65\x16\xaa\xa1\
+\x72\x5f\x1e\xf4\x51\xdf\x5c\x03\x66\xcd\x1a\xd2\xab\x5c\x2a\x6e\
+\x04\x71\x7b\x03\x20\x83\x84\x63\x4c\x51\xc5\xdf\x74\x71\x82\x50\
+\x45\xec\x68\x10\x7f\xbe\x46\x33\xfd\x41\x03\x1d\x21\x21\xc9\x4d\
+\xa2\x90\x9c\x8a\xda\x0f\xfc\xef\xd9\x98\x11\x19\xfb\xb3\x94\x89\
+\x8c\x35\xe7\x7b\x5a\x71\x9d\xef\x9d\x6e\x2d\x6b\x22\x57\x3a\x49\
+\xa0\xa6\xee\xb7\x19\x14\xb5\xce\xed\xaf\xcf\x29\x05\x9a\x7d\x55\
+\xef\x9a\xb4\xfe\xc1\xff\xf0\xbf\x98\xdf\xf7\xc2\x2f\xce\xaf\xbe\
+\xfa\xea\xfc\xf1\x8f\x7f\x7c\xfe\x6f\xbe\xf9\xaf\xcc\x4f\x9c\x13\
+\xca\x27\x9f\x3e\xfd\xba\x24\x02\xed\x30\xd1\xa0\xb7\x26\x70\x6d\
+\x6f\x33\xa3\x7d\x86\xb5\x1f\xd6\xde\xff\x6b\x9f\x9a\x7f\xd3\x67\
+\x3c\x9a\x7f\xf0\xed\xef\x9c\x7f\xfb\x1b\xde\x7c\x49\x00\xda\xe1\
+\xe9\x25\xe9\x18\x9e\xf2\x49\x01\x61\xff\x7b\xd4\x0e\xb5\x03\xd6\
+\x60\xd7\xf6\xb7\xf0\x36\x30\x2c\x91\x30\x82\x49\x95\x30\x95\xe0\
+\xff\x1b\x93\x41\x2d\x1d\x19\x26\xee\x6d\xa3\x37\xbf\x89\x27\x5f\
+\x38\xa9\xd8\x84\x11\x58\xc6\x18\x97\xfa\xa4\x0d\xee\xa7\x33\x69\
+\xed\xea\x1a\x06\xbf\xb2\x47\xc9\x59\xd0\x31\xde\x41\x47\xcf\x81\
+\x20\x3c\x94\x22\xf0\xf1\x31\x48\x64\xfb\x3d\x80\x27\x64\x36\xab\
+\xe9\x57\x5a\xf8\x07\xf4\xf6\x5d\x07\x8c\x9f\x00\x8a\x92\xdd\x51\
+\x31\x3f\xba\x47\x05\xbd\xae\x94\x90\x58\x12\xcc\x4b\x09\xcc\xf7\
+\x33\xbb\x5f\xcc\x8b\x2a\x18\x1f\xbd\xa9\x1b\x60\x99\xe8\x88\x49\
+\x78\x98\x73\xfd\xec\x74\x20\xca\x1d\xca\xf5\x40\x65\x27\x2b\x56\
+\xd5\x56\x2b\x91\x8f\x54\xfe\xab\xaa\x5e\xdd\xa3\xf1\x3f\x2c\x6c\
+\xb3\x8a\xdb\x5c\xc6\xbb\x44\xed\x6a\xb4\x09\x87\x0c\xcc\x2e\x42\
+\x7d\x47\x32\x8f\xda\xf0\x3e\x63\x07\xd1\x34\xc4\x56\x62\x51\x3c\
+\xa2\x08\x4a\x35\x1e\xcf\x46\x37\x91\x87\xf6\xba\xf1\x89\x40\x52\
+\x50\x42\x8c\xad\x42\x75\xf7\x2e\xfe\xe7\xad\x82\x0a\xd5\x91\x5a\
+\x1d\x35\x2a\xe2\xba\xf4\xbc\xb2\xe3\xbe\x08\xba\xc4\x67\x69\x82\
+\x10\xc3\xea\xbf\xf9\xb5\x66\xfe\xfe\x1f\xfc\xb1\xf9\x57\x3e\xf8\
+\xab\x97\x04\xe0\xa3\xaf\x7e\x74\xfe\xc3\x7f\xf4\x1b\x4f\x81\xfa\
+\x29\x04\xfd\x3f\x22\x9a\x15\x6d\x87\xc7\xa7\x40\x4d\x46\x02\x01\
+\x71\x42\x68\xc2\xd3\x8b\x1e\xc1\xa7\x3f\x9a\xff\xc2\x5f\xfe\x1b\
+\xf3\xb7\xfc\xf5\xbf\x7b\xfa\xbd\xbd\xfc\x79\x8b\xda\x0e\x98\xf8\
+\x18\x55\x6e\x9e\xdb\xe2\x26\x55\x6e\xe7\x55\xd0\xaa\x1c\x8b\x32\
+\x25\xc4\x30\x41\x43\x45\x94\xb8\xdc\x32\x9e\x5e\xd1\xdc\x28\x39\
+\xff\x41\x0a\xfa\x35\xea\xf3\x57\x7e\xa4\xce\x52\xa1\x1f\xc5\x7d\
+\x90\xfa\x9b\x6c\x19\xa5\xe6\x3a\x1f\x68\x2f\x91\x04\x00\x62\xf1\
+\x21\xd5\x73\x45\xe6\x12\x5d\xee\xd7\x85\x50\x8d\xfd\x43\x0a\xe6\
+\xd5\xbd\xc8\x19\xff\x7c\x08\xa4\xe8\x87\x40\x84\x74\xe2\xef\x7a\
+\x54\xc8\xc0\xe3\xbd\x26\x01\x8f\xad\xd7\xde\x3d\x7e\xbe\xc3\xde\
+\xeb\xbc\xbb\xaf\xe0\xdf\x26\xcc\x49\x5a\x4e\x34\x12\x9d\x96\x4a\
+\x24\x72\x39\x91\x88\x1d\x9a\x64\x53\x6b\x15\x39\x78\xc8\xd3\x67\
+\xc2\x68\xf2\x80\x67\xad\x94\xe1\x8f\x2d\x37\xa1\xac\xcf\x9e\x1a\
+\xed\x13\x7a\xee\xb2\x18\x8a\x29\x63\x5c\x47\x59\xad\x40\x50\x1c\
+\x8e\x0a\x33\xb8\x94\xac\xb8\x48\x20\x63\x01\x25\x2f\x50\xd4\xc9\
+\x72\xaf\x5a\xb5\x4e\x61\x7f\xcd\xd2\x38\xa5\x95\x1f\xe0\xcc\x36\
+\xb9\xf6\x52\x76\xc9\xa5\x15\x3f\xa8\x3d\xe5\xf3\xda\x7f\xe2\x54\
+\x8d\x7f\xc5\xd7\xfc\x57\xf3\x7b\x9e\x7d\x61\x7e\xe5\x95\x8f\xcc\
+\xe7\xff\xfb\x37\x1f\xfa\xf0\xfc\x85\x7f\xe0\x6b\xe7\x27\x2e\x49\
+\xc0\xb4\xc2\xee\x81\x50\xda\xf6\x08\x66\xee\x80\x29\xfc\x71\xc1\
+\x9f\x69\x21\xfe\x79\x68\xff\xa9\x05\x5d\x78\xed\x9b\xe6\x2f\xfb\
+\xca\x3f\x31\x3f\xf3\xbe\x5f\x9c\x7f\xef\x97\xfc\xe1\x25\xe1\x78\
+\xf2\xe9\x25\x41\x18\x1e\x89\xcf\xe1\x1c\x04\x5a\x37\x9a\xd8\x8d\
+\x44\x7e\xf9\x66\x66\x45\x7e\x34\x76\x63\xd1\xd0\x63\xc5\xc1\x91\
+\x10\xb0\x5a\x51\x34\x09\x92\xcf\x8f\x24\x00\x5d\x41\x22\xdd\x8d\
+\x6c\xe2\xc6\x5c\x48\x9d\x65\x55\x17\x6c\x08\xfe\x40\xf6\x7e\x35\
+\x48\xc1\x5d\x96\x3d\xd7\xed\x7d\x0d\xf3\x11\x01\xa2\xec\x17\x92\
+\x40\xd8\x10\x1c\x99\x0f\x4b\x07\x44\x43\x03\x8f\x49\x4b\x3c\x09\
+\x09\x39\x08\xa3\xc8\xe3\xbd\x05\xbb\x6a\x27\x69\x6f\x73\x55\x8d\
+\x47\x56\xbb\x3d\xfc\x8a\xfb\xbd\x0f\x42\x02\x70\xdb\x6c\x43\x83\
+\xf3\x48\x95\x45\x16\xdd\x48\x0e\x36\x7d\x1a\x01\x94\x04\x40\xda\
+\xec\xe8\xb0\x5c\x25\x6e\xd5\x7e\xbc\x87\x3b\xa9\x90\x09\x25\x79\
+\x00\xed\x95\xf7\xb4\x55\xb0\x8c\x00\x82\xff\xef\x94\x53\x62\x25\
+\xf1\x04\xbc\xf4\x24\x33\xf9\x11\xbe\x5b\x8d\x36\x6e\xbd\xca\x0b\
+\x37\x4e\xc0\x85\x25\x56\x7e\x63\x0e\x02\xc3\x39\xf2\x44\x18\x05\
+\xd1\x8f\x44\xa2\x82\x83\x3e\xba\xfe\x86\x18\x00\x09\xec\xf6\x42\
+\xef\xfa\x5a\x75\x85\x9b\x84\x6a\x5d\xb6\x2b\x4e\x9b\xe0\xe4\x10\
+\xa4\xdc\xdf\xcb\xde\x05\x67\xde\xc8\xb9\x1f\xff\xc4\x6b\x3f\x77\
+\xfe\xd4\xdf\xf2\xd4\xfc\x4f\xbe\xff\xed\xf3\x0b\xef\xff\x85\xf9\
+\xe3\x1f\x9f\xe7\xd3\xff\xcf\xbf\xfc\x2b\xbf\x3a\x4f\xff\xee\xbf\
+\xbf\xb4\x6e\x3a\xa0\xfc\x93\x8b\x8d\x34\x04\x78\x7b\x80\x24\xd2\
+\x75\x4e\x22\xea\xd3\x67\x55\x0e\x05\x78\xf2\x4d\x97\xd7\x67\xfc\
+\x8e\x7f\x6f\xfe\xd9\xf7\xbc\x30\xff\xe0\xdb\x7f\x6a\xee\x7e\xeb\
+\xe7\x9e\xfe\xee\x4d\x2b\xf4\x8f\x54\x37\x07\x4a\x24\x5d\xa0\xe0\
+\xf5\xb9\xa1\x24\xe0\x16\x2d\x00\xaa\xb4\x18\x2b\x01\x6a\x28\x0a\
+\x4d\x04\x28\x39\x57\xf7\x4b\x30\x09\xdd\x06\x41\x64\x2a\x27\x28\
+\xd5\x01\x0b\x68\xeb\x73\xe9\x90\x40\x51\x67\x98\x72\xa6\xdd\x90\
+\x00\x00\x1b\x49\x1c\x99\xbe\x7c\x6c\x9a\x55\x26\xfe\x32\x2a\x15\
+\x37\xc8\xce\x95\x9b\xc6\x18\x53\x2e\xaa\xb4\x65\x52\x77\xb9\x04\
+\x60\x0c\x6b\x64\x80\xdb\xdb\xe9\x76\xd4\x0f\x25\x0e\xec\x36\x4c\
+\x4e\x75\x5b\x38\x1c\x32\x99\x32\xd2\xac\xd8\xfc\x7d\xc6\xc7\x9d\
+\x00\x98\x7b\x49\x00\xea\x43\xa2\xba\x63\xfd\x68\x2e\x6c\x92\x74\
+\xc9\x23\xd0\xb5\xec\x98\x46\x13\x03\x08\x30\xf7\x10\xfb\x82\x63\
+\x18\x3c\xd2\x65\xf7\x10\x61\x7c\x1d\x38\x40\x44\xe6\x34\x07\x6c\
+\xf8\x01\x8a\xb2\x1e\x0b\xbe\xc3\x31\x90\x0c\xd7\xc4\xa4\xea\xd9\
+\x77\x12\x2b\x67\x2a\xd9\xdb\xae\x23\x93\x72\x22\xa2\x09\xfb\x40\
+\x79\xc5\xdf\x49\x28\xca\x51\x20\x3d\x62\x44\x65\xcc\x56\x66\x49\
+\x1e\xc7\x60\x8a\x67\xcd\x55\xf3\x9a\x62\x8e\xca\x76\x78\x9a\x26\
+\x00\x66\x0d\xc6\xa7\xaa\xfb\xb5\x4f\xcf\x5f\xf9\x47\xbe\x71\x7e\
+\xcf\xb3\xcf\xcf\xbf\xf1\x6f\x3e\x74\x4a\x00\x4e\xff\xfb\xf8\xc7\
+\xe6\xf7\xfc\xfc\xf3\xf3\x67\x7e\xd6\xe7\xcd\xf5\xc3\x37\x9e\xee\
+\xdd\x1b\xbd\x05\xf1\x92\x8c\xc6\x53\x13\x32\x93\xfd\x1c\xfc\x9f\
+\x5a\x47\xfe\x1e\x5d\xc6\xfe\x9a\xb5\x0d\xf0\xc4\x93\x76\xfe\xdb\
+\xdf\xf1\xdd\xf3\x0b\x2f\x7d\x60\xfe\x73\x7f\xfe\x7f\x5d\x89\x87\
+\x53\x08\xee\x0e\xf5\xc2\xe3\xa4\x2e\x11\x39\x8c\xde\xa0\xaa\x24\
+\x51\x4a\x21\x7d\x69\x7f\x8d\x52\x14\x00\x42\xaf\x9f\x24\x43\x69\
+\x56\x7f\x32\x21\xc4\x48\x1a\x13\xca\xd2\xdd\x3a\x41\x81\xd8\x6d\
+\xa6\x27\x9c\x1a\xa9\xb6\x89\x69\x1f\x88\xa4\xce\xe5\x7f\x27\xef\
+\x73\x51\xd6\x98\x7d\x4e\x2b\xc8\xd9\x36\xc2\xc4\xcd\x6d\xa4\x6c\
+\x4b\x1d\x0f\x6f\x0c\x7f\xa3\xb6\x46\x83\x12\x0e\x5a\x6c\x6e\xf7\
+\xc2\x69\x86\x91\xa1\x32\x86\x19\x64\x81\x3a\xe1\x76\x5b\x1f\x88\
+\x7b\x19\x03\xbc\xa6\xdf\x62\x0b\x61\xe9\x10\x50\xa8\xe3\x1b\xad\
+\x5e\xeb\x44\xe5\x8e\x37\x78\x98\xa9\x9e\x04\x34\x01\x54\x89\xde\
+\x50\x59\x58\xa5\x1d\xa1\xcd\xcb\x2b\xf2\xb5\x07\x6a\x8d\x8a\x13\
+\x9a\xe5\x7b\x59\x2a\x81\x39\xe0\xac\x1f\x41\xc0\x9e\x98\x33\x65\
+\xc6\x29\x25\xab\x4a\xa3\x68\xc8\xc7\x55\x5d\x40\x1b\xb8\x43\xa2\
+\xde\x3f\xac\x99\x6e\xfe\x65\x5e\xba\xa7\x59\xff\x62\x45\x8a\x51\
+\x1a\xd8\xc9\x1a\x07\x66\xe5\x9c\xe6\x0f\x48\x07\x66\xe3\x03\x69\
+\xe9\x6c\x7f\x79\x90\x93\x9f\x87\x63\xe6\x3f\x35\x7f\xea\xbf\xf5\
+\xf4\xfc\x03\x3f\xf4\xff\xcd\xef\x7b\xe1\x17\xe6\x8f\x7d\xec\x63\
+\xa7\xd7\xab\xf3\x47\x3e\xfa\xd1\xf9\xfb\xdf\xf2\x23\xf3\x6b\x3e\
+\xfd\x74\x8f\x4e\x49\x40\x7d\x4e\x02\xb0\xaf\x02\x9a\x44\x21\xb2\
+\xbb\x87\xb0\xce\x5d\xff\x3f\xbc\x16\xa6\xff\x79\xfc\xef\x89\x53\
+\xe2\xf1\x9f\x7e\xc3\x37\xcf\xef\xfa\xf9\x17\xe6\x17\x7f\xe9\xd7\
+\xe6\x47\x9f\xff\x07\xbd\xa0\x4c\x83\x66\xc4\xfd\x8b\x20\x71\x18\
+\x6a\x07\xc5\x91\xb0\xfc\x19\x46\xfb\xa6\x43\x86\x51\xac\xd5\x75\
+\x59\xbb\x07\xae\x08\xea\x12\xf7\xe3\xfa\x73\x53\xf2\x19\x51\xf1\
+\xa3\x82\x84\x8f\xec\x2f\x28\x48\x00\xc6\xa4\x73\xaa\xae\x57\x01\
+\x09\x16\x3c\x43\xd5\x90\xd2\x68\xce\x12\x3b\x3b\xd6\xe6\x08\xbf\
+\x6e\x7f\x0f\x71\xf1\x22\xef\x97\xdb\xf5\xab\x43\xd1\x97\x9a\x02\
+\x30\x73\x99\x7d\xfc\x3e\x0e\x40\xa4\x1a\x9b\xbc\xa7\xa5\x53\x1a\
+\x31\xd7\xa4\xf5\x8a\xb6\x40\xc7\x06\x87\x12\xa9\xde\xc7\x9d\x0c\
+\x14\x93\x00\x0b\x3c\x9e\x37\xcc\xf4\xd2\x2a\x31\x04\x3e\x47\x76\
+\x49\xf9\xd3\x7b\x22\xdf\x41\x60\xf8\xa2\x04\x40\xaf\x6e\x21\x54\
+\x37\x87\x15\x76\x55\x12\x80\x38\x89\x90\x0e\x2d\xc5\x3e\xd5\x0b\
+\xd2\x4c\x82\xa9\x0e\xdf\xf8\x81\xdd\xdb\xf8\x51\x26\x43\xc4\x52\
+\x72\x90\xa9\x9c\x00\x4c\x02\x22\x62\x94\xb1\x2c\x20\xb2\xad\xf4\
+\x19\x18\x21\x01\xa0\x08\x46\xd5\xf3\x31\xa9\xbc\x96\x76\x89\x4c\
+\x2d\xbe\xbe\x58\xe5\xcb\xaa\xce\x80\x74\xe3\x41\xb1\xc0\x4f\x59\
+\xb0\x37\xca\x44\xcb\x32\x6a\x78\x79\x39\xa6\xff\x93\x8f\xe6\xaf\
+\xfe\xa3\xdf\x34\xbf\xf7\xb9\x17\xe7\x5f\xfe\xe0\x07\xe7\x57\x5f\
+\xfd\xd8\xfc\x91\x8f\x7c\x64\x7e\xf9\xf4\xfa\x5b\xdf\xf6\x0f\x4f\
+\xcf\xf9\xf5\xa7\x0a\xed\x8d\x8b\x90\xd4\xb0\xfa\xb7\x13\x21\x1b\
+\x9e\x00\x18\xa4\x3e\xf8\x68\x99\xef\x3f\x4f\x00\xac\x5c\x80\x33\
+\x02\x70\x6e\x03\xc0\xe7\x7d\xf9\xfc\x23\xff\xe2\x5d\xf3\x4b\x1f\
+\xf8\xe0\xfc\x9d\xdf\xfd\xd6\xf9\x89\xfe\x0d\xa7\x64\xe3\x0d\x44\
+\xb0\xc9\x25\x1b\x04\xb2\x15\x13\xa5\xc4\xbd\x52\xee\x97\x4a\x70\
+\xc3\x0a\x7b\xeb\xaf\x4d\x54\x3c\xf0\x59\x6b\x2c\x60\xa3\x3f\xaf\
+\x25\xf8\x5b\x2f\xca\xb4\xc5\xfe\x58\x64\xcd\x77\xb9\x24\x40\x23\
+\xde\xd1\xbf\x0b\x05\x4e\x09\xe2\x76\x54\xdc\xf9\x98\xfc\xed\x90\
+\x63\xe9\x2b\xd7\xce\x54\xec\x52\x84\xb9\xaa\x08\xf1\x2d\xfd\x99\
+\xb1\x40\x6e\xb8\xbc\x32\xae\xba\x72\xc4\x25\xd5\x92\xde\x8b\x66\
+\x68\x02\x74\x41\xd2\x5e\xf2\x5c\x29\x41\x40\x1e\xaf\x80\xd2\xdd\
+\x2d\xfb\x12\x58\x57\x5c\xaa\x8e\x63\xdf\x6e\xba\xd1\x02\xc4\x07\
+\x02\x3b\xdd\x25\x00\xee\xd7\xf0\x19\x21\x90\x00\xd2\x19\xd7\xa0\
+\x25\xf7\x39\x4b\x05\xde\x74\xa9\xde\xa2\x55\x12\x88\x71\xd6\x3c\
+\xd3\xb1\xcc\xea\x39\x49\x09\xc1\x14\x94\x6b\x42\x09\x4f\x07\x02\
+\x41\x0e\x76\xc0\xd2\x10\x49\xc9\xb6\x07\x4e\xc0\x33\x99\x24\x62\
+\x12\x7a\x89\x46\x14\x28\x71\x70\xbf\x73\xb7\xab\x1d\x53\x9d\x9b\
+\xf1\x1c\xa6\x7c\x10\xee\x63\x41\x9e\x00\x7b\xd2\x00\xdf\xa6\x60\
+\xc9\xce\xfd\x3d\x64\x6c\x3d\xad\x58\x39\x12\xa6\xfd\x9e\xb1\xb7\
+\x27\xa7\x95\x98\xf7\xd4\xfc\xa9\xe7\xd1\xbc\x1f\xfe\xc9\xf9\xdd\
+\xef\x7d\xf6\xd2\x0a\x78\xe5\x95\x97\xe7\x97\x5f\x79\xe5\x92\x04\
+\xfc\xc5\xff\xe9\x7f\x9f\xab\xd7\x7c\xce\x05\x05\x88\x5b\x4c\xd6\
+\x07\x7e\xf7\x0c\xeb\x27\x17\x94\x89\x4c\x12\xb8\xf1\x3e\x9f\x14\
+\x3c\x75\x21\x21\xfe\x83\xef\xfe\xa1\xf9\xe7\x9e\x7d\xdf\xfc\xfc\
+\x4b\x1f\x98\xbf\xee\x8f\xff\xe9\xb9\xfa\xb4\xd7\xaf\x68\xc3\x31\
+\x24\xbe\x87\xf5\x57\xef\x03\x41\xd1\xa2\x10\x50\xe5\xfb\x21\xdd\
+\x9f\xfc\xc1\x0c\xa4\xd7\x4d\x13\x47\x6e\x2a\x14\x5a\x75\xa1\x72\
+\x05\x84\x16\x58\x74\x8d\xdb\x50\x8a\x5a\x24\xd4\xa1\x99\xfb\x0e\
+\x54\xee\x0c\x75\x93\x4c\x29\x6d\x72\xa2\x1b\xd6\xbd\xcf\x29\x81\
+\xa6\xf5\xe5\xe5\xe0\x4b\x85\x91\x38\x02\x78\xfe\xf7\xd5\xfa\xfb\
+\x6a\x48\x25\x01\xb6\x58\xff\x5f\xec\x7f\x47\x63\xa0\x20\x20\x76\
+\xd3\x26\x7d\x99\x6d\x01\x2f\x58\x38\x87\x56\x92\x46\x38\xdf\x36\
+\x82\xb7\x8c\xea\x22\x37\x4b\x8d\xb7\xc2\x3e\x27\x14\x59\xb1\xcb\
+\x69\x49\xb0\xde\x97\xb0\x68\x7c\x0d\xb8\x5d\x0b\x80\x4a\xef\x52\
+\x49\x56\x5e\x7d\xe2\xca\x53\x32\xa5\x68\xd0\x03\xac\x06\x69\x03\
+\xba\xfe\x8b\xb4\xd0\x00\xc9\xff\xca\x99\x66\x83\xcd\x41\x44\xe7\
+\x27\x43\xd9\xc4\xbd\xa1\x4e\x5a\xbe\x5f\xaa\x6b\xc6\xe3\x43\xb1\
+\x2c\x43\x45\x87\xe0\x35\x4a\x74\xde\xe2\xd7\x2e\xca\x73\x8c\x23\
+\x51\xf3\x64\x25\x05\x95\x0e\x5a\x9f\x51\x76\x52\x8c\xdd\xea\xb8\
+\x59\x4c\x09\xab\x9e\x25\x00\xd2\xac\xbf\x04\x53\x76\x46\x71\x99\
+\xb4\xe2\x78\x61\xdd\xdb\x84\xd1\xcf\x1e\xe2\xdb\x14\x29\x51\xba\
+\x84\x62\x51\xe0\x33\xf3\x57\xff\x27\x7f\x6a\xfe\xd9\xf7\xbc\x6f\
+\x7e\xe6\x3c\x15\xf0\xf2\x2b\x97\xd7\xcb\x2f\xbf\x3c\x7f\xf8\xf4\
+\xeb\x37\xfc\xc9\x6f\x9e\x3f\xe5\xd3\x3e\xfb\x82\x04\x9c\x5f\x8b\
+\x9c\xb4\x59\xc4\xae\x0e\xab\xe5\xf0\x21\x6e\x75\x5d\x98\xfd\x44\
+\x59\x70\xf2\x55\xf0\x39\xf9\xfc\xb3\xff\xdd\xb7\xcc\x3f\xfc\x63\
+\x3f\x35\x3f\xf7\xe2\x2f\xcc\x3f\xf5\xb3\xcf\xcd\xbf\xed\xb3\x7f\
+\xcf\xca\x3b\x38\x12\xa2\x5f\xdb\x43\x94\x74\xa4\xda\x36\x5b\x5b\
+\x22\x2e\x68\xb9\xe9\x9a\x5a\x21\x49\x71\xb7\x4a\xdd\xbd\xd3\x24\
+\x10\x0a\x23\x4c\x75\xd8\x0c\x4a\x91\xe3\xc3\x18\x46\xe0\x3d\xa2\
+\x2a\x1a\xf4\x31\xe0\x4c\xf2\x23\xea\x73\x74\x5b\x8c\xd8\x52\xe4\
+\x34\xc8\xc0\xf0\x25\x01\x05\x48\x12\x5f\x47\x42\x55\x31\x57\x20\
+\x82\xbc\xc9\x44\xd6\xe3\xb7\xc4\xd5\xda\x83\x31\x1a\x5d\x48\xb2\
+\x1c\x02\x21\x73\x61\xf9\x9b\x0d\xa4\x63\x5b\x20\xcf\x7e\x5f\x4a\
+\x80\x20\xca\xbb\xdf\x34\x01\xe0\x5c\x80\x4a\x65\xe7\x5a\x34\x2b\
+\x2b\x90\xca\x22\xa6\xb6\x61\xd9\x37\x14\x32\xb3\xa5\x05\x00\xb1\
+\x52\x1d\x31\xa5\x99\x3c\x03\x3b\x8c\xc9\x30\xf2\xe1\x80\xaa\xde\
+\x0c\xa1\x4c\x7f\x28\x47\x0a\xb9\x46\x49\x45\x62\x8c\x6d\x0d\x0a\
+\xdc\xd4\xe5\x12\x70\x70\x7f\x6f\x30\xa4\xcf\xbf\xa9\x7f\x3b\xd8\
+\x8c\x7f\x00\x88\x8e\x5a\x92\xd0\xd3\x12\x94\x4a\x18\xf5\x26\x56\
+\x24\xc3\x01\xa2\x2b\xe3\xa0\xd4\x8a\x01\x55\x19\xe1\xcf\x5c\x41\
+\x04\x54\x94\xec\x4e\xd7\xf3\xc4\x6b\xc7\xf9\x7b\xfe\xf9\x8f\xcc\
+\x3f\xfd\xce\xf7\xce\xbf\xf4\x81\x0f\xce\x2f\x7f\xf8\xc3\xa7\x04\
+\xe0\xf4\x7a\xe5\xc3\xf3\x6f\x7c\xe8\xe5\xf9\xcb\xbf\xea\x3f\x9f\
+\x3f\xe5\x35\xaf\x9b\x1f\x74\xaf\x9f\x1f\xf4\x6f\xf4\x87\x8d\x94\
+\xec\x2d\x15\x2f\x86\xe0\x1f\x11\xa1\x9b\x76\x1d\x7b\xfd\xc2\x2f\
+\xfd\xba\xf9\x1f\x7f\xdf\x5b\xe7\xf7\x3c\xf7\xe2\xfc\xde\xf7\xbd\
+\x7f\xfe\x9b\x7f\xe7\x3b\x2f\x2d\x87\x0b\x0a\xd0\x21\xa2\x9f\x5f\
+\xcb\xbc\xe5\x70\x03\x21\x20\x62\xfa\x13\x27\x00\x35\xab\xfa\x9d\
+\xa7\x41\xad\x38\x66\x12\xf1\x9f\x61\xba\x19\xb1\x93\x9e\x63\x92\
+\x4e\x06\x4a\x00\x86\x51\x41\x06\x52\xa2\x60\x5a\xa5\x07\x57\x38\
+\xb1\xa6\x82\xbf\x46\x20\x84\x82\x33\xdc\xc6\x93\x0c\xf8\x59\x76\
+\xa9\xa4\x3e\x3e\x9b\xab\x01\x09\x97\x0d\x8f\xb3\xcf\x6d\x45\x32\
+\xe8\x56\xf3\xa6\x46\x58\xab\x35\x4b\x74\x74\x7e\x01\x8f\x61\x9a\
+\xb0\xd0\x7d\x04\x7c\x2d\x39\x0d\xbf\xbf\xbb\xe5\xd8\x45\xa4\xaa\
+\x35\xc4\x1b\x5c\x46\x0e\x40\xb0\xa0\x05\xa4\xc6\x07\x42\x4f\x4d\
+\xab\x4c\x0c\x23\x90\xf1\xcf\x1e\x55\x48\x9f\xf8\x06\x20\x08\xb2\
+\xba\x24\x1d\x47\x4f\x46\x72\x24\xa9\x85\xf1\x2d\x93\x8e\xdc\x9f\
+\xe9\x0f\x1b\x84\xe0\x99\x17\x9d\x69\x1d\xf4\x79\xb0\x5e\x49\x0e\
+\x5f\x43\xbd\x47\x7a\x59\x0d\xfe\x5a\x86\x3a\x8a\x96\x93\x44\xba\
+\x15\xf5\x63\xa5\x97\xff\xd9\x83\x61\x66\x2d\xcc\x0b\x22\xcb\xb2\
+\x66\xb3\xbe\x04\xa2\xd5\xfb\xd6\xad\x4b\xa2\x0e\xbc\x77\xbc\xb7\
+\xda\x55\xee\xfb\x9a\xec\x3d\xe8\xdf\x30\x7f\xd9\x1f\xfa\xfa\xf9\
+\xa7\xdf\xf5\xcc\xfc\x8e\x77\xbd\x67\xfe\x8d\x0f\x7f\x68\x7e\xf9\
+\x23\xaf\xcc\xaf\x9c\x5b\x01\xaf\xbc\x3c\x7f\xf0\xd7\x7f\x63\xfe\
+\x82\x2f\xfa\x8a\x53\x02\x70\x8c\x14\x14\x6b\xdf\xff\xa7\xc1\xdf\
+\x71\x02\x48\xc5\xbb\x8e\xa5\x9d\x99\xdf\x0f\xff\xed\x47\xf3\xdf\
+\xff\xa7\x6f\x99\x7f\xec\x5f\xbc\x73\x7e\xe6\x7d\x2f\x9e\x5e\x2f\
+\xcd\xff\xf1\xd7\xff\xc9\xb9\x7e\xf8\xfa\xd3\x9a\x7e\x63\x18\xd7\
+\x1c\x0c\x5a\x4f\x56\x7d\x6e\x92\x23\x62\xf6\xfe\x70\x41\xa6\x81\
+\x8a\x59\xc5\x08\x80\x1b\x53\x3b\xed\xb3\x83\x42\xdc\x5d\xf7\x7f\
+\x75\x90\xda\x37\xfb\x92\x96\x38\x58\x62\x12\x1d\xac\x53\x39\xac\
+\x5a\x27\x7a\x09\x18\xe1\xc4\x70\x6f\xce\x54\x8b\x25\x00\xd1\xa8\
+\xa4\xde\x57\xa7\xa8\x1f\xb6\xaf\x4d\x8f\xc6\x96\x49\xee\x42\x18\
+\x6f\xee\x8c\xda\xf2\xd4\x9c\x32\x97\x62\x24\xec\xf1\xd6\xb7\xb2\
+\x80\x89\xbf\xdd\x67\xf5\x5f\x32\x35\x92\x2f\xdc\x62\x1f\x12\x66\
+\x58\x36\xa4\xc9\x93\xb4\x0d\x60\x22\xc3\x33\xfe\x9c\xae\x83\xfc\
+\xa1\x00\xb5\x0d\xa4\xf6\xdd\x08\x80\x44\xc2\x88\x14\xc6\x0e\xa5\
+\x4c\xe1\x85\x79\xec\xd9\xbe\x2e\xc0\xaa\x59\x52\xe8\x81\x89\x07\
+\x10\xf1\x7e\x8f\x59\xed\x95\x02\xff\xcb\xb3\xb4\xe8\xe7\x4f\x9b\
+\xbe\xf2\xd7\x99\x41\x40\x36\x69\x6a\xc7\x59\x64\xb2\xe2\x3c\x58\
+\x52\x31\x51\x32\xdd\x1a\x38\x7c\x02\x12\x8f\xfd\x95\xa8\x35\xe2\
+\xe0\x2b\xf7\x1a\xb5\xf6\x09\x85\x61\x97\x35\x20\x1f\xce\x38\x99\
+\xa0\x7d\xdf\x40\x02\xab\xd6\xeb\xa9\x8a\x7b\x83\xa0\xcc\xfb\x87\
+\x40\x57\xaf\x44\x3a\x4a\x24\x75\xbf\x3e\x52\x26\x0b\x52\xf7\xed\
+\x91\xf0\xfd\x42\x6b\xe7\x81\x67\xb1\xbf\x6e\xfe\xb6\x7f\xf8\xbd\
+\xf3\x4f\x9d\x12\x80\xe7\xde\xff\xd2\x92\x00\x5c\x5e\x1f\xbe\xfc\
+\xf7\x4b\xbf\xf4\xc1\xd9\xfc\xae\x3f\xb0\xf4\x46\xd7\xb9\x7d\xef\
+\x66\xe9\x0f\x56\x43\x27\x0d\xf0\x58\xe0\x1a\x8c\xda\x75\x4a\xe3\
+\xc1\x6b\x5e\x3f\xff\xf9\xbf\xf4\x7f\xcc\xdf\xfb\x96\xb7\xcf\xcf\
+\xbc\xb0\xa0\x00\xef\x78\xf7\x73\xf3\x67\x8d\x6f\x3e\xed\xdf\x37\
+\x2c\x8a\x73\x67\xf1\x1f\x8f\x34\x24\x02\xfa\x61\x7b\x12\x29\x26\
+\xc0\x83\x66\xa2\x82\x82\xe8\x80\x5b\x7d\x23\x2d\x10\xd4\x43\x1c\
+\xe2\x3d\xb0\x2b\x19\x98\x50\x21\x41\xf5\x3b\xaa\xc8\x35\xf3\x28\
+\x56\x59\x32\xe3\x3f\x2f\xd3\x4b\xad\x88\xa1\xe8\x90\x8f\x09\xd3\
+\x25\xe7\xd0\x58\xd8\x37\xc6\xfa\x26\x26\x8c\x46\x77\x86\x8d\x25\
+\x9b\x84\xb2\x2b\x75\x80\xfc\xc4\xb2\xde\x73\xf7\xc6\x66\x11\x85\
+\x20\x99\x6c\xa3\x22\x37\x2f\xd1\x3b\x32\x9d\x95\xc7\xe5\x05\x20\
+\xcb\xbc\x57\x21\x01\xd8\xa3\x56\x64\xcb\xa7\x02\x7a\xa5\xca\x64\
+\xea\x7d\x6e\x56\x3f\xee\x45\xca\xd9\x5a\x4c\xfc\xc1\x8e\x81\x58\
+\x90\x66\x14\x46\xf9\x8c\x68\x2b\x1c\x91\xdd\x06\xe6\x45\xb0\xea\
+\x16\xd0\x7f\x17\xfb\x92\x6f\x83\x78\x64\x52\x4f\x9c\xbd\x3a\x13\
+\x97\x89\x06\xaf\x53\x50\xa8\x0e\x56\x60\xf3\xe3\x8a\x64\xdc\x38\
+\x83\x8f\x21\xf7\x51\x51\xa9\xe2\xcc\xf1\xd0\x16\x69\x57\x1e\xc0\
+\x85\x08\xc9\xb4\xd7\x1d\x74\x5b\x0f\x86\x25\x01\x92\x22\x60\xb8\
+\x8f\xed\x60\xa3\x71\x9d\x2a\xc7\x05\x40\x88\x44\x40\x48\x78\x50\
+\x33\x89\x4a\x50\xb0\xa8\x1e\x4c\x39\x19\x10\x29\x3c\x9e\x59\xf8\
+\xbf\xf7\xf7\x7f\xcd\xfc\x33\xa7\x20\xfc\x8e\x77\xbf\x77\xfe\xf5\
+\x7f\xf5\xeb\x97\xe0\x7f\x9e\x0a\x78\xe5\xa3\x1f\x99\x3f\xf2\xea\
+\xab\xf3\xb3\xcf\xbf\x34\xff\xce\x37\xbe\xd9\x8f\xf7\x2d\x2e\x82\
+\x66\x25\xf9\x3d\xb5\x22\x18\x38\xf1\x03\xda\xb3\xef\x83\x45\xf5\
+\x39\xc0\x7f\xf9\x57\xff\x97\xf3\x3f\xfa\xde\xb7\xcc\xef\x7a\xe6\
+\xd9\xf9\x99\x53\x02\x70\x4e\x02\xfe\xf6\xdf\xfb\xee\xb9\x39\x5d\
+\xcb\x85\x0c\x78\xfe\xf9\x27\x2d\x31\x26\x6a\x87\x98\x73\x70\x59\
+\x6f\x07\xd8\x86\x22\x21\x0e\x00\x56\xe7\x6c\x7a\x9b\xd0\x57\x5f\
+\x55\xf0\x06\x44\xd4\x75\x09\x41\x6f\x12\x64\x52\xfa\xdc\xce\xfc\
+\xa1\x07\x57\x59\x18\x4f\x91\x76\x48\xc5\x99\xfa\xc3\x58\xc0\xbc\
+\x86\x0c\xc1\x2f\xe5\x1e\x5a\x32\x95\x25\xfd\xec\x28\xb4\x34\x4c\
+\x82\x6c\xe8\x88\x89\xeb\x1e\xee\x78\x81\x04\x82\x1d\x73\xd8\x8f\
+\x44\xc3\x45\x90\x7d\x8f\x93\x41\x60\x92\xc9\x5b\xb4\xf9\x47\x01\
+\x8d\xd4\x93\x0a\xad\x10\xab\x06\xe9\x6c\xcb\x8d\x12\x62\x6e\x84\
+\x0d\x16\xe3\x3b\x7c\x02\xf6\x8d\x54\xde\xe2\x7d\x69\xac\xba\xdb\
+\xfe\x01\x50\xe6\x04\x98\x80\x87\x62\xa1\x17\xcc\x94\x3f\x06\x61\
+\x9e\x01\xf4\x31\x3b\xb1\x9d\x20\x09\xf6\x48\x0e\x75\x63\x3c\x8b\
+\x3f\x1c\x33\x36\xbe\x47\x91\xb4\x28\xf7\xc4\xb7\x1a\x3c\x80\xb2\
+\x78\x4d\x2c\x6e\x42\xa6\x15\xe0\x52\x11\x56\x07\xb8\x1c\x78\xe7\
+\x5f\x9d\xca\x97\xd6\x13\x74\xc6\x2f\xba\xfd\x6d\x0c\xdf\xd2\x4d\
+\x3b\x46\x92\xa2\xb8\xe5\x52\x33\x91\x0d\x87\x98\xb8\xe9\x8d\x73\
+\x80\xa1\x70\x3d\x9d\xa1\x6e\x18\x81\x14\x93\x6e\x62\x31\x25\x8e\
+\x3e\x49\xeb\x71\x12\xc5\xa2\xb8\x52\x9d\x7e\x10\xd9\x9d\x5c\x02\
+\x84\xbc\xac\xc1\xf8\xbc\x7e\x3e\xa5\xfb\x9c\xf9\x5b\xff\xfe\x3f\
+\x3d\x25\x01\xcf\xcc\xef\x7d\xee\xf9\x4b\x0b\xe0\x9c\x00\x7c\xe4\
+\xd5\x8f\xce\xaf\x5e\x74\x02\x3e\x36\xff\xc4\x4f\xbd\x73\xfe\x8c\
+\xdf\xf1\xbb\x2f\x2a\x7f\xf5\xe9\x7e\x55\x48\xf3\xdf\x59\xfb\xfa\
+\x7d\x74\x0e\xca\x07\x24\xda\xe3\xd5\xeb\x16\x14\xe0\xb7\x7d\xce\
+\x17\xcc\xdf\xf5\xcf\xde\x36\xbf\xfd\x27\x7e\xda\x27\x00\xef\x7d\
+\xfe\xfd\xf3\xd7\xfd\x67\x7f\x66\x99\x3c\xb8\x4c\x16\xac\xe3\x84\
+\x17\x54\x64\xba\x4c\x30\xd4\x4f\xae\xfc\x82\xc3\xb4\x8d\x1f\xd1\
+\x4b\xce\x8d\x40\xa0\x67\x19\x92\x4e\x10\xe4\x32\xc4\xcc\xf6\xa0\
+\x8d\xf0\xda\x4b\x60\xd3\x39\x1a\xa6\xe0\xf9\xd1\x04\xe0\x22\xaa\
+\x33\xe0\xea\xbf\xdc\xe4\x47\x1f\x1f\x94\x82\x34\xec\x3a\x33\x6a\
+\x1e\xa4\xa2\x20\x07\xa2\x13\x1f\xb9\x6f\x1d\x88\x45\x4d\xe0\x2b\
+\xc9\xe4\x5a\x9f\x7c\x61\xee\x8e\x48\xc2\xc5\x22\x4a\xe3\xc6\x80\
+\x07\x1b\x7f\xbf\x45\x8a\x39\x31\x55\xe1\x47\xb3\x11\x42\xea\x13\
+\x1c\xd8\x35\xca\x78\x0b\xc7\xc1\x6d\x6d\x81\x31\x92\xb6\xbf\xbb\
+\xee\xe6\xc5\x3f\xdf\x16\x42\x85\xad\xda\x6f\x4b\xcd\xda\x83\xd0\
+\x5b\x4f\x3b\xf1\x35\xaa\x90\xd0\x91\xc1\x21\xda\xdf\xa7\xd4\x08\
+\x8f\x8c\x09\x0f\x1b\x12\x00\xc8\x08\x62\x20\x5b\xe2\xde\x88\x06\
+\x35\xf5\x01\x3c\x17\x61\xd1\x35\x00\x32\xf7\xce\x67\x56\xf7\xa9\
+\xde\x99\xa8\x8d\x40\x93\x2d\x20\x55\x72\xc8\x8a\x71\x02\x70\x0c\
+\x89\x09\xfe\x39\x55\x4a\x93\x56\x0d\xce\xc9\xab\xe9\xe2\xf1\x22\
+\xce\x26\x8f\x82\xf4\xc1\x8a\xad\x12\x2a\xce\x92\xab\xb8\xa8\x59\
+\x55\xd9\x44\x00\x1b\x81\x5a\xd7\xcb\x83\xee\x0d\xf3\xe7\x7f\xd1\
+\x1f\x9a\x7f\xe6\x3d\xcf\xcd\xef\xfc\xb9\x67\x2e\x84\xc0\x8f\x9e\
+\x2a\xff\xb3\x6d\xf0\xc7\x3e\xfe\xb1\x8b\x52\xe0\x59\x31\xf0\xfb\
+\xfe\xf9\xdb\xe6\x87\x9f\xf9\xf4\x65\x8c\xb0\x79\xf2\x91\xff\x35\
+\x24\x00\x8f\xe8\xcc\xbc\x17\xf6\xc1\xa8\xc3\x1b\xe7\x4f\x79\xcd\
+\x67\xcf\xff\xcb\xff\xf5\xed\xf3\xf7\xbc\xe5\x6d\x97\xe0\xff\xcc\
+\xf3\x2f\x5e\xf8\x00\xef\x7c\xcf\xf3\xf3\xeb\x1f\xfd\xbe\x05\x65\
+\x78\xf2\x69\x2f\x24\x54\x63\x24\xa0\xa4\xc7\x2f\x24\x00\x6d\x2f\
+\x69\x01\x98\xcc\x21\x9b\xd8\x63\x03\x75\xff\xcc\x21\x00\x7c\x7d\
+\xe8\x6b\xdf\xc8\x9e\x12\x87\x60\x92\x23\x1a\x7a\x79\x3e\x50\x29\
+\x4a\xaa\xb5\x00\x40\x40\xd6\xc6\x8d\x07\x3a\x08\x23\xd7\xee\x7d\
+\x6c\x62\x0a\xc1\x64\xaa\xe8\x92\xe9\x06\x54\x8c\x1c\x68\x6f\xbc\
+\x46\x93\x47\xf1\xb5\x41\x86\x0f\x71\x8b\x60\x97\x21\xf6\x91\x24\
+\x51\xff\xd9\x4a\x4c\xb4\x80\xee\xbd\x81\x8b\xbc\xe5\xa5\xa0\x1b\
+\x01\x15\xd1\xc7\x3a\xaf\x73\x0a\x2c\x4c\x00\xe0\x26\x09\x00\x09\
+\x50\xb8\x0f\x7c\x90\x20\x42\x23\xf6\xe8\x69\xaf\x64\x24\xb0\xb6\
+\xcc\x6a\x85\x8c\xc3\x5e\x4a\x6c\x43\x51\xe5\x1a\x8e\x05\x86\x44\
+\x3c\xb8\x6a\x09\x00\x28\x3c\x03\x9e\x09\xa7\xe6\x82\x2d\x25\x9c\
+\xac\x99\x67\xb0\xb5\x0d\x41\x86\xde\xb3\x91\xb6\x17\xd8\x0c\x74\
+\x19\xb9\x4d\x5b\x84\x10\x55\xc9\x97\x7e\xbd\xb7\x18\x65\x89\x95\
+\x7b\x6e\x07\x1b\x5b\x2e\xb3\x51\x30\x2a\xf8\x23\x89\xfe\x20\x07\
+\xbb\xc4\x58\x2a\x15\xcf\x99\x58\x4b\x0a\x92\xe2\x21\x39\x38\xb0\
+\x29\x6d\x05\x60\x31\x9b\x53\x02\x50\x75\xaf\x9b\xff\xef\x6f\xff\
+\xae\xf9\x67\xdf\xfb\xec\xfc\xee\x67\x9e\xbd\xf0\x00\x3e\xb6\x56\
+\xff\x4b\x12\xf0\xf1\xcb\xeb\x5b\xff\xee\x3f\x9a\x7f\xf3\x6f\x79\
+\xb4\x26\x00\x4f\x9f\xee\xdb\xd3\x68\xfe\x7f\x42\x88\x89\x53\x10\
+\x44\x96\xd5\xe7\x96\xc3\xe9\xb3\x1e\xbc\xe6\x75\xf3\xd7\xfe\xf1\
+\x6f\x9a\xff\xc9\x0f\xbc\x6d\xfe\xc9\x9f\xf9\xb9\xf9\x99\x17\x5e\
+\x9a\x7f\xfe\x85\xf7\x5f\x46\x03\xbf\xf3\x7b\xdf\x3a\x7f\xda\x67\
+\x2c\x26\x42\x97\xcf\x38\xac\xda\x05\xc3\x54\x4e\xf2\x53\x5e\x15\
+\x11\x92\x19\x0b\x0e\x7d\x25\x11\xc7\x6d\xb5\x5e\xab\xdc\x79\x7b\
+\x06\x22\xf4\x2c\xb4\xc2\xac\x18\x30\x83\xd6\x80\x43\xd9\x40\xd7\
+\x00\x19\x8e\x5e\x89\x54\x76\x29\x9d\x12\x3a\xfd\x50\x20\x0b\x9c\
+\x27\xff\xc9\x5c\x00\x53\x90\x68\xc1\xc6\x2a\xd8\xe6\x9f\xdf\x60\
+\x22\xbf\x0f\xd2\x1f\x8f\xf4\x3c\x40\x09\x68\xb7\xd0\xc1\x87\xac\
+\x38\x11\x37\x06\xa2\x02\x3d\x69\x61\x25\x3e\xd2\x17\x10\x01\x40\
+\xba\x06\xf2\xf7\xd3\xb8\x62\x29\x42\xe4\x6d\x88\x92\x8a\x0f\x0c\
+\x55\x02\x84\x0c\x8c\x9d\x27\x47\x54\x91\x26\x00\xee\x05\x32\x35\
+\xa6\x28\xb8\x4b\x08\x80\xf1\xa2\x3d\xa1\x97\xbf\x54\x82\xe1\x80\
+\xc1\x0f\xed\x58\x6e\xbd\x9b\x7d\x49\x90\xbf\x40\x7c\xeb\xf1\xb5\
+\x8c\xba\x7a\x9e\xc8\xfe\x87\xc4\xac\x26\xd7\x19\x07\x02\xed\x53\
+\x6d\x05\x47\x3c\x3a\xe6\xc5\x44\x06\xa1\xd2\xee\xa9\x66\x7e\x20\
+\x00\xda\xa4\xe4\x2e\x5d\xe4\x23\x4b\x16\x30\x21\x0a\xb5\x20\x22\
+\x2f\x82\xf4\x7a\x6b\x92\x2d\x9f\x94\xa5\x30\x10\x05\x3d\x49\x9f\
+\x21\x56\xe6\x02\x64\xef\x5c\x42\xee\x29\x19\x83\x92\x34\xe6\xc7\
+\xf9\x73\xdf\xfc\x15\xf3\xbb\x9f\x7d\x71\xfe\xb9\x9f\x7f\x7e\x7e\
+\xe9\x17\x7f\xf9\x14\xf8\x3f\x7e\x09\xfe\xaf\x7e\x9c\x26\x01\xdf\
+\xf2\xd7\xff\xd6\xfc\xc4\xa7\x3b\x65\xc1\x95\x04\xe8\xaa\xad\x0e\
+\x59\x07\xf7\x6b\x02\xd0\x2f\xbe\x02\x17\x4d\x81\x87\x6f\x9c\x1f\
+\x3c\xfc\x9c\xf9\xb3\xcd\x17\xce\xdf\xf3\x83\x3f\x36\xff\xe0\xdb\
+\x7e\x7c\x7e\xf6\x14\xf8\x9f\x7d\xf1\xa5\x4b\x02\xf0\xbe\x97\x7e\
+\x69\xfe\xd3\xff\xed\x5f\x99\x9b\xd7\x2e\x2d\x86\x1a\xbd\xb0\xae\
+\x40\x4a\xf2\x38\xed\xea\x99\x96\x77\x25\xbe\x20\x83\x3c\xf6\xc7\
+\x65\x57\x75\x3e\x86\x51\x5e\x25\x23\x82\x8b\x2e\xbe\x2c\x9c\x83\
+\xc7\xfe\xf8\xf8\x32\x08\x88\xe0\x8d\x8d\x5c\xf0\xd8\x71\x4f\x55\
+\x2d\xf7\x0a\xc6\xd0\x6a\x35\xe5\x29\x20\xc3\xd9\x52\x01\x16\x57\
+\xf9\xb7\xf0\x0f\xd8\xdf\xf7\xce\xc9\x83\x97\xb7\x52\x8c\x40\x76\
+\x46\xf7\xab\xe3\x44\x40\x2b\xa8\xd1\xa6\xaf\xeb\xf6\xe2\x3f\xa5\
+\x42\x7e\x6a\x02\x50\x7e\xd3\x2b\xc2\x62\x07\xc2\x14\x6d\x98\x42\
+\x94\x6c\x65\x09\x09\x22\x0c\x6c\x58\x20\x70\xc3\xe0\x9f\xab\xc6\
+\x21\xa1\xec\x97\xfb\xf9\x31\x21\x16\x02\x19\xf1\x9d\x23\x19\xf7\
+\x89\xdf\xf3\x98\x9d\x25\xae\xd6\x3e\x71\xab\x88\xeb\x04\xe2\x1f\
+\x14\x2e\x42\x9b\xb0\x41\xd6\x2a\x9e\x63\x52\x4b\x00\x27\x56\xc9\
+\xc0\x9f\xd4\x5e\x4f\x9b\xc5\xe4\x85\x5a\xca\xd9\xbd\x79\x67\x3a\
+\x8b\x6c\x54\xd7\x03\xf8\x49\x3b\xff\x6f\x7f\xf3\xff\x9d\xdf\x7b\
+\x4a\x00\xbc\x59\xd0\x39\x09\x70\x48\x00\x7a\x7d\xf3\x5f\xfc\xab\
+\xf3\x13\x07\x83\xac\x8c\x81\x88\x5a\x85\xd7\xf1\xf4\x5c\xd7\xc4\
+\xb5\x3b\xae\x49\xc0\xeb\x2f\x49\xc0\x99\xf8\xf7\x7d\x6f\x79\xfb\
+\xfc\xee\x67\xde\x37\x3f\xff\xe2\x2f\xce\xcf\xbd\xf0\x8b\xf3\xb3\
+\x2f\xbc\x34\x3f\x73\xfa\xf5\x0b\xbe\xf8\x6b\x7c\x6b\xa1\x71\xea\
+\x82\x43\xae\xfa\x37\x85\x13\x3e\xb9\x43\x88\x29\x7d\x76\x63\x66\
+\xbf\xd0\x60\x83\xd5\xd7\xda\x3e\xa7\xc9\xa0\x8f\x7c\x51\xe8\xdc\
+\xf1\x65\x46\x81\x38\x9c\x93\xf2\x85\x1b\x07\x3c\x60\xd3\x06\x5b\
+\xa5\x71\xb7\xc2\xe6\x90\xb4\xee\x4d\x27\x14\x76\xbe\x8e\xac\x76\
+\x5f\x3d\xf0\xeb\xb4\x04\x64\xc2\xf8\xa8\x8e\xfe\xa5\xda\x4f\x9f\
+\x98\xef\x00\x22\x2a\x51\x51\x37\xc0\x7d\xfd\x97\x8a\xb9\x22\xb5\
+\xd2\x17\x1d\x8c\xa0\x1e\x05\xab\xd2\x9f\x3c\xa2\xa0\xbb\x86\x81\
+\x22\x0a\x03\xca\x28\xcd\xa8\x38\x6d\x5d\x93\x00\xf0\xc5\x69\x33\
+\x07\x83\x2e\x03\x5c\x06\xd7\xb1\xe0\x3e\x8c\x09\x75\x27\x1d\x01\
+\xa0\x5a\xf9\xd6\x43\xb4\x0d\x61\xd1\x63\x0f\xef\x69\x67\x76\xae\
+\x5d\x1b\x14\x27\x6a\x67\x18\xbb\x92\xf4\xff\x89\x65\xb3\x49\x66\
+\xf5\xb1\xef\x01\x14\xdc\x67\xc8\xb0\x8c\xb7\xf8\x1b\x30\x22\xe7\
+\x85\xb0\x67\x16\x42\xdf\x6b\x9f\x9a\xdf\xf0\xb9\x5f\x3a\xbf\xeb\
+\x99\x17\xe7\xf7\x3c\xf7\xc2\x29\x20\xbf\x74\x31\x0a\x3a\x57\xff\
+\xe7\xa0\x7f\xe1\x05\x9c\x5e\xe7\xff\x3e\xfb\x07\x7c\xc3\x9f\xfa\
+\xef\xd7\xe0\x3e\xae\x33\xfc\x81\xb8\x8a\xab\x7f\xbf\x56\x1e\x1e\
+\x57\xdd\xff\x25\x21\xf8\x13\xdf\xf4\x17\xe6\xef\xff\xa1\x1f\x9b\
+\x7f\xf4\x27\xdf\x31\xbf\xef\xc5\x73\xf0\x7f\xff\xfc\xf3\xcf\xbf\
+\xff\x92\x04\xfc\xf0\x8f\xbe\x63\xfe\xf4\xdf\xfe\xf9\x0b\xcf\xc0\
+\x79\x0a\xa8\x1a\x08\x13\x42\x57\xd2\x04\x4b\x8e\x96\xc8\x66\x33\
+\xa3\xec\x24\xd9\x1b\xc5\xd0\xcb\xe8\x8e\x8f\x45\x22\x3f\x4a\x1f\
+\x98\x73\x16\xce\x23\xbf\xfd\x31\xc1\xe2\x87\x4c\xbb\xce\x5e\x19\
+\x70\x8c\x00\x99\xeb\x7b\x4f\x1b\xcb\xbe\x4d\x1f\x5d\x23\xec\xc1\
+\x3d\xf7\xf3\x3f\x99\xc6\x06\x4b\x92\x21\xf9\xef\x4b\xd6\xe2\xe3\
+\x4f\x68\x6e\x95\x00\xf4\xa3\x47\x01\x9a\xdc\x18\xc5\x2a\xf2\x51\
+\x79\xc8\x7f\xf4\x92\x9a\x81\xbc\x06\x6c\x0e\x55\x61\x65\x76\x86\
+\x79\x58\x0b\xb3\xb4\x1d\x33\xdc\x91\x20\x78\x07\xdb\x0d\xc7\x4c\
+\xd0\xc7\x2a\x85\x81\x61\x1e\x6b\x5a\xc3\x7a\x70\x1c\x85\xaa\xc6\
+\x24\x12\x01\x99\xe4\xe1\xab\x47\x7f\x9f\x80\x8a\x90\x60\xcf\x84\
+\x61\x64\x90\x9c\xc4\x94\x07\xd1\xe8\xa3\x72\xce\x8c\xe8\xfb\x56\
+\x22\x0a\xa0\x18\xeb\x08\xf2\xac\x92\x24\x67\xd3\xb1\xf1\xc1\x2e\
+\xe6\x69\x84\x35\xc5\x7c\xe3\x89\xc8\x0a\x88\xfa\xe2\xb9\x2a\x4f\
+\xe7\x91\x8c\x09\xd1\xa3\x31\x26\xe3\x28\x73\xe6\x41\x44\xc7\x10\
+\xee\xc1\x22\x3c\x64\x2e\x23\x77\xcd\x6b\x4f\x09\xc0\xa7\xbf\xe9\
+\xf4\x7a\x6a\xfe\x1f\xfe\xe7\xbf\x71\x31\x0a\x7a\xe6\x7d\x2f\xcc\
+\xbf\xf2\xab\xbf\x76\x41\x01\x5e\x5d\x13\x80\x8f\x7e\xf4\xa3\xeb\
+\xeb\xd5\xf9\x43\x2f\xbf\x3c\xff\x91\xaf\xff\xa6\xb9\x7a\xcd\xeb\
+\xe6\xfa\x35\xe7\x19\xfe\xd3\xab\x7f\xc3\x85\xe8\xe7\x13\x80\x01\
+\x57\xff\x8e\x78\xb9\xa0\x0d\xf6\xf3\xff\x83\xf9\x07\xde\xfe\xe3\
+\xf3\x3f\xfb\xe1\x1f\x5d\x38\x00\x2e\x01\x58\x93\x80\xbf\xfc\xd7\
+\xbe\xf5\x62\x23\xec\xf8\x00\xed\x61\x4a\x90\xec\x4c\x71\xd0\xa5\
+\x2d\x91\x89\xfc\x9b\xd0\x6b\x3f\x4f\xb2\xe0\x62\x02\x48\x4f\x1e\
+\x2b\xa9\x89\x09\x46\xb7\xda\x60\x93\x6b\x4b\xf7\x57\xa9\x90\xcb\
+\xe4\xf5\xf1\x83\x16\x81\x74\x26\xf0\x76\xdc\xa8\x10\x7a\xa7\x9b\
+\x04\x39\x8a\x64\xf0\x51\xc7\xff\x9f\xbc\xf7\x80\x8e\xa3\xba\xfe\
+\xc7\x39\xe7\x9f\xe0\xd5\xca\x60\x5b\xa3\x95\x6d\x7a\xc7\x7d\x67\
+\x76\x25\xd9\xa6\xd7\x84\x16\x4a\x02\x31\x10\x20\x84\x14\x42\x0b\
+\x5f\x48\x21\x94\x90\x40\x80\x40\x02\x21\x74\x08\x18\x03\x06\x8c\
+\x7b\xc5\xbd\xc9\x2a\x56\x6f\x96\x64\xc9\x96\xbb\xad\xde\xab\x1b\
+\xdc\xff\x7b\xf7\xbd\x99\x79\x33\xfb\x66\x76\x56\xc5\x49\xce\xef\
+\xf8\xbc\x33\xda\xb5\xb4\x3b\x3b\x3b\x33\xf7\x73\xef\xfd\xdc\xcf\
+\x47\x73\x6c\xbd\xf8\x3d\x05\x81\xbe\x68\xee\x6b\x96\xb6\xa3\xd9\
+\x9a\x51\x1d\x3c\x4c\xcc\xca\x40\x7f\x8c\x77\x62\xaf\xc2\x79\x98\
+\xcc\x89\xd0\x99\xe9\x4b\x92\xe3\xec\xf8\x68\x6f\x3d\xc6\x3b\x98\
+\x9f\x1d\x7b\xad\x03\xd7\x16\x40\x5f\x10\x6a\xac\x00\x42\xb3\x10\
+\xc6\x86\x04\xc2\xb6\x60\x24\xe7\x21\x58\xcd\x42\xc2\x92\x56\x42\
+\xc8\x63\x96\xaf\x59\xfb\x6b\xb2\x79\xff\x08\x29\x50\xa7\xde\x3e\
+\x0f\xf8\xc2\xbc\xbc\xcf\xe1\x3d\x99\x27\xb7\x16\x45\x1b\x5c\xf3\
+\xa0\xeb\xad\x83\x96\x90\x54\xb4\xc8\x8b\x91\x85\x1b\x09\xc8\xe7\
+\x98\x9d\x6b\x51\xdc\xc0\x62\x69\xd9\xd8\xbe\x63\x45\x75\x38\x0e\
+\x72\x5b\x55\x2b\xd7\x40\x75\x6d\x57\x44\xbf\xc8\xd4\x08\x31\x26\
+\x99\xa6\x80\x09\x94\x42\x11\x44\x42\xf9\x14\x40\xa4\x9d\xae\x6e\
+\xe6\x83\x23\x76\xd4\xb5\x6f\xf4\x64\x38\x47\xfd\x1e\x6c\xdd\xb1\
+\x1f\x76\xee\x21\x8b\x00\x81\x83\x07\x0f\x71\x00\xc0\x82\x3f\x1d\
+\x11\x3c\x72\xe8\x30\x1c\x3a\xd4\x0b\x1d\xdd\xbd\xf0\xea\x1b\xd3\
+\x41\x39\x59\x85\x21\x23\xc6\x72\x10\x30\xc1\xcc\xf4\x71\x4d\x32\
+\x00\xa8\x1f\x47\x43\x43\xf8\x7e\xf1\xa3\xc2\x30\x7b\xf1\x5a\x58\
+\x9b\x99\x03\xc5\xe5\x55\x18\xfc\xe9\x34\x40\xf5\xee\x7d\xb8\x76\
+\xee\xad\x85\x3b\x7f\xf6\x3b\xee\x2c\x98\x62\x15\x7c\x09\xd8\x5a\
+\x83\x0e\xa6\x4d\x76\x33\x29\x47\x7d\x09\xde\x73\xd7\x25\x62\x7d\
+\x96\x71\x4f\xcd\x50\xb3\x74\xd4\x14\x49\x14\x35\x22\x34\xe1\x71\
+\xc8\xc2\x31\xd2\x41\xb0\x2f\x20\x1b\x43\xf3\xd2\xae\xb0\x93\x81\
+\x45\x00\x20\xa9\x06\x04\xd4\x01\xbf\x71\x7b\xd1\xeb\x8f\x3d\x71\
+\x0b\xc7\x98\xc9\x3b\xbc\x67\x84\x7d\xb8\x4c\x2f\xc4\x89\x69\x6f\
+\x8e\x25\x7b\xbb\x37\xc5\x72\xec\xdc\xae\x7d\xcd\x20\x02\xfa\x02\
+\x51\x08\x79\x4a\xc8\x73\x96\x1f\x29\xea\x16\x36\xc4\xe8\xe2\xf8\
+\x24\x50\x9c\x20\xaa\xe4\x5c\x51\xd7\x6c\x7c\x93\xc1\xac\x66\x18\
+\x53\x00\xea\x20\x94\x48\xbc\xfd\x8d\x4f\xda\xef\x76\x2f\x8f\xfb\
+\x13\xc3\xce\x59\x9c\xcc\x6d\x30\x96\x12\x9e\x6b\x25\xc0\x4d\xd1\
+\x4b\x73\x98\x40\x90\x03\x12\x3a\xb2\xe5\x73\xe4\x14\x68\x2e\x37\
+\x1f\x19\x10\x19\x88\xf1\x10\xb3\x6a\xe1\xd3\x81\x4c\x82\x5d\xf9\
+\x4c\x73\x3e\xe9\x03\xd1\x4f\x6e\xa7\xf3\xc4\x67\xe9\xb7\xca\xcb\
+\xbd\x91\x00\x20\x24\x15\x3e\xf2\x0e\x00\xc2\xc2\x94\x89\x6d\xde\
+\xd7\xe9\x6f\x02\x36\x4e\x4b\x54\xf3\xa0\x50\x44\x65\x80\x55\x01\
+\x48\x86\x3d\x32\x15\x6d\x7b\x69\x35\xe0\x85\x57\x3f\x64\x01\x99\
+\x04\xe2\xfd\x35\xf5\x08\x00\x8e\x92\xac\x1f\xf5\x01\x0e\x1f\x61\
+\xa6\x41\xbd\x3d\xd0\xd3\xd3\x03\xdd\xdd\x3d\x50\x5a\x5e\x0d\xd7\
+\xff\xf0\xe7\xe0\x23\x20\xc0\x37\x62\x02\xb2\xfd\x7d\xd4\xee\x57\
+\xb1\xb5\x06\xe8\x77\x82\x95\x07\xf2\x5e\xa3\x26\xc3\xc3\x7f\x78\
+\x19\xd6\x64\x64\xc1\xc6\xac\x3c\x1e\xfc\xf7\x20\xff\x80\x2e\x6a\
+\x52\x44\x55\x02\xbf\x77\xf3\x7d\x26\x19\x92\x9e\xbf\x68\x1e\x64\
+\x05\x98\x7e\xe9\x58\xa6\x0c\x00\x48\x9c\x02\x75\x05\x46\x6c\x17\
+\xea\x9c\x21\xbb\xc5\xad\x26\x51\xf7\xb3\x12\x55\x4d\x73\x9a\x90\
+\x45\x30\xca\x02\x4a\xc4\xfb\x84\x62\x4d\x20\xe4\xc2\x5b\x72\x31\
+\x31\xe7\x56\x9e\xea\x41\xea\x77\x30\x32\xb7\xc1\x2a\xa5\xbb\x67\
+\xb5\xf2\x31\x65\xcd\xa5\x6d\xa6\xfd\x07\xcb\xdc\xce\xdc\x20\xab\
+\x46\x81\xe6\x28\x57\xef\xf7\x7c\xec\xd4\x08\xad\x15\x53\x0f\x85\
+\x0b\x79\x89\xd7\x8e\x6b\x95\x66\xb0\x3c\x02\xec\x6e\xa9\x1a\xae\
+\xe3\xdc\xfd\xac\x63\x29\xcf\x68\x7d\xe8\x09\x69\x51\x58\x8b\xce\
+\x17\x41\xbc\x4d\x93\x39\xc2\xaf\x3e\x6a\x39\xdf\x01\x04\x44\x88\
+\x02\xb9\xb1\xea\x35\x0f\x3d\x41\x7b\xf0\x54\x6d\xca\x84\x9a\xc4\
+\x2e\xd8\x89\x15\xed\x44\x22\x4c\xf6\x5c\x22\xb3\x2b\xe9\xc9\x40\
+\x8f\x21\x7d\x9c\x10\x94\x54\x41\x64\x37\xc1\x90\xc7\xe0\xef\xa6\
+\x5c\xe6\x95\x7c\xe7\xde\xeb\xf4\x07\xb4\x18\xab\x59\xba\x19\x4e\
+\x38\xba\xb4\xb3\x38\xe6\x24\x35\x9f\x8a\x94\x16\x8e\xb7\x5b\xd6\
+\xe2\x62\x33\xf7\x7e\x04\x00\xa9\x70\xfa\x84\x2b\xa1\xa2\x7a\x2f\
+\xb6\x01\x68\x36\x7e\xa0\xae\x01\x0e\x92\xac\x9f\x06\x7e\x5a\x11\
+\xe8\xed\xed\x35\x56\x0f\x01\x02\xdd\x3d\xb4\x1a\xd0\x03\xb3\xe6\
+\x7e\x0d\x67\x8f\xbf\x14\x86\x8c\x18\x07\xbe\x84\xf1\x68\x22\xa4\
+\xcb\xd5\x8a\x95\x92\xa1\x23\x19\xe7\x20\x78\xe1\x0f\x61\x6d\x46\
+\x1e\xac\xd9\x94\x0d\x25\x5b\xb7\x61\xe0\xaf\xda\xb9\x07\xb6\xed\
+\xe0\x6b\xe7\x5e\x28\xaf\xde\x0d\xf7\x3d\xf4\x0c\x92\x07\x7d\x23\
+\x26\xe2\x24\x01\x3d\x0f\xfc\x06\x70\x75\x06\x00\x46\xab\xc3\x49\
+\xf8\xcb\x12\x94\xad\x92\xd6\xa6\x12\x68\xd8\x9b\x8c\xaf\x6d\x24\
+\x30\x4e\x1c\x19\x75\x92\x06\xb7\x9d\xfb\x32\x42\xa8\xe5\xba\x70\
+\x05\xfd\x4e\x89\x4b\xe8\xbf\x7a\xb9\x8f\xc8\xc5\x22\x3e\xa4\xb9\
+\x54\xed\x34\x97\x0c\x59\x83\xff\x34\x0f\xc0\x7a\x8e\x68\x60\x77\
+\xac\x15\x41\xa3\xe7\x49\x0d\x61\x52\xc5\x7a\x0f\x11\x5a\xa7\x1e\
+\x0d\xcd\xa4\x15\x05\x65\x10\x40\xa0\x12\xd4\x01\x40\x5f\x4f\x60\
+\xa7\x8b\x42\xf5\x56\x36\x09\x38\x4d\x01\x44\x22\x6a\x9f\xd8\x67\
+\x8e\x22\x4b\xeb\x9a\xbd\x07\x64\xac\x73\x07\x10\x60\x11\xfa\x91\
+\x5d\x00\x61\xe9\x7b\xfa\x0c\x0e\x82\x93\x7a\xa0\x2a\x10\xee\xdc\
+\x26\x0b\x9c\x94\x09\x9d\xc4\x2e\x34\xf0\xd6\xfb\x13\x27\x38\xe4\
+\x53\x04\x66\x6f\x5e\x6c\x39\x38\x33\xe6\xc5\x1b\xac\xfb\x0a\xda\
+\x78\x19\x9a\xad\x6a\xa3\x79\xce\x80\xfc\xd2\x52\x69\x74\x36\xb6\
+\x5f\x76\x93\x0a\x78\x94\xb5\x8e\xf0\x0e\xd0\x3c\xb2\xe3\x43\x02\
+\x00\x08\x73\xa9\xdf\x64\x63\xfb\xdc\xdf\xde\xc7\x0a\xc0\x76\x12\
+\x84\x2b\xab\xf7\x40\xf5\xce\x7d\xd0\xde\xd1\xc5\x83\xbe\x0e\x00\
+\x7a\x0c\x20\xd0\xdd\xd3\x8d\xd5\x80\x03\xb5\x8d\xf0\x9b\xdf\x3e\
+\x47\x32\xe9\x09\x28\x35\xec\x4b\xb4\x0b\xe7\x70\xdf\x83\x51\x61\
+\x1c\x27\xfc\x62\xc1\x4a\x58\xbb\x69\x33\x6c\xc8\xca\x83\xad\xdb\
+\x77\x92\xa0\xbf\x07\x27\x03\x2a\x49\xe0\xaf\xac\xde\x05\x95\xdb\
+\x77\xa1\x54\xf1\x33\xcf\xbd\x81\xce\x81\xf8\x9a\xb4\xd5\xa0\x5b\
+\x08\x2b\x21\x6b\x15\x80\x8f\xf6\x9a\xba\x01\x29\xc2\x36\xc5\x22\
+\x29\x6c\x3d\x3e\xc9\x4c\x75\xd0\x00\x4a\x76\x3b\xe0\x64\x67\x8f\
+\x81\x44\xd1\x65\xd0\xda\x02\x70\xd5\x6d\xb0\x10\x91\x35\x17\xa9\
+\x5e\x3b\x28\x0e\x79\x28\x99\x0f\x1c\x00\xf0\x07\x06\x3b\x38\x86\
+\x63\x9c\x42\x90\x91\x32\x9d\x3c\x41\xa2\x95\xc8\x55\x17\x3e\x99\
+\x17\x4d\x7b\xad\x8f\x9f\x23\xe4\x92\xd9\xab\x02\xdf\x44\x8b\xe1\
+\xf8\x87\x23\xa7\x9a\x02\x76\xf5\x52\x2d\x4a\x45\x21\x86\xf3\x42\
+\x19\xc0\xea\x0f\x8f\x51\xc7\xf5\x0d\x59\x0d\x84\x3a\x91\xec\x66\
+\x6d\x23\xdc\x39\x28\x4f\x89\x6e\x4f\x71\x3a\x9b\x5d\x89\x2c\xb5\
+\xfb\xa2\x06\x4f\xa7\x8b\xdf\x0e\x16\xdc\x4a\x29\xee\xa4\x41\xeb\
+\x44\x82\xe6\xf0\x99\x55\x97\x09\x88\xbe\x59\x85\x5a\x44\x74\x14\
+\x3d\x40\x27\x7b\x53\x62\x13\xab\x20\x01\xab\x05\x72\x9f\xec\x3c\
+\x15\x81\x64\x28\xea\x8c\x2b\x21\xc7\xef\x26\x52\x49\x4e\x03\x77\
+\x87\x2e\xe1\xe6\x24\xce\x4d\x8b\x40\x4b\x91\xdc\x4c\x14\x97\x49\
+\x09\xd7\xb2\x7e\x74\xd9\x6b\xb9\xa9\x8e\x19\x1c\xe3\x93\x52\x8c\
+\xc7\xa7\x8f\xbb\x02\xca\x2a\x77\x43\x15\x09\xfe\x15\x24\x08\x97\
+\x55\xed\x84\x0a\xb2\xea\x1a\x5a\x48\xb0\xd7\x03\xff\x41\x02\x06\
+\x0e\x9a\xd5\x00\xf2\x7c\x4f\x77\x37\x74\x91\xe7\x36\xa6\xe7\xc1\
+\xd4\x4b\x7f\xc8\x38\x00\x82\xd3\xa1\x01\x02\x46\x26\xc3\xd0\x51\
+\xc9\xf0\xc8\x13\x2f\xc3\xda\x8c\x1c\x1c\x09\x5c\x47\xb6\xf9\xc5\
+\xe5\x50\xb9\x83\xaa\x12\xee\x44\x65\x42\x2a\x51\x5c\xb6\xb5\x9a\
+\xac\x9d\xf0\xde\xf4\x39\x90\x74\x6a\x2a\x27\x1d\x4e\xe2\xdf\x9f\
+\x2e\xbe\xa4\x19\x01\x95\x7e\xd6\xd3\xc7\x7e\x0f\x4e\x18\x9d\x82\
+\xad\x86\x78\x9c\x26\x48\xb1\x78\x0c\xc4\x1b\x1e\x03\xa2\x8d\xb5\
+\xbd\x82\x12\xf2\xac\xdd\x6f\x2d\xf3\xda\x4c\xc8\x24\xe5\x60\xbb\
+\x3e\x80\x2c\x38\x59\x95\xea\xc4\xf3\x32\xb9\x9f\xd9\xab\x1a\xc3\
+\xbd\x52\xb3\x49\x27\x6b\x30\x50\xbd\x60\xbf\x67\x3e\x50\x2c\xad\
+\x09\x6b\x02\xe3\x37\x2a\xb0\x41\x81\xdc\x3b\x10\x01\x4c\x73\x1d\
+\xa7\x8b\x3a\x4f\x9f\x68\x13\x7e\xd2\x5b\x42\x02\xaf\x24\xf2\x38\
+\x69\x1e\x8e\x4d\x7f\xad\x9c\x07\x6a\x44\x33\x16\xc9\x63\x13\x04\
+\x1c\x37\x30\xa8\x35\xdc\x8f\xbe\x8f\xe4\x20\xf3\x8c\xd0\x27\xfd\
+\x22\x35\xe1\xe6\x43\x83\x3f\xd3\xae\xd6\xe5\x4f\x7d\x81\x50\x94\
+\xd1\x42\x35\x52\x82\xd8\x70\xfb\x93\x80\x80\x68\xc8\x5e\x0c\xee\
+\x8a\x28\x28\x13\xc4\x4a\x80\x11\xf0\x14\x0f\x20\x24\x20\xfb\xff\
+\xbe\xcd\x1a\xdb\x19\xc1\xfe\xa8\x04\xce\x68\x15\x93\xa0\x04\x98\
+\x78\xb0\xe8\x15\x82\xb0\x4f\xb7\xba\x55\xf4\x09\x00\x4d\x20\x48\
+\x7a\x35\x3f\x91\x93\x42\x9d\x2a\x14\x3e\x45\xa8\x34\x24\xa8\x46\
+\x8b\xc8\x98\x4a\x51\x54\x77\x36\x71\xa2\xbb\x08\x4e\x2c\x2b\xd2\
+\x22\x99\x89\xee\xd0\xe0\x1c\x3f\x32\x05\x1e\xf9\xfd\xdf\xa0\x7c\
+\xfb\x1e\x12\x84\x77\x42\x69\x55\x35\x6c\xd9\xca\xd6\xee\xbd\x07\
+\xa0\xb3\xab\x1b\x03\xbe\x58\x05\xe8\xa5\x8f\x69\x25\x80\xf2\x03\
+\x0e\xf6\x90\xdf\xe9\x81\x77\x3f\xf8\x02\x4e\x3f\xff\x12\xf6\x3e\
+\x28\x1d\x1c\x66\xef\x41\xf7\x81\xbc\xcf\xb9\xea\xb5\x30\x6b\xc1\
+\x2a\x74\x08\x5c\x93\xb6\x19\x56\x6d\xc8\x20\x60\x20\x1b\x8a\xca\
+\xaa\x08\x00\xa1\xef\xb7\x1d\x4a\x2b\xc8\x2a\xdf\x06\x25\x64\x2d\
+\x5b\x95\x01\xc1\xd4\xeb\xb0\x1d\x80\xa4\x43\x85\xf1\x57\x74\x1b\
+\xe1\x38\xfe\x3e\x49\x67\x5e\x08\x8f\xfe\xf1\xef\xf8\x33\x6d\x6d\
+\xc4\xf3\x71\x42\xb3\x22\xa0\xb7\x03\x92\x05\xa2\x9e\x16\x45\x4a\
+\x39\x9a\x59\x4f\xd8\x3c\xbf\x94\x90\xed\x7c\x0f\xdb\xce\x0f\x51\
+\x4d\x54\xae\x40\xe9\x5c\xee\xf6\x1e\x80\x7d\xae\xde\x29\x5a\x8c\
+\xf7\xd4\x90\x44\x14\xac\x2f\x59\xa3\x7e\xad\xc9\xf6\x71\xa0\x4a\
+\xf2\x92\xaa\x80\x32\x10\xc2\x48\x61\xa1\xcd\xa9\x41\x6c\x6d\x69\
+\x67\x00\x14\xaf\x6b\xd5\xd8\xe4\xab\x4d\x0b\xef\x70\x0c\xbc\x89\
+\x68\xba\x27\x83\xc1\xdb\xd0\xfa\x90\xb4\x8b\xed\xe8\x90\xce\x01\
+\x90\x8f\x6b\x0d\xac\xa1\x42\x34\xb7\x26\xcd\x1a\x50\x8d\x25\x21\
+\xfe\x25\x32\x6f\x69\xbf\xd8\xcb\x33\x02\xac\x93\xee\xb1\x3d\xb0\
+\x85\x1d\xda\x16\xd1\x38\x03\x5e\x3c\x98\xf5\x19\x4b\xd5\x0c\x3a\
+\x8a\xea\x52\xee\x77\x02\x1d\x72\x77\xb0\x58\xbf\x1f\xd9\xb4\x44\
+\x64\x2f\x4a\x8b\xe4\x2c\x58\xb8\x10\x76\x3d\x82\xa0\x67\xa4\xeb\
+\xd3\xdf\x4b\xd1\x5c\x38\x23\xe6\x6b\xf9\x04\x85\x3b\x9f\xa5\x4f\
+\x67\x92\xf4\xe2\x02\x5e\xca\x69\x82\x9f\x79\xa2\x69\x46\x64\x06\
+\x30\x4e\xcc\x51\x34\x8f\xbd\xe6\x70\xc4\x88\x53\x2c\x4e\x73\x11\
+\x41\x90\x03\x00\x96\x29\x73\x85\x3f\xb2\x3f\x37\x4d\x7b\x00\x72\
+\x0a\xb7\xc2\x96\x4a\x1d\x00\x6c\xc7\x6d\xe5\xb6\x5d\xd0\xdc\xd2\
+\x46\x40\x40\x2f\x07\x02\x14\x00\xb0\xb6\x00\xad\x0a\x1c\x24\x8f\
+\x0f\x1e\x3a\x84\x23\x83\x07\xea\x1a\xe1\xd7\xbf\x79\x06\x86\x8f\
+\xe6\x20\x60\x64\x0a\xf7\x11\x60\x9e\x02\xa3\xcf\xb9\x18\x5e\xfc\
+\xe7\xbf\x61\xe5\xc6\xcd\xe8\x14\xb8\x74\x75\x1a\x2c\x23\x2b\x23\
+\xa7\x10\x03\x3f\x5b\x55\x08\x00\x8a\x09\x30\xc8\xce\x2f\x87\x1f\
+\xdf\xfd\x7f\x48\x38\xf4\x53\x3e\x80\x62\xca\xa1\xa2\x33\xe1\xc8\
+\xc9\x30\x74\x54\x0a\xbc\xfc\xaf\x0f\xe1\xae\x5f\xfc\x0e\x1f\xfb\
+\x47\x4e\x25\xff\x37\x99\x71\x1d\x70\x25\x1b\xe4\x3f\xd3\x29\x91\
+\x7b\x18\x24\xf6\xd5\xad\x4f\x1f\x2d\xf5\x72\xef\xb1\x8d\x2a\x07\
+\xbc\xdc\xe0\xc3\x03\x50\x72\x8f\x95\x63\x15\xd9\x72\xf4\x29\xda\
+\x00\x04\x6b\xcd\xa1\x02\x30\x90\x00\x40\xf3\x28\x7b\x3c\x50\x81\
+\x50\x8b\x69\x6a\x40\x3f\xcf\xe2\x75\x01\xa9\x44\xa1\x85\x65\x77\
+\x31\x8c\xa9\xea\xe2\x45\x24\xce\x2b\x57\x6e\x30\xf9\x10\x9a\x35\
+\xfe\x99\x00\x40\x1b\x00\xc4\x17\x4d\xd4\xc6\xed\x0b\x72\xf8\x22\
+\x13\x24\xe5\x23\x41\x04\xc6\xda\xcf\x08\x9a\x2e\x68\xae\x41\x54\
+\x75\x98\xbb\xd7\x2c\x22\x20\x56\x59\x4f\x2f\x00\x40\x95\x66\xc8\
+\x7e\x4b\xa9\x59\x8b\x81\x38\xa8\x39\x0a\x4a\xb8\x83\x0f\xb9\x53\
+\x97\xfd\xc2\xf7\x27\x86\x1d\xd0\xa1\x9d\x03\x11\x04\x67\xaf\x06\
+\xd5\x93\xda\x95\x15\x00\x68\x36\x5d\x05\xc9\xe7\xe6\x19\xa6\xdb\
+\xc5\xee\xad\x4f\xa7\x5a\x48\x97\x7e\x2e\x3e\xe5\x17\xc7\xcd\x62\
+\x36\x48\x0a\x79\x56\xc2\x73\x33\x0b\xb2\x64\xc6\x78\x43\x62\xa4\
+\x1c\xda\x6f\x1f\xab\x7d\x1f\x96\xac\x4a\x37\x2a\x00\xa5\x14\x04\
+\x54\xb0\x45\x55\xfc\xba\xba\xbb\x91\x03\xd0\xc3\xdb\x02\x74\x51\
+\xc2\xa0\xee\x2c\x88\xda\x01\x47\xbf\x81\x8d\xe9\xb9\x90\x7a\xc9\
+\x2d\x24\x18\x87\x0c\xa9\x5f\x1f\x25\x20\x62\x29\x5e\x85\x9f\xdc\
+\xf7\x5b\x58\xb0\x62\x23\x2c\x59\x4d\xd6\xaa\x34\x58\x4c\xd6\xea\
+\x0d\x9b\xa1\xa0\x64\x2b\x94\x94\x51\x00\x50\x05\xc5\xa5\x74\x6d\
+\x85\xc2\x92\x2a\x78\xe1\x95\x0f\x60\xc4\x49\xc9\x46\xd5\x24\x8e\
+\x83\x19\x1a\xe4\x69\xd0\x1f\x1b\xfa\x3e\xd4\x35\xb6\xc1\x65\xd7\
+\xdd\x0d\xf1\xa3\xa6\x32\x10\xc0\x8d\x86\x0c\xee\x83\xa1\x45\xa1\
+\x9b\x17\xa9\xc2\xb5\xad\x49\xa6\x3c\xa2\x03\x80\xb8\xa8\x00\x20\
+\x2c\xe5\xcd\xf8\xa4\x5a\x15\x5a\x1f\x02\xbb\xd7\x04\xa9\x7f\x0a\
+\x74\xfd\x0d\x18\xfe\x41\xeb\x29\x3b\x93\x84\x9d\xde\x23\xf6\x44\
+\x53\xa6\x12\x19\x1d\x00\xf8\x2c\x15\x43\x9e\x40\x1a\xfc\x92\x64\
+\x43\xa6\x3e\xde\x62\x19\x2e\xc6\x97\x58\x41\xdb\x7f\x4a\x98\x28\
+\xd6\xa9\x02\x83\x04\x38\x50\xa5\x08\x27\xa5\x2e\x7b\xdf\x58\x73\
+\xd0\x9e\x96\x8f\xf3\xf9\x14\xeb\x3c\xa9\xcf\x7e\x61\x28\x1a\x9f\
+\x7f\x0e\xba\x04\x7f\xbb\x50\x8e\x5d\x70\xc4\x2e\x0e\xa4\x3a\x9e\
+\x48\x8e\x5f\xbe\x0e\x40\x78\x4b\xc2\x97\x60\xfb\x2c\x09\x41\xfe\
+\x59\xe4\xad\x09\xf3\x38\x39\x8c\xc2\x25\x86\xe5\x63\x24\x16\x8e\
+\x81\x78\xb3\x4b\x8e\x51\x14\x24\xe4\x3a\x2d\x61\x06\xdc\xb0\xe3\
+\xdc\xb3\xe3\x45\xad\x08\x59\x8c\x22\x90\xfe\x14\xf3\xa2\xc6\x96\
+\x89\x01\x36\xc2\x2e\x63\x7d\xf2\x12\xae\x7b\x09\x56\xcc\x00\xc5\
+\x39\x5f\xcd\xec\x03\x7a\x92\xbc\x0d\x59\xcc\x40\xbc\xf5\xad\x59\
+\xcf\xdb\x64\xc7\x73\x9d\xfd\x40\x2a\x23\xe7\xf1\x89\x82\x78\x2a\
+\x66\x93\xc0\x14\xfc\x28\xf3\x5e\x39\x39\x0c\xaf\xbf\xfd\x19\x01\
+\x00\x3b\x58\x49\x5e\x2f\xcb\x57\x54\x41\x65\xf5\x4e\x68\xed\xe8\
+\x30\x2a\x01\x07\x0f\xb1\xe0\xcf\xd6\x41\x02\x02\x0e\x31\x0d\x01\
+\xb2\x3a\xbb\x7b\xe1\x95\xd7\x3f\x00\xe5\xf4\x54\x2e\x78\x93\x82\
+\xba\x15\xbe\x11\x93\x60\xc8\xf0\x71\x10\xba\xe0\x07\xf0\xd9\xec\
+\xa5\xb0\x74\xf5\x26\x58\xbc\x32\x0d\x16\x11\x10\xb0\x64\xd5\x26\
+\x48\xcf\x2e\x86\xe2\x2d\x55\x50\x58\x5a\x89\x80\x20\xbf\xa8\x1c\
+\xf2\x8b\x2b\x60\xf6\xc2\xb5\x30\x46\xbd\xc6\x00\x31\x3e\x6e\x51\
+\x4c\x2b\x0c\x43\xc9\x67\x99\x35\x6f\x39\xec\xd8\x53\x0b\x13\x52\
+\x6f\x40\x9d\x03\x3a\xe5\xc0\x0c\x86\x44\x0f\x03\x4d\x70\xe9\x74\
+\x99\xa2\x48\x94\xfb\x0c\x88\x3c\x00\x9f\x40\x48\x74\x77\xe4\x33\
+\xe7\xbf\xfb\x34\x73\xaf\x38\xcd\x85\x0f\xe6\xbc\xb6\xb7\x9b\xbd\
+\xaf\x2f\xa4\xc1\x04\x8d\xad\x18\xf5\xf4\x1d\x03\x8c\xa2\xd9\x04\
+\xd7\x06\x8b\xdc\x16\xe3\xeb\x2b\xa6\x69\x58\xe4\xfd\x33\xcc\xaa\
+\x8c\x89\xec\xfa\x33\xdb\x46\xe1\x28\x9f\x25\xba\x51\x58\x74\xe2\
+\x61\x5f\x01\x9c\x36\xa0\xe7\xd5\x71\xfd\x3b\x21\xfb\x52\xd2\xd2\
+\x3c\x94\x4a\x44\x21\x1a\xcd\x61\x86\x31\x18\xc9\x5e\x57\x9c\x90\
+\x68\xd8\x25\xd0\x79\x9d\xf7\x77\x3a\x79\xf9\x6b\x1b\x04\x29\x1e\
+\xe0\x12\x34\xcb\x45\xe1\x57\x34\x8f\x93\x0a\x9a\x45\x2b\xc0\x62\
+\x3a\x91\x68\x3d\x99\xe5\x41\xdb\x2a\x44\xe1\x78\x61\x07\x9c\x10\
+\xa2\xea\xd0\xeb\x77\x72\x34\x14\x4d\x32\x64\x26\x18\x91\x96\xbe\
+\xfa\x85\x65\x7e\x3e\xfb\xa8\x64\x38\xaa\xf6\xb8\x77\x32\x62\xd8\
+\x6a\x97\x6b\x08\x74\x70\xe9\x6a\x85\xfb\x22\x78\x02\x00\x9a\x84\
+\xf5\xaf\x45\x09\xfe\x34\x00\x92\x40\x18\x48\xc5\x85\xbd\xf1\x00\
+\x5b\x43\xf5\xd2\xa3\x11\xc4\x84\xe9\x11\x3a\x7f\x9f\x30\x01\xee\
+\x26\x59\x7a\x5e\x51\x05\x02\x00\x96\x95\x6f\xc7\xd2\x7c\xe9\xd6\
+\x6d\x50\xd7\xd0\x84\x63\x82\x87\xa8\x5e\x00\x15\x0b\x22\x81\x9f\
+\x82\x01\xbd\x1a\xc0\xd6\x61\xac\x0a\x6c\xdd\xb6\x13\x6e\xb9\xfd\
+\x01\x14\x0c\xf2\x11\x90\x71\xfc\x88\x09\x64\x8d\x83\xe3\x87\x8f\
+\x85\x91\x67\xa4\xc0\x8b\xaf\xfd\x1b\x96\xac\x4e\x87\x85\x2b\x37\
+\xc2\xa2\x15\x04\x08\xac\xd8\x00\x2b\xd7\x67\x91\xf7\x2e\x27\x00\
+\xa0\x82\x01\x80\xa2\x32\xc8\x27\x3f\xa7\x67\x95\xc2\x8d\xb7\x3d\
+\x88\xf6\xd3\xe8\x21\xc0\x25\x84\xa9\xa6\xc1\x65\xd7\xdd\x03\x6d\
+\x1d\x3d\x08\x16\x4e\x1b\x73\x19\x7e\xf6\x78\x2e\x1f\xac\x3b\x44\
+\xc6\xd3\xa5\x8f\x99\x72\x9e\x4c\xc4\xf7\x63\x54\x06\x54\x61\xaa\
+\x41\x22\xde\x13\x70\x0b\x24\x9a\x34\xfb\xf7\x8b\xc7\x3d\x46\x79\
+\x56\xe3\x3d\x94\x81\x20\x41\x0f\x50\x56\xa9\xf4\x2d\x89\xf3\x2b\
+\x03\x18\x4c\x74\x1e\x96\x22\x53\x6a\x1d\x18\x00\xd0\x97\xf6\xb4\
+\x3f\x62\x12\x44\x9c\x22\x33\xb5\x24\x0c\x0f\x9b\x3e\x3b\x2a\x0a\
+\xf6\xeb\x32\x3d\x85\x98\x78\x23\x03\x91\xfd\x7b\xfb\x9d\xe3\x06\
+\xee\x04\x75\x63\x41\xaa\x2e\xbd\x12\x9d\x20\x26\x66\xf4\x9a\x39\
+\x8a\x26\x1d\x3b\x13\x65\x82\x05\xc2\x89\xa2\x4a\xf6\x29\x5a\xb9\
+\xbe\x7f\x00\x80\x65\x21\xc9\x82\x82\x93\x2a\xb4\x22\xb4\x28\x6a\
+\x7f\x6e\x64\x45\x1b\xc0\x51\xa2\xb5\x58\xa2\xf7\xe4\x2d\x04\x29\
+\xc5\x29\x83\xd1\x6c\xf3\xd0\x76\x91\x0c\xa1\x7f\x1e\x51\xed\x49\
+\x76\x97\xb8\x54\xec\x72\xce\x9a\xc7\x11\x48\xcd\xf6\x3e\xe6\x05\
+\xec\xed\xe6\xa1\x45\x28\xd7\xc5\xd9\xfd\xeb\x13\xc3\x31\xf7\xa2\
+\x45\x30\x62\xb7\xab\x36\x8f\x87\xde\x03\xe7\xfd\x7e\x04\x00\x29\
+\x6c\x19\x56\xbe\xa2\xa9\x0f\xbb\x91\x62\x45\x84\xce\xe2\x0f\x1f\
+\x0f\x13\x53\xae\x85\x25\x2b\x36\xb1\xc0\x4f\x41\x40\xc5\x36\xe4\
+\x06\x94\x91\xb5\x6b\xcf\x7e\xe4\x00\xd0\x20\x4f\x01\x00\x0d\xfa\
+\x4c\x3f\xa0\x17\xd7\x21\x04\x03\xe4\x31\xf9\x3f\x2a\x27\x3c\x6f\
+\xd1\x2a\x38\x6f\xd2\x15\x70\xfc\xb0\xb1\x58\x01\x18\x42\xb6\x14\
+\x04\xc4\x8d\x18\x0b\x77\xdc\xfb\x7f\x30\x77\xc9\x3a\x58\xb8\x7c\
+\x3d\x01\x00\x1b\xe1\x2f\x2f\xbf\x03\x8f\x3e\xf1\x12\xac\x4b\xcb\
+\x85\xdc\x82\x52\x02\x06\xb6\x90\x45\x40\x00\x01\x24\xb9\x85\xe5\
+\xf0\xa7\x17\xde\x82\xc4\x53\xa7\x30\x51\xa3\xa4\x29\x08\x04\x86\
+\x8e\x0c\x41\xfa\xe6\x62\xe8\xe8\xec\x86\x55\xeb\x73\xc8\xff\x4f\
+\xe6\xe7\xcb\x24\x72\x8d\x4c\x12\xc0\x7a\xd0\x5c\xbc\xf2\xe1\x47\
+\x40\x20\x82\x21\xdd\xe6\x58\x35\xc7\x28\x85\x73\x2c\xde\xfe\x9d\
+\x39\x12\xb7\x34\x07\x22\xa9\x17\xdf\x00\xcd\xe3\x3c\xb6\x77\x1e\
+\x82\xfb\x4a\x1e\x84\x80\x7f\x0c\xf4\x05\x2c\x9c\x82\x30\x26\x46\
+\x5e\x5b\x0e\xee\xd7\x70\xf2\x80\xf4\xce\x45\xde\x93\x41\x60\x15\
+\x00\x40\x5c\xa2\xc4\xaf\x46\x09\xf7\xe1\x7b\xd4\xa2\x4e\x2d\xf5\
+\x9d\x64\xaf\xc1\x40\x72\x28\x7c\xd6\x31\xc0\xbe\x02\x00\x27\x23\
+\x1c\x87\x5e\x58\x40\x75\xd1\xc3\xd7\x83\xa7\x15\x4d\x5a\x4b\xed\
+\x0e\x04\x36\x0b\xd3\xde\xcd\xd9\xd0\x0b\x3f\x20\x8a\xfc\xad\x22\
+\x64\xb4\x16\x41\x19\x35\xca\xc8\xa1\x97\x93\x57\x95\x8c\x33\xea\
+\x00\xc0\xd6\xdb\x4f\x0c\x43\x2c\x3d\x3f\x0b\x08\x50\xbc\x39\x46\
+\x59\x65\x53\xf9\xd8\x57\x22\xeb\x59\xfb\x03\xf2\xcc\xd9\x51\x79\
+\x4a\x04\x78\x8a\x33\x18\x74\xae\xd2\x38\x7f\x17\x6e\x37\x16\xb3\
+\xa4\x9c\x1c\x23\xd9\xcf\x0b\x1f\x40\x73\x50\x94\x4b\x96\xc8\xe2\
+\xd2\x9e\x63\x0a\xd7\xc4\x4f\x36\x03\xbf\x12\x14\xcc\x7c\x82\xa8\
+\xef\x8f\xea\x7e\x09\xe3\xb9\x9b\xdf\x04\x48\x38\x29\x04\x2f\xbf\
+\x3e\x9d\x64\xfe\x3b\xa0\xac\x72\x3b\x94\x57\x55\x43\x39\xdf\x56\
+\x6c\xab\x86\xa6\xe6\x56\x03\x04\x30\x00\xd0\x03\xbd\x07\xad\x53\
+\x03\x3d\x3d\xdd\xd0\xd5\xd5\x0d\x07\x6a\x9b\xe0\xd1\xc7\x9f\x83\
+\xf8\x04\x02\x02\x86\x9d\x0f\xbe\x61\x63\xc8\x62\x3f\x4f\x48\xf9\
+\x3e\xbc\xf7\xf1\x5c\x58\xb0\x7c\x03\xfc\xe3\xad\x4f\x09\x38\x18\
+\x07\x29\x17\xff\x10\xa6\x7f\xbe\x08\xb2\x72\x4b\x48\xe0\x2f\x25\
+\x6b\x0b\x01\x04\x65\x90\x5d\xb0\x05\xbe\x98\xb3\x1c\xc6\x85\xaf\
+\x63\x24\xc3\x51\x0c\xec\xfc\xfc\xc1\xa7\x09\x00\xe8\x81\xd6\xf6\
+\x2e\x98\x41\xfe\x2e\x9e\x7e\x1e\xf2\x59\xe2\x94\x89\xc6\x42\x70\
+\xc3\x45\x86\x68\x3b\x42\x07\x01\xec\x1c\xe5\xc7\x87\x57\xd8\xf4\
+\x69\x01\x06\x00\x52\xac\x44\x2e\x9b\xe0\x8f\x7c\x8c\x2b\x52\xca\
+\xd8\x51\x34\x48\x38\xa7\x23\x85\xab\xfa\x43\x0a\x74\x22\x01\x87\
+\xfe\xc7\x97\x66\x9b\x32\xd0\xac\x63\x99\x81\xe8\xfa\x20\xee\x00\
+\xa0\xff\xca\x78\x7e\x3b\x00\x08\x58\x2d\x91\xe3\x85\x11\x52\xbf\
+\xe5\xde\x1a\xee\x83\x8e\x42\xdf\x38\x01\xee\xc7\x40\xf3\x34\xa2\
+\xd9\x17\x0d\x88\xe3\xbc\xd8\x3d\x46\x95\x14\x8c\xea\x27\xed\x05\
+\x29\xdb\x44\x61\x14\x41\xd6\x57\xb1\xb3\xfd\x6d\xa4\xc2\x40\x50\
+\x52\xee\x73\x0a\x2c\x02\x60\x48\x74\x91\xfd\x55\xfa\x3b\xcf\xa9\
+\x46\xc9\x16\xc2\x8e\x20\x48\x5e\x09\xd0\x22\x67\xdf\x25\xbd\x4f\
+\x59\x40\xf4\x27\x86\x6c\x66\x48\xde\x7b\x5b\x9e\x67\xdc\xa5\xf2\
+\xcc\x61\x90\x9b\x47\x85\xc0\x6a\xf4\xa4\x39\x9c\xe4\xde\xa7\x32\
+\x22\x80\x87\x50\xde\x8c\x4f\x94\x28\x22\x26\x89\x06\x35\xb2\x32\
+\xbf\xdd\xed\x2e\x2c\xf1\x9f\x37\x2b\x07\x3e\xb1\xcf\x28\xf4\xfa\
+\xe3\xb8\xe0\x0d\x7b\x3f\x1d\x00\xf0\x1b\x0c\xfd\xfd\x84\x20\x9f\
+\xb1\x67\xcb\x8f\x41\x71\x12\x92\x01\x87\x20\x00\x98\x68\x8a\xf1\
+\x90\x40\x3a\xed\xa7\x8f\x41\x7e\x49\x25\xce\xed\x33\x10\x40\x89\
+\x82\xdb\xa0\xb4\xa2\x0a\x76\xf3\x6a\x00\x9d\x06\xa0\xad\x80\x9e\
+\x83\x54\x44\xa8\x9b\x4b\x08\x93\xe0\xdf\xdd\x05\x9d\x9d\x6c\x75\
+\x74\x74\x41\x5a\x7a\x1e\x5c\x70\xe9\xcd\x30\xe4\xc4\xf3\x60\xc8\
+\xf0\xb1\xac\x1a\x40\xd6\x88\x51\x2a\xfc\xdf\x13\x7f\x83\x59\x0b\
+\xd6\xe0\xe8\x1f\x95\xec\x1d\x3e\x3a\x19\x6e\xbd\xeb\x51\x58\xbc\
+\x22\x0d\x72\xf2\x09\x00\xc8\x2f\x85\xcd\xf9\xc5\x38\x39\xb0\x9a\
+\x64\xfa\x37\xdd\xfe\x10\xc9\xfe\x99\xb0\x51\xe2\xa9\xa9\x64\x5f\
+\xea\xa0\xa5\xb5\x1d\x1a\x9b\xdb\xe1\xd9\x17\xde\xc2\x2a\x03\x0b\
+\xfa\x13\x30\xe0\xdf\x38\xed\x11\x48\xbd\xf8\x56\x18\xaa\x50\x2e\
+\xc2\x04\x2e\x36\xa4\x21\xc7\x87\x01\xb5\x14\x4e\x30\xd4\x4b\xf6\
+\x3a\x8f\x22\xd9\x65\x64\x30\x64\x51\xfb\x93\xcb\x3a\x6b\x10\xcd\
+\x3c\x26\x2e\x10\x29\x2c\xd4\x7f\xc2\xdc\x40\x4c\x14\xf4\xf7\xbd\
+\x55\x88\xc5\x37\xc4\x79\x24\x51\xb3\x4a\xb9\x1b\x80\xde\x4b\xc6\
+\x1b\xdb\x18\xb1\x9c\x0c\x19\xe3\xf4\x83\x12\xb2\xca\x48\xeb\xf7\
+\x2a\x6c\xff\x59\xb9\x26\xfd\x6f\x79\x87\xfb\xa6\x91\xa3\xf4\x3f\
+\xa3\xef\x4b\x6b\x64\x00\x00\x40\xc8\x81\x4c\xa2\xc5\xb6\xc3\x96\
+\xc0\x2f\x02\x80\xa0\xd0\x57\x52\xcd\xb1\x3a\x03\x78\xc8\xbc\xba\
+\xdd\x98\xb8\x61\x47\xf5\xbb\xfe\x01\x00\x4d\x7e\xe2\x45\x7c\xc9\
+\xb2\xb9\xe0\xb0\x44\x4d\x4b\x85\x48\x27\xc3\x90\x31\x06\x27\x96\
+\xf2\xfd\xfa\x77\xe0\x44\x84\x52\x54\x09\xab\xde\xab\xdf\x7d\x32\
+\xd8\x0d\x36\x1c\xe7\xe6\x23\x24\x30\x93\xa3\xf8\x0f\x84\x3c\x02\
+\xc6\x3e\xb4\x67\x94\x50\x04\x00\xb0\x28\xc9\xc9\xe6\xfa\x13\xc3\
+\x66\x59\x5e\x3a\xeb\x9f\x6c\x19\x19\xc2\x19\xfb\x44\x93\xac\xca\
+\xca\xd5\x3c\x30\xa1\xdc\x2f\x23\xc8\xc5\xe1\x38\x1c\x59\x81\xc9\
+\x66\x60\x23\x99\xad\x8f\x9c\xcb\x3e\x1e\xec\x71\x91\xc0\x48\xe7\
+\xed\x87\x8c\x98\x80\x8b\x66\xdf\x4c\x84\x87\x11\x4c\x75\x47\xb1\
+\xe0\x94\x1b\x61\xc9\xca\x34\xa8\x20\x00\xa0\xac\x72\x1b\x6c\xa9\
+\x60\x63\x7b\x74\xd1\xaa\x00\x75\x15\xa4\x20\xa0\x97\x7b\x08\xd0\
+\xe0\xdf\xd9\x45\x03\x7f\x27\x74\x76\x74\x92\xe0\xdf\x01\xed\xed\
+\xed\xd0\xde\xd6\x0e\x4d\x4d\x1d\xf0\xc6\x9b\x9f\xc0\xe8\xd3\x52\
+\xc0\x87\xd5\x80\x71\x4c\x02\x98\xac\xcb\xaf\xbb\x17\x86\x9f\x3c\
+\x85\x79\x17\x90\xec\xfe\x84\xd1\xa9\x10\x38\xe3\x02\xf8\xe5\x23\
+\x7f\x86\x55\xeb\xb3\x21\x33\xb7\x08\xd2\x36\xe7\x43\x5a\x66\x01\
+\x6c\xc8\x28\x80\x9b\x49\x50\x47\x80\x44\x8e\xc3\x0b\xaf\xbc\x07\
+\x0d\xcd\xad\x50\xd7\xd8\x0a\x35\xf5\xad\xf0\xb3\x5f\x3d\x01\x3e\
+\xf2\x79\x7c\x0a\xf3\x2e\x38\x77\xe2\xd5\x90\x5b\x5c\x4d\xfe\xae\
+\x04\xfe\xf2\xd2\x7b\x70\xf1\x55\x77\xc2\xb0\x51\xbc\xb2\x66\x54\
+\x4d\x52\x23\xc5\x93\x02\x29\xce\x22\x4b\x01\x9b\x42\xa0\x94\x93\
+\xe2\x6e\xe7\x1c\x27\x31\x1e\xea\x1f\x00\x50\x3d\xde\x0f\x07\x4b\
+\x4a\x58\x1b\x04\x20\x21\x3a\x9e\x9a\xf2\xeb\x5e\xdb\x71\xde\x40\
+\x88\xd6\x4f\xe1\x1b\x91\x9b\x10\x12\xce\x0b\xf3\x3e\x1a\x2f\xf0\
+\x81\x06\xee\x38\x0d\x94\x48\xde\x20\x7f\xd7\x8a\x01\x00\x62\x2b\
+\x5b\xf8\x24\x8f\x7d\x2e\xa3\x2a\x91\xe6\x0a\x9a\x33\x62\x52\x64\
+\x15\x80\xa0\x65\x8e\x3e\x52\x58\x47\x93\x94\x89\x9c\x88\x85\xd1\
+\xd4\xf5\x54\x49\x3b\xc1\xcb\x41\x0f\xbb\x6b\x4e\x47\x20\x62\x2f\
+\x63\x3d\x56\xb9\x5c\xbd\xc4\x26\x96\xfe\xfd\x9e\xcc\x25\x34\x63\
+\xec\x2a\xd6\xf9\xe4\x48\x77\x3b\xab\xae\xb5\x53\x09\xd6\x49\x57\
+\xc2\x32\x66\x15\x50\x23\x38\x01\xee\x99\x42\x6c\x20\xc0\x38\x36\
+\x92\x52\x71\x7c\xa2\x7b\xf0\x70\x63\xf6\x63\x46\x2f\x8c\x0f\xe1\
+\x68\x21\x67\xee\xeb\x53\x0c\x43\xb8\x09\xcf\xb0\x93\x26\x43\xe0\
+\xcc\x0b\xe1\xd4\xf3\xaf\x84\xf3\x82\xd7\xc3\xc4\xc9\xb7\x40\xf2\
+\x25\xb7\xc1\x94\xcb\x6f\x87\x0b\xae\xbc\x13\x2e\x22\x41\xef\xa2\
+\xab\x7f\x42\xd6\x9d\x70\xe1\x55\x77\x90\xe7\xa7\x41\xca\x25\x3f\
+\x02\x6d\xea\x8d\x30\x31\xf5\x7a\x18\xa3\x7d\x0f\x4e\x3a\xfb\x42\
+\x46\x08\x0c\xb0\x79\xfb\x38\x9c\xb1\x4f\x85\xc4\xd3\xa6\xc0\xf3\
+\xaf\xbc\x4b\x32\xff\x6a\xcc\xfe\xe9\x74\x00\x75\xf9\x2b\x29\xa3\
+\x23\x7c\x95\xc8\x0d\xe8\xe4\xe6\x41\x1d\x5d\x24\xe8\x77\xb2\xd5\
+\xd9\xd9\x41\xb6\x04\x00\x10\x20\x80\x20\xa0\x95\xfc\xdc\xd6\x05\
+\x95\xdb\xf7\xc2\x4f\xee\x7d\x14\x86\x62\xa9\x3e\xc8\x8e\x05\xcd\
+\xb8\xb9\x69\xd1\xd0\x51\x53\xe0\xc4\x51\x74\xde\x3f\x15\x75\x0b\
+\x4e\x3a\xe7\x22\x78\xe4\xf7\x2f\xc0\xca\x8d\xd9\xb0\x31\x33\x1f\
+\x85\x85\x3e\xfe\x7c\x09\x39\xe6\x0c\xd0\x9c\x3d\xfe\x32\xa8\xdc\
+\x71\x00\x6a\x1a\x5a\xe0\x40\x7d\x33\xec\x39\xd0\x04\x3f\xf8\xd1\
+\xfd\x3c\xd3\x67\x2d\x8e\x2b\xae\xbb\x07\xca\xaa\xa8\x13\x61\x1d\
+\xec\xda\x57\x0f\x79\x45\x55\xf0\xf7\x7f\x7d\x0c\x97\x7e\xef\x2e\
+\xf2\x5e\xc9\x5c\x51\x30\x15\xf7\xc1\xcf\x3f\x37\x6a\x27\x04\x22\
+\x95\xfd\x4c\x1b\x5f\xd3\x3a\x3b\x3e\x4a\xb0\x77\x6d\x07\x25\x3a\
+\x54\xd7\xfa\x4c\xd8\x0a\xc2\xb1\x1f\x15\x8b\x6e\x37\xde\x77\xc2\
+\xb7\x50\x79\x55\x34\x41\x84\xcd\xab\x51\x8f\x16\x05\x30\x45\x23\
+\x22\xc7\x52\xa1\x0e\x59\x66\xfb\x23\x93\x97\xfe\xc8\x2f\x1f\xcb\
+\x4a\xce\xc0\x72\x36\x04\x00\x10\x86\xbe\x3b\x5a\xc9\xd8\xed\x0e\
+\xe5\xe4\x98\x44\x15\x54\x63\x56\x51\x9e\x0d\x6b\x1e\x83\xa9\xea\
+\xc2\x64\xd7\x3c\x80\x80\xd8\x75\x11\x22\xe6\xf0\x23\x3e\xbf\xea\
+\x02\x50\xe4\xf2\xc7\x06\x7a\x0d\x58\x83\x9b\xe7\x19\x64\x45\x03\
+\x67\x1b\x62\xb7\x2c\x45\x93\x8e\x4a\xb9\x03\x00\x6b\x0f\xcd\xa7\
+\xd8\x2b\x23\x8c\xd7\xe0\x73\x6c\x4b\x38\x70\x34\x22\x4c\x9a\xa2\
+\xf7\xd5\x64\xfd\x7d\x7d\xbf\xe3\x0d\x2d\x7a\x99\xde\x7f\x48\x28\
+\xf9\xf3\xa0\xc2\xad\x75\x7d\x49\xd4\x60\x47\x83\x91\x67\x5e\x00\
+\x63\xc3\xd7\xc1\xa5\xd7\xdc\x0d\xd3\x7e\xfa\x38\x3c\xfc\x87\x97\
+\xe0\xf9\x7f\xfc\x1b\xde\x9c\x3e\x07\xa6\x7f\xb9\x0c\x16\xad\xc8\
+\x22\x01\x32\x0f\x56\x93\x20\x49\x17\x65\xd5\x7f\xbd\x7a\x13\x12\
+\xec\xe6\x2d\x5b\x0f\xb3\x17\xaf\x81\x59\x0b\x57\xc3\x97\x0b\x56\
+\xc2\x17\x0b\x56\xc0\xe7\xf3\x97\xc3\xa7\x73\xbf\x86\x4f\xe7\x2c\
+\x83\x4f\x66\x2f\x85\x19\x5f\x2d\x81\x0f\xbf\x58\x04\xb7\xfd\xf4\
+\x31\x38\x71\x24\xd7\x0e\xa0\x36\xc2\x5c\xdc\x87\x82\x8c\x1b\x7f\
+\xfc\x10\x64\xe4\x96\x20\x00\xa0\x81\xbf\x98\x00\x80\xa2\x2d\x5b\
+\xa1\xa0\xb4\x1c\x8a\xc8\xcf\xf5\x0d\x4d\x98\xf1\xe3\x22\x00\xa0\
+\xbd\xb3\x9d\x3f\x26\x3f\x63\x25\xa0\x13\x5a\xdb\x3a\xd8\x6a\xef\
+\x86\x45\x4b\x37\xc0\x84\xe4\x6b\xd9\x84\x42\x12\x97\xf6\x1d\xc5\
+\x00\xc0\x94\x2b\xee\x82\x33\xc6\x5e\xce\x45\x7d\x98\xcb\xd9\x99\
+\xe3\xae\x80\xa7\x9f\x7f\x93\x7c\xce\x1c\x58\x99\x96\x03\x93\x26\
+\xdf\x00\x71\xc3\x27\x20\x9f\xe0\xf5\x77\x3e\x83\xed\xbb\xf6\x11\
+\x10\xd0\x0c\x07\xc8\x7e\x6c\xdb\x55\x07\x29\x17\xff\x08\x9d\x0b\
+\xe3\x38\xf7\xe1\xec\xf1\x57\xc1\x83\x8f\x3e\x07\x8b\x96\x6d\x44\
+\x10\x40\xc1\x42\x4d\x43\x2b\x6c\xce\x2f\x83\x27\xfe\xfc\x3a\x8c\
+\x4f\xf9\x01\x9c\x40\x65\x8c\x11\x88\xa4\xb2\x89\x02\xa1\x8d\xe7\
+\xb7\x19\x1f\xf9\xb9\x1e\xbb\x3e\x26\xe8\xae\x30\x98\x1c\x59\xd1\
+\x52\x9c\x83\xbd\xbd\xe5\xe6\x1d\x10\xa8\x1e\x2a\x5c\x7d\x0b\x1e\
+\x7e\x49\x8f\xdb\xbd\x84\x1e\x6b\xc5\x57\x95\x4c\xf4\xd8\xdc\x4e\
+\x65\x2d\x80\xa8\x1c\xa5\x28\x00\x20\xa0\x0e\x8c\xfe\x01\xaf\x00\
+\x18\xfb\x1f\xb0\x72\x13\xec\xd7\x7d\xff\xdd\x18\xb5\xff\x29\x30\
+\x70\x9c\x7c\xbc\x4b\xed\x83\xba\x9f\xe6\x3a\x22\x66\x29\x23\xf3\
+\x4c\xcb\xe7\x9a\xb5\xda\xfb\xfd\xb1\xec\x97\x9b\xd0\x8e\x4c\x94\
+\xc8\xcd\xfa\xd3\x69\x54\x48\x95\x90\xfe\xcc\xe7\xfd\x12\x36\x71\
+\xa4\xd5\xa8\x78\xcc\x82\x10\x69\xf5\xab\x6b\x04\x84\x1c\x99\xca\
+\xa6\x3d\x6a\xc8\x66\x92\xc4\x51\xb9\xc5\x90\x48\x16\xf8\xdd\x3e\
+\xb7\x50\x05\x48\x8c\x7c\xff\xf8\x44\xc9\x2c\xbc\x62\x1b\xb5\x12\
+\x55\xb5\x02\xb2\x3e\x7e\x38\xa2\x34\x18\xe1\xe1\x60\x0b\xfc\x3a\
+\x63\xde\x17\x8d\x04\x89\x3d\x3e\x73\x4c\x2f\x5e\xea\x50\xe7\x90\
+\x21\xf2\xf7\x1a\x42\x7b\xe0\x49\x41\x38\x67\xd2\x55\x70\x2d\xc9\
+\x60\x1f\x7b\xfa\xef\xf0\xfe\x8c\x79\xb0\x6c\xcd\x66\x48\xcf\x29\
+\x85\xec\xc2\x32\xc8\xca\x2f\x25\x41\xb8\x18\x36\x65\x17\x62\x49\
+\x9c\x66\xc4\x5f\x2e\x5a\x09\xa7\x8f\xbd\x04\x7e\xf0\xe3\x5f\xf3\
+\x11\xbb\x4d\xb0\x86\x80\x80\xaf\x57\xa7\xc1\xc2\xe5\xeb\x60\xee\
+\xb2\x35\x04\x00\xac\x22\x00\x80\xae\x15\x04\x00\x7c\x0d\x33\xe7\
+\x2d\x25\x00\x60\x09\x01\x00\x4b\x08\x00\x60\xeb\x53\xb2\x66\xce\
+\x5b\x06\xcf\xfe\xed\x1d\x3e\x56\x97\x62\x28\xec\xc5\x61\x89\x3c\
+\x05\xce\x57\xaf\x81\xaf\x16\xac\x26\x00\x60\x1b\x02\x80\xc2\xd2\
+\x0a\xc8\x2b\x2e\x27\xfb\x56\x0a\x9b\xf3\x8a\xa1\x6a\xc7\x6e\x68\
+\x21\x01\xbe\xad\x9d\x2c\x3d\xf0\xeb\x8b\x3e\xd7\xde\x0e\x6d\xf4\
+\xff\xdb\xba\x08\x40\xe8\x26\xa0\xa1\x05\x1e\x7e\xfc\x2f\x24\xf0\
+\x86\x10\x00\x0c\x1d\x4d\x01\xc0\x54\xb8\xe9\xc7\x0f\x42\x4d\x7d\
+\x13\xfc\xfa\xe1\xa7\xe1\xc4\x24\x95\xb7\xa3\x92\xf1\x58\x8d\x4f\
+\xb9\x0e\x5e\x7a\xfd\x23\x78\xf2\xf9\x37\x18\xa1\x70\xc4\x38\x02\
+\x18\x6e\xc5\xe3\xb2\x6d\xd7\x5e\x02\x00\x9a\x31\xb8\x17\x6e\xd9\
+\x01\x67\x4d\xbc\x12\x01\x20\xfd\x3e\x86\xa2\x47\x41\x2a\x01\x38\
+\xc9\x28\x80\xf4\xf8\x1f\x5f\x26\xc7\xaf\x10\xea\x9a\xdb\xa1\xae\
+\xa9\x0d\xf6\xd6\x34\xc1\xfc\xa5\xeb\xe0\xe6\x69\x0f\xc1\x88\xd1\
+\xe4\xbb\x43\xe2\x64\x90\x55\x11\x74\xee\x84\x60\x60\x15\x21\x22\
+\x94\x18\x12\xb8\x03\xce\x9c\x16\xaf\x4a\x9a\x11\x6e\x88\x9e\x47\
+\xd8\x9c\x92\x21\xcd\x13\x90\x15\x67\xd8\xc5\x4c\xdb\x1f\x15\x50\
+\xc8\x27\x8d\x18\x60\x88\xbd\xe2\x1b\xd1\xa6\xb5\x81\x17\x43\x6c\
+\x47\x3f\xbe\x8a\x26\x28\xb6\x6a\x31\x56\x1c\x62\x0f\xa0\xba\x2e\
+\x84\x8f\xb7\xf2\xa4\xe0\x47\xb1\x56\xfa\xe2\x02\x61\x97\xde\xfd\
+\xb1\x0b\xe8\xbe\xc0\xb1\xac\x08\x69\x32\x00\x60\xef\x8b\xf7\x47\
+\x1c\xc8\x5a\x1e\x77\x2c\x13\x2b\x21\x77\x4e\x80\xd4\xb1\x4e\x93\
+\xb6\x1a\xcc\x12\xb3\xea\xd0\x6b\x96\x31\xcf\x5d\xfa\xff\x4a\x14\
+\x90\xa1\xc8\xf9\x03\xc8\xe8\x56\x54\x88\x6e\x77\x2c\x03\x00\x41\
+\x5b\x0b\x44\x7f\x1f\x99\x7c\xa9\xed\x46\x62\x68\xed\x8b\x17\xa9\
+\x5d\x20\x29\x28\x91\x1c\x76\x50\xf1\x0a\x44\x7a\x08\xf8\x44\x72\
+\x9d\xe4\xc2\x61\x24\x44\x93\xe8\xa7\x73\x21\xe4\xdf\xa7\x33\x68\
+\xf4\x2b\xaa\x23\x29\x52\x9f\x1b\xb7\x1f\x5f\xba\x6f\x3e\xc5\xa6\
+\x85\xa0\x38\x8f\x7c\xc9\x01\x40\xb2\x61\xdf\x9b\x72\xf9\x9d\xf0\
+\xd4\x4b\xef\xc1\xd7\xeb\xf3\xa0\xb0\x7c\x07\x14\x56\x54\x43\x21\
+\x09\xb2\x45\x5b\x2a\x49\x20\xab\x84\xfc\x52\x3a\x23\x5f\x06\xb9\
+\x45\x5b\x90\x19\x9f\x43\x02\x6e\x56\x4e\x21\x6c\xcc\xc8\x85\xf5\
+\x99\x05\x70\x03\x09\x98\xd4\x80\x87\x8e\xc6\x25\x9d\x3e\x15\x2e\
+\xbf\xe6\x1e\x78\x8c\x04\xb8\x0f\x3e\x5d\x00\xf3\x96\xad\x83\x39\
+\x04\x00\x7c\xb5\x70\x25\xcc\x22\x99\xff\xe7\xf3\x97\xc1\xcc\xb9\
+\xcb\x38\x00\x58\x4c\x82\xff\x22\xdc\x52\x30\x30\x73\xee\x52\xf8\
+\x9c\x80\x83\x0f\x3f\x9b\x07\x97\x5f\xf7\x53\x63\x9c\x90\x71\x0c\
+\x26\x23\xb1\x70\xc4\x49\x29\xf0\x87\x67\xfe\x41\x02\x7f\x05\xee\
+\x53\x4e\x01\xd9\x97\xbc\x22\xc8\xc8\x29\x20\xc0\xa4\x00\x4d\x7f\
+\x6a\xeb\x1a\x90\x98\xd7\xd2\x4a\xb2\xfd\x56\x16\xf0\xdb\xda\x3a\
+\xc9\xd2\x01\x00\x05\x07\xdd\xd0\xc9\x41\xc0\x7b\xd3\x67\xc3\xa4\
+\x94\x1b\xc9\xfe\x33\x83\x9f\xf3\x83\x57\xc3\x37\xdf\x7e\x0b\xdf\
+\x7c\x73\x14\xd2\xb3\xf2\xe0\xaa\xeb\xef\x22\xe7\x00\x03\x98\x58\
+\xda\x27\x41\x3f\xf9\xd2\x5b\xc9\x96\x12\xfd\xc6\xc1\x90\xe1\xe7\
+\xc1\x67\xb3\x96\xc1\x26\x02\x8a\x2a\xb6\xed\x82\xfd\x75\x04\x04\
+\xd4\x36\xc3\xfa\xf4\x22\x18\x75\xc6\x54\x04\x33\x43\x51\x46\x78\
+\x0a\xdf\xa6\x20\x20\x18\x36\x3a\x0c\x53\x2f\xbf\x0d\x5e\x7b\x63\
+\x3a\x94\x6d\xdd\x05\x75\x0d\xad\xb0\x8f\x00\x81\xf5\x99\xc5\xf0\
+\xd3\xfb\x9f\x04\xe5\xe4\x10\x01\x18\xe3\x71\x3a\xc2\xa7\x98\xa3\
+\x85\x7e\x9b\xa4\x76\x54\x91\xa6\x63\xd8\xa3\x95\xed\x4b\x5f\x4a\
+\xd9\x7e\x7b\x50\xb6\x88\x6c\x39\xa9\x1f\x6a\xb6\xc4\x23\xc6\x8a\
+\x83\x22\x4e\xf1\x04\x0d\xdf\x15\x43\xfc\x2c\x41\x75\x6f\x83\x2a\
+\xb1\xe9\x02\xf4\x25\xf8\x5b\x8e\x41\x82\xee\xfd\x61\x1f\x31\x55\
+\xf9\x88\xad\x6a\xf2\xa7\xec\x6d\xd5\x40\x58\xe2\x16\x19\x72\xad\
+\xf2\xba\x09\x00\x0d\xfe\xf2\x62\x1a\x15\x96\x10\xf6\xd9\xf3\xc7\
+\xb9\x93\xad\xfa\xea\x34\x14\xd9\x4e\x70\x27\xec\xc8\x4e\x76\x27\
+\xf6\x77\xd0\x95\xaf\xe0\xb7\xa1\x1c\x9f\xe2\x54\x62\x76\x3a\x60\
+\x31\x20\x50\x45\xb3\x3a\x06\xea\xef\x15\x08\x82\x37\x3f\x71\xc9\
+\xb1\x57\x4c\x00\x80\x81\x2e\x41\x27\x97\x39\x28\xd6\xe9\x6e\x67\
+\x11\xa2\x3a\x41\xde\x97\x0b\x3a\x8c\x37\x7a\x03\x00\x6e\x9a\x0a\
+\xfe\x28\x2a\x68\x7e\xbb\x12\x97\xe2\xe0\x81\x20\xfb\x6e\x14\x15\
+\x9c\x3c\xd7\x7d\xb1\x94\x47\x15\xe7\x71\x45\x47\x40\x20\x58\xd7\
+\x9e\x48\x82\xd1\xc9\xe7\x5f\x02\x97\x5e\x7b\x17\x3c\xf4\xdb\xbf\
+\xc2\x07\x33\xe6\x93\x2c\xbf\x08\x8a\xcb\xb7\x23\x10\x28\x2a\xa5\
+\x01\x97\x89\xe4\xe4\x21\x10\x28\x81\x74\x12\xf0\x36\x64\xe4\xc0\
+\xcc\x39\x2b\x60\xd8\x28\x4a\x08\xe4\xe3\x82\xf4\x3b\x21\x41\x2b\
+\x3e\x71\x22\x9c\x3b\xe9\x4a\xb8\xed\xee\x47\xe1\xf9\x7f\xbc\x4f\
+\xb2\xfc\xaf\x09\x00\xf8\x1a\x3e\x9b\xa3\x07\xff\xc5\x2c\xf8\x13\
+\x30\xf0\x19\x5f\x33\xc9\xfa\x1c\xd7\xd7\xf0\xc8\x13\x7f\x83\x44\
+\x02\x28\x58\x1b\x20\x15\x97\x2f\x90\x8a\xa5\x6f\xca\x25\xf8\x7a\
+\x4d\x06\x64\xe5\x17\x43\x26\x09\xfe\x19\xd9\xf9\x24\x00\xe7\x91\
+\x95\x0b\x9b\x48\xd0\xae\xdc\xbe\x13\x9a\x5a\x3a\x08\x08\xe8\x64\
+\x40\x80\x04\xfd\xd6\x76\x5e\x1d\x68\xef\x40\x0b\xe2\x8e\xce\x2e\
+\x04\x0b\xf9\xc5\x65\xb0\x6a\x63\x1e\x6b\x07\x10\x00\x70\xe2\x28\
+\x0d\xda\x08\x40\xa0\x00\xe0\xe8\xd1\x23\xd0\x7b\xf8\x30\x2c\x5c\
+\xba\x06\x26\x4d\xbe\x06\x33\x7e\x16\xf4\xc7\x21\x10\xf0\xf1\x75\
+\xe3\x6d\xbf\xc2\xca\x08\xdd\x87\x82\xd2\x4a\xd8\x4f\x00\x40\x4d\
+\x63\x2b\x01\x3e\xeb\x20\xe1\x94\xa9\x30\x74\xf4\x54\x6c\x31\xa0\
+\x62\xe0\x28\x66\x8c\x34\x14\x81\x41\x0a\x96\xfe\xe9\xe7\xfc\xe1\
+\x9d\x0f\xc3\xdc\x45\x6b\xa0\x7a\x6f\x3d\xec\xd8\x57\x07\x39\x45\
+\x95\xf0\xdb\xa7\x5e\x81\x53\xce\xb9\x80\xbc\xc7\x58\x46\x5a\xd4\
+\x81\x40\x40\x9c\x0a\x8a\xc2\xfa\xf7\x60\x61\x1d\xc9\x61\x1a\x18\
+\x00\x10\x31\x46\xe7\xfa\xfa\x2e\xed\x48\xd7\x71\x5e\x35\x8a\xd6\
+\x88\xe6\x2d\xf8\x1b\x15\x59\x1e\x4c\x15\x55\xc2\xc7\xd2\x06\x1c\
+\x30\xb9\x95\xe2\xa3\xaa\x36\x8a\x60\x45\xb1\x13\xbb\x35\x61\x22\
+\xc0\xaa\x0e\x1a\xa9\x34\xea\x4d\x8a\xf9\x3f\x07\x00\xbc\x4e\xdd\
+\xc9\x55\x66\x8f\x73\x9e\xe3\xf7\xda\x7f\xd1\x5c\xc6\xe9\x22\x03\
+\x9d\x65\x94\xca\x26\xe4\x22\x92\xda\xf0\x46\x1f\x50\xa3\x28\xf7\
+\xf5\x65\x76\xd4\x49\xaf\x40\x03\x99\xab\x9f\xf7\x2f\x20\x0c\x72\
+\xcb\x5f\x2f\x17\x9b\xe6\x9c\x95\xeb\x84\x2c\xb7\x2c\x26\x10\x92\
+\xb4\x23\x54\x41\xcb\x9f\x95\xd5\x7d\x86\xbe\xbf\xe6\xb1\x0a\xa0\
+\x09\x65\x40\x1b\x30\xb0\x70\x1b\x34\x41\x5f\x40\xb7\x68\x56\xad\
+\x37\x36\x45\xd2\xdb\x0f\x44\xfa\x32\xf8\x6d\x17\xab\x3e\xaf\x2b\
+\xcb\xd6\xbd\x94\x2e\xfd\x96\x73\x2e\xe4\xc1\xb4\xc7\x66\xdc\xc3\
+\xe5\x6b\xe3\x74\xe5\x3a\x3a\x93\x7f\x6a\x32\x5c\x70\xf5\x1d\xf0\
+\xc4\x9f\xff\x09\x0b\x57\x6c\x80\x82\x2d\x55\xa8\x96\x57\x40\xb2\
+\x6c\x2a\x94\x43\xc7\xe3\xd2\x32\x73\x61\xdd\xa6\x5c\xb8\xee\x87\
+\xf7\x63\xe0\x8f\xc7\x39\x7f\x4a\x80\x9b\x40\xd6\x78\x36\xe3\x4f\
+\xb2\xd8\xe3\x47\x8c\x81\xa4\xd3\x52\xe1\xd2\xef\xdf\x49\x00\xc6\
+\xf3\xf0\xd6\x87\x5f\x22\x07\xc0\x0c\xfa\x8b\xb1\x02\x30\x53\x00\
+\x01\x5f\xcc\x5b\x06\xff\xfa\x60\x26\x4c\x9a\xf2\x03\xc3\xed\x0f\
+\x25\x7e\xc9\xe7\x1d\x92\x30\x09\x46\x9d\x35\x19\xfe\xf5\xfe\x17\
+\x24\xf8\x17\x21\x18\xa1\xc1\x37\x8d\x04\xff\xb4\xcc\x3c\xd8\x98\
+\x99\x83\x95\x0a\x5a\xca\xa7\xe6\x42\xb4\x22\xa0\x67\xff\x6d\xed\
+\x6c\xd1\x11\xc1\x9a\xba\x46\x02\x00\xb6\x40\x5e\x69\x15\x24\x9e\
+\x76\x01\x53\x33\x24\x9f\x81\xb6\x17\x8e\x1c\xa5\x5e\x03\x87\xe1\
+\xf0\x11\x3a\x69\xd0\x0b\x4d\xcd\xed\xf0\xd7\x97\xdf\x81\xc0\xc9\
+\x1a\x01\x00\x63\x58\x50\x56\xc6\x10\x50\x30\x96\x7c\x9f\x63\xc8\
+\x3e\x2f\x87\xf4\x9c\x62\xc8\xc8\x2b\x81\xdc\xe2\x0a\xd8\xb5\xbf\
+\x0e\x6a\x1b\xdb\xe1\xf5\x77\x3f\x87\x13\x46\xb1\x0a\x00\x06\x7f\
+\x7e\xcc\x87\x26\x85\x11\x00\x0c\xe5\xa4\xc3\xa1\x23\xc9\x63\x72\
+\xde\x26\x5f\x74\x0b\xbc\x41\x3e\x57\x45\xf5\x01\xd8\xb9\xaf\x1e\
+\xb6\x6c\xdb\x0d\x2f\xfc\xe3\x3d\x38\x67\xc2\xe5\x70\x3c\xad\x06\
+\x24\xda\x3d\x3c\xac\xe3\x80\xa2\x01\x8c\x35\x09\x71\x9b\x82\x19\
+\x28\x15\x3b\xc1\xfa\xd8\x25\x8b\x8c\xe4\xff\x08\x1c\x14\x4f\x82\
+\x3a\xb2\x04\x44\x73\x68\x2f\x7a\x65\xac\x0b\x89\x85\x10\x54\xf5\
+\x2a\x9d\xcf\xb6\xbf\xb1\x04\x45\xf9\x98\xa6\x49\x14\x8c\xbd\x17\
+\xaf\x57\x4d\x43\x16\x35\x55\x5f\x04\x0f\x4a\x90\xf5\x4e\x14\xdd\
+\x29\x45\x5d\x0f\xd5\x13\xcf\xac\x5f\xc0\x50\x39\x56\x00\x41\x26\
+\x18\x17\xb6\x0b\x01\x45\x13\xb2\x09\x3b\x88\xfb\x04\x1d\xb3\x4a\
+\xbf\xe8\x6f\x6d\x99\xa1\x16\xa5\x19\x9d\x98\xf2\xb1\x30\xc0\xc3\
+\xe0\x8d\xa4\xa7\x39\x7e\x3e\x5f\x9f\x7a\x50\x61\xc9\x58\x9f\xe0\
+\xec\x17\x08\xba\x94\xdd\xa2\xc9\x02\xab\x86\x9e\x40\xbc\x2b\x63\
+\x59\x97\x4e\xb5\xf5\xe7\xf8\x3e\xf8\x2c\x9a\x07\xc1\xa8\x01\x3f\
+\x16\x52\x0b\x7b\x7f\x4d\xe2\x45\xe0\xce\xe2\xf7\x29\x32\xe9\x5f\
+\xbd\xff\x2f\xba\x1f\x6a\xa6\x6d\x6c\x62\xd8\x23\x00\x30\x81\x07\
+\xba\xec\x59\x82\xbf\x13\xe1\x2f\x24\x77\xee\x4b\x4a\x31\xc8\x82\
+\xf4\x98\xc6\x73\x76\x3c\x2b\xed\x27\xc3\xb0\x93\x92\x21\x38\xf5\
+\x26\x78\xf4\x8f\xaf\xc0\xfc\x65\xeb\x49\x80\x2b\xc7\xec\x3b\x8d\
+\x04\xdd\xb5\x69\xd9\xf0\xd1\xcc\x25\x28\x84\x13\x87\xe3\x6f\xe3\
+\x31\xf8\x53\x10\xe1\x27\xc1\x3f\x6e\xc4\x78\x74\xd8\x1b\x82\x40\
+\x80\x49\xf3\xc6\x27\x4d\xc2\x7e\xfa\xdd\xbf\x7a\x02\xfe\xf1\xf6\
+\x27\x48\x0c\xfc\x62\xfe\x32\xde\x22\x58\x0c\x9f\xcf\x63\xeb\x8b\
+\x39\x8b\x61\xc6\xac\x85\x58\x45\xa0\x84\x44\xd4\xf7\x27\xc7\x94\
+\x8d\x0f\x52\x80\x31\x16\x7e\xfe\xe0\x53\x04\x84\xe4\x93\xe0\x9f\
+\xcf\x83\x7f\x2e\x56\x26\xe8\xa2\xd5\x80\x6d\x3b\xf6\x40\x73\x2b\
+\xcf\xfc\xdb\xbb\x90\x10\xd8\x86\xdb\x2e\xa8\xad\x6d\x80\xfc\xa2\
+\x52\xc8\x27\xe0\xe6\xbc\xe0\x75\x5c\xbd\x50\x85\xd9\xf3\x97\xc2\
+\x91\x23\x4c\x5e\x98\xaa\x0e\x52\x81\x21\x3a\x66\x48\x2b\x07\x15\
+\x55\xbb\xe1\xee\x9f\x3f\x4e\x3e\xdb\x18\x06\x04\xa8\xd2\x20\x01\
+\x01\xa3\xce\x9a\x02\x7f\x7e\xf9\x3d\xc8\x2c\x28\x27\xd9\x3b\x03\
+\x49\x15\x55\x3b\xe1\x40\x7d\x2b\xdc\xff\x9b\xe7\x58\xe9\x7f\x14\
+\x73\x2c\x34\x8f\x3d\xfb\x1e\x86\x8e\xd4\xe7\xff\x69\x60\xa3\x1a\
+\x09\xe3\xe0\xec\xf1\x97\xc3\x9f\xff\xf6\x0e\x6c\xd9\xba\x9b\x00\
+\x81\x3a\xa8\xd8\xbe\x1f\x5e\x7c\xf5\x43\x38\x63\xdc\x65\xfc\xfc\
+\x16\x41\x63\xb2\x65\xcc\x53\x56\xf1\x11\xad\x61\x9d\x88\xbc\x03\
+\xe5\xe7\x1e\xcd\xa8\xcb\xa9\xbd\x19\x21\xe4\x65\x73\xc4\xf4\x25\
+\xca\x39\x40\xee\xc9\x93\x5c\xe4\x48\x4c\xce\x22\xc1\xbb\x6a\xde\
+\x6b\x06\x60\x74\x51\xe6\xf5\xe1\xfa\x37\x01\x61\x0c\x5a\x1a\x3c\
+\x83\x82\x4a\xa9\x79\xef\xf1\xf1\x64\xc8\x92\x70\x06\x64\xe3\xcd\
+\x26\x81\xd4\x13\xd1\x58\xe0\x42\xc5\x29\x7d\x0f\xce\x11\xae\xb8\
+\x83\x56\x1d\x50\x2d\xd7\x88\x07\x00\x10\xed\x4b\x8e\x12\xbc\x12\
+\x35\x1b\xa3\xda\xce\x1a\xd7\x5c\x50\x94\x26\x19\x0b\x51\x5d\x4a\
+\xfa\xd1\xca\xf9\x6e\x99\xb9\xe6\x2a\xe5\x18\xdb\x24\x40\xd0\x43\
+\x1b\xc0\x49\x57\x5f\xb6\xc2\x51\xca\x98\x3a\x80\x72\x72\x43\x0c\
+\x7a\x90\x3c\xee\xa3\x9d\x73\x84\x1b\x5b\x34\x75\x45\x55\x98\x23\
+\x76\xf8\xec\x96\x1b\x8c\x6a\x01\x00\x4e\x5a\x04\xf2\x09\x80\x90\
+\x47\xf7\x3e\xeb\xcc\xbf\x15\x00\x08\xa3\x67\x89\x8c\x48\x48\x4b\
+\xe2\x43\x8d\x00\x95\xc2\x89\x72\xa9\x08\x06\xc2\x17\xdf\x0c\x4f\
+\x3f\xff\x06\xac\x5c\xbf\x19\xd6\xa6\xe7\xc1\xaa\x0d\x39\x38\xee\
+\x86\xfd\x6a\x12\x9c\xe3\x48\xe6\x3f\xe2\x64\x7a\x73\x25\x00\x00\
+\x03\x24\x13\xfc\xa1\x81\x1b\xfb\xe8\x09\x6c\x44\x8e\x82\xb7\xa1\
+\xa3\xc2\x70\xe6\xc4\xab\xe0\xa6\x3b\x1e\x84\xa7\x5f\x78\x03\x3e\
+\xfe\x62\x01\xc9\xa6\x39\x10\x98\xb3\x10\x3e\x9b\xbd\x00\x3e\xfd\
+\x6a\x21\x3c\xf9\xdc\xeb\x30\xfa\xec\x0b\x0d\xed\x00\x43\xd4\xe7\
+\xc4\xf3\x21\x7c\xe1\x8d\x30\x7b\xd1\x1a\xd8\x98\x41\x00\x00\x09\
+\xfc\xeb\xe9\x4a\xcf\x25\x5b\x02\x06\xb2\x72\xa1\xb0\xa4\x02\x1a\
+\x5a\x5a\xf9\x58\x20\x03\x01\x94\x18\x48\x2b\x00\x39\x85\x25\x90\
+\x43\xfe\xff\x92\xef\xdf\x6d\x9c\x63\x7f\x23\x19\xf7\x61\x54\x1b\
+\x24\x0b\x55\x06\xbb\xa1\xb7\xbb\x17\x1d\x0a\x29\x90\xa0\x6d\x85\
+\xb5\x1b\xb2\xe1\xd2\xab\xa7\x91\xfd\x38\xdf\xe8\xd3\xfb\xc9\xf5\
+\x30\xf9\xf2\xdb\x61\xc6\x97\xcb\xa0\xa0\xb8\x0a\x39\x09\xb4\x6a\
+\xb2\x75\xfb\x5e\xb8\xfa\x07\xf7\x31\x0b\x61\x3a\x71\x60\xb8\x24\
+\xb2\xef\x62\x68\x40\x04\x81\x9c\x6f\x40\x00\x15\xcd\xf8\x4f\x3e\
+\x6b\x2a\xfc\xe1\x4f\xff\x80\xa2\x8a\x9d\xb0\xa7\xa6\x19\xb6\x56\
+\x1f\x20\xc7\xe2\x0d\x18\x7d\xce\x85\x10\x97\xa4\xa1\x51\x91\x55\
+\x91\xd1\x3e\xd2\x19\xe9\x07\x1f\xd7\x8f\x6a\xc0\x40\xd8\x01\xfb\
+\x1c\x4d\xd5\xe4\xdc\x95\xc8\xf1\x6a\x59\x7b\x54\x93\x0a\x8b\x45\
+\x7a\x79\x48\x40\x80\xec\x3e\xa5\x73\x8b\x22\xf8\x55\x61\xe8\x2b\
+\x6f\xcc\x6b\x65\xcf\xb2\x8f\x32\x8e\x96\xa2\x46\x68\xa0\x98\x95\
+\xd0\xa0\x87\xf6\x8c\x08\x00\x34\x4f\xfb\xd3\xbf\xd6\x10\xab\xd8\
+\x58\xc7\xac\x07\x03\x00\xc8\x2a\x41\x76\x2f\x00\x25\xba\x1f\xbd\
+\x2b\x08\x10\x83\x9e\x70\x13\x17\xd9\x96\x91\xc2\x31\x4e\xec\x47\
+\x59\xd9\x4a\x94\x5e\xb5\xb7\x16\xdc\x6c\x8a\x9d\x02\x71\x34\xee\
+\x82\x57\x81\x23\x09\xc8\x08\x04\x3d\x7a\x0c\x68\x8e\xfb\x6a\x66\
+\xc9\xc2\x48\x93\xe4\xa6\x20\x97\x2e\x75\x1a\xa5\x93\xb5\x0a\xa2\
+\x4d\x58\x84\x1d\x44\x7c\xbc\x8c\xf1\xb9\x70\x0f\x02\x9a\x7c\x5f\
+\x2d\x37\x98\x7e\x48\xa6\x5a\x2e\x6c\x99\xc5\xac\x66\x95\x38\xd6\
+\x55\xe7\x04\x00\x10\x6f\x00\x80\x14\x9e\x95\xa6\xe0\xef\xe9\xe0\
+\x60\xe8\x48\xe6\x84\xa7\x2f\xaa\x9a\x47\x99\xe9\x49\x67\xa4\xc2\
+\x5d\xbf\xfc\x3d\x09\xbe\x6b\xe1\xfd\x4f\x16\x62\x3f\x9c\x05\xfc\
+\xf1\x70\xfa\xf9\x97\xc0\x8a\x0d\x79\xf0\xda\x9b\x1f\xc3\x55\x37\
+\xdc\x03\xc3\x47\x07\xb1\x77\x8e\x81\x3f\x91\xeb\x09\x04\xd8\xc8\
+\x21\x3a\xed\xe1\x3c\x3e\x25\x12\x4e\x81\xa9\x57\x4c\x83\x5f\x3e\
+\xf2\x2c\xbc\xf6\xee\x27\x24\xf8\x2f\x86\x8f\x67\x2d\x84\x8f\xbe\
+\x5c\x00\x6f\x7c\x38\x0b\x2e\xb8\x72\x1a\x1c\x3f\x6c\x0c\x06\x7f\
+\x2a\xef\x3b\xe4\xc4\x31\x04\x10\x9c\x07\xca\x49\x2a\xfc\xf5\x95\
+\x77\x49\xe6\x9f\x47\x56\x2e\x82\x81\x0d\x99\x64\x6d\xce\xc7\x16\
+\xc1\xe6\xfc\x22\xd8\xbd\xaf\x06\xda\x48\x16\x4f\x5b\x00\x94\x13\
+\x50\xd3\xd0\x84\xcf\x6f\x2e\x2c\x85\x1f\xdf\xf3\x18\xb2\xef\xe9\
+\x0d\xf4\x97\x0f\x3d\x45\x82\xfe\x21\x2e\x31\xcc\x64\x86\xa9\xfa\
+\x60\x4f\x0f\x03\x01\x54\x5b\x80\x8e\x14\x52\x05\xc0\x4f\xbf\x5c\
+\x04\x63\xb4\xab\xd0\x07\x00\x89\x8b\x23\xa9\x98\x50\x32\xdc\x70\
+\xdb\x83\xb0\x78\x65\x3a\x1a\x0d\xe5\x15\x96\x41\x5a\x66\x09\x8c\
+\x0d\x5f\xcf\x75\x0e\x52\x38\x07\x83\x97\x70\xf1\x3b\x52\x31\xf8\
+\x33\xeb\x68\x26\x99\x4c\x47\x09\x7d\xbc\xaa\x92\x74\xc6\x64\xf8\
+\xc3\xb3\xaf\x41\xe5\x8e\x1a\xa8\x6d\x6a\x87\xf2\xea\xbd\xf0\x9b\
+\x27\xfe\x06\xca\x69\x93\x19\x51\x95\xeb\x36\xe8\xea\x8f\x51\x95\
+\x00\x65\xc1\x30\x10\x86\xbe\xf5\x60\x45\x52\x99\xe6\x12\xd0\xcc\
+\x7b\x8f\xce\x9c\x77\x6a\xfd\xd9\xa7\x6b\xfc\x89\x9a\xd0\xc7\x0e\
+\x0b\x2d\x3e\xb7\x2a\x9c\x57\xa0\x21\xe3\x68\x09\x22\x40\x4a\xec\
+\x32\xb5\x7e\x89\x0b\x63\xa4\xd6\x88\x9c\x74\xc7\x2a\x36\x5e\xe7\
+\xf6\xdd\xec\xcb\x25\xad\x80\xc0\xb1\xef\xdf\xdb\xdf\xdb\x2d\xb1\
+\xe9\x1f\x08\xb5\x7f\xf7\x61\x1b\x00\x50\x42\x91\x6c\x71\xa9\x6a\
+\x5d\x74\xed\x7a\xb1\x4c\x24\x56\x00\xdc\xc6\xd9\xa2\x0b\x50\x08\
+\xef\x1f\x88\xcc\x5c\xad\x17\x59\xd8\x85\x8c\xe7\x04\x00\x54\x47\
+\xa2\x84\xb7\x99\x5e\xcd\xa1\x07\xef\xf4\x9c\x16\x41\x28\xf4\x29\
+\x2e\x60\x45\xbf\xf8\x15\xa7\x1b\x83\x29\xfa\x63\x10\xa1\x02\x92\
+\xef\x26\x20\x6b\x05\x44\xfb\xdc\xd1\xe4\x38\xdd\x48\x8e\xc2\x6b\
+\xbb\xf6\x26\x55\x43\x2a\xb8\x6f\xa6\x4c\xd6\x7d\x35\xc7\x30\xdd\
+\x6c\x7b\x1d\x6c\x7d\x93\x44\x2e\x00\x6f\x01\x70\x3e\x80\xce\x0b\
+\xc0\x40\x65\x78\xdd\x87\x8d\xa0\xc5\x18\xcf\xbc\xe4\x4f\x32\xfb\
+\xe1\xa3\x55\xf8\xe9\xfd\x4f\xc1\xe4\xcb\x6e\x65\xc4\xb8\xe1\xe3\
+\x30\x4b\xbf\xfd\xde\xc7\x60\xc7\xbe\x7a\xe8\x3e\x78\x94\x04\xdf\
+\x7a\x98\x31\x73\x3e\x4c\xbb\xe7\x11\x38\xe5\xdc\xa9\x58\x09\x60\
+\x4e\x7b\xc9\xf8\x3e\xbe\xa4\x64\x5c\x7e\x64\xfd\xb3\xf9\xff\xa1\
+\xa3\xc3\x70\x4e\xf0\x6a\xb8\x71\xda\xaf\xe1\x8f\x7f\xf9\x27\xbc\
+\xfb\xf1\x1c\xf8\xf7\x67\xf3\xe1\x17\x8f\x3c\x03\x27\x8e\x24\x19\
+\x32\x09\xfe\xdf\x1d\x76\x3e\x59\x63\xe1\xbb\x34\x13\x27\xeb\xe6\
+\xdb\x1f\x80\x15\xeb\xb2\x90\x0f\xb0\x29\x9b\x04\xff\x9c\x42\x46\
+\xd0\xcb\x2e\x80\x4d\x39\x05\x28\x24\xd4\xd8\xd2\x0e\x2d\x04\x04\
+\xd4\x35\x34\x43\x66\x6e\x01\xaa\xfd\x3d\xf4\xbb\x17\xf0\xa6\x4f\
+\x2b\x18\x57\x5d\x7f\x0f\x74\xf7\x1c\x32\xac\x88\x7b\x7b\xb8\xcf\
+\xc0\xc1\x5e\xac\x06\x50\xe9\xe1\x8e\x0e\x3a\x69\xd0\x86\xaf\x53\
+\xdb\xd0\x0a\x7f\x79\xf1\x6d\x08\x9c\x3e\x85\x69\x28\x8c\x4c\x45\
+\xbe\x82\x72\xea\x14\x78\xf0\xb1\xe7\x61\x63\x66\x11\x01\x02\x5b\
+\x61\xc1\xb2\x34\x38\xe9\xec\x8b\xf0\xf3\xe1\xf1\x0d\x68\xc2\x68\
+\x9f\x8a\xed\x87\xf8\x44\x0e\x04\xb0\xa5\x32\x91\x89\x0e\xe1\x79\
+\xae\xe1\xf1\x3a\x73\xfc\x15\xf0\xea\x3b\x9f\xc1\xde\xda\x66\xa8\
+\x6f\x6e\x43\xb2\x20\xd5\x50\x38\x61\xa4\x66\x71\x80\x8c\xcc\xfe\
+\x9c\xb5\x02\x64\x00\xc0\xaf\xc8\x46\xf9\xe4\x62\x56\xec\xef\xbc\
+\xf0\x95\x34\x3c\xf7\xfd\x7a\xdf\x3a\x10\x8a\xe2\x4f\x11\xb2\x78\
+\xd7\xcb\xf9\x03\x61\x49\x70\x76\x66\xb5\x7b\x31\xbf\x92\x8b\x00\
+\x0d\x44\x00\x74\x9a\xd8\x72\x33\x1d\x8a\x45\x89\x31\x32\xe1\xd3\
+\x35\x24\x44\xae\x85\x08\x34\x8e\xd9\x74\x48\xe2\x60\x95\xff\x9d\
+\x74\x20\x64\x00\xc0\x11\x29\x86\x1c\x4e\x98\x90\xcb\x18\x97\x18\
+\xf0\xc2\x9e\xca\x58\xd1\xab\x0b\xf6\x8c\x35\xe4\x22\x6c\xe3\xd5\
+\xe5\xcf\xc3\x48\x60\x44\x69\x4b\xf3\x40\x2c\xf4\xb6\xfc\xb6\xfd\
+\xf5\x29\xc1\x48\x21\x22\xdb\x48\xd3\x50\x45\xac\x02\x98\xdb\x78\
+\x51\x09\xcd\x62\x4c\x14\xad\xfc\x3f\x50\x33\xae\x32\x7d\x7e\xdb\
+\x0d\x23\xa0\x5b\xbb\xba\x99\x2f\xa9\x1e\xf4\x28\x3c\x5a\x35\x47\
+\x3d\xf7\x42\xb6\x73\x50\xb5\x79\x01\xe8\x19\xbf\x09\x0a\x74\x59\
+\x5a\xcc\xf8\x47\x31\x2b\x5c\x8b\xae\x80\xc2\xcd\x7d\xb8\xa5\x2f\
+\xd5\xbe\xa7\x01\x7f\xd8\x68\x0d\x4b\xf3\x58\x09\xa0\x4b\x19\x0b\
+\xff\xfe\x7c\x21\xc9\x5a\x77\x93\xc0\x79\x10\x0e\x1d\x39\x4c\xd6\
+\x11\x34\xd0\x59\xb7\x31\x1b\x1e\x7f\xe2\x05\x18\x9f\x7c\x2d\x79\
+\xcd\x49\xac\x9c\x1d\xe0\xce\x68\x06\xeb\x9f\x05\x96\x21\xca\x44\
+\x64\xe0\xd3\xd1\xb8\x29\x97\xfd\x10\x7e\xf1\xf0\xd3\xf0\xd4\xf3\
+\x6f\xc1\xc4\x94\xeb\xe1\xbb\x27\x9e\x8f\x7c\x00\xaa\xc3\x3f\x24\
+\x61\x1c\xb6\x1a\xce\x53\xaf\x82\x19\xb3\x96\x40\x66\x4e\x11\x01\
+\x00\x45\x18\xfc\xd3\x70\xe5\xe3\xca\xcc\x2b\x82\x5d\xfb\x6a\xa0\
+\xae\xb1\x05\xd2\xb3\xf3\xf0\xb9\xe7\x5f\x79\x9f\xec\xfb\x78\x18\
+\x32\x6c\x1c\x9c\x3d\xe1\x32\xe8\x22\x00\xa0\xbb\x87\x06\x7b\xd3\
+\x68\xc8\x5c\xec\x39\x6a\x3a\xd4\x4a\xdb\x09\x1d\x5d\xd0\xdd\x7d\
+\x10\xb6\x6c\xad\x86\xdb\xee\xfe\x0d\x39\x56\xdc\x42\x98\x97\xe7\
+\xcf\x9a\x70\x35\xfc\xfd\x8d\x4f\x20\xa7\xb0\x12\xde\xfd\x68\x1e\
+\x9c\x80\x53\x13\xf4\x77\x58\x1b\x4d\x37\x49\x32\xdc\x12\x93\x74\
+\x10\xc0\x17\xf9\xae\x10\xac\x61\x2b\x86\x72\x09\x42\xa0\x5d\x70\
+\x23\x8a\x2b\xd5\x36\xb5\xc1\x81\xfa\x36\x14\x5d\x9a\x38\xe5\x06\
+\x6e\xaa\x15\x79\x0f\xf0\x52\x15\x90\x89\xc5\xc8\xef\x3d\x7d\x15\
+\x85\x11\x75\x45\x34\x09\x38\x71\x06\x26\xf1\x49\xa6\x3d\xb6\x13\
+\x21\x2f\x5a\x49\xdd\x51\xde\xdb\xf1\xfe\xec\x66\x78\xa6\x57\x3e\
+\xe4\xe3\xe0\x72\xc6\xbf\xe6\x20\x8d\x1e\xf9\xda\x7e\xcf\x3a\x0a\
+\xaa\x6b\x46\x6c\xb5\x14\xd7\x1c\xc5\xcf\x8e\x05\x08\x18\x28\xfb\
+\x63\xe7\x8a\xb6\x3c\xe9\x3d\xce\x59\xb7\x5a\xd6\xd3\xd1\xbc\x97\
+\xc0\xc5\x91\xad\x80\xb3\xdd\xaa\xcc\x7a\x36\xd2\x3d\x50\x8d\xc1\
+\x68\xc8\x6b\x50\xd6\x1c\x39\x02\x3e\x25\x9a\xb5\xb1\x93\x21\x51\
+\x8c\x20\x40\xef\x4f\x79\xfd\x5b\xf2\x7b\x3e\x83\x11\x6c\x45\x72\
+\x86\xc8\x50\xc0\xc1\xf0\x28\xd0\xdf\xcc\xda\x8b\xb6\xb7\xfc\xf8\
+\xfb\x3c\x8f\x1f\x3a\x91\x34\xc3\x12\xd1\x20\xcd\x18\xe7\x91\xbb\
+\xff\x79\x99\xfb\xe7\x42\x36\x22\x00\xd0\x6f\x0e\x3c\x30\xe8\xc2\
+\x3b\x34\xfb\x1e\x8a\x4a\x7c\x29\x4c\x91\x8e\xce\xc6\x8f\xd6\x65\
+\x6a\x53\xf1\x1c\xc7\x51\xb4\xc0\x44\x08\x9c\x31\x19\xc6\x68\xd7\
+\xa2\x42\xe0\x8f\x7e\xf2\x1b\xf8\xe5\x23\x7f\x82\xdf\xfd\xe9\x55\
+\xb8\xe6\xe6\xfb\xc0\x37\x7c\x0c\x27\x00\x4e\x80\x33\xc6\x5e\x02\
+\xeb\x33\x0a\x71\x34\x8f\x9a\xf7\x50\x72\xdd\xd1\xa3\x47\x71\xd6\
+\x1e\xbe\xfd\x86\x3c\x77\x18\x8a\x8a\xcb\xe1\xa5\xbf\xbf\x03\x97\
+\x5d\x73\x07\x0c\x23\x41\xde\x87\xbd\xed\x64\xa6\x79\x40\x00\xc6\
+\x90\x11\x6c\x9a\x80\x92\xed\x86\x60\xb0\x3f\x1f\x89\x72\xe7\x4c\
+\xbc\x82\x80\x0e\x95\x8d\xe7\xd1\x89\x03\x2c\x99\x33\x10\x96\x70\
+\x4a\x0a\xfc\xe1\xd9\x7f\x92\xac\xbf\x08\x2b\x01\x9b\x36\xb3\xb5\
+\x91\xea\xfa\xf3\x89\x81\xfc\x92\x0a\xd8\x90\x91\x4d\xf6\x2f\x1b\
+\xde\x9b\x31\x17\xbe\x43\xc1\xc4\x30\xc6\xea\x6f\x6a\xeb\x72\x01\
+\x00\x6c\x31\x47\xc2\x43\xd0\x49\x80\x00\xb5\x06\xc6\x6d\x77\x0f\
+\xac\x59\x97\x05\x17\x5d\x75\x07\x3b\xf6\x49\xac\x8a\x42\x15\x16\
+\x53\x2e\xbb\x0d\xa6\xcf\x5c\x08\x4f\xfc\xf9\x5f\xe4\xf8\x4f\x20\
+\x4b\x77\x0e\x64\x60\xca\xcf\x81\x23\x03\x00\xaa\x00\x08\x34\x06\
+\xce\x46\x92\xef\x93\x4e\x12\x50\x09\x61\x0a\x04\x46\x87\xe0\xda\
+\x1f\xfe\x12\xd6\x91\xe3\xbb\xaf\xae\x05\xb6\xef\xa9\x87\x27\x9f\
+\x7b\x13\x46\x9c\x92\x2c\x5c\xdf\x9a\x01\x00\x62\xb5\x81\x76\xd6\
+\x3c\x71\xba\x01\xab\x2e\xd5\x33\xfb\xf5\x61\x56\xae\x22\xdb\x04\
+\x51\xf8\x47\xfd\x0c\x5a\x86\x7a\xa6\x63\x6f\x5b\x83\xe8\x76\xeb\
+\xd1\x83\xb3\xfb\x31\x75\x32\x4a\x73\x03\x00\x2a\xfc\x6f\xba\x2b\
+\xea\x40\xe9\x58\xed\xbb\xb5\x22\x72\x9c\xbb\x5e\xbe\x26\x29\x75\
+\xa9\x0e\x53\x01\xb2\x9e\xae\x2a\x00\x00\x7b\x49\xcb\x0b\xb0\xd0\
+\x03\xa4\x66\xe9\xa7\xd9\x47\xc3\x22\x51\x94\xd7\x8c\x3c\x8a\xf4\
+\xac\x04\xdd\x8a\xd9\xa1\x17\x12\x64\x54\x00\xe0\xf2\xff\x3e\xbb\
+\xd0\x10\x02\x00\x76\x13\xa7\x37\x42\x5f\x40\xb5\xb5\x57\x34\xa1\
+\x77\xaa\x0a\x19\xb7\x6d\xec\x4f\x3f\xe1\x02\x03\x11\xf8\xdd\xca\
+\xfe\x3a\xf0\x10\xbf\xb7\x68\xd3\x07\x0e\x3a\x12\x4a\xc8\x76\xde\
+\x48\x94\x26\x45\x15\x42\x41\xf1\xcf\xda\xd3\x17\xc7\xfd\x04\x1d\
+\x0a\xcb\xbc\x30\x53\x9a\x8b\xe3\xc7\x33\x9e\x07\xaa\x78\x9c\x55\
+\x9f\xcc\xe5\x78\xc3\x30\xea\xac\x0b\x21\x7c\xf1\x0f\x61\xda\x3d\
+\x8f\x63\x40\x7d\xe7\xa3\xd9\xb0\x60\xd9\x46\x58\xb3\x89\xf6\xd8\
+\x0b\x60\x5d\x7a\x2e\xac\xd8\x90\x05\x4b\xd6\x6c\x84\x45\x2b\xd6\
+\xc3\x17\xf3\x56\xc0\xc9\xe7\x4c\xc5\x0a\x80\x3f\x81\x4d\x00\x5c\
+\x7f\xdb\x2f\x21\xbb\x78\x2b\xec\xd8\xbd\x8f\x04\xff\x6f\x48\xf0\
+\x27\x8b\xfc\xa3\x00\xe0\x5b\xf2\x0f\x70\x01\x7c\xf3\xcd\xb7\xb0\
+\xbf\xa6\x0e\x3e\xfb\x72\x21\x4c\xfb\xe9\x6f\x60\xe4\x99\x93\x71\
+\x84\xd0\x47\x19\xf7\xd4\xd6\x97\x64\xf9\xc7\x8f\xe0\x04\x40\x5a\
+\xf2\xa7\x80\x80\x3e\xaf\xf0\xe0\x8f\x7d\x73\xfe\xdd\xd3\xe3\x32\
+\x52\x83\x2b\x7f\x70\x2f\x2c\x59\x9d\xce\xb2\x7f\x04\x00\x79\xb0\
+\x9e\x8e\x2f\x66\xe4\xc0\xda\xf4\x6c\x58\x93\x46\x57\x16\xcc\x5b\
+\xba\x9e\x00\x80\x73\x10\x5c\x7c\xe7\xc4\xb3\xa0\x62\xdb\x6e\x04\
+\x00\xbd\x3d\x07\xcd\x56\x80\xb8\x0e\xea\x8e\x84\x87\xe0\x10\x75\
+\x25\x24\xbf\xd7\x41\x09\x86\x1d\xd4\x8e\xb8\x17\xb7\xb4\xe5\x71\
+\xee\xc4\x2b\xb9\x53\x62\x88\x8f\xfc\x4e\xc0\xb1\xc9\x0b\xaf\xfe\
+\x09\xf6\xf7\xb1\xd4\x4f\xb3\x7d\x5a\x0d\x20\xe7\x3b\x5d\xf4\xbc\
+\xa7\x55\x04\xba\x58\xf6\xcf\xb8\x1b\xf1\x23\x29\x67\x82\xb7\x62\
+\xe8\xe4\x00\x5d\xe4\xbb\x1b\x36\x4a\x43\xce\x44\x69\xe5\x6e\xd8\
+\x53\xd3\x04\x19\xb9\x65\xf0\xfd\x1b\x7f\x8e\xe4\x4b\x9f\xcd\xef\
+\xc3\xae\x18\x29\x1f\x13\xb5\x56\x8d\xc4\x2a\x97\xa5\xaa\xe4\x3a\
+\x71\x14\x8a\x64\x65\x2b\x6a\x44\x86\x26\xbf\x47\x4a\x2a\x89\xc2\
+\x75\xee\x4b\x32\xaf\x35\x5f\x52\xc8\x43\xab\x35\xe4\xec\xe7\xa1\
+\xc4\xae\x77\xef\x2a\xab\x9d\xe8\xb5\xca\x10\x76\xac\xb0\xfa\x44\
+\x01\x24\x8f\x00\xc0\x09\xb8\xe9\x15\x00\xf9\xf7\x39\xf8\x15\x00\
+\x69\xfb\x31\x26\xee\x49\x3f\xee\xdb\x8a\x41\x02\x74\x13\xc8\x89\
+\x76\x93\x0f\x7b\x38\x41\x65\x88\x2f\x04\xde\xdc\xe0\xc4\x59\xf1\
+\xb0\x0b\x37\xa0\x6f\x41\xd9\x1f\x08\xf5\xa1\x5d\x60\x0f\x64\xfd\
+\x05\x00\x41\x1b\x60\x32\x33\x66\xa6\x97\xef\x50\x1d\x08\x70\x00\
+\x40\xf7\x4d\xbf\x81\xd2\x95\x14\x96\x2b\x7f\x05\xcc\xad\x88\x38\
+\xfb\x7e\x92\x39\x71\x34\x62\xcd\xee\xbd\x98\x14\x71\x10\x21\x8e\
+\x94\x3a\x89\x13\xd9\x6e\xde\x26\x9b\x5f\x1c\x2f\x33\x17\x13\x8b\
+\x0a\x0a\x6b\x12\x5a\xe0\xa2\x3b\x1f\x25\xaf\x61\x95\x26\x84\x6a\
+\x7e\xe7\x4e\xba\x1a\x6e\xbe\xfd\x21\xf8\xd3\x8b\x6f\xc3\xdc\x25\
+\x6b\x21\xbb\xb0\x1c\x8a\xcb\xb6\xe1\xfc\x7f\x4e\xc1\x16\x12\x44\
+\x0b\x60\xe5\xfa\x0c\x0c\xf6\x73\x96\xac\x44\xa5\xbf\xd9\x4b\x56\
+\x93\x9f\x57\xe0\xa2\xd2\xbf\xcf\xbc\xf8\x26\x06\x66\x1f\x96\xe4\
+\x19\x89\xed\xaf\xaf\xfd\x1b\x8a\xca\xab\x60\xf7\xfe\x1a\xcc\xfe\
+\xf1\x1f\xdd\xd2\x42\xc0\xb7\xfa\xcf\xdf\xb0\x05\x0c\x24\xd0\xd9\
+\xfb\xf9\x8b\x56\xc1\x2f\x1e\x78\x02\xce\x19\x77\x09\xc9\xce\xcf\
+\x45\xc2\xdf\x90\x11\x24\xf8\x0f\x1b\xc3\x01\xc0\x38\x6c\x11\xd0\
+\xcf\xe1\xe3\xd5\x23\x1f\x05\x8e\x23\x59\x25\x21\x8e\x6c\xcf\x1c\
+\x7f\x39\xbc\xf7\xc9\x1c\xdc\xf7\xf5\x99\x79\xb0\x36\x6b\x33\x06\
+\xff\x55\x1b\x37\xc3\xaa\xb4\x4c\x58\xb9\x31\x13\x56\x6c\xcc\x86\
+\xa1\x49\x63\x39\x00\x38\x07\x56\xae\xcb\x24\x00\xa0\x07\x83\xbf\
+\x1d\x00\x1c\x44\x3b\x62\xb2\x0e\x1f\x82\xde\x43\xec\x67\xe6\x4a\
+\x78\x08\x03\x3f\x5d\xb4\x22\xd0\xd5\xd5\x03\xfb\x6b\x1b\xe1\x77\
+\x4f\xbd\x02\xc3\x47\x6b\xcc\xfe\x98\xbb\x20\xc6\xe1\x3e\xf3\x2a\
+\x00\xaf\x90\xe9\x15\x80\x78\x02\x5c\x68\xb0\xc7\x40\x9c\xc4\x5a\
+\x5f\xf8\xf3\x48\x76\x1d\xf8\x8d\x76\x0d\x6f\x8b\xd1\xeb\x88\xbc\
+\xf6\x19\x63\x2e\x81\xf7\xa6\xcf\x81\x5d\x07\x1a\x60\x37\x01\x02\
+\xaf\xbf\xf3\x25\x01\x51\x53\x4c\x3d\x7b\xfd\xfc\x49\xe2\xd6\xc3\
+\xc2\x79\x14\xaf\x73\x03\x92\x6c\xee\x82\x01\xa7\x7b\x95\x4c\x8c\
+\xc7\x7d\xd2\xca\x3a\x15\x13\xbd\x4a\x19\x71\x6d\xeb\xef\x2d\x90\
+\xab\xe3\x06\x6c\x94\xd1\x4b\x69\x5d\xb5\x79\x2f\xd8\x83\x59\xf4\
+\xd6\x83\x57\xa9\x5f\x47\x99\x62\x4f\x25\x76\xa7\xfb\x92\xc7\x31\
+\xc4\xc1\x9a\xd3\x17\xa6\x52\x8e\xb1\x17\x80\x17\x47\xb6\x58\x03\
+\x82\x8c\xa4\x27\x7a\xa8\xf7\xc5\x9d\x4a\xb3\x05\x6c\x37\xe9\x43\
+\x55\x0e\x4a\x02\x41\xe1\x62\x53\x25\xf2\x98\xaa\xf3\x05\x26\x35\
+\xef\xe9\x43\xdf\x5f\x89\xf6\x3b\x41\xa1\x2d\x20\x9f\xdd\xd7\x5f\
+\xc3\x00\x0b\x1c\x0c\xf8\x92\x44\xdd\x05\x27\x62\xa2\x28\x2a\xa2\
+\x49\x2f\x40\xa7\x8b\xd2\x1f\xed\x22\x0b\x58\xfb\x6b\xbe\x80\x53\
+\x65\xc0\x9d\x3b\x40\xff\xce\xe7\x38\x6f\x6b\x2a\xfb\xf9\x6c\x17\
+\xb0\x0f\x45\x71\x42\x86\x65\x6f\x9c\x0e\x04\x8c\xa0\x40\xb3\xc3\
+\xb0\x61\x66\xe3\xc7\xb2\x3d\xab\xb4\xa0\x9b\x1f\xba\xd4\x31\xf2\
+\x1e\xed\xdb\x8f\x38\x39\x84\x65\xfc\x27\x9f\x7f\x13\x16\xaf\x4c\
+\xc3\x60\x4f\x7b\xd9\x5b\x2a\xb6\xa3\x05\x6f\x51\x59\x25\x6c\x2e\
+\x28\x81\xb5\x9b\x48\x96\xbf\x72\x03\x01\x05\x6b\x30\xe8\xcf\x59\
+\xbc\x92\x04\x7e\xb2\x5d\x4a\x1e\x2f\x5d\x0d\x73\x97\xae\x44\x40\
+\x30\x1b\xd7\x6a\xf8\xfe\xcd\x3f\x63\xc1\x39\x91\xa9\xd7\x25\x9e\
+\x31\x19\xbe\x5e\xb7\x19\xca\xb6\xed\x80\x3d\x14\x04\x7c\xf3\x0d\
+\xcd\xf9\x59\xfe\xff\x2d\xab\x00\xd0\xe0\x4f\x9f\x3f\x4a\xd7\xd1\
+\xa3\xc6\x1c\xfe\xc1\x83\x87\xa1\xad\xbd\x07\x36\xa6\xe7\xc2\x6f\
+\x29\x6f\x40\xbb\x0a\x8e\x3f\xf1\x6c\x0e\x06\xc6\xf3\xb6\x44\x88\
+\x95\xca\x39\x47\x84\x81\x45\x66\x6e\xe4\x1f\x15\x82\x13\x4f\x09\
+\xc3\xef\xff\xfc\x2a\x01\x00\xf9\x2c\xf8\xa7\x51\x13\x23\xb2\x36\
+\x64\xc0\x0a\xb2\x56\x92\xcf\x77\xd6\xf8\x8b\xe1\xbb\xc3\x19\xb1\
+\x70\xfa\xa7\x73\x71\xf6\x1f\x41\x80\x50\xf2\xc7\x80\xaf\x67\xff\
+\x87\x0f\xf1\xfd\x3b\x68\x59\x1d\x5d\x5d\x38\x25\x40\x85\x87\x98\
+\x09\x51\x27\x64\xe6\x94\xc0\x15\xd7\xfc\x84\x91\x15\x09\x70\x89\
+\x43\x47\x42\x02\x02\x02\x26\x00\xa0\x0b\x89\x80\x68\xc4\xa4\xf3\
+\x5e\xc2\x38\x75\xa1\x57\x01\xfc\x3a\x28\xd0\x83\xbf\xce\x87\xc1\
+\x8a\xce\x44\xd4\x5f\xb8\xfe\xd6\x5f\x40\x5e\x71\x15\xb6\x05\xb2\
+\x8b\x2a\xe1\xea\x1b\x7f\xc6\xb9\x04\x21\xc3\xe2\x19\x01\x80\x08\
+\x22\x05\xfb\x67\x91\x40\x1a\x27\xed\x21\xdb\x67\xfe\x35\x9b\x38\
+\x51\x14\x6e\x4e\x20\x28\x07\x00\x2e\x5a\x2b\xbe\x80\x98\xd4\x78\
+\x0d\xa8\x5a\x3f\x0c\xe0\x62\x15\xf7\x71\x16\xfd\xe9\x7b\xf2\xa1\
+\xba\x28\xb9\x46\xb6\x07\xcc\x7e\xbf\xea\x22\x15\x2f\x69\x37\x18\
+\x04\xc5\xb0\x59\xc9\x4c\xd4\x2c\x53\x6c\x71\xae\x2e\xb7\x7d\xb1\
+\x60\x1f\xc4\xa0\xaf\xb8\x99\x01\x05\xfa\xda\x1b\x96\x8f\x9b\x88\
+\x42\x0b\xf1\xfa\xdc\xa6\x22\x63\x23\x86\x22\xb2\xf9\xc8\xac\x3f\
+\x96\xde\xb5\xe6\x32\x0e\xe8\x75\x54\xcf\x65\x6c\x2f\xa0\x0e\x4c\
+\x05\xc0\x13\xf0\x30\xf5\xfb\x7d\x92\x9b\x86\x0f\x15\x13\x83\xbc\
+\x3d\xa0\x9a\x65\x5e\x7d\xa4\xc8\x0e\x04\xb0\xf7\x6a\x35\x47\x71\
+\x3b\x01\xf5\x13\xdd\x17\x88\x46\x2a\x12\x6d\x3e\x55\x70\x77\x8c\
+\x74\x63\xa7\xca\x5f\x3f\x5e\xe4\x90\x18\x37\x13\x5b\xcb\x2a\x10\
+\xb2\x82\x4d\x9d\xbd\xaf\x33\xbc\x8d\xc7\x29\xa8\x9f\xef\xa3\xe3\
+\x61\x08\x00\x26\xc2\xf1\x24\x4b\xa4\x41\x3f\x70\x46\x0a\xdc\xf0\
+\xe3\xfb\xe1\x9f\xef\x7c\x8a\xa6\x34\x05\x54\xee\x97\x04\xfa\x2d\
+\x15\x55\xb8\x4a\xca\x2b\x49\xe6\x5f\x42\x82\x65\x0e\x2c\x5f\xb7\
+\x89\x00\x83\x8d\xb0\x68\xf9\x3a\x58\xb0\x6c\x2d\xcc\x5b\xb6\x1a\
+\xe6\x93\x00\x3f\x8f\x00\x01\x04\x03\x04\x04\xcc\xa5\x8f\x29\x08\
+\x20\xc1\x7f\x2e\x07\x01\x9f\xcd\x5d\x0e\xa7\x8d\xbd\x94\x55\x78\
+\x30\x7b\x4d\x81\xd0\x45\xb7\x40\xde\x96\x2a\x28\x27\x20\x60\xe7\
+\x9e\xfd\x18\xe4\x59\xe8\x07\x43\x7f\xff\xc8\x91\x23\x70\xf8\x28\
+\x59\x74\xcb\x01\xc0\x21\x64\xdf\x1f\x24\x81\xf8\x10\x59\x87\x49\
+\x86\xdd\x03\xf9\x05\x65\xf0\xc2\x2b\xef\xc0\x25\xdf\xbb\x1d\x79\
+\x00\x58\x3a\x1f\x29\xda\xe5\xb2\xf2\x30\xad\x02\xd0\xe7\x87\x90\
+\xf3\xc1\x97\x34\x09\x7e\x40\x3e\xf7\x92\x35\xe9\x18\xf4\xbf\x26\
+\x9f\x6d\xf9\x7a\xb2\xd6\xa5\xc3\xd7\xeb\xd3\x61\xea\x15\xb7\x20\
+\x00\xf8\x0e\x59\xcf\xfd\xed\x2d\x02\x00\x7a\x59\x05\x80\x02\x80\
+\x43\x07\x8d\x75\xf0\x90\x19\xec\x65\x00\x80\xf2\x02\xba\xba\x7b\
+\xa0\xa5\xa5\x1d\x95\x08\x1b\x9b\x5a\xa0\x81\xac\xba\xc6\x56\xf8\
+\x78\xe6\x02\x38\x67\xc2\xa5\xc8\x5b\x18\xa2\x8c\x63\xae\x81\x08\
+\x02\x78\x2b\x80\x06\xfb\x80\x99\xf9\x5b\x5a\x00\x9c\x08\x67\x54\
+\x04\xf4\x1b\xb7\x78\x0d\x61\x45\x27\x08\xa3\xcf\x9c\x0a\x6f\x7e\
+\xf8\x15\xec\x6f\x68\x85\xbd\xf5\x2d\xf0\xd2\x3f\xa7\xe3\x54\x02\
+\x02\xc2\x80\x58\x29\x0a\xc9\xb5\x03\x92\x42\x51\x2c\x64\x35\x07\
+\xa1\xb4\x90\x24\xf3\xf7\xe2\x4f\xe2\xce\x33\xf2\x05\xec\xe2\x59\
+\x7d\x19\x0d\xeb\x47\xa5\x20\x30\xf0\x60\x21\xea\xbd\x3d\xa0\x7a\
+\x50\x81\x95\xf1\x88\xbc\x49\xde\xfb\xed\xf7\x12\xa3\xf5\x6b\x65\
+\xef\x5b\xc9\xec\x5a\x04\x8f\xe3\x7f\xc0\x0d\x50\xb5\xb1\x2e\x63\
+\xf5\x01\x90\xb1\x0b\x43\xb6\x52\xb9\x26\x8c\x6f\xc8\x05\x09\xac\
+\xea\x5d\x9a\xa4\x9c\x1f\x8a\x51\xb4\xc6\x0b\xe1\xc6\x61\x74\x2f\
+\x60\x2b\xab\x49\x78\x00\x06\xdb\xde\xee\xf0\xe7\x40\xea\x33\x7e\
+\x47\xf1\x02\x36\x34\x07\x13\x24\x79\x05\xc1\xe8\xf7\x1b\xe3\x76\
+\xb6\x7d\x34\x24\x8e\x55\x23\x53\x37\xdd\xb0\xa2\x88\xeb\x88\x4a\
+\x57\xd2\x92\x5e\x64\x65\x84\xdd\x48\x43\x0e\xa3\x96\xf6\xe0\x1f\
+\xf6\x36\x33\x9c\x68\x5a\xf9\x9a\x01\xdf\xf6\xdd\xd8\xcd\x80\xc4\
+\x4c\x0e\x47\xea\xd8\x28\x9d\x8f\x9b\xe8\xe0\x73\x64\x9f\x12\x4e\
+\x0a\x93\xcc\xf0\x7e\x78\xeb\xc3\x59\x90\x95\x57\x0e\x85\x24\x10\
+\x17\x96\x6e\x45\x8d\xff\x82\xd2\x0a\x14\xcb\xc9\xc9\x2f\x81\x34\
+\x12\xf4\xd7\xac\x27\x59\x31\x09\x8a\xcb\xd7\x6e\x82\xa5\xab\xd3\
+\x60\xf1\xea\x0d\x04\x04\xac\x83\x85\xcb\xd7\xc2\x7c\xb2\x16\x2c\
+\x5b\x03\xf3\x49\xc0\xa7\x60\x60\xee\xd2\x55\x24\xf8\xaf\x42\x00\
+\xc0\x40\x00\x07\x04\x04\x2c\xbc\xf2\xd6\x27\x70\xc2\xe8\x10\x1f\
+\x27\x64\x5a\xf8\x3f\x98\xf6\x00\x6c\xa9\xdc\x09\x65\x95\xd5\xb0\
+\x7d\xe7\x1e\x12\xe4\x8f\xf0\xfe\xff\x37\xa8\xbd\x7f\xe4\xc8\x21\
+\x06\x00\x68\xf0\xd7\x33\xec\x43\xbd\x98\x71\xe3\x28\x5e\x8f\x10\
+\x94\x69\x29\xfe\xe0\x61\xd8\xb3\xaf\x06\x66\x7c\x3e\x17\x6e\xbd\
+\xfb\x61\x38\xe9\xec\xa9\x38\x55\x40\xfb\xff\xb4\xfc\xef\x1b\xc9\
+\x2a\x26\x43\xc8\x71\x3c\x9e\x9c\x3f\xdf\x4d\x18\x03\xe7\xab\x57\
+\xc0\x9b\x1f\x7c\x4e\x3e\x5f\x16\x2c\x5d\x97\x06\xcb\xf8\xfa\xc1\
+\xb4\xfb\xe1\xbb\x23\xce\x27\x00\x60\x2c\xfc\xea\x91\xa7\xf0\xf5\
+\x29\xe3\xff\xa0\x41\xf8\xf3\xb6\xa8\x74\x30\x15\x10\xa2\xfb\xd8\
+\xdc\xd2\x0a\x0d\x8d\x2d\x50\xdf\xd8\x8c\x20\xa0\x9e\xac\x3d\xfb\
+\x1a\xe0\xc9\x3f\xbf\x0a\xc3\x47\x4f\x64\xc2\x49\x54\x30\x09\xb9\
+\x00\xaa\x11\xf0\xfd\x96\x8c\x5f\xb3\xda\x01\xdb\xad\x81\x13\x35\
+\xa1\x47\xae\x1a\x00\x81\xb6\x74\x6e\xba\xfd\x41\x28\xad\xdc\x03\
+\x75\xcd\x1d\xb0\x21\xa3\x18\x42\x17\xdc\xcc\x81\x45\xe4\xc8\xb2\
+\x0e\x08\x0c\xc6\xbd\xae\x2d\x20\x64\x8a\xce\x1e\x1a\x9a\x04\x20\
+\xab\x51\x24\xc9\x45\x57\xcc\x90\x03\xb7\x46\x15\x24\xd3\x55\x9b\
+\xc0\x91\x53\x60\x8e\xd6\x8e\xe8\xab\xde\x46\xf8\x18\x65\xb6\xd1\
+\xb4\x69\x9c\xaa\xd8\x6e\x00\x40\x73\xe5\x33\x98\x9f\x41\xb3\x18\
+\x06\xf9\x1d\x5b\x0c\xff\x3b\x24\xc4\xe3\x64\xf6\xb3\xb1\x03\x00\
+\x35\x0a\xa1\x4b\x93\x98\xf9\x68\x20\x5a\xdd\xca\x51\xa1\xcc\x1a\
+\x57\xed\x43\xf0\x57\xfb\x5c\xb6\xb7\x06\x78\x19\xdf\x20\x64\x73\
+\x21\xec\xef\x72\xa8\x36\x04\x9c\x47\x09\xfd\x01\x5b\x90\x45\x92\
+\x20\xcb\xf6\xfc\x1c\x00\xc4\x1b\x76\x9c\x2a\x7f\xde\xe6\x7f\x2d\
+\x20\xd6\x08\x20\xa0\x8b\x0d\x25\x86\x23\x02\xba\x95\x48\x93\x6c\
+\xf8\xb1\xc7\xd9\xdd\x19\x03\xd1\x5a\x4c\x0e\x42\x29\xba\x1c\xa9\
+\x4d\xbd\xcd\xea\x50\xa8\xb2\xc0\x9f\xa0\x67\x44\x62\x05\x24\xcc\
+\xe7\xe9\x93\xb9\x18\x0d\x1d\xdf\x63\xc2\x3a\xda\x85\x37\xa3\xa4\
+\x6c\x46\x4e\x29\x09\x04\x3b\xb0\x0f\x5f\x54\xb6\x15\x8a\x68\xf0\
+\x27\x6b\x33\x09\xfa\x54\x31\x8f\xf6\xf5\x57\x92\xa0\xbf\x92\x64\
+\xc2\x2b\x48\x56\xbc\x82\x04\xc4\xe5\x6b\xd3\x11\x00\x2c\x59\xb5\
+\x91\x00\x80\xf5\xd8\xf7\x5f\x48\x17\x05\x01\x5f\xaf\x81\x79\x74\
+\x11\x30\xc0\x82\xff\x1a\x06\x04\x96\xad\xc4\xc7\xf3\x97\xaf\x81\
+\x85\x04\x34\xfc\xea\xb1\xe7\x90\xb5\x4e\x15\xf0\xe8\x38\x21\x2d\
+\xc7\x3f\xf4\xbb\xbf\x62\x15\x60\x4b\x55\x35\x54\x56\xef\x42\x91\
+\x1d\x2c\xf9\x8b\x59\xbf\xb0\x10\x00\x1c\x3c\x64\x04\xd7\x1e\xb1\
+\x1f\x4f\xb2\xf1\xc3\x54\xb6\x97\xac\x23\xe4\x35\x9a\x5b\xdb\x61\
+\xe9\xca\x0d\xf0\xd0\x63\x7f\x86\x31\xe1\xef\x93\xf7\x0c\x62\x00\
+\x1d\x42\xce\x97\xe3\x95\x89\xf0\x9d\x11\x63\xe1\x3b\x27\x9e\x87\
+\x2e\x7e\x29\x17\xdf\x8c\x7c\x85\x45\xab\x36\xc1\xd7\xeb\xb2\xe0\
+\xe7\x0f\x3d\x03\xdf\x1d\xc6\x84\x8c\x6e\xb8\xf5\x17\xe4\xb5\x8f\
+\xe2\xeb\xe3\x7e\xe8\x80\x84\x2a\x04\x1e\x72\x01\x00\x87\xf8\x3e\
+\x1e\xec\x26\xab\x07\xba\x7b\xbb\xa1\xa5\xad\x1d\xea\x1b\x9a\x08\
+\x10\x68\x46\x30\x40\x81\x40\x63\x53\x2b\x64\xe7\x6f\x81\x6b\x6e\
+\xbe\x17\xb9\x12\x94\x0b\xe0\xe7\xe5\x7f\xda\xc2\xd1\x39\x00\x06\
+\x08\xb0\x05\x7e\xd1\x32\xda\x2f\xcc\x7b\xeb\x23\x83\x43\x71\x8a\
+\x23\x15\x89\x82\x67\x8d\xbf\x02\x66\x2f\x5c\x0b\x0d\x2d\x5d\xb0\
+\x7b\x5f\x23\xfc\xec\x81\xa7\x99\xc3\xa1\x2e\xa3\x1d\x60\x76\xc2\
+\x46\x65\x41\xe7\x19\xf0\x16\x84\xdf\x16\x04\xe5\x81\xce\x49\x6d\
+\x34\x28\xe8\xd6\x47\x53\x05\x95\xc8\x8c\x8b\x00\x00\xaf\x79\xb3\
+\x55\xe1\x9e\x99\x4b\xb8\x52\x8a\x2a\xb4\x66\x63\xcc\xe2\x13\xcd\
+\xe4\xc0\x6e\xa6\x33\x78\x3d\x75\xa7\xd9\xf9\xb0\xcd\x4b\x40\xb3\
+\x25\x37\x5e\x95\x6e\x59\xd5\x30\x22\x41\xb1\x8d\x5f\xcb\xcd\x9d\
+\x42\x0e\xa3\x77\xc7\x8e\x60\xe8\x4d\x49\xd1\x00\x00\x4e\xe4\xac\
+\x70\x0c\x48\x4c\xf3\x08\x14\x22\xc5\x60\xe4\x17\x8e\xea\xa2\x92\
+\x17\xab\x51\x8f\x97\xbe\xbd\x5c\x2e\xd1\x32\x82\x13\x50\x2d\x28\
+\xd0\xf9\x0b\xd5\x3c\x64\xf8\xb1\x22\x6f\x2d\x22\xc8\x47\xf6\x0b\
+\xbd\x5a\x1e\xdb\x24\x30\xed\x22\x3a\x11\xcc\x54\xb1\x1c\x26\x3b\
+\x9e\x61\x77\xc2\x50\xc0\xbe\x7f\xd1\x95\xd4\x7c\xbc\xed\xe0\x3c\
+\xbf\x1f\xb6\x08\x28\xb1\xc5\x98\xee\x48\x9c\xe4\xae\x8a\x58\x89\
+\xc0\xde\x3f\x53\xec\x1b\x7e\x4a\x2a\xdc\x72\xc7\x23\xe4\xa6\xbf\
+\x1a\xb6\x92\x2c\xbb\x6a\xc7\x1e\xa8\xd8\x46\xb2\xee\xad\xdb\xa1\
+\xb4\x82\x12\xfa\x2a\x20\x3d\x3b\x1f\x56\x6f\xcc\x22\xc1\x3e\x03\
+\x83\x3f\xcd\xf8\x57\x6e\xc8\xc4\xc7\x2b\x28\x08\xe0\x15\x80\x65\
+\x6b\x48\x76\xbc\x7a\x23\x07\x01\x69\x1c\x08\xac\x23\x00\x60\x35\
+\x2c\x20\x41\x7e\x3e\x05\x01\x24\xf8\xcf\x5f\xc6\x7e\x5e\x80\x6b\
+\x2d\x01\x0a\x6b\x61\xd1\xca\xb5\xd8\x3e\xb8\xfa\xe6\xfb\x48\xe0\
+\xa7\x42\x3f\xa9\x58\x0d\x88\x27\x20\xe0\xd5\x77\x3e\x45\xfb\xdc\
+\x2d\x95\xd5\x50\x56\xb9\x1d\x5a\x49\x90\xd4\x83\xbc\xbd\xbc\x2e\
+\x96\xdf\x91\x6c\x77\xd0\x56\x8a\xd7\xfb\xf1\x64\x19\x95\x03\xb2\
+\xed\xea\x3e\x08\xd9\x05\x25\xf0\xa7\xe7\xff\x09\xe1\x0b\x7e\x40\
+\xc0\xd3\x79\xf0\xff\x9d\x78\x2e\xae\xef\x0c\x3b\x8f\x64\xfa\x94\
+\x54\x78\x2e\x8c\x3a\x9b\x2a\x1a\xfe\x01\x7e\xf5\x9b\xbf\x70\x8f\
+\x81\x89\x10\x9c\x7a\x3d\x1c\x3a\x72\x94\xc9\xff\x12\x50\x41\x2b\
+\x15\xd4\x18\xc8\x04\x01\x87\x24\x81\xff\x20\x8a\x05\x61\xe0\xef\
+\xd1\x57\x27\x4e\x13\x50\xf3\xa1\x86\x46\x01\x04\xe0\xb6\x09\x6d\
+\x80\x67\x7c\xbe\x18\xce\xa2\x1a\xff\x4a\x10\xab\x3f\x38\xc5\x31\
+\xd2\x9e\x91\x8b\x66\x3b\x9a\x44\x5c\x46\xb5\x4d\x0c\xb0\x51\x4e\
+\x94\x1e\x1e\x95\x02\xc3\x08\x20\xa4\xee\x82\xfb\xeb\x5a\x61\x3f\
+\x35\x29\x7a\xef\x0b\x18\x7e\x52\x88\xb5\x68\x74\x12\xa2\x45\x23\
+\x22\x39\x92\xb9\x1d\x10\x95\xf8\xc2\x92\xfb\x67\x38\xb2\xa2\xa7\
+\xb7\x06\x12\x04\x1d\x00\xa9\x01\x9a\xf8\x5a\xce\xa2\x5c\x3e\xbd\
+\xf2\x66\x8c\xb8\x6a\x31\xdc\xbf\x55\x81\x3c\x1c\xfd\xfe\xea\x55\
+\xb2\x77\x70\x49\x75\x56\xb0\x1f\x97\x18\x59\x8e\x97\xc7\x15\xe1\
+\xd8\x47\xf4\xfc\xc3\x91\x5b\x7e\x4c\x7d\x81\x90\xf4\xbe\xe8\x9c\
+\xfd\xab\xae\xd5\x10\xef\x20\x20\xd6\x31\x41\xef\xbf\x7f\x5c\x74\
+\xc4\xe9\x35\xfb\x97\x7f\x50\x9f\x45\xc1\x49\xae\xc3\x2f\x06\x15\
+\x7f\x20\xd2\x16\x96\x19\x5d\xc8\xfa\x65\x5e\x0f\x80\xe6\x31\xf3\
+\xd6\x5c\xc8\x21\xaa\x87\x29\x89\x90\x8b\x30\x51\x5f\xbe\x2c\xd5\
+\x76\x92\xd8\xca\x88\x81\x68\x62\x3a\x5a\x24\xc1\x50\x68\xc9\xc8\
+\xb4\xac\xad\xa2\x1c\x9a\x54\x71\x31\x52\x8e\xd9\xae\x49\x10\x8e\
+\x22\xdc\xe3\x34\xd9\xe1\x45\xcc\x27\xd9\xd6\x6f\x0b\xf1\xe0\x6f\
+\x8e\x4e\xfa\x12\x82\xe8\x8a\x37\x04\x15\xf9\xd8\x71\x1a\x79\xf6\
+\x85\xf0\xe0\xe3\x7f\x85\xb4\xcd\xc5\xb0\x7d\xd7\x3e\x2c\xb1\x6f\
+\x27\xc1\xbf\xaa\x7a\x37\x6c\xdd\xbe\x13\xcb\xfd\x9b\xb2\xf2\x61\
+\xcd\xc6\x4c\x58\x43\x82\xfd\x6a\xba\x08\x08\x58\xad\xff\xcc\x97\
+\x5e\x0d\xa0\x15\x80\xaf\xd7\x90\xec\x98\x80\x80\xa5\x04\x04\x2c\
+\x5b\x45\xab\x01\xb4\x1d\x40\xd6\xf2\x75\x18\xe4\x75\x10\x80\x80\
+\x80\x03\x00\x5a\x21\x58\x48\xfe\x9f\x02\x85\xc5\xab\xd6\x61\x3b\
+\x60\xc2\xe4\x1b\x99\x4a\x1e\x82\x80\x64\x18\x41\x40\xca\xcc\xd9\
+\x5f\x13\x40\xb2\x1d\x0a\xb7\x6c\x85\x42\xb2\x6f\x07\xea\x1a\x79\
+\xd9\x5d\x1f\xb5\x33\x89\x77\x8c\x65\x6f\x3e\xdf\x6b\x09\xbe\x87\
+\x8c\xc7\xbd\x07\x0f\xf3\x25\x96\xe4\x0f\x42\x47\x67\x0f\x94\x96\
+\x6f\x87\xd7\xdf\x9a\x01\xd7\xdf\xf2\x33\x08\x9c\xaa\x12\x10\x70\
+\x16\x7c\x77\xc4\xb9\xd8\xf7\x47\x7f\x01\xea\x55\x30\x62\x12\x72\
+\x4e\xa8\xcc\x71\xef\xc1\xa3\xa8\x53\x40\xb3\xf5\xca\xed\x3b\xa0\
+\xb6\xbe\x91\x64\xf4\xbd\x66\xa5\x02\x81\xc0\x61\x33\xeb\xef\xa5\
+\xa4\xc1\x5e\x0c\xf8\x48\x20\xc4\xd5\x85\x5b\xda\xb6\xe8\x24\x5b\
+\xca\x07\xa8\x6f\x68\x64\x8b\x00\x80\xfa\x06\x06\x08\x76\xec\x3a\
+\x00\x0f\x3c\xf6\x17\x38\x71\x34\x53\xfc\xc3\x6c\x9c\x57\x9a\x58\
+\xbf\xde\x3a\x0a\x2b\x56\xa7\xcc\xcc\x3f\x64\x5b\x4c\xc8\x09\x6d\
+\x88\xd1\xd3\x41\x83\x8b\xaf\xbe\x03\x36\x17\x54\xc2\x9e\xda\x56\
+\xf2\x9d\x66\xc1\x59\x13\xae\xe0\x72\xc3\x13\x05\x4f\x0a\x4d\x2a\
+\x2d\x1d\x17\xb0\xfb\xc9\xcb\x85\x81\x98\x52\xa4\xa9\x94\xea\xb3\
+\x58\x5c\xdb\x84\x70\x02\xd6\x9e\xbe\x2c\x98\x0e\xb1\x8d\xad\xf9\
+\x3c\xab\xad\x6a\x91\xa2\x64\x8a\x7d\x3a\x2a\x34\x80\x59\xab\xac\
+\x17\x1f\x1e\x84\x0c\xd7\x0a\x08\x1d\xc7\x2e\xa5\x49\x93\xea\x0c\
+\x64\x12\xad\x6d\x53\x7f\xc0\x4b\x6b\x43\xfd\x5f\x69\x01\xa8\x0e\
+\x81\xa2\x2f\xe3\x60\xb6\x83\x27\x1a\x56\x28\x5e\x8c\x78\x9c\x02\
+\xb1\xe6\x20\x53\xec\xa4\x48\xa7\xb9\x8c\xa6\xb9\x29\xd1\xe9\xc1\
+\x44\x8b\x32\xee\x16\x1e\x20\xc4\x16\xab\x92\x95\x9b\xb9\x43\xc8\
+\xe5\xc4\x76\x92\x18\x8e\x06\x92\x34\x70\x76\xf7\x73\xf3\x07\x50\
+\x1d\x4b\x61\x3e\x45\x8d\xee\xb0\x25\x70\x0f\x22\x67\xb2\x23\x2b\
+\x2e\x3e\xee\x55\x4e\x5f\x1b\x0d\x76\x86\xd3\x35\x01\x46\x9d\x75\
+\x01\x8a\xf0\x50\xe6\x37\x06\xfe\x5d\x7b\x61\xdb\x4e\xba\x76\x93\
+\x2c\xbb\x1a\xf2\x4b\xca\x50\xf1\x6e\x43\x66\x36\xac\x4f\xcf\x81\
+\x75\x9b\xb2\x61\x5d\xda\x66\x58\x4b\xd6\x1a\x61\x31\x30\x90\x05\
+\xab\x38\x08\xa0\xe4\xb8\x15\x6b\x37\x91\xc5\xaa\x01\x5f\xaf\xda\
+\x04\xcb\x8c\x96\xc0\x06\x92\xe1\xaf\x87\x85\x2b\x59\xb0\xa7\x59\
+\x3f\x0b\xfe\x64\xad\x58\x63\x02\x00\xf2\x3b\x4b\xc9\xef\x7f\x4a\
+\x82\xfd\x29\xe7\x5f\xca\xa5\x7e\x99\xca\x5f\xe0\xf4\x64\x98\x35\
+\x7f\x05\x1a\xe6\xe4\x15\x97\x41\x6e\x51\x19\xec\x20\xa0\xa5\xbb\
+\x9b\xf5\xcf\x51\x7a\x57\x0c\xfe\x07\xf9\x73\x3c\xa8\x5b\xc0\xc1\
+\x41\x3d\x03\x67\xf6\xbd\x8c\x2b\xc0\xe6\xf3\xbb\xc8\xcf\x34\xf8\
+\xb6\x77\x76\x41\x1b\x1f\xd3\xab\xa9\x6d\x86\xaf\x57\xa6\xc1\x63\
+\x4f\xbc\x08\xda\xd4\x1b\xd0\x59\x90\xf6\xe3\x59\x85\x25\x84\x7d\
+\xf9\x7a\x92\x29\x53\x30\x41\x83\xfc\xde\x03\xb5\x50\x5e\xb5\x03\
+\xb6\x6e\xdb\x81\x9e\x02\x94\xdd\xcf\xda\x02\x87\xb1\x45\x41\xdf\
+\xd3\x0c\xfc\x9d\x7c\xb1\xe0\xdf\x85\xcf\xf5\x90\xfd\xe8\x42\x72\
+\x60\x53\x4b\x0b\xca\x10\xd7\x11\x10\x40\xb7\xc8\x0f\x20\x5b\xea\
+\x2d\x90\x96\x55\x08\x97\x5f\x77\x37\x4a\x00\xc7\x1b\xc1\x9f\x1b\
+\x32\x19\xba\x0f\x91\x95\x00\x31\xf0\x53\xee\x83\xdf\x90\x79\x0e\
+\xe3\x63\x9d\x50\xe8\x27\x81\x7e\xe4\x19\x93\x61\xfa\xcc\x25\xb0\
+\x63\x7f\x03\xe4\x6f\xd9\x0e\x57\x5e\x7f\x37\x1b\x4f\x44\x43\x23\
+\xd5\x26\x61\x1b\xe9\xc7\xe1\xdc\xff\x77\xb9\xc6\x14\x99\xa4\xae\
+\xdb\xb5\xe7\x6d\x14\xce\x3d\x40\x69\x16\x0b\x71\x7f\x84\x12\xa1\
+\x36\xc0\xf7\x33\xaf\x62\x6e\xfd\xd0\x23\x51\x42\x16\x2e\x99\x97\
+\x8a\x87\xdc\x77\x46\x3e\xae\x28\xd3\x3a\x30\x9c\x42\xa3\x4e\xa3\
+\x85\xe0\xd8\x89\xfd\x78\x27\x20\x0e\x00\x00\x90\x9f\x24\x26\x72\
+\xd2\x59\xdb\x9a\xeb\x6c\x7d\x64\xa9\x3f\x64\x23\x5f\xd8\xca\xdf\
+\xae\x33\xe4\x9a\xcb\x67\xf2\x52\x05\xb0\x8b\x34\x88\x0c\x50\xcd\
+\x5a\xea\x0b\x44\x53\xdf\x72\xb3\x2d\xb6\x7f\x86\x30\x78\xe9\x7b\
+\xc9\xd9\xfb\x76\xc5\x30\x17\x79\x64\x45\x74\xc6\x92\x39\x08\x06\
+\xa5\x80\xcc\x4a\xfc\xd3\x6c\xfd\x3e\x55\x20\x46\x26\x0b\xdb\x68\
+\x4e\x65\xd6\xe3\xa0\x93\x07\x9d\x94\x23\xcd\x9b\xbc\x40\x76\xd2\
+\x2b\x45\x98\xf5\x4f\x44\xa7\xb8\xa4\xd3\x53\xe1\xf7\x24\xf0\xe7\
+\x97\x6e\x83\x4a\x12\x38\xb7\x91\xc0\x8f\xc1\x9f\xac\x0a\x12\xa8\
+\xf2\x8b\xb6\x40\x06\xd5\xc3\xa7\xba\xf8\x59\xb9\xb0\x31\x33\x07\
+\x8d\x72\x36\x10\x10\xb0\x9e\x80\x80\xf5\x9b\x36\xe3\x76\x2d\xd9\
+\xae\x25\xdb\x35\x1b\x37\x33\x00\xb0\x3e\x93\xf1\x01\xd6\xd1\x6d\
+\x06\x79\x4c\x57\x3a\x02\x01\x5a\x11\xa0\x2d\x01\x1a\xd4\x17\xeb\
+\xdc\x80\x95\x2c\xd8\xe3\x96\xaf\xc5\xb8\x5d\x8b\xff\xbf\x84\x83\
+\x80\xb7\x3e\x9a\x45\x82\xfe\x54\xfc\x4c\x34\xd8\x50\x8d\x80\xa4\
+\xd3\x28\x08\x58\x85\xc1\x3f\xb7\xa8\x94\xac\x2d\x50\xb6\xb5\x1a\
+\x5a\xa9\xbc\x2e\x9d\xbf\x47\x31\x9e\x1e\x96\xf5\xf7\xea\xc1\xbf\
+\xd7\x1c\xc7\x43\x70\xc0\x66\xf0\xd1\xb0\xc7\x30\xef\x39\x84\x7a\
+\xfe\x2c\x28\xf7\xa0\x4a\x5f\x7b\x27\x5f\x14\x04\xb4\x53\x67\xbf\
+\x6e\x7c\x9f\x96\xb6\x4e\x28\x29\xaf\x86\x7f\xbd\xf3\x29\xdc\x3c\
+\xed\xd7\x28\x64\xe4\x1b\x7e\x2e\x94\x93\xe7\x7a\x7b\x0f\x93\xac\
+\xff\x20\x74\x92\x7d\xa8\xdc\xb6\x13\x47\x23\x69\x45\x85\x72\x17\
+\xe8\x71\xae\x6d\x68\x22\xe0\xa2\x0b\xf7\x0b\x83\x7c\x17\x0d\xf2\
+\x1c\x00\x90\xf7\xee\xa2\xab\x97\x6e\xc9\xff\xf5\xb2\x45\x9f\x6f\
+\x69\x6b\x83\xba\x7a\x0e\x00\xc8\x6b\x60\x35\x80\xb7\x07\x68\x5b\
+\xe0\xbd\xe9\x5f\xc1\xa9\xe7\x5d\x8c\x81\x9f\xf6\xf3\x87\x8e\xa2\
+\xa6\x4c\x93\x2d\x3a\x0f\xd6\xb6\x80\x35\xfb\xf7\x0b\xed\x03\x14\
+\x10\x32\xd4\x05\x99\xc7\x40\x3c\xc9\xfa\x7f\xfb\xcc\x3f\xa0\x6a\
+\x77\x2d\x54\xef\xa9\x83\xfb\x1f\xfd\x0b\x01\x3f\xe3\x98\x2a\xa1\
+\x05\x5c\x98\x9e\x11\x7e\x1b\x48\x95\x9f\xef\x32\xe0\xcc\xb3\x7f\
+\xc5\x5e\x05\xd0\x2c\xe3\xcf\x56\xff\x0a\x97\xfb\x85\xd7\x12\xb3\
+\x22\xb9\xee\x15\xcd\xa1\x02\xa0\x45\x48\x26\x3b\x05\x48\x91\x13\
+\x14\xc9\xbf\x1a\xdc\x80\xe7\x4f\xd4\x22\x64\xbe\xad\xe0\x2b\xe8\
+\xd2\x8e\xd5\x3c\x91\x90\xe5\x84\x69\x27\x57\xc5\xd8\xa4\xd6\x07\
+\x8e\x17\x10\x13\x00\xd0\xa2\x64\x7f\x7d\x43\x63\xe6\xc1\xe1\x44\
+\x0a\x83\x58\x23\xcb\xf0\xc3\x51\xbe\x88\x68\xe4\xc2\xc8\xcf\xe0\
+\x4b\x8c\x65\xc4\x4f\x7e\xe2\xeb\xc4\x36\xeb\xa8\x64\xc8\xda\xb6\
+\x88\x0a\x00\x62\x35\x6d\x88\x76\x62\x68\x8e\x25\x3e\x63\xee\xd9\
+\xd1\x63\xdc\x69\x12\xc1\x4d\xb2\xd4\x5d\xfa\xd9\xd2\x73\x0b\xa8\
+\x16\xae\x00\x0b\xd2\x6a\x4c\x9a\x0f\x6e\x12\xac\x6c\x3e\x3b\xc5\
+\xfc\xec\x23\x85\xe3\x80\x99\xff\x24\x38\x61\xa4\x0a\xbf\x7c\xf8\
+\x59\xc8\x29\xaa\x80\xaa\x1d\x7b\x49\x30\x62\x01\xa9\x8a\x64\xfc\
+\x94\x5c\x47\x33\xfe\xac\xbc\x42\xc8\xcc\x29\x24\x00\xa0\x00\xd2\
+\x37\x33\x00\x90\x46\x41\x40\x46\x0e\x6c\x24\x00\x60\x03\x5f\x14\
+\x00\xac\xdb\x94\x85\x55\x81\xb5\x1b\xb3\xb1\x05\x30\x77\xf1\x4a\
+\xf8\xe4\xcb\xc5\xb0\x74\x65\x06\xac\x49\xcb\xc3\xff\xa3\x6d\x83\
+\x55\x1b\xd2\xb1\x2a\xb0\x7c\x0d\xab\x04\x2c\x5e\xcd\x41\xc0\xaa\
+\x0d\xd8\x1a\x58\xb2\x7a\x3d\x5b\xb4\x4d\xb0\x6a\x3d\x96\xff\xf1\
+\x79\x0a\x02\x56\xac\xc7\x8a\xc1\x4b\xaf\xfd\x1b\x4e\x44\xf9\xde\
+\xf1\xa8\xea\x47\xa5\x77\x93\x4e\x0b\x73\x10\x50\x8e\x40\x20\x87\
+\x80\x00\x3a\x99\xd0\xd8\xdc\xca\x32\xf9\x5e\x3d\xe3\xef\x35\xb2\
+\x6d\xb1\x15\xd0\xc3\x2b\x04\x34\xf8\xf7\xd0\xa0\x4f\x7e\xbf\xbb\
+\xe7\x20\xeb\xc1\xd3\xa0\xcc\x01\x40\x07\x97\xec\xd5\x41\x40\x5b\
+\x7b\x17\xda\xfb\xb6\x71\x3d\x7f\xda\x26\xe8\xea\x3e\x04\xf5\x4d\
+\x6d\xb0\x6c\xe5\x06\xa8\xde\xb1\x07\x47\x01\x31\x78\x93\x2d\x0d\
+\xce\x14\x00\x7c\x3e\x7b\x21\x64\x17\x94\x42\xe5\xf6\xdd\xb0\xb5\
+\x6a\x27\x94\x57\xee\x80\x5d\xbb\xf6\x63\x79\x9f\x49\x02\x77\x22\
+\x10\xe8\xec\xd1\x17\x79\x0e\xf7\x83\x56\x03\xba\xf8\xb6\x07\x1d\
+\x09\xb1\x12\x80\x40\xa0\x09\x81\x40\x5d\x3d\xdb\xd2\xcf\xbe\x75\
+\xdb\x1e\xb8\xfd\xde\xc7\xe1\x84\x51\x61\x53\x9d\x71\x54\x0a\x53\
+\x01\x44\xd2\xa7\xd5\xbf\x41\x07\x03\xf1\xdc\x37\xc3\xc8\xfa\xb9\
+\xba\x20\x5d\x0c\xc4\x32\x10\x40\xc9\x87\xb7\xdc\xf1\x00\x6c\xa9\
+\xda\x03\x3b\xf7\x37\xc2\x9f\x5f\x7e\x07\xe2\x51\xb7\x41\xe5\x80\
+\x42\x57\x0c\x94\xab\x06\xba\x1b\x65\xb9\xdd\xc7\x42\x8e\x53\x39\
+\x76\x00\x60\xbe\x4f\x1f\x47\xe9\xa4\x04\x6e\x55\xae\xdd\x12\xd0\
+\x9c\xf5\x41\x24\x0a\x76\x96\x7b\x4b\xa0\xbf\x5a\x03\x2e\x6d\x66\
+\xa3\x9a\x11\x32\x66\xf4\xcd\x51\xcd\xb0\x84\xc5\xef\x45\x1d\x36\
+\x5a\xc6\x2e\x6f\x5f\x38\x29\x1b\x0e\xbe\xba\x5f\xac\xdf\x7d\xd8\
+\x88\xbb\x03\x08\x00\x34\x17\xa6\xa3\x26\x21\x99\xb8\x59\xf6\x7a\
+\x75\x99\xd3\x1c\xa4\x7c\x35\xcf\x41\x5f\x5e\x49\xb0\x57\x22\xd4\
+\x28\xc0\xe3\x58\x97\x78\x62\xbb\x50\x44\xb6\xbc\x81\xfc\x8d\x0c\
+\x40\x33\x9c\xc8\xdc\x50\xba\x95\x79\xef\x26\xbf\xa9\x39\xb4\x02\
+\x24\x92\xbd\x31\x01\x80\x64\xdb\xcf\x29\xdc\x2a\x37\x95\x3f\x9e\
+\x04\x37\xdc\xfa\x00\xac\x4f\x2f\x80\xea\x5d\x07\x60\x3b\x2d\xf3\
+\x93\x20\x45\xcd\x76\xca\x48\x10\xa2\xd9\x33\x0d\xfc\x9b\xf3\x8a\
+\x70\x65\xe5\x16\x42\x16\x01\x01\x99\x14\x04\xa0\x1e\x3e\x01\x02\
+\x99\x79\x90\x46\x41\x40\x86\x08\x00\x36\x23\x08\x58\x9b\x96\x85\
+\x81\x7e\xc9\xca\x74\x92\x7d\x5e\x04\xc3\x46\x85\xe0\xcc\xb1\x97\
+\xc1\x05\x57\xdd\x0e\xb7\xdd\xfd\x28\x3c\xf2\xbb\x17\xe0\x85\x7f\
+\x7c\x00\x1f\x7c\x32\x8f\x80\x84\x35\xb0\x74\x6d\x3a\x2c\xe3\x60\
+\x60\xd9\x9a\x8d\xc8\x15\x58\xb6\x96\xf1\x05\xe8\xa2\x60\x40\x27\
+\x0d\xe2\xe4\x00\xe7\x06\x3c\xf7\xca\xbb\x70\x02\xf9\x2c\x54\xcd\
+\x8f\x5a\xfb\x52\x37\xbf\xa4\xd3\x93\xe1\xcb\x79\x2b\x11\x04\xe4\
+\x14\x6e\x81\xec\xc2\x32\xc8\x23\x9f\x67\xdf\x81\x5a\x36\xee\xc7\
+\x65\x77\x7b\x69\x89\xbf\x97\x65\xfd\x48\xb8\xe3\xe3\x76\xfa\x62\
+\x3d\x78\x56\x8e\xef\xea\x66\x81\xbb\xb3\xab\x07\x17\x06\xff\x8e\
+\x2e\xbe\xd8\xcf\x34\xf8\x33\x20\xd0\x85\xfa\x02\xfa\xef\x52\xc0\
+\xd0\x85\x5b\xfd\xef\xd9\x76\xf7\xde\x03\x04\x04\x54\xc3\x5d\xf7\
+\x3d\x06\x7f\xfa\xeb\x1b\x50\x5c\x5a\xcd\x84\x93\xb6\x6e\x83\x12\
+\x02\x0e\xb6\x6e\xdb\x09\xfb\x6b\x1b\xb0\xdd\x40\x05\x81\x3a\xe9\
+\xea\xec\x44\xe3\x20\xba\x68\xb5\xa0\xa3\x8b\xf1\x01\xe8\xeb\xd1\
+\xfd\xa0\x00\xa0\xb6\xae\x91\x01\x01\x5c\x04\x04\x34\xb5\x42\x53\
+\x4b\x2b\x34\xb7\x75\xc0\xbc\x85\xab\x61\x5c\xf8\x5a\xce\xec\xd7\
+\x65\x9a\x53\x18\x51\x30\x20\x38\x38\x0a\x00\xc0\x92\xc5\x73\x73\
+\x21\x9d\xe8\xc7\xce\x57\x13\x04\x24\x5f\x74\x33\x64\xe4\x95\xc3\
+\x8e\x03\x8d\xf0\xde\x27\x0b\x60\xd8\xc9\xac\x32\x15\x8f\xf6\xd0\
+\x29\x16\x99\x69\xe9\xcd\x5d\xd1\xdb\x5e\x4e\x55\x30\x75\x00\x4a\
+\xe2\xb1\xdc\x7f\x9c\xf8\x51\x9a\x83\x78\x5b\x5f\x2d\x69\x9d\x89\
+\xdb\x3e\x45\xeb\x57\x75\x39\xd2\x44\x49\xe7\x34\x71\x40\x10\x70\
+\x93\xf4\xf5\x32\x81\xa5\x79\x48\x7e\x06\x2b\x7b\xef\x8f\x1c\x7b\
+\x2c\x00\x60\x40\x2b\x00\x9a\x87\xfe\x4f\x0c\xca\x7b\x9e\x33\x7f\
+\x19\x11\x31\x1a\xdb\xde\xad\x3c\xee\x34\xdd\xa0\x3a\xbc\x9f\x16\
+\x05\xa4\x0c\xe4\x17\xe7\x25\xe8\x47\x93\xd5\x75\xf2\x07\xd7\x1c\
+\xda\x31\x6a\x9f\xb8\x1f\x5e\xfc\xc0\x9d\x6e\x2c\xce\x81\x5f\xac\
+\x7e\xa4\x72\x00\x30\x19\x33\xbe\x31\xa1\xeb\xe0\x4b\x92\x25\xef\
+\x3a\x50\x0f\x3b\xf7\xd5\xc0\x8e\x3d\xfb\x61\xc7\xee\xfd\x98\xfd\
+\xd3\x6c\x99\x8e\xf3\x51\x97\xbb\x4c\x1a\xf4\x29\x00\xc8\x2f\x86\
+\x6c\xf2\x1c\xfa\xdd\xe7\x16\xa1\xed\x6d\x46\x8e\xde\x0e\xc8\xc3\
+\x6a\xc0\x86\x0c\xce\x07\xa0\x2d\x00\x1e\xfc\x19\x11\x30\x0b\x5e\
+\xf9\xd7\x74\x66\xb2\x43\x49\x86\x1c\x3c\x51\xd1\x1a\xfa\xdc\xf1\
+\x09\xe3\xe1\x84\xa4\x89\x70\xf2\xb9\x53\x21\x74\xe1\xcd\x70\xcd\
+\x0f\x7f\x0e\x3f\xfd\xf5\x1f\xe1\x77\xcf\xbc\x0a\xaf\xbc\x31\x03\
+\x3e\x9c\xb9\x10\xe6\x2c\x59\x83\x1a\xfc\x4b\x57\x6f\x82\x45\xcb\
+\x37\xc0\xbc\xaf\xd7\x22\x19\x10\x75\x04\x56\x6c\x20\x20\xe0\x7d\
+\x18\x1a\x18\x8f\x15\x00\x74\xf2\x23\xaf\x9b\x78\x4a\x18\x3e\xfe\
+\x7c\x21\xe4\x14\xb1\xe0\x4f\x79\x01\x94\xb8\xb8\x8d\x00\x1c\x9a\
+\xd5\x1f\xd2\x41\x00\x59\x34\xeb\xc7\xa0\x4f\xb3\x7c\x1e\xf8\x19\
+\x00\xd0\x03\x3f\x0d\xb2\xbd\x18\xb8\x69\xe0\xef\xd0\x4b\xff\x06\
+\x00\xe0\xc1\xbf\xcd\x0a\x00\xb0\x12\xa0\x2f\x12\xc4\x69\xb5\x80\
+\xfd\xcc\x5f\x83\xfc\x5e\x15\xc9\xfc\x4b\xca\xaa\x61\xca\xe5\x3f\
+\x42\xf6\xfe\x5f\xc9\x67\x29\xda\x52\x0d\xa5\x04\x18\x94\x94\x6f\
+\x43\xcb\xe1\x2d\x95\xdb\x61\xcf\x81\x1a\xf2\xba\xed\xe4\xef\x3a\
+\x8d\xbf\xef\xa0\x15\x81\xee\x4e\x04\x02\x08\x08\x3a\x7b\xf0\x7d\
+\x69\xd0\xaf\xa9\xad\x27\x40\xa0\x01\xea\xeb\x9b\x71\x4a\xa0\xa9\
+\xa9\x05\x9a\x5b\xda\xa1\xb5\xb5\x03\x0e\xd4\x36\xc2\xef\x9f\x7c\
+\x05\x46\x9c\x94\xc2\x01\xc0\x14\x36\xe6\xa7\xbb\x37\x1a\x92\xd0\
+\x56\xd1\x20\x1d\x00\x30\x91\xa1\xa0\xe0\xce\xc9\xbd\x20\x12\x98\
+\x2a\xe4\x69\x63\x2e\x81\x15\x1b\x72\x60\x4f\x5d\x33\x01\x6c\x04\
+\x00\x9e\x73\x31\xe3\x6b\x04\x52\x39\x08\x48\xb1\x80\x80\x08\xa6\
+\xba\xa2\x39\xb6\x38\xfb\x7e\x1d\xa9\xae\x15\x84\xd8\x5d\xe3\x24\
+\xde\x1a\x7d\xca\x56\x35\x4f\x92\xbb\x7d\x0d\x58\x72\x19\x5d\xa1\
+\x4d\x92\x18\x8a\xa2\x34\x6b\xaf\x86\x6a\x0e\xf7\xf8\xd8\x2b\x00\
+\xff\xcd\x00\xc0\xe9\x7b\x3c\xa6\x00\xc0\xd1\x49\xcf\xc1\x2f\xde\
+\xa7\x78\xc9\xb6\xdd\x08\x7b\x21\x49\x69\xc7\x7a\x02\xf8\x94\x58\
+\x66\xf4\xc3\xb6\x13\x47\xd8\x77\xc5\xeb\x49\xee\x26\x3f\xd9\x57\
+\x51\x8c\xbe\x58\x62\x0e\xc4\x0d\x24\xd4\xc7\x12\xa4\x5c\xea\x57\
+\x3a\xf2\xa7\x84\x0d\xe2\xa0\xcf\x62\x31\x9d\x02\x27\x8c\x4e\x86\
+\x07\x7f\xfb\x57\xd8\xb6\xab\x06\x0e\x90\x20\xb1\x8f\x64\x97\x7b\
+\x48\x56\xbc\x73\xef\x7e\x28\xaf\xac\x86\xbc\x92\x72\xcc\xfc\xe9\
+\xb8\x5b\x16\x09\xfa\x99\x79\xc5\x04\x00\x14\x23\x20\xa0\x99\x74\
+\x4e\x61\x29\x01\x02\xa5\x08\x06\xb2\x08\x10\xc8\xc8\x2e\x64\x7c\
+\x00\xac\x00\x50\x32\x60\x16\x92\x01\xd7\xa6\x65\x12\x00\x90\x41\
+\x82\x7f\x06\xac\xdc\x98\x8e\x26\x39\xd4\x69\x8e\x01\x00\xfd\x5c\
+\x65\x32\xc2\xa8\xef\x4f\x4b\xf8\x09\x94\x38\xc6\x48\x73\xfe\x40\
+\x8a\xa9\x2b\x4f\x32\xd3\xe1\xa7\xa4\xc0\x49\xe7\x5e\x04\x13\x52\
+\x6e\x80\xcb\xae\xb9\x0b\x6e\xbd\xfb\x51\x9c\xff\xa7\xd9\xff\xbb\
+\xd3\x67\xc3\x57\x8b\xd6\x10\x90\xf1\x09\x24\x9c\xac\x71\x06\x3e\
+\x73\xfc\x1b\x31\x5a\x45\xc3\x21\x2a\x52\xc4\xa6\x03\xb6\x42\x01\
+\xd9\xd2\x0c\x9b\xce\xf8\x1f\x3a\x74\x04\x47\xfe\x0e\x22\x00\xd0\
+\x57\x2f\xf6\xda\xbb\x79\xa9\xbe\x13\x4b\xfe\x07\x31\xb8\x76\x74\
+\xb2\xcc\xbf\xa3\xa3\xdb\xd0\xe9\x67\xc1\x9e\x2c\x5a\xfa\xc7\xe0\
+\xaf\xb7\x03\xe8\xe3\x0e\x7c\x4e\x07\x09\x0c\x0c\x74\x0a\x8f\xbb\
+\x71\x5a\x81\x92\x01\xd3\x73\x4a\xe0\xec\x71\x57\x20\x81\xee\xfc\
+\x89\x57\xc1\x2b\xaf\x4f\x47\x81\xa5\x92\x8a\x2a\x02\x02\x2a\xa1\
+\x88\xac\xd2\xad\xdb\x61\xef\xfe\x5a\x24\x0d\xb2\x8a\x40\x27\xb6\
+\x22\xcc\x96\x04\xdd\xbf\x5e\xdc\xd2\xa0\x4f\x41\x40\x5d\x7d\x3d\
+\x4e\x09\xd0\x31\xc1\xc6\xa6\x66\x68\x6e\x6e\x85\x96\x96\x36\x68\
+\x21\x9f\x7f\xd5\xda\xcd\x30\x69\xea\x4d\x7c\xcc\x6f\x32\x9f\xf5\
+\x4f\xb1\x18\x41\xb1\xf2\xbf\xa0\x12\xa8\xfb\x0c\x08\x96\xc3\xec\
+\xfa\x9e\x84\x1e\x0a\xb4\x1a\x40\xc9\x8f\x23\xcf\x9a\x02\xf3\x97\
+\x6d\x80\x9a\xa6\x36\xd8\x98\x55\x0c\x67\x8c\xbf\x12\xab\x4f\xf1\
+\x49\x0c\x8c\x5a\x2b\x54\x4e\x6a\x74\x6e\x24\xe8\xbe\x06\x15\xad\
+\x1f\x20\xc2\x69\xb4\xda\x8b\x41\x4f\x5f\xb4\x61\x06\x0e\x00\x58\
+\x03\xbe\xa0\xca\x47\xab\x33\xfa\x48\x60\x22\xb7\xd0\x4e\x0c\x7b\
+\xdc\xc7\x58\x00\xc0\xff\x96\xeb\xa0\x5c\xab\xc0\x22\x05\xdc\xd7\
+\x39\xfb\x68\x65\xe8\xb0\x83\x79\x8e\x03\x53\xdd\xd0\xc0\x77\x29\
+\xbf\x28\x6e\x3d\x2c\xb1\xd4\x1c\x8e\x02\x66\x64\xe6\x32\x91\x17\
+\xac\xcf\xee\x44\x15\xd5\xd9\x2f\xec\x72\x62\x69\x2e\x95\x88\xe8\
+\x9a\xfb\xb1\x6b\x3f\x7b\x19\x55\x1c\xc8\xde\x52\x7f\xc6\x77\x44\
+\x57\x32\x0d\xe2\x15\xb6\x7c\x09\x8c\xb8\x88\x20\x80\x8e\xf8\x91\
+\x9b\xf3\xb9\xea\xd5\xb0\xe0\xeb\xf5\x70\x00\x19\xe3\x24\x43\x24\
+\xdb\xfd\x24\xf8\x50\x2f\xfb\xf2\xed\xbb\x48\x70\xd9\x49\x82\xe3\
+\x76\x58\x9f\x55\x08\x73\x16\xaf\x86\xb7\x3f\xfc\x0a\xfe\xf2\xf2\
+\xbb\xf0\xd8\x93\x2f\x23\xa9\xeb\xde\xfb\x9f\x82\x3b\xef\xfb\x3d\
+\xdc\x7a\xd7\x6f\xe0\x96\x1f\x3f\x00\xb7\xde\x79\x3f\x2c\x5d\xb1\
+\x0e\xb6\x91\xbf\xdd\xca\x17\x25\xdc\xa5\x65\x31\x4d\x80\x35\x14\
+\x04\x10\x00\x40\x2b\x01\xb4\x22\x40\x33\xf7\x93\xcf\xb9\x90\x33\
+\xe3\x27\xb1\x80\x41\xcb\xc6\x04\x04\xa0\x99\x10\xd7\xe0\xf7\x21\
+\x41\x6c\x32\x5a\xdf\xc6\xe1\x36\x95\xd9\xe0\x06\x4c\x4b\x5f\xfc\
+\x3b\xea\x0e\x48\x45\x6f\xb0\x82\x30\x09\x4e\x3d\xf7\x62\x38\xed\
+\xfc\x4b\xb9\x41\x0e\x57\xc5\x23\xbf\x3b\x6c\xb4\x06\xff\x78\xf3\
+\x13\x12\x40\xb7\x91\xcc\x9a\x02\x81\x0a\x28\x28\x2d\x27\xa0\xa0\
+\x1c\x76\xed\x3d\x80\xc4\xbc\x83\x7a\xff\x5f\xaf\x02\x74\xf7\x60\
+\xbf\x5e\x2c\xf7\x1b\x8b\x07\x6e\x1a\x68\x69\xb6\xad\xf7\xfc\x2d\
+\x95\x00\x87\xd5\x8e\x55\x82\x0e\xa6\xed\xcf\x1f\xb7\x92\x55\x45\
+\x8f\x1d\xc9\xf2\x17\xaf\x48\x83\xc4\x53\x53\x09\x28\x62\xbc\x86\
+\xb3\xc7\x5d\x0a\xcf\xbd\xfc\x16\xd9\xdf\x4a\x02\x04\xb6\x43\x69\
+\xf9\x36\x04\x04\x58\x11\xd8\x5f\x03\x6d\x1d\xac\x1a\x40\xc1\x09\
+\xdb\x4f\xb6\xf4\xc7\x94\x47\x50\x4b\x40\x5e\x2d\x6d\x03\xd4\xb3\
+\x31\xc1\x46\xba\xc8\xf3\x4d\x4d\xb4\x2a\xd0\x0a\x7b\x6b\x1a\xe1\
+\xb7\x4f\x52\x83\xa1\x64\x16\xfc\x47\xa5\x08\x59\x7a\x48\xa2\x11\
+\xc0\x85\x82\x14\x9b\x70\x50\x22\x07\x05\x3c\x29\xa1\x95\x84\xc4\
+\xd3\x26\xc3\xa7\x73\x96\x43\x4d\x63\x07\xa4\xe7\x96\xc1\xd9\xe3\
+\xbf\xc7\xf8\x06\x58\x0d\x48\x16\x26\x01\xc2\x82\xe7\x89\x66\x75\
+\x9a\x4c\x14\xef\x6f\xaa\x03\x39\x30\xd2\xf9\xd2\x2e\x48\xe6\x53\
+\x34\x0f\xaa\x78\x7d\x07\x10\xb1\x65\xfe\xd1\x0c\x90\x06\x32\xe3\
+\xb5\xba\xd1\x8a\xce\x8b\x08\x02\x94\x48\xc2\x9e\xf3\xbd\x31\xe8\
+\xaa\x93\xdf\x2f\x91\x9d\xff\x6a\x19\x60\xf3\xbb\x3a\xce\xbd\x2c\
+\xdc\x97\x6c\xd0\xcb\x0c\xbe\x66\x31\xb6\xf1\x2b\xf6\x00\x1a\x74\
+\x2e\x6d\x1b\x23\x33\xe2\xdf\x88\x17\x99\x57\x34\x2a\x63\x4a\x6a\
+\xce\x4a\x59\x51\x67\xec\x79\x86\xaa\xe8\x8a\x7b\xc2\x7e\xba\x66\
+\xdc\xee\x08\xb9\xdf\xbd\x25\x0e\x00\xfc\x8a\xd7\x6a\xc4\xc0\x12\
+\x18\xbd\x7b\x62\xdb\x66\xab\xb9\x82\x21\x9e\x1b\x74\xbc\x8f\xce\
+\xa0\x8f\x98\x88\x62\x34\x37\xdf\xfe\x30\x94\x94\xef\x24\xd9\x7e\
+\x3d\x09\xfa\x24\xf3\xaf\x6f\x86\xfc\x2d\xdb\xe0\xf3\xb9\xcb\xe1\
+\x4f\x2f\xbc\x05\x77\xfe\xfc\xf7\x30\xf5\x8a\x69\xc8\x14\x1f\x36\
+\x52\xc5\xa0\x8a\x25\xfb\x11\xba\x03\x1f\xcb\xea\x86\x24\xb2\xc0\
+\x74\xe5\xb5\x77\xc1\xfa\x8c\x7c\xd8\x57\xd3\x00\xbb\xf7\xd5\x42\
+\xf5\xee\xfd\x90\x57\x5c\x4e\x82\x3d\x09\xfc\xeb\x33\x71\x4b\xab\
+\x00\xeb\x36\x66\xc0\x5a\x0e\x00\xe8\x7a\xf5\xad\x4f\xc8\xfe\x8d\
+\x67\x33\xf2\x09\x2c\xf0\x53\x20\x30\xe5\xca\x3b\xe1\xca\x1b\xee\
+\x81\xb1\xda\xf7\x20\x70\x5a\x0a\x27\xc0\x32\xb3\x22\xe6\x47\x90\
+\xca\x6e\x10\x74\x6a\x41\x77\x1e\x4c\x60\xaf\x31\x04\x6d\x82\xc7\
+\x61\xc6\xcf\x32\x7f\x06\x00\xe2\x14\x93\x80\x46\x2b\x1f\x4f\xfc\
+\xe5\x5f\x04\x00\x54\x61\x8b\x23\x9f\x4a\x16\x17\x95\x43\x7e\x71\
+\x19\x94\x92\x80\x4a\xab\x01\x54\x38\xa8\x87\x13\xfe\x68\xe6\x4f\
+\x97\x25\xf0\x8b\x3d\xff\xf6\x2e\xa3\x02\x10\x2d\xe8\xd3\xd5\xaa\
+\x07\x7d\xbe\xd5\x7f\x6e\xe3\x26\x3f\x75\xf5\x2d\xb0\x85\x64\xf7\
+\xe5\x55\xd5\xf0\xc1\x8c\xb9\x30\x54\xcf\xa4\x87\x93\xcf\x35\xfc\
+\x3c\x02\x04\x2e\x81\x97\x5f\xff\x08\x8a\xcb\xaa\x09\x50\xab\x46\
+\x7e\x40\x69\x79\x15\x94\x13\x20\xb0\x9f\x7c\x07\xed\x6d\x66\x25\
+\x82\x01\x02\xce\x39\x20\x5b\xea\x1f\x40\x4b\xfe\x35\x75\x6c\xd5\
+\xd6\x51\x30\xd0\xc8\x00\x41\x3d\x1f\x19\x6c\x6c\x83\xd5\xeb\x73\
+\x60\xca\xe5\x3f\x16\x46\xfe\x4c\x2b\x68\xbf\x9e\xf9\x27\xea\xea\
+\x77\xe2\x28\x5c\xc8\x28\x23\xe3\x4a\xe2\x84\x3f\xde\x5a\x18\x7e\
+\x6a\x0a\xbc\x3b\x7d\x0e\xd4\x12\x10\x90\x55\xb8\x15\xce\x0b\x7e\
+\x9f\x13\x53\x75\x69\x60\x89\x03\x9f\x12\xb2\x95\x9a\xa3\xb5\x18\
+\xad\x33\xed\xf2\x24\x4d\xed\x87\x7a\xeb\x60\x04\x13\xed\x18\xdc\
+\x27\xdc\x2a\x9a\x61\x41\x6e\xbe\x8f\x25\x74\x25\xd6\xbf\xff\x5f\
+\xac\x02\x84\x2d\x06\x49\xc7\x79\x13\xb6\xe9\x3b\xc2\xf0\x3c\x8f\
+\x4f\x47\x6c\x14\x35\x32\xb0\xdb\x83\x94\x00\x00\xfc\x8a\xed\x77\
+\xec\x88\xce\x55\x20\x47\xf3\x00\x5e\x9c\xb4\xfb\xb5\xc8\xcc\xdf\
+\xe2\x27\xaf\xd9\xc6\x6c\x9c\xaa\x00\xaa\xb4\x6a\x32\x38\x1e\xd0\
+\xfa\x98\x91\xf0\x5d\x2b\x03\xd3\x47\xea\xdf\xb9\x23\x4a\x10\xdb\
+\xd8\xce\xb8\x8f\x41\x63\xbc\x6f\xc4\x49\x61\x78\xe9\xf5\x19\x50\
+\xb1\xa3\x86\x64\xe4\xf9\x58\x56\xfe\xf1\x3d\x8f\xc2\x79\x24\xd0\
+\x0e\x3b\x99\x7b\xc0\xe3\x68\x58\x32\xca\xa1\xfa\x12\x05\xa7\x3f\
+\x0a\x20\x12\xd8\x8a\xc3\xf2\x3c\x1d\x15\x4c\x81\xbf\xbf\x39\x1d\
+\xf6\x90\xa0\xb3\x8f\x04\x95\xbd\x04\x50\x50\xde\x00\x25\x04\xd2\
+\x8c\x9f\x06\xfb\x75\x74\xcb\xd7\xba\x4d\xfc\xe7\x8d\x9b\xc9\x62\
+\x22\x41\xbf\x7c\xf8\x19\x74\xb0\xa3\xb6\xbe\x68\x5e\x43\xde\xf3\
+\x64\x92\xb9\x2f\x5b\x97\x0d\xed\x48\x64\xeb\x44\x42\x22\x15\x17\
+\xfa\x60\xfa\x2c\x78\xe6\xf9\xd7\xe0\x27\xf7\x3d\x0e\x17\x5c\x3e\
+\x0d\x4e\x3f\xef\x12\x88\x4f\x1c\x8f\x64\x3f\xdf\xf0\xb1\xe0\xa7\
+\x4e\x78\x34\xf8\x0f\x1f\xcf\xed\x7c\x75\x4b\xdf\x09\x08\x8a\xf5\
+\xd9\x77\x04\x10\x64\x3b\xed\xa7\x8f\x41\x56\x7e\x19\xe4\x12\xb0\
+\x92\x57\xc4\xda\x1d\x39\x45\xa5\x90\x5f\xb8\x05\xaa\x77\xed\x85\
+\x8e\xae\x5e\x9c\xf3\xef\xe8\xee\x66\xbd\xf6\x0e\x6b\xa0\xb7\x02\
+\x00\x5b\xc6\x6f\x04\xf7\x4e\x5c\x62\xb0\x37\x56\x6b\x3b\xae\x16\
+\xcb\x62\xd5\x00\xaa\xb9\x40\x33\x7b\x4a\x02\xfc\xfd\xd3\x7f\x07\
+\xbf\x01\x6c\xa8\xa6\xc0\x18\x04\x64\x13\x53\xaf\x43\x8b\xde\xb2\
+\xad\x6c\x84\xb0\xa4\xac\x92\x80\x9a\x4a\x28\x27\x7f\x53\x43\xbe\
+\x0f\x0a\x02\x68\xe6\xdf\xc5\x17\xfb\xb9\x1b\x8d\x84\x0e\xd4\xd4\
+\x93\xdf\x69\xc0\xaa\xcf\x01\xb2\xad\xc1\xc5\x40\x01\x05\x04\xb4\
+\x65\xb0\xbf\xa6\x19\xee\xfe\xc5\x1f\x0d\xa1\x20\x5d\xc9\xd3\xc9\
+\x37\xc0\x52\x52\x0e\xe8\x13\x04\x61\x16\xe0\xe9\x31\xe7\x6d\x85\
+\x61\xa3\x92\xe1\xad\x7f\xcf\x86\xda\xa6\x76\x02\xbe\xaa\xe1\x7c\
+\xf5\x5a\xac\x00\x44\xfa\x63\x70\xd5\x40\x63\xa4\x35\xe4\x22\x39\
+\xae\x39\x8c\xdf\xc9\x35\x37\xe4\x36\xe1\xff\x1b\xfd\x68\xc7\xfb\
+\x8b\x12\x6b\xb2\xa1\x45\x48\x12\x7b\xbe\x77\x2a\x94\x8c\x18\xfa\
+\x7f\x06\x00\xf8\x05\xa5\x4a\xf1\x3c\x3d\x4e\x2e\x59\x19\x1e\xa4\
+\x93\x42\x73\xf6\xb7\x77\x2c\xa7\xab\x9e\x04\x32\x74\x25\x2b\xbf\
+\x9d\x6d\x2b\xb5\xd7\x74\xab\x34\xd8\x96\x14\x94\x44\xf1\x0f\x48\
+\xd4\x24\xbf\xef\x56\x65\x19\xbc\x0b\xd8\xaf\x08\x0a\x64\x8e\x25\
+\xbf\xc1\x44\xe6\xd1\x11\xa9\x39\xb7\x9b\x2c\xd8\xae\x86\x8c\xec\
+\x9f\x66\xc9\x13\x26\xdf\x44\x82\xf5\xe7\x24\xe0\xfe\x09\xce\x9d\
+\x78\x39\x33\x89\xa1\x8b\x6b\xa0\xd3\xa0\x4f\xa5\x7e\x7d\xd8\xff\
+\x65\x7d\xdf\x38\x63\x1c\x29\xc8\xb2\x7e\x9e\x69\xd3\xe0\x4a\x9d\
+\xf2\xb2\x72\x4b\x61\x77\x4d\x2d\x01\x00\xf5\xb0\x67\x7f\x1d\x14\
+\x93\xe0\xb3\x3e\x83\xce\xff\x67\x21\xf3\x7f\x03\x6a\x01\x90\x95\
+\xce\x16\x4e\x03\x6c\xca\x44\x6e\xc0\xea\x8d\x19\x28\x0a\xb4\x62\
+\xdd\x66\xb4\xf7\xc5\x0c\x5e\xe7\x27\x90\xf7\x3f\x6d\xec\xe5\x30\
+\x67\xf1\x3a\x1c\x65\x63\x96\xbe\xba\xad\xef\xb7\x70\xf4\x9b\xa3\
+\xd8\xaf\x6f\x6d\xef\x86\xbd\xfb\x1b\x61\x73\x6e\x09\x7c\x39\x7b\
+\x19\xbc\xf8\xca\x3b\x70\xff\x43\x4f\xc3\xb5\x37\xde\x0b\x13\x92\
+\xbf\x0f\x49\xa7\x12\x10\x33\x82\x5a\xe4\x8e\x41\x57\xbc\xf8\x91\
+\x4c\xcb\x1e\xbd\x0d\xb8\xde\xfb\x05\x57\xdd\x01\xab\x37\xe5\x42\
+\x6e\x61\x29\xe4\x14\x96\x40\x56\x41\x09\xba\x15\x32\x9e\x43\x29\
+\xec\xda\x5b\x43\xde\xa7\xcb\x2c\xd9\xb7\x9b\xd9\x35\x06\x7a\x0b\
+\xdb\x5f\xff\x1d\x31\xe0\x77\x71\x10\x60\x66\xf9\x91\x41\xdf\x5c\
+\x94\x99\x4f\xf5\xfd\xe9\xa8\x5e\x29\x7a\x2b\x54\x92\x20\x59\x05\
+\xe7\x4d\xba\x82\x07\xfe\x31\xd8\xea\xc0\xb6\x07\xbf\x3e\x2f\xb9\
+\xe6\x2e\x98\xb7\x64\x1d\x94\x94\x6f\x47\x00\x50\x5c\x4a\x16\xf9\
+\x3b\x2a\xd3\xdc\x42\x5e\xaf\x53\x00\x00\x38\x81\xd0\xd9\x83\x04\
+\xc0\x7d\x07\x08\x70\x23\xa0\x6d\x2f\xf9\xfe\xf6\x1f\xa8\xc3\xea\
+\x01\xae\xda\x7a\x38\x50\x57\x8f\x60\xe0\xb5\xb7\x3f\xe5\xf3\xfd\
+\x2a\x3a\x01\x8a\x92\xbe\xe6\xb8\x98\x6e\x95\x1c\x8e\x90\xf8\xc5\
+\x8a\xcd\x48\xbd\x85\xa0\x13\x0c\x27\xc3\xb0\x93\x52\xe0\xed\x0f\
+\x67\x43\x7d\x53\x07\x01\x5d\x95\x70\xc6\xb8\x2b\xac\x7e\x1a\x42\
+\x19\x3f\xde\xb0\x14\xb6\x1a\x8a\x45\x02\x02\x2d\xaa\x2e\x8a\x23\
+\xaf\x4a\xe9\xeb\xa8\x5d\x7f\x38\x04\x5e\x9c\x01\x07\xea\xf5\xad\
+\xa6\x3e\x3a\xb1\xd2\x67\x7f\xcd\x80\x55\xbd\xcf\xb9\x07\x1e\xd9\
+\xb2\xf4\x47\x11\x56\xfa\xef\x5d\x61\xcf\x00\xc0\xae\x21\x73\xdc\
+\xe0\x10\x1b\xe4\xa3\x61\x3e\x31\x4b\x0e\x78\x05\x02\x5a\x14\x60\
+\xa2\x09\x66\x16\xb2\x80\x1b\x8c\xce\x3b\x70\x9c\x34\x90\x64\xf7\
+\xc6\xe3\xa0\xf9\xbc\xd8\xc6\x30\x7e\x0e\x32\x2d\x71\xa3\xd5\xe1\
+\x26\x52\xe4\x34\x87\x2a\x99\xf3\x55\xfa\xa2\x3a\x28\x56\x4c\x84\
+\xf1\x24\x45\x1d\xc0\xef\xde\xfd\x06\x64\x47\xd6\x86\x7a\x5a\x62\
+\xb2\x83\xd8\x0f\xeb\xe7\xe1\x71\x26\x59\xfb\xa8\xb3\x2f\xc4\x52\
+\x3e\xeb\x95\x53\x97\xb8\x09\x86\xa6\x37\x8e\x77\x8d\x0c\x71\x65\
+\xb7\x14\x64\x68\xc7\x73\x30\x41\xb5\xc2\xe9\x4d\xc2\x4f\xdb\x08\
+\x04\x00\xd0\x4c\xf4\xf1\x3f\xbc\x84\xf2\xb2\x7b\xf6\xd6\x62\xef\
+\x99\x4e\x0c\x6c\xce\x2b\xe1\x62\x40\xd9\xb0\x31\x3d\x1b\x49\x80\
+\x1b\x48\xd0\xc7\xc7\x64\xd1\xad\x05\x08\x70\x62\x20\x05\x01\x4b\
+\x57\xa7\x83\x36\xf5\x46\xb6\xcf\x23\xd9\x3e\xd0\x4c\xf1\xe4\xf3\
+\x2f\x83\x19\xb3\x96\x42\xe5\xf6\x5d\x38\x9a\x47\x83\xff\x37\x47\
+\xbf\x81\x23\x47\x8f\xa0\x54\x2e\x2b\xd1\xf7\x42\x77\xf7\x21\x3e\
+\x4a\x77\x90\xf7\xe2\x7b\x49\xc0\xa5\xec\xf7\x36\xa8\xaa\xde\x0f\
+\x69\x99\xf9\xf0\xc5\xec\xa5\xf0\xf2\xab\xef\xc3\x23\x8f\x3d\x0f\
+\x37\x4f\x7b\x00\xa6\x5c\x76\x1b\x9c\x39\xee\x52\x18\x3e\x2a\x08\
+\xe7\x4d\xbc\x94\x04\xd0\xd5\x24\xf8\x17\x43\x36\x5d\xe4\xb3\x64\
+\xe4\x16\x41\x7a\x76\x11\xa4\x65\xe5\x41\x5e\x51\x19\x92\xf3\x5a\
+\x8c\xf2\x7d\xa7\x19\xf4\xdb\xba\x58\x50\xd7\x59\xff\x74\xd1\x2c\
+\xbe\x8d\x31\xec\x5b\x5b\xf9\xdf\x90\x9f\x5b\x78\xc6\xaf\xaf\x66\
+\x4e\xbe\xd3\xb7\xf8\x73\x2b\xf9\xb9\xa5\x03\xb3\xf4\xea\x9d\x7b\
+\x71\x52\x81\xb6\x53\xfe\xef\x0f\x2f\x82\x6f\xf8\xf9\x58\xe9\xa0\
+\xdf\x21\x13\xd5\x09\x63\xe6\xec\x43\xb5\xbe\x89\x30\xed\x9e\x47\
+\x61\x5d\x7a\x3e\x01\x62\x55\x04\x00\x54\x21\x47\x80\x92\x39\x6b\
+\x49\x66\x4f\x8f\x8f\x5e\x09\xd0\x89\x8b\x0d\x4d\x6d\xd8\xb2\xd9\
+\xbd\xbf\x16\x01\xdc\xde\xfd\x04\x0c\x10\x20\x40\x95\x09\xd9\xb6\
+\x1e\x66\x7c\xb1\x08\x5b\x33\x54\x3d\x50\xef\xe9\x5b\xd5\x02\xc3\
+\xee\x4b\x1c\xf3\x4b\x4a\x85\xa1\x38\x79\xc2\xc6\x0d\x29\xcf\x80\
+\xb6\x03\x0e\xd4\xb7\x12\xe0\x58\x04\x27\x91\x73\x54\x07\xdc\xd8\
+\x0a\x4c\x34\xad\xab\x8d\xb6\x82\x0d\x08\x18\x6e\x85\x1e\xcb\xfa\
+\x3e\x9b\x90\x8f\xdf\x32\xd2\xdb\xf7\xf1\x41\xff\x80\x56\x7f\x55\
+\xb3\xc2\xc8\xef\x7b\x7e\xa9\xda\xe1\xc0\x2f\x5f\x40\x5e\x09\x88\
+\x5a\x19\x50\xfa\xcf\x01\xf8\xcf\x06\x7f\xcd\x41\x15\xd1\x06\x00\
+\x74\xce\x1b\x2e\x4d\x04\x00\x83\x43\x32\xb0\x5a\x65\x5a\x83\xbf\
+\xcf\xa2\x4c\x27\x4a\x51\x06\x4d\xa7\x2c\x59\x6f\x4c\xfc\x80\x46\
+\xb9\xdd\xeb\x04\x82\x07\x07\x3e\x1b\x07\x40\xcf\x44\x71\x29\xe6\
+\x63\x33\xe8\x07\xa5\xa0\xc0\x78\xce\x42\x5c\x8c\xb2\x4f\x81\x28\
+\x01\xdd\xb8\xe0\xcd\x63\xe0\x2a\x07\xaa\x44\xaa\x03\xfa\xf8\x7e\
+\xf9\x8f\x11\x9b\x55\x0c\xfe\x7e\x4b\x76\xe4\x7e\xd3\x35\xb9\x00\
+\x14\x48\xb1\xa0\x6f\x06\xff\x49\x26\x69\xcb\x50\x7a\x63\x25\x5b\
+\x04\x00\x58\x26\xd7\x7b\xb3\xec\x06\x79\xda\x79\x17\xc1\xec\x79\
+\x2b\x60\x2f\x0d\xfc\xfb\x6a\x60\x1f\x09\x1a\x54\xc1\x8e\x0a\x02\
+\x51\x1f\x00\xba\xa8\xe5\xef\x26\xae\x05\x80\x40\x40\x07\x04\x64\
+\xbb\x2e\x93\x01\x00\xbd\x25\xb0\x86\x73\x02\xd6\x6c\xca\x84\x45\
+\x2b\x36\xc2\xb8\x94\xeb\x99\xdb\x20\x82\x90\xc9\x68\x40\x94\x78\
+\xfa\x05\xf0\xf6\x07\x73\x90\xf8\x46\xe7\xf6\x0f\x1d\x3a\xcc\xd7\
+\x21\x3e\xab\x6f\xf6\xe9\x19\x00\xd0\x47\xea\xba\x2d\xd9\xba\xde\
+\x07\xa7\x60\x81\x0a\x00\xd1\xdf\xa7\x01\x7d\x7f\x6d\x33\x94\x94\
+\x6d\x23\x41\xbf\x18\x76\xec\x3d\x80\xbe\x06\x34\x7b\xce\x2d\x28\
+\x85\xf4\xcd\x05\xa8\x6e\xb8\x3e\x83\x4a\x1d\xe7\xe1\x08\x5e\x6d\
+\x63\x8b\x50\xd2\x27\xc1\xbf\xb5\xcb\x24\xf2\xf1\x40\x4f\x83\x3b\
+\x05\x01\x34\xfb\x6e\x21\x01\xdd\xc8\xf8\x31\xb0\xb7\xe1\xa2\x19\
+\x78\x13\x5d\x24\xd3\x6f\xc6\xc7\xe6\xa2\xcf\x37\x37\xb7\x41\x4d\
+\x7d\x13\x82\x0f\x5a\x89\x58\xb2\x32\x0d\x7c\xc3\xce\x67\x5c\x0c\
+\x02\xe8\x6e\xbb\xeb\x51\xb8\x65\xda\xaf\xe1\x84\x00\xbb\x4e\x86\
+\x60\x65\x66\x1c\x04\x4e\x0e\xc3\x9f\xfe\x4a\xf9\x0d\xdb\x70\xba\
+\x81\x92\x09\x2b\x08\x08\xd8\xb9\x6b\x1f\xb6\x2e\x74\x2e\x40\x27\
+\xb6\x2e\xba\xc9\x7b\x34\x63\x95\x83\x92\x3f\x29\xa0\xa3\x52\xc4\
+\x7b\xf6\xd5\xe2\xda\x4d\x1e\x2f\x5d\x95\x8e\xdc\x03\xbf\x61\x00\
+\x13\xb4\x95\xdc\xa3\x9c\x8b\x02\xbb\x1f\x67\xff\x03\x93\xf1\xdc\
+\x62\x8b\x19\x09\x7d\x30\x63\x3e\xec\x39\xd0\x08\x8b\x57\x66\x82\
+\x72\x6a\x2a\xf9\x7c\xcc\x99\x92\xe9\xfe\x9b\x8e\x96\x56\xfd\x78\
+\x81\xd8\x17\x50\xa3\xe8\xa1\xc8\x54\xfc\xac\xf7\x3e\x9f\xa2\x0d\
+\x1a\x78\xf7\x32\xd6\x2b\x06\x1c\x9f\x22\x04\x7c\x85\x4f\x5a\x25\
+\xd8\x39\x5a\x1a\xfc\x57\xb1\xe9\x95\x18\x3e\xab\xc3\xbd\xcd\x17\
+\xf8\x4f\x7e\x06\x89\xe3\x60\xb4\x56\x2e\x39\xef\x06\x11\x00\xa8\
+\xce\x84\x40\x3d\xfb\x17\xca\xeb\x91\xfd\xff\xa0\x40\xf6\x93\xb0\
+\x54\xfb\xea\x1f\x2d\x56\x1e\x8c\x1b\x42\xd8\x01\x00\x68\x11\x44\
+\x45\xbf\x6d\xe9\x41\xde\x6f\xab\x02\xb0\x9e\xbb\x66\xe3\x29\x84\
+\x3c\xb4\x11\xa2\x4d\x0d\x88\x95\x06\xcd\xc3\x49\x1a\x96\xbf\x56\
+\x3f\xec\x3f\xfb\x62\x17\xaa\xdf\x24\x2c\x3d\x56\x5b\xd6\x6f\x66\
+\x5a\xc9\x5c\x17\x3f\x05\x03\x3a\x2b\xe1\x4f\x44\x52\x1c\xf3\x87\
+\x9f\x68\x94\x72\xe3\x2d\x92\xac\x61\xc3\xfe\x37\x9e\x8b\x04\xc5\
+\x71\xe5\x40\xaa\x21\x5f\x5a\x56\x0d\x35\x58\x2e\xa6\x19\x63\x2d\
+\x96\xfc\xa9\x1c\x70\xc6\x66\xba\x0a\x50\x07\x40\xd7\x02\x40\x75\
+\x40\x0a\x02\x32\x19\x10\x60\x55\x00\xb3\x02\xa0\x57\x01\xd6\x51\
+\x3e\x00\xaf\x14\x2c\x5c\xbe\x01\xc6\x84\xae\xc5\x16\x84\x2f\xc0\
+\x01\x08\xd9\xa7\x61\x23\xc3\xf0\xd4\x73\x6f\x42\x76\x61\x05\xbe\
+\x67\x13\x09\x8e\x07\x0f\x1f\x61\x4c\x7d\xae\xca\xa7\x03\x80\x4e\
+\xce\x82\xef\xe8\xec\x31\x7b\xf4\xf4\x71\x47\x8f\x31\x1b\x8f\xbf\
+\x43\xc7\xe4\xba\xbb\x05\x51\x9e\x6e\x9c\xcd\xa7\xea\x7d\x34\xc0\
+\xd3\x0c\xbc\x89\x64\xc8\xb4\x05\xb1\x87\x64\xc3\xb4\x27\xbf\x75\
+\x1b\x9d\x6c\xd8\x41\x02\x63\x0d\x06\x7a\x16\xfc\x3b\x79\x46\xcf\
+\xb2\xfd\x36\x4b\xc6\xdf\x11\x59\xe2\x6f\xd1\x17\x0d\xf4\x6c\x61\
+\xe0\x27\x40\x80\x96\xfd\x9b\x70\xb5\x41\x23\x79\xef\xfa\xc6\x56\
+\x28\x21\xa0\x23\x1b\x75\x17\xca\x20\xe5\xe2\x1f\x32\xd2\x23\xb9\
+\x5e\x2e\xba\xf2\xc7\xf0\xcd\xb7\xdf\xc2\x96\x8a\x2a\xf8\xe5\x83\
+\x4f\x12\x20\x30\x9e\x55\x07\xf8\xc8\x63\xca\x45\xb7\x10\xd0\xb0\
+\x09\x2a\xaa\x76\x91\xb5\x1d\xca\xb7\x55\xe3\x64\x06\x15\x01\x62\
+\xfa\x00\x8c\x6b\xd0\x4a\x3e\xc3\x9e\x7d\x75\xb0\x73\xcf\x01\x9c\
+\x82\xa0\x40\x80\x7e\x3e\x04\x05\x7b\x6a\x20\x2b\xbf\x9c\xbc\xee\
+\x18\x2c\xff\x8b\x6a\xa4\xfe\x44\x0f\xd9\x3f\x5f\x43\x09\x08\xa0\
+\x2b\x1e\xc7\xfd\x52\x38\x40\xd5\x47\x3b\x35\x54\x6f\xa4\x04\xd4\
+\x9d\xfb\x1b\x60\xd6\xc2\xb5\x30\x6c\x34\xf9\x3b\x0c\x78\xf2\xe0\
+\x6f\x95\xab\xd5\x24\x6e\x99\x5e\x5c\x36\x6d\xd7\xba\x32\xc0\xc1\
+\x63\x40\x78\x48\x82\xdf\x00\x4f\x9e\xdc\xfd\x43\xfe\x07\x7b\xeb\
+\x1e\x7d\x19\x62\x05\x16\x03\xdb\x86\xb1\x3a\x46\x1a\x00\x54\x19\
+\xb4\x16\x40\xc8\x45\x62\x52\x0c\xf0\x41\x6b\xf9\x5c\x78\xde\xc8\
+\xba\x5d\x7c\x09\xac\x65\x65\xa7\x13\xca\x05\x00\x18\x55\x08\xa7\
+\x31\x36\x9b\xbc\xb0\x12\xb4\x02\x16\x4b\xf9\xcd\x04\x31\x7e\xa1\
+\x75\xc1\x1c\xbf\x78\xe6\x2d\x61\xf4\xa2\x64\x71\x40\x74\xf6\x93\
+\x99\x53\x38\xb4\x47\x14\x35\xa2\x35\x22\xce\xc5\x9a\xcf\xd9\x39\
+\x09\xa1\x01\x2c\xc7\x45\x99\x24\x50\x6c\x73\xba\xa2\x71\x4a\x92\
+\x1d\x00\xf0\x9b\xea\xc8\x64\x1e\xbc\x99\x45\xee\x49\xe7\x5c\x04\
+\xf7\x3f\xfe\x3c\x3c\xfb\xf2\x3b\x70\xeb\xbd\xbf\x43\x46\x3c\xce\
+\x6e\xa3\x2b\x1c\x5f\x5c\x2a\x98\x01\x00\x9d\xb4\x95\x02\x43\x93\
+\x42\xf0\x8b\x07\x9e\x86\x03\xb5\x4c\x56\xb6\xb6\xa6\x01\xf6\xee\
+\x3f\x00\xf9\xc5\xe5\x90\x91\xa3\x4b\x02\xe7\x1b\x40\x00\xa5\x81\
+\xc9\x4a\xa3\x2b\x33\x17\x36\x11\x00\x40\x81\xc0\x06\x6c\x0f\x30\
+\x7d\x00\x11\x04\x50\x8e\x00\x7d\x8e\xfe\x0e\x05\x0e\x8b\x96\x6f\
+\x84\x73\x27\x7d\x8f\x97\xd8\xf4\xac\x40\xc5\x12\xf4\x5d\xf7\xfd\
+\x9e\xbc\xdf\x16\x92\x9d\x6f\x21\x41\x6d\x07\x06\x5f\x43\x8e\xb7\
+\x53\x67\xe9\xf7\x08\x2c\x7d\x0e\x02\xf8\xf3\xc6\xbc\xbd\xc1\xe0\
+\x67\x41\x1f\x45\x79\xa8\x6e\x3f\x09\xfe\xb4\x07\xdf\x28\x64\xe6\
+\x4d\xcd\xed\x3c\x33\xa7\x5b\xf2\xff\x2d\x9d\x18\xd8\xe9\xa4\x40\
+\x2b\xf6\xeb\x19\x00\x68\x6b\xe3\x25\x7e\xfe\xd8\xc8\xf8\x5b\xdb\
+\x85\xec\xbe\xd5\x08\xfe\xcd\xcd\x2c\xcb\x6f\x32\x82\x7e\x2b\x34\
+\x50\x10\x40\x02\x74\x43\x13\xb5\xf4\x6d\x25\xe0\xa3\x05\x27\x2a\
+\xa8\xf0\x52\x56\x5e\x09\x3c\xf3\xfc\x1b\xd8\xce\x89\xe3\x55\x1d\
+\xca\xfa\xff\xf6\x9b\xc3\x70\xe4\xf0\x61\x02\x04\xb6\xc3\x9d\xf7\
+\x3e\x4a\x02\xe7\x38\xf6\x3b\xe4\x7c\x4d\x38\x39\x15\x9e\xfb\xdb\
+\x7b\x50\x56\xb5\x13\xb6\x92\xe3\x45\xa7\x0a\xa8\x45\x32\xcd\xee\
+\x5b\x39\x4f\x81\xee\x23\x95\x21\xae\xde\xb5\x1f\xaa\xf7\xec\x43\
+\x11\xa8\x9d\x04\x08\xe0\xda\x43\x47\x42\xf7\xe1\xa4\x86\xe1\x7f\
+\x81\xec\x7f\xd3\x9f\xc4\x55\x7a\x5a\x17\x11\x32\x56\x32\x56\x04\
+\x58\x25\x20\xcc\x01\x41\x08\xc1\x85\x72\x6a\x32\x2c\x5e\x91\x0e\
+\x3b\xf6\xd6\xc3\x7b\x1f\xcf\x87\x78\x24\x9c\x06\x71\x8c\x15\xaf\
+\xbf\x24\xe7\x4a\x83\x19\x00\x9c\x2c\x80\xa3\xdc\x67\x15\xad\x9f\
+\x6d\xda\xfe\x8d\x7e\xfb\x24\x80\x9f\x81\x1f\xe1\xbe\x9e\xa0\x0b\
+\x2d\x79\x9b\x38\xf3\x29\x83\x43\x2a\xf4\x0f\x74\xb0\x1d\xc0\x0a\
+\x84\xbf\x5f\xed\x76\xcd\xf3\x77\x25\x3a\xf4\x1e\x77\x6c\x4a\x13\
+\x0e\xc6\x3c\x81\xa0\xc4\x90\x42\x08\xa2\x8a\x1a\x19\xb8\xf4\x7e\
+\x52\x54\x76\xa8\x15\x70\x48\xbd\x01\x02\x41\x09\x11\x50\x52\x72\
+\xb7\xed\x1f\x9b\x19\x0e\x0a\x7d\x7d\x97\xcc\x5e\x71\x9b\xfb\xf7\
+\xd2\x9a\x70\x09\xfe\x8a\x5e\x66\x64\xe0\x82\x96\xfb\xfd\x12\x62\
+\x4b\xe4\x48\xa2\x95\x50\xe3\x4c\xd2\x09\x0f\xc8\x45\x17\x67\x03\
+\x00\x76\x42\x0a\xfa\xbc\x07\xcc\x3e\x6b\xdc\x48\xc6\xb8\xa6\x06\
+\x2f\x09\xa7\x4e\x81\xd7\xdf\x9d\x09\xf3\x97\xaf\x87\x27\xff\xfa\
+\x06\x12\xba\xfc\x8a\x66\x94\xfe\x19\x08\x60\xe2\x1f\x7e\x6e\xce\
+\x84\x19\xda\xc8\x29\x48\x0c\xa4\x63\x81\xb4\x57\xdc\xd8\x48\x00\
+\x40\x5d\x03\x66\x87\x94\x25\x9f\x95\x5b\xcc\x54\x01\xa9\x38\x50\
+\x0e\x95\x05\x2e\x80\xac\xec\x02\x43\x1a\x38\x9d\x82\x01\x04\x00\
+\xac\x12\x40\x5b\x03\x3a\x47\xc0\xe0\x02\x60\xe6\xbf\x99\xfc\x5f\
+\x36\xf9\x5d\x5a\x29\xc8\x85\xaf\x16\x2e\x87\x7f\xbe\x37\x13\xce\
+\x9c\x70\x25\xaf\x5c\xe8\x3a\x01\xd4\xcf\x5e\x85\x8b\xae\xba\x13\
+\x56\xad\xcf\xc6\x12\x7d\x4e\x7e\x09\x2a\xf9\xb5\xb4\xd1\x59\xfc\
+\x5e\x16\xd0\x75\x86\x3e\x57\xe7\xeb\x68\xef\x31\x9f\xeb\x30\x45\
+\x7a\x0c\xb6\xbe\x91\x09\xb3\xcc\x1c\xb3\x6f\x12\x88\xeb\x9b\x98\
+\xab\x1e\x05\x00\x4d\x2d\x62\x10\xef\x30\x7a\xf6\x76\x56\x7f\x8b\
+\x84\xd5\xdf\xdc\xcc\x7f\x5f\x2c\xf1\x53\x70\xa1\x07\xfe\x26\x16\
+\xf4\xf5\xc0\xdf\x48\x02\x7f\x3d\x35\xed\x21\xab\x96\x1c\xf3\x03\
+\xf5\xcd\x4c\x88\x89\x1c\xe7\xb5\x1b\x73\x71\x2c\xd3\xcf\x19\xf3\
+\xbf\xfd\xe3\x8b\x18\xfc\x0f\x1f\xee\x85\x43\xd4\xcf\xa0\xf7\x10\
+\x39\x86\x79\x90\x7c\xc1\x4d\xdc\x1c\x87\x05\xd8\x5b\xee\x78\x18\
+\xf2\x4b\x2a\x11\x00\x50\x4e\x00\xb5\x49\xa6\x04\x41\xfa\xb9\x28\
+\xe1\x90\xee\x13\x0d\xfc\xdb\x76\x11\x00\xb0\x9b\x81\x80\x6a\xae\
+\x06\xb9\x8d\x80\x00\xaa\xa2\x68\x24\x13\x1c\x38\x46\x90\xfd\xa2\
+\xac\x78\x9b\x43\xa5\xf1\x3c\x05\x9f\xbc\x0a\x78\xf2\xd9\x17\xc2\
+\xda\x4d\x85\xb0\x7d\x77\x1d\x3c\x45\xc0\xce\xf1\xb4\x62\x95\xc0\
+\x46\x0b\x7d\x49\xe6\xfb\x59\x65\x83\x1d\x44\xd1\xa2\x96\xe5\xc3\
+\x7c\xe4\x58\x35\x79\x07\x2e\x49\x40\xf4\xea\xe8\x60\xb4\xfc\x64\
+\xa4\x6e\x6b\x75\xd3\x2f\x55\x7f\x0d\x09\x3a\x07\x03\x31\xf2\x16\
+\xcb\x94\xc1\xe0\xca\xfa\x5a\x5a\x06\x03\x56\xc1\xf1\x36\x95\x61\
+\xbe\xb7\xa0\x03\xe0\xeb\x37\x7a\x8c\x86\x3e\x34\xe9\x97\xce\xb2\
+\xe4\xc8\xa0\xec\x37\xb2\x6c\xd6\x47\x33\x4a\x47\x8a\xc0\x17\x50\
+\xb4\x08\x73\x1c\x79\x09\x4d\x73\x70\x03\x34\x5b\x11\xe6\x54\x82\
+\xec\x22\x0c\xf3\x0c\x5f\xe8\xf1\x27\x04\x05\x37\x3d\xdb\xbc\xbf\
+\x60\x77\xec\x4b\x0c\x46\x71\x9f\x52\x5d\xe4\x87\x55\x79\x05\x20\
+\x82\x6f\xa0\xb7\x1e\x04\x17\x43\x45\x0e\x8c\xfc\x8e\x3a\x09\xfd\
+\x15\x05\xd2\x1c\x4f\xf0\x78\xfd\x02\x74\xbb\xb1\x8a\x96\xbf\x68\
+\xe2\xa2\x4b\xfc\x12\x00\x30\x3a\x15\x9e\x79\xf1\x2d\x58\xb6\x26\
+\x0d\x5e\x7b\xf7\x33\x18\x71\x4a\x0a\x5e\x30\x28\x10\x94\x18\x36\
+\xcd\x5d\x74\x27\x30\xa1\x2d\x32\x6c\x74\x0a\xbc\xf7\xd1\x5c\x12\
+\x8c\xda\x50\x28\x88\x06\xff\x5d\x24\x28\xd0\xc0\x9b\x9d\x47\x82\
+\x6f\x1e\x25\xcb\x15\x41\x76\x2e\x01\x01\x14\x00\x50\x49\x60\xba\
+\x25\x00\x20\xc3\x00\x01\x42\x3b\x80\x02\x01\x5a\x0d\xc8\x64\xce\
+\x81\x08\x06\x70\x4b\xb2\xff\xac\x1c\x54\x0c\xfc\x74\xd6\x42\xf8\
+\x70\xe6\x5c\xf8\x60\xe6\x1c\x02\x02\x3e\x83\xb1\xa1\x6b\x50\x23\
+\x40\xcf\x68\xfd\x5c\xb6\xf4\xb4\xf3\x2e\x85\x77\x3f\x9c\x03\x99\
+\x94\xac\x97\xcd\x40\xc8\xae\xdd\x07\x38\x21\xaf\x93\x6d\xdb\x3b\
+\x99\x40\x0f\x57\xdc\x6b\x6f\x97\x8d\xe8\xe9\xa5\x7a\x16\x98\x1b\
+\x79\x70\xa6\x23\x70\x34\x08\x17\x72\xd3\xa0\xe6\x96\x0e\x4b\x09\
+\xdf\x08\xf0\x02\x79\x4f\x7f\xdc\xca\xb7\x06\x60\x68\x66\xe5\x7d\
+\x31\xe0\x63\xd0\x6f\xd6\x03\x7f\x0b\xdb\x36\x52\x00\xd0\x8a\xd9\
+\x38\x03\x00\xad\x50\xdb\xd0\x82\x55\x00\xaa\x09\x90\x95\x5f\x84\
+\xea\x8b\xd7\xdc\xfc\x4b\x02\x56\x99\xc1\xd6\xc8\x53\x53\xb1\x52\
+\x40\x85\x8b\x28\x00\x38\x7c\xe8\x20\x1c\x39\x72\x14\xdb\x21\x4f\
+\x3e\xfb\x2a\x56\x6f\xa8\xdc\x6e\x1c\xc9\xb4\xd5\xc9\x37\xc1\xf2\
+\xb5\x59\x28\xce\x54\x4a\x47\x06\xcb\xb7\x61\x3b\x83\x82\x1c\xba\
+\x9f\x7b\x6b\xeb\x11\x14\xd0\x91\x4b\xea\xfa\xb8\x7d\x37\xb3\x7e\
+\xae\xde\x53\x0b\x67\x8d\xbb\x1c\xb5\xfd\xcd\x6b\x36\xec\x39\xf0\
+\x9b\x3c\x80\x64\xa3\xc2\x64\x2c\x7d\x6c\x4c\xe1\xd5\x41\xf2\x3d\
+\xd3\x69\x87\xac\xfc\xad\x50\xb5\xab\x16\xee\xfa\xc5\x1f\xb0\x0a\
+\xc0\xae\xc1\x64\x4b\xab\x4b\xac\x86\x99\x95\xa2\x58\x54\xf3\xc2\
+\x12\xbe\x91\x66\x1d\xef\x95\x5e\xef\xe1\xc1\x9b\x00\x90\x8c\xd2\
+\xf9\x12\x35\x1b\x4f\x4b\x95\x4f\x59\x49\xf7\xd1\xcd\xab\xc5\x2b\
+\x39\x2e\x2c\xed\xf5\xf7\x69\xdc\x4f\x19\x8c\x16\x82\x76\xcc\x00\
+\x80\x79\x8e\x99\xc7\xf5\xb8\xfe\x97\x5a\xc2\xe6\x17\x12\x88\xc6\
+\x07\x50\x0d\xc7\x26\xbf\xcc\x9e\x51\x61\x12\x9c\x46\x66\xae\x48\
+\x18\xf8\x6e\xdc\x82\x88\xd1\xbf\xb0\x94\x7c\xe8\x8d\x8d\xaf\x0a\
+\x84\x9b\xa0\x31\x66\x68\x06\xdd\xa0\xeb\xf4\x80\x15\x00\x38\xb9\
+\x6e\x79\x74\xa3\x52\x54\x1b\x69\xd2\xa6\x3f\x20\x9a\x77\x28\x91\
+\x28\xd6\x27\x15\x13\xd1\x24\x16\xcd\x7d\xe9\xc9\x69\x8e\x48\xd7\
+\x60\xe3\x3a\xc9\xfc\x8a\xbe\xda\xfa\xcd\x95\x96\xef\x47\x92\x9b\
+\xfe\xa8\x14\xb8\xff\xf1\xe7\x60\xd9\xda\x8d\x30\xfd\xcb\xc5\x30\
+\xfa\xdc\x4b\x84\x1b\xa7\x86\x99\x17\x8e\x70\x29\x9a\xf0\xdd\x4c\
+\xc2\x9b\xf0\xf0\x93\xc2\xf0\xc5\x9c\x15\x18\xf8\x6b\xa9\x81\x4c\
+\x6d\x23\xec\x24\xc1\x20\x8f\x04\x7f\x5a\x7e\xcf\xc9\xdf\x02\xb9\
+\x74\x4c\x8e\x04\xde\x1c\x12\x84\x29\x81\x0e\x0d\x82\xb8\x49\x50\
+\x46\x4e\x01\x5b\x1c\x04\xd0\x6a\x00\x7a\x04\x64\xe6\x08\x8b\x81\
+\x02\xda\x2e\x58\xbd\x31\x13\x3e\xfe\x62\x3e\x7c\xf4\xf9\x6c\xf8\
+\xf7\x67\xb3\xe0\xfd\x4f\xbf\x82\x77\x67\x7c\x09\xff\xfa\xf7\xe7\
+\x70\xf1\xf7\xee\x44\x71\x1f\x1c\x41\x53\x98\xaa\x24\x55\x32\x8c\
+\x4f\x98\x00\x77\xfe\xec\x71\xf2\xb7\x04\x50\x6c\x2e\x84\xb4\xec\
+\x42\xc8\x2d\x2c\x43\xe2\x9a\xae\xbd\x4f\x01\x40\x67\x67\x37\x2f\
+\xf1\xeb\x23\x7a\xed\xb8\x5a\xdb\xda\x4d\x32\x1e\x0f\xce\x8d\x24\
+\x58\xd3\x20\x5c\x8f\x2e\x7a\x4d\xb0\x62\x6d\x1a\xb2\xe3\xf5\xb2\
+\x7d\x44\x3f\xbf\x59\x08\xfa\x42\xe0\x6f\x11\xfa\xfa\x54\x73\xdf\
+\x2c\xf1\xb3\xde\x3e\x56\x54\x8c\xd5\xc2\x4a\xfe\x4d\x2d\x46\xe6\
+\x5f\xdf\xc0\xca\xff\xb5\x24\xfb\xa7\x6b\x17\x09\xc2\x94\x07\x40\
+\x9d\x0c\x5f\x7b\xfb\x33\x0e\xee\x35\xe4\x74\x3c\xf7\xc2\x1b\x48\
+\x8a\x3c\x7c\xf8\x30\x1c\x3d\x7a\x04\xbe\xf9\xf6\x1b\x9c\x98\xa4\
+\x13\x13\x2b\x56\x6d\x84\x53\xcf\xbe\x88\x7c\xcf\x53\x10\x08\x24\
+\x9d\x79\x01\xbc\xf7\xf1\x1c\x34\x77\xa2\x2d\x03\x3a\x29\x50\x44\
+\x40\xce\xee\x3d\x07\xb0\xd5\x40\x8d\x88\x4a\x10\x1c\xb0\xf1\x43\
+\x2a\x92\x44\xa5\x92\x53\x2f\xfd\x11\x53\x68\xe4\x00\x20\x96\x0a\
+\x40\x9c\x2c\xf0\x07\xcc\x4a\x1b\x92\x6c\xf5\x96\xe0\x88\x20\x92\
+\x54\x2f\xb8\xe2\x36\x28\xdf\xbe\x1f\xca\xab\xf7\xc3\x65\xd7\xdf\
+\x63\x96\x77\x9d\xde\x23\x29\x1c\x7b\x00\xe6\xc0\xc3\x6f\x8c\x40\
+\x5b\xcd\xbd\xa2\x07\x75\x99\x9f\x4a\xff\x7a\xd8\x7e\x19\xe9\x97\
+\x57\x29\x22\x85\xda\x54\x5b\xeb\xc3\xce\x45\x08\x3b\x94\xb9\x63\
+\x55\x1c\x1d\xb8\x6c\xde\xdd\x1b\xa1\x0f\x40\x6a\x50\x27\x0f\x34\
+\x87\x6a\x86\x2e\xb9\xcf\xbe\x73\x04\x00\xfd\x01\x01\xac\xec\x6a\
+\x92\xde\xa2\xb7\x00\x42\x86\x7b\x93\x59\x05\x08\x1a\xd9\xb5\x5f\
+\xb1\x4e\x06\x38\x6b\x04\x98\x6a\x59\xce\x0c\x5a\xcd\x03\x00\x90\
+\x05\x3e\x61\xa4\xd0\x32\x6e\xa3\x5a\x46\x0e\x4d\xc5\x3f\x2f\xa0\
+\x22\x5a\xf9\x5f\x8b\x22\x21\x2c\x6b\x01\x04\x85\xd6\x06\x0f\x8a\
+\x62\x76\x93\x28\x58\xf5\x26\x86\x05\x96\xaa\xdb\xbe\x0c\x90\x3a\
+\xa0\xe2\x5e\x01\x30\xed\x3c\x79\x15\x40\x07\x0b\x49\x6c\x8e\xff\
+\xfa\x1f\x3f\x08\x4b\xd7\xa4\xc3\xfc\xaf\xd7\xc1\xb8\x94\x1b\xc1\
+\x3f\x6a\x32\x9b\xc7\xd6\xfb\xae\x28\xfb\x19\xc6\x2a\x91\x39\xe3\
+\x3f\x11\x46\x8c\x0a\xc1\x57\xf3\x57\xe2\x0c\x38\x15\x8b\x39\x40\
+\x32\xff\xed\x24\x33\xa4\x65\xff\x7c\x12\x80\xe8\x96\x02\x01\x06\
+\x06\x4a\xb0\x0c\x4f\x83\x13\xcd\xc2\xa9\x31\x90\xee\x14\x98\xc9\
+\x81\x00\x02\x00\x3a\x25\x80\xdc\x00\x66\x1b\xac\x2f\xfa\x1c\x25\
+\x00\x7e\x32\x6b\x01\x4c\xff\x7c\x0e\xc9\xfe\x67\x63\xf0\x7f\xff\
+\x93\xaf\xe0\x9d\x8f\x67\xc1\x5b\xd3\xbf\x84\xb7\x3f\x9a\x05\x77\
+\xdc\xf7\x5b\xb2\xdf\xba\x9c\xf1\x24\xae\xfa\x37\x0e\x86\x0c\x1f\
+\x03\xe7\x4c\xb8\x1c\xde\x99\x3e\x87\x00\x80\x62\x48\xcb\x29\x86\
+\x74\xb2\xf2\x4b\x2a\x70\x8c\xad\x43\x27\xfb\x71\x10\x60\x94\xfb\
+\x79\xb9\x1e\x03\x74\x0b\x2b\xf7\xb3\xcc\x9b\x65\xfe\xf5\x08\x7c\
+\x9a\xc9\xe7\xad\x80\x4f\x08\x30\xd1\x5b\x03\x98\xfd\xeb\x40\x80\
+\xfe\xdc\xcc\xc6\xf5\x74\x66\x7f\x4b\xb3\x9e\xf1\x9b\xbd\x7d\x3d\
+\xf3\x67\x81\xde\xdc\xd2\xf7\x64\xef\xcb\xdf\x93\xca\xf4\x72\x00\
+\x80\xc1\x9f\xb6\x00\xea\x5b\x50\xa2\xb9\xa6\xae\x05\x0a\x8a\xcb\
+\xb0\x02\x90\x91\xb3\x05\x46\x8c\x0e\x23\x19\x90\x02\xa3\x11\xa3\
+\x83\x50\x48\xf6\xf3\xc8\xd1\xa3\x18\xfc\x51\x33\x81\x2c\x5d\x3b\
+\xa1\xa4\x6c\x2b\x8c\x51\xbf\x8f\x7c\x10\x1f\x39\x37\x4e\x1c\x15\
+\x86\x27\x9e\x7d\x0d\x4a\x2b\x76\x90\xff\xab\x42\x4f\x84\x5c\x5d\
+\x04\xa9\x90\x09\x21\xe5\x10\x20\x95\x4d\x80\xde\xe6\x82\x72\x98\
+\xbb\x64\x3d\x9c\x39\xfe\x0a\x81\x03\xa0\x19\x36\xc1\xf1\x49\xb1\
+\x56\x02\xec\x20\x40\x3c\xe7\x83\xa6\x68\x15\x01\x36\xf7\x3d\xf8\
+\x0c\x6c\x27\xc0\xa7\x80\xec\xe7\xd8\xf0\xb5\xa6\xca\x65\xc4\xf5\
+\x90\x6c\x11\x20\x8a\x1e\x44\xc2\x96\x31\x40\x2b\x29\x38\x56\x49\
+\xf1\x81\x03\x00\x91\xe2\x69\x21\x6b\xe5\xd1\x4d\xdc\x2d\xa2\xea\
+\x11\xf6\x30\xf2\xe6\x51\x61\x54\x39\x36\x04\x40\x67\x73\x38\xa7\
+\x31\x4e\x31\xf8\x6b\x83\x00\x66\x34\xcb\x3e\x5a\xb9\x0f\xb6\x16\
+\x80\x3b\x00\xf0\x6a\x6e\xe3\x90\x09\x06\xac\xff\x8f\x1a\xef\xba\
+\x3d\xa7\x65\xf4\xcf\x5a\xa6\xf7\x27\xc6\x62\xd2\xe3\x10\x6c\x15\
+\x97\xff\x17\xcb\xe6\xa2\x8a\x14\x2a\x77\xc9\xf6\xcd\xfa\xda\x7e\
+\xc5\x3a\xb6\xa8\x03\x06\xbf\xa2\xba\xbc\xaf\xac\xe4\x1f\x74\x70\
+\x2b\xd4\xd1\x9a\x69\x6f\x69\x6a\x94\x5b\x89\x87\xf4\x39\xda\x03\
+\x8f\x97\x90\x9a\x9c\x45\x30\xb4\x28\xa3\x90\xfd\xe8\xbd\xf1\xf7\
+\x8b\x77\x2a\xb5\x26\x86\x85\x6c\x81\x57\x4c\xf4\xf1\x47\xf2\xff\
+\x13\xa6\xdc\x08\x0b\x56\xac\x47\xb7\xbc\xcb\x6f\xb8\x17\xe2\x47\
+\x4d\x61\x00\x20\x89\xb3\xb0\x6d\x7a\xeb\x7e\x9e\xfd\x8f\x18\x1d\
+\x82\x59\xf3\x57\x93\xc0\xdf\x00\xfb\x6a\xea\xc8\xb6\x0e\x7d\xeb\
+\xf3\x8b\xca\x90\xf4\x47\x83\x10\x95\xcb\xa5\x8f\x0b\x28\x10\x28\
+\x2c\x35\x7a\xf1\xd9\xbc\x25\x60\xda\x05\xb3\xc5\xaa\x01\xf9\xa6\
+\x65\xb0\xb8\x08\x08\xf8\x7c\xce\x62\x98\xfe\xc5\x5c\x9e\xfd\xcf\
+\x86\x0f\x48\xf0\x7f\x8f\x02\x80\x19\xb3\xe0\xed\x8f\xbf\x80\xb7\
+\x09\x08\x78\xf7\xe3\xaf\xe0\xb1\xa7\x5e\x81\xc0\xe9\x93\x4d\x31\
+\x22\x85\x29\xe3\x0d\x19\x3e\x1e\xb5\x09\x68\x35\x60\x55\x5a\x3e\
+\x64\xe4\x6d\x81\x4c\x6a\x4e\x44\x16\x2d\xe1\xef\xe7\x40\x80\x4e\
+\x01\xb4\xf3\x59\x7d\x9d\x98\x47\xcb\xf0\x0d\x4d\x24\xdb\xa7\x41\
+\xb8\x81\x6d\xeb\x78\xd6\x4d\xe7\xfe\x8b\xcb\xb7\xc3\x53\x7f\xf9\
+\x07\xec\xd8\x53\xc3\xec\x73\x79\xa0\x37\x33\xfe\xc8\x56\x80\x5e\
+\xf6\x67\x5c\x82\x36\xde\xe3\xa7\xbd\x7d\xd6\xdf\xd7\x17\x65\xf8\
+\x37\xe8\x01\x9f\xbe\x6f\x23\x0f\xfa\x74\x35\xf0\xc0\xaf\x2f\xb2\
+\x3f\x74\x3c\x91\x72\x01\x36\x93\xc0\x7c\xcd\x4d\x3f\x47\xd7\x44\
+\x94\x3a\x26\xc7\x22\xe9\xb4\x54\xf8\xed\x1f\x5f\x82\x95\xab\xd3\
+\x60\x17\xc9\xe4\x29\xcf\xe1\xd0\xe1\xa3\x70\xf4\x1b\x20\xeb\x5b\
+\xd4\x6c\x08\x4e\xbe\x85\x73\x43\x28\xb1\x53\x83\x5b\x7f\xf2\x30\
+\xf9\xde\xca\x49\xa6\xbf\x0d\xf2\x8a\xab\x60\x43\x46\x21\xcc\x5e\
+\xb8\x0a\x5e\x7f\xe7\x13\xd4\x1c\xb8\x79\xda\xaf\x61\xac\x7a\x15\
+\x39\x37\x98\xf4\x33\x5e\x27\x86\x03\x60\x0a\x9f\x34\x09\x1b\x2a\
+\x81\xb1\x2f\xfd\xde\x26\x06\x04\x95\xb1\xff\xb9\xbf\xc3\xdf\xdf\
+\x98\x01\xd5\xe4\xd8\xaf\xda\x90\x07\xca\xa9\x29\xe6\x4d\x58\x07\
+\x0f\x49\x56\x3e\x00\x02\xe6\x80\x16\xe1\x9a\xe9\x77\xd0\x3f\xd1\
+\x03\xbe\x5f\x5a\xd5\x74\x02\x12\xe1\x28\x32\xed\x21\x6f\x00\xc4\
+\x91\x6c\x2d\xd3\x17\x50\x6d\x3c\x24\x2f\xd5\x09\x2f\xa5\xfe\xb0\
+\x94\xd8\x67\xd1\xe4\xb7\x91\xeb\xfc\x62\xf2\x68\xb9\x07\x79\xd5\
+\x42\xd0\x8c\x51\x6d\xbf\x11\x0b\x98\xde\x4b\x5f\xa7\xaa\xfc\x83\
+\x54\xcd\x30\x81\x65\x58\x5e\x09\xb0\x02\x80\xbe\xda\xd8\x86\xa3\
+\xa0\x48\xeb\x6b\x9b\x73\xb5\xba\x50\x86\x66\x1d\x03\x4c\x0c\x46\
+\x09\xa0\x41\x29\x77\x20\xce\x22\xb8\x23\xa0\xcf\x44\x93\xfd\x6b\
+\x96\x3e\x34\xf3\xc0\xd8\xb4\xa4\x31\x78\x09\x68\x35\x62\xec\x2f\
+\xd1\x2e\xf3\xab\x5a\xf5\x02\x5c\x33\x7f\xd5\xc5\x36\x33\x1a\x01\
+\xc8\xe4\x1b\xf8\x2d\x72\xc8\x41\x43\x6b\x40\x36\x5f\x2f\xef\xf9\
+\x39\x71\x0f\x06\x66\x46\xd7\x60\x59\x5b\x2e\x50\x31\xe3\x11\x10\
+\xaa\x31\x2b\xcc\xf8\x18\xa3\xce\xbe\x00\x66\x7c\xb5\x08\x83\xff\
+\x5d\x3f\x7f\x82\x3b\xbb\x4d\x61\x37\xff\x00\x1f\xeb\x4b\x4a\x36\
+\xfa\xb2\x0c\x18\x05\x61\xd8\x48\x0d\xbe\x9c\xbb\x12\x95\xe0\x0e\
+\x1c\x10\x82\x3f\x0d\xfc\x25\xe5\x50\x48\xf5\xf2\x8b\xd9\xca\xa7\
+\xba\xf9\xd4\x56\xb7\x70\x8b\x51\x05\xc8\xc1\x51\x35\xd6\x0a\xc8\
+\xce\x67\xae\x81\xc8\x0b\xc8\x65\x36\xc2\xe9\x3a\x2f\x80\x03\x01\
+\xda\x16\x98\xb7\x78\x39\x0f\xfe\x64\x7d\x36\x07\x3e\x20\x00\x80\
+\x06\xff\x77\x67\xb0\x0a\xc0\x3b\x1f\x7f\x89\xeb\x2d\x02\x04\xde\
+\xfc\xe8\x0b\x78\xe9\xf5\x8f\x20\x7c\xe1\xcd\x70\x3c\xc9\xfc\x69\
+\xf0\x8f\xe3\x4e\x7f\x71\xdc\x47\xe0\x94\xf3\x2e\x81\x3f\xbd\xf4\
+\x0e\x64\xe4\x6e\x21\x00\xa0\x14\x17\xad\x4c\x50\x99\xdf\x1d\x7b\
+\x0e\x20\x7b\x9f\x66\xff\x34\x48\xd3\x92\x3b\x2b\xb7\x37\x23\xd9\
+\xae\x96\x1b\x22\xd5\x60\xf0\x6f\x82\xfd\xb5\x8d\x50\x5e\xb9\x13\
+\xfe\xf5\xee\x27\xf0\xc1\x8c\xd9\xf8\xbb\x34\xb0\x9b\x15\x80\x36\
+\x14\xed\xd1\x4b\xfd\x66\x8f\x9f\x07\x7f\xa3\xbf\xdf\x8c\x7d\xfa\
+\x46\x1e\xf0\x1b\x1a\xe8\x7b\x9a\x81\x1f\x81\x07\xcd\xf8\x1b\x18\
+\xf0\xa8\x15\x02\x3f\x75\x68\xac\xa9\x63\xfb\x43\x47\xf5\x36\xf3\
+\x63\xfa\xec\x4b\x6f\xc3\x77\x87\x8f\x47\x30\x84\x2d\x35\x1a\x84\
+\x47\x26\xc3\xd0\x91\x21\x6c\xdf\x8c\x3a\x63\x0a\x9c\x7e\xde\xc5\
+\x70\x36\xc9\xdc\xcf\x1c\x77\x19\xda\xef\x8e\x38\x69\xb2\xd9\x1e\
+\xa2\x53\x22\xe4\x7c\xa5\xbd\xfd\x29\x97\xde\x02\xa7\x9d\x3b\x15\
+\x4e\x08\x90\x63\x39\xec\x3c\xf8\xce\x89\xe7\xc2\x77\xc9\x0a\x9c\
+\xaa\xc1\xcf\x1f\x7c\x0a\x9e\x7d\xf1\x1d\xac\x92\xe9\x8a\x7c\x18\
+\xf4\x03\xba\x45\xb0\x5e\x05\x48\xf6\x4e\x06\x4c\x0c\x09\x42\x42\
+\xbc\x9a\xa9\xd8\xbc\x4a\x38\xe1\xf0\xc4\xd1\xe4\x9c\x5c\xb8\x9a\
+\x80\x80\x3a\xf8\xd7\xfb\x5f\x30\x45\x42\x1d\x3c\x24\x0a\x6d\x04\
+\xa9\x8b\x60\x2c\xa3\xd6\xaa\xd1\x6b\xb7\x6c\x3d\xb5\x00\x9c\xee\
+\x57\x9a\xe7\x1e\xb6\x58\xe6\x37\x09\x89\x5a\x64\x49\x5f\xb0\x45\
+\xc6\x63\x96\xd0\x5f\x7f\x81\x64\xef\x7d\x7b\x45\x24\x75\x6b\x52\
+\x00\xe0\xe5\x33\xfb\x05\x51\x3a\xbf\x60\x46\x64\x9c\x5f\x7c\x02\
+\x22\x16\xd7\x54\xff\x80\x95\xfc\x35\x70\xb2\x5e\x77\x3a\xc7\x0c\
+\x00\xe0\x1b\x90\x1d\x50\x3d\xa0\x92\x90\x60\xfc\x22\xf6\x6f\x85\
+\xc0\xaa\xd8\xb2\x62\x4b\x19\x29\xe8\x81\x35\x6f\x63\xd6\x5a\x46\
+\xff\xac\x2c\x59\xfc\xc2\x92\x74\x32\x4e\x58\x78\xbf\xa0\x40\x60\
+\xb1\x09\xfb\x28\xa2\xc7\xb7\xd7\x9e\xbe\xd3\x9c\x7f\x14\x7e\x83\
+\x22\x11\x77\xe0\x02\x23\x22\x19\xd0\xd4\x14\x97\x7d\xd9\x9a\x44\
+\xa3\x3c\x64\xd5\x2e\x0f\x0c\x0c\x00\xf0\xb9\xf5\x08\x75\x40\x22\
+\x8c\xc7\xe9\xde\xeb\xb4\x74\x1a\x9f\x14\x84\x57\xde\xfc\x18\x16\
+\xaf\x5a\x07\xbf\x7f\xf6\x55\xb4\xce\xa5\x64\x40\x3f\x01\x00\x2c\
+\x6b\x4b\xe1\x16\xac\xba\x1e\x3e\xb3\x62\x1d\x9a\xa4\xc2\xc7\x9f\
+\x2d\x22\xc1\x86\x06\xbe\x06\x2c\xfd\xef\x24\x99\x64\x41\x71\x05\
+\x09\xfe\x5b\xa1\xa8\xa4\x02\x7b\xc5\x34\xf8\x17\x91\x55\x58\x5c\
+\x6e\x54\x02\x72\x79\x15\x80\x02\x81\xcd\xf9\x45\x7c\x66\xbd\x08\
+\x47\xd7\xe8\xe3\x2c\xce\x0d\xc8\xe4\x6d\x81\xcc\x6c\xc6\x0d\x58\
+\xb1\x2e\x0d\xcb\xfe\xd3\x67\xce\x83\x8f\x66\xce\x85\x0f\x3f\x9b\
+\x8b\x15\x80\xf7\x3f\x9d\x43\x40\xc0\x6c\x0b\x08\x78\xeb\xa3\x99\
+\xf0\xe6\x87\x9f\xc3\x1b\xff\x9e\x49\xd6\xe7\x70\xcf\xaf\xfe\x80\
+\xa5\x6f\x34\x11\xa2\x4e\x7f\x34\x63\xc4\x2a\x08\x3d\x17\x35\x98\
+\x90\x7a\x03\xbc\xf1\xde\x97\xa8\xf3\x4f\x2d\x8c\x37\xd1\xd6\x40\
+\x6e\x01\x64\x92\xfd\xa1\xfa\xfa\x7b\x6b\xeb\x58\x00\x26\xc1\x95\
+\x9a\xe1\x88\x81\x7f\x5f\x2d\x59\x35\xcc\xd7\xa0\xaa\x7a\x2f\xac\
+\xdc\xb0\x19\x6e\xba\xed\x17\x50\xb1\x6d\x37\x96\xfc\x5b\x05\x12\
+\x20\x02\x00\x3d\xf8\xa3\xa3\x5e\x8b\x40\xea\x63\x59\x7f\x43\x63\
+\xab\xd1\x5e\xc0\x72\xbf\x01\x00\x58\xf0\x37\x03\x3e\x6b\x3b\xb0\
+\x7d\x69\xc2\x45\x01\x00\x82\x91\x3a\xb6\xcd\x29\xa0\x0a\x85\x85\
+\x04\x38\xad\x81\x33\xc7\x5e\x06\xca\x29\xe4\xbb\xa3\xd5\x2b\x54\
+\x72\x24\xdf\xe9\x28\x02\x02\x46\xa5\xe0\x3a\x81\xfb\x3a\xf8\x0d\
+\x09\xde\x54\x0c\xfe\x7e\xae\xeb\x40\xcf\x1b\x34\x76\x42\x65\x48\
+\xee\x9b\x30\xec\x7c\x02\x1a\x2e\x85\xa7\x9f\xff\x27\x56\x05\xe8\
+\x54\xc0\x5e\x02\x84\x52\x2e\xb9\x85\x65\xfa\x49\x93\xf9\xeb\x85\
+\xb9\x70\x94\x4e\xc8\x4b\x11\x00\xa5\xcb\xa8\x9e\x4c\x2a\x58\x31\
+\xfb\xdc\x7e\xbd\x0d\xaa\x57\xe5\xc8\x77\x79\xf2\xb9\x17\x91\xef\
+\x6f\x0b\x6c\x23\x20\xe0\xbe\x87\x9e\x41\xd2\xaa\xee\x0f\xe0\xaa\
+\x9c\xc9\xb3\x57\x5f\xb4\x12\xb6\xc1\x2d\x89\xe5\x1e\xae\xba\x4c\
+\x26\xc5\x60\xe1\xab\x08\x09\x49\x42\xd0\x2a\x84\x16\xa1\xab\xa2\
+\xda\x82\xb6\x16\xa5\xff\xad\x7a\xb6\xe3\xf5\xc5\x0c\x00\x54\xe1\
+\x39\xcd\xc1\x19\xd6\x79\xc6\x9e\x9a\x7a\xf9\x9c\xda\x38\x7d\x99\
+\x20\x18\x90\xe9\x04\x2d\x8a\x04\xb0\x9d\xbf\x12\x96\x55\x00\xfa\
+\xcb\x36\xd4\xa2\xcf\x72\x8a\xe8\x39\xa0\x49\xfa\x12\x6a\xc4\xd8\
+\x9a\x3f\xc2\x52\xf3\xff\xe7\xee\x3d\xc3\xe3\x28\xaf\xb7\x71\x3e\
+\xfc\xc0\xab\x95\xc1\xb6\x56\x2b\xd9\xd8\x09\x04\x08\xc6\x4d\xbb\
+\xb3\x2b\xc9\x8d\xde\x7b\x68\x01\xd3\x21\xd4\x84\x12\x4a\x02\x01\
+\x92\x00\xa1\x19\x30\x18\x6c\x5c\x70\xef\xbd\x17\xc9\x45\x96\xac\
+\x66\xb9\xca\xdd\xb2\x65\xab\x57\x37\xb9\x53\x92\xf7\x7f\x9d\xff\
+\x73\xce\x53\xe6\x99\xd9\xd9\x66\xcb\xe4\xf7\xbe\x1f\x9e\x6b\x56\
+\xab\xad\x33\xb3\x73\xee\x73\xce\x7d\xee\xdb\x08\x3f\x4b\xaa\x93\
+\xe2\x1c\x1e\xeb\x16\x12\x9d\x96\xde\xb4\xa5\xdc\x66\x68\xa4\xbb\
+\x80\xc3\xfb\x1b\x61\x10\xa3\x11\x7f\x8b\x22\x6c\xe9\xce\x01\x48\
+\x09\xb6\x30\x9f\x3b\x96\x3d\x70\xc3\x42\xfe\x71\x5b\x08\x4e\x76\
+\x32\x93\xf3\x68\x8c\x33\x63\xb6\x75\x58\xc1\x6e\x5d\x98\x42\xfb\
+\x1c\x72\x16\x95\x98\xd3\x1e\x6e\xf4\x73\x5e\x52\x77\xf8\xd3\x5f\
+\xfe\x05\x73\xb2\x56\xb1\x6c\x79\x3a\xb4\xbb\x30\xc8\x2f\xf8\xa9\
+\xbd\x95\xea\x9a\x14\xf8\x21\xb9\x5f\x05\x0c\x02\x64\x8f\x8b\xc4\
+\x34\x9a\xf3\x67\x17\x7c\x64\xfb\x63\xf9\x7c\xf3\xb6\x32\x2e\x2b\
+\x8b\x5b\xf6\x77\x29\xad\x9d\x04\x08\x36\x6d\x15\xed\x00\xb6\x36\
+\x60\xff\x78\x13\xe7\x02\xe0\x96\xdf\xe6\x4b\x01\x01\x02\x03\xa5\
+\xc4\x0f\xc0\x2a\xc0\xc4\x19\x73\x61\x0c\x66\xff\x93\x79\xf6\x3f\
+\x9a\x01\x81\x51\x58\x05\x10\x1c\x80\x11\x13\xa6\x13\x11\x10\x01\
+\xc0\x77\x63\xa7\x32\x00\xc0\x82\x3f\xae\x51\x93\xe0\x1b\xb6\x3e\
+\x1e\x34\x12\x32\xaf\xbd\x9f\xb3\xd3\x3d\xdc\x43\xc0\xe5\x45\xe7\
+\x40\x6e\x1d\x8c\x41\xea\xca\x9b\x1f\x83\xef\x27\xcc\x87\xc2\x75\
+\xdb\xa0\x80\x01\x8f\xbc\x92\x4d\xb0\xaa\x68\x1d\xac\x2c\x28\x21\
+\x50\x52\xc6\x82\x3a\x9a\x18\xd5\x37\xa3\x06\x3e\x0f\xfa\xe8\x90\
+\x58\x53\xcf\xbd\x0d\xca\xab\xea\x21\x6b\x55\x31\xfc\xfe\xd1\x3f\
+\xc1\x8c\xb9\xcb\xa1\xbe\xe1\x80\x92\xf6\x25\xc9\x5e\xc1\x23\x90\
+\x00\x40\x66\xfc\x07\x05\xa7\x40\x0f\xfe\xcd\x32\xfb\xdf\xcf\xc9\
+\x7d\x08\x38\x9a\xc5\x96\xfe\x6e\xd6\x83\xfe\x41\x0a\xfa\xf5\xb4\
+\xe5\xb7\xeb\xd8\x16\x15\x01\x0b\x51\x77\x61\x1d\xb6\x56\xb6\xb2\
+\xfd\xb8\x8d\xca\xe3\xd3\x59\x96\x3c\x6c\xcc\x4c\xaa\x90\xfc\xfd\
+\xe3\x6f\xe1\x8d\x77\xbf\x80\xe7\xfe\xfc\x3e\x3c\xfa\xdc\xdb\x70\
+\xff\xa3\x7f\x86\x5b\xee\x79\x1e\xfa\xdd\xf4\x28\xf4\xc8\xb8\x0b\
+\x3a\x74\x4e\xa7\x8a\x0f\x06\xff\xf3\xd0\x30\x09\xab\x28\xed\xbb\
+\x42\xa0\xdf\x1d\x30\x74\xf8\x64\xd8\xba\x73\x1f\x81\x1d\x9c\x08\
+\x40\x43\x24\x24\x54\x6e\xd9\x51\x0e\x5d\x58\x20\x76\x0b\xbf\x08\
+\xaa\x20\xd0\xb9\x24\xd5\x23\x05\x00\x48\x49\x8f\xb9\xf4\xaf\x2e\
+\xfc\x52\x4f\xc0\x62\x27\xcc\xff\xa6\xd7\x67\xef\xd7\xef\x86\x01\
+\x50\x56\x59\x0f\x3b\x2b\xea\x20\xf3\xea\x07\x48\x13\x20\x41\xe3\
+\x03\x58\x4b\xb6\xd2\xd2\x56\x80\x7c\x75\xb1\x0e\x86\xcd\xe0\xf5\
+\x29\x20\x97\xd7\x6f\x56\x04\x4e\xab\xa4\x6c\x38\xc8\xa6\x1b\x31\
+\xfc\xce\x75\x0e\x98\xe1\x00\x34\x9c\xb4\x0d\x8c\x28\xe5\x7f\x23\
+\xb2\xa8\x9b\xfa\xce\xa7\x33\x96\x6e\x38\x2a\xbf\x3a\x05\xd9\x90\
+\x38\xa6\xb7\x65\xd5\xb5\x36\xdd\xaa\x2c\x99\xdc\x5a\xc6\x42\xfe\
+\x18\xdb\x25\x81\x18\x01\x40\xba\x45\x5a\xff\x1c\x97\xa7\xb5\x74\
+\xe0\xfd\x71\x7c\x98\x80\x69\x88\x61\xe9\xbf\x47\x52\x13\x74\x2a\
+\x55\xdb\xc8\x85\xd4\xdf\xb3\x06\x2f\x97\x3d\xa0\x79\x43\x7b\x24\
+\x56\x53\x09\xa7\x13\xc4\x49\x6c\xc3\x49\x3e\xd8\x50\x3d\x3c\x2b\
+\xc3\x3e\x86\x69\x83\x88\x13\x0e\x5a\xd9\xc9\xd2\xdf\xf2\xab\x12\
+\xba\xcc\xe2\xcd\xf7\x35\xf7\xb7\x44\xac\xf6\x1f\x7d\x78\x44\x19\
+\xbb\x12\x99\x5e\xa5\x70\xa9\xd6\x4a\xc0\xd1\xa0\x43\x6a\xf3\xbb\
+\x93\xcd\xd1\x29\xd9\x13\xbf\xee\x8e\xc7\x60\xf6\xd2\x1c\x98\xb6\
+\x60\x39\x5c\xd2\xeb\x06\x9e\x45\xa9\x8c\x3f\x43\x88\x03\x09\x81\
+\x9f\x14\x0c\x92\x7d\x08\x08\xbc\xc9\x82\xc5\x21\x16\xc8\x88\x85\
+\xce\xb2\xd0\x06\x16\x00\x91\x1c\x86\x8a\x7b\xb4\x76\xec\x86\xad\
+\x74\xbb\x4c\x00\x82\x32\xaa\x06\x20\x18\xc0\xd6\x00\x02\x81\x0d\
+\x0c\x04\x60\xe9\x9f\x2a\x01\xa5\x1c\x0c\xc8\xb6\x00\x27\x09\x6e\
+\x86\x92\x4d\x5b\x38\x18\x60\x8f\x5b\xb8\x6c\x25\x8c\x9f\x66\x02\
+\x00\x1a\xfd\x13\x2d\x80\xef\xa9\x0a\x30\x1d\x46\x8e\xe7\x00\x00\
+\x39\x00\xdf\x8d\x9d\x02\x43\xc7\x4c\xe1\x55\x00\x06\x02\xbe\xa1\
+\x4a\xc0\x44\xaa\x08\xfc\xf9\x6f\x9f\xc2\xa5\xbd\x6e\xe2\xc7\x4d\
+\x7a\xcb\xa7\x08\x70\x83\xa3\x90\x2c\x1b\xbe\xfa\x96\xc7\x60\xc4\
+\xb8\xd9\x90\xb7\xa6\x14\x72\x0a\xd7\xc1\xf2\xfc\x35\xb0\x2c\xbf\
+\x98\x65\xf7\xc5\x90\x53\xb0\x16\x36\xb0\xef\x51\x8e\xde\x06\x75\
+\xcd\x50\x5d\x8f\x6b\x3f\x54\xd5\x35\x91\x34\xf0\xd2\x9c\x02\x18\
+\x3a\x6a\x3a\xdc\x7c\xf7\xd3\x50\xba\xbd\x5c\x08\x00\x9d\xa0\xad\
+\xce\xf4\x3f\x28\x2a\x00\x07\x04\xb1\xaf\x59\x12\x0b\x0f\x70\x3d\
+\x81\xfd\x62\x49\x66\xbf\x5c\x18\xf0\xeb\x45\xe0\xc7\x6d\x7d\xf3\
+\x21\x6b\xf0\x6f\x42\xb7\xbe\x43\xd4\xc2\xc0\xe0\x8f\xf2\xc4\xc8\
+\xab\xc0\x16\xcb\x5a\xe4\x5f\x6c\xda\x41\x8b\x9b\x19\x6d\xa7\xfd\
+\x8f\xd3\x10\x28\x21\xbc\x61\x0b\xe7\x6e\x6c\xdc\xc2\x89\x7e\xc5\
+\x1b\x77\xc0\x92\x9c\x35\xf0\xbb\x87\xfe\x48\x2d\x94\xf3\xda\x33\
+\x00\xd0\xa1\x2b\x3c\xf1\xdc\x5b\xb0\x67\x6f\x0d\x69\x2a\xa0\x9b\
+\xe3\x1e\xb6\xca\x2b\x6b\xa9\x0a\x84\x22\x4b\x3f\xfc\xf4\x1f\x28\
+\x2c\xde\x04\x9d\x2e\xe9\x27\x40\x80\x34\xf8\x09\x88\xca\x40\xba\
+\x00\x5d\xe9\x21\x63\x7a\xce\xc1\x5f\xbb\xe8\x53\x15\xd1\xcf\x85\
+\xa9\x64\x40\x4e\xf1\x9b\xe0\xa2\x63\x26\x8d\xb3\xbe\xf2\xf6\x27\
+\x50\xc1\x8e\xc9\xea\x92\xad\x90\x72\x71\x3f\x61\x3e\x14\x39\xc3\
+\x73\xfe\x7d\x1a\xd6\xaa\x9d\x27\x1c\x91\x97\xff\xce\x5c\x1e\x23\
+\x46\x73\x1e\x03\x62\x97\x04\x8e\xb1\x5d\xac\x94\x17\xc3\x55\x67\
+\x0d\x87\x7e\x7f\x30\x82\x9a\xac\xc6\x81\x0a\xfb\x19\x22\x11\xd1\
+\x03\x36\xfd\x97\x58\x46\x2f\x83\x0e\xea\x86\x01\xb3\xfc\x1f\xa1\
+\x62\x14\x5f\xec\x8c\x57\x55\x37\xbe\xaa\x81\x7e\x0e\xeb\x80\xe9\
+\x9c\xd6\x1b\x39\xf0\xc7\xf8\x81\x02\x1a\x52\x12\x44\x31\x4f\x34\
+\xbf\xfa\x70\x3b\x40\x77\xd6\xd2\x8d\x36\x62\xb5\x27\x76\x1a\x41\
+\xf1\xd9\xd0\xaa\x3f\x82\x90\x8e\x93\xad\xaf\x0c\xbe\xf1\x88\xfc\
+\x04\xa2\x80\x80\x68\x15\x17\x43\x2b\xe3\xc7\x33\xfe\x13\x70\x9e\
+\xb1\xf5\xfa\xe2\xd4\x07\x37\x94\xb4\xa4\x65\x1e\xd8\x9e\xdd\x68\
+\xa4\x14\x02\x00\xc4\x98\xee\x09\xbf\xba\xe2\x2a\x98\x3c\x67\x29\
+\xcc\x59\xb2\x0a\xae\xb9\xf5\x31\xb2\xee\xe5\xbd\x61\x31\xe7\x2f\
+\x91\x2b\x05\xc7\x3e\x7c\x2c\x2c\x35\x13\x06\x3c\xf5\x06\x09\xdd\
+\xb4\x1c\xe1\x41\x0c\x67\xfd\x77\xed\xda\x4b\x26\x32\x38\x0a\x26\
+\x17\x82\x00\x0c\xfc\xb4\xdd\xc1\x00\x00\xbb\x5d\x2a\x41\xc0\x36\
+\xde\x0e\xc0\xc0\xbe\x41\x04\xa0\x75\x14\x98\xb6\x6a\xdb\x2d\xa2\
+\x22\xb0\x85\x34\x02\x26\xcd\x9c\x0f\xe3\x67\xcc\x83\x71\x53\xe7\
+\xc0\x98\x29\x73\x60\xf4\x94\xd9\x30\x6a\xf2\x2c\x5e\x01\x98\xc4\
+\x27\x01\xb0\x02\x30\x42\x55\x00\x38\x00\x18\x3a\x06\xb9\x00\x58\
+\x09\x98\x44\x15\x01\x6c\x0d\x7c\xc7\xd6\xd0\xef\x79\x5b\xa0\xe3\
+\x6f\xaf\xe6\x1c\x87\xd4\xde\xa2\xfa\xd1\x87\xc0\x00\x06\x93\xb6\
+\xde\x34\xc8\xbc\xe6\x5e\xf8\xe8\xcb\xef\x21\x2b\xb7\x04\xb2\xf3\
+\xd6\xb0\x6d\x31\x64\xe5\x14\xc1\xd2\x55\x85\x2c\x30\x16\x42\x5e\
+\xd1\x06\xf6\x9d\xca\x60\x2f\x0b\x7c\x08\x00\x70\x2d\xcf\x2d\x82\
+\x95\xf9\xeb\xa1\xf3\x65\xfd\x61\xca\xac\x65\x14\x20\x5b\x84\xa3\
+\x9f\xd9\xf7\x17\xd9\xff\x41\xae\x21\x40\x99\xbe\xea\xf1\xb7\x10\
+\xbf\x80\x2f\xb3\xc4\xdf\xa0\x97\xf8\xf7\xf3\x0c\xbf\x41\x05\x7d\
+\xde\x8a\xa9\x6b\xe4\x0b\x2b\x13\x68\xd8\x53\x51\xdd\x40\x92\xc4\
+\x34\xa7\xcf\x16\x66\xe9\x68\x94\x84\x12\xbf\x3b\x77\x57\xc0\xb6\
+\xb2\xbd\xa4\xff\xbf\x75\xa7\x3c\x4e\xbb\x19\x68\xe1\x1c\x0e\x74\
+\x38\x2c\x66\xfb\x3f\x1f\x0d\x8e\xd6\x6e\x61\xa0\x66\x06\x74\xf5\
+\xdf\x04\xe7\xb2\xec\xbf\x4d\x52\x57\x18\xf8\xf5\x68\xf6\x7a\xf8\
+\x9a\x18\xfc\x19\x18\x60\xaf\x8f\xa0\x03\x81\xce\x8f\x3f\xfd\x4c\
+\xee\x8b\xab\x8b\x36\x42\xa7\xcb\xae\x62\xe7\x4e\x6f\x61\x1a\x65\
+\xf2\x00\x12\x05\xaf\x24\x34\xf8\x1b\xb6\xdb\xb6\x2a\x5b\x72\xd0\
+\x3a\x52\x2b\x15\x2a\x09\x00\x64\x12\x79\x35\xb1\x63\x5f\x38\xbf\
+\x73\x06\x4c\x9c\xb1\x18\xf6\xd6\x34\xc2\x57\xc3\x26\x0b\x33\x24\
+\xdb\x6f\x24\xac\x9d\xad\x1e\xf0\xd2\x6d\x89\x89\x2f\x06\x23\xb5\
+\x40\x04\x12\xf0\xd9\x1b\x43\x73\x7b\x9d\xae\x73\xd1\xc8\xc6\xc1\
+\x28\x7a\x33\xd1\xae\x71\xc1\x18\xaf\xf9\x06\x9c\x0e\xe1\x5d\xf9\
+\x3b\xe8\x46\x4f\x67\x04\x00\xe2\x01\x5b\xc1\x38\x2b\xf2\xfa\xb1\
+\x30\x6c\x15\xf7\x56\x05\x00\xce\xa8\x30\x5a\xcf\x42\x01\x01\xad\
+\xe7\x95\x60\xe9\x8d\x19\x51\xd4\xaa\x74\x47\xad\x30\x33\x8f\x8a\
+\x37\x60\xef\xf5\x04\x4c\xa3\x1e\xc7\x91\x38\x23\x02\xb7\x20\x9c\
+\x30\x85\xf6\x5a\xde\x58\x5a\x00\xb6\xfd\xe6\x89\x05\x00\xf8\xc3\
+\x93\x79\xbc\x3a\x00\x39\xd3\xe3\x68\xc4\xa9\x0f\x60\xd8\xd8\xb6\
+\xd6\xf3\x20\x51\x93\xff\xc5\x6a\x04\xd7\x34\x48\x63\xf7\xa7\xc1\
+\xa0\xef\x26\xc1\xac\x25\x2b\xe1\x0f\x2f\xbd\x07\x09\xd4\x13\xf7\
+\x99\xed\x1a\x95\x75\xa5\x53\x79\xdc\x4d\x01\x31\x03\xfa\xdd\x38\
+\x80\xca\xcf\x2d\x2d\xbc\x84\x8d\xe5\xea\xb2\xbd\x15\xb0\x13\x83\
+\x08\x82\x80\x5d\xe5\xa4\x33\x2f\x7d\xe6\x11\x08\x6c\x23\x40\x20\
+\xaa\x01\xb8\x28\xc8\xec\x22\x07\x3d\x6c\x03\x50\xc6\xb9\x59\x80\
+\x00\x5a\xdb\x68\xad\xdf\xc4\x2b\x01\x08\x06\x16\x2f\xcb\x65\x00\
+\x60\x01\x4c\x60\x00\x60\xfc\xb4\x79\x30\x76\xea\x5c\x18\x3d\x15\
+\x01\xc0\x6c\x02\x00\xa3\x26\x0a\x00\x30\x5e\x6f\x01\x4c\xa1\x60\
+\x4f\x55\x00\x76\x7b\x88\xe0\x04\xe0\x7d\xc3\xd8\xdf\xc3\xd8\xfd\
+\xc3\xd9\xe3\x90\x1f\xf0\xf0\xb3\x6f\x12\x10\x70\xcb\x36\x07\x95\
+\xa7\xfd\xd0\x86\x54\x05\x7b\x52\xaf\xbb\xcb\xe5\x7d\xe1\x0f\x7f\
+\x7a\x07\x26\xcf\xce\x86\xac\x55\x6b\x60\xc9\xca\x42\x1a\x99\x5c\
+\xbc\x32\x9f\xb6\x4b\x19\x18\xc0\x96\xc1\x8e\xf2\x4a\xc8\xc9\x5f\
+\x0b\x39\x05\xeb\xe0\xf7\x8f\xbe\x0a\xd7\xdd\xfa\x28\xfb\x1e\x3b\
+\x28\xa3\x6f\xd1\xf4\xfb\xd5\x2c\x3f\xb1\xfb\x79\xa0\x6f\xa6\x3e\
+\xff\x21\x7a\xac\xca\xf6\x0f\x98\x99\x3e\x06\xfe\xc6\xe6\x43\x66\
+\xd0\x57\xc1\xff\x00\x71\x10\xea\x9a\xb8\x35\x6f\x1d\xb5\x25\x9a\
+\x69\x55\x8b\x2d\xda\xf7\xd6\x35\xed\xa7\xc7\xc8\xd5\xd0\xc4\x9f\
+\xdf\xd0\x7c\x58\x80\x0b\xed\xfd\xb0\x85\xc0\x9e\x53\xb6\xaf\x0a\
+\xd6\xb2\xe3\x93\xbf\x7e\x13\x5b\xa5\x90\x57\xb2\x19\xfe\xfc\xd6\
+\x27\x70\x41\xa7\x34\x38\xb7\xc3\xe5\xf0\xee\xbf\xbe\xa6\xb6\xc7\
+\xbe\xea\x3a\x92\x02\x46\x00\x54\x5b\xdf\x4c\x76\xc8\x3f\xfd\xfc\
+\x33\xfc\xfb\xdf\xff\x61\x40\x6f\x3b\x5c\xd4\xed\x5a\x5e\x55\x4a\
+\x91\xba\xfe\xa6\x14\xb5\x5d\xa9\xcf\x9a\xf1\x1b\x36\x10\xa0\x3d\
+\x26\x45\xea\x9c\x08\xad\x13\xf6\x77\x5b\xac\x5e\x75\xe4\x24\xd6\
+\xc4\x4e\x7d\xa0\x4b\xd7\x6b\xa0\x68\xc3\x36\x28\xab\xa8\x87\x3b\
+\x1f\x78\xd1\x72\x0d\xb4\x7b\xb6\x5b\x2f\xf6\xe1\x48\x7a\x0e\x93\
+\x44\x12\xbc\x7b\x8d\x88\x99\xe0\x2f\x63\xc6\xe3\xd7\x4a\xeb\xd1\
+\x5b\xc6\xd1\x13\x38\x1d\xf0\x9c\xbe\x46\x89\x73\x02\x15\xb4\x94\
+\xf0\xc3\xcf\xfd\xcb\x63\x16\x8c\xaa\x23\xd1\xda\x84\xbe\x33\xff\
+\xce\x7e\x0b\x5f\xc2\xe6\x05\x70\x76\xd4\x87\xa2\x7d\x49\x57\x4c\
+\xbe\xc5\xd6\x93\xdf\xe5\x31\xc2\xce\x5d\x9a\xcf\x33\x6c\xcc\x7c\
+\x07\x50\xa1\x5b\x08\x3b\xf2\x0b\x7c\xca\xb3\x3c\x9c\x94\x65\x82\
+\x23\x99\xc7\x1f\x23\xcb\xd6\x08\x33\x8f\x6b\x84\x25\xba\x58\x67\
+\x7d\x1d\x2e\x06\x1a\xf0\x70\x2a\x33\x86\xc8\x63\x3a\x9c\xe0\x2e\
+\x8f\x61\xf3\x4a\xf0\x87\x51\xec\x92\x81\xdf\x41\x82\x38\x82\xd3\
+\x1a\xef\xa1\xf9\x29\xa0\x3d\xf3\xca\xdf\x59\xe6\xbf\x12\x3e\xfd\
+\x76\x3c\xbb\xaf\xa7\x49\x24\x92\xbd\x4d\xaf\xe9\xdc\x26\x95\x02\
+\x3b\xff\xf6\x2a\x96\x29\x56\x90\x18\x8e\x64\xb2\x63\xbf\x17\x5d\
+\xe3\x70\xa1\x5c\xec\x0e\x91\x4d\x12\x00\xd8\x29\x01\xc0\x6e\x91\
+\x5d\xca\x8a\x00\x5f\xc5\x2c\xa0\x60\x96\x49\x13\x03\x52\x2b\xa0\
+\x94\xb7\x03\xd6\x12\x08\xe0\xd5\x00\xac\x12\x4c\x99\xbd\x10\x26\
+\xcf\x5a\x08\x13\x19\x08\xc0\x2a\xc0\xd8\xe9\xf3\x18\x00\x98\x4b\
+\x93\x00\x08\x00\x28\xf8\x4f\x64\xd9\x3f\x11\x00\xe5\x24\xc0\x54\
+\x5a\xc8\x05\xc0\x35\x74\xdc\x64\x02\x05\xdf\x8d\x45\x00\x30\x89\
+\xad\xc9\x30\x9c\xd6\x14\x02\x0d\x08\x04\x1e\x7b\xfe\x2d\xe8\xdc\
+\xf5\x6a\xb1\x9f\xb8\x9c\x70\x1b\x0f\x77\x42\xc4\xf9\x79\x04\x02\
+\x89\x6c\x7f\x5d\x7d\xeb\xc3\xf0\xe1\xc0\x11\xa4\x43\xbf\x98\x05\
+\xfe\x25\xab\x8a\x18\x00\x28\x82\xac\xbc\x62\x58\xb6\x7a\x0d\xcb\
+\xfe\x51\xba\x78\x3d\x7c\x33\x62\x2a\x0b\x48\xbd\xe0\xfb\x09\xf3\
+\x68\x5f\xf0\x16\x80\x19\xfc\xf7\x53\xb0\x6f\xe1\xaa\x89\xfb\x0f\
+\xc2\x7e\x16\x78\x9b\x58\x40\x96\xc1\x5f\x66\xfd\x7a\xb0\xc7\xa0\
+\x8d\x00\x40\x0f\xe4\x98\xf1\x23\x08\xe0\x40\x60\x3f\x59\xf4\x62\
+\xd0\x47\x20\xa0\x16\x1a\x32\x35\x1e\x30\x17\x81\x85\xfd\x9c\xc0\
+\x29\x2a\x09\x0d\xa2\x8d\x20\x5f\x17\x41\x43\x8d\xe0\x38\xec\xa9\
+\xac\x85\x8d\xdb\x76\x41\xe1\x7a\xee\xe5\x30\x7f\x69\x2e\x5c\x7b\
+\xdb\xa3\x6c\x3f\x5d\x01\xaf\xbf\xf3\x19\x0b\xfe\x4d\xd4\x0a\xa9\
+\x69\x6c\x56\xef\x85\xe7\xca\xcf\x04\x02\xfe\x4d\x20\xb1\x7b\xe0\
+\x56\xe2\x02\xb8\xd4\x54\x89\xad\xd4\xaf\x32\x72\xc3\xba\x52\xb4\
+\xd6\xa5\x57\xe3\x34\xa5\xf0\xd2\x3f\x02\x80\x44\xcd\x9d\x92\x4f\
+\xb1\xb0\x85\x95\x00\xf6\x7e\xd7\xdd\xf1\x04\xec\xdc\x5b\x4b\x26\
+\x45\x38\xf5\x91\x60\x0b\x16\x76\x00\x60\x8a\xfc\x18\xb6\x60\x6f\
+\x98\xe3\xd2\xde\x78\xf4\x3c\x6c\x4e\xa7\xde\x48\x2d\x80\x20\xb4\
+\x3e\x33\xdd\x70\x10\xab\x31\xb4\x6b\x46\x30\xba\x96\x8c\x27\xd6\
+\x0a\x69\x2c\x13\x10\xa1\xd7\xac\xe8\xb3\xfe\xda\x08\x62\x94\xb1\
+\xeb\xf8\x27\x3b\x02\xca\xad\xd2\xb9\xda\x7c\xa6\xa2\x7d\xd6\x4a\
+\xed\x39\xad\x13\xcc\x03\x21\xfd\x70\xb7\xbd\x24\xac\x67\xeb\x1e\
+\x23\x82\x03\x55\x38\x82\x9c\x93\x9d\xae\x11\x21\x30\xfb\x23\x8c\
+\xdf\xc5\x6a\x0b\xec\x0f\xa3\xe4\x17\xda\x7e\x88\x5e\x52\x33\xc2\
+\x06\x7a\x77\xd8\xbe\x58\x14\x67\x43\xcb\x67\xf3\xf1\x92\x9b\xbe\
+\xd4\xbe\x0a\x9e\x86\x82\x96\x69\x1d\x9c\xe8\x09\x84\x88\x8c\x38\
+\xea\xfc\x27\x87\x82\x37\xa9\x74\xc6\x8d\x7f\x34\x96\x2d\x7b\x4c\
+\xfa\x35\xf7\xc2\xec\x25\x39\x30\x75\xde\x32\x96\x1d\x5d\x45\xf3\
+\xda\x5c\x53\x41\x93\x8b\xf6\xfa\x2c\xbd\xc4\x44\x76\x7b\xfa\xdc\
+\x65\x42\xfe\x96\xcf\xb6\x63\x96\x87\x73\xe6\x65\x7b\x2a\xc9\x64\
+\x67\xa7\x30\x8e\xd9\x81\x6b\xb7\x28\x2b\xef\x62\x00\x40\x2c\xbc\
+\xbd\x45\x80\x01\x24\x05\x62\x60\x57\x9c\x00\xea\x39\x6f\xa7\x8a\
+\xc0\xfa\xcd\xb2\x27\xcd\x2b\x01\xcb\x72\x0b\x68\xee\x7f\x32\x03\
+\x01\x13\xd9\x76\xc2\xcc\xf9\x30\x8e\x01\x80\x31\xd3\x78\x15\x00\
+\x25\x80\x47\x32\x10\x30\x7c\xe2\x34\x16\xc8\xa7\x5b\x46\x01\x31\
+\xc3\x1f\x3e\x7e\xaa\x58\xf8\x37\x82\x02\x96\xfd\x8f\xc3\xc0\x3f\
+\x89\x07\x7f\x04\x01\xf8\xf7\xf8\x29\x30\x62\x02\x8a\x08\x4d\x83\
+\xe7\x5f\xff\x10\xba\x67\xde\xc1\xad\x90\x71\x25\xf7\x22\x6b\x64\
+\xe9\x8e\xd8\x26\xa9\x3b\xbb\xdd\x03\x3a\xfe\xa6\x0f\xdc\xf3\xf0\
+\xcb\x30\x70\xc8\x58\x58\x90\x9d\x0f\x2b\x0a\xd6\xc3\x8a\xfc\x12\
+\x06\x00\xd6\xc1\xaa\xc2\xb5\xb4\xed\x74\x59\x3f\xc8\xb8\xf6\x41\
+\x12\xca\xc1\x92\xfc\x21\x09\x00\x88\xe8\x77\x90\x2b\x27\xb2\x6d\
+\x13\x81\x00\x04\x00\x07\x78\x96\xaf\x93\xfb\x9a\xac\x4b\x06\x68\
+\x15\xac\x31\xe8\x8b\x25\x6f\x4b\x00\x80\x60\x00\xdb\x01\xb5\x8d\
+\xd6\x55\x83\x8f\x95\x95\x01\x5a\x02\x48\x88\x55\x43\x8f\x69\x26\
+\x62\x63\xb5\x58\xf8\x9a\xfb\x6a\xeb\x49\xf1\x0f\x01\x1c\x8e\x4e\
+\x7e\x32\x78\x0c\x74\xb9\xa2\x1f\xbc\xf4\x97\x0f\xd9\xe3\x0f\x88\
+\x2a\x03\x07\x16\x8d\xec\xb3\x1e\x61\xe7\xcc\x4f\x3f\x31\x10\xf0\
+\x9f\xff\x50\x75\xe0\xca\x1b\x06\xa8\xfe\xbf\x24\xe5\x49\x36\x3f\
+\x27\xfd\xca\xaa\xa4\x5f\x05\x78\xe5\x25\x20\xcb\xfe\x29\x86\xd2\
+\x18\xa0\x69\x06\xd5\xb6\x12\x20\x00\xdb\x0a\x72\xa2\x01\x09\x88\
+\xec\xf9\x1f\x7e\x31\x02\x76\x55\xd4\xb0\xe3\x3c\x5b\x80\xf6\x0c\
+\xdb\xef\xc7\x6a\x12\x64\x92\xec\xac\xfe\x1f\x21\x63\xc8\x16\x63\
+\xb1\x48\xfd\x7e\xbb\xf9\x58\xb4\xf6\xa0\x71\x16\x92\x44\x23\xae\
+\xa0\x15\xfe\x3a\x7d\x3a\x5a\x25\x81\x30\x1a\x29\x91\x38\x01\x4e\
+\xc9\xa6\xa6\x72\x6a\x4b\x82\xa2\x07\xfe\xa0\x43\x2b\xfb\x4c\x2a\
+\xb7\xa7\x17\xbb\xcf\x39\x23\x92\x47\xcc\x07\x38\x34\x20\x73\xe4\
+\x1a\xee\x00\x38\x19\xf6\xf8\xc2\x06\x6f\xcb\x4e\xf3\x86\xd3\x0d\
+\x88\x65\x0e\xd6\x09\x64\xf8\x22\x04\x70\x5f\x14\xc6\xac\x11\xd3\
+\x28\x8e\xdb\xd1\xf6\x37\x7c\xef\xcb\xe5\xf1\x45\x77\x0b\x8c\xd4\
+\x6a\x88\x4a\x32\xd2\xf6\x4d\x92\x5f\x5d\x04\x1d\x9f\x2f\xfb\xa0\
+\xde\x30\x63\x52\x36\x29\x60\x2a\x4d\xb2\xad\xf7\xe2\xbe\x30\x7e\
+\xfa\x22\x98\xb7\x6c\x35\xdc\x7a\xef\x33\x44\x04\xc4\x51\x22\x97\
+\x02\x00\x86\xe9\xe1\xee\xe5\x19\x30\xae\x97\xde\xf8\x17\x37\xb4\
+\x21\xf6\xfa\x51\x52\xfc\xdb\xb3\xaf\x0a\x76\xef\xe3\xbd\x64\x04\
+\x02\xbb\xca\x2b\xd8\xaa\xe4\x40\x00\x01\x80\x00\x01\xdb\x70\x09\
+\x00\xb0\x55\x00\x00\xec\xeb\xaf\xdf\xbc\xcd\xe4\x04\x10\x00\xd8\
+\x45\xed\x00\x6a\x0b\xb0\xff\x6d\xa0\x8a\xc0\x76\x98\xbd\x20\x0b\
+\xa6\xcc\x59\xc4\x00\xc0\x22\x98\x44\x00\x00\xab\x00\xf3\x61\x2c\
+\x01\x80\x39\xf0\xfd\x14\x9c\x02\x60\x00\x00\xb5\x00\x30\xe0\x8f\
+\x9d\xce\xd6\x54\xba\x8d\xa4\xc0\xd1\x93\x66\xc0\x38\x06\x14\x90\
+\x3b\x30\x9e\x6d\x71\x8c\xf0\xfb\x09\x1a\x18\x90\xd5\x00\xf6\xf7\
+\x88\xf1\x33\xe0\x93\xaf\xbf\x87\x01\x4f\xbf\x01\x57\x04\x6f\x61\
+\xc7\xbc\x3b\x5f\xc9\x3d\x08\x04\x60\x35\xc0\x95\x24\x00\x00\xce\
+\x97\xe3\xf1\x49\x41\x57\xba\x20\xdc\x71\xdf\xd3\x30\x76\xe2\x6c\
+\xf6\x9d\xf7\xb1\x7d\x50\x49\xe0\x65\xe5\xea\x35\x04\x10\x30\x88\
+\x61\xff\x7c\xd3\xd6\x5d\x14\xf8\x71\xd4\x6f\xff\x7e\x2e\x1d\xdc\
+\x88\x53\x14\x18\xe8\x59\xb0\xc4\x60\x2d\xcb\xf2\x32\xd0\xd7\x8b\
+\xb2\x7d\xad\x0c\xfa\x8d\xe6\x6d\x4b\xa6\x2e\x83\xbb\x28\xf9\x53\
+\xd9\xbf\xc1\x0a\x0a\xec\xb7\xe5\x04\x83\x7a\xbe\x68\x1d\x60\xdb\
+\x00\xc1\x4a\x55\x7d\x13\x6d\x71\xd5\xd0\xc2\xd7\x6d\x12\xef\xd1\
+\x04\x65\xfb\xaa\x49\xfa\x17\x81\xcf\xfd\x4f\xbc\x0c\xcf\xff\xf9\
+\x3d\xf6\xdc\x03\xaa\x2d\xd1\x80\x20\xa0\x79\x3f\x9d\x33\x3f\xfd\
+\xf4\x6f\xf8\xf9\x3f\xff\x07\x8e\x1e\x3f\x05\xcf\xbd\xf4\x2e\xa9\
+\x34\xba\xbd\xd2\xb7\x5e\xf3\xfa\xf0\xf8\x2c\xba\x23\x54\xde\x57\
+\x6c\x7f\xbf\x65\x94\x39\x51\x02\x02\x15\xf8\x03\xa6\xe6\x00\x82\
+\xdf\x54\x31\xd5\xc2\xee\x4f\xea\x12\x84\x9c\xa2\x4d\x34\x15\x70\
+\xef\x23\xaf\x70\x82\x2e\x82\x80\x64\xd3\x75\x30\x51\x11\x0c\x0d\
+\xeb\xcc\xbd\xea\xe3\x72\x40\xa0\xae\x05\x5e\x9f\x43\x2b\x32\x5c\
+\xb5\xd2\x1f\xa6\xad\xaa\x31\xeb\x4f\xdb\xde\x36\x3d\xca\x2c\xff\
+\xe9\x82\x8a\x48\xa6\x6a\xb1\x91\xec\xcc\xa0\x1f\x4d\x7b\xc1\x08\
+\xb3\xb5\xef\xb3\xa0\x4d\xc5\xb1\x35\x40\x91\x71\x86\x89\x78\x7c\
+\x3a\x0e\xe7\xc4\x3f\x76\x10\xef\xf8\x42\x2c\xbd\x70\xdb\x41\xf5\
+\xea\x73\xed\x3a\x08\x30\x1c\x2d\x7d\xad\x19\xb8\x3f\x8e\x0c\x3f\
+\x92\x48\x8f\x11\x46\x56\xd8\xe9\xbd\x82\xa7\x95\x5d\xeb\x2c\x7a\
+\xb7\xe3\x0f\xd6\x88\x60\xdf\xe9\x8f\xc3\xd7\x20\x82\x50\x44\x58\
+\x00\x66\x58\x44\x32\x5c\x61\x9e\xab\x88\x50\x21\x73\xb1\x46\x68\
+\x59\x4c\x4c\x24\x20\x08\x78\xe7\xa3\x6f\x60\xd1\xf2\x3c\x78\xef\
+\x93\x6f\x29\x9b\xe5\x86\x39\xbe\x90\x8c\x26\x91\xe6\x9c\xb9\x84\
+\xae\xbf\xcf\x5d\x2c\x53\x3c\xc4\x09\x6b\x87\x91\xac\x76\x98\x08\
+\x5f\x48\x26\x23\xf2\xd7\xde\x6a\x02\x01\x1c\x0c\x30\x00\x40\x40\
+\xa0\x42\x55\x02\xb6\x09\x10\xa0\x57\x03\x50\xde\x17\x89\x80\xc4\
+\x09\xd8\x2e\x46\x05\x71\x4c\x10\x35\x04\x48\x30\x88\x57\x03\xb0\
+\xd4\x3c\x79\x16\x0b\xfe\x1a\x00\x98\x68\x03\x01\xc8\x03\xe0\x3a\
+\x00\xd3\x60\x2c\xbb\x3d\x63\xce\x12\x58\x98\x9d\x03\x2b\x56\x17\
+\xc1\xea\x35\xeb\x69\x7c\xb0\x48\x88\x09\x15\xae\xdd\x00\x05\xeb\
+\xb8\xeb\x60\x01\xfb\x1b\xed\x87\xd1\x60\x68\x61\xf6\x6a\x62\x8c\
+\xf7\xea\x7b\x17\x0b\x18\x72\x52\xa2\x07\x95\xfd\x71\xde\xdd\xe5\
+\xe9\x26\x66\xdf\x79\x2b\x00\x45\x85\x7e\x75\xf9\x95\xf0\x28\x03\
+\x0a\xa3\x26\xcc\x81\x1d\x65\xd5\x2c\x88\x1e\xa4\x00\x59\x59\xdb\
+\x48\xce\x78\xc8\x87\x40\x32\xe0\x57\xc3\x26\x51\x96\x6a\xf4\xbf\
+\x8f\x58\xf5\x58\x25\x21\x15\x3f\x22\xf6\x61\x80\x3c\x40\xde\x09\
+\x08\xaa\xd0\x5e\x17\x03\x2a\xf2\x23\x36\x6d\xdb\x4d\x60\x02\xf7\
+\x71\x15\x7b\x4d\xca\xd8\x25\x08\xc0\xad\x68\x09\x98\xa5\x7a\x19\
+\xf4\xf9\x56\x06\xfa\xfa\x06\x73\x51\x69\xbe\xde\x6c\x0d\xe0\x63\
+\x6b\xe9\x6f\xf3\x79\xd5\x1a\x00\xa8\xae\x6b\x56\x00\x80\x2f\x1e\
+\xf8\xe9\x7d\x30\xcb\xc7\xb6\x01\x03\x2f\x55\x75\x8d\xb0\x95\x7d\
+\xd6\xef\x27\xce\x81\xd7\xdf\xf9\x88\x7d\xde\x66\xca\xfe\x79\xcb\
+\x82\x7d\x3f\xb6\x10\xf8\xfc\xf0\xe3\xcf\x24\x3f\xfc\x9f\xff\xf3\
+\xff\xc1\x84\x29\xf3\x20\xf9\x57\xe9\x5c\xc1\x8f\xc4\x89\x7a\xd1\
+\x39\xc9\x81\x95\x58\xe2\x9a\xa3\x02\xbf\x06\x00\x78\xc0\xe7\x5b\
+\x77\x6a\x80\xf4\x2b\xd0\x89\x52\x91\x0b\xe5\xb4\x41\xaa\xcc\xf4\
+\xfd\x70\xd3\x5d\x4f\xc3\xce\x7d\x75\x50\x52\xba\x1b\xba\x5c\x7e\
+\x2d\x6f\x45\x68\x3a\x04\x92\x87\xa0\x13\xa7\xd5\x12\xd3\x46\x2e\
+\xaf\x93\xcc\x79\xa4\x6c\xde\x1f\x03\x9f\xc0\x08\x33\xc6\x67\xc4\
+\x9d\x7d\xda\x95\x12\x5b\xb7\x8a\xe0\x8f\xab\x2a\x60\xcf\xae\xc3\
+\xf3\x0d\xa2\xf1\x19\x6c\x46\x74\x9e\xd6\x14\xf3\x71\xaa\x00\xc4\
+\xeb\xd6\xd8\x8a\x00\x20\xb2\xf1\x41\x2c\xfd\x95\x30\x81\x29\xc9\
+\x17\x12\xc4\xc3\x5b\xe0\x1a\xaa\xac\xa5\x02\xbd\xa5\xcc\x6d\xbb\
+\x1d\xc2\xea\x37\xe2\x98\xc1\x8f\xe4\x1f\x60\xb7\x12\x36\xa7\x06\
+\xf4\x39\xd0\xc8\x4a\x7c\x61\xf6\xa1\xc7\xce\x41\x70\xf6\x09\x70\
+\x29\xc6\x71\x38\xa3\xa5\xd0\xef\x64\xee\x33\x7d\x44\x31\x12\x49\
+\x25\x18\xfe\x33\x3a\x2a\x4d\x99\x04\x3f\x99\xed\x48\x75\xb5\x44\
+\x2a\xaf\x6a\x55\x02\xbc\x9d\x92\x09\x57\xdf\xfa\x04\x2c\xc9\x29\
+\x80\xe9\xf3\xb3\x21\xf5\xd2\x7e\x5c\x46\xd3\x63\xfd\xbc\x6e\x59\
+\xd2\x14\xa3\x82\x48\x16\x5c\x55\xb0\x91\x0b\xd1\x90\xfe\xfc\x61\
+\xb2\x7e\xd5\x01\x00\x8e\x7f\xd1\xb6\xa2\x5a\x55\x03\x64\x45\x80\
+\x7b\xc9\x63\x35\xa0\x5c\x01\x01\x0c\xf8\xa8\xf5\xbf\x79\x87\x9c\
+\x10\xd8\xad\x4d\x08\x70\x4e\x00\x29\x06\x32\x00\x90\x9d\x5b\x48\
+\xbd\x7f\x04\x00\x93\x18\x00\x98\x28\x00\xc0\xc4\x99\x0b\x89\x10\
+\x88\x00\x60\xfc\xf4\x79\x30\x6f\xc9\x0a\x58\x99\x5f\x2c\x1c\x04\
+\x37\x70\xcf\x80\x35\xdc\x54\x08\x83\x7f\xb1\x00\x01\x24\x31\x8c\
+\xe2\x3e\x6c\xa1\xe2\xdf\xd4\xb9\xd9\xf0\xf0\x53\xaf\x41\xca\x25\
+\x7d\x59\x30\x60\x17\x77\xdc\x77\x2c\x2b\x24\xc2\xa4\x87\x4f\x4b\
+\x9c\x87\xd2\xc1\x1d\xba\xb1\x6d\x57\x48\xcb\xbc\x1d\x5e\xfd\xeb\
+\x27\x0c\x30\x14\xb0\xa0\xc7\xb3\x75\x2a\x91\xd7\x35\x51\xe0\xaf\
+\x44\x3b\xdc\xaa\x3a\x1a\x87\x2b\x2b\xaf\x84\x2c\xb6\xbf\x97\xac\
+\x2a\x86\x8b\xba\xdd\x40\xfb\xfb\xdb\x91\x53\x49\xe2\x18\x47\x05\
+\x1b\x0e\x1c\xa4\xec\xbf\x51\xcd\xf0\xf3\x8c\xb9\x81\x05\xd6\x6a\
+\x16\x50\x91\x8d\x5f\xb0\x4e\x28\x21\xae\xe3\x9f\xbd\x64\xd3\x56\
+\x02\x08\x08\xa6\x90\x9c\x87\x66\x3c\xf8\xde\x35\x0e\x59\x7f\xbd\
+\x96\xf1\x2b\x32\x60\x23\x6e\x1b\xd9\xd2\x82\x3a\x7b\x2f\x7e\xbb\
+\x51\x05\x79\x99\xf9\xd7\xd6\x21\x40\xe0\xa4\x3e\xfc\x9e\x04\x16\
+\xea\x79\x05\x00\x41\x43\xbd\xf0\x7d\x20\x10\xc3\x00\x0d\x6a\x21\
+\x6c\xdc\xbc\x1b\xbe\x1f\x37\x8d\x1c\x02\xb1\x8a\xd1\x28\x2a\x01\
+\xf8\x38\xac\x78\xa0\xbf\x02\x12\x03\x91\x17\x80\x5a\x01\x57\xde\
+\xf0\x00\xed\xdf\x36\x12\x70\x79\xb8\xbf\x84\x4b\x07\x01\x58\x8d\
+\x4a\xd1\xf8\x00\xa9\x3c\xe8\xb7\x4d\x0d\x72\xe1\xaa\x8e\x41\x2a\
+\xf9\x13\x00\x48\x45\xce\x0a\x37\xad\x92\x2a\x84\xc4\x37\x10\xf3\
+\xfa\x5f\x8f\x98\x4a\xad\x80\xaf\x86\x4f\xa1\xeb\x89\x93\xe9\x50\
+\x82\x52\x4d\xf5\x5b\x38\x51\xb2\xda\x80\xaf\xe3\xb2\xb5\x29\xad\
+\xa3\xd6\xc1\x30\xa4\x64\xa7\xeb\xb4\x4f\x7b\xad\x48\xe2\x40\x81\
+\xb0\xd3\x58\x6a\x1c\x3b\x64\x4e\x5e\xff\x3b\xb4\xdc\x1d\xde\xba\
+\xd8\x1f\x43\xf0\xb7\x8f\x83\x07\xac\xfb\x8f\xf6\xbb\x61\x91\x7d\
+\x8e\xe4\x03\x11\xbe\x2d\x1d\x7a\x7d\x74\x7b\x62\xd1\x34\x08\x05\
+\x22\xfa\x72\x26\x14\xb6\xae\x91\x51\x1c\x00\x20\x96\xf1\x10\x23\
+\xc6\xd1\x8a\xa0\x83\x06\xbf\x2f\x74\x74\xc5\x1b\x29\xc0\x3a\x1c\
+\xf0\x90\xa0\x1c\x46\x1e\x58\x31\x62\xd3\xe2\x74\x01\x8c\xe7\x71\
+\x7e\x38\x1d\x8e\x44\x34\xd6\x6c\x6c\xe8\x3b\xd2\x8f\xf9\xf4\xc6\
+\x7c\xdc\x71\xf6\xd1\x9c\x67\xa5\xb5\xbf\x53\x78\x29\x94\xb4\x08\
+\xd8\xc5\x2f\xe9\xa2\x7e\x2c\x70\x2e\xa5\xb1\xb5\x5b\x1f\x78\x8e\
+\x5f\x20\xa5\xa8\x91\xf6\x7d\x14\x07\xc0\xc3\x75\x02\xfe\xfc\xd6\
+\x67\xa4\x3f\x8f\xb3\xfe\x98\xf9\x63\x00\xd8\x5b\x55\xa3\x46\xca\
+\x70\x11\x18\x90\x8b\x66\xc2\x39\x00\xc0\x51\x33\xfc\x3f\x92\x03\
+\x65\x2b\x00\x27\x05\xb0\xf4\xbf\x86\x65\xf6\x92\x0c\x28\x81\x80\
+\x04\x01\x9b\x24\x08\xd8\xb2\x03\xe6\x2d\x5e\xc1\x00\xc0\x12\x16\
+\xfc\x17\xf3\x35\x6b\x81\x00\x00\x0b\x60\xda\x9c\xc5\xb0\x2c\xaf\
+\x08\x8a\x85\x87\x40\x91\x50\x0b\x2c\x10\x2e\x82\xb8\xb8\xab\xe0\
+\x06\x28\xc6\x19\xf8\xf5\x28\x28\x84\x81\x7f\x0b\x0c\x1b\x3b\x83\
+\x88\x61\x17\x74\xe2\x00\xc9\xa5\xc6\x1d\x33\x39\x08\x60\xfb\x02\
+\x85\x92\x5c\x28\x76\xd3\xf7\x2e\x78\xef\x83\xc1\xec\x75\xb7\xb2\
+\x00\x7a\x88\xe6\xfd\x31\x33\xc6\x7e\x76\x65\x1d\x06\xfd\x06\x9a\
+\x7d\xc7\x60\x8c\xfb\x86\xf6\xc7\x3e\x2e\x8a\x93\x95\x5b\x44\xfb\
+\xfc\x91\x67\xff\x4a\xc7\xaf\x5b\xf0\x56\xc8\x2d\xe4\x9f\xb1\xb6\
+\x99\x07\x7b\xbe\xb8\x92\xa2\xbe\x10\x10\x60\x20\xc6\xfd\x83\x00\
+\xa0\x70\xdd\x66\x5a\x04\x60\xd6\x6d\xa6\x45\xe2\x3e\x6b\x4b\x49\
+\xe9\x0f\x5d\xff\x70\x14\x13\x41\x18\x8e\xe2\x21\x10\xc0\x2a\x01\
+\xad\x26\x04\x03\x26\x48\xa8\x41\xd0\xc0\x56\x35\x03\x2d\x08\x00\
+\x30\x83\xaf\x62\x00\xa0\x52\xdc\x46\x30\x50\x59\xcf\x47\x1a\xab\
+\x69\xb4\xd1\x04\x09\xd4\x0a\x10\x15\x03\xb9\xea\xc4\xe7\x6d\x68\
+\x6e\x86\x66\xf6\x7e\xf8\x9a\xeb\x4b\xb7\xd2\x63\xd1\x23\x82\xbe\
+\x93\x68\x67\x34\x88\x6a\xc0\xc9\x1f\x7f\x84\x1f\x7e\xfa\x11\x8e\
+\x9d\xf8\x11\xbe\x1e\x36\x1e\x3a\x5e\x1c\x24\x20\xe0\x22\xaf\x82\
+\x1e\xc2\x49\xb0\x17\x5d\x47\xdc\x82\x8f\xe2\x16\x24\xbf\xb6\x42\
+\xc1\x90\x07\xfd\x0c\x01\x04\x32\x34\xa1\xa1\x80\xc3\xf4\x00\xd7\
+\x21\xe8\x72\xf9\x35\x50\xb4\x71\x27\x6c\xdf\x53\x0d\xfd\x6f\x7c\
+\x44\x03\xcd\x01\x61\x5a\x64\x7f\xae\x39\x95\x10\xda\xa6\xb4\xf6\
+\xfe\xc3\x65\x92\x6d\xbc\xba\x4c\x70\x38\xcf\x14\x23\x42\x85\x36\
+\x96\x59\x75\xeb\xa4\x81\xdb\xb1\x25\x6c\x9c\x66\x3f\x3b\xda\xb5\
+\xda\xa6\x03\x93\xc2\x97\xb9\x3f\x83\x16\x50\x72\x66\xac\xfc\x60\
+\x0c\xbe\x2a\x4e\x2d\x18\x23\x8a\x74\x7e\x20\xce\x89\xba\xd3\xaf\
+\xd2\x9f\x13\xb9\x6f\x14\x8c\x31\xeb\x0f\x86\x65\x8d\xaa\xf9\x58\
+\xe5\x57\x1d\x83\x30\x8e\x37\xcc\x89\xe8\x8d\xa1\x5a\xe0\xf8\x7a\
+\xbe\x28\x63\x7e\x67\x62\x3a\xe4\x8f\xf3\x04\x36\xa2\x38\x72\x19\
+\x11\x7a\x78\x76\x45\x2a\x9f\xc6\x81\x08\xd7\xef\x0f\xc6\xc5\xe8\
+\x75\xc7\x59\xaa\xe2\x25\xd0\x74\xf5\x83\x92\xc8\x5a\x95\x30\xe5\
+\x0f\x4d\x54\x03\x5e\x7d\x6b\x20\x64\xad\xcc\x87\x4f\xbe\x1a\x23\
+\x04\x59\x7a\x2b\x6d\x7f\x24\x54\x99\xc7\x98\x03\x45\xcc\x7c\x2f\
+\xea\x7a\x35\xcb\x6a\x9b\x55\xe6\x8f\x99\x1c\x8e\x7a\x71\xef\xf7\
+\x3a\x7e\x5b\x80\x80\x7d\xd5\x6c\xe1\x1c\x78\x05\x0f\x7e\x18\x30\
+\xf6\x1f\x3e\x42\xc1\xc8\x5a\x09\xd8\x4b\xca\x7e\x48\xf0\x23\xb1\
+\xa0\x5d\x9c\x13\xb0\x55\x54\x02\x24\x10\x20\x4b\x59\xb6\xa6\xce\
+\xe1\x81\x7f\x22\x65\xff\x8b\x61\xc2\x4c\x1e\xfc\xb3\x56\x16\x70\
+\x39\xe1\x52\xae\x19\xb0\x56\xb8\x0a\x52\x50\xc4\x8c\x19\xb3\x7f\
+\x04\x00\x6c\x15\x95\x6c\x12\x92\xc2\x5b\xe0\xb3\xc1\xdf\x83\xd1\
+\xef\x6e\x38\x1f\x33\xc6\x8e\x5c\x85\x2e\x41\x64\x80\x44\x9a\x24\
+\xc5\xc7\x34\xe8\x95\x71\x3b\x8d\xb7\x95\x6c\xdc\xce\x82\xda\x11\
+\x1a\xb1\xab\x69\x38\x40\x59\x30\x05\xfe\x9a\x46\x0a\xb2\xfb\x30\
+\xe3\xaf\x16\x59\xbf\x98\x87\xc7\x56\xc8\xee\xbd\xd5\xb4\x56\x16\
+\xac\x83\x45\x6c\xbf\x8f\x98\x30\x87\x00\xc5\xb9\x1d\xba\xc3\xdb\
+\x1f\x7c\x0d\xd9\x79\xc5\xb0\x69\xc7\x1e\x95\xa1\xab\xa0\x4f\x8b\
+\x05\xd4\x66\x5c\x3c\x6b\xc6\x0a\x01\x06\xdc\x2d\x3b\xf7\x88\xa0\
+\x8f\x0c\xfc\x1c\x18\x3e\x76\x1a\x2c\x5e\x96\xcf\xc0\xc4\x26\x58\
+\x5d\x84\xf6\xc6\x1b\xe9\xff\x08\x70\xc8\x6e\x19\x79\x16\xb8\x9f\
+\xd9\x7e\xdc\x5e\xb6\x97\xb4\x08\xb0\x35\x41\x01\x9d\x05\xfe\xaa\
+\x5a\x01\x5e\xe4\xaa\x6d\xa0\x2a\x46\x35\xdb\x22\x30\xa8\x92\x1c\
+\x00\x05\x0a\x64\x55\x40\xf0\x01\x1a\x1a\x19\x20\x6c\xa4\x0a\x01\
+\x56\x05\xa8\x22\xc0\x40\x07\x8a\x42\x35\x88\x36\x05\x3e\x5e\xb5\
+\x1f\x84\x57\x04\x69\x14\x30\x10\xd5\xc8\xbe\xeb\xb1\x13\x27\xe0\
+\x87\x1f\x4e\xc1\xa9\x53\x3f\xd0\x7d\xef\xbe\x3f\x08\x3a\x5f\xd6\
+\x87\x84\x86\x08\x04\x20\xf1\xd2\xeb\x33\x83\x38\x0b\xf4\x38\x45\
+\x80\x22\x3f\x89\x9d\x70\xde\x1f\x99\xfe\x99\x22\xf3\x17\x72\xc3\
+\xa9\xd2\xa0\xcb\x5c\xc4\x0d\xa0\xc7\x64\xd2\xe3\xef\x7b\xf4\x55\
+\x76\x2e\x56\xc2\xfc\xac\x7c\xb8\x20\xd5\xb0\x9a\x5c\x49\x62\x61\
+\x88\x16\x41\x40\x65\xf6\x4a\x7e\xd8\xeb\xe4\x92\xea\x10\x38\x9d\
+\x82\xbd\xe6\xc2\x6a\x51\x4a\x8d\x8b\x0f\x66\x84\xb9\xf6\x07\x5a\
+\x61\x24\x2e\x9a\x3e\x8c\xb3\x80\x9a\x75\x5c\x53\xe8\xce\xa4\x38\
+\xb7\x59\xce\xac\xcd\x1d\x8d\x93\x10\xee\xda\x1c\x59\xee\xb8\xf5\
+\x35\x05\x22\x02\x80\x40\x18\xb9\xc6\x68\xbd\x08\x23\x8a\x13\x60\
+\x04\x92\x9a\x37\x5c\xa9\x29\x0c\xda\x0b\x09\xe4\x46\x8c\xa5\xfd\
+\x70\x13\x03\x67\x0a\x00\x62\x71\xac\xf2\x47\x00\x4d\xfe\x18\x4e\
+\x28\x7f\x98\x13\xcc\x88\x41\xf0\xc2\x38\xad\x0a\x40\xb8\x93\x4e\
+\xaa\x8a\x85\xf6\xd3\xec\xa5\x3e\xed\x07\xa6\x82\x7b\x3a\xf8\xfb\
+\xdf\x07\x4b\x96\x17\xc0\xbc\xa5\x79\xf0\xeb\x1e\x37\x70\x97\xbf\
+\x14\xa1\xef\x9e\x22\x03\x9f\x16\xfc\x29\x50\x75\x83\x31\x13\xe7\
+\x71\x8f\x79\x61\x75\x5b\xc5\x02\x43\x45\x0d\x0b\xfc\x18\xfc\x71\
+\xee\x9b\x2d\x0c\x28\x15\x22\x08\x22\x20\xc0\xdb\x4d\xa8\x69\x7f\
+\xe4\x38\x05\x14\x0a\xfe\xe5\x72\x3a\x60\x2f\x2d\x34\xf5\xc1\xec\
+\x9e\x04\x83\x76\xd9\xc4\x83\x84\x5e\x00\x56\x02\x50\x01\x10\xc9\
+\x7f\x93\x08\x04\x70\x00\x30\x75\xee\x12\x16\xe8\x36\x50\xb6\x2b\
+\xc9\x82\x04\x02\xa4\x84\x30\x1a\xdf\xa0\xec\xed\x5a\x01\x00\x58\
+\x50\xcc\x2b\xde\x08\xef\xfd\x6b\x30\x5c\x9e\x76\x93\xd0\x8a\x97\
+\xfb\x28\x28\x24\x5c\x39\xd9\x31\xe5\xe2\x4c\x78\xfe\xe5\x77\x21\
+\xb7\x60\x03\x1c\x3e\x7a\x0a\x0e\x1d\x3d\xce\xbe\x4b\x0b\xcd\xc3\
+\x63\xff\xbd\x9a\x84\x75\x9a\x29\x70\xa2\xb8\x8e\x02\x40\x08\x88\
+\x04\xf0\xd9\x23\x04\x76\xca\xca\x79\x2b\x24\x9f\x05\xe7\xf9\xcb\
+\xf2\x60\xfe\xf2\x7c\xe8\x9e\x7e\x1b\xdb\xaf\x3d\xe1\xc2\xcb\xfa\
+\xc3\xe2\x9c\x62\x58\x9e\x5f\x4c\xad\x80\xda\x06\x11\x24\x25\x18\
+\xa0\x2c\xb9\x99\x6f\x09\x00\x1c\xe0\x44\x41\x2c\xb1\xb3\xc7\xe2\
+\x3e\xc2\x7d\x93\x5b\xb4\x09\xde\x79\xff\x2b\xb8\xfe\xe6\x87\xe0\
+\x77\xbf\x7f\x0e\xde\xfb\xe8\x1b\x98\x36\x6f\x19\x14\x6f\xd8\xc9\
+\x00\xd1\x0e\x52\xfd\xe3\x2e\x8b\xdc\x67\x81\x7b\x2b\x70\x45\x40\
+\x74\x08\xc4\x7d\x8c\x80\x6c\x37\xfb\xec\x28\x62\x44\x4b\x1c\x4f\
+\x09\x0a\x2a\x6a\x39\x30\xc0\xea\x40\x4d\x1d\xaf\x16\xd4\xc8\x2a\
+\x80\xb6\x6a\xd5\x12\x55\x01\xf6\x98\x3a\x0a\xf6\xcd\x04\x08\xea\
+\xd8\xfd\xf5\xf5\xfb\xc9\x65\x51\xf2\x0e\x6a\x05\x68\xc0\xa9\x92\
+\x53\xa7\x4e\x71\x20\xf0\xc3\x8f\x24\x2f\x3d\x6d\xe6\x22\x78\xe4\
+\xa9\xd7\xe0\x57\x97\xf7\x67\xc1\xb1\x17\x17\x65\xc2\xcc\x1f\xb3\
+\x7e\x0c\xfa\x08\x00\x48\xec\x27\x83\x16\x57\x18\x4c\x17\x6d\x31\
+\xc3\xc6\x13\xe0\xad\x00\x2e\x45\x2c\x41\x43\x00\xc6\x4f\x5b\x04\
+\x5b\xcb\x2a\xe0\xe9\x3f\xbe\x67\x53\xf6\x33\x4c\x42\xac\xad\x7c\
+\x6e\x19\xe5\x93\xea\x78\xde\x48\xa2\x31\xe1\x93\x18\xb7\xc7\x3e\
+\x2e\x2d\x55\x3b\x83\x67\xa8\x0c\xd8\x1a\x53\x04\xb1\x54\x1d\x42\
+\xe3\x96\xa9\x31\x63\x28\x6e\x85\xbd\xec\x1f\x0b\x00\x88\xdc\x06\
+\xf7\x87\x89\x57\x46\x8c\x93\x05\xfe\x88\xce\x87\xbf\x10\x00\x88\
+\xa6\x34\x17\x8c\x40\x0a\x09\x37\x3b\x1a\xb4\x89\xf4\xf8\x2d\xca\
+\x78\x84\x5a\xc5\x08\x4d\x64\x36\xa4\xcf\xda\xef\xb7\x65\xba\x56\
+\x80\x11\xab\x2e\xbf\x2f\x02\x99\x2f\xfc\xb2\x8c\xb0\x59\x8c\x23\
+\xa2\x19\x48\xc4\x5a\xe6\x31\xe2\x68\x83\x84\x0a\x53\xb8\x35\xaf\
+\x00\x67\xc6\x7f\x8c\xc1\x3f\xce\x2a\x81\x3d\xe0\xeb\xca\x6a\xd4\
+\xd3\xa4\xc0\x9e\x01\xe7\x5f\x98\x01\xc3\xc7\xcd\x82\xac\x55\x05\
+\xf0\xf8\x0b\xef\x40\x42\x47\x2e\x77\x9b\xa8\xac\x59\x03\x42\xec\
+\x27\xa0\x04\x3f\xda\x74\xe8\x05\xfd\x6f\x78\x88\x7c\xe5\x9b\x84\
+\x24\x2d\x5e\xb8\xab\xeb\x58\x30\x60\x8b\x82\x7d\x55\xbd\xca\x1a\
+\x31\x3b\xc4\x6c\x6a\xd1\xb2\x55\xd0\x72\xec\x38\x49\x04\xa3\xa4\
+\x2d\xe7\x03\x54\xc0\x2e\xe4\x03\xa0\x58\xd0\xbe\x0a\xe2\x02\x20\
+\xf9\x0e\xcb\xda\x44\x0a\xdc\x59\xae\x16\x05\xff\x9d\xa6\x7a\x20\
+\x96\xf0\x31\xe0\x4f\x66\x6b\x22\x03\x02\x33\x17\x2e\x63\xc1\x6c\
+\x2b\xcf\xfc\x31\xf0\xd3\xc8\xe0\x36\x0e\x04\xc4\xd8\x20\x9a\x0b\
+\xad\x27\xe9\x60\x94\xbf\x2d\x85\xf7\x3f\x19\x0a\x17\x5d\x71\x15\
+\xef\x2f\xe3\x08\x1f\x06\x7b\x75\x4e\x23\xe0\xe9\x01\x7d\xaf\x7f\
+\x10\xbe\x1d\x31\x99\x05\xb2\x03\x70\xf4\xf8\x0f\x2c\xf8\x9f\x80\
+\x83\xe8\xfc\xc7\x80\x0f\x8a\xe2\xd4\x36\xb3\xc0\xcf\x02\x33\x2f\
+\x91\x37\x50\x80\xc4\x72\x7f\xb9\x68\x7f\x60\xd5\xa3\x5c\x48\xe1\
+\xe2\x48\x24\xaa\xeb\xa1\x23\x20\x4e\x43\xac\x61\x9f\x77\x6e\x56\
+\x2e\xcc\x62\x19\xfb\x0b\xaf\xbd\x0f\xe7\xb6\xeb\x06\xff\xd3\xe1\
+\x0a\x78\xf9\xad\x8f\x69\x5c\xb0\x64\xd3\x36\x5e\xaa\x57\x73\xfa\
+\x3c\x53\xc6\x52\x79\xa3\xd6\x1e\x68\x14\x8b\xfc\x07\x9a\x0f\x52\
+\xcb\x01\xbf\x33\xb5\x3b\xd8\xf7\x1c\xfc\xdd\x44\xe8\x7d\xcd\x7d\
+\xf4\x7d\x3a\x5e\x7a\x15\x5c\x7f\xfb\x93\xf0\xda\xdf\x06\xc2\xf8\
+\xa9\x0b\xa0\x70\x2d\x7a\x2b\x6c\xe5\x00\x60\x1d\x9f\xe1\x2f\x12\
+\xdc\x02\xe4\x4a\xe4\x16\xaf\x85\x3c\x06\xaa\x90\x5f\x80\xfb\x9f\
+\xf4\xfc\xf1\x18\xd7\xf0\x85\xc7\xb7\x92\x7d\xf7\x2a\xc9\x1b\x68\
+\x90\x81\x5f\x56\x00\x1a\xd5\x6d\x94\x45\x96\xd3\x02\x18\xe0\xeb\
+\xc5\x96\xee\xab\x13\xad\x87\x7a\xde\x56\x90\x9c\x02\xac\x78\x34\
+\x1f\x40\xcd\x80\xa3\x70\xe2\xe4\x49\x38\x79\x0a\xd7\x29\x5a\x47\
+\x8f\x9f\x24\x29\xe9\x09\x53\xe7\xc3\xdf\xfe\xf9\x05\xfc\xfe\x89\
+\x97\xe9\xdc\xbc\xc2\x7f\x13\xfc\xea\xb2\x2b\xe1\xfc\x4e\xe9\x3c\
+\xa0\xa7\xe8\x92\xc1\x46\x48\xf9\xdf\xf2\xfb\x20\xb0\x90\x01\x69\
+\x7d\xee\x82\xd2\x1d\xfb\xc8\x34\xa8\x13\x03\x65\x64\x0e\x85\x6d\
+\xd2\x24\x9f\x72\xd8\x93\x5a\x03\x4a\x62\x38\x44\x99\xd0\x08\xe1\
+\x6e\x59\xaf\x4b\xe6\xf5\xc3\xe5\xd5\x6f\x3b\x25\x1b\xb1\x30\xdb\
+\x43\x15\xf7\xdc\x1a\x60\x70\x6b\xd2\xe3\x56\x0d\xfa\x40\x9c\xa4\
+\x69\x23\xb6\xb1\x6a\x6f\x18\xb9\x61\xd2\x6a\x48\xb7\x5c\x9b\xac\
+\x2d\xca\xa0\xc5\x8f\x21\x3e\x03\x9e\xa0\xa3\xb6\x82\x53\x3c\xd2\
+\xab\x36\xa1\x3a\x08\xc1\xd0\x69\xb6\xb3\x5a\xfa\x8f\x08\x00\xce\
+\xcc\x83\x38\x9c\x65\xa4\x4e\xd4\xb3\x8a\x6c\x98\xfd\x22\x77\x44\
+\x06\x7b\x3c\x02\x0b\xb6\xac\xdf\xa3\xbf\xb6\x4f\x8c\xce\x44\xb2\
+\xe4\x0d\x84\xa9\x16\x04\x1c\x44\x8a\x9c\x01\x40\xa8\x13\x5f\x34\
+\x89\x4b\xc3\x26\x47\x1c\xd9\xf5\xd0\xbe\x2f\x5c\x42\xe3\x39\x5e\
+\x51\x0a\x57\xc4\xf2\x7f\xf8\xb9\x7f\xfe\xa3\x33\x01\x80\x2a\xad\
+\x85\x00\x00\x9e\x15\xdd\xfd\xe8\x2b\xb0\x84\x05\xff\xf1\x33\x16\
+\x43\xbb\x2e\x2c\xf8\x77\xec\xcb\x1d\xde\x14\x00\x48\xd7\x5c\xd2\
+\x84\x1b\x63\x52\x4f\xc8\xca\x29\x51\x5a\xf4\x4d\x07\x0e\xaa\xec\
+\x0f\x83\x60\x55\x0d\x2f\x1d\x63\x60\xc0\xe0\x35\x6f\x71\x1e\x18\
+\x7d\xef\x60\x99\x70\x1d\x03\x00\xc7\xa0\xe5\xe8\x31\x96\x39\xd6\
+\xf3\xa9\x00\x5a\x95\x04\x04\xf0\x36\x06\x76\x0c\x3e\x38\x09\x40\
+\x82\x41\x34\x22\x88\x00\x60\x2f\x1f\x15\x14\x20\x00\x5b\x02\xb9\
+\x85\xeb\x60\xfa\xbc\x2c\x02\x00\x73\x96\xac\x80\x75\x9b\x4c\x7d\
+\x00\x1e\xf8\x77\xf0\x71\xc1\x2d\xdb\xb9\xc1\xd0\xd6\xed\x50\xca\
+\xb6\xa5\x5b\xcb\xc8\xe4\x26\xad\xf7\xed\x2c\xe8\xf7\x10\x06\x36\
+\xdd\x69\x74\x8f\x40\x80\xa7\x27\xb4\xeb\xe4\x23\x19\xe0\xbc\xe2\
+\x52\xd8\x7f\x08\x6d\x7e\x8f\x50\xcb\xa2\xf9\xf0\x51\x06\x5e\x8e\
+\x40\x13\x0b\xfe\xa8\x78\x88\x65\xf8\x5a\xca\xfe\x39\x31\xae\xa2\
+\xb6\x41\x54\x3c\xea\x14\xff\x01\xb5\xf0\xf7\xec\x65\x8b\x65\xfd\
+\xbb\xf7\xf0\xc0\xbf\x9d\x5a\x1e\xfb\xd8\xe7\xdc\x01\x33\x17\xaf\
+\x80\xe9\x6c\x8d\x9b\xbe\x18\x12\x58\xf0\x3f\xb7\xfd\x15\x90\x7c\
+\x51\x10\x96\xae\x2c\x86\x9c\xc2\xb5\x0c\x1c\x55\x29\xd2\x1e\xf5\
+\xc8\x31\x73\xc6\xd1\xbf\x46\x1e\x1c\x79\x65\x80\x83\x02\xce\xec\
+\x37\xfb\xf8\x58\xda\xc7\x16\x00\x56\x55\x8a\x37\x6c\x83\x89\x33\
+\xb2\xe0\x8e\xfb\x5f\x24\x8b\x5f\xaa\x1c\x79\xd2\x20\xf5\xe2\x3e\
+\x70\xe3\x9d\x4f\xc1\x1b\xef\x7e\x0e\x13\xa6\x2f\x62\xfb\x7f\x0b\
+\x01\x13\x3c\x0e\x38\x05\x91\x5b\xb4\x8e\xed\xeb\x12\xc8\x29\x5a\
+\xcb\xc1\x00\xdb\x62\xcb\x64\x13\x03\x69\x65\x95\xb5\xd4\xf2\xe0\
+\xa3\x7f\x72\x6a\x00\xdb\x00\xe8\x81\xd0\x40\xe7\x85\xe3\xc2\xec\
+\xbe\x96\x93\x08\x55\xa5\x40\x9c\x43\x44\x36\xac\x33\x2b\x07\xf8\
+\xdd\x48\xfc\xa8\xe9\x00\x89\x21\xa1\x31\x12\x56\x05\x8e\xb0\x73\
+\xe9\xc4\x89\x13\xbc\x3a\x80\x7c\x01\xc1\x19\x38\xf5\xe3\xcf\x70\
+\xe2\xd4\x8f\xa4\x34\xf8\xc9\xa0\x91\xec\x9c\x67\x01\x35\xc5\x67\
+\x7a\x03\x50\xeb\xcb\x24\x08\x27\x5a\x40\xb2\x34\x22\x4a\xa7\xf3\
+\xfd\xe3\x2f\xbf\x67\xdf\x73\x2f\xbc\x3f\x70\x04\x3b\x47\x7a\x72\
+\x4d\x0c\x8f\x39\xfd\xa4\x9b\x10\x99\x81\xcc\x4e\xa8\x8b\xc7\xfe\
+\xd7\x29\xe9\xf0\x59\x4a\xcf\x6e\x6f\xb8\x8a\x6e\x6c\x81\xca\x49\
+\x0a\xbc\xf5\x27\x01\x9c\x5a\xa6\x7e\x8b\x34\xbc\x35\xe3\x37\xb9\
+\x00\xa6\xb3\x5f\x3c\x15\x80\x60\x8c\x93\x61\xce\x60\xc5\xd4\x8d\
+\x89\x7d\x9f\x9c\x2d\x10\xe0\x6a\x7d\x29\xe0\xc8\x19\xa3\xe9\xa1\
+\x1d\x54\xde\xc9\x6e\xdb\x8c\xb8\x89\x64\xcd\xc0\xe9\xf2\x04\x34\
+\xa6\x7b\x30\x8e\x92\xbb\xa6\x1c\xa5\x97\xb8\x3c\x4e\xc4\x12\x9f\
+\xc3\x28\x8d\x8e\xa6\x23\x99\x46\x18\x36\x52\x48\x34\x83\x8d\x68\
+\x00\x20\x5a\x35\x22\xfc\x8f\x2a\xde\xbf\x4f\xa7\x7d\x21\x8d\x30\
+\x12\x6c\x7d\x35\x53\x4f\x5d\x66\x3a\x99\x44\x66\x4b\xba\xb8\x3f\
+\xcb\xa0\x97\x31\x00\x50\x08\x57\xdd\xf2\x04\x0b\xfc\xbd\x95\xcb\
+\x9f\x6e\xeb\xab\x14\xd9\xc4\x3c\xf6\xbd\x0f\xbf\x0c\xcd\xa8\x4f\
+\xcf\xb2\x5f\x2c\xfd\xe3\x05\xba\x56\x64\x75\xd5\x2a\x7b\x6b\xa2\
+\x92\xf8\xbb\x1f\x7e\x43\x76\xc2\x9f\x7d\x3d\x86\x2e\xd8\x87\x59\
+\xf0\xc7\xcc\xb9\xac\xa2\x52\x01\x80\xdd\x15\x55\x44\x0c\xc4\xbf\
+\x4b\xb7\xef\xa2\x4c\x54\x0a\x05\xc9\x2d\x01\x80\x9d\xe5\x4a\x27\
+\x00\x81\xc2\x4a\x96\x21\xcf\x58\xb0\x1c\xe6\x2e\x5d\x41\x81\x94\
+\x6b\x04\x68\x5b\x59\x01\x60\x00\x00\xcd\x85\x4a\xb7\x97\xc1\xa2\
+\x65\xf9\x70\xe3\x5d\x4f\x93\x30\x0c\x31\xc7\xd1\xf1\xb0\x43\x0f\
+\x72\xb0\x3b\xb7\x5d\x57\xe8\x78\x49\x6f\xf8\xeb\xdf\xbf\x80\x6d\
+\x7b\xaa\xa1\xe9\xf0\x31\x16\xe8\x8f\x40\xe3\x81\x16\x5a\xf5\x58\
+\xe9\x60\x41\x9f\x24\x70\xc5\xdc\x3d\xcd\xc8\x37\x08\x00\x80\x99\
+\xb0\x02\x00\xf5\x26\x01\x72\x1f\xf6\xfb\x2b\x89\xf5\x8f\x82\x48\
+\x3b\x76\x57\xd0\xf8\xde\x56\xf6\x7d\x36\xb2\xcf\x34\x7d\xe1\x32\
+\x98\xca\xd6\xb4\x05\x2b\xe0\xca\x9b\x06\xc0\x79\xed\xbb\xd2\x67\
+\x79\x06\xdb\x0d\x45\x48\x56\xdc\x44\x59\xb5\x9c\xf1\xa7\x45\xfd\
+\x74\xbe\x30\xe0\xd7\x36\xf0\x20\x5c\x43\x7d\x79\xd1\x93\x17\x7d\
+\xfc\x0a\x06\xc8\xb0\x7d\xb2\x06\x89\x81\xeb\xd1\xec\x67\x07\x2c\
+\x61\xe0\xe2\xb9\x97\x3f\x80\x0b\x2f\xbd\x4a\x90\xb2\x4c\x56\x36\
+\x4e\x80\xdc\x7c\xcf\x33\xf0\xd6\xfb\x5f\xc1\xd4\xd9\x4b\x61\x75\
+\xf1\x46\x02\x5b\xe8\x78\x98\xc3\x00\x40\x2e\x03\x00\x38\x1a\x99\
+\xc7\xd6\xea\x35\x1b\xa8\xd2\x52\x56\x5e\x21\xa6\x0d\xf6\xd3\x56\
+\x4e\x0e\x54\x49\x02\xa1\x65\x09\xd2\x20\x02\x04\x1c\x5f\x44\x4e\
+\x41\x1d\x02\xc6\x06\x6a\x23\xe1\xb6\x9a\x56\xa3\x7a\x9d\xfd\x87\
+\x5a\xe0\x28\x82\x47\x14\x9a\x3a\x22\xbc\x12\x5a\x5a\x08\x08\xe0\
+\x7d\x78\x6e\x1d\x3b\x7e\x92\x38\x03\xb8\x3d\x7e\xf2\x14\x1c\x3f\
+\xce\x2b\x35\xbe\xde\x77\x90\x8e\x85\x14\xae\xe2\x00\x20\x93\xa6\
+\x39\xac\x81\x3f\xdd\x0c\x46\xf8\x7b\x4c\xf2\x43\xe7\xcb\xae\x84\
+\xc2\xf5\x3b\xa0\x64\x4b\x19\x5c\xee\xbb\x91\x5b\x45\xa3\x4d\xb6\
+\xd0\x21\x31\x39\x36\xf2\x37\x16\x74\x60\x93\x47\x02\xfc\x46\x64\
+\x33\x35\x29\xb8\xa5\x69\xa6\x24\x26\xdb\x13\x09\xc3\xd2\x5f\x8f\
+\x78\xcd\xf7\x9e\x7d\x06\xbb\x55\x66\xd8\x2a\xd0\x63\x66\xfa\xd6\
+\xbe\xbf\x54\x6e\xc4\xef\x96\x68\x73\x63\x3c\x7d\x31\xa3\xd8\x0d\
+\x7b\x62\x1f\x8d\x34\xce\xfa\xbe\x43\x60\x7e\x4e\x6b\x1d\x84\x70\
+\x81\x53\x67\x81\xca\xd1\x95\x04\xdd\x9e\x56\x3f\x71\xbd\x81\x08\
+\x22\x36\xfe\x18\x11\xae\xe1\x50\x92\xd1\xad\x85\xa5\x1b\x92\x19\
+\x74\xb9\x17\xbb\x2f\x8a\xe9\x50\xa4\xf9\x5a\x23\x4c\x5f\xdf\xce\
+\x5b\x30\xa2\x98\x5c\xc4\x32\x91\x70\x7a\x27\x46\x6b\xe9\x54\xab\
+\xf1\x14\x87\x9e\xbf\x65\x1c\x12\x4b\x6b\x64\xbd\x9a\x09\x2f\xbe\
+\xf6\x11\x2c\xc9\x29\x82\xf7\xbf\x18\x29\x7c\xdd\xa5\xc5\x6f\xba\
+\xe6\xf2\x97\xa1\x7c\xd9\xf1\x3b\x9e\xcf\xce\x95\xb5\x1b\x77\x72\
+\x73\x1a\xb6\x30\x2b\xab\xa3\x1e\x35\x9f\xff\x26\x16\x38\xbb\xc0\
+\x6f\xdd\x55\x01\xb7\xfc\xee\x0f\x44\x84\xea\x91\x7e\x07\xbb\x80\
+\x1f\x23\x99\x5b\x54\xb9\xc3\xde\x78\x99\x10\x09\xda\x2d\x48\x71\
+\x7b\x2a\xaa\x88\x20\x87\x99\x3a\x92\xf6\x76\x09\xd5\xc0\x9d\x52\
+\x35\x70\x57\xb9\xc5\x4c\x08\xab\x00\xe8\xbe\x37\x77\x69\x0e\xcb\
+\xec\x77\x10\x70\xc0\xe9\x80\x4d\x4a\x34\x68\xa7\x09\x00\xc8\x56\
+\x78\x27\x39\xfc\x75\xf8\x15\xe7\x3d\x60\xbf\x97\x66\xb6\x05\xa1\
+\xf1\x72\xdf\xcd\xf0\xfe\xa7\xc3\x60\x55\xf1\x66\x58\xb5\xa6\x14\
+\x96\xad\x5e\x0b\xd9\x79\x25\x90\x9d\xcb\xcd\x7d\xb2\xd9\xdf\xcb\
+\x0b\xd6\xb3\x00\xb8\x01\xf2\x4a\x4a\x59\x50\xd8\x02\x25\x9b\xd0\
+\xa7\x60\x17\xfb\x2c\x08\x54\xf6\x91\xc6\x7f\x19\xb1\xfb\x25\xf1\
+\xb1\x8e\xb7\x01\xc4\x77\x44\x00\x80\x8f\xdb\xb6\x6b\x2f\x7d\x07\
+\x1c\xe3\xdb\xc4\xd6\xcc\x45\x2b\x60\xea\xfc\x65\x30\x65\xfe\x72\
+\x78\xef\xd3\xa1\xf0\x3f\x17\xfc\x16\xce\x6b\xd7\x1d\xda\x5d\xe8\
+\x87\x85\xcb\x8b\x58\xc0\xdd\x48\x80\xa6\xa1\x49\xa8\xe8\x35\x0a\
+\x65\x3f\x6d\x36\x9f\x8f\xe1\x69\xa4\x3c\x22\xf0\x89\x25\xf4\xf7\
+\x71\xe1\x3e\x2c\x5e\xcf\xfb\xfd\x08\x04\x0a\xd6\x6e\x85\x0f\x06\
+\x0e\x87\x5e\x19\x77\xf2\xd6\x5f\x0a\x97\xe1\x25\x66\x7a\x12\xaa\
+\x1a\x5e\x01\x5d\x7e\xdb\x07\xee\x19\xf0\x47\x18\xf8\xcd\x68\xda\
+\x1f\xb9\x6c\x1f\xe4\x62\xf0\x67\x0b\xdb\x30\x38\x5d\x81\x13\x14\
+\x48\x2a\xc4\x2a\x0d\x02\x20\x4e\x00\x94\x99\xbd\x0c\xf8\xfc\x73\
+\x51\x50\x17\xad\xa1\xca\xda\x7a\xa8\xc2\x6a\x11\x8e\x2b\x52\xcb\
+\xa8\x5e\x90\x0d\x39\xe1\xb0\x4a\x3c\x0e\xbf\x17\xf2\x1e\x0e\x1d\
+\x6e\x61\x01\xfe\x04\xb5\x02\x4e\x9c\x3a\x49\xdb\xe3\x18\xf4\x4f\
+\x1c\x17\x00\xe0\x24\xb5\x05\xd0\x6e\x18\x65\x86\xd1\x5a\x79\xe5\
+\xea\xf5\x64\xda\xc4\xa7\x04\xf8\x58\x2c\x99\x3b\x79\x33\xc5\x54\
+\x40\xba\x6d\x44\x4e\x28\xfa\x89\x51\xd7\xe7\x5f\xfd\x27\xac\x63\
+\xe7\xd5\x17\x43\xc7\x53\x75\xa6\x8d\xd2\x22\xf0\x45\xb1\x27\x6e\
+\x4d\x61\x1d\x6d\x0c\x3c\xd9\x3a\xa6\x16\xbf\x26\xc0\xd9\x33\x1a\
+\x8a\xae\x41\xe0\x3c\x95\xa4\xda\xa4\xd2\x72\xf9\x8c\x00\x40\x2c\
+\x2d\xda\x78\x8e\x8d\x11\x57\xcb\xf6\xbf\x00\x00\xfc\xa7\xe1\x59\
+\x1c\xd4\x6c\x78\xcd\x9e\xb9\x79\x72\x19\xa1\xbe\xd2\x16\x22\x4c\
+\xd0\x66\xeb\x1b\x8b\x6b\x60\x78\xe7\x2b\x97\x7d\xec\x45\x05\x68\
+\x9f\x83\xab\xde\xe9\xfc\xb0\x22\x8d\xa6\x18\x11\x00\x45\x24\xa2\
+\x61\x14\x41\x08\x6f\x1c\xfd\xfb\x48\xfd\x2e\x4f\xb8\x96\x8f\x93\
+\xee\xb5\x96\x79\x68\x3f\xb4\x44\xe5\xa8\x96\x4e\xca\x67\x17\xf5\
+\xba\x89\x05\x97\x02\x58\xbc\xa2\x00\x2e\xf3\xdd\xaa\x6c\x6e\x13\
+\x25\xf9\x4f\x5c\x1c\x55\x0b\x40\xf8\xb2\x3f\xfc\xd4\x9b\x2c\x90\
+\x9f\xa0\x0c\x0c\x01\x80\x12\x91\x69\xe4\x73\xdf\x98\xad\xe5\xe4\
+\xad\x87\xdf\xf4\xbc\x0e\xce\xc3\x51\x39\xf6\xfe\xd3\xe6\x64\x53\
+\xd9\x1f\x83\x7f\x13\xcb\x9e\x77\xed\xe6\x8a\x80\x0a\x00\xa0\x58\
+\x10\xbb\xbd\x97\x65\xcb\xeb\x85\xd6\x3f\x06\x4b\x1c\x0f\x94\x20\
+\x80\xfb\x07\xec\x53\xa4\x40\x04\x00\x39\x0c\x00\x20\xb1\x6f\x9b\
+\x74\xa9\x53\x8e\x82\x65\x0c\x14\xec\x54\xd5\x80\x49\x33\x16\x43\
+\xb7\xc0\x6d\xfc\xfc\xf5\x72\xcd\x03\x0a\x74\xec\xb3\xb5\x21\xd5\
+\xb6\x5e\xe0\xbd\x28\x13\x3a\x5d\xd2\x17\x2e\xee\x76\x0d\xf4\x08\
+\xde\x0a\xe9\x57\xdf\x0f\xd7\xdf\xf9\x24\xb1\xc1\xff\xf0\xca\x3f\
+\xe0\x6f\x1f\x7c\x0d\x83\xbe\x9b\x0c\xe3\xa7\x2f\x81\xd9\x4b\xf3\
+\x60\xfe\x8a\x42\x58\xc0\xf6\xdd\xe2\x95\x45\x90\xb5\xaa\x88\x03\
+\x85\x55\xc5\xb0\x74\x15\x77\x01\x44\xbb\x5f\xbc\x1f\x75\xff\xd1\
+\x1a\x38\x8f\x05\x4d\x2c\xc5\x17\x61\xf0\x45\x37\x43\xf6\xb9\xd6\
+\xa3\xc4\x31\xfb\xac\x48\x02\x9c\xb2\x20\x9b\x01\x80\x65\xb4\xb0\
+\x0a\x71\x5e\xfb\x9e\x54\x72\x7e\xfc\xb9\xbf\x42\xde\x9a\x4d\x54\
+\x86\xdf\xc9\xf6\x49\x3d\x89\xfa\x1c\x10\x59\x7f\xb3\x6a\x3d\xc8\
+\xec\xba\x52\x04\x59\xde\x8a\x90\xab\x5e\x04\x5e\x1e\x90\xb1\x3d\
+\x83\xfb\x08\x47\x03\x0b\x71\x44\x72\x23\x3a\xfa\x6d\x83\x6f\xbe\
+\x9f\x02\x7d\xaf\x7f\x48\xf9\x1c\x9c\xd7\x01\x01\x80\xd0\x38\x68\
+\xdf\x8d\xc4\x8d\x3a\x74\xf2\xc3\x0d\x77\x3e\x01\xef\x0f\x1c\x4a\
+\x86\x47\x85\x6b\xf9\x88\xe5\x1a\x69\xcb\x8c\x16\xcd\xec\x6f\xd4\
+\x72\x40\x10\x44\x00\xa0\x56\x64\xfe\xb5\x02\x8c\xe0\xdf\xd5\x32\
+\xc8\xd7\x13\x5f\x81\x16\x7e\x56\xbc\x9f\x88\x86\x0d\x66\x3b\x45\
+\x3c\x47\xea\x19\xd4\x35\xef\xa7\xf6\xd3\x21\x96\xdd\x63\xf6\x4f\
+\x55\x81\xa3\x47\x29\xd8\x23\xc8\x44\x57\xc5\x16\xe1\xa9\x70\x88\
+\x4c\x95\x8e\xc1\x1b\xef\x7c\xc1\xaf\x1f\xc2\xba\x3a\x81\x04\x81\
+\x32\x45\xd6\x9e\x11\x3a\xda\x27\x09\x78\x2c\xdb\xbf\xa0\xa3\x8f\
+\x48\x99\xc5\xa5\x3b\x19\x98\xbd\x8d\x5a\x60\xb2\xa2\x60\xf5\x9d\
+\x4f\x77\x98\x19\x0f\x44\x20\xee\x3a\xb9\x96\x86\x53\x06\x14\xa4\
+\x42\x4f\xb0\x15\x54\xe9\xce\x74\x05\xc3\x64\xfc\xb1\x07\x54\xfb\
+\x24\x02\xbf\x5e\xc9\x44\xd4\x38\x83\x64\x28\x18\x41\x79\x31\x10\
+\x46\x55\x36\xf0\xbf\x6a\x61\x2c\x3c\xe7\x6c\xbe\x81\x3b\xe2\xfc\
+\xb8\xb3\x32\x93\xd9\x23\xf1\x3b\x94\xb4\xa2\xc9\xd7\xfa\xc3\x8e\
+\x84\x38\x8b\xfb\x58\xd5\x07\x75\x21\x8b\x50\x76\xbb\x73\x10\x34\
+\x89\x2e\x91\x32\xf9\x68\x06\x40\xd1\xd4\xad\x34\xa7\xb1\x14\x4d\
+\x79\x2f\xd9\xf9\xb3\xb5\xea\x31\x54\x7d\x47\x3b\xe1\x2f\xc8\x75\
+\xcf\x25\x7b\xdf\x2e\xb2\x41\xda\xe7\xe9\xf0\xee\xc7\x43\x58\x70\
+\x2a\x86\xd7\xde\xfb\x5c\xe8\xa1\xf3\xf2\x7f\x82\x56\xfa\x4f\x54\
+\x5e\xec\x19\xe2\x7e\x03\x0a\xd7\x6c\x61\x99\x15\xbf\xc0\xe2\x3c\
+\x77\xa3\x64\x71\x8b\xf1\xad\xe9\x73\x96\x83\xa7\x73\x3a\x9c\x4b\
+\xbd\x74\x3f\x5c\x75\xcb\xa3\x70\xe4\xf8\x0f\x54\xbe\x45\x7f\x00\
+\x9a\xfb\xc7\x72\xb8\xa8\x00\x90\x40\x50\x25\xb7\x8a\xc5\x8c\x19\
+\x0d\x7e\xb0\x0a\x80\x25\xf3\xdd\xe5\x9c\x20\xc8\xab\x00\x68\x24\
+\xc4\xb3\x67\xaa\x04\xec\xd8\x43\xec\xf5\x2d\xdb\xf7\xd0\x6d\x92\
+\x11\xc6\xb1\x41\xb4\xaa\x65\xc1\x0d\xfd\x03\xd6\xb3\xac\xff\xe5\
+\xd7\x3e\x04\x37\x0b\x62\xc8\xae\xff\x1f\x14\xee\x91\xa3\x8f\xa9\
+\x72\xbe\x3f\x48\x3f\xb8\x36\xf8\x3f\xd1\xff\x27\x2e\x00\x7a\xda\
+\x27\x75\xe3\xb7\x51\xe9\x2f\x89\xcf\x9f\xa3\xf6\x7f\xfb\xce\x06\
+\x5c\x9a\x76\x23\x5c\x75\xeb\xe3\xf0\x20\x03\x44\xaf\xfe\x6d\x20\
+\x7c\x36\x78\x1c\x4c\x98\xb9\x04\x96\xe4\x94\x40\xf6\xea\x75\xb0\
+\x94\x01\x02\xac\xae\x2c\x5a\x91\xcf\x80\x42\x3e\x05\x79\x49\xf6\
+\x9b\xb1\x78\x05\xcc\x58\xb8\x02\xa6\x2f\x5c\x0e\xb3\x96\xb0\xbf\
+\x17\xad\x60\x00\x60\x19\xad\xa9\x0b\x96\xc3\xc3\xcf\xfc\x95\x9c\
+\x17\xf1\xb3\xb6\xef\x12\x84\xb9\x4b\x73\x19\x08\xd8\x08\xb9\x6b\
+\xd6\x53\x20\x55\x86\x3e\x82\x74\xa7\xf4\x06\x44\x80\xad\x54\x13\
+\x17\x82\xa9\x5f\x63\x4e\x63\x48\xa0\x80\xc1\x14\xf7\x39\xca\x11\
+\x17\xa2\xf8\x11\x12\x00\x71\x31\x30\x30\x72\xfc\x6c\xe8\x73\xc3\
+\xef\x45\xf0\xef\xce\x3e\x4b\x77\xe2\x49\x70\x59\xe8\x9e\x6a\xfc\
+\xae\x03\xfb\x6c\xb7\x3f\xf0\x3c\x0c\x1d\x3d\x95\x81\x88\xed\xca\
+\x9a\x79\xad\x98\x2e\xc0\x71\xce\x52\x76\x1c\x70\x02\x02\xdb\x12\
+\xd5\x22\xa3\xa7\xcf\x88\x63\x92\x44\x16\xad\x83\x4a\xb6\x2a\xaa\
+\x38\xa1\x50\xff\xac\x95\x35\xb5\xc4\xa5\xa8\xa4\x49\x08\xae\x4e\
+\x58\x23\xf8\x0f\xb8\x0f\x28\xc0\x53\x90\xc7\x56\x40\x0b\x1c\xc2\
+\xd6\x40\xcb\x31\xb1\x3d\xaa\x59\x2a\x1f\x81\x86\xe6\x16\x48\xcb\
+\xbc\x53\x70\x5f\x32\xf9\xb9\xed\x15\xd5\xad\x14\x4d\xd4\xc7\x63\
+\x0d\xb8\x92\xf3\xf2\xc0\x93\xaf\x12\x00\x18\x3c\x7c\x32\xed\x0f\
+\x5d\x73\x40\xb6\x0e\xec\x2b\x9a\x21\x4d\xf8\x20\xee\x3c\x12\xed\
+\x16\xae\x71\xee\x98\x32\xec\xd8\xd6\xd9\x72\x9d\x75\x87\xad\x44\
+\x5a\x5b\x00\xe6\x7e\x12\x02\x4e\x29\xa7\xab\x80\x1b\x0c\x49\x88\
+\x63\x69\xb3\x3a\x3d\xc6\xed\x68\x04\xf5\x4b\x02\x00\x8d\x03\x70\
+\x36\xde\xdc\x1d\xb1\xdf\x6d\x84\xb1\x83\x94\xc1\x34\xde\x72\x77\
+\x38\xe3\x20\x6d\x2a\xc1\xeb\x0f\x73\xe2\x87\x73\x16\x8c\xa6\x65\
+\x6d\x44\x31\x21\x8a\x34\xcf\x6f\x44\x19\x69\x71\x00\x30\x5e\x7f\
+\x08\xb9\xf0\x74\x7f\x60\xb1\x3f\xc7\x70\x04\x6e\xf6\xd1\xbf\x44\
+\x1b\xa2\xc6\x5e\x6f\x57\x96\x0d\x63\x70\x5a\xc0\xb2\xd8\x4e\xbf\
+\xbd\x86\xfd\x08\x7b\x53\xff\xdf\xec\xfd\x67\x08\x00\x20\xda\x01\
+\x5e\x34\x4b\xc9\x84\xeb\x6e\x7b\x12\x8e\x9f\xfc\x91\x05\x73\xac\
+\x00\x1c\x25\x42\x56\x93\x90\x72\x45\xaf\xf9\x91\xe3\xe6\xc0\xf9\
+\x6c\x5f\x9c\x47\xea\x78\xbd\xe0\x5c\x16\x28\x16\x67\x15\xf0\x72\
+\x2c\x03\x00\x48\x18\x94\x63\x7f\x34\x01\x20\x14\x02\xb1\x44\x2e\
+\xfb\xe5\x1c\x00\xec\x54\xb2\xc1\x4a\x31\x70\x37\xaf\x08\x28\xff\
+\x80\x5d\x7b\x28\xcb\xc4\xa0\x4f\x24\x41\x69\x28\xc4\xc0\xc0\x16\
+\x06\x02\xb0\x1a\x30\x6a\xc2\x4c\x78\xf1\x95\xbf\xc3\x1f\x5e\x7c\
+\x87\xb4\xfb\x31\x9b\xff\xdd\x43\x2f\xc1\xad\xf7\x3c\x0b\xd7\xdc\
+\xfa\x18\xcb\xf2\x1f\x80\x2b\x02\xb7\x93\xf0\x4b\x52\x67\x6c\x71\
+\xf4\x24\x35\xbf\x73\xdb\x5d\xce\xfd\xec\x69\x5d\xc1\x02\x3f\x0f\
+\x7c\x09\xa8\x3e\x47\x4c\x70\xd3\x1c\x49\x82\x08\xea\x27\x77\x0c\
+\x40\xf2\x45\x7d\xa0\x57\xef\xbb\xe1\x8e\xdf\xff\x11\x5e\x78\xfd\
+\x5f\xf0\xd1\x57\xa3\x60\xdc\xb4\x45\x2c\xf8\xaf\x86\xb9\x4b\x72\
+\xc9\x5e\x99\x07\xff\x15\x30\x8d\x01\x00\x0c\xf8\xd3\xe6\xe3\x16\
+\x39\x00\xcb\x19\x18\x58\x09\x63\xa6\x2e\x84\xb6\x28\x37\x9c\xc2\
+\x85\x69\x7e\xf7\xf0\x4b\x90\x5f\x52\x0a\x79\xc5\xeb\x69\xc6\x9f\
+\x57\x00\xf6\xf3\x92\xbf\x9e\xed\x57\xeb\x8b\x4f\x22\x90\x06\x41\
+\x4d\x68\x70\xad\x12\xc0\x00\x01\x02\x82\x2b\x6c\x0b\xe0\x54\x44\
+\x81\x18\x8b\xcc\x61\xeb\xd1\x67\xdf\x24\x6e\x84\x4b\x18\x1b\xb9\
+\x84\x14\x6f\x82\xec\x81\x0b\x27\x48\x0c\xa0\x97\xa6\xdd\x44\x0a\
+\x88\x59\x2b\x0b\x61\xed\xa6\x6d\x04\x02\xd6\x62\x9b\x61\x3d\x1f\
+\x33\xc4\xb6\x0c\x4e\x42\x54\xcb\x11\xc9\x2a\x3e\x2e\x8a\xc4\x50\
+\xda\x56\xcb\x55\x4f\x1a\x12\xf8\xd9\xea\xc5\xb8\x23\x3a\x22\x62\
+\x96\x8f\xa5\xfe\xa6\x83\x87\x19\x18\xe0\xe7\xdb\x87\x9f\x0e\x86\
+\xe6\x43\x47\xa9\xcf\x8f\x20\xe0\x60\xcb\x61\x38\xc0\xb6\x87\xf0\
+\x3e\x0a\xfc\x2d\x0a\x00\xb4\xb4\x1c\x87\x9c\xd5\x1b\xe0\x02\x39\
+\xea\x97\xda\x5b\x80\x80\xa0\x4a\x6c\x94\xca\xa5\x2e\x79\x2e\xaa\
+\x00\x6e\x6f\x0f\x98\xb7\x74\x35\xac\x29\xdd\x05\xfe\xbe\x77\xa9\
+\x1e\xb7\x99\xfd\x07\xc3\x06\xfd\xd6\x91\x8b\x35\x04\x38\x89\x40\
+\x02\x8e\x91\x35\xdf\x7a\x31\x25\x5a\xdb\x21\x7c\x15\x24\x14\x10\
+\xd8\x55\x08\x8d\xd3\xc8\xfc\x8d\xb8\xd4\xff\x7e\xd9\xe0\x6e\xc4\
+\xdc\x2e\x69\x65\x12\x60\xac\x82\x32\x4e\xa2\x3e\x01\x07\x86\x7d\
+\x30\x0e\x29\xca\x40\x64\x25\x26\x8f\x0e\x46\x22\xe9\x11\x58\xc9\
+\x7c\xe1\x89\x2e\x7a\x25\x21\x5c\x3f\xc8\x88\x41\xd4\xc7\x21\xfb\
+\xf7\x86\x5a\x7e\xea\x9f\x4b\xb5\x4e\x3c\xc6\x59\x03\x6d\x6e\x87\
+\x91\x40\x53\xe4\xc7\xae\x4c\x66\xda\xa7\x4a\x6b\x60\x6c\xb1\xb4\
+\x61\x01\xec\x1f\x9f\x0e\x23\x8b\xda\xe7\x31\x3b\x4e\x41\xc1\x9f\
+\x3e\x16\xd2\x9f\xcc\xfa\xd5\xa2\x76\x40\x10\xa6\xb2\x0c\xf7\xc4\
+\x89\x53\x70\x94\x5d\x88\x0f\x8a\x16\xc0\x7e\xe1\x11\xff\xe9\x57\
+\xa3\x49\x95\xad\x4d\x12\x97\x69\xc5\x51\xc1\xde\xd7\x3c\xc0\x2e\
+\xdc\x27\xa9\xfc\x8f\xa5\xd9\xaa\xda\x7a\xca\xe8\xa9\xf4\x8f\xc4\
+\xb8\x7d\x3c\xf8\x63\xe0\x47\x00\x80\x60\x00\x33\xd2\x4d\x36\x00\
+\x50\xa6\x13\xe8\xa8\x25\xc0\xfd\x03\xb0\xec\x4f\x81\xbf\xac\xdc\
+\xb2\xb6\x8a\x96\x00\xb5\x02\xb6\xf0\x56\x00\x92\x04\xb1\xec\xbe\
+\x61\xeb\x2e\x21\x22\x84\xfd\xf7\x3d\xec\xef\xdd\xec\x7f\xbb\x59\
+\x06\xbb\x0b\x56\x15\x97\xc2\xbc\xec\xd5\x14\xb0\x07\x8f\x98\x02\
+\x6f\xfe\xfd\x4b\xe8\x95\x79\xb7\xd0\xfb\xef\xa1\x74\xe8\x39\x13\
+\x3c\x4d\x01\x00\x1e\x04\x33\xb8\xbb\x9c\xdc\x8f\xa9\xd2\xd7\x3e\
+\x40\x4e\x89\xa8\x21\x10\xec\x7f\x0f\xdc\xc3\x82\xf9\xab\x6f\x7f\
+\x0a\x83\x86\x4d\x82\xc9\x73\x31\xe8\xaf\x84\xa9\x0c\x00\xf0\xe0\
+\xbf\x02\x66\x2d\xce\x61\x60\x21\x0f\xae\xbf\xe3\x49\x15\xa8\xda\
+\x76\x0a\xc2\xb8\xe9\x8b\x60\x35\xf2\x0f\x8a\x36\xd0\x78\x1f\x92\
+\xed\x30\xf3\x97\x25\x7e\x0a\xf4\x22\xf0\x57\x08\x0d\x86\x7d\x42\
+\x80\x68\x9f\x2e\xca\x54\xcd\x6f\xab\x25\x00\x01\x2a\x14\xe2\xc4\
+\x04\xb6\x1a\x56\x16\xae\x83\x15\xf9\x6b\x60\x45\xc1\x3a\xb8\xe3\
+\x81\x67\xc1\x85\xd5\x10\xac\x04\x78\x74\x16\xbc\x5f\x4c\x97\xa4\
+\x5b\x26\x46\xda\x33\x20\x75\xf7\x80\x3f\xc1\xa4\x19\x4b\x60\xed\
+\xc6\x1d\x14\xfc\xa9\x35\xb0\x61\x33\xb5\x1c\xb0\xc5\x83\x80\x83\
+\xa6\x23\xe4\x22\xf0\x27\x95\x23\xeb\xf8\x08\x25\x3b\x17\x70\x74\
+\xf0\xd8\x89\x63\xd4\xe7\x47\xc2\x29\x9f\x6e\xe0\x1c\x08\x24\x65\
+\x06\xfa\xdd\x0d\x37\xdf\xf5\x04\x3b\x3f\xaa\x29\xf3\x3f\x78\x98\
+\x3b\x28\xf2\x75\x18\x0e\x8a\x85\x7f\xb7\xb0\xff\x23\x10\x7d\xfd\
+\xed\x81\x4a\xe8\x8a\x1b\xfb\xc8\x9e\xba\xcd\xb9\x33\xa4\x0a\xd0\
+\x03\x1e\x78\xfc\x15\x28\xd9\xb2\x0b\x86\x8c\x9a\x4e\x60\xd0\x7e\
+\x6d\x74\xca\xfc\x4f\xeb\xb7\xee\x31\x62\x00\x06\xc1\x5f\xb8\x05\
+\x10\xeb\x0c\xbd\x11\x75\x8e\x3e\x14\x08\x04\x6c\xd7\xab\x5f\xc2\
+\xf6\xfe\x7f\xe3\xe2\xfb\xae\xcd\xd9\x02\x00\x34\xb7\x9a\x1c\x74\
+\x60\xa1\x06\x1c\x4a\xf1\xbe\x10\x05\xab\xf8\x74\x90\x6d\xc1\x53\
+\x65\xf9\x41\x1b\xdb\xdf\xb0\x71\x09\xa2\x18\x49\x78\x63\xd5\x16\
+\x88\xe4\x37\x60\x44\x20\xdb\x38\xf9\x52\xfb\x6c\xb3\xff\xa1\x80\
+\xe1\x4c\x4b\x6b\x21\xa5\x28\x8f\x95\x4b\x10\xb9\x5c\x15\x70\x98\
+\x3f\x96\x4c\x5a\xa1\x8b\x2d\x48\x4d\x48\x76\x9b\xc7\xb2\xd1\x59\
+\x8b\x56\x81\xf7\x37\xfd\x78\x3f\x3c\x55\x06\xac\x4c\xb3\x05\x90\
+\x22\x2b\x00\x19\x04\x12\x7e\xdd\xed\x3a\x16\xc4\x4f\x12\x00\xc0\
+\x51\xbe\xc3\x98\x69\xb5\xb4\x50\x7f\xf5\xc3\xcf\x46\xd0\x05\x11\
+\xcb\xe8\xc4\x90\x66\xb7\xcf\x65\x41\x63\xec\xc4\xb9\x2a\x13\xdb\
+\x8f\xcc\x7f\x0c\xfe\xe4\x09\x50\xc5\x15\x01\x71\x3e\xbe\xd2\xbc\
+\xf8\x23\x20\x40\xd2\x1e\xb5\x00\xd0\x37\x00\x5b\x04\x92\x2c\xb8\
+\x4f\x3a\x0a\x72\x22\x1d\x8e\xb7\x61\xd9\x9f\x4f\x09\xf0\xaa\x80\
+\xac\x0e\x6c\x17\x95\x00\x9c\x0f\x47\x31\x1b\x29\x1b\x8c\x7c\x00\
+\x3e\x0e\xb8\x93\x5b\x0c\x6f\x33\x4d\x86\x36\xb2\xb5\x8e\x81\x84\
+\x82\xf5\xdb\xe0\xb3\xc1\x63\xa1\xff\x4d\x03\x20\x31\xb9\x07\x59\
+\xfb\xba\x54\xd9\x9b\x1b\xd2\xd0\x92\xae\x74\x5e\x93\xdd\x9c\x20\
+\x09\x96\xa2\xc7\x8c\xfd\x66\x97\x08\x32\xdc\x3c\x28\x4d\x80\xa3\
+\x9e\x14\x50\xdb\x75\xf2\x43\xcf\xcc\x3b\xe0\xce\x87\xfe\x08\x2f\
+\xbd\xf5\x19\x7c\x3d\x72\x2a\x03\x00\x79\x30\x7f\x59\x3e\x7c\x3e\
+\x64\x82\x68\x55\xa0\x30\x4d\x26\x5c\xc3\x00\xc1\xea\x35\x9b\x88\
+\x4b\x90\x57\xb4\x9e\x00\x0d\x66\xef\x3c\xb0\xf3\x20\x8a\xc1\x73\
+\xaf\xc8\xa6\xf7\xc9\x4c\xba\xd2\x06\x00\x30\xd8\x6a\x32\xcd\x1c\
+\x14\xf0\x85\x52\xcd\xa8\x26\xb8\xaa\xb0\x04\x96\xaf\x5e\x03\xcb\
+\x56\x97\xc0\xd2\x55\xc5\xe0\xc7\x71\x49\xdc\x0f\x72\x0c\x8e\x7e\
+\x0f\x86\xd9\xea\x42\x01\x1e\x5d\x60\x8a\xad\xb6\x1d\x83\x70\xd5\
+\xcd\x8f\xc0\x77\x2c\x58\x62\x7b\x00\x45\x87\x50\x96\x18\x2b\x0c\
+\x68\xc0\x84\x15\x07\x6c\xe5\xa0\x3a\xa2\x3c\x07\xb0\x42\x80\xc7\
+\x13\x47\x42\x91\xc0\x87\x9e\x00\x68\x82\x54\x55\xdb\x20\x46\x4c\
+\x9b\xb8\x32\x22\xb6\x9e\x0e\x1c\x86\xcc\xab\xef\x87\xf3\x53\x0c\
+\xf8\x4d\xf7\xab\xa1\x60\xcd\x66\x6e\x9f\x7c\xe0\x00\x5b\x07\x85\
+\x34\xf5\x21\x0e\x04\x0e\x61\x9b\xe0\x18\x1c\x61\x20\xb4\xa9\xf9\
+\x08\xf4\x48\xbf\x9d\x8e\x53\xa2\x98\x6c\x71\x27\x9b\x7a\x28\xee\
+\x10\x5b\x74\xa9\x96\xda\x8b\xbd\x57\x2f\xc8\xca\x5b\x07\xeb\x18\
+\x78\xf4\xf7\xbd\xdb\x66\xb4\xd5\x5a\xa5\x75\xc3\x01\x00\x04\x22\
+\xe8\xde\xff\x37\x83\x55\x24\xc2\x62\x3c\xd7\x3d\x93\x20\xee\xb6\
+\x39\xfa\xc5\x47\xd4\xfb\xbf\x1d\x00\x48\xd1\xb1\x60\xbc\x00\xc0\
+\x38\x83\x5e\x72\xa8\x0e\xb2\x5b\xf3\xa6\xd6\x15\xae\xe2\x3b\xb9\
+\x43\x09\x80\xae\x08\x55\x08\x57\x34\x36\xab\x9a\x46\xd0\x27\x0a\
+\x82\x0e\xa3\x82\x46\x58\xc2\x1f\x67\xf6\x1a\x9a\xf4\x71\xa4\x0a\
+\x40\x98\xd7\xb0\x89\x6a\xd8\xc9\x3e\xce\x23\x3e\x46\x14\xd6\xa7\
+\x2f\x62\x4f\xcb\xe5\x58\xde\x4f\xd7\xfe\xd6\x25\x7f\x79\x45\x40\
+\x5d\xa0\x29\xf8\x0b\x52\x17\x0b\x3e\x6f\xbe\xf7\x05\xcc\x59\x9a\
+\x03\x4f\xbe\xf8\x0e\xed\x07\xd2\xb5\x57\x81\x3f\x43\x91\xa4\xa8\
+\xec\x4f\x00\xa0\x37\x4d\x08\xbc\xf9\xee\x17\xec\x82\xfc\x23\x31\
+\xad\x5b\x8e\x1c\xe7\x0c\xeb\x63\x27\x60\xd0\x90\xf1\xa4\xc3\xce\
+\x47\x04\xb9\x50\xca\x79\xec\x62\x79\x49\xf7\xeb\xa0\xb1\x19\xab\
+\x04\x87\x68\x21\xb1\x8b\x1c\x01\x05\x00\x50\x0a\x79\x55\x75\x2a\
+\x78\x61\x80\x97\x00\x40\x9a\x07\x49\x33\x21\x55\x35\x40\xe9\x60\
+\x9c\xa5\x2f\xe3\x20\x60\x07\xce\xd4\xe3\x56\xc8\x08\xef\xd0\x5a\
+\x04\xc4\xb4\x17\x95\x80\x52\x21\x1d\x8c\xc1\x1f\x5f\x9f\x82\xff\
+\x76\xbe\x50\x58\x68\xe3\x96\xdd\x24\x83\x7c\xb9\x71\x2b\x2f\x71\
+\xd3\x77\xe9\xc5\xb3\x5e\xe9\xf2\xe7\x11\x60\x80\xee\x4b\x53\xd5\
+\x1e\xbe\xaf\x34\x00\x25\x7c\xe4\x13\x64\xc5\x4c\x80\x2f\x77\x92\
+\xd0\xba\x50\xaf\xcf\xf7\x97\x1a\x29\x4b\x0d\x40\xf2\xc5\x7d\x21\
+\xf3\xda\x07\xe1\xe9\x3f\xbd\x0f\x1d\x2f\xbb\x5e\x08\x33\xf5\xa6\
+\xff\x0d\x1f\x37\x9b\x2a\x00\xb9\x85\xeb\x59\x86\xbe\x8e\x46\x04\
+\x37\xef\xd8\x2d\x4c\x97\x4c\x30\x85\x4b\x66\xf8\x7b\xab\xb4\x12\
+\xbb\x3d\xf0\x0b\x30\x20\x33\xf1\x3d\x82\x90\x89\x2d\x9a\xfc\xb5\
+\x1b\x21\x3b\x8f\x81\x80\xfc\xb5\x30\x63\xe1\x4a\xb8\xf0\x92\xde\
+\x62\x04\xce\x27\x44\x6a\xc4\xef\x38\xc5\xd0\x26\x87\x82\xaa\x22\
+\x92\x20\x05\x75\x52\x83\xe0\xeb\x73\x37\x7c\x3a\x68\x0c\x0b\xd2\
+\x5b\x58\xf0\xdf\x08\x79\x6b\xd6\x11\x88\xc9\x63\xdf\x03\xa5\x89\
+\xb7\xec\x2a\x87\x5d\xec\xd8\xe2\xf1\xc2\x73\x02\x33\x7e\x2c\xe9\
+\x13\x5f\xa0\xae\xc1\x94\x19\x96\x2e\x86\x28\x7a\x74\xe0\x08\x74\
+\x33\x6e\x21\x3d\x03\xec\x1d\xf7\xbd\xf6\x01\x32\xa4\x6a\xda\xbf\
+\x9f\xb8\x29\x68\x2a\x84\x2d\x27\xf4\xa7\x38\x70\xf0\x08\x81\x00\
+\xb2\xaa\x66\x80\x75\x45\xde\x5a\x68\xdf\x29\x83\xcb\xeb\xb2\xf3\
+\x36\xd1\xc3\x4b\xff\x32\xf0\xbb\xa5\x0a\x9f\x54\xfb\xd3\x08\x81\
+\xcf\xbc\xf2\x0f\x58\xcf\xf6\xf9\x97\x43\x27\x2a\x29\xed\xd6\x03\
+\x00\xfe\x98\x32\xe6\xff\xfe\x88\x5f\xb4\x58\x12\x8b\xdf\x8a\x11\
+\x77\x7f\xfe\xff\xed\x4a\x80\x19\x87\x63\xac\x00\xb4\x26\xe2\xb1\
+\x07\xba\x60\xab\xbf\x47\x78\x54\xeb\x8f\x63\x07\x45\x42\xa1\xe1\
+\x58\xfa\x46\x14\x1d\x68\x23\xac\x68\x45\x38\x54\x1b\x4e\x19\x2a\
+\xf4\xc7\x1f\x2b\x1a\x36\xe2\x28\x93\x85\x32\xfe\x1d\x49\x47\xec\
+\x35\x13\x3d\x3c\xfb\x6f\x23\xb2\x4f\x94\x98\x9d\xb9\x70\x05\x4c\
+\x9e\x93\x05\x49\x5d\xd2\x89\x15\x4f\xa4\x22\x49\x86\xf2\x9a\xbd\
+\x7f\x9c\x02\x48\xa0\xd2\x7f\x5f\x32\x52\x29\xdd\xb2\x07\x4e\x9e\
+\xfc\x01\x8e\x1d\x3b\xc9\xd6\x09\x38\x7e\xfc\x07\x18\x35\x71\x0e\
+\xb4\xed\x24\x4a\xdf\x78\xa1\x4c\xe2\xc1\x0d\x89\x74\x1f\x7f\x31\
+\x52\x38\x04\x1e\x82\x26\x96\x89\xf1\xec\xbf\x8a\xb2\x4c\x59\xf2\
+\xdf\x27\x32\xd6\x7d\xa2\x5f\xbd\xab\xbc\x8a\x66\xca\x37\x21\x00\
+\x10\x66\x39\x9c\x23\x50\xa3\x01\x81\x6a\x92\xd1\xdd\xc5\x00\x00\
+\xb6\x04\x2c\xe3\x82\x72\x64\x50\x13\x10\xe2\xe3\x76\x65\x3c\xd8\
+\x23\x08\xa0\xec\x9f\x83\x01\xbc\x1f\x47\xf8\x86\x8f\x99\x05\x69\
+\x99\xbf\x63\xdf\x33\x53\x79\xc3\xf3\x89\x94\x34\x51\xf2\x17\xad\
+\x0d\xe4\x36\xb4\x47\xab\xdf\xee\xd0\x36\xc5\x07\xbf\xba\xfc\x1a\
+\xe8\xd5\xe7\x1e\xe8\x73\xe3\xa3\xe0\xbf\x6a\x00\x81\x25\xdc\x6f\
+\x89\x02\x9c\xe9\xe7\x14\x0f\xfc\x7e\xd3\x74\x4b\xa8\xc9\xb9\x64\
+\xcb\x48\x64\xfb\x7c\xf5\xe6\x9f\xa3\x63\x1f\x11\xfc\xfb\xd0\x31\
+\xe9\x7d\xdd\x83\x34\x11\x80\x53\x05\xcb\xf2\x4a\x68\xca\x00\x8d\
+\x84\x70\xfa\x00\x39\x02\x1b\xb7\x96\x91\x68\x10\xf5\xd5\x09\x00\
+\x98\x3e\x0c\x72\x2c\x71\xaf\x16\xf0\xcd\xf2\xbb\x34\x69\xaa\x16\
+\xc2\x4c\x55\xd4\xaa\x59\xc7\xc0\xd8\xf2\xfc\x12\x58\x5e\xb0\x0e\
+\x86\x8d\x9b\xc5\x32\x60\x9f\xd0\xb7\x0f\x6a\x13\x26\x01\xd3\x7a\
+\x5a\x1b\x51\xe3\xa5\xf5\x74\xc1\x8f\x08\x50\x06\xdd\x35\xed\x46\
+\xf8\xe0\xd3\xa1\xb0\x0a\x41\x0c\x01\x99\x0d\x90\x83\x8b\x81\x01\
+\xac\xbe\x20\x97\xe1\xd8\x89\x1f\x28\xeb\xdf\xc7\x80\x40\x85\x10\
+\x93\x22\x00\x20\x26\x4c\x68\xe4\x91\xc4\x8e\x0e\xc0\xa0\xa1\xe3\
+\xa1\xab\xff\x46\x7a\x6d\xe4\x6a\x6c\xdf\x55\x41\xca\x88\x4d\xe8\
+\x3c\xd8\x7c\x88\x83\x80\xfd\x62\x7b\x80\xb7\x06\xd0\xb8\x6a\xee\
+\xc2\x55\xd0\x0e\xc9\xb1\xd4\xe3\xf7\xf1\xe0\x9f\x2c\xad\xbf\xfd\
+\x1a\xd9\x99\x2b\xf2\x71\xa0\xc0\xab\x6b\xde\xdf\xf4\x85\xc2\x8d\
+\xdb\x61\x1d\x3b\x87\x2e\xe9\x79\xb3\x9a\x28\x69\x1d\xc2\x6f\xeb\
+\x5c\x6f\x7f\x89\x51\xb5\xd8\x46\xe6\x82\x11\x48\x7a\xfe\x5f\xa0\
+\x55\x11\x49\x8e\x3d\x10\xc5\xfc\xe7\xbf\x34\x01\xe0\x41\x42\x72\
+\xcc\x00\xe0\xf4\x4f\x9a\xd0\x4c\x55\x93\xf9\x8d\x92\xbd\x9e\xde\
+\x09\xee\x77\x94\xc1\x8d\xfb\x64\xf5\x18\x61\x08\x7a\xb1\x7b\x50\
+\x87\x06\xf8\x40\x04\x39\x4c\xbf\x26\x20\x62\x44\xb0\x93\xb4\x03\
+\x80\x58\xcb\x61\x46\x54\x56\x6a\xa2\xbd\x4f\x66\xbb\xd8\x38\x91\
+\x8f\xdc\x5a\xf9\x12\x83\x7f\x9b\xf6\x3d\xe1\xd9\x97\xde\xa3\x1e\
+\xf3\x13\x2f\xbc\x2b\x32\x58\xbf\xa5\x2d\x64\x8e\x32\x65\x88\x20\
+\x96\xc9\x02\x5d\x1f\xb8\xe6\x96\xc7\xe1\xd4\xa9\x9f\x59\x66\x86\
+\xe2\x2a\x7c\xcd\x9c\xbb\x02\xda\x75\x46\xc3\x95\x3e\x14\x38\x13\
+\xe5\x7b\xb2\x0b\x6a\x52\x97\x00\x0b\xee\x8d\xec\xe2\xcb\x4b\xff\
+\xc8\x38\x27\xd6\xbf\x60\xfb\xeb\x19\x2a\x2e\x3e\x06\xd6\xc8\x82\
+\x79\x15\xf5\xeb\x31\x40\xef\x51\xa5\xe1\x1a\xd5\x22\xa0\xbf\x19\
+\x18\xc0\x6a\x00\xf2\x00\x50\x57\x7f\xb7\x90\x11\x26\x8e\x80\xf4\
+\x14\x90\x22\x42\xaa\x12\x20\x39\x01\xb2\xdc\xcf\xc7\xef\x56\xae\
+\xde\x40\x84\x40\xee\x14\xd7\x47\xac\xde\xa2\x02\x22\x66\xc3\xa9\
+\x2f\x9c\x06\x97\xb1\xe0\x75\xc3\x9d\x4f\xc1\x53\x7f\x7c\x17\xde\
+\xfd\xe4\x3b\xf8\xf2\xbb\x89\xf0\xed\xf7\xd3\x60\xe8\xd8\x19\xf0\
+\xf1\xe0\xf1\xd0\xf9\xf2\xeb\xa8\xac\xac\xbc\xe5\x75\x32\x93\xdd\
+\x2c\x4b\x08\x2a\x25\x78\x74\x15\x4b\x0c\x96\x19\xaa\x25\x83\x20\
+\x20\x21\x55\x66\xff\x9c\x4f\x80\xcf\xfd\xfc\x9b\xf1\x0c\x00\x6c\
+\x84\xac\xdc\xb5\xb0\x74\x65\x11\x2c\xce\x29\xa2\x51\xc4\x45\x38\
+\x92\xb8\xa2\x90\xdd\x57\x48\x6d\x02\xfc\x8e\xdc\xf5\xcf\x24\xfe\
+\xe9\xee\x8c\xf6\xac\x5f\xb5\x59\x28\xf8\x57\x29\xde\x05\x8e\x5b\
+\xe2\xcc\x7f\x6e\xf1\x46\xf8\xe7\x27\xc3\xc5\x54\x4e\x50\x59\x22\
+\x2b\x63\x29\xa5\x8f\xaf\x55\x03\xd4\xf9\xed\xe3\xd5\x0e\x6c\x7d\
+\x30\xf0\xf4\x9b\x6e\x57\xc3\x3b\x1f\x7e\x0d\x2b\xf3\x31\xf8\x6f\
+\x80\xd5\x6b\x4b\x69\x82\xe1\xe8\x89\x93\x50\xd5\xd8\x48\x9f\x87\
+\xce\x8b\x1a\x21\x0e\x84\xab\xde\xb4\x27\xae\x15\x36\xc6\x78\xbb\
+\x6c\x5f\x0d\x3c\xf7\xca\x7b\xf0\x3f\x6d\x2f\x83\x91\x63\xa6\x91\
+\xb3\x60\xa3\x00\x00\xa4\x1e\x48\x16\xc3\x6c\x21\x20\x68\x3e\x0c\
+\x73\x16\xad\x82\xf6\xa9\x7c\xff\xbb\x95\x5b\x9f\xa1\xd9\xf4\x6a\
+\x6d\x3d\x59\x0d\x90\xda\xf5\x82\x94\xf9\xf6\x07\x83\x61\xe3\xf6\
+\xdd\xf0\xd6\x3f\xbf\x16\xd5\x8e\x8c\x56\xa8\x00\xc4\xef\x15\xe2\
+\x7c\x0d\x8f\xf5\xfa\x67\x9c\xa1\xaa\x6c\x38\xa5\xbf\xa0\x4d\x9e\
+\x3d\x92\xc1\xda\xd9\xeb\xa3\xc7\xce\x59\xf8\xdf\x56\x31\xf0\xd3\
+\xf4\xd4\x39\xbf\x0c\x6a\x74\x1a\xd3\xf3\x85\x19\x81\x6b\xbd\x03\
+\x64\xad\x06\x04\x95\xfe\x40\xf4\x93\x31\x12\xc3\xdf\x49\xa6\xd8\
+\x88\xe3\xb5\xc2\x01\x80\x48\xed\x82\x58\xda\x1f\xf1\x99\x12\x85\
+\x8c\xa0\x24\xeb\x00\x20\x60\x13\xf6\x09\x2a\x62\x66\x48\x65\x40\
+\x73\x14\x4b\xe8\x90\x06\xed\x2f\x0c\xc0\xe4\x59\x59\x30\x7d\xc1\
+\x0a\x48\xb9\xa8\xb7\x72\x1a\x23\x00\xe0\x31\x42\x40\x4c\xa2\x18\
+\x03\x6c\xcb\x02\xd2\x77\x2c\xd0\x9d\x62\xd9\x3f\x02\x00\xe4\x00\
+\xe4\xac\x5e\x47\xf6\xc1\xee\x4e\x7d\xc9\x38\x88\x4b\x07\xa7\xab\
+\xcc\xe9\xd9\x97\xff\x4e\x65\x57\xaa\x00\xb0\xc5\x83\x8c\xcc\xfe\
+\x79\xe6\xcf\xd9\xe9\x75\x9a\xb1\x0c\xbb\xf0\xb3\x80\xb3\x71\xf3\
+\x0e\x0a\xd2\x7b\xd8\x85\x7d\xaf\x46\x0c\xe3\xab\x56\x91\x05\x31\
+\x38\x71\xf1\x20\x11\xb0\xf6\x71\x7e\x40\x19\x81\x80\x0a\x02\x01\
+\xb4\xca\xb8\x84\x30\x06\x32\xe9\x22\x88\x2d\x81\xaf\x87\x4d\x82\
+\x8e\x97\xf4\x15\xda\xef\x7d\x84\x0e\x82\x00\x01\xec\x3b\xb5\xeb\
+\x94\x41\xa5\xf8\x67\x5e\xf9\x27\xf5\xe3\x87\x8c\x9e\x06\x83\xbf\
+\x9f\x02\x83\x46\x4c\x84\x41\xc3\x27\xc2\x57\x23\x26\xc1\xe0\x91\
+\x93\xe0\xeb\x11\x53\xe0\xd2\x5e\x37\x09\x91\x25\xce\x8a\x4f\x54\
+\xc7\xc5\x0c\x20\x52\xd8\x4a\x69\x5d\x88\xec\x5f\xe7\x79\xb8\x08\
+\x04\xa4\x43\x9b\x94\x74\xd1\x4e\x48\x17\x7a\x05\x19\xaa\x9d\x80\
+\x19\xeb\xc5\xdd\xaf\x25\x91\xa5\x97\xff\xf2\x09\x7c\x37\x66\x26\
+\x0b\xfe\xc5\xa4\xec\xb7\x64\x25\xea\x0f\x14\x42\x76\x6e\x11\x2c\
+\xcf\x2b\x82\x15\xab\xd7\x40\xfe\x9a\x0d\x04\x7c\xf6\x88\xa0\x2a\
+\x5b\x2f\xd2\x9a\x59\x71\x2c\xf6\x56\xd3\xfe\xe3\xbe\x0c\x95\xbc\
+\xca\xb2\x47\x82\xaa\x0a\x12\x0e\xca\x5f\x53\x0a\x4f\xbe\xf8\x37\
+\xee\x9c\xe7\x35\x5d\x25\x13\x54\x3b\x4a\x9e\x7b\x22\x80\x26\xc9\
+\xeb\x09\x27\x4d\x12\x4f\x84\xad\xf3\xda\x75\x63\xeb\x0a\xb8\xf8\
+\x8a\x2b\x61\xd8\xa8\x69\x54\x79\x38\xc6\xce\x2b\x2c\xed\x17\x93\
+\x40\xd1\x56\xd8\x56\xb6\x87\x8e\x39\x37\x1a\x32\x83\x7f\xb5\x32\
+\x18\x6a\xe6\x96\xc4\xec\xdc\x29\xaf\xac\x83\x57\xde\xfc\x10\x9e\
+\x7a\xf6\x75\x68\x68\xe6\x93\x29\x1c\x04\x70\x00\xd0\x44\xbe\x09\
+\x07\x21\x7b\xe5\x1a\xe8\x70\xa1\x41\xbf\x07\x54\xf9\x33\x99\xfc\
+\x01\x8b\x08\x90\x45\xc7\x43\x38\x05\x26\x8a\xe0\x8f\xbe\x02\xbf\
+\xe9\x79\x23\x94\x6c\xde\xc5\x80\xcb\x66\x48\xfa\x75\x6f\x47\x00\
+\xc0\x49\xb7\x82\x14\x1c\xd7\xb5\x3a\x08\xff\xf7\x12\xd8\xa2\xb1\
+\xf0\x8d\x18\xb4\x6b\xce\xb4\x6a\x12\x4a\xd0\x8e\x6c\xd4\x16\xfc\
+\x5f\xb5\xcf\x79\x05\xa0\xd5\x74\x00\x22\x8d\xcb\xf9\x23\x04\xd0\
+\x30\x00\xc0\x1b\x2e\x68\xfa\x23\xd8\x15\x47\x43\x69\xb1\x1e\x00\
+\x23\xac\x4f\x80\xd9\xbb\x33\xfd\x0c\x22\xf6\x96\x3c\xd1\x02\xb1\
+\x7d\x1f\x85\x13\xff\x09\xcf\xd6\x75\x87\xd5\x3e\x88\x3e\x76\xe9\
+\xac\xd7\x1d\x08\xd3\x06\x48\x57\xe3\x36\x3a\x1f\x80\xac\x4a\xa9\
+\xf4\x9c\x46\xbd\x79\x94\xef\x9d\xbd\x28\x07\x5e\x7a\xeb\x63\x22\
+\x74\xe1\x05\x50\x95\x36\x3d\x4e\x95\x0c\xee\x19\xd0\xae\x53\x10\
+\xaa\x6a\xf7\x53\xf9\xff\xe4\xa9\x1f\x58\x40\xa8\x86\x8b\xbb\xdd\
+\x44\xc1\x1f\x7d\x03\xe4\x38\x95\xca\x52\xd9\xfb\xe5\x17\x95\x12\
+\xf1\x0f\x4b\xae\x28\x5b\x8b\x32\xbf\x98\xb9\xef\xa5\xe0\x8f\xd9\
+\x7e\x03\xad\x2a\x06\x00\x24\xc1\x0b\x75\xe0\x31\xa3\xc7\x09\x00\
+\x0c\xd0\x18\x14\xe4\x18\x1b\x3e\x67\xaf\xc6\x62\x2f\xaf\x14\x44\
+\xc2\x4a\xb3\x7c\x5d\x56\x61\x4e\x0d\x48\x77\x41\x1c\x1b\x94\xdc\
+\x00\x6a\x07\xec\x28\x87\xd2\xed\xe5\xf0\x87\x3f\xbe\xc3\xf6\x4d\
+\x4f\xd3\x0d\x4e\xaa\x20\xb2\x6d\xca\xa5\x57\xc1\x83\x4f\xff\x15\
+\xbe\x1a\x36\x05\x46\x4c\x98\x0d\xc3\xc7\xcf\x84\x61\x2c\xcb\x1f\
+\xca\x00\xc0\x37\xdf\x4f\x66\x01\x5f\x00\x80\x61\x13\x61\xf0\xf0\
+\x49\x70\xcb\xbd\xcf\x12\xf9\x51\x06\x76\xb7\xd2\x3b\x77\x70\x89\
+\xd4\x4a\xff\xe6\x6f\xca\x54\x42\x33\x83\xa9\x04\x00\x41\xa1\x89\
+\x1e\x34\xab\x5f\x49\x82\x4c\xd8\xa1\x17\x2d\xec\xcb\x27\x77\x09\
+\x42\xff\x1b\x07\xc0\x8b\xaf\x7f\x08\xa3\x26\xce\x25\x7e\x40\x4e\
+\x7e\x09\x5f\x05\x6b\xd9\x76\x1d\x91\xfa\xb0\xaf\xbf\x99\x81\x21\
+\xdc\x6f\xd2\x96\x58\x4d\x58\x94\xcb\x69\x0b\x6e\xcf\xbc\x6b\xaf\
+\x79\x1f\xf2\x2e\xf0\x78\xa0\xd2\x22\xb6\x1a\xee\xb8\xef\x79\xfe\
+\xb9\x2d\x42\x51\x1a\x70\xf5\xf0\xd2\x3a\x05\x59\xd1\x16\x92\x8b\
+\xfb\x2e\xf4\x20\x85\xc1\xf3\xbd\x3d\x61\xf9\xaa\x12\x1a\x2b\xc5\
+\x0a\x00\x1a\x39\xa1\x0a\xa4\x34\x71\xc2\x16\x04\x12\x3d\x11\xb8\
+\xf0\xe0\x6f\x5a\x0e\x4b\x0b\x62\x3e\x52\x88\x53\x03\xf5\xf0\xe8\
+\xd3\x2f\x73\x67\x4a\x2a\xfb\x9b\xc1\x1f\xc7\x54\x57\x15\x6c\x84\
+\x4e\xbf\xe9\x23\x46\x3a\x7d\x21\xb6\xb4\xca\xea\x59\x4b\x46\x42\
+\x0d\xb5\xd8\xf9\xdd\x11\x5d\x06\x83\x0c\x14\x8e\x85\xb5\xec\x5c\
+\x1d\xf0\xf4\x5f\x04\xff\x23\x43\x8d\x15\x4a\xb9\x5b\x93\x53\x65\
+\x2e\x5e\xc1\x0c\xda\x26\xa0\xfe\x3b\xe4\x36\x0e\xfe\x7f\xd9\xf9\
+\xf6\xd6\x0f\xb6\x46\x14\xa1\x39\xe3\x34\x44\xf2\x62\xdb\x77\xad\
+\xff\x3d\x82\xa2\x5d\xd8\x2a\x00\x20\x96\x32\x88\xe1\x5c\xa2\x74\
+\xda\x99\x1e\xed\xb9\x1e\x73\x4b\xea\x6a\x62\x99\x19\x4e\x2c\x23\
+\x81\xf1\x56\x16\xfc\xce\xa5\x2e\xed\xfd\xe9\xf3\x44\x21\x1b\x46\
+\xcf\xd6\x6d\x41\xdf\x1b\x49\x4d\x2a\x14\xf5\xaa\x5e\xa2\xfa\x4c\
+\xd1\xdf\xdf\xe5\x09\xd5\x0e\x70\x3b\x88\x1b\xd1\xc5\x45\x18\x99\
+\x24\xa4\x04\x4d\x16\x72\x72\x30\x44\x91\x2c\x51\xf4\x61\xb9\x7a\
+\x63\x2f\x18\x31\x7e\x36\xcc\xc9\xca\x83\xcb\x7a\xdd\x48\x59\x98\
+\x3b\xc9\xaf\x08\x91\x12\x04\xe8\x0b\x85\x68\xf0\x02\x7e\xe3\x9d\
+\x4f\xc3\xb1\xe3\x3f\x10\x23\xfb\x60\xcb\x71\xe8\x7b\xdd\x83\xdc\
+\x2e\x98\xb2\xe5\x0c\x0a\x9a\x64\xc3\x8a\xcc\x6f\x76\x3b\xe3\xea\
+\xfb\xa1\xe5\xe8\x29\x22\x5c\x1d\x3c\x7c\x98\xca\xfb\xbb\xf7\x69\
+\x99\x3f\xbb\x58\xa3\xec\x6b\x95\x50\x77\xab\x41\x43\x18\x32\x85\
+\x69\x24\x90\x80\x00\x60\xeb\xb6\xdd\x14\x88\x38\x50\x30\x59\xec\
+\x15\xd5\xdc\x66\x98\x2a\x03\x95\x1a\x99\x4d\x07\x02\x64\x2c\x54\
+\x25\x40\x80\x1c\x1b\xe4\xc6\x3b\xa5\x0c\x00\xdc\x71\xdf\x73\x94\
+\x91\x4a\x27\x4c\xbc\x58\xb7\x4d\xe5\x3c\x86\x9b\xef\x7d\x11\xbe\
+\x19\x3d\x13\x46\xb2\x20\x8a\x81\x7f\xf8\xb8\x19\x30\x6c\xdc\x34\
+\x06\x00\xa6\xc1\x50\x96\xa9\x7e\xcb\x00\xc0\x60\x01\x00\x06\x0d\
+\x9b\x00\xef\x7d\x34\x84\x08\x81\xb8\x3f\x13\xf4\xf1\xb8\x64\xc3\
+\x59\x06\x56\x3b\x4f\xe5\x6f\x48\xb6\x5f\x5c\x29\x3c\xf8\x63\x30\
+\x49\x10\x6d\x18\xaa\x06\x90\x50\x51\xd0\x04\x0f\xec\x98\xb8\x3a\
+\xf8\x04\x10\xf0\xd1\x6d\x57\x07\x01\x08\x92\xd2\xa8\xac\xfd\xeb\
+\xee\xd7\xc1\x03\x8f\xfd\x19\x06\x7e\x33\x16\xb2\x72\x4b\xa8\xcf\
+\xbe\x62\x75\x09\x2c\xcf\x2b\x84\x6c\xb6\x70\xc4\x0f\x67\xf5\xc9\
+\x95\x50\xf2\x28\x84\x3e\xc3\x2e\xb9\x04\x18\x90\xa0\x6a\x8f\xd0\
+\x6c\xd8\xce\x32\xf3\xd5\xc5\xa5\x70\xe5\x4d\x8f\x8a\xf3\x2c\x48\
+\xbd\x7e\x8b\xc2\x9d\x02\x00\x22\xf8\x27\xa7\xa9\x2a\x00\xf1\x29\
+\x10\x00\xb4\xbf\x02\xde\xf9\xe0\x2b\x68\x64\xc1\xfa\xc8\xb1\x53\
+\x70\xed\x2d\x0f\x43\xb0\xff\xdd\x30\x6e\xf2\x1c\x06\x00\x77\x90\
+\x77\xc3\x46\x34\x71\xda\xca\x6f\x23\xd1\x13\xab\x45\x5c\xf8\xa8\
+\x41\x79\x2e\xf0\xf3\x81\x57\x94\xb2\x57\x16\x40\x63\xe3\x41\x0e\
+\x00\xb0\x05\xc0\xb2\x7e\x14\x0c\x5a\x95\xbf\x11\x3a\xff\xa6\x2f\
+\x27\x31\x62\xf6\xdf\xc1\xb0\x99\x88\x85\x93\xf2\x0d\x5a\xc6\xfb\
+\xf0\x1c\xc1\xf6\x0c\xb6\x89\x7a\x5f\xf7\x10\x03\x00\xbb\x60\xc6\
+\x82\x95\xec\xdc\x0f\x08\xde\x8c\x6c\x9d\x89\xdf\x21\xee\x13\x05\
+\x82\x34\x00\xa8\xae\xa9\x81\x30\x56\xe2\xbf\x50\x59\x1a\xdf\x3f\
+\xc9\xb0\x56\xa2\x7e\xa9\x25\xbf\x7b\x4c\xd7\xc8\xd3\xed\xfd\x1b\
+\xd0\x6a\x44\x41\x8f\x6d\xe9\x2d\xe9\x56\xdc\x7f\xc4\xcb\xf2\xb4\
+\xca\x18\xa0\x11\x45\xdb\xde\x08\xc3\xa0\x37\x1c\x49\x74\x6e\x21\
+\x50\xc0\x2f\x5a\x22\xeb\x56\xa4\x26\xbf\xf5\x76\x44\xd4\x15\x4f\
+\x99\x3e\x12\xe1\xcf\xd6\x7b\x72\x12\x30\x8a\x09\x04\x18\x51\x14\
+\x02\xe3\x54\xa2\xd2\x00\x89\xdb\x7e\xb2\xc4\xe9\x0d\x10\x32\xea\
+\x97\x6c\xaa\x0c\xba\xec\x20\xc0\x52\x1d\xc8\xe0\xde\xe6\xa2\x4f\
+\x7b\xf5\x2d\x8f\xd1\xe8\xdf\xc0\x21\x13\xe0\xdc\x76\x3d\x78\xff\
+\x9f\x2e\x4a\xfc\x02\xc0\x99\xd0\x86\x79\x4c\x93\xfc\x8a\xf4\x36\
+\x88\x3d\x07\xe7\xa7\x51\x00\xe8\x99\x3f\xbd\xc7\x55\xd4\x64\xf0\
+\x17\x46\x2a\x6d\x15\xe3\x3b\x03\xbe\xfc\x66\x1c\x11\x04\x8f\x1e\
+\x3d\x4e\x6a\x6c\x7b\x45\xe6\x5f\xa1\x82\x78\x03\xd4\xd4\x70\x2d\
+\x78\x0c\xfe\xa8\x13\x5f\x57\xd7\x4c\xb6\xb0\xf8\x18\x2c\x57\xa3\
+\x49\x0e\x66\x9d\xa4\x11\x4f\x40\xa1\x9e\xa6\x08\xaa\xaa\xf9\xb6\
+\x52\x56\x06\x24\x38\x20\x41\x19\xd1\xd3\xc6\xb5\xb7\x5a\xe3\x04\
+\x54\x50\x25\x00\x7d\xdd\x6f\x65\xd9\xba\x59\xf6\x15\x0c\x7e\x6a\
+\x73\x64\xc0\x1d\xbf\x7f\x19\xc6\x4e\x5f\x0c\xdf\x4f\x9a\x07\x23\
+\x65\xe6\x4f\x00\x60\x3a\x7c\x37\x76\x3a\x0c\x1d\x33\x0d\x86\x8c\
+\x9e\x02\xdf\x4f\x98\x05\xe3\xa7\x2f\x82\x69\x73\x57\xb0\xfd\xfa\
+\x28\x0f\x2a\x49\x69\x66\xa0\xf3\x98\x55\x80\xf0\x53\x2e\x41\x4b\
+\xef\x1f\x8f\x53\x9b\x94\xa0\x20\x61\x66\x8a\x92\x7f\x3a\x2d\x0e\
+\x00\xb4\xf3\x2a\x49\x30\xd2\x93\x78\x0b\xc1\x25\x81\x40\x92\x4f\
+\x10\xd5\xd2\x15\x91\x13\xdb\x07\x38\x55\x70\xfb\xfd\x2f\xc0\xa7\
+\x5f\x8f\x86\xac\x9c\x35\x90\x9d\x8b\x72\xc5\x28\x61\x9c\x0f\x4b\
+\x56\xae\x86\xc2\x75\xa5\xb0\x8d\xa6\x29\x38\x50\xa2\xb2\xff\x1e\
+\x2e\xd5\x8c\xb7\x4d\x2d\x86\x2a\x3a\x26\x7b\x19\x10\xc0\x7d\x8a\
+\x1e\x02\x28\x1b\x9c\x28\xf6\x61\x82\x54\xc2\x54\xfc\x06\x9f\x68\
+\x33\x69\x2d\x00\x22\x53\x72\xe7\xc5\xde\x57\xdd\xcb\x5e\xa7\x92\
+\xb2\xff\x81\x83\x47\xc1\xb9\x17\x70\x8d\xfd\xc7\x9f\x7b\x53\xc8\
+\x39\xef\x84\xcd\xc4\xd5\xe0\x4b\x12\x38\xb1\xa5\x23\xb5\x0b\x2a\
+\x85\xe8\x91\xac\x14\x61\x45\x00\x01\x00\x92\xfe\x70\x4c\xb0\xb1\
+\xe9\x10\xac\x5a\xbd\x1e\x3a\x5d\xd2\x9b\x00\x12\x96\xfe\xa5\x8e\
+\x81\x9e\xfd\x47\x5e\xba\x95\x36\x57\xd2\x24\xb2\x27\xea\x62\xb0\
+\x73\x60\xfd\x96\x32\xe8\x7f\xc3\x23\xec\x1c\x12\xdc\x11\x69\xc0\
+\x25\x15\x41\x95\x98\x90\x6d\x6b\x4f\xc4\x3c\x91\x64\xc9\x83\x67\
+\x25\xfb\xff\xaf\x7a\x05\x88\xd6\xa3\x49\x8e\x6d\x6d\x00\xf0\x4b\
+\x54\x33\xce\x46\x0b\xc0\xdf\x9a\x66\x40\x0e\x99\xab\xd7\x17\x56\
+\x6a\x32\xbc\xda\x9d\x5f\x29\x14\xa9\xb2\x96\x47\x1e\x44\x2d\x03\
+\x57\x15\x00\x23\x62\x89\x23\x3c\x00\x88\x45\x54\xc8\xb0\xb8\x07\
+\xba\x1d\x66\x63\xdd\x1e\x67\xd1\x9c\xb0\xad\x10\x6f\xa4\xef\xef\
+\x8f\xc1\x70\xc8\xf6\xa3\xf5\x68\x23\x78\xa7\x61\x08\x14\xde\xae\
+\x53\x1b\xbf\x52\xfd\xd7\xa0\x36\x8a\x94\x21\x00\x81\x30\xbb\x61\
+\x17\x25\x0c\x22\x9f\x7c\x3d\x16\x16\xae\x28\x84\x5b\xef\x7b\x5e\
+\x04\x2b\x9e\x49\xba\x93\x02\x7c\x79\x34\xc2\x93\x20\x0d\x12\xe3\
+\xfd\x82\xae\xb0\x65\xfb\x5e\x38\x72\xf4\x24\x8c\x1c\x37\x8b\x07\
+\x35\xea\x95\x67\x5a\xfd\xd3\x95\x87\xba\xc1\x82\x44\x0d\x55\x0b\
+\x8e\x1e\x3d\x01\x4d\xec\x42\x8c\x73\xe8\x15\xa2\xe7\x8f\x81\xbb\
+\xaa\x86\x67\x6f\x58\xf2\xc7\xac\xbf\x0e\xed\x5e\x1b\x50\x4e\xb8\
+\x19\x6a\xd8\xc5\x7c\x2b\xbb\xf8\x23\x00\xc0\xe0\xc3\x41\x02\x07\
+\x01\x68\x14\x53\x8d\xa5\xe0\x1a\xae\x15\x5f\x55\x6b\xaa\xd9\x61\
+\x65\xa0\x42\xf0\x04\x10\x04\x48\x0d\x01\xce\x09\xa8\xa4\xe9\x82\
+\x87\x9f\x7e\xc3\x0c\xcc\x74\x21\x0f\x0a\xa1\xa3\xde\x54\xb9\x48\
+\xfd\x4d\x3f\x18\x33\x75\x01\x8c\x62\x19\x28\x02\x80\x11\xec\xfb\
+\x0e\x1f\x37\x93\x82\xff\xf7\x93\x66\xb1\x8b\x7d\x16\xcc\xcf\x5e\
+\x0d\x0b\xb2\xf3\x60\xee\x92\x3c\x18\x3d\x79\x11\x05\x34\x0a\x2c\
+\x49\x52\x18\x88\xeb\x67\x10\xb7\xc2\x6b\x1f\x5f\xb5\xb5\x77\xa4\
+\xed\x29\xf6\xfd\x93\x33\x28\xd0\xb7\x49\xe6\xfd\xfe\x36\x29\x82\
+\x3d\x9f\x6c\xfa\x15\xb8\xe9\x78\xf9\xd4\x14\x01\x05\x56\x8f\xcc\
+\x30\x0d\x01\xe4\x0c\x53\xde\x56\xb4\x11\x24\xc0\xc1\xef\xdb\xe9\
+\xb2\x2b\x61\xc0\x1f\xfe\x02\xa3\xa7\x2c\x84\x25\x39\xc5\x5c\xa6\
+\x78\x79\x3e\x2c\x62\x60\x00\xe7\xf2\x51\x6a\x79\x47\x59\x05\x8d\
+\x56\xea\x95\x80\xdd\x58\x09\x10\xa0\x00\x49\x97\x08\xb0\x76\x97\
+\x57\x43\xf1\xba\x6d\x10\xbc\xf2\x7e\x61\x20\x14\x54\x2d\x0a\x05\
+\x00\xb4\xd2\x3f\x69\x27\x10\x07\xa0\x07\x24\x26\xf7\x84\x45\xd9\
+\xf9\xd0\x7c\xe0\x20\x11\x3f\xdb\x75\x4c\x83\x73\xb1\x2d\xe5\xed\
+\x45\x24\x46\x49\xd8\xdc\x82\x6b\x47\x19\xf1\x37\x4a\x89\xbf\xc1\
+\x47\x38\x91\x27\x82\xc7\xb7\x42\xb4\x93\xa4\x0a\x22\x92\x4d\x51\
+\x96\x1a\xab\x0a\x78\xee\xe5\x16\x96\xc2\x85\xec\x3b\xab\xf6\x0b\
+\x8d\x5c\xa6\x59\x8d\x75\x62\x94\xcc\xd5\xcf\x75\x02\x3c\xa9\xbd\
+\xe1\x91\x67\xdf\x86\xf5\x5b\x77\xc1\x17\x0c\x24\xd3\x04\x09\x4d\
+\x81\x38\x70\x01\x54\x45\xd0\xe0\x53\x07\x0a\x04\x04\x22\x78\x93\
+\x18\x67\x9d\x17\xf0\x4b\xb7\x00\x54\x32\xe9\x31\x4c\xc9\x65\xc5\
+\x43\x8a\xa7\x62\x1b\x88\xd2\x8e\xfd\x65\x35\x01\x5c\xad\x08\x8e\
+\x38\x00\xf0\xb7\xb6\x1d\xb0\x11\xa1\x04\x1f\xd9\xed\xce\x25\x96\
+\xb5\x57\xaf\x97\x8e\xad\xfa\xd9\xe1\x33\xe6\x58\xad\x76\xa3\xe9\
+\xf3\x1b\xca\xc9\xd0\x5c\xc1\xb0\x27\xb3\xdb\x51\xe8\x27\x10\xc3\
+\xe8\x60\x30\x86\x13\x2e\x42\x0f\xdf\x13\x49\xd5\xcf\x88\x09\x00\
+\x38\x4f\x15\x98\x46\x1a\x3a\x00\x48\xd0\x5c\xfb\xb8\xbe\x39\xcf\
+\x48\x2e\xee\x7e\x13\x5d\xec\xe7\x65\x17\x40\xfb\xce\x19\x2a\xc8\
+\xcb\x80\x61\xee\x37\xbf\x3a\x9e\x5c\xac\xa6\x3b\x5c\x9e\x76\x23\
+\xb4\x1c\xff\x11\x4a\x36\xee\x84\x0e\x9d\x84\x20\x91\x98\x75\x27\
+\xc6\x7b\x4a\xd0\xa2\x18\x88\x63\x6a\x27\x4f\xfd\x44\x00\xe0\xd8\
+\xf1\x53\x14\xdc\x2b\x85\xec\x2c\x92\xb5\x30\x78\x63\xf6\x5f\x4b\
+\x7e\xf0\x8d\xe4\x1e\xc8\x2d\x6d\xd9\x85\x1b\xbd\xee\xeb\x9a\x69\
+\x26\x1f\xfb\xf5\x58\x9e\xe6\x64\x2f\x6e\x0d\x8b\xcf\xab\x11\xaf\
+\x21\x35\xe5\xab\x6b\x45\x2b\xa1\x86\xaf\x7d\x42\x4e\xb6\xbc\x8a\
+\x5b\xf0\x62\xd6\x8a\xc1\xff\xfd\x4f\xbe\x23\x0d\x7f\xb7\x6c\xe9\
+\x60\xb0\xea\xc8\x47\xfe\x12\xa9\xa7\xdb\x1b\xce\x67\xdb\x47\xfe\
+\xf0\x16\x4c\x9e\x9b\xcd\x02\xfe\x1c\xd2\xc3\x1f\x33\x65\x3e\xcc\
+\x59\xb2\x8a\xd8\xf5\x68\x23\xbc\x90\x2d\x04\x00\xf3\xb3\xf2\xe0\
+\xb9\x57\x3f\xa0\xfd\x64\x66\xff\x72\x9c\xcc\x67\x02\x0d\xc9\x2e\
+\x47\xd7\x41\x6f\x40\x1b\x9f\x33\xc1\x9b\x4b\x94\xfa\x71\x9d\x87\
+\x20\x40\x54\x6d\x5c\x74\x1b\x97\x41\x3a\x01\xa4\x15\xe0\xe1\x95\
+\x1b\xce\xeb\x90\xd5\x00\x39\xbf\x2e\x7e\xaf\x16\x5d\x08\x99\xc1\
+\x4a\x80\x96\x21\x46\x1c\xd3\xa0\xef\x8d\x0f\x51\x1f\x1b\x4d\x6e\
+\x16\x2c\x47\x60\x93\x4b\xe4\xc1\xd2\xed\xbb\xa9\x1a\xb0\xab\x7c\
+\x9f\xc9\x0d\xd0\x5b\x03\x28\xe3\x5c\xce\x9d\x0d\x11\x18\x14\xad\
+\x47\x10\x70\x9f\x16\x64\xd3\x84\x60\x52\x5a\x08\x00\x20\x2d\x05\
+\x16\xe8\x5f\x7c\xf5\x9f\x2c\x78\xd7\xb2\xec\xff\x38\x3c\xfc\xe4\
+\xab\x34\x56\x79\x2e\xdb\x97\xb7\xde\xf3\x0c\x81\xbf\x2d\x3b\xcb\
+\xc8\xee\x79\x1b\xae\x9d\x7b\x61\xf4\xa4\xb9\x30\x7e\xfa\x42\xd2\
+\x3c\xc0\xe9\x06\xe2\x08\x94\x6e\xa3\xcf\x51\x51\xdd\xa0\x9d\x5f\
+\x8d\x74\xce\x20\x99\x10\x0d\xa9\x3a\xff\xf6\x1a\x1e\xac\xbd\xe9\
+\xd6\x00\xe4\x35\xcc\x6a\x5a\x72\x30\x8c\x99\x96\x0d\x00\x58\xda\
+\x01\x99\xa4\x9e\x99\x72\x49\x7f\x58\xb3\x69\x27\xac\x61\xbf\x8f\
+\xce\xbf\xbd\x96\x00\xb7\x6e\x77\xcb\xdb\x00\x41\x73\x8a\x40\x0b\
+\x7c\x66\x15\xc0\x88\x40\x34\x3e\x33\xa2\x9c\x3b\x4c\x2b\x54\x0f\
+\xb6\xfa\x75\xd3\x9d\x1c\xaf\x12\x5f\x30\x8c\x34\xbb\x3f\xfc\x9c\
+\xbb\xc7\xbc\xce\x28\xde\x8c\x47\x7f\x6f\x23\x8a\xe8\x91\x61\x4b\
+\x26\xc3\x11\xd5\xad\xc6\x4a\x2e\xc7\xe4\x2d\xba\xf2\x6a\xc8\xfe\
+\xf4\x9c\x0e\x5f\x23\xd6\x4a\xb2\xbf\xb5\x2b\x00\x81\x30\x64\xb6\
+\xd8\x01\x40\x58\xa6\xbc\x12\xd5\xf1\x5b\xaa\x00\x6e\x8f\x11\x41\
+\x97\x3f\xe8\x60\x09\x1c\x6d\x05\x6c\x5b\x3d\xfb\xc7\x03\x12\x0c\
+\xdf\x9b\x51\x20\x26\x10\x06\x00\xc8\x3e\x54\xa4\x03\xe4\x3f\x0d\
+\xdd\xee\xf8\xdd\x1b\xa3\x8f\x11\xf9\xd5\x09\xa2\x97\x97\x55\x60\
+\xa1\x3e\x2c\xcf\x20\xa5\x91\x0f\x5e\xfc\x9e\x78\xee\x5d\x58\xb6\
+\xaa\x08\xde\xfe\xe0\x5b\x0a\x32\xf8\xd8\x44\x15\xf8\xb5\xad\xb8\
+\x28\x51\xb0\x21\x00\xd0\x0d\xfe\xf4\xda\x07\xd0\x7c\xe8\x38\x04\
+\xfa\xfd\x8e\x67\x75\x14\xd0\x32\xd4\xdc\xba\x5b\x65\xff\x9c\x07\
+\xf0\xe1\xa7\xc3\xe0\xe4\x89\x9f\xc8\x87\xfd\xd8\xd1\xe3\xec\x82\
+\x5c\x47\x99\x3a\x05\xee\xda\x06\x91\xd1\x37\x8a\xb2\x7f\x23\x95\
+\xfd\x1b\x58\xf0\x6f\x64\x20\xa0\x91\x01\x80\x86\xc6\x66\xca\xf8\
+\x76\xec\xdc\x43\xa5\x5e\x04\x09\xb5\x18\xfc\x19\x08\xc0\x6d\xad\
+\xf4\x90\xc7\x5e\x30\xf1\x07\x1a\xc5\xeb\xf2\xf7\xa8\x12\x6d\x82\
+\x8a\x6a\x6e\xc1\x8b\x0c\xf7\xc5\x0c\xf8\x5c\x90\x22\x34\xde\x93\
+\x7c\x4a\xc3\x3f\x78\xf5\x83\xec\xa2\x7d\x1d\xcf\xdc\x3a\xf6\x81\
+\xb6\x0c\x04\x24\x75\xe9\x03\xa3\x26\x2d\x84\x89\xb3\x16\xc3\xcc\
+\x85\x2b\x21\x2b\x77\x0d\x2c\x65\x01\x72\xe9\xf2\x02\x58\xb4\x9c\
+\x03\x80\x85\xcb\x56\xc3\xc2\xac\x7c\xe8\x73\xed\x43\x6c\x3f\xf9\
+\x15\xcb\xdd\xad\xda\x69\x42\x52\xd6\x62\xb9\x1d\x10\x3d\xfe\xd0\
+\x1e\xb3\x2c\xf5\x73\xb2\x1f\x77\x4f\xe4\xd5\x00\x03\xce\xc3\x91\
+\x20\x2f\x3f\x26\x6d\x14\x08\xd0\x88\x84\x49\x7e\xd5\xc2\xe1\x53\
+\x06\x41\xae\x3c\xe8\xcd\xb0\x4d\x8b\xf0\x63\x25\x95\x21\x39\x5f\
+\x27\x8d\x8c\x8e\x7c\x7d\xee\x84\x4f\xbe\x1a\x4d\xce\x90\x0b\xf0\
+\x7b\xae\x28\x80\x42\xac\x06\x94\xf3\xd1\x4a\x5a\x28\xbc\x84\x7c\
+\x81\xdd\xa6\xe6\x02\xde\xde\x85\x40\x61\xf7\x3e\x92\xfc\xed\x77\
+\xfd\x00\xae\x14\xd8\x81\x97\xf9\x79\xc6\x9f\xa6\x40\x4b\x82\x30\
+\x13\xba\xa8\xeb\x95\xc4\xf3\x68\x69\x39\x02\xab\x8b\x36\xd1\x79\
+\x86\xf2\xd4\x6e\xf6\xf8\x69\x73\x96\x92\xbf\x03\x8a\x37\x21\x10\
+\x18\x3b\x69\x3e\xf4\x61\xa0\xf2\x82\x8e\xe9\x6c\x05\xe0\x99\x3f\
+\xbe\x0b\x6b\x4b\x77\x92\x5b\x24\xb9\x46\x6e\xda\x46\x32\xc0\x4a\
+\x02\x19\xc1\x40\x6d\x13\xcc\x59\x94\x03\xa9\x17\xf7\x15\xfd\x78\
+\x69\x65\x6d\x63\xfb\x27\x07\xcd\x15\x03\x00\xb0\xf0\x01\xbc\x42\
+\x20\x8b\xfd\xbe\x3e\xff\x76\x3c\xac\xdb\xbc\x13\x9e\x7c\xe1\x3d\
+\x93\x80\xab\x27\x26\xaa\x6d\x67\x88\xaa\x8d\x56\x29\xb5\x54\x4f\
+\x1d\x12\x22\x8b\xa4\xf9\x59\x92\x84\x3f\xa3\x2a\x40\x3c\x63\x75\
+\x86\xf9\x3d\xf5\xb8\x91\xe4\xd3\x62\x4a\x30\x4a\x49\xdf\x88\xc0\
+\xee\xf7\x47\x69\x09\xf8\xa3\x5f\x8b\xb5\x18\x12\x3f\x18\x0a\x58\
+\x0c\xeb\x4e\x8f\xc8\xc9\xf9\x18\x67\xa1\x05\xe0\x8f\x20\x9a\xe3\
+\x8b\xa1\x0f\x6e\x84\x21\x45\x18\x96\xf2\x96\x59\xe2\xf1\xdb\xb2\
+\xf5\x68\x4c\xf8\xc8\x13\x09\x2e\x59\x2e\xf3\x88\xcf\x2b\xc1\x86\
+\x36\x7b\xec\xf2\x18\x71\x8c\x87\x38\xf9\x0e\xf8\xc2\x7c\xdf\x58\
+\x38\x0d\xb1\x92\x5e\xa2\xb7\x01\xc2\xeb\x2c\x98\x00\xc0\xbc\x80\
+\x88\x13\x46\xfb\x51\xf0\xfe\xb1\x50\xf3\x63\xf7\x8f\x61\x17\xd1\
+\xe5\xb9\xc5\x90\x81\x01\x8b\x5a\x02\x0c\x1c\xd8\x83\x3f\x96\x8e\
+\x3d\x72\x2e\x3a\x4d\x64\x6a\x57\xd0\xcc\xf4\x1b\xef\x7d\xce\xcb\
+\xb3\x49\xb2\xfa\xc0\x33\x9b\x04\xaf\x49\x8c\xa2\x4c\x9a\x9d\xf8\
+\x6b\x37\x6c\x87\x13\xa7\x50\x27\xe0\x24\x69\xb0\x63\x60\xc6\x55\
+\x5b\xdb\x28\x02\x38\x0f\xe2\xe8\x13\xcf\x83\x7f\x33\xd9\x08\x63\
+\xf0\x6f\x14\x02\x2e\x38\xb3\xbf\x7d\x57\x39\xb1\xf7\xf1\xb9\x75\
+\xf5\xbc\x4d\x50\x4b\xfe\xf2\x8d\xf4\x37\x7f\x9d\x26\xda\x22\x33\
+\x1c\xdb\x09\x35\xd4\x56\x10\x2d\x03\xe2\x07\xd4\xc2\x9e\xf2\x5a\
+\x30\x7a\xdf\x69\x96\xcc\x85\xf5\x6f\x8f\xf4\x3b\x68\x8e\xff\x8f\
+\x6f\x7c\x04\x6d\xd9\xfe\x68\x9b\x8a\x15\x80\xbe\x0c\x04\xf4\x85\
+\xbe\xd7\x3f\xcc\xb2\xcc\x72\x1a\x79\x5b\xbe\xba\x84\x44\x76\x70\
+\xbc\x6e\x11\x06\x47\x16\xfc\xb1\x12\xb0\x68\x59\x11\x24\x75\xce\
+\x14\xa4\x53\x9f\xca\xfe\xf5\xdf\x92\xbc\x78\xf0\x80\xce\x01\x00\
+\xf6\xf9\xad\x2d\x00\x1e\xf8\xb1\xf4\x4f\xbd\x7e\x04\x00\x18\xf8\
+\xbd\x7e\x0a\xf8\x6d\xbc\x62\x51\xf0\xe7\xf7\xb9\x54\x6f\x5d\x56\
+\xe1\x34\xe2\xa9\x37\x60\xc9\x56\x75\x62\x68\x82\xe0\x12\xb8\xe4\
+\x6f\x3e\x89\x0b\x36\xa1\xca\x21\x06\xe1\xde\xd7\xde\x07\xdf\xb3\
+\x73\x65\x31\x5a\x19\xb3\xf3\x65\x55\xd1\x7a\xd8\x5a\xb6\x8f\x67\
+\xfb\xbb\x25\x97\xc2\x04\x00\x68\xe9\xbc\x93\x64\x97\xcb\x49\xd2\
+\x77\xc3\x96\xdd\x70\xdb\xdd\xcf\x40\x9b\xf6\x3d\xb8\x79\x10\x99\
+\x27\x71\xe9\x63\x7a\x2f\x3a\xa7\xba\xc1\xd7\x43\xc7\x33\xf0\x57\
+\x4f\x20\xf1\x96\xbb\x9e\x12\x4a\x88\x06\xdc\x72\xcf\x1f\x84\x62\
+\x63\x19\x8c\x9f\xb6\x10\xae\xbc\xe9\x11\xa1\xcf\xc0\xa7\x33\xf0\
+\x3b\xb5\x65\x8f\xed\x7b\xdd\x03\x24\x20\x84\x55\x00\xf4\x44\x40\
+\x79\xe7\xf2\x4a\x6e\x76\x84\x84\x40\x04\x0d\xed\x52\x0d\x8b\x72\
+\x67\x62\x4c\x65\x7e\x23\xc4\xdc\xc7\x71\x49\xa5\x4c\xe1\xa1\x71\
+\xfd\x9d\x4f\x43\x09\x5a\x4e\xcf\xce\x12\xe7\x98\x39\x01\x64\x01\
+\x12\x96\x6a\x64\x40\x89\x4d\xb9\xf5\xd1\x50\x71\xee\xb8\x94\x3e\
+\xc1\x99\x03\x00\xf7\x69\x73\x01\x62\x1d\x57\x8c\x35\xb3\x36\xcc\
+\x64\xcb\x02\x00\xfc\x21\xde\x30\xaa\x2a\xe1\xb1\xc7\x07\x9f\xd0\
+\x94\x30\x6c\x41\x3a\xf4\x9a\xed\xb2\xeb\xc5\x48\x4e\x96\x2d\xee\
+\xb8\x34\xc9\xfb\x33\xab\x86\x44\xfb\xee\xb1\xf4\xff\x83\x67\x03\
+\x00\xf8\x23\xe8\x35\x87\x0f\x88\x6e\x35\xb7\xec\x1c\x48\x5d\x22\
+\xdb\x77\xe9\xcc\x66\x75\x52\x85\x0b\xe8\x4e\x9e\xd7\xd1\x00\x80\
+\xce\x9a\xd5\x01\x80\x3c\x91\xc2\x7b\x2a\xbb\x62\xf2\x0c\x08\x37\
+\xfe\x18\x4d\x03\x20\x5e\x96\x69\x30\x7e\xfb\x4e\x47\x00\x20\x7a\
+\x99\x42\xde\xd7\x95\x24\xca\x46\xc9\x86\x36\x56\x96\x49\xe5\xc8\
+\x6e\xc1\x3b\x60\x59\x6e\x09\x4c\x66\x17\xa7\xb6\xc4\x60\x96\x22\
+\x37\x32\x4b\x09\xaa\x00\x92\x48\x41\x2c\x8d\x26\x06\xb0\x5c\xde\
+\xae\xa3\x1f\x56\x15\x6e\x26\x87\x3c\x92\xc4\x65\x41\x27\xd1\xa3\
+\xcd\x4d\x4b\xc3\xa0\x54\x6e\xaf\x7a\x49\x8f\x1b\x58\xf0\xff\x09\
+\x4e\xfe\xc0\x00\xc0\xc9\x93\x2c\xa0\x1f\xe0\x01\x99\x7a\xfd\x4d\
+\x14\xb8\xeb\xc5\xaa\xa3\x92\xbf\xc8\xfa\x9b\xcc\xe0\x8f\xec\x6d\
+\x0c\x28\x12\x00\x54\x56\xd5\xb2\xc7\x35\xd1\xaa\x6f\xe0\x8b\x00\
+\x41\x03\x02\x81\x06\xf3\x36\xdd\xdf\x4c\x00\x81\x00\x06\x55\x0d\
+\x1a\xe1\x93\x2f\x47\xf1\x00\x24\xc0\x0d\xee\xaf\x2e\x5d\xaf\x86\
+\x8f\x06\x8d\x84\x2f\x87\x8d\x87\xaf\x86\x4f\x60\x19\xe6\x00\x38\
+\x9f\xed\x97\x0b\x3a\xf6\x63\x20\xa0\x1f\x5c\xd0\x29\x03\xfe\xfa\
+\x8f\x2f\x61\xf7\xbe\x3a\x92\xdd\x5d\xce\xf6\x5f\xf6\xca\x22\x02\
+\x01\x4b\x56\xe4\xc3\x12\x06\x04\x26\xce\x58\x22\x46\xff\x34\x22\
+\x6c\xb2\xcf\xfa\xfb\x11\x95\x19\x17\xf5\xf9\xc5\x36\x85\x97\xf5\
+\xf9\xfd\xbc\x5a\x83\x52\xcc\x6d\xbc\xe9\xe2\x71\x5c\x06\x94\x97\
+\xfd\x35\x10\x20\x6e\x9f\x27\x56\x1b\x8f\x6d\xce\x59\x29\xef\xf1\
+\xb6\x43\xa2\x26\x59\x2d\xb5\xfa\xf9\xe7\xe1\xef\x21\xdb\x09\x58\
+\xaa\x77\x49\xf3\x26\x16\xa0\xcf\xef\x68\x30\x50\xf4\x09\x64\xe1\
+\xd8\x60\x01\xae\xb5\xe4\x91\xb0\x5b\xb6\x01\xf6\x70\x47\xc6\x1d\
+\x65\x9a\xff\xc2\xce\x3d\xbc\x6c\xbf\x63\x0f\x0b\xde\xe5\xf0\xf0\
+\x53\x6f\x70\x2b\x65\x51\x0d\x90\x6d\x12\xdc\xa6\x65\xde\x46\xd5\
+\x84\xa3\x47\x8f\x42\xf6\x8a\x22\x3a\xdf\xf0\xf3\x25\xff\x3a\x13\
+\xb2\x73\x4a\x60\xd2\x8c\xa5\x70\xf5\xad\x4f\x08\xb2\x5d\x6f\x3e\
+\x72\xc7\xce\xdb\xb6\x54\x4a\x97\x2c\xfa\x9e\xe0\xcb\xb8\x8d\x00\
+\x9a\xf4\x74\xd8\xca\xce\x97\x7d\x35\x8d\x30\x6c\xd4\x4c\x38\xdf\
+\xdb\x4b\x69\x5c\xd0\x45\xdf\x96\xbd\xbb\x1d\x44\xb5\x62\xc9\xfc\
+\xe5\xf3\x4d\xd9\xec\x3e\xec\xf7\xc4\x40\xe3\x85\x19\xb0\x64\x55\
+\x09\xe4\xaf\xdf\x0a\x5d\xfd\xb7\x9a\xbf\x53\xdb\x94\x41\xa2\xfe\
+\x9b\xb6\x4c\xfb\xc8\x31\x5c\x27\x5b\x74\xff\x99\xf7\xb3\xc5\x75\
+\xd9\xd5\xea\xea\x80\xf6\x16\x69\x30\x72\xc5\xd4\x63\xfd\x3e\xba\
+\xdf\x42\x48\x60\x56\xda\x09\x86\xad\x42\xe2\x0f\x53\xc5\x0d\x46\
+\x1f\x19\xa7\x2a\x94\x11\x71\x8c\xdb\x6d\x6b\x9b\xb8\x4f\x9b\x7b\
+\x71\x26\xcf\xe3\xd5\xaa\xd6\x9b\x02\xf0\xfa\xac\x41\x34\xc4\xec\
+\xc7\xee\x78\xa7\x07\xde\x50\x05\x33\xc9\x14\x77\x27\x9b\x4a\x66\
+\xae\xb0\xbd\xfc\x30\xaf\xe3\x38\x5f\x1f\x25\x38\x7b\x9c\x96\xd9\
+\xf7\xd4\x85\x73\x9c\x59\xa7\x46\x1c\x20\xc0\x0a\x4c\xdc\x4e\x9f\
+\x41\xfd\xc8\x0d\x67\x12\x88\x7e\xc2\x7b\xec\xda\x04\xb1\xb1\x8f\
+\x15\xd9\x4f\x2b\x9b\xc9\x0c\x90\x82\xbf\x47\x8e\x85\x09\x4d\x79\
+\xf9\x1d\x05\x49\xe9\xf9\x57\xdf\x87\x65\x2c\xa3\x7b\xf1\xf5\x8f\
+\xb8\xb4\x6c\x4a\x6f\x35\xae\xd4\x56\xb2\x95\xa9\x44\xe9\x17\xda\
+\xe7\x18\x28\x79\xff\xf6\xc6\x3b\x9f\x81\xeb\x6e\x7f\x9c\x5d\xc8\
+\xb9\x8e\x80\x64\x9f\xbb\xb5\xf9\x69\xce\x00\xcf\xa4\x0c\xed\x89\
+\xe7\xdf\x86\x93\xa7\x7e\x64\x00\xe0\x04\x55\x01\xea\x44\xb6\x2e\
+\x03\x7f\x43\x3d\x0f\xe0\x0d\x54\xee\x6f\xa6\xa0\x8f\x00\xa0\x99\
+\x04\x5b\xf8\x42\x03\x17\xec\x31\x6f\xdf\xc5\x05\x7c\x70\x7a\x80\
+\x1e\xd7\xc4\x9f\xd3\x20\xda\x04\x0a\x10\x34\x36\x2b\x60\x50\x8f\
+\x1c\x02\x04\x03\xe2\x71\x7b\x59\x56\xd8\xe5\xf2\xab\x58\x80\x0d\
+\x28\x47\xb7\xb6\x29\x7e\xf8\xcb\x3f\xbf\x82\x81\x43\x46\xc3\x17\
+\xdf\x8d\xa3\xf5\xaf\x2f\x47\x42\xc7\x4b\xae\x64\xc1\x8f\x81\x80\
+\x4e\x7d\xe0\x82\x0b\xfb\x41\x87\xce\xbd\x61\xcc\xe4\x85\x34\x9b\
+\x9e\xcb\x02\x21\xb6\x50\xb2\x51\x72\x37\xa7\x80\xec\x6e\x07\x0f\
+\x9f\x2a\x4a\x97\xa6\xc7\x84\x65\xf6\x5f\xf3\xd0\xa0\xc0\x9e\xcc\
+\x01\x00\x55\x00\xc4\xdc\xbc\x2b\x64\xf1\xdf\xd1\x79\xc9\xb2\xe7\
+\xcf\xb3\x93\xf3\x58\x90\xc4\xd5\x46\x10\xd8\x10\x10\x50\xe5\xc1\
+\x1b\x50\x19\xbf\x4b\xcd\xb0\x6b\x3d\x6e\xa9\x8d\x61\x09\x6c\xf6\
+\xdf\xbf\x99\xa1\xab\xd9\x78\xf6\x5a\x99\xd7\x3e\x04\x53\xe7\x2d\
+\x87\x15\xe8\x0a\x58\x50\x42\xf3\xf9\xd4\xf3\x97\x00\x40\xf9\x2d\
+\x94\x9b\x16\xcc\x3b\x76\x73\x1b\xe6\xed\xe5\xf0\xf6\x3f\x06\x81\
+\x9b\x2a\x0b\xbd\x94\x73\x22\x4e\x95\x8c\x1a\x3f\x9b\x8e\xdf\x29\
+\x76\x9e\x5c\x7d\xf3\xc3\xe0\xee\xc8\x5d\xf9\xee\x1e\xf0\x0a\x4d\
+\x68\x20\x98\x74\x91\xb6\x44\x3f\xb6\xfa\x0a\xb2\xa9\x29\xab\x4c\
+\x04\x3e\xe4\x72\xb0\xd7\xba\xf6\xe6\x47\x19\xe0\xd8\x4d\x52\xcf\
+\x5b\xd9\xf9\xf2\xe9\xd7\xe3\x18\x50\xe0\xc0\xc6\xad\xdc\x0a\x0d\
+\x93\xa4\xea\x24\x97\x1d\xe7\x6a\xeb\xe5\xfd\x7f\x97\x38\xe7\xb9\
+\x6a\x64\x06\xbc\xc9\xbe\x6f\xee\xda\x8d\xf0\xdc\x9f\xdf\x27\x20\
+\xe5\xd6\xb2\xcf\xb0\x60\x22\x84\x28\x18\x89\xa8\x7d\x3a\xcc\xf6\
+\x78\x9f\x77\xb6\x49\x87\x46\x98\xc4\x2a\x5c\x35\x42\x1b\x95\x4c\
+\x8a\x94\x50\x46\x92\x89\x77\x10\x8b\x93\xbc\x03\xdd\x9c\x4e\x1a\
+\xae\x49\x80\xe6\x71\x8a\x25\xbf\x9c\x4e\x83\x18\x03\x8c\x56\x56\
+\x09\x46\x29\x3f\x87\x31\xc6\xf1\x86\x0b\xc8\x3e\x2d\xa8\xf9\x6d\
+\x26\x3a\x7e\x0b\xf1\x2e\xba\x0b\x5f\x2c\x9c\x83\x68\x9f\xc7\x19\
+\x00\xb8\xf5\xea\x84\xce\x2a\x75\x0c\xbe\xf6\xe7\x1b\x71\x54\x03\
+\x6c\x6e\x60\xb6\xfb\xe4\xc5\xd4\x0e\x02\x4c\x46\xab\x39\xa1\xe0\
+\x48\x28\xb1\x38\xf7\x19\xea\x42\xa0\x97\x6f\x13\xa4\xfb\x22\x96\
+\x84\x3d\x9c\x41\x7d\x1e\x5e\x58\xdb\x73\x31\x15\x1c\xa7\x3a\xaf\
+\x1d\xd7\xa6\xa7\x85\xcc\x7d\x2c\xb7\x52\xe0\xf1\xb1\x4c\x75\x31\
+\x2c\xcb\x2d\x06\x5f\xbf\x7b\xb9\xd2\x9d\x72\xf9\x4b\x37\xb7\xa2\
+\x1a\x90\x98\x6c\x02\x00\x64\x9b\xf7\xbd\xfe\x51\x21\x18\x84\x17\
+\xd4\x34\xba\x4f\x92\xe8\xdc\x29\x62\x86\x1e\x41\x00\xbb\x68\x9f\
+\x9f\x1a\x84\x91\x63\x67\xb1\xc0\xff\x03\x5b\x27\xc9\x28\xa8\x4e\
+\xcb\xf6\x31\x40\x37\xea\xa5\xfe\x26\x1e\xf0\x9b\xe5\xda\x7f\x90\
+\x18\xe1\xfb\x0f\x1e\x66\x81\xbb\x9a\x84\x7b\x30\xd0\xa0\x30\x10\
+\xaf\x0e\xf0\xe7\x35\x08\xe0\xc0\x41\x80\x75\xd5\x37\x35\x8b\xd7\
+\xde\x4f\x0a\x70\x1f\x0d\x1c\xae\x04\x7e\x70\xbf\xb6\x61\xdf\xeb\
+\xde\x47\x5e\xa6\xe0\xff\xf9\x90\x31\xf0\xf9\x50\x5c\x63\xe1\x8b\
+\x21\x63\xe1\x95\xb7\x3f\x63\x81\x9f\x81\x22\x94\x35\xbe\xb0\x2f\
+\x9c\xcf\x56\xf2\x45\x7d\x60\xfa\x9c\x65\x50\x5d\xd7\x0c\xab\x8b\
+\xd6\xc3\x0a\xb6\x1f\x57\xe4\x16\xd2\xfa\xec\xab\x31\x5c\x4d\x4e\
+\xe9\x61\x04\x2c\xa6\x59\x3a\xc8\x93\x0c\x79\x4e\xea\x4b\xa7\x8c\
+\x5f\x2e\xf4\x5a\x48\xc0\x09\x00\x9a\x02\x08\x50\xbf\xff\xbc\x64\
+\x13\xdc\xc9\xd5\x46\x04\x6c\xe2\x02\x78\xc5\xc8\xab\x22\x14\xa6\
+\x6b\xba\xfc\xe6\xf9\xa4\xaa\x13\x5e\xb3\x94\xec\x52\x6d\x0a\x9f\
+\x59\x49\x4b\x32\xc7\xf6\x78\xe6\x9d\x49\xc7\x34\x95\x81\xa2\x4f\
+\x06\x8f\x25\xa9\xde\x95\xf9\xeb\x20\x7f\x6d\xa9\x1a\x11\xdc\xb1\
+\x7b\xaf\x32\x5b\xc2\xe0\xbf\x95\x05\x7f\x9a\xde\xd8\x56\x06\x9b\
+\x59\x50\xde\xbc\x6d\x0f\x8c\x9a\x38\x0f\x52\x2f\xee\xa3\x5a\x75\
+\x28\x54\x84\xd3\x03\xa7\xd8\xf9\x31\x6b\x7e\x36\x99\x04\xb9\xd1\
+\xe8\xa8\x63\x5f\xe5\x7b\x80\xc4\xd2\x5f\xf7\xb8\x49\x79\x21\x90\
+\x3e\x03\x11\x4f\x03\x26\xc7\xc2\xc3\x01\x2a\x82\x80\xf7\x3f\xfa\
+\x96\x01\x91\x4a\x78\xf3\xef\x83\xe8\x1c\x4c\x14\x20\x27\xd1\x41\
+\xc4\xe7\x4c\x02\xbf\x59\xfe\xe7\xa4\x57\x72\x68\xa4\xea\x17\xe7\
+\x01\x04\xaf\xba\x1f\x72\x4b\x4a\x61\xe2\xac\x25\xec\x77\xd8\x4d\
+\x7c\x56\xbb\x51\x97\x1d\xdc\x87\xf2\x0e\x42\x33\x6b\x7f\x04\x92\
+\x60\xac\x2d\x47\x23\xac\xe0\x90\x59\x6a\xff\x25\x46\xe7\x82\xb6\
+\x15\x4b\x3b\xc2\x1f\x45\x74\x2e\x5a\x7b\xd6\x88\x32\xea\x6d\x4d\
+\x1c\x55\xab\xc6\x13\x8f\x19\x53\x6b\x01\x00\x43\x9b\x04\x30\x04\
+\x00\xf0\xc4\xa3\x67\x1c\x08\xef\x65\x1f\xb1\xc4\x6e\x9b\xcb\xf7\
+\xd8\x41\x80\xd6\xe3\xf7\x04\xa2\xb4\x13\xfc\x31\xfc\xdf\xa1\xf7\
+\xee\xa4\x95\xae\x97\xbc\x93\xfd\x56\x23\x15\x8b\xf6\x80\x11\x2a\
+\xb0\xe2\xd1\x9e\x67\x01\x38\x12\xe4\xc4\x47\x88\x74\x47\xad\x44\
+\xf8\x2c\x02\x44\x76\x62\x0d\x27\x02\xa5\x5b\xe5\x90\x1d\x1d\xfe\
+\x82\x44\x5c\x4a\x54\x72\xb2\x06\x5c\xee\xbf\x05\xde\xfb\x78\x38\
+\x8c\x98\xb8\x10\x46\xb3\xac\x74\xd4\xe4\x45\x6c\xb1\xed\xa4\x45\
+\x30\x72\xc2\x02\x5a\x23\x26\xcc\xa7\xff\x8f\x64\xf7\x8f\x9e\xba\
+\x18\xc6\x4f\xcf\x82\x89\xd3\x97\xc2\xf2\xdc\xb5\x30\x95\x05\x31\
+\x1c\x01\x4b\xc0\x92\xa5\x37\xd3\xc1\xf8\x87\x8b\x97\x24\xaa\x3e\
+\xa8\x4f\x55\x03\x24\x81\x4b\x91\xcc\x30\xf8\xa4\x18\xca\x3a\x15\
+\xc7\xfe\x68\x3c\xca\x9b\xc6\xb2\xbf\x72\x38\x71\x12\x05\x83\x7e\
+\x20\x0b\x56\xca\xca\x65\x05\x40\xb0\xfc\x39\x00\x68\x16\x00\xe0\
+\x20\x0f\xfc\xb8\x9a\x0f\x51\xf6\x8f\x0b\x47\xfd\x08\x00\x88\x11\
+\xb4\x46\x02\x09\x07\x55\x95\x40\xae\x46\xd1\x3a\x90\xed\x83\x46\
+\x71\x3f\xbe\x5e\x5d\xe3\x21\xb8\xb8\xc7\xf5\x2c\xa0\xf7\x27\x72\
+\x1f\x5e\xac\x51\xcb\xff\xf3\x6f\x47\xc3\x67\x6c\x0d\xfc\x76\x14\
+\x03\x01\x7c\x8b\x80\xe0\xcb\xa1\xe3\xe0\xb1\xe7\xde\x86\xf3\xd1\
+\xd8\xa8\x23\x97\x02\xc6\x96\x49\xfb\x8e\x06\x4c\x9c\xb6\x04\x1a\
+\xd8\xe7\x5b\xbb\x71\x2b\xe4\xe6\xaf\x81\x55\x6c\x7d\xfe\xcd\x38\
+\xca\x6e\x95\xba\x5b\x72\xc0\x16\x80\xd3\x95\xba\x1c\x05\xf6\x94\
+\x74\xb5\x54\xe9\xdf\xcb\x0d\x97\xdc\x04\x00\x82\x9c\xf0\x47\x4e\
+\x8a\x69\x44\x8a\x6b\x23\xb7\x9a\x6b\x20\x81\x80\x90\x29\x82\x60\
+\x48\x59\xdb\x4e\x7c\x32\x55\x09\xb5\xca\x9f\xcc\x92\x3d\x66\xd5\
+\xc2\x04\x00\xbc\x52\xd4\x96\x65\xe8\x38\xed\xb0\xb2\x60\x03\xac\
+\xc8\x5f\x4b\x2d\x11\xec\xf7\x6f\xdb\xc9\x83\xbf\xcc\xfa\xb7\x10\
+\x00\x60\xdb\x6d\xdc\x82\x19\x17\xfe\x1f\xed\x8b\xaf\xb9\xf5\x31\
+\x16\x9c\xfd\x30\x67\x51\x2e\x1c\x3c\xdc\x02\x27\x4f\xfe\x08\xbe\
+\xde\x77\x88\xe9\x8b\xbe\xe4\x25\x81\xdb\x4b\x7a\xde\x04\xdf\x8f\
+\x9b\x05\xaf\xbc\x35\x50\x10\x4c\x33\x84\x98\x95\xae\xf8\xa9\x8d\
+\x16\x26\xa7\x41\xc7\x8b\xfb\xc2\x7d\x8f\xbc\x26\x46\xf4\x32\xb5\
+\x8c\xba\x95\x02\xbe\x63\x1b\x40\x9f\xb6\x49\xe7\xa2\x59\x9e\x9e\
+\x30\x63\x61\x0e\xac\x2c\xda\x08\x97\x76\xbf\xc1\xd2\x96\x34\xfd\
+\x35\xd2\xad\xc1\xde\x52\x09\xd0\xbd\x08\x02\xb6\xc9\x1f\x23\xca\
+\x98\xb6\xdd\x23\x45\xff\x3b\x18\x7a\x9f\x27\x34\xd8\x3a\x66\xde\
+\x67\x65\xbe\xdd\x6f\x23\x66\x47\x1a\xa9\x0b\x23\x8e\x14\xc2\x8b\
+\x08\x46\x08\xcc\x36\x02\xa2\x6e\xc4\x15\xf2\x7f\x1b\x08\x88\x79\
+\xcc\xaf\xb5\xf6\x97\xb5\xaa\x71\x8e\x52\x69\x8b\x48\xb8\x88\x47\
+\x22\x31\x5c\x8f\x49\xde\x67\x1b\xab\x73\x98\xb9\xe7\xbd\xa4\xa0\
+\x36\x52\xe1\x77\x78\x4d\x23\x7e\x10\x60\x7b\x8c\x7d\xac\xd0\x65\
+\x09\xfa\x3e\x07\xf6\xac\xcf\xfa\xb7\xc7\x17\xe5\x7d\x7d\x71\x01\
+\x00\x3b\xe8\x70\x7b\x8c\x90\x76\x80\xfd\x07\xe8\xb6\x04\x7f\xcd\
+\x34\x25\x9c\x7f\xb8\xce\xfe\x17\x7a\xea\xdd\x82\xb7\xc1\xec\xc5\
+\xab\xe1\x65\x76\x51\xbc\xe1\x8e\x27\x60\x7e\x76\x3e\x0b\x62\x13\
+\xe1\xf7\x4f\xbd\x01\x0f\x3c\xf6\x3a\xdc\xff\xc8\xab\x2c\xab\x35\
+\xd7\x7d\x8f\xbd\x0a\x0f\x3c\xf1\x1a\x0c\x60\xff\x7f\xec\x99\xbf\
+\xc2\xe3\xcf\xfe\x0d\xae\xbf\xe3\x0f\xec\xa2\x9e\xae\xac\x6a\xf9\
+\x08\x53\xa6\x36\x2e\x98\x2e\x32\x9b\x74\x92\xc5\x75\x4b\xc6\x7c\
+\xb2\x9c\x35\xf7\x59\x80\x90\xac\x14\x70\xd0\xc6\xab\x1c\x5d\x7e\
+\x7b\x15\x1c\xc7\xfe\xff\xa9\x53\x64\xe5\x8a\xc1\xb8\x41\xf6\xec\
+\x45\x86\x4e\x81\x5f\xba\xb4\x61\xb9\x1f\x83\xfe\x7e\xe1\xdb\xbe\
+\xff\x30\x79\xb7\x23\x71\x10\xc9\x81\x3b\x76\x73\xa7\x3f\x1c\xe3\
+\xab\x65\xaf\xd1\x84\x66\x2e\x24\xef\x2a\x8c\x5d\x08\x34\x1c\x50\
+\x72\xaf\xf2\xf6\x7e\xf6\x3f\x7c\x8d\xf1\x93\xe7\xb3\xe0\xcf\x82\
+\x18\x03\x00\xdc\x51\x2f\x08\x2f\xfd\xf5\x23\xf8\xf2\xbb\x31\xf0\
+\xc5\x77\x2c\xf0\x0f\xe5\x00\x00\x01\x01\x56\x03\xbe\xfc\x6e\x1c\
+\x7c\x3d\x7c\x22\xdc\x35\xe0\x25\x9e\xe1\xa5\x88\xea\x1a\x0b\x34\
+\x89\xc9\xdd\x61\xf0\x77\x13\xe0\xf0\xd1\x53\xa4\x35\x50\xcc\x32\
+\xe1\x61\xa3\x67\x50\x75\xc4\x25\x5a\x6b\xfc\x02\xaa\x67\x8a\xe9\
+\xa2\x5f\x8c\xc4\xbf\x0c\x5a\x92\xed\x2f\x6d\x96\x95\xe5\xb2\x20\
+\xe6\xf1\x60\xdf\x4b\x54\x71\xc4\x42\xf3\x9c\x24\xae\x34\x88\x5c\
+\x0f\x7e\x1e\xa5\x8b\xe7\x73\x66\xbf\x2b\x25\x18\x92\x4d\x5a\x41\
+\xbb\xdf\x54\xec\xd4\x84\xbf\xcc\x96\x8f\xd9\xd6\xe1\x56\xd2\x42\
+\xf2\x16\xdf\x23\x95\xfb\x3c\xdc\xf9\xe0\x9f\x20\x6b\x55\x09\x64\
+\xe7\xae\x21\x20\x50\xba\x03\x4b\xfd\xbb\x89\xad\x4f\x5b\x74\x55\
+\xa4\xed\x1e\x1a\x23\xc4\xfb\x10\x00\x6c\xa7\xe3\x58\x0d\xe3\x26\
+\xcf\xa5\xca\xce\xcf\x3f\xff\x04\x23\xc6\x4c\xe5\x20\xb2\x23\x1f\
+\xc1\x6c\xdf\x39\x1d\x5e\x60\x20\x63\xdb\xae\x0a\xa8\xa8\x6d\x82\
+\x8b\xbb\x5f\x27\xf6\x55\x80\xb7\x52\x2c\xed\x29\xbf\x36\x6a\x69\
+\x8e\x5b\x72\xf1\x9d\x0c\x45\x4e\x0d\xed\xeb\x47\x61\xf5\x87\x70\
+\x03\x82\x56\x40\xae\xc4\x80\xd2\xd5\x71\x33\xb3\x45\x83\x38\x0e\
+\xaf\xbe\xf5\x29\x03\x4a\xeb\xe9\x37\xc7\x2b\x84\xf2\x75\xd3\xb5\
+\x2a\x4d\x30\xd4\xd0\x2b\xd9\xb0\xb4\x68\xf4\x91\x3a\x5d\x4e\x38\
+\x32\x57\x49\xd7\x20\x09\x9c\xa1\x32\xdd\xe9\x88\xb3\xfd\x52\xae\
+\x7e\xfa\xb5\x3b\x18\x85\x8b\x15\x2a\xe7\xee\xf2\xd8\xe2\x44\x72\
+\xd0\x6a\xef\x9e\xac\xcb\x72\xff\x37\xec\x80\xcd\xcf\x7e\x8e\x2b\
+\x02\xc1\x2d\x96\x17\xb0\xdb\x5a\x46\x0c\xca\x5e\x9f\x22\x91\x29\
+\x81\x1f\x99\x39\x44\x94\xf6\xb5\xbf\x8e\x3f\xcc\x63\x7c\x51\x81\
+\x80\xcb\x9e\xa1\xd8\x4b\xef\x9e\xd0\x1e\x7c\xe4\x56\x83\xd6\x62\
+\xd0\x01\x8f\xc6\x7f\x30\xe5\x5a\xa3\x00\x80\x24\xcd\xcb\x3d\x59\
+\xcb\x4a\x94\x0c\x64\xe8\x34\x80\x3b\x59\x0f\xe6\x91\xa4\x46\x03\
+\xaa\x9f\xce\xb3\x3a\x71\x3c\x3c\xbd\xe0\xb3\xc1\xe3\x29\x03\x3b\
+\x97\x05\x82\x81\x43\x26\xc2\x87\x5f\x8e\x16\xee\x63\x3c\x80\x13\
+\xd1\x51\x04\x0e\x3e\xba\xd7\x53\x90\xde\xd2\x28\x7b\x3a\x5f\xce\
+\xe8\xa7\x66\x2a\x73\x19\xb7\xc8\xae\x64\x0b\x80\x67\xf0\xe9\xe2\
+\xe2\x2f\x75\xcc\xf5\xd9\x5e\xbf\x65\x3f\x26\x8a\x8b\xaf\xcb\x6b\
+\x96\x92\xef\xbc\xff\x05\x16\xf8\x7f\xe4\x6e\x81\x0c\x00\x34\x50\
+\xaf\xbf\x49\x94\xe7\xcd\x2c\xbd\x59\x58\xb3\x52\xb9\x9f\x05\x6c\
+\x0c\xfa\x58\x2d\xc0\x85\x81\xfb\xd0\xa1\x16\xf6\xbf\xc3\x4a\x89\
+\x0e\x65\x7d\x71\xdc\x4f\x56\x0a\x64\x95\x40\x55\x0e\x6c\xf7\x1f\
+\x38\x78\x08\x0e\x1d\x3e\x06\x77\x3d\xf8\x02\x03\x00\x98\x5d\xf6\
+\xa5\xec\xb2\x5b\xfa\x5d\x2c\xc0\x8f\x87\x41\xd4\xf7\x1f\x0b\x9f\
+\x0f\x1d\xcd\x01\x00\x72\x01\x86\x8e\x81\x41\xc3\xc6\x91\xb4\x2f\
+\x4a\xfc\x5e\x7f\xd7\xd3\x2a\xc3\xe4\x04\x36\x16\xe8\x3b\x5c\x0e\
+\x7f\x7c\xf5\x3d\x38\x74\xe4\x04\x1c\x39\x76\x02\x96\xe5\xac\x21\
+\x29\x5b\x1e\x4c\x43\x15\xe5\xcc\x9e\x33\x9f\xc8\x68\xe3\xcd\x50\
+\x1a\xff\xe4\xa2\xc7\xee\x47\xf0\xd0\xe1\x57\x99\xd0\xff\xa6\xc7\
+\xe0\xf9\x57\x3e\x82\x8f\xbf\x1c\x0f\x23\xc7\xcf\x87\x89\x33\x97\
+\xc1\xf8\x19\x59\xf0\xcd\xc8\x19\xf0\x8f\x4f\x86\xc3\x33\x2f\xff\
+\x03\xae\xbb\xf3\x29\xe8\x78\x49\x7f\x1e\xf4\x88\x74\xd9\x87\xf8\
+\x1c\xe4\x18\x28\xde\x83\x13\x0a\x6d\x2e\x7c\x24\xcc\x63\x5e\xf0\
+\x5c\x12\x40\x6b\x60\x9d\xbb\xdc\x19\xda\xf1\x4f\x17\x23\xa4\x99\
+\xca\x8a\x18\xab\x21\xd7\xdc\xf2\x04\x2c\x42\x32\x64\x4e\x3e\x03\
+\x01\x25\xe4\xd8\x58\x8a\x00\x40\x5b\x24\xda\x23\x2a\x02\x48\x0e\
+\xdc\x5e\xb6\x8f\xc8\x82\x28\xea\x73\xec\xc4\x71\x38\x76\xfc\x24\
+\x5c\xda\x8d\xf3\x32\x12\x3b\x1a\x70\xe7\xef\x9f\xa7\x2a\x55\x85\
+\x70\xfd\x9b\x32\x7b\x29\x55\x41\x54\xbf\xdf\x9b\xa6\x05\x7f\x9f\
+\xe5\x36\x01\x54\xaf\x00\xa4\x96\x52\x7b\xba\x03\xbb\xdf\xb0\x3d\
+\x26\x10\x86\x18\xa8\x4d\xe3\xa4\x68\xff\x97\x00\xc3\x02\x9e\x83\
+\x16\xa9\xdf\xde\xd7\xfe\x1e\x56\x16\x6e\x80\x61\x63\x67\xd1\x67\
+\x33\x45\x83\xd2\x35\x42\x66\xc0\xcc\xf4\x35\xe7\x44\xa7\x11\x60\
+\x57\x48\xc9\x39\x9a\x1f\x89\x01\xad\x63\x0c\x17\x0f\x07\x20\xbe\
+\xf7\x8b\x58\x5a\xf7\xe8\x56\xc6\x46\x04\xed\x14\x99\x8c\x04\xad\
+\xfb\x40\x6f\xa3\x78\x23\x8f\xc0\xbb\x35\x2f\x8e\x70\xce\x8d\xe1\
+\x2b\x0a\xc1\x38\xab\xf2\xa7\xb7\xce\x39\xfd\x03\x18\x4e\xf8\x27\
+\x96\xac\xdc\x64\x15\x27\x28\x63\x8c\x74\xd3\xe2\x33\x24\xc3\x8d\
+\x64\x7a\x13\x4f\xd6\x1f\xc3\x64\x42\x88\xda\x60\xac\xad\x0d\x5b\
+\xab\xc1\xab\x55\x3c\xbc\x81\xd8\x2a\x15\x52\xcb\x5b\x9f\x44\x88\
+\x38\x45\xa0\x73\x34\xf0\x84\xe3\x64\xbb\xc4\x64\xa7\xb1\xa3\x80\
+\xd6\xef\x17\xbe\x0c\xec\xc2\xd7\x36\xd5\xc7\xb2\xff\x3c\xb8\xa8\
+\xdb\xb5\x70\x1e\x03\x03\x8b\x57\xad\x85\x5e\x7d\xee\x65\x17\xcf\
+\x3e\x02\x00\xc8\x32\xa4\x66\xb9\x9a\x2c\x64\x4e\x51\xda\x37\x25\
+\x20\x3c\xe6\x33\xcc\x4c\x44\x04\x7e\x99\x41\x2a\x35\x3f\x91\xd1\
+\x58\x01\x40\x50\x55\x22\xf8\x12\x99\x63\x32\x07\x01\xaa\x1f\xcb\
+\xb6\x7f\xff\xf0\x1b\x92\x0b\xc6\x0b\x7c\xcb\x91\x63\x24\xee\x43\
+\xf3\xfd\x96\xe0\x6f\x0d\xd8\x32\xf8\xa3\x69\xd0\x41\xb1\x3d\x74\
+\xf8\x08\xc9\x07\x97\x09\x47\x3a\x34\xab\x41\xad\xff\x03\x0c\x14\
+\xc8\x20\xaf\x82\xbd\x58\xf2\x76\x33\x01\x89\x16\xa8\xac\x69\x86\
+\x0e\x9d\x83\x54\xfa\xe7\x2b\x13\xfe\xf0\xd2\xdf\x61\xf0\x88\xf1\
+\xf0\xd5\xb0\xb1\xbc\x0a\x30\x14\x17\x96\xfe\x31\xfb\x1f\x4b\x00\
+\x00\xdb\x00\x5f\x22\x27\x80\x6d\x6f\xb9\xf7\x19\xe2\x5b\xb8\x92\
+\xf8\x98\x5c\x42\x87\x6e\x04\x02\x32\xaf\xba\x8b\x65\xb6\xfb\xe0\
+\xf8\x89\x9f\x20\xa5\x0b\x0f\x00\x54\xa6\x4e\x31\x03\x85\x45\x2d\
+\x8e\xed\xe7\x36\x22\xe0\x4b\x31\x9a\xe4\x8b\xfa\xc2\xdd\x03\x5e\
+\x83\x17\x5f\xff\x14\x5e\x79\xeb\x4b\x78\xe0\xf1\xd7\xa1\xff\xf5\
+\x0f\x43\x8f\xe0\x6d\xd0\xd5\x77\x23\xa4\xa5\xdf\x0e\xd7\xdc\xf4\
+\x08\x3c\xc4\xee\xff\xcb\x7b\x83\x48\x71\x70\xcd\xe6\x72\x28\xdd\
+\x55\x07\xf3\xb2\x8b\xe1\xad\x0f\x87\x40\x3a\x0b\x36\x7c\xfc\xb2\
+\x0f\x29\x33\x2a\x66\xba\xe8\x2d\x9b\xfa\x16\x3e\xa5\xcc\xc7\x09\
+\xa2\x3e\xd3\x98\x46\x03\xa0\xaa\x95\xa3\x84\x9d\x78\xa0\x53\x5b\
+\xc1\xc2\xbf\xf2\xc6\x01\xb0\x68\x79\x21\x2c\x5c\x91\x0f\xab\x8a\
+\xd6\x71\x67\xc5\xed\x18\xfc\x77\x99\x00\x60\xe7\x6e\x1a\xe5\xdc\
+\x46\x00\x60\x2f\x81\x81\xca\xea\x5a\xf8\xf7\x7f\xfe\x0d\x75\x8d\
+\x07\xe0\x9f\x1f\x7f\x0b\x2f\xfc\xf9\x9f\x90\x95\x53\x44\xa2\x4d\
+\x15\x42\xca\x79\x1f\x03\x01\x0f\x3e\xf1\x1a\x9d\xc3\xd4\xf2\x48\
+\xe2\xbe\x01\x09\x7a\xb6\x2f\xab\x01\x8a\xe0\x28\x97\xd9\x6f\x97\
+\xa4\x41\x33\xb8\x6b\x1c\x1b\xa7\x96\x9b\xc6\x0f\xd0\x9f\x6b\xaf\
+\x00\xa8\xdf\x8f\xd4\xc1\x48\x0e\x2a\x51\x2d\x5c\x6d\x53\x7c\x6c\
+\xbf\x14\x41\x4e\xe1\x46\xe8\x74\xd9\x55\x9c\x24\x28\x5f\x5b\x12\
+\x6d\x95\x3b\xa4\xdf\xe1\x38\x84\xd1\x00\xd1\x84\xba\x22\xba\xde\
+\x79\xce\xbe\x72\xe0\x2f\x26\x13\x1c\x13\xb1\xd1\x3a\xea\x19\x79\
+\x84\xda\xb0\x19\xc7\x9d\x8e\xc8\x52\x38\x00\xd0\x4a\xd3\x1a\xad\
+\x0f\x00\xc2\xb9\x24\x39\xf7\x96\xdc\xfa\x9c\xa4\xf6\x23\x49\x90\
+\x6c\xf4\x70\xb3\xeb\x8e\xad\x05\x5f\x18\x72\x5f\xec\xe4\x3b\x77\
+\x58\xa5\x40\x7b\x7b\xc0\xe9\x3e\x9f\x35\xdb\x77\x92\x3f\xf6\xfa\
+\x2d\xee\x5f\xa1\x48\xdb\x0a\x00\x5c\x92\x91\xaa\x65\xfc\xee\xa8\
+\xc4\x12\xfb\x88\x89\x35\xc0\x86\x64\x28\xc9\xa2\xbf\x8e\x99\x76\
+\x4a\x1a\xcc\x5c\x98\x03\xbf\x46\x00\xc0\x32\xfb\x85\x2b\x8a\x21\
+\xad\xef\x3d\x9a\x7a\x99\xad\x74\xa9\x5a\x15\x69\x22\x48\x0b\x2b\
+\xd3\x14\x9d\x58\x28\xb3\x3b\x99\xf1\xf3\xac\xcf\x6d\xb9\x08\x06\
+\x2d\xd6\xa8\xe6\x67\xb3\x71\x22\x88\x8c\xc5\xa5\x70\x67\xcd\x5b\
+\x0e\x2d\xc7\x8e\xc3\xd1\xe3\x27\xe0\xc0\xa1\xc3\x82\xe9\x2f\x83\
+\x7f\x68\xa6\xbe\x5f\x66\xfe\x18\xfc\x29\xf0\x1f\x85\x83\x2c\xf8\
+\xa3\x81\x10\x02\x08\x9c\xe1\x2f\x13\x00\x00\x0d\x68\x9a\xb5\x4a\
+\x81\xaa\x18\x68\xc0\x01\xff\xde\x7f\x00\xab\x08\x2d\x30\x0e\xcb\
+\xff\xec\xf3\xf2\xe0\xdf\x07\x3a\xfc\xba\x0f\xcb\xfe\xd1\xba\x17\
+\xc7\xfe\xc6\xc1\x57\x0c\x00\x0c\xfa\x6e\x34\x0b\xfa\x2c\xf8\x0f\
+\xe3\x00\x00\xd7\x17\x82\x10\x88\x9c\x80\xcf\xbe\x1d\x03\x8f\x3f\
+\xff\x36\x9c\xcf\x8e\x01\x92\x2d\x5d\xed\xbb\x93\x32\xa2\xab\x7d\
+\x37\xe8\xd0\xc9\x0f\xdf\x7c\x37\x01\x1e\x7e\xea\x4d\x33\x68\xa4\
+\xf2\x7d\x88\xf2\xcb\x26\x10\xe0\x19\x23\xe7\x5d\x04\xc1\xf3\xeb\
+\x7e\xec\xf8\x3d\x00\xe9\x57\x0f\x60\xe0\xce\x50\x63\x72\x6d\x84\
+\x70\x0e\x77\xf7\x13\x25\x7f\xe1\xf2\x97\xd0\x81\x97\xff\xdb\x75\
+\x0a\xc0\xb5\xb7\x3d\x09\x1f\x7e\x31\x0a\x4a\xb6\x94\x43\xd9\xbe\
+\x7a\x58\xb8\xbc\x18\x1e\x7e\xe6\x6d\x22\x2f\x26\xc8\x96\x83\x6c\
+\xcf\x79\x6c\xad\x33\x59\xbd\xf2\xfa\x44\xc0\x34\x44\xd0\x4f\xd7\
+\x80\x60\xba\xa5\x72\xe1\x56\x20\x26\xa8\xa9\x47\xf6\x82\xdb\xee\
+\x7d\x96\x02\xdd\xfc\x65\xf9\x50\xb8\x6e\x13\x65\xf7\x24\xde\x23\
+\xda\x00\x5b\x05\x2f\x80\x2c\x98\xf1\x36\x03\x03\x3f\xfe\xf8\x13\
+\x1c\x3b\x71\x92\x5c\x1c\x95\x5f\x43\x45\x8d\xb0\x73\xae\xa6\xdb\
+\xe8\xd2\xd8\x2e\xd5\xcf\xdd\xfa\x70\x9f\x63\xf5\x85\x9d\x5f\x6e\
+\x8f\xad\xe4\xaf\xeb\x57\x78\x0d\x47\x4d\xff\x50\xd2\x9f\xdd\x51\
+\xd3\x50\xa0\x40\xee\x03\xa9\xbe\xc8\xc7\x35\x03\x8a\xb8\xe9\x4a\
+\x09\x5a\xc0\x72\xa8\xeb\xa1\x99\x51\x7e\xf8\xc5\x48\xc8\x2b\xdc\
+\x00\x77\x3f\xf4\x92\xaa\x20\xd8\xab\x8c\x6e\x6d\xab\x3b\x47\x46\
+\x02\x01\xce\x99\x73\x38\xd5\x40\xe3\x17\x0a\xc6\xff\x0d\x00\x10\
+\x8e\xdb\x16\xb4\xb6\x5b\xc3\xb6\x01\xec\x7a\x2c\xf1\xb6\x3b\x62\
+\x99\xf7\x37\xfe\x5b\x00\x20\x18\xa6\xff\xe1\x8f\x30\xcb\x6e\x2f\
+\xc1\xeb\x72\xa2\xe6\x3c\x7d\x82\x37\x7c\x49\x84\x9f\xb0\xfe\xd0\
+\x72\x7b\xdc\x00\xc0\xb0\x98\x64\xd0\xfb\x59\x9c\x96\xfc\xf1\x2d\
+\x95\xed\x47\x21\x2c\xda\x98\xba\xe1\xaa\x0f\xae\x90\x13\x48\x77\
+\xf4\x0a\x05\x5b\x2e\xaf\x4e\xbe\xb2\xb3\xc3\x1d\x4a\x7f\x21\x42\
+\x2e\x01\x78\x7f\xe0\x08\x78\xfe\xb5\x0f\xc8\xc0\xe7\xad\x7f\x7e\
+\x03\x1f\x0d\x1a\x2d\x14\xd6\xc4\x3e\x4a\x09\xaa\xac\x44\x55\x63\
+\x94\xf4\xaa\x39\x0a\x45\x3d\xd7\x14\xc9\x62\x0e\xa8\x85\xfe\xf5\
+\x89\xb2\x05\x91\x12\x0c\x21\x2a\x59\x04\x65\x64\xe6\xe2\x15\xe6\
+\x2e\xc9\x3d\xb8\xb9\x4b\xfb\x2b\xd8\xc5\x1e\x4d\x5d\x8e\xc1\xb1\
+\xe3\xc7\x58\xc0\xe7\x3d\xff\x26\x15\xfc\x0f\x68\xc1\x5f\x04\xea\
+\x43\x22\xe3\xa7\x75\x94\x05\xfe\x63\x70\x98\x65\xfe\xb8\x10\x00\
+\xd4\x35\x36\x51\xff\x9f\x3b\xd0\xd5\x10\x8f\xe0\xa0\x00\x0b\x2a\
+\xf8\x8b\x8a\x01\x02\x07\x0e\x06\xb8\xfd\xf0\x33\x7f\x7a\x97\x5f\
+\xac\x85\x69\x91\xaf\xdf\x7d\xf0\xed\xe8\xc9\x0c\x00\x4c\xe0\x00\
+\x60\xd8\x78\x9e\xf1\x63\xd0\x97\x6b\xc8\x58\x9a\x08\x18\x38\x74\
+\x0c\x7c\xc6\x00\xc0\xa7\xc8\x0d\x60\x20\xe0\xed\xf7\xbf\x82\x8b\
+\xba\x5d\x45\x02\x36\x54\x0d\x20\xd0\xe3\xa7\xef\xef\x65\x01\x9d\
+\x32\x64\x92\x14\xce\x50\x3d\x79\xbd\xf4\xab\x08\x96\xec\xf3\xb4\
+\xeb\xdc\x5b\x91\x53\xb9\x8b\x5f\x9a\xf0\xa5\x4f\x53\x96\xcd\x52\
+\x39\x8f\x3b\x31\x4a\xd3\x9a\x00\x9f\x18\x48\xe1\x5e\xf4\xc9\x17\
+\xf7\x81\x27\x5f\x78\x07\x56\x14\x6c\x80\xdd\x55\x0d\xb0\xba\x64\
+\x0b\x3c\xfc\xec\x5b\x04\x2a\x14\x58\x4d\x12\x3a\x11\x4a\xcb\xc3\
+\x67\xaa\x14\xca\x11\x45\x75\x0e\xf0\xd1\x36\x29\xe7\xec\x56\x04\
+\x54\xc1\x57\xf0\xca\xb6\x20\x07\xf6\xb8\x1f\x9e\x79\xe9\xef\xb0\
+\x60\x59\x01\x49\x08\xaf\xdf\xb2\x53\x05\x7f\xd4\x02\x20\x72\xa0\
+\x20\x08\x62\x8b\x00\x2b\x33\x3f\xff\xfb\x3f\xe4\xd7\xb0\xbb\x92\
+\x3b\x0a\xe2\x74\x47\x99\xb0\x1b\xde\x59\xce\xed\x9b\xff\xf1\xd1\
+\xd7\xd0\xd6\xd3\x1d\x52\x7f\x1d\x80\x8b\xbb\xf6\x87\x1e\xe9\xb7\
+\x90\xd9\xd0\xf9\xa9\x86\xd2\x71\x50\x63\xa8\x4a\x00\x29\x60\x0b\
+\x9e\x81\xa8\x7a\xfe\xa1\x6d\x81\xa0\x45\x2c\x49\x69\x37\xc8\xe9\
+\x0d\xf2\xd4\x48\x37\x9f\xab\x09\x92\xd1\xef\x21\xc9\x9c\x42\xba\
+\xfb\xa1\x3f\xc1\xca\xfc\xf5\xf0\xcf\x4f\x87\x69\x95\x0a\x07\x02\
+\xa6\x50\x74\x34\x39\x0c\x01\x0b\x17\x41\xc9\x7c\xc7\xdd\x23\x3f\
+\xfd\x20\x2b\xab\x1a\x4e\x8f\x73\x7b\x5b\xaf\xa2\xe0\x8a\x31\xc3\
+\x97\xf1\xc7\x4a\x6a\x0d\x44\x21\x44\x06\xad\x5e\x29\x31\x27\xcc\
+\x81\x33\x0c\xee\x46\xab\xb5\x02\x24\x99\xfc\x9c\xd8\xde\xd4\xa9\
+\x34\x61\x44\xd0\xd9\x8f\x47\x02\x38\x10\xa5\xac\xa2\x89\x3e\x78\
+\x63\x09\xf4\xd1\x47\xf0\x64\x89\x8c\x82\xbe\x57\x57\x70\x8a\x83\
+\xc8\xa7\x7d\x16\x97\xd0\xfc\x4e\xf0\x3a\xbf\x27\x22\xfd\x04\xad\
+\x6f\x18\x4d\xbc\x88\x40\x40\x92\x55\xc4\x22\x62\x15\xc6\xeb\xa0\
+\x08\x16\xf6\x22\xc5\xfb\xb0\x4a\x70\x84\x5d\x78\xae\x08\xde\x0e\
+\xb3\x97\xe4\xc1\x0b\xaf\x7f\x08\x97\xa5\x5d\x07\x43\x46\xcd\x80\
+\x8f\xbe\x1c\x05\x69\x7d\xee\x22\x35\x3b\x5f\xbf\x7b\x20\x70\xd5\
+\x03\x10\x64\xab\x47\xc6\x9d\x90\xd4\x25\x43\x8c\xee\xf5\x22\x91\
+\x17\xb7\x52\x14\xf3\x6b\x41\x9d\x5f\xf8\xdb\xa6\x08\x01\x20\x2f\
+\x5f\x1c\x04\x64\x38\xf6\x51\xf9\x85\xc9\x10\xaf\x23\xb2\xff\xe4\
+\x9e\x24\xca\xe2\xe9\x12\x84\xc3\x47\x4e\x32\x00\x70\x14\x8e\x1d\
+\x3b\xce\xcb\xff\x8d\x22\xf8\x37\x3b\x64\xfd\x07\xcd\xac\x9f\x4a\
+\xfe\x87\x65\xe0\x67\x8b\x6d\x71\x84\x10\xff\x8f\x66\x2f\x04\x00\
+\xf6\xd5\x90\xde\xff\x41\x7a\xac\x58\x2d\x7c\x8b\xcf\x3b\xa4\xdd\
+\xdf\xc2\x3e\x87\xbf\xef\x5d\x42\xa8\x28\x83\x7a\xd8\xfd\x6e\x78\
+\x18\xbe\x1d\x35\x99\x5a\x00\xc8\x03\xf8\x6a\xf8\x58\x13\x00\x0c\
+\x11\x99\x3f\xad\x31\x04\x00\x06\x0e\x19\x43\x00\xe0\xb3\x6f\x25\
+\x51\x70\x0c\xdc\x7c\xef\xd3\x42\x24\xc9\x30\x1d\xe1\xb4\x39\x70\
+\x3e\x1a\x96\xa1\x65\xd0\x99\x96\x8c\x5a\x9d\x0f\x32\x30\x8b\x8c\
+\x5c\x5a\xe6\x2a\x77\xc6\x24\xd3\xf2\x57\x2a\xa4\xf1\x7e\x34\xfa\
+\xd0\x73\xdb\x62\x04\x1c\xb8\x6d\xd7\x39\x1d\x1e\x7f\xe1\x6f\x50\
+\xbc\x69\x27\x94\x55\xd6\xb3\x60\x5c\x08\xbd\xaf\x7b\x80\x2a\x16\
+\x7c\xfe\xde\x47\x93\x04\x92\xf8\xe4\xf2\x98\x7a\x20\xb2\x02\x20\
+\x03\x8f\x2c\x6f\x27\x28\x00\x20\x4a\xe1\xd2\xcd\xce\x46\x88\x75\
+\xb3\x63\xff\xc5\xd0\x89\x64\x24\xb4\x32\x7f\x2d\x1f\x07\x94\x81\
+\x7f\xe7\x6e\x65\xde\xb3\xb7\xaa\x06\xfe\xfd\x9f\xff\x43\x1a\x0d\
+\x58\xcd\xa1\xa5\x02\x3f\x37\x1d\xc2\x71\x4f\x9c\xfa\xd8\xb4\xad\
+\x0c\xb6\xed\x64\xf7\xef\xa9\x26\x11\xa6\x3d\x95\x0d\xc4\x81\x68\
+\x23\x7d\x16\x3c\x7e\x53\x53\x5f\x56\xd3\x3c\x01\x47\x72\x6d\x68\
+\x05\xc0\x08\x5f\x75\xd3\x7a\xfe\x2e\x71\xde\x73\xa7\x4d\xb3\x5d\
+\x46\xca\x9a\xfa\x88\xb1\x72\xd3\xf4\x11\x00\x90\x55\xc1\x0b\x2f\
+\xbf\x12\xb2\xf3\xd6\xc3\xec\x85\xab\xe8\xb7\x21\x41\x9c\x5a\xc9\
+\xc2\x13\x81\x7e\x3f\x42\xaf\x40\x55\x22\x64\xb5\x20\x9c\x10\x98\
+\x39\x4a\xe7\x3a\x23\xa6\xf9\x7f\xc3\x34\xc7\x38\x0d\x0e\x82\x11\
+\xc5\x80\xcd\x1f\xb6\x2c\xef\x16\x20\xce\xed\x39\x5d\x00\xe0\x0f\
+\x0b\x80\xcc\x98\x68\x84\x21\xda\x9f\x79\x05\xe5\x0c\x95\x00\xe3\
+\x53\xfc\x0b\x07\x00\x4c\x52\x46\x34\x7d\xfa\x58\xbd\x06\x7c\xce\
+\xa4\xbc\x48\x73\xff\x21\xd5\x09\x5b\x99\xdf\xf2\x5a\x3e\x4b\x4f\
+\x48\x06\x7d\xb7\x25\x13\x77\xa8\x3a\x78\x6d\x66\x15\xb6\xd7\xb2\
+\x7f\x37\xb7\xc7\x70\x50\x47\x0c\x77\x02\x19\x1a\x20\x91\x95\x06\
+\x67\x1b\x52\x35\x93\x4f\x25\x65\x61\x38\xc2\x1e\xd7\x35\x70\x0b\
+\xcb\xfc\xbf\x87\x29\xb3\x57\xc0\xa4\x59\xcb\x60\x06\xbb\xb8\xcc\
+\x5a\xbc\x1a\x66\x2f\x2e\x80\x79\x59\x85\xb0\x20\xbb\x08\x16\x66\
+\x17\xc3\xe2\xe5\x25\x30\x7f\x59\x11\xbc\xff\xd9\x70\xb8\xac\xe7\
+\xf5\x82\x3d\xde\x53\xab\x06\xd8\xc7\x0f\xf5\x0b\x61\x74\x19\x54\
+\xcb\x77\xf3\xfa\x94\xb9\x4b\xef\xab\xef\x67\xc1\xff\x14\x55\x00\
+\x8e\xb0\x55\x5f\xdf\x44\xa5\xff\xe6\xe6\xc3\x44\xf8\x93\xa5\xf9\
+\x83\x96\xcc\xbd\x45\x05\x6d\x99\xf5\xb7\x1c\xc5\xe0\x7f\x9c\x5e\
+\x03\x2d\x62\xf7\x8a\x32\x71\x79\x45\x2d\xf5\x88\x0f\x8a\x6c\xff\
+\xb0\xe0\x09\x1c\xb6\xad\x16\x06\x1c\x9a\x0f\x1c\x83\x0b\x52\x7d\
+\x26\x98\x61\x01\x3a\x8d\x81\xa4\x6f\x47\x4d\xe1\x1c\x00\x0d\x00\
+\x60\xc0\xc7\xe0\xce\x45\x81\x46\x93\xd5\xef\xc8\x89\xb3\x60\xcc\
+\xd4\xf9\x30\x61\xe6\x22\xb6\xaf\x17\xc3\x64\xda\x2e\x62\x7f\x2f\
+\x84\x4f\xbe\x1e\x45\xf3\xde\x38\xbf\x8e\xa3\x6b\x9c\x1c\x97\xa9\
+\x3c\x17\x4c\x52\x65\xba\x99\x4d\xab\x12\xb0\x39\x3d\x22\x05\x7e\
+\x74\x5d\x7f\x97\x50\x76\x4c\x48\x0a\x88\x65\x58\xd8\xe1\xfc\xf5\
+\x82\x42\x1a\x57\xbc\x3e\xa9\xe4\x05\xc1\x7b\x71\x1f\x78\xfb\xfd\
+\xc1\xb0\x79\x57\x25\x6c\xdd\x53\xc3\x8e\xff\x08\x48\xee\x92\x4e\
+\x40\xb0\x8d\xd2\xe3\xb7\x93\x9e\x74\xb2\x62\xd0\x24\x82\x7a\xad\
+\x82\x39\x48\xb0\x4b\xf4\x84\xca\x65\x23\x20\xf8\x75\xb7\x6b\xd8\
+\xf9\x97\x0f\x4b\x56\x15\xc2\xba\xcd\x3b\x48\x14\x08\x15\xf9\x10\
+\x04\x94\x6e\xdf\x45\x82\x4e\x3f\xfe\xfc\x13\x1c\x6c\x69\xe1\x7e\
+\x02\x82\xd7\xb1\xcb\x12\xf8\xf9\x42\x3b\xe2\x6d\x42\x5d\x10\xe5\
+\x86\x51\xdf\x7f\xc4\xb8\xd9\x54\xb9\x72\x79\x8d\x08\x55\xb3\x60\
+\x54\xe5\x3e\x9d\xdc\x68\x05\x00\xd6\xc7\x61\x2b\x25\xf3\xfa\x01\
+\xd0\xfb\xfa\x87\xd9\xf6\x61\xb6\x7d\x04\xfa\xb0\x95\x89\xeb\xda\
+\x87\x21\xfd\xda\x07\x21\x78\x0d\x5b\x57\x3f\xc4\x40\xf7\x83\x04\
+\xbc\x03\x57\x3e\xc0\x6f\xb3\xfb\x0c\xf6\x77\x5a\xdf\xdf\xc1\x8c\
+\x05\x39\x90\xbd\x6a\x2d\x5c\x7f\xc7\x93\xd0\x23\xf3\x2e\xb8\x82\
+\x01\xf5\xcb\x03\xb7\xc2\x45\xdd\xaf\x63\xc7\x8b\x5b\x21\xa3\x04\
+\xf3\xf9\x9d\xb8\x2c\xb5\x2e\x56\x64\x26\x22\xf1\xf4\xa0\xcf\x96\
+\x30\xd0\x2f\xe7\x0e\x18\x4a\xfe\x0b\x46\x50\x64\x8d\xcd\x5d\x35\
+\x36\x31\xa2\xd6\x00\x40\xe1\xc8\x98\xbf\x78\x0b\x20\x4a\xf0\xb7\
+\xf7\xc1\xf5\x91\x3a\x27\x00\x10\x61\xc7\x86\x3a\xd4\x45\x26\xe4\
+\xb9\x3c\xa1\x41\x3f\x74\x4e\x5f\x56\x01\x74\xcd\x68\x09\x00\x02\
+\x0e\xa3\x86\x1a\xd7\x20\x44\xd9\xd0\x08\x33\x3a\xe2\xf0\x7e\x96\
+\x32\x7d\x38\x72\x62\xc0\x36\x0e\x69\x40\x6c\xf3\x9c\xa1\x28\xd1\
+\xa9\xdf\x67\x67\x8f\x27\x10\xc1\x2b\x43\x78\x1c\xa4\x71\x42\x5a\
+\xfb\x2b\x58\xc0\xbd\x82\x5d\xd0\xbb\xb3\xcf\xd0\x83\x5d\x4c\x7c\
+\x2c\x20\x04\xa0\x5d\xa7\x74\xb6\x82\xe0\xf9\x55\x26\x18\x57\xde\
+\x4b\x6d\x83\xf9\x59\x05\x64\xce\xc2\xa7\x02\x84\x5f\xbd\xe5\xfb\
+\x4a\x06\xb2\xdf\x0a\x02\x52\x02\x11\xab\x14\x3a\x00\x70\x09\x00\
+\xf0\xe8\xd3\x6f\x72\x02\x20\x0b\xdc\x98\xc5\x37\x36\xec\x17\x63\
+\x79\x87\x88\xbc\x47\x81\x9f\xb2\x7e\xce\xf2\xe7\x19\x7c\x8b\x56\
+\xf2\xe7\x00\xe0\xc8\x91\xe3\x26\x00\x38\x7e\x9c\x64\x7d\xd1\xd6\
+\x17\x49\x80\x68\xf3\x8b\x16\xaf\x96\x80\x7f\xc4\xda\x36\x40\x76\
+\x3e\x9a\xd2\x50\xa9\x58\xce\x6b\xb3\x20\xd9\xb9\xeb\x35\x2c\xb8\
+\x4f\x83\xaf\x46\x4c\x80\x2f\x45\xe6\xff\xa5\x98\x04\xc0\xa9\x80\
+\xd1\x93\x67\xc3\xb4\x79\x4b\x61\xc6\xfc\x6c\x5a\xb3\x17\x64\xc3\
+\x9c\xc5\xcb\x61\xfe\x92\x95\xb0\x28\x6b\x25\x2c\x59\x9e\x07\xd9\
+\x2b\x0b\x61\x45\x5e\x31\xe4\x14\xac\x87\x0f\xd8\xfe\x25\x79\xda\
+\x8e\xbd\xb9\x0c\xb2\x46\xf8\x4b\xd0\x40\x80\x3d\xdb\x4c\x94\x2d\
+\x1a\x29\xcc\x23\x7f\x13\x1e\x9f\x68\x03\x70\xa2\x69\xa2\xc7\xca\
+\x7f\x31\x19\xfa\x6c\x9b\x6a\x58\xa6\x35\x12\xbc\x32\x23\xed\x05\
+\x5d\xfd\x37\xc2\x94\xb9\xcb\x61\x73\x59\x15\xe4\x95\x6c\x83\x3b\
+\x7f\xff\x22\x9c\xdb\xbe\x9b\x26\x85\x6c\x68\xa3\x88\x41\x45\x20\
+\x35\x27\x41\x6c\xe7\x26\x89\x43\x99\x6d\x1f\xb7\xd7\x1f\x32\x3d\
+\xf0\xd8\x0b\x7f\x83\xac\xbc\x12\x58\xb6\x7a\x0d\x6c\x2d\x63\x00\
+\xa0\x6c\x37\x71\x02\x30\xb8\x9f\xfa\xe1\x47\x38\x7a\xe2\x04\x0b\
+\xfa\x15\x5c\xd3\x41\x2c\x74\x1a\x44\x00\xb0\x7d\xcf\x3e\x21\x27\
+\xcc\x17\x72\x06\x48\xff\x81\xfd\x6f\xda\x9c\x6c\x68\xdf\x89\x8b\
+\x25\xf1\x16\x97\x61\x03\xca\xe9\x31\x00\x81\x08\xc0\xc1\x46\x02\
+\xc4\x75\x71\xb7\xeb\x21\x6b\xd5\x06\xc8\xca\x5d\xc7\xb2\x78\xb6\
+\x65\x2b\x3b\x17\xff\xde\x00\x4b\x73\xd6\xc3\xe2\x15\x25\xb0\x60\
+\x79\x31\xcc\x5d\xc6\x16\x03\xdd\x73\x18\xf8\x9e\x9b\x55\xcc\xb6\
+\x45\x30\x73\x49\x21\xcc\x5c\x9c\x0f\xb3\x16\xad\x86\x05\xcb\x0a\
+\x61\x71\x0e\x03\xe6\x2b\x8a\xd8\xe3\x0a\x60\x36\x03\x49\x73\x96\
+\xe4\xc3\x8c\xc5\xb9\x30\x71\x66\x16\xbc\xf4\xd7\x8f\xe1\xc1\xa7\
+\xde\x60\xa0\x72\x39\x7c\x36\x64\x12\xf8\xfb\xdf\x47\xad\x39\x14\
+\x17\x22\xd2\x6e\x4c\x9e\x23\xad\x19\xb4\xce\x76\x15\xc0\x88\xc3\
+\x4b\x25\x9a\x67\x8c\x11\x7f\xf0\x0f\x6b\x33\xdc\x9a\xdf\x3b\x9a\
+\x4d\xfc\x59\x03\x00\xc1\x30\x16\xb7\x46\x0c\xaa\x7c\xbe\xa8\x2d\
+\x80\x70\x66\x35\x91\xf5\xf5\x8d\x18\x04\x7f\x8c\xc8\x52\xbf\xc9\
+\xfe\x28\xe4\x0f\xc3\x6c\x3d\xd8\xab\x09\x5e\xbf\x65\x54\x04\xc5\
+\x6b\x5c\x8e\xba\x07\x31\x2a\x15\x86\x45\xce\xe1\x51\xa6\x29\xea\
+\x61\x7a\xc1\xdb\xfb\x8d\x2a\xcb\xf2\xa6\x87\x30\xc8\x13\xa8\xef\
+\x28\x47\x09\x7d\x8a\x70\xa7\xb2\x79\x8f\xdf\x42\xe8\x73\x4b\xc5\
+\x3b\x7c\x5e\x72\x1a\x0c\x78\xfa\x0d\x96\x9d\x15\xb0\x2c\xed\x2a\
+\x01\x02\x7a\x08\x1f\x74\x9f\xd6\x03\xe6\x84\x43\xae\xea\x67\xaf\
+\x02\x04\x42\x24\x54\xa5\x60\x09\x1f\x19\x4d\x23\xf1\x13\xcc\x32\
+\xff\xf6\x8f\x41\x1c\x00\x9c\x38\x46\x81\x9d\x18\xff\x42\xd5\xef\
+\x80\x0a\xfe\x5a\xd6\xdf\xc2\xb2\xf8\x23\x47\x54\xe0\x6f\x39\xc6\
+\xcb\xfe\x18\xfc\x31\xf3\x3f\x7a\x9c\x03\x00\x1c\xe9\x43\xc2\x18\
+\x01\x80\xea\x3a\xa8\x6e\x68\x86\xc3\xc7\x8e\x8b\x6a\xc1\x71\xca\
+\xf8\xe9\xf6\x11\xfe\xdc\x63\xc7\x4f\xb0\xc0\x91\xa5\x40\x8c\xaa\
+\xa4\xb0\xa0\xf9\xf9\x90\x71\x14\xfc\x29\xeb\x47\x15\xc0\x6f\x47\
+\xc1\x90\x51\x93\x60\xea\xdc\xa5\x30\x73\x3e\x06\xff\x2c\x98\x85\
+\x81\x7f\xd1\x72\x98\x87\xc1\x7f\xe9\x4a\x58\x98\x9d\xcb\x2e\xfa\
+\xab\x20\x3b\x67\x35\x2c\x47\x05\xc0\xfc\x62\xc8\x2d\x28\x81\xdc\
+\xe2\x8d\x70\x49\xaf\x9b\xa0\x6d\x27\x61\x25\x9c\xca\x03\x28\xd9\
+\x23\xa7\x8a\xa9\x8c\x94\xa0\x8d\x6c\xa6\xcf\x77\xfb\x2c\xda\x12\
+\x6e\xcd\x4b\x80\xc6\x3a\xbd\x7e\x55\x16\x36\x67\xf3\x25\x43\x1f\
+\x95\x17\xd9\xeb\xe2\x4a\xe1\x41\x98\xe4\x81\xd9\xb9\x71\x1e\x3b\
+\x1e\xc8\xcb\x78\xf5\x6f\x03\xa1\x74\x67\x25\x6c\x2b\xaf\x81\xef\
+\xc6\xcf\x82\xce\xbf\xbd\x92\xaa\x0e\xbc\xcc\xdd\x5b\x95\xb6\xcd\
+\xd2\xb9\x24\x95\xe2\xe7\x36\x94\x1c\xaa\xb2\xfa\xf6\x6a\xbf\xdd\
+\x14\x31\x7a\x47\xd5\x08\x06\x3c\xbb\x64\xb0\xc0\x97\x0b\xd9\xab\
+\x8b\xa1\x78\xe3\x56\xca\xfc\xb1\xc4\x8f\xc1\x1f\x27\x42\xf0\xf6\
+\x8e\x72\x1e\xf0\x11\x04\x98\x4e\x82\xc2\x47\x60\x97\x99\xf9\x6f\
+\xdf\x89\x20\x60\x2f\x2c\x5d\xb9\x06\x52\x7e\xd3\x0f\xda\x78\x25\
+\x81\x32\xdd\x32\x6a\x99\xa8\xf3\x75\x6c\xe4\x55\x9d\xa4\xe7\x16\
+\xad\x2e\x1d\x04\xd8\x5b\x03\xfa\xf9\x8d\xa2\x47\x9d\x2e\xbb\x1a\
+\x3a\x5d\x72\x25\x74\xba\xf4\x4a\x48\xbd\xf4\x2a\x62\xf3\x77\xba\
+\xec\x1a\x7e\x3f\xbb\x9d\x7a\x69\x7f\x48\xbd\xa4\x3f\x8d\x64\xe2\
+\xc2\xc7\x75\xba\xb4\x1f\x74\xbc\xb4\x2f\xfb\xbb\x0f\xa4\x5e\x9c\
+\x01\x0f\x3c\xfe\x12\x2c\x5a\x59\x40\x7e\x13\x17\x5e\xda\x07\x2e\
+\xfc\x6d\x7f\xe8\xd2\xb5\x3f\x74\x0d\xdc\x04\x7f\xfa\xcb\x47\xb0\
+\x64\xd5\x1a\xb8\xe1\xce\xc7\xa0\xf3\x65\xfd\xe1\xf5\x77\x07\x51\
+\x05\xef\xea\x5b\x9e\x50\x8a\x91\x66\xe5\xd0\x9c\xb4\x72\x25\xdb\
+\x1c\x03\x3d\x7e\x07\xf3\xb3\xc8\x65\x77\x33\x79\x0b\x84\xb6\x3f\
+\xc2\x26\x78\x67\x37\xfb\xb7\x4e\x71\x18\x21\xad\x52\xeb\x35\x36\
+\xa8\xf1\x14\xa2\x59\x06\x6b\x1a\x2c\x9e\x48\x3c\x39\xa7\x38\x67\
+\x02\xe1\xd0\xfb\x83\x51\xf6\x8d\x61\x6b\x25\x9f\xd5\x0a\x80\xa1\
+\x01\x00\x23\x02\xba\x8a\x30\x16\xa7\x81\x00\x13\xed\x1b\x8e\xec\
+\x49\x6b\x26\xe8\x77\x28\xab\x47\x33\xf5\x89\x41\x6c\x27\x26\xc9\
+\x4b\x67\x83\x1f\x97\xc3\x98\x9f\xfc\x0e\xee\x58\x46\x06\xbd\xfe\
+\x08\x6e\x80\xf1\x97\x9f\x2c\xbd\xc9\xe4\x40\xa8\xe8\x48\x6a\xba\
+\xd9\x6f\x4d\xb1\x91\xc8\xe4\x0f\xc0\x63\x8e\x19\xa9\xc0\x2f\x2e\
+\xe6\x89\x6a\x36\x39\x83\x6b\xfc\xa7\x4a\x9d\x7f\x83\x18\xe5\xc8\
+\x15\xf8\x2b\x0b\xce\xc8\x5e\x4f\x90\x00\x40\xf6\xf0\x93\x0d\xeb\
+\xf1\xd3\x2a\x01\x09\xc9\x46\x04\x19\x55\xde\xd2\xe0\x00\x00\x59\
+\xeb\xdd\x60\xe8\xc8\x49\x2c\xf8\x9f\x80\x13\x27\x4f\xc0\xc1\xc3\
+\x87\x95\xa6\xff\x7e\xbd\xe4\xcf\xd6\x61\x2a\xf7\x1f\x31\xb3\xfe\
+\xa3\x6c\x1d\xe3\x00\xe0\xe8\xd1\x23\xe4\x0d\x8f\x81\x1f\x01\x00\
+\x06\x73\xcc\x1e\x65\xf0\xdf\x57\x53\x47\x7e\xef\x07\x45\xb0\x3f\
+\x42\x00\xe0\xb8\x00\x0e\xc7\x68\xfa\xe0\xc4\x89\x53\x30\x68\xc8\
+\x78\x62\xe4\xbb\x48\xfb\x40\x94\x7f\xd9\x79\xf1\xca\x5b\x9f\x50\
+\x9f\x9f\xab\xff\xf1\x72\xff\x74\x16\xf8\x67\xb2\xa0\x3f\x7b\xe1\
+\x32\x16\xf8\x57\x50\xe0\x9f\xb7\x64\x05\x2c\xcc\xca\x81\xc5\xcb\
+\x30\xf8\xe7\x43\x56\x4e\x3e\x2c\xcb\x2d\x80\x95\x79\x45\xb0\x32\
+\xbf\x84\x00\xc0\xea\xe2\xf5\xf0\xe2\xeb\x1f\x12\x00\x70\x77\xe2\
+\x00\xc0\x9d\xa2\xad\x90\xac\x54\x5e\xe8\x7c\x8a\x2c\xeb\x0e\x69\
+\x8b\xf1\xc5\xed\x80\x0d\x2d\xe0\x19\x16\xd2\xa6\x22\x6f\x7a\x4d\
+\x8e\x0c\x01\x00\x3c\x1e\xc9\xdc\x82\x17\x2d\x7e\x33\xaf\xb9\x07\
+\x96\xb2\xcc\x7c\xeb\x9e\x6a\x58\xbb\x79\x0f\x3c\xfa\xdc\xdb\x04\
+\x18\x64\x95\x22\x41\x10\x42\xdd\x29\x26\x40\x95\xa2\x3b\x7c\xab\
+\xa9\x41\x2a\xd0\xc8\xaf\x19\x04\x3c\xb0\x15\xd1\x91\xf3\x1e\x1e\
+\x7d\xfe\x6d\xc8\x29\x5e\x07\x6b\x4b\xb7\xb1\x63\x54\x07\x3f\xfc\
+\xf8\x13\x55\x71\x30\xdb\xdf\xa6\xfc\x02\xca\x29\xc8\xef\xa0\x0c\
+\x1f\xbd\x04\xca\x29\xd8\x6f\x23\x13\xa1\xff\x9f\xba\xf7\x80\x8e\
+\xaa\xdc\xda\xc7\xef\xfa\xaf\x4f\x32\x33\x41\x81\x4c\x26\xc1\x8e\
+\xf7\x5a\xe8\x99\x33\x33\x09\x20\x8a\x28\x8a\x82\xbd\x77\xc4\x86\
+\xd2\x54\x44\x10\x2c\xf4\x1a\xe9\x9d\xd0\x7b\xef\x84\x1a\x08\xbd\
+\xa3\xd8\xb0\x17\xba\xd8\xe8\x45\xbc\xf7\xdb\xff\xbd\xf7\x5b\xce\
+\x7b\xce\x94\x4c\x22\x78\xbf\xdf\x5a\xbc\x6b\x26\xc3\xf4\x39\xe7\
+\xdd\xcf\xde\xfb\xd9\xcf\x43\x55\x83\xcf\x60\xc7\xc7\x9f\x41\xe1\
+\x86\x9d\xf0\xaf\x6a\xf5\x34\x09\xcf\xeb\x98\xd1\x8f\xc4\xa8\x00\
+\x44\xec\x71\x65\x29\x19\xec\x55\x41\x5f\x7d\xbe\x0c\x45\xc8\x0d\
+\x27\x6c\xbb\x89\x31\x4a\x31\xfa\x58\x9a\xc1\xb4\x5c\xe5\xc5\xa5\
+\x57\x29\x0d\x2a\xa1\x31\xe5\x9e\xe9\x57\x7d\x7d\x01\xb4\xaf\xab\
+\x5e\x0f\x16\x15\x6c\xc4\x0c\x7f\x31\x5c\x54\xf6\x7a\x51\x81\x23\
+\xd3\x25\x3a\x2f\xf1\xbb\x6b\xf2\x66\x67\x04\x97\x6b\xa1\x3c\x82\
+\x1c\xe2\xde\xb4\x7e\x27\x17\xa6\xcd\x5d\x06\x69\x57\xe6\x44\x79\
+\x89\xa8\x4a\x50\x4a\x0c\x12\x77\x72\x00\x20\xba\xdc\xad\xfc\x29\
+\xa2\x0d\x91\x9c\x2a\x84\x89\x95\xf5\x4a\x66\x86\xa3\xdb\x61\xc6\
+\xde\xaa\x00\x80\x73\xb4\xdc\x82\xf3\xa1\x3d\x50\x34\x90\x09\x3b\
+\xf8\x06\x45\x01\x20\xfb\xf6\x70\x52\x60\xe0\x6f\x68\x01\x14\x05\
+\x00\x92\x67\xd0\xab\x40\xe3\x8b\xa3\x0f\xe0\xfc\xc0\x45\xcc\xf5\
+\x07\x82\xc5\x07\x00\x71\x55\x04\xdd\xa4\x90\x60\x6c\xa0\x63\x08\
+\xd3\x28\x41\xa2\xe8\x56\x45\x22\x70\x94\x15\xbb\x3f\xe4\x2f\x1e\
+\x00\x88\x05\x04\x8a\xd2\x23\xf7\x6a\x75\xb8\x6c\x7b\xfe\x3e\x60\
+\x5b\x2b\x9b\x8c\x62\xd1\x1b\x8e\xe8\xde\xb3\x9a\xd5\x56\x2a\x7f\
+\x9c\x05\xe1\xfd\x6f\xac\xf7\x38\x66\xb7\x2b\x31\xf8\x2b\x06\x7b\
+\x75\x63\x64\xd2\x8a\xd3\xea\xb0\x6c\x85\xbf\xa8\x4d\xd3\x72\x48\
+\xca\x72\xe0\x29\x5b\x09\x66\xcd\x5b\x0e\xc7\x31\x58\x9f\x3c\x79\
+\x92\x01\x80\x22\xfb\xfd\xe2\x62\xeb\xeb\xf2\x3d\x06\xff\x23\x1c\
+\xc8\x55\xcf\xff\x28\x13\x08\x19\x00\xd0\x3a\x71\x8c\x9f\x8f\x84\
+\x63\xc8\xec\xe7\x9b\x1f\xf7\xc2\xb7\x7b\x05\x00\x38\x74\xf8\x57\
+\x04\x0b\xb2\x55\xa0\x82\xff\x31\xbc\xef\xf1\x53\x2c\x44\xd4\xae\
+\x63\x3f\x9b\x7d\xcf\x01\x59\x48\x1b\xdf\xfb\xf8\xab\x42\xfb\x9f\
+\x64\x7f\x87\x8c\xc5\xe0\xbf\x14\x33\xfe\x65\x1c\xfc\x39\xf0\x2f\
+\x5a\x01\xf3\x39\xeb\x5f\xc5\xc1\x3f\x7f\xc5\x1a\x36\xfe\x59\xbe\
+\x8a\xb4\xff\x37\x40\x41\xe1\x26\x0e\xfe\x85\x1b\xb6\xc0\xda\xcd\
+\x54\x12\xde\x08\x69\x15\x6a\x0a\x12\x60\x66\xc4\xc8\xf8\xc3\xb6\
+\xcc\xab\xf2\x81\x37\xe6\xd5\x53\x15\xf0\x72\x7c\x97\x22\x30\x88\
+\x4a\x95\x00\x01\x5e\x87\x47\x44\x48\x92\x34\x2d\x1d\xfc\x6d\x20\
+\x26\x26\x12\xd4\xec\xbc\x37\x5d\x3a\xef\xe1\xf5\x32\x97\x05\xe1\
+\x9d\x2e\xfd\x31\xfb\xde\x0b\x5f\x7e\xb7\x1f\xe6\xe4\xaf\x81\x9a\
+\xf5\x9e\x10\xc0\x41\x57\x01\x22\x3a\xc8\x78\x94\xcc\xae\x43\x69\
+\x4f\x1a\x06\x05\xec\xca\x91\x92\xdd\x15\x52\xbe\x11\xa8\x79\xeb\
+\x43\xf0\xd5\x0f\xfb\xe0\x57\xfc\x5d\x29\xf8\xff\x7a\x84\x82\xff\
+\xb7\xb0\x6b\xb7\x20\x05\x7e\x84\x01\x9e\x1c\x05\x89\x27\xb0\x69\
+\xc7\xc7\xb0\x7e\xdb\x87\x50\xb8\x71\x3b\xac\x5c\xbf\x05\x0a\x10\
+\x54\xad\xa2\xaa\x0a\x5e\x5f\xb9\x6e\x2b\x64\xdf\xf2\xb0\xed\xad\
+\x91\x11\x76\x4d\xe8\x84\x74\x3b\xc4\x16\xd4\xb1\x27\x56\x3c\xba\
+\x92\x61\xf1\xf8\x9e\x57\x9e\x47\x1e\xed\x84\x67\x25\x9c\x12\xf0\
+\x1a\x93\x10\xa9\xfa\x5c\x72\xfe\x6d\x6b\x00\xd8\xc1\x4c\x9c\x9b\
+\xe2\x7b\x22\x03\x24\x5f\xa0\x0a\xcc\x5d\x5a\x08\xf9\xab\x37\x41\
+\x7a\x85\x6c\x21\xd2\x45\xff\x47\xe0\x24\x33\x07\xca\x5c\x99\x0d\
+\xf3\xf2\x57\xb3\x6b\x62\x69\x7c\xae\xcc\xab\x6b\xc0\xfc\x25\x6b\
+\xa1\xe1\xc3\x2f\x4b\x62\xa8\x65\xf8\x99\x84\x8a\x18\xe7\x4e\xbe\
+\x24\xed\x89\xea\xb5\x87\x1d\x23\x74\xc9\x97\xb9\xc3\xf0\xd7\x88\
+\x7f\x56\x7c\x2d\xff\x80\x5d\xfd\xb8\xe0\x23\x8a\x81\xf8\x7b\x7a\
+\xac\xc0\x5e\x74\xc0\x3f\xbf\xeb\x1f\xe7\x97\x79\x99\x8c\x2c\xaf\
+\x65\x8f\x92\x05\xe2\x4f\x05\xa8\x0a\x40\x6c\xa3\x8a\xa2\xcd\x7e\
+\xe2\xf5\xfe\x8b\x26\xa9\x58\xb1\x67\x5f\x75\xd6\xef\x32\x3a\x31\
+\x9e\xd7\x13\x48\x0e\x00\x78\xfc\xb1\x41\x88\xc7\x6f\xfd\x25\x00\
+\xe0\x71\x2b\x8b\x39\x00\x81\x99\xc9\x47\x1c\xb3\xca\xa9\x2a\x33\
+\xf3\x5b\x5a\x23\x40\xab\x87\x65\xd8\xd3\x02\xb6\xb8\x4f\x8e\x9c\
+\x07\xb7\xe0\x8a\x8a\x37\xc3\xe2\x82\xcd\x90\x7e\x65\x84\x49\x47\
+\x29\x86\x9e\x7c\x54\xa5\x25\x60\x8a\x6a\xd8\x5c\x01\x73\xa5\xa6\
+\xcb\x3e\xb6\x04\x24\xcc\x32\x2f\x53\x19\xd6\x6f\xfa\x88\xe5\x7f\
+\x4f\x9d\x3a\xc5\x65\x7b\x05\x00\x7e\x95\xc1\xdf\x04\x00\xcc\xf2\
+\xe7\x7e\xbf\x08\xde\x47\x64\xe0\xa7\xe9\x81\x63\x98\xfd\xb3\x5a\
+\x1c\xaf\x13\x08\x02\x4e\xe2\x63\x7e\x67\x00\xf0\xdd\x9e\xfd\x0c\
+\x00\xf6\xec\x3b\x84\xf7\x3d\x21\x82\xbe\xba\x3c\x4e\xf7\x3d\x85\
+\x00\xe4\x2c\x34\x6f\xd5\x45\x97\xfe\xbd\x7a\x3c\x35\x0b\xaa\x44\
+\x1a\x72\xe0\xef\x3d\x28\x0f\xc6\x4c\x9b\x8b\x81\x7f\x39\xcc\x32\
+\xcb\xfd\x94\xf5\x63\xf0\xa7\x7e\xff\x92\x95\x6b\x61\x29\x06\xfe\
+\xe5\x98\xf9\xaf\x28\x5c\x8f\xc1\x7f\x03\x7b\x00\x14\xae\xdf\x04\
+\x6b\x37\x6d\x85\xf5\x5b\x76\xc0\x86\xed\x1f\x41\xb3\x36\xdd\x75\
+\x15\xc7\x67\xb4\x7d\x4c\x1d\x8d\x28\x3f\x09\xbf\xfd\xdd\x72\x50\
+\x37\x00\x33\x07\xff\x0c\xf2\x0d\x08\xc9\xeb\x16\x97\xe4\xdd\xbf\
+\x83\xaa\x28\x78\x03\xd1\xc0\x97\x03\xb5\x1a\xd7\x93\xd9\x69\xf8\
+\xa6\x87\x10\xd8\xac\x87\x2f\xbe\x3f\x00\x5f\xe2\xca\x9b\x34\x0f\
+\x6a\x20\x38\x14\x9a\x00\x02\xa0\x08\xe1\x1d\x69\xdd\x2b\x55\x10\
+\x15\x63\xdd\xcb\xad\x05\xa9\x2d\x41\xef\x3b\x93\x44\x96\x42\xec\
+\xb5\x90\x3b\x70\x2c\xfc\xf4\xdb\x71\x38\x7e\xea\x0c\x97\xfd\xf7\
+\x1e\x3c\x0c\xdb\x3f\xfe\x1c\x36\xed\xdc\x05\x6b\x36\xef\xc0\xa0\
+\xbe\x05\x96\x22\x80\xca\x5f\xbd\x11\x96\x15\x6e\x84\xa5\x08\xa4\
+\x68\x2d\xe1\xcb\x8d\xb0\x62\xed\x76\x58\xb0\x6c\x3d\x0c\xce\x9b\
+\x0e\x75\x1b\x36\x92\x9f\xc7\xdd\x36\x73\x93\x56\x95\x1f\x85\xf3\
+\xff\x3d\x5a\xb7\x44\x71\x1d\xc2\x0e\x73\xa6\x28\x0b\x6e\x17\x20\
+\xf7\xea\x76\x80\xdd\xa2\x53\xad\x39\xaf\xf2\xcc\xd0\xc4\x4e\xa7\
+\x6c\xaf\x1a\x91\x4d\xf5\x0b\xe5\xc8\xfe\x79\x93\xb9\x2d\x52\xa3\
+\xde\xa3\x2c\xf1\x4c\xc2\x5e\x42\x98\x0b\xcf\xcf\x4b\x23\xd0\x25\
+\x77\x28\xb4\x47\xb0\x9a\xca\xdf\x7d\x15\xe8\x83\xdf\x63\xb3\x56\
+\x9d\x25\x17\x24\x28\x47\x8b\x83\x71\xec\xd5\x4b\x32\xee\x67\xec\
+\xef\x01\xab\x44\x09\xcd\xf9\x0b\xfa\x96\xeb\xbd\x58\x51\x31\xc6\
+\x93\x1e\xbe\xf0\x00\xa0\x18\xd5\x04\x67\x22\x79\x21\x24\x95\x4b\
+\xdc\x02\x28\x89\x9a\x51\xbc\x99\xf9\x50\x0c\x23\x91\x58\xbe\xf5\
+\xa1\x24\xc7\xfd\x42\xc5\x6c\x05\x14\xc5\x56\xb5\x12\xba\x3c\x71\
+\x89\x2d\x46\x5f\x5f\xdc\x9e\x8c\x89\x51\x3c\x85\xc2\x64\x4e\xbc\
+\xc4\xf3\xb5\xca\x0b\xde\x97\xe1\x02\x00\x19\xca\x21\x2e\x5b\x8e\
+\x21\x19\x22\x4c\x6a\xf3\x77\x88\x86\x04\xe5\xe8\x96\xfd\x78\x55\
+\x09\x10\x3d\x68\x55\x92\x0e\xc1\x0d\xe1\xbb\x60\xd1\xca\xcd\x50\
+\xb6\x7c\x96\xd8\xd8\x39\x53\x34\x65\x90\x63\xdb\x73\x2a\x62\xa0\
+\x37\xdd\xb4\xfe\x75\xd9\xdd\x4a\x63\xa0\x52\x97\x54\x82\xcf\xbf\
+\xf8\x5e\x03\x80\xc3\xbf\xd8\xc1\x5f\x2f\x9d\xfd\xcb\x7e\xfd\x11\
+\xd5\xef\x3f\x26\xb3\xfe\x13\xac\x1f\x70\x14\x03\xff\x71\x0e\xe6\
+\x08\x00\x4e\x52\x49\xff\x04\x7b\x0b\x7c\x8f\xc1\x9f\xa4\x62\xbf\
+\xdf\x4b\x72\xb1\x07\x79\x12\x40\x00\x00\xd1\xf7\x57\xe5\x7f\x32\
+\x22\x7a\xb9\xf9\x3b\xd2\x3d\x2e\x5b\x66\xb6\x52\xbe\x18\x37\xe0\
+\x9e\xfd\x31\xfb\x1f\x36\x06\x66\x2f\x5e\x01\x73\x30\xe3\x27\x92\
+\xdf\xfc\xfc\x02\x58\xb8\x94\x4a\xfe\xab\x30\xeb\x2f\x84\xa5\x98\
+\xf5\x2f\x5b\x8d\xc1\x9f\x4a\xfe\x6b\x30\xf8\x73\xdf\x7f\x13\x67\
+\xfe\xeb\x36\x6d\x87\x75\x5b\x77\xc0\xc6\x6d\x3b\x61\xf3\x8e\x5d\
+\x08\x02\x3e\x85\x6b\xb3\xee\x70\x1d\x5b\x41\x83\x5c\x19\x8a\xfa\
+\xce\xf4\xef\x19\x08\xea\xde\xae\x28\xfb\x07\x39\xf0\x53\xd0\x4a\
+\x91\xcc\x77\x4f\x86\xc1\x03\xd0\x23\x98\x36\x6f\xc3\x29\x72\x25\
+\x02\xbe\xa9\x8f\xaf\x5e\x8f\x6c\x9f\x2f\xb9\x34\x0c\x2f\xb4\x78\
+\x0f\xb6\xef\xfa\x1a\xbe\xfa\x6e\x2f\x7c\xfd\xe3\x01\x58\xbc\x72\
+\x13\xbc\xfa\x46\x17\xb8\xae\xfa\xed\x50\xaa\x4c\x45\x48\x21\xb1\
+\xa3\xb2\x55\x04\xe1\xd4\x5f\x4d\xaa\x4a\x56\xd3\x6a\x88\x74\x59\
+\xe6\x52\x0b\x1a\x60\xa6\x3a\x7a\xd2\x5c\x38\xf8\xcb\x11\x38\x72\
+\xfc\x24\xfe\x56\x67\x10\xc8\x9d\x82\x8f\x3f\xfb\x1a\x03\xfb\x06\
+\x58\x8c\xdf\x1f\x4d\x06\x2c\x5e\x45\xd7\x37\x72\xf0\x5f\x4a\x44\
+\xc1\xb5\x5b\x61\x0e\x66\xba\xbd\x07\x8d\x63\x79\xe3\xba\x0d\x9f\
+\x85\xab\x2a\xde\xc2\x01\xd0\x23\xc7\xe1\x52\x59\xd2\x38\xa4\x89\
+\xc0\xb6\x3e\x85\x59\xae\x0e\xba\x40\xaa\xcc\xf4\xb5\x86\x7b\x58\
+\x67\xfd\x9e\x40\x38\xee\xb9\xe9\x98\x76\x30\x75\x1b\xdc\x7a\x0e\
+\x99\xd9\x46\x75\xc0\xe4\xee\x58\x42\x86\x58\xb6\xe9\x52\x0d\x8d\
+\x8c\x16\x6d\xbb\xf1\x77\xf1\xf8\x0b\x6f\x8a\x73\x4e\x3a\x67\x0a\
+\x19\xe7\x30\x74\xec\x31\x84\x2d\x93\xe9\x7b\xa6\x16\x5d\xef\x7e\
+\xa3\xa0\xf9\x9b\x5d\x6c\x00\x10\xb3\x0d\x59\xdc\x39\x73\xe7\xb9\
+\xed\x89\xe2\x7e\x59\x70\x7e\x47\xf9\xac\x22\x88\x8a\x56\xd2\x9e\
+\x36\x17\x9e\xb4\x57\xd4\x54\x80\x95\x78\xec\xfd\x6f\x98\x8c\xf8\
+\x47\xf1\x3e\x40\xb0\xe4\x00\xc0\x51\xf2\x8d\x25\x12\x64\x9e\x30\
+\x61\x47\xe9\x2d\x7e\x00\x0d\xc7\x61\xc1\x27\x5b\xfe\x4f\x50\xea\
+\x77\x57\x23\x5c\x9b\xac\x33\x98\x59\x71\xc6\x33\x8a\x30\x0a\xf2\
+\x27\xc3\x92\x0d\xc6\x65\xac\x3a\x67\xfb\x9d\x32\xb1\xbe\x0c\x9b\
+\xf8\xe7\x95\xc1\x9f\x41\x40\x40\x38\xc7\x69\xf1\x25\x53\xfa\xd4\
+\xc8\xc8\x9d\x92\xad\x36\xf9\x89\x18\xe9\xa9\x52\x94\x86\xc0\xc6\
+\x53\x2f\xb5\x61\xf7\x40\xca\xd2\x4d\x37\xb9\x58\x02\x49\x0e\x43\
+\x0c\x5d\x2e\xb5\x0c\xd5\x32\x27\x00\x50\x20\x81\x14\xf2\xf6\xee\
+\xff\x19\x4e\x9e\x3e\x2d\x2a\x00\x46\xf6\xcf\x81\xff\x37\xc5\xf6\
+\x3f\x62\x97\xfd\x39\xe8\x1f\x95\xbd\x7e\x91\xf9\x1f\xe7\x8c\x5f\
+\x94\xfe\x09\x4c\x10\x9f\x80\x5a\x0a\x27\x4f\x9d\xe4\x8a\x02\x55\
+\x00\x7e\xdc\x4b\x20\xe0\x20\xec\xc3\x2c\x93\x08\x66\xc7\x69\x9d\
+\x38\xc9\x20\x80\xff\x3e\x79\x0a\x5e\x6c\xda\xde\x1e\x9f\x33\xc4\
+\x57\xa8\x02\xd2\xb8\xd9\x3b\x30\x7c\xfc\x74\x98\xbf\x04\x03\x3f\
+\x66\xfc\x0b\x97\x18\xe5\x7e\xcc\xfa\x97\xad\x5a\xcb\xe5\xfe\x95\
+\x6b\x36\x60\xe0\xc7\xac\x7f\xdd\x46\x0c\xfc\x9b\x61\xcd\xa6\x6d\
+\x5c\xf6\xdf\xb0\x75\x27\x06\xff\x0f\x39\xf8\x6f\xdd\xf9\x09\x6c\
+\xff\xe8\x53\x18\x39\x7e\x36\x07\xc6\x94\xf4\x2c\x69\xdc\x65\xd9\
+\xc1\x2b\xdd\x8a\x1a\xb5\xf4\x3a\x82\x73\x88\x83\x3d\x2f\x06\x00\
+\x41\xa9\x40\x27\x44\x9b\x14\x00\x48\x95\xd5\x23\x6f\x86\x0c\x30\
+\x0a\x00\x98\x23\xb5\x01\xb7\xb2\x9c\xdd\x03\x57\x96\xc8\x44\x72\
+\x2b\xff\xaf\x9b\xa0\x5d\xe7\x01\xf0\xd1\xee\xef\xe0\xeb\xef\xf7\
+\xc1\x17\x5f\xff\x08\x9f\x7d\xf5\x03\x66\xe9\x5b\xd8\xe1\xf0\x95\
+\x96\x1d\xe1\x81\x27\x9b\x41\xbd\x7b\x1a\x41\x9d\xbb\x9e\x84\xfa\
+\xf7\x3d\x0f\x4f\x34\x6e\x05\xed\x3a\xf5\x85\xa9\x73\x96\xc0\xb7\
+\x7b\x0e\xc1\xcf\x08\xde\x7e\x23\x00\x47\xb2\xcf\x27\x4e\xf3\xed\
+\xd5\x6a\xdc\x09\x13\x67\xe6\x73\x56\x4f\x0c\x78\x5a\xf9\xf8\x9c\
+\x13\x66\x2d\x81\xf6\x5d\x06\xc1\x83\x4f\xb5\x84\xeb\xad\x3b\xf1\
+\x58\xae\x22\x74\x2a\xca\x55\x93\xda\x07\x6e\x4f\xf7\x48\x5c\x65\
+\x3c\x13\x00\x08\x30\x64\x00\x03\xf3\xfb\x92\x26\x4c\x0a\x0c\x08\
+\x43\x26\x09\xae\x4d\x55\x4e\x37\x17\x40\x19\xfd\x28\x1f\x04\x15\
+\xf0\x33\xb3\x65\x65\xad\x86\xbc\xcc\xd6\xe7\x46\xaa\x5f\xb4\x75\
+\x18\xbc\xe8\xdf\x27\x0b\xee\x79\xf4\x15\x06\x00\x6d\x3a\xf6\x95\
+\xbc\x84\x88\xe6\x23\x94\xc6\xfb\x4d\x99\x9e\x0f\x0f\x3f\xd1\x9c\
+\x09\xba\x34\xb6\x3a\x63\xfe\x0a\x7e\x8c\x98\xe8\xb0\x5c\xea\xa6\
+\x71\xc6\x8b\x93\xca\x5c\x43\xb1\x47\x99\x13\x10\x01\xcf\x2f\xc9\
+\x2f\xda\xa1\xd2\x17\x48\x3c\x09\xe5\xe0\x1b\x25\x6c\x7b\x58\xc5\
+\x6c\x4b\xc4\x1e\xd3\x53\x24\xd8\x44\x09\x9c\x5b\x6a\xd8\xf9\x7d\
+\x5d\x98\x4a\xca\x3f\x8a\x9f\xd5\x27\x0a\x50\x71\xec\x25\xcd\xb1\
+\x3a\xb3\xd4\xe6\x77\x97\x8d\xcc\x7e\x9b\x09\x16\x82\x49\x54\x00\
+\xac\x62\x5a\x12\x07\x13\x64\xfb\xce\x83\x38\x7a\x74\xcf\x8a\x73\
+\x02\x14\x31\x0e\xe3\x98\x50\xc8\x72\x32\x6e\x93\x56\x80\x0a\xc7\
+\x25\xc1\xb8\xd5\xc8\x52\x25\x73\x9f\x7a\x82\x1e\x29\xc0\xc2\x02\
+\x1f\x4a\x00\x46\xa9\x84\xf9\xc5\x26\xe3\x64\x83\x47\xb4\xf8\x4c\
+\xaa\x63\xf6\xbc\x06\x2b\xc5\x91\x48\xcc\x65\xd7\xd6\x66\x7b\xd2\
+\xc7\x9e\x6f\x2d\x8d\x82\x24\x07\x40\xb7\x39\x42\x51\x6d\x0d\x5f\
+\x20\x12\xe7\x7b\xb6\x74\xef\x3a\x4a\x37\x00\x03\xeb\x2f\xbf\x1d\
+\x47\x00\x70\x8a\x03\x36\x07\x7f\x43\xac\x47\x11\xff\x14\xe9\xef\
+\x28\xf7\xec\x8f\x4a\xd5\xc0\xe3\x8e\x45\x99\x3f\x05\x74\x0d\x00\
+\x10\x50\x90\x77\x3c\x3d\xef\xf7\x3f\xee\x67\x31\x20\xaa\x00\x50\
+\x1b\x80\x40\x05\xdf\x17\x33\x7f\x2a\xff\x13\x18\x20\x1e\x40\x93\
+\xe6\x1d\x6c\xd5\x3b\x6d\x18\x23\xa6\x28\xac\xda\xf7\xf3\x7c\xbf\
+\xa3\xcf\xcf\x81\x7f\x9d\x60\xf9\x17\x8a\xe0\x2f\x02\xff\x26\x58\
+\xb3\x71\x0b\xac\xc5\xe0\xbf\x8e\x82\xff\x16\x19\xfc\xb7\x7f\xc4\
+\xb6\xc0\xdb\x3f\xfc\x14\x76\x20\x00\xf8\xf0\xe3\x2f\xa0\x51\x93\
+\xb7\x59\xaa\xd9\x23\x89\x73\xa9\x7e\xcb\x16\xac\x09\x18\x3d\x7f\
+\x0d\xaa\xc2\xfa\xba\xea\xfd\x7b\xe5\x75\x06\x03\x99\xaa\xfc\x6f\
+\xaa\x42\x1a\x26\x51\x7a\x82\xc5\x72\x1c\xbb\x5a\x28\x27\xe0\x22\
+\x9c\x66\xca\x1e\x36\x8d\x2e\xca\x49\x85\xc0\x35\x35\xe0\xb9\x97\
+\xdb\xc2\x64\x0c\xd0\x1f\xef\xfe\x1e\x76\xed\xfe\x16\x2f\xbf\x15\
+\xc4\xbc\x2f\xe5\x9c\x3e\xa9\xf5\x91\x0e\xc3\xf7\x7b\xe1\xfb\x7d\
+\x07\x60\xef\xa1\x9f\xe1\x27\x52\x70\x3c\x7a\x92\x65\x7b\xbb\xf4\
+\x1e\x0e\x55\x72\xee\xc6\x63\x0e\x5f\xaf\x7c\x18\xde\xee\x32\x18\
+\x01\xd6\x2c\x68\x8e\xd9\xef\x6d\xf7\x36\x66\xf6\x7b\x4a\x5a\x25\
+\x06\x5f\x5c\x51\xf0\x1b\x63\xb4\xda\xd3\x23\xf6\x39\xa9\x80\x6e\
+\xb4\x80\x56\xd0\x10\x32\x72\x97\xf0\x5d\x8e\x88\x31\x78\x00\x9e\
+\x22\x94\x02\x7d\x86\xa6\x83\x79\x8e\x91\xe9\x92\xd2\xf6\x4f\x95\
+\xad\x25\x13\x60\xfa\x0c\x87\x4c\x02\x67\x24\xd4\xb5\x6c\xed\x26\
+\x18\x34\x7a\x8a\xa8\x48\x48\x42\x23\x55\x55\x1e\x78\xbc\x39\xcc\
+\x9a\xb7\x12\xfc\x57\x84\xb8\xda\xf2\xd4\x0b\x6f\xc2\xcc\xf9\x05\
+\x90\x7e\x55\x2d\xcd\x1d\x29\x7a\x9f\x77\xef\x95\xe1\x38\x65\xeb\
+\x78\x7a\x30\x21\x57\x7b\xe4\xc2\xac\x68\x35\xbf\xf3\x91\xc9\x5b\
+\x25\x4c\x7e\x8b\x2a\xf1\x97\xf4\x3d\x85\x2f\x88\xf7\xc2\x3f\x4a\
+\xd6\x5f\x29\x4e\xc5\xc0\x9d\x01\x9a\xf6\xb5\xb1\x5e\xd3\xed\x98\
+\x15\x72\xf4\xab\x13\x97\x95\xac\x22\x80\x41\xb4\xd8\x48\x42\x22\
+\x63\xd4\x7d\x82\x71\x0e\x86\x64\x4a\x3a\xd1\xd5\x03\x4f\x52\x3d\
+\xb7\xa2\x4f\x24\xf3\x64\x36\x55\xf6\x78\x16\x5b\xf6\xaa\x15\x13\
+\x9b\xc9\x5b\x86\x1c\xac\x66\xfd\x53\x50\xe1\x52\x6e\x98\xcb\xb9\
+\x42\x89\x2e\xc2\xc1\x5e\xa8\xd1\xe5\x70\x96\x52\x5a\x12\xd2\xae\
+\x0f\xde\x09\x63\xa6\x2e\x84\xa1\x63\x67\xb3\x41\x89\x47\xf6\x73\
+\x3d\x51\x7c\x8e\x50\xb4\x85\x6c\x0c\x23\x29\xdd\xaf\x76\x2d\xca\
+\x56\x2f\x2e\x1f\xc4\x00\xfc\x07\x9c\x3a\x73\x9a\x4b\xf6\xda\xd0\
+\xc7\x0c\xfc\x3c\xb6\x67\x94\xfd\x8f\x8b\x4b\xdd\xeb\x3f\x79\x82\
+\x47\x08\x8f\x9f\x3c\xce\x6e\x82\x94\xf5\x9f\xe0\xc0\x4f\x00\xe0\
+\x04\x9c\x42\x70\x71\xe8\xa7\xc3\x0c\x00\x7e\xc4\xe0\xbf\x67\xff\
+\x21\x38\x80\x7f\xd3\x7d\x18\x2c\x20\x00\xa0\x0a\x00\x71\x02\xde\
+\x78\xab\xbb\x50\x41\x94\x4a\x6b\xc2\x17\x41\x90\xe3\x7c\xe9\x55\
+\x20\x6f\xe2\x5c\x58\xb4\x7c\xb5\x0c\xfc\xd4\xe7\xa7\xa0\xbf\x11\
+\x33\xfe\x4d\xb0\x6a\xdd\x26\x58\xbd\x7e\xb3\xcc\xfa\xb7\xc0\x7a\
+\x0e\xfc\x3b\x38\xf8\x6f\xda\x2a\x82\xff\xd6\x9d\x14\xfc\x3f\x83\
+\x9d\xbb\x3e\x87\x9d\x9f\x7c\x0e\x1f\x7e\xf2\x05\x6c\xff\xf8\x4b\
+\xa8\x71\xcb\x23\x42\x7d\x2f\x4d\xbd\xa6\x65\x94\xa8\x9d\x53\x16\
+\xfa\x7c\x51\x2b\x43\x02\x81\x8c\x20\x03\x80\x52\x99\x76\xf0\x57\
+\x41\x4d\x64\xb2\x12\x2c\xa8\x16\x82\x5b\xc3\x21\xdd\xd4\xb7\x0f\
+\xdb\x1e\x0f\x86\xfb\x23\x97\xb3\xcb\xcb\xc0\x49\x40\xb3\x6c\x15\
+\xc8\xb8\x3a\x07\xee\xc5\xec\xb3\x63\x8f\xa1\x30\x6d\xce\x72\x58\
+\xbf\xed\x13\xf8\xf8\x0b\x52\xea\xdb\x03\xbb\xbf\xd9\x07\xbb\x3e\
+\xff\x0e\x56\xac\xd9\x0a\x43\x47\x4f\x83\x57\x5a\x75\x82\xe0\x8d\
+\xf7\xf1\x68\xa5\xb2\xf3\xa5\x45\x40\x96\x40\x80\xe2\x0d\x10\xe8\
+\xf4\x32\x28\xb2\xdb\x4e\x1e\x53\x3a\x5b\x11\xdc\x02\xb6\x2b\x9e\
+\x5d\x39\x0b\xe9\x36\x57\x34\x09\x35\x98\x40\xb0\xca\x72\x01\x00\
+\xcb\x30\xd9\x0a\x39\x6c\xb7\xbd\x31\x6d\x7f\xe5\x32\x4b\xfd\x7a\
+\x1a\x20\xa2\x27\x21\x7c\x0c\xc2\xaa\x41\x29\x0c\xde\x6a\x09\xe3\
+\x28\xa9\xbe\x89\xf7\xc9\xa8\x50\x93\xab\x21\xb3\x16\xaf\xe4\x09\
+\x0d\xaa\xec\x5d\x7c\x69\x08\x1e\xa7\xf1\xdc\xfc\x75\x50\xaf\x61\
+\x23\x7c\x5c\x65\x78\xe0\x89\xe6\x3c\x06\x78\xd7\x43\x2f\x8b\x6a\
+\xa0\xdc\x1b\x8a\xb6\x77\x4f\x8e\xc0\xe6\x24\x6d\xff\x5d\xaa\x7f\
+\xa1\x22\xb2\xe9\x50\x1c\x95\xc3\xe2\xaa\x19\x5a\x25\x2e\xcb\xdb\
+\xef\x43\x55\xe6\xce\x97\x8d\x6f\xf1\x39\x62\xc5\x04\x00\xd6\x79\
+\xea\x79\x44\x67\xb8\xda\xf5\xcd\xf1\xa5\x58\x45\x04\x54\xa7\xef\
+\x76\xd1\xfd\xfb\x78\x25\xfd\x60\x9c\x60\x1f\x6f\xac\xd1\x4a\xcc\
+\x64\x8f\x6b\xdb\x18\xaf\xac\x16\x4b\x6d\xd0\x8a\x89\x66\x93\x2f\
+\x2f\x59\x31\xe6\x6f\x45\xcb\xe2\xae\x07\x9a\xc0\x0b\x2d\x3b\x41\
+\xe3\x96\x1d\xa0\x71\xf3\xf7\xa0\x11\xad\xa6\xef\x1a\xeb\x7d\x68\
+\xf4\xea\xbb\xf0\x1c\x5e\x6f\xdc\xec\x3d\x78\x11\x33\xdb\x97\x5b\
+\x76\x64\x6b\xe0\x26\xaf\xd3\x65\x07\x78\x09\xaf\xbf\xd8\xa2\x23\
+\xbc\xd0\xbc\x13\xbc\xd0\xac\x13\x6e\xce\x5d\xa1\x5b\xdf\x31\xb0\
+\x64\xf5\x36\xe8\x35\x68\x3c\x04\x2a\xd4\xb2\x89\x67\xfe\x68\xe4\
+\xef\xd3\x73\xc6\x61\xdb\x01\xd2\xa1\x5c\x68\x3f\x56\xb3\xd1\x33\
+\xec\x0a\x10\x65\x34\x69\x97\x87\xe1\xf4\xd9\xff\xc0\x99\x33\x67\
+\xb8\x7c\x6f\x02\x00\x2d\xf6\xe3\x00\x01\x47\x25\x08\x10\x40\xc0\
+\x2e\xfd\x1f\xe7\x60\x7e\x52\x05\x75\x79\xfd\x14\x57\x01\x4e\x71\
+\xb6\x4f\xb6\xc0\x3f\x52\x05\x00\x01\xc0\x9e\x03\x07\xf9\xf9\xc8\
+\x7a\x98\xfe\x8f\xd7\xf1\x13\xf0\x7e\x97\xfe\x2c\xc1\xaa\x46\xe2\
+\x94\x58\x11\xf5\x99\x69\x93\xae\x79\xeb\xa3\x30\x72\xc2\x1c\x58\
+\x59\xb8\x19\x56\xad\x15\x01\x9f\xd7\x06\x11\xf8\xd7\x6e\x14\x19\
+\xff\x3a\xcc\xfc\xd7\x6f\xde\xc1\x65\xff\xcd\xdb\x30\xeb\xdf\xbe\
+\xcb\x0e\xfe\x1f\x7f\x0e\x1f\x61\xe0\x27\xd3\x9b\x8f\xa5\xe3\xdd\
+\xa6\xed\x9f\xc1\x0d\x59\xf5\x05\xe1\xcb\x70\xc9\x14\x7a\x0b\x41\
+\xa7\xe0\x52\xba\xb3\x8a\x22\x66\xef\x31\xf0\x07\x0c\x1e\x8b\x31\
+\xa3\x2f\x5a\x42\x61\x41\x10\x24\xde\x05\x06\xa0\x14\xcd\xca\x77\
+\x4e\x05\xd8\xbf\x13\x66\xfb\x46\x85\xc8\x96\xf9\xb5\x5b\x77\x14\
+\x98\xc9\x65\xb2\x54\x5a\x55\x6d\x25\x4d\xed\xa2\x52\x65\xaf\x67\
+\xb0\x54\x06\xc1\xdd\xc5\x19\xd2\x5c\x0a\x9f\x9b\x44\xa7\x4a\x33\
+\xe8\x34\x1c\x25\x33\x85\x11\x92\xb8\x4d\x95\x6d\xb3\xb4\x66\x85\
+\x00\x9f\xc6\x24\x91\xd6\x3a\xb7\x64\xdf\x3e\xe4\x50\x3c\x54\xef\
+\x3d\xb6\x68\x4f\x7c\xf3\x1f\x33\x31\x51\x3a\xfa\x1e\x33\xe0\x1b\
+\x00\xc0\xa3\x75\x1a\xdc\x2d\x00\x59\x6d\x31\x2a\x6a\x04\xae\xaf\
+\xa9\x72\x3b\xb4\x68\xd3\x03\xfa\x0f\x9f\x8a\xc7\x7b\x84\x2b\x69\
+\xb7\x34\x7c\x0e\x46\x4c\x9e\x0f\x43\xf1\x58\x1a\x82\x40\x7b\xe8\
+\xd8\x39\x30\x7c\xc2\x3c\x18\x39\x79\x21\x8c\x99\xb6\x18\xc6\x4d\
+\x5f\x2c\xc6\x48\x57\xae\x87\x3e\x43\x27\xc3\xc0\xd1\x33\x61\xda\
+\x82\x95\x30\x6f\xd9\x1a\x18\x32\x66\x3a\xbc\xfe\x76\x4f\x04\xa3\
+\xf3\x60\xc6\xa2\x42\x68\xf0\x68\x33\x11\xf4\xf1\xf5\x3c\xac\x7d\
+\x10\xb1\xf7\x2e\xbf\x41\x44\x36\xf7\xbb\x40\xb0\x04\x49\xdf\xdf\
+\x4d\xa4\x8b\x3f\xa7\x9f\x78\x84\x31\x19\x32\x78\xa2\xa4\xef\xaf\
+\x3a\x0d\xfe\xb7\x8d\x93\xc4\x67\xfa\xc7\x85\x22\x17\x44\x07\x42\
+\xcb\x21\x7c\x60\xf7\x5f\x62\x8f\x6c\x38\xfa\x46\x86\xb0\x8d\x2f\
+\x8a\x75\x5b\x5c\x6d\xea\x44\xa5\x7f\xe7\x97\x13\xdd\xf3\xb7\x37\
+\x40\x6f\x20\x5e\xc0\xb6\xe2\x8c\x03\x5a\x09\x5a\x19\x11\x17\xa2\
+\x76\xa2\x58\x6f\x02\x3f\x6f\x13\x20\xa5\x3a\x40\x52\x10\x1e\x7a\
+\xea\x35\x68\xd3\xa1\x2f\xbc\xf5\x5e\x1f\x68\xfd\x7e\x5f\x78\xf3\
+\xdd\x0f\xa0\x55\xbb\x5c\x78\xad\x6d\x0f\x18\x37\x63\x11\xcc\x5c\
+\xb4\x1a\x5a\xbf\x9b\x0b\xc3\xc6\xcd\x60\xe7\xb5\xfe\x23\xa6\x40\
+\x8f\xfe\x63\xa1\xd7\xc0\x71\xd0\x73\xc0\x58\xe8\xde\x6f\x34\x74\
+\xed\x9b\x07\x1d\x73\x47\xc0\xfb\xbd\x70\xf5\x18\x01\xef\x76\x1b\
+\x02\xcd\xdb\x74\x87\x1a\xb7\x3d\xce\xd9\xa4\x2d\xe0\x13\x71\xcd\
+\xf5\xdb\xd9\x8e\x73\x14\x31\x1c\x0d\x0e\xfd\x41\xad\x22\xa7\x7d\
+\x04\x0c\xa2\x22\x49\xce\x9e\xf9\xe3\xdf\x70\xf6\x0f\xaa\x00\x9c\
+\xd4\xda\xfc\x94\xfd\x6b\x00\x70\x94\x96\x9c\xf7\x97\xc1\x9f\x4b\
+\xfe\x27\x4f\xc8\x75\x1c\xb3\xfd\x13\xdc\x46\xa0\x6c\x9f\x4a\xff\
+\x27\x4f\xdb\xc1\xff\xd4\xe9\xd3\x70\xfa\xcc\x69\xf6\x16\xf8\x51\
+\xb6\x00\xf6\x52\x15\xe0\xd0\x61\x7e\x3c\xb5\x0b\x8e\x73\x15\xe0\
+\x04\xf4\x1f\x32\x9e\x7b\xcc\x1e\x19\xd4\xae\xac\x78\x9b\x20\xb0\
+\x31\xd1\xac\xaa\xf0\x69\xcf\xcc\xe2\x8c\x6b\xca\xec\x65\x18\xec\
+\x77\x72\x96\xbf\x69\xfb\x87\xb0\x7e\xab\x08\xf8\x1b\x71\xa9\x7e\
+\xff\x26\x0c\xfe\x5b\x77\x7c\x0c\xdb\x76\x7e\x02\x3b\x3f\xfa\x0c\
+\x3e\xfc\x58\xb8\xde\x11\xe1\x8d\x64\x6f\x3f\xdb\x4d\xb3\xed\xdf\
+\xb2\xa1\xcd\x06\xcc\x9c\xaf\xad\x56\x4f\x2a\xee\xb9\x8c\x95\xd4\
+\x0c\x3f\x57\x53\x42\x8e\x71\x3e\x75\x2c\x7b\x24\x11\xd7\xeb\xae\
+\xcc\x30\x49\x30\xcc\x24\xc1\x52\xcc\x13\x08\xda\xbc\x17\x79\x7f\
+\x35\x42\xa8\x47\x10\x75\x0b\x20\xdb\x19\x50\xa5\x5b\x9a\x02\x76\
+\xba\xea\x54\xae\xba\x94\x24\x96\xe3\x84\xaa\x44\xcf\x1c\x15\x51\
+\x65\xa2\x8a\x93\x10\x9c\x8a\x48\x7e\x41\x48\x04\xfe\x4c\x53\xf9\
+\xd0\x68\x79\x28\xe3\x1e\x6d\x19\x1e\xbf\xb7\x1a\x9d\xc5\xc7\x92\
+\xca\x76\x66\x6e\xd1\x15\x02\x9b\x60\xeb\x35\x5a\x00\x76\xd6\x1f\
+\xd6\x04\x41\x6f\x5c\x7e\x81\x3d\x01\x40\x32\xcf\xe1\x3a\x8f\xc0\
+\xd4\xf9\x05\x78\x8e\x7e\x00\x77\x3e\xf0\x3c\x94\x0e\x88\xef\xeb\
+\x9a\x2a\xf5\xa0\xc1\x23\xaf\x40\x83\x87\x5e\x82\xbb\x1e\x7c\x11\
+\x1a\x3c\xdc\x04\xee\x7e\xac\x29\xdc\xf7\x54\x0b\x78\xf0\x99\xd7\
+\x71\xbd\x06\x63\xa6\xce\x63\x02\x64\xd3\x37\x3b\xc3\x03\x4f\xb5\
+\xe4\xdb\x1e\x69\xf4\x06\x3c\xfa\x6c\x2b\x78\x08\xef\x73\xfb\x03\
+\x2f\x42\xfa\x3f\x6b\xf3\xf7\xeb\x65\x8b\xef\x9a\xdc\x0e\xf4\x98\
+\xad\x38\xbf\x12\xfd\x09\x6a\x5e\x90\x73\xcc\x3a\xd6\x84\xd6\xdf\
+\x3d\xc6\x16\x5f\xb8\x2d\x3a\xae\x84\x63\xbe\xcf\xc4\x5e\x33\xb1\
+\xe2\x80\x5b\x6d\x35\x98\xb0\x0d\xe1\x0b\xc4\x1e\xcd\x36\x35\xfd\
+\x8b\xb6\x14\x4e\x62\xc5\xb5\x64\x2e\x1e\x48\xf0\xa4\x5b\x17\x02\
+\x00\xc4\x43\x50\x4e\xe7\xa5\xf8\xbd\xfd\xa0\x43\xe5\x2e\xea\x04\
+\xcc\x30\xcb\x31\xe1\xf3\x00\x50\x0c\x66\x75\x20\x54\x84\xfe\x40\
+\x2c\x64\x1c\x8f\x40\x12\x8b\x77\x60\xc5\xd5\x20\x88\x69\xcf\x19\
+\x08\x15\x79\x82\xe9\x39\xf0\xa8\x72\x93\x94\x7e\xa5\x8c\xab\x2c\
+\xb9\xe9\x55\x85\x52\x65\xaa\xc0\xff\x5c\x5c\x11\x6a\xde\xf2\x08\
+\xcc\xc2\xac\xa0\xb2\x75\x07\x44\x6e\xba\x0f\x16\x2e\xdf\x00\x35\
+\xea\x3e\xc6\x07\x04\x13\x93\x32\x73\x24\x2b\x59\x6c\xfa\x34\xda\
+\x97\xe2\x17\xe3\x5b\x54\x76\x2d\x25\x05\x47\x74\x8f\x34\x33\x5b\
+\x4e\x05\x64\x1b\x24\xce\xe8\x11\x28\xd3\xf1\xcf\x29\x17\x6d\xb7\
+\x21\xd8\x38\x28\x5d\xba\x07\xca\xdf\x5f\x00\x80\xff\x20\x00\x38\
+\xcb\x00\x80\xe5\x79\x8f\x08\xd2\x1f\x69\xc0\x93\xd1\xcf\x8f\x07\
+\x0e\x43\xef\x01\x23\xe1\x37\x1a\xdb\x3b\x7a\x04\x03\xf5\x51\xcc\
+\xd6\x8f\x89\xde\x3d\x91\xfe\x64\xa0\x57\x00\x80\x02\xfe\x29\x49\
+\x2a\x54\x00\x80\x2a\x0c\x27\x4f\x9e\x86\x3d\x7b\xf6\xc3\xde\xbd\
+\x08\x00\x10\x04\xec\x43\x30\x40\x1c\x03\x22\xff\x09\x1e\xc0\x09\
+\x98\x3e\x3b\x1f\x33\xd8\x8a\x22\x9b\xc5\x55\x25\xe7\x7e\xa8\x18\
+\x69\xc8\xc1\x5f\x08\xf1\x58\xb2\x17\x4e\xda\xef\x61\xb8\xef\x89\
+\x66\x30\x77\xf1\x1a\xd6\x9e\xdf\xfd\xed\x0f\x2c\x46\x43\xa5\xfe\
+\x4d\xb4\x38\xf3\xc7\xe0\xff\xe1\x27\xb0\xe3\xa3\xdd\x9c\xf5\x73\
+\xf0\x27\x51\x1b\x0a\xfe\x14\xf8\xbf\xfa\x8e\x35\xee\xc9\xb4\xe8\
+\xdb\x1f\xf7\xc1\xd6\x9d\xbb\xa1\x4a\xa8\x81\xdd\x4f\x0e\xc8\x9e\
+\xb1\x9a\x5f\x57\x6a\x7e\x0a\x04\xa8\x49\x8f\x0c\xb3\x32\x10\xd2\
+\xf7\x11\xe3\x6d\x16\x93\xd8\x18\x04\xa8\xf9\xff\x0c\x7b\x12\x43\
+\x55\x06\x4c\xcd\xfc\xd4\xf4\x88\x2d\x87\xac\x82\xa3\x32\xcf\xf1\
+\x87\x6c\x6e\x89\x21\x30\x25\xf8\x21\xd2\x36\x58\x95\xe5\x95\x40\
+\x8e\x6c\x1f\x08\x65\x45\x45\x66\x55\x8a\x84\x71\x1c\x2e\x55\x0b\
+\x2c\x10\x72\xd9\x6d\x27\xea\xc3\x3b\x01\x76\x6a\x94\xd2\x5f\x24\
+\x46\x35\x20\x6c\x1b\xf8\xc4\x4c\x4e\xc2\x25\xf0\x10\x08\xb3\xd9\
+\xd2\x84\x19\x4b\x11\xac\xb7\xc0\x63\x4a\x70\x19\x68\x24\x52\x88\
+\x24\x65\x49\x3f\x07\xa5\xbf\x10\xe4\x73\x92\xdf\x5f\x79\xf1\x3d\
+\xb5\xef\x32\x00\x96\x16\x6e\x40\xe0\xf0\xb2\xa8\xe0\xb0\x19\x54\
+\x75\x76\x81\x4c\x91\xfe\x0c\xc2\x6e\x38\x87\x33\x7f\x0f\x4f\x40\
+\x64\x43\x4a\x7a\x44\xab\x31\xda\xaa\x7f\x59\xda\xdd\xd3\xeb\x37\
+\x19\xfd\x56\x4c\xc5\xbf\xb8\xb6\xc2\x81\xf0\x79\x02\x02\xc9\x6a\
+\x12\xc4\x9e\x24\x8b\xbf\xaf\x86\x8b\xd1\xf6\x2e\xea\xbd\x85\x63\
+\xf2\xc0\xa2\xd5\x0f\x43\x71\xbf\xc3\xbf\x06\x00\x8a\x57\x25\x70\
+\xf2\x10\x2e\x28\x00\x08\xc5\x9d\xbd\x37\xcb\x89\x89\xb4\xf3\x55\
+\x29\x53\x6d\x52\xde\x40\x49\x7b\x27\x56\x02\xfd\xfe\x50\x11\x2e\
+\x82\x56\x42\x92\x4b\xec\x0a\x46\xd0\x69\xc9\x99\x84\x1e\x76\x22\
+\x64\x98\xe8\x6f\x9f\x7b\x49\xe6\xb0\x47\x1a\xc0\x50\x89\x34\xa5\
+\x9c\xd8\x10\x48\xb9\xef\xa2\xb2\x95\xa1\x5d\xa7\x81\xf0\x42\xf3\
+\x77\x10\x10\x5c\x0f\xef\x75\x1f\x0c\xcd\xda\x74\x93\x9b\x44\x0d\
+\x29\xe3\x5a\x93\x37\x8c\x14\x9a\x1c\x20\x85\x30\x7c\xae\x8b\xa4\
+\x0c\x6c\x8a\x2c\xb9\x2a\x47\xc5\x54\xe5\x22\xa7\x99\xcd\x52\xf8\
+\x25\x20\xb5\x03\xa2\x2a\x00\x76\xe9\x5a\x94\x88\x5d\x93\x08\x7e\
+\xa3\x84\x2d\x83\x15\x39\x01\x12\x00\xf8\xe3\xdc\x1f\x1c\xcc\xa9\
+\xcf\x2f\x00\x80\x90\xfe\xfd\x05\x57\xdf\xc1\xe3\xe0\xff\xbb\xe4\
+\x3a\x78\xaf\x5b\x7f\x04\x01\x82\x04\x78\xfc\xf8\x71\x59\xba\x3f\
+\x21\xb2\x7f\x2e\xf9\xab\xe0\x2f\x81\x00\x66\xfd\xb4\x4e\x73\x05\
+\xe0\x0c\x9c\x39\x7b\x96\xa7\x0c\xf6\x21\x00\xd8\x47\xd3\x00\xfb\
+\x0e\xb0\xed\x30\x07\x7f\x02\x01\xc7\x4f\xc1\x16\xcc\xc2\xff\xe7\
+\xe2\xeb\x70\xc3\xae\xc2\xae\x78\x97\x5f\x77\x33\xb4\x6c\xdf\x5b\
+\xcc\xb1\x2b\x22\x65\x26\x7e\xde\xf2\x92\x7f\x81\x97\x17\x5f\x16\
+\x82\xa7\x5f\x6c\x03\x9b\x76\x7c\x8e\x60\xe5\x17\x1e\x39\xfc\xf8\
+\xf3\xaf\x45\xd9\x7f\xc7\x27\x4c\xf8\xdb\xf9\xf1\x17\x2c\x68\xc3\
+\x25\xff\xdd\xdf\x72\xf0\x27\x47\xbb\x2f\xbf\xfd\x51\xca\x15\xef\
+\xe3\x31\xc5\x3d\xfb\x0f\xc3\xe7\x5f\xfe\x08\xb7\x36\x6c\x24\x33\
+\x65\x95\x31\x3b\x55\xfc\x58\x53\x41\x57\x01\x6c\x39\x66\xaf\xab\
+\xcc\x4d\xbf\x49\x0a\x2f\x59\x05\x08\xa8\x4a\x41\x90\xdb\x00\xdc\
+\x32\xd0\x63\xbc\x36\x60\x4d\x4d\x77\x12\xe1\xb4\x9d\xb3\xdc\xa0\
+\x94\xa1\x15\x03\x80\x80\xdd\x02\xf3\x98\xe7\xbd\x76\xc5\x0b\x1b\
+\x86\x44\x42\xa2\xda\x9b\x29\x7b\xf4\x19\xb1\x95\xe4\xcc\x63\x2a\
+\xbe\x1e\x7f\xf1\x57\x6c\x00\xe0\x54\xdd\x8c\x52\xe1\x2c\xee\x92\
+\xe7\x6a\x9d\xbb\x9e\x85\x71\x53\x17\x49\x0f\x0e\x69\x05\x4d\xdc\
+\x06\x65\x08\x26\xc1\x99\xcf\x98\xa0\x12\xba\x1c\xe2\x9c\xa3\xb1\
+\x4b\xd2\x40\x20\x15\x46\xe1\x26\x18\xd6\x56\xcd\x29\xba\xca\x22\
+\x46\x15\x3d\x6c\xbb\x4c\xd3\x40\x62\xb1\x2b\xa1\x12\x79\x53\x20\
+\x4d\x9a\x46\x39\xe5\xd2\x83\x09\x24\x7f\x2f\x44\xc6\x5f\x3c\x8d\
+\xfb\xa2\x49\xd8\xc9\xc6\xaa\x78\x49\xe5\x5f\xd1\x34\x08\xfe\xe5\
+\x3e\x7e\x34\xe7\xcb\x2a\x46\x8b\x24\x9c\xe0\xf3\x71\x0b\x20\x1e\
+\x0b\x3d\x7c\x1e\x91\x5b\x32\x73\xf1\xf1\x94\x03\x2d\x1b\xd9\x9b\
+\x92\xa2\x49\xfe\x18\x1e\x7f\x22\x27\x25\xab\x08\xfb\x4a\x2b\x09\
+\x6e\x80\x65\xb8\x0a\x5a\x46\x75\x20\x68\x13\xfd\x34\x1b\x39\xc6\
+\x7b\xd6\x1b\x57\x24\x2a\x1b\x49\x96\xcc\xe1\x73\x28\xc2\x29\xdf\
+\x70\x23\xeb\xd2\xe5\x57\x0c\xe2\x08\x00\x3a\xf7\x1c\x01\xf7\x3c\
+\xf2\x32\x02\x80\x1b\xe0\x83\x41\xe3\xe0\xd1\xe7\xde\x90\xf2\xad\
+\x35\xe4\xa5\x08\xfe\xa5\xf0\x3d\xa5\x48\x89\x50\x1a\x41\x4b\x91\
+\x6a\x6d\x4e\xb1\x19\x31\x0f\xef\xe1\xf2\xa2\x24\x33\x99\x9e\xef\
+\xc6\x58\xa2\xbd\xf9\x19\xc1\x5f\x96\x1f\x7d\xfe\xa0\x51\x05\x70\
+\x12\xcf\xca\x5e\x1a\xc4\xcc\xfd\x1c\x03\x00\x2a\xc5\x2b\x85\xbe\
+\xdf\x8f\x08\x1e\xc0\x2f\x47\x8e\xc3\x4d\xf5\x1e\x85\x8b\xca\x55\
+\x46\x80\x73\x1d\xbc\xdb\xb9\x2f\x8f\x8f\x1d\x97\xe4\x3f\x2e\xf7\
+\xab\x5e\xff\x69\x55\xee\x3f\xc3\x8b\x83\x3f\xae\x33\xb2\x02\x70\
+\xf6\xec\x19\x06\x03\x7b\x89\x91\xbe\x6f\x3f\xec\xdb\x7f\x10\xf6\
+\xee\x3f\xc0\x92\xc3\x62\x1c\xf0\x14\xfc\xf4\xd3\x11\x48\xc1\xd7\
+\x21\x30\x45\xdf\x27\xcf\xff\x0f\x1e\x0b\x37\xd5\x7f\x5a\x66\xe1\
+\x61\xee\x8d\x0b\x00\xa4\x4c\x97\x44\x65\x24\x0d\xc1\x4c\xcb\xb7\
+\xba\x31\x2b\xfe\xe0\xe1\x23\x70\xf0\xa7\xdf\xe0\xdb\x1f\xf6\xc2\
+\xa7\x9f\x7d\x0d\x1f\x7e\xf2\x39\x4b\xd6\x7e\xba\xfb\x2b\x36\xba\
+\xd9\xfd\xb5\xb0\xb6\x25\x86\x3c\x49\x15\x7f\xc7\x22\x45\x08\x4a\
+\x0e\x1c\x86\x43\x87\x7e\x81\x03\x87\x7e\x83\x56\xed\x7a\xc2\xc5\
+\x99\xa2\x4c\x9e\xaa\xcb\xe6\xca\x70\xc9\x29\xea\x23\xe6\xfa\x83\
+\x46\x1b\x4b\x05\xf4\x30\xfe\xd6\x16\x83\x00\x11\xec\xb3\xc4\x6f\
+\x4e\xb7\xf1\xef\x2f\x7a\xea\x1a\x84\x07\x6c\x3f\x74\x8f\x6e\x11\
+\x84\xe5\x63\x8d\x36\x5e\xba\x21\x33\xad\x4b\xf6\x02\x98\x78\x65\
+\x0b\x23\x35\xa0\xa4\x78\x23\x3c\x9f\xaf\xdb\x49\x19\xa1\x22\x4d\
+\xa3\xdc\x64\xaf\xd4\x74\x77\xf6\x1d\x8a\x2a\xbb\x27\x1f\xa4\x23\
+\xae\x69\x24\xa7\x84\xad\xa3\x02\x57\x12\x90\xc1\xdf\x4d\x16\xdc\
+\xf7\x64\x73\xe8\xde\x7f\x14\x67\xff\x1e\xe5\xac\x99\x26\x55\x17\
+\xf5\x18\xa2\x94\x25\x4e\x57\xa4\x4b\xc5\x8f\xa8\xc1\xd5\xa5\xfc\
+\x95\x6b\xe1\xb5\xb7\x7b\x8a\x31\x45\xfa\x1d\x54\x26\x9f\xa6\xf6\
+\x9c\xb0\x2c\xf9\x0a\xe3\x23\x06\xf6\x04\x02\x32\x94\xed\xaf\xa5\
+\x2b\x33\xca\x2a\xda\x93\x16\x6b\x4c\xd9\xfe\xed\xff\x0e\x02\x5b\
+\xf4\x5c\x7f\x38\x01\x3b\x3e\xfc\x17\x41\x40\xbc\x49\x07\x2b\xa1\
+\x9e\x7f\x72\xdc\xad\xf3\x2d\x7a\x54\x12\x00\x10\x9b\xa3\xf1\x8f\
+\xbf\x2e\xfc\x13\x6b\x3c\xcd\x4a\xd8\x5b\x8f\x3b\x17\x1f\x30\xe4\
+\x82\x65\xa6\xe0\x33\x1d\x03\x03\x21\x4d\x52\xf1\x94\x88\x55\xe9\
+\xd6\xb9\xce\x8a\x33\x0b\x1b\x4a\x60\x48\x14\x03\x28\xd0\x49\x96\
+\x16\xdf\xfc\xc8\xf6\x3a\x2f\x7a\x06\xd4\x17\xa3\x67\xae\x84\x7b\
+\x3c\x31\xc0\x83\x5b\x2f\x5a\x1b\xac\x68\x35\x3d\xfc\x3b\x2d\x4b\
+\x66\x16\xa2\x0a\xf0\x5c\x93\xf6\xf0\x7e\xb7\x41\x0c\x00\x9e\x79\
+\xb9\x0d\xf4\x1d\x3a\x89\x33\x56\x6f\xa6\xa8\x00\x70\x8f\x30\x43\
+\x68\x06\x94\x52\x52\xb0\xca\xf7\x5d\xd9\xcb\xaa\xeb\xe9\x02\x00\
+\x78\x33\xc9\xba\xb6\x16\xdb\xd7\x72\x0b\x41\x02\x09\x35\x3f\xad\
+\xfa\xcc\xa9\x8e\xd9\x5b\x2b\x2a\xcb\xf0\xf9\x8d\x63\xc4\x1f\x92\
+\x9b\x60\x55\xcc\xf8\x4f\xea\x16\x80\x12\xf6\x11\x4e\x7d\xc7\x31\
+\x50\xee\x85\x94\x32\xd7\x63\x36\x5e\x91\x05\x4f\x52\xca\xde\x00\
+\x6f\xbf\xd7\x1b\x03\xf6\x19\xc1\xf4\x3f\x7d\x52\x64\xf8\x72\x51\
+\xa0\x3f\x7d\x56\x00\x00\xbe\x2e\x6f\x3b\x73\xf6\x34\x57\x00\xe8\
+\x3a\x95\xfd\xf7\xec\xdd\x8f\x01\xf7\x00\x83\x81\xfd\x07\x0e\xb2\
+\x3c\x30\x03\x8b\x93\x67\xe0\x9f\x95\xea\x88\x92\x2d\x31\xb4\x11\
+\x04\xbc\xd3\x7d\x30\x74\xe9\x33\x12\xfc\x15\x6a\x8a\x32\xb6\x56\
+\x5c\x94\x5a\xf1\x99\x62\x23\x4f\x09\x08\x63\x9d\x4b\xca\x67\xc1\
+\xb3\x2f\xb7\x85\xb5\x1b\x3f\x84\xa3\x27\x4e\xe3\x7b\x3d\xcd\xad\
+\x0c\xe2\x1d\x7c\xf5\xdd\x0f\xec\x6e\xf7\xe5\x37\x3f\xc2\xb7\xdf\
+\x4b\x85\xc2\x7d\x07\x79\x3a\x81\x54\xf0\xf6\x1f\xfa\x19\x0e\x1d\
+\xfe\x45\xb8\x20\xfe\x76\x0c\x16\xe4\xaf\x66\x6d\xfb\x54\x97\x39\
+\x90\xd6\x62\x08\x64\x39\x67\xf9\x4d\x95\x3f\x35\x1e\x28\x49\x6b\
+\xe2\x38\x0b\x8a\x2a\x80\xc3\xeb\x22\xa4\xbd\x2f\xc4\x6f\x19\x71\
+\xa9\x11\x86\x8c\x11\x3c\x5b\xef\x5f\x2b\x72\x06\x9c\x95\x9d\xd4\
+\xf4\xb0\x14\xad\x8a\xd8\x99\x74\x46\x24\x86\xcb\x61\x51\xcb\x55\
+\x8e\x77\x9c\x4f\x96\x5d\x95\x48\x97\x22\x59\x81\x70\x0c\xd5\x3f\
+\x27\x40\x30\x7b\xf9\x2a\xe8\xb9\x03\xbd\x76\x80\x8b\x71\xbe\x2a\
+\x00\x92\x9a\x08\x1c\x30\xe0\xad\x0e\x91\x5b\x1e\x84\x29\x73\x97\
+\x41\xe9\x40\x15\xdb\x55\x93\xce\x55\xed\x39\x12\x91\x0e\x7e\x52\
+\x22\x58\x4d\x5b\x30\x5f\x22\x07\x6a\xd5\x7b\x1c\x16\xaf\x5c\x07\
+\x9d\x7a\x0f\x97\xbf\x8b\xf8\xce\x39\x80\xa7\x55\x97\x55\xc0\xa0\
+\xd4\xff\xa0\xa0\x8f\xe7\x35\x8d\x05\x67\x46\x58\x17\x84\x80\x9f\
+\xb8\xbf\x48\x12\x3c\xe6\xe2\xdf\xd3\x35\x7e\x16\xf8\x6f\x4a\xd7\
+\x5e\xd8\xe9\x02\xdf\x79\x62\xd8\x0b\x73\xb8\xf3\x33\xcd\x60\x3b\
+\xd7\xfe\x6d\x52\xc0\xc1\x12\x2a\xff\x25\x1a\x25\x09\x25\x94\xc8\
+\xf5\x98\x66\x25\x86\x5f\x80\xf6\x37\x77\x04\x5b\x23\xfb\xf4\x27\
+\x49\x76\xf0\x5b\x71\x44\x77\x82\x49\x97\x77\x8a\x3c\xc8\xfd\xb2\
+\x37\x23\xd1\xb7\x46\xe1\xb2\x8f\x67\x57\x09\x5c\x25\xb4\x04\x9b\
+\x84\x46\xdc\xe6\x66\xe4\x00\x00\x31\x7a\x9a\x1a\x00\x18\xd2\x9e\
+\xd2\xea\x97\xca\xd5\x64\xdd\x4a\xb2\xbd\x93\x67\x2d\x83\x17\x9a\
+\xbd\x0b\x65\x2f\xcf\x82\xe1\xe3\x66\x42\xb7\x3e\xa3\xe0\x9a\xaa\
+\xf5\xe5\x28\x58\x48\x94\x8b\xd3\xc5\x28\x92\x32\x20\x11\x63\x48\
+\x92\xe8\x96\x26\x18\xf0\x54\xf6\xb6\xed\x63\x73\x34\x08\x10\x6c\
+\xe3\xec\xa8\x8c\x2c\xd5\x3c\x16\xfc\x4e\x12\x60\x14\xd7\x42\xfe\
+\xd6\x29\x65\x2a\x62\xd6\xfb\x0b\x06\xe7\x3f\xb4\x28\x0f\x01\x80\
+\x23\x47\x4f\x20\x30\x38\x0e\x43\x46\x4e\x95\xc1\xb8\xb2\x96\x9a\
+\x25\x20\xf0\x52\xb3\xf6\x18\x5c\x4f\xc9\xc0\x7e\xc6\xb8\x14\x81\
+\xdf\x5c\x04\x08\xce\xca\xaa\xc0\x69\x6e\x11\x9c\xe1\xec\x9f\x40\
+\x00\x03\x00\xbc\x4e\xf6\xc3\x42\x15\xf0\x14\x3c\xf4\x44\x53\xfc\
+\x3e\xa5\x0d\x2e\x7e\x4f\xcf\x36\x6d\x0f\x03\x46\x4e\x82\x67\x9b\
+\xb4\x13\x9b\x74\xf9\x6c\x39\x7a\xe9\x1a\x81\xf4\x67\x49\x2e\x85\
+\xfc\x4e\x11\xac\xd4\xaa\xfb\x10\x0c\x1a\x3e\x49\x88\x1d\x9d\x39\
+\x87\xaf\x7f\x0e\x4e\x9e\x3a\xc3\x9f\x8f\x7c\x09\x08\x14\x30\x1f\
+\xe1\xc0\x4f\xb0\x1f\x01\xc0\xc1\x9f\x7e\x85\x9f\x08\x00\xfc\x22\
+\x5a\x20\xbf\x21\x70\xd8\xb7\xef\x67\x78\xfd\xad\x6e\x08\x2c\x4c\
+\x6b\xea\xea\xb6\x3b\xa3\xa1\xe6\xa7\x2b\x00\x0a\x48\xeb\x12\xb3\
+\xd2\xb8\x17\x00\x40\xb4\x02\xe4\x39\xa4\x01\x85\x00\xe1\xda\xd9\
+\x4f\x3b\xfa\x29\x0b\x6b\xe7\xb9\x5d\x2a\x5d\x68\x0a\x78\x34\xb7\
+\x47\x1d\x07\xb6\x2c\xae\x39\x46\x98\xea\x22\xd5\x25\x3a\x37\xcc\
+\xbf\x3d\xb2\x8d\xa1\xb2\x66\x65\x3c\x96\xaa\x13\x06\xf1\xff\xde\
+\x40\xac\xca\x40\xd8\xc5\xa1\x09\x39\x88\x92\x1e\x25\xb3\x2d\x45\
+\xb4\xf4\xe6\x1e\xe3\x7d\x28\xad\x0b\x27\x37\xc7\xa5\x1d\x20\x35\
+\xf8\x39\xc8\xe2\x31\x30\x68\xd4\x74\x68\x49\x6d\x38\xd2\x33\xe0\
+\x25\x75\xfd\x95\xe0\x50\x66\x0d\xbb\xc2\x93\x69\x8c\xf6\xe2\x6d\
+\xd7\x05\xeb\xc3\x92\x95\x1b\x60\xf0\x88\x29\xb2\x72\x20\x8f\x2f\
+\xe2\x00\xd0\xc8\x28\x8f\x8d\x4a\xbe\x85\x56\x03\x15\xfc\x1e\xb1\
+\x37\x66\x31\x4f\xc8\x23\xf9\x2c\x36\xb9\xb5\xba\xd6\xf2\x88\xe5\
+\xe6\x17\x7b\x0c\x30\x51\x0b\xf6\x7c\x02\x00\x2b\x8a\x70\xf7\xdf\
+\x1e\x3b\x74\x03\x09\x4f\x42\x65\xd9\x0b\x0b\x4c\xce\x83\x0e\x40\
+\xb0\x84\x52\x90\x56\x8c\x19\x4a\x2b\x4e\x09\x3e\xbe\x7b\xa0\xcf\
+\x91\x45\x67\x19\xbe\xe5\x66\x20\x37\x0c\x2d\x8a\xc5\x47\x08\xc6\
+\x17\x0d\x8a\x9a\xd7\x4c\x06\xdd\x1a\xf7\x4f\xb3\xcb\xee\x2a\xa0\
+\xf9\xb4\xfb\xa0\xec\x85\xba\x0f\x9c\x18\x84\xa1\xe8\x79\x62\x29\
+\x3b\x9a\x6e\x6f\x4c\xb1\xec\x23\x7d\xc6\x66\x6c\xf2\x02\xfc\x57\
+\xd6\x80\x89\xb3\x0b\x60\xdc\xf4\xa5\x30\x66\x4a\x3e\x8c\x9e\xb8\
+\x00\xa6\xcf\x5b\x09\x8b\x0b\x36\xc1\x14\xbc\x1c\x32\x7a\x2a\x2c\
+\x5f\xb3\x95\x3d\xca\xa7\xce\x2b\x80\x29\x73\x56\xc2\xe4\xb9\x2b\
+\x61\xe2\xac\x15\x30\x7e\xc6\x52\x18\x3b\x7d\x09\x8c\x9d\x9a\x0f\
+\xe3\xa6\x2d\xe1\xe7\x98\x30\x63\x19\x4c\x9c\xb9\x1c\x26\xcf\x29\
+\x80\x69\xf3\x57\xc1\xf4\x85\x85\x30\x7d\xc1\x6a\xe8\xd6\x77\x2c\
+\x54\xcd\x79\x80\xdb\x00\x94\x65\x70\x4f\x32\x60\xb8\xaa\x19\xa8\
+\xd6\xee\xff\x3b\x7f\x0b\x9f\xf9\x5b\xd1\xf7\x55\x2e\x0b\x4a\x5d\
+\x72\x03\x7c\xfa\xe5\x77\x52\x07\x40\x54\x00\x68\xa6\x9f\x2e\x29\
+\x48\x3e\xf2\x54\x0b\xde\xb8\x52\x98\x85\x2f\x99\xe6\x72\x8e\xfd\
+\xf6\x7b\x9f\x85\x03\x87\x7f\x86\x3f\xce\x9d\x85\xb3\x67\xc5\x52\
+\x59\xbe\x28\xf9\xff\x21\xfe\x96\xb7\x9d\x36\x00\x01\xcd\xfc\xef\
+\xd9\xb3\x0f\xf6\xee\x15\xad\x80\xfd\x07\x0e\xb1\xea\x20\xb5\x01\
+\x7a\xf4\x19\x21\x36\xc9\x80\xe8\x63\xdf\x7a\xf7\xf3\x30\x20\x6f\
+\x32\xae\x29\x10\xba\xf9\x11\x21\xc0\xa4\xdb\x00\x21\x4d\xcc\x54\
+\x7a\xf8\xfc\x7e\xa5\x85\x32\x71\x09\x3c\x65\x2a\x41\x2a\x6e\xfe\
+\x77\xdc\xfd\x2c\x0c\x1e\x3e\x91\xa7\x10\xfe\xf3\xbf\xff\x0b\xf8\
+\x0f\xd7\xff\xe2\xfb\x3f\xc7\xfa\x05\x54\xf5\xf8\xf9\xd7\xdf\x25\
+\x00\x70\x5a\x21\x93\x0c\xf2\x8e\x5d\x5f\xc2\x23\x4f\xbf\x86\xdf\
+\x9d\x04\x6b\x52\x5e\xd7\x63\x8c\xcb\xf9\x0c\xb7\x46\xaf\x09\x00\
+\x64\x0b\x4b\x04\x7f\xc3\x2c\x45\x8e\x11\x7a\x94\x7c\xb0\x1c\x21\
+\x54\xf2\xd7\xa2\xaa\x11\x5d\xcd\xf1\x28\x00\xa0\x80\x84\x39\x1a\
+\x67\x06\x7f\x63\x8a\xa1\xa4\x7d\x7b\xf5\x7e\x1c\xae\x7d\x5a\x7c\
+\x2c\x1c\x9b\x39\x1e\x2f\x40\x1b\xef\x95\x01\x8f\xf4\x4e\xd0\xc1\
+\x3f\x10\x76\xb5\xf0\x8c\xc9\x87\xf4\x50\x52\x55\x0b\x45\xd2\xa5\
+\x20\x7d\x4d\xa5\xba\x30\x7a\xca\x42\x18\x39\x69\x1e\xbc\xd5\xb1\
+\x3f\x5c\x76\x5d\x1d\xcd\xbb\xe8\x92\x3b\x1a\x7a\xf4\x1f\x07\x5d\
+\xfb\x8e\x86\x2e\x08\xd2\xbb\xf4\xc9\x83\xae\x74\xf9\x81\x58\x3d\
+\xfb\x8f\x86\x45\xcb\xd6\xc2\x8c\x79\xcb\xe1\xdd\x2e\x83\xa0\x7d\
+\xd7\x21\xf0\x0e\xae\xf6\xdd\x06\xf3\xc4\xce\x7b\x3d\x87\x42\xa7\
+\xdc\x11\xd0\xad\x9f\x78\x9e\x5e\x03\xc7\xe3\x9a\x00\xb9\xb8\x7a\
+\xe1\xdf\xdd\xe8\xf9\x3e\x18\x81\xaf\x33\x12\x3a\xf7\x1e\x09\xef\
+\xe0\x73\xdc\x7e\xdf\xf3\xa2\x22\x90\xee\x6c\x9b\x78\xd3\x5d\x22\
+\x47\xe9\xc5\x61\xb3\x5b\xba\x9a\x60\xdb\xed\x16\x91\xb4\xfd\xed\
+\xf2\xb8\x25\xe1\x28\xb8\xc7\xdc\x65\xc0\xfe\x4b\x2e\x87\xff\x55\
+\x00\x10\x32\x10\x7b\x71\x51\x8b\x15\xa7\x02\x10\x8c\x01\x2c\x12\
+\xd8\x07\x1b\xc6\x3e\x9e\x40\x30\x4e\xb9\x38\xab\x98\xef\x2d\x86\
+\x7b\x60\x20\x2b\xe1\x4c\x7e\xd1\xfd\xac\xb0\xf3\xf1\xac\xb0\x67\
+\x7b\xaf\xfb\x5c\x0e\x7f\x5c\xb1\x30\x03\x7c\x0c\xb9\xd0\xa8\x93\
+\x29\xe0\x7c\x6d\x8f\x99\x81\x38\x24\x47\xed\x6c\xcc\xab\x15\xe2\
+\xc2\x5c\x36\x24\x65\xb6\xfb\x9e\x7c\x1d\x1a\x3e\xda\x0c\x1a\x3e\
+\xdc\x14\xee\x7e\xf8\x55\xb8\x17\xaf\x3f\xf0\x44\x4b\x5c\xaf\xe1\
+\xff\xb5\x80\xfb\x9f\x94\x97\x4f\xb4\x80\xfb\xf0\xf6\x7b\x1f\x6b\
+\x8e\x0b\xef\xfb\xe8\xab\xf8\x98\x57\x78\xdd\xf5\xe0\x4b\x70\xe7\
+\x03\x2f\xb0\x74\xeb\x1d\xf7\x34\x66\x29\xd7\xdb\x1a\x3e\xcb\x06\
+\x2b\xf7\x3c\xda\x14\x3e\x18\x32\x89\x7d\x01\x6a\xdf\xf1\x8c\xf0\
+\x0b\x50\xee\x66\x9c\xd9\xc9\x0d\x9f\xc7\xc3\xec\xef\xc3\xa9\x14\
+\x18\x96\xaa\x6d\x96\x1c\x49\x12\xfc\x85\x8b\xca\x54\x86\xc2\x0d\
+\x3b\xb8\x77\x7f\xc2\x90\xe5\x3d\x7a\xec\x24\xfc\x76\xec\x14\x94\
+\xaf\x90\xc3\x99\x4e\x8a\xbf\x9a\xcc\xfc\x42\x32\x4b\xaa\xc1\xe5\
+\xd3\x4a\xe1\xbb\x60\xd7\xa7\x5f\xc1\xb9\x73\x7f\xc2\x1f\x7f\xfc\
+\x01\x67\x69\xe9\xa0\xff\x87\x5d\x05\xd0\xeb\x34\x03\x80\x53\xa7\
+\x4e\x33\x21\x70\x8f\x01\x00\x0e\x1e\xfa\x99\xab\x10\x34\xda\xc7\
+\x06\x36\x32\x13\xab\x50\xe5\x0e\x18\x38\x7a\x1a\xf4\xcb\x9b\xc8\
+\x9b\x2d\xf9\xbc\x0b\xa2\x56\x36\xff\xe6\x97\x5c\x9a\x0d\x37\x37\
+\x78\x0e\xca\x5c\x86\x9f\xb9\x6c\x55\xbb\x9a\x52\x4e\x00\x00\x35\
+\x51\xa0\x44\x7e\x4a\x63\xb0\xbe\xb1\xee\x23\xd0\xee\xfd\xde\xb0\
+\x78\xd9\x2a\xce\xf6\x05\x20\xc0\x05\x00\xff\xfe\x0f\x4d\x45\x9c\
+\x63\x7e\x03\x7d\x1f\x3c\x02\xc9\x4a\x88\xc7\xf8\xbb\xd9\xbc\xed\
+\x53\x78\xb6\x49\x1b\x28\x53\xbe\x3a\xdb\x29\x53\xd5\x26\x25\xbd\
+\x9a\x63\xc4\x4b\x13\x06\x0d\xf3\x16\x9f\x2c\xff\x97\x32\x24\x52\
+\x3d\x01\x4b\x07\xf1\x52\xd2\x4a\x58\x93\x06\xe5\xec\x78\x8a\xda\
+\x33\xd4\x38\x99\x5f\xf0\x01\x54\x25\x41\x05\x50\xaf\xc3\x10\x27\
+\xe2\x1a\x13\x75\x11\xed\x02\xc9\x06\xd4\x78\xad\x01\x01\x6e\x3c\
+\x2e\x31\x97\xd8\x32\xb1\x21\xc7\x78\xa3\xc7\xd0\xfb\x4f\xd1\x7a\
+\xff\x36\x00\xd0\x01\xd1\x45\xc6\xe5\xb6\x40\xba\x01\xe8\x63\x9e\
+\xdf\x76\xd9\x9d\x2b\x56\x78\xec\x92\x1e\x42\xc3\x47\x5e\x81\x57\
+\xdf\xe8\x06\x97\x5d\x7b\x8b\xe6\x63\xbc\xf6\x76\x2e\xbc\xf9\x5e\
+\x5f\x78\xe3\xbd\x3e\x78\xd9\x07\x5a\xbd\x8b\x0b\xff\x7e\xf3\x9d\
+\xbe\xd0\xea\x9d\x3e\xd0\xba\x7d\x2e\xcc\xcd\x2f\x84\xd9\x0b\x57\
+\xc1\xab\xaf\x75\x86\x26\xaf\x75\x62\x1d\x8f\x97\x5a\x74\xc4\x45\
+\x3a\x1e\x1d\xa0\xc9\xeb\x9d\xa0\xe9\x9b\x5d\xa1\x59\xeb\x1e\xd0\
+\xe2\xad\x1e\xd0\xbc\x75\x57\x68\xda\xaa\x2b\xbe\x56\x27\x7c\x7c\
+\x2f\x98\x3e\x67\x19\xcc\x59\x5c\x80\x8f\x7d\x17\xde\xeb\x3e\x04\
+\xe6\x2f\x5f\x07\xad\xdf\xfb\x40\x4e\x8f\x64\xcb\x15\x71\x25\x27\
+\x11\x07\x1f\x24\xf9\x7d\x33\x5c\x4c\x65\xbb\x70\x02\x41\x1e\xeb\
+\xff\x44\x3b\xc1\xb9\x6f\x87\xf5\x54\xca\xf9\xe5\x48\x9c\x8f\xf7\
+\x1b\x4e\x0e\x00\x08\x72\x4f\x22\xe9\xdd\xe2\x64\xdb\xb1\x04\x74\
+\x92\x91\xeb\x35\x46\x90\x74\x60\x8b\xf5\x98\x44\x08\xd4\x2a\xa2\
+\x1a\x61\xc5\x69\x01\x84\xe3\x90\x50\x4c\x16\xa6\x71\x50\xfa\x4d\
+\x3d\x7b\x9b\x51\x6b\x03\x80\xe8\x72\x90\x47\xcb\x91\x26\xd3\x4e\
+\x31\x00\x80\x02\x69\x01\x63\x04\x50\x81\x0b\x07\xa0\x08\x69\xef\
+\x72\xd1\x8f\x97\x32\xa1\x92\x4b\xe0\x4b\x57\xc6\x26\x82\x18\x64\
+\x4b\x89\x2a\x0f\x77\xa9\x75\xae\xfa\xff\x34\x41\x80\x59\x2a\x19\
+\xd3\x90\xde\x3a\x95\x0c\x4b\xe9\x9e\xa5\x98\x0a\x28\x8d\xbf\x55\
+\xab\x77\x3f\xe0\x6a\x40\xe0\x9a\x9b\xa0\x74\x46\x4d\xdc\xe4\x6b\
+\xda\xaa\x67\xaa\x34\xea\x4f\xe6\x00\x15\xbd\x4c\x1f\x67\x49\x95\
+\x61\xc6\xdc\xa5\x42\xc0\xe7\xc4\x09\x59\x86\x17\x00\x80\xc4\x71\
+\xa8\xf7\xaf\xa4\x79\x7d\xd2\x0c\x85\x95\x0b\xcb\xe3\x6b\x5f\x7a\
+\x23\x94\x2e\x5f\x0b\x02\x15\x6a\xc3\xd4\x59\x8b\xe0\xdc\x9f\x7f\
+\xe2\x3a\xc7\x19\x35\x01\x01\x67\x2b\xc0\xd5\x22\x90\xa3\x82\xd4\
+\xff\xdf\xbb\x4f\x00\x00\xea\xbf\xff\xfc\xdb\x6f\x70\xfc\xe4\x59\
+\xb8\xfc\xda\x5a\x52\xa5\xae\x26\x5b\xd6\x76\xe9\x9b\x07\x7d\x87\
+\x8f\x87\x3e\xc3\xc6\x43\xb3\x36\x3d\xf0\x3d\x88\xac\x56\x10\xac\
+\xaa\x41\xc5\xc8\x3d\x98\x91\x8d\x80\x87\x1a\xbd\x01\x15\xaa\xde\
+\x06\x29\x34\x4a\x48\xad\x0b\xfe\x2e\xa5\xc2\x5f\xba\x6a\xa7\xd0\
+\x18\x21\x39\xe2\x85\xb9\xc5\x42\x5a\xee\xd5\x6b\x36\x84\x46\x2f\
+\xbf\x05\x7d\xfa\xe7\xc1\xa2\x25\x05\x4c\x14\x3c\x7a\x8c\xaa\x18\
+\xff\x46\x60\x23\x17\x7e\xae\x3f\x10\x18\x9c\x3d\x4b\x9f\xef\xdf\
+\xf0\xd3\xaf\x47\x61\xd4\xf8\x19\x98\xd5\x3d\xc7\x22\x3b\x5e\x53\
+\xc7\x5f\x9a\xcd\x78\xd5\xd8\x5f\xc0\x3e\xe7\x52\x54\x96\x9f\x61\
+\xf3\x50\x3c\x46\xe0\x37\x49\x83\x02\x08\x64\x49\xaf\x02\xd1\xf2\
+\x4a\xf1\x2b\xa0\x60\x00\x86\x0c\xbb\x0f\x1f\x2d\xc1\x1b\xaf\xaf\
+\x1f\x89\x1a\x3b\x2c\x7a\x04\xcf\x72\x54\x00\x9c\x93\x0f\xe1\x98\
+\xe3\xb7\xe2\xfd\x64\x1b\x3c\x02\x03\x7c\x1b\xce\x81\x26\x01\xd2\
+\x17\x47\xed\x4f\x67\xc7\x71\xdb\x17\x41\x9b\x6c\xc7\xbd\xf6\x6a\
+\x82\x60\x2b\x2d\x96\x85\xa4\xb0\x14\x55\x92\xfd\x7f\xae\xa8\x95\
+\xcf\x16\x7c\x00\xe6\x98\xc8\x7e\x3f\x02\xc8\xc9\xb3\x97\xf1\x58\
+\x2f\x91\x51\xe9\x38\xba\x48\x8e\xeb\xf2\xa2\xdf\x83\xde\x7b\x66\
+\x44\x3f\xd6\x93\x29\xab\x37\x69\xa2\x5d\x70\x19\x1e\xc7\x43\xf2\
+\xa6\xc1\xc0\xe1\x13\xc0\x8b\xc7\xe4\xed\xf7\x3c\x0b\x0b\x57\xac\
+\x83\x07\x9f\x7a\x4d\x93\x82\xd5\x7e\x60\x67\xef\x61\xc3\x08\x49\
+\xed\x3f\xd6\x79\x0d\x4e\xc9\x09\xf8\x04\x8b\x98\xcf\x77\x01\x8e\
+\x40\x6c\x42\x9c\xaf\x18\x99\xb6\x6d\x99\x1e\xad\xfa\x77\xc1\xaa\
+\x0e\xfe\x92\x56\x40\x12\x7f\x3f\xb1\x01\x80\xdf\xfc\x32\x8a\x03\
+\x02\xac\x04\x24\xc0\x60\x1c\xb7\x29\x57\xd0\xf7\x5b\x2e\x55\xb9\
+\xa0\x2e\x6d\xdb\xff\x17\x6b\x4c\x25\x91\x4b\xa0\x15\xc3\xf2\x33\
+\x1c\x47\xf6\xb1\x08\x4f\x6c\xfd\x3e\x6c\xc9\x51\x3d\x36\x63\x56\
+\x38\x34\x03\xd7\xa9\xe3\x6f\x13\x1a\x23\xae\xfe\x70\xec\x52\x97\
+\x27\xcd\xd2\x59\xb1\x78\x5e\x4b\x8b\x38\xf0\x49\xa7\xb8\x07\x69\
+\x4a\xcb\xc0\xad\x08\x18\x96\xa5\x78\x31\x02\xe4\x91\x52\xa0\x3e\
+\xe3\xd2\x2b\xff\x4f\xac\x88\x54\x73\x8b\x48\xa9\x58\x7b\xa2\x80\
+\x00\xc0\xf0\x09\x73\x61\xce\x92\x75\x18\x4c\xaa\x8b\x5e\xa5\x1a\
+\x5b\x62\x10\x10\x82\xb4\x2b\xb3\x31\x1b\x29\x84\x07\x9e\x7a\x1d\
+\x9f\xa3\x86\x03\x00\x98\xad\x8a\xa2\xed\x30\x83\xda\x6a\x96\x40\
+\xc6\xa0\xe1\x13\xd9\x0c\x88\x54\xf9\x34\x07\x00\x01\x40\x9f\x41\
+\xe3\x45\x69\x5b\x59\x18\xe3\x6b\x95\xbb\xfa\x66\xb8\xfd\x81\x57\
+\x84\x69\x11\x06\xff\xd2\xe5\x6f\xe4\x4b\x02\x36\xaf\x62\x96\x43\
+\x6d\x03\x0a\x94\xba\xec\xaf\x48\x80\x7c\x5d\x04\xfe\x33\x8a\x34\
+\x88\xa0\x80\x46\x08\x15\x00\x38\x70\xf0\x30\x8b\x05\x1d\x3b\x71\
+\x0a\x9e\x79\xb1\xb5\x34\x46\x22\x00\x50\x03\x9e\x69\xd2\x0e\xfa\
+\x0e\x1b\xc7\x96\xc0\xb9\x83\xc7\xb2\x28\x8b\x97\xcb\xfd\xd5\x74\
+\x86\x5f\x39\xd2\x10\xde\xcf\x1d\xc1\xa5\xdc\xd7\x31\xfb\xba\x03\
+\x03\xf3\x15\xd7\xd7\x11\xec\x6f\xd6\x61\x30\x7b\xbc\x82\x60\xa9\
+\x0c\x99\xd4\x26\x9c\xca\xbf\x47\x55\xb8\x08\x37\x6b\x5f\x5a\x25\
+\xb8\xec\x9f\x39\x50\x3d\x52\x1f\xea\xdc\xfe\x18\xdc\xfd\x40\x63\
+\x78\xe0\xf1\x97\xe1\xe1\x27\x5f\x85\x07\x1e\x7d\x05\xea\xdf\xfb\
+\x3c\xd4\xa8\xf3\x30\x8b\xca\xa4\x66\x46\x5c\x3d\xf0\xb0\x43\x20\
+\xc8\x93\x6e\x8a\xc1\x84\xec\x20\xe6\xda\x9c\x29\xd0\x97\xd2\x93\
+\x02\x8a\x30\xa8\x66\xd6\x83\xb6\x8f\x80\x21\x22\xe4\xd3\xc7\x55\
+\x8e\x41\xf4\x0b\xc5\x9e\x9d\x8f\x2b\x07\x6e\xf3\x66\xe2\x13\xec\
+\x9c\xd2\xe1\x8a\x7c\x6a\x57\x3e\x42\x2e\x47\xc5\x70\xf4\x08\xa1\
+\xa3\xf2\x66\x2b\xe6\xf9\xd2\xed\xac\x3f\x11\xff\x48\xdf\x2f\x01\
+\xc0\x51\xc0\xda\x23\x85\x91\xbc\xe9\xb6\x36\x82\xe0\x1c\xe4\x88\
+\x51\xdc\x4c\x22\xee\x11\x00\xc8\x16\xc4\x3d\x02\xf1\x19\xb2\xdd\
+\x81\xf7\x2f\x85\xe7\x24\xa9\xfd\xcd\x5a\x5c\x08\x81\xab\x6a\xd8\
+\x60\x42\x12\x9c\x4b\xf1\x84\x47\x58\x3c\x07\x13\x7c\x73\xb4\xd6\
+\x43\x29\x65\xb7\x8d\xd7\xaf\x0d\xde\x09\x8b\x96\xad\x81\xdb\x1b\
+\x3e\x03\xa9\x78\xcc\xbe\xd7\x65\x00\x4c\x98\xb6\x48\xca\x89\x67\
+\x6b\x7e\x91\xc7\x9c\xc2\xf2\x9b\x1c\xab\x44\xf3\xe9\xe7\x03\x00\
+\xc4\xb1\x69\x4f\xc6\xf1\x4f\xed\x93\xe6\xeb\x98\xb7\xf9\x8b\x91\
+\xed\x1b\x9f\x51\x25\x5e\x4e\xa9\xfa\xbf\x32\x82\x58\x92\xd9\xff\
+\x0b\xd0\x02\xf0\xf9\x55\x29\x36\x5c\x0c\x31\x86\xe4\xa4\x81\x7d\
+\xae\x52\x78\xf4\xd8\x9f\x21\x2b\x2b\x49\x74\xbe\x34\x4b\x0a\x8b\
+\x98\x06\x1f\x41\x4d\xb6\x33\x97\x13\xdd\x5b\x0e\x55\xc1\xd4\x8c\
+\xd8\xe5\xb8\xa2\xed\x83\x83\x31\xc8\x7e\xe6\xdf\xc1\x98\x41\xcd\
+\xc7\x9b\x87\x95\x70\xcc\x28\xbe\xb1\x86\x3d\x61\xa0\x4d\x93\xe8\
+\x75\xd2\x2c\xe9\xe4\x25\x2f\xe5\xe2\x8c\x22\x3d\xe8\x10\xa6\x10\
+\xcf\x47\xef\x21\x47\xaa\x0d\x66\x4b\x33\x9e\x88\x20\x61\x69\xe4\
+\xeb\xd6\x2e\x97\xf3\xe4\x99\xb6\x56\x3a\xbd\x36\x91\x08\xc7\x4d\
+\xcf\xc7\x0c\x7f\x15\x6b\x8c\x0b\x03\x20\x9b\xec\x28\xa6\x37\xb2\
+\xa0\x57\xff\xb1\xd0\xbc\x35\x65\xc0\x08\x00\x02\x35\x65\x2b\x20\
+\xe2\xe8\x1b\xf2\x06\xeb\x8f\xa1\xa6\x65\x02\x80\x80\x14\x41\xc1\
+\xd7\x69\xd7\xa1\x0f\x13\xf3\xa8\x0f\x7e\x8c\xc5\x7e\x04\x00\x78\
+\xec\xd9\x37\xc4\x6b\xab\x09\x83\x0c\x91\xe5\xb4\x68\xdb\x0b\x9e\
+\x7d\xa5\x3d\x94\xb9\x1c\x5f\x3f\x93\x32\xf5\x5a\x02\x90\xe0\x7d\
+\x2a\x87\xea\xc3\xba\x4d\x3b\xb8\xfc\x4f\x01\x9f\xc6\x03\xed\x29\
+\x01\x05\x08\xe4\x62\xde\xc0\x19\x9e\x00\x20\x3d\x80\x83\x87\x0e\
+\xc3\x4f\x08\x00\xa8\xe7\x3e\x6d\xd6\x62\x76\xbf\xa3\xe0\x4f\x40\
+\x20\x74\xf3\xc3\xd0\x17\xb3\xa8\xdc\x21\xa3\xa1\xd7\xa0\xd1\xd0\
+\x73\xe0\x18\xb8\xed\x9e\xe7\x44\x69\xbf\x5c\x15\x43\x38\xe8\x6e\
+\xe8\xd8\x7b\x38\x4f\x0d\x74\xeb\x37\x12\xef\x37\x1a\xda\x74\xea\
+\x0b\xf7\x3f\xd5\x12\x2a\x67\xdf\xc7\xb6\xba\x3e\xa5\x25\xa0\xc0\
+\x53\xa6\xe8\x49\x73\x1f\x9e\x82\x2f\x13\x08\x2b\xcb\x55\x49\x5c\
+\x96\xab\xcc\xbf\x11\xcb\xee\xfa\xb3\x8c\x8c\x55\x4d\x22\x44\xf4\
+\x68\xa2\x50\xa2\x93\xd9\xb2\x1b\x48\xeb\xe3\xc6\x9d\x0c\x88\x63\
+\x8d\xb2\xca\x52\x52\x7f\xdf\x63\x48\x06\x2b\x7e\x81\xc7\x70\x76\
+\x4c\x95\x6a\x7e\x3e\xd3\x60\x2a\x3d\x01\xd3\xdf\xa1\x69\x11\x43\
+\x54\x47\x56\x90\x1c\x65\xf6\xb8\x22\x3f\x2e\x30\xe0\x36\x38\x72\
+\xa8\x7b\x1a\xf7\x35\x58\xdc\x9e\x58\x9e\x1b\x31\xfe\x2f\x16\x41\
+\xd7\x93\x1e\x4a\xd8\x9e\xf0\xa8\x6a\x89\x14\x58\x12\x33\xff\x11\
+\x21\xc8\x94\x21\x18\xfb\xf6\x92\x32\xcd\x92\x87\x21\xc6\xfc\x10\
+\x84\x23\x00\x18\x30\x72\x1a\xcc\xce\x5f\x0b\x57\x5d\x5f\x97\x6f\
+\x2b\xe5\x17\x22\x40\x04\xd0\x4a\x71\xdb\x46\x8e\xfe\x65\x08\x53\
+\x30\x21\xf8\x64\x57\x71\xc4\x71\x11\x86\xd1\x13\x66\xc3\x0b\x4d\
+\xdf\x81\xd2\x78\xfb\xdd\x0f\xbd\x0c\x2b\x0b\xb7\x80\xff\xea\xda\
+\x32\x81\x70\x7f\xe6\xa0\x5d\x09\xf5\x1b\x52\xd2\x12\x10\x78\x74\
+\x92\x94\x6c\x76\x1d\x86\xe2\x4d\x9c\xc5\x1b\xcd\x73\xf1\xa8\xd4\
+\xef\xe6\x0f\x1a\xef\x47\x91\x56\x9d\x00\xc0\x53\x9c\x0a\x44\x46\
+\x2c\xa5\x56\x2b\x4a\x68\xe7\xfc\x68\xe9\x98\x72\xea\x17\x14\x00\
+\x84\x1d\xde\xf2\xc9\x59\x20\x5a\x09\x2a\x00\xe1\x68\xc5\x3b\x33\
+\xe0\xc4\x1a\x0f\x34\x01\x80\xfe\xdb\xf5\x7a\xfe\x60\x1c\x79\xdd\
+\x44\x4a\x7b\x89\xe4\x74\x8b\x01\x00\xcc\x6a\x84\x22\x7d\xe8\x20\
+\x6d\x7c\x8f\xbc\xc1\xe6\xe8\x8d\x36\x55\xce\x3a\xab\xec\x3a\x35\
+\x06\x00\x88\x49\x30\x21\xf0\x23\xb3\x7b\x31\xda\x23\xb8\x06\x1e\
+\xad\x31\x20\x0e\x64\x9f\x3f\xa4\x49\x3b\x22\xd8\x3b\x2b\x00\x5e\
+\xa9\x00\xa6\x2f\xd3\x9d\x00\xc6\xa3\x48\x79\x01\xcb\xd8\xb0\x55\
+\x25\x40\x04\x03\xda\x54\xa6\xcc\x5e\x0e\x13\x66\x2d\x65\x06\x3c\
+\x3b\xb0\xa5\xc9\xf1\x42\xbf\x30\x18\xa2\xbf\x07\x0c\x9f\x02\x2f\
+\xb5\xec\xcc\xc6\x41\xa2\x0d\x90\x23\xc9\x5e\x36\x19\xd0\xeb\x37\
+\x83\x7d\xc8\xa5\xe4\x66\x4f\x87\x70\x76\x8f\x9f\xfb\x99\x17\xdf\
+\xc2\x6c\xfc\xac\x03\x00\xd0\xf8\xdc\xb5\xd5\x6e\xd7\x82\x44\xa9\
+\xd2\x96\x96\x58\xd3\x37\xde\xf1\x0c\x0c\x1c\x39\x05\xda\x74\xe8\
+\x0f\x97\x5f\x7f\x1b\x4b\xae\xa6\xd2\x88\x22\x7d\x76\x6e\xd9\x54\
+\x85\x77\x3a\xe6\x72\x35\x80\x7a\xfd\x1a\x04\x28\x72\xe0\x1f\x18\
+\xf8\xff\x38\xc3\x5c\x01\xe2\x0d\x9c\x3b\x77\x8e\x19\xf7\x64\x18\
+\x74\xf8\x67\xc1\xc0\xa7\x39\xfc\x8c\x0a\x35\xa4\x15\x6e\x84\xcb\
+\xf5\xd4\x06\xe8\x3d\x18\x01\x00\x06\xf5\x1e\x03\x10\x04\x0c\x1a\
+\xc3\xa3\x5a\x29\x06\xcb\xba\x54\xd9\xaa\x50\xad\xe6\xbd\xd0\xe5\
+\x83\x91\x78\x9f\x51\x7c\xdf\x5c\x04\x0c\xb9\x83\x69\x8d\xc1\xdb\
+\x47\xe0\xf7\xf7\x3e\xd4\xbf\xff\x05\xa8\x56\xe3\x3e\x48\xbf\xaa\
+\xa6\x08\xac\x3c\xe2\x25\xd4\x1d\x69\xf4\x90\x36\x7f\xd1\x42\xa8\
+\x88\xb7\x55\x94\x0c\xf2\xca\xb2\x95\x20\x49\x6c\x6c\xdb\xac\xb8\
+\x08\x39\x72\xf4\x2e\xcc\xe0\x82\x83\xb3\xb4\x9b\xb5\xdd\xe6\x42\
+\x4e\x33\x29\x09\x04\xbc\xf2\x3e\xe4\x24\x49\x00\x20\x45\x4e\x17\
+\x78\x64\xf6\xaf\x6d\x82\x5d\x80\xd7\x06\x00\x82\x44\x98\x2a\x27\
+\x41\x9c\xaa\x95\x2e\x9f\x10\xbf\x15\x3b\xb8\xa7\x87\x93\x6c\x01\
+\x28\x5d\x0d\xa3\xf2\x97\x1e\x74\x71\x72\xac\x38\x72\xb7\xe2\xdc\
+\xf6\xc4\x08\x5a\x45\x65\xfe\x5e\x93\x00\x96\x48\x0d\x50\x81\x29\
+\x35\x6e\x99\x61\x69\x6e\x04\xcf\xe9\xcb\x80\xad\x82\x35\x13\x2d\
+\xd5\xf9\xa0\xc6\x3a\x99\x44\x58\x8d\x7f\x7f\x92\xed\x9e\xbd\x64\
+\x2d\xfc\xab\xda\x1d\xdc\x32\xf3\x48\x00\xc0\xdc\x0c\xce\xfe\x23\
+\x52\x0a\x98\xc8\xb9\xf6\x98\x2f\x3f\x37\x1d\x1f\x08\x5e\x2f\xb9\
+\x22\x07\x66\xce\x5f\x01\x0f\x3f\xd3\x92\x7f\xb3\x87\x9e\x6e\x09\
+\x8b\x57\x6c\x84\x8b\x2f\x93\x23\xbd\x01\x67\xe6\xec\xd1\x55\x3a\
+\xbb\x2a\xca\x7c\x89\x74\x3b\xf8\xc7\x26\x69\x5b\x71\x02\x6d\x38\
+\xa9\x32\xb8\xe0\x97\x84\x92\x52\x27\xf4\x05\x0c\xa0\x28\x45\xc6\
+\xec\x63\x59\x1e\xab\xfe\x92\x91\xf2\x7c\x71\x64\x80\x4b\xe6\xa9\
+\x13\x3e\x8f\xbd\xff\xe2\x79\xf9\xfc\x23\xd6\x9b\x29\xd9\x6c\x67\
+\x38\x81\xcc\xae\x3d\xee\x16\xdd\xb3\x8f\xce\x78\xbd\x8e\x72\xbf\
+\x65\xb4\x03\xc2\x2e\x9b\x4f\x2b\xb1\x64\xaf\xc3\x97\x3a\xde\xeb\
+\x07\x63\x13\x04\x79\xca\x20\x64\x67\xe0\x06\x5a\x74\x1c\x34\xea\
+\x3d\x68\x40\x10\x96\x65\xf4\x1c\xce\x38\xb5\xb7\x77\x46\xb6\x9e\
+\xe7\x65\xc1\x9c\x8c\x6c\xc7\x48\x90\x43\x8a\xd3\x04\x3f\x69\x96\
+\x51\xe9\xb0\x09\x56\x8e\x1e\x66\xba\x28\xf1\xa7\x06\xc4\xeb\xf9\
+\x14\x62\x57\xac\xe8\xf4\xb0\x1d\xf8\xa5\x24\x28\x67\x31\x69\x6a\
+\x64\xb1\xba\xe1\xa8\x56\x5d\x67\x6e\xf6\x88\x16\x3e\x6f\x20\x87\
+\x83\xd0\xf4\x79\x05\x30\x76\xea\x22\x28\x55\xa6\xb2\x34\xc1\xa9\
+\xae\x47\xef\xa8\x9f\x49\x01\x79\xfe\x92\xf5\x70\xe3\xed\x4f\xb3\
+\xd1\x09\x81\x80\x54\xfd\x9e\x22\xd1\x9a\x05\xa6\x9a\x5b\xba\xad\
+\x90\xa6\xe5\x8c\xe5\x6f\x7a\xcb\x9d\xcf\xc0\xe9\xb3\x7f\x70\xb0\
+\x66\x57\x3e\x5c\x3f\xec\x3b\xcc\x2e\x7c\xca\x95\x4e\xc9\x12\xd3\
+\x2a\x73\x45\x4d\x0c\xc4\xd4\x8f\x1f\x07\x9d\x31\xd0\x06\x6f\x7c\
+\x48\x8c\x54\x49\x47\xc4\x14\xb9\x79\x5a\x35\x1b\xc2\xa6\x2d\x1f\
+\xc1\xa9\xd3\x67\x45\xe6\xaf\x04\x81\x8c\xe0\xaf\x00\x00\xad\x5f\
+\x7e\xf9\x95\x01\xc0\x2f\x64\x49\xfc\xeb\x51\x68\xf4\xd2\xdb\x22\
+\x53\xe7\x2a\x49\x16\x3c\xde\xb8\x35\xf4\xc6\xcc\xbf\x07\x06\xf5\
+\xee\x03\x45\x15\xa0\x47\xff\x31\xf8\xfa\xf7\x83\xc7\x45\xf6\xab\
+\x92\x73\x0f\x74\xed\x93\x27\x02\x3f\x02\x05\x02\x01\xbd\x07\x11\
+\x20\xc8\xc3\x4d\x7d\x24\xaf\x5e\x04\x10\x10\x48\xb4\xeb\x32\x00\
+\x9e\x6f\xf1\x1e\xdc\xf7\x78\x33\xa8\x53\xff\x29\xc8\xaa\x75\x1f\
+\x5c\x53\xf9\x56\x08\x54\xc8\x86\x8b\xcb\x53\x0b\x86\x82\xff\x0d\
+\x18\x9c\x2b\x0b\xd9\x66\x0a\x12\x64\xb2\x43\x23\x9a\xe5\x43\x70\
+\xc9\xe5\x11\xc8\xfc\xd7\x4d\x50\x31\xd4\x10\xea\x36\x6c\x0c\x8d\
+\x9b\xbe\x0b\x6f\xb4\xcf\x85\xc7\x9f\x6b\x0d\xe1\xda\x0f\x43\xb9\
+\xcb\xc3\x02\xcc\xc9\xd9\x6f\x71\x3c\x19\x00\x39\xcd\x16\x94\xf2\
+\x70\x96\x59\x4d\x8f\x18\xf2\xa4\x4b\x40\x4d\xd1\x84\x0d\xd0\x9b\
+\x2d\x45\x7d\xc2\xd2\xaf\xde\xf6\x79\x48\xcd\x90\xe2\x44\x72\x13\
+\xf6\x99\x60\x5a\x07\xd2\x22\xfc\xdc\x33\x8a\xaa\x00\xb8\xa5\x7c\
+\x43\x36\x4f\x27\xdd\xd6\x2a\xb0\xf5\x3a\x4a\x96\xb1\x99\xbc\x9c\
+\x28\x71\x2e\x07\x08\x90\x19\xa2\xb9\xa7\xc9\xc0\x2f\xc4\xb4\x64\
+\x89\x3e\x53\x2c\x0d\x06\x02\xa2\xea\x22\x80\x56\x96\x76\x43\x64\
+\x12\x69\xd9\x8a\x0c\x18\xe7\x2c\x5d\x0b\x95\x42\x0d\x84\x4b\xa5\
+\xee\xff\x5b\x7a\xee\xdf\xcb\x6e\x83\x35\x59\xaf\xc3\x53\x5e\x4c\
+\xe9\xa4\x70\x5b\xa1\x26\x03\x80\xc7\x1b\xb7\x81\x39\x0b\x57\xc3\
+\x15\xd7\xdf\x8c\xc7\x53\x18\x86\x8e\x99\x01\x9d\x7a\x8f\x80\x52\
+\x52\xa6\xd9\xa3\xcd\x83\x64\x75\x38\xcd\x25\xe2\x25\x13\x88\x52\
+\x92\x14\xea\xd1\x6e\x8c\x96\x51\x6e\x97\xd5\x1b\xa3\xaa\x64\x72\
+\x97\x62\x91\x03\x3d\x66\x4c\x48\x53\x49\x8f\xf9\xbd\xdb\x9c\x04\
+\x5f\xba\x33\xc9\x48\x75\x4c\x72\x59\x06\x08\x50\xa2\x63\x16\xfc\
+\x25\x46\xbe\xfa\x1c\x81\x90\xa1\x72\x1a\x4e\x92\x5b\x76\xa1\x25\
+\xf8\xff\x4a\x0b\x20\x2e\xa1\x21\x08\xc5\x1f\x0b\xb4\x92\xd2\x8f\
+\x36\x51\x9e\x2f\x56\x35\x40\x89\x52\x38\x34\x02\x92\x14\x16\x0a\
+\x58\xc6\xe7\x09\xc7\xf8\x91\xa2\x1f\xeb\x51\x53\x06\xf2\x60\xf7\
+\x19\x7d\x40\xf7\x41\xeb\x51\xac\xf5\xb4\xea\x5a\x3c\x85\x37\xc1\
+\x4c\xa5\xab\x2f\x83\xbe\x0c\x4e\x5a\xc9\x4b\x96\xd6\x3d\x4a\xbb\
+\xbb\x5c\x35\x6d\xf7\x6a\xae\x14\x45\x0e\xf2\xdb\xef\x4b\x05\xcf\
+\x54\xdd\x23\xce\xe1\x2c\x57\xb0\xef\xc3\xb2\xd4\xa9\xb4\xbd\x2d\
+\x9b\xec\x97\x21\x66\x81\xf9\xfb\x90\xc1\x3b\x25\x4d\xb0\xd2\x53\
+\xe4\xfc\xaf\x1e\x15\xcb\x10\x3d\x75\xb6\x01\xe6\xe7\xb7\x60\xf6\
+\xe2\x42\x18\x3d\x65\xbe\x00\x00\x9a\xb4\x54\x9d\x6d\x59\xaf\xbc\
+\xf6\x26\x18\x3c\x72\x3a\x7c\x30\x78\x12\xeb\x08\xe8\x29\x00\x73\
+\x14\xd0\x50\x2d\x8c\xa5\x66\x48\x3a\xf2\xac\x27\x1f\x30\x3d\xe7\
+\xc3\x50\x01\x83\xdd\x99\x3f\xfe\x64\x00\x70\xe2\x84\xd0\xe5\x5f\
+\x5a\xb0\x51\x13\xe6\x9c\x4b\x4c\x3e\x3c\xd6\xf8\x4d\xf8\x60\xc8\
+\x38\x0e\xae\x3d\x07\x8c\x61\x03\x95\x8b\xcb\x87\x24\x58\x21\x06\
+\x7e\x65\xf0\x92\x92\x1f\x06\xce\x37\xdf\xee\x06\x87\x0f\xff\x86\
+\x20\xe0\xac\x56\x04\x34\x03\xff\x9f\x7f\xfe\xc9\xeb\xdc\x1f\xe7\
+\x30\xfb\x27\x10\x20\xd6\x3c\xfc\x3e\xd4\xd4\x0a\x7d\x7f\xd7\x65\
+\xdd\xc1\x19\x3d\x95\xf5\x45\x1b\x60\xb4\x00\x03\xfd\x47\x83\x55\
+\xfb\x7e\x2e\xd1\x8b\xbe\xaf\xd8\x38\xfe\x55\xbd\x3e\xbc\xdf\x63\
+\x08\xbe\x4f\x51\x05\x50\xc1\xbf\x47\xff\x11\xbc\xba\xf7\x1b\x09\
+\xdd\xfa\x0e\x87\xae\x7d\xa9\x65\x30\x0c\xc1\xcc\x50\x5c\x78\x99\
+\x3b\x14\xff\xc6\xdb\xfa\x8e\x80\xce\x7d\x46\x40\xc7\xdc\x61\xf0\
+\x7e\xaf\xc1\xf0\x7e\xcf\xa1\xb8\x86\xf1\xe6\xdd\xa5\x0f\x3d\x1e\
+\x01\xc4\xa0\xb1\xd0\x7f\xe4\x64\x04\x6e\x0b\x61\xe6\x82\x02\x58\
+\xb4\x62\x1d\xe4\x17\x6c\x80\xfc\x95\x62\x2d\x5d\xb9\x11\x2f\x37\
+\xc3\xb8\xa9\x8b\xa1\x53\xcf\x11\xf0\x7c\xb3\xf7\x59\x5b\xbe\x32\
+\x82\x85\x32\x97\x85\x65\xbb\xa1\x2a\x1f\x9b\x5e\x79\x7c\xa6\x48\
+\x5b\x5a\x05\x00\x18\x70\x70\xf5\x28\xec\xf8\x1d\xa8\xb4\xac\x78\
+\x00\x5a\xe2\x57\x8e\x1d\x6a\xb9\x5b\xfa\xcd\xfd\xa6\xea\x67\x28\
+\xaa\x92\x90\xbc\xc2\x9e\x5b\xc5\xcf\x72\x19\x22\x29\xc2\xae\xc1\
+\xe3\x71\x78\x90\x84\x63\x07\xf7\x04\x25\x62\x07\x00\xf0\x9b\x04\
+\x41\x09\x44\xfc\x86\x25\xb1\xd1\xda\x54\xed\x16\xbd\x2f\x64\x8a\
+\x24\x81\x03\xb6\x14\xe2\xe2\x2c\x5e\xb9\x28\x4a\xf3\x29\x7b\x6e\
+\xbf\x0a\x57\x81\x3a\xf6\x1c\x02\x73\x96\xac\x85\x6a\x08\x28\xd9\
+\xf3\x43\x8d\x98\xf2\xef\x22\xcf\xf7\xcc\x1c\x61\xe5\x9d\xa1\x48\
+\x85\xd9\xbc\xca\x5c\x59\x13\x9e\x40\x10\x3b\x37\x7f\x2d\x34\x78\
+\xf0\x65\x28\x8b\x40\xb0\x6d\x87\xfe\x30\x0b\xc1\x40\x85\x2a\xb7\
+\x73\xdb\x40\xb7\x23\x02\x72\xaa\x83\x8f\xf5\xa0\xd8\x97\x68\xdf\
+\x92\xe6\x4e\x42\x7e\x58\x04\xe9\x14\x15\xac\x1d\x1a\x28\x96\x56\
+\x46\xf5\x04\x6c\xe7\x41\x4f\xba\x79\x3d\x68\x24\x3a\x59\xb2\x9d\
+\x21\x41\x8d\x4e\x8e\xa2\x4b\xec\xb6\x12\x64\xc4\xd0\x9a\xb0\x1c\
+\xed\x2b\xa5\x8b\xe2\x4b\x0f\x1a\x71\xa4\xe4\x99\xb5\xcf\x1c\xcb\
+\x76\x57\x34\x8b\x2d\xa8\x77\x21\x04\x93\x8a\xe6\xec\xfd\x23\x36\
+\x11\xab\x38\x15\x00\x55\xc2\xcd\x8a\xf1\xc2\x96\x41\x28\x72\x65\
+\x7c\x31\xa5\x0a\x83\x8e\x0c\xdf\x97\xee\x24\xfd\xf9\x54\xbf\x5d\
+\x1d\x58\x5c\xba\xae\xee\x52\xdf\xcb\x8a\x52\xe4\xb3\x5d\xfd\xac\
+\x38\xc4\xbf\x18\xd2\xbe\x6a\x14\x51\x01\x00\xde\xa4\x0c\xc6\xbd\
+\x89\x64\xf1\x3d\x97\xc6\x8d\xad\x65\xdb\x5c\x68\xd6\xa6\x3b\xb4\
+\x6c\xd3\x03\x5e\x6f\xd7\x1b\x5a\xbf\xd7\x0f\xd2\xae\xa8\x25\x24\
+\x76\xf1\xc0\x6c\xde\x36\x97\x47\x79\x5e\x6b\xdf\x1b\xaf\xf7\x84\
+\x57\x5b\x77\x87\x26\xad\xba\xc2\xcb\x6f\x74\x86\x97\x5e\xef\x0a\
+\x2f\xbe\xd6\x05\x5e\x7c\xbd\x0b\x5f\x6f\xf2\x06\xad\x6e\xfc\xff\
+\xaf\xb4\xea\x8e\xf7\xed\x01\x4d\xdf\xea\xce\x8f\xa1\x71\x9e\xe6\
+\x6f\xf5\x92\xab\x27\x2f\xbe\xad\x75\x4f\x68\xfa\x26\x3e\x27\x3d\
+\x57\x8b\x4e\xf0\x42\xd3\x0e\xd0\xf8\x95\x77\xa1\x11\xae\xc6\x78\
+\xfd\x85\x16\x1d\xf1\x35\x3a\xc2\x4b\xaf\x75\x66\x8b\xdf\xe7\x9b\
+\xbd\x07\xcf\xe1\x22\xab\xe0\xe7\x5b\xbc\x0f\x2f\xb4\x94\xff\xff\
+\x7a\x67\x7c\x4f\x5d\xe0\x15\x7c\xae\x66\x6d\x7a\xe2\xe7\xea\x0d\
+\xaf\xbd\xdd\x9b\x3f\xd7\xbc\xa5\x6b\x60\xea\xbc\xa5\xf8\x7a\xdd\
+\xe5\xea\x86\xb7\xf7\x84\x8e\x3d\x46\xc0\xac\xf9\xab\x61\xc8\xa8\
+\x59\x70\xf9\x75\x75\x98\x47\xa2\xc6\x10\xdd\x12\xac\xdc\xab\xf7\
+\xbb\x32\x00\x9d\x29\x59\x0e\x4d\x76\x05\x6c\xc8\xe7\x7c\xff\xa1\
+\x5f\x10\x00\x10\x0f\x80\x88\x79\x67\xa0\xff\xb0\x89\x98\xdd\x66\
+\x3b\x1d\xe9\x24\x18\x22\xfe\xc1\x65\x37\xdc\x8a\x19\xf5\x04\xce\
+\xc2\x49\x6e\xb5\x1b\x06\xc3\x36\x1d\xfb\x41\xc5\xf0\x9d\x2c\xc0\
+\x43\x19\xb9\x87\x24\x58\x71\x13\x25\x73\x9f\xcb\xff\x95\x83\x00\
+\x66\x12\x9c\x40\x90\x41\x81\xfe\xcf\x3f\xcf\xc1\xbf\xff\xfd\x6f\
+\x5e\x14\xfc\xd5\x75\xe2\x05\x50\xf0\x3f\x78\xf8\x17\x38\x74\xf8\
+\x77\xb8\xb6\xca\xad\x02\xbc\xd1\x4c\xff\x25\xd7\x43\xeb\xf7\xfb\
+\x88\xc0\xcf\x00\x60\x94\xb8\x8e\x99\x3c\x81\x80\x9b\xef\x78\x9a\
+\xb5\x0d\xbc\x9a\x84\x99\x8d\x59\xfc\x8d\xf8\xdb\x76\x45\x10\x30\
+\x46\x54\x00\x06\x48\x10\x80\xab\x3b\x82\x80\xae\x06\x00\x10\x8b\
+\x02\xff\x70\x79\x3b\xfe\x7f\xbf\x11\xd0\x8d\x00\x03\x3e\x8e\x2a\
+\x06\xd4\x46\x20\x12\x22\x55\x3f\x46\x8c\x9f\x01\x93\x66\x2f\x86\
+\xb9\x4b\x56\xc3\x82\xa5\xab\x61\xfe\xd2\x42\x26\x7b\x2d\x26\x10\
+\xb0\x72\x2d\x2c\x59\xb1\x1e\x01\xc0\x7a\x58\x86\x80\x60\x79\xe1\
+\x26\x28\x58\xbb\x15\x0a\xd7\x6d\x83\xb5\x1b\xb7\xc3\xba\xad\x1f\
+\x43\xe1\xa6\x8f\x30\x18\xac\x82\x7e\x43\x27\xc3\x9b\x78\x4c\x3f\
+\xfe\x6c\x2b\xb8\xf1\xb6\x27\xe0\xca\xeb\xeb\xe0\x06\x5b\x55\x13\
+\x40\x53\xf1\x7c\x49\xd5\x5e\x04\xd9\xa2\xdd\xc2\x99\x67\x58\x9b\
+\xfd\x28\x35\x3b\x7d\xce\xa7\xa9\xd1\x59\x4b\x8e\xcf\x5a\x46\x66\
+\x26\x2b\x03\x2e\x8d\xfe\xd4\x40\xfc\x49\x00\x6f\x4c\x19\xdf\x58\
+\x13\x02\x41\x97\x30\x97\xd1\x86\x48\xb0\xef\xc5\x53\x77\xb3\xc5\
+\x92\x42\xae\x6a\x67\xd8\xe9\xd1\xa1\x12\x19\x0c\x9c\xe5\xae\x08\
+\xc3\xa3\x08\x50\x69\xa6\x7f\x60\xde\x0c\x18\x3c\x66\x16\x0c\x1a\
+\x3d\x93\xaf\x0f\xa0\x85\x40\xba\xcf\xd0\x29\xd0\x7b\xe0\x44\x3c\
+\x7e\xc6\xe3\x1a\x07\xdd\x71\xf5\x18\x40\xc7\xf3\x44\x5e\x34\xcf\
+\xdf\xbd\xef\x38\x98\x30\x23\x1f\x66\xe7\xaf\x46\x00\x39\x0e\xde\
+\xeb\x31\x94\x57\x87\x5e\xc3\x11\x28\xe6\x21\x00\x1c\x8b\xc7\xd2\
+\x04\x7e\x9e\x5e\x78\x2e\xd0\xf9\xd0\x9b\x34\x00\xa4\x0e\xc0\xd4\
+\xd9\xcb\x61\x31\xfe\xfe\x53\xe7\x2e\xc5\x63\x66\x1c\xcc\x5c\xb4\
+\x0a\x16\xe3\xb1\x30\x72\xe2\x2c\xe8\x88\x20\xb2\x53\xee\x28\xe8\
+\xf4\x81\x58\x1d\xf1\xf9\x3a\xf4\x1e\x25\x56\x2f\xbc\xde\x6b\x24\
+\x74\xe8\x99\x07\x9d\xf0\xb2\x23\xdd\xaf\xf7\x68\x5c\xa3\x78\x75\
+\xa4\xdb\xf0\x3e\xef\xd3\x7d\x7a\x8d\xe0\xbf\x3b\xf4\xc6\x95\x9b\
+\xc7\xcf\x49\xcf\x25\x9e\x37\x0f\x01\x6c\x1e\x1e\xcf\xa3\xf1\x38\
+\x1e\x83\xc7\xf3\x18\x3c\xbe\x47\xe3\x7b\xc7\xff\xcb\xc5\xe7\xe8\
+\x2d\x16\xfd\x4d\xd6\xe4\x34\x32\x29\x2a\x01\x71\x66\xf0\x8d\xea\
+\x62\xaa\xa3\x65\x63\x39\xc4\xe5\xbc\x06\x47\x21\x69\x81\x9f\x40\
+\x8c\x76\x43\xba\xaa\xb2\x5a\x45\x38\xc2\xfe\x5f\x5b\x56\xfc\x0a\
+\x40\xc9\xb4\x8d\x83\x49\xa1\x90\x22\x47\xf6\xdc\xfd\xff\x74\x5b\
+\x58\xc7\x16\x1b\xc9\x72\xfe\xbf\x5b\x7e\x37\x2e\x47\x20\x98\x60\
+\x3c\xd0\x5c\xa2\x7a\x20\x58\xe8\x32\xf8\xe3\xc9\x5c\xda\x00\x00\
+\xb6\xce\xb9\x78\x4f\x97\x64\x86\xa0\xdf\xb0\x29\xbc\x88\x94\x33\
+\x18\x4f\xe6\x11\x13\xe6\x83\xbf\xc2\x4d\x62\x1e\x1d\x37\xc6\x5e\
+\x83\x26\xc3\xe0\xb1\xb3\x61\xe0\xe8\xd9\xd0\x3f\x6f\x26\xf4\x1d\
+\x81\xd9\xf2\xf0\x69\x90\x3b\x6c\x2a\xe4\x0e\x9d\x0a\xbd\x87\x4c\
+\x81\x5c\x5a\x83\x27\x43\xef\xc1\x53\xf8\x6f\x5e\xb4\x11\x0c\x99\
+\xcc\x97\xf4\xff\x1f\xe0\x7d\xfb\xe0\x63\xfa\x0d\x9b\x06\xfd\xf1\
+\xf1\x03\x47\xce\x80\x81\x23\x66\x70\xd9\x6e\xe1\x8a\x8d\xb0\x60\
+\xd9\x7a\xee\xc3\xf7\x19\x3c\x9e\x33\xbe\x19\x0b\x56\x43\xbf\x11\
+\xd3\xa0\xcf\x90\x49\xd0\x0f\x6f\xef\x37\x62\x2a\xf4\xc5\xc7\xf7\
+\xc1\xd7\xe8\x85\xd9\x7a\xef\xc1\xb8\x29\x0c\x9e\x28\x2f\xf1\xef\
+\x41\x93\x78\xa3\xe0\x4d\x62\xd0\x44\x0c\x4c\xf8\x98\x21\x53\x59\
+\x32\x78\x3e\x06\x8f\x59\x8b\x0b\x78\x53\xca\xc5\xe7\xeb\x3b\x94\
+\x5e\x67\x12\x67\x8e\x0f\x3e\xf9\x1a\x94\xb9\x34\x5b\x9e\x78\xea\
+\x84\x8c\xc4\xee\xe5\xfa\xed\x71\xc4\x68\x63\x17\xbb\x7f\x5c\x9a\
+\x36\xfd\xf2\x04\x00\x72\x60\xd5\x9a\x6d\x4c\xd2\x23\x1e\x00\x01\
+\x80\x96\xad\xbb\x70\x75\xc2\xab\xaa\x2a\x1a\x60\x08\x10\x40\x3d\
+\xf0\x67\x5e\x69\xcf\x81\xb7\x5b\xdf\x91\xb8\xc9\x48\x21\x95\x7e\
+\x79\xf0\xc4\xf3\x6f\x42\xd9\x4b\x31\xbb\x2a\xa7\x08\x74\x95\x24\
+\x89\xae\x12\x64\xd5\xb8\x0b\xe6\x2d\x5a\x09\xe7\x30\xd8\xff\xe7\
+\x3f\xff\xe1\x99\xfb\x7f\xff\x87\x82\xff\x7f\xf0\x6f\x04\x03\x78\
+\x3b\xb9\x06\x12\x21\xf0\xe0\xc1\xc3\xd0\xbe\x43\x1f\x66\x63\x13\
+\x88\xb8\xa8\xcc\x0d\x70\x53\xfd\x27\x70\xd3\x15\xe5\x7f\x55\x05\
+\xe8\x29\x2f\x73\x07\x8d\x87\xfb\x1e\x6b\x2e\xcb\xe2\xa2\xbf\x4a\
+\x2d\x16\xe2\x0f\xdc\xfb\x78\x53\xfc\xde\x47\xe3\x06\x3d\x4a\x07\
+\xff\x6e\xfd\x28\xc0\x4b\x00\xd0\xd7\x0c\xfc\x62\x75\xeb\x3f\x1c\
+\xba\x53\xbb\x80\x2a\x07\x03\x05\xff\x60\xf0\xe8\xa9\x30\x6e\xfa\
+\x02\x98\xb5\xa8\x00\xe6\xe4\x17\x60\x76\xb7\x8a\xd7\x7c\x5a\x4b\
+\xd6\xe0\xf1\xb1\x16\x16\xe3\xef\x98\xbf\x62\x0d\x2c\x29\x58\x0b\
+\xcb\x56\xad\x87\x15\xab\x37\xc2\xca\xc2\x8d\xb0\x6a\xed\x26\x28\
+\xdc\xb0\x05\xd6\x6c\xda\x0a\xeb\x36\x6f\x87\x0d\x9b\xc9\xba\xf8\
+\x43\xd8\xbc\xed\x63\x69\x5a\xf4\x19\xec\xdc\xf5\x05\xec\xfa\xec\
+\x1b\xd8\xb2\x63\x37\x3f\xdf\xd0\xbc\x69\xd0\xae\x63\x7f\x68\xf4\
+\x72\x7b\xb8\xad\x41\x63\xb8\xb6\xda\x1d\xf8\xdd\x52\x3b\x46\xfa\
+\x77\x18\xc1\xdf\x27\xab\x6f\x4c\x5c\x2d\x57\xdd\x68\x43\x05\xb5\
+\x90\x96\x70\x11\x94\x80\xdb\xa8\x02\xb1\x96\x84\x22\x30\x4a\x07\
+\x44\x6f\x11\x3a\xfe\x5e\x43\xd9\xcf\x27\x1d\x13\x1d\x15\xc6\xf3\
+\x20\x36\xe3\x71\x5d\x3a\xa6\x19\xfc\x26\xe9\x4c\xcc\xfe\xd3\xf7\
+\x33\x6a\xf2\x42\x98\x81\x59\x36\x55\x6c\x5a\xbe\x8d\x49\xc3\xdb\
+\x3d\xe0\x0d\x4c\x0c\x68\xe6\xbf\x6d\xc7\x81\xd0\xb6\xd3\x40\x78\
+\x1b\xc1\xea\x9c\xfc\x42\x04\x6f\x6b\x31\xd0\x8f\x86\xd7\xda\xf5\
+\x82\xd7\xdf\xce\x85\x37\x68\xb5\xeb\x83\x2b\x97\xed\xbd\x5b\xbd\
+\x93\x0b\xad\xdf\xf9\x00\xde\xc4\xcb\x56\xed\x3f\xc0\x85\x89\x06\
+\xfe\xfd\x16\x3f\x57\x7f\x78\xbb\xf3\x40\x68\xdf\x65\x10\xb4\xeb\
+\x8c\xab\xcb\x40\x68\xd7\x69\x00\xdf\x4e\x97\xef\xe0\xff\xb5\xeb\
+\x3c\x00\xde\xee\x24\xfe\xa6\xfb\xb6\xc5\xf5\x76\x27\x71\xd9\xb6\
+\xe3\x00\x68\x43\xf7\xef\x30\x00\xde\xc2\xd5\xa6\xc3\x40\x04\xd1\
+\x03\xe1\xad\x4e\xe2\xb2\x2d\xfe\xdd\xf6\xfd\xfe\xb8\xf0\xff\x78\
+\x0d\x64\xde\x0d\x7f\x86\x8e\xf4\x3c\xf4\xba\x83\xa1\x7d\xe7\x21\
+\xf8\x1e\x86\xc0\x3b\xb4\xba\x0e\x15\x82\x45\xdd\xe4\xea\x3a\x98\
+\x85\x8b\xda\xe3\x25\xbd\x47\x7e\x6d\x7a\x5d\x7c\x1e\xfa\x0c\x6f\
+\x75\xe8\xcb\x76\xe6\x4f\xbe\xd0\x46\xaa\x27\x06\x9d\x93\x58\x51\
+\x40\x40\x72\x48\x34\x99\xdd\xe0\x8e\x05\x24\x59\xd9\x5f\x32\x27\
+\xd9\xe8\x7e\xbf\xdd\x5e\xf2\xc4\x19\x53\xff\xef\xad\x70\xf1\x2b\
+\x00\xe7\xc7\xb2\x31\xda\xea\x36\x39\x33\x83\xa0\x1e\x8f\xf1\x1a\
+\xe6\x30\xaa\x5c\xe6\x89\xab\x1c\x18\x8c\x12\xdd\x51\xe4\xa4\xf8\
+\x40\x20\x98\x40\xc1\xd0\xa8\x26\xf8\x8d\x3e\xa5\x09\x00\xf4\xb2\
+\x0c\xdf\xf3\x6a\xe2\xa0\x54\xe5\x6b\xea\x51\xca\xde\x9b\x8f\x7b\
+\xe1\xd9\x86\xac\x6f\x90\x7b\xb5\x44\x08\x63\x57\xb9\x32\x72\x95\
+\x35\x57\x55\xe1\xe4\xa7\x4a\x57\xca\x54\x27\xc3\xcc\x86\x42\x5a\
+\xee\xb7\x3d\x9e\xc4\xd4\xa3\xaf\x5d\xef\x09\xb8\x38\xb3\x2a\x0c\
+\x1d\x3d\x03\x46\x8c\x9b\x0b\x95\xc2\x0d\xe0\x22\x92\x01\x96\x65\
+\x44\x66\x08\xe3\xf3\x96\x92\x16\xc1\x24\xb4\x23\x9c\xed\x2a\x1b\
+\xa2\x34\xf2\x92\x4b\xbd\x82\x47\x71\x71\x46\x10\xe6\x2d\x5b\x07\
+\x53\x66\xaf\x10\x19\xaf\x51\x6e\xa5\x40\x5d\x5a\x72\x1b\x74\x86\
+\xef\xb7\x49\x5d\xf6\xd8\x56\x1c\x57\x43\xa3\x3a\xa0\x44\x83\x44\
+\x29\x9f\x78\x04\x35\x11\x00\xd4\x82\x41\xc3\x27\x33\x49\xef\xe4\
+\x29\xaa\x00\xfc\x01\xf7\x3e\xd2\x84\xab\x03\x0c\x00\x1c\x40\x43\
+\x99\xa7\x84\xe0\xea\xca\x75\x39\xf3\xef\xda\x57\x28\xa8\xf1\x42\
+\x30\x40\x99\xf3\xbb\xb8\xe9\xd4\xb8\xf5\x51\x26\xd0\x71\x35\x80\
+\xb2\x0b\x3c\xd6\x84\x38\x4d\x10\xea\xd4\x7f\x12\x16\x2f\x2f\x64\
+\x00\xf0\x1f\x10\x22\x3c\x04\x08\xce\x21\x10\xf8\xe3\xcf\x73\x70\
+\xf4\xd8\x31\xd8\x77\xf0\x10\x7c\xf4\xc9\xd7\xe0\x2b\x77\x03\x78\
+\xca\x54\xe4\xd9\xfe\xd4\xf4\x2a\x98\xd9\x8c\xd4\x6d\x00\xb5\x7a\
+\x63\x66\x4e\xab\xef\xd0\x89\xd0\xb8\xe9\xfb\x08\x96\x72\x98\x98\
+\xc7\x4b\x6a\x35\x54\x0e\x35\x80\x77\xbb\x0e\x80\x1e\x08\x02\xa8\
+\xfc\xdf\xb5\x8f\x9d\xf9\xeb\xc0\xdf\x4f\xad\x11\x0c\x12\x7a\x0e\
+\x1c\x09\xfd\x47\x4c\x84\x51\x93\xe6\xc0\xb4\xf9\x34\x13\xbe\x12\
+\xb3\xf6\x15\xbc\x66\xe3\x75\x12\x79\x99\x83\xc1\x7f\x1e\x5e\xce\
+\x5f\xb2\x0a\x16\x2e\x2d\xc4\xcf\x85\xc1\x7f\x05\x06\xff\x82\xf5\
+\xb0\x7c\xd5\x46\x58\x81\xc1\xbf\x60\x0d\x02\x80\x75\x9b\x11\x00\
+\x6c\x83\xb5\x9b\xb6\xc1\xba\x2d\x3b\x60\x03\x07\xff\x8f\x30\xf8\
+\x7f\x0c\xdb\x76\x7e\x0a\x3b\x3e\xfa\x0c\x3e\xfc\x78\x37\xec\x22\
+\xcb\xe2\xcf\xbf\x84\x4f\xbf\xf8\x9a\xf5\x08\xbe\xfc\xe6\x07\xf8\
+\xfa\xbb\x3d\xf0\xed\x8f\x07\xe0\x07\x72\x2b\xfc\x6a\x2f\x2c\x2b\
+\xdc\x0a\x23\xc7\xcd\xc6\x40\x36\x00\x1e\x6b\xd4\x1a\x42\x37\x3e\
+\x08\x69\x97\x47\xb8\x5d\x44\x62\x48\xde\x72\x26\x87\xc4\xe6\x92\
+\x30\x08\x48\x57\x5c\x81\xb0\xb3\xbd\xa3\xc6\xd2\x0c\x25\x41\x7b\
+\xc2\x24\x12\x2d\xeb\x9b\x1e\x3d\x0d\x10\x7b\x7c\xec\xfc\x8c\x59\
+\x39\xaa\x5c\x86\x3f\x81\x18\x17\xae\x0e\x99\xff\xbc\x11\xc6\x4c\
+\x5d\x84\xa0\x6d\x1c\x5c\x7a\xdd\x4d\xcc\xc0\xe7\x2a\x16\xe9\x49\
+\xd0\x71\x5c\x5e\xb4\xf1\x68\xff\x6a\xf9\x56\x57\xfc\x2d\xd7\x40\
+\xed\x3b\x9e\xe4\x73\x53\x9c\x97\xc2\xda\x5b\xb4\x64\xaa\x4a\x0d\
+\x09\x59\xf6\x2f\x6b\xff\xbf\xc7\xd0\x95\xf0\x19\x06\x42\xac\x91\
+\xa1\x6c\x97\xe9\xbb\xcb\xb4\xbf\x5f\xd1\x82\x90\xad\xcb\x0c\xa1\
+\x64\xa9\xf6\x17\x2e\xef\x9b\xad\x4a\xb9\x87\xd0\xf2\x96\x55\xfe\
+\x01\xa4\x6b\x10\xb4\x47\xa0\xe5\x48\xa9\xa3\x8f\x2f\xcb\xfc\xf1\
+\x2a\xaf\x5a\x91\xd2\x1f\xd4\x62\x49\x29\xfc\xda\x72\x39\xc6\xb0\
+\xdd\xe3\xd9\x66\xb6\x1f\x72\xf5\xf8\xad\x18\xee\x86\xc1\x12\xfc\
+\xbe\xf1\xc8\xee\xa1\xe8\x04\x36\x59\x37\xc3\x0b\xac\xf6\x57\x6c\
+\x0e\x40\xc9\x00\x40\x3c\xdf\xfb\x58\x5f\x60\x2c\x67\xbe\x38\x5a\
+\x00\x0a\x08\x24\x60\xea\xa7\x3a\xfa\x79\x31\x94\xff\x02\x89\xf4\
+\x02\xac\xf8\x73\xa6\xb2\x54\xa4\x7b\x47\x0e\x33\x0f\xd9\x73\x4a\
+\xb7\xdf\x9f\xb0\xb2\x95\x7d\xf9\xcc\x1a\xf2\x84\x92\x24\x38\xee\
+\xbf\x49\xbb\xdd\x40\x8e\x1c\x13\xb2\xfb\xff\x1e\x95\x0d\xa9\xde\
+\xbf\xfa\x3b\x3d\x24\xed\x5e\x45\x59\x35\x35\xb3\x86\x0c\x8a\x92\
+\xd4\x23\x5d\xf8\x6a\xd6\x7d\x02\x16\xaf\xd8\x0c\x39\x75\x1f\xe3\
+\x13\x87\xac\x67\x27\xcd\x5c\x0a\x57\x5c\x5b\x07\x4a\xf1\x49\x14\
+\xc4\x4b\x8b\x4f\x20\x1e\x1d\x2c\x17\xe4\x13\x96\x01\x46\x9a\xed\
+\x02\xa6\xcc\x43\xe8\x24\xd6\xce\x7c\x52\x55\xef\x62\xdc\xa8\xe6\
+\x2e\x5d\x87\x41\x65\x8d\x38\x49\xe5\x9c\xbf\x0d\x70\x6a\xd8\x3d\
+\x7f\x46\xe0\x96\xb1\x42\x31\x74\x00\xac\xb8\x4a\x6f\x62\x53\x17\
+\x9b\x55\x69\x16\xf4\xa9\x01\x4d\x5a\xbe\x07\xa7\x58\x27\x9f\x04\
+\x7a\xfe\x80\xaa\x91\xbb\x25\xef\xc1\x94\x1c\x0e\x39\x64\x91\xc9\
+\xb3\xa0\x51\xb3\x77\x39\x58\x76\xed\x3b\x0a\xba\xd1\xa2\x92\x39\
+\x06\xd7\xce\xb2\x9c\xde\xa2\x6d\x37\x26\x50\xf1\x86\x19\x08\xc9\
+\xcd\x52\x7e\x2e\xcc\x18\x6b\xd7\x7b\x0c\xe6\x2c\x58\x06\x7f\x9c\
+\xfb\x93\xc1\xc0\xb9\x7f\xff\xc9\xd7\x49\x89\xef\xb7\xdf\x8f\xb2\
+\x3b\xdf\x63\x4f\xb7\x60\x73\x25\x62\xe4\x53\x25\xa0\xc1\xa3\x4d\
+\xb8\xf7\x4e\xfc\x83\xde\x83\x44\xe0\xcf\x1d\x32\x96\xcb\xfc\x7d\
+\x86\x8e\x83\x7e\xc3\x26\x72\x96\x77\x65\xa5\x7a\x92\x67\x21\x8e\
+\x0b\x7a\xef\x65\x2f\x8b\xc0\x23\x8d\x5e\xc3\xf7\x3a\x42\xf4\xfd\
+\x29\xf8\xf3\xa2\x0a\x80\x00\x03\xdd\xfb\x8f\x84\x7e\xc3\x27\xc0\
+\xc8\xf1\x33\x60\xf2\xac\xc5\x30\x63\xde\x32\x98\x81\xc1\x7f\xc6\
+\x82\xa5\x30\x73\xc1\x72\x07\x00\x98\x4d\x95\x00\x0c\xfe\x02\x00\
+\x14\xc0\xc2\x65\xab\x39\xfb\x5f\x5a\xb0\x4e\x64\xff\x18\xfc\x57\
+\xae\xd9\x84\xc1\x1f\xb3\xff\x75\x98\xfd\x53\xf9\x9f\xb2\xff\xad\
+\x3b\x61\xd3\xb6\x0f\xd9\xb2\x78\x1b\x65\xff\x1c\xfc\x3f\x87\x8f\
+\x28\xf8\x7f\xf6\x25\x7c\xb2\xfb\x6b\xf8\xec\x0b\x72\x2d\xfc\x0e\
+\xbe\xc0\x45\x26\x46\xdf\xfc\xb0\x07\xbe\xfb\x61\x3f\x7c\xbf\x07\
+\x81\x00\xdb\x29\xff\x24\x3c\x0c\x0e\x91\x7e\xc2\x6f\x78\xdb\xcf\
+\xb0\x6e\xe3\x47\x30\x7a\xfc\x5c\x78\x0b\x33\xd6\x7b\x1e\x7a\x85\
+\xa5\x70\x3d\x7e\x31\xd2\x48\xbd\x6d\x6e\x07\x30\x11\x35\x5b\x1e\
+\x57\x39\x3a\x68\x89\xf6\x8e\xe2\xd1\xe4\x18\x52\xc2\xb6\x1b\xa6\
+\xad\x84\x69\x18\xf9\x68\x5f\x80\x60\x11\x93\x43\xe7\x07\x00\x38\
+\x80\x88\x0a\x86\x08\x6e\x9a\x61\x50\x1f\x35\x65\x01\x94\xbd\x42\
+\xb0\xf0\x05\x39\x4f\x9c\xcb\xe2\xfc\xae\x05\x5e\x3c\xde\x2b\xe7\
+\xdc\x07\x0b\x96\x6f\x80\x5b\xef\x79\x9e\x09\x97\xd4\x67\xa7\xd1\
+\x4b\xbb\xdf\xee\x5a\xc6\x6d\xe6\x79\xac\xc5\x94\x98\xc9\x2f\x49\
+\xc2\xc6\x52\xb6\xc2\xa6\x13\xa8\xda\xa3\x3c\x01\x7b\x02\x41\x8c\
+\x1c\x67\xd9\x46\x43\xbc\x47\xa8\x91\xbf\x2c\xbb\x75\x93\xe6\x62\
+\xd6\xfb\xe5\x58\x79\xba\xb3\x25\x52\x1c\xe6\xbf\x1d\xbc\xad\xd8\
+\x63\xd8\xe9\x2e\x40\x60\xf0\x49\x4c\xeb\x71\x6f\xba\x3b\x96\x24\
+\x51\xdd\x09\xb8\xfc\x5e\x12\x66\xda\x96\x8b\xb4\x9e\x24\x00\x88\
+\x02\x2b\xff\x4f\x01\x00\xb5\x54\x29\x3e\x54\x84\x40\x83\x13\x81\
+\x39\xb3\xf7\xa0\x2e\xad\x27\x0b\x00\x98\xac\x66\x18\x06\xe9\x13\
+\x3f\x3d\xe8\x74\x44\x8b\x09\x04\xe2\x11\x3c\x0c\xe9\xe1\xb4\xa0\
+\xb1\xa9\x84\xa2\x88\x6c\xa6\x6f\xbd\xea\x39\x2a\x62\x9e\x36\xee\
+\xc8\x10\xb3\xb6\x0c\x00\xa4\xa3\x97\x9e\x97\x4d\x53\x92\xa0\x59\
+\xf6\x09\xe6\xcf\xd2\x65\x2e\x8f\xde\x08\x73\x64\x2b\xc1\x90\xd8\
+\x65\x20\x20\x38\x06\xaf\xb7\xed\x05\x43\x46\x4e\xe7\x8a\x08\x6d\
+\x34\x43\x47\xcf\x84\x17\x9b\xbf\x27\xd8\xda\x44\xca\x61\x51\x10\
+\x29\xdd\xaa\x48\x36\x69\x41\xfd\x9a\x8e\xf2\x99\xdf\x66\xcc\xea\
+\x6c\x9c\x0d\x49\x42\x2c\x38\x32\x6f\xd9\x06\xa9\x11\x90\x13\xb5\
+\xa1\xe8\x4c\x23\x3d\x6c\x1c\xdc\x21\xa3\xc7\x1a\x0d\x1e\xdd\xe5\
+\xdb\x54\x33\xbb\xa3\xcf\xc8\x00\xa0\x26\x44\x6e\x7e\x18\x4e\x62\
+\xe0\x3f\x7e\xf2\x14\x1c\x39\x7a\x86\x99\xeb\xa9\xa6\xeb\x9e\x56\
+\x8c\x0b\x1b\xd5\x99\xea\x2c\x82\x43\x1c\x00\xaa\x02\x74\xeb\x97\
+\x27\xca\xea\x7d\xed\xde\x3a\x91\xec\xa8\x47\x4f\x5c\x8c\x7f\x56\
+\xbd\x43\x02\xae\x1a\xd2\xd8\x48\x7e\xe7\xf8\x3b\x54\x0a\xde\x01\
+\xbd\xf1\xf1\x7b\x0f\x92\x31\xd1\x39\x38\x7d\xf6\x4f\x38\x7d\xe6\
+\x1c\xfc\xfa\xfb\x31\x58\xbe\x7a\x0b\xa4\x10\x00\x28\x5b\x89\x47\
+\xf4\x88\x3c\xd7\xbd\x9f\x0c\xfa\x83\x9d\x8b\x00\x00\x2d\xd2\x0c\
+\xe8\x3d\x68\x1c\xd4\xae\xff\xac\x66\xb4\x2b\xc3\x20\x6a\x47\x5c\
+\x5b\xfd\x56\x2e\x0d\x77\xea\x3b\x82\xcb\xfb\xfd\x86\x8f\x87\xc1\
+\x63\xa6\x42\xde\xe4\xd9\x30\x61\xc6\x42\x04\x78\x8b\x60\x0a\x06\
+\xff\x69\x73\x96\x20\x00\x58\x8a\x00\x40\xac\x99\x08\x56\x14\x08\
+\x70\x00\x80\x7c\x0c\xfe\x4b\x57\x73\x55\xc3\x09\x00\xd6\x43\xc1\
+\xda\x8d\x0c\x00\xd6\xac\x17\xe5\xff\xf5\x9b\x77\xc0\x66\xcc\xfe\
+\xb7\x60\xf6\xbf\x0d\xb3\xff\xed\x1f\x62\xf6\xbf\xeb\x33\xf8\xe8\
+\x13\xcc\xfe\x3f\xfb\x02\x3e\xf9\xfc\x2b\xf8\x94\x00\xc0\x97\x12\
+\x00\x7c\xf3\x3d\x02\x80\x1f\xe1\xeb\x1f\xf6\x22\x00\xd8\x07\xdf\
+\xfd\xb8\x0f\x7e\xd8\xb3\x1f\xf6\xee\x3d\x80\x20\xe0\x20\xec\xdf\
+\x7f\x08\x17\x02\x01\x36\x34\xa2\xf5\x33\x1c\x38\xf4\x2b\x1c\x3a\
+\xf4\x1b\x1c\xfa\xf9\x28\x7c\xfe\xd5\x1e\x98\x33\x6f\x05\x0b\xd0\
+\x34\x7c\xf0\x65\xb8\xf4\x9f\xb5\x98\x57\x43\x64\xce\xd2\x4c\x60\
+\x93\xea\x8e\x04\x32\x0d\x32\x9b\xd9\xfa\x31\xf7\x12\x5f\xba\xe5\
+\x10\x67\xf1\x05\x4c\x2e\x50\xbc\xe0\x1f\xfe\xcb\xc1\xdf\x9b\xee\
+\xd6\xca\xb7\xcf\x27\x0a\xd2\x13\x66\x2c\x81\xa7\x9b\xb4\x13\xe7\
+\x21\x2b\x2d\x8a\xcf\xe4\x55\xc7\x1c\x1e\xeb\xbe\xf2\x08\x76\x5f\
+\xef\x02\x23\xc6\xcf\x92\x9a\x0b\x41\x5b\x60\x49\x55\x45\xd5\xb9\
+\x9b\x56\xdd\xb0\xff\x95\x93\x42\x04\xa0\xca\xb9\x94\x0e\x1d\x44\
+\xdc\x88\x3e\xcf\xbc\x9a\xe5\x2f\x47\x7e\x33\x95\x0b\x68\x58\x6a\
+\x08\x88\xbd\x23\x45\xee\x4b\x8a\xe4\x27\xf6\x68\x25\x95\x6c\x39\
+\x0d\xbe\xfc\xa6\xac\x77\x28\xae\x85\x6f\xd1\x26\x42\xf1\x45\xc3\
+\xbc\xb2\x85\xa8\x03\xbf\x1a\x4f\x74\xd9\xc5\x8b\x7d\x20\x68\x2b\
+\xb8\xfa\x6d\x9b\xf9\x64\x02\xb4\xa7\xc4\xd5\xf0\x50\xd2\x23\x86\
+\xbe\xbf\xc1\xe9\xf0\x6f\x00\x00\xc1\x38\x52\xbf\xa1\xa2\xed\x80\
+\xdd\xce\x7f\x06\xf1\xcf\x31\x1a\xe7\x8f\x5f\x05\xd0\x41\x38\x23\
+\xa8\x49\x3e\x1a\x00\x24\x14\xfb\x89\x31\x7e\xa8\x00\x8d\x6e\x43\
+\x18\xe3\x80\xb1\xfa\x42\x2a\xb0\x65\x38\x05\x48\xbc\x19\x8a\x0d\
+\x6c\xc9\x31\x28\x9b\x19\x6c\x8f\xb6\x64\x45\x65\xe0\x6a\xde\x9f\
+\xe7\xff\x03\x92\x4d\x2d\x33\x1e\xa5\xea\x27\xfa\xdc\x34\x67\x5f\
+\x8b\xb3\x88\x8e\x3d\x87\x43\xeb\x77\x3f\x10\x36\xca\x18\xf4\xa7\
+\xe2\x66\x5a\xff\xfe\x97\x38\x63\xf0\x4a\x69\x56\xe5\x8a\x68\x0b\
+\x27\x29\x1f\xf0\xa0\xa3\x92\xa3\x01\x00\x55\x57\xf0\xfd\xf2\x26\
+\x5c\xbe\x06\x4b\xc9\x4e\x99\xbd\x0c\x16\xac\xd8\x88\x01\x2e\xdb\
+\x0e\xfa\x01\xd5\x83\xcf\xe1\x91\x44\xad\x72\xe8\x0f\x39\xcb\x7e\
+\x8e\xe9\x8d\x38\xd3\x21\x2e\x36\x7f\xaa\x0c\x00\x24\xb6\x43\x3a\
+\xfa\x34\x7b\x4f\x23\x80\xdf\xfd\x70\x10\x83\x6d\x15\xa7\x24\x67\
+\xc0\x6e\xd5\x68\x8b\x66\x2a\x1b\x62\x56\xf9\x7c\xf3\x0e\x3c\x72\
+\xd7\xa5\xaf\x10\xdf\xe9\x4a\xec\x7a\xee\xaf\x8f\xe4\x6c\xba\xe7\
+\x80\x3c\x26\xe0\xf5\x1e\x32\x1e\x9e\x6b\xf6\x2e\x54\xa8\x7a\xa7\
+\x28\xc7\x4a\xf1\x14\xa1\x85\x60\x71\x0b\xe5\xe2\xcc\x2a\xf0\x64\
+\xe3\xd7\x31\x88\xae\x85\xe3\xa7\xc8\xbd\xef\x4f\xf8\xf9\xb7\xe3\
+\x70\xef\xc3\x2f\x89\xf9\xfc\xb2\xc2\x94\xe8\xee\xc7\x9a\x42\xdf\
+\xa1\xe3\x45\xc0\x1f\x32\x4e\x03\x00\x22\xe8\x91\x5a\x60\x5f\x02\
+\x01\xc3\xc6\x63\x60\x9f\x08\x8d\x9a\xb6\x87\xb2\x97\x47\xa4\x24\
+\x6c\x15\xa9\x17\x50\x99\x27\x15\x1a\x3c\xfc\x32\x0c\x1b\x37\x13\
+\xc6\x4c\x9d\x0b\x63\x67\xcc\x83\x09\x33\x17\xc0\xa4\x59\x18\xfc\
+\x67\x63\xf0\x9f\x9b\x8f\x6b\x09\x4c\x43\x00\x30\x7d\x3e\xad\xe5\
+\x30\x03\x83\xbf\x03\x04\x2c\x5c\x09\x73\x17\x0b\x0e\x00\x01\x80\
+\x45\xcb\xd7\xf0\x7b\x5f\x4a\xe5\xff\xd5\x1b\x60\x65\xe1\x06\xee\
+\xfd\x53\xf9\x7f\xcd\x86\x6d\xb0\x6e\xd3\x76\x58\xbf\x09\xb3\x7f\
+\x04\x00\x5b\x31\xfb\xdf\xbe\xf3\x13\xd8\x81\x00\x60\x27\x67\xff\
+\x04\x00\x28\xfb\x47\x00\xf0\xc5\x37\x1a\x00\x7c\xf9\xed\x0f\x0c\
+\x00\xbe\xf9\x7e\x2f\x7c\xcf\x00\x60\x2f\x57\x01\xf6\xec\x39\xc8\
+\x4e\x86\xac\xa4\x88\x00\xe0\x00\x02\x00\x52\x53\x24\x4f\x85\x83\
+\x6c\x6b\xfc\x1b\xfc\x74\xf8\x57\x9e\xc0\xf8\xf9\x67\x32\x35\x3a\
+\xc2\x0e\x8f\xbf\xfe\x7e\x02\xdf\xc3\x87\xd0\x0b\x7f\xaf\x7b\x1e\
+\x7e\x05\x32\x2a\xd4\xc4\x63\x3d\x8c\xdf\x7d\x0e\x07\x48\x0a\x94\
+\xa9\x46\x05\x40\x71\x77\x7c\xe6\x98\x1f\x8b\x43\xa9\xbd\x41\x02\
+\xf9\x40\xa2\x6c\x3f\x52\xc2\x8d\x3f\x56\x4b\x2b\xa4\x2b\x0f\x8a\
+\x28\x96\x56\xa1\x06\x0b\xf6\xdc\xda\xf0\x39\x87\x3a\xa2\x47\x32\
+\xff\x79\x3c\xaf\x7c\x4d\x3e\x9f\xa9\x2f\xdf\xbe\x4b\x7f\x56\x5d\
+\xd4\x23\xc0\xea\xb3\x69\xe2\xa4\x25\x7b\xe2\xd5\x6d\x00\xa0\xf7\
+\x0f\x39\x6f\xaf\xf4\x1c\x4c\x80\x1c\x65\x7c\x14\x91\x1a\x21\x61\
+\x23\x81\x0a\x69\x02\xb7\x12\xf6\xd1\x1e\x0f\x7e\x5b\x91\xd4\x0c\
+\xc0\x1e\xe5\x1a\x19\xa5\xbe\xf7\xd7\x2c\x7a\x63\xf2\xd1\x1c\x19\
+\x7f\x58\x8e\x1d\xba\xb4\x67\xfc\x61\x5b\xa3\xc0\x91\x54\x9a\x6a\
+\xb3\xc5\xed\x9f\xc7\xb3\xb9\x37\xbc\x33\x1c\x23\x8a\x17\xc2\x9b\
+\xc0\x3a\x6f\xba\x01\xff\x38\xbf\xb3\x87\xf1\x48\x77\x4e\x90\xa0\
+\x3d\xc2\x13\x2d\x7f\xd0\x49\xf8\x8b\x69\xe1\x1b\x74\xcc\xf1\xd3\
+\x49\x9e\x1a\x30\xe6\x8b\xd3\x6d\x30\x60\xa3\x3e\x97\xea\x60\xcc\
+\x76\x44\xc8\x36\x1b\x32\xe7\x45\x55\x70\x97\xd9\xa5\xb6\xdf\x55\
+\x82\x23\x19\x21\xd7\xc8\x91\xfd\x3e\xb4\x34\xaa\xf1\x19\x3c\x0e\
+\xf2\x93\x65\x5f\x97\x40\x80\x89\x50\x92\x29\xae\x08\x63\x6a\xe4\
+\x8f\x4b\xe3\x19\x36\xbf\x80\x08\x41\x3d\x30\xc0\x79\xb8\xb7\x5f\
+\x19\x46\x4d\x9c\x03\x8f\x3f\xf7\x06\x8b\xf5\x50\x55\x20\x45\x8f\
+\xe0\x64\x39\xc1\x95\x9e\xff\x97\xed\x14\xbf\x58\x3e\xd3\x30\x86\
+\x32\x30\xdc\x98\x2e\xc6\xcd\x76\xcc\xe4\x85\xb0\xa8\x60\x13\x6b\
+\xeb\xfb\x64\x60\x14\xfd\xc4\x1c\xa9\x15\x10\x76\xba\xff\xf9\x8d\
+\x71\x4d\xbf\x3d\xe2\x13\x77\x34\x34\xc3\xc5\xfa\x56\x99\xdf\xa5\
+\x04\x76\x2c\x58\xb8\x64\x2d\xcb\x00\x6f\xdf\xf9\x39\x94\x2a\x53\
+\xd1\x06\x6a\x4a\xc4\x48\x83\x17\x75\x59\x9d\x99\xea\x57\x55\xac\
+\x0b\xdd\xfa\x8f\x15\x5c\x00\x66\xcd\x53\xe0\xcf\x63\x02\x5d\x0f\
+\x66\xdd\xd3\xb8\xdc\x28\x41\xc2\x1b\x3c\x9a\x81\x40\xe3\x16\x1d\
+\xe0\xba\x60\x03\x06\x6f\xac\x7b\xce\x23\x49\x55\x39\x3b\xe7\x00\
+\x8d\x19\xff\xb5\xd5\x6e\x81\x76\xef\xf5\x86\xad\x3b\x3e\xc7\xc0\
+\xf9\x31\xbe\x56\x65\x51\xc2\xc6\xcf\x56\xf6\x8a\x1c\xe6\x1f\xf4\
+\x1b\x21\xfc\x01\x48\x26\xb8\xcf\x10\x1b\x00\xf4\x19\x8a\x20\x60\
+\xf8\x58\x71\x3b\x82\x01\xe2\x24\x54\xce\xbe\x4b\xea\x05\x54\x81\
+\x8b\xd2\x04\x2f\x83\x2c\x9c\x33\xae\xce\x86\x57\x5b\x75\x84\xf1\
+\x33\x16\xc1\x64\x0a\xfc\x73\x16\x73\xe0\x9f\x3e\x8f\xd6\x52\x5e\
+\xdc\x02\x90\x6b\x26\x83\x80\x95\x1c\xfc\xa9\x0a\x40\xe5\xff\x05\
+\x08\x00\x16\x21\x00\xc8\x47\x00\xa0\x98\xff\x2b\x99\xf9\x8f\xc1\
+\x7f\x3d\x05\xff\xad\xb0\x6e\xe3\x36\xce\xfe\x29\xf8\x6f\xd9\x2e\
+\x7a\xff\x4c\xfc\x93\xe5\x7f\xd5\xfb\x27\x00\xf0\xd9\x97\xdf\x60\
+\xe6\xfe\x2d\x67\xff\x04\x00\xbe\xfe\x7e\x0f\x7c\x8b\x00\xe0\x5b\
+\x0c\xfe\xdf\x61\xf6\xbf\x87\x00\x80\xb4\x53\xde\x47\x15\x00\x96\
+\x52\x16\x6a\x8a\x87\x7e\xfa\x19\x83\xfe\x2f\x70\xf8\x67\x0a\xfc\
+\xd2\xd1\x90\xed\x8d\x8f\xc0\xef\x47\x8e\xb0\xdc\xf3\x89\x13\xc7\
+\x59\x86\x99\x26\x3f\x7e\xfd\xfd\x38\x2c\x5d\xbe\x0e\xda\xb4\xef\
+\x0d\xc1\x5a\x0f\xe0\xf1\x68\x00\x6d\x3e\x7f\x84\xa6\x3e\x5f\xca\
+\xe3\x59\x55\x04\x7c\x86\x1f\x80\x53\xf8\x27\x14\xc7\x64\xe6\x7c\
+\x78\xc5\x87\xa2\xf4\xff\x53\x2f\xb5\x60\x3a\xfe\x26\xf7\x3f\xd6\
+\x5c\x97\xe5\x53\xb5\xd6\x7f\x0d\x06\x00\xde\x4b\x6b\x31\xb8\xa1\
+\xe9\x9a\xbe\x78\x9c\x90\x0c\xb6\xf8\x7c\xea\xbc\xa1\xc4\xc0\xce\
+\xf8\x15\x89\x92\xf5\x01\x02\xd5\x24\x27\x4a\xec\x39\x9e\x8c\x90\
+\x21\xc0\xe5\x34\x41\xf2\x6a\x33\x1f\xcb\x61\x39\xee\x33\xbc\x4e\
+\x6c\x83\x23\x19\x30\x65\x7f\x5f\x55\x0f\x35\x08\x70\xe9\xc7\x24\
+\xd6\x91\x89\x97\x18\x5a\xe7\x2f\x0b\xf6\x27\xfa\xcd\x92\x69\xf9\
+\x04\xe3\x5c\xb7\xe0\xff\x0a\x7b\x3f\x71\x22\x6e\xfd\x1d\x00\xc0\
+\x8a\xee\xff\x07\xb2\x8a\x60\x3f\x16\x25\xbb\xeb\x56\x04\xcc\x4a\
+\x7c\x1f\x93\xfd\xaf\x4a\xfd\x06\xf3\xd7\x53\x04\xc8\x70\x98\xf5\
+\xf8\x8b\x7a\xaf\x4e\x23\x90\x54\x2d\x2c\xe1\x2c\x2d\x46\x97\x19\
+\x63\x54\x2e\x02\x26\xc9\x30\x4b\x66\x2c\x4a\xdd\x2b\xa8\x4f\x6e\
+\x51\x82\x0f\x1b\xe2\x41\x35\x65\xdf\x5d\xfc\x2d\xca\xf2\x62\xdc\
+\xaa\x6e\x83\x46\xac\xe4\x75\xe5\xb5\x37\x33\x09\xe8\x95\x96\x1d\
+\x60\x48\xde\x54\x7c\x6e\x29\xd2\x23\x95\xfa\x04\xaf\xa0\xba\x14\
+\xf1\x91\x33\xdd\xfe\x6a\x5a\xd4\xc7\x97\xe6\xe4\x56\xa4\x4a\x22\
+\xe3\xc5\xe5\x6b\xe1\xca\x81\x61\x63\x66\xb1\x8d\xf0\x55\x95\x6e\
+\x13\x1b\x58\x40\x4a\xcc\xea\xf7\x18\x91\x9b\x89\x6a\xa1\x64\xd9\
+\x1b\x98\xc9\xde\xf5\xc7\xb3\x63\x75\x01\x00\x4d\x50\x8a\x70\x06\
+\xf8\x4e\xc7\xfe\x70\xe4\xe8\x49\xcc\x5c\x37\x33\x00\xe0\xcf\x25\
+\x85\x68\x44\xf6\x97\x65\x2b\xd2\x31\x18\x50\xa5\xd1\x6a\xf0\xc4\
+\x0b\x6d\xa0\x6b\x1f\x31\x5b\x4f\x59\x3f\x31\xed\x7b\xf6\x17\xc1\
+\x9f\x17\x31\xe9\x07\xe5\x69\x20\x40\x41\xfa\x03\xcc\xe0\x9b\xb7\
+\xed\x01\xd6\xcd\x0f\xe1\x7b\xaa\x26\xc9\x58\x95\x25\x49\x52\x5d\
+\x56\xc2\xa0\x7d\x03\xd4\xac\xfb\x08\x54\xa8\x7c\x9b\x14\xbc\x11\
+\x23\x8c\x75\x1a\x34\x86\xfe\x23\x26\x21\x08\x10\xd9\x3e\x01\x01\
+\xaa\x06\xf4\x91\x7c\x00\x5e\xb8\xd1\x13\x47\xa0\xd7\x20\xb1\x88\
+\xbf\x91\x76\x65\x04\x2e\xa2\xe0\x8f\xcf\xff\x3f\x1a\x0c\x54\x61\
+\x06\x79\xdb\x0e\xfd\x30\xc8\x2f\xe7\x45\x81\x5e\x04\xfd\xe5\x2e\
+\x00\x40\x1c\x00\x0a\xfe\x2b\x30\xfb\x5f\x89\xd9\x7f\x81\xcc\xfe\
+\x0b\x61\xc9\x0a\x51\xfa\xa7\xec\x9f\x4a\xff\xab\x99\xf8\xb7\x05\
+\xd6\x52\xf0\xc7\xec\x7f\xe3\x96\x9d\x4c\xfc\xdb\xb2\x63\x17\xec\
+\xc0\xec\x7f\xa7\x24\xfe\x89\xf2\xff\x97\x5c\xfe\xff\xe4\x8b\xaf\
+\xe1\x33\x0c\xfe\x0a\x00\x7c\xf5\xed\x8f\xba\x02\x40\x2d\x80\x1f\
+\x7e\x24\x00\xb0\x5f\x03\x00\x0e\xfe\xec\xa6\x28\x82\x3f\x03\x80\
+\x9f\x7f\xb5\x2d\x8d\x7f\xc5\xe0\x4f\x96\xc6\x08\x00\x8e\x1c\x3d\
+\xca\x04\x4b\x02\x00\x27\x4e\x9e\x44\x10\x70\x92\xf5\x1f\x84\x4c\
+\xf3\x59\x6e\xbf\x7c\xf2\xf9\xb7\xd0\x1b\xc1\x55\xdd\x3b\x9f\x46\
+\x60\x2a\x0c\xa3\xc8\xf1\x90\x6c\x90\xd9\x97\xc2\xef\xb6\x15\x0f\
+\xc6\xf1\x23\x09\xb9\x84\x67\x8a\x5f\xc2\x8d\xb7\x2f\xba\x3d\x17\
+\x08\x98\x74\xce\xc5\x63\xaf\xdf\x68\x71\x7e\x64\x8a\x71\x55\xee\
+\xb9\xd3\x65\xf9\x5a\x62\xe1\xed\x35\xeb\x3e\xc9\x1a\x13\xd7\x57\
+\xaf\x27\xfb\xfa\xd5\x35\xd0\xb1\x2b\xa4\xd5\x8c\xf3\x58\xea\x32\
+\x04\xb2\x8c\x09\x08\x61\xf0\x25\xda\x72\x6a\x22\xc3\x96\x66\x56\
+\x1c\x09\xaf\x31\x81\xe3\x55\xa0\x5d\x32\xe9\x53\xfd\x21\x83\x98\
+\x1d\x5d\x65\xf0\xa6\x9b\xca\x8b\x86\x9f\x88\x29\x9d\x1c\x77\x5f\
+\xb5\x92\x9a\x59\x2f\xb6\x28\x9d\x3f\xde\xef\x67\x15\xe3\xf7\x0b\
+\xff\xcd\x36\xc4\x56\x31\xde\xdf\x85\xb6\x03\xf6\x5b\xc5\xc8\xfa\
+\xdd\xc2\x3b\xe6\x07\x89\xc4\x78\xd3\xc1\xe4\x97\x3f\x9e\x6b\x60\
+\x62\x20\xe1\x33\xef\x63\x82\x92\x40\x96\x0b\x00\x24\xf8\x81\x0d\
+\x16\xab\xd7\x25\x28\xe1\x75\x7b\xd6\x27\xf1\x59\xcc\xd2\xa4\x09\
+\x00\x7c\x7e\x5b\xda\xd3\xa3\x83\x95\xe8\xeb\xa9\x72\x9c\xea\xc1\
+\x0b\xd3\x19\xa9\x6b\x9f\x29\xc0\x80\x98\xb3\xb7\xa0\x34\x3e\xc7\
+\x80\x61\x93\xe0\x7d\xcc\x22\x69\x13\xbc\xf4\x9f\x35\x60\xfc\xb4\
+\x45\x98\x49\x74\xc5\xd7\xa8\xaa\x6d\x47\x3d\xd2\xc0\xc7\xe3\xaf\
+\x2a\xbd\xe2\xd5\x26\x52\x45\xdc\x26\x03\x2a\xbd\x36\x33\xfb\x65\
+\xc9\xf5\xe2\xcc\x1b\xa1\x34\x66\xe1\x7d\x86\x4e\x82\x85\x2b\x37\
+\xb0\xa2\x9c\x68\x47\x28\x93\x1a\x45\x20\xca\xd6\x2a\x7e\x76\x6f\
+\xb2\xba\x0d\x02\xd2\x0d\x96\x70\x12\x56\xaf\xa9\x86\xba\x1b\x8d\
+\x17\xd6\xad\xff\x0c\x1c\x3d\x7a\x1a\xe6\x2c\x2c\xe0\x59\x7e\x22\
+\xf9\x09\x23\xa2\x2c\x47\xf6\x9f\xea\x12\xfc\xa0\x80\xe0\xbf\x32\
+\x9b\x47\x02\x7b\xf4\x17\xf3\xf2\xbd\x06\xca\xc5\x00\xc0\x9e\xbd\
+\xa7\xeb\x74\xbb\xaa\x06\xf4\x1a\x2c\x24\x7d\xdf\xe9\x36\x10\xee\
+\x7a\xb8\x09\x94\xff\x57\x4d\x48\x49\xab\x88\x19\x91\x00\x01\xe2\
+\xbb\xab\x86\xef\x51\x88\xe1\x78\x32\xa5\x23\xa1\x9c\x8a\xa0\x11\
+\xa6\xfe\x23\x27\x32\x53\x9f\x88\x7b\x8a\x03\x40\xc1\x9f\x66\xf6\
+\x7b\x9b\x7a\x01\x83\xc4\xea\xdc\x67\x24\xd4\xbb\xb7\x31\xff\x26\
+\x17\xe1\x67\x54\xfa\xfe\x29\x78\xcc\x52\x1f\xb6\x52\xa4\x21\xb4\
+\xef\x32\x80\x33\xca\x59\x18\xec\x67\xcb\xb2\xff\x0c\x04\x81\x33\
+\x16\x28\x02\xe0\x0a\x98\x83\xc1\x9f\x7a\xff\x0b\x96\x60\xf6\xbf\
+\x6c\x35\x06\x7f\xca\xfe\xd7\xc2\x72\x04\x00\x05\x3c\xf6\xb7\x11\
+\x83\xff\x66\x0c\xfe\x5b\x39\xf8\x6f\xda\xb2\x53\x66\xff\xbb\x60\
+\xeb\x4e\xd1\xfb\xdf\xb9\xcb\xc8\xfe\x1d\xe5\xff\x18\x15\x80\x1f\
+\xf6\x72\xf0\xff\x71\xcf\x3e\xae\x00\x68\x17\xc5\x03\xa2\xfc\xaf\
+\x00\xc0\x4f\x94\xfd\x1f\xfe\xc5\x01\x00\x28\xf8\xff\xfe\xfb\x51\
+\xf6\x5d\x38\x76\xfc\x18\x1c\x3f\x7e\x9c\xd7\x89\x93\x27\xd8\x09\
+\x92\xe4\x9a\x4f\x9d\x26\xc9\xe6\x93\x7c\x79\xe2\x14\xad\x33\xf0\
+\xfd\x0f\x87\x60\xf0\xf0\xc9\x70\xeb\x5d\xcf\xe0\x6f\x4e\xc7\x74\
+\x65\x9e\x30\xf0\xaa\xd2\x78\x42\xc2\x9f\x75\xde\x37\x7a\xad\x6a\
+\xe8\x32\x34\xa2\xff\x0b\xd7\x79\x98\x89\xb4\xf7\x3d\xde\x5c\x02\
+\xdb\x5a\xbc\x74\xf0\x2f\x2f\x34\x43\xa8\x75\xd7\x13\x8f\x55\x1a\
+\xe7\xcd\x20\x93\x1f\x06\xe7\x59\xce\x40\xcc\xfb\x84\x94\xe3\xf6\
+\x4b\x51\x26\xa9\xfe\xc9\xea\x94\x52\x23\xc3\x6b\x3a\xf9\x49\x59\
+\x66\x5f\xc0\x72\xd8\x40\x3b\xf7\xc5\x2c\xbd\x87\x2a\xee\x82\x5e\
+\xe5\xcc\x76\xa5\x22\x47\x47\x0c\xd1\x2f\x05\x02\x9c\xb6\xc9\x45\
+\xb7\x8c\x83\x09\xa6\xc6\x8a\xfb\xfd\x1b\x7c\xb2\x12\x07\xe2\xf0\
+\x05\xcc\xfa\xad\x22\x5c\x5f\xff\xab\x1c\x00\x2b\x89\x37\x6c\x25\
+\x60\xd5\x87\x8b\x28\x4b\x58\x71\xec\x79\x93\xec\xd5\xc7\xfb\x7f\
+\x93\xe8\xc7\x28\xd8\x7d\x7b\x56\x14\x00\x88\x96\x6b\x8c\xf5\xbe\
+\x42\x86\x9f\xb8\x93\x51\xea\x4b\xd2\xce\x38\xa6\x4a\x61\x0c\x30\
+\xa4\x7b\xf3\xe9\x42\x5d\xaf\x4c\xf9\x10\x04\xae\xaa\x09\x81\x0a\
+\x35\x21\x1d\x57\x46\x85\xda\x90\x71\xcd\x8d\x90\xf1\xcf\xda\x10\
+\xb8\xa6\x36\xa4\x5f\x7d\x23\x94\xbb\xb2\x06\x94\xbd\x32\x0c\x65\
+\x2f\x0f\x41\xd5\x9c\xbb\x60\xe2\xac\xc5\x2c\x3d\x5b\xbd\xe6\x3d\
+\x10\xaa\xd5\x50\xfc\x3d\x60\x0c\x54\xb2\xee\xc2\x0c\x3e\xc8\xeb\
+\x92\x4b\x2d\x28\x73\x99\x58\x97\x94\xcf\x82\x8b\xf1\xef\x8b\x2f\
+\x15\xff\x47\xd7\xc9\x8c\xa6\xec\xa5\xd9\x50\xee\xb2\x1c\x7e\x7e\
+\xff\xd5\xb5\xf0\xf5\x6f\x84\xb4\xab\x6b\xb2\x89\xcd\xfc\x65\xeb\
+\x20\x7c\xf3\x83\xac\x0c\x58\xba\xbc\xc5\xdc\x80\x8b\xe5\xa2\xdb\
+\x28\x10\x6a\x3d\x72\x2e\xcb\x56\x95\x3a\x0e\x41\x63\x56\x36\x24\
+\x4a\x94\x46\xa6\x1f\x5b\xd5\xcd\xa9\xa1\x7e\x09\x3e\xff\xbe\x83\
+\xbf\xc3\xd4\x99\xf9\x3c\x76\xa7\x9d\x08\xfd\x59\xce\x89\x03\xbf\
+\xa8\xd2\x78\x03\xea\x52\xfc\x16\xb7\xdc\xfd\x1c\x66\xe3\x93\x44\
+\x70\xe7\x4c\x5f\x01\x81\x3c\xa9\xc2\x87\xab\xbf\x3d\x57\xaf\x16\
+\xb5\x09\xa8\x6a\x40\xfc\x01\xca\xe0\x9a\xbe\xd9\x05\x6e\xba\xfd\
+\x09\x48\x23\x09\x5d\xfc\x7c\x3e\x69\x28\x93\xaa\x26\x18\x94\xfd\
+\x2a\x6e\x8a\xa4\xa8\x36\x72\xd2\x3c\x18\x39\x71\x36\x0c\x18\x39\
+\x89\xab\x00\xb9\x43\x45\x05\x80\xc6\x03\x69\xe4\xaf\x87\x7c\x0d\
+\xaa\x04\x0c\xc8\x9b\x0c\x23\x26\xcd\xe6\x72\x3f\x29\xf8\xd5\xba\
+\xfd\x51\x59\xa5\x09\xf2\xe8\xa5\x90\x74\x16\x95\x96\x7f\x65\xdd\
+\x09\x2d\xda\xf6\x80\xa9\x73\x97\x71\xe0\x9f\xbe\x40\x72\x00\x68\
+\x0a\x60\x31\xf5\xfe\xd5\xe8\xdf\x6a\x9e\xfd\x5f\x82\xc1\x7f\xe9\
+\xaa\x75\x72\xec\x6f\x13\x66\xff\x9b\x60\x0d\x65\xff\x9b\xb6\xc1\
+\x06\x2e\xfd\xef\x64\xe2\xdf\x56\xcc\xfe\xb7\x7d\x28\x98\xff\xd4\
+\xfb\xff\xf0\xd3\xdd\x46\xf9\xff\x6b\x1e\xff\xe3\x0a\xc0\xd7\x08\
+\x00\xbe\x95\x04\x40\x02\x00\x4c\xfe\xc3\xe0\xbf\x17\x83\x3f\x66\
+\xff\xfb\xf6\x1f\x70\x94\xfe\x05\x00\x90\xc1\x9f\x2a\x00\xbf\xfe\
+\x2e\xb3\xff\x23\x08\x00\x8e\xc2\xef\x47\x8e\xc2\x91\x23\x54\x01\
+\x38\xca\x20\xe0\x18\x01\x80\x13\xc7\x30\xd0\x9f\x44\x10\x20\x00\
+\x00\x01\x81\x93\xa4\x05\xc1\xb7\x89\xdb\x4f\x22\x28\x20\x82\xe8\
+\x17\x5f\xef\x81\xce\x3d\x87\x40\xe5\xd0\x1d\x5c\x09\x13\xed\x18\
+\xd3\x95\xd0\x8a\xd3\xba\x74\x39\xc5\x25\xa9\xa4\xe6\x75\x38\x07\
+\xaa\xc7\x06\x5d\x92\xc4\x61\x5d\x19\xa3\xf3\xfa\xd9\x57\xda\xc1\
+\x82\xe5\x1b\xe1\xcd\x77\xfb\xb0\x45\xb4\x1f\xcf\xab\x72\x57\xd6\
+\x84\xb2\x57\xe0\xba\x3c\x1b\x2e\xb9\x2c\xc2\xc2\x57\x57\x5d\x7f\
+\x23\x1e\x33\x73\x20\x6f\xe2\x02\xb8\xe9\x8e\x27\x21\xe3\xea\x1a\
+\xbc\x17\x64\x5e\x53\x0b\x32\x2b\xd4\x82\x00\x3e\xce\x8f\xe0\xc0\
+\x7f\x45\x18\xc1\x6d\x04\xf7\x83\x1c\xbc\xad\x96\xdc\x23\x6e\x84\
+\xcc\x7f\xe1\xfa\x67\x2d\xbe\x9e\x71\x8d\xb8\x9d\x1e\x1f\xa8\x50\
+\x03\xef\x8b\xeb\xaa\x1c\x7e\xbc\xb8\xcc\xc6\xe7\xc8\x81\x34\xbe\
+\xcc\xc6\xcb\x1c\xfe\xdb\x8f\xe7\x3f\x39\x7c\xa6\x5d\x81\xb7\x5f\
+\x51\x43\x5e\x8a\xdb\xd3\xaf\x12\xcf\x55\x1e\xf7\x23\x12\xff\xa2\
+\x0a\xa1\x98\x64\xc9\x76\x54\x14\xe2\x32\xe6\x63\x01\xb2\x80\x51\
+\x9d\xb8\x20\xd9\x74\x3c\x00\x18\x6f\xb4\xef\xfc\x07\x7f\x8f\xbf\
+\x64\xba\xfd\x25\xb7\x50\x2e\x11\x00\x08\xc7\xf8\xb1\x12\xa1\xb8\
+\x58\xa2\x09\x61\x97\xc3\x5d\xd0\x16\xda\x49\x8f\x67\xcc\x61\x25\
+\xe8\xd7\x58\x45\xb4\x04\x12\xc9\x02\x67\xe9\x96\x80\xed\x1c\x18\
+\x8c\xf3\xdc\x09\x84\x82\xe2\x92\x0a\xad\x04\xbe\x02\xd1\x19\x88\
+\xc3\x3e\xd2\x24\x26\x49\xb9\x5f\x0a\xa0\x4f\xbd\xd8\x96\x25\x39\
+\x49\x7e\x77\x56\x7e\x21\xcc\xc9\x5f\x0b\x73\x97\xac\x63\x3b\xde\
+\xd9\xb8\x66\xe0\xed\xd3\x16\xad\x82\xc9\xf3\x57\xc2\xd4\x79\xb8\
+\xe6\xaf\xc2\x85\x19\xe0\xa2\x02\x98\x81\x19\xf2\xa4\xd9\x4b\x61\
+\xd2\xdc\xa5\xac\xee\x45\xec\xfd\x19\x8b\x56\xf3\x63\x66\x19\x6b\
+\xe6\xc2\x55\xb8\xf0\xff\xf0\x92\xd6\x74\x7c\xbd\x19\x8b\xf0\xff\
+\x16\xad\xc5\xec\x71\x3d\xbe\xd6\x06\x98\xbf\x7c\x13\x2c\x58\xb9\
+\x19\xe6\x2d\xdf\x80\xd9\xcb\x1a\x56\x1d\xa3\xe7\x9e\x38\x63\x19\
+\x5e\x2e\x83\xc9\x73\x56\xf0\x9a\x34\x6b\x29\x8c\x9f\x9e\x0f\x79\
+\x93\xe7\x43\xcf\xc1\x13\xe0\xa9\x97\xda\xe2\xe6\x53\x53\xf4\x31\
+\x65\x55\xc3\x74\x4b\xf3\x66\x3a\x83\x7f\x5c\x87\x38\xb3\xaf\x88\
+\xcf\x31\x7b\x7e\x01\x4c\x98\xb6\x50\xa8\xf8\xc9\xb9\x71\x55\xd1\
+\x71\x02\x00\xa7\xa8\x10\x4b\x24\x67\x04\xb9\xd7\x4e\x8c\xfa\x3e\
+\x43\xc7\x70\x86\xdf\x73\xd0\x28\x57\xb0\x17\x2d\x02\xd1\x26\xb0\
+\x03\x3f\x07\xff\xfe\x79\xfa\xff\x68\xa2\xa0\x3b\xae\x26\xaf\x77\
+\x84\x9b\xee\x7c\x1a\x37\xd8\xda\xc2\x71\x52\x9b\x12\xe5\xf0\x98\
+\x26\x49\xae\xd6\xbb\xff\x65\x98\x34\x73\x09\xfe\x16\x05\x30\x71\
+\x76\x3e\x8c\x9a\x3c\x17\x46\x4c\x9c\x09\xc3\x27\xcc\xe0\xcb\xbc\
+\x29\x73\x60\xfc\xcc\x85\x30\x79\x6e\x3e\x4c\x99\xb7\x04\xa6\xcc\
+\x97\x0b\xaf\x4f\x9b\xbf\x9c\xb9\x0b\xc1\x5a\xf7\x89\x63\x24\x43\
+\x8c\x97\x7a\x59\xdb\x3d\x9b\xb3\xba\xf2\xd7\xde\x04\xcf\xe0\xf7\
+\x3d\x7a\xf2\x02\x3c\x66\x0a\x04\xf3\x9f\x7a\xff\xf9\xab\x60\x01\
+\xfe\x5e\x8b\x68\xf6\x1f\xb3\xff\x65\x92\xf8\x47\xc1\x9f\x45\x7f\
+\xd6\xcb\xec\x9f\xc6\xfe\xb6\xa8\xb1\xbf\x8f\x98\xfc\xb7\x8d\xc8\
+\x7f\x08\x00\x3e\xd2\xe4\x3f\x04\x00\xbb\x65\xf9\x5f\x66\xff\x82\
+\x00\xf8\x9d\x5d\xfe\x27\x00\xf0\xe3\x5e\x04\x00\x07\x31\xf8\x1f\
+\xe4\xb2\xbf\xd9\xf7\x17\xc1\xff\x57\xee\xfb\x93\xa1\xd2\xcf\xbf\
+\xfe\x2a\x00\x00\x06\x7f\x1a\xa9\x3c\x72\xe4\x38\x1c\x39\x7a\x84\
+\x5b\x00\x47\x19\x00\x1c\x85\xe3\xd4\x0a\x38\x71\x82\xf9\x00\x1c\
+\xec\x29\xe8\xe3\xf5\x13\xbc\x4e\xf2\x58\xe8\xf1\xd3\xa7\xe1\xe8\
+\xc9\xd3\x70\xf8\xb7\xe3\xb0\xfb\x9b\x7d\xb0\x7e\xeb\x27\xd0\xad\
+\xef\x68\xb8\xa2\xe2\xad\x92\x9f\x13\x91\x1c\x9d\xa0\xc3\x80\x28\
+\x71\x3f\xda\x4a\x42\xea\x3c\x1c\x47\xf0\xcc\x72\x8d\xb4\x86\x35\
+\x21\x98\xde\x43\xc3\x47\x5e\x81\x29\x78\xce\x2c\x59\xbd\x05\xcf\
+\xaf\x8d\x7c\x3e\xcf\x5c\xbc\x06\xcf\x3f\x3c\xa7\x17\xac\xe2\x35\
+\x95\xce\x6b\x3c\x9f\xa9\x62\xb0\x60\xc5\x06\x58\xb8\x02\xcf\x43\
+\x5c\x0b\x57\x8a\x45\x64\xdc\x79\x4b\xd6\xe3\xf9\x28\xc4\x82\xe6\
+\x2d\x5d\x0f\x0b\x96\x6d\x84\x85\xf8\x7c\x24\x08\xb6\x70\xe5\x46\
+\x98\x4f\xf7\xc1\xf3\x76\xde\xb2\xf5\xac\xe1\x41\xcf\x25\xf6\x90\
+\xb5\xbc\x66\xf3\xa5\xb8\x6d\x6e\xfe\x3a\xfe\x5b\xdd\x87\x9e\x9b\
+\x9e\x93\xd6\xdc\x25\xc6\xe3\xf2\xd7\xea\xbd\x88\x7c\x3f\x16\xe2\
+\xfe\xb0\x78\xe5\x16\xb8\x21\x74\x8f\xae\x4a\xa6\xba\x44\xbd\x62\
+\x57\x9a\x83\x31\x2a\xab\x21\x99\xbc\x59\xc5\x10\x91\x33\xa7\x8d\
+\x4a\x02\x10\xac\xbf\xcc\x37\x38\x7f\x44\xbf\x0b\x45\x1c\x2c\x31\
+\x07\xc0\x2a\x46\x75\xc0\x4a\xa0\x0f\xe0\x76\xd7\x8b\x17\x48\xc3\
+\x09\xd4\xfa\x4a\x50\x1d\x88\xa5\x0a\x68\x6a\x71\x27\x60\x73\x9a\
+\x66\x42\xd1\x3f\x4c\x02\x32\x63\xc0\x29\x54\xe4\x04\x0d\xb1\x0e\
+\xec\x90\x43\x03\x81\xb3\x64\xcc\x5c\xae\xae\x74\x2b\xf7\x95\x6b\
+\xde\xfa\x28\xd4\xba\xed\x09\xb8\xb1\xde\x53\x50\xfb\x8e\x67\x30\
+\x1b\x78\x1a\x6a\xd7\x7f\x0a\x6a\x61\x56\x50\x0b\xb3\xd0\x9a\xb7\
+\x3f\xce\x8e\x73\xb5\xea\xd1\x7d\x1e\x87\x1b\xef\xc0\xcb\xdb\xe5\
+\xc2\xfb\xdc\x5c\xff\x69\xa8\x83\x01\xaa\x6e\x83\x67\xe1\xd6\x86\
+\x8d\xe1\xd6\xbb\x1b\x8b\xcb\x06\x8d\xe1\x96\xbb\x9e\xc3\xdb\x1b\
+\xcb\xff\x7b\x0e\x6e\xbb\xfb\x79\xa8\x77\xf7\x8b\x70\xc7\xbd\x2f\
+\x42\x7d\x0c\x5a\xf5\x1f\x78\x05\xee\xc4\x75\xd7\x43\x78\xf9\x60\
+\x13\x68\xd7\xb1\x1f\x67\x9a\xad\xdf\xcd\x85\x86\x78\xdb\xbd\x8f\
+\xbd\x0a\x4f\xbe\xd0\x1a\xfa\x0e\x9f\xc4\x40\xa3\x73\xee\x30\xb8\
+\xe7\x91\x97\xe0\xd5\x56\x9d\x20\x6f\xd2\x02\x18\x3d\x65\x11\xdc\
+\x88\xef\xd5\x23\x7b\x97\x26\xdb\x5f\x5b\xc4\x46\x49\xb5\x26\xd0\
+\x81\xc7\xdf\xa1\x45\xab\x2e\x30\x76\xca\x02\x31\x37\xae\x0d\x6c\
+\x8c\x8d\x40\x32\xaf\x53\x03\x96\xa3\x0f\x9b\x2a\x45\x94\xae\xaa\
+\x5c\x17\xc6\x4c\x5d\xc0\x3d\xf9\x5c\x25\xbf\x3b\x70\x94\x0e\xfe\
+\x0a\x00\x74\x63\xa1\x9d\x91\xc6\xca\x73\x00\x03\x1a\x1d\xe4\xac\
+\x7d\xd0\x18\xc1\x17\x18\x32\x01\x5a\x61\x56\xd7\xf0\xb1\xa6\x70\
+\x7d\xb0\x01\x4f\x4f\xf8\xa4\xf9\x12\xc9\xfe\x92\xbc\xf2\x98\xa9\
+\xf3\x71\x53\x5f\x0e\x53\x10\x98\x4d\x9e\x93\x8f\x6b\x31\x4c\x52\
+\x6b\xee\x62\x04\x00\x8b\x11\xcc\x51\xd0\x5f\x8a\xf7\x5b\x82\x6b\
+\x29\x7e\xdf\xcb\xf0\xbb\x5d\x81\x9b\x6f\x21\x57\x1f\x6a\xdc\xfa\
+\x38\x93\x23\x99\x34\x96\x29\x2d\x5e\x69\x5c\x2b\xad\x0a\x82\x9e\
+\x6a\x70\x5b\x83\x46\xd0\xed\x83\x91\x30\x67\x21\x29\x00\xae\x86\
+\x05\x4b\x88\xf8\x57\x88\xd9\xff\x1a\xc9\xfa\x97\xc1\x9f\x58\xff\
+\xeb\xb7\xc0\x3a\xcc\xfe\xd7\x6f\xd9\x21\x15\xff\x3e\x82\xcd\x3c\
+\xf7\x2f\x2a\x00\x3b\x76\x99\xb3\xff\x5f\xc8\xf2\xbf\x00\x00\x1c\
+\xfc\xbf\xfe\x1e\xbe\x66\x11\xa0\x1f\xe1\x3b\x39\x01\xb0\x67\xcf\
+\x3e\x49\xfc\x13\xe5\x7f\x95\xf9\xff\xa4\xfb\xfe\xbf\x72\xf0\x27\
+\xc6\xbf\xea\xfb\x73\xf0\x3f\x7a\x02\x7e\x3f\x7a\x4c\x73\x00\x8e\
+\xe0\x75\x22\x7c\x1e\x3b\x71\x9c\x49\x81\xc7\x4f\x9c\x60\x19\xe8\
+\x63\xc7\x4f\xc3\xb7\x3f\xec\x87\x45\x4b\x56\xf1\x94\x40\xe3\x97\
+\xdb\xc2\xcd\x78\x0e\x54\xb8\xa1\x36\x94\x0e\x54\x81\xff\x29\x73\
+\x3d\x2f\x16\xbe\xd2\x25\xea\x6c\x69\x7f\x1c\x3f\xc0\x44\xef\x5b\
+\x49\xb8\xb4\x19\x09\x8e\xcf\x35\xda\x66\x1a\x00\x99\xc9\x90\x22\
+\xda\x5d\x5c\xde\x82\xac\x5a\xf7\xe2\xf9\xd8\x08\xea\xdd\xf3\x1c\
+\xd4\x6b\xf8\x1c\x9f\x87\xb7\xdc\xf5\x34\x2e\xbc\x6c\xf0\x0c\xae\
+\x67\xa1\x2e\x9e\xaf\xf5\xee\xc1\xf3\xf2\x9e\x17\xa0\xde\xbd\xb4\
+\x5e\xe2\xf3\xf4\x96\x86\x8d\xf0\x3c\xeb\x8c\x81\xb8\x10\x3a\xf4\
+\x1c\x0c\x75\xe8\xb1\x74\x4e\x37\x7c\x1e\xea\xd2\xc2\xe7\xac\x8b\
+\xcf\x49\xb7\xdf\x7c\x27\xee\x1b\x78\x1e\xd2\xaa\x5d\xff\x49\xbc\
+\x7c\x5a\xfe\xfd\x34\xaf\x9b\xe5\xbe\x72\xd3\xed\xb4\xc7\x3c\xc5\
+\xfb\x4b\x6d\xf5\x7f\xf8\xd8\x9b\xeb\x8b\x75\x13\x5d\xc7\xfb\xd6\
+\xb9\x43\xfc\x5d\xe7\x8e\x67\x71\x35\xc2\xeb\xcf\x82\xff\xaa\x9b\
+\x34\x07\xc0\xe7\x32\x95\x73\x3a\xaf\x1a\xfb\xb5\xdf\x3d\xb6\x67\
+\xb9\xf4\x64\x2e\x5c\xbf\xdd\x69\xdd\x7b\x21\x08\x79\xa1\x0b\xfc\
+\xfc\x7f\x0b\x00\x28\xea\x45\xad\x24\xc0\x40\x30\x81\x50\x50\xbc\
+\x16\x82\x95\x5c\xe9\xbf\xa8\x2a\x80\x3f\x36\xf9\x2f\xda\x1a\x34\
+\xde\xc8\x62\x96\x51\x8e\x32\xc7\x4c\x62\x95\xf5\x63\x2b\x15\xc6\
+\xfe\xbf\xb0\x44\xc1\x59\x4e\xad\x02\x37\x48\xd1\x4c\xdf\x90\xb6\
+\xf6\xf5\xc9\x31\x3b\x85\xa2\xd5\x2c\xb0\x52\xce\x22\x32\x90\x22\
+\xf5\x79\xfd\x76\x1f\xd4\xc3\x3d\x40\x43\x3a\x37\x23\xdb\xee\xd9\
+\x65\x48\xa7\x40\x79\xa9\xc8\x49\x1e\x19\x60\x98\x4c\x84\xef\xb9\
+\xc1\x03\x2f\x73\xf0\x7a\xec\xb9\x56\xd2\xe7\x5e\x1a\x18\x95\xab\
+\x02\x0f\x3e\xd5\x9c\xab\x10\x0d\x1e\x7c\x09\x2e\xba\xf8\x06\x9e\
+\xd3\x6f\xf5\xce\x07\x18\xe4\x96\xf1\x0c\xbf\xd8\x0c\xed\x19\x7f\
+\x6f\x5c\x37\xb7\x04\xdc\x00\xfc\xcc\x15\xb3\xee\x64\x7e\x43\x8a\
+\xbf\x0a\x97\x54\x4d\x11\x0d\x5f\x7a\xb4\x17\x7c\x6a\x86\x3d\xa9\
+\x21\x48\x8d\xf8\x39\x1e\x7d\x15\xc6\xcd\x58\xc4\x00\x80\xdc\xf8\
+\x84\xfc\x2e\x06\x75\x23\xe0\xf3\x98\x20\x69\xf1\xbb\x82\xbf\x0d\
+\x00\x30\xf8\x0f\x14\x16\xbe\xcc\xe8\x97\x23\x7d\xd4\xef\x1f\x34\
+\x6a\x1a\x3e\xd7\x58\x78\xb1\x39\x55\x07\x9e\x85\xf2\xff\xba\x99\
+\xdb\x25\x6f\x75\x1c\x00\xa3\xa7\xce\xc3\xef\x64\x09\x06\xfb\x25\
+\x0c\x00\x28\xeb\x57\x97\x53\xf0\x36\xf2\x5a\x20\x00\x40\x6b\xba\
+\x1c\xe7\x23\x26\x3f\xcb\xf9\x12\x91\x6f\xc5\x5a\x18\x94\x37\x03\
+\x6e\x47\x80\x56\xfa\x52\x69\xd5\x9c\xae\xfa\xc1\x55\xf9\xb7\xb8\
+\xa8\x4c\x45\xb8\xe2\xba\x9b\xe0\xf1\xc6\xad\x60\xe8\xd8\x99\x6c\
+\xfa\xb3\x62\xd5\x46\x28\x28\xdc\x8c\xc1\x7f\x33\xac\x26\xd6\xff\
+\x46\x19\xfc\x37\xef\x10\xa2\x3f\x12\x00\x10\xf9\x8f\xfa\xff\x5c\
+\x01\xd8\xf5\xa9\x06\x00\xbb\x0c\xf6\x3f\x2d\xea\xfd\x8b\xf2\xff\
+\x1e\x49\xfe\xdb\x03\xdf\x53\xf6\xcf\xbd\x7f\x27\x00\x50\xac\x7f\
+\x4d\xf8\xc3\x8c\x9f\x19\xff\xbf\x1f\x83\xdf\x8f\x50\xb0\x3f\x8e\
+\xc1\x1e\x17\x06\x7a\xba\xa4\xbf\x09\x0c\xfc\x7e\xe4\x04\xec\xd9\
+\x77\x98\x2b\x18\x1d\xba\x0e\x80\x7b\x1f\x79\x19\x2a\x54\xba\x19\
+\x4a\x95\x23\xd9\xe5\x4a\x6c\x4a\xc5\xa3\x97\x92\x8c\x49\x4b\x9b\
+\xe1\x90\x61\x0d\x8b\xd9\x44\xc4\x84\x8a\xd6\x0c\x28\x6a\xa4\x2b\
+\x19\x4e\x80\x93\x29\xee\x49\x0f\xc6\xd4\x96\x77\x57\x01\xec\x7d\
+\x21\xe4\x20\x3b\xfb\xca\x65\x69\x73\x2e\x61\xb1\x9d\x25\xce\x5d\
+\x66\xf3\x4b\x4b\x6f\x43\xac\xc7\x27\x45\x7d\x1e\x7f\xe1\x2d\xf6\
+\xe7\x78\xe2\xf9\xb7\xd8\x39\x90\xc1\xa6\x16\xf6\xc9\xd6\xa3\xc9\
+\x6c\x3d\xec\xcf\x72\x55\x3f\x4d\xe3\x1d\x69\xbe\x43\xf7\xd3\x1e\
+\x2e\xb6\x92\x9f\xbd\x42\x92\x63\x23\xf9\x39\x19\xd9\x36\xf7\x27\
+\xc3\x56\xe4\x4c\x8e\xa5\x2e\x89\xc1\xb1\x80\xc1\xdf\xd6\x07\x37\
+\xe3\x40\x18\xfe\x6f\xb0\xfc\x2d\x97\xc3\x6e\xa8\x08\xc0\x5a\x42\
+\x17\x4b\x7f\x94\x14\xb0\x15\x23\x00\x27\x8b\x3a\xa2\x7b\x2b\xa6\
+\xc3\x53\xd1\xea\x7b\xf1\x78\x06\x56\x92\x65\xfe\x38\x40\xc0\x1f\
+\xc7\x2b\xc0\x1f\xcb\x40\x28\x1e\xc7\x21\x56\xdf\xc8\x20\x1c\x9a\
+\xa3\x75\x51\xc1\x3e\x16\xf7\x20\x68\x8c\x02\x3a\xab\x03\x5a\xf0\
+\x43\xfb\x66\xab\x99\x55\x25\x72\x11\x36\xe4\x84\x43\x9a\x68\xe7\
+\x31\xfc\x0b\x7c\x6a\xd6\x5f\x1b\x25\x89\xdf\x55\x39\x83\x71\x90\
+\x57\x26\x3d\x4a\x26\x94\xdd\xc1\x44\x46\xc9\xe5\x65\x25\xb0\xa3\
+\x36\xae\x80\xd0\x67\x88\xdc\xfc\x10\x97\xb0\x49\xd1\x4c\xd9\xda\
+\x72\x79\x9f\x1d\xcb\x10\x04\x3c\xfd\x3a\x4c\x9e\xb7\x12\xae\xaa\
+\x58\x87\xdf\x43\x6a\x66\x16\x74\xe9\x3d\x02\x46\x4d\x98\x0b\x65\
+\x2e\x13\x65\xf1\x78\x3d\x7f\xa7\xa9\x4b\x28\xf6\x48\x11\xf5\xc1\
+\xf1\x75\x3a\xf5\x18\xce\x7d\x71\xc1\xfe\x77\xb9\xaf\x29\x37\x46\
+\xa3\xf4\xaf\xb2\xbf\x54\x65\x4b\x8b\xc1\xf8\xed\x2e\xfd\x61\xe4\
+\xa4\xd9\xa2\x0d\xa0\xf4\xf7\xa5\x3e\x80\xd0\x08\x18\x21\xab\x00\
+\x23\x74\x05\xa0\x9b\x01\x00\xe8\x31\xe4\xe0\x47\x00\x40\x29\xfc\
+\x11\x08\x20\x00\x30\x80\x56\xde\x64\x04\x02\xb4\xa6\xc0\xc0\xbc\
+\x69\xd0\xbe\xdb\x20\x68\xda\xba\x33\xfe\xff\x24\x98\x40\xe5\x7e\
+\x0a\xfa\xf3\xa8\xe4\x9f\xaf\x4b\xff\x53\xe7\x2d\xe3\x35\x7d\xfe\
+\x32\x0e\xfe\xd4\xcf\x17\xa3\x7c\x42\xd3\x7f\x1e\x66\xbd\x0b\x30\
+\x18\x2e\x58\xb6\x06\x16\x2e\x5f\x03\x79\x13\xe7\xc1\x43\xcf\xbc\
+\x06\x69\x57\x86\x05\x21\x51\x4e\x29\x5c\x24\xa5\x61\x3d\x65\xc5\
+\xef\x52\x39\xdc\x10\x5e\x7d\xa3\x33\x4c\x45\x30\xb6\x9a\xa4\x7e\
+\x37\x6e\x83\x75\x9b\x55\xe6\xbf\x93\xd7\x66\x06\x00\xbb\x6c\x00\
+\xf0\xd1\x27\xb0\x7d\xd7\xa7\x92\x03\x40\x00\xe0\x0b\xc7\xf8\xdf\
+\x97\x52\xfc\x47\x31\xff\x69\xf6\xff\x87\x3d\x7b\x25\xf3\x7f\x3f\
+\xec\x97\x00\x80\xe6\xfe\x15\xf1\x4f\x04\x7f\xca\xf8\x8f\x70\xe0\
+\xe7\xa0\x7f\x8c\xc8\x7e\x27\xb8\xaf\x7f\xec\xc4\x29\xf8\xe2\xeb\
+\x1f\x61\xec\xa4\x39\xd0\xa4\xc5\x3b\x60\xd5\xbc\x07\x52\xfd\x95\
+\xe0\xa2\x4b\xae\x67\x85\x45\x96\xab\x46\xe0\x47\x24\xb9\x8b\xd2\
+\xa4\xb4\x35\x7f\x56\xf1\xb9\x3d\x65\x2b\x0b\x00\xc0\xa4\xb8\x90\
+\xb0\xd4\xcd\x94\x8e\x78\xca\x30\xca\xa8\x36\x15\x5d\x51\x0c\x15\
+\x51\x29\x30\x49\xc3\x96\x6b\xfe\xdb\x72\x09\xf1\xb8\xda\x05\x4a\
+\x45\x4f\x0b\x80\x55\x97\x95\xb2\x6a\xce\x2a\xa5\x22\xd9\x06\x72\
+\xe4\xf5\x88\x0c\xf0\x35\xa0\x45\x9b\x1e\x30\x7f\xd9\x5a\xb8\xf3\
+\xa1\x97\xa5\x72\x5f\xc4\xb8\x8f\x91\x28\x04\xac\x68\x23\x1c\x35\
+\x1f\x1f\x37\xc8\x58\x06\x93\x3f\x6c\x57\x3c\xa2\xe4\x8e\x23\xb6\
+\xf6\x47\x20\xba\x0a\x12\x3f\x4e\x04\x5d\xfb\x5f\x50\x03\x8f\x92\
+\xfa\x31\x14\xbf\x6a\xfd\x7f\x6d\xcc\x2f\xfe\x77\x15\xbb\x2a\x65\
+\x15\xc1\xbf\x8b\x7f\xdc\xba\x00\x80\x15\x87\x95\x19\x7b\xd6\x33\
+\x76\xcf\xc2\x19\xe0\x4d\xf5\xaa\xb8\x19\xb2\xab\x32\xe0\xec\x8d\
+\x17\xc1\xac\x0f\x58\x71\x78\x08\xae\x2f\x2d\x90\x65\xcc\xa1\x67\
+\x19\xc2\x34\x59\x31\x74\xa1\xdd\xda\xd4\x41\xad\xff\xac\x58\xf9\
+\x6c\x65\xa9\xc7\x0d\xad\x18\x19\xbf\x8b\x78\x18\x48\x04\x02\xb2\
+\x62\x00\x98\xac\x18\x07\xa3\x59\x4e\x0b\xb9\x36\x30\xe5\x3d\x60\
+\xbf\x27\x5b\x8b\x20\xcb\x2e\x77\xa9\x95\x19\x71\x08\xee\xf8\xf4\
+\xa8\x50\xb6\xd6\xa4\xb7\x03\x7f\x44\x18\xf7\x04\xc4\x66\x45\xda\
+\xfa\x13\x67\x2f\x81\xce\xb9\xc3\xd9\x4b\x40\x33\xfd\x25\x71\x91\
+\x6c\x61\x87\x8c\x9b\x05\x2f\xb6\xec\x20\x18\xc7\xf8\x5a\x24\xb3\
+\xbb\x70\xf9\x3a\xb8\xed\xde\xe7\xa5\xe4\x69\x8e\x43\xdb\x3d\x35\
+\x26\x08\xb0\xa2\x8c\x84\x6c\xbd\xed\x2c\xa8\x7b\x57\x63\xde\x2c\
+\x13\x8d\x0e\x0a\x32\x9e\x18\x7b\x12\x9f\xd3\x12\x3e\xf4\x19\x82\
+\x25\x9d\xf1\xaf\x5a\xf8\x5e\x67\xc2\xb0\x71\x33\x98\x07\xd0\x6d\
+\x80\xea\xf5\xdb\x99\x7f\x37\xb9\xba\x0f\x70\x66\xfe\x14\xfc\x89\
+\xc0\x97\xcb\xe3\x82\xa2\x05\x40\xa3\x7d\xe4\xc0\x47\x73\xfd\xfd\
+\x46\x4c\xb0\x81\xc0\x48\x1a\x03\x9c\x08\x7d\x48\x0f\x00\xff\xee\
+\x87\x6b\xc8\xd8\x69\x5c\x01\x98\x32\xcf\xee\xf9\x4f\xe5\xac\x7f\
+\x19\x97\xfc\x29\xf8\x2b\x39\xdf\x59\xcc\xe6\x57\xa6\x3e\x05\x0c\
+\x02\xd4\x9a\x8b\x6b\x76\xfe\x4a\x98\x32\x67\x29\x34\xc5\x00\x7f\
+\x6d\xd5\x5b\xf1\x77\xa9\x24\x3c\x1d\xca\x0a\xe3\x14\x4f\xba\xc8\
+\x0c\x85\x9e\x43\x04\xc2\x37\x3f\x0c\xaf\xbf\xdd\x83\xc7\x46\x37\
+\x60\xc0\xdf\xbc\xfd\x23\xd8\x44\xa5\x7f\x63\xf1\x04\xc0\x47\x42\
+\xfd\x6f\xe7\x27\x9f\x09\x12\x20\x55\x00\x64\xf9\x9f\xa5\x7f\xbf\
+\xfd\x01\xbe\x91\xa5\xff\x1f\x78\xf4\x6f\x1f\xb3\xff\x69\xb1\x02\
+\xa0\x9c\xfd\xdf\x2f\xd9\xff\x3f\x71\x05\x40\x94\xfb\x8f\x1e\x3d\
+\x01\xc7\x8e\x9f\x82\xdf\x8e\x9e\x42\x80\xf1\x15\x0c\x1f\x35\x15\
+\x9e\x6f\xf2\x36\x54\xc1\x63\xc5\xe7\x97\xce\x8a\x69\x95\x39\xd3\
+\x2f\xc5\x59\x7d\x25\x21\xb3\x2c\x4d\x9b\xa8\xda\x51\xca\x2f\xa6\
+\x23\x58\x33\x81\x6e\x4f\xab\x08\xe9\x97\x87\xa0\xc6\xad\x8f\xc0\
+\xa5\xd7\xd6\x16\xa0\x35\x23\x5b\x5a\xdf\xe6\x48\x1b\x6c\x7b\x2e\
+\x5e\xdb\x85\xfb\x6d\xb3\x9e\xa2\x12\x93\xf8\xfc\x94\x90\x66\xe0\
+\x3b\x24\xaf\xe5\x39\x97\x1a\x23\x38\x7a\x94\x41\x90\x43\x97\x23\
+\x4b\x4e\xb4\xa8\xbd\x47\x68\xf9\x7b\x65\x3b\x29\x55\xe9\x6c\x50\
+\xaf\xbd\x7c\x36\x74\xea\x3d\x0c\x01\x40\x21\x04\x6f\x7a\x48\x54\
+\xe9\x32\x45\x95\xc3\xa3\xc6\xfe\x62\x56\x54\x43\x8e\x0a\x80\xfa\
+\x8c\x4a\xe8\xc7\x6d\xb3\x1b\x4f\x0b\x41\x6b\x7d\x04\x8c\x24\xc1\
+\xed\xd0\x68\x08\xf9\xd8\x97\xf1\xf6\xcc\xf3\x95\xfd\x07\x8d\xd6\
+\x8b\x15\x35\x8e\xa9\x6d\xa1\xdd\xca\x8d\x46\x02\x61\xbf\xcf\xbf\
+\x2e\x64\x54\x94\x4e\x44\xbc\xe3\xca\x1b\xe5\x9e\x1b\x3c\x4f\x15\
+\x0f\x2b\x51\x0b\x20\x98\x40\x08\xa1\x04\xc8\x45\xcd\x62\xc7\xc8\
+\xce\x3d\x45\xe8\x06\xf8\x02\xc9\x8e\x0c\xc6\x23\xe8\x24\x0a\xb4\
+\x21\xe3\x04\x08\x25\x18\x15\x0a\xba\xc6\x00\x95\xd2\x53\x12\x55\
+\x09\x37\x00\x88\x3b\x85\x10\x0b\x00\xc4\x2e\x25\xc6\x77\xa9\xb2\
+\x1c\x07\xbb\xd3\xb8\x22\xe8\x02\x70\xa2\x27\xea\x54\xde\xcb\xd1\
+\xfa\xea\xa9\xd2\x04\xc4\x96\xf3\x55\x95\x1c\xcc\xe8\xcb\x67\xc1\
+\xf8\x99\xf9\x30\x74\xfc\x6c\xb9\x11\x1b\xa3\x49\xe9\x82\x68\x49\
+\xc1\x7f\xe0\xc8\x69\xb8\x19\xd1\x94\x40\x0e\x67\xdb\x23\x10\x14\
+\x34\x7f\xab\x2b\x9b\x9e\xf8\x0c\xd2\x9f\x06\x00\x4a\xbe\x57\x6f\
+\x22\xa1\xf8\xc2\x22\xf8\x9b\xa5\x51\x35\x21\x3d\xe8\xea\xb3\x2a\
+\x89\x53\x33\xeb\x8f\x08\xd5\x44\xc7\x66\x20\x40\x00\xe9\x0a\xdc\
+\x80\x01\x67\xfc\x8c\x25\x30\x10\x03\x50\x97\x7e\xc2\x6d\x4f\x83\
+\x80\x01\x36\x00\xd0\x81\x7f\x80\xd0\x09\x60\xad\x00\xca\xfc\x69\
+\x0d\x1d\x2b\xb3\x7f\x19\xfc\x87\x8f\x17\x8b\xc6\xfe\x24\x10\xe8\
+\x8b\x97\x74\xbd\xef\x88\x89\x5c\x01\x18\x38\x8a\x98\xfe\x33\x45\
+\xf0\x9f\x27\x82\xff\xd4\xf9\x42\xcd\x4f\x28\xf9\xad\x60\x21\x1f\
+\x0a\xfe\xb3\x17\x4b\x43\x1f\x06\x01\xab\x35\x10\x10\xd7\x05\xd3\
+\x9f\x94\xfe\xe6\x2d\xa6\xdb\x0b\x21\x77\xe0\x38\x68\x80\x19\x21\
+\x1b\xef\x30\xef\x22\x9b\x47\xcd\x94\x6f\x03\x5f\x96\x27\x0d\x09\
+\x0b\xaa\x44\x1a\xc2\x4b\x2d\xde\x83\xd1\x93\x66\xc3\xba\x2d\x02\
+\x08\x6c\xda\x4e\x6d\x00\xd1\x02\xa0\x2a\xc0\x8e\x8f\x3f\x93\x15\
+\x80\x2f\x35\xfb\x9f\xca\xff\x6c\xfe\xf3\x3d\x95\xfd\x05\xf3\xff\
+\xc7\x3d\xfb\xe5\x3a\x00\x7b\x49\x01\x10\x01\x80\x00\x01\x3f\xc1\
+\x01\xe6\x00\xfc\x86\xf7\x3b\x0c\x4b\x56\x6e\x84\x6e\xbd\x87\xc3\
+\x83\x4f\xb4\x80\xab\x2b\xd5\x65\xf0\x28\xd4\x32\x85\x0c\x2d\x05\
+\x21\x36\x9b\x21\x10\x50\xb6\x92\x94\x57\xae\x04\x17\x91\xdb\x22\
+\x5d\x2f\x43\xe4\xcf\x4a\x3c\x8e\x19\xb9\xe5\x21\xb8\xff\x89\xa6\
+\xf0\x6a\xeb\x8e\xd0\xa3\x5f\x1e\x4f\x3f\x2c\x29\x20\x72\x5a\x21\
+\x3c\xf8\x54\x4b\x3c\xde\x22\x62\x64\x96\x84\x76\xa4\x11\x0e\x2b\
+\x6b\xaa\x16\x9c\x21\x78\xa3\x83\x43\x20\xbe\x98\x4a\x49\x46\xd4\
+\x1c\xbc\x17\xb7\xc5\xac\x3f\x64\xa8\xa0\x1a\xe3\x79\x86\x0a\x5e\
+\xaa\xac\x00\x08\xc9\xe0\x88\xdd\x67\x47\x30\x4b\x72\xc1\x0b\x97\
+\xad\x63\x16\xbe\x87\xef\x17\x92\x49\x4a\x48\x57\xc4\x3c\xfe\xa0\
+\x8b\xf4\x1c\x72\x55\x20\x15\x3b\xdd\x72\xa9\x82\x5a\x5a\x14\x28\
+\xb1\x52\x9f\x11\x38\x4d\x61\xa1\x98\x7b\x72\x22\x3d\x98\xf3\x9f\
+\x81\x47\xff\x5e\xc1\x22\x02\xfb\x5f\x9d\x02\xb0\x0c\x02\xbd\x05\
+\x7f\xd7\x3c\xff\x05\x1c\x03\x2c\x89\x40\x81\xa5\xfd\xbe\x85\x29\
+\x83\xfd\x23\xa7\xc8\x71\x2c\x5f\x5c\x25\xbe\x50\x31\xd8\xfd\xc1\
+\x22\x58\x94\x56\x12\xc1\x3d\x98\x00\xf5\xcb\xc0\xc7\x27\x94\xeb\
+\x79\x8b\x00\x27\x1e\xa3\x2c\xef\x4d\x77\xdb\x16\xc7\x68\x25\x04\
+\x42\x09\xcc\x8a\xe2\x11\x07\xc3\x31\x00\x80\xe5\xf0\xc4\xd6\x97\
+\x01\x3b\xb8\xea\x92\xa4\xb2\x58\xd5\x2d\x81\x6c\xed\x55\xe0\xd0\
+\x32\xd7\xfd\xc0\xea\x2c\x4e\x33\x68\xf4\x74\x98\x30\x7b\x29\x94\
+\xe5\x11\x38\x57\x8b\x05\x5f\xff\x81\x67\x5e\x87\xb1\xd3\xf3\x85\
+\x4b\x20\x67\x9d\x61\xe8\xf2\xc1\x70\xb6\x1c\xe5\x0d\x39\x23\x12\
+\xa7\xcf\x1f\x2a\x52\x1c\xc8\xb6\x0c\x4e\x74\xdf\x90\x01\x00\x4c\
+\x4d\x01\x4b\xca\xc3\x2a\xd9\x68\xb1\x88\x44\x39\x75\x7e\x01\xf4\
+\xcb\x9b\x0c\x9d\xd8\x72\x77\x84\x83\x00\xd8\xa3\x7f\x9e\xd6\x06\
+\x60\x7d\x80\xc1\xa3\x20\x77\x88\x14\x0a\x22\x55\xbf\xa1\x76\xe6\
+\x6f\x02\x00\x35\xf7\xdf\x4f\x07\x7f\x59\x15\xc8\x13\x00\x60\xd0\
+\xe8\x29\x30\x6a\xf2\x1c\x7c\xed\x65\xba\xdf\x3f\x5d\x8e\xf0\x11\
+\xe9\x6f\x96\x54\xf1\xe3\xfe\xff\x62\xdb\xd6\x77\x6e\xbe\x79\xdd\
+\xfe\x7b\x1e\xdb\xfd\x52\x8b\x60\x35\x2c\x5e\xb1\x16\xe6\x23\x40\
+\x78\xbf\xfb\x50\xa8\x73\xd7\xb3\xf8\x5b\x49\x73\xa3\xf2\x35\xa5\
+\x78\x54\x2d\x39\xa5\x10\x61\xd0\x46\x99\x75\xe0\xea\x30\xdc\x79\
+\x7f\x63\xe8\xd0\x6d\x00\x2c\x5e\xbe\x1e\xb6\xec\xfc\x0c\xb6\xef\
+\xfa\x4c\x10\x01\x3f\xd9\x0d\x1f\xef\x16\x00\xe0\x0b\x29\xfd\xfb\
+\xcd\xf7\x7b\x84\xe8\x0f\x05\xff\xbd\x22\xf0\xf3\xda\x4b\xeb\x10\
+\x82\x84\xbd\xb0\x62\xd5\x26\xe8\x3b\x70\x2c\x34\x7a\xe9\x2d\xb0\
+\x6a\xde\x07\x17\x67\x64\xb1\xc3\xa4\x08\xf8\xaa\x2d\x65\x97\xae\
+\x3d\x0c\x02\xa4\xfb\x9c\x5f\xa8\x2e\x52\xf0\xbf\xe4\xd2\xea\x08\
+\x56\xee\x84\x3b\x1f\x7e\x11\x5e\x79\xbd\x03\x74\xc9\x1d\xca\xdf\
+\xb5\xa8\xbe\x8c\x86\x11\x13\xa6\xc1\xa2\x15\xab\x05\xd1\x71\xd5\
+\x3a\x58\xb5\x66\x23\xac\xdd\xb8\x1d\x86\x20\xb0\xbb\xb6\x5a\x7d\
+\x61\xcc\x45\xe2\x59\x72\x4c\xcd\x3d\xe1\xe4\x4b\x60\x81\x1e\x15\
+\xb4\x4b\xb8\xd9\x7a\x12\x64\x64\x0e\x3f\x94\x80\xe5\xe4\xb0\x04\
+\x4c\x11\x1f\xc9\x9f\xc1\xcf\x73\xc9\xa5\x11\x04\x87\xab\xd8\xfd\
+\x91\xab\x7f\x06\xd7\x25\xba\xcd\xe1\x1a\x6d\xf6\x07\x5d\xf6\xb5\
+\x89\x26\x9b\x12\x57\x40\xbc\x06\x6f\x47\x8f\xfe\x39\x26\xc0\x42\
+\x49\xf0\xc2\xce\x97\x7d\xae\x15\x77\x8f\x4c\xbe\x3d\xe0\x9c\x64\
+\x4b\x9e\x0b\x92\x38\x66\xfa\x02\xe1\xff\x17\x00\xc0\x5f\x25\x19\
+\x18\xf7\x57\x3a\xfa\x6a\xd4\x4d\x23\x53\x23\x13\x0b\xc4\xeb\xfd\
+\x87\x74\xc6\x1c\xcd\xb6\xb7\x92\x24\x6e\x44\x57\x02\x7c\xfe\x60\
+\x82\x60\x1f\x4a\x82\x9b\xe0\x2c\xa9\x79\x62\xcd\xf1\x47\xbd\xdf\
+\x44\x07\xb8\x09\x00\xe2\x55\x60\x2c\x97\x3b\x56\xac\x7e\x90\x15\
+\xc3\x60\xc7\xb9\x19\x98\xe2\x1c\xa9\x92\x84\xe7\x95\x0a\x5e\x3e\
+\x29\xe4\x21\x48\x82\x11\x97\x80\x89\xf2\x32\xaf\xc6\x25\xd7\xf6\
+\xdd\x06\xc2\xc4\x39\xf9\x50\x31\x74\x97\xcd\xee\x97\x8a\x88\x1e\
+\xdc\x88\x9e\x7d\xa5\x3d\x8c\x9c\x30\x57\x3c\x9e\x39\x05\x16\x8b\
+\x14\xb5\x78\xab\x87\xcc\xc8\x22\x31\xfb\xfe\x5e\x97\x70\x4a\xbc\
+\xe0\x6e\x7b\x2e\x58\x2e\x0b\xe0\x18\x25\x34\xe5\x11\xe0\xf8\x3e\
+\xec\x8d\x52\xf1\x26\x1e\x78\xfa\x75\x98\xbe\x70\x15\x0c\x18\x35\
+\x45\x18\x05\x31\x00\xb0\xcb\xfd\x3d\x07\x89\x92\x7f\x6f\xee\xf9\
+\x8f\xb6\x55\xfc\x86\x1a\x15\x80\xa1\x2a\xf3\x97\x97\xc3\x8d\xc0\
+\x3f\x62\x62\x54\xf0\x1f\x34\x66\x2a\xaf\xd1\x53\xe6\x71\xd6\x3f\
+\x43\x12\xfe\x28\xf8\xab\xc0\xaf\x32\xff\x39\x8e\x2a\x80\x9d\xfd\
+\x93\xcd\xef\x5c\x6e\x07\x14\x32\xdb\x7f\xc1\xd2\x55\xb0\x68\x39\
+\x01\x80\x42\x39\xef\xbf\x01\x0a\xd6\x6d\xc1\x40\xb1\x9a\x05\x89\
+\x6a\xd5\x7b\x0a\xca\x5c\x5e\x43\x8e\x0f\x66\x0b\xe1\x22\xb6\x76\
+\xb5\x83\xed\x45\x65\x6f\x60\x65\xc3\xca\xe1\xfa\xf0\x34\x06\xee\
+\xfe\xc3\x27\xc1\xda\xcd\xbb\x30\xf8\x7f\x07\xbb\xbf\x96\xa4\x3f\
+\x0c\xfc\xdf\xfc\x70\x00\x81\xc0\x3e\xd8\xfa\xe1\xe7\x30\x77\xd1\
+\x2a\x18\x38\x74\x22\xb4\x6a\xdb\x03\xee\x7f\xac\x29\x54\x0b\x37\
+\x60\x4b\xea\x52\xd4\xbb\x2f\x43\x99\x3b\x49\x1a\x0b\x7b\xeb\x52\
+\x94\xe1\x93\xa0\x11\xfe\x26\x29\xe4\x36\xa7\x80\x40\xa6\xd2\x86\
+\x08\x42\xf9\x7f\xde\x08\xd9\x75\x1f\x86\x47\x1b\xbd\x06\xad\xdf\
+\xeb\x0d\xbd\x89\xac\xc9\xdf\x79\x1e\xaf\xdc\xc1\x78\x39\x58\x5c\
+\x8e\x9a\x38\x1d\xf2\xf1\xf3\x2e\x5e\x89\x9f\xb9\x60\x2d\x9b\x1b\
+\x91\xb1\x11\x8d\x37\x6e\xd8\xb2\x03\xaf\x6f\x83\xfb\x9f\x6c\xa1\
+\xcd\x84\x04\x00\x30\xf6\x1a\xbf\x6d\xfb\x1d\xbb\xf7\x7a\x1e\x36\
+\xeb\x80\x6d\x54\xe3\xe8\x91\xcb\xb1\xd5\x54\xbf\x5d\x7d\x70\x98\
+\x8b\x99\x20\x56\xaa\xf8\x31\x3f\x07\x41\xdc\xb5\x59\x77\xc2\x82\
+\xe5\x85\x30\x7c\xdc\x4c\xb1\xef\x28\x70\xa0\xe6\xf0\x63\xf2\x18\
+\xe2\x64\xe2\x31\xab\x93\xee\x71\xf0\xd8\xc9\x96\xc7\x30\xb4\xf1\
+\x44\x01\x9e\x70\x54\x05\x35\xb6\x22\x60\xf0\x3c\xf6\xcd\xc3\x71\
+\xae\xbb\xb5\x1b\x8a\xf2\x02\xb0\x92\xd0\x23\x28\x29\x09\xcf\x82\
+\xf3\x4f\x1a\x3c\x0f\x00\xc0\x77\x5e\xd9\x95\x36\x89\x44\x67\x94\
+\xf2\x0b\x4d\x95\x46\x19\xb1\x3f\x50\x56\x09\x4a\x45\xb1\xa7\x11\
+\x3c\x51\x27\x41\x11\xcc\x7f\xc7\x08\x9f\x65\xb8\x89\xc5\x12\xa7\
+\xb0\xb8\xa2\x11\x5d\x0d\x70\xb6\x1b\xc4\x68\x5a\xb2\x08\xd7\x95\
+\xfd\xbb\xfd\xa7\x5d\x26\x16\xd1\x81\xd2\x7d\x5b\xec\xbe\x93\xea\
+\x91\xdb\x0a\x7e\x36\x93\xd7\x2b\xa5\x43\x15\x7b\x5e\x6d\x92\x1e\
+\x26\x5e\x55\x83\xc6\xcd\xdf\x81\x89\x73\x97\xc0\xed\xf7\x3d\x2f\
+\xc7\xf0\xaa\x6b\x66\x33\x95\xfd\x07\x8f\x99\x81\xc1\xa6\x0f\x6e\
+\xb8\x22\x53\xb9\xfc\x86\x3a\x18\xa0\xd6\xc0\x5d\x0f\x36\x11\x56\
+\xae\xd2\x77\xdc\xb4\x72\x75\x12\x03\x8b\x98\x04\x30\x82\xb9\x33\
+\xcb\x8f\xc4\xcd\x4e\xb8\x22\x20\xb3\x7e\xdd\xe2\x90\x33\xd9\xe2\
+\xf7\xcb\x82\x97\x5e\xeb\x08\x33\x30\x50\x0e\x1e\x3b\x5d\x54\x01\
+\xa8\xec\x3f\xd0\x2e\xf7\xb3\xa5\xef\x20\x59\xf6\x1f\x22\x02\xbf\
+\xce\xfe\x29\xf8\x4b\x00\xd0\x97\x41\x80\x08\xfe\xfd\xf9\x52\x04\
+\xfe\xfe\xa3\x30\xf8\x8f\x16\xc1\x7f\x30\x2e\xe2\x01\xd0\x1a\x3a\
+\x6e\x3a\x8c\x9d\x36\x5f\xf7\xfb\x67\x2b\x00\xe0\x08\xf8\x05\xae\
+\xcc\xbf\x50\x92\x02\x57\xf3\x9a\xcf\xc4\xc0\xd5\xda\xea\x37\x9f\
+\x04\x7f\xc8\xed\x6f\xb5\x10\xfd\x11\x66\x3f\x5b\xa0\x70\xc3\x76\
+\x1e\xd7\x7c\xe3\xdd\x5c\x88\xd4\x79\x04\xbf\x0f\x15\xfc\x85\xaa\
+\x21\x11\xe8\x4a\x29\x33\x22\x36\x24\x12\x9e\xf3\xa5\x33\x82\x60\
+\xd5\x7e\x10\x1a\x3e\xf2\x2a\x8f\x91\x12\x8f\x80\x9c\x13\xd3\xae\
+\xa4\x8c\xba\xba\x28\xe3\xfb\xe5\x73\xb1\x5f\xbd\x9a\x0e\xa9\x66\
+\x3f\x3f\xcb\x4e\x07\xd9\x98\xaa\x94\x14\x82\x12\xc2\x2f\x59\x70\
+\xd9\x75\x37\xf1\xb8\x59\xa3\x57\xdb\x41\x87\xde\x83\x11\x34\x91\
+\x6c\xf2\x58\xd6\x6a\xe8\x33\x0c\xbf\xeb\x61\x08\xba\x86\x8e\x82\
+\x3e\x43\x68\x61\xe0\x27\x20\x30\x28\x0f\x86\x8e\x99\x2c\x15\x0e\
+\x45\xf0\x5f\xbe\x6a\x2d\xac\x5c\xb3\x41\x1a\x1b\x6d\x65\x71\x23\
+\xe2\x38\x6c\xdf\xb5\x1b\x7a\xf5\x1b\x0b\xe9\x57\xdd\x68\xeb\xe0\
+\x4b\x77\x3b\xa5\x18\xe8\x4b\x37\xdd\x43\x2d\xdb\x5f\x22\x66\xef\
+\xd8\x30\xd3\x71\xef\x9b\x46\x16\xcc\xd5\x43\x03\x00\x78\x54\xe5\
+\x2a\x5d\x38\xe9\xa5\x6a\x59\x71\xcb\xe1\x59\xa2\x5a\x12\xa9\xb2\
+\x5a\x66\x1a\x64\xf9\xd8\x1c\xab\x26\xdc\x76\x5f\x63\xfc\xcd\x0b\
+\xa0\x63\xaf\x21\xc2\xaf\x42\x92\x79\xbd\x9a\xeb\x10\xd2\x8a\x78\
+\xb1\xb3\xcf\xa2\x44\xd9\x8a\xca\x7e\xa3\xc9\x7e\x1e\xa3\x05\x99\
+\xe2\x96\x1a\x2e\x92\x18\x78\xfe\x4b\xff\x31\x5b\xa7\x8e\x16\xc5\
+\x85\xd7\xed\x77\x7f\xf7\x76\x0b\x22\xfc\x97\x55\x0f\xbd\x7f\xa1\
+\x1a\x45\x82\x44\xff\x88\xd7\xd3\x29\xa9\x23\x56\x3c\x2e\x81\x4f\
+\x05\x7d\x33\x2b\x8d\xf7\xb8\x40\x3c\x32\xa2\xe5\xfa\x02\x63\x95\
+\xf9\x8b\x83\x9a\x82\x71\x05\x80\xec\x93\x3d\x94\x60\xb4\xc5\x72\
+\x95\xd1\x24\xaf\xc1\x20\x1d\x46\xbf\x96\x55\x0c\xd3\x86\xe8\x7e\
+\xa4\x2f\x0a\xdc\x38\x25\x47\x9d\x22\x24\xb1\xc0\x81\x49\x94\xcb\
+\x71\x78\x80\x7b\x02\x22\x3b\x22\xa5\xb9\x14\x76\xf3\xb3\x8c\xf1\
+\x42\x31\x62\x48\xac\xeb\xfa\xf7\x3f\x0f\x93\x66\x2f\xe1\xcd\x9a\
+\x27\x01\x94\x0c\x29\x06\xd7\x7b\x31\xfb\x5b\xb4\x62\x23\x06\x8b\
+\x07\x38\xd3\x27\x10\xf0\x46\xbb\x5e\x30\x71\x66\x3e\x2b\x09\x7a\
+\xa5\x95\x2b\x83\x03\x03\x64\x38\x5c\x14\x13\xb6\x01\x22\x49\x8f\
+\x0d\xaa\x0a\x87\x57\x57\x9d\x82\xae\xaa\x81\x39\xea\x19\x64\x27\
+\xc9\x66\x6d\x7a\xc2\xf4\x45\x85\x90\x37\x79\x2e\x74\x27\x89\x60\
+\x22\xf9\x0d\x16\x92\xbd\xcc\xf6\x57\xb6\xbe\xd2\xcc\x47\x31\xff\
+\x19\x00\x0c\x9b\x20\x82\xff\xf0\x09\x8e\xfe\x3f\x05\x7f\x47\xe6\
+\xef\x0a\xfe\xc3\xc6\xcf\x80\xe1\x13\x66\xc2\xb8\xe9\x0b\x58\xbd\
+\x6f\x4e\x7e\x81\x91\xed\xaf\x74\x95\xfb\x29\xe3\x2f\x90\x81\xbf\
+\x50\x06\xff\x55\x98\xfd\x17\xb2\xce\xff\x22\x69\xf5\x4b\x7d\x70\
+\x02\x00\xcb\x11\x00\x2c\x2f\xdc\xc0\x41\xb1\x60\x8d\x70\xfd\x2b\
+\x58\x27\xd6\x8a\xf5\x5b\x60\xea\xbc\xe5\xf0\x46\xfb\xde\x50\xbb\
+\xde\x63\x98\xb1\x57\x17\x3d\xf6\x72\x55\x34\x20\x10\x53\x1e\x41\
+\xde\x30\x53\x32\x6d\x42\x9d\xed\xfd\x20\x64\x5f\x95\x8b\x27\x8f\
+\xa1\xea\xd1\xd0\xea\x6c\x20\x23\xfa\xf9\xd5\xa5\xfb\xa4\xc8\x36\
+\x49\x99\xae\x66\xbd\x27\xe0\xa9\x97\xdb\xc0\x7b\x3d\x06\x73\x85\
+\x64\xc0\x88\x71\x30\x60\xe4\x58\xfc\xde\x46\xe1\x77\x8a\x81\x7f\
+\xf8\x18\xbc\x14\x00\x8b\xc0\x80\xba\xed\x83\xa1\xa3\x21\x17\xc1\
+\x00\x81\x2d\x92\x39\x66\x00\xb0\x72\x0d\x2c\xa3\x8a\x07\x7e\xde\
+\x82\x35\x1b\x79\xcc\x91\x26\x1d\x36\x6e\x26\x65\xc3\x5d\xb0\xe3\
+\xc3\x4f\x60\xd7\xc7\xbb\x61\xf1\xb2\xf5\x50\x35\x72\x37\x57\x22\
+\x94\xe4\xb6\xe0\xb1\x54\xb7\x27\x86\xf4\x71\x62\xec\x37\x81\xa0\
+\x2b\xb8\xa8\xf1\x3a\x59\x55\x33\xac\x6b\xd5\xbe\x99\x62\x04\x7d\
+\xaf\xbc\xaf\x6d\x25\x2e\xec\x72\xb5\x69\x55\xc0\x6c\x95\x5a\x6c\
+\xb1\x6b\xb7\xb2\x22\xb2\x65\xa7\x0c\x84\x6a\x42\xe9\xf2\xb5\xe0\
+\xc5\xd7\x3a\xf1\xef\xff\xca\x1b\x5d\x6c\x39\xee\x4c\x69\x1c\x16\
+\x08\xb9\xc0\x7f\x38\x6a\x0a\xa1\xa4\x6a\x7b\x09\x83\x96\x49\xf8\
+\x8b\x23\x07\xfc\x77\x94\xc2\xe3\x99\x12\xa9\xdf\xcc\xe9\x53\x10\
+\x2e\x41\xd6\x6e\x25\x39\x2d\x12\x9b\x00\xf8\x7f\xa1\xfc\xef\x89\
+\xd7\x02\xf0\xa5\x9f\x0f\x84\xe4\xd6\x76\xb6\x0c\x81\x96\x70\x12\
+\x1e\xc8\x89\xcc\x3b\xe2\x09\x77\x58\x09\x59\x98\xce\x83\x21\x18\
+\x87\x99\x1f\x2b\x48\x47\xe2\xfc\x80\x56\x5c\xf1\xa0\xd8\xf6\xc5\
+\xa1\xa4\xcc\x2f\x74\x76\xa1\x33\x12\x27\x31\xc5\xa7\xd5\x03\xdd\
+\x44\xc0\x50\x54\xe9\xde\x1d\x3c\x1d\x56\xbb\x19\x39\x2e\xa3\xa1\
+\x9a\x1a\x00\x08\x32\x56\x96\x31\xe6\xa7\x66\x94\xab\x42\xa5\xff\
+\x9f\xbb\xef\x0c\x8f\xe2\x4a\xba\xf6\x8f\xef\x33\xa3\x11\x36\x61\
+\x34\x02\x9c\xbd\x8e\x18\x90\xa6\x67\x24\x11\x9c\x73\x4e\xeb\x1c\
+\xd6\xf6\x7a\xed\xb5\x8d\xd7\xbb\x0e\xbb\xc6\x71\x9d\x70\x5c\x9c\
+\x88\x26\xe7\x2c\x40\xe4\x1c\x45\x10\x51\x80\x40\x20\x82\x32\x22\
+\x27\x89\x64\xbf\xef\xf7\xd4\x77\xab\x6e\xe8\xdb\x3d\xdd\x13\xa4\
+\x91\xc0\xfb\xe3\x3e\xa3\x00\xd2\x68\x42\x9f\x53\x55\xa7\xce\x09\
+\xdd\x09\x23\x27\xcd\x82\x8f\xbe\xec\xc1\xcd\x78\x44\x00\xcb\x4d\
+\xf7\x3c\xc7\xc0\x6b\x09\xbc\xf5\xe1\xf7\x44\x06\x1a\xb7\x0a\xd1\
+\x1e\xfa\xc4\x69\x0b\xe1\xee\x3f\xb2\xea\xbf\xa5\x8c\x10\xce\x34\
+\xb7\x0f\xa2\xfa\x00\x18\x16\xe2\xa2\x8b\xfd\xac\xff\xc6\x04\x7d\
+\x4f\xaa\x3e\xf2\x10\x29\x8d\x7a\x52\x63\xaa\xf6\x58\xc9\x6d\x0f\
+\x79\xc1\x67\x24\xe0\xb5\x7f\x7e\x09\xd9\x33\x16\xc1\xf0\x09\x33\
+\xe1\x3f\x0c\xcc\xbf\xd3\x12\xfc\xb8\xda\x7f\xb0\x50\xfc\x0f\x12\
+\x33\xff\xa1\x9c\x04\xd0\xed\x50\xfa\x5c\x6f\xf9\xeb\xe0\xaf\x2a\
+\x7f\x04\x7e\x76\xfa\x30\xf0\xff\x85\x81\x7f\xdf\x61\xe3\xe9\x60\
+\xe4\x2f\x8a\xfe\x38\xd8\xcf\xe5\x4a\x7f\x22\x04\x26\xf8\x4f\x9c\
+\xb9\x80\x6f\x01\xb0\xaa\x1f\x2b\x7f\x0a\xf9\x99\xb5\x90\xaa\x7f\
+\x74\xfb\x43\xbb\x5f\x4e\x00\x72\x05\x28\x2e\x85\x39\x8b\x38\x09\
+\x98\xbb\x18\x03\x80\x38\x19\x98\xc3\x6e\x67\x2f\xc6\xef\x2d\x83\
+\xb9\x4b\xf2\x60\xda\xdc\xa5\xf0\xed\x8f\x03\xe1\x91\x67\xfe\x0e\
+\x17\x5c\x71\x2d\x03\xed\x6b\x38\xb9\xf3\x9b\xee\x83\xa4\x23\x10\
+\xa1\x54\x49\x42\x48\x6a\x5d\x2b\x13\xeb\x6c\x29\x69\x6a\x3c\x84\
+\x60\x96\xf2\x87\xeb\x20\xe3\x96\x27\xe1\xf1\x17\xdf\xa1\x4c\x85\
+\xee\xb8\x22\xd9\x8f\x83\xfe\x8f\x78\xfa\xe0\xe6\x04\x03\x7f\x04\
+\x7d\x4c\x48\x64\x1f\x73\x02\xc0\x00\xbf\x0f\x3f\xdf\xcb\xef\x11\
+\x29\x18\x08\x23\xb3\xa7\x32\x40\xe7\x84\x47\x92\x1d\x19\x6d\x2c\
+\x0d\x8e\x70\xbd\x11\x5d\x0d\x91\x00\xe4\x0b\x3f\x83\xbc\xb5\x9b\
+\xc9\xab\x82\x48\x8e\x8f\x47\x37\x73\x2f\x8d\x34\x73\x6d\x97\x08\
+\xa1\x61\x73\x0e\x0c\xda\x40\x34\x64\xda\xd7\x3a\x5d\x73\x44\x07\
+\x40\x56\xc6\x49\xda\x6b\xd2\xec\xec\x69\x71\xe2\x5a\x07\xd1\xe3\
+\x4f\x13\x1d\x80\xa0\x00\x77\x91\x2d\x21\x92\x31\x93\x5b\x76\x82\
+\x16\x97\xdf\x04\x97\xb6\xbd\x1d\xfc\x97\x5c\xaf\x92\x39\xa5\xfd\
+\x34\xfa\x1e\xa0\xde\xc1\x49\x95\x1f\x7e\x3d\x8c\x34\xe6\x74\x07\
+\x7d\x67\x22\x10\xb2\x14\x25\x0d\x1d\x6e\x13\x9d\x10\x18\x5a\x50\
+\x91\x61\xf3\x76\x09\xc6\x38\xef\x37\xa2\xe4\x4a\x44\x72\x31\x34\
+\x1c\xc6\x13\xd1\x1e\x1b\xa3\x9e\x08\x80\xe1\x42\x00\xfc\x89\x6d\
+\x4d\xe8\x76\xc0\xd1\xd7\x1a\x42\x2e\x55\x7a\x3c\x86\x44\x41\x5b\
+\xc5\x1c\x74\x6c\xdf\x47\xb6\xef\x75\x13\x09\xc6\x68\x82\xa4\x47\
+\x0f\xfb\xeb\x32\x27\x0a\xb8\x98\x43\x04\x6c\x5e\xdb\x86\x2d\x89\
+\xcc\x70\xa8\x96\x33\xac\x5b\x00\x62\xed\xaf\xf9\xc5\xd7\x41\xcb\
+\x2b\x6e\x82\x56\x57\xb2\x73\xc5\xf5\x64\x5a\xc3\xfd\xc3\x79\x0e\
+\x41\x2a\xab\xdc\x5b\xa0\x07\xf9\x25\x1d\xc9\x5f\xfc\xa2\x6b\x6e\
+\x60\x04\x60\x0e\x0c\x18\x39\x19\xce\xbb\x1c\x95\xd8\x8f\xc0\x7b\
+\x9f\xfd\x0c\x39\xac\xba\xfa\xf4\xdb\x5e\xa4\xec\xbe\xfe\x4e\x74\
+\xa3\xeb\x07\x13\xa6\xce\x87\x3f\xfd\xf5\x7d\x31\x52\xc8\x32\xbd\
+\x05\x52\x43\x2e\x04\x20\xe4\x4a\x00\x9c\xbf\xaf\x77\x36\x42\xaa\
+\xea\x0a\x5b\xb9\x91\x21\x2d\x61\x4e\x83\xba\x77\xbb\x41\x5d\x80\
+\x64\x76\x5e\xef\xf2\x0d\xe4\xcc\xce\x25\xf7\xbd\xbe\xc3\xc7\xc3\
+\xcf\x0c\xb8\xbf\x67\x20\xc5\xdb\xfe\x3c\xcc\xa7\x1b\xfb\xfc\x7b\
+\xd1\xf2\xef\x26\x48\x40\xb7\xde\xa2\x03\xd0\x57\x23\x00\xc2\x0b\
+\xa0\xfb\x80\x51\xd0\x63\xe0\x28\x55\xf9\x23\xf8\x4b\xe0\xef\x37\
+\x3c\x9b\x04\x81\x78\x06\x8d\x9e\x44\xc2\xae\x89\xac\xba\x9b\xa8\
+\xad\xfb\xa1\xe3\x5b\x8e\x68\xf9\xe3\xac\x1f\xfd\x00\xa6\xcc\xe2\
+\x67\x1a\xce\xfd\x67\x2f\x52\x04\x80\xda\xff\x68\xfb\x8b\xa9\x7f\
+\x0b\xb1\x0b\x90\x4b\xe0\x48\xc0\x2f\x3a\x02\xd4\x15\x58\xbc\x8c\
+\x77\x04\x58\xc5\x3c\x7f\x29\x8e\x08\x56\xc2\xa2\x65\xab\x61\xd1\
+\xf2\x75\x30\x6c\xec\x34\xea\x0e\xa0\xe3\x1c\xfa\xd5\xf3\x8e\x4e\
+\x16\xa5\x43\x72\xd3\xa8\x10\xf7\x9c\x50\x69\x75\x66\x55\x9d\xe4\
+\xd3\x04\xb4\xec\x79\x6e\xdb\xf1\x11\x78\xf8\xd9\x37\xa1\xcb\x67\
+\x3f\xb0\x2a\x7f\x04\xf4\xe8\x3f\x0c\x7e\xee\x37\x84\x2a\xfe\x9f\
+\x18\xd8\xff\x28\x80\x1d\x01\x9f\x2a\x7d\xf6\xf1\x7f\x04\x01\x40\
+\x22\xd0\xad\xcf\x20\xae\xad\x10\x84\xa1\x7b\xbf\xa1\x34\xe6\x98\
+\x41\xf6\xc6\x08\xfe\xf8\xf7\xe5\xf2\x74\x43\x51\xfd\xcb\x58\xe3\
+\x55\x6b\x36\x30\x02\x20\xfc\x0c\x30\xd1\xb0\x60\x2b\xac\xdf\xbc\
+\x1d\x5e\xfd\xfb\x27\x3c\xc9\xb1\x19\x0f\xc5\x3a\x5b\x10\x17\x5e\
+\x18\x18\x9a\x62\xdc\x70\xf7\x04\xf1\xdb\x76\xab\xfd\x5a\x8b\x55\
+\x8e\x00\xb4\x56\xb8\xcc\xbf\xd0\xc3\x82\xa8\x3b\xa5\x67\x8d\xb0\
+\xc7\xb1\xd5\xe5\xd7\x41\xfb\x9b\x1f\xa7\x2e\x49\x87\xdb\x9e\x66\
+\xe7\x19\x68\xcf\x6e\xdb\xdf\xfa\x14\x74\xbc\xfd\x59\xb8\xf6\x8e\
+\xe7\xa1\xd3\xed\xcf\xb1\xc3\xbe\x7e\xeb\xd3\xec\x3d\xf8\x38\x5c\
+\x15\xba\x17\x9a\x5e\x90\x29\x04\x83\x42\xec\x98\x9a\x21\x08\x8a\
+\x11\x65\xbc\x1b\xe9\xfa\x16\x4f\xc5\x6e\x40\xdd\x85\x91\xf5\x33\
+\xef\x56\xb8\xe3\x0b\xc6\x30\x0e\x89\xe6\x78\x1b\x4b\xde\x40\xa2\
+\x9d\x04\x13\x47\x04\x3c\x82\xac\xbb\x76\x00\x9c\x1f\xac\xba\xef\
+\x42\x46\x27\x16\xb1\x54\xfb\x31\xb2\x24\x5f\xd0\x32\x6f\x89\xde\
+\x69\x88\x25\x3a\x34\xd2\x7d\x0a\x44\x71\x39\x8c\xb0\x4a\xe3\x8b\
+\xd5\x10\xc2\x21\xb1\xd1\xe7\xec\xc0\xe8\x4d\x71\x4a\xd7\xcb\x50\
+\x15\x34\xed\x16\xb3\x8b\x7a\x17\x06\xde\xe8\x2d\x3e\x15\xfd\xc5\
+\xc9\xef\x3f\x17\xc6\x4f\xe7\xbe\xe4\x23\x73\xf0\x2c\x60\x67\x3e\
+\x8c\x98\x34\x8f\xce\xf0\x89\xec\x76\x02\xb7\xb3\x1d\x3b\x79\x1e\
+\x89\xe7\xc6\x4e\xc5\x4c\x81\xb9\xf4\xb5\x6c\xf6\x7f\xc7\x4f\x5d\
+\xc8\x2e\xea\xa3\xd8\xc5\xea\x69\xf3\x82\x24\x2a\x46\xd3\x7f\xc0\
+\xdc\x8f\x4e\x0e\xab\xea\x63\xdb\x08\xb0\x93\x00\x5e\xfd\x1b\x0e\
+\x1d\x92\x90\xba\xd8\x58\x85\x86\xa6\x28\x30\x99\x14\xd7\x7c\x3d\
+\x30\xb9\x65\x10\x5e\x7b\xa7\x2b\x4c\x9b\xb7\x02\x26\xcf\xc9\x85\
+\xc1\xa3\x27\x13\x38\x63\xbb\x9e\xf6\xfa\x45\xbb\x9f\xaa\x7e\xed\
+\xa0\x13\x20\xae\xfa\x11\x01\x60\x55\xee\xcf\x3a\xf8\xcb\xb6\x3f\
+\x3b\x7d\x44\xdb\xdf\x04\xff\x6c\x46\xa8\x26\xc2\xc0\x51\x13\xd8\
+\x99\x44\x07\x2d\x81\x27\xcd\xe4\x2d\x7e\x74\x00\x9c\x44\x67\x21\
+\x7d\x2c\xe7\xfd\xd8\xfe\xc6\xb6\x3f\x02\xbf\x59\xfd\x73\x02\xc0\
+\xab\xe2\xa5\x74\x4c\xd0\x5f\x46\x87\x80\x9f\x9d\xf9\x02\xfc\x17\
+\x30\xf0\x5f\xb0\x2c\x8f\x81\xff\x4a\x56\x39\xaf\x66\x67\x0d\x03\
+\xd0\xb5\xb0\x6c\x15\x9a\x02\x6d\x82\x25\x79\xeb\x69\x95\xf3\x95\
+\x37\x3e\x85\xe0\x75\x8f\xc0\x39\xe4\x40\x68\xb6\xfc\x65\x77\x88\
+\xbb\xd8\xa5\x99\xae\x78\xfe\x2c\xab\xce\x84\x3d\xbe\xad\x2e\xbb\
+\x8e\xb2\x13\x5e\xfa\xc7\x47\xb4\x55\xc1\x73\x19\x06\x98\xa2\xca\
+\xde\x7c\xee\x8f\xa0\x4f\x15\x3f\x12\x01\x06\xfa\x3f\xf4\xc5\x11\
+\xc1\x60\x22\x0e\x83\x47\x4f\x24\x91\xe3\x6c\xf9\x37\x22\xf8\xb3\
+\xbf\x6f\xc1\x62\x1e\x6e\x64\xc6\x1a\x63\xa6\xc1\x06\x06\xfe\x7c\
+\x93\x01\x3b\x00\x1b\x37\x15\x41\x41\xe1\x76\xd8\xbc\xb5\x04\x3e\
+\xff\xae\x8f\x48\x10\x6c\x43\x5b\x07\xaa\x0b\xa0\x8d\x1b\xf5\xec\
+\x00\x8f\x3f\x10\x05\x0c\xcc\x35\x3e\x8f\xda\x20\x12\x5b\x44\x38\
+\x46\x21\xc1\x63\xc8\x65\xc5\x35\x24\xdc\x3f\xdb\xc1\x3d\x8f\xfc\
+\x15\xc6\x4f\x5b\x40\x2a\xff\x89\x33\x16\x91\x97\x7f\xce\xec\x25\
+\x74\xa6\x50\x2e\xc0\x52\xf6\x5e\x65\x5f\x9b\xb9\x98\xb2\x00\xc6\
+\x4f\x9d\x4f\xb7\x23\xb2\x67\xc1\x5f\xfe\xf6\x09\x34\x3d\xbf\xbd\
+\x22\x00\x72\x64\x11\xb9\xab\x1b\xab\x10\x2f\x74\x1a\xaa\x7a\x23\
+\x06\xd0\x4d\xc4\xe6\x80\x7e\xdd\x0e\xc5\x75\x3d\x4e\xec\x09\xc5\
+\x66\x43\x5d\xe7\x50\x22\x87\x0e\x80\xa3\x8a\x3a\xc1\x6d\x18\x7b\
+\x68\x86\x65\xb6\xef\x0f\x84\x55\xbb\xe1\xed\x93\x60\x84\x34\x27\
+\xa7\x79\x4b\xb8\x18\xc3\xbc\x2f\xd1\xcc\x86\xac\xc6\x3b\xae\xbb\
+\xe9\x11\x36\x0b\x38\x58\x87\xe2\x9e\xaf\x99\x2d\x2b\xc3\x65\x36\
+\x1e\x74\xd4\x00\xe8\xc6\x3f\xce\x33\x74\xb1\x7b\x2f\xe6\x8b\x6d\
+\xb3\x1e\x24\xaf\xf1\x5b\x44\x46\xc0\x0d\x77\x3d\xc7\x2e\xd0\x4f\
+\x53\xa6\x00\xe6\x0b\x74\xb8\xe5\x09\x68\x7f\xcb\xe3\xea\x64\xdd\
+\xf4\x28\xb5\x71\x31\xa4\xe6\xf9\xce\xef\x43\xa7\x3b\x9f\x85\x4e\
+\xf8\x7f\xee\xfe\x13\xdc\x70\xf7\x0b\xd0\x91\x55\x2a\x97\xa7\xdf\
+\x45\x73\x7e\xaf\x98\xf9\x7b\x5a\x58\xad\x7f\x93\xb5\x55\x43\x65\
+\x26\xa2\xed\x3e\x9b\x55\x92\x4b\x4c\xb0\xc5\xf0\x47\x6a\x09\x82\
+\xc2\xfc\x24\xa0\x69\x0b\xcc\x16\x6b\xf8\xf3\x17\x74\xb0\x0d\x0e\
+\x41\xe3\x16\x21\x38\x87\x55\xba\xe7\xb0\x9f\xfd\xe4\x9f\xff\x45\
+\x24\x60\xfa\xc2\xe5\x30\x6c\xfc\x54\x02\x6a\x04\x6c\xdc\xbf\xee\
+\xc1\x80\x9d\xc8\x00\x01\x3f\xdf\xfb\x97\xad\xff\x9f\xfb\xcb\xb6\
+\x3f\x03\xfe\x01\x58\xf5\x8f\xa2\xaa\xbf\xd7\x10\x04\xff\x31\x3c\
+\x00\x68\xf8\x78\x22\x15\x03\x46\xe2\xc9\x26\xf0\xc7\xea\x1f\x05\
+\x81\xfc\x4c\x84\xe1\xe3\xa6\xc0\x84\x19\xf3\x08\xec\xf1\xe4\x10\
+\x01\xc0\x74\xbf\xf9\x9c\x00\x68\x73\x7f\xac\x88\xa7\xb3\xaa\x7f\
+\x06\x3b\x08\x8e\xbc\xfd\xbf\x8c\x81\xff\x72\x0d\xf8\x97\x13\xe8\
+\xe3\x59\x20\x80\x7f\x21\x02\xff\xf2\x55\xb0\x78\x05\x03\x7e\x3c\
+\x79\xdc\x1a\x78\xd9\xea\x7c\x58\xb1\x86\x03\xe8\x9a\xb5\x05\xac\
+\x8a\xde\xc4\xa3\x81\xd7\x17\xb1\xff\xb7\x8e\x55\xee\x23\xe1\xb9\
+\x97\xba\xc0\x95\xed\x6e\x63\xc0\xc5\x37\x08\xb0\xad\xce\x41\xd4\
+\x10\xfa\x8b\x4c\xb5\x65\x22\xd7\x0e\x93\x64\xbb\x9a\xbd\xd7\xd1\
+\x1e\xf9\x9a\xac\xbb\xe1\xa1\x67\x3a\xc3\xfb\x9f\x7f\xaf\x48\x40\
+\x37\xa9\x01\xc0\xd1\x00\x92\x80\xbe\xd8\x2d\x18\xc2\xc8\xd4\x30\
+\xea\x1e\x8c\x9d\x34\x9d\xfd\x5d\xf8\xf7\xe5\xd2\x99\x87\xad\x7f\
+\x9c\xfd\x2f\x59\x01\x4b\xa4\xf8\x8f\x55\xff\x2b\xd1\xcf\x60\xdd\
+\x46\x22\x00\xf9\xc2\xcc\xa8\xa0\xb0\x88\x81\xff\x0e\xd8\x82\x6e\
+\x86\x3b\x4a\xa1\xff\xd0\x09\xd0\xa4\x55\x3a\x99\x0b\x59\xda\xff\
+\x22\x3a\x37\x39\xd5\x14\x9b\x26\xa5\x5a\x03\xbd\x22\xad\x4d\x7b\
+\x84\x0e\xc0\x72\x52\xdd\xde\x97\xf2\xbd\x8b\xbf\x3f\x0d\x9a\x5f\
+\x98\x01\x97\xb6\xbd\x09\x2e\x6d\x73\x23\xbb\xbd\x05\x2e\x4b\xbb\
+\x15\xae\x08\xdc\x06\x57\x19\xb7\xc3\xd5\xa1\x3b\xe1\xea\x8c\xbb\
+\xe1\x9a\xcc\x7b\x28\x16\xfa\xaa\xd0\x5d\xf4\x75\xa3\xd3\x03\xf0\
+\xe7\xce\x1f\x30\x12\x3e\x07\xbe\xfe\x71\x88\x20\x01\x36\x82\x11\
+\xb5\x08\x73\x9a\x69\x07\x1c\xd6\xe3\x0c\xf7\x55\x5e\x57\x23\x9b\
+\xba\x00\x74\xc0\xd6\xb2\x0f\x59\x0c\x7b\xbc\x91\x7c\x43\x62\xf6\
+\x6f\x30\xea\x9c\xb4\x17\xc9\xd8\xc7\xfd\x39\x8f\xd7\x5f\x22\x90\
+\xa0\x2e\x40\x20\xfa\x08\x20\x51\x04\xc0\x5b\x6b\x43\x0d\x23\x42\
+\x50\x4f\x14\xc7\xae\x14\xe7\x96\x71\xc4\x0e\x80\xe3\x3a\x8c\x11\
+\xe3\xfd\x8e\xc6\x0c\xe3\x27\x01\x91\x7f\x66\xc0\x66\xd8\x61\x55\
+\x25\x3b\x01\xa8\xd5\xc6\x33\xa8\x91\x82\x4c\x33\xc5\x4b\x58\x0c\
+\xf3\xb9\x7f\x9a\xb0\xfc\x6d\x47\xfb\xdb\xe8\xbe\x86\x36\xac\xf7\
+\x3c\xf2\x0a\xab\xfc\xe7\xc0\xb3\xaf\xbe\xcf\x45\x61\xb4\x5b\x2e\
+\xaa\x3c\x6a\x13\x77\x50\xf3\x48\x5e\x85\x64\x3a\x9a\xfb\xc8\xb6\
+\x7c\xb2\x5f\x6f\x51\x86\xe2\x7c\x23\x19\xe2\x02\x6d\x68\x76\xc0\
+\x46\x98\xe1\x87\x37\xc5\x49\x17\x61\x25\x50\x74\xb1\x67\x64\x85\
+\xfc\x0b\x18\x79\x41\x22\x70\x13\x23\x45\x13\x59\x05\x36\x73\x51\
+\x1e\x55\xe5\x58\xb5\xf7\x1e\x32\x8e\x01\xfa\x58\xe8\x35\x70\x0c\
+\x01\x3c\xce\xf6\x11\xf0\x7f\xc6\xaa\x9f\x8c\x7e\x46\x8a\x99\x3f\
+\xb6\xfd\x79\xe5\xdf\x67\x28\x02\x3f\x4f\xff\xc3\xb1\x82\x49\x00\
+\x26\xd2\xec\x9f\x83\x3f\x27\x00\x83\xc7\xe0\x99\x04\x83\xc7\x4e\
+\x82\x21\x63\x27\x93\x31\x10\x81\xfd\x2c\x53\xed\x3f\x4d\xab\xfc\
+\xa9\x1d\x2e\x67\xff\xf3\x73\x61\xd6\x82\x5c\x51\xf9\x23\xf0\x2f\
+\x57\x55\x3f\xaa\xe3\x09\xf8\xd9\x59\x48\x2d\x7f\x09\xfe\xab\x08\
+\xfc\x73\x05\xf8\x63\x2a\xe0\x8a\x35\xf9\x90\xb7\x96\xa7\x02\x52\
+\x30\xd0\xba\x02\xe5\x0e\x88\x87\xa2\x82\xd7\x17\x52\x04\xef\xea\
+\xfc\x22\x18\x38\x6c\x12\xbc\xfc\xb7\x8f\xa0\x0d\x03\xa4\x73\x52\
+\xc5\x73\x21\x05\xa6\xec\x34\xa2\xd0\x22\xee\x35\xc1\xd5\xf1\xe9\
+\x64\xd9\x8b\xab\xa5\x67\x93\x7d\xf1\x55\x70\xc1\x95\x9d\x48\x64\
+\xfa\xee\x27\xdf\xab\x0d\x0b\x24\x00\x3f\xf5\x1b\xcc\x1e\xcf\x61\
+\xd0\x73\xc0\x08\xe8\xc5\x1e\xe7\x09\x53\x67\xaa\x31\xc6\xdc\x45\
+\xb9\xac\xf2\xe7\xad\x7f\x54\xfe\x63\x07\x83\xac\x8d\x29\xd6\x78\
+\x03\x25\x1a\x52\xeb\x5f\x38\x19\x16\x32\xf0\x2f\xda\x56\x02\xdb\
+\x77\x14\x93\x93\x21\xe6\x17\x8c\x99\x34\x0b\x9a\x5e\x10\x52\x02\
+\xc0\x64\xd5\xae\x0f\x86\x75\xad\xac\x8e\x71\x86\x43\x4b\xdb\x10\
+\x66\x61\xbc\xfa\xd7\xc1\x5f\x2a\xe3\xbd\x72\xaf\x5f\x23\xc3\xc9\
+\x82\x70\x78\xc5\x56\x0a\x4f\xd0\x6c\x67\x1e\xcc\xbd\xc0\xa8\x73\
+\xed\x5a\x25\xad\xc8\xf9\x18\x86\xdb\x3e\x5f\xc9\x88\xc2\xb0\xf1\
+\x33\xa0\xf3\xdb\x5f\x88\x6b\x60\xa6\xc5\x13\x24\x3a\x28\x47\x9b\
+\x3d\x47\x36\x4a\x8a\x07\xcc\xf4\xce\xa7\x27\xa6\x55\xee\x60\x2d\
+\xc6\x12\x0d\x7b\xea\x06\xee\xb5\xe9\x82\xd7\x96\x00\xb8\xf9\x00\
+\xf8\xeb\x63\x2d\xb0\x16\x8a\x52\xd7\x16\x7b\xd0\xc5\x2c\xc7\x2d\
+\x88\xc3\xcd\x62\x31\x18\x21\xc9\xcf\xb9\x85\x5f\xb7\x11\x46\x5d\
+\x5b\x60\xd1\x9c\x0f\x6d\xe6\x3f\xae\x04\xc0\xea\x7c\x66\x0f\xdb\
+\x51\x8f\x2f\x06\x75\xc8\x30\xa2\xe6\xfc\x73\x69\x6e\x74\x55\xe8\
+\x1e\x18\x3f\x7d\x1e\x74\xfd\x61\x80\xf0\x59\xef\xa0\x0c\x85\x78\
+\xe5\x27\xc4\x7e\x96\xce\x43\xd0\xf1\x77\x99\x17\xd3\x50\x8c\xab\
+\x8d\x21\x95\x19\x6e\x1a\xfe\x18\x16\xa3\x23\xf5\x3b\xa3\x29\x84\
+\xc5\x4c\x36\xd9\x92\x50\xc8\x49\x00\x06\x22\x21\x11\x38\xa7\x65\
+\x7b\x48\xeb\xf8\x20\x0c\xcb\x9e\xc5\x48\xc0\x72\xc8\x66\x7f\x37\
+\xb6\xf0\x7b\x32\x60\xef\x21\x40\xbe\xe7\x00\x6c\xed\x8f\xa1\x83\
+\xe2\xbe\xde\x58\xf1\xb3\x83\xff\xc6\x54\xfa\xa3\xe0\x0f\xe7\xfe\
+\xbc\xfa\xb7\xb6\xfe\x79\xdb\x9f\x03\x7f\x0e\x03\x7d\x7e\x86\x8e\
+\x9b\x4c\xb9\x01\x43\xc7\x4d\x85\x11\xd9\xd3\x60\xd2\xf4\xb9\x0a\
+\xf4\xa7\xca\xaa\x7f\xae\xd9\xf2\x9f\x35\x3f\x97\x08\x00\x6f\x8b\
+\xf3\xd6\xbf\xde\xee\x5f\x90\xbb\xdc\x04\xfe\x65\x2b\x61\xf1\x72\
+\x0e\xfc\xb2\xfa\x5f\xba\x92\x67\x03\xac\x58\xbd\x0e\xf2\x18\x01\
+\x58\x45\xc9\x80\x22\x18\x88\x9d\xd5\x8c\x04\x20\xa0\xae\xcd\xdf\
+\xcc\xce\x26\xaa\xac\x69\xb6\xce\x0e\x3a\x03\x1e\x3c\x5c\x03\x27\
+\x4e\xfe\xc6\x3e\x2e\x87\x61\xa3\xa7\xc0\xab\x6f\xfe\x1b\xda\x64\
+\xde\x4b\x5d\x15\xda\xf5\xc7\x83\xe3\x18\x14\x07\x22\xa1\x44\xe0\
+\x6f\xca\x03\x7d\xce\x16\x8e\x7f\xfc\xe3\xab\xe0\x0f\xac\xfa\x7d\
+\xf8\x99\xd7\xe1\x8b\x6e\x7d\x68\x8c\xd2\x73\x20\x9e\x11\xd0\x7b\
+\x20\x12\x80\x59\xe2\xef\x42\xd1\x1f\xaf\xfc\xf1\x6f\x92\xe1\x46\
+\xcb\x09\xfc\xd7\x33\x62\xb2\x91\xb7\xfe\x45\x94\x31\xda\x18\x53\
+\x82\xe1\x8e\x12\xd8\x59\x5c\x4a\xf9\x05\x98\x5d\x50\xb1\x6b\x0f\
+\xe4\x4c\x5f\x08\x29\x17\x59\xed\xb0\x65\x82\xa4\x0a\xb0\xb2\x8c\
+\xaa\xc2\xbb\x8c\x52\xed\xaf\x03\x1a\x11\x01\x21\x4e\x6d\x24\xc6\
+\x01\xf2\xbd\x68\xed\x64\x05\x2d\x24\xc0\xeb\xe7\x79\x1e\x18\xee\
+\x95\x24\x72\x02\xf8\xc7\xd2\x32\x38\x4d\x1c\xb1\xc5\x20\xc6\x30\
+\xb8\x81\xf1\xf0\x53\x7f\x83\x71\x39\xf3\xe1\xbc\xcb\x6f\x50\x62\
+\xcd\xe8\xa3\x46\xb7\x93\xe1\xb0\xda\x96\xa0\xeb\xbf\x2f\xde\x11\
+\x80\xbd\xa0\xaa\x9d\x97\xbf\x27\x9a\x3a\xdf\x1f\xcf\x48\x22\xd1\
+\x89\x7f\xd1\x8a\x48\xa3\x16\x3a\x02\xe7\xee\xf9\x59\xd1\x57\x15\
+\xe2\x69\x8b\x44\x17\xe6\xc5\xce\x8e\x0c\x17\x9f\x7e\x6d\x1f\x3e\
+\x42\x2b\x24\xba\x9b\x5c\x28\x4a\x5a\x61\x30\xee\x59\x7e\xd4\x39\
+\xbf\xa3\x97\x40\x6d\x48\x40\xf4\xc7\x3e\xb6\x99\xb9\x7c\x33\x67\
+\x38\x3e\xbf\xdc\xab\x9c\x87\x87\xc8\x6e\x0a\x01\x25\xba\x90\x9d\
+\x97\x45\x2a\xf9\xd1\x39\x73\xe0\xdc\x56\xed\xcd\x95\xb0\xd4\x4c\
+\xed\x22\x99\xe9\xea\x6f\x9d\xac\x9c\x06\xed\xad\xb3\x60\x54\x1f\
+\x80\x24\x7f\xc8\x25\x49\xd0\xad\xcd\x66\x84\xed\x2c\x3b\xfe\x7c\
+\x79\xb1\xf7\xcb\xec\x00\x61\x1d\xcb\xfe\x5e\x8c\xf6\x3d\xef\x8a\
+\x1b\xe0\xbb\x1e\x43\x61\xc6\x82\x65\x90\x33\x7b\x11\x55\xf2\xdd\
+\xfb\xf1\x6a\xbf\x47\x7f\x41\x02\x18\xe0\xf7\x1e\xcc\xdb\xfc\x04\
+\xfa\x58\xed\x0f\xe3\xa0\xdf\xd7\x52\xf9\xeb\xe0\xcf\x09\x00\xaf\
+\xfc\x27\x2b\x02\x30\x74\x1c\x3b\xe3\xa7\xd0\x19\x36\x7e\x1a\x8d\
+\x20\x86\xb1\x8f\x31\x28\x68\x2a\xfb\xfd\xbc\xdd\xbf\x84\xdd\x4a\
+\xf0\x5f\x4a\x04\xc0\xac\xfc\x97\x29\xa1\x9f\x6a\xf9\x8b\xca\x5f\
+\x07\x7f\xac\xfa\x73\x57\xca\x44\x40\x76\x18\xf8\xe3\xee\x7c\x9e\
+\x88\x05\x5e\x8d\x23\x00\x6c\xa3\x0b\xf0\x27\x02\xb0\x1e\x41\xbf\
+\x90\x4e\xfe\xc6\x2d\x3c\x2d\x70\xd3\x56\x28\xd8\xbc\x0d\x4a\x2b\
+\xaa\xe0\xf8\xf1\x93\xf0\xeb\x6f\xff\xcb\xce\xff\xc0\xc9\x5f\xff\
+\x17\x36\x6d\xd9\x09\xdd\x7b\x0f\x87\xfb\x1f\x7d\x05\x7c\x17\x86\
+\xb8\xc7\x40\x33\xe1\xf5\xdf\xe4\x6a\x9e\xea\xd7\xe4\x1a\x95\xe4\
+\x87\x5e\x04\xdc\x63\x22\x9d\x3c\x08\xd0\x77\x00\xad\xa4\xf1\x31\
+\xfe\x65\xf0\x28\x18\x37\x69\x3a\x91\x99\x05\x4b\x44\xac\x31\xab\
+\xfc\x49\xf8\xb7\x7c\x0d\xcd\xfe\xf1\xbe\xaf\x5e\x2b\x5b\xff\xc2\
+\xc6\x58\x44\x18\x6f\xdb\x51\x4a\xe0\x5f\xa2\xc0\x7f\x37\xec\xde\
+\xbd\x9f\x22\x8a\x27\x4d\x5b\x08\xcd\x2e\xc8\xa2\xd7\x78\xb2\xd2\
+\xac\x84\xd4\x3a\x9e\x93\x67\xbc\x45\xe0\x6c\x03\xfe\x24\x59\xfd\
+\x8b\xad\x00\x65\x7c\x24\x47\x01\xd4\x31\xcb\x50\x63\x06\x35\xce\
+\x4a\x35\x7d\x2a\x54\xa8\x97\x3f\xcd\xfc\xd8\x27\x32\x03\xb4\x43\
+\x24\xa0\x19\xef\xda\xb5\xfa\x43\x47\x18\x3f\x79\x3e\xdc\x76\xdf\
+\x8b\xe6\xf8\xa2\x1e\xd2\xea\x3c\xbe\xd3\x5d\x7d\x07\xa0\x6e\x82\
+\x3b\x7d\x95\xda\x88\xb1\xe8\x0d\xb8\xe0\x54\x6d\xf4\x0b\x81\x06\
+\xe8\x60\xb8\xdb\xfb\x9f\x15\x69\x8d\x23\xfc\x8f\x33\x62\xb4\xde\
+\x8d\xbe\x0e\x11\x69\x5e\xe3\x9c\xd8\x64\x03\xe8\xda\x12\x00\xad\
+\xbd\xec\xf1\x47\xb2\xa5\x8c\xe0\x50\xe8\x66\xac\xe0\x16\x96\x61\
+\xd9\x3b\x0d\x45\x65\x79\xd6\x37\x55\x40\xb5\x15\xbd\xae\xab\x39\
+\x01\x77\x02\x90\x12\x72\x0c\xdb\xb1\x92\x91\xc8\xa4\xcc\xd2\x02\
+\x6d\xc1\xd7\x91\x50\x0d\xfe\xc9\xb7\x7d\x60\xc2\x8c\x05\xd0\xb6\
+\xc3\x43\x7c\x2d\x8c\xaa\xff\x90\xd5\xbd\x2c\xd2\xe3\xef\x22\x84\
+\x8c\x34\x4b\xf4\x6a\x6b\x54\xd1\xcd\x82\x9c\x32\xc9\x0d\xc7\x2e\
+\x83\x2e\x46\xc4\xd3\xd8\xcf\x89\x80\x1a\x0b\x88\xdf\x8d\xad\xed\
+\xe7\x5f\x7d\x1f\x72\x66\x2d\x81\xc9\x73\x73\xa9\x32\xef\x4e\xe6\
+\x3e\x23\x88\x04\xf4\x12\x95\x7f\xef\xa1\x63\xa8\xe2\xef\x3b\x9c\
+\x55\xfb\x23\xc6\x31\xb0\x1f\x4f\x73\x7e\x39\xeb\x97\xa0\xcf\x81\
+\x9f\x9f\x21\x04\xfe\x93\xa9\xe5\xaf\x2a\xff\x6c\x06\xfe\x13\xa6\
+\xc2\xf0\x6c\x3c\xd3\x60\xc4\x84\xe9\x74\x46\x4d\x9c\x41\xee\x80\
+\x33\x84\x02\x1e\xc1\x1f\x6f\x11\xf8\x25\xf8\x5b\x2b\x7f\x77\xf0\
+\x5f\x2a\x67\xfe\xab\x90\x00\xe4\x13\xf8\xe3\xec\x7f\xe5\x1a\x56\
+\xf1\xaf\x29\x20\xf0\xc7\xd6\x3f\x56\xfd\x4e\xe0\x8f\xaa\xfa\x0d\
+\x22\x2a\x18\xad\x82\x31\x29\x70\x0b\xab\xb2\xab\xf6\xee\x87\x53\
+\xa7\x7e\x63\x24\xe0\xff\x11\x11\xf8\x8d\xce\xff\x83\xfd\x07\x8f\
+\xc2\xe4\x69\xf3\xa1\xf3\x5b\x9f\xc0\x55\xe9\x37\x83\xa7\xc9\x15\
+\x0c\xfc\xaf\xe2\x95\x3f\xa5\x19\xf2\x94\x3f\x6e\xa7\x6d\x6a\x09\
+\xa4\x80\xf0\xc1\x27\x3b\x33\xe2\x35\x12\x16\x2d\x5f\x0b\x0b\x73\
+\xf3\x48\xf4\xc7\xc1\x7f\x35\x2c\x5d\xb1\x56\x85\x19\x61\x87\x02\
+\xe7\xfe\x1b\x90\x98\x6c\x61\xe0\x5f\xc4\x2d\x8c\x31\xbf\x40\x81\
+\x7f\xa5\x88\x2b\xde\xcb\x63\x8a\x0f\x1f\xae\x86\xe1\x63\xa7\xd1\
+\x0a\xab\xdc\x94\x31\x77\xf0\x33\x5c\x5e\x53\x01\x47\x20\xd4\xdb\
+\xff\x72\xfc\x45\x5f\x4b\x0d\x9a\x61\x3d\x16\x1d\x4b\xa6\xd8\xf9\
+\xb7\x12\x00\xd9\x0d\xe0\x47\xb4\xfe\xed\x04\x40\x26\x9c\x36\x4b\
+\x27\x51\xe6\xb9\xad\x02\x30\x66\xe2\x1c\x78\xe0\xf1\xce\x66\x06\
+\xc8\x19\x95\x74\x77\x3a\xe2\x7e\xad\xe3\x51\xbd\xc3\x11\x4e\xea\
+\xe2\xa9\xa8\x03\x67\xc8\x18\xc2\x88\x50\xf1\x1b\x61\x04\xc0\x51\
+\x04\x18\xbf\xda\x31\x14\x61\x65\xcd\x70\x30\xf1\x09\x59\x40\xc5\
+\x99\x00\xd8\x7e\x86\xdf\x39\xc8\xc7\xeb\x33\x62\x9e\xc1\x38\x12\
+\x0e\x3b\x01\xf0\x47\x32\xee\x89\x5f\xc3\xe0\xb5\x55\xb9\xe1\xc2\
+\xc4\xf8\x98\xab\xc9\x52\x8d\x98\x02\x2c\xe2\x55\xd0\x5b\x85\x84\
+\x41\x5b\x65\x6c\xa6\x06\xe2\x3a\x5f\xe3\x96\xed\xe1\x91\xe7\xdf\
+\x82\xb1\x33\xe6\xc3\x63\x7f\x7e\x47\x18\xc2\x64\x5a\x8c\x4e\x1c\
+\x45\x7c\x29\xa1\x18\xf4\x20\x46\x74\x02\x93\x1a\x1e\x18\xe4\xfe\
+\x5c\xeb\x7f\x9b\x61\x31\x4a\x4a\x4e\xb1\x8a\xb2\x92\x53\xf4\x8f\
+\x0d\xeb\xd7\xc5\x9a\x16\x8a\xc5\xd2\xda\xdf\x07\xbf\x0c\x9b\x04\
+\x53\xe7\x2d\x85\x09\xd3\x17\x90\xa2\xbf\xbb\x14\xfb\xa1\xd0\x6f\
+\xd8\x18\x0a\xfb\x41\xe0\xe7\x95\x3e\x03\x7e\x25\xf4\x9b\x48\xf3\
+\xfd\xa1\xac\xd2\x1f\x8a\x60\xcf\xce\x30\x04\x7b\xfc\x78\xcc\x14\
+\xd1\xf2\x9f\xcc\x2b\x7e\x04\x7e\x8c\x0d\x9e\xc0\xc1\x7f\xe4\x44\
+\x8c\x0c\x9e\x49\x5a\x84\xd1\xec\x16\x0f\x6e\x05\x20\xf8\x73\xc3\
+\x1f\x6b\xd5\x3f\x9f\xd6\xfb\x38\xf0\x4b\x95\xbf\xa5\xf2\x5f\xc1\
+\x5b\xfe\x38\xf3\xa7\xb9\xff\xaa\x7c\x1e\x07\xbc\x66\x03\xab\xa0\
+\x0b\xd8\xd9\xc4\xc5\x7f\xd8\xf2\x5f\x5f\xa8\xc0\x9f\xaa\x7e\x01\
+\xfe\x1b\x59\xd5\x6f\x82\xff\x76\xd8\xcc\xaa\x6c\x24\x00\x5b\x71\
+\xc6\x5e\x52\x0a\x87\x18\xa8\x22\x01\xf8\xf5\xb7\xdf\xe0\x14\x3b\
+\x27\x19\x29\x38\x71\xe2\x37\xa8\x39\x79\x12\xaa\x8f\x9f\x82\x35\
+\xec\xe7\x76\xfd\xb6\x17\x74\xb8\xf1\x21\xf0\x62\xaa\x5f\x53\xe1\
+\x3f\x20\xc5\xb3\x2a\x9a\x9a\x77\x98\x70\x84\x70\x4e\x8b\x10\xdc\
+\xf7\xe8\x6b\x30\x68\xc4\x64\x46\x00\xd8\xdf\x23\xaa\xff\xa5\x2b\
+\x79\xf7\x02\x43\x8c\x70\x2c\x81\xc4\x64\x53\xe1\x36\x02\xff\xa2\
+\xed\x25\x22\xbc\x88\x81\x7f\x59\x05\x03\xff\x2a\x01\xfe\x58\xfd\
+\x1f\x84\x83\x87\x18\x01\x38\x72\x94\x22\x89\xd1\xf1\x91\x2a\xf1\
+\x96\x99\x2a\xa4\x28\x29\xce\xb9\xae\x47\x1b\x07\xc8\xd7\x91\x0e\
+\xfc\x32\xfb\x80\xac\xb1\x5b\x04\x95\xd7\x3f\xef\x3e\x49\x02\x20\
+\x00\x5e\x10\x00\xd5\xfa\xf7\xa7\xd9\x08\x80\x1c\x03\xf0\x0e\xc0\
+\x35\xc1\xbb\x60\x6c\xce\x3c\xb8\xf6\xb6\xa7\xd5\xb8\xcc\xe3\x6f\
+\x88\x91\xed\x99\x31\x83\x8f\xa5\x9d\xce\x0b\x8e\x90\x1a\x71\x98\
+\xef\xf3\xda\xb4\xd4\x03\x8e\xe4\xe1\xcc\x7c\xbc\xc2\x3a\x00\xb1\
+\x82\x7c\x28\x46\x02\xe0\xae\x8a\xf7\x3a\x44\x45\x86\x33\x2f\xa7\
+\xb5\xb6\x50\x0c\x7b\xf8\x41\x9b\xef\xb4\x4b\x05\x9a\x12\x8a\x81\
+\xe8\x18\xae\x79\xcb\xb1\x0a\x5d\xdc\x08\x40\x7c\x9a\x81\x40\xd4\
+\x99\x4f\xa4\x17\x5e\xb2\x03\xb0\x45\x73\xd8\x0b\xfb\x1b\x24\x01\
+\x68\x21\x1c\xc9\x70\x7d\xb0\x65\x07\xb8\x22\x78\x0f\x8c\x61\xe0\
+\x87\x9d\x80\x24\xb1\xef\xed\x5e\xd1\x87\xa7\xa0\x45\x9b\xff\x85\
+\xc5\x01\xcb\x98\x60\x15\xcb\x6c\x5a\x8f\x3a\x91\x0e\xa7\x96\x7f\
+\x24\x62\x94\xec\x48\x8c\xcc\xea\xc0\xa3\x8c\x83\xf8\xbc\xb5\xe9\
+\x79\x06\xbc\xd1\xe5\x2b\x98\x36\x3f\x0f\xa6\x2f\x58\x46\x20\xcd\
+\x09\xc0\x28\x46\x0e\xc6\x40\x3f\x22\x00\xe3\x60\xc0\x08\x09\xfe\
+\xd9\x30\x88\x11\x00\x04\xff\x21\x63\x91\x00\xb0\x33\x36\x87\xc0\
+\x7f\xd8\x38\x06\xf4\xe3\x19\xc8\xe3\xc9\x96\x67\xba\xaa\xf8\x75\
+\xf0\xc7\xe0\xa0\xd1\x22\x32\x78\xcc\xe4\x99\x94\x21\x30\x76\xca\
+\x6c\x98\x32\x7b\x21\x11\x00\xb2\xfd\xcd\xd5\x54\xfe\xa4\xf4\x5f\
+\xc9\x2a\xe6\x95\x24\xf8\x5b\x62\xab\xfe\x97\x0b\xd0\x24\xf0\x5f\
+\xbd\x9e\x92\x00\xb1\x82\x5e\xb5\x96\x0b\xfd\xa8\xea\x17\x73\xfe\
+\xfc\x8d\x5a\xd5\xbf\xa9\x88\x81\x7f\x91\x22\x00\x38\x5f\x47\x02\
+\x80\x6d\x76\x3c\x98\x18\x88\x24\x00\xab\xee\xd2\xca\x5d\x50\x73\
+\xfc\x24\x9c\x60\xe0\x7f\xfc\xe4\x29\x38\x76\xe2\x57\x38\x7e\xe2\
+\x04\xd4\xe0\x39\xc9\xce\xf1\x13\x70\x8c\x7d\xbf\x60\xf3\x0e\xf8\
+\xe6\x3f\x7d\xc0\xe8\x74\x1f\xb7\x18\x4e\x0d\xa9\xad\x01\x6f\x4a\
+\x26\x8f\x36\xf6\x61\xca\x61\x06\xe5\x09\x20\x19\xbb\xe9\x8e\x67\
+\x18\x11\xc8\x61\x7f\x0f\x92\x18\x2e\x5a\x44\x91\xe2\xfa\x4d\x5b\
+\x88\x94\x28\xf0\xdf\xc1\x2a\xff\x92\x72\x28\xa7\xca\xbf\x0a\x76\
+\x55\xed\x61\xe0\xbf\x0f\xf6\xee\x63\xd5\xff\x41\x46\x00\x0e\x1f\
+\x82\x23\x47\x0e\x43\x75\x4d\x0d\xdd\xd7\xbf\xbe\xf1\x6f\xb1\x09\
+\x20\x44\x74\x3e\xc3\x25\xac\x2b\xe4\x68\x05\xac\x52\x43\xa5\x13\
+\xa0\xf2\x05\xc8\x50\xf1\xbe\x68\xae\x94\x84\x24\xa3\x25\x7f\x5f\
+\xe1\xa8\xa9\xb1\x65\xb3\x05\x2b\xfb\x76\xa2\xc5\xdf\xce\x7a\x84\
+\x36\x80\xbe\xef\xe3\xdf\x47\xf0\xc7\x28\xe8\x7f\x7e\xf0\x1d\x7b\
+\xad\x4d\x83\x26\x17\x64\xf1\x91\xdc\x69\xf6\x9c\xaf\xfb\x5a\x5c\
+\x62\xf6\xe4\x3d\x7e\x27\xd7\xdb\x8c\x5a\x0a\xd3\x63\x1d\x03\x9c\
+\xee\x8e\x80\x3b\xa6\x9c\x95\xd8\x24\x26\xf7\xd9\x83\xbe\x55\x90\
+\xec\xda\x8e\x36\x62\xfc\x03\x62\x57\xae\x86\x13\x00\x27\x71\xa3\
+\x11\x25\x31\x2a\x10\xa5\xd3\xe0\xe6\x08\x55\x9b\x3d\xd7\x90\x4d\
+\x77\x90\x1e\x66\xa9\xac\xbf\x98\xcd\x9d\xf9\x0c\xd3\x76\xd3\xb6\
+\x42\x47\x96\xbb\x29\x31\xb6\xca\xc9\x02\x38\x64\x21\x3b\x56\xa1\
+\x52\xa6\x10\xc8\x75\xa0\x60\x9f\x3e\x23\x26\xb1\x0a\x75\x16\x9c\
+\xdb\x4a\x80\xb3\x8f\x5b\xc2\x26\x8b\x0c\x04\xfb\xcc\x5f\xde\x7f\
+\xc9\xb4\xbd\xae\x82\xa0\x90\x33\x81\xf3\x99\xe9\x86\xf4\xef\x52\
+\x83\xa6\xc0\x50\x99\xfd\x64\x58\x44\x87\x91\x93\xcc\xb4\x04\x41\
+\x97\x3c\x81\xb0\xad\x05\x6a\xb7\xa6\x11\xf8\x34\x6a\xde\x1a\x3a\
+\xde\xf2\x18\xab\xd6\x67\xc2\xac\x45\x79\x30\x75\xf6\x62\x18\x3c\
+\x6a\x22\xcd\xfd\x4d\xe0\x9f\x68\xa9\xfc\x39\x01\xc8\x11\x95\xff\
+\x64\x05\xfe\xc3\x59\xc5\x8f\xee\x76\xa3\x18\x91\x18\x35\x61\x06\
+\x29\xd3\xc7\x4e\x9e\x23\x80\x5e\x9c\x1c\x71\x3b\x85\x83\x3e\x9e\
+\x71\x53\x67\x53\x86\x00\xda\x08\xa3\x40\x71\xe6\xdc\xc5\x62\xb7\
+\x7f\x25\x2c\x44\x65\x3c\x82\xff\x32\x3e\x23\xa7\xea\x7f\xb9\xa9\
+\xf6\x5f\xb6\x72\x1d\x09\xe6\x10\xfc\x57\x88\xca\x9f\x8c\x73\xd6\
+\xf2\x0e\xc0\x1a\x21\xf4\x5b\xb7\x91\x11\x80\x82\xcd\x04\xaa\x64\
+\xa4\x43\x6d\xff\x22\x55\xf9\x53\x4c\x30\x11\x80\x1d\x74\x38\x01\
+\x28\x11\x24\x80\xdd\xb2\x53\xc4\x4e\xd5\xfe\x43\x0c\xe8\x4f\x89\
+\x73\x92\x9d\xe3\x8c\x0c\x9c\x80\xe3\x78\x7b\xec\x38\xdd\x9e\x64\
+\x04\x01\xbb\x04\x38\x8e\x78\xe3\x9d\xcf\xe1\xbc\x3f\x5c\xcb\x43\
+\x8b\x10\x40\xc9\xcf\x81\x5f\xb0\x1b\x35\x0f\x70\xcb\xe1\xa6\x6d\
+\x21\xa9\x69\x6b\xb8\xe7\xa1\x97\x20\x7b\xca\x3c\x06\xfe\xec\x7e\
+\xe2\xbe\xff\x66\xbe\xee\xb7\x95\xdd\x87\x1d\x3b\x4b\xa0\xa4\xb4\
+\x82\xc0\xbf\x1c\x2b\x7f\x06\xfe\x7b\x58\xe5\x4f\xe0\xcf\xee\xd3\
+\x81\x43\x07\xe1\x10\x03\xff\x23\xd5\x47\xa1\xa6\xe6\x18\xdd\xaf\
+\x83\x47\x6a\x58\x05\xfd\xa4\x00\x0d\xe1\xd0\x97\x22\xac\x83\x85\
+\x28\x36\x29\x8a\xba\xde\x6b\xcb\x01\xc0\xb0\x2c\xee\xbf\x91\xc5\
+\x5d\xfd\xf0\xb6\x65\x06\x01\x3f\x3a\x65\xf2\x0d\x14\x7e\xeb\x25\
+\xcf\x80\x74\xb1\x05\xd0\x96\x1c\x37\x1b\x49\xbf\x02\xda\xca\x69\
+\x2b\x40\x9f\xdf\xd2\xe7\x29\x6d\xe1\x89\x3f\xbf\x4d\x16\xcf\xf7\
+\x3f\xf9\x37\x1e\xb0\x24\xc2\x8f\xdc\x00\xce\xdb\x20\x33\xf8\xd8\
+\x45\x81\xde\x18\xb4\x07\x91\x43\xdc\x42\xa7\xa1\xbb\x61\xd4\x13\
+\x86\xd6\x7b\x1a\x60\xa8\x1e\xef\xbc\x75\x9d\x4e\xb6\x5c\xf5\x63\
+\xbd\x40\x07\x13\xc4\x54\xdd\x6d\x2c\xdd\x9f\x64\x97\x14\x3e\x5f\
+\x20\x6a\x1e\xb6\x69\xff\x1b\x74\xe8\x42\xc4\x73\x7f\x23\xc5\x72\
+\x3a\x88\x0a\x53\xac\x95\x6b\x92\xbe\xfa\x28\xbe\x9f\xac\xec\x83\
+\xe3\x11\xcd\x85\x54\x55\xe3\xb4\x77\xcf\xdb\xb1\xed\xe9\xe3\xce\
+\xff\xea\x0a\x23\x19\x48\x65\xde\xf8\x28\xf7\x79\x17\xb3\x48\xaf\
+\xd3\x2a\x62\x4a\x78\x27\xc6\x1b\xa1\xe5\xe6\xb4\x4b\xec\x75\x20\
+\x6f\x26\xd8\x47\xd6\x98\x58\xbe\x17\xf6\x98\xe8\xf1\xab\xee\x63\
+\x23\xde\xb9\x08\xa8\x96\xab\x57\x5c\x98\x9b\x9e\x1f\x84\x57\xdf\
+\xfc\x8c\x3c\x03\xe6\xe5\xae\x62\xd5\xf8\x62\x9a\xe5\x9b\xa0\x3f\
+\x91\xcc\x6b\xe8\x48\x85\xbf\x68\xfd\xe3\x19\xc1\xc0\x1f\xab\xff\
+\x51\xac\xd2\x1f\x3d\x71\x26\x9d\xb1\x39\x73\x28\x1d\x70\x3c\x03\
+\x79\x0c\x08\x9a\xc8\x00\x3e\x67\xc6\x3c\x6e\x0c\x34\x83\x9d\xa9\
+\xf3\x60\x02\x85\x06\xf1\xe0\xa0\x6c\xf6\x35\xf4\x0c\x98\x28\x6c\
+\x83\x51\x24\x88\x24\x00\x41\x9f\x80\x9f\xdc\xf1\x56\x53\xd5\xbf\
+\x4c\x80\x3f\x82\xfe\x0a\xac\xfa\xa9\xf2\x5f\x0f\xab\xd7\x98\x6a\
+\x7f\xac\xfe\xd7\x31\x30\xcd\xdf\x50\x08\xeb\xa9\xea\xdf\x42\xf3\
+\x74\x55\xf9\x17\x6e\xb3\x80\xbf\x24\x00\xd4\x01\x28\x2a\xa6\x83\
+\xa3\x00\x24\x01\x5b\x04\x09\x28\x64\x1f\xef\x64\x20\x5c\x5d\x7d\
+\x9c\x84\x82\x35\xa2\x0b\x70\xec\xc4\x71\x3a\x27\x4e\x32\x02\x70\
+\xea\x57\xa1\x19\xf8\x0d\xfe\xe7\x7f\xff\x07\x0e\x1d\x3e\x0a\x03\
+\x87\x8e\x87\x4e\xb7\x3c\x4e\xeb\xa2\xdc\x30\xc7\xe0\x19\x03\x14\
+\x3e\xd4\x86\xf4\x03\x8d\x9a\xb4\x86\xc6\xec\xb9\x78\xe6\xc5\x77\
+\x20\x77\x79\x3e\x6c\xda\xc2\xc0\x9f\xdd\x87\x6d\x8c\x88\x14\x97\
+\x96\x42\x59\x79\x05\x54\x62\xe5\xbf\x7b\x2f\xec\xd9\x83\x95\xff\
+\x01\x9a\xfb\x1f\x64\xd5\xff\xa1\x43\x0c\xfc\x8f\x1c\x81\xa3\xd5\
+\x47\xa0\xe6\x18\x27\x00\x48\x46\x0a\x8b\x4a\x29\x99\xd0\x23\x55\
+\xf8\xb4\x6e\x97\x6e\x26\x60\xfa\xb8\xb8\x2f\x39\x8a\xfe\x84\x93\
+\x17\x3e\xfb\xa7\x11\x1a\x03\xf8\x7b\x1e\x7d\x0d\x9e\xfe\x4b\x17\
+\x78\xf2\xc5\x7f\xc1\x93\x7f\xfe\x27\x03\xee\x7f\xc1\x13\x2f\xfe\
+\x13\x1e\x7f\xe1\x9f\xf0\xd8\xf3\xef\xc0\x1f\x9f\x7d\x1b\x1e\x7c\
+\xfa\xef\x70\xdf\x13\xaf\xc3\xbd\x4f\x74\x66\xe7\x55\xb8\xef\xf1\
+\x57\xe1\xde\xc7\xf0\x74\x86\x7b\x1e\x7b\x0d\xee\x7e\xec\x15\xb8\
+\xfb\xd1\x57\xe0\x3e\xf6\xf1\x93\x7f\x7e\x07\xbe\xe9\x3e\x88\x11\
+\xc9\x19\xf0\xfc\xab\x1f\x92\x69\x11\x05\x2e\xd9\xac\xcc\xcf\xe8\
+\xf6\xbd\xaf\xae\xd5\x6d\x8c\x7e\xfc\xa7\x31\x88\xa7\x2e\xeb\xf3\
+\xa7\x21\x0e\xb8\xae\x6c\x30\xe0\xdc\x09\x70\x13\x01\xfa\xdc\x2c\
+\x28\xe3\xbf\x2f\x5e\xbf\x11\xc3\xae\x66\x28\x72\x3e\xb5\x2f\x0a\
+\x31\x12\x15\x2f\x3f\xa6\x33\x9f\x37\xee\xc7\xcc\x29\xa6\xd3\x6d\
+\xcf\x58\x0b\x53\x0a\x73\xd0\xb3\xb5\xc2\x53\xcc\xaa\x39\x0c\xf4\
+\x52\x42\x91\xcd\x33\xe8\x31\x0c\x37\xdf\x51\xc1\x23\xa9\x99\x70\
+\xdd\x1d\xcf\xd0\x36\xc0\x8b\xaf\x7f\x44\xe2\x23\x15\xad\xea\xd3\
+\x7e\xaf\x3f\xd6\x51\x4c\x64\x02\x90\xac\x6c\x4d\x75\xfd\x86\x61\
+\x99\xf1\x5b\xc9\x42\x28\x72\xd5\xe3\xb3\xd9\xb8\x2a\x17\xb7\x80\
+\xeb\x63\x23\x09\x9f\x57\x78\xc6\x5b\xd6\xb0\xd8\xc7\x57\x04\x6e\
+\x87\x6e\x3d\x87\x41\xee\xca\x0d\xec\xac\x67\x44\x60\x11\x03\x7a\
+\xde\xf2\x47\x12\x30\x84\xaa\xff\x29\x82\x00\x70\xf0\x1f\x8e\x1d\
+\x00\x5c\xf3\x1b\x3f\x1d\x46\x66\xcf\x60\xe0\xcf\xaa\x7b\x56\xc1\
+\x71\x02\x30\x87\x52\x02\x51\xf0\x87\xc1\x37\x39\xc2\x00\x68\xfa\
+\xec\x85\x30\x6b\x0e\x37\xfb\x41\x2b\x5c\x5c\x0b\xcc\x99\xb5\x90\
+\x72\x02\x26\x2a\xeb\x60\x9e\x16\x88\x6b\x81\x8b\x10\xfc\xa9\xe5\
+\xbf\x96\x83\xbf\x98\xf7\xeb\xe0\x4f\x73\x7f\x3c\xb8\xf3\x8f\xe0\
+\x8f\x67\x83\x49\x00\x36\x88\xb6\x3f\x1d\x1b\x01\xb0\x56\xfe\x02\
+\xf4\xb7\x95\xb0\xea\xbb\x84\x3a\x00\x5b\x45\x07\xa0\x68\x7b\x29\
+\x7d\xbc\x1d\x57\x06\x0f\x1d\x81\xe3\x27\x59\xf5\x7f\xea\x24\xbf\
+\x65\xe0\x7f\x82\x7d\x7c\xf2\xd7\x53\x70\xea\xd7\xdf\xe0\x57\x76\
+\x90\x04\xfc\xca\x3e\xe7\x02\xc2\xff\x85\xc5\xb9\xab\xe1\x91\xa7\
+\x3a\x83\xb7\xb9\x06\xfc\x78\x70\x7b\x80\xb6\x09\x5a\xd3\x56\x41\
+\xea\x85\x06\x7c\xfe\x75\x77\x02\x70\x54\xfc\xa3\xe0\xaf\x92\xd4\
+\xfe\x7b\x61\xaf\x98\xf9\xef\xa7\xb9\x3f\x03\xff\xc3\x0c\xfc\x8f\
+\x22\xf8\x57\x43\xb5\x00\x7f\x3a\xec\xe3\x9a\x9a\xe3\x30\x26\x7b\
+\x16\x0f\x46\x42\x3f\x8c\x66\x92\x04\x58\x35\x48\x5e\xb7\x00\x1a\
+\xbf\x09\x38\x72\x15\x30\x59\x90\xe7\xff\xf4\x18\xce\x9d\x34\x73\
+\xe6\xc3\xe8\x49\x73\x58\xd5\xce\xcf\xe8\x49\xe8\xa8\x39\x9b\x76\
+\xf9\x07\x8f\x9e\x0a\x03\x46\x4e\x81\xfe\x23\xf0\x4c\x62\xe0\x3e\
+\x1d\x46\x64\xcf\xa4\xaf\x0f\x64\x67\xd0\xe8\x29\xec\x4c\x83\x41\
+\x23\xa7\x43\x9f\x41\x93\xa0\xcb\xa7\xdd\x21\x74\xfd\xc3\x94\xc6\
+\x88\xab\x96\x7c\x93\xa7\x36\x8e\xae\xf1\x5d\x7b\x13\xb9\x0d\xe0\
+\x71\x8a\xf7\x75\x34\x88\x8b\x74\x3f\x1b\xa6\x1d\xef\x69\x20\xa0\
+\x8e\xf9\xc4\xf9\x5c\x9f\x95\xd8\x79\x43\xb4\x55\x87\x90\xe3\x8c\
+\xdc\xb2\x0e\xa6\xff\x7f\x7f\x5d\xda\xff\xd6\x30\x22\x7b\x15\x18\
+\xfe\x42\x0f\x17\x19\x9a\x9e\xe0\x6e\xec\x94\x03\x86\x47\x45\x1f\
+\xdb\x40\xc5\x57\x9b\xce\x45\x20\xc2\xce\xab\x11\x36\x63\xe7\x8f\
+\x5f\x86\x19\x4a\xa2\x57\xd7\x3e\xa7\xae\x41\xd0\x51\xf0\xe6\x14\
+\xa3\xeb\x48\xd4\xa4\x79\x89\x9f\x47\x8e\x36\x39\x2f\xc4\x2e\x50\
+\x53\xe1\xa7\xbe\x63\xc0\xc3\x2e\xc8\x5e\x51\x1d\xc9\xbf\x5d\xdd\
+\x17\x4b\x3c\x6f\xc8\x99\xe1\xfa\xdc\x09\x80\xda\x54\xd0\x3f\xb6\
+\xd9\xfa\x26\xbb\x10\x00\x9d\x08\xa8\xc7\xc4\x17\x34\x43\x6c\x94\
+\x79\x8b\x70\x7f\x94\xc4\xc7\x55\x54\x28\x3c\xdb\x35\x71\xaa\x0c\
+\x8d\x49\x6e\x11\x64\xd5\x9d\x01\x77\x3c\xf8\x17\x12\x61\xad\x5c\
+\x57\xc8\x00\x37\x9f\x2a\x76\x52\xf6\xb3\xaa\x7f\x88\x54\xf8\x8f\
+\xe5\xb7\xe8\xf6\x87\x23\x00\x04\x7f\xec\x00\x8c\x99\x84\xd5\xff\
+\x2c\x5e\xfd\x4f\x9d\x4d\xa9\x80\x93\xd8\x99\x8c\xc9\x77\x8c\x00\
+\xa0\xef\xff\xf4\x39\x8c\x00\xcc\xc5\xf8\x5b\xe1\xf3\x2f\x7d\xfd\
+\x17\xaf\xa0\x70\x1f\xdc\x0e\x98\x32\x07\x83\x82\x16\x12\x31\xc8\
+\x61\xa4\x01\xcd\x81\x70\xf6\x8f\x2d\xff\xe5\x34\xef\xcf\xa7\xa0\
+\x9c\x55\xa2\xed\x8f\xd5\xff\x2a\xcd\xec\x87\x56\xe8\x36\x6e\x66\
+\xe0\x5f\x28\xaa\xff\x70\xe0\xb7\xb7\xfd\xf9\x29\x56\xad\x7f\x3a\
+\x3b\x39\xe8\x6f\x63\xb7\xe8\x15\x50\x84\x9f\xef\xe4\x84\x00\xdb\
+\xf0\xc7\x4f\x72\x02\x40\xe0\x4f\x1d\x80\x13\xbc\x0b\xf0\x2b\x3f\
+\x8a\x0c\xe0\x2d\x7e\xfd\xd4\x6f\x90\xb7\x6a\x23\x11\x01\x4f\xd3\
+\xab\xc1\xd3\xa4\xb5\x22\x02\xb4\x5a\x28\xbc\x04\x90\x10\x64\x5e\
+\xf7\x00\x7b\x9c\x96\xc2\xae\x2a\x56\xf5\xef\xdb\xc7\x81\x9f\x55\
+\xfd\x07\x0e\x1e\x86\x83\x87\x8f\xc0\x61\xaa\xfa\x8f\x42\x75\x4d\
+\x35\xab\xfc\x6b\x44\xf5\xcf\xc8\x08\x76\x24\xd8\xe7\xc7\x6a\x6a\
+\xd8\xf7\x8e\xc3\xf3\x2f\x77\xa1\x98\x63\x6e\x79\x2c\x77\xf1\x03\
+\x14\xe7\xeb\x6c\x70\x25\x47\x73\x56\xe1\x2a\xe9\x64\xc8\x23\x23\
+\x0b\x9a\x9c\x9f\x05\x4d\x2f\x6c\x0f\x4d\x2e\xe8\x00\x4d\xf1\x63\
+\x3c\x17\xb4\xa7\xaf\x35\xbb\x90\x7d\xff\x82\x4c\x68\x7a\x5e\x06\
+\x9c\xdb\xca\x80\x73\x5a\x06\xa0\xc5\x1f\xb2\x60\x24\x23\xdb\xbf\
+\x0c\x9d\x00\x8d\xfd\x6d\x28\xbd\xf1\x9c\x16\xe9\xfc\xe0\xa8\x00\
+\xd7\x27\x9b\xb4\x21\x92\xe2\x6d\xc6\xc8\x29\x8d\x29\x8c\x08\x6d\
+\xf5\xd3\x0c\x54\xb5\x06\xe9\xd3\xe1\xc5\x92\x88\x2c\x83\x86\xa9\
+\xf2\xf1\xf9\xf6\xb8\xe2\x4f\xa8\x3e\x3b\x00\x31\x80\xb1\x7e\x71\
+\x57\x60\x15\x2e\x52\xd1\xab\xd6\xf8\xf2\x04\x02\x31\x6d\x2f\x78\
+\x5d\xc3\x87\xac\x2d\x78\xaf\xd8\x83\x37\x5b\xfc\x36\x85\x29\xb1\
+\xec\x74\xd7\x2c\x82\xf8\x67\x48\x91\xd6\x2e\x8d\xf0\xd4\x46\x3b\
+\x48\xa5\x84\x77\x01\xc2\x41\x35\x14\x55\x08\x97\x64\xb7\xec\xb5\
+\x28\xe5\x4d\x57\x3d\x9c\x47\x62\xb6\x3c\x56\x2b\x57\x07\xee\x34\
+\x4d\x83\x08\x48\x0d\x8d\xa4\x38\x8d\x29\x42\xce\x29\x6a\x4e\x6b\
+\x94\x6e\x2a\x6c\x7f\xd0\x71\x1b\xc0\x35\x8b\xc2\x67\x0b\x8a\xa2\
+\x96\xbe\x21\x4e\x40\xd3\x11\x84\x5c\xac\x83\x0d\x15\x1d\x8c\x39\
+\xf6\xfc\xd6\x10\x96\xb1\xbc\x43\xd2\x58\xb4\x78\x9b\x9d\x9f\x01\
+\x4f\xbe\xf0\x0e\xcc\x9c\xb7\x9c\x81\xe9\x16\xc8\x5d\xb9\x8e\xda\
+\xf8\x43\xa9\x03\x30\x85\x46\x04\xa8\x01\x18\xce\x0e\x0a\xfe\x46\
+\xa1\xaf\xc2\xc4\x19\x0c\xfc\x67\xc3\x38\x76\xb2\xa7\x20\xf8\xcf\
+\x11\xe0\xbf\x80\xec\x7f\x29\xfd\x6e\x36\xf7\xfc\xa7\x9d\x7f\x76\
+\xe6\x88\x94\x3f\x6e\x88\xc3\x8d\x7e\xa4\xd2\x1f\x83\x7d\x90\x14\
+\xa0\x59\x90\xb4\x13\x9e\xc3\x08\x03\x76\x01\x56\xad\xe1\x82\xb9\
+\xd5\xe2\xa0\xd3\x1f\x85\xe6\xc8\xb9\x3f\xa9\xfd\x45\x78\xce\x26\
+\xeb\xcc\x9f\x5a\xfe\x0c\xf4\x2d\x6d\x7f\x8b\xf8\x4f\x56\xfd\xa5\
+\x04\xfc\x45\x0c\xf8\xb7\x15\x97\x11\x01\xd8\x81\xa7\xb8\x1c\xb6\
+\x97\x94\xc1\x76\xf6\xb5\xaa\x3d\xfb\xe0\x04\x23\x00\x27\x4f\x9e\
+\xe4\x07\x89\xc0\xa9\x53\x74\x4e\x9d\xe0\x5f\x3b\x85\x1f\xe3\xd7\
+\xd8\xe7\x27\x70\x64\x40\x55\xfa\x49\x58\xba\x22\x1f\xee\x7e\xf0\
+\x05\xbe\x46\x28\x36\x08\x90\x04\x20\x19\x45\xa3\x21\x74\x1a\x3c\
+\xb7\x65\x3a\x7c\xf0\xc9\xf7\xb0\x6b\xcf\x01\xea\x3a\x1c\x3a\x72\
+\x84\xd4\xfe\x47\xaa\x8f\x10\xf0\x63\xa5\x8f\xed\x7e\x04\xfd\xe3\
+\xea\x67\x1f\x23\x02\x50\x83\x82\xc0\x9a\x63\x50\xb9\xeb\x00\x5c\
+\x7a\xf5\x0d\x7c\x3d\xb1\xb9\xc8\x0c\xf0\xe9\x36\xd3\xf6\xd7\x75\
+\x48\x8b\x40\xb7\x77\xd1\x84\x06\x40\xb8\x66\x7a\xa4\x7b\xa6\xb4\
+\x4b\x6e\x21\xc4\x81\x14\xba\x94\x21\x5e\xa7\xe9\xd0\xe9\xd6\xa7\
+\x18\x01\x98\x05\x7f\x7f\xef\x1b\xe1\x97\x20\x53\x3a\x45\x5c\x77\
+\xb3\x80\x88\x60\x4e\xe7\x44\x1c\xbf\xa6\x92\x1a\xdd\xae\x47\x81\
+\xb8\x00\xd3\xeb\x4b\xa4\x30\xed\xf7\x37\x33\x4f\x28\x40\x9f\x19\
+\x1a\x80\xfa\x20\x00\x86\xcb\x3a\x60\x30\x5c\xad\x9d\x22\x82\x60\
+\x9c\x82\x7c\xd4\x85\xdf\x69\xf6\x9b\xc8\xa0\x86\x08\x24\x80\xe6\
+\xd9\x86\xcb\x58\x42\x10\x84\x3a\xc5\x36\xba\x19\x45\x38\x0b\x33\
+\xbd\x31\x12\x00\x3d\x8a\x34\x56\x9f\x04\xab\x32\x36\xe8\xba\x32\
+\x98\xac\x93\x1f\x76\x01\xba\xfe\xae\x67\x69\xee\xf8\xdc\x2b\xef\
+\xd1\x18\x80\x03\x69\x40\x85\xa2\x78\xed\x6b\x76\x16\x32\x60\x98\
+\x3e\x09\x4e\xea\xfd\x14\xad\x9a\x8a\xb4\xf2\x17\x96\xf1\x6d\x6f\
+\xf5\x47\x61\xe0\x92\x04\xf8\xc3\xb3\xd3\xf5\xc0\x20\x6b\xa4\x70\
+\x40\x11\x80\xe4\x54\xc3\x62\x18\xc3\x85\x5c\x78\x42\xd0\xfc\xa2\
+\x4c\xf8\xf3\xeb\x1f\x32\xe0\xcd\x23\x81\xda\x92\xe5\x6b\x69\x76\
+\x8f\x2b\x7f\xc3\xc6\xa2\x00\x70\x8a\x20\x00\x42\xf8\xc7\xc0\x7f\
+\xfc\xe4\x39\x8c\x00\xcc\xa5\x48\x60\x8a\xfb\x9d\xb9\x90\xac\x7f\
+\xb1\xf5\x3f\x73\xce\x62\xe5\xfa\x87\x5e\xff\xbc\xfa\xe7\x31\xb8\
+\x72\xd7\xdf\x5c\xf5\x5b\x07\x4b\xd9\xc1\x79\x3f\xb6\xff\x17\xb1\
+\xef\x63\x3c\x30\x8e\x0d\xe6\x2f\x5a\x4e\x9d\x00\x12\xfb\x89\xca\
+\x1f\xbd\xfe\xf3\xc5\xdc\x9f\xd4\xfe\x34\xf3\xdf\x2a\x66\xfe\x45\
+\x96\x96\x3f\x12\x80\x42\x01\xfe\xb8\xfa\x57\x48\xad\x7f\xd9\xf6\
+\x2f\xa6\x4a\x9f\xaa\xfe\x1d\x9c\x00\x6c\xdf\xc9\x40\x9f\x80\xbf\
+\x1c\x76\x96\x56\xc0\xce\x12\x7e\x8a\xd9\xc1\x75\x3c\x22\x01\x08\
+\xf2\x74\x2b\x08\x81\x00\x7c\xf3\xc8\xf6\x3c\x56\xeb\xa2\x6a\xaf\
+\x3e\x01\x53\xa7\x2f\x84\x8c\x8e\xf7\xc3\xd9\xe7\x5e\x2d\xc0\xb1\
+\x1d\x59\x56\x7b\x44\xe7\x11\x75\x1d\x1d\x6e\x7c\x0c\xf2\x56\x6e\
+\x24\x12\xb2\xa1\xa0\x88\x11\x9c\x2d\x64\x5c\x84\x64\x64\xef\xbe\
+\xc3\xb4\xfe\x77\x1c\xc5\x89\xc7\x4e\xb2\xca\xff\x38\x81\xbf\xf9\
+\xbb\x6a\x60\x42\xce\x1c\x22\x16\x3c\xec\x88\x5f\x17\x92\x6d\x1d\
+\xb5\x64\x56\xcc\x24\xa7\xb8\x8c\xdc\xf4\xb5\xd6\xd4\x90\x0a\xeb\
+\xf1\x28\x3f\x80\x4c\xe5\x05\xc0\x09\x01\x6e\x04\xb4\xe7\x84\x81\
+\xbd\x9f\xde\x7a\xff\x5b\x32\xde\xba\xf9\xde\x17\xb8\xfe\x81\x82\
+\x98\xf0\x3d\x68\xb0\xc3\xab\x7d\xbc\xf5\x36\x33\xe8\xe3\xa4\x98\
+\xdb\xf2\x75\x74\xb4\xf3\xd5\xb6\x92\x35\xfe\x0b\x00\x3d\x23\x6e\
+\x42\x23\x09\x80\xd7\xf7\xbb\x23\x00\x81\x38\x2a\xd9\xc8\x2d\x19\
+\x4b\x8b\xd5\x4d\x08\xe6\xd7\x80\xa1\xde\x1f\x30\xb1\xa6\x28\xe6\
+\xf9\x5e\x9f\x04\x77\x21\x68\xf3\x19\xda\xef\xb7\x93\x04\xde\x25\
+\xf0\xd4\x59\x11\x6b\xc4\xde\xc6\xf2\x87\x1c\xc1\xda\xbe\x71\x11\
+\x5b\x46\x76\xc8\xd2\x95\x51\x33\x3d\xb7\xb0\x0f\xf5\x58\x19\x54\
+\xed\x37\x6d\x95\x01\x83\x46\x4f\x85\x9e\x03\xc7\xb3\xca\x23\x4d\
+\x3c\x7e\x72\x44\xe2\x70\xf1\x93\x63\x1f\x5b\x1e\x41\x52\x04\xb3\
+\x22\x33\xd4\xc7\xdc\x18\x09\x5b\xef\xf3\xc5\xd2\x62\x8b\x3c\x33\
+\x54\xbf\x43\x6d\x21\x18\x1a\x09\xd0\x43\x50\xac\x1f\x9b\x36\xae\
+\x19\x8a\x08\x34\x26\xb5\x37\x4f\x5c\xf4\x30\xa2\xd0\xec\x82\x0c\
+\x78\xfe\xaf\xef\xc2\xcc\xb9\xcb\x18\xd8\x16\x32\x40\xce\x87\xc9\
+\x33\x16\xc0\x08\x39\xff\x9f\x38\x9d\x54\xfe\x63\x27\xa3\xe8\x8f\
+\x83\xff\x24\x0c\x02\x9a\xb9\x40\x04\xfe\x2c\x24\x85\xbf\x4c\xc0\
+\x9b\xbb\x70\x19\xcc\x5b\xa8\x9b\xfd\x58\x2d\x7e\x49\xf0\xa7\x29\
+\xfd\x69\xd6\x8f\xde\xfe\xeb\x36\xd2\xbc\x1f\x8d\x73\xe6\x2f\x5e\
+\x01\x8b\x96\xe4\xd1\xf7\x70\x1f\x3f\x7f\x83\xd8\xf3\xdf\xb0\x55\
+\xb9\xfb\xf1\x35\xbf\x70\xb1\x9f\x5e\xf9\x73\xa1\x5f\x31\x07\x7f\
+\x76\x8a\x76\x96\xf0\x8a\x5f\x54\xfd\xdb\x8a\x39\xf8\xef\x2c\x46\
+\xd0\xaf\x84\x9d\x65\xfc\xa0\x32\xbf\x98\xdd\x16\x97\xef\x82\xaa\
+\xaa\xbd\xac\x02\xe7\x80\x4f\xa3\x00\xac\xfe\x8f\x9b\xe0\x4f\x9b\
+\x02\x27\xcc\xf9\x3c\xb6\xe7\x6b\x64\x95\x5e\x7d\x0c\x0e\x1d\x3e\
+\x06\x3f\xf5\x1a\x0a\x2d\x2f\xce\xe4\xad\x7a\x11\x99\xed\x51\xa1\
+\x44\x19\x34\x9e\x69\xdc\x22\x8d\x81\xb4\x79\x1a\xfb\xdb\x41\xf3\
+\x56\x06\x5c\x72\xe5\x75\x10\xea\xf8\x00\x3c\xfc\xf8\xab\xd0\xe5\
+\xc3\x6f\x60\xd8\x88\x49\xec\x6f\xdf\xce\x7e\x6e\x0d\x69\x01\x6a\
+\x8e\x9d\x80\x3f\xfd\xe5\x1d\x6e\xc2\x43\x23\x27\x33\x59\xd3\x34\
+\x09\xd2\x3a\x4a\xb6\x11\x24\x1f\xa1\x65\xa8\x68\x60\x74\x00\x34\
+\xd7\x5b\xb5\xee\x80\x88\xe9\xe6\x1b\x37\x3c\x7e\xb9\xf9\x05\xed\
+\x61\xf8\xb8\x59\x8c\x00\xcc\x83\xe6\x17\x66\x71\xd0\xf7\x49\xd0\
+\x17\x62\xe5\xe6\x3c\xe1\x8d\xc0\xbf\xb9\x61\x01\x66\xfe\x7e\x3b\
+\xd3\xd6\xfb\xfe\x5b\x49\xc1\xef\x6a\x0b\x20\xd1\x7b\xa0\xa1\x18\
+\x40\x87\xaf\x6e\x79\xfc\x41\x9b\x10\xcf\x36\x6f\xf7\x45\xde\x17\
+\xf7\x46\x65\xb2\xb5\x61\xb6\x36\x15\xbe\xb2\xc3\x0d\x68\x73\x2b\
+\x73\x5e\xef\xf1\xc9\x55\xbd\xf4\xd8\x44\x83\x71\xef\xb8\x06\xa2\
+\x12\x81\xda\xbc\xc9\xdc\x46\x2a\x1e\xc7\x35\x43\x97\x04\x2b\xba\
+\xd0\xa5\xd3\xc5\xf6\xad\x0f\xbf\x83\xe1\xd9\xb3\x20\x74\xdd\x1f\
+\x21\x89\x55\x25\xde\xe6\x51\x4c\x98\x1c\xb6\x03\x92\x5c\xdc\xf9\
+\xcc\x76\xbc\x11\x66\xa7\xec\xf5\xeb\x5a\x83\xd8\x09\x80\xc7\xa1\
+\x7a\x51\x1d\x04\x39\xe6\xf0\x1b\x2e\xf6\xc4\x86\x2d\x41\x50\x80\
+\xbf\xb8\xcf\xc9\x96\x9c\x02\xe1\xec\x46\x1d\x93\x34\x9a\xd3\x36\
+\x69\x11\x80\xa7\x5f\x7c\x9b\x55\xf4\x4b\x59\x95\xbd\x8d\x01\xf2\
+\x66\x98\x3d\x7f\x19\x8c\x9d\x34\x93\xe6\xff\x38\xfb\x47\xf0\xcf\
+\x99\x39\x0f\x26\x53\xdb\x7f\x01\xcc\x60\x04\x60\xc6\xdc\x85\x24\
+\xfa\x23\xab\x5f\xac\xfc\x17\x2e\x87\x79\x8b\xa4\xe1\x0f\x77\xc4\
+\x53\x46\x3f\xc2\xde\x77\x99\x30\xf8\x59\x2e\xe7\xfd\x6b\x85\xc8\
+\x6f\x3d\x57\xf8\xe3\x7e\xff\xca\xb5\x1b\x19\x19\x58\x0b\x4b\x96\
+\xad\x66\x1f\x17\x88\xca\xdf\x14\xfd\x21\x01\x28\x60\x04\x60\xd3\
+\x96\xed\xce\x2d\x7f\x34\xfd\x61\x04\xa0\x48\xb4\xfc\x8b\x76\x70\
+\xd0\x47\xa1\x1f\xb6\xf8\xa9\xd5\x5f\x5a\x0e\x3b\xb0\xf2\xc7\xaa\
+\x1f\x41\xbf\x14\xc1\x7f\x17\x03\xff\x5d\x50\xca\x4e\x19\xde\x32\
+\x12\x50\x59\xb5\x8f\x91\x80\x53\x0c\xf0\x19\x11\x38\xce\x41\x5f\
+\x3f\x48\x00\x8e\x1f\x37\xe7\xf3\x35\x24\xd4\xab\xa1\x56\x3e\x3f\
+\xc7\x59\x45\x5f\x09\x7f\x7c\xf2\x35\xf6\xb8\xa7\x29\xb3\x1d\xca\
+\x20\x90\xd5\xb6\xf6\xba\x23\x87\xc1\x54\xee\x60\xc9\x3b\x5a\xed\
+\xb8\xb8\x10\x75\x05\xe7\x5e\x0d\x8d\xce\xbd\x0a\xae\x4a\xbb\x15\
+\xfe\xf1\xd6\x67\xb0\x74\xd9\x3a\x28\xab\xdc\x07\x17\x5f\x7d\x13\
+\x01\x74\x63\x7f\x7b\x91\x74\x28\x36\x64\xa8\x93\xa9\x6d\x98\xa4\
+\x58\x89\x6a\x98\x9d\x70\xaa\x74\x9b\x0c\x6a\x21\x5d\x19\xc2\xf8\
+\x28\x8b\xb6\x05\x30\x54\xcb\xdb\xb2\x23\xdc\x74\xd7\x73\x8c\x14\
+\xce\x83\x4f\xbe\xfd\x45\x09\xfb\x30\xcc\x45\x56\xfd\x52\x7c\xcb\
+\xc1\x5f\x90\x01\x7b\xba\x66\x3d\xa9\xde\x3d\x75\x16\x6c\x27\x96\
+\x0c\x84\xb9\xb2\xfa\xce\x2c\x52\xe1\xf1\x47\xd3\x0f\x18\xbf\xe7\
+\x11\x40\x94\xa3\x2e\xe0\xa1\x88\xd5\xbf\x7a\xb1\x5a\x04\x2c\xd1\
+\xf6\xed\x03\x8e\xda\x03\xbb\x51\x4e\x6c\x81\x3e\x01\x73\x05\xd0\
+\x22\x18\x33\x1c\x08\x4b\x20\x06\x2f\x85\x50\x2d\x9f\xd8\x40\x44\
+\x0b\x66\x8f\x3f\x58\xeb\xe4\x46\xd7\x99\xb9\x4b\xbc\xa7\x75\xdd\
+\x4e\x5c\xdc\xc4\xfc\xb1\xc3\xad\x4f\x31\x02\x30\x9b\xe6\x93\x24\
+\x42\x6a\x2e\x1e\x2b\x6d\xb7\x5e\xae\x4b\x25\x87\x69\x0a\x42\x16\
+\xd3\x24\xe7\x2d\x05\x5b\x4c\xb0\xd3\xa6\x80\xcf\x8d\xec\x84\xdb\
+\x28\x47\x1b\x09\x58\x57\x54\x75\xf2\x61\x84\x39\x27\xca\x8b\xbb\
+\x5c\x21\x4c\x56\xf7\x55\xa6\xc7\xc9\xfb\x90\x46\xe6\x2d\xb4\xd3\
+\xdd\xfc\x1a\x38\x27\x05\x43\x5b\x5e\x83\x89\x53\x17\x32\x90\xdd\
+\x49\x60\x8b\x46\x3d\x08\xfc\x39\x42\xf0\x37\x7d\xd6\x42\x9a\xf7\
+\xcf\x9c\xbb\x88\x81\xff\x62\x72\xfc\x9b\x2b\x12\xfe\x28\xda\x57\
+\xa4\xe0\x2d\x5c\x66\xae\xfb\x2d\x16\xab\x7e\xdc\xde\x57\x08\xfe\
+\xa4\xb5\x2f\xb6\xfa\xd7\x71\x91\x1f\x2a\xfc\x71\xbf\x9f\x62\x72\
+\x37\x71\x67\x3f\xd4\x04\xe0\x76\x00\x3a\xfe\x71\xe0\xdf\x4e\x36\
+\xba\x96\x35\xbf\x22\x2e\xf4\x2b\xdc\x66\xee\xf8\x73\x91\x1f\x17\
+\xf8\xf1\x56\x3f\x9f\xf3\xd3\x11\xa0\x8f\x95\x3f\xaf\xf8\x2b\xd8\
+\x2d\xfb\x98\x55\xfe\x65\xe5\x08\xfe\x95\x50\x8e\xb7\xe5\x55\x8c\
+\x04\x54\x91\x2f\xff\x09\x22\x01\x1a\xf0\x8b\x19\x3d\x9f\xcd\xeb\
+\xe7\x38\x91\x80\x6a\x22\x01\x35\x5c\xc5\xcf\xce\x89\x93\xbf\xc2\
+\xd0\x11\x13\xa0\xd5\x65\x1d\xd5\x6b\x30\x49\x17\xb8\x8a\xc2\xa3\
+\x91\x3f\x43\x54\xc6\x86\x4a\xbe\x24\x3b\xe2\xa6\x57\xd3\xf1\x34\
+\xe5\xd6\xc4\x49\xcd\xdb\xb2\xd7\x74\x1b\xb8\xee\xd6\x27\xe1\xe1\
+\xa7\xdf\x64\xcf\x77\x07\x68\x4c\x01\x58\x59\x56\x02\x10\x46\x76\
+\x03\x0e\xd9\x16\x5a\x30\x96\xa6\x21\xe0\xe4\x40\x26\x03\x66\x52\
+\x18\x95\xb7\x45\x47\xd2\x0b\xbc\xfb\xef\x1f\x48\x0c\x7a\xf7\x23\
+\xaf\x12\x39\xe0\xf9\x1d\x21\x45\xc4\xcd\x62\xc5\x08\x17\xff\xaa\
+\x6e\x61\x3c\xb1\xb8\xa1\x5a\x14\x32\xd6\xf7\x60\x6c\x1d\xdb\x50\
+\x84\x64\xbf\xda\x01\x61\xd8\xdf\xe8\x33\x0b\xca\xd8\xb4\x59\xc6\
+\x69\x00\x66\xfb\x46\x9a\xf1\xdf\x40\x00\x8c\x08\x15\xa8\x76\xc1\
+\x77\xa9\xe0\xbc\xf6\xc0\x1e\x9f\x2d\xad\xcf\x67\x44\xd8\xe5\xb7\
+\x6e\x01\xd4\xde\xbf\x20\x60\x51\x8a\xbb\x3b\x13\x46\x22\x00\xa1\
+\x84\x3f\xa1\x16\xa5\xbf\x2f\x18\x83\xe3\x60\xfc\xc4\xc0\xd5\x32\
+\x38\x4c\xbd\x6f\xb0\x6a\xc8\x80\x3e\x43\x73\x60\xe0\x98\xe9\xe0\
+\x3b\x3f\x8b\x57\x21\x3e\x49\x00\x32\x23\x6e\x1b\x78\x5d\xbc\xca\
+\x3d\x2e\xa9\x80\xc9\xc2\x4c\x2a\xf1\x02\xa5\xa0\x46\x16\xac\x1d\
+\x16\xa7\x0b\xb8\xac\xfa\xcd\xc0\x98\x0c\x1b\x01\xd0\x46\x17\x4a\
+\x50\x9a\x4e\xeb\x82\x64\x75\xdb\x8c\x13\x01\x6f\xf3\xd6\x70\xeb\
+\xdd\x7f\x82\x7e\x83\xc6\xc3\x86\xcd\x5c\x5c\x87\xf3\x78\x9c\xe9\
+\xd3\xcc\x7f\x1e\x5f\xf7\x43\xc5\x3f\x01\xff\xa2\x15\xd4\xba\xc7\
+\xd6\xff\x42\xf6\x6f\xc8\x0f\x9f\x11\x00\x9c\xf9\x2f\xc9\x5b\x4d\
+\xd5\x3f\xce\xfb\xb9\xb5\xef\x7a\x72\xf9\xe3\xce\x7e\x5a\x98\x8f\
+\x74\xf6\x23\xf0\x97\x22\x3f\xf4\xf3\xe7\xf3\x7e\x14\xff\xa1\x1e\
+\x00\x49\xc9\xa6\xad\xce\x62\x3f\xcb\x8a\x1f\xce\xfa\x65\xcb\x5f\
+\xcc\xf9\x77\x88\x19\x3f\xaf\xf8\x79\xd5\x8f\x15\x3f\x02\x7f\x29\
+\x55\xfc\x15\xb4\x9e\x47\xe6\x3c\x8c\x00\x94\x97\xef\x86\xf2\x8a\
+\xdd\x50\xc1\x48\x00\x1a\xf4\x9c\x10\xe3\x00\x4e\x02\xa4\x59\x90\
+\x00\x7e\x46\x04\x6a\x04\x19\xa0\x2e\x80\x98\xd3\x57\x1f\xe3\x73\
+\x7b\xda\x2a\x38\x79\x8a\x48\xc9\xed\xf7\x3f\xaf\x55\xe2\xa2\x05\
+\x9f\x92\x61\x3a\xf4\xb1\xe7\x44\xfa\x09\xd0\x4a\xa1\xdc\x22\x20\
+\x32\xd0\x86\x56\x0c\xd1\xf9\x91\xde\xc3\x94\x83\xd1\x81\x9c\x30\
+\x93\x5b\xe2\x6d\x96\x02\x64\xca\x91\x10\x15\xbe\x5b\x61\x60\xbe\
+\x86\x9d\xb7\x4c\x4c\x9f\x0d\xf6\xb3\xe8\x67\x77\x00\xdf\xc5\x9d\
+\x60\xd4\xc4\x39\x64\xee\x93\x72\x49\x27\xf6\xef\x44\xe7\x41\x12\
+\x0e\x7d\x34\xa9\xbd\x07\x92\x7d\x31\x06\xa3\x25\x48\xd5\xef\xad\
+\xe3\xf8\x35\xfe\x64\x3c\x37\x23\xa1\x90\x6d\x55\xd8\x6a\x30\xe4\
+\xf5\xd9\xe3\xc1\x63\x8d\x41\x6e\x20\x1f\x04\x9f\xf1\xdf\x42\x00\
+\x22\x8c\x00\x34\x31\x8c\x7c\x23\xc6\xd6\x0a\x77\xdf\x91\x37\x9d\
+\xf3\x62\x7b\x12\xdd\x77\xc4\x35\xdf\x02\x45\x52\x0c\x72\x23\xb3\
+\xfa\x19\x84\x62\x54\xd4\xd6\xe5\x09\x35\x1c\x2c\x74\xf9\x9b\x5e\
+\x5d\x44\x7c\x91\xff\x26\xb7\xbd\x7f\x57\xff\xfd\x58\x4e\x4a\xc8\
+\xf2\x5c\x62\x15\xf2\xfc\x6b\x1f\xc1\xd0\x89\xb3\xe1\xde\xc7\x5f\
+\xe7\xf7\xd3\x6f\x6f\x77\xd6\xed\x42\x64\x25\x21\x0e\x49\x82\xbe\
+\x58\x5e\x3b\xb1\xaf\xe2\x78\x62\x20\x47\x61\x2a\x6f\xd5\xe1\x10\
+\xda\x00\xd9\x81\xf0\xa7\xd3\xc7\xc9\xca\x67\x80\x7d\x4e\x96\xae\
+\x6d\xd9\xbf\x4f\x87\xcb\xd3\x6e\x87\x5b\xee\x7d\x16\x3e\xec\xfa\
+\x13\x64\x4f\x9b\x0f\x1b\xb7\xec\x84\x1d\x0c\x30\x11\x64\xb1\x45\
+\x8f\x82\x3d\xac\xfc\xc9\xe6\x77\x09\x03\x7f\x76\xe6\x8b\x24\x3c\
+\x5d\xf4\xb7\x54\x86\xfb\x88\xb6\x7f\x1e\x45\xf9\x6e\xa0\xf5\x3e\
+\xf2\xf4\xc7\xb6\x3f\xfa\xf9\x6f\xb4\x8a\xfc\x10\xfc\x65\xa0\xcf\
+\x26\x14\xf9\x6d\xe5\x22\xbf\x8d\x85\xdb\xb9\x9f\xbe\x48\xd2\x53\
+\x3b\xfe\x4a\xec\x57\x0a\x45\xc5\x1c\xfc\xa9\xda\x67\x40\xcf\x81\
+\x9f\x7f\xcc\x41\x9f\x57\xfb\x25\x0c\xe4\x71\xd6\x5f\x42\xd5\x3e\
+\x03\xfd\x8a\x5d\xea\x54\xd0\xd9\x43\xa7\x12\x49\x00\x3b\x07\x0f\
+\x1e\x22\x6f\x80\xe3\x44\x02\xf0\x1c\x33\x49\xc0\x71\x5e\xf9\x4b\
+\x81\x1e\x07\x7f\x93\x0c\x70\x25\x3f\xff\x7f\x28\xee\x7b\xff\xdf\
+\xdd\x28\x55\x50\x75\x20\xe5\xfb\xb7\x79\x3a\xdc\x78\xcf\x0b\xf0\
+\xce\xc7\x3f\xc0\xcb\x7f\xff\x04\xfe\xf8\xf4\x1b\xd0\xe9\xe6\xc7\
+\xe0\xbc\xcb\x3a\x51\xd5\x8f\xa4\xc0\xd3\x9c\x0b\xff\xe8\x9a\xa5\
+\x08\x00\x77\xf2\x93\x96\xbe\xbc\x65\x9f\xa1\xb5\xf8\x0d\x31\x42\
+\xb2\x6d\xf6\xf8\x0c\x2b\x31\xb4\x8b\x5b\x29\x08\x28\xc4\x33\x37\
+\xa8\x03\xd0\x01\xee\x79\xf4\x15\x6a\xff\xbf\xf3\xd1\xf7\x3c\x37\
+\x40\x11\x00\xb1\x8e\xeb\x24\x78\xb5\xb9\x6a\x46\xca\xcb\xa8\x6b\
+\x07\xc0\x14\x3c\xd6\x07\x68\x05\x62\xca\x65\xb1\xaf\x19\x5b\x9c\
+\x46\xfd\x0e\x66\x68\x11\xd3\x59\x13\x5d\xac\x45\x22\x47\x21\x17\
+\xfb\xfb\xdf\x2d\x01\x88\x7e\xe7\xbd\xaa\x03\x10\x43\xfb\xda\x67\
+\xb6\xb6\x3c\x51\x93\x09\xf5\x0e\x41\xd0\x96\x41\x60\x55\xce\xbb\
+\xfb\x0c\x18\xda\xef\x0d\x68\x6c\xcc\xbe\xa2\x17\xb2\xfe\x5c\x7f\
+\xa4\xbf\xdf\xa8\x03\x1b\x8e\x1c\x45\xec\x8d\xe1\xc5\x17\x46\x02\
+\x52\xc2\xdf\x04\x6e\xc1\x40\xb2\xe5\xcd\x2f\x22\x19\x56\xa7\x40\
+\x9f\xf5\x4d\x74\x69\x9b\x5b\x61\xf8\xc4\x59\xf0\x6d\x8f\xa1\x34\
+\xa7\xe4\xd5\x56\x86\x9a\x93\xf2\x2a\xc9\x46\x04\x6c\xc9\x81\x9e\
+\x08\xbb\xc2\xe1\x5d\x8e\x10\x24\x52\xbf\xe2\xdc\xbe\x74\xb2\x0d\
+\xd6\xba\x00\xea\xf1\xcc\x08\x5b\x93\xa4\x2d\x01\x59\xf5\x93\x6b\
+\x60\x40\x74\x2f\x0c\x38\xf7\xbc\x10\xb4\xeb\xf0\x00\x05\x2a\xbd\
+\xf5\xef\x1f\xe0\xfd\xaf\x7a\xc1\x7b\x5d\x7f\x86\x2e\x5d\xbb\xc3\
+\xbb\x5f\xfe\x0c\x1f\x7d\xd7\x8b\x92\x06\xd7\x6e\xd8\x0a\xe5\x55\
+\xfb\xa0\xb2\x6a\x2f\xcd\xd9\x57\xae\x5d\xcf\x83\x7d\xd8\x21\xe1\
+\x1f\x1e\x9a\xfd\x23\x01\x58\xc3\xab\x7f\x0a\xf7\xc9\xa7\xea\x9f\
+\x13\x00\xde\xfa\x5f\xbb\x8e\xcf\xfd\xe5\x7a\x5f\xbe\x74\xf7\xd3\
+\xc0\x9f\xda\xfe\x4a\xec\x87\x42\xbf\x9d\x74\xf0\x73\x8c\xd3\xa5\
+\x15\x3f\x29\xf4\xdb\x51\x2a\x04\x7e\xa5\x24\xf0\xdb\x41\x8a\xfe\
+\x4a\xde\xee\x2f\x13\xe2\x3e\x0d\xfc\x4b\x45\x8b\x1f\x0f\x55\xfc\
+\x15\x55\x74\x2a\x14\x01\xa8\x22\xf0\xaf\xac\x64\x04\xa0\x72\x0f\
+\x25\xf5\x1d\x39\x7a\x94\x80\x5f\x6f\xfb\xcb\xca\x9f\x6b\x00\xaa\
+\xa1\xa6\xe6\x28\xd7\x01\x20\x09\xa8\x46\xc1\x5e\x35\x1f\x0b\x28\
+\x42\xc0\x77\xfb\x87\x8e\xce\x01\xdf\x85\x62\xde\x8f\x2d\x7f\xd4\
+\xaf\x34\x4b\xa3\xaa\xff\x89\xe7\xdf\x86\xbe\xc3\x26\xc2\x2f\x43\
+\xc7\xd3\xe9\x33\x24\x1b\xbe\xfa\x71\x20\x3c\xdf\xf9\x03\x30\xae\
+\x7d\x88\x91\x07\xde\x19\x92\xc2\xbc\x64\xcd\xce\x37\x49\x88\xf6\
+\xbc\x42\xc1\x6f\x86\x76\x05\x1c\xd6\x92\xe5\x68\xcc\x30\x09\xa2\
+\x3e\xa3\x4f\xe5\x04\x20\x99\x08\x45\x7b\xba\xfd\xe6\xa7\x41\x44\
+\x00\x42\xd7\x3d\xca\xfe\x1f\x82\x7f\x96\xf9\x7a\x53\xad\x63\x71\
+\x8d\xf4\x59\xbb\x00\xa6\x88\xda\xc9\x12\x3b\x23\x4a\x1c\x7b\xac\
+\xc6\x33\x86\x76\xad\xac\x4b\xeb\xbb\xf6\x76\xbc\xe6\x5a\xb0\xf6\
+\x3e\xf5\xb9\x74\x29\xfc\x21\x17\xeb\x66\x37\x6c\x09\x25\xc0\x98\
+\x2e\x18\xa6\x6f\x73\x22\x00\x0d\xbd\x1e\x78\x56\x5d\x2a\xf9\x98\
+\x2e\xb6\x3e\xc3\x41\x99\x2e\xec\x5b\x23\xc6\x0b\x3b\x59\xe2\xda\
+\x2a\x7f\x5f\xb4\xe8\x47\xc3\x31\xe5\xce\x7a\x81\x37\xc2\xa2\x7a\
+\xbd\x92\x00\xa8\xb6\x6d\xc0\xc1\x58\x28\xc3\xe5\xc5\x53\x47\x16\
+\x29\xe6\x79\xde\x14\x23\x02\xf9\x88\xf7\xc5\xe8\x1c\xc4\xe4\x6c\
+\x11\x1c\x0c\xdf\x7b\x8f\xc5\x46\x98\x7e\x5e\x3a\x7c\xfc\x4d\x2f\
+\x18\x31\x71\x26\xb4\xc9\xbc\x5f\xcc\xc0\xb3\xb8\x6b\xa0\x13\xf8\
+\xbb\xda\x10\x07\x5d\xac\x90\x0d\xdb\x73\xd9\x30\x56\x9e\xd6\xad\
+\x85\x48\x61\x4a\xb2\x1b\x12\x12\x2a\x70\x61\x16\x44\x3b\xe3\x7c\
+\x3b\xe2\xbc\xcb\x6f\x80\xfb\x1e\xef\x0c\xff\xfa\xec\x27\xf8\xf7\
+\x77\xbf\xc0\xc7\x5f\xf7\x86\x0f\xbf\xea\xc9\x08\x40\x6f\x78\xef\
+\xcb\x1e\x74\xba\x7c\xd9\x1d\xba\xb0\xaf\x75\xf9\x9a\x7d\xfd\xeb\
+\x1e\xd0\x6b\xf0\x18\x06\xec\x6b\x61\xd7\x9e\xfd\xb0\xef\xe0\x61\
+\xa8\xd8\xbd\x97\x54\xf9\xe8\xed\x3f\x6f\x31\x57\xff\x23\x01\x58\
+\xbc\x82\xbb\xfd\x49\xc5\xbf\x02\xfe\x7c\xde\xfa\x27\x5b\x5f\x04\
+\xfe\x02\x33\xcc\x67\xfd\x66\x6b\x94\x2f\xce\xfc\x95\xca\x7f\xab\
+\x26\xf4\x93\x56\xbe\x45\x3b\x15\xf8\x17\x15\x73\xf0\xdf\x26\xc4\
+\x7d\xc5\x72\xd6\x4f\xe0\xcf\xc5\x7d\x25\x42\xdc\x57\x22\x80\xbf\
+\x8c\xda\xfc\x55\x04\xf6\x44\x00\x2a\xf9\xc7\x68\xd1\x8b\x80\x8f\
+\xb7\xe8\xd8\x27\x6f\x31\xb0\x07\xf7\xf0\xa5\x0e\x40\x69\x00\x8e\
+\x1f\x13\x3b\xfa\x35\x82\x00\x54\x13\x01\xc0\x7f\x5b\x8d\x8e\x7e\
+\xec\xeb\x47\xab\x8f\xb1\xea\x9f\x93\x82\x6a\xfc\x7a\xcd\x09\x1a\
+\x9f\x9c\xf7\x87\x4e\xa6\x8d\x30\xb5\xf8\xaf\x21\x33\xa1\xe7\x5e\
+\xe9\xc2\xc0\x3f\x9b\x81\x3f\x23\x00\x83\xc7\x41\xef\xc1\x63\xe9\
+\xe0\xd7\xfe\xd3\x73\x38\xfc\xf1\xd9\x7f\x40\xea\xc5\x1d\x05\xf8\
+\xf3\x4e\x00\xdf\xd5\xcf\xe2\xa0\x9c\x9a\xa1\x2a\xf3\x70\x02\xaf\
+\x5d\x13\x64\x77\x40\xdb\x22\xd1\xc3\xaf\x78\x1c\x30\x17\x01\x5e\
+\x1d\xbc\x97\xf2\x20\x7a\x0f\xca\x16\xef\x9f\x2c\x5b\x70\x97\x9b\
+\x91\x99\x15\x54\x93\x53\xac\x42\x56\x53\x9b\x63\xb8\x54\xc1\x81\
+\xd8\xdf\x5f\xbe\xba\xac\x02\xd6\x8f\x6d\x6e\x44\x7d\xd3\xe9\xde\
+\x44\xa8\x95\x33\xe3\xef\x6e\x04\x60\x84\xbb\xd7\xe9\xad\x18\x47\
+\xa3\x1a\x8d\x21\xfb\xb8\x91\x85\x35\x0a\x38\x10\xc3\xac\xc6\x2d\
+\xb8\xc7\x6c\xeb\x7a\x6d\xfb\xee\x61\x0e\x85\x6a\x0c\x60\x38\xcc\
+\xf0\x42\x8e\x73\x69\xf3\xe7\x04\xea\x14\x48\xe1\x6c\x0a\xe4\x3e\
+\x23\x73\x53\xf0\xbb\x11\x05\xc7\xb0\x92\x88\x7f\x9b\x61\x8e\x6c\
+\xa2\xb4\x12\x71\x0e\x7e\xed\x9d\x7f\x22\x02\xf0\xc6\xbb\x5f\xf3\
+\x2a\x06\xdb\x98\x62\xa5\x89\xe6\x9a\x31\x8f\x00\x9c\xf2\x10\x8c\
+\x06\xf7\xef\xb6\xaf\x48\x46\x0b\x0a\x92\x22\x2c\xaf\xac\x8a\x52\
+\x38\xd0\x5c\xd2\xe6\x66\x78\xea\xa5\x77\xe1\xd3\x6e\xfd\x59\x65\
+\x39\x00\xbe\xf8\xa1\x2f\x7c\xd6\xad\x0f\x7c\xfc\x6d\x4f\xf8\x88\
+\x91\xa6\x0f\xbe\xe9\xc3\xc0\xbe\x27\x7c\xf0\x25\x92\x01\x04\xff\
+\xde\x44\x00\xde\x63\xdf\xfb\xf0\xbb\x5e\xf0\xc9\x7f\x7a\x43\xb7\
+\x3e\x43\x21\x67\xd6\x62\x06\xbc\xbb\x60\xef\x81\x6a\xd8\xb5\xf7\
+\x10\x14\xed\x2c\x87\x55\x0c\xe0\x17\x2e\x5d\x45\x24\x60\xe9\x8a\
+\x35\x54\xf9\x93\xad\xef\xba\x02\x35\xef\xc7\x83\x76\xbe\x72\xb5\
+\x8f\xbb\xfa\x31\xe0\xdf\x62\xba\xfa\x15\xa8\xaa\x5f\xae\xf8\x15\
+\x9b\xe0\xbf\x9d\x1f\xee\xea\x27\x9c\xfd\x90\x00\x94\x94\x92\xba\
+\x1f\xdb\xfd\x3b\x45\xbb\xbf\x58\xb4\xfa\x4b\xc5\x29\x93\x15\x7f\
+\x79\x95\x56\xf5\x57\x51\x22\x5f\xf9\x2e\x7e\x5b\xb1\x8b\x57\xfe\
+\x0a\xf8\xf1\x73\x3a\x7b\x60\xef\xde\x03\xbc\xad\x8f\x00\x7f\x5c\
+\x80\x3f\xa9\xff\xab\x85\xf8\xaf\x9a\x40\xff\x28\x03\xfa\xa3\x35\
+\xe2\x96\x81\x3f\x06\xfb\x1c\x3d\x7a\x14\x8e\x1c\xa9\x16\xe7\x28\
+\x19\x00\xad\x58\x55\x00\x17\x5e\x71\x1d\xa5\xe6\xf1\x79\x3f\x9f\
+\xf3\x63\xab\xbf\xf3\x3b\x5f\x2a\x02\xd0\x07\xc1\x7f\x08\x12\x80\
+\x71\xd0\x6f\x78\x36\x0c\x1a\x39\x09\x7a\x0e\x18\x43\x7e\xfc\xe7\
+\xb4\x92\x1d\x80\x0e\x34\xa7\xf7\xd2\xeb\x3c\x53\x75\xcd\xac\xaf\
+\xdb\x80\xe8\x38\xe8\x46\x53\x76\x5f\x14\x43\xcb\xf6\xe0\x2b\x86\
+\x78\x70\x2c\x81\xa6\x50\x7f\x7c\xf6\x4d\x22\x17\x9c\x00\x58\xe3\
+\xad\xed\xbf\x27\x52\x94\xb8\xf5\xfd\x9b\xe1\x02\xfe\x75\x10\xe0\
+\x9d\xc6\xe8\xdf\x58\x08\x40\xb8\xc3\x68\xc3\x12\x00\x59\x78\x7a\
+\xfc\x67\x86\x19\xd2\x59\xf5\x07\xfe\x01\xc7\x4a\x2a\xc9\xa1\xed\
+\xec\xbc\x7e\x17\xb0\xc6\x6f\x8a\xd6\xbe\x87\x8e\xc1\x83\x2e\x5c\
+\xb3\x07\x82\xae\x24\x40\x0f\xa9\x31\x5b\x63\x4e\x80\xed\x9c\x2a\
+\x98\x9c\x9a\x61\x03\xbf\xa0\xe6\x49\x1d\x9b\x0b\x61\xec\x23\x00\
+\xa7\x80\x22\xbb\xb1\x52\x1d\xd7\x32\x1d\x76\x95\x1d\x49\x80\x8b\
+\x53\x1f\xb7\x06\x36\x95\xcb\xe7\xb4\xca\x80\x1e\x83\xc6\xc1\xb0\
+\xf1\xd3\xe1\xbc\x2b\x6e\x20\x02\x90\x2c\x2e\x8e\xf2\xa2\x16\x19\
+\xfc\x0d\x07\xaf\x05\xd9\x36\x0d\x9c\xb6\xaa\xc2\x8d\x00\x24\x6b\
+\x17\x70\x65\x1c\xe5\x33\x5b\xff\x1e\x06\x2c\x18\xe6\xf2\xd9\x0f\
+\xfd\xa0\x2b\x9e\x1f\xfb\xc3\x97\x3f\xe1\x19\xc0\x88\x00\x7e\xde\
+\x8f\x91\x82\x5f\xe0\xa3\xef\xfa\xc0\x87\xdf\xf4\x64\xa7\x17\xbc\
+\xff\x4d\x6f\x02\xfe\x2e\x5f\xe3\xc7\x8c\x00\x7c\xdb\x07\x3a\x77\
+\xf9\x06\xae\xbf\xe7\x79\x48\xbd\xb4\x13\xf8\x2e\xc8\x84\xc7\x9e\
+\xfb\x07\x4c\x99\xb1\x18\x2a\xf7\x1c\x82\x3d\x07\x0e\xb1\xdb\xfd\
+\xb4\x8e\x87\xb3\x7e\xf4\xf7\xc7\x55\xbf\xb5\x62\xcd\x2f\x5f\xb4\
+\xfc\x37\x48\xb1\xdf\x26\x6d\xbd\x4f\xdb\xed\xdf\x54\xb4\xc3\xd1\
+\xd3\x5f\x59\xfa\x92\xa1\x8f\x29\xf6\x93\x7b\xfd\xc5\x4a\xe8\xb7\
+\x4b\xb5\xfb\x51\xdd\x5f\xca\x40\xbe\x94\x01\x7a\x19\xbb\x2d\xa3\
+\xb6\xbe\xd9\xde\xd7\xc1\x1e\x41\x1e\x6f\x2b\xaa\xc4\xad\xa8\xfc\
+\xd5\x61\xdf\x47\xbf\xfe\x1a\x41\x00\xaa\xb5\xca\x9f\x83\x7f\x8d\
+\x00\xfd\xa3\xbc\xf2\x3f\x5a\x43\xa3\x83\xa3\x47\xab\xe1\x10\x81\
+\x3e\xbb\x3d\x7c\x84\xac\x7f\xf7\x1f\x62\xe7\xc0\x11\xc8\x5b\xb3\
+\x19\x2e\xbe\xf2\x3a\x0a\x10\xe2\x59\x02\xd7\x90\xe0\x2f\xd9\xdf\
+\x0e\x3e\xf8\xa2\x3b\xf4\x1d\x92\xcd\xce\x78\xe8\x37\x8c\x9d\x11\
+\xe3\xa1\xff\xc8\x09\x30\x70\xd4\x24\x0a\x77\x1a\x3a\x26\x07\x3e\
+\xfb\xae\x2f\x5c\x9e\x7e\xa7\xa9\xd4\x6f\xd9\x5e\x03\x54\xd1\xf9\
+\x51\x56\xe2\xe1\x33\x6c\xfb\x6b\x9e\xeb\x42\xf4\xf5\xda\x20\x3d\
+\xcf\x83\x46\xe6\xc0\xf0\xb1\x33\xc0\x77\x71\x07\xe1\x65\x90\x69\
+\xe9\x3a\x85\x13\x0d\xf7\x6b\xa1\x25\x0d\xd5\x5f\x5f\xd5\xaf\x71\
+\xda\x81\xcd\xeb\xe0\x8b\x12\x5f\xe1\x90\x18\x0d\x57\xec\x1b\x17\
+\x67\x14\x01\x48\xc4\x1d\xb2\x01\xb3\x65\xaf\x3b\x68\x33\x78\x09\
+\x39\x90\x06\x6b\x3b\xcb\xa3\x44\x78\x4e\x15\x71\xc0\xa5\x6a\x0e\
+\xb9\x1a\xeb\x48\xb3\x0e\x2b\x31\x08\x59\xee\xab\xfb\x1a\xa3\x95\
+\x0c\x58\x5b\x68\x4e\xf7\x25\xde\x1d\x56\xc3\x85\xc5\x1b\x8e\xda\
+\x06\xb7\x56\x92\xf5\x0d\xee\x5e\x1d\x44\x26\x00\xda\xaa\x92\x03\
+\xa9\xe0\xa0\x98\x61\x8a\xfc\x52\xb9\xfb\xdd\x63\xcf\xbf\x0d\xa3\
+\x73\x66\xc1\xd3\x2f\x77\x11\x46\x38\xed\xf9\xdc\xd4\xb1\x03\x60\
+\x37\x33\xb2\xb7\x24\x03\x8e\x04\xae\x7e\xaa\x09\xb7\xca\x3f\x68\
+\x89\x0d\x0e\x77\x20\x0c\x72\xdb\xd5\xe6\xbc\xd5\xcf\xc3\x62\xd2\
+\x68\xa7\xfc\xd2\xd6\xb7\xc0\xe7\x3f\xf4\x87\x2f\x18\xf0\x77\xfd\
+\x71\x20\xdd\x7e\x21\x48\xc0\x57\x3f\xf5\x85\xae\x48\x06\xe8\x7b\
+\xfd\xe0\x93\x6e\xbd\xe1\xa3\x6f\x7b\xc3\x07\xdf\xf6\xa2\xd3\xe5\
+\xcb\x1e\xf0\xc8\x9f\xdf\x86\x2b\x02\x77\x10\x98\x78\xfc\x9c\xf8\
+\xe2\xa8\x05\x2d\x6e\xb1\x7a\x4d\xcb\xba\x17\xbe\xec\xd6\x97\x81\
+\x7f\x39\x1c\x38\x78\x94\x92\xf3\xf6\xec\x3d\x48\x6b\x78\x58\xed\
+\x93\x95\xef\x46\xbe\xe6\x87\x56\xbe\xb2\xf2\x27\x5b\x5f\x22\x00\
+\xdb\x61\xb3\xb4\xf5\x45\xf0\xd7\xed\x7c\x45\xab\x5f\x57\xf9\x6f\
+\xd7\x14\xfe\x12\xf8\x77\x48\x53\x1f\x01\xfe\x92\x00\x94\x55\x54\
+\x52\xb5\x5f\x56\xb1\x4b\x11\x00\x3a\x04\xf8\x08\xec\x55\xbc\xd2\
+\xc7\x84\xbe\x5d\x1c\xec\x51\xeb\x80\xb7\x55\x3a\x01\xc0\xcf\x77\
+\xef\xa5\x36\xbe\x32\xfe\x39\x86\xd5\xff\x51\x3a\x47\x65\xa5\xcf\
+\x6e\x0f\x33\xd0\x3f\x4c\x55\xff\x51\xf2\xf9\x3f\x74\xb8\x9a\x1e\
+\x93\x43\x0c\xf8\xd1\xff\x7f\xff\x81\xc3\xb0\x6f\xdf\x21\xd8\xcb\
+\xce\xf2\xbc\x8d\x70\xfe\x25\xed\x69\xd5\xcf\xd3\xac\x35\xcf\x11\
+\x68\xde\x06\xfc\x97\x64\x41\xb7\xde\xc3\x60\xc0\x88\x89\xec\x4c\
+\x82\x81\x23\x27\x52\xa4\xf3\xe0\x51\x39\x30\x78\xb4\x08\x75\x1a\
+\x3b\x11\x86\x8d\x9d\x02\x77\x3e\xfc\x12\x03\x7f\x2e\x04\x4c\x12\
+\xaf\x15\x8f\xe3\xd8\x32\x14\xa6\x29\x31\xb7\x60\x0c\x65\x9b\xad\
+\xcc\xc8\xd8\xeb\xe9\xfe\xc7\x5e\x23\x87\xc8\xd7\xde\xfe\x02\x1a\
+\xf9\x83\xea\xbd\x66\xed\xa6\x06\x5c\x2c\xc4\xc5\x7b\x5e\x5f\xd9\
+\x0d\x4b\x5c\x0d\xd5\x23\x20\x9d\x1e\x83\x21\xaf\xcd\x1b\xc5\x0e\
+\xfe\xb1\x85\x16\x19\xa7\xe1\x6f\x09\x40\xa2\x84\xe2\xb1\x86\x37\
+\xe1\x69\x98\x2d\x00\x87\x79\xb1\xaa\xc0\xfd\xb1\x78\x43\x67\x84\
+\xed\x7d\x3b\x13\x01\xc3\x46\x00\xf4\xea\x91\x8f\x12\xa8\xf5\xe2\
+\x73\x88\xaa\x8d\x91\x21\x7a\x52\x0c\x97\x11\x80\xbe\x21\x90\xe8\
+\x37\x83\x43\x35\x1c\x75\x65\xc6\x70\x00\xb7\xf0\xbc\x6c\xaf\x4b\
+\xfb\x3f\xc9\xcd\xbc\x27\x25\xe4\xf8\xd8\x29\x1f\x7c\x06\xf6\x2d\
+\x2f\xbb\x1e\x86\x8e\x9f\x0e\xfd\x86\x4f\x82\x66\x17\xb6\xe7\xed\
+\x51\x22\x00\x21\xb1\x3a\x67\xdf\x9f\x0f\x85\xed\x4a\xab\x55\x26\
+\xa7\x08\x5f\x39\x93\xf7\xd5\xe5\xcd\x12\x5e\x91\xe9\x82\xce\xa8\
+\xab\x90\xf2\xdf\xfb\x84\xc1\x0f\x3a\xcf\x35\xe3\x61\x31\x49\xe2\
+\xe0\xe7\x4f\xbf\xd4\x85\x55\xfe\x03\xe1\xcb\x1f\x06\x30\xe0\x1f\
+\xc8\x80\x7e\x00\x3b\x7d\xa9\x13\xf0\xf5\x4f\xfd\xe0\xab\x9f\x19\
+\x01\xf8\x79\x00\xbb\x1d\x40\x1f\x7f\xfe\x43\x3f\xf8\xf0\xeb\x3e\
+\x70\xff\xd3\x7f\x87\x96\x97\x5f\x4b\x59\x0b\x7c\x75\x50\xa4\x2c\
+\x52\x26\x7d\x1a\x3f\x3e\x1e\x4c\xd3\xc8\xd7\x06\x7c\xe7\x07\xe1\
+\xf9\x97\xfe\x05\x0b\x73\xd7\x30\x40\xc4\x30\x9b\x5f\xa1\xfa\xd8\
+\x09\x06\x9c\xfb\x60\x4b\xd1\x4e\xd8\x88\x8e\x7e\x9b\xb6\xb1\x83\
+\xc0\x2f\x04\x7f\x54\xfd\xb3\x6a\x5f\x28\xfe\x51\xec\x57\xb8\x5d\
+\x7a\xf9\x17\xab\x8a\x9f\x8e\xac\xfa\x4b\x4c\xa5\x3f\x0a\xfe\x8a\
+\x69\xe6\x5f\x49\xb3\xfe\x62\x9a\xf1\x8b\xb6\x3f\xaa\xfb\x49\xe9\
+\xbf\x9b\x81\x3f\x76\x00\xb8\xc2\x9f\xaa\x7f\x24\x00\x95\x7b\x44\
+\xab\x5f\x92\x01\x1b\xe0\xcb\xc3\x80\x5f\xde\x62\x88\x8f\xae\xfa\
+\x27\xe1\x1f\xb6\xfe\x09\xfc\xab\x59\xd5\xcf\x0f\x56\xfc\x08\xfe\
+\x87\x0f\x8b\xca\x5f\x80\xff\x81\x03\x87\xe9\x67\x60\x20\x10\xae\
+\x19\xee\xd9\x73\x00\x66\xcf\x5b\x01\xcd\x5b\xa6\x8b\xb5\xbf\x36\
+\x64\x65\x8d\xe2\xc0\xb6\xed\xef\x63\xc0\x3f\x19\x86\x8c\x99\xc2\
+\xce\x64\x06\xfa\x39\x30\x64\x74\x0e\x45\x3b\x4f\x9c\x3e\x87\xb6\
+\x30\xe6\xe5\xe6\xb1\xdb\x95\xf0\xfa\x3b\x5f\xd0\x75\x8c\x13\x34\
+\x7c\x7e\xd2\xad\xe6\x60\x2a\xb1\xd2\x9e\xaf\x61\x8d\x14\x57\xb9\
+\x23\xcd\x79\xca\xe4\x4f\x7d\x46\x31\x02\x30\x03\x2e\x6b\x77\x3b\
+\xfb\xb9\x99\x61\x62\x3e\xe7\xf5\x63\xc3\x55\xf7\x13\x9e\x0b\x52\
+\x5f\xfb\xec\x91\x81\xc9\xba\x26\xe9\x54\x40\xd5\x35\x64\xa8\x36\
+\xa3\x6a\x27\xdd\x59\x43\x3b\x20\x46\xd9\x54\x72\xd9\xde\xaa\xcb\
+\xfa\xe2\x59\x92\x09\xd4\xcf\xba\x9f\xb9\x9e\x95\x6c\x5f\xc1\xf0\
+\xb9\x3d\xe9\x46\x98\x5f\x80\x27\xd5\x74\x0f\xb4\x5b\xc4\xba\x8b\
+\x05\x6d\xa4\x40\x12\x00\xb1\xd7\xef\xad\xa5\x47\x40\x98\x19\x8c\
+\x65\x6f\xdd\x88\x10\xe6\x53\xdb\x17\x95\xd3\x48\xc0\x88\xb0\x6d\
+\x10\x0b\x93\x0c\x57\xde\x86\x5d\x24\x22\xcd\xe7\xe9\xf1\xcb\x70\
+\x09\x13\xca\x84\xe4\x96\x19\xf0\xf2\x9b\x9f\xc2\xa8\x49\x33\xe1\
+\xfe\xa7\xfe\x26\xd6\xa5\xa4\x48\xca\xb0\x6c\x18\x58\x2f\x86\x21\
+\x70\xcb\xed\x96\x16\xc4\x56\xd1\x61\xed\x09\x80\x5e\x15\xa9\xdb\
+\x30\xc7\xbf\x8c\x88\x44\x00\x2f\xf0\x58\xed\x9f\x4d\x09\x71\x6d\
+\xe0\xf6\xfb\xff\x02\xcd\x2e\x68\x0f\x49\xcd\x38\x30\xb7\xba\xb4\
+\x13\x7c\xd6\x8d\x55\xf7\x3f\xf0\xb9\x3f\x56\xfd\x5f\xfc\xc4\x6e\
+\x59\xb5\x8f\xe7\x2b\x46\x00\x90\x04\x7c\xf3\x73\x3f\xf8\x16\x09\
+\x00\xfb\x37\x8f\xbe\xf0\x36\xb4\xba\xfc\x3a\x22\xaa\x98\xe5\xee\
+\x11\x63\x05\x1e\x3e\x93\x4e\x46\x42\x49\xe2\x63\x8f\x3c\x29\xc2\
+\x7e\x99\xd2\xe9\xd2\xe1\xc6\x3b\x9f\x86\xa1\xa3\x26\xc1\xc1\xc3\
+\x35\x70\x02\x93\xf6\x4e\x1c\x27\xf0\xc3\xae\x00\x75\x01\xf0\x28\
+\x02\xb0\xdd\x04\xff\x22\xb1\xde\xa7\x82\x7c\xa4\x8d\x6f\x19\x09\
+\xfd\xc2\x66\xfd\x64\xe6\x53\xa1\xf6\xfa\xcb\xca\x38\x01\xa0\xaa\
+\xbf\x92\x57\xfe\x24\xf6\x63\x40\x5f\xb6\x8b\xb7\xfd\x2b\x44\x8b\
+\xbf\x82\x55\xfa\x95\xb2\xe5\xbf\x87\xdd\x12\xd0\xef\x55\x95\x3f\
+\x01\xbf\xc3\xc1\x6a\x9f\x5a\xff\xd5\x35\x42\xe8\x27\x80\x9f\x7d\
+\xce\x81\xbf\xda\x6c\xf9\x1f\x32\xc1\x5f\x02\xff\xbe\xfd\x58\xfd\
+\x1f\xa0\xb3\x7b\xef\x3e\xa8\x62\x24\x60\xc4\xd8\xe9\xf4\xfc\x61\
+\xd0\x0f\xf9\xfc\x8b\xf7\xd6\x43\xcf\xfc\x9d\xe2\x77\x31\xb0\x09\
+\x33\x1b\x30\xc4\x09\x63\x97\x17\xe6\xae\x84\x85\x4b\xf2\x60\x01\
+\x23\x01\x73\x17\x2f\x87\xb9\xec\xe3\x8b\x5b\xdf\x60\x3e\x47\x4a\
+\xf4\x99\x1e\xf6\x7e\x0c\x23\x93\x24\x18\xd5\xac\xc7\xb1\x93\xd4\
+\x34\x0d\x6e\xb8\xe3\x19\xf6\x7b\xa7\x42\x97\x4f\x7f\xe4\x82\x45\
+\xbf\xdd\x33\x25\x64\x03\xfa\xf0\x2e\x67\xe4\xb1\xac\xd3\x35\x24\
+\xa3\x01\xdd\xfb\x9c\xb3\x55\xea\x5b\x27\xe0\xe8\x2f\xe3\x10\x02\
+\x17\x8b\x9d\x7d\x62\x2d\xf4\xeb\xd2\x81\xa9\x03\x01\x48\xcc\x1c\
+\xc3\x99\xa1\xd8\x2f\xd6\x61\xd6\xaf\x11\xab\x65\x7d\x65\xc6\xde\
+\xaa\xd6\x2e\xe0\x7e\x17\x02\xa0\x8b\x07\xf5\x8f\x7d\x66\x48\x8d\
+\x27\x26\x3f\x7e\x9b\xd0\x44\x17\xc6\xa9\x75\x12\xf3\x7e\xba\xb7\
+\x8f\x5c\x74\x11\x31\x3b\x67\x19\x61\x04\xc7\xeb\x44\x98\xfc\x86\
+\x4b\x45\x10\x2d\x6f\xc0\x70\x08\xdf\x89\x60\xe4\xa4\xb9\x97\xe9\
+\xfb\xcf\x74\xdb\x32\x13\x2e\x69\x7b\x1b\x0c\x1d\x3f\x0d\x7a\x0c\
+\x1a\x0b\xe7\x9e\x97\xc1\x53\xcd\xfc\x19\x16\x1b\x5d\x6e\xa1\x6b\
+\x73\x46\xf3\x87\x62\x30\x24\x0a\x45\x89\x78\x8e\xed\xcd\xa2\xda\
+\xa1\xf2\xf5\x15\x56\xe5\x67\x58\xfe\x46\x6b\x05\x17\xe4\x55\x38\
+\x03\xfa\x96\x97\x76\x84\x2e\x9f\xfc\x0c\xef\x7c\xf8\x3d\x09\xfe\
+\xf8\x28\xa0\x1d\xdc\xff\x44\x67\xaa\xf8\xbf\xf8\x61\x00\xb5\xf9\
+\x71\xee\xdf\x55\x10\x00\xea\x00\x30\xe0\xff\x86\x7d\xfe\x5d\xf7\
+\x81\xf0\x57\x46\x98\x2e\x6a\x73\x0b\xed\x79\x27\xb5\x08\xd1\x6a\
+\x19\x11\x5f\x6a\xd7\x71\x60\x30\x3b\x01\x12\x68\x38\x01\x90\x8e\
+\x95\xb4\x46\xa9\x8c\x6e\x0c\xb8\xac\xed\x2d\xf0\xc9\x57\xdd\x49\
+\x91\x5f\x73\xfc\x14\xab\x9a\x8f\xc3\x21\x06\x8e\xd8\xa2\x47\x6b\
+\xdf\x8d\x5a\x9c\xaf\xbd\xed\x2f\xc1\x1f\x93\xfb\xb6\x53\xc5\xcf\
+\x95\xfe\xd2\xd5\x8f\xaf\xf8\x55\x70\x02\x50\x5e\xc1\xaa\x7e\xee\
+\xea\xc7\xd7\xfb\x76\x71\x81\x1f\xdd\xee\x51\x2d\x7f\x3e\xe7\xdf\
+\xcd\x81\x5f\xb5\xfb\xd9\xd9\xcd\x3e\xde\xb3\xd7\x15\xf4\x77\xef\
+\xd9\xa7\x3e\xde\xbf\x7f\x1f\xcd\xfd\x49\xe1\x8f\xe0\x5f\xcd\xab\
+\xff\xc3\x47\x4d\xf0\x3f\x7c\xf8\x28\x07\x7f\xac\xfa\x45\xdb\x7f\
+\xff\xfe\x43\x02\xfc\x0f\x12\xf8\x63\x0c\x31\xfe\x5c\xdc\xac\xd8\
+\xbd\xf7\x10\x7c\xf6\x4d\x6f\x4a\xf9\x93\xee\x95\x49\x24\xb8\x0b\
+\xc1\x47\x5f\x76\x67\x55\xf8\x34\x46\x04\xa6\x52\x32\x23\xe6\x27\
+\xa0\xe9\x12\xad\x62\x2e\xe1\x4e\x8c\x73\x18\x11\xb8\xf5\xbe\xe7\
+\x29\x7d\xd0\xe3\xe3\xdd\x19\x55\xfd\xe3\xc8\xc6\x6f\xb8\xf8\x59\
+\x98\x2e\x95\xd2\x56\x3b\x89\x12\xfe\xda\xc0\x57\xdf\xf7\xa7\x35\
+\xd0\xd6\x99\x77\x43\x23\x2a\x5c\x82\x8e\x71\xe0\x49\x9a\xa0\xd0\
+\x1c\x31\x38\x8b\x00\x9d\x5c\x51\x4f\xb7\xd7\xbf\x55\x40\x6d\x24\
+\x68\x0c\x50\x9b\xf5\x60\xad\x78\xb2\x08\xcf\x45\x87\xc0\x5f\xdb\
+\x16\x7d\x28\x8e\xf6\x7e\x6d\x48\x46\xa8\x4e\xe4\xa1\x5e\x34\x00\
+\xd6\x99\xae\x35\x64\xc6\x4a\x0a\xdc\xd6\xb9\xec\x4f\x4c\x48\xf8\
+\x00\xe8\x2f\x62\x37\x95\x7c\x64\x02\x40\x55\x92\x5f\x7b\xd3\xb8\
+\x56\x93\xce\x55\xb6\x37\x6c\x47\xdf\xf4\x1f\xf0\x84\x6d\x0e\xd8\
+\x67\x73\xb1\x12\x00\xc3\x7d\x46\xa4\x2c\x89\x03\x11\x46\x03\x06\
+\xf7\x09\x8f\x6a\xec\x61\xd3\x45\xe8\xdb\x19\xae\x1e\xe2\x46\x58\
+\x9b\xdc\xee\x6f\x8e\xe6\x28\x08\x62\x9d\xbb\x74\x85\x21\xe3\xa6\
+\xc0\x1d\x0f\xbd\xac\xfd\x3f\x7b\xa0\x4e\xd0\xa1\xab\x13\x4e\x00\
+\x9c\x62\x89\x63\x23\xa9\x86\xd0\x55\x38\xdd\xff\xa0\x4a\x9a\x4c\
+\xf2\x07\x1d\x47\x11\x76\x92\x23\x9d\xda\x28\x0a\x99\x5d\xf0\xdb\
+\xdf\xf0\x18\xf4\x19\x9c\x4d\x69\x88\x81\x6b\x1f\x84\xb3\x7d\x6d\
+\xd9\x49\x83\xc6\xa9\x69\xb4\xe2\xd7\xf5\x87\x01\xbc\xed\x2f\xaa\
+\xff\xae\x34\x06\xe8\x47\x63\x80\x2f\xd9\xf9\xf8\xeb\x5e\xd0\xe1\
+\x96\x27\x38\x11\xa2\xc7\x8d\x77\x4a\x3c\xa9\x66\x10\x91\x14\x17\
+\x72\xf0\x4f\x37\xc9\x80\x10\x99\x59\x42\x92\x84\x89\x0c\xf7\xb7\
+\xe7\xab\xb6\xbe\x0b\x33\xe0\xb5\x7f\x7c\x02\x1b\x36\xed\x60\xe0\
+\x79\x92\x88\xc0\x61\x06\x9a\xe5\x0c\x94\x0b\xb7\xf1\x11\x80\x4c\
+\xf3\xe3\x9e\xfe\x7c\xbf\x9f\xec\x7c\x4b\xa4\x87\xbf\xac\xfe\xb9\
+\xb9\x0f\xad\xfa\x95\x63\xe5\x5f\x29\xc0\xbf\x12\xca\x2b\x2b\x95\
+\xca\x9f\xd6\xfb\xa4\xba\x7f\x17\x07\x7d\x04\x7f\x4b\xab\x7f\xb7\
+\x38\xbb\xf6\xd0\xa8\x82\xb7\xfd\x75\xf0\x77\xe8\x04\xb0\x7f\xc3\
+\x2b\x7e\xbd\xdd\x5f\x2d\x66\xfd\xfc\x70\xf0\xe7\x47\x56\xff\xfb\
+\x15\xf8\x1f\x84\x3d\x78\x88\x00\x70\x12\xb0\x67\x2f\x3b\xfb\x0e\
+\xc3\xa3\xcf\xfc\x4d\x3d\x86\x49\xc2\xbb\xe2\xc2\xab\x6e\xe4\x42\
+\xbc\xf1\x53\xc8\x80\x29\x37\x8f\x11\x80\x15\xab\x60\xe1\xb2\x3c\
+\xb2\x60\x9e\xcf\xce\x5c\xf6\xf5\x97\x5e\xff\x90\x93\x3f\x1f\xef\
+\xd0\xf0\xce\x8c\x46\xd6\xc3\x5e\xb3\xf6\x62\x26\xa0\x74\x24\x59\
+\x37\x3d\x4a\x71\xd1\xef\x7f\xf1\x33\x8f\x34\xf6\x6b\x7a\x1d\x7d\
+\x04\xea\x33\x22\x08\x00\xa3\x55\xdb\x75\x53\xb1\xbb\x63\x46\x34\
+\x40\x32\xea\xed\xbe\xd5\x7d\xd3\x4a\xbf\x66\xa7\xbb\x74\x73\x8d\
+\x7a\x22\x00\x06\xd4\x4e\x07\x50\x47\x02\x10\xbd\xfd\x1f\x88\x8b\
+\x35\x86\x5f\x98\x9d\x5b\xd5\xce\x2d\x5f\xc3\xc1\xc6\x57\xbf\x1f\
+\x6e\xed\xfe\x40\x74\x42\x60\x03\x4b\xd5\x52\xd6\x40\xdd\x13\x13\
+\x63\xb5\xaf\xfe\xf1\xbd\xde\x24\xdb\xfd\x0c\xbf\xaf\x6e\xad\x20\
+\x23\xc6\xaf\x39\x1b\x02\xd9\x63\x6a\x93\xc2\x3a\x25\x91\x67\xd9\
+\xf6\xaa\xc0\x24\x00\x86\xb2\xcf\xb4\xb6\xdc\x23\x13\x80\x24\x01\
+\x64\xde\x96\x19\x70\x69\xda\x6d\x30\x70\xcc\x14\xe8\xd6\x6b\x38\
+\x24\xb7\x08\xa8\xf5\x27\xae\x03\x90\x1f\x3b\x8b\xeb\x92\x9c\x2c\
+\x52\x5d\xb7\x07\x0c\xf7\xc4\x49\xad\x3b\xa3\x3e\xb7\x74\x21\xf4\
+\x0a\xdf\x5c\x95\x32\x01\x5f\xda\xb3\x9a\x1d\x0b\x4c\x71\x6b\xdc\
+\x22\x08\x7f\xfa\x6b\x17\x18\x99\x3d\x93\x9d\x19\xd0\x6b\xe0\x38\
+\x76\xb1\x6e\x03\x67\xb3\x2a\xf2\xff\xb2\x8b\x76\x5a\xc7\xfb\x19\
+\xe8\x0f\xa2\xd9\x3f\x56\xfb\x5f\x10\x01\xe8\x47\x64\xe0\x73\xec\
+\x0a\xb0\xcf\x5f\x78\xfd\x03\xf0\x5f\xdc\x41\x3d\x0e\x28\xa0\x94\
+\xe1\x35\xd6\xe7\x53\x27\xb2\x12\xfc\x03\x5a\x55\x12\x10\x7f\x93\
+\x14\x2c\xca\xec\x05\x7d\xa5\x36\x0d\xce\x69\x91\x06\xcf\xfd\xe5\
+\x1d\x58\xb7\x61\x2b\xe9\x03\x90\x08\xe0\x9e\x3c\xb6\xdf\x31\xc9\
+\xaf\x10\xe7\xfe\x4a\xe5\x5f\x4e\x95\x3f\xce\xfc\x11\xf0\x77\x08\
+\x63\x1f\xda\xeb\xc7\xdb\x0a\x69\xe5\x5b\x41\x62\xbf\x32\x02\x7c\
+\xcd\xd9\x6f\x57\x55\xf8\x4a\x5f\x15\xff\x58\x56\xfd\x66\xab\x7f\
+\x0f\x9d\x5d\x55\xfb\xf8\xf7\x2c\x5f\x0f\xef\x08\x20\xa0\x1f\x39\
+\x7a\x8c\x9d\x1a\x5a\xef\x33\x49\xc0\xd1\xb0\xb6\xbf\x3c\x7c\xee\
+\xcf\x2a\x7f\x6a\xfd\xb3\x5b\x06\xfc\x8a\x00\xb0\x5b\xfc\xfa\xce\
+\x92\x2a\x68\x6d\xdc\x4d\x8f\x5f\x52\xaa\xb4\xf6\x0d\xc2\x83\x4f\
+\xbe\x4a\x41\x4d\xe8\xac\xb8\x6c\xd5\x5a\x22\x01\xe8\xba\xb8\x78\
+\xf9\x6a\x58\xb0\x7c\x25\xcc\x67\xa7\x6b\xb7\xbe\xec\xb9\xbf\x86\
+\x01\x7f\x1b\xde\x01\x10\x45\x47\xa4\xb5\x59\x4e\x98\xcd\xd7\xb5\
+\x47\x3c\x4f\x5d\xbb\xf5\x83\xc1\x8c\x00\xa0\x0e\xa1\x11\x8e\x99\
+\x7c\x4e\xeb\xbf\x66\x21\x64\xcd\xe7\x08\x3a\x7c\x5e\x0f\xd6\xbf\
+\x11\x31\xc0\x70\xb8\x2f\x21\xc7\x56\x7c\xd4\xfb\xd3\xdc\x48\xe8\
+\x48\xda\x49\x07\x61\x5e\x23\x02\xee\xde\x33\x0e\xf1\xe0\xb5\x1d\
+\x01\xd4\x76\x3b\xa1\x6e\xa3\xcf\x5a\x13\x80\x44\xad\x3d\x38\xcd\
+\xe6\x8d\x08\x2d\xee\x40\x38\x90\x3b\x3d\x41\x7e\xb7\x7f\xef\x60\
+\x75\xab\xfe\x9d\x96\x30\xa7\x08\x40\x40\x54\x8a\x36\x33\x0d\x7f\
+\xc0\x61\x9f\x56\x6b\x5f\x69\xf1\xb4\x1e\xd7\xfd\xf5\x40\x1c\x0c\
+\x2d\x14\x21\x52\xd9\xe9\x71\x0b\xd8\x80\x3f\xe8\x10\xa5\x1b\xcd\
+\xf6\xd3\xfe\xf8\xcb\x15\x23\xc3\x92\x69\xee\xf6\xa6\xb2\x57\xc8\
+\x18\x83\x9b\xdc\x82\x83\xe6\x5f\xdf\xfe\x1c\x06\x8c\x99\x0c\xb7\
+\x3c\xf8\x22\x5f\x91\xb3\x74\x00\x82\x9a\x28\xd0\x76\xbf\xfd\xc1\
+\x98\x5b\xff\x4e\xed\x4d\x3d\x45\x50\x12\x34\xb5\x7f\xad\xc6\x17\
+\x21\x8d\x80\x84\x07\x1f\xc9\xef\x25\x4b\x62\x43\x44\x20\x93\xfc\
+\xd8\x3f\xee\xda\x0b\xc6\x4f\x9e\x0b\x63\x73\xe6\xc0\x68\x06\x0e\
+\x7f\x79\xe3\x63\xf8\xbf\xcd\x38\x01\xf8\x3f\xcd\xae\x81\x17\xff\
+\xf6\x11\xfc\xd4\x6f\x14\x7c\xdb\x63\xb0\x50\xfe\xf7\xa5\x35\x40\
+\xfc\xf8\x53\x76\x81\xbf\xfe\xee\x67\x08\x2c\xc8\x21\x50\x5e\x30\
+\x45\x14\x2c\x75\x18\xc2\x08\x80\x61\x7b\x2d\x3a\x77\x80\x3c\xb6\
+\x4d\x14\x29\x2c\xe3\x15\x69\x3b\xaa\x50\xcf\x49\x6d\x0b\x7f\xe9\
+\xfc\x1e\x6c\xda\x52\x02\xd5\xc7\x4f\x42\x0d\x3b\xe8\x9a\xb7\x8b\
+\x81\x61\x51\x09\x37\xf6\xd9\x26\xc5\x7e\x42\xe4\x27\x2b\x7e\x3e\
+\xef\xaf\x10\x5e\xfe\xbc\xf2\xc7\x59\x7f\xa9\x20\x00\x15\xa2\xf2\
+\xb7\xee\xf2\x4b\xe0\xe7\xd5\x7e\x25\x55\xfe\x5c\x03\xc0\xc1\x5e\
+\x12\x80\x70\xb0\xdf\x65\xdb\x06\xd8\xb5\x7b\x37\x75\x0b\x0e\x1f\
+\xa9\x21\xb5\x3f\x01\x3f\x3b\x07\x11\xfc\x0f\x87\x83\x3f\x9f\xfb\
+\xeb\x6d\x7f\x7e\xe4\x68\x61\xf7\xee\x7d\x44\x06\xf6\xee\xdd\x47\
+\xdd\x81\x19\x73\x96\x43\x93\x56\xe2\x35\xdd\x42\xbc\x9e\x5b\x06\
+\xa1\x47\xff\xd1\xb0\x72\xdd\x06\x22\x01\x4b\x19\x09\xc0\xac\x85\
+\xdc\x95\x6b\x61\x71\xde\x1a\x58\xc4\x08\x01\x92\xc0\xb3\x9b\x5e\
+\xc9\xc3\x9e\x24\x01\xf0\x1b\x2e\x80\x63\x25\x00\xc9\x5a\x70\xd0\
+\x75\xb7\x3f\x45\xa2\xc3\x0f\xa8\xfa\x6f\xc3\x57\x9e\xf5\x42\xc3\
+\xa6\x61\x89\xaa\xbf\x8a\x20\xb0\x4d\xcc\x1c\xdb\xd0\xb4\x03\x86\
+\x1a\x41\x58\xef\x43\xd0\x15\x34\x13\x4f\x48\x9c\xbb\x11\x4e\x11\
+\xe3\x91\x47\xcf\x66\xc7\x58\xb9\xc6\xfa\xed\xf1\xf5\x01\xa8\xcb\
+\x5c\x3f\xb2\x36\xa1\x21\x1e\xab\x06\xcb\x02\x30\x1c\x2a\x61\x37\
+\x41\x9b\xe1\x60\xfa\x63\x6f\x75\x45\x38\xfe\x74\x4b\xdb\x2d\x29\
+\x0c\x10\x0d\x4d\x93\x60\xf0\xc0\x19\x91\x6d\xef\x71\x7d\x01\x05\
+\xc2\xdb\xe5\x4e\x6b\x76\xfe\x48\xf7\x2d\x54\xc7\x37\x5c\x24\x01\
+\x60\xb8\x12\xd4\xea\x46\x16\xcb\x8b\x27\x64\xdb\x64\x08\x69\x2b\
+\x44\x31\x78\xe2\x6b\xed\x71\xf2\x2b\x6f\xc9\x15\xff\x17\xb4\xbe\
+\x09\xfa\x0c\x9f\x04\xdf\xf5\x1e\xce\x88\x81\x36\x8a\xf1\x3b\x08\
+\x2a\xf5\xea\xdf\x81\xb8\xb8\xab\x60\x03\x0e\x2e\x81\xd6\xd5\x4d\
+\xa5\xcf\xd0\x3b\x15\xa9\x19\x51\xbb\x24\xaa\x7d\x2b\x80\xf9\xe2\
+\xd6\xb7\x40\xf7\xbe\xa3\x61\xe2\xb4\xf9\x94\xce\x86\x16\xad\xe3\
+\xd9\xe9\x70\xf3\xe3\x0c\xfc\xd3\x88\x00\x34\x6a\x7e\x35\xf4\x1e\
+\x9c\x0d\x43\xc7\x4d\x83\x21\x63\xa7\x42\xbf\x11\x13\xe0\xbb\x5e\
+\x83\xe0\x8b\x1f\xfa\xc3\x07\x5d\x7b\xc0\xe5\x81\xdb\x48\xdd\xef\
+\x49\x91\x8a\x71\xe9\x0e\x27\xf2\xe0\x15\x09\x0a\x1f\x23\x79\x54\
+\x55\x6f\x7d\x7d\x99\x7b\xe4\xe6\xfb\xc4\xa3\xb5\x32\x3d\x42\x48\
+\x28\x75\x0b\xb8\x39\xd0\xa4\x65\x00\xfe\xf1\xee\x97\x50\x56\xb5\
+\x1f\x6a\x48\x2c\xc8\x88\xc0\xf1\xe3\x50\xb1\x67\x2f\x23\x00\x22\
+\xc2\x57\xb5\xfd\xcb\x89\x00\x94\xa9\x79\x7f\x25\xa9\xfd\xcb\xc5\
+\x8a\x5f\x59\xa5\x69\xec\x23\x77\xf9\x65\xeb\xdf\xbe\xd3\x4f\x5f\
+\xdb\xbd\x5f\x7c\xcd\xac\xf8\xc3\xc0\xde\xe1\x54\x0a\x0d\x01\xee\
+\xf3\xe3\xac\xff\x90\x38\x04\xfc\x0e\xe0\x2f\x05\x7f\x08\xfe\x44\
+\x00\x76\x73\xd0\x37\x47\x0a\x8c\x08\x30\xf2\xb1\x9b\xfd\xcd\xd8\
+\x09\xd8\xc7\x48\xc0\xdb\xef\x7f\x03\x8d\x55\xe7\x87\x93\xd9\x6b\
+\x6f\x7b\x92\x0c\x97\x56\xac\x59\x4f\x24\x80\xce\xaa\x75\xb0\x8c\
+\xdd\xe6\xb2\xdb\xf9\x4b\xd7\xb0\xe7\xa4\xb5\x36\xff\x4f\x57\xd7\
+\x9e\xb0\x8e\xaa\x1a\x09\x64\x2a\x92\xc1\x89\x46\x08\xbe\xef\x39\
+\x8c\xc6\x66\x6d\xb2\xee\x85\xb3\x89\xb4\x99\x04\xc0\xa3\xae\x31\
+\x91\x66\xe9\xf5\x35\xb3\x77\x33\x22\xb3\x39\xa8\x5a\x46\xa5\x21\
+\x5b\xc7\xb7\x36\x60\x66\xb6\xd0\x3d\x09\x10\xd1\x85\xff\xde\x50\
+\xcc\xd7\x61\x6f\x3d\x98\x1d\x35\xb4\xb1\x99\x23\x01\xf0\xd6\xfb\
+\xfc\xc5\x69\x3f\xdf\xa9\x5d\xef\x10\x87\xe8\x8f\xb0\xe3\x6a\x07\
+\x7e\x9b\x6b\xa0\xbd\x0d\x16\xf6\xbb\x95\x80\x2a\xe0\xb2\x4e\x13\
+\x5b\x38\x83\xc7\x71\xe4\xe0\x14\x62\x11\x88\xf3\x05\x1b\x8a\xe2\
+\x0c\x18\xfb\x28\xc1\xfa\x42\x0b\x45\x78\xe1\x4b\x0b\xe4\xa0\x26\
+\x06\x0c\x85\x75\x40\xbc\x7e\xad\x6d\x9e\x2a\x7d\x00\x32\xf8\xfc\
+\x54\x81\x2b\xdf\x5b\x7f\xee\xf5\x8f\xa0\xff\xc8\x49\xf0\xc0\x53\
+\xaf\x33\xe0\x49\x13\x17\x41\xfd\xe2\x61\x55\x32\x3b\x55\xe4\x91\
+\x3b\x19\x91\x56\x68\x1c\xfe\x56\x39\x06\x48\x75\x76\x75\xd4\x47\
+\x0b\xf2\xb9\xc5\x7f\x7b\x75\xe8\x6e\x5a\x0d\xcb\x99\xb1\x00\x26\
+\xcd\x98\x0f\x93\xa6\xcf\xa7\xdb\x89\xd3\x17\x83\xef\xc2\x0e\x24\
+\xd6\xc2\xf9\xff\x15\x69\xb7\xc2\xc8\x09\x33\x61\x58\xf6\x74\x12\
+\x42\x0e\x1d\x3f\x95\x2e\xea\xef\x7c\xdc\x0d\x52\x2e\x69\xaf\xc4\
+\x62\xe6\xeb\x34\x64\xc9\x5a\x30\x37\x31\xf4\xf7\x49\xba\xf5\xfe\
+\xc8\x7d\x71\xf5\xb9\xa8\xf6\x75\xa2\xec\xe3\xef\x0b\x8f\x1c\x1b\
+\xf8\xd2\x15\xe9\xe0\x6b\x84\xdc\xb3\xe0\xa2\xab\xaf\x87\xc1\xa3\
+\x26\x31\xf0\x3f\x45\x09\x7a\x27\x4e\x9d\xa2\x19\x7b\x49\x45\x15\
+\x8d\x00\x4a\xf0\x20\x01\x60\x95\x7f\x59\x19\x27\x00\x44\x02\xec\
+\xf3\x7e\x31\xf3\xaf\x90\x62\x3f\x49\x00\x74\x63\x1f\xdb\xbe\xbf\
+\x24\x00\x72\x24\x10\x7e\x4c\x62\x20\xbb\x09\xf8\xf3\x11\xcc\x39\
+\xf8\xcb\xaa\xff\x08\xec\x67\x07\x41\x1f\xe7\xfd\x96\xb6\xbf\x04\
+\x7f\xaa\xf8\x4d\xe0\xe7\xa4\x43\xfa\x0e\xec\xe6\x64\x80\xfd\x9b\
+\xe2\xf2\x3d\x70\x75\xe0\x6e\xae\xc9\x48\x6d\xcf\x45\x99\xec\xf1\
+\xea\x35\x60\x0c\xe4\xad\xdb\xc8\xce\x06\x9e\xae\xb8\xae\x80\x1d\
+\xf6\xf9\xda\x8d\xb0\x72\xfd\x16\x68\x71\x69\x7b\xb1\xa2\x19\xb0\
+\xbc\xc6\xc3\xde\x3f\xca\x85\x4f\x54\xff\x48\xfa\x18\x11\xb8\xef\
+\xf1\xd7\x68\xeb\xe0\x83\xae\xdd\xc9\xe7\xc1\x04\xff\x90\xd5\x14\
+\x2d\xec\xb5\xee\xf4\x7e\x0e\x25\x28\x5e\x37\x16\xdb\x6d\x43\xcb\
+\x56\x89\x57\xcc\x67\xc4\xb0\x02\x97\x08\x9f\x7c\x23\x46\x02\x60\
+\x38\x5c\xdb\x9d\xb3\x49\x6a\x3f\xab\x3f\x33\x04\x98\xf8\xf9\x59\
+\xb5\xfb\x21\x46\x0c\x80\x6f\x38\xf8\x54\xbb\xcd\xb2\x8d\x28\xea\
+\xf4\x48\x5d\x02\x4d\xb4\x11\xa6\xde\x34\xa2\x80\x85\x11\xc3\x1e\
+\xa5\x9b\x9e\x20\xda\xdf\x1e\x70\x56\x98\x46\x5c\x7b\x8c\x56\x9d\
+\x47\x6e\xfd\x45\x37\x04\x8a\xa7\x5b\x63\x68\x61\x3f\x11\xec\x7f\
+\x23\xce\xe9\xf9\xe3\xe6\xbf\xac\x13\xf4\x1e\x9a\x4d\x1b\x01\x08\
+\x80\x34\x0a\x48\x31\x94\xf6\xc2\xab\x9b\x94\xf8\x8d\xa8\x6d\xff\
+\x98\x73\x28\x1c\xdf\x78\x21\xcb\x1c\xcf\x99\x00\x98\x41\x54\x14\
+\x15\xcb\x2e\xea\x58\x91\x0d\xcf\x9e\x09\x39\x33\x17\xd2\x99\x3c\
+\x6b\x11\xbf\x9d\xbd\x18\x7e\x19\x3c\x81\x2e\x4e\x67\xb3\xbf\xff\
+\x6c\xf6\xb3\xd1\x2a\x76\x14\x23\x00\xa3\x26\x4c\x87\x11\x13\xa6\
+\x13\x01\xf8\xf8\xab\x9e\xd0\xa4\x95\xc1\x2f\xec\x4a\x24\x96\xe6\
+\xf0\xf7\x1a\x9a\x92\x3b\x10\xe5\x35\xea\xfe\x7a\xf5\xf8\x74\xe7\
+\xcc\x74\x53\x3f\x20\x8e\x87\xfe\xb6\x80\xaa\x2a\x31\xad\xf0\xde\
+\x47\x5e\x82\x82\x2d\x3b\xe1\xd4\xaf\xbf\xc1\xc9\x5f\x7f\x25\x32\
+\xb0\xf7\xc0\x41\xd8\x89\xe0\x5f\xca\x15\xff\xa5\x92\x00\x54\x54\
+\x8a\xea\x7f\x97\x85\x00\x54\x6a\x6d\xff\xca\x18\x2a\x7a\x79\x2a\
+\x6c\x20\x1f\xe9\xc8\xdf\x23\xe7\xfd\xfb\x65\xd5\x7f\x50\x02\xbf\
+\x38\xb2\xed\xbf\x77\x1f\x07\x7f\x6d\x9b\xa0\x6a\xd7\x5e\xb3\x23\
+\x41\xa7\x8a\xfb\x11\x88\x6e\xc4\x90\x91\x53\x58\x75\x2e\x49\xa2\
+\x41\x8f\x61\xb0\xe3\xfd\xb0\x6a\xfd\x66\x58\xbd\xde\x74\x59\xc4\
+\x60\xa5\x35\xec\xac\x2b\x28\x82\xd6\xc1\x3b\x45\x47\xc7\x50\xdb\
+\x41\xde\x30\x71\xa9\xb4\xfc\xcd\x54\x61\x59\x98\x27\xe0\xbb\xa4\
+\x23\xf4\x1d\x36\x9e\xbd\x5e\x66\x40\xdb\xf6\x0f\xda\x8a\x8a\x50\
+\x4c\xb6\xe0\xa7\x27\xda\xdd\x6d\x93\x2b\x78\x86\x9c\xc4\x25\xb1\
+\xd6\x47\x45\x7f\xfa\x3a\x00\xfc\x3a\x7f\x56\xfd\x56\xfd\x0e\x15\
+\xb4\xb2\xc7\x74\xab\xde\x0c\xcb\x0c\xde\xcd\x9a\xd6\xd9\x2f\xde\
+\x2d\x33\x20\xf6\x07\xdb\xd9\x93\xde\x50\x44\xc4\xb5\xcd\x1c\xf5\
+\xc5\x13\xa9\xe3\x11\xff\x13\x67\x06\x88\x84\x5c\xc4\x97\x75\xdd\
+\x2b\x35\xac\x69\x8d\x11\xe6\xf1\xbc\x55\x1a\xb2\xad\xca\x09\xd3\
+\x9f\x54\xbe\x2f\xff\xc8\x0b\x6f\xc2\x80\xd1\x93\xe1\x85\xbf\x7d\
+\xcc\x5d\xec\x94\x26\x23\x24\x8c\x99\x0c\xed\x6f\x8b\x44\x00\x82\
+\x0e\xed\xc4\x68\x42\xc0\x90\xa3\x78\x33\x39\xd5\x41\xf5\x9f\x62\
+\xc6\x1b\x63\x75\x8c\xc6\x30\x6d\xb3\xee\x81\x11\xe3\x67\xc1\xc4\
+\x99\x0b\x18\xe8\x2f\xb0\x90\x80\xa9\x73\x96\xc0\xbb\x9f\xfc\x00\
+\x49\x2d\x33\xa1\x51\x8b\x0e\xb4\xbb\xff\xf6\x87\xdf\xc1\x98\x9c\
+\x59\x30\x66\xe2\x4c\xea\x04\x7c\xfe\x9f\x5f\xa0\x69\x2b\x43\xb4\
+\xe0\x45\x05\xee\x4b\x57\x73\xfe\x70\x02\x10\x6b\x75\x64\xb8\x54\
+\x68\x56\x82\xec\x51\xc4\x38\x5d\x1b\x3b\x88\x9f\x99\x2a\x2a\x37\
+\x9a\x79\x87\xc0\xcf\x08\xda\x77\x3f\xf5\xa7\xb5\xc1\x93\xa7\x7e\
+\x63\x24\xe0\x7f\x68\x73\x00\x6d\x7d\xb1\x0b\xc0\x09\x40\x85\x9a\
+\xfd\x13\x09\xa8\xd0\x66\xff\x92\x04\x54\xf1\x2e\x40\xf4\x96\xbe\
+\xd9\xda\xe7\x2b\x82\x78\xaa\xf8\x2d\xfd\x9c\x5d\xf4\x79\x85\x0c\
+\x0b\x12\x04\x00\x7f\x2f\x82\xbd\x45\xec\xa7\xe6\xfd\xa8\xf2\x3f\
+\x00\x7b\xb1\xf2\xdf\xbd\xdf\x04\x7e\xd1\x69\xe0\xdd\x89\x3d\xaa\
+\x5b\x51\x5e\xb9\x9b\x48\x4c\x39\x7d\x5e\x45\x6b\x8b\xe5\xbb\xf6\
+\xc3\x0d\x77\x3e\x2b\xcc\x9e\x02\x34\xb2\x39\xbb\xe9\xd5\xd0\x6f\
+\xc8\x38\xc8\x2f\x28\x24\x4b\xe5\xf5\x85\x5b\x28\x4c\x89\x4e\xe1\
+\x36\xe8\x70\xd3\xa3\xe2\xb9\x0d\x58\xd6\xf3\x9c\xd2\x36\xcd\x51\
+\x4f\x06\x89\x4a\xff\xf4\xca\x7b\x30\x32\x7b\x2a\xbc\xc5\x5e\x3b\
+\x1e\x4b\x35\x1d\xee\x32\x6a\xd5\xd1\x44\x26\xc9\x75\x1f\x0d\x18\
+\x51\x9d\xea\x9c\xb7\x1b\x42\x51\x4c\x88\x42\xf5\x0a\xc4\x4e\x51\
+\xc8\xb1\x69\xa2\x22\xdb\xd9\xd7\x29\x4b\x24\x82\x20\xb3\x61\x89\
+\x80\x79\x3d\x39\xab\x7e\x58\x51\x20\x4a\x3b\xc7\x5e\xd9\x46\xaa\
+\xca\x1d\xfc\xfc\xfd\xc1\x18\xc5\x83\xb5\x9d\x71\x45\xcf\x8e\x8f\
+\xfd\x09\x33\xa2\x24\xdc\xd5\xc6\xe8\xc1\x50\x95\x62\x92\x8b\x43\
+\x62\xdd\xde\xf8\x86\x4d\xf3\xe0\xd0\x01\xd0\x83\x81\x64\xdb\xdf\
+\x29\x44\x48\x80\x73\x93\xf3\x43\xf0\xfd\x2f\xa3\xa0\xef\xa8\xc9\
+\x70\x79\xe0\x0e\x76\x41\x15\x17\x4a\x21\x52\xf3\x6a\x2d\xce\xc8\
+\x41\x1e\xd6\x8b\x52\xb8\x1b\x63\xe4\x0d\x0e\xc7\x5d\x6c\x4d\xb5\
+\x4c\x6d\x57\x9f\x41\xa3\x8a\xb3\x7d\x08\xfe\x77\xc3\x8c\xf9\xcb\
+\x21\x7b\x2a\xb6\xfa\xe7\x5b\xc0\x7f\x0a\xab\xfe\xa7\xcd\xcd\x85\
+\x27\x5f\xfc\x27\xad\xef\x79\x5a\x22\x01\x30\x28\x48\x66\xdc\x94\
+\xd9\x30\x66\xf2\x6c\xe8\xd6\x73\x18\x34\xbf\x38\x93\xba\x08\x49\
+\x29\xba\x4b\x5c\x20\x8c\x00\x24\x45\x0a\xc7\x4a\x89\x75\x5f\xda\
+\xf6\x1e\x92\x71\xc4\x4a\x13\xa0\xaf\x38\x05\x94\xa6\x40\x11\xb9\
+\x16\x9c\x84\xdc\x7a\xdf\x9f\xa0\x68\x7b\x19\x9c\xfc\x15\x49\xc0\
+\xaf\x50\x73\xf2\x04\x89\xe7\x8a\x05\x09\x28\x11\x9d\x80\x72\x4d\
+\x08\x28\xf7\xff\x63\xa9\xe2\xc3\xaa\xfa\x2a\xd9\xde\xaf\xe2\x1b\
+\x04\x02\xe8\x2b\xc8\x45\x90\x77\x19\xe4\x29\x13\xa4\x03\xab\x7b\
+\x1d\xf8\xb1\xe2\xdf\xbb\xff\x00\x81\xff\x1e\xa1\xf0\xdf\x4d\x33\
+\xfe\xbd\x24\x3c\x54\xc6\x43\xbb\x38\x99\x28\xaf\xe4\xe2\x45\x69\
+\x57\xcc\x6f\xab\x78\x86\x41\xf9\x2e\xc8\x9e\x32\x8f\xbd\x2e\xdb\
+\x70\x63\xa7\x66\x3c\x2f\xe0\x96\x7b\x9e\x81\x8d\x85\xdb\x79\x7a\
+\x22\x45\x24\xef\xa0\xdb\x0d\xec\xf6\xd6\xbb\x9f\x25\xff\x87\x24\
+\x45\xb0\xe4\x68\xc7\xd0\x7c\x25\x32\xad\xf1\xd7\xec\xf3\x0b\x5b\
+\xdf\x04\x83\xc7\x4c\xa6\xac\x81\x0b\xae\xba\x51\xf9\x38\x78\x1d\
+\x5c\x2a\xc3\x8d\xd2\x1a\xaa\x9a\x0c\xc4\x75\x4d\xad\xfd\x7d\x89\
+\xaf\xcb\xe1\x06\xa2\xe6\x7b\xca\x08\x5b\x3f\xf7\x36\x50\x10\x90\
+\xf7\x77\xa0\x07\xa8\x25\x01\xa8\xab\x69\x43\x24\xc0\x0f\x39\x76\
+\x02\xa2\x1b\xf6\x68\x17\x37\x5f\x34\x85\xa6\x7d\x2e\x1f\x70\x11\
+\x1e\x06\x6d\xad\xd8\xda\xbc\x58\xec\xf7\x33\xdd\xf1\xf7\xb8\xff\
+\xbc\x50\xbd\xb5\xee\x22\xbe\xd9\xfd\xe9\xce\x61\x22\x0e\x04\x40\
+\xe9\x00\xb4\x36\xa7\x52\xf7\x8b\xec\x73\xfc\x59\xd7\xde\xf9\x34\
+\xf4\x1b\x3d\x99\xd2\xee\x3c\xac\xa2\xb2\x90\x00\xdd\x95\x2f\xea\
+\x1b\xc1\x88\xeb\x7b\xa6\x6f\xba\xe1\x50\x8d\x99\x6b\x40\xb4\x11\
+\xd3\x9c\x81\x62\xf3\x74\x9a\xd3\x5f\x78\xd5\x75\xb0\xbe\x60\x3b\
+\xe4\xcc\x40\xc1\x1f\x23\x00\x33\x78\x07\x80\x83\xff\x22\x72\x85\
+\x9b\x31\x7f\x19\x5c\x7f\xe7\x73\xe0\x69\xd1\x9e\x4e\xb3\x8b\xb2\
+\x60\x3c\x23\x0b\xd9\x53\xe7\x42\xff\x11\x39\x70\xc1\xd5\x37\x42\
+\x23\xd4\xb1\xa4\xca\x56\x3b\x3b\xa9\x62\x6d\xd4\x6f\x58\x3a\x39\
+\xf1\x5d\x94\x8c\x18\x3e\xb7\xbd\xce\xa5\x4e\x26\x2c\x61\xd3\x5c\
+\x8d\xe4\x3b\xf0\x5c\xd3\x71\xfe\x95\xd7\xc3\xc4\x69\xf3\x88\x00\
+\x1c\x3b\x81\x22\xc1\x53\x24\xb4\xb3\x9a\xff\xd8\x08\x40\x85\x39\
+\x0a\x90\x40\xae\xb7\xed\xc3\x4e\xd5\x6e\x0b\xd8\x13\x30\xef\xe2\
+\x62\xc2\x72\x01\xfc\x65\x62\xd4\xc0\x0f\x02\x34\xdf\x40\xc0\xff\
+\x67\x57\xf9\xeb\x4a\xff\xdd\xbb\x4d\x67\x41\xfd\x7e\xc8\xfb\x59\
+\x5e\x51\xa9\xac\x8b\xb1\xab\x51\x22\xcc\x8d\x70\xeb\x01\x57\x20\
+\xb7\x95\x54\xc2\x4d\x77\x3e\xc5\x5e\x0f\xd7\x40\x92\x48\x0e\xf4\
+\x34\xbf\x12\xe6\xe5\xae\x12\xc6\x49\x3c\x29\xb1\x50\x9c\x7b\x1e\
+\x7a\x91\xdb\x40\xd3\x88\x2b\xa0\x15\x0b\xba\x8b\xa9\x08\x0c\x4a\
+\x15\x86\x4d\xec\x71\x7f\xe7\xe3\xef\x60\x38\xab\xfe\x9f\x60\x44\
+\xd2\xe3\xd7\x32\xed\xeb\xf0\x7e\xb6\x16\x04\xb1\xfe\x5f\x23\xae\
+\xf7\x53\xb4\xf7\x59\x43\xa7\x01\x3a\x57\xff\x41\x07\x6d\xcf\x69\
+\x8c\x2c\x8e\x70\x1f\xbc\x0d\x3c\xc6\xf1\xd4\x7e\x0b\x20\x11\x69\
+\x77\xc1\x08\xc2\x95\xda\xb2\xd3\x40\x4c\x2d\x2b\xf7\xb8\xd9\x60\
+\x0c\xd5\x57\x5d\x83\x1b\x02\x2e\x01\x3f\x75\x67\xc0\x89\x17\x6d\
+\x06\x5c\xd9\x7d\x64\xf1\x9c\xc3\x5e\x32\xfd\x2d\x6d\xe1\x5f\x9f\
+\xfd\x08\xbf\x8c\x9c\x04\x37\xb2\x6a\x89\x5b\xa7\x06\xd4\x46\x86\
+\xb3\x8d\x69\x2c\x6d\xf0\xda\xb6\xe5\xcc\x15\x50\x69\xb6\xe3\xa1\
+\xa0\x9d\x34\x68\xec\x4f\x83\x69\xb3\x97\xc2\xe6\x2d\x3b\x20\x7b\
+\xda\x5c\x12\xfc\xf1\xea\x7f\x3e\x4c\x9e\xbd\x10\xa6\xb2\xea\x7f\
+\xfa\xdc\xc5\x30\x67\xc1\x4a\xb8\x2c\xfd\x4e\x68\x44\x04\x20\x0b\
+\xae\x0c\xde\x45\x44\x61\x4c\xce\x1c\x08\x74\x7a\x90\x2a\x3e\x4f\
+\xaa\xd8\xc9\xf7\x9b\xeb\x7c\x91\x2e\x48\x6e\x2b\x97\x75\x7e\xf3\
+\x3b\x82\x7f\xc0\x32\x56\xf2\x10\xf0\x64\xaa\x2d\x90\x73\x5a\x04\
+\xe1\xeb\xff\xf4\x81\x63\xc7\x4f\xd1\x96\x00\xde\xa2\xeb\x5e\x19\
+\x85\xfe\xf0\x95\xc0\x32\x11\xfe\xa3\xa2\x7e\x71\x1d\x70\x97\x6c\
+\xab\xcb\xa8\x5f\x4d\x28\xa8\x8d\x0b\x24\xe8\x57\x20\x81\x10\x55\
+\x79\x39\xa5\x08\x8a\xf5\xc2\x8a\x5d\x16\xa2\x81\x79\x03\x3b\x2b\
+\x70\x25\x91\xff\x5e\xa9\xf2\xb7\xae\xf9\xed\x55\xc6\x42\x72\xc6\
+\x4f\xbf\x87\x80\x7f\x97\xba\xbf\xdc\xc4\x88\xfd\x1d\xc2\xd8\x88\
+\x82\x8d\x4a\xcb\xc9\x07\x61\xeb\xf6\x52\xd8\xb2\xad\x04\x86\x8e\
+\x9e\x0a\x8d\x9a\x5c\x0d\x49\x4d\xda\x50\x68\x10\x8e\x01\xde\x7a\
+\xbf\x2b\x99\x25\xa1\x51\xd2\x4e\x3a\xe5\xe4\x9b\x70\xff\x23\x2f\
+\x33\x02\xd0\xd6\x4c\x84\x74\xd0\xd1\xf0\x0e\x40\x50\xad\x99\xa2\
+\x09\xd4\xf0\xec\x69\xd0\x63\xc0\x18\x68\x72\xbe\x34\x80\x0a\x59\
+\x6c\xb0\x4f\x2f\x68\xd5\xa5\x5b\x69\x40\xc3\xcf\xf9\x03\x70\xe6\
+\x68\x10\xce\x24\x2d\x84\x93\x78\xbd\x56\x04\x20\x54\xc7\x19\xb6\
+\x7b\x37\x20\xf2\x9e\x68\xb4\xaa\x4f\x27\x01\xe9\xb6\x51\x40\x86\
+\x45\x2d\xeb\xee\x24\x18\xc9\x37\x3f\x14\xa1\xb5\x1f\xaf\xe5\x64\
+\x34\x51\x61\xb8\x75\x70\xb4\x59\x5a\x62\x2f\x14\x4e\x23\x80\x60\
+\xd8\x8e\x6f\xf8\xbc\x4f\xd7\x00\xe8\x95\x0f\x67\xb7\xc9\xec\xa2\
+\x78\x69\xdb\x5b\xa0\xf7\xb0\x09\xf0\xc3\x2f\x23\xa1\xf9\x85\x99\
+\xb6\xfb\xae\xcf\xea\x32\x22\xac\x7d\xc6\x4f\x18\xbd\x5a\x90\x4a\
+\xf8\x5a\xa8\x74\x61\xe3\x4e\x6c\xd8\xea\xfd\xea\xbb\x5f\xe0\xd0\
+\xa1\xa3\x30\x6f\xd1\x72\x98\x38\x7d\x2e\xa9\xfd\x79\xf5\xcf\xc0\
+\x9f\x9d\x69\x73\x16\xc3\x8c\x79\x8b\x61\xf6\x82\xd5\xdc\xff\x5f\
+\xe4\x1d\x74\xba\xfd\x69\xf6\x6f\x17\xc1\xa3\x7f\xfa\x07\xe9\x1f\
+\x30\x25\xce\xdb\x22\x28\x3e\x16\xaf\x71\x69\x01\xeb\x0f\x9e\x06\
+\x6b\x56\x23\x2c\x1f\x23\xdc\x50\xc6\x74\x75\x24\x82\xe4\x6b\x07\
+\x2f\x75\x7e\x1f\x0e\x1e\xc2\x10\x9e\x13\xe4\x1b\x80\x91\xbb\x08\
+\xcc\x52\x17\x50\x26\xac\x80\x4b\x2b\x4c\x22\x40\xa6\x40\x0c\xd0\
+\x25\xd0\xf3\xca\x9b\x27\x02\x62\x36\x80\x5c\x1f\x94\x9b\x04\x65\
+\xaa\x1d\x5f\x25\x46\x0b\xbc\xd5\x5f\x5c\x21\xaa\x74\x1c\x3b\x60\
+\xe4\x30\x03\xff\x9d\xe5\xbc\x5a\xb7\x82\xff\x3e\xad\xea\x17\x73\
+\xfe\x4a\x59\xf5\xe3\xcf\xac\x22\xab\x62\xf4\x30\x20\x1b\x63\x21\
+\x6e\xdc\x59\x52\x26\x02\x8e\xca\x69\xfd\x11\xc3\x8f\x30\x13\x61\
+\xf3\xb6\x62\x76\x4a\xa1\x5d\xc6\xdd\x0c\xfc\xb1\x03\xd0\x86\x6c\
+\x7a\x5b\x07\x6e\x26\x7b\x65\xee\x89\xc0\x13\x10\x91\x98\x98\x04\
+\x20\x4d\x78\xfb\x9b\x3a\x9a\xe4\x94\x90\xb9\x39\x23\x6c\xb1\x9b\
+\x5f\x98\x05\x3f\xf7\x1b\x09\x23\xc6\x4f\x87\x6b\x6f\x7f\x8a\xaf\
+\x24\xfb\x75\x37\x4e\x6b\x40\x55\xe2\xb5\x3e\x75\x07\x2e\xa7\xb1\
+\xda\xe9\x6b\x69\x1b\x9a\x11\xdb\xe9\x02\xd6\xd0\xef\x02\xfc\x5d\
+\x09\x40\x6c\x4f\x5a\x22\xd3\x92\x0c\x8b\x91\x4b\xe4\x79\xa8\x73\
+\x52\xa0\x5d\xac\xa2\x2c\x79\x7d\xf6\x1d\x7c\x5d\x51\x1b\x70\x5c\
+\xaf\xb3\x8b\x67\xec\xf3\x6c\x6e\x90\x93\xc8\xb4\x2c\xc3\x41\x4d\
+\x6b\x84\xa5\x79\x39\xc5\x11\x7b\x53\xea\xea\x8b\x1f\x9b\x25\xa5\
+\xee\xd7\xed\x2c\xf2\x91\x2e\x79\xba\x77\xbe\x83\xc1\x0e\x8d\x66\
+\xd2\xe0\xb1\x17\xde\x82\xfe\xa3\x72\xe0\xe5\x37\x3f\xd3\xfe\x46\
+\xfb\xbe\x70\x46\x44\x5b\x65\x6f\x8a\xbb\xe1\x51\x64\xcf\x82\xa0\
+\xb5\x15\x2b\xd4\xfe\x44\x00\x9a\xa5\x91\x9d\xeb\xed\xf7\x3d\x0f\
+\xfb\x0f\x1e\x25\xe1\xd8\x64\x06\xfc\x53\x04\xf0\xe3\xa1\xb9\xff\
+\x1c\x5e\xfd\xcf\x9a\xbf\x04\x26\xcf\x5e\x2a\x2e\x3a\x99\x24\xe6\
+\xba\xeb\xd1\x57\xe0\xcb\xef\x07\x40\x32\x03\xfd\x64\x22\x05\xf8\
+\x78\x18\x24\xb0\xa3\xc7\x24\x55\xb7\x41\xe6\x23\x81\x86\x69\x3d\
+\xea\xd9\x15\xc1\x30\x12\xcc\xef\x8b\xbc\xd5\xdc\xdc\xfc\x72\x1b\
+\xa2\x1d\xdc\xf5\xc0\xf3\xe4\x9d\x5f\x5d\x73\x9c\x5c\x04\xd1\x8d\
+\x8f\x3a\x01\xb8\x21\xc0\xaa\xe8\xb2\xb2\x4a\x45\x04\xa4\x38\xb0\
+\x4c\x12\x01\x4d\x30\x58\x2a\x5a\xf9\x7c\xde\xbe\x9b\x6e\xd5\x29\
+\xaf\x12\x2d\x79\x51\x9d\x97\xed\x12\xee\x83\x15\x04\xda\xa5\xf4\
+\xbb\x44\xb5\xce\x00\x5b\xaa\xfb\xa5\xd0\x8f\xd6\xfa\xb4\x8e\x83\
+\xec\x28\x94\x09\xe0\xc7\x43\x15\xbf\xf6\x33\xc8\xf3\x00\xdd\x0f\
+\x19\xf0\xa3\x13\x22\xb5\xf5\xb7\xed\x24\x7b\x64\x3c\x5f\x7c\xdb\
+\x87\x81\xff\x35\x3c\x7d\xd1\x87\x44\xe0\x4a\x98\xbb\x68\x85\x22\
+\x34\x95\x15\x48\x66\xf6\xc2\xdd\x0f\xfe\x59\x8c\x00\xb8\xde\x43\
+\x7a\x33\xc8\x95\x5a\x4a\x35\x15\xeb\x7f\x48\xae\x5e\xfe\xfb\xbf\
+\x59\xf5\x3f\x1d\xde\xfd\xf4\x27\xd1\x7d\x72\x72\xc3\x74\xf2\xcb\
+\x70\xee\x66\x35\x94\x6a\x3e\x16\x61\x70\xc3\xb9\x0e\xda\xdb\xfc\
+\x41\x17\x43\xb0\x86\xba\x5f\x21\xc7\x76\xbe\xb7\x4e\x4e\x82\x89\
+\xea\xc6\xd7\x69\x04\x60\x24\xf0\x01\x0a\xd9\x3a\x09\x89\xf8\xfd\
+\xa6\x5f\xb6\xc7\xb5\xc2\x76\x02\xfd\x68\xdb\x03\x86\x8b\x32\x3b\
+\x9e\x0a\x34\x14\x41\xad\x1d\x8c\xaa\x07\xb0\xe4\x59\xfb\x8d\x5a\
+\x84\x5e\xd4\x35\x96\xd2\x88\x18\xe6\x61\xad\x1c\x1d\x5c\xb7\xe8\
+\x62\x66\xa6\xfe\x9d\x7b\x5e\x10\xbe\xed\x35\x14\x06\x8e\x9e\x0a\
+\x59\x37\x3f\x6e\xe9\x1e\x58\x1f\x5b\x37\x4b\x65\x07\x41\xa8\xcb\
+\x86\x86\xc7\xc1\x80\x44\x12\x15\xf9\xb5\x46\xd2\x28\x87\x11\x80\
+\xe6\xe7\x85\x20\x7f\x43\x11\x1c\x38\x74\x08\x0a\xb6\x14\x31\xc0\
+\xc7\x76\xff\x22\x98\x4e\x33\x7f\x04\xfe\x5c\x56\xf9\xe7\x32\xf0\
+\xcf\x65\xd5\xff\x52\x9a\xf7\x63\x86\x7c\x23\x91\xde\x77\xc7\x23\
+\x9d\xe1\x0f\x69\x77\x88\x8e\x40\xa6\xa6\x8d\x30\x6c\x44\x52\xaf\
+\xc2\x8d\x06\x6c\x91\xba\xad\xd3\xea\x06\x43\x86\x6d\xa5\xd0\x10\
+\x06\x42\x6d\xe1\xe6\x3b\x9f\x62\xd5\xf6\x21\xa8\xae\x3e\x46\xe7\
+\x48\xf5\x71\x02\x6d\x8c\x06\x46\x60\x2d\x2d\x33\xf3\x01\x4a\xca\
+\xcd\x16\x3e\xdd\x0a\xb1\x9d\xfa\x58\xc4\x07\x93\x95\x70\x85\x39\
+\x87\xe7\xa7\x82\xda\xf2\x64\x41\x2c\x8c\x88\x68\x1d\x91\xb2\x09\
+\xb8\x45\xf1\x8e\xe2\x72\xaa\xf2\x75\x53\x1f\x12\xfa\xd1\x48\xa1\
+\x8a\x4e\x59\xa5\xa8\xd2\xd1\xcd\x50\x03\x7e\xcc\x36\xc0\x9f\xb1\
+\x9d\xfd\x8c\xa2\x9d\xbc\xea\xc7\xb6\x3f\x66\x21\x14\x62\xe5\x5f\
+\xb4\x93\x42\x92\x30\x29\x71\x75\xfe\x56\x32\x4d\xe2\x21\x4c\x6d\
+\xc9\xa1\xef\xfd\x7f\x7f\xc7\x7e\x0f\x92\x0d\x1c\x35\x20\xf9\x38\
+\x08\x37\xdd\xf9\xb4\x99\xd9\xe0\x4f\x57\x1e\x26\xc9\x3e\xf3\x1a\
+\xe0\x11\xaf\xdb\x76\x1d\x1e\x20\xf0\x1f\xc4\xde\x03\x17\xb5\xbe\
+\xc5\x62\x42\x26\x85\x6a\x1e\xbf\x93\x11\xda\xe9\x79\x9d\x9c\xfe\
+\x10\xa1\xdf\xd3\xbe\xfd\xef\x63\x6c\x10\x27\x01\x08\xd4\xd3\x1f\
+\x67\xc4\xf0\xbd\x78\x72\xa0\x0d\x17\xeb\x5c\xbb\xb0\x2d\x10\x61\
+\x26\x1a\xc9\x47\xc0\xfd\xc1\xac\xbf\x17\x44\x3c\x6d\x25\xa3\xc1\
+\x58\x77\x34\x3d\x80\x63\xb7\x40\xcc\xc3\x83\x37\xfc\x11\x06\x8e\
+\x99\x06\x3f\xf5\x1f\x0d\x29\x17\x77\xe2\xe1\x2b\xb2\x3a\x12\x15\
+\x0f\xb7\xa9\x8e\xd1\x28\xc4\x6f\xd5\x11\xc4\xec\x0b\x2e\x2b\x61\
+\x22\x00\xed\xe0\xeb\x6e\xfd\x61\xdf\xfe\x03\xb0\xff\xe0\x01\x58\
+\xbe\x72\x0d\x4c\x9b\xbb\x08\x66\xcc\x5d\x42\x67\xe6\xbc\x25\x0a\
+\xf8\xe7\x2c\x5c\xc6\xaa\xc0\xe5\x30\x76\xf2\x3c\x38\xbb\xd9\x35\
+\x64\x00\x84\x17\xec\xa6\x17\x75\xa2\x4e\x00\x0f\xf6\xb1\xe6\x34\
+\x38\x67\x44\x04\xea\xa9\x7d\xeb\x14\x42\xe5\x94\xb5\xe1\xf6\xf8\
+\x4a\x5d\x84\x21\x3c\x03\xd2\xa8\xba\xc5\x36\xf8\x03\x8f\xfd\x15\
+\x0e\x1e\x62\x04\xa0\xe6\x04\x1c\xad\x39\x0e\x47\x8e\x1c\x25\xf0\
+\x2f\x2e\x29\x17\x60\xcd\xa3\x82\x8b\x45\x7b\xbc\x44\x90\x01\xd3\
+\x46\xb8\x52\x54\xf9\x55\x44\x0e\xd0\x61\x70\x67\x79\xa5\x02\x7f\
+\x14\xe1\x21\xf0\xef\x50\x55\xba\x48\x21\x94\x91\xc4\x02\xb8\xb7\
+\x33\xe0\xc6\x31\x42\x95\xc8\x10\xa0\x7d\x7e\xb9\x39\x50\x51\xa5\
+\x0c\x8b\x64\xab\x7e\xa7\xb0\x36\xe6\xc0\xcf\x41\xbf\x08\xe7\xfd\
+\xa2\xe5\xbf\x65\x5b\x31\xaf\xfc\x19\xf8\x6f\xc2\x80\x24\x8c\x4a\
+\xa6\xb3\x13\xee\x79\xf8\x45\x9e\x16\xd8\x9c\x77\x01\xae\xbb\xf9\
+\x11\xd8\xb3\x5b\xac\x1b\xee\x3b\x44\x1d\xa3\x8c\x6b\x1f\xe6\x69\
+\xa3\x3e\x43\x99\x4d\x29\x00\xd5\xb6\x31\x1a\xa7\x1a\xf0\xcd\x4f\
+\x83\x60\x58\xf6\x54\x78\xf8\xd9\xbf\x93\xee\xe2\xcc\x9b\x23\x1b\
+\x2e\xda\xaa\xe0\x7f\x09\xc0\x1a\x0d\x44\xa4\xea\x33\x3a\xb8\xee\
+\xc4\xa2\x01\x3b\x00\x46\x14\x27\x3c\xa3\x6e\x0f\xa0\x2f\x5a\x2b\
+\xdb\x56\xe9\xb8\x2a\xa2\xf5\x55\x29\x23\xb6\x27\xd7\x67\x24\x90\
+\x79\x46\xf0\xdc\xf6\xa5\xd7\xa1\x8a\xaf\x9f\x17\x54\x38\xc0\x85\
+\x5c\x4c\x76\xf4\xb5\x41\x74\x0c\x34\xe0\xc5\xbf\xfd\x1b\x06\x8f\
+\x9d\x0a\xaf\xfd\xeb\x6b\xd1\x25\xc8\x52\x06\x29\x7a\xd7\x25\xb2\
+\x72\x56\x1f\xfd\xc4\xf3\xe6\x16\x5e\x0a\xa9\x66\x6b\xdc\xe8\xf4\
+\x10\x54\xed\x3d\x08\xfb\x0e\xec\x87\x03\x07\x0f\xc2\xdc\x05\xac\
+\xd2\x17\xa0\x4f\x87\x81\x3e\x82\x3f\x02\xff\xfc\x25\x79\x74\x26\
+\x4c\x5f\x44\x04\x80\xf6\xbf\x85\xbb\x60\x72\x0b\x91\x87\x90\x1a\
+\x8c\x02\xfc\xb5\x59\x5b\x4d\xc4\x45\xc8\xee\xca\xe9\x16\x59\x2d\
+\x2d\x58\x79\x02\x21\x92\x80\x46\x68\x75\xdc\xb4\x35\x74\x7e\xf3\
+\x13\x56\xfd\x63\x24\xef\x71\x8a\xe6\x45\x43\x9e\x9d\x22\x35\x70\
+\xa7\x88\x0c\x36\x63\x83\xc5\x29\xe5\x5d\x02\x22\x09\x65\xbb\x08\
+\xe8\x4b\xb4\xaf\x49\x80\xde\x51\xaa\xe5\x10\xc8\x24\xc2\x62\x7e\
+\xb6\x17\x97\x8b\xb0\x22\xde\xb2\x2f\x11\xdb\x00\x15\x42\xe8\x57\
+\x2e\xc6\x0e\x65\x02\xfc\xe9\xf7\xc8\x9f\x55\x5c\xa1\x88\xc3\x36\
+\xd1\xea\xdf\xb2\x83\x83\x3f\x07\xfe\x1d\xbc\xea\xdf\x2a\xcf\x76\
+\x28\xd8\xb2\x8d\xa2\x93\xbf\xfb\xb1\x3f\xad\x02\x26\xb1\xea\x3f\
+\x29\xa5\x0d\x9c\xe3\xbf\x06\x8a\x8b\xb9\x17\x01\xfe\xed\x47\x8e\
+\x1e\x87\xcb\xda\xdc\x6c\x7d\xed\xcb\x4a\x9e\x34\x26\x69\x7c\xf3\
+\x85\x11\x88\x87\x9e\x7a\x83\x55\xfe\x93\xe1\xd3\x6f\xfb\x92\x3e\
+\xa4\x51\x6a\xd0\x31\xda\xfb\xcc\x99\x25\x1b\x67\xd0\xfd\x48\xa4\
+\x37\x4d\xec\x6b\x85\xff\x5d\xe4\xc7\x5c\x79\x3e\xcb\x31\xee\xd1\
+\xd7\x90\x4f\xa0\x11\x75\xad\xc9\xb4\x8c\x8d\x77\x85\xc2\x4d\xab\
+\xe0\x16\x2a\x64\xcb\x82\xf6\xbb\x09\x05\x03\xce\x95\x95\xcf\x80\
+\xba\x87\x2b\x05\xb4\x17\x5e\x20\x3c\x11\x2e\xa6\xf8\xcf\xfa\x63\
+\x93\xa6\xa5\x72\x30\x82\x9b\x9e\x7b\x12\x21\x89\xa1\x44\xf2\x5d\
+\x93\x0b\xb2\xe0\x9b\xee\x43\x60\xd0\x98\xa9\x70\xdd\x9d\xcf\x88\
+\x2e\x40\x66\x1c\x46\x19\x46\x2d\x8c\x9f\xac\xb9\x01\xd4\x91\x48\
+\xcd\xa4\xaa\x6c\xca\xcc\xc5\x70\xe0\xd0\x41\x38\x70\xe0\x20\xa9\
+\xc9\x67\xa3\xca\x7f\x3e\x56\xfb\x08\xfa\xac\xe2\x5f\xbc\x02\xe6\
+\xb1\x83\xc0\xbf\x20\x17\x33\xe1\x57\xc1\xb4\xf9\x79\x8c\x00\xb4\
+\xa6\xd7\x8d\x4a\x3b\x94\x29\x6f\xa9\x46\x0c\x04\xc0\xa8\xe7\x4e\
+\x40\xac\xa3\x29\x67\xf3\x2a\xe5\x1d\x20\x08\x00\xc5\xdd\x0a\x30\
+\xfb\xa9\xd7\x70\x4e\x00\x18\xf8\x55\xb3\x83\x89\x7a\xdb\x65\x6b\
+\x5d\x1c\x5e\xbd\x8b\xb6\xbd\x56\xcd\xf3\xea\xbe\x52\x55\xf9\xdb\
+\x4b\xf4\xc3\xc1\x7e\x9b\x0e\xf6\x04\xf8\xe5\x74\xb0\x72\xa7\x79\
+\x3d\x03\x6f\x24\x16\x64\xe0\x23\xda\xfe\x28\xf4\x2b\x15\xba\x81\
+\x62\xd1\xf2\xa7\x54\x43\x02\x7e\xfe\xf3\x8a\x18\xf0\x6f\xc5\x39\
+\xbf\x68\xf7\x4b\xf0\xdf\x24\xcf\x16\x04\x7e\x01\xfe\x9b\xb7\x91\
+\xe9\xcf\xa2\xe5\xeb\xd8\xf3\xdb\x9a\x46\x00\x5e\xf6\x18\x78\x19\
+\x09\x98\x30\x69\x36\x59\x11\x63\x2c\xf1\xa1\xc3\xc7\xa0\xd9\x79\
+\x19\xe2\xf5\x94\x21\xf4\x39\x5c\x2f\x44\xe3\x25\xec\x9e\x30\xf2\
+\xf4\x87\xb4\x5b\xe1\x97\xa1\x13\xa0\xcf\xd0\x6c\xb8\xe4\x9a\x5b\
+\xc5\xda\x9f\x61\x71\xa8\x0c\x4f\xd6\x33\xce\x00\xd7\x38\xe7\x75\
+\xd5\xd3\x23\xf4\xab\xcd\x0a\x9d\x11\x37\x01\x48\x52\xfa\x8d\xda\
+\xae\xfa\x9d\xb9\x8e\x88\x8d\x84\xb5\xf2\x59\xa7\xf7\xce\x04\x62\
+\x98\x71\x19\x75\x9c\xef\x18\xce\x39\x02\x4e\xbb\xd0\xae\x5d\x83\
+\x28\xb1\xc3\xbe\xa0\x5a\x67\xab\xdb\x1c\x4a\x03\x76\xbf\x53\xc0\
+\x50\x7a\x04\x45\x7c\x7d\x75\x01\x0c\xe7\x71\x87\xdf\x2d\x6d\x2b\
+\x8a\x6b\xa0\x4c\xd9\x13\xa1\x41\x6d\x32\xef\xa3\x6a\xa8\xf7\x90\
+\xf1\x70\xc1\x55\x58\x41\x65\xd9\x46\x01\x19\x16\xcb\xe1\x24\x8b\
+\xc1\x87\x4d\x18\x48\xd6\xaa\xd6\x8e\x90\xc7\xcd\x45\x51\x6e\x28\
+\x50\x37\x22\x0b\xee\x7e\xf8\x65\x38\x7c\xb4\x86\x55\x73\x07\x61\
+\xff\xa1\x03\x34\x9b\xc6\x0e\xc0\x3c\x06\xfc\xf3\x17\x2f\x67\xc0\
+\xbf\x9c\xf2\xe0\x39\xf0\xaf\xa4\x28\xd8\xc5\xcb\xd7\xc0\x82\xe5\
+\xf9\xec\x02\xd1\x4e\xd9\x1b\x2b\x2d\x42\x4a\x50\xd9\xc8\xc6\x56\
+\xfd\x07\xea\xe9\x3d\x16\xad\xb3\x16\x8a\x6c\xd2\x25\x04\x92\x72\
+\xb6\xed\x6d\x9e\x26\xe2\x88\x0d\x68\x72\x5e\x08\x96\x2c\x5d\x07\
+\x35\xa2\x0b\x80\x9b\x01\xf8\xb8\x71\x41\x5d\x99\x15\xbc\x91\x10\
+\x60\x65\x8f\x82\x3b\x8d\x20\x6c\x93\x55\x7d\x89\x76\x14\xe0\xf3\
+\x43\xad\x7a\x3c\x3b\xf0\x94\x11\x78\xe3\xc1\xca\x1d\x09\x44\x79\
+\xe5\x1e\xbe\xde\xc7\x08\x00\x8d\x1e\x4a\xc4\xbc\x5f\x90\x09\xfc\
+\x99\x6a\xce\x2f\x2b\xff\xed\xc5\x5c\xe4\x27\x41\x9f\x4c\x7d\xc4\
+\x61\x15\x3f\x1a\xfd\x6c\xd8\xbc\x15\x36\x30\xf0\xcf\xdf\xb8\x15\
+\xd6\x16\x14\x41\xf0\xda\x07\x48\x07\x80\xdb\x2c\x48\x18\x3f\xfe\
+\xec\x47\xca\x4c\xa8\xae\x39\x06\xdb\x77\x94\xb3\xe7\x3c\x5d\x10\
+\xbf\x0c\x65\xfa\xa3\x44\x94\xcd\x71\xb5\x34\x9d\x5c\x21\x07\x8c\
+\xca\x81\xdb\x1e\xfc\x33\x37\x9d\x92\x84\xda\x51\xcc\x67\x38\x12\
+\xef\x44\xce\x80\x7f\xaf\x55\x6c\xfc\x9a\x04\x87\x4c\x19\x5f\x62\
+\x8d\x7c\x12\xb3\x06\xd9\x30\x84\xea\x6c\xa1\x95\x3b\x0d\x04\x20\
+\x04\xce\xf1\xc0\xb5\xab\x80\xa2\xed\x4c\x5b\x3e\x76\x74\xe4\x8b\
+\x02\xee\x2a\x69\x2d\xd6\x7f\x6f\x40\x62\x46\x24\x2e\x3f\xdf\x9f\
+\x1e\xe7\x63\xe5\x4c\x14\x62\x89\x9e\xb4\x27\x0a\xaa\x96\xb0\x4a\
+\xd7\x8b\x9c\x10\x18\xed\x24\x33\xe0\x45\xe3\x19\x5c\x99\x1b\x9e\
+\x3d\x03\x3e\xfe\xba\x37\x24\xb7\x44\xe1\x5c\x7b\xd5\x09\x48\x52\
+\x9d\x03\x1b\xc9\x50\xa9\x6a\xd6\x08\x5f\xe5\x48\x68\xd3\x4f\xe8\
+\x5d\x15\x73\xe5\x4d\xa4\xbd\xb1\xff\x33\x6d\x76\x2e\x1c\x3e\x8c\
+\xa1\x32\x87\xa8\x0b\x80\xf3\xec\xf9\x04\xfa\xcb\x61\x01\x01\xff\
+\x0a\x06\xfc\x79\xb0\x78\xd9\x4a\x58\xb2\x7c\x15\xe4\xe6\xad\x85\
+\xa5\x2b\xd7\xc2\xb2\x35\x9b\x20\xf5\xa2\xf6\xca\xfc\x25\x39\x45\
+\xac\x7f\xb1\x8b\x4b\xb2\x45\x97\xe0\x56\xf9\xcb\xc7\x37\xbd\x9e\
+\x48\x80\x9b\x2e\x26\xf2\x45\xc7\xa3\xe7\xb1\x37\xd7\x82\x86\x7c\
+\x5a\x9a\x1d\x7b\xdc\xd2\x3b\x3c\x08\xfb\x0e\x56\xd3\x66\xc0\x11\
+\x22\x50\x47\x38\xd0\x12\x48\x97\x9a\xe0\x4d\xf3\x76\x56\xb9\xe3\
+\xd9\x69\x02\x3c\x56\xe5\xdb\xc5\xe7\x34\x8f\x2f\x2e\xb3\xfe\x9f\
+\x9d\x25\x04\xfc\x5b\x77\x94\x2a\xe0\xdf\xba\xbd\x44\xed\xe9\x23\
+\x01\x28\x63\x04\x40\xba\x03\xe2\x48\x60\xfd\xc6\x2d\xbc\xcb\x50\
+\x2c\x2b\xfe\x52\xf1\x33\xb0\xe5\xbf\x93\x2a\x7e\x39\xeb\xdf\xac\
+\x83\xff\x16\x04\x7e\x13\xfc\xf3\x37\x6d\x81\x75\x1b\x0b\x61\xdd\
+\xfa\x42\x58\xb3\x7e\x33\xbc\xfc\xc6\x47\xec\xf9\x4d\xa7\xe7\x15\
+\xb7\x3a\x1e\x7e\xf2\x55\xa8\x39\x86\xde\x08\xc7\x60\xce\xfc\x3c\
+\xf6\x3d\xf6\xde\x48\xcd\xd4\xc6\x58\x42\x6c\x2a\x08\xc0\x73\x7f\
+\xed\x02\x03\x46\x4e\x82\xb7\x3e\xfa\x8f\xb0\x85\x0e\xc4\x00\x02\
+\x6e\x6b\xd7\x67\xf8\x8e\xb9\xaf\x61\xee\x5f\xec\x44\xc0\x88\x6a\
+\xb4\xe6\x49\xc8\xf8\xd6\x68\x70\x30\xaf\xcd\xc1\x0e\x40\xa3\x86\
+\x25\x00\x46\x04\xc0\x0b\x38\xb4\x73\x13\xc5\x50\x43\x2e\x0e\x83\
+\x31\x00\xba\x76\xd1\x0b\x4f\x0d\x74\x18\x1f\xe8\x6b\x55\xbe\xba\
+\xb6\xe1\x0d\x8b\xef\x77\xed\xe7\x71\x06\x84\x87\x33\xd5\xf6\x79\
+\x8b\xfe\xbb\xc3\x03\x81\xec\xa0\x2f\xd7\x04\x33\x89\x00\x10\x00\
+\xb7\x0c\xc1\x47\x5f\xf6\x84\x61\xe3\xa7\xc3\x53\x2f\xbd\xcb\x7d\
+\xe9\xa9\x13\xa0\x03\xbe\xb3\x9d\xa7\xd7\x6f\x40\x78\x82\x60\xd0\
+\x46\xfa\x44\x85\x25\x55\xd5\x3e\xf9\xb8\x72\xb1\x5e\xe8\xda\x87\
+\xe1\xf0\x91\x63\x70\xe8\x10\x27\x00\xd8\x05\x40\x83\x97\x45\xb9\
+\x79\xfc\x30\xe0\x5f\xb4\x0c\xab\xfe\x55\xb0\x24\x6f\x0d\x07\xfe\
+\x55\xeb\x28\x1a\x76\xe5\xba\x42\x68\x97\x79\x3f\x5d\xe0\x75\xa0\
+\x54\x3b\xe0\x0e\x1b\x28\x1e\x87\xd7\xbb\xc7\xa2\x61\x88\x70\xc1\
+\xf3\xd5\xf5\xf9\x8b\xf3\xff\xfb\x44\x1b\x54\xfe\x5d\xb6\x20\x25\
+\x7c\x4c\xff\xfd\x45\x77\xca\x0b\xc0\x0e\xc0\xe1\x23\xd5\x34\x8f\
+\xe7\x4e\x79\xc5\x50\x88\xe2\x3a\x05\xda\x25\x8a\x18\xe0\x6d\x91\
+\x8d\x20\x6c\x15\xc7\x24\x10\xbc\xca\xb7\x9c\x6d\xc5\x04\xfc\x74\
+\xd8\xcf\xc7\x2a\xbf\x14\xfd\x04\x84\xa3\x1f\x8a\x0d\xf1\xf9\xa2\
+\xae\x82\x52\xf7\x97\xa8\x39\xbf\x12\xf9\x15\x69\x33\x7e\x04\xfe\
+\x2d\x12\xf8\x8b\xa8\xea\x5f\x5f\xb0\x85\x3c\xff\xd7\x6d\xd8\x4c\
+\xc1\x3f\x48\x00\xba\xf7\x1d\x49\x95\xff\x39\x2d\x32\xe0\x1c\x46\
+\x54\x5b\x07\xef\x80\x13\x27\x7e\x65\xe7\x04\xf4\xea\x3b\x8a\x7d\
+\x2f\x53\x74\xb0\x74\x02\x90\x41\x8f\x5b\xc7\x5b\x9f\x84\x81\xa3\
+\x27\xc1\xcf\xfd\x47\x81\xff\xd2\x0e\xe2\x35\x10\x6a\xb8\xe7\xf1\
+\xbf\x56\x0d\x1f\xeb\x56\x56\x6c\x1d\x14\x6f\xdc\x9d\x04\xb7\x02\
+\xce\x38\x8d\x8f\x4b\xf4\xeb\x74\x03\x12\x80\x68\x76\xb7\xce\x23\
+\x00\xaf\xc3\x0a\x57\xdc\xd6\x8a\x8e\x01\x32\x91\x12\x05\x03\x36\
+\x10\x77\x22\x00\x86\xfa\x9c\x7f\x5f\x46\x0a\x4b\x5b\x5b\x23\x82\
+\x80\x30\x9e\x20\x1e\xc3\xc1\xfc\x23\x14\xa7\x10\xb2\xfe\x5e\x88\
+\x5e\x87\x2d\x89\xd8\x2a\xff\xa0\x96\x7b\xcf\x2b\x70\x5c\x99\x3b\
+\xef\x8a\xeb\xa1\xc7\x80\x71\x30\x68\xcc\x14\xc8\x62\x17\x4b\x8a\
+\x48\x4d\xb5\xee\xad\x73\x75\x75\xd0\x46\x08\x82\xd6\xa4\x35\x7d\
+\x5f\x5a\x3e\x76\xe4\xb9\x8e\x3e\x04\x92\x3c\x98\x3a\x00\x14\x01\
+\x76\xfb\x79\x10\x1c\x3c\x8c\x4a\xee\x83\xb0\xff\xc0\x01\x12\x00\
+\xee\x60\xe0\x91\xbb\x6c\x35\x55\xfb\x4b\x56\xac\x86\xdc\xe5\x0c\
+\xf8\xb1\xea\x5f\xbd\x0e\x96\xaf\xc9\x87\x15\x6b\x37\x30\xf0\xdf\
+\x08\xab\xf2\x37\xc3\x7d\x8f\xbd\x4a\x73\x71\x9d\x24\xca\xd9\xa1\
+\xd7\xae\x27\xd1\xac\x8f\x93\xb4\xc4\xbe\x24\xf5\xda\x49\xb4\x80\
+\xd4\xa8\x73\xe5\x66\x89\x1e\xb6\xad\x33\xa2\x6e\xc3\x77\x61\x26\
+\x14\x16\x95\xd1\x36\x00\xa5\xf3\x1d\x38\x4c\xeb\x74\x9b\x8b\xb6\
+\x53\x9b\x5d\x02\x2f\x81\xf7\x76\x71\x76\x08\x62\x20\xda\xf1\xf2\
+\x73\xf5\x7d\x05\xf6\x7c\x4e\x2f\x6f\x0b\x8b\xf8\xcc\xbe\x50\x54\
+\xef\x48\x00\x30\xb6\xb8\x44\x80\x3f\xb6\xfe\xa7\xcc\x9c\x6f\x56\
+\xfc\x6a\xce\x5f\xac\x04\x7e\xb2\xd5\xbf\x51\x00\xff\x06\xd9\xee\
+\xc7\x50\x9f\x4d\x08\xfc\xac\xf2\xdf\xb0\x85\x83\xbf\x20\x00\x78\
+\x3b\x7b\x51\x1e\x03\x7f\x03\x1a\xb7\x6c\x0f\x8d\x5b\x75\x80\xa6\
+\x8c\xb8\x1e\x38\x78\x94\x52\x13\x3b\xbf\xf9\xa9\x20\xad\xfc\x78\
+\xa8\xfd\x9f\x45\x8f\x0f\x7a\xfd\xf7\x1d\x3a\x1e\x06\x8f\xce\xa1\
+\xed\x17\xca\x9a\xf0\x1b\x31\x5a\x9c\x07\x1d\x3a\x00\xb6\x1c\x90\
+\x06\xb7\xd8\x3d\x53\x45\x88\xa1\xc8\xd7\x44\x9f\xa1\x0e\x27\xb5\
+\x5a\xa1\xe6\x0b\xd4\xa1\x90\x75\xd2\x15\xd4\xd7\xe6\x84\xfd\x75\
+\x10\xa8\x75\x07\xa0\x81\x34\x00\x01\x88\x16\xf7\x6b\x7f\xa0\x92\
+\x7d\xee\xe2\x0b\xbd\x02\x8a\x54\x0d\x99\xe0\x6f\x38\x86\xbe\xb8\
+\x13\x00\x19\x9c\x62\x02\xbb\x0c\x54\xf1\x88\xb5\xa8\x24\x9f\xd9\
+\x16\xf5\x36\xe7\x0a\x69\xfc\x5c\x56\x97\xe6\x8b\xa9\x16\x4f\x8e\
+\xdf\x1e\x8f\x1b\x8a\xe0\x46\x18\x34\x41\xc3\x17\x8f\x37\x41\xdd\
+\x0d\x31\xac\xaa\xe5\x50\x9c\xe3\x00\x99\x85\xce\x8f\x57\x18\x07\
+\xa5\x77\x7a\x08\xfa\x8f\x98\x04\x3d\x87\x64\xc3\xc5\xd7\xdc\xaa\
+\xe6\xa7\x0a\xe0\x65\x47\x44\x10\xa4\x64\xcb\xcf\x33\xc2\x77\xed\
+\x53\xa4\x03\x1b\x02\x7f\x06\x3f\xfa\x78\x80\x3d\x66\xe7\xb2\x0b\
+\xfa\xd6\x6d\x65\xa4\xfc\xc7\x30\x19\x3c\xfb\xf7\x1f\x80\x62\x06\
+\x2c\xcb\x58\xa5\x9f\xbb\x92\x57\xfc\xcb\x57\xb2\x8a\x7f\x55\xbe\
+\xa8\xfa\x37\x30\xe0\x2f\x80\x35\xf9\x08\x0c\x85\xf0\xf7\x77\xbf\
+\xe2\x1d\x00\x31\x06\xe0\xd5\x7f\x48\xdc\x5f\xcd\x60\x47\xac\x1b\
+\xf2\x99\x7a\xc0\x0c\xea\xf1\x99\xaf\x2b\x4f\xad\xbb\x5c\x09\x5a\
+\xd7\xf2\x89\x0c\x74\xf1\x7a\xf2\x88\x2c\x7a\xd5\xcd\xf0\xdb\x8c\
+\x85\x52\x39\xd0\xbd\xfc\xb7\x4f\x18\x89\x3a\xca\xc0\x9f\x7b\xf3\
+\xe3\x9e\x7f\xc1\xd6\x6d\x4a\x58\x47\xed\x76\x49\x06\x8a\x4c\x50\
+\x96\x22\x3c\xf3\xec\x50\x26\x3c\x08\xf2\xf4\x6f\xf1\x76\x2b\xfb\
+\x9a\x3a\xec\xe7\x6d\xd9\x49\x67\x47\x71\x19\x77\xe5\x2b\xe7\x9b\
+\x06\x58\xed\xe7\x4c\x9f\x47\xad\x7b\xb3\xe2\xe7\xea\x7e\xfc\x7f\
+\xba\xc0\x0f\x81\x7f\x3d\x1e\xd1\xee\xc7\x8a\x9f\x57\xfd\x85\x0c\
+\xf4\xb1\xed\xbf\x89\x3d\xc7\x9b\x60\x2d\x3b\xeb\xd8\xc7\x6b\x37\
+\x6e\x85\x0b\x18\x51\x6d\xdc\xb2\x03\x24\x33\x02\x90\x9c\x1a\x80\
+\xf5\x05\x45\x94\x9a\xd8\xe9\xd6\xa7\x14\xf8\x93\xfd\x33\x82\x7f\
+\x6a\x7b\x68\x72\x7e\x7b\xf8\xf2\x87\x01\x30\x74\xdc\x14\x78\xe6\
+\xe5\x7f\x69\x6d\xff\x78\x9d\x44\x63\x73\x21\xf5\xc4\xf8\x1c\x9f\
+\x11\xc0\xee\xab\x0d\xc8\xc6\x19\xe4\xe3\x33\x44\x17\xcb\x30\xaf\
+\xd1\x36\x72\x45\xde\x0c\x72\xe5\xd8\x67\xc4\x49\xc4\xdd\xee\x9b\
+\x71\x86\x91\xa3\xa8\x3e\x00\xf5\xb5\xea\x11\x70\x61\xb3\x4e\x73\
+\x73\x23\x01\x2d\x4f\x27\x51\x9a\x53\x20\x44\xb4\x0e\x80\x59\xf5\
+\x7b\x2d\x55\x5b\xba\x4a\xaf\xf3\x4a\x61\x14\x09\xa5\x02\x09\x51\
+\xe1\x13\x68\xf9\xcc\x30\x10\xbb\xeb\x9f\xd3\xe3\xe3\xf8\x18\xf9\
+\xa2\x11\x24\x23\xce\x80\x8c\x48\xaf\x8d\x0c\xeb\xc7\x3e\x4d\x6f\
+\x61\xdb\x00\xe0\xed\x7f\x0e\xc4\x8d\x85\x35\xaa\x39\x36\x08\xc0\
+\x3d\x8f\xbf\x0a\x03\x46\x4d\x86\xae\x3f\x0f\x84\x66\xe7\x67\x69\
+\xa0\x96\x2e\x40\xd4\x50\x6f\xd6\x70\xcf\x01\xfb\x98\x20\xc3\x42\
+\x38\xcc\x11\x84\x20\x01\xec\xf9\xbb\xe3\xfe\x17\x61\xf7\xde\x83\
+\xec\xec\x85\x3d\xec\xec\xa5\xdb\x7d\xd4\x52\x5e\xbe\x6a\x1d\x3f\
+\xab\xf3\x21\x0f\x81\x9f\x55\xfd\xab\xd7\x15\x10\x28\xac\x11\x59\
+\xf0\xeb\x36\x6e\x81\xde\x03\xc7\x81\xa7\x99\xe6\x01\xef\xd3\x3c\
+\xe0\xe5\xfd\x54\x5a\x12\x43\x7b\x6d\x19\xe6\x6b\xcb\x17\x2e\x4a\
+\xf2\x6a\xd5\x9d\x37\x6a\x6b\x33\x91\x15\x87\xe1\xf8\xde\xf3\xa6\
+\xd8\xaa\x7f\x19\x01\xcd\x48\x40\xd3\xf3\x33\x18\xb8\x16\x0b\x5b\
+\xde\x03\xec\xf1\xdc\xaf\x66\xeb\x08\xba\x74\xc4\x5e\x3d\x01\x38\
+\x81\xf2\x76\x0e\xee\x02\xa4\x0b\x25\x51\x90\xb7\x3a\xe0\x2b\xb1\
+\xde\x0e\xf1\x33\xd8\xcf\x2a\xdc\x46\x73\x7e\x24\x00\xc5\xe5\x7c\
+\xad\x10\x15\xfb\x93\x67\x2e\x80\xdc\x15\x6b\x79\xd5\xcf\x7e\xb6\
+\xb5\xe2\x2f\x12\x55\x3f\xaf\xf8\xf3\x0b\xb6\x52\xc5\x9f\x8f\xb3\
+\xfe\x8d\xec\x39\x5d\x2f\x5a\xfe\x8c\xdc\xad\x5e\xb7\x89\x9e\x6f\
+\x3c\x6b\x19\x01\x40\x31\x60\x87\x1b\x1f\x87\x73\x5b\x5d\x0b\xe7\
+\x30\x02\xd0\xb8\x45\x08\x66\xce\x5d\x4a\x5e\x08\x4d\xcf\xcf\xe4\
+\xf3\x7f\xd4\xaf\x20\x29\x4a\xe5\xce\x90\xaf\xbe\xfd\x05\x03\xff\
+\xa9\xf0\xe9\x37\xbd\x68\x7c\xd0\x10\xe6\x2e\x89\x10\xb5\x25\xba\
+\x03\xe0\x75\xbc\xaf\xf1\xf8\x9a\xd4\x16\x9f\x0c\xdb\xeb\x38\xa0\
+\xde\x67\xd8\x11\x74\x8e\xd1\x8e\xd5\x93\xe6\xf7\x3d\x8a\xc1\x4e\
+\x54\x82\x08\x40\x24\x86\xe6\x26\x44\x0a\xd6\xa3\x02\xda\x39\xbd\
+\x2e\x39\x25\x5a\xe4\xaa\xf5\x78\x45\x9b\x96\x5f\xb8\x45\x25\x24\
+\x8d\x3e\xe4\x3c\x57\x5c\xf4\x9d\x59\x63\xa0\x56\x6f\x14\x09\x1e\
+\x49\x7a\x3e\x3d\xfd\x7e\x87\x37\x94\xcf\xfc\x3f\xfc\xfb\x86\xe5\
+\xeb\xd1\x22\x3b\x63\x7b\xa3\xbb\xbf\x36\x3c\x61\x6f\x70\xd3\xcb\
+\xdc\x7e\x5f\xed\xc1\x28\xc9\x22\x33\xc0\x74\xe6\xc3\x0a\x33\x0d\
+\x5e\xfd\xe7\x17\x30\x70\xf4\x64\x78\xfb\xa3\x6e\xec\x7b\x42\x81\
+\x2e\x2a\x65\x49\x00\xbc\x3e\xc3\xb5\xd3\x40\x55\xbf\xac\xc2\xb5\
+\x59\xac\x65\xf4\x80\xbf\x8b\x55\xed\xdf\xfe\x38\x90\x5b\xc7\x52\
+\x76\x7d\x15\x54\xb1\xdb\xaa\xdd\x3c\x40\x26\x8f\x01\xff\xca\x35\
+\x1b\x08\xf8\x57\xad\xe5\xc0\xbf\x76\xc3\x26\x0e\xfc\x05\xa2\x5d\
+\xcc\xce\xd2\x55\x05\x8c\xb4\x5d\x43\x3f\x0f\x5f\x0b\x28\x06\x43\
+\xd1\x22\x01\xa4\xa8\x96\x93\x95\xab\xa1\x7c\x0d\x05\xc5\xad\x3e\
+\x5a\xaa\x8f\x99\xa0\x11\xb3\xa6\xc0\xe3\xf2\x3d\x73\xe4\x22\x49\
+\x95\x18\xdd\x58\x2c\x9f\x0d\xe8\xf2\xf1\xf7\x50\xb5\x67\x3f\x05\
+\xf1\xec\xda\xb3\x97\xb6\x01\xb0\xca\xa6\xe8\xdc\xc2\x6d\x6a\xde\
+\x8e\x67\xd3\x56\x8d\x10\x88\x79\xfc\xa6\x2d\x3b\xe8\x20\xe8\xcb\
+\x8f\xd5\xd1\x85\x7a\x72\x6e\x2f\x08\x80\x32\x0c\x62\x04\x60\xe5\
+\xda\x8d\x14\xda\x34\x7b\xe1\x32\x4e\x00\xd8\xcf\xc2\x8a\x5f\xb5\
+\xfa\xc5\x59\xaf\xda\xfd\x02\xf8\x37\xf2\xe7\x76\x2d\x55\xfd\x0c\
+\xf4\xd9\x73\xbd\x8a\x01\xff\x2a\xf6\xf3\xf0\x10\xf1\x63\xc4\xe0\
+\xc1\xc7\x5f\x67\xe0\xdf\x09\x92\x5b\x76\x04\x6f\xab\x0c\x18\x31\
+\x26\x07\x96\xe6\xad\xe3\x95\x24\x6d\x94\x70\x1d\x00\xde\xde\xf5\
+\xc8\x2b\x30\x64\xcc\x14\xe8\x35\x78\x2c\x9c\x77\xc5\x75\x09\x18\
+\xf1\xb8\x00\xab\x2f\x9c\xf0\x3b\x15\x06\xde\x84\xb6\xa0\x43\x50\
+\x1f\x1b\x46\xee\xb8\x51\xbb\x50\x22\x7d\xad\xdd\x23\x3a\x02\xde\
+\x38\x46\xd1\x4e\x3f\xcf\xfa\xb8\x1a\x75\x7b\xde\x4e\x33\x09\x48\
+\xc0\x08\x20\x14\x45\xf5\x18\xab\x0d\x6f\xe2\xaa\x7f\x95\xa4\xe5\
+\x02\x10\xb1\x01\x9c\x6e\x8b\x2a\xda\xa1\x2e\xaa\x78\xaf\x6b\xdb\
+\x28\x90\x00\x02\x63\x68\x24\xc0\xb9\x3a\xd4\x7d\x08\x62\x57\xcd\
+\x9a\xc6\x3d\x09\xf1\x07\x17\x15\xb7\x95\x00\x84\x6c\x55\xac\xd9\
+\x92\x57\xb9\x01\x7e\xeb\xe7\x78\x9a\xb0\x6a\xaa\xeb\x8f\x03\x60\
+\x00\xbb\x78\x3e\xff\xda\xfb\x3c\x63\x5d\xf8\xab\x2b\x72\xe6\xe3\
+\xed\x69\xe7\xf1\x42\xc8\x1c\x01\xa4\x9a\xc0\x6f\x1e\x2e\x5e\xc3\
+\x7d\xee\xbc\xd5\x05\x7c\x7f\xbc\x52\x8b\xb2\xad\xe4\x5e\xf2\x08\
+\x08\x6b\xa8\xe2\x67\x15\xa0\x68\xf7\xe7\xb3\x8a\x7f\x3d\x03\x8d\
+\xf5\x9b\x85\x60\x6c\x33\xe6\xc2\x17\x43\xb0\xa3\x10\x02\xd2\x26\
+\x40\xd0\xf4\x02\xf0\x9b\xab\x80\x14\x88\x24\x47\x03\x92\x4c\xaa\
+\x0d\x93\xd3\x58\x4d\xf8\xec\x19\xf3\x92\xe4\xda\xb3\x17\x82\xc2\
+\xab\x21\x8b\x42\x8e\xce\xc1\x56\x78\x6a\x86\x0a\x38\x42\x23\x9c\
+\x8a\xca\x7d\x64\x91\x5b\x51\xb5\x17\x4a\x77\x55\x51\x45\xce\xe7\
+\xeb\x9c\x08\xf0\xc3\xc1\x5b\x07\x73\x0b\x39\xa0\x83\xeb\x78\xfa\
+\x31\x41\x9f\xd6\xf4\x36\xf3\xb3\x43\xfa\x0d\x08\x22\x80\xde\x0c\
+\x93\x67\x2e\x24\x0b\x67\xee\xe8\xb7\x9d\xff\x3e\x29\xee\xdb\x64\
+\xb6\xfb\xd7\xb1\xb3\x76\x63\xa1\xa8\xf8\x79\xbb\x1f\x81\x1e\xc7\
+\x3b\xab\xd6\x6d\xa4\x51\x0f\x11\xc0\x35\xfc\x73\x24\x04\xcf\xbd\
+\xfc\xbe\x20\x00\x1d\xc0\xdb\x32\x03\xfa\x0e\x1e\x0d\x5f\x77\xfb\
+\x45\xed\xff\x27\xd1\x66\x4b\x16\xa4\x77\x7c\x98\x66\xfe\x83\xc7\
+\x4c\x86\xc0\x75\x7f\x14\x64\x3e\xc3\x61\xcb\x26\x01\x5a\x1c\x39\
+\xd7\xb6\x55\xbb\xe1\xd7\xcf\x40\x84\xe7\x3d\xb1\x62\x44\xaf\xed\
+\x24\x66\x93\xa5\x16\xf7\xd7\xef\x50\x0c\xf9\x9c\x08\x45\x64\xa2\
+\xa1\xf4\x58\xbe\x04\x13\xb7\x33\x87\x00\xd4\xe6\x01\x36\xa2\x54\
+\x83\xf6\x96\xbb\x8d\x65\xf9\xdc\x56\xe9\xf8\xcf\x8a\x2a\x02\x8c\
+\x71\x86\xe4\x64\x54\x13\xb9\xdd\x65\x28\x7b\x58\x73\x2e\x14\x0a\
+\x07\x5b\x5f\x34\x17\xb7\x58\xf6\xb0\x23\x54\xd5\x4e\x2d\x7f\x2d\
+\x5c\xc4\x2b\x3c\xc6\x75\x07\x3c\xaf\x66\x9f\xeb\x71\x11\xb6\x84\
+\xaf\xf7\xd5\x9e\x00\x98\x6a\x77\x0e\x0e\x4e\x1d\x00\xfd\xbe\x27\
+\xdb\x03\x8c\x6c\xb7\xb2\x7d\x7f\x51\xeb\x9b\xa0\xc7\x80\xb1\x30\
+\x60\x64\x0e\xdc\xfb\xe8\x2b\xe4\xb7\xef\xd1\x08\x00\x75\x73\xc2\
+\x8c\x88\xb4\xd5\x2b\x5d\x40\xe9\x37\x47\x0f\xd4\x75\x10\xed\xeb\
+\xab\xd2\xef\x64\xc0\xbf\x97\xa7\xd9\x49\x0f\x7b\x65\x55\x5b\x49\
+\x26\x30\xbc\xf5\x5b\xc8\xc0\x63\x0b\x01\x88\x14\x8b\xa9\x2a\x94\
+\x5a\xdb\xc5\xf0\xd6\x7b\xdf\xf0\x11\x80\x9f\x77\x34\x1a\xa7\x66\
+\x68\xa6\x46\x41\x73\x0c\x80\xeb\x81\x29\x41\xd3\x1a\x56\x6a\x00\
+\xb4\xce\x8d\x39\x7f\x6f\x38\xf1\x96\x57\xfc\x5e\x53\x14\x15\x0c\
+\xf3\xb7\xc0\xe7\x15\xc5\x6d\x58\xfd\xb7\x69\xff\x00\x5c\x7f\xd7\
+\x0b\xe4\xe5\xc0\xfd\x17\x02\xd0\xa8\x69\x5b\x98\x3a\x73\x31\x94\
+\x53\xe2\xdf\x1e\x22\x01\x08\xbe\xd8\x62\x5f\x2f\x1f\x3f\x3a\x45\
+\x74\x88\x0c\x6c\x46\xb3\x9d\x22\x3a\x1b\x55\xb7\x80\x1f\xfe\xfd\
+\x22\x7a\x1e\x36\x4a\xb2\x85\xff\x4e\xfc\x7f\xfc\x5c\x6e\x10\xa0\
+\x31\x10\x12\x81\x69\x73\x16\x11\x01\xc8\x99\x31\x9f\x48\x5a\x81\
+\x6a\xf7\x17\x71\xf0\x2f\xe0\xab\x7d\x6b\x85\xc0\x0f\xe7\xfc\xab\
+\x09\xf0\x0b\xa8\xcb\x83\x67\xe5\x9a\x8d\x04\xfc\x79\x6b\xd7\xf3\
+\xdb\xd5\x78\xbb\x9e\xbe\xfe\xd7\x7f\x7c\x0a\x8d\x5b\x74\x84\xe4\
+\x16\x1d\xc8\xf1\xb1\xf7\x80\x51\x70\xdb\xfd\xcf\x53\xd6\x45\x92\
+\xe8\x00\x5c\x70\xf5\xcd\x34\x16\x1a\x36\x6e\x2a\x3c\xf0\x64\x67\
+\x71\x1d\xcb\xd0\x3a\x2a\x21\xdb\x9a\x6d\xfd\xb4\x97\xbd\xbe\x58\
+\xab\xec\xc4\xb5\xb9\xa3\x75\x1d\x3c\xb5\x2a\xf0\xe2\x4f\x5d\xf5\
+\xf8\x9c\x89\x8a\xc7\x75\x34\x50\x17\xf1\x5e\x2d\x9f\xab\xd3\x4d\
+\x00\x7c\x61\x04\x20\x50\xeb\x3f\xd6\x7c\x51\x9b\x22\xb6\xa4\x30\
+\x96\xab\xed\xd6\xab\xb5\xa2\x48\xb1\xbc\x81\x18\x5e\x0c\x6e\xeb\
+\x7d\x86\x55\xac\xe4\x0f\xc6\x94\x9c\xe7\x91\xd6\x9d\x3e\xfd\x44\
+\x13\x4d\x45\xba\x58\x07\x62\x14\x44\x1a\xf1\xcf\xf6\x2c\x0a\xd7\
+\x80\x66\xda\x12\x88\x08\x20\x89\x9c\xef\xc9\xaa\xc6\x04\xef\x0c\
+\x8d\x9c\x38\x54\x04\x8e\xe6\x40\xb6\xaf\x89\xc7\xa5\x4d\xd6\xbd\
+\x64\x10\xf4\xcb\xb0\x89\xd0\xfe\xa6\xc7\xb8\x0b\x9d\xac\x9a\x55\
+\x2b\x2f\x18\xa3\xe7\x80\x04\x7f\xf9\x71\x26\x3c\xf9\xdc\xdb\x7c\
+\x75\xac\xa4\x8c\x9d\x72\xba\x2d\xa6\x53\x4a\x11\xb1\xa8\x64\xc7\
+\x4a\x91\x00\xbf\xb0\x48\xd9\xc2\x16\xc8\x79\x76\x11\x5f\x29\xc3\
+\x95\xb4\xd9\x0b\x56\x91\x21\x50\xe3\x54\x7d\xb4\x91\x65\x89\x48\
+\xf6\x6a\xdb\x1d\xa6\xb2\x5e\x17\x04\x1a\xd6\xaa\x2e\x46\x4b\xe3\
+\x84\x00\x85\xcf\x45\x31\xdd\x3c\x5d\xbc\x8e\xe4\x16\x40\x26\x9c\
+\x7b\x41\x7b\x78\xef\xf3\x9f\xe0\xf5\x7f\x7d\xa5\x46\x00\x48\x00\
+\x70\xb7\xfd\xed\x2e\x5f\x8b\x98\x5f\x1e\xf7\x8b\x6d\x78\x24\x50\
+\xd4\x35\x11\x44\x80\x08\x81\x3c\x8a\x10\x6c\xa5\xb6\xfc\x06\x06\
+\xf6\xf2\x73\x02\xed\x02\xa1\xce\x17\xb7\x92\x40\xe0\xff\xc5\xe7\
+\x64\xab\xb6\x62\x88\x5d\x83\x49\xd3\xe7\x91\x06\x20\x67\xe6\x7c\
+\x02\xf5\x8d\x85\xa6\xba\x7f\x1d\xb5\xfb\x0b\x21\x5f\x07\xfe\x7c\
+\x5e\xd9\xe3\x91\xc0\xbf\x92\x01\x7e\x1e\xbb\x5d\x81\x07\x85\x9f\
+\x78\x48\x07\x92\x0f\xaf\xbd\xf5\x39\x7b\x8e\xb3\xb8\x87\x05\x7b\
+\x1e\xbf\xed\x3e\x18\xce\x69\x15\x10\x6b\x9c\x41\x68\x7a\x61\x7b\
+\xf8\xf2\xfb\xfe\x0c\xfc\xa7\xc1\x6b\x6f\x77\x25\xcb\xeb\x24\x11\
+\x88\xe5\x8d\x4b\x7c\x1b\xef\x9a\x60\x30\xa1\x1d\xd4\x98\x66\xc8\
+\xb5\x0c\x08\xf2\x24\x6c\x6c\x60\x44\x29\x54\xea\xf0\xf8\xf9\xe2\
+\x21\x02\xf1\x15\xcf\xde\x33\x44\x84\xe9\xf5\xd5\x6a\x04\x60\xb8\
+\xcc\x09\xf5\xbc\xf5\xa0\x4b\xdb\xdd\x08\x13\xd8\x39\x3a\x34\x45\
+\xb8\xb8\x79\xc3\x42\x7f\xdc\xcc\x7d\x0c\x70\xcb\x87\x8e\x1a\x0b\
+\x69\x5f\xff\xf3\x45\x7e\x10\x23\x3f\xa1\x86\xcb\xdf\x68\xc4\x40\
+\x00\x0c\xeb\xfa\xa1\xfe\x6f\xec\xbf\xd7\x17\x8f\x45\x70\x62\x2a\
+\x48\x8b\x40\x31\x45\xbb\xc0\x69\x2d\x37\x4b\xbe\xb9\x3f\x06\xb0\
+\xb6\x30\xf3\x74\xc8\xba\xf9\x51\xb2\x4d\xed\x39\x78\x1c\x5c\x93\
+\x79\x2f\x78\x9a\xa7\x6b\x5d\x07\xb7\xf6\xbf\x83\xfb\x60\x4a\x50\
+\xcd\xe3\xa9\x4a\x67\x5f\xfb\xfc\xeb\xde\x04\xf4\x3b\x8b\x4b\x61\
+\x07\x56\x90\x3b\x4b\x58\x25\x59\xa2\xac\x62\xf1\x56\x82\xbf\x39\
+\xb3\xe6\x02\x35\x52\xaf\x33\x82\x80\xff\x6e\x1b\x29\xd1\x77\xc3\
+\xf5\xb7\x3f\xcd\xaa\x43\xcc\x01\x60\xc0\xdf\x22\x4b\x10\x80\x4c\
+\x9b\x90\x53\x6f\x8b\xea\x6b\xa4\x01\x13\xf4\x7d\xf1\x28\xfa\x13\
+\x44\x00\xec\x84\xb2\xb9\xb0\xb5\x16\x84\x92\xdb\xd9\xf2\x0d\x99\
+\xc7\x5e\x78\x07\xfe\xd3\x73\x10\x7c\xc7\xc0\xcf\x77\x51\x47\xe5\
+\x78\xe8\x61\x24\xa0\x03\x7b\xbe\xca\x77\xed\x85\xb2\x8a\xdd\x14\
+\xf5\x8b\x4e\x7f\xd4\x45\x59\xbf\x19\xd6\xaf\xdf\xcc\x01\x58\x9e\
+\x02\x71\x4b\xe0\xcc\xc9\x01\x02\x3d\x8e\x59\x38\x49\xd8\x2a\xce\
+\x16\xb1\x97\x6f\x12\x08\xfc\x37\xd8\x5d\x40\xf2\x25\x37\x09\x96\
+\x33\xa0\x9e\x38\x6d\x1e\x4c\x9a\xb1\x80\x9d\xf9\xb4\xb6\x89\xcf\
+\x9d\x9a\xf5\xab\xb5\x3e\x21\xee\xa3\xf9\xfe\x06\x02\xfb\xbc\xb5\
+\x1b\x68\xc3\x03\xc1\x3e\x8f\x1d\x14\x7e\xe2\x41\xbf\x07\xdc\x02\
+\x59\x2a\xb6\x41\x5e\x79\xe3\x63\x53\xd3\xc1\x1e\x8b\xdb\xee\x7b\
+\x91\x04\xa0\xe8\xf1\x9f\xec\x4f\x87\xb7\x3e\xfc\x16\x06\x8f\xc9\
+\x81\x7f\xb3\xd7\xd6\x39\xe7\x65\xd0\xd8\x90\x9f\x0c\x6b\x57\xea\
+\x8c\x11\x92\x25\xe2\xf7\x87\xea\x0e\xb8\x67\xa4\x0f\xc1\x7f\xa3\
+\xdf\x42\xc0\xf2\x1e\x3f\xab\xae\x0f\x92\xe3\x7c\x47\x13\xb0\x85\
+\x8f\x01\xec\xf6\xb6\x81\x08\x9b\x00\x46\x1c\x6d\x2b\xa7\x9f\xa3\
+\xed\x65\xbb\xec\xab\x47\x02\x6c\xaf\xbe\x97\xef\x33\xa2\xcf\xba\
+\x22\xae\xa7\x18\x31\x08\x4e\x0c\x67\x27\x40\x8b\x0f\x41\xb8\xd6\
+\xc1\xbc\x90\x87\x1c\x3a\x0e\xf5\x93\x0f\xa0\x77\x51\x64\x65\xed\
+\xb5\xb8\xf0\x05\x1d\x8c\x7c\x62\x24\x00\x7e\xb9\x0e\xc9\xab\xca\
+\x9b\xef\x7f\x01\xfa\x8e\xcc\x81\x1f\x07\x8e\x81\x2b\xd2\xef\x00\
+\x3d\xa9\x31\xac\xca\x57\x87\x1b\x0d\xa9\x8f\xe5\xfd\xa2\x00\x20\
+\xfc\xbf\xe9\x30\x62\xec\x74\x02\xfe\xa2\x1d\x7c\xef\x9c\x2a\xc9\
+\x6d\x7a\x1c\x6c\x31\x29\xcf\x49\xc9\x5e\x64\xae\xa7\x6d\x11\x86\
+\x36\x68\x2f\x8b\x6d\x67\x14\xa0\x21\xd8\x0d\x1d\x3d\x85\x94\xde\
+\x5e\x22\x00\x62\xbd\xd1\x9f\xa1\x75\x38\xec\x8f\x89\xa1\x44\x83\
+\x5e\xd9\x15\xf3\xeb\xc6\x52\xf1\x8c\x8f\x12\x74\xb1\x12\x04\x8e\
+\xaf\x24\x1a\x1c\xf4\x9b\x73\xf0\x47\x90\xeb\x78\xeb\xd3\xf0\xf5\
+\xcf\x03\x19\x01\x18\x08\xdd\x7a\x0e\x01\xe3\xba\x47\xa8\x15\xce\
+\xff\xde\x20\x9c\xcb\xaa\xe1\xed\x25\xbb\xe8\xf1\x28\x2e\xaf\xa2\
+\xbd\xfc\xd5\xf9\x62\x73\x22\x9f\xab\xe9\xd7\x89\xbd\x7a\x3c\xe4\
+\xb4\xb7\x91\xaf\xde\xe5\x8b\x5b\xf9\x35\x45\x14\x36\x4a\x95\xbe\
+\x3c\x7c\x03\x83\x0b\x06\xcd\x35\xc3\xd9\x0b\x72\x61\xc2\xb4\xb9\
+\xec\xcc\xa3\x33\x3f\x77\x85\x20\x17\x85\x0a\xf8\xf9\x9c\x7f\x23\
+\x9f\xf1\xaf\xe1\xe0\xbf\x82\x55\xfc\x2b\x58\x75\x4f\xfe\x0e\x08\
+\xfe\x0c\xf4\x11\xf8\x69\x0d\x34\x6f\x1d\x2c\x59\xb1\x86\xbc\x20\
+\xd0\xfe\xf9\xb9\x97\xdf\xa5\x6d\x14\xfe\x9c\xa5\x81\x17\xc3\x81\
+\x9a\xf1\x88\xe0\x17\x5e\x7f\x1f\xfa\x8f\x98\x08\xdf\xb1\xc7\xa5\
+\xc5\x1f\xae\x55\x3e\xff\xf2\x39\xf7\x38\x5e\x73\x12\x58\xb5\xda\
+\x5a\xee\x9e\x84\x00\x9d\x11\x55\x9f\xa5\x0a\xbf\x18\x2b\xdd\xc8\
+\x05\x53\x20\x61\x23\x01\x55\x9c\xd6\x93\x57\x42\xbc\x24\xfb\x4c\
+\xa9\xfc\xeb\x48\x00\x62\x99\x61\x9b\xde\xd6\x8e\x04\x40\x8b\xc6\
+\x8c\x5a\x01\xbb\x7e\x2d\xe4\x00\xfc\x4e\xca\xd1\x40\xcc\x56\xc1\
+\x96\x56\xba\x5c\xe7\xd2\x36\x01\x1c\xc1\x5f\x37\x9c\x89\x29\xc7\
+\xc0\x70\xf1\xf3\x77\x89\x63\x4d\x31\x2c\xb3\x59\xf7\xb6\x9b\x11\
+\xc1\x74\xc9\x88\x6b\xdc\x10\xfb\x73\x6e\x75\xe5\x4b\x92\x24\x40\
+\xfb\x7b\xd5\x06\x43\x84\x11\x80\x1a\x03\x08\xd1\x8e\x29\x7c\x94\
+\x15\x71\x1a\xfc\xf1\x4f\x6f\xc2\x40\x06\xb0\x3f\xf6\x1b\x0d\x97\
+\xb4\xb9\x45\x6d\x5e\xe8\xe0\x9f\x24\xfc\xd7\xb1\xbd\x6f\x56\xdf\
+\x99\xa6\xc0\x30\xc5\x5c\xc7\x4b\x6a\xd6\x06\x16\x2c\x5b\x27\x00\
+\xdf\x5c\x3b\xe3\x55\xfe\x36\xda\x61\xc7\xf9\x3e\x82\xbf\x32\xb2\
+\x21\xc3\x1a\x6e\x4b\x8b\xb6\xb5\x18\x5c\xb3\x53\x44\xdb\x62\xd5\
+\x5b\xb1\xfb\x00\x74\xbc\xf9\x09\xee\x6e\x48\xbf\x2f\x60\xb9\x00\
+\x25\x3b\x10\x80\x64\xb9\x6d\xa2\x77\xc5\xfc\x66\x08\x8f\x37\xe6\
+\xe7\xa7\xf6\xc4\xce\xa3\x34\x1c\x21\x6e\xa5\xac\x1e\x7b\x6e\x61\
+\xeb\x69\xc6\xa3\x92\xaf\xce\xb8\x0b\x3e\xfb\xae\x0f\x7c\xf5\x73\
+\x3f\xf8\xb6\xc7\x00\x46\x02\x06\xc3\xbd\x8f\xbe\xa6\x11\x00\x1c\
+\x07\xa5\xc1\xcc\x79\xcb\xa1\xb8\x02\xd7\xf2\xf8\x6a\x9e\x5c\xa5\
+\xc3\x76\xfb\x1a\x06\xbc\x6b\x49\x65\x5f\xa0\x84\x77\x04\xcc\x04\
+\xce\x1c\xa4\x51\x94\xb7\x8e\xd6\x2c\x37\x89\xaa\x7d\x93\x22\x0c\
+\xb8\x9f\xcf\xff\xcd\x26\x73\xcd\x10\xcd\x7d\xd8\x73\x35\x7e\xca\
+\x6c\x76\xe6\xc0\xf8\xa9\x73\x20\x9b\x11\x80\x59\x8c\x10\x20\xf8\
+\xaf\x41\x31\xe7\xfa\x02\x6d\xd6\xcf\x08\x80\x68\xf5\x23\xf8\x63\
+\xe7\x60\x99\x58\xf9\x44\xd0\x5f\x96\xb7\x96\xac\x9e\xd1\xfc\x89\
+\x67\x3e\xac\x82\x45\x4b\x57\xc2\x82\xdc\x3c\x78\xf0\x89\xd7\xe8\
+\x6f\xe4\x2b\xa9\x69\x94\x0e\xd8\x88\xbd\x96\xee\x7f\xe2\x15\xe8\
+\x3b\x2c\x9b\x9c\xfe\x2e\x6b\x77\xbb\x7a\x3e\x9c\x46\x90\xf5\xe9\
+\x05\x1f\x3f\xc8\x84\x1a\x1c\xf0\xa2\x77\x4c\x8d\x38\xee\xb3\x51\
+\xbb\xc7\xc2\x17\xaf\x06\xc1\xa8\xd3\xe3\xe8\x0d\x2b\xd6\x62\xfd\
+\xfd\xf5\xe8\x00\xe9\x8b\x89\x00\x18\x2e\x0f\x86\x51\x87\x59\xb2\
+\x11\xc1\x07\xbb\x36\xfe\xe6\xda\x9a\x86\x52\xda\x46\xf6\xe7\x77\
+\x6f\xff\x1b\x9a\x39\x8b\x1e\x84\x62\x13\x66\xf9\xc2\x01\xcd\xdd\
+\x82\xd7\x88\xa1\x03\xe2\x22\x46\xb1\x8c\x21\x42\xb5\x10\x8e\x84\
+\x1c\xc8\x46\xc0\xdd\xc5\x2f\x25\x42\x85\x12\x26\x2a\x34\xef\x8f\
+\xa5\xd5\xef\x33\x2d\x78\xbd\x16\x26\x1e\x6d\x56\xaf\x7b\xfb\x1b\
+\x2a\x4e\x37\x59\x8c\x03\x9e\x7b\xf5\x03\x5a\x0f\xec\xd6\x6b\x38\
+\x9c\x7f\xc5\x0d\x2a\x97\xc0\x2a\x00\xcc\x14\x44\x20\x43\xb3\x64\
+\x0d\x99\x3b\xf7\x54\xd1\xa6\x41\xe3\x94\xb6\x90\x5f\xb0\x4d\xac\
+\x99\x6d\x57\xab\x62\x52\x88\x46\xf3\xe7\xcd\x7c\x2e\x8d\xe0\x2f\
+\xad\x69\x49\x70\x26\x14\xe7\xb8\x7f\x8e\xe0\x5f\x51\x81\x6b\x84\
+\x7b\xa1\x6a\xcf\x3e\x98\x3e\x2b\x17\x1a\xb7\x90\x9b\x21\xd2\x24\
+\x2a\x5d\x81\xb9\x04\x03\xf3\x31\xd3\x3b\x3d\xe9\xe1\xa3\x31\x7f\
+\xac\x84\x2d\x82\x5f\xbc\xcf\xd4\xaa\x38\xfe\x2c\xbf\x49\xe0\x48\
+\xc8\x26\xc8\x12\x8e\x00\x90\x00\x34\x62\x15\xee\x1f\xda\xdd\x06\
+\x1f\x7d\xd3\x03\xba\xfe\xf0\x0b\x7c\xf5\x53\x3f\xf8\xa6\xfb\x00\
+\x56\xe9\x0e\x84\xe7\x5f\xfb\x80\x7c\xf1\x93\xc5\x5a\x20\xfe\x6d\
+\x3d\xfb\x8e\x26\x57\xbe\x1d\xa5\x3c\x8c\x07\x41\x7e\x95\x68\xb3\
+\xcb\xb5\xba\x55\xeb\x36\x2a\x65\xfd\x5a\x41\x10\xd6\xe8\x1f\xe7\
+\xf3\x19\x3d\x7e\x6d\xb5\x46\x18\x68\x3d\x6f\x6d\x01\x75\x01\xb8\
+\x95\xef\x76\xd8\xcc\x0e\xb6\xeb\xc7\x4e\x9e\x05\xe3\x18\x01\x18\
+\x2b\x88\xc0\xf4\xb9\x8b\xf8\xac\x5f\x81\xff\x46\x72\x6f\x94\xc2\
+\x3e\xac\xf6\x97\x61\x9b\x7f\x25\x6f\xf3\xe7\xe2\x61\xd5\x7e\x2e\
+\x03\x7d\xac\xf8\xd1\xfe\x19\xb7\x0a\x10\xf8\x31\x0f\x62\x1e\x3b\
+\x37\xdc\xfe\x34\x6d\x8f\x20\x09\x40\x4d\x8a\x87\x81\xff\xf5\x77\
+\x3e\x05\x7d\x86\x8e\x87\x5e\x83\xc6\x42\xdb\xf6\xf7\x8b\x82\x21\
+\x28\x5e\x87\x4e\x4e\x98\x67\x56\x25\x18\x1b\x29\xf9\x6f\x6b\xef\
+\xc7\x0a\xe4\x66\xec\x79\xa2\xc6\x1f\xb2\xc3\x66\xd9\xc2\xf0\x35\
+\xd4\xb8\x26\xe2\x1a\xa0\xd3\x8c\xda\xa9\x8a\xae\xdd\x7c\x84\xda\
+\x60\x75\xde\x4b\x75\x5a\x27\x34\xa2\xba\x0b\xd6\x2e\x39\x2a\x32\
+\x50\x7b\xc3\x0c\x87\x8c\x28\xf3\x7f\x23\x8a\xd8\xd1\x70\x11\x0c\
+\x1a\x75\x14\xd2\x18\x51\xff\x96\xf8\x83\x2e\x1c\x36\x3e\x52\xa4\
+\x9a\xdf\x41\xf1\x1b\x31\x23\xc0\x29\x5a\x58\xfb\x9a\xda\x1e\x08\
+\xc0\x8b\x6f\x7c\x42\x46\x41\x5f\xff\x3c\x18\xce\xbb\xfc\x7a\x01\
+\xf0\xed\x4d\xb0\x4f\xc9\xa4\x79\xab\xd7\x2f\x47\x00\x99\xa6\x13\
+\xa4\xb2\x6c\x4e\x83\x16\x97\x64\x31\xc0\x2f\x36\xfd\xdf\x37\xf3\
+\x15\x31\x29\x4c\x23\xb5\xb8\x72\x85\xdb\x4c\x55\xff\xb6\x62\xde\
+\xf2\x47\x97\xc0\x12\x56\xd9\x62\xfa\x1c\x81\x7f\x25\xf7\x0e\x40\
+\x03\xa1\x3d\xfb\x0e\xc1\xcb\xaf\x7f\x0c\x5e\x56\x31\x63\x04\x2c\
+\x1e\x65\x10\xe4\x37\x1c\x47\x1e\xf6\x71\x8f\x85\x14\xf8\xd3\x5d\
+\xc4\xa3\xb1\x54\x1e\xb2\x73\xc4\xff\x7f\x23\x4b\x20\x92\x43\xf0\
+\x93\x4c\x69\x14\xcf\x95\xc7\xcf\x09\xc0\xe5\x81\x3b\xe0\xe3\xaf\
+\x7b\xc2\x17\x0c\xfc\xbf\xfc\xb1\x2f\x11\x80\xaf\x7f\x46\x12\xd0\
+\x1f\xde\x78\xef\x6b\x22\xb4\x8a\x40\xb0\xc7\xfa\xdd\x8f\x7e\x60\
+\xe0\x5f\x49\x7e\xfc\x48\x98\xb0\x72\x27\xc0\x5d\xb3\x9e\x0c\x95\
+\x90\x08\xac\x14\x84\x00\x85\x77\xab\x35\x52\x80\x1f\xd3\x11\x04\
+\x81\x77\x0f\x36\x8a\xc3\xe7\xf6\xb8\xeb\x9f\x5f\xb0\x45\xad\x12\
+\xa2\x30\x73\xc6\xbc\x25\x04\xfc\xe3\x26\x33\x02\x30\x19\x6f\xff\
+\x3f\x7b\xef\x01\x1e\x47\x95\x74\x0d\xfb\x79\xfe\x6f\xad\xd1\xc8\
+\x80\xad\xd6\xc8\x86\x05\x13\x16\x30\x0e\xd2\x74\x4f\xcb\x01\x58\
+\xe2\x92\x59\x72\x5e\x60\xc9\x98\x9c\xa3\x01\x93\x6c\x03\x06\x67\
+\x9c\x73\xce\x39\xc9\x39\x67\x30\x38\xe3\x84\xc9\xb6\x71\x4e\x60\
+\x5b\x96\xeb\xbf\x55\xf7\xde\xee\xdb\x3d\xdd\x33\x3d\xa3\x91\xcc\
+\x7e\xff\xcf\xfb\xde\x1d\x49\x96\x66\x7a\xba\x7b\x6e\x9d\x3a\x75\
+\xea\xd4\x14\x4b\x08\x88\xcf\x4d\xaf\xf5\xb5\x5d\xeb\x5f\x48\x54\
+\xbf\x5d\xe3\x9f\xb7\xf8\x2b\x5a\x73\x31\xe3\x67\x81\x9f\x07\xff\
+\xc5\xb4\x70\x0a\x24\x0e\x85\x9a\x3e\x77\x29\x9c\xcb\x80\x50\x15\
+\x34\xa5\xa2\xec\xbf\x90\x34\x0f\x1d\x7b\x0f\x81\x4e\x0c\x00\x34\
+\xbc\xfc\x6e\xd1\x0a\x6a\xc4\xb1\x83\xce\xce\x98\xb2\xb5\x7d\x86\
+\xfe\xaf\xab\x4b\x57\x74\xf0\xd7\x21\xd8\xd8\x78\xa3\x5c\xc1\x46\
+\xa8\x4c\xbe\x1e\x46\xa6\x01\x80\x51\x8e\x27\x21\x93\x2a\x48\xa9\
+\x46\x76\x0f\xe1\xf1\xca\xb8\xcd\xb4\xe8\xae\x90\x16\x55\x74\x00\
+\x51\xf0\x9b\xd4\x16\x2f\xee\x32\x7c\x5d\xf7\x52\xf7\x8e\xd6\x33\
+\x74\x4d\x12\x8d\x36\x4e\xf5\x06\x36\x95\xfe\x61\x23\x4e\x03\x62\
+\x75\x7e\xb8\xba\x00\xdc\x1d\x21\x7e\xc1\xdf\x4b\xd1\x9f\xad\x0a\
+\xfc\xf0\xf5\xaa\xeb\xf0\xc4\x8b\x1f\xd0\x08\x61\x54\x60\x63\xcb\
+\x55\x58\xf4\x5e\xdb\x19\x7f\x7d\xab\x14\x60\xbf\x86\x6d\xc5\x8b\
+\x9b\xf4\xd9\xb5\x2f\x87\x55\x6b\x36\xd9\xe2\x32\x31\xfc\xe5\xeb\
+\x95\x6b\x14\xba\x79\x35\xf5\xff\x93\x13\xdc\xca\xb5\xb0\x69\xcb\
+\x2f\x56\xd6\x4f\xc1\xff\x57\x34\x0f\xda\x46\x6b\xeb\xd6\xed\xb0\
+\x15\x01\xc0\xb6\x1d\xb0\xe5\x87\xdf\xa0\x6e\xec\x5a\x08\x55\xad\
+\xc7\x3d\x0c\x72\xed\xcc\xde\x4d\x05\xcb\x6e\x18\x14\xd0\x39\xb2\
+\xff\x88\x5e\x06\xd0\xa6\x8e\x3c\x35\x14\x06\x2b\x41\x7b\xac\x34\
+\xb1\x21\x00\x20\x2d\x6d\x0d\x88\x5d\x72\x3b\x7c\xd0\xb2\x13\x7c\
+\xcc\x02\x7f\x73\xb1\x10\x00\xc8\xf5\xe6\xc7\xed\x48\x1b\x60\xdf\
+\x0f\x3a\x3c\xfe\xcc\x7b\x54\x1e\x41\xc0\x84\xac\x09\x9e\xcb\x85\
+\x42\x49\x4f\x4b\x58\x2a\x23\x18\x58\x24\x5a\xed\x70\x2d\x15\x8f\
+\x4b\xbe\x96\x8b\x03\x03\xeb\x7b\xfc\x9d\x65\x58\xb3\x5f\x01\xdf\
+\x58\x5d\x03\x1c\xac\x61\xf6\x3f\x84\x05\x7d\x0c\xfe\x43\xc7\x30\
+\x00\x30\xa6\x18\x46\x4d\x9a\x4e\xcf\xb1\x44\x11\xf9\x59\xe2\x3e\
+\x41\xf5\xcf\x5f\x24\x02\xff\x22\xcc\xfa\x97\xd2\xec\x87\x39\xf3\
+\x59\xf0\x9f\xb7\xc8\x9a\x02\x89\xa3\xa0\xa7\xcd\x5e\x00\xe3\xa6\
+\xce\x83\x93\xf2\xa3\x7c\x4f\x60\xe7\xb4\x66\xad\x4b\xa1\x73\x9f\
+\x21\xd0\xa5\xdf\x30\xb8\xe4\xfa\x07\x78\xf0\x8f\x70\xd6\x26\xc7\
+\xcb\x82\x5c\x0e\xa3\x2a\xd3\xac\x90\xff\x1b\x80\x40\x45\x0a\xec\
+\x92\xd9\xd0\x3b\x7f\x96\xba\x40\xd3\x08\x10\xaf\x92\xff\x6d\x38\
+\xa5\x73\x63\x64\x0c\x08\x55\x4a\x3c\xe5\xc8\x28\x37\x8a\x49\x15\
+\x8b\xa5\x0f\x04\xa2\x71\x17\x31\x1c\x57\xaf\x09\x3a\x2d\x2a\x08\
+\x03\xa0\x7b\xf4\xf2\xc6\xe2\x1e\xbd\xc5\x7e\xa9\x4c\xed\xf3\xcb\
+\x12\x0c\x57\xf9\xc4\x08\x38\x0c\xc8\x6b\x02\x62\x59\xec\x42\xdd\
+\x42\x49\xaf\xbf\x35\x2c\x7f\x82\xb0\x87\xee\x42\x3d\x7f\x4e\x17\
+\xc9\x98\x3d\xaa\x57\x28\xa7\xe5\x98\x5f\x6e\x3b\x6b\x12\xc5\xfe\
+\xcc\x6b\xcd\xa0\xf7\x90\x71\xf0\x45\xa7\x01\x7c\x6e\x40\x3e\x77\
+\x5f\xa3\x15\xe1\x8f\x34\x67\x20\x4f\xdd\x84\x6d\x06\xe0\xdc\x7a\
+\x57\xc2\x37\x2b\xd7\x3b\x6a\xcc\xe8\xf4\x66\xd5\x89\x45\xe6\x28\
+\x83\x13\x06\x0f\xec\x59\xc7\xfe\x76\x32\x0a\xfa\x75\x1b\xfc\x86\
+\xc1\x9f\x65\xfe\x5b\xb7\xb1\xc0\xbf\x7d\x07\x5f\x0c\x00\x6c\xdd\
+\xba\x13\xe6\xcc\xfb\x1a\xb4\xd3\x0c\xc1\x00\xa8\x62\x54\xbb\x4d\
+\x56\x8a\xff\x7c\xef\xb5\x88\xa1\x00\x81\x34\xa7\x6d\x6a\xea\xb5\
+\xf2\x18\x57\x6a\x65\xff\x12\x00\xb0\xf3\x88\x3d\xee\x35\x1a\xc0\
+\x0d\x77\x3e\x05\x9f\xb4\xed\x45\x81\x9e\x82\x7f\x5b\x3b\xf8\x37\
+\x17\x3f\x7b\xef\xd3\x4e\x50\x19\x6d\x90\x73\x05\x50\x66\xc7\x7b\
+\xcf\x7f\x5f\x82\xf5\x98\xfd\x8b\x61\x3c\x78\x6e\x69\x82\xa2\x98\
+\xa2\xb8\x40\xb1\x58\x5e\xb4\x94\x01\x81\xa5\x9c\x1d\xa0\x25\x02\
+\x35\x59\x2f\x5b\x8c\x01\x07\x0a\x3c\x73\x67\x3f\x5f\xc6\x19\x80\
+\xe5\xc2\x89\x71\x3a\xcb\xce\x87\x8e\x9e\xcc\x02\xff\x54\x0b\x00\
+\xe0\xf7\x23\x26\x4c\xb5\x40\x87\x54\xf4\x23\xdd\x8f\xc7\x31\x1f\
+\x33\x7e\x11\xfc\xe7\x2d\xe6\x75\xfe\xb9\x98\xf9\x53\xf0\x5f\x4c\
+\x81\x9f\x32\xff\x39\x0b\x08\x00\x4c\x9d\x35\x1f\xda\x76\xee\x0f\
+\x61\x76\x3d\xc3\x64\xff\x1d\x85\x6b\x6f\x7d\x04\xba\x0f\x18\xc1\
+\xce\x53\x63\xf8\x1b\x8e\xf7\xa5\x61\x55\x2e\x9a\x5f\x4e\xf3\x74\
+\x50\xff\x7a\x06\x36\xef\x8a\xa2\xe4\x33\x61\x33\x9d\x7a\xdb\x73\
+\xc5\xcf\xa7\x09\x9a\x65\x07\xb7\xb1\x4f\x2f\x11\xd6\x7d\xce\x93\
+\x99\xa1\xf3\x26\x7d\x12\x74\x5a\x95\xbc\x85\x67\x15\x53\x77\x4a\
+\x4f\x43\x60\x7a\xa0\x36\xd7\x09\x8b\x78\x8f\x17\x4e\x5d\x63\x10\
+\xdf\xae\xe8\x2d\x64\x8b\x29\xae\x7a\xa6\x87\xf9\x51\x70\xd0\x11\
+\x72\xd0\xc1\x06\x24\x9f\x3e\x15\xa0\x6b\x22\xa2\x7b\x96\x1a\xe2\
+\x0c\x91\xb4\x54\x10\xb5\x1e\xf0\xe6\x8f\xff\x37\x9a\xa7\x2e\x03\
+\xbb\x2a\x8c\xf1\x60\x01\x54\xc7\xc0\x1c\x31\x3b\x00\xc1\xc0\xc9\
+\x35\x8a\xe0\xb9\xd7\x5b\x90\xcf\x7a\x9b\x2e\x03\xe1\x6c\x14\x5e\
+\xe5\x3b\xe7\xb0\x5b\x9a\x04\xa9\xb2\x27\x97\x3e\xde\xd2\x76\x56\
+\xdd\x2b\x58\x00\x58\x2e\x6c\x5f\x57\xd2\xa2\x1a\xb1\x34\x7f\x91\
+\xea\x70\x91\xb1\x2e\x14\x81\x64\xdd\xfa\xef\x59\xc0\xdf\x41\x7e\
+\xf7\x48\xf9\x6f\x65\x8f\xdb\x1d\x8b\xfd\xdb\xef\xbb\x68\x0d\x18\
+\x32\x01\xaa\x44\x0a\xad\x60\x1e\x52\xeb\xfc\x24\x32\x8d\x8a\x6b\
+\x13\xf5\x05\x00\xa1\x44\x4e\x99\x11\x33\x39\x48\xd3\xec\x21\x57\
+\x5e\xc6\x50\xe1\x88\x14\xff\x09\x2f\xfb\xea\x0d\x20\xf7\xcc\x8b\
+\xe1\x91\xe7\x9a\x92\xc8\x0f\xc5\x7e\x48\xf5\x7f\xd2\xae\x3b\x34\
+\x67\x8f\x2d\xda\xf1\xaf\x9b\xb5\xeb\x06\xcd\x18\x00\x78\xff\xf3\
+\x2e\x24\x82\x0b\x09\x6d\x45\x28\xaf\x10\x6e\xb9\xfb\x69\x1a\x03\
+\x8c\x83\x7c\xd0\xe6\x17\x41\x95\x0c\xb4\xf3\x94\x71\xca\x32\x20\
+\xcb\x99\x0b\x8b\x94\xf6\x3b\xde\x7b\xff\xad\xb5\xe4\xcf\xe7\xb3\
+\xdf\x43\x8f\x7e\xde\x41\xb0\x86\x66\x32\x50\xf6\x4f\x00\x40\x06\
+\xff\x62\x0e\x00\xc6\x4f\xb5\x15\xfd\xb8\x16\x0b\x81\x9f\xa5\xea\
+\x17\x19\x3f\x8e\x7a\xc6\x25\x82\x3f\xcf\xfe\x17\x52\xe0\x9f\xce\
+\x00\xc0\xb4\xd9\xf3\x61\xca\xcc\xf9\xf0\xd8\x33\xef\xf0\x6b\x46\
+\xc1\xbe\x1e\xbc\xfc\xf6\x27\x70\xeb\x7d\xcf\xb0\xe0\x5f\xc0\xaf\
+\x53\xc4\x6f\x6f\x50\x80\x96\x1c\xff\xac\x55\x34\x00\x30\xd2\xaf\
+\x5b\x6b\x46\x06\xb3\x70\x3d\x43\xe5\xda\x74\x33\x65\x03\x9c\xc3\
+\xb3\x12\x3f\x77\xb0\x38\x65\x24\x35\x55\x0a\x97\x09\x38\x65\x32\
+\x29\x77\x02\x8c\x4a\xc9\xc4\x72\xff\x1b\x42\x0e\x57\xc0\x8f\x94\
+\xa5\xde\x9d\xdc\x1d\xcb\xa6\xa7\x63\xae\x2c\xd6\x70\xa1\x7c\x23\
+\xc5\x12\x84\xae\x08\xed\xd4\xcd\x3f\x9d\xf3\xa1\x7b\xd8\xff\xba\
+\xad\x2d\x8d\x32\xde\x94\x7e\x37\xa8\x99\x00\xf0\x99\x0e\xa3\xa8\
+\xa4\x33\x1c\x14\xed\x80\x3a\xfd\x0f\x6b\xfb\x08\x02\x1e\x63\x81\
+\xaa\xef\xd0\x71\xd0\xbe\xfb\x20\xa8\x65\xdc\x00\xd9\x79\x45\xf6\
+\x07\x3c\xa2\x8c\x2d\xd6\x0c\x47\x8b\xe1\xdf\x6b\x5d\x0a\x23\x27\
+\xcc\xb0\xe8\xe5\xc5\xcb\x04\x25\x8d\xe3\x7e\x2d\x71\xd8\xd7\x16\
+\x55\x6c\x7f\xfd\x15\x03\x01\x9b\x69\xe2\xdd\xef\x3b\x77\xc1\xf6\
+\x1d\xbb\xf9\xd7\x38\x49\x70\xc7\x2e\xb1\x76\xc3\x0e\xb6\x70\x54\
+\x6c\xaf\x7e\xa3\xa0\x5a\x0d\xd3\x39\x09\xd0\xca\x96\xc5\x42\x9b\
+\x63\xf6\x18\x8a\x78\x00\x81\x88\x1e\x60\x40\x89\x9f\x20\x37\xaa\
+\x74\xdd\x18\xb6\xb3\x5f\x6e\xd4\x6a\xf3\xb3\x1c\x1c\xf3\xb9\xc3\
+\x5f\x9d\x06\x37\x41\x93\xe6\x1d\xe0\x8b\x8e\xbd\x48\xe4\x47\x00\
+\x40\x04\xfd\x16\x72\xb1\xec\x9f\x00\x40\xdb\xae\xf0\x41\xcb\xce\
+\x02\x00\x14\x52\xa7\x40\x16\x5b\xa8\x94\x5f\xb5\x6e\x93\x10\x55\
+\x6e\x20\x30\x35\x57\x08\xeb\x68\xb4\xb2\xa8\xb7\xf3\xfe\xfa\xaf\
+\x45\x46\xce\xcf\x33\x4e\x5d\xa4\xb5\x54\x02\xaf\xe5\x0e\xb1\x1e\
+\x06\x74\x12\x03\x7e\xbb\x8a\x04\x7e\x53\x66\x2f\x80\x41\xa3\x26\
+\xc3\x20\x16\xf0\x87\x8c\xe6\x40\x60\xc8\x98\xc9\x30\x78\xf4\x14\
+\x18\x39\x71\xba\xa3\xc6\xcf\xb3\xfe\x65\x56\xf0\x9f\xbd\x80\xab\
+\xfb\xe5\xc2\xac\x7f\x16\xcb\xfa\x11\x00\xcc\x98\xb3\xd0\xa2\xfe\
+\xa7\xb2\xe0\x3f\x79\xe6\x02\xa8\x5b\x74\x9d\x30\xa3\x2a\x20\xd3\
+\xa7\x6b\x6f\x7f\x1c\x2a\xe3\x7b\xcf\x2b\x04\x7b\x38\x95\x19\x37\
+\xc0\x4b\xde\xb3\x99\x6c\xc3\x2d\x4b\xc2\x65\x4f\x18\x2d\x0a\x16\
+\x30\xb4\xb2\x06\x1f\x55\x34\xee\x9f\xb4\xa4\x2e\x8e\x34\xca\x08\
+\x9e\xdc\x7b\xb6\x99\xa4\x24\x50\xd1\xfe\x0a\xde\xe7\x30\xec\xa3\
+\xe5\x49\x27\xc1\xad\x64\x53\x3c\x15\xa7\xf6\xf4\xf3\xe6\xf7\x43\
+\x5b\xc9\x2f\x82\x5f\xbd\xb4\x2c\x20\x20\x41\xeb\x9b\x03\x00\xc4\
+\xbc\x5b\xf7\xd2\xbc\x38\xa1\x84\xc6\x48\xee\x9b\x34\x91\xdf\xbf\
+\xaa\x5e\x8d\xcf\xda\x53\xb7\x03\x2e\x9b\x09\x8d\xa7\xfd\x72\xbe\
+\xe9\xab\x34\x4e\xee\xec\x67\x52\x8d\xbf\x4a\x7e\x0c\xfe\xf3\xf8\
+\x6b\xe4\xbb\xde\xa9\xf7\x30\x30\xfe\x79\x3b\x54\xd6\x38\xcd\x1f\
+\x92\x93\x1a\x25\xa8\x22\x9b\x5e\x04\x15\x06\xe4\x9f\x7d\x21\x74\
+\xe9\x37\x12\xa6\xb2\x4d\xde\xca\x10\x97\xf2\xa0\x3f\x9f\x05\x1a\
+\x54\x84\x53\x7d\x78\x91\x1d\x34\x28\x88\x2d\xe0\x22\x31\xec\x47\
+\xff\x7d\x27\x0b\xf2\xbb\xf7\xc2\xce\x9d\x18\xf0\x77\xf1\xc7\x5d\
+\x7b\x58\xe0\xdf\x03\xbb\x76\xed\x85\xdd\x7b\xf6\xc1\xde\xfd\x07\
+\x61\xcc\x84\x99\x90\x5f\xb3\x01\x0b\xbc\x05\x62\xae\x41\x01\x1d\
+\x1f\x17\xf8\x29\x2b\x12\x8d\x07\xaf\x11\xe7\x3d\xec\xdc\x44\xf5\
+\xe4\x0c\x40\x5e\xd4\x0e\xfe\xb9\xba\x0d\x40\x72\xb9\x16\x42\x96\
+\x69\x70\x6c\xed\xed\xff\x7d\x99\x05\xfd\xbe\x14\xfc\x3f\x27\x00\
+\xd0\x8b\x00\xc0\x67\x2c\xe8\x73\x16\xa0\x1b\x07\x02\x02\x00\x60\
+\x09\xe0\xdd\x4f\xb0\x04\x50\x47\x00\x80\x7a\xd4\x31\x70\xd7\x03\
+\xcf\xb1\xf3\x23\xa6\xec\xad\x5e\x47\xe7\x94\x82\x2c\x66\xdb\x94\
+\x71\xf3\xcc\x9b\x16\x02\x02\x71\x9e\xf1\x7c\xcf\x17\x81\x7a\xc1\
+\x52\xa5\x5c\xb0\xc4\xee\xcb\xa7\x4e\x02\x62\x6c\x56\xc1\xa2\xaf\
+\x57\xc1\xc0\x51\x93\x60\xe0\xc8\x49\xf4\x38\x88\xad\xc1\xa3\x8a\
+\x09\x0c\xe0\x1a\x85\x66\x40\xec\x6f\xe6\x62\x8d\x9f\x04\x7e\x4b\
+\x45\xe0\x97\x22\x3f\xf6\x38\x77\xb1\xc8\xfa\x97\x58\x6a\xff\x99\
+\xec\x67\xd3\xe7\x2c\x82\xe9\xb3\x17\xf2\xec\x7f\xd6\x3c\xe8\x3e\
+\x60\x0c\x64\xe5\xd6\x61\xe7\xb1\x9e\xb8\x7e\x42\xe4\x89\xf7\x59\
+\x24\x6a\x3b\x3c\xe6\xbb\x93\x03\xf7\x9e\x96\xa9\xb9\x0f\x7a\xc0\
+\x7d\xd2\x74\x95\xd7\x8c\xd4\x3f\xbb\x19\xad\xc3\x9b\x69\x06\xfb\
+\x4c\xc7\x20\xc3\xb5\x07\x9a\x19\xd4\x28\x38\xf7\xe8\x50\x19\x00\
+\x44\xfc\x79\xca\x14\x1b\xc0\xb5\x28\x95\xe2\x7b\xeb\xcd\x8c\x07\
+\x7b\x3f\x03\x99\xb2\xb4\xa6\xf0\x1b\x59\x39\xd1\x71\xd9\x93\x91\
+\xa6\xe8\x2d\x80\xed\xb1\xa7\x9f\x40\x2c\x29\xe0\x48\x6e\x14\x64\
+\x06\xa8\x41\x05\x2d\x2f\xc4\x07\x57\xe7\x20\xa0\xb2\xa0\xdb\x64\
+\x20\xc4\x80\x44\xc3\xa2\xac\x0d\x45\x96\x00\x22\xa6\x52\x3b\xf5\
+\x13\x01\x7a\x00\x00\xa9\x0b\x60\x41\xf2\xf6\xfb\x9f\x87\x9e\x03\
+\x47\x43\xd7\xfe\x23\xe1\xb2\x1b\x1e\xe4\x75\x69\xcc\xd4\x34\xdb\
+\x1a\xd9\x32\xdf\x61\xf7\x0a\x1a\xd6\x7c\xd9\x73\x28\x74\xe9\x3b\
+\x04\xa6\xb3\x8c\x8f\x02\xbc\x9a\x21\xaa\xa2\xb0\x05\x32\x4b\x5c\
+\x0c\xb3\xe7\x09\x75\x38\x7b\x5c\xc0\x02\x16\x8a\x02\x77\xed\xde\
+\x67\x05\xfd\x5d\xbb\xf7\x50\xe0\xdf\x83\xc1\x7f\xef\x01\x06\x00\
+\xd8\xe3\xbe\x7d\xec\x79\x96\x43\xad\x82\x7f\xb1\x00\x59\x9b\x5a\
+\xc7\x78\x26\x19\x75\xfa\x61\x20\xe5\x9f\x6f\x58\x56\xd4\x71\x2d\
+\x82\x2e\x87\xcb\x44\x1b\x46\xc8\x01\x00\xa2\x5c\xd8\x2a\xdd\xfc\
+\x88\x01\xe0\x01\x2c\x8b\x05\xb4\x5a\xb1\xeb\xe1\xf5\x0f\xda\x12\
+\xe5\xff\xc5\x97\x3c\xf3\xa7\xec\xbf\x7d\x0f\x51\x02\xe0\xeb\x13\
+\x51\x0a\x20\x0d\x80\x28\x01\xbc\xf6\x7e\x6b\xca\x82\x91\xfe\xcf\
+\xa2\x9e\xf8\x3a\xf0\xf0\x93\x6f\xb2\x00\xcd\x35\x15\x28\x9e\xc4\
+\x80\x4f\xc1\x95\xce\xdf\x62\x98\x83\x8f\xb4\xf8\x79\x9d\xa3\x80\
+\x01\x3c\xe7\x78\x0d\xe6\x2d\xf9\xca\xca\xda\x2d\x50\xc0\x82\xf9\
+\x12\x31\xa4\x07\xcb\x35\x63\xa7\xcc\x81\xfe\x23\x26\xc0\x80\x91\
+\x6c\x11\x00\x98\xc8\xc0\xc0\x44\x0e\x0a\x46\x4d\x86\x31\xc5\x33\
+\xad\x6b\x29\x7b\xf9\x69\xb1\xeb\x89\xc7\x82\x81\x5e\xae\x19\x73\
+\xe4\x5a\x08\x33\x66\x73\xea\x7f\xfa\x6c\xa4\xff\x17\xd2\x64\xc1\
+\xbb\x1f\x79\x89\x5a\xff\x38\x58\x2b\x14\x65\x80\xa8\xad\xb1\x90\
+\x9f\xff\x88\xd3\x0c\x2d\x47\x99\x4b\x91\x19\xa6\x35\x55\xea\xdc\
+\xf4\xd1\x18\x19\x27\x30\x9b\x4d\xa5\x97\x3e\x53\xda\x83\x60\xfe\
+\x01\xce\xf2\x6d\xac\x9c\xf6\xc7\x20\x40\xc3\x47\xe7\x95\x31\x06\
+\xc9\xa0\x04\xa9\xd2\x5f\x8b\xca\x4f\x05\x54\xb8\x6b\x39\xc9\x56\
+\x66\x46\x1d\x27\xaf\x8b\xeb\x09\x2e\x5e\x3a\x75\x9a\xc4\xc2\xbe\
+\x90\x66\xa4\x55\x23\x4c\x2d\xf8\x17\x65\xd8\x34\xc4\x8c\xf7\x14\
+\xcf\xf7\x0e\xf8\xd9\x89\xbc\xfd\x85\xd3\x1e\xa7\x5b\xa3\x70\xf5\
+\x2d\x8f\x40\xd7\xbe\xa3\xa0\x6b\xbf\x51\xf0\xef\x7b\x9e\xa6\x3a\
+\x2d\xd1\xeb\x5a\xd4\x12\xc1\xf1\x52\x00\x6e\xde\x75\x59\xc0\xeb\
+\x03\x1d\x7a\x0e\x80\x4e\x7d\x06\xc3\xe4\x19\xf3\x58\x86\xca\x83\
+\x91\xba\x66\x2d\x58\x6c\xd7\x85\xe7\x2c\x12\x01\x03\xb3\xc3\x45\
+\x30\x60\xc8\x68\xe8\xd0\xad\x2f\x0b\x28\x8b\x89\x09\xd8\xb3\x77\
+\x3f\x5b\x18\xf0\xf7\xf3\x85\x5f\xb3\xb5\x67\x1f\x03\x07\xec\xdf\
+\x36\x7e\xff\x1b\xdc\x7e\xef\x53\x90\x55\xb5\x16\x0b\xbe\xf5\x78\
+\x00\xb1\xd4\xe2\x31\x1a\x27\x1b\x8a\xa8\xb5\xfb\x68\x92\xfb\xd9\
+\x8c\x63\xa5\x2c\xd7\x39\xf5\xb3\x21\x3a\x01\x28\x4b\xa7\xd6\xc4\
+\xba\x34\x5c\x29\x52\xb3\x21\x0b\x6c\xaf\xb0\x4c\xbe\x27\x0b\xec\
+\x3c\xd8\xb7\xc4\x8c\xbf\x83\x4d\xfd\x63\xe6\xef\x58\xed\x14\x10\
+\xd0\xb6\x2b\x3c\xf9\xca\x47\x94\xf5\x67\x23\xfd\xcf\x32\xe4\xca\
+\x0c\xe0\xbc\xd6\xe4\x33\x58\xfa\x15\x1f\xa7\xbb\xec\xdb\xd5\x14\
+\x48\x91\x4e\xc7\x56\x3a\xa4\xd8\x67\x8b\xf3\x89\x40\x8a\x32\xf1\
+\x85\x4b\xe2\xce\xbd\x55\x2e\x58\x68\x33\x04\xa8\x01\xa0\x76\x3e\
+\x06\x00\x66\xb3\x7f\xeb\x3f\x7c\x1c\x03\x00\xe3\xa1\x3f\x03\x00\
+\xfd\x59\xe0\x1f\x40\x8b\x7d\x3d\x82\x3d\xb2\x35\x7e\xea\x6c\xf6\
+\x5c\x18\xf0\x97\x11\xdd\x3f\x8b\x68\x7e\xbe\x66\xcc\x5d\x2c\x68\
+\x7e\x7e\x2d\x31\xd0\xe3\x23\xcf\xfa\x79\xe6\x4f\x20\x80\xfd\xfb\
+\xe8\x49\x73\x40\x3b\xb3\xa1\xf0\xf5\x77\x33\x35\x0a\x98\x56\xc4\
+\x7e\xea\xfd\x9b\x9d\x96\x26\x28\xb3\x73\xdf\xd3\x1f\xc7\x9b\x8a\
+\xb0\xaf\x3c\x05\x7b\x99\xd8\x7f\xcc\xbf\x90\x10\x31\xa8\x86\x2b\
+\xd3\xad\x80\xce\x52\x71\xa5\x60\x27\xcd\x48\x4b\x78\x92\x5a\x90\
+\x31\x3c\x45\x6a\xf1\x03\x7c\xbc\xa6\x69\x29\x22\xb7\x88\xe1\x63\
+\x7c\x93\x08\x61\x1a\x10\xac\x6c\x91\x68\xc6\x41\x7c\xc9\x81\x67\
+\x63\x66\x1a\x20\x28\xc9\xe8\x5d\x47\x26\xef\x55\x46\x89\xaf\xf9\
+\x95\x7d\xfc\xa8\x01\xa9\x96\x77\xb2\x7d\xed\x7f\x5d\x1d\x13\x91\
+\x98\x8f\x80\xca\x4c\x6a\x1f\x6c\x4d\x17\xa4\x8d\xae\x80\xda\xd6\
+\xda\x76\x19\x04\x5d\xfa\x8d\x80\x87\x9f\x7b\x8f\x81\x04\x9d\xb2\
+\x53\xca\xda\x22\x4a\x6f\x3d\x03\x07\x6f\x7d\xdc\x06\xda\xf7\xec\
+\xcf\xd6\x00\xe8\xd0\x63\x00\x0c\x1e\x3d\x09\xa6\xcd\xe5\x41\x69\
+\xce\x02\xde\x03\x3e\x53\xd4\x83\xe5\xc2\x80\x30\xae\x78\x3a\x74\
+\xef\x37\x04\xda\x77\xed\xc7\x5e\xab\x2f\xb4\xe9\xd4\x1b\x7a\xf6\
+\x1b\x4a\x76\xb5\x08\x02\xf6\x51\xf0\x67\x80\x60\x1f\x82\x82\x3d\
+\xb4\x76\xef\xd9\x4f\x6b\xd7\xee\x03\xd0\x77\xd0\x38\x38\x3f\x7a\
+\x25\x67\x01\xf2\x4d\x31\x4a\x16\x45\x78\x26\x67\x00\xf2\x0d\xef\
+\x8e\x00\x5f\x00\xe0\xcc\x5c\x78\xbd\x99\xb3\x2b\xd2\x39\x92\xbc\
+\xfc\xd9\xeb\x61\xe0\x3f\xf9\x54\x03\xae\xb9\xed\x31\x78\xbf\x65\
+\x17\x0a\xe6\xb4\xda\xf3\x45\x20\x80\x6a\xff\x1c\x04\xc8\xf5\xa9\
+\xf8\x37\x8b\x0d\x10\x20\xe0\xce\x47\x5e\xb6\xe8\x70\x04\x02\x95\
+\xab\x5e\x00\xad\xbe\xec\x0b\x8b\x97\x49\x21\xe5\x0a\x98\xca\xc0\
+\xd5\xb4\x59\x0b\x28\xb8\xe2\x39\x44\x00\x35\x6b\x2e\x6f\xb3\xe3\
+\xe0\x8a\x2d\x41\xcb\xbb\x01\x98\x55\x26\x58\xfc\x95\xe8\x14\xf8\
+\x06\x16\x32\x10\x80\x75\xfe\xfe\x23\x54\x00\xc0\x57\x3f\xf6\x7d\
+\xbf\xe1\xb8\xc6\xc2\xa4\x19\x73\x29\xe8\x73\x33\x1f\x4e\xf1\xa3\
+\xb2\x9f\x82\xfe\x1c\x1e\xf4\xa7\xce\xe2\x0a\xff\x69\xb3\xe6\xc1\
+\xd4\x99\x2c\xe3\x9f\x39\x9f\xbe\x9f\xca\x8e\x77\x2a\x32\x00\xec\
+\xf7\x1f\x7c\xf2\x2d\x08\xa3\xd9\x11\x4d\x3e\xe4\xdd\x24\xd6\xb2\
+\x5a\x3b\x55\x10\xab\x94\xb8\x22\xc9\xbc\x34\x8c\xb4\x12\x06\xef\
+\xbd\xd1\x0c\xe4\xb5\x91\xd8\x4a\x3d\x9d\xf6\x62\x23\xe0\x31\x98\
+\xbe\x2e\xac\x89\xd9\xd1\xb2\x94\x9a\xe3\x3d\x46\xbc\xe3\x48\xd0\
+\xe3\xc9\x3c\x3b\x9e\xe8\xdc\x95\x2f\x30\xd4\x83\x32\x00\x65\x47\
+\x4b\xc9\xe9\xef\x54\x1c\xcf\x82\xb5\xec\x85\xb4\x20\x0c\x40\x6a\
+\xaf\x1b\x5f\xd2\x30\x3c\xa8\x59\x2f\xd5\xab\x97\xe8\xc6\x5d\x9a\
+\x30\x52\xb4\x76\x35\x3c\x6e\xa2\x4c\xdb\x7c\x66\xd6\x78\x22\x94\
+\xcc\x63\xdc\x25\xa2\xca\x71\xd4\x20\x93\xb9\x08\x72\xe7\xc4\xb3\
+\x6a\x5f\x0e\x1f\xb7\xea\x4e\xe5\x80\x37\x3e\x6c\x0b\xb9\x67\xd4\
+\xa7\xac\x97\xd7\x6e\xa5\x3e\xa0\x00\x1e\x7f\xe1\x3d\x68\xdf\x03\
+\x83\xff\x40\xbe\x7a\x0e\xa4\xbe\xee\x01\x2c\xb0\x8c\x99\x38\x15\
+\x26\xb1\x0c\xb2\x78\xfa\x5c\x98\x38\x7d\x36\x8c\x99\x34\x9d\x28\
+\xe6\xee\xfd\x87\x42\x87\xee\x7d\xa1\x5d\x57\x5c\xfd\xa0\x4d\xe7\
+\x3e\xd0\xba\x73\x6f\x68\xd5\xa9\x17\x7c\xfe\x65\x0f\xe8\xd6\x77\
+\x08\x05\xab\xdf\xb6\xef\xa0\xac\x7f\x17\x05\xff\xbd\xb0\x9b\x3d\
+\x62\x29\x00\x99\x81\x7d\xfb\x0f\xc1\xb6\xdf\xf7\xc0\x17\xed\x7b\
+\xc1\x39\x05\x57\x72\x00\x20\xad\x74\x09\x00\xe8\x62\xf4\xb1\xdd\
+\x5a\x27\x03\x8e\x5f\x49\xcb\xb9\xd1\xf3\x4e\x09\x1c\xdd\x1b\xa2\
+\x11\xcd\x1c\x00\x9c\x7c\x6a\x14\x2e\xbb\xe1\x21\x78\xa7\xf9\x97\
+\x14\xe0\x3f\x11\x01\xbd\x05\xaa\xfb\x71\x75\xe8\xce\x7f\x46\xd9\
+\xbf\x0c\xfa\x2e\x06\x40\x7c\x2f\xc1\xc0\xe5\x37\x3e\xc4\xcf\x67\
+\xb5\x42\x12\x00\xfe\xed\xe4\xf3\x61\xc4\xf8\x19\x2c\x5b\xe7\x4e\
+\x7b\x73\x17\x7e\x05\x53\x66\xce\x25\x21\x1d\x06\x5b\xca\xb4\x25\
+\xa0\x62\x5f\xcf\x44\x40\x30\x8f\xf7\xdb\x13\x10\x10\xac\x80\x5c\
+\x73\x04\x28\x90\x9d\x03\xe8\xd7\x3f\x76\xca\x4c\xa2\xfe\x29\xf8\
+\x13\x00\x60\x01\x1f\x17\xbb\x6e\xb8\xfa\xb2\xd5\x67\xd8\x68\x16\
+\xc0\x17\x8a\x6c\x7f\x89\x15\xf8\xa7\xcd\x59\x28\x02\x3f\x0f\xf4\
+\x53\x66\xa2\xc8\x6f\x1e\x14\xb3\x63\x44\xa5\xbf\xb5\x66\x2d\x20\
+\x01\x60\x2f\x06\xd6\x4e\xf9\x7b\x03\x0a\xfe\xd9\x35\xc4\xf9\xc5\
+\x79\x0f\xf9\x02\x08\xf8\x9a\x90\x49\x11\xaa\x57\xf0\xcf\x74\x6b\
+\x57\x2c\x80\x76\x2a\xd9\x1e\x6b\x94\xb9\x0c\x11\x8e\x24\x2e\xfb\
+\xc6\x6b\x12\x8c\x34\xcb\x02\xa9\x9e\x13\x6f\xe7\xda\xf2\x09\xb2\
+\x46\xca\x00\xc5\x3d\xb9\x36\x38\x43\x6c\x96\x99\x19\xaa\x54\xde\
+\xe8\xc6\xff\x44\x7b\xf5\xa7\x1b\x69\xb4\x0b\xfa\x19\xdd\x04\x15\
+\x01\xfa\x39\xee\x99\x01\x3f\x68\xee\xf6\xbd\x14\xea\x3e\x5a\x2c\
+\x89\x43\xa0\xc7\x6b\x0a\x56\x21\x14\xa7\xa0\x55\xa9\xc6\x8a\x9d\
+\xce\x95\x9e\x9e\x40\x8f\x33\x4e\xf2\x1e\x0e\xe4\x02\x00\x79\x09\
+\x98\x82\x7c\xc3\x02\x64\xda\x99\x0d\xe0\xe5\xf7\x3e\xa7\x51\xc2\
+\x2d\xda\xf5\x82\xb3\xeb\x5e\x6e\xb9\xf2\x11\x10\x60\x00\xe0\xdf\
+\x77\x35\x66\x81\x7f\x10\x74\xec\x39\x08\x3a\xf5\x62\x8f\xbd\x06\
+\xb0\xc7\xfe\x6c\x0d\x64\x3f\x1b\x00\x1d\x19\x38\xf8\xb2\x67\x7f\
+\xf6\x3b\x6c\x75\xef\xcf\xc0\x02\x7b\xec\xd6\x0f\xda\x77\xeb\x0b\
+\x6d\x19\x00\xe0\x81\x9f\xaf\x2f\x3a\xf6\x24\x00\x80\x01\xb3\x45\
+\xdb\xae\xd0\x92\x3d\x0e\x66\x19\xe9\xe2\xaf\x57\xc2\x2f\x5b\x7f\
+\x27\x3d\xc0\xbe\xfd\x07\x61\xdf\x81\x83\x70\xe0\xe0\x21\x38\xf8\
+\xc7\x41\xb6\xfe\x84\x6d\x3b\xf6\x40\xc7\x6e\x83\xa0\xc1\x15\x77\
+\x90\xbf\x01\x0a\xca\x30\xf8\xe3\xf1\x59\x35\xe7\x88\x6e\x53\xcf\
+\x2e\x06\xc0\x32\xa1\xb2\xb2\x4e\x04\x12\x0d\x6d\x5f\x04\x06\x06\
+\x4e\x39\xa3\x21\x5c\x79\xd3\x23\xf0\x6e\x8b\x0e\x2c\x80\xf7\xe4\
+\x59\xbc\xcc\xf2\xdb\xbb\xb2\x7a\x0a\xf0\x3d\xad\x9f\xb9\x4b\x00\
+\x9f\x74\xe8\x66\x95\x0a\xbe\xe8\xd8\x07\xce\xd3\xaf\x17\x83\x45\
+\xf8\xdc\x00\xed\x74\x13\xe6\x2d\x59\xc1\x02\x36\xef\xbb\x9f\x3e\
+\x67\x31\x14\xcf\x98\x47\x25\x96\x29\x33\x45\x66\x8d\xc1\x77\xb6\
+\xcd\x08\x70\xa7\x3d\xee\xb6\x67\x81\x81\xf9\xa2\x44\x20\x00\x01\
+\xb2\x00\x38\x91\x6f\xea\x9c\x05\x36\xf5\x8f\x0c\x80\x15\xf8\xc7\
+\x43\xdf\xe1\x18\xf8\xc7\x5a\x6b\xc6\x9c\xa5\x2c\xe0\x2f\x61\x81\
+\x5c\x64\xfb\xb8\xc4\x31\xe0\xb1\x4c\x9e\x31\x9f\x8e\x8b\x1e\xa7\
+\xf3\xaf\x8b\x09\x0c\xcc\x87\xe2\x59\xf3\x18\xf0\x9b\x0f\xfa\x45\
+\xb7\x89\xe1\x4e\xc2\x54\x2a\x9f\xdf\x67\xce\xee\x0c\xdd\xc7\x8c\
+\xcc\xf0\xf0\xee\x28\x6b\x86\x6b\xb8\x82\x47\xb0\x36\xeb\xd4\xd9\
+\xd8\x32\x26\x86\x11\x13\x32\x5b\xfe\x35\xd2\xfc\x79\xd0\xe4\xd2\
+\xcc\x70\xc9\xc2\x70\x01\x3c\x03\x82\x8d\x30\x0e\xb6\xdf\x66\x2a\
+\x29\xab\x74\x62\xeb\x1f\x7a\x52\x00\x10\xfc\x06\x36\x12\x88\xff\
+\x8c\x00\x86\x14\x46\x9a\x37\x7e\x34\xa5\xf7\x91\xae\xe5\xee\x5f\
+\x4b\x8f\x51\x94\xe6\x31\x1b\x0e\x05\x6a\xd8\x31\xf6\xd6\x0c\x24\
+\x12\xe5\x43\x75\xfc\x7c\x18\x0c\xc7\xd0\x9f\x9c\xfc\x28\xdc\xfd\
+\xe8\xab\xd0\xb1\xdf\x70\x68\xdb\x63\x30\xd4\xbf\xec\x4e\xc8\xa2\
+\xda\x3b\xaf\xbf\x17\x5e\x78\x13\x74\xea\x3d\x94\xad\x41\xb4\x3a\
+\xf6\x1e\x40\xc1\xbf\x53\xcf\x41\x04\x00\xbe\xa4\xd2\x40\x7f\xaa\
+\xf3\x63\xd0\x6f\xc7\x82\x7f\x3b\xf6\xd8\xa6\x4b\x6f\x0a\xfe\xad\
+\x3b\xf5\xa1\xe0\x8f\x93\xf1\xa8\x76\x2e\x83\x24\x9a\xe5\xb4\xee\
+\x46\xbe\xf9\x1f\xb7\xea\xcc\xb2\xe9\xae\xd0\xb3\xff\x70\x16\x08\
+\xe7\xc3\xb7\xab\xd7\xc3\x6f\xdb\x76\x30\x20\x80\x20\xe0\x0f\xd8\
+\x7f\xf0\x0f\x06\x0e\x0e\xc2\xef\xbb\xf6\xb3\x60\xb9\x0c\x5e\x7e\
+\xfb\x33\x30\xff\x79\x1b\x9c\x72\x9a\x41\xed\x75\xa8\x61\xb0\x06\
+\x18\x45\x6c\x31\x9f\x65\x37\xab\x99\x96\xfa\x9c\x28\x67\x62\x11\
+\xb8\x2b\xe2\xa9\xff\xb8\x0c\x6e\xb8\xeb\x59\xf8\xb0\x55\x77\x68\
+\xdd\xa5\x1f\x89\xfc\x3e\x15\x99\x3b\x05\x7e\xd9\xe3\xdf\x01\x59\
+\x80\x1e\x76\x39\x40\x59\x9f\xb6\xef\xe6\x62\x00\xb8\x46\xe0\x8b\
+\x0e\xbd\xa0\x79\xeb\x1e\x50\xa5\x86\x30\x6c\xca\xe3\x1d\x06\x97\
+\x5e\xfb\x00\x4d\xd0\xa3\xba\x3d\xcb\xda\x27\x4f\x9f\x0b\x93\xa6\
+\xcd\xa5\x47\x09\x02\x6c\x20\xc0\xb3\xec\xe9\x73\xec\x9e\x7b\x04\
+\x01\xea\x42\x30\x80\x2c\xc0\xac\x45\xbc\x86\x8f\x41\xbf\xdf\xf0\
+\x71\x44\xf3\xf7\x1f\x3e\xde\x02\x02\xf8\xb3\xbe\x14\xf8\xc7\x40\
+\xef\x21\xa3\x89\xad\xc1\xc0\x3f\x15\x17\x06\x7c\xf1\x7a\x14\xf8\
+\x67\x8a\xc0\x8f\x41\x1f\x19\x9e\x69\x73\xf8\xc2\x63\x9d\x3e\x0f\
+\x26\x21\x10\x60\xc7\xf5\x60\xe3\x37\x39\xa0\xaa\x5e\x5f\x68\x51\
+\x70\x92\x64\xcc\xc3\x85\xb4\x3c\x35\x48\x66\x8a\xde\xfc\xa9\xee\
+\xa1\x41\x93\x96\xff\x25\x97\x42\x43\x61\x17\x82\x8a\xfd\x4c\xa8\
+\xb8\x5a\x7f\xa2\xe1\x71\x15\xbb\xf7\x57\x4a\xbf\x86\x9f\x7e\xab\
+\x5b\xb6\x2f\x2d\xa6\xbb\x68\x21\xd3\x13\x49\x26\x66\x05\xfc\x2c\
+\x6f\xcd\x04\xe8\x2b\x48\xcd\xdd\xf0\xb9\xd1\x75\xc5\xe2\x33\x48\
+\xb7\x41\xb2\xd9\x05\xc9\x9f\x23\x08\x95\x95\x1e\xbd\x65\xa4\xb0\
+\x29\x19\x9e\x25\x0b\xb5\x45\xd2\x3e\xd6\x22\xc5\x04\xc5\x08\xe8\
+\xc6\x95\x68\xaa\x96\xa1\x64\xbe\x86\xc7\x0c\x01\xd3\x02\x19\xa8\
+\x4c\x6f\x74\xe5\x9d\xd0\xa6\xeb\x40\xe8\xda\x6f\x34\xdc\x7c\xdf\
+\xb3\x64\x5d\x8b\xed\x81\xd5\xce\xa8\x2f\x3a\x01\x86\x41\xe7\x5e\
+\x83\x89\x05\xe0\xd9\xff\x40\x07\x00\x68\xdb\xb5\x0f\x0f\xfa\xec\
+\xb1\x75\x57\x96\xf1\x0b\xca\x9f\x67\xfd\x22\xf8\x63\xb0\x44\x7f\
+\xfc\x76\x1c\x00\x34\x6f\x8d\xab\x0b\x5b\x5d\xc9\x35\x0f\x83\xe7\
+\xe7\x2c\x70\x22\x60\x40\xf0\xd0\x91\xbd\x4e\xef\xc1\xa3\x60\xf8\
+\xd8\x62\x18\x5b\x3c\x1b\xc6\x4f\x9b\x07\x63\xa7\xcc\x83\x61\x13\
+\x66\xb3\x9f\x17\xc3\xbb\xcd\xbb\xc0\x15\x37\x3c\x22\x14\xe7\x32\
+\xe8\x47\x9d\x83\xaa\xa4\xce\x84\x74\x04\x3c\xdb\xaf\x52\xc3\x84\
+\xc2\x46\xb7\xc2\x13\x2f\x7c\xc8\x00\x0a\x32\x17\x83\xa0\x5d\xf7\
+\x01\xec\xf8\xfb\x0a\x63\x9f\x5e\x96\x90\xef\x13\x91\xe1\xb7\x50\
+\x0c\x7e\x64\x39\x40\x7e\x2d\x4d\x80\x38\x00\xe0\xc1\xff\xf3\x2f\
+\xf1\xbd\xf7\x86\x87\x9e\x7e\x87\x5e\x97\xdb\x06\x9b\x14\x14\x5f\
+\x7b\xb7\x25\x37\xda\x11\xed\x76\xe3\xa6\xcc\x82\x09\x53\x67\x73\
+\x10\x20\x81\x00\x5b\xc5\x0e\x30\xb0\x50\x00\x01\xb9\x16\x5a\xa2\
+\xc1\x99\x42\x2c\x38\x63\xc1\x62\x18\xc0\xb2\xfd\xde\x43\xc7\x50\
+\xf0\x47\x03\xa8\xbe\x16\x18\x10\xc1\x9f\xfd\x5b\x2f\xb6\x7a\x0e\
+\x1a\x45\x63\x81\xa7\xb0\xe7\x2d\x56\x02\x3e\x06\xf6\x49\x14\xe4\
+\x79\xd0\x9f\x30\x55\xae\xd9\x24\x18\x9c\x40\x20\x60\x36\xfd\x1e\
+\x4e\x3d\xac\x52\xc3\xe0\xb3\x24\x28\xeb\x97\x5a\x15\xc3\x43\x67\
+\x94\x88\x7d\xcc\x14\xad\xef\xcf\x4e\x3a\x33\x7d\x77\x6f\xfb\x89\
+\x1c\x30\x64\x96\x23\xd5\x1e\xc0\x5e\xd7\x75\xfe\xec\xd6\x3f\xef\
+\xfd\xb8\xbc\xcf\x59\x72\x46\xa6\xe2\x00\x80\x14\x86\x56\x3a\xf1\
+\x59\x66\x7c\xfd\xdc\x6d\xa4\x91\xed\x32\xd5\x48\x19\x79\x45\xf4\
+\x00\xa2\x3b\x03\xfc\x27\x3f\xe9\x0e\x41\x9f\x7a\x73\x5b\xc1\x3f\
+\xa2\x3a\x10\x06\x41\xe9\x46\x12\x00\x63\x78\x0a\x44\xbc\xea\xfd\
+\x9e\xc1\x3f\xe3\xd7\x4b\x77\x7d\x98\x74\xd7\x87\x4d\x01\x84\x2e\
+\xf5\xbe\x7d\xfc\x89\x4a\x1d\x46\x0a\xe8\x5e\x94\x05\xb4\x98\x47\
+\x57\x40\x7d\xee\x32\x28\xc6\xec\x52\x7d\x5a\xab\x0b\xd5\xcf\x6e\
+\x08\x05\x0d\x6e\xa0\x61\x2e\x21\x1a\xe7\x1a\x23\x61\xd7\xe9\xb5\
+\x2e\x87\xe8\x3f\x6f\x85\xeb\x6f\x7f\x82\x26\xdb\xbd\xd6\xf4\x73\
+\x96\xb9\x77\x63\x01\xb3\x1f\xe9\x02\xda\x77\xef\x4f\x5f\xb7\x62\
+\xd9\xfe\x17\xb4\x58\xc6\x2f\x82\x3f\xaf\x8f\xdb\xf4\xf9\x27\xaa\
+\x51\x4e\x9b\xae\xec\x79\xb8\x77\x3e\x9f\x9c\xd7\x8b\xfd\x1d\xfe\
+\x7d\x5f\xf6\x7d\x2f\x68\xfa\x59\x67\x78\xb1\xc9\x67\x70\x7f\xe3\
+\xb7\xe1\xda\x3b\x1b\x43\xec\xd2\x3b\xe0\xcc\xba\x57\x32\x50\x52\
+\xc4\xc5\x7a\x34\x63\xbe\x80\x56\xc8\x6a\xe3\x2b\x14\x4a\xfe\x42\
+\x85\x09\xd0\x49\xe8\x58\xdb\xb8\x1e\x1e\x7e\xaa\x09\x03\x2e\xc3\
+\x60\xe4\xc4\x99\x30\x7a\xe2\x0c\x5a\xa3\x26\xcd\x64\xdf\xcf\x80\
+\x61\xe3\xa7\x91\x61\x4e\xef\xc1\x63\xa1\x4b\x9f\x61\xf4\x9e\xb0\
+\xaf\x1f\x47\xfb\x5a\xde\xfe\x42\x0c\xa8\x82\x00\x9b\x09\xb0\x05\
+\x81\x08\x7a\xf0\x5c\xe8\x17\x23\x3d\xde\x90\xcf\x0e\xc0\x73\x5f\
+\xdd\x80\x51\x13\x67\x91\xa9\x0f\x82\x00\xcc\xb8\xc7\x33\x00\x30\
+\x7e\xca\x6c\x0a\xb2\x13\xa7\xf2\x4c\x9b\x02\xb0\x60\x04\x90\x15\
+\xe1\x60\x60\x9e\x60\x04\x38\x18\x90\xcc\x00\xf5\xe5\x33\x00\x30\
+\x78\xf4\x44\xe8\x39\x78\x34\xf4\x1a\xc2\x32\xfc\xa1\x18\xec\x71\
+\xc9\xc0\xcf\x57\x6f\xf6\x6f\xf8\x3b\xdd\x07\x8e\xa4\x60\x3e\x89\
+\xb2\x7c\xfe\x3a\x93\x08\x78\xcc\x63\xc7\x20\x32\x7e\x0c\xfa\xec\
+\xd8\xc6\x4d\x99\x23\x1e\xc5\xd7\xec\xe7\x08\x9a\xb4\x9a\x45\x0a\
+\xab\x62\x97\x97\xc8\x9d\x31\x62\x24\x68\x33\xd6\x21\x73\x2a\x73\
+\xb1\x1f\x2a\x9f\x41\x5b\xc8\x67\xb8\x34\x40\x4e\x63\x9b\x8a\x07\
+\x00\xca\x71\x46\xd2\x6f\xff\xce\x4c\xf6\x6f\xfa\x94\x48\x8c\x04\
+\x22\xbb\xf2\x67\x5e\x1d\x7b\xa1\x63\x4f\x8c\xf9\x1e\x6f\x79\x32\
+\x12\x29\x68\x00\xcc\x72\xa2\x43\x82\x7a\x31\xa7\x63\xe2\xa3\x8a\
+\x71\xa2\x09\xc4\x76\xde\xf6\x94\xd6\x00\x8f\x38\x21\x9f\x3b\xb8\
+\x4b\x20\xa0\x8b\xde\x6b\x23\x03\xe7\x46\xaf\xa0\x52\x40\x10\xfa\
+\xcb\xf0\x11\xd2\xb8\x8d\x3d\x94\xf7\x2e\x19\x80\x48\x2a\xb6\x99\
+\xa9\xb5\xc0\x24\x1e\x2d\x1c\xb3\x1c\xff\x30\xd8\x87\x72\xeb\xb0\
+\x9b\xbd\x8e\x30\x72\x29\x14\x41\x93\xab\xba\x29\xc3\xc3\xc7\x1a\
+\xf5\x89\xce\xc6\xd1\xb6\x27\x9d\x6a\x42\xe4\xac\x8b\xe0\x6c\x16\
+\x90\xeb\x35\xba\x11\x1a\x5d\x71\x17\xfc\xeb\xdf\xff\x85\x7f\xdf\
+\xf3\x24\xdc\xf5\xf0\xf3\xf0\xe0\x93\xaf\xc1\xa3\xcf\x35\x81\x27\
+\x5e\x7c\x0f\x9e\x7c\xb9\x29\x34\x66\xeb\xc9\x97\x9a\xc2\x63\x2f\
+\xbc\x0b\x0f\x3e\xfd\x26\xdc\xf3\xd8\xab\x70\xc7\x03\xcf\xc1\x0d\
+\x77\x35\x86\x2b\x6f\x7a\x08\x1a\x5d\x75\x1f\x03\x19\xb7\xc3\xb9\
+\xb1\xeb\xe0\xd4\x5a\x97\x42\xb5\x33\x1b\xd1\x6b\xf0\xb6\xb2\x18\
+\x0d\x02\x0a\x89\x19\x05\x14\xf0\x73\xf9\xa4\x39\xfb\x7b\x65\x21\
+\x30\xa8\x5a\x87\xbd\xff\xba\x50\xcb\xb8\x86\x14\xea\x9d\x7a\x0d\
+\x67\x41\x6d\x3e\x05\x53\x0a\x7a\xd3\x58\xa0\x63\xd9\xf6\x38\x16\
+\x70\xc7\x15\xcf\x86\xb1\xc5\xb3\x60\xcc\xe4\x99\xe4\x7c\x38\x62\
+\xdc\x74\x18\x3a\xa6\x98\x05\xd4\xc9\x14\x3c\xdb\x30\x80\xd3\xac\
+\x0d\x67\x29\x9a\x09\xa3\x9f\x4f\x5d\x65\x00\xc9\x0e\xf0\x0e\x81\
+\x5e\x64\x14\xf4\x6e\xf3\x0e\x50\xa5\x3a\xbe\x87\x86\x56\x8d\xbc\
+\xfe\x65\x77\x93\x39\x0f\x1a\x29\x61\xdf\x3e\x06\xfe\xb1\xc5\x33\
+\xd9\x31\xcc\xa2\xc0\x8a\x81\x16\x03\x2f\xa7\xdc\xe7\xd2\xe2\x6c\
+\x80\x5c\x1c\x08\x4c\x11\x02\xbd\x69\x73\x16\x10\x03\x30\x6c\xec\
+\x24\x0a\xea\x3d\x06\x8e\x62\xd9\x3d\x82\x80\xb1\xb4\x10\xcc\x60\
+\xd0\xef\x3d\x84\x3f\xf6\x62\xc1\x1f\xb3\x7f\x64\x01\x28\xdb\x67\
+\xcf\x8f\x40\x60\x82\xa0\xf7\x27\xe0\xf7\x53\xe7\x52\xd6\x3f\x7e\
+\x2a\x0f\xfa\x63\xc5\xf9\xc1\xe3\xc4\xaf\xbb\xf5\x1b\x05\x7f\x3f\
+\xf7\x62\xc8\xae\x6e\x58\x83\x7d\xe4\x75\xe2\x73\x1c\xbc\x2c\x9b\
+\xf5\x04\x0e\x99\x99\x6a\x3f\xf6\x0b\x14\x41\x87\xd7\x98\xe5\x18\
+\xd8\xdc\x9f\xff\x98\x87\xf7\x41\x79\x1d\x83\x91\x90\x7d\x70\xee\
+\xd7\x66\x4a\x34\x7d\xfa\x00\xc4\x3d\x47\x21\x13\x2d\xe7\x99\x8a\
+\x05\xa6\xdb\x0a\xb8\xa2\x33\x7e\xc3\x83\x92\xd7\x21\xf9\x18\x5b\
+\x3f\x1a\xdf\x8f\xce\x0f\x82\xc4\x4d\x47\x4b\x44\x48\xf3\x52\xf0\
+\xa7\xd7\xc2\x58\xb6\x0f\x7d\x2a\xaf\x6f\x04\x12\x12\x3a\x45\x87\
+\x99\xec\xd1\x0d\x8a\xea\x0d\x08\xd6\x89\x91\xba\x30\x28\x4e\x34\
+\x28\x36\xa3\x2c\x2c\x01\x10\x00\xe0\x41\x33\xab\x6a\x3d\x31\xb9\
+\x4e\x17\x8e\x80\xf6\xf8\x5b\x64\x0f\xaa\xa0\xd0\x4b\x2c\x02\x07\
+\xd6\x86\x5f\x28\x8c\x7b\xea\x11\x9b\x10\x46\x1d\x81\xd0\x12\x90\
+\xf9\x0d\x82\x0b\x4d\x6a\x0b\xd0\x1a\xb6\x2e\x77\x8c\xcb\x93\x4e\
+\x71\xec\x58\x59\xb0\x0c\x57\x8f\x11\xd8\xc8\xae\xde\x80\x54\xff\
+\x96\xf2\xdf\x6a\xd3\x2b\x24\xa3\x9e\x90\x9c\x15\x4e\xf7\x64\x01\
+\x1d\x7b\xe5\x53\x2e\x80\x1a\x67\x35\x80\x2b\xae\x7f\x00\x5e\x79\
+\xfb\x53\xe8\x33\x68\x1c\x05\x7d\xaa\xb1\xcf\xe0\x0b\x45\x6b\x18\
+\xe8\x78\x76\xcb\x02\x1b\x5b\x63\x26\xcf\x82\xd1\x93\x66\xb2\xcc\
+\x7c\x06\x03\x00\xd3\xc9\x1f\x1f\x47\xe5\xa2\x6d\x2e\x32\x02\x03\
+\x46\x4e\x82\x2f\x7b\x0d\xe1\x8c\x85\x18\xf6\xf3\x49\x5b\x25\xf3\
+\xc7\x19\x00\x04\x02\xba\x41\xcb\x0e\xbc\xe4\x81\xf4\xff\x55\xb7\
+\x3c\x66\x0f\x5e\xa2\xf3\x55\x1f\xde\xf9\xb8\x3d\x59\xf8\xa2\x62\
+\x1f\x33\xf7\xb1\x0c\x74\xe0\x48\xde\xb1\x6c\x8d\x27\x20\x30\x53\
+\x64\xdb\xb3\x61\xc2\x14\xc1\x08\x50\x79\x60\x0e\x5f\xd3\x6d\x40\
+\xc0\x01\xc0\x42\x18\x36\x6e\x0a\x74\xed\x37\x0c\xba\x0d\x18\x09\
+\xdd\x07\x70\x10\xd0\x83\x81\x80\x9e\x83\x91\xea\xe7\x74\x7f\xaf\
+\xc1\x18\xfc\x39\x38\xe8\xc1\x80\x02\xb6\x08\x52\xe0\x9f\xca\x01\
+\xc0\xf8\xa9\x3c\xb3\xc7\x47\xcc\xf2\x79\xe0\x9f\x49\x8f\x63\x8a\
+\xc5\x39\x62\xc7\xda\xbd\xff\x68\x38\xf3\x82\xcb\xb8\x37\x43\xbe\
+\x1d\xec\x65\xe0\x0f\xfb\x96\x17\x75\xa8\xe8\xfa\xad\xb3\x0d\x3a\
+\x56\x81\x81\x3f\x1d\xa7\xd6\x13\x61\x2a\x74\xe2\x34\x53\xde\xa5\
+\x1b\xa3\x5c\x5e\x2b\x9d\xeb\x87\x73\x28\x42\x9a\x11\xd4\x07\x20\
+\x93\x59\x7f\xa2\xe9\x46\x7a\x82\x6c\x38\xd9\xcd\x9c\xc8\x1a\xd5\
+\x3d\x51\xcd\x80\x60\xa3\x22\xbd\x68\x21\xb3\x82\x6e\x6c\x23\x45\
+\xb5\x6b\xa2\xe0\xaf\x27\xf9\x3e\x55\x94\x5a\x16\x15\xaf\x11\x10\
+\x54\xe8\x29\x81\x2e\x67\x99\x21\xa6\x78\xaf\xf3\xc1\x3f\xa1\x48\
+\x21\xcb\x94\x9b\xc0\x7f\x1f\x7f\x1d\xea\x9a\xd7\xc2\x29\x7f\x97\
+\xfd\xdb\x12\x04\xb0\xec\xbf\x3a\x07\x00\x18\xc8\x78\x60\x8e\x59\
+\x53\xdf\x6c\x00\xc0\x1d\xe0\xc2\xe2\xd1\xf2\xf1\xd7\x0a\x85\x1f\
+\xbc\x70\x89\x53\x17\xde\x7b\x02\x64\x50\xf0\xc7\xa0\x89\x00\x40\
+\xfe\x2c\xbf\xc8\x12\x93\x12\x5b\x21\x68\xfe\xaa\xa7\x9a\x50\x3b\
+\x76\x1d\xdc\x7c\x57\x63\x78\xfd\x9d\x96\xe4\x72\x58\x3c\x6b\x11\
+\xcc\x98\xb7\x58\x4c\xa7\x5b\x40\xd9\x32\x0a\xd9\x26\x89\x8c\x7f\
+\x82\xa0\xb6\x27\x10\xed\xce\x83\x1c\x66\xfe\xa3\x26\x4e\xa7\x9a\
+\xf8\x88\xf1\xb8\xa6\x30\x00\x30\x95\x26\xe7\x0d\x26\x00\x30\x91\
+\x5a\xea\x3e\xef\xd8\xd3\x2a\x59\x10\x08\x90\xe5\x00\x51\xd2\xf8\
+\x84\x74\x0c\x3d\x08\x04\x7c\xf4\x45\x37\x38\xe5\xf4\x86\xd6\xfc\
+\x00\x6c\x35\xac\x7e\xf6\x45\x30\x63\xee\x32\x58\xb8\xe4\x1b\x2a\
+\x01\x4c\x98\x36\x9b\x5e\x1b\x01\x80\x7c\xe4\x59\xf6\x4c\x2b\xf8\
+\xe2\x71\x8e\x13\x5f\x8f\x97\x75\x78\x04\x04\xd3\xe7\x90\x1a\x7f\
+\xc8\x98\x49\xd0\xb9\xcf\x50\xe8\xdc\x77\x18\x74\xed\x3f\x82\x96\
+\x0a\x04\xba\x0f\x1a\x45\x00\x00\x03\xbf\xf5\xc8\x7e\x3e\x5e\x64\
+\xfd\x76\xe0\x9f\x4d\xa0\x63\x9c\x00\x1f\xf2\x18\xf8\x71\xcd\x82\
+\x51\x6c\x75\xee\x33\x12\x6a\xb2\xe0\x1f\x12\x5e\x22\x61\x2f\x41\
+\xb1\x96\x48\xdc\x77\xa2\xc4\xbb\xa9\xb4\x31\xeb\x19\xcb\xf8\x4f\
+\x7c\x20\xcb\x64\xf6\x9e\x8e\x5e\x23\xd5\x29\x9d\x65\x35\x85\xcb\
+\xbc\x07\x40\x40\x1f\x00\xd5\x6c\xc7\xcc\x10\xb5\xad\xfb\xf4\xcc\
+\x3b\x47\x66\xaa\xf5\x91\x44\xbd\xf8\xea\xf3\xc7\xd7\x76\xbc\xfa\
+\xf3\x75\x8f\x5a\xb6\x11\x37\x8d\xce\xae\xfd\xc7\xcf\xac\xf7\xaf\
+\x6b\xa5\x73\x33\x1a\xbe\xe7\xc4\x69\xe0\x61\x78\xd4\xd5\xdd\x06\
+\x1f\xaa\xcd\xaf\xe9\x3a\xdf\x46\xda\x37\x5f\x9c\xd2\x3e\x90\xe9\
+\x48\xa6\x85\x88\x86\xcf\xbc\x83\x78\x00\x90\x43\xa2\x2d\xdb\xb5\
+\xed\xe4\x1a\x06\xb4\xe9\xd8\x17\x0e\xfe\x79\x14\xb6\xfc\xf2\x1b\
+\x4c\x62\xc1\xe1\xd3\x56\x5d\xe0\xa1\x27\x5e\x83\x06\x97\xde\x06\
+\xa7\x9d\x7b\x31\x9c\x54\xdd\x80\x2a\x52\x41\x4c\xed\x78\xc2\x4e\
+\xb8\x1a\x0b\xfe\xe8\x23\x90\x27\x40\x80\x7c\x8c\x60\x76\x5f\xc0\
+\xbf\x8f\x70\x40\x10\x8e\x14\x92\xd5\x70\x76\x3e\xbb\x77\xd8\xf3\
+\xe5\xd4\x88\x11\xb8\x20\x13\x99\x1a\x45\x94\x2d\xe3\x23\x19\xcb\
+\xb0\xdf\xa9\xc2\xfe\xbd\x06\x7b\xed\xd8\x3f\x6f\x81\x3b\x1f\x78\
+\x0e\x9a\x34\x6d\x0d\x7d\x06\x8c\x81\x59\xf3\xbe\x82\x65\xdf\xac\
+\x83\x25\x5f\xad\xa4\x21\x39\x68\x53\x8c\x5e\xfa\x58\x0f\x47\x71\
+\x1c\x0d\xa9\x99\x85\xe2\x36\x29\x6a\xe3\xd4\x3a\x05\x51\x11\xec\
+\x78\x90\x9b\xc1\x00\xc0\x34\x18\x35\x61\x2a\x03\x01\x53\x09\x04\
+\x0c\x1f\x37\x85\xca\x00\x38\x38\x07\xd5\xf2\xe8\x9e\xd7\x6d\xc0\
+\x08\x5e\x0a\x68\xd7\xcd\x1a\xfa\x83\x5f\x37\x57\x34\x02\x08\x0a\
+\x5a\xb6\xeb\x01\x57\xdf\xfc\x18\x7b\xdf\xd2\xb7\x80\x9f\xf3\x47\
+\x9f\x69\x02\x0b\x96\x7e\x0b\xf3\x17\x7d\x43\x2d\x7d\xc8\x3a\x8c\
+\x9e\xc4\x82\x3f\x5b\xf4\x38\x19\xbf\x9f\x2e\x00\xc1\x0c\x0b\x04\
+\x8c\x57\x41\x80\x00\x02\x48\xdd\x0f\x64\xc7\xd5\xb1\xcf\x20\x0a\
+\xfe\x5d\xfa\xb1\xd5\x7f\x38\x07\x01\x03\x04\x10\x60\xab\x3b\x82\
+\x00\x01\x08\x70\x2c\x2f\x3e\x0e\x64\x60\x66\x02\x3b\x1f\x14\xfc\
+\x8b\xe7\x88\xa0\xaf\x06\x7e\xf6\xfa\xc5\xfc\x18\xf0\xb8\x46\xb3\
+\xe0\xdf\xba\xcb\x40\xa8\xf1\x8f\x8b\xf8\x30\xa6\x88\x92\xf5\xe7\
+\xab\xda\x1e\x7f\xc1\x5f\x38\x92\xd9\x00\x1b\x64\x1e\x46\xbc\xf7\
+\x83\xbf\x26\x28\x5d\x80\xe2\x2d\xa2\x73\x96\x47\x83\x18\xff\xc4\
+\x1b\xb7\x65\xb2\xa6\xee\x3c\xa6\xa0\x26\x44\x15\xd5\x35\xa5\xc6\
+\x0f\xff\xc1\x4c\x15\xef\x0c\x29\x57\x19\x8d\x80\x92\xfd\xcc\xf0\
+\xa0\xf2\xbd\x3c\xfb\x8d\x24\x03\x23\x8c\x04\x3e\xcb\x46\x82\x3a\
+\xbd\xd3\xf7\x98\xbf\xb6\x2b\xc8\x3a\x5a\x7a\xbc\x40\x4f\x3a\xfe\
+\xd9\x46\x9a\x68\x52\x35\x80\xd1\x3d\xde\xbf\x91\xc0\x64\xc3\xc7\
+\x43\xc0\xd2\x40\x18\x01\xfd\xfa\x93\xb1\x23\x41\xd4\xb2\x7e\x6c\
+\x44\x3a\xfe\x04\x06\x04\x1b\x7e\x63\x8a\xcc\x4d\x88\x91\xb0\xae\
+\x1e\xe1\x65\x00\x69\x08\x55\x85\xfd\xec\xa5\x37\x3e\x86\x83\x7f\
+\x1c\x86\x63\xc7\x8e\xc1\xb1\xd2\x52\x28\x61\x8f\x47\x8e\x1e\x83\
+\x1d\xbb\x76\xc3\x9a\x75\x9b\x61\x12\x0b\x1a\x9d\xba\x0e\x80\x37\
+\xde\xfd\x0c\xee\x7f\xf4\x55\xb8\xea\x86\xfb\x21\x5a\xff\x7a\x38\
+\xab\xd6\xc5\x90\x7f\xa6\x09\xa7\x9c\x5a\x08\x39\x11\x2c\x03\xd4\
+\x86\xac\x6a\x17\x40\x56\x6e\x2d\xf6\x58\x0b\x2a\xb3\xc7\x10\xfa\
+\xfc\x6b\x75\xd8\xf9\xa9\xcb\x02\x7e\x21\x54\x3b\xdd\x64\xc1\xfd\
+\x42\x38\xb7\xe0\x5f\x60\x5c\x74\x33\x5c\x79\xe3\x83\x70\xcf\x43\
+\x2f\xc1\xf3\xaf\x37\x83\x16\xad\xba\x42\xdf\xc1\x63\x61\xe6\xdc\
+\xa5\xf0\xcd\x9a\x8d\xb0\x76\xd3\x0f\xb0\xfa\xbb\x4d\xb0\x7a\xcd\
+\x7a\x58\xb1\x72\x1d\x7c\xbd\x62\x2d\x8d\xbd\x45\xeb\x5b\xa4\xd5\
+\xd1\x1b\x9f\xac\x89\x05\x00\x20\xcb\xda\x59\x5c\x40\x87\x19\x33\
+\x17\xb6\xcd\x11\xd9\x2e\x0f\xfe\xa3\x31\xd8\xb2\xa0\x3b\x1a\x01\
+\x00\xcb\xfc\x47\xb2\x45\xc1\x7f\xec\x64\x18\x36\x66\x32\x01\x80\
+\x81\xa3\xb8\x97\x7e\xbf\x11\x13\x39\x00\x10\x0c\x80\x5c\xa8\x0d\
+\x68\xd1\x86\x0f\xfe\x69\xce\x1e\x5f\x7d\xff\x73\x06\x5e\x74\x76\
+\x5e\x8b\x04\x8b\x51\x1f\xb4\xd3\xeb\xb3\xe0\x3d\x17\xe6\x31\xa0\
+\x32\x67\xe1\x32\xa2\xfb\x47\x93\x10\x71\x3a\xb1\x0f\x7c\x4d\xe3\
+\xc7\xa2\x80\x80\xd1\x93\xa7\xc3\x38\xa5\x44\x80\x0b\xfd\xfd\xfb\
+\x0e\x1b\x07\xed\x7b\x0e\x84\x2f\x7b\x0f\x61\x20\x60\x08\x74\x12\
+\x2c\x40\x97\xbe\xc3\xa9\x63\xa3\x4b\xbf\xe1\xb4\x2c\x56\x00\x1f\
+\xe9\xfb\xe1\x04\x34\x38\x10\x12\x81\xbf\x58\xd6\xf9\x67\xf2\x92\
+\x44\x31\x07\x26\x38\x29\x10\xc5\x92\xe8\x8d\x90\x7b\x7a\x91\xbd\
+\x0f\x44\xa2\x0a\xed\x6f\x38\x1c\x18\xc3\xbe\x8a\x7f\xa3\x42\x58\
+\xc0\x70\xa2\x20\x1d\x29\xef\x4c\xd4\xeb\xb8\x8a\xfe\x42\x0c\x80\
+\xb7\xd5\x6f\xb2\x01\x49\xe9\x25\x6d\xc1\x06\xb2\xf9\x7b\x35\x98\
+\x50\x96\x92\x4b\xa6\x04\x80\x58\x0a\xa8\x94\x89\x1a\x70\x6a\x35\
+\x6d\x3d\x01\x00\x70\x07\xf1\x54\x7a\xcb\xd5\x51\xba\x3e\xc7\x1a\
+\x67\xa4\xc2\xdb\xf8\xc2\x71\x0a\x7e\xc3\xf3\x77\x33\x5e\xc7\xd3\
+\xfc\x4c\x2b\x74\x5f\x43\x91\xc4\x62\x17\xbf\x1b\x48\x87\xf4\x66\
+\x88\x97\xc5\x27\x3c\xf5\x8c\x28\x5c\xe6\x63\x52\x40\xa6\x50\x6b\
+\x87\x2c\x66\x28\xc6\x6b\xfb\x2c\x63\xbd\xed\x9e\xa7\x60\xc7\xce\
+\x3d\x14\xfc\x4b\x4a\x8e\x32\x00\x70\x04\x0e\x1f\x3e\x0c\x7f\xfc\
+\xf9\x27\x1c\xfa\xe3\x0f\x38\x70\xe8\x00\xec\x3f\xb0\x9f\x26\xf9\
+\xed\xdb\x77\x10\xf6\xee\x3b\x04\xbf\xef\xdc\x0b\x3f\xff\xba\x1d\
+\x36\x6e\xfe\x09\x56\xae\xdd\xcc\x82\xf3\x1a\xca\x76\x67\xce\x5b\
+\xc6\x82\xf1\x12\xb6\x16\x93\xf1\xcc\xec\x85\x5f\xc3\xa2\x65\x2b\
+\x61\xf9\x8a\xf5\xb0\xe6\xbb\x2d\xec\xf7\x7f\x81\x1f\x7e\xde\x0e\
+\x3f\xfd\xfa\x3b\xfc\xc8\x1e\xbf\xff\x69\x2b\x6c\xfe\xf1\x17\xd8\
+\xb8\xe5\x27\xd8\xf0\xfd\x0f\xb0\x7e\xf3\x0f\xb0\x76\xc3\x66\x58\
+\xb3\x7e\x13\xac\x5a\xb7\x01\x56\xad\x5d\x0f\xdf\xae\x5a\x47\xf3\
+\xee\x97\x7e\xbd\x9a\xc6\x14\x2f\x14\x93\xf0\x70\x1a\x21\x0d\xb2\
+\x99\xb7\x08\xa6\xb3\x2c\x1b\xed\x75\x8b\x85\xd2\x1d\xb3\xe6\x89\
+\x53\x45\xc6\x4b\xc1\x4e\x64\xb8\x02\x00\x60\x09\x60\xe4\x38\x0e\
+\x00\x86\x53\x09\x40\x8c\xcd\xc5\x21\x3a\xc2\x47\x1f\x45\x7e\xcd\
+\x5d\x20\xa0\x39\x05\xff\xee\x54\x1e\xf8\xb8\x55\x37\x38\x2f\x7a\
+\x35\x64\x51\x59\x44\x38\x0e\x62\xf6\xff\xec\x3b\x14\xf8\xd1\xcf\
+\x1f\x1d\xf5\x46\x4f\x40\xc6\x81\x97\x1d\x46\x4e\x9c\xca\x1f\x89\
+\x81\x98\xce\x41\xc1\x24\xbe\x08\x0c\x4c\xe2\x20\x65\xac\x00\x05\
+\x48\xed\xb7\xed\x86\xa6\x4b\x03\xa1\x3d\x9a\x33\x21\x08\xe8\x25\
+\x40\x80\x58\x5d\xe4\xb2\xc0\xc0\x30\xfa\x1a\x8d\x80\x26\xca\xb6\
+\x3e\x49\xf9\x17\xf3\xa0\x4f\x0c\xc4\x44\x2c\x87\xf0\x35\x7c\xc2\
+\x0c\xf8\x6f\xe3\xb7\xd8\x7b\xe0\x03\xa3\xc2\x02\x00\x90\xbb\x5f\
+\x3e\xfb\x1e\x19\x9c\xfc\x78\x0b\x66\xab\x23\xa3\xcc\x93\x3f\x33\
+\x35\xed\x2f\xb5\x00\x16\xb2\x44\xb4\xc1\x7b\xf5\x83\xa9\xe5\x0d\
+\x38\x51\xa3\x8e\xd3\xdf\xbb\xca\x32\x0c\xcd\xf4\x2f\x39\x57\xe8\
+\xd8\xe7\x74\xd9\xe6\x8c\x38\x01\x26\x78\x71\xcd\x4f\xe0\xa5\x27\
+\x28\x05\xe8\x69\xd8\xe1\x3a\xb3\xe8\x70\xe0\x91\xc1\x86\x87\x4e\
+\xc0\xef\x38\x4f\x64\x5d\x2f\x59\x5f\xb1\x87\xdf\x35\xfe\x4c\x53\
+\x01\x46\xcc\xe7\xdc\x18\xe5\x70\xd3\x19\x3e\x2d\x8d\xde\x7a\x8f\
+\x90\x3a\x5d\xb1\x4c\xa2\x24\x5d\x30\x3d\x86\x8b\x69\x12\x99\x00\
+\xd5\xe0\x1b\xd1\x42\xc5\x7f\xd1\x25\xb7\xb1\x60\xbb\x91\x01\x80\
+\x12\x38\x72\x84\x01\x00\xb6\xfe\x60\xc1\xff\xe0\xa1\x43\x70\xe0\
+\x00\x03\x00\xfb\xf7\xc3\x7e\xe9\xe9\xbf\x17\x47\xfb\xee\xe1\x6b\
+\x37\x8e\x00\xde\x03\x3b\x76\xed\xa2\x11\xc0\xbf\xef\xd8\x0d\xdb\
+\xd8\xe3\xd6\xed\x3b\xe0\xb7\xad\x6c\x6d\xfb\x9d\x3f\x6e\xdd\x0e\
+\xbf\xfe\xb6\x1d\x7e\xf9\x75\x2b\xfc\xf4\xf3\xaf\xf0\xe3\x4f\xbf\
+\xc0\xf7\x3f\xfc\x04\x9b\x7e\xf8\x99\x07\xff\xcd\x3f\xc2\x77\x9b\
+\xb6\xc0\xba\x8d\xdf\x53\xf0\x5f\xbd\x6e\x23\xac\x5c\xb3\x01\x56\
+\xae\x5e\x0f\xdf\x20\x03\xf0\xed\x6a\x9a\x78\xb7\xe4\xab\x15\xb0\
+\x18\xc7\x14\x8b\xd6\x3a\x64\x01\xa4\xa7\x3d\xb6\xcc\x91\x73\xdd\
+\x74\xa1\x76\x17\x00\x60\xac\xcc\xfc\x27\x89\xec\x1b\x03\xf0\x78\
+\xbe\x86\x11\x00\x98\xcc\x4b\x00\x63\x26\x51\x37\x00\x81\x80\xd1\
+\x93\x68\x06\x80\x9a\xfd\xdb\x00\xa0\x1b\x01\x80\x6b\x6e\x7b\x5c\
+\xb4\x25\x16\x10\x53\x95\xc5\xee\xb5\xb3\xea\x5c\x09\x13\xa7\x2f\
+\xa0\x41\x49\xa8\x4d\x18\x39\x61\x0a\x09\x0d\xf9\x9a\x06\x23\x26\
+\xf0\xaf\x47\xca\x45\x60\x60\x3a\x2d\x2a\x4d\x88\x63\x1c\xce\x7e\
+\xde\xb1\xf7\x20\x68\xd5\xa5\x2f\x03\x00\x03\xa0\x5d\xf7\x81\xd0\
+\xb6\xe7\x20\xf8\x92\x4c\x99\x06\x33\x10\x30\x98\x83\x01\xb6\x10\
+\x04\x74\x12\x8f\x72\xa1\x50\x70\x4c\xf1\x2c\x2a\x7f\x8c\x17\x99\
+\x3f\xcf\xfe\xe5\xf9\x98\x29\xc0\xd0\x74\xe8\x3b\x74\x22\x5c\x74\
+\xd5\xbd\x24\xdc\xe4\x5a\x0d\x9e\x1c\xd0\xa0\x28\xd5\xe7\x3f\x12\
+\xd4\xe0\x47\x3f\xf1\x41\x4d\x8e\x7c\x3e\x61\x41\xa7\x22\x45\x90\
+\x86\x8f\x5e\x4b\x4f\x61\xcf\xc8\x44\x4d\xde\x48\x93\x69\x29\x6f\
+\xbd\x48\x72\x21\x79\x8a\x25\x80\xd4\x83\x00\x7e\x98\x42\x11\xaf\
+\x92\x80\xee\x51\x8f\x0f\xe2\xdc\x97\x4c\xd9\x68\x2b\xa7\x13\x67\
+\x87\x7e\xcc\x83\xd7\x58\xd5\x72\xa8\xeb\x69\xa9\xde\xdc\x86\x07\
+\x38\xf2\x9a\x6d\xed\x76\xc2\x73\x06\xd4\x70\x06\xc1\x4c\xe2\x12\
+\x80\x8f\x2f\x7a\x12\xaa\x34\x94\x02\x00\x48\x94\x09\xd9\xad\x98\
+\x51\xab\x2f\x59\x8a\x02\xa9\x5f\x9d\x01\x80\xec\xea\x0d\xa1\x0a\
+\x5b\xa7\xfe\xe3\x12\xa2\xe1\x0f\x1f\x29\x81\x3f\x0f\x1f\x86\x43\
+\x18\xfc\x0f\x1e\x62\xc1\x9f\x03\x80\x7d\xfb\xf6\xc1\xbe\xfd\xfb\
+\xc4\x50\x1f\xb6\x04\x08\xc0\x91\xbf\x3b\x11\x00\xec\xdc\xcd\x00\
+\xc0\x2e\xd8\xbe\x63\x27\x6c\x67\x00\x60\xdb\xb6\x1d\xb0\x95\x01\
+\x80\xad\x5b\x19\x08\xf8\x6d\x1b\x05\xff\x9f\x7f\xe1\xc1\x7f\x0b\
+\xcb\xfa\x37\x6f\xc1\xe0\xff\x23\xcb\xfc\x7f\x64\x99\xbf\x12\xfc\
+\xbf\xdb\xc8\xb2\x7f\x06\x00\xd6\x6e\x80\x15\xab\xbf\x23\x00\xf0\
+\xd5\x37\xab\x61\x19\x03\x00\xc8\x00\x2c\xc2\xb6\xba\x25\x1c\x00\
+\xcc\x5d\xb0\xd4\x1a\x52\xc4\xc5\x80\xf3\x61\x8a\x68\x79\x9b\x28\
+\xe9\x7f\x01\x00\x28\xc0\x4e\xe4\x41\x78\x24\x05\x64\x64\x00\x8a\
+\x09\x00\x0c\x63\x00\x00\x41\xc0\x50\x06\x00\x70\x0d\x61\x5f\x7f\
+\xa6\x0c\xf9\xe1\xc1\x9f\xb3\x01\x18\xfc\x1f\x79\xb6\x09\x0b\x98\
+\x75\xa9\x0d\x11\x27\xff\x65\x57\xe3\xc2\xc7\x4f\xdb\xf4\x10\x93\
+\xf4\x16\x52\x70\x1d\x31\xbe\x98\x5e\xc7\x06\x01\x53\xd9\x6b\x4e\
+\x25\xe6\x41\xfd\x39\x67\x04\x90\x21\x98\xc6\xc0\xc7\x64\x68\xd3\
+\xb5\x3f\x79\x24\xb4\xea\xd2\x8f\xbe\x6e\xc3\x40\x40\x5b\x06\x02\
+\xda\x59\x73\x1a\x18\x18\xe8\xc5\x81\x40\x27\x62\x05\x9c\xa0\x60\
+\xc8\xa8\xc9\x5c\x54\x28\x19\x10\x5a\xa8\x2b\x10\xa5\x05\x64\x00\
+\x26\xcf\x82\xe6\xad\xba\x43\xcd\x0b\x2e\xa5\xee\x10\x62\xf9\x30\
+\xdb\x57\xa7\xfb\x45\x74\xdb\x4c\x47\x0b\x12\xfc\xcb\x13\x00\x64\
+\xc0\x92\x37\xd1\xd2\xca\x62\xc5\x6b\x54\x50\x9b\x5f\xaa\xfb\x4c\
+\x79\x33\x00\xc6\x09\xc8\xda\xcb\x4b\x07\x10\x83\x4a\xa1\x32\x9f\
+\xfc\x64\x73\xe8\x63\x69\x00\x00\x3d\x89\xa6\xc0\xe3\x64\x6a\x31\
+\x6b\xec\x69\xb6\x66\x88\x60\xe2\x91\xd1\x47\x74\x48\x3c\xbc\xa7\
+\xa2\xa9\x1c\x77\x0b\xa1\x9c\x68\xe8\x71\x6c\x9e\xc3\x33\x4c\xc5\
+\x21\x4f\x31\x4f\x52\x40\x40\x58\x75\x2d\x74\x04\xcb\xf2\x2e\x01\
+\xc4\x02\x05\xff\xcc\xb5\x25\xc5\x83\x25\x59\x87\x23\xfb\x60\x6a\
+\xf7\x6b\xc8\xcd\x6b\xaa\xa3\x8a\xbd\x11\x89\xf0\x9e\x7e\xb1\x29\
+\x0b\xe6\xfb\xe0\xe0\x01\x16\xfc\x0f\xb2\xa0\x7f\x60\x3f\x5f\x08\
+\x00\x70\x80\xcf\x7e\x1c\xeb\xbb\x87\x00\x00\x81\x80\xdd\x7b\x19\
+\x08\xd8\x4d\x20\x60\xe7\x4e\x64\x02\x76\x72\x10\xf0\xfb\x4e\x06\
+\x02\x7e\x17\xd9\xff\x36\x16\xfc\x7f\x63\xd9\xff\x2f\xf0\x03\x02\
+\x00\x96\xfd\x6f\x66\x81\x1f\x33\xff\xf5\x9b\x7e\x80\xef\x36\xfe\
+\x00\xeb\x36\x7c\xcf\xe9\xff\xef\x38\xfd\xbf\x72\xed\x7a\x02\x00\
+\xcb\x57\xae\x85\xaf\xbe\x5d\x23\x18\x00\x1c\xaa\xb3\x9c\x94\xf5\
+\xf3\x05\x00\xc0\x99\xf6\x33\xc5\x70\x1b\xcb\xde\xd6\x6a\xff\x53\
+\x01\x80\x50\xff\xb3\xac\x7c\x38\x05\xdf\x62\x5a\x08\x02\x10\x00\
+\x0c\x19\x5b\x4c\xa5\x00\xfc\x1a\x75\x00\x9f\xb9\x26\xfd\x91\x37\
+\x40\x9b\x2e\xf0\x72\x93\xcf\xe0\x94\x53\x63\x50\x19\xdb\x29\xab\
+\xd5\xe5\xab\x6a\x3d\xb8\xe9\xae\xc6\xe4\xb4\x87\x36\xbb\x18\x60\
+\x47\x8c\x63\xaf\x35\x56\x06\x7c\xbe\x08\x74\x8c\xe7\x00\xc0\x5a\
+\x78\x1c\xec\x98\x10\x04\x60\xef\x3e\x37\x57\xe2\x46\x4b\xad\x3a\
+\xf7\x25\xdb\xe2\xd6\x08\x02\xd8\xe2\x6c\xc0\x00\x5e\x12\x60\x20\
+\x00\x81\x40\x87\x5e\x9c\x19\xe8\x20\x16\xb6\xfe\x8d\x63\xc1\x7d\
+\x1c\x3b\x06\x7c\xc4\x63\x19\x37\x89\x05\x7f\xac\xfd\x4f\xe1\x02\
+\xc3\xa1\x63\xa7\xc1\xed\x0f\xbc\x08\x55\xe4\xa4\x45\x99\xe1\xcb\
+\x89\x7e\x6a\x8d\x3f\xa2\xfb\x0b\xff\x22\x51\x6f\x06\xf1\x04\xd3\
+\xbb\x21\x5a\x66\x39\x00\x00\xc3\xd7\x61\x2f\x91\x43\x6a\xc5\x2f\
+\xb3\x82\x01\x48\x59\x4b\x08\x99\xec\x72\x08\xd8\x06\xae\x5c\x47\
+\x0b\x00\x64\x29\x81\xa0\x62\xfc\x9b\x55\xc1\x5b\xa2\xbe\x5a\xdd\
+\xe3\xcd\x99\x3e\x0e\x54\x4a\x4b\xa1\xa6\x0b\x8f\x79\xc3\xe7\x39\
+\x52\x61\x1b\xca\x0b\xdd\xfb\x51\xfc\x86\x98\x0f\x6f\x80\xff\x50\
+\xa3\xc4\xa3\x8a\x73\x52\x50\xbb\x86\x22\x65\xa5\xc0\x82\x50\x69\
+\xae\xcd\x52\xab\xc8\xcc\xc0\xe9\x14\x18\x16\xa2\x35\x6e\xfe\x23\
+\x1d\xec\xea\xd3\xc6\x5f\x74\xf1\xad\x2c\xd3\x5e\xc1\x07\xf6\xec\
+\xe7\x41\x7f\xdf\x5e\x01\x00\xd4\xb1\xbe\xbb\x77\xc1\xae\x3d\x02\
+\x00\xec\xe4\x0b\x4b\x01\x14\xfc\xb7\x73\x06\xc0\x09\x00\x7e\x85\
+\x1f\x7e\xfc\xd9\x1b\x00\xac\x57\x19\x00\x06\x00\x50\x00\xb8\xea\
+\x3b\x1a\x2b\x8c\x25\x80\x65\xdf\xac\x52\x4a\x00\xcb\x69\xca\xe0\
+\x9c\x45\x4b\x85\x0e\x60\x09\xcc\x98\xb3\x98\x18\x00\x2a\x03\xcc\
+\x98\x47\x9d\x00\x13\x54\x0d\x80\xa8\xfd\x23\x03\x30\x7c\xbc\x0c\
+\xc0\x82\x01\x40\x2f\x00\x09\x00\xd8\x63\xb7\xfe\xc3\xc5\x08\x60\
+\x7b\x40\x10\xf6\xff\xbf\xf1\x41\x2b\xa8\x7e\x4e\x23\xe1\x4a\x88\
+\x00\xa0\x0e\x54\xae\x5a\x17\xce\xa9\x73\x19\x8c\x9a\x30\x8b\x0c\
+\x77\xc6\xb0\x60\x8b\x0c\x02\xb6\x17\x0e\x1f\x3b\xc5\x19\xec\x19\
+\x08\x18\x36\x6e\xaa\xf5\xf5\x88\x71\x1c\x80\x0c\x19\x3b\x89\x32\
+\xf8\xcf\x3b\xf6\x12\x81\x5f\x5d\x0a\x13\x20\x16\x96\x04\x70\xb5\
+\x27\x46\x60\x10\x07\x04\x6c\x21\x1b\x80\xcc\x03\xd7\x12\xb0\xe0\
+\x3f\x69\x26\xa9\xfc\xf1\x1c\x4c\x28\x46\x97\xbf\x39\xd0\xa2\x4d\
+\x4f\x38\xb7\xf0\x6a\x17\x53\x66\xc4\x99\xf9\x04\xa3\xfc\xcb\x43\
+\x17\x64\xa4\xc9\x78\xc5\x02\x94\x60\x53\xf3\xe7\xaf\x58\xdb\xde\
+\xff\xdd\x0c\xda\x5d\x7a\x4c\x2c\x3a\x2c\x2b\x5b\x1c\xd4\x62\x3e\
+\x48\xd9\xda\x70\x96\x00\xb2\xca\x94\x09\x96\x65\xd8\x4d\xa2\x96\
+\x40\xa5\x0d\x2e\x25\x87\x24\xbf\x8c\x3e\x19\xdb\x60\x54\x60\x5d\
+\xcb\xaf\x25\xd2\xdd\xc1\x60\x04\xa3\x19\x85\x10\xd0\x7f\x82\x9e\
+\xff\xcd\x15\xd6\xca\xc2\x58\xa4\x59\x47\xd3\x2a\xf6\x43\xea\xf4\
+\x06\x88\x91\x4d\x30\x07\x03\xc2\x04\x48\x96\x8f\x72\x0b\xe1\x94\
+\xea\x05\xf0\x41\xf3\xf6\x2c\x9b\xdf\xc3\x32\xfe\x7d\xa2\xfe\x2f\
+\x02\xbf\x45\xff\xef\xa6\x12\xc0\xae\x5d\xc8\x00\xec\xa1\x32\x80\
+\x17\x00\x20\xfa\x5f\xd4\xfe\x7f\xf8\xe1\x67\xaa\xff\x6f\xde\xcc\
+\x45\x7f\x1b\x18\x00\x58\xb7\x71\x0b\x03\x00\x9b\x6d\x00\x80\xf4\
+\xff\x1a\x14\x00\x32\x00\xf0\xed\x5a\x58\x8e\x25\x80\x6f\x56\x52\
+\x1b\xe0\xa2\xa5\xdf\x52\x7f\xfd\x5c\x54\xd9\x2f\xe0\x00\x00\x47\
+\xe7\xce\x98\xb3\x80\x84\x80\x53\x14\x00\x30\x11\x5b\xe9\x94\xf6\
+\xbf\x91\xa2\xfe\x8f\x01\x18\xeb\xff\xc3\x28\xf8\x73\x00\x30\x94\
+\x82\x36\x0f\xdc\xad\x69\x56\x40\x2f\xf8\xbc\x03\x0b\xc8\xec\xf1\
+\xb3\xf6\x3d\xe1\xb5\x77\xbf\x20\x0b\x65\x0c\xfe\x3c\xfb\x47\x43\
+\xa5\xba\x90\x7b\xaa\x0e\x5d\x7b\x0f\x27\xef\x81\xb1\x2c\xe8\xa2\
+\x86\x00\x3b\x0a\x86\x8e\xc1\x0e\x83\x29\xf4\xdc\xb8\x46\x20\xed\
+\x3f\x96\x07\xfc\x11\xb4\xa6\xd1\xea\x33\x78\x8c\x18\x9f\xcc\x56\
+\xc7\x3e\x16\x00\xf8\xa2\x53\x1f\x07\x18\xc0\x63\x6a\xad\x00\x01\
+\x62\x03\x04\x23\xd0\xae\x1b\x07\x02\xc3\xd9\x7b\x93\x2d\x87\x08\
+\x04\xc6\x4e\xc2\xae\x02\xae\xfc\xc7\x51\xbe\xd7\xdd\xfa\x04\x9c\
+\x54\x83\x03\x40\xb2\xf4\x75\x80\x00\x67\x12\x12\xf6\xed\x54\x2a\
+\x6f\x00\x70\xa2\xb4\x46\x15\x33\x0a\xfe\xff\xbe\x65\x04\xe8\x78\
+\xaa\xe8\x6b\x60\xa4\xbe\x0f\x4b\x06\x20\xbb\xc2\x01\x80\xa4\xd2\
+\xa2\x1e\x63\x4e\xa5\x8f\xbb\x47\x06\x99\xa0\xa5\x22\x6c\xfd\x6e\
+\x54\xd4\x81\xcd\x24\x1a\x00\xaf\xe0\x6b\x06\x98\x5b\xe0\xad\x5c\
+\x0f\x12\x74\xbd\x00\x40\x58\xb9\xb8\x21\x5f\x5b\x4f\x3d\xa9\x2a\
+\xd8\xca\x74\xa5\x08\xd0\x6f\x70\x50\x05\x04\xe0\xc4\xe7\x22\x13\
+\x2a\xdc\x54\x87\x81\x88\x4e\x00\x4d\xe7\x00\x40\x0e\x75\x91\x2d\
+\x83\xc2\x81\x8f\x02\xdc\x29\xb5\xa1\xe8\xa2\x9b\x48\xd5\xbf\x67\
+\xef\x01\x16\xf4\xf7\x0a\x00\xc0\x02\xff\x9e\x5d\x16\x00\xd8\x4d\
+\x3a\x80\x3d\xb6\x0e\xc0\x45\xff\xdb\xe2\xbf\x9f\x09\x00\x6c\xc6\
+\xf5\xfd\x0f\xb0\x71\xf3\x8f\x36\x00\xb0\xd4\xff\x1b\x39\xfd\xbf\
+\xe6\x3b\xf8\x76\x35\x67\x00\x96\x7f\xcb\x01\xc0\xd2\xaf\x56\x30\
+\x00\xf0\x0d\x2c\x94\x22\x40\x2a\x01\x2c\x66\x00\x60\x11\xcc\x40\
+\xcf\x7c\xa1\x01\x50\x19\x80\xf1\x82\x01\x90\x2d\x80\x54\x7b\x47\
+\xda\x7f\xdc\x64\xde\x02\xa8\x02\x80\xf1\x53\xc9\x47\x1f\x67\x1d\
+\xb4\xee\x68\x8f\x37\x7e\xfe\x8d\x66\xa0\x9d\x51\x04\x59\x62\x2e\
+\x01\x59\x10\xb3\x55\x25\xaf\x1e\x34\xff\xa2\x2b\xb9\xec\x8d\x66\
+\xc1\x7f\xd0\x48\x14\x11\x72\x6b\xe1\xc1\xa3\x8b\x05\xa8\xb0\x41\
+\xc0\xf0\xb1\x3c\xfb\x1f\x39\x9e\x65\xfd\x0c\x28\xe0\x80\x25\x14\
+\x1b\x72\xb0\xd1\x9b\x5c\x05\x3f\x67\xcb\xc1\x02\x74\x12\x0b\x99\
+\x00\x59\x12\xb0\x80\x00\x96\x07\xfa\x11\x1b\x30\x84\x3d\x3f\x8a\
+\xfb\x30\xf3\xc7\x96\x42\x0a\xfe\xc5\xc8\x46\x4c\x85\xff\x3e\xf9\
+\x16\xe4\xd5\x6c\x24\x86\x15\x15\xf1\xfb\x51\x6d\xe9\xa3\x3e\x7f\
+\xdd\xc7\xe8\x27\x19\x00\xc8\x74\x26\x9a\x21\xa6\x51\x2b\xcf\x2e\
+\x9b\xcc\xee\x0d\xe1\xbf\xc8\xf1\xa4\xce\xb2\xf8\x05\xe3\xcc\x94\
+\x20\xc2\x15\x99\x20\x21\x03\x10\x52\xa8\xa1\x50\xa4\xfc\x11\x53\
+\xc8\xa1\xd4\xf6\x09\xc8\x72\xe2\x99\xac\x53\xd1\xf4\x33\x23\xe9\
+\x9b\x09\xe5\xd9\x53\xd2\x6c\xca\xcb\xd5\x1e\xa6\xf9\x4d\x0a\x0c\
+\x80\xaa\xa4\xd0\x30\x6d\xaa\x2d\x51\x7f\x7c\x22\xc1\x9c\x9f\xda\
+\xd8\xb0\x32\x79\x09\x9a\xc2\x5e\x37\x93\xa0\x7b\xec\x9f\x19\xca\
+\xb9\xc9\x24\xe2\x37\x53\x04\x43\xe5\xb0\x22\xea\x32\x2d\x86\x44\
+\x8a\xba\xf0\x3c\x55\xd1\x44\x47\x04\xdd\x57\x51\x6b\xc0\x4e\x56\
+\x35\x49\x73\xd7\x65\x81\xae\x2e\x3c\xf1\x6c\x13\xd8\xb0\xf1\x27\
+\x16\xf8\xf7\x51\xc0\xdf\x45\x20\x00\x01\xc0\x5e\xd2\x01\x50\x37\
+\xc0\xce\x5d\x1c\x00\xa0\x08\x10\x19\x00\xcc\xfe\x05\xfd\x8f\x0c\
+\x80\x2c\x01\x10\x03\xf0\x3d\xb2\x00\x3f\x71\x00\xb0\x61\x0b\xac\
+\x5d\xbf\xd9\xa6\xff\xd7\x6e\x60\xc1\x7f\x1d\x2c\x5f\xb9\x06\xbe\
+\x59\xb1\x86\x00\xc0\x57\xcb\x57\xc1\x92\x65\xdf\x5a\x5d\x00\xf3\
+\x45\x17\xc0\x6c\x96\xfd\xcf\x9a\xbb\x48\x30\x00\xf3\x05\x03\x30\
+\x9f\xfb\x01\xa0\x0e\x00\x8d\x75\xb0\xbf\x1e\x01\x00\xb6\xe4\x8d\
+\x9f\x4e\x25\x80\x61\x8a\x07\xc0\x70\x14\x00\x8e\xe5\xc1\xba\x3d\
+\xcb\xaa\x5b\x77\x66\x81\xb5\x13\x0b\xb6\x9d\xfa\xc1\xfd\x8f\xbf\
+\x41\xb3\x0a\xf0\xf3\x44\x00\x80\x9d\x13\xa4\xfd\xb3\x23\x75\xe1\
+\xed\x0f\xdb\x10\xad\x8e\xad\x74\x68\x25\x3c\x88\x05\x75\x74\x14\
+\xc4\x2e\x02\x14\xf3\x71\x26\xa0\x98\xa6\x1c\x52\xb9\x01\x69\x7f\
+\x06\x02\x7a\xf4\x1f\x2e\x32\xfe\x9e\x44\xfb\x5b\x8f\x38\x5b\xe0\
+\x4b\x96\xf9\x77\xb4\x19\x00\xfc\xba\x15\x7e\x2f\x80\x01\x8a\x03\
+\xf9\xe2\xc0\xa0\x4d\x97\xfe\x04\x36\x46\xd2\xb0\xa3\x19\x14\xf8\
+\xb1\xcd\x6f\x04\x7b\x9f\xcf\xbf\xde\x1c\xce\xa8\x75\x99\x35\x44\
+\x2c\x5b\x32\x40\x56\xb9\xd0\xbb\xbe\x1f\x16\x00\xd1\x73\x4f\x12\
+\xf7\x09\x8e\x3b\x56\xf7\xa2\xf0\x5f\x28\x33\x0e\x27\x0b\x1e\x5a\
+\x59\xb3\x47\xe3\x84\xb1\x01\xf1\xc1\x39\xe8\x38\x64\x03\xfc\xa6\
+\xe0\x95\x35\x1b\x2f\x8b\x1b\x62\xa8\xdc\x4a\x12\x41\x41\x88\x7d\
+\x1d\x2b\x65\x45\x2a\xa2\xf6\xef\xa6\xd9\x93\x20\x6c\xcd\xf9\xa1\
+\x0c\x8b\x0f\x9d\x9a\xd9\xda\xa2\x3f\x29\x02\xd4\x6d\x6a\xdb\xab\
+\x77\xd5\x32\xf9\x30\x14\x31\x60\xf0\xc1\x0b\xea\x87\xab\x6c\x28\
+\xcd\x7b\xda\x9f\xef\x48\x60\x91\xa9\x86\x3c\x6b\xe9\x7a\x42\x64\
+\xef\x4d\xf3\x07\x15\x94\x04\x74\xba\xf2\x78\xfd\x13\x8d\xee\x9d\
+\xee\x5f\x7c\x14\x31\x3f\x17\x86\x75\x3f\x85\xf3\x0c\x1b\x00\x60\
+\x4b\x1b\x01\x01\xbe\xc9\x73\x40\x50\x40\x40\xe0\xb4\xb3\x1b\x40\
+\xcb\xb6\x3d\x61\xeb\x8e\xdd\xb0\x67\x0f\xb6\x03\xee\x23\x0d\x00\
+\x32\x03\x3b\x19\x08\xb0\x18\x00\x02\x00\xdb\x39\x03\xc0\xb2\xff\
+\x5f\x10\x00\xb0\xf5\x23\x82\x00\xc1\x02\x7c\x2f\x01\x80\x10\x00\
+\xae\x11\x00\x60\xa5\x42\xff\xa3\x00\x70\x39\x01\x80\x35\xf0\xd5\
+\x37\xab\x88\x01\x20\x2f\x80\x25\x08\x02\xbe\x22\x2f\x80\x39\xf3\
+\x04\x03\x30\x97\xbb\x01\x92\x0e\x60\x06\xfa\xe8\xdb\x56\xc0\x12\
+\x00\x50\x27\x00\x02\x00\xac\xc3\x8f\xe5\xaa\xff\x61\xa2\xee\x8f\
+\xc1\xbf\xc7\x80\x91\xd0\xbe\xeb\x00\x68\xcb\xb2\xea\x4f\xd9\xfb\
+\xfc\xe7\xb5\xf7\x93\x65\x71\x28\xdf\xa4\x84\x00\x7b\xde\x11\x18\
+\xe5\xe4\x17\xb0\xe0\xdf\x9a\xac\x73\xb1\xac\x30\x68\x24\x6f\x1d\
+\x44\x10\x20\xdb\x08\x39\x18\x98\x44\xfe\x02\x28\x2c\xc4\xcc\x1f\
+\xe9\xfe\xd6\x2c\xab\xe7\x59\x7f\x4f\x2a\x31\xe0\xd7\x2d\x2d\x20\
+\x20\x40\x40\xa7\xde\x56\xe0\x97\x0c\x00\x02\x03\x1c\x61\x2c\x1f\
+\x5b\xb2\x25\x83\x3f\xf6\xf1\xe3\x1a\xc9\xb2\xff\x11\xe3\x66\xc0\
+\x2b\x4d\x3e\x83\x73\x0a\xfe\xe5\xec\x84\x11\x4c\x0f\x0f\x8e\x7a\
+\x9c\xb1\x8f\xb5\xc7\xc8\x92\x80\xa6\x64\xff\x9a\x7b\x19\xca\xcf\
+\x8d\x34\x54\xf4\xe5\x91\xc1\x89\x89\x98\x65\x6e\xa3\xd5\xd3\xd8\
+\xcb\xff\x02\x19\x6c\x9c\x01\x5c\x11\xfc\xf5\xca\x90\x65\x7f\xed\
+\x50\x24\x28\xa3\x9a\x7a\x52\x5e\xa9\xe2\x6a\x48\xa9\x01\x00\x4b\
+\x95\xab\x7c\x00\xc3\xb2\xdf\xd5\xad\x1b\x10\x2c\x01\x77\x80\x53\
+\x26\xc5\xc5\x01\x00\x1d\x82\x4d\xdb\xf3\x08\x92\xe2\x38\x38\x18\
+\x29\xcb\xc5\x35\x3c\x5a\xea\x12\x4d\x27\x34\x13\x74\x2c\x98\x16\
+\xe0\x49\xdd\x72\xd8\xcb\x39\x2b\x48\xd7\x45\x59\x4b\x00\x15\xc0\
+\x00\x88\x8e\x88\x1c\x5a\xf5\x2d\x5f\x84\x6c\x01\x00\x2c\x80\xa9\
+\xd9\x59\x5f\x48\x66\x78\xb8\xc8\xea\x57\xf4\xbb\xd3\x14\xbe\xba\
+\x10\x6d\x74\x23\xf4\x1d\x38\x86\x0c\x81\x76\xef\xdd\x4f\x60\x60\
+\x97\x02\x00\x1c\x02\x40\x09\x00\x28\xf8\xff\xc2\x45\x80\x5b\x7e\
+\x26\x06\x60\xd3\xa6\x1f\x61\x23\x03\x00\xdf\x6d\xd8\x02\x6b\xbe\
+\x63\x00\x60\xdd\x26\xa5\xfe\xcf\x3d\x00\x10\x00\x7c\xcd\x00\xc0\
+\xb2\xe5\xab\xe0\xab\xaf\x6d\x00\x80\x13\xf6\xe6\x2d\x62\x00\x60\
+\x3e\x37\x03\x22\x06\x60\x36\x02\x00\x1c\xa0\x33\x47\x00\x80\x39\
+\x30\xa1\x78\x36\x57\xc3\x4f\x94\x0c\xc0\x34\x18\x39\x96\x03\x00\
+\x0c\xcc\xc3\x46\x73\xf1\x5f\x9f\x21\xa3\xa1\x5d\xb7\xfe\x6c\x0d\
+\x82\xc6\x2f\x7d\x08\xa7\x9f\x7f\x99\x98\x85\xd0\x80\x6d\x3a\x0d\
+\xd8\xbd\x59\x1f\xb2\xd8\xb9\x41\xa7\xbf\x8f\x5b\x76\xa6\x3e\xfa\
+\x61\xe3\xa7\x50\xd0\x1f\x48\xd9\xff\x64\x2a\x01\x0c\x64\x60\x00\
+\x2d\x78\x07\xb1\x35\x70\xe4\x44\xb2\xf1\x45\x65\x7e\xab\xce\xbd\
+\xe1\xb3\xf6\xdd\xa1\x25\x8e\x11\xc6\x39\x02\xb4\x7a\xd2\x3c\x01\
+\x1a\x8f\x4c\xcb\x06\x02\x08\x02\x5a\x75\xe4\x65\x01\x5a\x5f\xf6\
+\xa1\xdf\x93\xc2\xc4\x8e\x3d\x06\xc3\x10\xf6\x3e\x86\x8c\x9b\x06\
+\x43\xc7\x4d\x87\x7e\x43\x27\xc1\x53\x2f\x7e\x00\x67\xd7\xbe\xd2\
+\x19\xc8\x2d\x17\x3f\xdb\x52\x3c\xc7\x01\xfc\xb9\x50\x38\xec\x98\
+\xe6\x97\xa0\xc7\x5f\xe3\x6d\xcd\xf6\x5e\x14\x4b\xd0\x72\x9c\x6a\
+\x30\x2c\x9b\x9e\x20\x9c\xd1\xc0\x66\x94\x3b\x4b\x51\x51\x60\xc1\
+\x4f\xe3\x74\xa2\xcb\x0e\x8e\x44\x32\x20\xa3\x9a\x18\x00\x94\x8d\
+\xb9\xad\x40\x00\x10\x4b\xe2\x08\xe8\xa2\xe4\xac\xcd\xd9\x50\x68\
+\x7d\x23\x8e\x12\xe7\xa0\x40\xd1\x0d\x28\x66\x38\xfe\x1a\x80\xd4\
+\xb2\x60\x99\x41\x64\x0b\xea\x38\xb5\x1b\x37\xdd\x89\x7e\x31\x6b\
+\xf3\xf1\x3a\x6f\xfc\x18\x4c\xc7\xb1\x84\x12\x7e\xb8\x0c\xa5\xfc\
+\xe1\xf5\x7a\xba\x0b\x4d\xa7\xef\x1c\x18\xce\x78\x0d\x32\xf8\xcd\
+\xad\x6a\x1f\xf8\xb5\x2a\x22\x20\x10\xb6\x32\x36\xf1\x3e\x45\xb0\
+\xb7\xee\x33\x2b\xf8\x47\x39\xdd\x8b\x7d\xe2\x9a\xfc\x5a\x5a\xc3\
+\x46\x21\x76\xf1\xad\xe4\xd5\xff\xfb\x8e\x3d\xc4\x02\x10\x00\xd8\
+\xc9\x01\xc0\x6f\x5b\xe3\x01\xc0\x8f\x02\x00\x6c\xde\xf2\x13\x6c\
+\x64\x00\x60\x23\x03\x00\xc8\x00\xac\x45\x06\xe0\x3b\x6e\x00\x84\
+\x25\x80\x15\xab\x85\x00\x90\x4c\x80\x44\xf6\xff\xb5\x30\x02\x22\
+\x00\xb0\x9c\x18\x80\x79\x0b\x97\xc2\x1c\x14\x01\xa2\x17\x00\xb5\
+\x02\x22\x0b\x80\x63\x74\x25\x00\x98\x4b\x00\x60\x3c\x02\x00\xa4\
+\xc6\x89\x01\xe0\x34\xfc\x50\x32\x00\xe2\xab\xef\xd0\xb1\xd4\x6a\
+\xf7\xc6\xfb\xad\x41\xff\xe7\x9d\x64\x8e\xc4\x27\x21\x36\xe4\x00\
+\x80\x3a\x24\x4c\x96\x55\x5f\x09\x9d\x7a\x0c\x21\x5b\x61\x2c\x21\
+\x60\xf6\x3d\x98\x00\x00\x66\xfc\xc5\x2c\xf0\x4f\x82\x01\x23\x58\
+\xd0\x67\xab\xdf\xb0\xf1\xa4\xec\xff\x04\x67\x08\xb4\xee\x42\xad\
+\x84\x38\x4d\xf0\x53\x06\x02\x3e\x6b\xd7\x83\x2f\x02\x00\x3d\x38\
+\x23\xd0\xc1\x66\x05\xe2\x40\x00\x66\xfe\x1d\x79\xf0\x47\x10\x80\
+\xd3\xff\x86\x8d\x9d\xce\x02\xff\x34\xe8\xd8\x73\x08\xdc\x71\xff\
+\x73\x90\x77\x86\x49\x25\x1b\xbc\x46\xe1\x38\xbf\xfa\x98\xed\x59\
+\x1f\x89\x79\x0e\xf7\x09\xe7\x05\xeb\xf3\x0f\x6b\xb6\x86\x84\x27\
+\x01\x89\x27\x6b\x86\xca\x31\xe0\x27\xba\xef\x73\xb4\x13\x1f\xf8\
+\x13\xef\x8d\x15\x21\x74\xcc\x6c\x7b\x66\x58\xcb\xec\xfe\x54\x7e\
+\x25\x83\xd4\x5f\x3f\x03\x4e\x80\xa9\xf6\x3b\xfa\xab\xf1\x43\xbe\
+\xee\x5a\xaa\x29\x47\x7c\x1d\x8a\x6f\xec\xa6\xd5\x07\xef\x98\x17\
+\x9f\x67\x26\x00\x00\x41\xfa\x5e\x0d\x7b\xa3\x90\xed\x85\x49\x6a\
+\x69\x21\x87\xf6\x20\x51\x76\x9d\xa8\x7f\xdd\x03\xf0\xb8\xde\x7f\
+\xd8\xf2\x3a\x30\x03\xdc\xb8\x86\xad\xad\xf0\xec\xc2\xf0\xf3\x35\
+\x37\xd3\xa2\xb7\xc2\x19\xff\x30\x1b\x65\x60\x23\xec\xce\x8a\xb0\
+\x02\xaa\xc2\x0a\xbd\x1b\x56\x75\x27\x9a\x53\x27\xc2\xa7\xc3\xd9\
+\x65\x25\xde\x46\x18\x03\xbd\xd1\x4d\xd0\xa6\x53\x3f\xd8\xfc\xc3\
+\x56\xf8\x7d\xd7\x1e\x8b\x01\xf8\x55\x8a\x00\x45\x09\x80\x33\x00\
+\xbf\xc0\x26\x34\x01\x12\x1d\x00\xeb\x11\x00\xac\xff\x9e\x7b\xff\
+\x93\x03\x20\xef\xff\xff\x66\x15\x66\xff\xeb\xac\xec\x1f\xd7\x52\
+\xd4\x00\x2c\xfb\x86\x00\x00\x31\x00\x58\x02\x58\x28\x00\xc0\xbc\
+\x85\x04\x00\xa6\xcd\x46\x00\x30\x17\x8a\xa7\xcf\xa3\xb1\xba\x13\
+\xa4\xf9\x8d\x04\x00\xe8\xc6\x37\x8e\xb7\xe8\x0d\xa1\xe0\x3f\x01\
+\x5e\x7e\xa7\x25\x18\x17\xdf\x4e\x03\x89\xb2\x49\x21\x8f\x01\xbf\
+\x91\x05\x00\x72\xaa\x9b\x70\xc5\x0d\xff\x85\x41\xc3\x27\xc2\x98\
+\x09\xd3\xa8\x84\x80\x0a\xff\xa1\xa3\xa6\x90\xe8\x6f\xc0\xe8\x89\
+\x04\x02\x10\x00\xf4\x1e\x3a\x8e\x98\x84\x66\xad\x3b\xc3\x47\x5f\
+\x74\x82\x8f\x5a\x75\x86\x66\xad\xba\xd0\x0c\x01\x1a\x2d\xdc\x96\
+\x8f\x15\xfe\x4c\x02\x01\x04\x00\x1d\x7a\x88\xf1\xc2\x76\xe7\x01\
+\x06\x7d\x2a\x07\x10\x00\xe0\x3f\x23\x93\x1f\xf6\xda\x43\x58\xf0\
+\x7f\xff\xb3\x4e\x70\xf1\x35\xf7\x42\x95\x08\xd7\x69\xa0\x30\x11\
+\xcb\x35\xd2\xf4\xc9\x0e\xfc\x31\x3e\xa4\x48\xb8\x64\x66\x47\x94\
+\x6b\x9f\x42\xe0\xb7\x46\x32\x2b\x49\x89\xdc\x07\xc2\x5a\x7c\xbd\
+\xf5\xc4\x04\x0b\xd3\xe3\x5e\x4f\xf5\xef\x0d\xa8\xb8\x44\xf0\xaf\
+\xde\x62\x58\x16\x00\x60\xa4\x44\xeb\x97\x1d\x00\x94\xf1\x5e\xca\
+\x0c\x00\x30\x52\x44\x64\x5e\xa6\x1a\xee\xfa\xbf\xb4\xe7\x55\xe8\
+\xef\x5c\x3d\x21\x12\x0a\x2b\xc3\x6f\xc2\x71\x2c\x80\xaa\xfe\x8d\
+\xda\x34\x5e\xc2\x93\x6d\x58\xa5\x8a\xb0\xa6\x07\x13\x22\x96\xb9\
+\xa5\xc7\x09\x80\x42\x81\x6c\x91\xfd\x8d\x97\xc2\x5a\xb2\x16\xc8\
+\x64\xc6\x4c\x41\x4c\x98\xbc\x0d\x28\x42\x65\x1e\x9c\xa4\xfb\x18\
+\x1f\xa5\xeb\x5c\x68\x3a\xb4\x22\x92\x59\x09\xbb\x36\x76\x5f\x46\
+\x4a\x75\x5a\xa4\x31\xb8\x3c\x48\x9e\x51\xeb\x52\x68\xfc\x42\x53\
+\x98\x36\x6b\x09\xcb\xfe\x77\xf2\x32\xc0\x6f\x9c\x05\xf8\xf9\x97\
+\xad\xf0\x23\x79\x00\xfc\x02\x9b\xbf\xff\x19\x36\xb1\xe0\xbf\x61\
+\xe3\xf7\xb0\x7e\x83\x68\x01\xfc\x6e\x33\x75\x00\xac\x10\x00\xe0\
+\x5b\x17\x00\x20\x06\x40\x00\x80\x05\xc4\x00\x70\x21\x20\xb2\x00\
+\xb3\xe7\xcb\x99\x00\x0b\x61\xea\x9c\xf9\x9c\x05\x90\x3a\x00\x9c\
+\x79\x8f\xad\x80\xa2\x35\x6e\x34\x96\x00\xc6\x4d\xa7\x11\xc0\x4d\
+\x9a\xb5\x83\x82\x86\xff\x26\x1b\x5c\x0a\x9e\x18\xe0\x28\x48\xa2\
+\x56\x02\x41\x40\x43\xd0\x6a\x36\x84\xe7\x5f\xff\x98\xb4\x03\xa3\
+\xc6\x4e\x65\x7f\x5b\x2c\x00\xc0\x34\x52\xde\x0f\x1a\x5d\x0c\xfd\
+\x47\x4e\xa4\x21\x3c\x58\xab\xff\xb8\x15\x0f\xfc\xf8\x48\x5f\x23\
+\x00\xc0\x79\x02\x6d\xc4\x14\xc1\xb6\x3d\x38\x00\x20\x10\x20\x4a\
+\x01\x32\xfb\xff\x52\x0a\x01\x7b\x0b\x00\xc0\x1f\xbf\xec\x3e\x08\
+\x06\x8f\x9e\xc2\x5e\x63\x34\xfc\xf7\xe9\x26\x70\x4e\xdd\x2b\xd9\
+\x1e\x50\x8f\x32\xfe\x50\xb5\x02\x65\x3c\x73\xd4\x41\xff\x53\x8b\
+\x67\xdc\x14\xb8\x22\x91\x10\xa4\xd2\xdf\xaf\x5b\x33\xd3\x9d\x2c\
+\x9c\x60\x1c\xb5\xf8\x9a\x73\x45\xd5\xbf\x43\x7f\xe9\xfe\xf8\x13\
+\x31\xdc\xe6\xaf\x00\x4e\x2a\xca\x12\xda\xcc\xdc\x3d\xa3\xc5\x32\
+\x05\x00\x8c\x40\xae\x6c\x89\xb3\x7e\xdd\x1e\xb2\xa1\x19\xae\x40\
+\xac\xb6\xe8\xb8\x95\xff\xb6\x0b\x5e\x48\xa9\xff\x5a\x22\x20\x0f\
+\xc0\x11\xca\x93\xaa\x78\x23\x39\x4d\x25\xeb\x7f\xbe\x6d\x88\x86\
+\xeb\x44\x4b\x21\x91\x59\x66\x00\x60\x0d\x5c\xf1\xab\xab\x6b\xca\
+\xf2\xad\x7d\x19\x3e\xe5\x93\x44\xd7\x2b\xde\xf5\x2c\xec\x98\x00\
+\xe6\x2a\x91\x58\x2a\x69\x3d\x65\x61\x94\x6a\xda\x94\x15\x49\xa5\
+\x4c\x93\xbe\x26\x21\x24\xef\x11\x4d\x69\x1f\xd5\xa2\x3e\xf3\xde\
+\x95\x36\xd5\x88\x6e\x0b\x4c\x71\x55\x47\x6b\xe1\x06\x24\x9a\x3b\
+\xa9\x46\x8c\xcc\x84\xde\xfd\xb0\x0d\xcc\x9c\xbb\x0c\x7e\xfc\x79\
+\x1b\xfc\xfc\xf3\x56\xd8\x82\x1d\x00\x18\xfc\x37\xff\x44\x06\x40\
+\xeb\x37\x7c\x0f\xdf\xb1\xe0\xbf\x96\x05\xff\x35\xeb\x44\x0b\xe0\
+\x9a\x0d\xbc\x05\x50\x29\x01\x58\x00\x80\x9c\x00\x39\x03\x80\x03\
+\x81\x68\x26\x00\x95\x01\xd0\x12\x78\x11\x4d\x06\x9c\x31\x07\x99\
+\x00\x06\x02\x90\x05\x98\x31\xd7\xea\x04\xc0\xfe\xf8\x11\x13\x66\
+\x40\x9b\xce\xfd\xe1\xde\x87\x5e\x81\x33\x2f\xb8\x14\x2a\xe7\xd6\
+\xb1\xba\x1e\xa4\xee\x81\x7b\xe0\x9b\x44\xf9\x5f\x74\xd5\x7f\xa0\
+\x4b\x9f\xe1\x34\x3f\x60\x14\xf6\xee\x8f\x2d\xb6\x4c\x7d\xb0\xcf\
+\x1f\x5b\x06\xdb\xf7\x18\x44\x81\x9d\x02\x3e\x05\xfe\x4e\x94\xfd\
+\x37\x6b\xdd\x05\x3e\xc6\x25\xe6\x07\xb4\x40\x1b\xe1\xb6\x5d\xc9\
+\x59\x10\xcb\x02\xc4\x00\x38\xb2\xff\x9e\x3c\xd3\xef\x28\x68\x7f\
+\x06\x26\xb0\xb7\xbf\x53\xaf\xe1\xf0\xe2\x5b\x9f\x40\xd1\x25\x77\
+\xc2\x29\x35\x62\x56\x39\x86\x8b\x34\x0b\xb9\x50\x53\x94\x67\xb0\
+\x2c\xc3\x07\xf8\xe8\x09\xc7\xc1\x26\x6f\x07\xd6\x7d\x1c\x40\x45\
+\x60\xd0\xd2\x09\x38\x41\x13\x86\xff\xbf\xb7\xbe\xec\x22\xc0\x32\
+\xe8\xb2\xb4\xf2\xa4\xf0\x03\xb2\x03\x5a\xc5\x83\x9f\xb0\x56\xae\
+\x1a\x00\x23\x41\xdf\xac\x18\xdc\xe2\x95\x71\x69\x1e\xde\xfc\x9a\
+\xd2\xb3\xed\x3a\x69\xc1\xea\x6d\xce\x8b\x60\xfd\x4d\xc4\xe3\xc3\
+\xe7\x10\xf6\xe8\x4a\x0d\x30\xd8\x7b\x0e\xc5\x6d\x26\xba\x8f\x71\
+\x84\x17\x0d\xa7\x0a\x15\x6d\x6f\x02\xdf\xd6\x15\x2d\xe6\x62\x33\
+\x8c\x34\x6f\x68\xd3\x57\x63\x91\x98\xd1\x70\x97\x48\xd2\x61\x3f\
+\x4c\x6f\x5d\x88\xe7\x08\xe3\x4c\x8f\x57\xb5\xa9\xe1\x84\xd9\x21\
+\x0e\x8a\x71\xf7\x90\xe3\xf7\xf9\xf5\x29\x73\xce\x8e\xd4\x27\xff\
+\x05\x69\x30\x84\x76\xb3\xb5\x8d\x6b\xe1\x91\x27\xdf\x84\x4e\xdd\
+\x87\xb0\xa0\xbd\x82\xda\x09\xd7\x6f\xfc\xd1\x6a\xff\xc3\x0e\x00\
+\x04\x00\x5c\x04\xb8\xd1\xee\x02\x58\x81\x36\xc0\xab\x69\x16\x00\
+\x02\x80\xc5\xd2\x07\x60\xa9\x60\x00\xc8\x0f\x60\x19\xcc\x45\x16\
+\x60\xc1\x62\x98\x3d\x6f\x11\xcc\x12\x20\x60\xea\xec\x85\x30\x79\
+\xe6\x02\x18\x30\x7c\x12\x34\x6d\xde\x01\x6e\xbe\xab\x31\x0b\xfa\
+\x97\xb0\xc0\x59\x9b\x1c\xfc\xc8\xc2\x37\xb7\x40\x80\xb5\x42\x5b\
+\xf7\x50\xad\x10\xce\x2b\xbc\x0a\xde\xff\xa4\x13\x8c\x9e\xc8\xcb\
+\x06\xe4\x20\x38\x9e\xf7\xf2\xf7\x1b\x36\x8e\x1c\xf7\x68\x58\x10\
+\x66\xf6\x18\xe4\x45\xb6\xdf\xbc\x55\x17\xa2\xfb\x9b\x89\xef\x9b\
+\xb1\xc0\xff\x11\x4e\x0f\xc4\xe0\x8f\x0b\xf5\x00\x2c\xf0\xb7\x68\
+\x87\xee\x82\x58\xd3\xef\x05\x2d\x3b\xf6\xe0\xf5\x7e\xb6\x30\xf0\
+\xb7\xee\x82\xe5\x83\xee\xf0\xc4\x8b\x4d\xa1\xd1\x55\xf7\x42\xee\
+\xe9\x0d\xf8\x84\x3e\x02\x5b\xc2\xa5\xcf\x21\x08\x8e\x2a\xd7\x45\
+\xba\xf8\x25\x9f\x07\x9f\x18\x04\x18\xde\x00\xc0\x12\xfc\xc5\xd2\
+\x04\x01\xff\xcb\xd9\x75\xf9\x4d\xf1\x0c\x57\x10\x00\x08\x07\x66\
+\x4e\xca\xcb\x8c\xc9\xc8\xf0\xf9\x30\xd2\x02\x8f\x9e\x82\x48\x1b\
+\x00\x94\xbd\xf7\xdb\xbb\x6e\x6c\x04\xb4\x2d\xd4\x95\x4c\x53\x8f\
+\x0b\xf4\x61\x2d\x4d\x7a\x45\xf3\x10\xb8\x59\x1f\x66\xc3\x27\x5b\
+\x75\xd6\x09\x43\x11\x19\xe4\x62\x8a\xb2\xd8\xf5\xde\x23\xb1\x80\
+\xd4\xa2\x9f\x5f\xb3\x5f\x00\x36\x5d\x6e\x88\xee\xbe\x5f\x1b\x14\
+\x85\x55\xd1\x52\x9e\x6a\x87\xec\x6e\x37\x34\x7d\xa8\xfd\x04\x6e\
+\x88\x5a\xcc\xc7\x5d\x51\xb9\x56\x42\x69\x1d\xb6\x5a\x13\xcd\x32\
+\xb2\x49\x65\x15\x4b\x99\x49\x3e\x10\xba\x28\x31\x05\xc9\x0c\x75\
+\x97\x71\x93\x18\x18\x93\x6f\x2a\x22\x33\x71\x9d\xac\x60\xc3\x7e\
+\x07\x33\xd5\xaa\xf5\xe0\xa4\x48\x01\x5c\x10\xbd\x16\x6e\xbf\xf7\
+\x39\x78\xfb\xfd\x36\xd0\xa3\xef\x28\x98\x32\x63\x31\x2c\x5d\xbe\
+\x8e\x46\x0b\xaf\xf9\xee\x7b\x06\x02\x36\xc1\x8a\xd5\x1b\xe0\x1b\
+\x06\x02\xbe\xa6\x32\xc0\x5a\xb2\x02\x5e\x84\x00\x60\xd9\x0a\x58\
+\xc8\xd6\x82\xa5\xdf\xc2\x02\xea\x06\x58\xce\xb2\xff\xaf\xa8\x1f\
+\xbf\xdf\x90\x71\xf0\x29\x0b\xb8\xcf\xbc\xfa\x11\x5c\x77\x47\x63\
+\x38\x5f\xbf\x16\x4e\x3e\x15\xc1\x75\x3d\xde\xca\x88\x94\x79\xd5\
+\x02\x08\xe3\x10\x9f\xaa\x75\xe9\x31\x94\x2b\x16\xfb\xfa\xd4\x7f\
+\x5c\x44\x25\x8c\x21\xa3\xa6\x90\x65\x30\x1a\x07\xa1\x75\x6f\xbf\
+\x21\x63\x49\xd0\x87\x99\xfa\x27\x6d\x70\x36\x00\x9f\x0f\xf0\x09\
+\x01\x80\xae\x34\x23\x00\x83\xfe\x47\x2c\xf3\xff\x58\x01\x04\x1f\
+\xb1\x40\xfe\x51\x9b\x1e\x7c\x7c\x70\xeb\x6e\xf0\x31\x82\x81\xb6\
+\xec\xfb\xb6\x0c\x3c\xb4\xeb\x05\x9f\x74\xe8\xcd\x00\x40\x5f\xf6\
+\x75\x4f\x96\xe5\x7f\x0a\x37\xdd\xfb\x2c\xd4\xae\x7f\x23\x54\x65\
+\x41\xbf\x4a\x75\x06\xa2\xaa\xc7\x68\x64\x73\x8e\x3c\xb7\x16\xf0\
+\x77\x1a\xf5\x48\x27\x3f\x39\xb2\x37\x79\xf6\x9f\x6c\xff\x89\x79\
+\xcc\x0f\x71\x7d\x06\xa4\x00\x30\xcf\xd9\x7e\x57\xb1\x93\xde\xca\
+\xc2\x20\x18\x19\xe8\x83\x0f\x16\xbc\xfc\x9d\x46\x53\xe8\xbc\x4a\
+\x33\xd8\x86\xbd\x8c\x87\x34\xbf\x2c\xdb\x3c\xa1\x1e\x07\x27\xd4\
+\x91\xb1\xfc\x45\x80\xfe\x6f\x24\x44\x94\x3f\xaf\xb3\x61\x1f\x36\
+\xa7\xff\x5d\x26\x40\x71\x0a\xf6\x74\x07\x25\x78\x7d\x28\xbd\xff\
+\x2e\xa4\x6e\x36\x9e\x3d\xc0\x1e\x66\x43\x9a\xe1\x43\x1f\x7b\x0b\
+\x1a\x83\x0f\x76\x70\x32\x13\x61\x45\x1f\x21\x7b\xda\x6d\x83\x22\
+\x55\xc4\x66\x24\xe8\x8b\x8f\x59\xd3\xce\x52\xcb\x18\x0c\xab\x7d\
+\xca\xf1\xfc\x9a\x2c\xd9\x18\xb6\xb8\xee\x44\x4e\xb9\x0a\x38\xad\
+\x32\x7e\xa3\x8f\x42\xc2\xe1\x2f\x9a\xee\xd2\x92\x88\xf3\xaa\x19\
+\xa2\x34\xe0\xea\x56\xa1\xce\x02\xd9\x5d\x50\x40\x2e\x7a\xd9\x92\
+\x7a\x67\x5f\xe7\x44\x0a\x21\xaf\x66\x43\x38\xb3\xce\x15\x10\xbd\
+\xf0\x16\xb8\xec\x9a\x07\xe1\xc6\xdb\x1b\xc3\x5d\x0f\xbe\x08\xff\
+\x79\xec\x35\x78\xe0\x89\x37\xe1\x81\xc7\xdf\x80\x7b\x1f\x7e\x15\
+\xee\x78\xe0\x05\xb8\xe1\xce\xc6\x70\xc5\x8d\x0f\x41\xc3\x2b\xee\
+\x82\x0b\x62\xd7\xc3\x69\xe7\x5f\x0a\xd5\xce\xc0\xa9\x86\x31\x0a\
+\x9c\x3c\x78\x16\xb1\xe7\x2d\xb2\x5a\x68\x71\x5a\x1f\x0f\xf6\x75\
+\x85\x8d\xaf\x60\x01\xaa\xd5\x86\x9a\xe7\x5f\x02\x8f\x3f\xd7\x14\
+\xfa\x0e\x99\x00\xfd\x87\x4f\x84\xee\x03\x46\xd2\x60\x1d\xa4\xe1\
+\x31\x5b\x47\xe1\x5e\x73\x16\xb8\x79\xe0\x67\x41\xbc\x1d\x06\xf2\
+\xee\x9c\x01\x60\xc1\xbf\x39\xae\xd6\x1c\x04\x34\x6b\xd5\x95\xe8\
+\xff\x8f\xd8\xfa\x10\x01\x40\xab\xee\x2c\xf8\xb3\xc7\xd6\xc8\x06\
+\xf4\x64\x7f\xd7\x8b\xfd\xbc\x07\xbc\xf4\x6e\x2b\xb8\xfd\xbf\xaf\
+\x80\x71\xc9\x1d\x90\x77\xd6\x85\x24\xa6\xac\xc2\x8e\x19\x57\x4e\
+\xbe\x58\xec\xde\xac\x22\x2d\x9b\x23\xd2\xbc\xc9\x09\xca\xc3\x11\
+\xdb\xd4\x29\x9e\xfa\x97\x1a\x00\x43\x80\x08\x33\xc0\xbe\x10\x60\
+\xb8\x99\x96\x4e\xdf\x7f\x39\x04\x94\x38\x46\xa2\x8c\x6d\x84\xe5\
+\xe1\xfd\xaf\xa5\x03\xd6\xbd\xdf\x47\x2a\xc7\xe6\x09\x6e\x12\x24\
+\x7c\xce\xdf\xd7\xcb\xef\x7a\x65\x94\x51\xcf\xec\x08\xf7\x4a\x27\
+\x06\xad\x24\x10\xa6\xf9\xd0\xc8\xa1\x32\xd5\x59\x52\xa9\x29\x1b\
+\xce\xd2\x83\xcb\x10\xc4\xea\x07\x16\x2e\x7c\x4e\x53\x1e\x23\x89\
+\x67\x78\x90\x8b\xe8\x91\x9d\xcb\x36\x35\x02\x49\xaa\x10\xc9\x65\
+\x84\x64\x19\x99\xd8\xcf\x91\x93\xa7\xa8\xa1\x7d\x67\x0f\xa4\x7b\
+\x43\x2b\x6a\xe9\x0c\x19\xa3\x94\x7d\x33\x12\xe7\x38\x57\x4f\x23\
+\x93\xd2\xe3\xac\xa9\x43\xea\xa8\xd8\x38\x8d\x84\xe1\x68\x55\x75\
+\xb4\xad\xca\x3a\x35\x5d\x37\x1e\xf8\x89\x76\xd7\xa2\x56\x07\x07\
+\x1f\x51\xac\x02\x33\xe7\x54\xba\x90\xd5\x92\x68\x3f\xe2\xef\xc8\
+\x79\x06\xd8\xb3\x5f\x25\x9f\xad\xea\x72\x89\xf9\x06\x6a\x06\x4d\
+\xc7\x50\x0f\x2a\x57\xab\xc3\xee\x85\x02\x6a\x63\x7c\xe6\xb5\x8f\
+\xa0\x5d\x57\xa4\xf4\xfb\xb0\x00\xdd\x15\xde\xff\xbc\x33\x34\xfd\
+\xbc\x0b\x7c\xf0\x45\x37\xf8\xb0\x15\x0f\xdc\xcd\x58\xe0\x6e\xde\
+\xd6\xce\xfc\x69\x32\x20\x8d\x09\xee\x2a\x16\xff\x1a\x41\x00\x82\
+\x01\x64\x01\x3e\x6c\xc5\x40\x40\xab\x6e\x04\x00\xde\x6e\xd6\x01\
+\x1e\x7b\xf1\x03\xb8\xfe\xae\xc6\x50\xaf\xd1\x4d\xa0\xd5\xac\x2f\
+\x58\x87\x02\xcb\x51\x2f\x2c\xdf\x87\x72\xbc\xc8\x22\xa9\x8b\xb7\
+\x5f\x8a\x60\x9f\xe7\xf4\x07\x71\x2a\xff\x55\x00\x10\x53\x96\x11\
+\x80\x05\x08\xb6\x37\x38\x32\x5a\xed\xc4\xd4\x6d\xff\xbf\xe1\xaf\
+\x5f\x5e\xa5\x68\x23\x63\x94\x7a\xf9\xcc\x86\x49\x45\x64\x9e\x99\
+\xf3\x55\xe9\xc4\xd1\x15\xba\x67\xbb\x5b\xfa\x73\xeb\xfd\x86\x00\
+\xa9\xaf\x65\x06\xcc\x0e\x5d\xcf\xe7\x66\x01\x12\x32\x0a\xc9\xea\
+\x8b\x7a\x0a\x94\x93\xe1\x34\x47\xd2\x74\xf0\x9c\x20\xa8\x02\x00\
+\x0a\x58\x86\xd2\x0f\x6f\x0f\xc2\x29\x33\x8a\xd4\xbc\xc0\x98\xe1\
+\x43\xfb\x19\x27\x20\xf8\xeb\x4e\xa6\x26\x2d\x01\x66\x34\x5e\xa8\
+\xaa\x05\x29\x0d\xe8\x0e\xb3\x98\x90\x00\x00\x21\x8b\x99\x51\x40\
+\x03\x05\x37\x15\x00\x08\x05\x7b\xc4\x69\x66\x13\x8a\x63\x22\xa2\
+\x0e\x1d\x02\x0f\x9e\xf5\xe9\x91\x03\x00\x7c\x6c\x40\xc0\x20\x4c\
+\x7d\xfd\x26\x54\xa9\xa1\xc3\xb9\xd1\x6b\xe0\x96\xfb\x9f\x83\x26\
+\xcd\xbe\x64\xc1\xba\x07\x7c\x4c\x81\x1a\x95\xfb\x9d\x59\xd0\xef\
+\x0c\xef\xb1\xe0\xff\xfe\xe7\x08\x04\xf8\xe3\x87\x18\xc4\x91\xbe\
+\x97\x00\xa0\x1d\x7f\xe4\x62\x3e\x2e\xe8\x6b\xd1\x0e\x7b\xfc\x7b\
+\x52\xcd\xff\xad\x8f\xdb\xc2\xa3\x2f\xbc\x0b\x37\xdc\xfd\x14\x98\
+\x97\xdc\x06\xa7\x9f\x77\x11\x39\x07\x56\xce\xad\x4b\x8b\x9b\x29\
+\x15\x90\xd6\x80\x03\x21\xdb\x53\x43\x06\x7f\x64\x03\x72\xe2\x86\
+\xf5\x08\xad\x85\x34\xf6\x51\x0c\xc2\xb8\x97\xbf\xd4\x08\x78\xd1\
+\xff\xb1\x40\x25\x80\x90\xa3\x34\x68\xa4\x48\x75\x1b\x7f\xd1\xa0\
+\xf7\xd7\x10\x19\x86\xff\x12\xe7\x24\xa8\xb3\xe9\x89\x2a\x01\xe8\
+\x29\xed\xcb\x99\x1e\xc1\x5c\xc9\x39\x81\xce\xcc\xc0\x45\x30\x20\
+\x15\x6a\x3e\xe4\xeb\x0a\x18\x8c\xb2\x77\xd6\xf9\x8d\x04\xfd\xad\
+\x5e\x93\xf5\x12\x8d\x00\x8e\xba\x02\x7e\xfc\xf1\x85\x12\xd2\x34\
+\x7e\xed\x76\x29\xd0\x8e\xf2\x1c\x69\x86\x07\xd3\x91\x08\x5c\x48\
+\x1f\x74\x69\x8e\x62\x66\xd4\xe9\xcf\xeb\x78\x43\x56\x86\x64\xa6\
+\xf8\x81\x36\x32\xb4\x51\xa9\x60\x2d\x15\x94\x6c\x24\x04\x00\xd9\
+\xc9\x00\x80\xa3\x2c\xe4\x72\xb3\x54\x7d\x17\x2c\xb1\x5a\xcc\xf6\
+\xa7\x97\x3d\xeb\x11\x57\xe0\xcb\xb7\x33\xdf\xec\x88\x47\x67\x86\
+\x9c\x63\x1f\xe1\x01\x94\x4a\x00\x2c\xe0\x57\xa9\x61\xc2\x49\x35\
+\x8a\xe0\xb4\xf3\x2f\x87\x86\xff\xfa\x0f\xdc\xdf\xf8\x6d\x78\xff\
+\xb3\x2e\xd0\xb2\x63\x3f\x68\xd1\xbe\x17\x65\xf4\xcd\x31\xbb\x27\
+\xba\x9e\xb7\xeb\x7d\xf0\x45\x17\x68\xfa\x05\x67\x00\xe4\x42\x26\
+\xe0\x83\x56\xc8\x02\xf4\x80\x66\xed\x7a\x11\x2b\xd0\xa4\xf9\x97\
+\xf0\xc2\x5b\x9f\xc1\x83\x4f\x37\x81\x7f\xdf\xf3\x0c\x5c\x78\xf5\
+\x7f\xe0\x02\xf3\x06\xa8\xfe\x8f\x8b\xd9\xeb\x63\x6d\xb9\x90\x3b\
+\x27\x6a\x75\x89\x71\xc0\x6c\x1f\x5b\x0d\xb3\x84\x16\x21\x5b\xb4\
+\xed\x85\x44\xeb\x9e\x55\xc7\xcf\x37\x94\xe0\x2f\x68\x7f\xaf\xe5\
+\x76\xec\x13\x62\xd9\xb0\x72\x2e\x9c\x59\xbf\x9f\x6e\xc8\xf4\x2e\
+\x6b\x59\x60\x20\x91\x70\xca\xf4\xd8\xb4\x83\x74\x46\x99\xbe\x9f\
+\xed\x74\x87\x65\x85\xd3\x06\x00\x15\x25\x14\x34\xcb\x18\xb0\x8d\
+\x0a\x62\x16\xfc\xe6\xaf\x94\x83\x56\x42\x4b\xf6\xfa\xee\xf8\x6b\
+\x66\x28\x51\xf2\x07\x40\x95\xca\x5b\x90\x11\xb8\xae\xec\xf0\x04\
+\xf0\x1b\xb7\xa8\xc7\x8b\x0d\x35\x3d\x4e\x34\x97\x34\xa3\x4f\x78\
+\x6c\xa9\x88\xf9\xdc\x17\xcb\xb0\xe9\xe2\x88\xcb\x74\xc7\xfd\xbd\
+\xef\x44\xa9\xa0\xce\x56\xba\xa7\x69\x91\xdf\x48\xdc\x54\xb5\x10\
+\x99\xed\xb1\x4d\x65\xc8\x46\xd9\x8c\x49\xc2\xaa\xb9\x4f\x4a\x65\
+\x9f\x04\xde\x14\xc9\x96\xe6\x1c\x24\x13\x76\x75\x15\xd8\x41\x4a\
+\xde\x0b\x31\xab\x4e\xed\xb9\xf2\x75\xff\xb9\xf5\xf9\xba\xf2\x3b\
+\x31\x3e\xfd\x91\x65\xfc\xda\x59\x97\x80\x71\xe9\xbd\x70\xd7\xc3\
+\x6f\xc0\x73\x6f\xb4\x84\x57\x9a\xb6\x85\xd7\x3e\x68\xc7\xb2\xf3\
+\x0e\xf0\x26\x5b\xaf\x7f\xd8\x16\x5e\x7d\xbf\x15\xbc\xf4\xee\xe7\
+\xf0\x62\x93\x4f\xe1\xf9\x37\x5b\xc0\xd3\xaf\x34\x83\x47\x9f\x7f\
+\x1f\xfe\xd3\xf8\x4d\xb8\xf3\xa1\x97\xe1\xa6\x7b\x9e\x86\xab\x6e\
+\x79\x94\x05\xf7\x7b\xa1\xf0\xa2\x5b\xe0\xbc\xe8\xb5\x70\xea\x79\
+\x97\x42\x6e\xcd\x86\x34\x1c\x08\x19\x05\x6c\x79\xc4\xd7\xb3\x9d\
+\x03\x8b\xac\x6b\x16\xa6\xb9\x0a\x85\x56\xa0\x0f\xa1\xa5\x32\xea\
+\x10\x64\x1b\x9f\x52\xc6\x08\xbb\xde\x8f\x95\xfd\xe7\xc5\x12\x9e\
+\x0f\x37\xf8\x0d\x47\x5c\x9f\x03\xe9\xfe\xe7\x29\x28\x2d\xf2\xbe\
+\xee\x9a\xdb\x83\xc4\x4c\x7b\x43\x0d\x1e\x14\x83\x01\xde\x50\x20\
+\x7f\x81\x0c\xce\xa0\x8f\x98\xf0\x7f\x57\xa9\xc2\x48\x10\xe8\x63\
+\x3e\xad\xa0\x5e\x2c\xb4\x91\xe1\xc0\xef\x27\x1c\x4d\x24\xa2\x37\
+\x32\xce\x06\x55\x4a\x9c\x7d\x96\xe5\x06\x0b\x3e\x61\xca\xdb\x80\
+\xc5\x69\xc6\xe3\xdf\xa6\xe1\xf2\xc6\xb7\x28\x40\xc3\xa7\x66\x92\
+\x8a\x35\x6f\xa2\x51\xa0\x41\x7e\xd7\xbb\xa7\x3e\xf1\x48\xc9\x54\
+\x8f\xcd\x70\x65\x44\xf6\x07\xd9\x29\x82\x32\x14\x7d\x80\xee\x03\
+\x8c\xfe\x2a\x23\x38\xcb\xe6\x6e\xe5\x74\x4d\xd4\x13\x08\x8c\x52\
+\xbc\x86\x5e\x13\xe2\x5c\x2c\x41\x48\xa8\xd6\xad\xf6\x42\x1c\x41\
+\x9c\xe7\x14\xb3\x65\xbb\x7d\xeb\xe5\xef\xe4\xa9\x0c\x80\x00\x0c\
+\x0a\x70\xb0\x1f\xed\xf6\x38\x19\xf0\xf8\xbc\xfb\x22\x5b\x03\x80\
+\x6a\x7a\x21\x0e\x44\xa1\x20\x05\x51\x0c\xc6\x9a\x14\x05\xd6\x15\
+\xad\x81\x75\x04\x55\x2f\x46\xfe\xca\x0e\x01\xcc\xda\x73\x0b\x39\
+\x8b\xa1\xf1\xd7\x0e\xe5\x8b\xe0\x8f\x8b\xda\x1d\x8b\x1c\xd4\xbd\
+\xdd\x05\xa2\x68\x17\x54\x8f\x05\x4d\x58\x2f\x47\x6c\x03\xa6\x70\
+\xc4\xcb\xc3\xdf\xe9\xea\x67\xeb\x00\xbc\x74\x18\x89\xd8\x3c\x33\
+\x80\xfb\x9d\x1b\x00\x64\xda\xb1\xae\x6c\x93\xe3\xbc\x83\x89\x91\
+\x62\x70\x30\xe0\x44\x97\x08\xbc\x26\xfa\x65\x56\x7c\x98\xbc\x15\
+\x30\x94\x52\xe9\xf5\x44\x02\x20\xd3\xe7\xda\x64\xf6\x5e\xc2\xe7\
+\xaf\x14\xbc\x6e\x92\x6a\xed\xd8\x08\xb0\xd9\x8b\x8c\xd9\xd3\xa2\
+\xd6\x45\xa7\x47\xbc\xdb\xd0\xb2\x23\xb6\xd3\x5b\x38\x62\xd3\x6d\
+\xf1\x7d\xbf\x5e\xb4\x9b\x91\x22\x72\xd4\x7d\x9c\x9f\x94\x00\xef\
+\x97\x41\x46\x74\xdf\x0f\x6e\xf2\xd6\x1c\xc3\x27\xfb\xf7\x9e\x51\
+\x1e\x96\x3d\xe9\x11\x67\x8b\x8b\x3b\x9b\x4c\xae\x49\x30\xca\x65\
+\x23\x90\xd7\xc6\x79\x4f\x98\x29\xbf\xae\xdf\x06\x12\x4a\x2a\xb8\
+\x34\x12\x50\x8e\x7e\x40\x20\x9a\x9c\xfa\xd7\x74\xcb\xa0\xc6\x1a\
+\x68\x15\x51\x5a\xd7\x5c\xd7\x20\xac\xce\xa5\x8f\x44\x9d\xc1\xcf\
+\x91\xe9\xc7\x03\x87\x6c\xab\x05\x4e\xb7\xa6\xde\x11\x18\x10\x6a\
+\x7a\x02\x02\xe8\x4f\x20\x34\x02\x14\x48\xad\xe9\x87\x05\xbc\x43\
+\x40\xe3\x53\x0f\x79\xb6\x2e\xbf\xe6\xdf\x53\xc7\x82\xc6\xcd\x82\
+\xa8\x4c\x87\xc7\x90\x2f\xad\x90\xb9\xf6\xc0\x02\x00\x56\x90\x36\
+\x88\xc2\xcf\x96\x81\x5d\xda\xe6\x46\x84\x03\xa7\xc2\x96\xa8\x82\
+\xbe\xb0\x05\x9a\xc4\xf7\xf9\x52\x2b\xe1\x1c\xe8\x15\x8e\x78\x08\
+\x35\xe3\xfc\x22\x8c\x14\x85\x5d\x2a\x00\x48\x5d\x68\x95\x3c\x88\
+\xe9\x4a\x32\x52\x1e\x2c\x41\xe2\xc4\xc6\x19\x30\xdc\x34\xb3\x51\
+\x4e\x19\x77\x32\x35\x7f\xa6\x03\x59\x2a\x2e\x7f\x2e\x2b\xf9\x88\
+\x99\x61\x5f\x82\xf2\x03\x31\xe1\x32\xbb\x0d\xc6\xdf\xab\x95\x42\
+\x5e\x2d\x77\x71\x1f\x80\x74\x68\x59\xc3\xe7\xe2\x9b\xca\x06\x6d\
+\xd8\x19\x42\xc2\xc0\x14\xf3\xaf\x81\xe7\x1b\x8e\xc0\xef\x9f\xd9\
+\x25\x0b\x08\xa9\x06\x61\xc3\x83\x32\x4a\xb6\x62\x69\x76\x05\xb8\
+\x33\xf6\x78\x56\x84\x67\x4a\x45\xca\xd7\x1e\xc7\x9d\xd4\xaf\x20\
+\xf9\x39\x08\xe5\xa5\x3a\x3e\x5a\xfd\xb0\xc7\x0b\xb4\x1c\xc7\x1a\
+\x89\x79\x96\x00\x02\x31\x05\x9a\x57\x87\x42\x10\xfb\x64\x23\xb9\
+\x29\x91\xaf\x96\x43\xed\xbc\xf0\x02\x0b\x51\x5f\xc1\xa0\x53\xd0\
+\x67\x07\xf3\x6c\x45\x07\x60\xfd\x9b\x83\x05\xb0\xa9\xef\x70\x44\
+\x29\x75\x08\x97\xc2\x6c\x0b\x20\xd8\x9e\x04\x56\x26\x6d\xd5\xba\
+\x0b\x2d\x00\xc0\xc1\x8a\xfd\x3d\xd1\xf6\x14\xf8\xa5\xf5\xb6\x6e\
+\x31\x00\x6e\xb5\x7d\x8e\xd5\x71\x50\x64\xa9\xf8\x39\x18\xd1\x1d\
+\x75\x7b\x5b\xcf\x20\xdd\x14\x75\x8b\x09\xc8\x76\x83\x01\x2b\xfb\
+\xb7\xc5\x7d\x52\xcb\x62\x8d\xf4\x8e\x44\x7d\x04\xb9\x7a\x1a\x81\
+\xc1\xd9\xd6\x1b\x84\xe6\x0f\x39\x6c\xca\xdd\xf7\x95\x99\x40\x33\
+\x90\x0a\x9b\x6a\xa4\x14\x98\xd4\x80\x1a\x2f\x7e\xcc\x64\x9d\xdb\
+\x48\xeb\xdf\x9d\xfb\xd1\x5f\xa3\x9f\xbe\xe2\x40\x48\xd0\xc0\x1c\
+\xe4\xb8\x32\xeb\x8d\x52\x29\x79\x4d\xb8\xbc\x51\x62\x82\xac\xdf\
+\x37\x2b\xd5\x5d\x62\x3d\xa7\xe7\x7b\x72\xe7\x2f\xc3\xd5\xd2\x96\
+\x0e\x7d\xe6\x55\x63\x14\xd9\x92\x45\xb5\x1b\xfe\x4e\x63\x9a\x61\
+\x19\xc6\x38\x37\x2e\x33\x0e\xad\xda\xb5\x4f\xc3\x29\x04\xf3\xdc\
+\xa8\x0c\x97\xea\x5f\xd9\x78\x22\x8a\x1d\xb2\x16\x4d\xd2\x82\xa2\
+\x78\xa2\xa7\xbc\x79\x25\x99\xae\xe8\xda\x0c\x54\x31\x5c\x90\x2c\
+\x2b\xec\x63\x8d\xec\xac\xb5\xf9\xd5\xf1\x92\xd1\xbb\xc9\x98\x80\
+\xa0\x7e\xf2\xba\xd2\x3e\xe8\x33\x65\x4e\x5e\x57\x71\x3d\x55\x00\
+\xe0\xc8\xf6\xe3\x02\xa3\x9b\x59\xd2\x9d\xad\x72\xb2\x2c\x90\x17\
+\xef\xff\x10\xce\x53\x19\x09\xa5\xc5\x50\x66\xfb\xb4\x64\xcd\x5e\
+\x57\x18\x80\xa8\x4b\x6c\x67\x2a\x4c\x83\xa9\x78\xf0\x8b\x72\x80\
+\x68\xe9\x0b\x47\x3c\x6a\xfa\xb2\x54\xa0\xc5\xeb\x24\x9c\x4c\x87\
+\x3d\xd5\x31\x47\x73\x97\x5e\xca\x2a\x16\x4b\x75\x40\x98\x73\x46\
+\x47\xc8\x13\x60\x9a\x19\xec\x72\x31\xca\xb4\xb1\x57\xdc\xb4\xbd\
+\x20\x7a\x08\x33\xc3\x81\x2b\x13\xec\x85\x2d\x7e\x2f\x0f\x73\xa4\
+\x8c\x59\x19\x97\xf3\xaa\x94\xf9\x37\x1f\xa4\x66\x9e\x6c\xa0\x8c\
+\xe1\xaa\x67\xc7\xc0\xdb\x5e\x37\xfe\x35\xd4\x1a\x78\x72\xe7\xc1\
+\xd4\x29\x2d\x6f\x87\x31\x77\xb0\x8f\x7a\xb3\x15\x11\x3d\x39\xc0\
+\xd1\x8c\x04\x5d\x09\x51\x3b\x60\xd0\x26\xe9\xd6\x3b\x18\x0e\x00\
+\xa0\x9e\x0b\x9e\x49\xb9\xb2\x52\x4f\xe1\xa5\xe1\xd2\x0b\x78\x03\
+\x04\x7f\xa7\x2f\x3f\xf3\x21\xe7\x35\xb2\x41\x4a\xf2\xd6\x16\x2f\
+\x67\xb7\x70\x52\x43\x93\x64\x2c\x82\x91\xa0\x4d\xcc\xf4\x29\xb5\
+\x24\xe8\x58\xd1\x82\xb5\x0b\x5a\xc2\xd7\x48\xcc\x5f\x04\xe8\x6e\
+\x83\x73\x01\x80\x1c\x35\xa3\xce\x53\xb3\x6d\xc3\x12\xd2\x39\xcf\
+\x4b\xcc\xd5\x52\xa7\xdc\x4f\x11\x7b\xf4\xb1\x55\x0a\x10\xff\x16\
+\x52\xe9\x76\x2c\x51\xe4\xb3\xe0\x87\xcc\x44\xbe\xb3\xcc\x94\xe3\
+\xdb\x82\x17\x8b\x7f\x9f\x79\x4e\x65\xbf\xfa\xd9\x88\x2f\x75\x98\
+\xf4\x5a\x16\x8d\x1e\xd1\xe3\x3f\x4f\x11\x6f\x76\x2f\x51\xb0\x25\
+\x26\x24\x57\x99\x3d\x92\xd4\xee\x5a\x99\x32\xe8\x30\x83\xd2\x3d\
+\xb3\xef\x4c\x07\xdb\x20\xcf\x29\xf7\x00\x3f\x17\xc4\xf4\x8f\xcb\
+\x08\x24\x4a\x0e\x47\x0c\xcf\xe3\x95\xec\xac\x17\x43\x91\x9a\x09\
+\x51\xa6\x4a\x16\x86\xe2\x17\x61\x58\xfb\x68\x3a\xe7\x3c\x33\x40\
+\x4e\x77\xed\xe5\x66\x05\x31\x20\x7a\x22\x0d\x40\x79\x0d\x43\x48\
+\xa6\x44\xd7\x3d\x32\x59\xd3\xba\xc1\x6c\x15\x75\x34\x81\x32\x5f\
+\xf7\x71\x99\x52\x1d\x05\xa3\x49\x5a\x01\x13\x7d\x18\xdd\xe6\x22\
+\x3e\x02\x32\xc7\xe6\xe4\xc7\x5e\x18\x3e\x82\x95\x64\xa2\x34\x9e\
+\x81\x78\x6d\xb8\xde\x1b\x96\x61\xd7\x89\x13\x2a\xde\x63\x81\x40\
+\x96\x77\x80\x8e\xb9\x5c\x06\xfd\x83\xb3\xaa\x01\x50\x75\x0a\x61\
+\x9f\x0f\x9e\xe7\x74\xb7\x88\xe9\x5d\xe6\x70\x7d\xd0\xfd\x9e\x47\
+\xfd\xf7\xf8\xe3\x4b\x45\x18\xe8\xf2\x89\x70\x00\x05\x27\x13\x10\
+\x8a\xa8\x2e\x82\x31\x2b\x20\x67\xab\x35\x7c\x87\xb7\xbd\x2a\x04\
+\x74\x6a\x02\x2c\xd3\x20\x4d\xce\x25\xd0\x69\x39\xd5\xf2\x72\x84\
+\xb1\x52\xa7\x8f\x18\x36\x80\x10\x8a\x7c\x09\x04\xd0\xf4\x28\x8b\
+\xbe\xe6\x23\x76\xe5\xd7\x36\x03\xc0\x41\x40\x38\xdf\x3e\x77\xc8\
+\x32\xd0\xf2\xf5\xe0\x77\x75\x3c\xe4\x39\xc5\x8f\x54\xef\xb7\x3e\
+\x2f\x2a\x2b\xe6\x2c\x5b\xd9\x00\x40\x98\x33\x21\x40\xc9\x17\x5d\
+\x05\x29\x05\x08\x23\x5e\xc0\x19\x60\xde\x45\xb6\x32\x3f\x24\x14\
+\x11\x13\x14\x15\xa6\xce\xcb\x8b\xa0\x62\xfc\x01\x54\x96\x25\xe6\
+\xfb\xfa\xde\xba\x9b\x4c\x30\x00\xf1\xa5\x3e\xff\xfb\x20\x51\x12\
+\x15\xd4\x97\x25\xd5\x78\xe3\x06\x24\x86\x55\x2e\x25\x61\x2b\xad\
+\x18\xb7\x7c\x8f\xa4\x5a\x16\x30\xca\x0c\x5c\x9c\x89\x50\x45\x02\
+\x00\xfe\x75\xa5\xd4\xda\x5b\x8c\x34\x6f\x92\x54\x7a\xfc\x8d\x00\
+\xbd\xda\x41\xda\xf4\xfc\x6e\x8a\xa8\xb3\x96\x97\x74\xe3\x30\x13\
+\x1c\xa3\x01\xa9\xb5\x0d\xda\xdf\x87\x92\x96\x16\x0c\x8f\x16\x42\
+\xb5\xfd\xc9\x83\x32\x97\x37\xb2\xe7\xdf\x1b\x01\x5a\x1d\x93\xf5\
+\xf1\x7b\x2b\xe9\x55\xf0\xe1\xdc\x8c\x62\x1e\xa5\x08\xef\xfb\x8d\
+\x7e\xd7\x55\xbe\xf1\x0f\xe0\xb1\x38\x00\x10\x2f\x76\x8a\x81\x63\
+\x82\xa3\xe3\xc3\x6d\x82\xdf\x70\xa0\x44\xdd\x1d\xa1\xb8\xa1\x55\
+\x86\x72\xbe\xe3\xa7\x5b\x26\x9c\x79\x61\x01\x00\x76\xcd\xf2\xc5\
+\x7c\xf0\x7c\xa5\xaf\x3d\x5f\x77\x00\x00\x4b\x3b\x10\x71\x01\x00\
+\x55\x13\x90\xef\x64\x03\x50\xb4\xc7\x87\x14\x49\x00\x10\x53\x4c\
+\x77\x54\x71\x1e\x0f\xee\x59\x91\xa8\xad\x0f\x60\x2b\xcb\x6a\xe7\
+\x8b\x3a\x41\x80\x0c\xd4\xe2\x9a\xe5\x78\x6a\x3b\xbc\x99\x80\x1c\
+\x17\x03\x60\x79\x1e\xa8\xe3\x96\x15\x10\x93\x15\x51\xac\xc3\xbd\
+\xae\x43\x24\x55\x63\xad\x44\xd7\x24\x9e\x45\x92\xba\x8a\x6c\x45\
+\x6b\x21\x83\x46\xb6\x3b\x09\x88\x78\x05\xda\xf4\x6a\xff\x5e\x9f\
+\xbb\x78\x03\x2e\xd3\x55\x37\x96\x7a\x09\x33\x43\x65\x01\xbf\xcf\
+\xac\x99\x44\xf3\xe5\x07\x3a\xd2\x3d\x26\x33\x2d\x70\x94\x2c\x98\
+\x27\x62\x0c\x53\xf7\x0e\x48\x17\x08\x64\xf2\x5a\x19\x29\x83\x93\
+\x4a\x99\x47\xa8\x7e\xaa\x4b\x3d\xc9\x81\x1a\x3e\x81\xd6\x6f\x44\
+\xad\xdf\x1c\x7b\xbf\x93\xad\xfb\xfc\x4e\x10\x61\x8c\xe1\x21\x88\
+\x4c\xe6\xfa\x97\x48\xc9\x1b\xff\x3a\xde\xe2\x3a\x3d\xde\x98\x48\
+\xf1\xa2\x57\x03\x1c\xde\xcc\x3c\x18\x99\x09\xea\xd1\x7e\x66\x42\
+\xe9\xd9\x4b\x52\x19\x20\x62\xc6\x51\x67\x4e\x33\x16\x23\x61\x4b\
+\xa9\x3b\x0b\x4f\xbe\x62\x2e\xcb\x57\xd3\xdb\x23\x41\x50\xa2\xa1\
+\x48\xcc\x07\x74\x25\xdf\xc8\xdc\x00\x2e\xa4\x1a\x33\x69\xb1\x04\
+\xfa\x94\x24\xae\x81\x56\xe6\x8f\xd7\x8c\xad\x7c\x8f\x59\x0d\x11\
+\x5b\xb0\x67\x97\x7f\x9c\xf7\x40\x4e\xbe\x2d\x04\xb4\x96\x65\x91\
+\x1b\xe3\x99\x7f\x9e\x50\xd3\x13\x7b\x20\x5d\xf7\x8a\xac\xd6\x3d\
+\x47\x79\x09\x33\xff\x48\xa1\x03\x04\x48\x0d\x40\x28\xae\xc4\x21\
+\x45\x86\x45\x9e\x99\x5e\x5c\xb0\xf7\xf8\xde\x4b\xe7\x20\x0d\x81\
+\xec\xa0\x6a\x58\x9a\x15\x7f\xd3\x30\xb7\xd3\x67\x1a\x1e\x1f\x91\
+\xc4\x00\x35\xe4\x97\x59\x46\x92\x29\xdb\x8d\x34\x40\x40\x32\x63\
+\x9c\x78\x4d\x8d\x93\x01\x4c\x96\x49\x06\xfd\x9c\xeb\x29\x04\x67\
+\x23\x2e\x29\x28\x1f\x6f\x11\x23\x85\xe0\x6f\xa4\x04\x08\x2a\xce\
+\xcd\xd1\x3f\xfe\x85\xd3\x06\x06\x86\x87\x2e\xad\xdc\x00\x40\xba\
+\x2d\x74\x1e\x53\xf1\x22\x7a\x0a\x4a\xfd\x44\x01\x57\xd9\x98\xb4\
+\xf8\x9a\xb6\xf7\xe6\x11\xf3\x00\x05\x7a\x12\x1a\x50\x01\x00\x9e\
+\x2d\x7f\x89\x3c\x0d\x92\x21\x47\x23\x89\xd8\xd1\x4d\x2f\xc7\x6c\
+\x2b\x53\x2b\xd8\xc5\x92\x04\x78\x83\x6f\xe6\xbe\xd7\x25\x75\xcd\
+\x87\x17\xc5\x9f\x1c\xf5\x9b\x8e\x8d\x22\x38\x00\xf0\x63\x08\xd4\
+\x8d\xd9\x70\x06\x10\x91\xa9\x66\x47\x3c\x32\x15\x35\x5b\x89\x7b\
+\x5e\xdd\xaa\x19\x87\x35\xb7\x88\xd3\x4f\xa0\xa4\x27\x0f\x34\xd4\
+\x53\x1f\xa3\xbe\x7d\xcc\xd2\x11\x00\xd0\x6b\xe7\x9b\xde\xc6\x44\
+\x4a\x66\x2e\xaf\x3f\x07\x09\x51\xab\xd5\x8e\xb2\x70\x76\x4c\x55\
+\xc8\x66\x58\xd8\xec\x2a\x7e\xfa\x14\x58\xf3\x55\x01\x9f\xad\xd8\
+\x77\x77\x30\xd0\xeb\xc8\xd7\xd5\x94\xfb\x4e\x8b\x3a\xea\xe6\xde\
+\x19\xbf\x0d\xfc\xdc\x3f\xf3\x32\x36\xca\xf6\xf0\x46\x50\xef\xf3\
+\x90\xe8\x14\x08\x59\xcb\x8b\x0d\x73\x02\x00\x27\xd3\x13\xa4\xf3\
+\x45\x77\x95\xc7\x3c\xc0\xb9\xfb\x39\xd5\xfb\x56\x69\xd3\xf2\xd2\
+\x9a\x24\xa5\x81\xb5\x20\x41\xd8\xf0\xf9\x99\x6b\x9f\x8b\xd8\x89\
+\x44\x66\xac\xb5\x63\x09\x4a\xaa\xe5\x65\x58\x93\x0e\x2b\x91\x5e\
+\xb0\xaf\xd8\xf6\xbf\xf2\x70\x63\x35\xa0\x2c\x9d\x6d\x95\x32\xe7\
+\x72\x95\x6c\xc8\x81\xdf\x07\xcc\x2f\x8b\x8f\xaf\x11\x7b\xab\xaa\
+\x91\x26\x14\x28\x3d\xe2\x47\xbd\x47\x3d\x4c\x85\x0c\x9f\xa0\xaf\
+\xc7\xd5\x66\x9c\xc2\x2d\x05\xed\x47\xd4\x6c\xdc\xcf\xc7\x40\x4f\
+\x0c\x80\x5c\xca\x76\xdf\x01\x35\xee\xe7\x89\xd8\x1f\x78\x47\x49\
+\x80\xb2\x4a\xdd\x67\xa3\x35\x92\x80\x94\x74\xaf\xb3\x19\x57\x87\
+\xb4\x55\xe1\x46\x82\x92\x90\x57\xcd\xb0\xbe\xeb\xef\xbd\xba\x3a\
+\xbc\x26\x7f\x19\x2e\x7a\xdd\x0e\xf0\x21\x87\x4d\xac\xe9\xea\x94\
+\xb0\x83\xbf\xb3\x56\x29\x87\x0a\x19\xf6\xd2\x0c\x47\x17\x87\xbf\
+\x97\x82\xe1\x9f\xf9\xe7\x0b\x0f\xfb\xfc\x98\xad\xa2\x17\x40\x20\
+\xac\x8c\xc0\x95\xd3\x04\x43\x9a\x93\x96\x57\x81\xac\xa4\xfc\x55\
+\xe0\x93\x23\x27\x45\xca\xc0\x2f\x7f\x4e\xaf\xa3\x7a\xef\x8b\xd7\
+\x62\x3f\x0f\x89\xba\xbb\x7c\x2d\x0e\x38\xc4\x52\x44\x80\xb6\xf8\
+\xd4\x9d\xd1\xc7\x2c\x8d\x89\x7b\xe3\x95\x01\x52\xd5\xcf\x38\x03\
+\xbe\x72\x6e\x1c\x9f\x4f\xfe\x75\x96\xc5\x00\xb0\xaf\xb5\xa8\x0f\
+\x58\x30\x3c\xba\x2b\x3c\xa6\x8f\x26\x65\x10\x62\xae\xd6\x5a\x7e\
+\x8e\xb2\xd4\xf7\x26\xee\xa7\x6c\xc7\x3d\x63\xba\xd8\x00\x75\xe2\
+\x5c\xd4\x61\x30\xe4\xbe\x6f\xc3\x49\x01\x80\xbb\x34\xe1\xf6\xfc\
+\x30\x9c\x8c\xa0\x87\x28\x30\x75\x4f\x8d\xa0\x36\xc7\x86\x87\x08\
+\xdb\x54\xca\x38\xde\xda\x83\xb2\xd5\xba\x8d\x40\xef\x23\xec\x53\
+\xa6\x54\x1f\x33\x2f\xda\x0c\x7a\x9e\x8d\xb8\xaf\xe3\xf7\xa4\xb2\
+\x52\xff\x69\x03\x80\xf2\x18\x72\x90\xac\x56\xaf\x07\xa0\xe3\x0d\
+\x5f\x83\x9d\x90\x40\xe5\xa1\xb8\x6c\xd9\x70\xf5\x0a\x1b\x3e\x82\
+\x37\x37\xb5\x1f\x8b\xcb\x24\xed\xac\xc6\x0b\xcc\x98\x01\x03\xab\
+\xbf\x68\x31\x9c\xe7\x9e\x47\xee\xfc\x9b\x90\xe7\xdf\xe9\x0e\x8a\
+\x3b\x35\x5d\x42\xb2\x76\xcb\xa0\x1f\x3e\x35\xf3\x32\x5c\x43\x58\
+\x4c\x97\xf0\x4a\x98\xe5\x28\x00\xcc\xce\xbc\x45\x4d\x39\xe2\x6a\
+\x2b\x73\x88\xb7\x38\x93\x93\x25\x82\x41\x48\x73\x53\xd3\x86\xab\
+\x13\xa2\x88\xb7\xf9\x58\xe0\xc8\xf9\x9e\x1d\x76\xc1\x2a\x00\x90\
+\xad\x41\xd6\x48\x5f\x01\x04\xf2\xec\x60\xe4\x25\x22\x0b\xbb\x98\
+\xa4\x90\x87\xeb\x1f\xd5\xe2\x65\x00\x26\x5b\x5d\x39\x06\xd7\x06\
+\x02\x36\xf0\x60\xcf\x21\x07\xe8\x60\x6b\x9e\x60\x00\x2c\x23\x1d\
+\x69\x98\xa3\xd4\xc1\x2d\xb6\x42\xb3\xdf\x23\x07\x1c\x82\xf6\x17\
+\x13\x03\x73\x84\xa9\x4f\x88\x2d\x62\x21\x22\x9c\xe6\xb6\x02\xbe\
+\xa6\x5b\x82\x37\x7a\x54\x28\x78\x5b\xc8\xa7\xbb\x00\x9e\x7d\x2d\
+\x1d\x1b\xbe\x55\xa2\x2a\xf2\xec\x0c\x50\x81\x7d\x48\x32\x10\x0a\
+\xe0\xb1\x0d\x89\x0a\x1d\x5d\x0f\xd9\x0e\xc7\x40\xe7\xf0\xa0\xe4\
+\x65\x40\xdd\xd5\x5d\xe3\xd5\x65\xa4\x80\xec\x7c\x29\x14\x33\x1d\
+\xde\x04\x21\x71\xdf\x86\x22\xf1\x8e\x94\x21\x05\x24\x86\xac\x15\
+\x1f\x70\x65\x29\x2d\xec\x57\xeb\xb7\x58\x2c\xc3\xb1\x0f\x84\xbd\
+\x4a\x77\x9a\x5a\xae\x88\xf9\x9a\xf2\xa8\xac\x8d\x7b\xe2\xaa\xfb\
+\xb8\xe5\xf4\xd1\xf8\x2e\x2d\x27\xe8\x8e\x7f\x0d\x23\x49\xb0\x4f\
+\x87\x75\x4c\xdc\x86\x18\xf6\xb8\xff\xd2\xd1\x07\x64\xb6\x14\x91\
+\xf8\x6f\x43\x11\x13\x32\x5b\x2a\x09\x6e\xe7\x5c\x0e\x25\x00\x3f\
+\xd5\xbf\x9e\x90\x96\xf6\x6a\xff\x4b\x4a\xab\xca\x36\x9c\x38\x9b\
+\xd0\xa8\x23\xf8\xfb\x67\xc3\x31\x1f\xbd\x41\x70\x53\x10\x27\x32\
+\x8f\x82\x6d\x6d\xec\xbd\x01\x85\x5d\xbe\xf1\xd9\x8e\x60\xe8\xa1\
+\x40\x8f\x6b\xd5\x33\x92\x94\x56\x92\x07\xfe\xf8\x12\x40\x50\xfb\
+\x53\x8f\xac\x80\x3e\xe4\x45\x0e\x23\x1f\xbe\x99\xc5\x67\x14\xb2\
+\xc7\x9c\x07\x34\xdc\xd4\x58\xf6\x99\xdf\x80\xfd\x7e\x43\xf6\xfb\
+\x0d\xac\xba\xbe\xa7\x97\x01\x06\x43\xe9\x54\x97\xab\x8e\xd7\x2d\
+\x10\x7d\xec\xb2\xaf\x5d\x77\x64\x66\x9c\x5e\x97\x1f\xb4\x44\x75\
+\x79\x57\x36\xa7\xf1\x52\x49\xa8\x5a\xd4\x0a\xc2\xf2\xd8\xb3\x72\
+\x0b\x15\x2a\xda\x5d\x7a\x70\xd7\x20\x75\x6b\x36\xbd\xac\xbf\x4b\
+\xb7\x3e\xb9\xb8\x52\xdf\x24\x10\x90\x2d\x29\x6f\xf9\x3a\x34\x3e\
+\x57\xbc\x67\xe1\xb3\x4f\xe3\x74\x2d\xd0\xa1\x8e\xcb\xb5\xcb\x15\
+\x7c\xb9\x14\xf6\x98\xed\x57\x67\x01\x9f\xec\x7c\xd9\x39\xaf\xde\
+\x80\x03\x00\xba\x7e\xe2\x73\x97\x6f\x28\x1d\x09\x31\xc7\xe7\x87\
+\x9b\x03\x09\x10\x20\x1d\x0f\x2d\xdb\x63\x19\x18\xed\xfb\x88\x67\
+\xdd\x3c\x78\x12\xc3\x11\x29\x72\xe9\x04\x62\xf6\xb0\x23\x21\x48\
+\xe4\x41\xbf\x80\x2c\x8b\x51\x84\x98\x95\xc7\xaf\x79\x96\x56\x68\
+\x79\x57\x50\x79\x23\x22\x9f\xd3\x9e\x23\x60\x05\xca\x88\x61\x09\
+\x13\xed\x5a\xaa\xda\xbb\xaf\x5b\x9f\x45\x39\x65\x91\x1b\x13\x39\
+\xdb\x6a\xc3\x32\xe8\x8a\xfb\x27\xcb\xca\x2e\x4d\xfa\x3a\x2b\xaf\
+\x88\x2d\x6e\x6c\xc6\xcb\x13\x72\xaa\xa0\x00\xa7\x56\xab\x61\x54\
+\xdc\x7b\xb6\xbb\xa1\x25\x2e\x44\x61\xa6\x66\xfa\x80\x7f\x79\x5e\
+\x95\x60\x1f\xb1\xf7\x3a\x0e\x8e\x84\x5f\x83\xb2\xdf\x85\xa4\x29\
+\x94\xf4\xfe\x88\xd3\xe0\xd8\xd7\x82\x7f\xcf\xee\x8b\xbc\xfa\x2e\
+\x00\xa1\xf3\xcf\x53\x84\xbf\xa7\x70\xae\x0f\xa3\x1b\xd1\x3d\x45\
+\xc1\xce\x21\x73\xe9\xcf\x42\x48\xee\xcd\x10\x4b\xd0\xe9\xe3\xcd\
+\x70\x24\x06\x07\x26\x24\x9e\x2d\x13\x9f\xf8\x04\x6d\xe5\xf4\x75\
+\x2e\x3d\x41\x86\x44\x21\xad\xdc\x7c\x00\xbc\xc4\x56\x41\x03\x98\
+\xfb\x67\xa6\xb5\xe9\xc4\x6f\xba\x6a\x5f\xb3\x97\x0a\x3b\x08\xe8\
+\x70\xe9\x08\x22\xd1\xb8\x1a\x5b\x30\xab\x5e\xdd\x46\xca\x9a\x8a\
+\xe2\x5d\xe2\x98\x04\x1e\xf5\x6a\xd6\xea\x04\x00\x51\x1f\x8f\x01\
+\x8f\xf6\x40\x2d\x1a\xd0\xf3\x20\x1d\xf1\x9f\xc7\xef\x45\xe2\x03\
+\x1e\xdf\xfc\xc5\x7b\xc1\x20\x2f\xa8\xd0\x2c\x16\xc8\x2a\x9f\x52\
+\x07\xb2\x4e\xa9\x4d\x81\x8d\x36\xa9\xea\x7c\xa8\x0c\x79\xd9\x57\
+\x2f\xa2\xda\xb8\x55\x5e\x91\x99\x27\x6d\xa6\x05\xe4\x5f\x1f\xaa\
+\x5a\x87\xfd\x6d\x5d\xf6\x5c\x75\xc9\xd3\x3e\x1b\xbd\xed\x95\x29\
+\x73\xb2\x0e\x1b\x96\x75\xda\x88\x0c\x72\x32\x53\x4b\xc2\x48\xe1\
+\xdf\xca\x3e\x71\x0a\xc0\x85\xdc\x23\x5f\xbc\x26\x7f\xe4\xc1\x49\
+\x82\x0d\x0b\xc1\x5b\xaf\x6b\x67\xa1\x32\x4b\xce\x51\xdc\xf3\xb8\
+\x67\x7f\x03\x2b\xfb\xa7\xcc\x5f\x02\x16\xf6\xfb\x59\xec\x35\xb3\
+\xd8\x6b\xfe\x0d\x7d\xfa\xd1\xaf\x9f\xde\x2b\x7b\xcd\x3c\x9b\x05\
+\x70\xf4\xff\x8b\x4c\x3f\x47\x13\x00\x80\x5a\xe3\xf8\x06\x4e\x19\
+\x3d\x79\xf0\xe3\x31\xd5\xa7\xac\x1f\x59\x80\x9c\xea\xec\xf7\xaa\
+\x3b\xcb\x4b\x71\x0e\x8d\x0e\x50\xaa\xdb\xae\x9d\x9a\x32\xdc\x27\
+\x17\x03\x29\x0f\x88\x32\xf8\x66\x0b\xe0\x82\xd7\x3b\x44\xad\x86\
+\xbc\xd4\xc0\x59\x07\x5e\x8a\x70\xbb\x52\xda\x9d\x07\x18\xec\xeb\
+\x3a\xce\x37\xce\x2a\xa0\xa9\x82\x82\xf1\xb2\xcc\x81\x54\x00\x25\
+\x59\x1e\xea\x78\x28\xa2\xf3\x4d\x1a\x8b\x48\x7d\x4f\x5d\x0c\x3f\
+\x76\x29\x7e\xd4\x7d\xd9\xad\xb0\x50\xf7\xdb\x9a\x1b\xc3\xea\xb6\
+\x91\x19\x7d\x56\x1e\x67\xa4\xb2\x72\xf9\x3d\x2e\x01\xaa\x04\x8d\
+\x16\x50\x8a\xa8\x9d\x26\x26\xef\xfe\x10\xc0\x28\x47\x01\xbf\xf6\
+\x31\x1a\x36\x10\xc5\xe7\x97\x00\x1a\x81\x11\x9e\x5f\x71\x8e\xb3\
+\x34\xf9\x7a\x05\xb6\xb5\xb3\xe6\x2a\x87\xe5\xa9\x60\x88\x97\xda\
+\xb2\xc5\xe7\x93\x3e\xa3\xec\xfb\x90\xd8\x3f\x24\xd0\x0d\x89\x6e\
+\x17\xbc\xbe\xc8\x48\x85\x7c\xf6\xc7\xe4\xca\x76\xff\xe1\x3a\x21\
+\xd7\xb8\x71\xb5\x1c\x12\x5f\x1a\x31\x12\x88\xcd\xcd\x24\xc1\xce\
+\x48\x83\x59\x08\x9a\x99\x07\x67\x32\x4e\xac\xe9\x90\xf3\x3c\xe1\
+\xb1\x54\x2a\xff\x03\xd2\x7d\x68\x7e\xbf\xec\x35\xc9\xa4\xb6\x88\
+\x47\xe0\xb4\xd0\x6f\xcc\xaa\xf7\x25\x2f\x41\xe8\xe0\x39\x27\x20\
+\xa2\x2a\x82\x9d\x17\x36\xcb\x97\xaa\x71\xdd\x3c\x9a\xbf\x60\x26\
+\xac\xc5\x3c\x86\x1f\x99\x8e\x3e\x63\x6f\xf3\xa0\x20\x5d\x0c\xb1\
+\x14\xa9\xff\xb2\x0a\x00\x63\x16\x6d\xa9\xd6\xd8\x79\x26\x88\x1b\
+\x5a\x03\x7a\x3c\xf5\xec\x0b\xe1\xe1\x27\x5e\x87\x2e\x3d\x06\xc3\
+\xa4\x69\xf3\x60\xde\xa2\xaf\x61\xf6\xbc\x25\x30\x6a\xdc\x54\x68\
+\xde\xb2\x13\x5c\x73\xf3\xc3\x50\x55\x4c\x9b\xb3\x02\x03\x6e\x78\
+\x79\x7c\xc4\x2c\x06\x43\x0c\xf6\x2f\xbe\xd9\x1c\x5e\x7f\xe7\x53\
+\x78\xa3\xc9\x27\x70\xff\xa3\xaf\x42\x56\xd5\x0b\xf8\x70\x1b\x4b\
+\x9c\x86\x81\x56\x87\x67\x5e\xf9\x10\x9a\x7c\xf0\x39\xbc\xfd\xc1\
+\x17\xf0\xf0\x93\x6f\x09\x6a\x9d\x07\x5a\x34\xb2\x09\x45\x0c\x5f\
+\x97\x3e\x0a\xa0\xb9\x08\x38\xa2\x70\xc6\xf9\x97\xc1\xcb\x6f\xb6\
+\x80\x57\xd8\xc2\xc7\x97\xd8\xeb\xbf\xf4\x06\x5b\xf8\xb3\xb7\x3f\
+\x81\x57\x9b\x7c\xc6\x1e\x3f\xa5\xef\x9f\x78\xee\x5d\xb8\xf6\xa6\
+\x47\xe0\xb4\x7f\x5c\xcc\x9e\xa7\xc0\xca\xa0\x39\xfd\x6e\x5a\xb5\
+\x7e\x7b\xf1\x4c\x3c\xac\x30\x02\x04\x00\x58\x40\xba\xf0\x8a\xbb\
+\xe0\xad\xf7\x5a\xc2\xdb\xef\xb7\x64\xef\xe3\x0b\xb8\xe4\xea\xfb\
+\x38\x13\x90\x57\x28\x94\xfa\xba\x2b\x83\x56\xbc\xf4\x2d\xb7\x47\
+\x9b\x31\xe0\xde\xff\x05\x70\x81\x71\x0d\x3c\xfb\x72\x53\xe8\xd1\
+\x67\x28\x4c\x9e\x3a\x1b\xa6\xcf\x9a\x0f\x63\x26\x4c\x87\x76\x9d\
+\xfa\xb2\xf3\xf9\x0a\x7b\xbf\x97\x8a\x16\xc1\xfa\x8a\xe7\x7f\x91\
+\x13\x00\xe0\x73\xe7\xda\x13\xff\x28\x88\x32\x10\x50\x25\x5f\x87\
+\x7f\x5d\xff\x20\x7c\xd4\xe2\x4b\x18\x36\x6a\x32\x4c\x9b\xb9\x00\
+\xa6\xce\x9c\x0f\x83\x86\x4f\x80\xf7\x9b\xb5\x83\xcb\xaf\xbd\x1f\
+\x4e\xae\x61\xf0\x6b\x8c\x2b\x3f\xe6\x04\xed\x11\x39\x49\x90\x0f\
+\x23\xaa\x13\xbb\x16\x5e\x7d\xab\x05\xbb\xd6\x9f\xc2\x9b\x4d\x5b\
+\x82\x71\xe1\x4d\x16\x40\xcb\x96\x0c\x93\x32\x8d\xd0\xf6\x18\x88\
+\x41\x5e\xcd\x8b\xe1\xf9\x57\x9b\xc1\x73\xaf\x7e\x0c\xcf\xbf\xde\
+\x1c\xae\xbb\xed\x09\x0e\x44\x34\xd5\xf9\x50\x00\x80\x88\x02\x1a\
+\xdd\x2c\x10\x7b\xee\x7a\x8d\x6e\x86\xb7\x9a\x7e\x4e\xeb\x6d\xb6\
+\xde\x7c\x5f\x2c\x76\x7d\xde\x78\xb7\x25\xbb\x1f\xd9\x23\x7e\xfd\
+\xce\x67\xf0\xfc\x2b\x1f\xc1\xcd\x77\x3e\x01\x67\x9c\x77\x21\xbb\
+\x37\xeb\x50\x80\x96\xcc\x40\x48\x94\x47\xae\xbe\xf9\x31\x78\xe2\
+\x99\x77\xe1\xa9\x17\xde\x87\x67\x5f\xfa\x10\x6e\xbc\xa3\x31\xbf\
+\x17\xf0\x9c\x0b\x26\xc6\x76\x14\x55\xb2\x7a\x01\x82\x8b\x2e\xb9\
+\x05\x1e\x7f\xb6\x09\x3c\xf5\xfc\xbb\xf0\xf4\x0b\x4d\xe1\x5f\x37\
+\x3e\xcc\x41\x07\xfb\x9c\x9c\x74\xaa\x0e\x4f\xb0\x9f\x35\xa6\xe7\
+\xfe\x08\x6e\xb8\xad\xb1\x05\x88\xac\x52\x9a\x52\x9e\x0b\x51\x09\
+\xa8\x01\xbd\xb6\x56\xf3\x22\x78\xf1\x8d\x16\xf0\xc2\x6b\xcd\xe0\
+\x45\x76\xce\xae\xb8\xfe\x21\x8b\xc5\x88\x9f\xbf\xe2\x5d\xb2\x8d\
+\x9f\x79\xe0\x57\xce\x4d\x10\xac\xb5\xa0\x01\xd7\xbb\xa3\xa8\xfc\
+\xfd\x17\x82\x69\x10\x32\x3f\x20\x2d\xd3\x31\xd9\x74\x6a\x00\x42\
+\x5a\x79\x0c\x87\xf0\x10\xbb\xf9\x8e\xea\xd4\x3d\x4d\x64\x6c\x73\
+\x10\xc3\xc3\x4d\x4f\xd0\x75\xb2\x27\x5b\x7d\x3e\x57\x26\x1c\x2f\
+\x00\xf2\xaa\x9b\x47\x3d\x32\x21\xbb\xc7\x37\xe4\x69\xf6\x91\x68\
+\x20\x4d\x0c\xfc\x87\x0f\xb9\xeb\x8f\x86\xb7\x20\x31\xe2\x2d\x6a\
+\x8a\x13\x97\x79\x05\x76\x3f\x67\x3a\x49\x55\xa6\x75\x83\x3a\x45\
+\x76\x61\xaf\x71\xbe\x22\xa8\x9d\x5c\xc3\x64\x41\xac\x15\x6c\xdf\
+\xb9\x1b\x4a\xe1\x18\x1c\x2b\x3d\x0a\x47\x4b\xd9\x57\xc7\x01\x8e\
+\x1f\x67\xff\x03\xb8\x00\x4a\xd9\xd7\xdf\x6d\xf8\x9e\x6d\x8c\x4d\
+\x58\x20\x91\x34\x77\x01\x9f\x27\x9f\xcb\xb3\xef\xca\xa7\x9c\x0f\
+\xdb\xf6\x1c\x80\xc3\xec\xef\x8f\x96\x1c\x83\x79\x8b\xbf\x85\xbf\
+\x9d\x72\x1e\x9f\x5c\x27\x33\x5e\x0a\x0c\x85\xb0\x79\xcb\x4f\xc0\
+\xff\x3b\x0e\xf3\x17\x7d\x43\x53\xf1\xb2\xab\xcb\xa1\x38\x86\x4d\
+\x73\xab\x63\x7b\x65\x59\x84\xee\xcf\x28\x65\x40\x17\x5e\x7e\x37\
+\x1c\x3e\x52\x02\x7f\xfe\x79\x14\x0e\x1f\x66\xeb\x68\x09\x1c\x29\
+\x29\x61\xaf\x5f\x02\xc7\x8e\x95\xd2\xf3\x1f\x17\xaf\x73\x5c\xbc\
+\x8f\xdd\x7b\x0f\x40\xdf\x41\xa3\xe1\xbc\xc2\x7f\x89\x9a\xbb\x52\
+\xdb\x17\x01\x3f\xa7\x7a\x91\x05\x0a\xb2\x65\x5b\x9e\x64\x28\xd8\
+\x7b\x9d\x36\x6b\x11\x7f\xbd\xc3\x87\xe1\xc8\xd1\xa3\x30\x6b\xde\
+\x52\xf6\xf3\x3a\x76\xab\x5f\x44\x6c\xea\x52\x81\xae\x21\x8d\x2c\
+\x33\xff\x28\x95\x45\x10\x18\x65\x6b\x9c\x35\xd1\x2f\xfc\x37\x8c\
+\x18\x3f\x15\x0e\xfd\x79\x58\x1c\x2f\x28\xc7\x7d\x5c\x1c\xfd\x71\
+\xd8\xbb\xef\x20\xf4\xec\x3b\x8c\x05\xdf\xeb\x39\x30\xa9\x51\x1f\
+\xaa\xd0\x31\x9b\x4a\xad\x9e\x4f\x08\xa4\x4c\x13\x03\x1c\x3b\xae\
+\x7b\x1f\x7a\x11\x56\xac\xd9\xc8\xce\x0b\xbb\xb6\x78\x7d\x8f\x1d\
+\x83\xd2\x52\xb6\x8e\x97\xb2\x67\xe5\xe7\x09\x7f\xfe\xed\xaa\x75\
+\x70\xdf\xa3\x2f\xb1\xf7\x2f\x1c\x05\xad\xe1\x3e\x6a\xfb\x61\x3d\
+\xba\xee\xb7\xdc\xfb\x14\x1c\x2e\x29\xa5\x73\x5d\xc2\x9e\x6f\xd5\
+\xda\x8d\x10\xa9\xd9\xc0\x06\x50\x71\xb3\x0e\xe4\xf5\x8c\xc1\xd9\
+\x75\x2f\xb7\xde\x27\xbe\x76\xbf\x21\x63\x39\x20\xb2\x7c\x0d\xa4\
+\x96\x42\xd2\xf3\x31\x65\xbe\x41\x7d\x5b\x9c\xc9\xde\xff\xdd\x0f\
+\xbd\xe0\x3a\x63\xe2\xbb\xe3\xfc\xac\x95\xe0\x9d\xcd\xde\x67\x09\
+\x7b\xbf\x25\xec\x78\x4b\xd8\x7d\xb1\x77\xff\x21\x18\x38\x74\x3c\
+\x5c\xa0\x5f\x23\xb4\x14\xa2\xd5\x93\x3d\xf7\x15\xd7\xdf\x4f\xf7\
+\xaf\x7c\xb6\xfd\x07\x0e\x31\x60\x76\xad\xc8\xc4\x63\xf1\xae\x9f\
+\x0a\x03\xa6\x9d\x1e\x83\x4d\xdf\xff\x4c\xe7\x17\xcf\xc9\x1f\x87\
+\x4b\xe0\xa2\x7f\xdd\xc9\x3f\x23\xec\xbc\x9d\xfa\x8f\x46\x70\xe4\
+\x18\x9e\xeb\xe3\x74\x7c\x23\xc7\x4e\x11\x65\x92\x06\xa2\x0b\xc6\
+\xd6\x2e\x70\x76\x4e\x68\x40\xd8\xbf\xd7\x64\x60\xb7\x54\x7c\x2e\
+\x4b\xd8\x73\x74\xe8\x3a\x80\x97\xdb\xac\x6e\x8c\x58\x1c\xf5\xef\
+\x35\x73\xc4\xed\xff\x11\x8e\x04\xf7\xb6\x4f\xdc\x0a\xed\x6f\xcc\
+\xe6\x6e\x87\x74\x7b\x11\xb8\x3b\x87\x2a\xc2\xa4\x29\xb1\x09\x92\
+\xcb\x00\xa8\x8c\xc1\x3f\xb5\x24\xde\x39\x76\xbd\x52\x72\xfa\xbe\
+\x6c\x27\x29\xec\x87\x40\x22\x7a\x0a\x6d\x68\x7e\x36\xbb\xc9\x34\
+\x07\xba\x8f\x3b\x9b\xcf\x48\x5c\x87\xc7\x7e\xb2\x91\xc8\x06\x94\
+\x5d\x2b\x91\x88\xa6\x37\x7c\xa8\xa8\x14\x1c\xea\xe2\x84\x87\xae\
+\x76\xc0\x32\x0d\xd2\x30\x7d\xd9\x9e\x2c\xfc\x77\xb6\xc9\xf7\x1b\
+\x32\x86\x82\x62\xe9\x71\x0c\x06\x6c\xab\x3c\x7e\x84\xc1\x80\x52\
+\x65\x73\xb6\xff\x3b\x4e\xbf\x77\x1c\xe6\xce\x5f\x06\x05\x45\xd7\
+\x51\xc6\x2f\x57\x36\x0b\x62\x7f\x3b\xf9\x7c\xd8\xba\x67\x3f\x1c\
+\x39\x8e\x1b\x5c\x09\xcc\x5d\xb8\x1c\x2a\x57\xad\x25\x66\xce\x2b\
+\x2d\x69\xec\xfb\x0d\x9b\xb6\x58\xcf\xbb\x60\xf1\x37\xdc\xf4\x26\
+\xdf\xdd\xa6\xe6\x6a\x25\x73\x6c\x20\x1c\x10\x60\x26\x7e\x04\x83\
+\x3e\x0b\xc4\x87\x8f\xfc\xc9\xbe\xc6\x80\x7c\x84\x6d\xe0\x47\xa0\
+\xd4\x02\x00\x36\x90\xa1\xf7\xc0\x76\x51\xdc\xa0\xb7\xed\xd8\x0d\
+\x57\xb2\xcd\x1e\x01\x00\xcf\x78\x15\xda\xdf\xbd\x39\x88\xec\x1d\
+\x37\xfa\xd8\xc5\x37\xc3\x1f\x7f\xf2\xe0\x4f\x00\xe0\xf0\x11\x02\
+\x1d\x17\x5d\x79\x27\xa7\xd8\x5d\x8c\x01\xd5\x94\x89\xa6\x55\x2d\
+\x7d\x79\x10\x0d\xb3\xa0\xf0\xf6\xfb\x5f\xc0\xde\x83\x7f\xb0\xc0\
+\x70\x8c\x82\x30\x05\x65\x5a\xfc\x7c\x63\xf0\x2a\x3d\x6e\x07\x37\
+\xfc\x72\xdf\xfe\x83\xf0\xd2\xeb\x1f\xf1\x31\xc2\x22\xcb\xce\x91\
+\x23\x88\x05\x38\x42\x56\x26\xbf\x66\x7d\x18\x3a\xb2\x18\xfe\x64\
+\x81\xe8\xf0\x91\xa3\x2c\x00\x32\x60\xc4\x82\x1b\xbe\x7f\x09\xf0\
+\xe4\xf9\xa1\xef\xd9\xff\x63\x70\xc2\xc0\x14\x39\xab\xa1\x55\xef\
+\x27\x1d\x47\x9e\x0a\x00\x0a\xe0\xc6\x3b\x9f\x64\xef\xfb\x38\x05\
+\x3a\xf9\x7c\x03\x59\x20\xaf\xe2\x18\xfe\x25\x6a\xe2\x9a\x1d\x34\
+\xf1\xda\x9e\x59\xe7\x52\x07\x00\x18\x30\x74\x1c\xb1\x32\x52\x3f\
+\x92\x2d\x4a\x17\xf4\x18\x71\x83\xfe\x22\x2b\x38\x86\x6b\x34\x80\
+\xbb\x1e\x7c\x4e\xbe\x03\x79\x86\xac\xf3\x76\x8c\x3d\x1e\xc5\x80\
+\x89\xc1\x1f\xd7\xb1\xe3\x74\x7e\x39\xf8\x39\x0e\x3b\x77\xef\x83\
+\x6b\x6e\x7a\x88\x5f\x7b\xd2\x5c\x34\x24\x50\xf8\x65\xd7\xfe\xd6\
+\xfd\x82\x4f\x89\x2c\x4c\xb6\x6a\xb8\xa4\x8c\x4f\xce\x16\x13\x1b\
+\xb3\xaa\xd5\x86\x36\x5f\xf6\xe6\xe0\xea\x38\xbf\x96\x5d\x7b\x0f\
+\x81\xca\xb9\x75\xa0\xb2\x56\x97\xae\x79\x8d\xb3\x1b\xb2\x73\x86\
+\xaf\xcf\xaf\xef\x28\x76\x9e\x39\x58\x6a\xc0\xdf\x4f\x24\xde\xb0\
+\x49\xb6\xa0\x9e\x71\xfe\x3f\xf9\x67\x95\xce\x77\x29\x1d\x23\x96\
+\x62\x7c\x9d\x56\x23\x99\x9c\x41\x10\x34\xf9\xd4\x03\x1b\x94\xfd\
+\xd5\x56\x38\xe3\x42\xbf\xcc\x9c\xf7\x4a\xe5\xfd\xa6\xc3\xae\x5e\
+\xd9\x78\x1a\x29\x08\x00\x50\xdd\xd7\x92\x05\x53\x23\x5e\x99\xad\
+\xe9\x4e\xc5\x77\x9c\x78\xc5\xf0\xe8\x07\x76\xcd\x0c\xcf\x33\x7d\
+\x04\x83\x65\xad\xc7\xf8\x80\x80\x88\x1e\x40\x50\x99\x8c\xd2\xf7\
+\x10\x3d\x69\x7a\x12\x27\xc2\x74\x7b\x4e\xed\x91\xaa\x58\xab\x6c\
+\xfc\x62\x53\xda\xec\x4b\x31\xdb\x29\x2d\xa1\xcc\x08\xb3\xb8\x61\
+\x23\x27\x42\x9f\x01\xa3\x60\xd4\xb8\x29\xb0\x7a\xcd\x06\x38\xc2\
+\x02\x07\x85\x89\x52\xbe\xf9\x94\xb0\xdf\x7f\xed\xad\x4f\x69\xc3\
+\x93\xb3\xeb\xb3\xab\x22\x03\x50\x0b\xb6\xed\x3d\x48\x19\x17\xdb\
+\x72\x61\xde\x62\x04\x00\xb5\x79\x4d\x3f\x5f\xa1\x70\xd9\x46\xff\
+\xdd\xc6\xcd\x0e\x00\x40\x9b\x7c\x7e\xcc\xa7\x85\xcc\x1e\x29\x6d\
+\xb5\xe1\x09\x45\xf6\xc5\xff\xba\x87\x6d\xa8\xc7\x58\xd0\xff\x13\
+\x8e\xb2\xc0\x8f\x19\xf2\xce\xdd\x07\x58\x96\x7f\x90\x05\xc9\x43\
+\x2c\x7b\x3b\x48\xeb\xe0\xa1\x3f\xe8\xfd\x1d\xa3\xc0\xc0\x37\x7f\
+\x8c\xa4\xbf\xef\xdc\x0d\xe7\x16\x5e\x05\x39\x35\x8a\x38\xc5\x9b\
+\xdf\x90\x07\xee\x3c\x3b\x73\xa7\xc7\x5c\x51\x76\x60\x40\xa7\x67\
+\xdf\x11\x14\xf4\x39\x00\x38\x22\x58\x80\x12\x18\x3c\x7c\x22\x3f\
+\x56\x0c\xc8\x91\x06\xb6\xa0\x8e\x00\x80\x6e\x79\xf9\x73\xc1\x60\
+\x3d\x38\x29\xbf\x10\xfa\xb3\x80\x59\x82\x41\x8a\x05\xa4\x23\xc7\
+\x78\x86\x8a\x9b\xfb\xaf\xdb\x76\xc0\xfc\x45\xcb\x61\xea\x8c\xf9\
+\xb0\xf4\xeb\xd5\xec\xfd\xec\xe7\x91\x1f\xf8\x71\x4b\x36\xe3\xfa\
+\x5b\x9f\xe0\xa0\x45\x4c\xfd\xe3\x6c\x5b\x94\x9e\xff\xd4\x73\x1a\
+\xc2\x92\xaf\x56\x11\x43\x72\xe4\xf0\x51\x76\x1d\x4b\xd8\x39\x3a\
+\xca\xd6\x31\xf8\xe1\xa7\xad\xb0\x6c\xf9\x6a\x58\xbe\x62\x1d\x6c\
+\xff\x7d\x27\x7f\x6a\xb0\x01\x01\x06\xc9\x05\x8b\xbf\x85\xbc\x9a\
+\x26\x05\x7b\x0c\x70\xb2\xcb\x41\x6a\x01\x6e\xbc\xf3\x09\x2b\x93\
+\x2d\x95\x60\x82\x3d\x3c\xff\xea\x87\xb6\x27\x83\x26\x8c\x92\x72\
+\x05\xf3\x11\xe1\xd9\xf6\x59\xb5\x2f\x55\x80\x65\x29\x0c\x1a\x36\
+\x9e\xfd\x7e\x3d\x02\x00\x76\xf9\x42\x9c\x2f\xcb\x19\xd4\xa5\x58\
+\x8f\x70\xc6\xe6\xce\x07\x9e\x55\x9e\x0b\x18\x38\x3b\xcc\x32\xfc\
+\x3f\x60\xcf\xbe\x43\xb0\x8b\xdd\x03\xbb\xd9\xda\xc3\xbe\xdf\x7f\
+\xe0\x30\x1c\x25\xa0\x42\x10\x41\x04\xf7\xe3\xb0\x63\xe7\x1e\xf8\
+\x47\x9d\xab\xe8\xda\x67\x57\xbf\x90\xad\x06\x50\xe3\x9c\x8b\xe0\
+\xa7\x5f\xb6\x72\x16\x81\x40\x63\x29\xdc\x7e\xcf\xd3\x5c\xf3\x90\
+\x5b\x4f\xe8\x06\x74\x2a\x43\x71\x31\x68\x3d\x06\x46\xef\x24\x90\
+\x25\xc1\xdb\x6f\xec\x1a\x9e\xc6\x32\xfe\xca\x02\x90\xa1\x4e\xa5\
+\xfa\x99\x0d\xd8\x75\x76\x02\x80\x2a\x74\x6f\x0b\xed\x87\x18\x11\
+\xcd\xef\x9d\xfa\x16\xd8\xc5\x32\xcc\xdf\xcf\xbb\x98\xee\xe1\x92\
+\x63\x47\x09\x64\x74\xec\x26\x00\x80\xa6\x5b\xbf\x67\xdd\xaf\x62\
+\x4f\xcf\x3a\x61\x13\xfe\x12\xfb\x0e\xfc\x75\xa6\xfc\x55\xb4\xb7\
+\x80\x79\xe2\x01\x40\x58\xf3\x1e\xc8\x11\x4e\xe8\x58\x94\xca\x44\
+\x2e\xbf\xf1\x9f\x46\x0a\x35\xff\xa0\x4a\x7f\x23\x89\x63\xa0\x91\
+\x21\x54\x6b\xb8\xc4\x48\x7e\xb5\xfe\x78\xb0\x14\xd2\x8c\xd4\xde\
+\xbf\x96\x18\x6c\x25\x77\x10\x33\x12\x08\x0a\xb9\x60\x09\x85\x6b\
+\xab\xd6\x6d\x66\x9b\x09\x0b\xfc\x25\x47\x29\xc8\x3f\xf8\xe8\x2b\
+\x94\xc9\x93\xa0\x4e\x50\x8a\x55\xd8\xfb\x3d\x9f\x05\x48\xac\xd7\
+\xff\xba\x75\x07\x05\x8f\x51\xe3\xa7\xb1\x63\xac\x43\x41\x26\xdb\
+\x0a\x0e\x6c\x31\x40\xb0\x8b\x05\x60\xce\x1f\xb0\x00\xb2\xe4\x1b\
+\x2e\x0a\xcc\x17\x3e\xf8\xa2\x1c\x91\xc5\x32\xa2\xb5\xeb\x37\xd1\
+\x46\x89\x1b\xe1\xbc\x45\xdf\x70\x3a\x3c\x81\xf1\x4c\x8e\xc3\x21\
+\xcf\x14\xe2\xbc\x18\x5c\x7a\xcd\x7f\x58\x66\x27\x32\x3c\x06\x04\
+\xde\x69\xfa\x39\xe4\xfd\xdd\x84\xbc\x33\xea\x43\x84\x65\xbf\xf9\
+\x6c\xc3\x95\xeb\x1f\x75\x2f\x87\xc7\x9e\x79\x9b\x05\xbf\xdf\xac\
+\x60\x87\xff\xa1\xee\x21\xa7\x7a\x4c\x00\x80\xfa\xca\xb4\x3c\x45\
+\xd9\x9d\xcb\xb3\xf7\xb3\x6b\x5f\x06\xfb\x0e\xfc\xc9\xb3\xfe\xa3\
+\x47\xa8\x0c\xf0\x27\x02\x80\x23\x47\xe0\xd0\x1f\x47\xe0\x02\xe3\
+\x3a\x51\x2e\x68\x44\x81\x99\x8b\xfa\x78\x76\x9e\x2d\xda\xe5\x48\
+\x68\xc9\x02\x49\xbb\xce\xfd\x28\x70\xe2\xff\x21\x08\x40\x00\x30\
+\x69\xea\x5c\xb8\xf2\xda\xfb\xa0\x6a\x8d\x7a\x74\x3e\x43\x6c\x85\
+\xd9\x26\x5f\xe3\xec\x06\x74\x7d\xbe\x5d\xb9\x56\xe6\xb8\xd0\xb9\
+\xe7\x20\x96\x6d\x8b\xcc\x35\xdf\x6e\x57\xe4\xd7\xbf\x1e\x4c\x9d\
+\xb9\x98\x8e\x0b\xaf\x2d\xae\x43\x7f\x1c\x86\x2e\xdd\x07\x83\xd1\
+\xf0\x06\x06\x3e\x78\xb6\x8d\x41\x59\x3b\xbd\x08\xae\xbc\xfe\x3f\
+\x30\x7a\x4c\x31\x01\x3c\x0c\xfe\xc7\x58\x90\x41\x16\x65\x34\x66\
+\xbe\xd5\x2e\xb0\x82\x1e\x05\x3e\x21\xfe\xbc\xe9\xee\xc6\x82\x91\
+\x50\x8b\x16\xc7\x59\x00\x3e\x02\x97\x5e\x7d\x0f\xff\xdd\x6a\xfc\
+\xfe\xe0\x9d\x35\x51\xcb\x5d\xf1\xcc\x0b\x2e\x55\xb9\x25\x18\x38\
+\x74\x1c\x17\x51\x12\x00\x88\xda\x9a\x03\x4b\xd0\x66\x3a\xed\x74\
+\x65\x86\xcb\xde\xef\xed\x0f\x3c\x2d\x8a\x18\x9c\xbd\x78\xea\x85\
+\xb7\xd9\xf5\x8f\xb1\x65\x82\x86\xf7\xc2\xe9\xf8\x75\x11\xdd\x03\
+\xe7\x16\x5c\x05\x4f\xbd\xf8\x1e\xfc\xb6\xfd\x77\xf1\xd2\xfc\x2f\
+\xdb\x76\xe8\x2d\x44\xae\xec\xba\xb1\x95\x53\x1d\x99\x85\xe7\x6d\
+\xe6\x85\x81\xc6\x8d\x9b\x7f\x84\xaa\xa7\x46\x39\x9d\x2f\x84\x84\
+\x52\xe8\x17\x62\xf7\xf4\xe2\x65\xab\xd8\xfd\x8c\x60\x99\xb3\x21\
+\x0f\x3c\xfe\xaa\x9d\x85\x0b\x67\xca\x1a\x67\x37\x62\xf7\xaa\x7d\
+\xce\x10\x00\xf0\xb6\xd3\x06\x1e\x1d\x18\xe2\x7d\x0a\xe6\xe8\x8c\
+\xf3\x2f\xa1\xf2\x41\x09\x81\xf5\x12\xe8\xd4\x7d\x20\xef\x42\xc9\
+\xd3\x1d\xf3\x19\xc2\x79\x2e\x41\xe4\x09\x0d\x7a\xff\x3b\x0c\x40\
+\xf9\x1f\xab\x91\x29\x06\xc0\x0c\x26\xd6\x48\xf5\x40\x22\xea\xbc\
+\x77\x33\x41\x50\x37\x12\x78\x4f\xbb\x07\xe2\xc4\x9c\x74\xb6\x66\
+\xb8\xea\xde\xd1\x00\x62\xb8\x44\x02\x93\x54\x3c\x9f\x3d\xb2\x75\
+\xcd\x55\x5f\x0e\x3c\x2f\xc1\xf0\x01\x25\xf1\xe2\x9b\x90\x9f\xf3\
+\xa2\xa3\x57\x5d\x0d\xfc\x7e\xd3\xff\xf4\x24\x8a\x5e\xd3\x17\x5d\
+\xab\xda\x0d\x04\x24\xa7\x9e\x73\x21\xd1\xb7\x98\x6d\x22\x55\x5e\
+\x3c\x6d\x2e\xfc\xed\x14\x54\x73\xa3\x5a\x5a\x08\xa2\xb4\x22\xeb\
+\xb8\x70\x73\x3e\xe3\xbc\x8b\xa0\x5b\xdf\x91\x94\x59\xca\x76\xbf\
+\x6c\xcd\xb6\xc1\x0d\xe7\xd5\x81\x3d\x7b\x0f\x58\xb5\xd3\x45\x4b\
+\xbf\xe5\x81\x1d\x83\x6b\x75\xc3\xfa\x3d\x64\x05\x56\xaf\xdd\x48\
+\x34\x2c\x66\x32\x73\x17\x2c\x27\xa0\x10\xf6\xea\xdb\x97\xf4\x3b\
+\xd5\xd4\x4d\xbb\x35\xaf\xba\x49\xb5\xef\xcb\xae\xb9\xdf\xa2\xc5\
+\x71\x53\x7d\xe7\xfd\xd6\x96\x39\x4f\x96\x6c\xc1\xca\xe5\x8f\x95\
+\x45\xf0\xad\x6b\x5e\x43\xc1\x50\xfe\xb7\x8d\x65\xc0\x39\x2c\x20\
+\x72\x86\x41\x99\xc8\x17\x11\x35\x7b\x21\x3a\x44\xf1\xdb\x67\xad\
+\xba\x89\x4c\x9a\x07\xff\x26\xef\xb6\x60\x00\x00\x83\xec\x9f\x94\
+\x5d\xb7\xef\xd4\x8f\x81\x26\x3c\xce\x86\x36\x00\xb0\x6a\x89\xba\
+\x18\xe6\x53\x08\x97\xb1\x20\x4f\x54\xb0\xa0\xfb\x31\xb3\x6b\xda\
+\xac\x0d\x7b\x8d\xda\x76\x59\x25\x57\xd0\xee\xa2\x96\x9b\xc3\x9e\
+\xaf\xda\x19\x0d\xa0\x43\xe7\xbe\x30\x76\xe2\x4c\xa8\x7a\x1a\x9e\
+\x87\x46\x94\xb1\xe6\x08\x06\x20\x5b\x00\x98\x67\x5e\xf9\x80\xea\
+\xd8\x08\x52\x70\x61\xcd\xfb\xb6\xbb\x9f\x84\xca\xa7\x88\x60\x2e\
+\x9e\x57\x5a\x05\x93\x10\x8d\xfd\xec\x91\x27\x5e\x83\x83\x87\x0e\
+\x53\x96\x59\x72\x8c\x65\xcc\x47\x4b\xe0\xc9\xe7\xdf\x81\xac\xaa\
+\xf5\xac\x36\x3f\xee\x6f\x10\x83\x5b\xef\x7d\xca\x0e\xfe\x78\xfe\
+\x2d\x86\xe8\x28\x6c\xda\xf2\x0b\xd4\x38\xab\x01\x31\x26\xfc\x3e\
+\x91\x2d\x7d\x3c\x73\xaf\xc9\x82\xd9\x71\x85\x01\xe8\x3b\x68\x8c\
+\xe8\xdc\x28\x10\x7e\x0e\x31\x9f\x59\x02\x8a\x59\x51\x3e\x07\x13\
+\x77\x30\x00\x70\x5c\xa9\x8d\x3f\xf6\xcc\x5b\xa2\x3d\xb3\x90\x77\
+\x6b\xe4\xca\x99\x09\x08\x7e\xeb\x53\x5b\x60\xa3\xcb\x6f\xa7\xd2\
+\x05\x67\x03\x8e\xc3\x96\x1f\x7e\xe1\x0c\x05\xb2\x00\xb4\x1a\xd1\
+\x39\x19\x31\x66\x32\x67\x5c\x4a\x8f\xd0\xfb\xfa\xf8\xd3\x8e\xec\
+\xfe\xad\x23\x74\x2f\xb8\xea\x50\x27\xc8\x53\x2f\xbd\x47\x41\xb9\
+\xb4\xf4\x30\x81\x85\x69\xb3\x16\x0a\x0f\x08\x7c\xae\x06\x56\x1b\
+\x67\xf5\x73\x1a\x51\x1d\x5f\xfe\x37\x72\x6c\x31\x89\x62\xd5\xb9\
+\x0d\xea\x28\x6d\x52\xd9\x6b\xbc\x95\xf6\xf4\xf3\xff\x09\x47\x4a\
+\x81\x97\x89\xb0\xbc\xc0\x00\x20\xbf\xcf\x63\x5c\xd0\x9b\x6f\x28\
+\x6d\xbe\xce\xe4\x25\x14\xc9\xa4\x81\x5c\x26\x82\x9f\x09\xa9\xa8\
+\xe1\x4f\xdc\xb1\x66\xf2\x18\x82\x1a\xba\x29\x9a\x0b\x2d\xd0\x34\
+\x40\x3f\x03\x9d\x4c\x9e\x90\x64\x81\xd9\xdd\x6b\xef\x9a\xab\xae\
+\x19\x2e\xd3\x9f\x04\x02\x38\x47\x5f\x7d\x50\x74\x69\x24\xf4\xf0\
+\x57\xdb\xff\x48\x98\xa8\xf8\xb2\x5b\xd4\x7b\xdc\x6b\xea\x09\x66\
+\x1e\xc4\x12\xd8\x7e\x9a\x2e\xb3\x19\xfb\xb9\x54\xff\x81\xb0\x43\
+\x08\xe9\x32\x44\xd2\x74\x4f\x63\x8f\x44\xd3\xc6\x82\x82\xbd\x2c\
+\xf6\xb3\x5a\xfa\xd5\x3c\xfb\x14\x6b\xc0\xa0\xd1\x6c\x53\xc3\x63\
+\x95\xed\x46\x45\x4a\xc7\x04\x17\x38\x11\x35\x5b\xad\x9e\x1d\xf8\
+\x45\xf0\xe7\x43\x6e\x30\x40\xd5\x23\x81\x9d\xfc\x6f\xf1\xb2\x15\
+\x54\x3f\xa6\x8d\xa9\xba\x21\x6c\x6b\x0b\xe0\x6f\x27\xd7\x82\x15\
+\xab\xd7\x53\x3d\x1a\x03\xcc\x9c\x05\x5f\xf3\xd6\x41\x6a\x93\x8a\
+\x9f\xa7\x20\x83\xb2\xcd\x00\x14\xb1\xe0\x5f\x04\x27\xd5\xa8\x0f\
+\x97\x5f\xfb\x80\x43\xa7\xf0\xde\x47\x6d\x15\xb1\x52\xd4\x6e\x99\
+\xb2\xda\xd7\x38\x5d\x3b\xb1\x78\x26\x6d\xfe\x94\xed\xb2\x1d\xf9\
+\xcc\xda\x97\x58\x5e\x15\xb8\x72\x34\x97\x61\x0f\x3b\xae\x6a\xa7\
+\xc5\x18\x58\xd8\x43\xc7\x8d\x6b\xc6\xcc\x45\x90\x75\xf2\x39\xb0\
+\x7e\xe3\x8f\x94\x69\x97\x88\x40\x5b\xb3\xd6\xa5\x54\x97\xc7\xc0\
+\x6c\x03\x00\xc5\x04\x87\x1d\xc7\xb4\xd9\x8b\xb8\x50\x8c\xea\xd2\
+\x25\xa4\xf2\x0f\x51\x49\xa5\xc0\xaa\x85\xcb\x21\x40\xfc\xfc\x22\
+\xe0\x61\xa0\xa2\x46\x23\x38\xe9\xd4\x86\xa0\xd5\xbc\x18\xaa\xb0\
+\xaf\x11\x14\xa0\x28\xae\x8a\x05\x8c\x1a\x42\xb5\xbf\x17\xc1\xcf\
+\xbf\x6e\x23\x70\x87\xa0\xe4\xc8\x91\x63\xf0\xf0\x93\xd8\x91\x51\
+\x5b\x00\x37\x7e\x5e\xc2\x0e\xe7\x3c\xd1\x76\xc7\x82\xd9\xc3\x4f\
+\xbc\xc2\x40\xc3\x31\x06\x20\x50\x33\x70\x04\x7e\xfa\xed\x77\x96\
+\xf9\xea\x74\x1e\x79\x10\xe7\x7a\x8d\xdb\xef\x7d\xc6\xa1\x0f\x21\
+\x36\xe9\x28\x03\x33\x54\x66\x38\x0a\xa3\xc7\x4d\x27\x46\x29\x5b\
+\x69\xb3\xe3\xe5\xa7\x18\xd4\x3c\xef\x9f\xb6\xc8\xf1\x78\x09\xf4\
+\x1a\x30\x0a\x2a\x57\x93\xd4\xba\x01\xea\x74\x51\xa7\x80\x56\x29\
+\xbf\x09\x60\x80\x00\xa0\x54\xd0\xf4\x08\x7a\x1e\x7b\xe6\x4d\x21\
+\x80\x14\x1d\x10\xb2\xff\x9f\xfe\xbe\x88\xbd\x7e\x11\xdd\x67\x8b\
+\x97\x7d\x2b\xee\x7f\x7e\x0f\x20\x63\x14\xa2\x76\xbb\x06\x04\x02\
+\xf0\x73\x70\x4e\xbd\xcb\x61\xc7\xee\xbd\x0c\xd8\xb0\xc0\x7e\xec\
+\x4f\x38\x70\xf0\x10\x44\xeb\xdf\x20\x4a\x01\xb5\xa9\x0c\x86\x34\
+\xff\xd6\xed\xbb\xd8\xb9\x42\xe0\x74\x84\x84\x9c\xd1\x46\xff\x16\
+\x9a\x92\x46\x02\x00\x70\x76\x09\x81\xb7\x85\x99\xd8\x17\x23\xc6\
+\x14\x0b\x61\x68\x4c\x98\x47\xd9\x63\xbc\x73\x84\x4f\x04\x2f\x1b\
+\x15\x32\x00\xfe\x4f\x2e\xce\x15\x85\x9a\x6e\xbd\x87\x88\x0e\x0d\
+\x53\x88\x24\xf5\xb8\x36\xd1\xe4\xa3\xdd\x4d\xd7\xe0\xb5\x58\x42\
+\xc1\x74\x28\xed\x32\xaa\xff\x04\xd0\xc4\x7f\x67\xa4\xe9\x7e\x6b\
+\x9e\x60\x15\x7f\x66\xc6\x24\x53\x1b\xe0\x5f\xe7\x20\x83\x00\x0c\
+\xdd\xe1\x28\x67\x8d\xf6\xd5\xf4\x78\xf5\x6c\x52\x7b\xd6\x64\xa2\
+\x43\x3f\x77\x3d\xc3\x07\xc9\xb9\x84\x7a\xbe\xf3\xe1\x93\x95\x18\
+\x8c\x24\xe7\xce\xa5\x4d\xd0\xa4\x4b\x9b\xae\x78\xb5\x47\x5d\x63\
+\x8f\x5d\x5f\xfb\xb8\xe7\xf9\x9e\x8b\x48\x70\xe0\x87\x1f\xe2\x1a\
+\x67\x5f\x68\xd5\x6f\x71\x43\xd9\xb9\x6b\x0f\xd4\x2a\xbc\x8a\x07\
+\x83\x3c\xbe\x11\x86\x05\x02\xa5\x63\x96\x9b\x69\x2e\x06\x81\x42\
+\x52\xf2\x87\x2d\xd7\xb7\x18\xa9\xb1\x4f\xaa\x1e\x25\x06\x40\xfe\
+\xb7\xe4\xab\x15\x90\x15\xa9\x47\x1b\x78\x16\xcb\x86\xa8\x47\x9e\
+\x05\xdf\xbf\x9d\x74\x2e\xac\x58\x25\x01\x00\x32\x00\x5f\x73\xdf\
+\x01\x2a\x29\x44\x1d\x63\x7b\x65\x90\xca\x11\xc3\x78\x6c\x06\xa0\
+\x3e\xe4\x20\x00\xb8\xce\x0d\x00\xda\x71\x45\xb7\x38\xf7\x96\x47\
+\x81\x55\x7b\xe7\xe2\xb8\xce\xdd\x06\x58\xd9\x2a\x6a\x08\xea\xd5\
+\xbf\xde\x3e\xff\x56\xe0\x37\x78\x06\x86\xbd\xe3\x2c\x20\x3f\xf5\
+\x42\x53\x16\x54\x8f\x8b\xfa\x6d\x29\xfc\xe7\xa1\x97\xe0\xff\x61\
+\xc0\xe5\x95\x37\x5a\x10\x90\x91\x42\xb8\x8f\x3e\xf9\x52\x78\x09\
+\x34\x10\x19\xb9\x69\x59\xfc\x62\x10\xd0\x1b\xdd\x24\xb2\x38\x16\
+\x64\x59\xd0\xfc\x8e\x01\x88\x53\x6a\xe8\xa2\x55\xac\xd0\xea\x14\
+\xb0\x16\x9e\x03\x32\x06\xaa\x4f\x00\x20\x5c\xe3\x22\xf6\xf5\x45\
+\x14\xec\x89\x15\xc9\x13\xee\x85\x82\x15\x79\xe0\xb1\x57\x79\x1d\
+\x9f\xbd\x06\x96\x45\xc6\x4c\x98\x41\x99\x6a\x28\xb7\xd0\x36\xa5\
+\x71\x01\x00\xb2\xeb\x46\x80\x84\x82\xb5\x53\xce\x87\xb1\x93\x66\
+\x8a\x8c\xf6\x28\x3b\xd6\x63\xf0\xe0\xe3\xaf\x59\xed\xa4\xd4\xca\
+\xc9\xde\xcb\xad\xf7\x3c\x63\x95\x00\xf0\xb5\x7a\xf7\x1b\x06\xdf\
+\xff\xf8\x1b\x1c\x3d\xc2\x01\x40\x09\xbb\xb6\xef\x7d\xd4\x86\x83\
+\x47\x61\x45\x4d\x76\xc1\xec\x7c\x9e\x79\xde\xc5\x16\x00\x2d\x2d\
+\xe5\x00\x20\x2b\xb7\x40\xe9\xc7\x37\x7c\xe6\x13\xc4\x94\x8e\x21\
+\x7e\x6d\x6f\xbb\xef\x29\x5e\x06\x62\xf7\x13\x02\x97\x47\x9f\x7e\
+\x43\x00\x56\xe1\x10\x89\x3d\xf2\xb2\x75\x4d\x43\x00\x60\x12\x00\
+\x18\x39\x6a\x92\xe8\x80\x28\xa5\xac\xfc\x4c\x06\xdc\xb2\xac\x4e\
+\x13\x93\x58\x30\x7c\x9d\xc7\x9f\x7d\x8b\xee\x93\xd2\x63\x7f\x40\
+\x69\xc9\x9f\x30\x6b\xee\x62\xf6\x79\xb8\x80\x01\x96\xba\xd4\xe6\
+\x3a\x68\xe8\x78\xba\xfe\x47\x11\x00\xb0\xdf\xfb\xb0\x79\x07\x6e\
+\x89\x2c\x7b\xf7\x45\xab\x2d\x32\x42\xd5\xd9\xe7\xae\x54\x01\x00\
+\xc3\x47\x33\x00\xc0\x8e\x35\x47\x30\x24\x61\x59\xc7\xb7\x66\x5b\
+\xe8\xf4\x79\xc3\xf3\x82\x00\x40\x65\x0f\xba\xf7\x19\x6a\x39\x1f\
+\x86\x1c\xe6\x48\x5e\x2a\x7a\x57\x0b\xb6\x00\xb6\xa1\x14\x33\xdc\
+\xd0\x09\xa2\xc1\xd3\x13\x75\x1b\x7f\x21\xea\xdf\x48\x91\xf9\xb0\
+\xbb\xea\x2a\xfd\xaf\x89\x1e\x6c\x87\xb3\xa8\xb0\x01\x8e\x77\xc8\
+\xe2\x1f\x62\x23\x81\xf9\x50\x32\x11\x9f\x57\x0d\x5e\xf7\x9e\xb6\
+\xa4\x79\xdb\x64\x5a\xad\x76\x32\xe0\x68\x51\x8f\xd7\x34\x20\xf8\
+\x18\x47\xb7\x30\x31\xe6\x1c\x7c\xa4\xe9\x3e\xc6\x41\x1e\xac\x88\
+\x97\x28\x32\x03\x37\xa8\x6d\x64\x54\xc8\x82\xf0\x77\x14\xc8\x24\
+\x87\xfb\xdb\xb6\xdf\xa9\x87\x1f\xfb\xbb\xab\xb0\x63\xcc\x91\xc7\
+\x23\xdd\xee\xa4\x40\x2b\x97\x8b\xc1\xc2\x11\x91\x9d\xa2\x69\xcd\
+\xa9\x0d\x18\x00\xd0\x19\x00\xd8\x6f\xd5\x82\x97\x7c\xbd\x02\x2a\
+\xe7\xd5\x15\x76\xb5\xc2\x41\x0e\x29\x53\x01\x00\x8e\x96\x70\x51\
+\x1a\x76\x0b\xc8\xec\xd4\xdd\x1a\x1a\x76\x8c\xc8\x2d\xb2\xb5\x00\
+\x3e\x00\xa0\xe9\xc7\xed\xb8\x5b\x9f\xf2\x01\x0a\x69\x36\x8b\x81\
+\xef\xe3\xff\x9c\x72\x01\x8c\x9b\x38\x83\x6f\xda\x2c\x73\x3f\xcc\
+\x82\x46\xcd\x0b\x2e\x55\xea\xcd\x76\xc7\x81\x35\xed\x4f\xab\x03\
+\xab\xd6\x6c\x10\x19\x23\xb0\x8c\x6f\x27\xcb\xc0\x75\xa8\xcc\x9e\
+\x1b\x95\xf6\xbb\xf7\x1d\xb0\xce\xe5\x8e\x1d\xbb\xd9\xcf\x1a\x91\
+\x40\x4d\x52\xf2\x61\xd9\x62\xc8\xd6\xbb\x1f\xb5\x16\x81\xef\x18\
+\x65\xac\x2f\xbe\xfe\x31\xa7\xbe\x35\xfb\xbc\x66\x5b\x00\x40\xe7\
+\x7d\xff\x64\x49\x5c\x9f\x9c\x01\xf9\x6a\x28\x40\x91\x98\x2e\x28\
+\xba\x0f\xaa\xb0\x6b\x31\x6c\xe4\x24\x2e\xe5\x3b\xce\xdb\xcd\xae\
+\xb8\xee\x7e\xcb\x96\xd9\xdd\xd2\xab\xb6\xd2\x86\x04\x3b\x82\x14\
+\xf7\x75\xb7\x3c\x24\x00\xe2\x31\xba\x96\x83\x47\x4c\xe0\x20\x33\
+\xdf\xb4\x6c\x77\x6f\xb9\xf3\x69\xab\x45\x14\xd9\x86\x16\x9f\x75\
+\x82\x8b\xaf\xb8\x03\x0e\x1e\xfc\x93\x80\xcd\xb1\x63\x1c\xe0\xdd\
+\x7e\xdf\xb3\x7c\xa2\xa2\x05\x00\x0a\xe0\x2c\x06\x00\xb0\x49\x03\
+\x81\x03\x76\x8c\xf4\xe8\x37\x52\x18\x37\x19\xca\xe4\x45\xc3\x35\
+\xc3\xc3\x69\x12\xc4\xcb\x3b\x85\x70\xcb\xbd\x8d\x49\x58\x47\x6c\
+\x07\xbb\xa6\x8f\x3e\xa5\x00\x80\x3c\x69\x02\x65\x5a\xec\x5f\x28\
+\xd7\x80\xbf\x31\xc0\xb9\xec\xeb\x55\xa2\x04\x83\x40\xac\x14\xf2\
+\x4e\x37\x45\x6d\x3f\x2a\xd8\x42\x53\x98\x4c\xd5\x21\xbf\x84\x63\
+\xc7\xfe\x84\xe3\xc7\x0e\x51\x90\x6f\xfc\xdc\x3b\x64\x98\x75\xfb\
+\xbd\x4f\x13\x80\xe4\x5a\x9a\x12\xf8\x86\x7d\xa6\x4e\xca\x17\x1d\
+\x0c\xf4\x9e\xeb\x0b\xbf\x0d\x2e\x32\xad\x7e\xce\x45\x0e\x00\x30\
+\x62\xcc\x14\x02\x00\x24\x92\x14\xfb\x66\x8e\xea\x19\xa1\xd9\x8e\
+\x8e\x35\x6b\xfd\xd3\xd1\x9d\xd3\xbd\xcf\x30\x7e\x4e\x23\xdc\x43\
+\x43\x15\xcb\x3a\x83\xb6\xa1\xd8\x22\x1b\x3e\xc3\x8b\x2a\x2a\xa8\
+\xa7\xf3\xbb\xc2\x13\x21\xe5\xe9\x7b\xfa\x09\x2c\x23\x64\x4a\x34\
+\x68\xfc\x2f\x00\x00\x7f\xcb\xde\xb0\x2b\xb0\x85\xe3\x54\xf1\x5e\
+\x28\xc9\xaf\xdc\x60\x78\xcc\x30\x90\xd3\xf6\x5c\xee\x7b\x9a\xdd\
+\x73\x6c\x67\x95\x46\xbc\x39\x91\xfa\x61\xd0\xfc\xc6\x96\xa6\x83\
+\x28\x15\x20\x20\xc7\xbf\x6a\xaa\x53\x9b\xfa\xa8\x5b\x80\x24\x9c\
+\x70\xb4\x68\x22\x06\x22\x58\x0b\x0b\xdf\x58\x1b\x50\x36\x72\xdf\
+\x43\x2f\x5b\x59\x98\xba\xb3\xa0\x92\x79\xe5\xda\xf5\xd0\xb1\x6b\
+\x7f\xb8\xf7\xc1\x17\xa0\xe6\x79\x17\x51\xed\x18\x37\x42\xd9\xbf\
+\x1e\x16\x3d\xda\x3c\x3b\x65\x99\x27\x32\x00\x2c\x20\xee\xde\xb3\
+\xdf\x7a\x9e\xa5\x5f\xaf\xe4\xed\x4f\x79\x8a\x7d\x2c\xb6\x0b\x9e\
+\x74\x1e\x07\x00\x82\x2a\x9e\xb7\xe8\x5b\xda\x4c\x79\x86\xea\x04\
+\x43\x61\x65\x50\x0e\xef\xff\x76\x02\x80\x2b\xae\x7f\x40\x91\x92\
+\x01\xbc\xfb\x71\x5b\xee\x9f\x1f\xa9\xaf\x4c\xef\x13\xe2\x3b\x6c\
+\xbd\x63\xc1\xad\x8e\x71\x15\x09\xf9\x10\x00\x1c\x39\x72\x18\x7e\
+\xfe\xf5\x77\x41\x55\xdb\x36\xd0\x39\x4a\xb6\x89\x82\x48\x34\x42\
+\x3a\x7e\xdc\x16\x6f\x7d\xd1\xae\x07\x0f\x6a\x58\x2a\x61\xe7\x01\
+\x8d\x7b\x2c\x59\x21\xfb\x9f\xe7\x5e\xfe\x40\xb4\x16\x4a\x51\x21\
+\x37\x16\xc2\xb6\x3d\x6c\x29\xe3\x7d\xf7\x25\xd4\x97\x7f\x01\x3b\
+\x1e\x8b\x15\x8a\x48\x76\x25\x4a\xb5\xe1\xc8\x19\x28\x64\x6c\x08\
+\x11\x5c\x35\x91\xfa\x6f\xc0\x56\x43\xc8\x3b\xa3\x01\xe4\xb2\x80\
+\x55\xb5\x86\x41\xc0\x01\xaf\x05\x17\x2d\x16\xc0\xa6\xef\x7f\x24\
+\x71\x1b\x82\x80\x9d\xbb\xf6\xb2\xd7\x8c\x5a\x02\xcc\x6c\xc7\x20\
+\x28\x65\x2c\x30\x59\x2b\x73\x2b\x67\xa4\xe2\x4f\xaa\x5e\x00\x87\
+\xfe\x3c\x22\x9e\xa7\x14\xd6\x6f\xda\xc2\x5b\xf4\xc8\x35\xd2\xa4\
+\xeb\x74\xfd\x6d\x4f\xf0\xe0\x2f\xfa\xeb\x51\x1f\xf1\x7f\xaa\xd4\
+\x82\xe7\x5e\x7a\x9f\x18\x0e\x02\x44\xe4\xbb\xb0\x0f\xf4\x86\xff\
+\x16\xe2\xd3\x42\xba\xd6\x67\x9d\x7b\xa1\xe8\x78\x28\x21\x06\xa0\
+\x67\xff\x91\x22\x50\xa1\x72\xbd\x48\x04\x4d\x2f\x57\x4e\xe5\x33\
+\x24\xd8\x9c\x5b\xef\x79\x92\xf4\x14\x47\x49\xef\x50\x02\x8f\x3c\
+\xf9\x3a\xd7\x4f\xe0\xfb\x11\x86\x57\xdc\xed\xd2\x20\xd3\x1c\x7c\
+\x7f\x17\x5e\x76\x1b\xb1\x05\xf8\xfa\x58\xdf\xdf\xbc\xe5\x57\xa8\
+\x7c\x52\x2d\x7a\xbe\x6c\x95\x29\xa1\xce\x8f\x7a\x50\x50\xff\x5a\
+\x38\xf4\xc7\x1f\x50\xca\x00\xc0\xb1\x92\x3f\x60\xdb\xb6\x9d\x70\
+\x7e\xc1\x25\xf0\xc3\xcf\xdb\xe8\xfd\xe3\xf3\xe0\xf3\x5d\xc9\xc0\
+\x16\xb1\x65\x9a\x6e\x59\xf8\x4a\x85\x3f\x06\xe9\x7c\x85\x01\x40\
+\x0d\xc2\x70\x06\x00\x42\x02\x00\x90\xcb\x9e\x52\x9a\xe4\x43\xa3\
+\xa2\x96\xb3\xe4\xe9\xec\x73\xa8\xb6\xb4\xf6\xe8\x3b\x5c\x0c\x41\
+\x2a\x52\x2c\xba\xbd\xc6\xec\xda\x49\x8e\x3a\x83\xc2\x6f\x3f\x0b\
+\xc5\x31\xa5\x7e\xa3\xb5\xbd\x4a\xa5\x45\x65\xae\xe5\x87\x3d\x0d\
+\xdb\xfe\x4a\x62\xbe\x20\xe6\x48\x99\x3b\xee\xbf\x3c\x00\x08\xcb\
+\x2c\x57\xf3\x17\xed\x59\x43\x61\x1c\x82\x3b\xdd\x69\xa9\xeb\x50\
+\xae\xea\x3e\xc6\x43\xa6\x67\x5d\x49\x66\xfa\x5c\x34\x23\x1f\xa3\
+\x56\x06\x2b\xc7\x95\x86\x65\x6d\x5d\x33\x1c\x75\x96\x90\x96\xce\
+\xe0\x9d\x20\x6c\x88\x3c\x37\x86\x68\x25\x53\x87\xd7\xe8\x36\xd5\
+\x2c\x99\x93\x84\x43\x23\x0c\x8f\x49\x68\x66\x4a\x1f\x36\xbb\x8f\
+\xba\x21\x65\xca\xef\x7c\xd0\x8a\x36\x4d\x19\xb9\x64\x86\x4b\xad\
+\x4c\xd4\x22\x78\x1c\xf6\xef\x3b\x04\xb3\xe6\x2e\x81\xc7\x1a\xbf\
+\x01\xa7\xe4\xf3\x16\xb6\x6c\x91\xfd\xe7\x44\x62\xa2\x26\xcf\x01\
+\xc0\x2e\x05\x00\x2c\x5b\xbe\x92\xea\xa4\xd4\x47\x2e\x4d\x64\x72\
+\xeb\xb2\x8d\xf6\x3c\x58\xb9\x6a\x83\x05\x00\x16\x2c\x5a\xc1\x02\
+\x33\x7a\x09\x14\x2a\xac\x8c\x6e\x8d\xd1\xa5\xcd\x50\x1a\xeb\x58\
+\x2c\x00\xd7\x01\x5c\xc9\x00\x40\xa9\xd2\xcb\x8e\xce\x82\xe1\xea\
+\x31\x52\xf5\xa3\xf3\x5d\x0e\x06\x54\xca\xae\xeb\xb0\xa0\x69\xc0\
+\x1d\xf7\x35\x86\xcd\xdf\xff\x42\x59\xdb\x61\x21\x90\xeb\xd8\x65\
+\xa0\x08\x18\xe2\x1a\x49\x2a\x56\x9c\x4b\xa4\x85\xd1\x11\x51\x9e\
+\x1f\xa4\xd5\x0b\xea\xdf\x44\x42\x31\x3e\x23\xa1\x08\x2e\xba\xfc\
+\x2e\x4b\xd1\x8f\xbf\xb7\x7a\xdd\x46\x7a\x7d\x2c\x03\x84\x64\x8b\
+\x1e\x02\x00\x76\xce\x96\xaf\x58\x4b\xe7\x18\x03\xc7\xbe\x03\x7f\
+\xc0\x49\x11\xc9\x7c\xf0\xcd\x3e\x2c\xea\xfe\xf9\x67\x35\x20\x66\
+\x61\x1f\xae\xfd\x07\x60\xef\xbe\xfd\xb4\xf6\xe0\x62\x41\x15\x7b\
+\xd8\xb7\xef\xdc\x07\x17\x44\xaf\xe1\xc7\xcf\x82\xc8\xc9\xec\xb9\
+\xb0\x1b\xe1\xb8\x50\x9a\x2f\xf9\x6a\x25\x07\x69\x96\xca\xdc\x36\
+\xd2\xc9\x71\xf8\x2e\x98\x96\x26\x05\x29\x7a\x04\x7c\x9b\x7f\xb0\
+\xcd\x9a\xf6\x1d\x38\xc4\x4d\x8b\x50\x23\x22\x2c\x98\xaf\xb9\xf9\
+\x51\x96\x39\x33\x00\x40\x9a\x88\x63\xf0\x79\x9b\x1e\xf0\xb7\x93\
+\xeb\x52\xb9\x61\xd0\xf0\xf1\xa2\x63\x91\x9f\x91\x95\x6b\x36\x80\
+\x76\x5a\x8c\x3d\x6f\x6d\xc8\x3a\xf9\x02\x38\xf3\x9c\x06\x1c\x00\
+\x94\x72\x0f\x8a\x5e\x08\x00\x22\x7c\xf6\x04\xb7\x07\x2e\x52\x34\
+\x19\xea\x50\x1d\x1b\x00\x50\x39\xa7\x6a\x3d\xb8\xe5\xee\x27\xb8\
+\xe0\xf1\x08\x6f\x75\x7c\xf8\xb1\x57\x20\x54\xb5\x36\x9d\x93\x1c\
+\x62\x54\x84\x3d\x33\xbb\x6f\xf3\x4f\xaf\x0f\xf7\xfd\xf7\x05\xf8\
+\xf1\xa7\xed\x04\x00\x4b\xd8\xdf\x1c\x2b\x39\x0c\x6d\x3b\xf6\xe5\
+\x20\x54\xce\x75\x10\x2e\x84\x21\x4d\xb7\x5a\xf8\x3e\x6d\xdd\x95\
+\xb7\xe0\x95\xa0\xde\xa3\x04\x7e\xfd\x75\x9b\x60\x10\xf8\x75\xef\
+\x37\x78\x8c\x60\x72\xd4\x80\x50\x64\xb5\xf4\xe1\x7b\x42\x20\xc7\
+\x99\x8f\xe3\xc4\x80\x0d\x1b\x5d\x4c\xcf\x9d\x23\xf7\x08\xe9\x74\
+\xa9\xd9\x40\x80\x1b\x47\x15\x92\xd6\xa0\x54\x68\x16\x08\x00\xf4\
+\x1b\xce\x6b\xff\xb2\x75\x30\x80\x9d\xbb\xc5\xce\x6a\x89\x3a\xba\
+\x4c\x85\x39\x55\x0d\xc9\xf4\x84\x81\x2e\xdd\xd6\xbe\x90\x22\x7a\
+\x0c\xb9\x86\x35\x65\x6b\xff\x03\xdd\x03\x5a\xcc\x75\xcd\x2b\x1c\
+\x00\x98\x29\x0c\x8b\x29\x2f\xef\x62\x3d\xee\x24\x84\xfc\x58\x02\
+\x2d\x48\x46\xeb\x67\xad\xeb\x47\xcb\x9b\xb6\x85\xaf\xfc\x30\x89\
+\x47\xde\x56\x64\x78\xb4\xd8\x19\x56\x7d\xde\xa9\x4b\xf0\xd3\x20\
+\x18\x29\x03\x23\x15\x00\xd8\xc0\xc3\x70\x74\x43\x84\x95\x1b\x3d\
+\xec\x89\xa0\x13\x8d\x23\x4e\xb3\x04\x40\x00\xa0\x11\x7d\x7d\xe9\
+\x35\xf7\x90\x28\xee\xf0\xd1\xa3\xb6\x97\x1a\x29\x9f\x4b\x29\x4b\
+\x29\x11\x62\x30\xa4\x73\xd7\x7e\xb7\x05\xae\xb8\xf6\x3f\x9c\xb2\
+\xc4\xbe\x7d\xa2\xa6\x1b\x50\x36\x8e\xd4\xe7\x2e\x16\x94\xe4\x7f\
+\x5f\x2d\x5f\xc5\x82\xc1\x05\x16\x00\x90\xee\x81\x95\x4f\xae\x45\
+\x5d\x00\xc7\x84\x81\xcc\xe2\x25\x2b\x44\x89\x41\x0e\x34\x31\xe3\
+\x98\x9c\x6c\x51\xe7\xb6\x56\x3e\x06\x78\x13\xae\xb8\xee\x01\x4b\
+\xc9\x8d\xff\x21\x03\xf1\xf3\x6f\xbf\xc3\x2f\x6c\xa1\x10\xee\xa7\
+\x9f\xb7\xf2\xf5\xeb\x76\xd8\xc9\xfe\xed\xf0\x51\x4e\xbb\x1f\xc1\
+\xda\x3f\x7b\xbf\xdb\xb6\x63\x0f\xf8\x95\x16\x05\xab\x0e\x83\xa2\
+\x31\xbd\x5a\x11\x9c\xaf\x5f\x4d\xd9\x9d\xe8\xbe\x87\x71\x93\x66\
+\x50\x17\x42\xa8\x7a\x43\x16\xdc\x1b\x92\x55\x2b\xb2\x50\xf3\x16\
+\x7d\x65\x89\x2a\xf1\x37\x6f\xba\xf3\x49\x31\x4c\x89\x7b\xca\x93\
+\xd7\x3e\x3b\x07\x6b\xbf\xdb\x24\xea\xf3\x25\xb0\x7d\xc7\x5e\x08\
+\x57\xab\x45\xc1\x55\x6e\xf6\xb4\xf2\x11\x00\x34\xb4\x9c\xdf\xe4\
+\x22\xca\xbd\x94\x53\xee\x18\x84\x8e\x1c\x2d\x85\x02\xf3\x06\x51\
+\x3e\xa9\x07\x55\x19\x08\xfb\xe3\xc8\x31\xeb\xf7\x67\xcd\x59\x42\
+\x40\x89\x7b\x05\xd4\x17\x06\x47\x31\x87\xb8\xd2\x06\x00\x32\xb0\
+\x32\x10\xc0\x82\xe1\x3a\x6a\xd5\xe4\x80\x06\xd9\x80\x70\x1e\x6f\
+\x39\x43\x36\x05\xb3\xe8\xab\x6f\x7e\x84\x77\x92\xb0\xf7\x81\x9d\
+\x24\xad\xda\xf7\x24\xd5\x3d\x06\xcd\x1a\x2c\xd0\xad\x61\xef\x53\
+\x9e\x33\xf4\x5e\xc0\x56\xbf\xca\x27\x9f\xcf\x00\xa0\x00\x00\xd8\
+\x81\x22\xa8\xf0\xde\x03\x46\x89\x69\x7e\x62\x36\x80\x1f\x00\xb0\
+\x34\x45\xdc\xd3\x1f\x33\xf6\x5b\xee\xe2\x00\x80\x4a\x3a\xec\x9a\
+\x6e\xdf\xbe\x8b\x65\xf4\xbf\xc0\x96\x1f\x7e\xa5\xf5\xfd\x0f\xbf\
+\xc0\xa6\x2d\x3f\xc3\x8f\xec\x3e\x40\x8d\xca\x51\xba\x07\x4a\xe8\
+\x1e\x38\xca\xce\x15\x5e\x83\x73\xeb\x5e\x0e\xd9\x0c\x4c\x70\xe7\
+\x44\x29\x1e\x2c\x14\x9d\x24\xfc\x33\x9a\xcb\xc0\xc3\x77\x1b\xb6\
+\x10\x63\xc1\x9d\x14\x4b\xad\x6b\xb2\x6b\xcf\x3e\xa8\xc9\xee\xa3\
+\x2c\x31\xdb\x80\x5b\x92\x17\x11\x43\xc4\x4b\x6e\xfc\x73\x8d\x2d\
+\x97\x47\xa9\xfb\x86\x1f\x2b\x6a\x00\xb2\x89\x59\x53\x27\x38\x72\
+\xef\x88\xff\xb7\xbd\xf7\x00\xb3\xa3\x2c\xdb\xc7\x73\x5d\xff\x4f\
+\x33\x67\x4e\x08\xc9\xce\x99\xb3\x29\x44\x90\x1e\x92\xdd\x33\xef\
+\xcc\xd9\xdd\xd0\x7b\x09\x2d\xf4\xde\x6b\x00\x01\x91\x5e\x04\xa5\
+\x28\x08\x02\x8a\x8a\x48\x2f\x52\x15\x2c\x88\x22\x88\x28\x82\x14\
+\x05\xe9\x5d\x44\x5a\x3a\x29\xa4\x97\xe7\xff\xf6\x32\xf3\x4e\x39\
+\x65\x37\xf9\xbe\xeb\xc7\xf7\x8d\x9b\x64\x77\xcf\x99\x79\x67\xce\
+\xfb\x3c\xcf\xfd\xdc\xcf\x7d\x97\x05\xd9\x91\x0b\x0d\x91\xe9\x1b\
+\xc1\xdb\x21\xff\xfd\x8c\xb4\x00\x3c\xc4\x03\x7f\xbd\x90\xf8\x18\
+\x7b\xb6\xd5\x3e\x9c\x65\x73\x2c\xbf\xa7\x8d\x31\x67\x2b\xda\x35\
+\x57\x38\x39\xc2\x63\x20\x55\x69\x70\x55\x69\x6d\xe7\xd9\x42\xf7\
+\xcf\xb1\xca\x23\x00\x8e\x06\xa9\xbb\x45\x24\x0e\x0b\x2a\xf0\x39\
+\x09\xf3\x20\x9b\xc0\x0f\xca\x21\x20\x06\x1a\xf3\x3e\x94\x89\x81\
+\x5b\x89\xf7\xe3\x6b\x16\xd3\x9e\x38\x79\x23\x68\xfc\x81\x89\x65\
+\xb2\x8e\x81\x70\x20\x93\xa7\x90\x6a\x11\x8a\xda\x06\x77\x51\xf8\
+\x97\x57\x24\x65\xae\x7c\xc7\x18\xca\x01\x8c\x43\x3b\xc1\x37\xce\
+\xbe\x94\x06\xb8\xcf\xa6\x4c\xe7\xa2\x23\xcb\x29\x11\x8c\x28\x04\
+\x2e\x5f\xbe\x98\x6e\x5c\xf3\xbe\x58\x00\xdb\xed\x7c\x28\x93\xc9\
+\xe5\x7d\x69\x5a\x95\xe3\xea\x73\xfa\xcc\xd9\x64\x1a\x9b\x6e\xfa\
+\xa4\x05\x30\x78\xf5\xf5\x99\xee\x3e\x37\xc9\xa1\x90\x26\xae\xce\
+\xde\x78\xeb\x5d\xd9\x07\x7d\x01\xff\x1c\x0d\x3c\xbe\x65\x4c\xb2\
+\x43\x99\x48\x29\xd3\x9e\x40\xea\xca\x6f\xb1\xfd\x41\x32\xe0\x0a\
+\x21\x98\x98\x7e\x21\xfd\xc7\xe5\x64\xc3\x25\x1b\x3e\x3d\x58\x6f\
+\xfa\xe3\x29\x33\xa9\x36\x3e\x45\x34\x3a\x6a\x32\xf0\xd3\xe0\x4f\
+\xbe\xe2\xf7\x2e\xe3\x7f\xbf\xea\xda\x9b\xb4\x20\x0c\xb0\xfd\xae\
+\x87\x51\x86\xbf\x98\x17\xa7\x55\x3e\x5e\xd7\x03\x8e\x38\x55\xcd\
+\xc5\xe3\xff\x27\xeb\xc8\x46\xff\xea\xca\x4d\x0c\x6f\xe4\x64\x3a\
+\x62\x29\xe7\x3f\xcc\x9b\xbf\x88\xa2\x2a\x25\x3e\x93\x5f\x16\x7d\
+\x7f\x7c\x7d\x9d\x6b\x89\x91\xb1\x15\xa6\x1a\x23\x25\xbc\x2d\x61\
+\x2d\x0c\x9c\x00\x74\xf7\xec\x22\x49\x8e\x6e\x07\x19\xc5\x5c\x40\
+\x83\x13\x39\xd9\x97\x5e\x7e\x83\xf3\x08\x7a\x64\xff\xde\x4d\xc8\
+\xf3\xf2\x31\x5d\x3e\x2e\x49\xc7\xe6\x70\xa5\x3e\x75\xda\x4c\xb9\
+\x86\x53\xa7\xcf\xa2\xb3\xee\xd4\x4c\x67\x38\x0b\xbc\xdb\x4f\x3a\
+\x92\x8e\xa5\xd1\x40\x88\x8f\xab\xaf\xbb\x99\x13\x0c\x23\x9a\x68\
+\xa0\xbe\x5d\x28\x27\x84\xf4\xd8\x57\xac\x58\x4c\xd7\xfe\x8c\x73\
+\x2f\x83\x2f\x0d\x59\x17\xd6\x5a\xb7\x8f\x12\x2a\x05\x62\x72\xdb\
+\xcf\xf5\x04\x40\xb4\x00\x54\xe0\x37\xdb\x67\xa2\x75\xc6\x02\xe3\
+\x6e\x38\x01\xa0\x53\x0b\x04\x51\x22\x28\xc0\x92\xc5\xb4\x27\xbf\
+\x42\x17\x4e\xe2\xf7\x8e\xad\x9d\x48\x00\x96\xc1\x94\x69\xb3\x61\
+\xc7\xdd\x8e\xa0\xba\x0c\x54\xb2\x5a\x70\x00\x78\x02\x20\x4d\x9d\
+\xf8\xe4\xd0\x36\x3b\x1f\x4c\xd7\x5d\x13\x1c\xa6\x7f\x3a\xe9\xb4\
+\x6f\x71\xdd\xfe\x09\xec\x2b\x35\x38\x52\x5c\x14\x8a\x32\xe2\xd7\
+\x5c\xbd\x33\x80\x85\x8b\x96\xd1\x84\x9a\x4c\x8e\x3c\xf4\xdb\xc7\
+\x79\x6b\x2d\x50\x82\x6c\x12\xd2\x8f\x98\x6f\x04\x37\xfe\x19\xbd\
+\x2e\x13\x02\x22\x1a\x0d\x04\x3d\xfa\xc9\x8d\x77\xf3\xc4\x0f\x19\
+\x13\x3b\x3a\x8f\x26\xee\x6a\xea\x6a\x50\xbe\xcb\x8b\xa6\x6c\xe9\
+\xdf\x28\x85\x04\xa8\xab\x72\xf6\xd7\xd8\xdc\xff\x4b\x00\x78\x02\
+\xd0\x68\xef\x39\x3b\x50\xb8\x0d\x09\xe5\x14\x4d\x00\x90\xc6\x12\
+\xce\xe2\x08\xa4\xb1\xed\xd5\xdf\x07\xfb\x59\xaa\x79\x61\xaa\x75\
+\xa5\xab\x5b\xf9\xf2\x4d\x42\xa2\x00\xb1\xe4\xc2\x4d\x20\x02\x41\
+\x8e\x72\x53\x64\x91\x4f\x46\xa9\xda\x01\x4e\x05\x29\x36\xaf\x64\
+\x96\x6b\xf7\x40\x9e\x97\x18\x93\xb4\xad\x93\x6d\x3c\x27\x6a\x3a\
+\xf3\x16\x1b\x7f\xb9\xa2\xcc\x5a\xd4\xd8\x53\xaf\xb2\xba\xc5\x9b\
+\xca\xea\x23\x6a\xd0\xb7\xc5\x9e\x70\xce\x85\x57\xc1\xdf\x9f\x7f\
+\x89\x2b\xa8\x2d\x65\x9b\x39\xfe\x3f\x52\xc5\x12\x88\x9b\x6d\xd8\
+\x8c\x89\x5e\xc2\x01\x62\x1a\x0e\x14\x2b\x60\x09\xfd\x59\xa2\x42\
+\x37\x78\x75\x56\xdd\x3a\xfa\xf4\xc7\xf0\x71\x32\x01\x20\xff\xfd\
+\xf3\xa5\x57\x79\x50\xaf\x73\x18\x1a\x19\x95\x9e\x98\x9e\x70\x39\
+\x43\x5e\x26\x6c\x38\x40\x6f\xb1\xdd\x41\x6a\x9a\x81\xcf\xd4\x03\
+\xaf\x3a\x75\xa5\xb9\x65\xcb\xd9\xa6\x4f\xaa\xe6\x29\x38\xb9\xb9\
+\xfe\xc6\x7b\x60\xed\x8d\xb6\xc4\x1b\x3f\x93\xe4\x65\xc4\xaf\x1a\
+\x0c\xa1\xe3\x57\x6c\x0c\xb0\x34\x3c\x00\x1f\x57\x7d\xd3\x67\xcc\
+\x66\xfa\xf9\x24\x59\xf9\xc7\xbf\xc0\xff\x4a\x04\x95\x35\x27\x80\
+\x87\x8f\x0a\xe9\xc9\x8f\xe9\x85\xe1\xf8\xe7\xbc\x31\x35\xf8\xe0\
+\xc3\x8f\x64\x50\x20\x55\xe9\x06\xb5\xed\xa4\x2d\xac\x50\xe8\xbb\
+\xf3\xee\x5f\xb1\x00\xce\x93\x91\x09\x5b\xee\x29\x47\x2b\x29\xb1\
+\xb2\xca\x48\x7d\xc3\x47\xf5\xc2\xd7\xcf\xb8\x18\x4e\xf9\xc6\x45\
+\x70\xf2\xe9\x17\xe1\xaf\x17\xc2\x49\x5f\xff\x26\x15\x8f\x11\x15\
+\x2f\x49\x00\x82\x9e\x5d\xe5\x58\xa6\x83\x03\xf7\x2b\xaf\xbd\xc3\
+\xd6\x02\x9f\x03\x51\x40\xf4\x46\xf7\x48\x33\x9b\x12\xaf\x46\x95\
+\xd5\xac\x96\x6c\x73\x7b\x63\xd2\xa7\x5f\x7b\xec\x56\x8a\x1f\x82\
+\x5f\xe9\x99\xe7\x5e\x92\x1c\x0d\xe1\x6a\xb7\xe3\x1e\x47\x53\x01\
+\x23\x46\x38\x5c\x0e\xd7\xfe\xe8\x16\xee\xcc\xc7\xab\x5e\xbc\x96\
+\x07\x1c\x76\x32\x4d\x76\x96\x2f\x5f\xc8\x46\xe4\x16\x2c\x82\x1d\
+\x76\x3e\x08\xbe\xba\x5e\x1f\x0d\xc6\x22\x84\xde\x7e\xcf\x43\x9c\
+\xaf\xa1\x9f\x9f\xce\x1d\x4a\x92\x64\xf5\x04\x80\xb4\x22\x96\xf0\
+\xb1\xd2\x25\x94\x94\xc7\xe5\x93\x65\x1b\x42\xa1\x5a\xa4\x7a\x27\
+\xc9\xcd\x8d\xb7\xde\x07\xeb\x75\x6d\x45\x5b\x16\x52\xdc\x47\x8c\
+\x2c\x76\xd4\x0c\xef\x09\x41\xb2\x24\x92\xd5\x57\x5c\xfd\x53\x43\
+\x76\xf8\x89\xbf\x3e\xcb\x85\xa4\x26\x50\x35\x41\x26\x26\xd5\x23\
+\x05\x80\x5c\x8e\x42\xd2\x29\x07\xfc\x5e\x44\xa5\x90\x4c\x0c\x2c\
+\x59\xb2\x90\xb6\xd6\xc8\xfb\x97\x84\x1b\xa5\x66\xf2\x24\x27\x34\
+\xf8\xb5\x8e\x0d\x77\xa0\x9f\xc3\x65\xcb\x98\x4e\xc3\x55\x3f\xb8\
+\x99\xb6\x40\xd4\x84\x51\xa0\x9d\x77\x3c\x01\x10\xe8\x56\xa4\xed\
+\xd9\x51\xae\x50\x5c\xff\xb0\xed\xd3\x7a\xfe\x19\x28\xc4\x4a\x6f\
+\x71\xaf\xbc\xf7\x4f\x22\x00\x5e\x51\xd1\x9b\xd0\xea\x77\x6f\x37\
+\xda\xc9\x1b\xa9\x4b\x9b\xb9\x6f\x66\xcc\x21\x68\xd0\x21\x2f\x48\
+\x67\xd8\xc7\xd9\xf6\x5e\xcd\x48\x00\x4c\x07\x42\x21\x84\x53\xb3\
+\x13\x15\xad\x24\x44\xdb\x5a\x46\xe9\xe4\x3c\x2d\xb0\xbb\x9a\xf7\
+\x38\xfb\x60\xa6\x4c\x21\xd0\xca\x10\xc5\x12\x8b\xf6\x23\x34\x25\
+\x43\x60\x24\xe0\xb0\x1b\xd9\x70\x59\xb5\x42\xa1\x44\x5e\xf9\x52\
+\x91\x93\x61\xec\x20\x95\xdf\x3e\x07\x9f\x40\x05\x6f\x84\x84\x2a\
+\xd9\x5b\xa3\x4d\x26\xa9\xf5\xe2\x55\xe3\x67\xd3\x66\xe1\x8d\x57\
+\x25\x00\x04\xf2\xa5\xbd\x63\xaf\x26\x49\x99\x2e\xae\xb6\xde\xc4\
+\x09\x80\xa8\xaa\x5f\xfc\xd7\x6b\x32\x01\xa0\xd7\xce\x83\xb1\x98\
+\x7f\x76\x64\xd5\xa7\xb4\x07\x68\x40\xc5\x3f\xb7\xd5\x0e\x07\x4b\
+\x59\x5f\x12\x84\x9e\xfc\xeb\x33\x70\xf5\x0f\x6f\x82\xef\xff\xf0\
+\x16\x0a\x49\x5f\x79\xf5\xcf\xe0\xd9\xe7\x5e\x64\x90\x3b\x11\xb7\
+\xc1\xd5\xe1\x8b\x2f\xbd\x0e\x43\xfc\x71\x6c\x8c\x8b\xba\x18\x6a\
+\x56\xc5\x9e\x42\x1e\x9c\x61\x5d\x38\xf0\x5e\xc2\x83\x0a\xd1\xd0\
+\x5f\x0e\x8b\x16\x12\xb9\xe1\x79\xf2\xf8\x9c\x1c\xb3\xe7\x51\xa9\
+\x5e\xc2\x7f\x20\x7d\x68\xc1\x15\x20\x81\xe6\x7b\x57\xdf\xc8\xaa\
+\x4a\x82\x7e\x70\xc9\xd8\x13\x4f\xbd\x90\x05\x2b\xd2\x5a\x59\xbe\
+\x98\x6e\xe4\xcc\x36\xb9\x8b\x5e\x5b\x99\x6b\x1e\x0c\xa1\xf3\xfd\
+\x64\xbc\x52\x40\xf7\x01\x85\xa7\xcf\xbd\xe8\x1a\xda\xca\xa0\x12\
+\xc4\x8b\x97\x41\xad\xbe\x8b\x5c\x33\x92\x24\xdd\x70\xd3\xdd\x86\
+\xce\xff\x21\x47\x9d\xc6\x83\x0a\x23\xa2\xb9\x3a\x22\x51\x61\xc1\
+\x85\x8d\x00\xb2\x5e\x37\x11\xb6\x39\xed\xac\x4b\xa5\xe0\x0c\x89\
+\x73\x64\x3d\xe9\x38\x5d\x45\xe9\x22\x4c\xdc\xfb\x38\x8d\x44\xba\
+\x02\xae\xc1\x09\x40\xb9\xc2\x13\x4b\xfa\x4c\x07\xf4\xba\xae\xbc\
+\xf6\x46\xe6\x17\xb0\x7c\x11\x5e\x93\xc5\xb4\x1d\xb3\xf1\xe6\x3b\
+\x1b\xd6\x3d\x77\xde\xf3\x2b\xd6\x52\x92\x56\xb8\x31\x32\xb1\xa7\
+\x9b\x86\x29\x11\x2d\x67\x78\x0d\x26\xed\x77\x3c\x5e\xc7\xe5\x52\
+\x57\xe2\x89\xbf\xfc\x1d\x7e\x7a\xf3\xfd\x38\xc0\x3f\x00\x37\xdf\
+\x76\x3f\xdc\x84\x03\xfd\x94\xa9\xd3\x59\x32\xc0\xc7\x23\x7f\xf9\
+\xd0\xef\xe1\x7f\xca\xeb\xc2\x97\x86\x69\xcf\x00\x97\x20\x56\xba\
+\x05\x81\x41\x40\xa5\x6b\xd8\x59\x87\x5d\xf6\x3a\x5a\x02\x00\xe4\
+\x0b\x71\x1a\x74\x3a\xeb\x1c\x09\xea\xe1\xf6\xc6\x75\xad\x3f\x2c\
+\x92\xa6\xf1\xb4\xfd\x45\x14\x05\xc9\x73\xb8\x74\xf1\x22\xf8\xe4\
+\xd3\xa9\x54\xe9\x91\x26\xe4\x1c\x8d\x13\x6e\x8a\x8e\x34\x03\x62\
+\xe8\xc3\xde\x07\x9d\x40\x13\x00\x22\xd0\x44\xda\x57\x67\x5d\x70\
+\x05\xb7\x64\xee\x92\x36\xdb\x76\x45\x55\xb5\x17\xba\x6d\x27\xab\
+\xa1\xd6\xc9\x77\x46\x71\x14\xad\x32\x81\x7f\x55\x39\x06\x59\xfb\
+\xe3\x5e\x9e\x34\xaf\x3d\x01\x70\xbd\x20\x65\x6c\x0e\x65\xea\xe8\
+\x3b\x95\x78\xcf\xba\x51\xaf\x7a\x94\xe3\xd3\x8c\xac\xfd\x2a\x27\
+\x61\x55\x9c\xf1\xfa\x02\xc2\x95\x04\xbb\x9a\x22\xbc\x48\x6d\xf2\
+\xe4\x58\x91\x9b\x10\xff\x49\x9b\x44\x40\x19\xda\xff\xf1\xe0\xae\
+\x91\xff\x74\xe2\x0d\xe7\x02\x38\xfa\x78\xe0\x80\x3e\xf0\x22\xe9\
+\x60\x55\x83\x2b\x12\x24\x11\xf4\x68\xb2\xd2\xc5\x55\xce\x58\x3f\
+\x94\x8c\x4d\x7d\x19\xff\xfb\x2f\xa9\x2a\x9a\x92\x7c\xdd\x73\xff\
+\xe3\x38\x87\x82\x05\x10\xe2\x05\xf0\xc9\xd4\x99\xd4\x51\x90\x18\
+\x0b\x3d\xfb\xc2\x2b\x34\x01\x30\xfd\xd6\xeb\x94\x8c\xf5\x16\xef\
+\x2f\xd3\x04\xe0\xa5\xd7\x18\x83\x5d\xf8\xc2\x77\x08\x02\x56\xb7\
+\xfc\xb3\xdb\x21\x2c\x6e\x35\x78\x13\xbf\xde\xb6\x13\x0f\x33\xdc\
+\xdf\xce\xfe\xe6\x95\xcc\xe1\x6f\x44\x04\x65\x72\xe0\x3f\xaf\x83\
+\x2b\xfd\x4f\x3e\x9b\x46\xab\x7f\x42\xfa\x5a\xb2\x78\x29\x25\x7d\
+\x91\x51\xb0\xc1\xc3\xba\x94\x58\x90\x38\xb8\x20\xd1\x10\x1c\xb4\
+\xdf\x7c\xe7\x43\x4e\x56\x5c\x44\xbf\x8a\x59\x7f\xf3\x50\x48\x83\
+\x0a\xfe\x2c\xc0\x4f\xc1\x09\x11\x21\xbf\x39\x7c\x7c\x92\xac\xe9\
+\x1a\xeb\x6c\x02\xf3\xbe\x58\x88\x13\x8a\x25\x54\x39\x8e\x24\x0f\
+\xeb\x8c\xdf\x8a\x8d\x1b\xfa\x7a\xd0\xe1\xfe\x04\xa4\x5d\xe3\x71\
+\x22\x2d\xbe\x1f\xe7\x5c\xf8\x7d\x58\x84\x03\xff\x22\x2a\xf3\xbb\
+\x14\xba\x7b\x76\xe6\x5a\xfb\x0c\x96\xdd\x89\x4c\x2c\x68\x15\xea\
+\xeb\x6f\xbe\x0b\x1d\x6b\xf4\x72\x22\x5a\x64\xb4\xd5\xc4\x28\x9d\
+\x90\xb5\x25\x23\x80\xfe\x98\x10\x3e\xf8\xe8\x33\x66\x1c\x44\x59\
+\xfa\xcb\x61\xd3\xed\xf6\x97\x49\xa2\x60\xaa\xef\xb6\xef\x09\xea\
+\x5d\x48\x02\x70\xdd\x2d\xf4\x3e\xca\xe7\xac\x83\xc9\xe6\x96\x2b\
+\x1b\xc1\xe3\x44\xf8\x88\xc8\xe4\xd2\x67\x63\x39\xbc\xf7\xfe\x07\
+\x06\x84\x7e\x07\x41\x00\x28\x0a\x61\x23\x07\xeb\x1e\x19\x81\x9c\
+\x96\x11\xe6\x4c\x44\x07\x60\x19\x4f\xb8\x08\xb1\xf0\xb8\x93\xce\
+\xa5\x41\x9c\x9c\xcb\x10\x72\xe0\x9f\xdd\x63\xdf\xe3\xe8\xf7\x81\
+\xfb\x1c\x90\xb1\xbf\xc3\x8f\x39\x13\x5f\xef\x38\xd6\xf7\x17\xe3\
+\xad\x5a\x02\x20\x5a\x4e\xac\x5d\xa6\xb4\xfa\x77\x9a\x74\x8c\x22\
+\xcd\xe2\xff\x3d\xe3\xfc\xcb\x79\xd5\xdf\x6b\x40\xff\xae\xde\x8a\
+\xec\x60\x63\xa8\x64\xdc\xf5\xc1\xdf\xfc\x81\x22\x40\xcb\x96\xb0\
+\xb5\xdd\x1c\xaf\x2d\x31\x35\x22\x2d\x25\x57\xa8\x06\x0a\xfd\x80\
+\x2a\x3f\xf0\xe7\xf5\xd6\x3b\x1e\xe0\x13\x17\x8b\xe9\x98\xe5\xae\
+\x7b\x1f\xcd\xa4\xb6\x87\x77\xc9\x16\x56\x9a\xdf\x8a\x22\xd6\x22\
+\x68\x1f\x41\x0d\xb5\xa8\x78\x17\x23\xd1\xb5\x4d\x6b\xe0\xff\x74\
+\x02\x90\xc7\xb8\xcf\x4f\x00\x8c\x4c\xd1\x0f\x73\x02\x73\x68\x81\
+\xbd\xc3\x9c\xc4\xa1\x59\x85\x41\x64\xf8\x8f\xbb\x06\x07\x00\x59\
+\x27\x06\xe2\x0f\x92\x2b\x33\xdd\xc0\x08\xba\x8e\x61\x56\x84\x62\
+\x2d\x91\xbc\x16\x05\xca\x74\x37\x74\xac\x09\x00\x32\x12\x80\x04\
+\xf9\x30\xee\xc8\xe8\xa5\x11\x27\x51\x1b\x25\x3c\x91\xc1\xa2\x1e\
+\xf1\xd5\x4d\xe0\x4a\x5c\x7d\x92\xbe\xa4\xd0\x6c\xa7\x7a\xec\xdc\
+\xde\x97\x25\x00\x35\x3e\x4b\x8d\xa8\x6c\xa9\xfe\xdf\xae\xfb\x1c\
+\x23\x5f\x8b\xea\xdb\xe3\x04\xe0\xd3\x29\x33\x69\xd0\x20\x9b\xfd\
+\xdf\x9f\x7f\x99\x8a\xca\x08\x33\x18\x76\x1f\xea\x94\xac\xf6\x06\
+\x47\x00\xc8\x26\xca\x5a\x00\x48\x22\x00\x52\x43\xde\x53\x1b\xb3\
+\xfa\x73\x4d\xea\x03\x90\x2a\x79\xfb\x9d\x0f\x37\x5c\xe5\xce\x3a\
+\xff\x4a\x3a\x96\xe8\x74\x32\xaf\x78\x2a\x43\xec\xd7\xa8\x07\x3c\
+\x09\x9a\x44\xa5\x8e\xf6\x5f\xf1\x06\xbc\xeb\xde\xc7\x70\x44\x41\
+\xdf\xa8\xb9\x60\x10\x7e\xff\x7d\x0f\x39\x19\x27\x0b\x42\x4d\x6f\
+\x91\xb4\x18\x5e\x91\x24\x1a\x18\xd5\xec\x72\xaa\xee\x27\xbc\x02\
+\x96\xd1\xb1\x38\x52\x59\x33\x69\xda\x71\x94\x61\x4f\xe0\x67\x52\
+\x0d\x93\x11\x34\xb2\x56\x4f\x3d\xf3\x0f\xe8\x18\x15\x32\xe2\x21\
+\x1d\xd3\x53\x0a\x82\x0c\xed\x60\x70\x37\x69\x59\x9c\x47\x26\x37\
+\x16\x33\xd6\xfb\xd2\xa5\x2b\x68\x02\xa0\x3b\x25\x92\xb1\x3f\xb2\
+\xa6\xba\x3e\xff\xed\x3f\x7f\x90\x49\xd3\x0a\x85\xc4\x0e\x21\x93\
+\x4b\x82\x12\x97\xcb\xc5\xd7\x3c\xa4\xda\x05\xbf\x79\xe4\x09\x1a\
+\x60\x18\xf9\x73\x09\xfc\xf1\x89\x67\x58\x95\x59\x61\x84\x33\xa1\
+\x6b\x30\x49\x26\x00\x2c\xe9\xb9\xfa\xba\x9b\xf8\xc8\x65\x20\x51\
+\x2f\x87\x8c\x81\xe2\x6b\x5e\x73\x83\x4d\xe1\xa3\xcf\xa6\x72\x5d\
+\x81\xe5\x71\x9b\x49\x4a\x02\x14\x4a\x8d\xcc\x00\x28\x94\xee\x9f\
+\x02\xed\x31\x75\x3a\x94\x4c\xf4\x3e\x07\x9f\x28\x5b\x40\xa4\xad\
+\x70\xcc\x89\xe7\xca\x69\x07\x36\xf2\xda\x43\x9f\x2f\x92\xa0\x30\
+\xb0\x82\x39\xf5\x4d\x9b\x39\x1b\xd6\xc5\x89\x57\xa9\x43\x25\x9a\
+\xb2\x95\x42\x27\x31\x18\xd9\x54\x4c\x4c\x94\xf8\x24\xc7\x0e\x93\
+\x8e\x32\x92\x97\x33\xcf\xbb\x9c\x43\xf6\xb1\xea\x9f\x06\xfd\x80\
+\xa1\x7b\x1d\xaa\x75\x72\xd2\x69\x17\xf2\xf1\xc3\x65\xf4\xda\x1f\
+\x79\xf4\xcf\x30\x94\xbb\x3a\xd2\x67\x56\xe7\x41\x70\x41\x29\xe2\
+\xbe\xb9\x60\xc1\x22\xa9\x9b\x30\xfb\x8b\xf9\xf8\x79\x41\x0c\xa5\
+\x1b\xde\xa5\x21\x8c\xc9\x04\xc0\x91\xb6\xc5\x81\x6c\x37\xba\x2d\
+\xed\x1f\x08\xda\xc1\x47\x2a\x44\x6e\xfe\x3f\x83\x04\xa0\x76\x71\
+\x00\xa2\x82\x19\x16\xca\x91\xcd\xcd\x93\xda\x8d\xcf\xcc\x47\xb1\
+\x7e\x4d\xa4\xdd\x20\x2d\xe8\x65\x1a\x41\xa4\xc1\xfe\x35\x6b\x65\
+\xed\xc8\x5e\x7d\x9e\xe9\x8f\x46\x30\xf4\xe2\x7d\x2f\x5d\x74\xa8\
+\x11\xce\x43\x23\xc9\x8c\xf9\xda\xae\x91\x18\xd8\x5a\x36\x41\x6a\
+\xa6\xeb\x24\x3e\x6c\xb5\x16\x12\x80\x48\xbb\x77\x4a\x59\x8c\x31\
+\xea\x6b\xf0\xeb\xdf\xfd\x89\x42\xb8\xcf\x3c\xf7\x22\x6c\xb6\xf5\
+\xde\x14\x9e\x24\x73\xf2\xa4\x4a\x61\x09\xc0\x38\xe6\x04\x87\x37\
+\xcf\x68\xd3\x49\x30\x7f\xfe\x42\xc3\x6e\x75\xdd\xae\x6d\x15\x54\
+\x4b\x50\x00\x92\x00\x7c\x36\x83\x6e\x6e\x04\x6e\xff\xfb\x73\x2f\
+\x73\x0e\x80\x92\x77\xa5\x1b\x1b\x4e\x00\x08\xc3\x5c\x6c\xa2\x64\
+\x5c\xd0\x95\xd7\xc9\x83\x12\x95\x5a\x1d\x47\x03\x1e\x81\xea\xbf\
+\xcc\xff\x4e\x93\x00\x9e\x2c\x10\x76\xfb\x76\x3b\x1f\x66\xd0\xb1\
+\x4e\x3f\xef\xbb\xb4\x1f\xab\xfb\x79\xd3\x80\x87\x5f\xe3\x07\xb8\
+\xea\x17\x73\xe7\x24\x58\x10\xb7\xb7\x31\xeb\x6e\xc2\xcd\x7b\x22\
+\xa5\x36\x47\x58\xee\x43\x37\x84\x3f\x3c\xf6\x94\x64\x96\x7f\x81\
+\xaf\xfd\xeb\x67\x5c\x04\x27\x7f\xe3\x5b\x70\xda\x59\x97\xc0\xe9\
+\xe7\x5c\x0a\xa7\x9f\x7b\x19\x9c\x71\xee\x77\x71\x00\xf8\x2e\xfe\
+\xfa\x1d\x38\xe3\x9c\xef\xd0\xef\x9d\x77\xd1\x15\x14\xa2\xa7\x46\
+\x3c\x8b\x96\xc0\xcb\xaf\xbd\x87\xdf\x7f\x7d\xbe\xa6\x1b\xe1\xeb\
+\x19\x0b\x6b\x6f\xb8\x39\xcc\x98\x35\x57\x9e\x0b\x09\x60\x8f\xfd\
+\xe9\x6f\xb0\xee\xb8\xad\x71\x10\x0e\xa5\x95\x30\x43\x58\xc6\xd3\
+\xf3\x27\xb2\xb3\x9d\x6b\xf5\xc2\x43\x0f\x3f\x06\x8b\x49\x92\x45\
+\xaa\x48\x1c\x10\xc8\x8c\x3d\x53\x1b\x64\x86\x40\xee\x88\x3a\xec\
+\xbc\xc7\xd1\x8c\x1b\x01\xca\xa5\xef\x4e\x5c\x65\xfb\x6b\xf6\xb0\
+\x24\x84\xdc\x67\x61\xfc\xc4\x49\x7d\x1b\x76\x6f\x4b\xa7\x06\xc4\
+\x74\x06\x41\x00\xe6\xcc\x5d\x00\xb5\xbe\x5d\x34\xe4\x25\x92\x96\
+\xc7\xbb\x53\x21\x20\x85\x84\x7c\xff\x87\x37\x71\x38\x9d\x8f\xd1\
+\x69\xa8\x0a\xf9\xf3\x8e\x93\x8e\xa0\x23\xa7\xaa\xf3\xcf\x9f\x25\
+\x9c\x54\xdd\x72\xe7\x83\x74\x14\x94\xdd\x7b\xae\xdb\x2f\xf4\x23\
+\x34\xdd\x0c\x41\x34\x76\x85\x33\x20\x0e\xc8\x24\x01\x60\x0e\x89\
+\x6c\x20\xf4\x98\x93\xce\xc5\xf7\xb3\x97\xdf\xd3\xba\x24\xd6\x0d\
+\x1f\x15\xc1\x73\x44\xfc\x87\xb4\x36\x68\x92\xba\x14\x1e\xff\xcb\
+\xdf\x61\x08\x1d\x15\x15\x89\x3a\x4b\x38\x5c\x91\x64\xfa\x4a\x7c\
+\x8a\x99\x0f\xf5\x50\xf2\xa3\x9e\x00\x90\x7b\x5f\xe6\x96\xbd\x8c\
+\x63\xd1\xc3\x5b\x20\x35\x6d\x1a\x49\x25\x18\xa3\xf1\x33\x37\x6f\
+\xfe\x02\xce\xd3\x60\x6b\x77\xd9\xf7\x7e\x0c\xab\x55\x63\x22\x47\
+\x54\x40\x2b\x80\xf5\xba\xb6\x86\x57\x5e\x7b\x53\xde\x47\x72\x5f\
+\xc9\x7a\xb1\x7b\xc8\xf9\x2b\x1d\x81\x41\x74\xb6\x4f\x04\xa0\x44\
+\xcf\xdd\x69\xb8\xd7\x1f\xb4\xdd\x53\xc0\x96\x00\xb8\x09\x4e\x55\
+\x2b\xef\xd7\x88\x41\xdc\x40\x69\xe5\x34\x9d\x00\xa0\x06\xa1\xf7\
+\xa2\x3d\x78\x73\x9e\x53\xcd\x97\xa3\x44\x8f\xdf\x95\x0c\x52\xa4\
+\x48\x6e\x56\xdb\xdb\x22\xb2\xc2\x39\xf0\xba\x1f\xa4\x40\x4b\x51\
+\x0a\x7b\x5e\x3d\x3c\xae\x97\x7c\x6d\xc7\x2f\x9a\x00\x04\x19\x62\
+\x17\xb6\x0f\x4e\x60\x19\x71\xd4\x51\x17\x85\xde\xb0\x40\x1c\x15\
+\x84\xd2\x50\x93\xf7\x5a\x91\x17\xcb\xc2\x22\x54\x4c\x40\xe0\x35\
+\x3d\xf5\x9c\xcb\x94\x1a\xdd\x32\xe2\x14\x87\x2b\xbd\xc7\x9f\x86\
+\x93\xbe\x7e\x21\x6c\xbe\xcd\xde\x30\xb6\xb6\x0d\x8c\x0b\xb7\x87\
+\xed\x77\x3d\x04\xae\xf8\xfe\x0d\x74\xcc\x49\x67\xb8\x3f\xf9\xf4\
+\x0b\xb4\x3a\x2a\x55\x95\x60\x0b\x61\x33\x7f\x36\x65\x06\xf3\x5a\
+\x27\xe3\x7d\x2f\xbc\x4c\x93\x09\x63\xf2\x83\x3e\x57\x5d\xf0\xd6\
+\x3b\xca\x0e\xf8\xc3\xff\x7e\x02\xa7\x9e\xf9\x6d\x38\xf9\x8c\x6f\
+\xc3\xd7\x70\x80\x3d\x11\x57\xcc\x27\x9c\x7a\x21\x3d\x26\x9f\x7c\
+\x01\x1c\x77\xd2\x79\x70\xd4\x09\x67\xc3\x91\x93\xcf\x86\x7d\x0f\
+\x3d\x85\x55\x7f\xbc\x2a\x23\x4a\x80\xd2\xd3\x00\x6f\x8c\x64\x8a\
+\x81\x91\xa7\x10\x57\xd3\xe3\x62\x2e\x78\xe3\x1d\x36\x1a\xd1\x19\
+\x7c\xd0\x42\x10\xb1\x3e\x1e\x42\x21\xf7\x1e\x26\xa7\x4b\x95\xf5\
+\xba\xa9\x38\xcf\xc2\x85\x4b\x68\xdb\x80\x24\x00\xf7\xfe\xf2\x11\
+\xf8\xd2\xd0\xb1\x6c\xce\x5b\xb8\xaf\x71\x71\x1f\xaa\xd0\x57\x8d\
+\xa4\x23\x1b\x49\xa2\x1e\x7f\xe2\xef\xbc\x75\xc0\x94\x06\x29\xd3\
+\x9c\x26\x56\x1b\xd1\x75\x22\xde\x07\x07\x1c\x7e\x0a\x65\xa2\x2b\
+\x6b\x5a\xa0\xac\xf9\xeb\x7e\x7a\x07\xec\x84\x83\xe5\xfa\x38\xc1\
+\x22\x22\x4c\x63\x83\x6d\x61\xd7\x3d\x8f\x82\x6b\x7f\x7c\x2b\x7c\
+\x82\x13\xac\xc5\x4b\x59\xf0\xa2\x15\x2f\xfe\xa5\xda\x84\xdd\xd9\
+\xfb\x53\xc4\x83\x1d\x44\x11\xf0\xaa\x1f\xde\x64\x30\xe1\x97\x2f\
+\x5b\x41\xfb\xef\xc4\xd0\x66\xdb\x89\x07\xc2\x78\x7c\x7f\xd1\x84\
+\x9d\x61\xbf\x43\x4e\x84\x5b\xef\x7c\x00\xe6\x7e\xb1\x80\xad\xe5\
+\x72\x76\x10\x32\xdd\x91\xc7\x9f\x45\x93\x8f\x92\xd7\x6d\xf0\x69\
+\x48\x70\xdd\x75\x6f\xe1\x06\xb8\x9c\xb6\x7c\xae\xba\xf6\x46\x1a\
+\x94\x48\x52\x41\x09\x8d\x1d\x35\x59\x7d\xb2\xe9\x8d\x10\xce\xff\
+\xd6\x55\x9a\x83\x20\xd7\xe1\xc7\xc1\xf8\xd6\xbb\x1e\x92\x26\x3b\
+\x0c\xe9\x09\x78\x9b\x4a\xcc\xf0\xb3\xcf\x7e\x59\xd3\x72\x17\x09\
+\xc0\xde\x07\x9f\x68\xa0\x40\x04\x01\x28\x53\xdd\x83\x48\x69\x65\
+\xd0\x03\xc1\xd8\x70\x47\x4a\xea\x64\xd2\xbe\xcc\xe6\xfa\xac\xf3\
+\x2f\x67\xaf\x5b\xe1\x7a\xfa\x42\xb5\x54\x0a\x38\xd5\xa9\xa8\x93\
+\x48\x24\x76\xd8\xfd\x68\xd9\x72\x22\xc7\x69\x38\xf1\x13\x32\xbc\
+\x62\xd4\xd7\xf1\x94\xec\x39\x23\x01\xea\xa8\x60\x00\x57\x92\xc9\
+\x12\xc6\x48\x90\xeb\xf0\xd7\xbf\x3d\x0f\x47\x1f\x7f\x36\x4c\xd8\
+\x7c\x4f\x7c\x5f\x76\x85\x89\x7b\x1e\x41\x93\xaa\x99\xb3\x66\x1b\
+\xa8\x13\xf1\xdb\x58\x0f\x27\x6b\xa2\x5d\x25\xd1\x8b\x94\x42\xcf\
+\xf1\x8a\x48\xab\xb7\x0a\xfb\xb7\x49\x33\x25\x77\x4f\x6e\xe5\xfd\
+\x8b\xb7\xad\xd3\x5b\xb2\x68\xc0\x51\x82\x58\x0b\x40\x1f\x59\x0b\
+\x0b\x90\x30\xa2\xc2\x55\x7e\xd6\x82\x39\x5e\xa0\xc4\x72\xbc\xc0\
+\x78\x98\xd5\x51\xcb\x59\x64\x54\xc0\x3e\x38\xa6\xe6\x27\x54\xfc\
+\x3c\x73\x04\x88\x54\x08\x54\x05\x8b\x7e\xd8\xe2\xa2\x43\x82\x28\
+\xa4\x91\xef\x3c\xbd\x05\x90\xa6\xa3\x10\xc4\x38\x00\xe9\x49\x93\
+\xa3\xf5\xee\x99\x90\x10\xcf\xf4\xa5\x8c\xa8\xa6\x26\xe8\x29\x71\
+\x0f\xa6\x4d\xce\x11\x00\x3f\x2d\xd0\x2b\x09\x54\xd7\x47\x4d\x7c\
+\x80\x62\xe6\x1b\x9a\x38\x92\xcb\xdb\x24\xdb\x4c\x3c\x14\x3e\xc4\
+\x15\x30\x19\x97\x22\x01\x65\xd1\x92\xa5\x54\x07\x80\xf5\x96\x97\
+\xc1\x02\x62\x73\x4b\x02\x4d\x02\xee\x5e\x41\xc7\x00\x37\xdd\x76\
+\x3f\x66\x43\x4b\xc7\xe1\xb8\xd0\x0d\x0e\xec\x53\xa6\xcd\x94\xfe\
+\xf0\x44\x84\x86\x54\x74\x2a\x99\x14\xca\x79\x5d\xf0\xf6\xbb\xef\
+\xab\x1e\x3a\x85\x35\x99\x6e\xfd\x52\x3a\xce\xb5\x8c\x42\xdb\xa4\
+\x9f\x4b\x99\xfb\xe2\xeb\x92\xe5\xd4\x65\x8e\xe8\xd5\x0b\xc8\x7b\
+\x8b\x1d\x0e\xa4\xdf\x67\x52\xac\xcb\xe0\xeb\x67\x5e\xac\x89\xea\
+\xd4\xd4\x24\x01\x57\x2d\x0c\x70\x35\x3b\x87\xca\xf6\xae\x90\x95\
+\xf7\xe4\x93\xcf\xe7\x96\xbd\xbd\x9c\xbd\x5e\xa3\x84\x36\x56\xfd\
+\x2f\xa6\x4c\xfb\xad\x77\x3a\x88\xf1\x05\x08\x94\xeb\x73\x69\x55\
+\x0a\xd3\x86\x52\xe4\x87\x55\x7f\x01\x0d\x80\xfb\x1e\x78\x22\x3f\
+\x77\xc6\xf4\x7f\xf0\xd7\x8f\x31\x84\x65\xb8\x18\x37\x63\x95\xf2\
+\x91\x38\xb1\x59\x40\x15\xf7\xe2\x7c\x02\xa0\xa4\xcb\x79\xf3\x16\
+\xc0\xfc\xf9\xe4\xbe\x2c\xa5\xc2\x45\x64\xcc\x6d\xe9\x12\x56\xa1\
+\x13\xc5\xc6\xef\x7e\xef\x27\x30\x64\x44\x9d\x8d\x25\x52\xb8\x98\
+\xab\x0f\xe2\x7b\x32\x74\x54\x0f\x5c\xf3\xe3\x5b\x78\x50\x07\x59\
+\xd5\x2f\xe6\x9a\xf9\x0b\x16\xe1\xd7\x5c\xba\x94\x33\xe4\x55\x50\
+\x26\xff\x91\xf6\xc2\x89\xa7\x5d\xc8\xa6\x13\x3a\x6a\x1a\x49\x4e\
+\x7d\x06\x27\xee\x71\x0c\xd3\x29\xa0\x2d\x8f\x65\x70\xc5\xd5\x37\
+\xc2\x97\x88\x98\xce\xb0\xf1\x32\x30\x09\x34\x8c\x0a\x37\x55\xfb\
+\x60\xe8\x88\x08\x7e\xf9\xeb\x47\xe5\xb3\xb4\x6c\x05\xbb\x77\xb7\
+\xff\xfc\x57\x54\x88\x67\xb0\x48\x36\x3a\x94\x89\x93\xc3\x93\x0f\
+\x57\x7e\x66\x14\x51\x90\xac\xfd\x9e\x07\x9c\xa0\xe9\x2f\xac\x80\
+\xa3\x4f\x38\x07\xbf\xdf\x04\x26\x8e\x23\xc5\xb2\x94\x1c\xf4\xbe\
+\x87\x9e\x44\x13\x2f\xd2\x4f\x27\xbf\xb3\x60\xe1\x22\xd8\x78\xeb\
+\x7d\x78\x42\x11\x31\xeb\xe6\x2a\x27\xac\x56\x39\x39\xaf\xca\x11\
+\x16\x7c\xec\xb8\xfb\x31\x46\x02\x70\xca\x19\x97\xb2\x24\xb3\x03\
+\xb1\x83\x92\xfe\x02\x45\x26\xa4\x2d\x00\x53\x87\xc3\x1b\xd3\x07\
+\x4f\x3f\xfb\x0f\x50\xd6\x3e\x4c\x51\x91\x90\xfc\x16\x8a\x7b\x43\
+\x27\x4f\xcc\x96\xd3\x82\x45\x8b\x60\xaf\x83\x4e\xe4\xc4\x5b\xbe\
+\xdf\x74\x98\x82\x39\x6c\x4f\xe2\xfb\xb5\x17\x28\x39\xec\xbc\x00\
+\xe6\xb5\xc3\xc9\xae\x49\x28\xdf\x43\x6d\x41\x65\x0b\x19\xfd\x14\
+\x69\x2b\x74\xa0\x01\x4c\x00\x50\x66\x82\x33\x28\x5b\x20\xa7\x59\
+\x48\x3b\xeb\xf7\xe3\xef\x51\x33\x83\x7e\x2c\x60\x89\xea\xd2\xec\
+\x41\xd9\xce\x31\x88\x09\x16\xa1\xf4\x9f\xf3\x35\xf7\x3c\x9b\xb9\
+\x10\x77\xd9\x73\x0d\xe3\x04\xf3\xba\x04\xbb\xdf\xf1\x83\x06\xda\
+\x1e\x69\x28\x89\xf9\xfb\x36\x1f\x03\x43\x5f\xc0\xb3\x24\x1b\x1e\
+\x4a\xb1\xe8\x44\x29\x68\x48\xd0\x86\x07\x2e\x99\xc8\xb8\xfc\x9e\
+\x8e\x26\xf6\xbe\xb7\xdc\x4b\xe1\x6d\x01\x75\x13\x88\x76\xc9\x32\
+\x06\x2d\x2f\x5f\xa1\x88\x64\x62\x93\xfa\xef\x27\x9f\xc1\x0e\xbb\
+\x1d\xc9\x35\x04\xfa\x58\xe0\x19\xd1\xc3\xfc\x00\x3a\x6b\x30\x7d\
+\xe6\xe7\x7c\x18\x7f\x05\xd5\x01\x60\xd6\xb1\xbd\x9a\x00\x51\x9d\
+\xc2\xfd\xef\xbc\xf7\x81\xdc\x40\x97\xf1\x00\xc2\x0c\x64\x96\x4a\
+\x08\x7a\x39\x67\xa1\x2f\xe7\xa3\x5b\x24\xc0\xff\xfb\x3f\x9f\xe0\
+\x4a\x71\x43\xa9\x9a\xb7\xd9\x76\xfb\xd1\x60\x46\x02\x24\xf9\x7a\
+\xea\x19\x97\x30\x36\xbd\x98\x20\x10\x3d\xe4\x6a\x20\xc5\x83\x0e\
+\x3f\xf6\x0c\x4d\x2f\x60\x05\x1d\x95\x9b\xb0\xd5\x3e\xcc\x5c\xa7\
+\x93\x19\xb6\x90\x4a\x9c\x8c\x92\x91\x2a\xf8\x99\x67\xff\x45\x2b\
+\x76\xe6\x81\x80\xb8\x85\x6e\xa8\x09\xea\xf0\x79\x7a\x9f\x25\xe8\
+\x24\xb8\x97\x3b\x36\x84\x77\xdf\xff\x2f\xbb\x26\xbc\x9e\x24\xa1\
+\x5a\xbf\x7b\x6b\xda\xce\xa0\xc1\x9f\xd8\x24\xf3\x04\x6f\xb3\x6d\
+\xf7\x87\x97\x5e\x79\xd3\xa8\x8c\xe9\x7a\x93\xeb\x5e\xc2\x2d\x7d\
+\x17\x2f\xc6\x81\x81\x19\x17\x11\xf9\xe0\xa7\x9f\xfb\x17\x6c\xbe\
+\xdd\xbe\xec\x5e\xca\xc0\x1f\xc9\x73\x63\xde\xf6\xbd\x54\xec\x67\
+\xff\x43\x4f\x81\xff\x7c\xf4\x29\xfd\x3d\x61\xd4\xc3\x26\x1b\xd8\
+\x3c\x39\xa7\xc7\x73\x18\x1d\xe0\xb5\x37\xdf\xc3\xf7\xf8\x08\x69\
+\x8b\xac\xf8\x2b\xa2\xd2\x64\x6b\x3b\x91\x8c\x01\x2e\x03\x96\x7c\
+\xe1\xb5\xba\xe2\x9a\x1b\x29\xfa\xc1\x4c\x9d\x78\xd0\x16\xad\x18\
+\x2a\x44\xd4\x27\x0d\x71\xde\x78\xfb\x7d\xde\xb3\x67\x49\x09\x55\
+\xd1\x23\xe3\x78\x1e\xb3\x04\x66\xd2\xd1\x1c\xfe\xef\x10\xc4\xbf\
+\xc8\x68\xed\xb0\xeb\xec\xa1\x09\x80\xfe\xdf\x51\x93\x59\x02\x50\
+\xe6\xea\x87\xf2\xb3\xd4\x21\x08\xae\x63\xe1\xa7\x37\xdf\x4d\xdf\
+\x1b\x80\x8d\x4b\xbe\xfe\xf6\x7b\x50\x19\xc3\x90\x1c\xe9\xb1\x20\
+\x0e\x4e\xfe\x73\xf9\xc8\xeb\xc4\x49\xc7\x70\x2e\x01\xe1\x7b\x00\
+\x7c\xed\xf4\x8b\x79\x35\xde\x25\x5b\x08\xa2\x7d\x21\xc7\x91\x2b\
+\xaa\x1d\x41\xac\xa2\xc9\xb9\x8d\x5c\x67\x13\xca\xab\x59\xce\x95\
+\x37\xe9\x67\x80\x26\x67\x38\xe1\xc3\x6b\xba\x60\x05\xbe\xf7\x44\
+\x74\x68\x39\xb3\x2d\xfe\xf7\x87\x1f\xc3\xf6\xbb\x1f\xce\xef\x73\
+\xbd\x40\x75\x9e\xee\xfc\xd7\x98\x6d\x7a\xb8\x0a\x40\xe7\x2b\xf3\
+\x1c\x06\x0a\x01\x48\x4d\x00\x50\x8a\x25\x6f\x7f\xb5\x01\x4c\xd1\
+\x0d\xc7\x12\xd4\x4d\x58\x29\xd2\x5c\xba\x2c\xc9\x43\x26\x7b\xde\
+\xde\x06\x70\xb9\x0a\x96\x6b\x35\xfb\xc9\x7a\x48\x03\xcb\x79\x28\
+\xc4\x44\x9a\xbc\x68\x2e\x68\xd9\xe7\x17\x5a\xbc\x02\xe2\xe7\x5f\
+\x33\xdf\xd7\xab\xc5\xb8\x08\x41\x8a\x75\x70\x94\xc1\xcf\xb0\xe9\
+\x10\x34\x32\xfa\x67\x91\x01\x15\x46\x21\xbe\x42\x93\x08\x1c\x3d\
+\x0e\x6d\x0f\xdf\xb9\xf2\x7a\x1c\x84\xde\xc2\xd5\xd0\x12\x3e\xb2\
+\xb5\x42\x4a\xdb\x92\x64\xe0\x4d\xbc\x61\x5f\x74\xd9\x0f\x60\xd4\
+\xba\x9b\x33\x63\x1a\xb1\x29\x56\x99\x12\x20\x71\xa9\x23\xb0\xf3\
+\xbb\xb8\x42\x9f\x31\xeb\x73\x9a\x08\x10\xcb\x5b\xfa\x5e\x9d\xbd\
+\x5a\x2f\xb6\x87\x9e\x13\xe9\xc5\x4e\x9b\x39\x8b\xea\x06\x4c\x9d\
+\xf6\x39\xb5\x53\xfd\x6c\xca\x4c\xfa\x75\xea\xb4\x59\x30\x7d\xc6\
+\xe7\x30\x73\x26\x39\x66\x53\xa7\x42\x22\x44\x43\x46\x0c\x5f\x7a\
+\xf5\x1d\x0a\xa5\x3b\xdc\x93\x60\x93\xad\xf7\x83\x4f\xa7\xcc\xa2\
+\x07\x11\xf6\x39\xee\x6b\xe7\xb3\x91\x3a\xee\x2c\x68\xa8\xab\x55\
+\x23\xe9\x27\x70\xcb\x1d\xbf\xa0\xd0\x2a\x79\xed\x69\x33\x66\xc1\
+\x53\xcf\xbe\x04\xc3\x46\xf7\x52\x38\xff\x84\xd3\x2e\xa6\xe7\x4f\
+\x74\xf4\xa7\xcd\x98\x0d\xfb\x1e\x72\xaa\x22\xb6\x71\xef\x76\xf6\
+\x9a\x7c\xac\x4a\x5a\xaf\x06\x3c\x68\xb1\x5e\xff\x69\x67\x5f\x0a\
+\x9f\x4c\x99\x41\xaf\x89\xd8\x08\x13\xab\x62\x16\x20\xbb\x24\xf9\
+\x90\x41\xf7\x3d\xd0\x81\xdf\xfb\xd8\x13\xcf\x81\xa7\x9e\x79\x01\
+\x16\x2e\x66\x8a\x8c\x24\xb8\x10\x74\x63\xf1\xe2\xe5\x94\xed\x4f\
+\xd6\xe9\xbe\x07\xff\x00\xbb\xee\x75\x34\x1b\x1d\xab\x30\x3e\x04\
+\x11\xd0\x29\x49\xa8\x5b\x13\xfa\xe1\x89\x09\x09\x4e\x95\x31\x11\
+\x1d\xed\x7b\xf6\xf9\x57\xa8\x54\x30\x4d\xf4\xa8\x14\x2f\x0b\x81\
+\x0b\x17\x2e\x86\x27\xff\xfa\x2c\x1c\x75\xfc\xd9\x30\x7c\x34\x97\
+\x0a\xf6\xeb\x9a\xbc\xac\xde\x9f\x66\x84\xcc\xed\x77\x3d\x1c\xa6\
+\xcf\x9a\x07\x33\x3f\xc7\x07\xfe\x7a\xe9\x15\xd7\x33\xe2\xa8\xd7\
+\x25\x47\x6d\x29\x29\x91\x43\xf5\x8c\xd1\xde\x47\xcf\xab\x77\x8b\
+\x3d\xe0\xa3\x8f\xa7\xc0\xa7\x9f\x4e\xa7\xbc\x91\x1b\x6e\xbd\x9f\
+\x71\x3c\x3c\x35\x92\x29\x90\x00\x85\xdc\xf1\xb6\x8b\x30\xf7\xf1\
+\xd9\xa4\xc4\xae\xfb\x1c\x07\xb3\x3e\x9f\x23\x47\x33\x0f\x3d\xfa\
+\x4c\x96\xcc\x51\x12\xa0\x2e\xc6\x13\xc8\x91\x4f\x62\xfc\xf3\xc2\
+\x4b\xaf\x51\x03\xac\x29\x53\xf1\x31\x6d\x06\x9c\xf7\xad\x6b\xa4\
+\x01\x91\x9e\x00\x38\x5c\xcb\x5f\xdc\xe3\x1d\x77\x3f\x02\xbf\xcf\
+\x7c\x98\x3b\x77\x01\x45\xc3\x4e\xfa\xc6\xa5\x52\x45\xb1\x24\xb9\
+\x0f\x35\x55\xfd\xeb\xed\x53\xde\x3a\x62\xaf\xd9\x0b\x43\x46\x84\
+\x94\x4c\x4b\x44\xa3\x88\x52\x25\x49\x62\x49\x92\xb7\x90\xdc\xf7\
+\xa5\x2b\x60\x3e\xbe\xef\xe4\x73\x79\xce\x45\x57\x42\x65\xad\x3e\
+\xde\xca\x50\x6e\x9d\xa9\xb2\xe8\xd6\xb1\xe5\xa2\xfb\x48\x9a\x12\
+\x6b\x11\xc4\xb9\x99\xf1\xc1\x3c\xc5\xd5\xa8\x0d\x2d\x80\xe6\x54\
+\x72\x9d\x95\xe9\x2f\x90\xb4\x03\x36\x0d\x73\x1c\x2f\x80\xd6\xd8\
+\xe0\x59\x37\x34\xc5\xa9\xce\xab\x65\x3c\x1c\xda\xbf\xf9\xb5\x02\
+\xb3\xfd\x69\x68\x81\x2d\x08\xc7\x4d\x7a\xd2\xe0\xfa\x34\x14\xc2\
+\x96\x65\xa1\x02\xe7\x62\x92\x5f\x5c\xc3\xd9\x2f\x96\x08\x78\x35\
+\x49\x66\xa3\x23\x88\x85\xac\x7c\x63\x89\x97\x1f\x24\xdd\x0c\x13\
+\x2a\x88\x45\x1c\x02\x6d\x44\x20\x53\xd8\x42\xb4\x2c\x58\xf5\x42\
+\xc6\xb5\xc6\xc3\x9a\x1b\x6c\x06\x5b\xed\x78\x10\xec\x73\xd0\xd7\
+\xe8\xb1\xed\xce\x87\xc2\x3a\xe3\xb6\xa6\x4e\x7f\x65\x1e\x40\x5d\
+\x2a\x6d\xcb\x2a\x4e\x5a\x2d\x51\x9f\xfa\x5e\x5a\x3d\x7b\x6b\x6e\
+\x0c\xde\x57\x26\x50\xc3\x9a\xe1\x6b\xb0\x8a\x9a\x55\x7f\xbc\x02\
+\x22\x82\x43\xc4\xb3\x7e\x8d\x5e\x1c\xf4\x22\xe8\x18\x89\x60\xd8\
+\x88\x6e\x18\xd6\xc9\x8e\xe1\xe4\x18\x19\xe0\xef\x85\xe0\x8d\xae\
+\xd3\xc0\xd8\x31\x8a\x11\xb8\x86\x8f\x42\x30\x74\x04\xe2\x41\x82\
+\x05\x9a\x32\x3e\x86\xe1\x73\x1b\xce\x7f\xbf\x4c\x58\xe7\x24\x90\
+\x54\x38\x93\x9b\xc2\xcf\xa1\x61\x25\x4c\x12\x96\xd5\x46\x12\x83\
+\x9d\x8d\xa1\xf2\x15\x7c\xbe\x63\x26\x50\x61\x9f\x21\x23\xf0\xf9\
+\xe2\x63\xd8\x1a\x9b\x30\xd3\x9d\x35\xd8\x7b\x97\xab\xaa\x4d\xe4\
+\x56\x54\x6b\xc6\x4d\x90\x56\x39\x69\x8d\x4f\x53\x94\xf0\xb9\xac\
+\xde\x49\xce\x8f\x1d\x43\xa9\x8f\xc2\x38\xfa\x7d\xf9\x9c\xd0\xf3\
+\x21\xeb\xb4\x31\x4e\xa0\xfa\xf0\x3a\xd7\x61\xad\xb1\xdb\xe0\xea\
+\xfa\x28\x38\x06\x27\x04\x27\x9c\x7c\x01\x1c\x78\xe4\xd7\x61\xc2\
+\x16\x7b\x81\x87\xd7\x8a\xd9\xfa\x8e\xe7\xde\x05\xfc\x33\xe6\x23\
+\x33\xf0\x6b\x26\x3f\xba\x94\x6c\x69\xf8\x78\xaa\xc1\x40\x78\x05\
+\xa4\xa5\xb1\xdf\xa1\xa7\xc0\x01\x87\x7d\x1d\xb6\x9e\x78\x28\x8c\
+\x59\x7f\x2b\x1c\xa8\x19\x73\x9e\xca\x3b\xfb\x11\x27\xd1\x45\xbc\
+\x7a\x55\x49\x8e\x98\x48\x70\xf1\xf3\x32\x7c\x54\x00\xde\xa8\x6e\
+\x7c\x1f\x03\x58\xad\xca\xef\x4b\xa5\x5b\xb6\xb1\xca\x1a\x74\x4e\
+\x8f\x4a\xc4\xf9\x19\x5d\x54\x01\x71\x75\x7a\xdf\x6a\xd4\x4a\x5a\
+\x8c\x7d\xba\x1d\x5a\xfb\x4f\x68\x3e\x08\x35\x3e\xad\xaf\xef\x72\
+\xa2\xe4\x6a\xf8\xd9\xab\xe0\x67\xce\xc7\x47\x15\xdf\xcf\x61\x23\
+\x09\x32\xd5\xa7\x0c\x85\x44\x20\xaf\xa8\xb6\x02\x79\xdd\xa1\xf8\
+\x3d\x3b\x46\xe2\xe7\x6a\x34\x39\x7a\xf1\x73\x58\xd7\xd4\x11\x03\
+\x65\x43\x5c\x8d\x24\xf7\xc9\xa1\x2a\x8d\x01\x4d\x20\xfc\xaf\xf4\
+\x50\x6d\xff\x61\x23\x19\xc2\xe5\x88\x7d\x8f\xb7\x1e\x5d\x43\x87\
+\x44\x27\xa6\x46\xbc\x3d\xc1\x5b\x14\xf4\xf3\xd8\x05\xd5\x35\xeb\
+\xd0\xb7\xf9\x5e\x30\x69\xff\xc9\xb0\xe7\x41\x27\xc1\x96\x3b\x1e\
+\x0c\x6b\x6d\xb8\x05\x7e\xa6\xc7\x1b\x53\x18\x8e\xd0\x59\x48\x09\
+\x18\xad\x57\xb3\x59\xfb\x72\xf1\xca\x35\x9d\xf4\x17\xe7\x64\xb5\
+\x53\xe8\xee\xff\xd8\xd4\x40\x47\xbf\xd8\x01\x17\x0d\x1e\x28\xe9\
+\x4f\x1f\x93\x96\x64\x81\x1e\x15\xd2\xa1\x4e\x9d\x51\x4d\x3b\x64\
+\x12\x51\xb3\x57\xe4\x56\xc8\xab\x16\x43\x1e\xb2\x50\x88\x46\x13\
+\x80\x58\x22\x14\x5f\x8b\x8e\x40\x1a\x88\xa4\x27\x20\xf6\x87\x3a\
+\x69\x7b\x9a\x27\xb8\x94\xd7\x4f\x43\xda\xcc\xaf\x7e\x3d\xb5\x18\
+\x69\x33\x30\xfb\x85\xc2\x82\xd5\x13\xe3\x43\x5d\x72\xfd\x64\x10\
+\xa8\x86\x1a\x04\x1b\x72\x12\x1c\xe3\x02\x10\x4f\x00\xd2\x12\x18\
+\x82\x83\xec\x10\xea\x61\xdf\x6b\xcc\xb4\x97\xaa\xbd\xbc\xa7\xca\
+\x92\x02\xf6\x3e\x22\xa0\xeb\x4a\x7f\x9c\x80\xd5\xc9\x93\x8c\x2a\
+\x97\x45\xa5\x09\x52\x37\xf3\x48\xaf\x30\xe7\x3c\x5a\x09\x7b\xe3\
+\xb9\x89\xcb\x78\xa6\x3c\xe8\xd7\xe4\x14\x89\xbe\xf1\x0a\x68\xbc\
+\x4c\x65\x7c\xfb\xb8\x9c\x2f\xab\x16\xa9\xc3\x20\x75\x19\xec\xa3\
+\xe7\xcf\x7e\xb6\xae\x09\xc1\x84\xca\xa2\xd6\x67\x9b\x97\xa3\x79\
+\xd5\x1b\xae\x87\x52\x53\xa0\x8b\xc3\xce\x4a\x6a\x56\xcd\x98\x0b\
+\x68\xbc\xce\xf9\x14\x13\xe4\xf9\x0c\xe1\xc4\x42\x3a\x62\xe9\xb1\
+\x11\x4d\xca\xd6\xf7\xc4\xb8\x26\x43\x11\x84\x85\xb1\x0e\x8d\x97\
+\xab\x0a\x01\x50\xce\x79\x35\x85\xe8\xc9\x2a\x9b\x27\x11\x62\x04\
+\x93\xde\x97\x1e\x95\x44\x48\xc5\xc8\x3a\x87\xd3\x43\xd9\x3e\x92\
+\x2d\x16\xca\x11\x18\xcf\xd6\xdf\xe3\x92\xcf\x7e\x8d\x6b\x19\x44\
+\x9c\x28\x1a\x32\x83\x26\x2e\x68\x53\x12\xcf\x15\x6d\x83\x74\xc9\
+\xc4\xd9\xd5\x24\xb8\x95\xee\x48\xcd\x4c\xc0\x45\x72\x23\xf5\x35\
+\x10\x43\x2a\x3a\x7b\x38\xba\xd3\xc7\x9f\xc5\x5e\x59\xb5\x8b\x44\
+\x48\xb4\x15\x84\x4d\x39\x53\x5c\x64\x89\x1c\xf1\x6a\xd0\xbd\x11\
+\x0c\x2b\x6a\x8e\xac\xd0\x00\xdb\xd1\x6d\xf2\x1b\xb8\xac\xb6\x4a\
+\x8e\x54\x02\x20\xd1\x8b\x8a\xd6\x2e\x92\x9c\x84\x28\x66\xe6\x85\
+\x24\xdf\x47\xed\x05\xc2\xf2\x98\x8f\x13\x7a\xfd\xa1\x19\x92\x81\
+\x00\xfb\xb5\xb6\xdb\x91\xb7\xd6\xc6\x4c\xda\x01\x17\xea\xf9\x0f\
+\xa4\x6a\xa0\xd5\xa0\xad\xf9\xfb\x42\xf6\xe5\x41\xfd\xb7\xa0\x41\
+\x81\x24\x20\xd4\x7c\xc4\x1b\x09\xda\xad\x1e\x28\x43\xb5\x30\xa3\
+\xda\x35\xb4\xfd\xf9\xbf\xfb\x41\xac\xba\x46\x0d\x9c\x83\x4d\x7c\
+\x29\xd6\x5a\xd0\x13\x15\x1b\x4a\xe2\xd7\x2c\x55\x7d\x68\x78\xb1\
+\xb3\x8d\x28\x94\xe2\x23\x76\xef\x83\xa0\x41\xe8\xca\x72\x9d\x7e\
+\x6c\x4d\x3d\x14\x3b\x27\xb1\x61\xf2\x5e\x2f\x9f\x89\x1e\xcc\xb9\
+\x14\xca\x43\x41\x6d\x96\x65\x01\x9b\x56\x15\xcc\x4e\x02\xd8\x10\
+\x4e\x46\x2b\xcb\x40\xd7\xab\x98\xf3\x7e\xaf\x64\xcd\xcb\xaa\x4c\
+\x24\x00\x3e\xdf\x5c\xab\x2c\x88\xb1\x19\x6c\x1e\x7c\xe9\xa6\xcd\
+\x03\x06\x0d\x34\xdd\xf2\x7e\x4b\xc6\xb8\x5f\x53\xb2\xd0\x7e\x3c\
+\x01\x60\xac\xfd\xb2\x0c\x18\xbd\x72\xce\x9b\xaa\xef\x51\x06\x7d\
+\x9f\x64\xd4\x8b\xca\xb5\xc4\x5b\x1e\xe5\x58\x90\x50\xc9\x10\x3b\
+\x37\x36\xb7\xde\xcd\x03\x1b\x0b\xb4\x83\x2b\x5a\xd0\xa6\x49\x8b\
+\xd0\x7d\xef\xe1\x6e\x81\x3d\x52\xf0\x45\xa0\x25\x82\x75\x2e\x82\
+\xad\x3e\x4e\x27\x92\x25\x26\x1d\x1c\x48\xef\x00\x33\xc8\x68\x41\
+\xa7\x12\x68\x42\x59\xfa\x4c\x7d\xb7\x4c\x08\x25\xe3\x5d\x06\x7f\
+\xfe\xbc\x8a\x39\x78\x82\x0e\x54\xf8\xb3\x5a\xd1\xe0\x79\x4f\x89\
+\xe7\xb8\xb2\x45\x82\x94\x6d\x33\x0f\xfe\x8a\x27\x21\x90\x32\x9e\
+\xb4\xe9\x1e\x1c\x3e\x92\x2a\x78\x42\x70\x48\x6a\x0f\x54\x58\xd2\
+\x25\xcf\xb5\x12\x93\xfc\xf6\x95\xcf\x45\x59\xf6\xec\x23\x6d\x62\
+\x20\x88\x11\xa8\x99\x36\x08\x49\xa0\xa4\x09\x94\x48\x06\xc4\x67\
+\x91\x5e\x3f\x7b\x4d\x47\xd8\x8e\xd3\xfb\xc9\x13\x1f\x4e\x36\x96\
+\x1b\xbe\xa7\x69\xf1\x7b\x35\xbe\x1e\x66\x10\x35\x27\xac\x42\x2e\
+\x7d\x1e\x99\xc1\x83\xbb\x34\x96\xb8\x14\xb2\x2a\x28\x34\x52\x6f\
+\x3f\x06\xb0\x2c\x0e\x52\x3b\x82\x5b\x3e\xac\xae\x8d\x54\xfb\x51\
+\x8e\x1c\x7c\xab\x9c\xa8\xbc\x73\x5b\xb9\x08\x40\x1b\x13\x80\xc8\
+\x02\xd9\xd4\x32\x7a\x2f\xba\xc0\x4d\xcc\x87\x3b\xae\x38\x65\x0b\
+\xfa\xfa\xbf\xf9\x7a\xe0\x29\x82\x08\x64\x05\x3d\xcb\x03\x60\x4d\
+\x3a\x6a\xc9\x9f\xf5\x63\xc4\x3d\xbf\xc8\xf9\x24\xa7\x15\x1c\xfd\
+\x3d\x78\xa5\xa9\xfc\xdc\xb5\xf5\x31\xce\x2b\x7f\xe2\x42\xf2\x13\
+\x8c\x16\x4d\xbe\x1a\x61\xb1\x3e\x95\x45\xce\x58\x2a\x70\x45\x6a\
+\xe3\x15\xbd\x6c\x99\x00\x30\x1d\x7f\xfa\x77\xbf\xdb\xb8\x26\x37\
+\x9e\x04\x88\x0d\x8e\x07\xed\x32\x67\xc7\x4b\x81\x14\x5e\x5d\x96\
+\x05\x17\x80\xbe\x67\x20\xab\x79\x21\x85\x4b\xdf\x43\x0f\x68\x22\
+\xb1\xe0\x7d\x77\x16\x64\x6a\xea\x10\xd5\xa3\xdc\x70\xb9\x71\x90\
+\x84\xa1\xeb\x12\x32\x2e\x6b\x76\xc2\x72\xfe\xbf\x2a\x6c\x86\x95\
+\xe8\x0b\x4d\x5c\xe8\xcf\xf5\x72\xc2\x23\xef\x03\x6b\xc1\xcc\x95\
+\xd7\x8c\x24\x27\xa0\x54\x65\x84\x43\x99\x88\x6a\xc9\x8d\x50\x9a\
+\x73\x45\xc5\x2d\x7d\xe2\x45\xe5\x4d\xce\x87\x07\xaf\x4e\x16\x7c\
+\xd9\x73\xd4\x2d\xbd\x14\x58\x0b\xaa\x9b\x1b\x07\x71\xff\x0b\xeb\
+\xb9\x20\x29\x72\x45\xef\x8f\xae\x91\xe1\x05\xca\x05\x93\x4f\xd9\
+\xb0\x84\x44\xab\x42\x2b\xa1\xaa\xde\x45\x02\xa0\xf1\x0a\x18\xf2\
+\x12\x68\x66\x39\x9c\x74\x2b\x91\x21\x91\x70\x45\x72\x6d\x59\x3f\
+\x5d\xd9\x1e\x97\xb4\x76\x59\x89\x27\x7c\x25\xa2\x7e\x57\xe1\xa8\
+\x88\x1f\x1a\xd7\xa4\x9e\xbb\x18\x12\xd7\xa1\x02\xbb\x20\x2e\x3a\
+\x82\xc0\x28\xf7\x28\x1b\xa2\x18\x6a\x13\x37\xf6\xcf\x4e\x59\x9e\
+\x87\x98\x38\xd2\xd1\x94\x94\x3d\x8b\x23\x17\x22\x99\x35\x26\x87\
+\xb4\x2a\x5f\x4f\xd8\x98\x6b\xa0\xc6\xe3\xd0\xd0\x46\x47\xe7\xf4\
+\xf8\xad\x04\x41\xb3\x82\x8e\xdb\xf7\xea\x2d\xa4\xfe\xec\x77\x3b\
+\xb9\x7c\x34\x93\xb7\x94\x38\x17\xbf\x15\x1e\x40\xd0\x86\xe0\x3f\
+\x10\x68\x08\xb2\x71\x00\x1a\x75\x87\x43\x19\xfa\xf5\x41\x0e\x31\
+\x0f\x69\x4c\xf7\x38\xd4\x5d\x33\xfd\xb9\xf3\xaa\x7e\xbf\x56\x08\
+\x19\x50\xc4\xb9\xf8\xf9\x44\x05\x82\x5b\x4c\xfb\xda\xda\x36\x08\
+\x93\x81\xdd\x7a\x5e\x28\x85\xfc\x82\x32\x7a\x64\x05\x92\xa0\x44\
+\x56\x1d\xe5\x64\xc1\x61\x53\xd5\x7f\x7b\x48\x3a\x41\x4c\x49\xcc\
+\x7e\x9d\xac\xf2\x0d\xb9\x7e\xbd\x72\x97\x53\xfd\xdf\x5e\xad\xba\
+\x15\x5a\xf4\x82\x11\xad\x7a\xca\x34\xc8\xe9\x4e\x66\x62\x03\x97\
+\x95\xbb\x56\x69\xfb\x81\x3a\xf8\x46\x5b\xd6\x0d\x4f\xfc\x58\xe5\
+\x2f\x03\x7f\x5d\xbe\x8e\x0c\xf4\x5a\xaf\x5b\x24\x06\xe2\xe7\x55\
+\x00\xe3\xc1\x59\xcc\x83\x57\xf5\xf3\xa8\x49\xd7\x3a\xa1\xb1\x40\
+\x51\x0a\x3d\x09\xf0\xb5\xaa\x50\x56\xdb\xbd\x32\x39\x72\x79\x72\
+\x54\x12\xbe\xee\xc2\x0c\x86\x3b\xf8\xd1\xf7\xab\xa8\xa9\x18\xf9\
+\x5e\xfc\xbe\x96\x79\xf0\x95\xd6\xb9\x5a\xc2\x2d\x1d\x0e\x75\xb3\
+\x2c\xd1\x87\xf5\x15\xac\xae\x23\x08\xa2\xdd\x23\xaa\x5f\xd9\xab\
+\x4e\x5c\xb7\x52\xec\x34\x91\x16\x3d\x98\xd4\x63\xa4\xba\x40\x41\
+\xf0\xc2\x9f\x5e\xbc\x9f\x6c\x43\xf4\xd2\xf5\xa1\x08\x0d\xe5\x49\
+\x20\x2d\xb8\x07\x2a\xd9\x13\x6b\x2b\x66\xe1\xc5\xbd\x90\x08\x86\
+\x20\xfe\xa6\x7d\xbe\x91\x01\xc5\xa7\x55\xb7\x66\x10\x4a\x69\x85\
+\x56\x2c\x06\x3c\x5e\xbc\x7d\xa9\x02\xb8\x5a\x13\x1b\x6c\x6c\x61\
+\xef\x7b\x08\x5a\x13\x2a\xcb\x33\x13\x4b\x26\x04\xfd\x7a\x18\xf2\
+\xbf\xb6\x36\x43\x60\x91\x65\x0f\x2c\x3c\xa9\x46\x09\x80\x01\xb4\
+\xaf\x85\xbe\x52\xed\x80\x51\x9b\x2f\x22\xe5\x21\xae\xd4\xda\x0c\
+\xfb\xd7\x1a\x18\x61\x6c\xf4\x46\x5b\x3e\xe8\x7e\x90\x61\x86\x54\
+\xe4\xfa\x6c\xe7\x63\x7b\x9f\x5a\xac\x5f\x19\x14\xf0\x13\x08\x33\
+\xec\x7f\x83\xdc\x8c\xb5\xb8\x63\x56\xb3\x42\x1e\x81\x25\x43\x47\
+\x16\x48\x33\x4e\x70\x0a\x55\xf0\x94\x0c\xea\x3e\x3e\x36\x58\xe7\
+\xa2\x3b\x1c\x75\x10\x48\x94\x18\xd7\xf3\xb4\x8a\xd2\xd7\x12\x89\
+\x78\x10\xf1\x6b\x92\x2f\x40\xfe\x5e\x96\xad\x13\x14\xeb\x89\xab\
+\x89\x85\xb2\x06\x0b\x2b\x88\xba\xae\x08\x59\x42\xce\x55\x06\x3e\
+\x0e\xff\xfb\x3d\x3c\x11\x08\x29\x27\xc1\x40\x00\xfc\x9a\x16\x6c\
+\x93\x88\x80\x81\x50\xc8\x40\x19\x99\x64\x30\xbc\x2e\x4e\x27\x3f\
+\x47\xe1\x1f\xef\xb3\xf6\x84\x10\x18\x92\xd6\xb0\x86\x79\x95\x82\
+\xad\x5d\x6d\xec\x55\x26\x1f\x7e\x4d\x05\x7f\x1f\x69\x32\xb0\x7a\
+\x55\x5d\xd7\xee\x1f\x67\xa7\x93\xf7\xf6\x7b\xa4\x2d\x6d\x59\xaf\
+\xc6\xb5\x24\x4b\x55\xdd\x81\x76\xdf\xeb\xb1\xeb\xb3\x90\xea\x84\
+\xd0\x8e\x58\x33\x99\x90\xf5\x4a\x3d\x03\x4a\x16\xe5\x63\x7c\xf2\
+\xfd\x25\xd2\x21\xae\x5f\x43\x57\xc4\x54\x45\xca\x67\xcc\x7c\x36\
+\x90\xa1\xb1\x11\x0f\xfc\xc9\x44\x20\x36\x4d\x93\x96\x04\x88\xc4\
+\x8b\xeb\x4e\x94\xbc\xf8\x34\x52\x8a\x6c\xb8\x61\xb1\x1b\xf5\x53\
+\x10\xca\x1b\x81\x1e\xb8\xc0\x26\x8c\xc8\x4a\x85\x25\x89\x83\x16\
+\x45\xf0\x56\x05\x1e\x43\x5b\x13\x00\xd4\x64\x4f\xc6\xec\x43\x33\
+\xd8\xda\x5e\xdd\xba\x89\x20\xd8\x78\x02\x20\x7b\x7e\xf2\xef\x91\
+\xb6\x01\xb6\xf3\x21\x8f\x62\xe7\x81\xd4\x98\x5f\x2c\xbb\x57\x55\
+\x48\xf1\x89\x04\x83\xd4\xd7\x11\x4f\x64\x6a\x39\x53\x0c\x81\xdc\
+\x80\xc4\x35\xbb\x46\xbf\x56\xfc\x7b\x14\xeb\x7b\xa5\x7d\x28\xa3\
+\x16\x93\x81\x20\x06\xf7\x99\x41\x5b\x7d\xcf\xac\x08\x53\xbd\x25\
+\x38\x8b\x99\xc9\xd6\x22\xcd\xd3\x3c\x52\xe4\x39\x19\xe8\xc4\xe6\
+\xae\x57\xf5\xea\x19\xa1\x7a\x0d\xa2\xa5\xa0\xa1\x0a\xe2\x90\x1c\
+\x80\x6a\x2c\xc8\x55\xb5\x7f\xf7\x55\xf0\xd7\x49\x87\xe2\x7d\xcb\
+\xbc\xba\x2e\x57\x4d\x99\x58\x31\x26\xa8\x92\x85\x88\x4f\x30\xb0\
+\x76\x00\x85\xfe\xa9\xbf\x40\x98\x48\x00\x24\x02\x20\x7b\xfb\x48\
+\xf5\xa9\xa9\x7a\x9d\x86\x4a\x54\x91\x22\xe9\xf9\x22\x01\x21\x81\
+\x4f\xf5\xad\x1d\x9d\x39\x2f\x51\x08\x9d\x03\x11\xa8\xf7\xa4\x6b\
+\x84\xe4\x3a\xd2\x3f\x57\xb9\xa5\x70\xb5\xa6\x54\xed\x34\x0d\x78\
+\xfd\x1e\x31\xf7\x39\x1c\xf8\x65\x22\x24\x12\x9f\x48\xb6\x25\xf4\
+\x40\x5e\xe6\x55\x2c\x6b\xcd\x90\x96\x07\xd2\x60\xfe\xba\x44\x2f\
+\xca\xd5\x30\x39\x4f\x2f\x12\x00\xc9\x77\xd1\xc9\xa4\x1c\xf1\xf0\
+\x7b\xe5\x79\x08\x34\xa0\x2c\xcf\x43\x25\x13\xd2\xc0\x89\xcf\xda\
+\xbb\x95\x6e\x85\x54\xf9\xaa\x55\x67\x3c\xc7\xa4\x35\x50\xd5\xc5\
+\xb6\x22\x6b\xf0\xb7\x27\x00\x6a\x0c\x52\x17\x43\x4a\xdb\x3b\x1c\
+\xa9\x41\xc2\xd5\x2f\x89\x24\x35\x75\xf8\xd3\x05\xbe\x90\x06\x73\
+\xa3\x04\x7a\x52\x7c\xbe\xbf\x11\x82\x9a\x19\x33\x6c\xe8\x47\x7c\
+\x6f\xe8\xef\x59\x7a\xb3\x88\xb0\x15\x13\xfa\xda\x04\xc6\x3e\x59\
+\xe4\xfc\x1c\xaf\x78\x31\x69\x5f\x8b\x30\x25\xa9\x8d\x2c\xfb\x68\
+\x7b\xd7\xab\x40\x0b\x20\x6a\x30\x03\x8a\x52\xf4\xf1\x63\x01\xc7\
+\x20\xae\x45\xd9\xcc\xf9\x44\x02\x10\x87\x89\x35\x45\x3b\x3f\x3d\
+\x71\x71\x32\x13\x00\x94\xd3\xe2\x40\x12\x5a\x2c\xe9\xbd\x37\xe3\
+\xfd\xa2\x82\x88\x05\xb2\x4c\x10\x88\xac\x5f\x9c\x67\x90\x2d\x64\
+\x94\xf8\x5e\x2d\x47\xcb\x20\xcb\x68\xa9\xf8\x87\xdc\x49\x45\x77\
+\x52\x7e\x47\x33\x83\x92\x64\xab\xc4\x33\x15\x65\x9b\x44\x09\x12\
+\x95\xd4\x69\xaf\xab\xca\x5b\x54\xd6\xa2\xe2\xf6\xeb\x66\xc0\xa5\
+\x1b\x23\xdb\xb4\x1d\x01\xf1\x8a\x20\x21\xaa\x68\x41\xbc\xd3\x83\
+\x7c\x45\x55\xd6\x66\x5b\x40\x27\x53\xa9\xd6\x43\xd9\x82\x00\x88\
+\xf3\x28\x69\x1c\x01\x1a\x84\xb8\x29\x8b\x38\x6f\x02\xfb\x97\x45\
+\xc2\x52\x55\xad\x0e\xf6\xde\x35\xc9\x8c\x77\x8d\xf1\xc0\x40\x55\
+\xe6\x9a\x60\x90\x78\x5f\x66\x9b\x5b\x97\x44\x40\x91\x78\xc8\x84\
+\x55\xa8\x0b\xd2\x73\x89\x64\x9b\x45\x92\x20\xab\xa2\xe2\x54\x50\
+\x7e\xb9\x82\x8c\x16\x84\x58\x27\xc1\x1d\xd0\x35\x0b\x04\x61\x4e\
+\x54\xfd\x4e\xb5\xae\x31\xda\xeb\x4a\xea\x58\xaf\xe0\x45\x61\xe0\
+\x2b\xc6\x7c\x59\x93\x20\x76\x75\xae\x44\xd5\x24\xb8\x1a\x95\xb7\
+\xa7\x19\xd2\x54\x43\x1e\xec\x7b\x34\x3b\xdc\x3e\xde\x06\xe8\x91\
+\x28\x8c\xb9\xb9\xea\x1a\x25\x9a\x45\x74\xec\x73\xed\x58\xf9\x43\
+\x41\x93\x6d\x35\xed\x77\x33\x49\xd1\xc8\x74\xe0\x4b\xcc\xe3\x47\
+\xd6\x76\x6b\x3c\x29\x89\x5f\xaf\x13\xdb\x1b\x14\x31\xbb\xb9\xe0\
+\x6b\x2f\xc0\xfa\xb3\x42\xb6\xb7\x6e\x5d\x43\xd0\x48\x47\x6a\xc2\
+\x58\xa1\x18\xb5\x30\x02\xd8\x3c\x02\x90\x8c\x53\x51\x13\xc2\x4a\
+\xfd\xd2\x02\x68\x87\x2b\x5c\x9a\x0c\x61\x5a\xe0\x6d\xa2\x05\x20\
+\x60\x31\x91\xe5\x36\x84\x5a\xd8\xce\x33\xb2\x7e\x80\x15\x5b\x94\
+\xc3\xc3\xbe\xd9\xfb\x29\x8b\x59\x5e\x5f\x0f\xec\x61\x0a\xe4\x8f\
+\x32\x20\xfc\x30\x46\x1e\x42\x39\x2a\x8d\x28\x89\x4e\x58\x93\x2a\
+\xd4\x42\xeb\x23\xef\xc3\x66\xf6\x3b\xe3\xc9\x86\xab\x7d\xdf\xf1\
+\x8b\x8c\xb4\x04\x16\x27\x43\xbd\xca\x8b\xe4\xdc\xbf\xf4\x33\x4f\
+\x64\xd0\xea\x20\x41\x60\x30\xaf\x8e\x69\xbf\xd7\x0f\xcc\x43\xf6\
+\x99\x19\xe9\x2f\xd9\x77\xd6\x51\x15\x55\x39\x96\xaa\xbd\xb1\x2a\
+\x3f\xb4\x9e\x47\xc9\xd0\x7c\xd7\x99\xf9\x75\x3a\x2d\x20\xab\x73\
+\x7d\x1a\xc1\x57\xad\x0b\x7a\x5e\xda\x28\x9b\x4a\x04\x14\xe4\xcf\
+\x48\x74\x75\x85\x8c\xf8\xca\x63\xbe\x24\x0e\xed\xbd\xe8\xf3\xda\
+\x59\x37\x83\xab\x9c\x34\xd0\x78\x35\xbe\x06\xa7\x1b\x49\x87\x96\
+\x40\x49\x7e\x82\x08\xfc\xa1\x16\xec\x7b\x8c\xc0\xef\xf0\xa4\x40\
+\x31\xce\x91\x99\x6c\x19\xad\x19\xb1\x66\x6c\xdd\x64\x92\x25\x03\
+\x76\x6c\x8c\x58\xce\xc6\x6b\x48\x91\x4c\xbe\x58\x9b\xc8\x11\xf7\
+\x8e\x13\x47\x5d\x49\x1e\xad\x4b\x25\x49\x15\x84\x15\xbf\xc2\xd1\
+\xa5\x9f\x53\x95\x52\x53\x74\x31\x72\xf7\xa3\x28\x83\xa0\x9c\x36\
+\xe5\x13\x18\xfb\x52\x7a\x65\x1f\x18\xfa\x12\xf6\x73\x42\x6d\x85\
+\xeb\x8d\x67\xbf\x85\x49\xa3\x66\x55\xee\x54\x45\x8f\xac\xa4\x44\
+\xd7\x5f\x75\xc7\xfc\x56\x91\x16\x40\xab\x01\x81\x6f\xfa\x9e\x2e\
+\xca\x10\xc5\x88\x82\xa1\x5d\x9f\xbf\xd1\xc3\x37\x1d\xfd\xc4\xcd\
+\x6f\x0c\xfe\xcf\xd3\x2c\x28\xf2\x3b\x28\xf6\x41\xb6\x70\x13\xfc\
+\x8c\x89\x04\xdf\x32\x42\x67\x19\xed\xb3\x9f\x87\x6d\x32\xa1\xde\
+\xa0\x43\x63\xbb\x25\x35\x83\x64\x02\xe0\x87\x46\x02\x90\xfe\x01\
+\x44\x09\x61\x0f\xbd\xb7\x5c\xe2\xc1\xdf\xa1\x47\x2f\xef\x2b\xd7\
+\x63\xc9\x13\x47\x67\x84\xcb\x9a\x40\x02\xf4\x8d\x3d\x46\xa0\x73\
+\x2a\x8a\x0d\x5f\x8a\x11\xa8\x44\x9b\x41\x8c\xf6\x09\xd5\xb9\xb2\
+\xa5\x1a\x35\xaa\x52\x0e\xdb\xab\x60\xdc\x2b\x5b\x07\x25\x3e\x4f\
+\x4e\xfe\xee\x74\x32\x95\xc0\x12\x87\xb5\xe5\x5c\xb9\x18\x43\xf4\
+\xba\x4d\xff\x01\x7e\xaf\xcb\x02\x72\x15\x32\xc8\xbe\x72\x8d\x13\
+\x2d\x12\x71\xae\x3a\xe4\xad\xb4\x07\x54\xeb\xa4\x54\x35\x09\x78\
+\xaa\x22\xe7\x9c\x1d\xdf\x4c\xc6\x75\xe2\x9f\x9c\x21\xaf\xa8\xb5\
+\x72\xf8\x21\xfc\xe7\x65\xc0\x25\x50\xb5\xb0\xd5\xd6\xa4\xa3\xdd\
+\x18\xaa\xa1\x12\x17\xa5\x97\xa0\x82\x5c\xa0\x39\xf9\x69\x8e\x7e\
+\xe2\xb9\x13\xd2\xd0\x12\x05\xd1\x8f\x3e\x49\x8a\xa4\x53\x01\x7e\
+\x5d\xfb\x7b\xc4\x05\xac\x02\x6d\x0c\x91\x4b\xef\x8a\xde\x7b\xa5\
+\x16\xfb\xac\x0a\xbf\x8e\xc0\x6e\x28\xd6\x70\x1f\x1d\xe5\x54\xff\
+\x59\x6a\x77\x28\x51\x74\xd1\xb1\x43\x2f\xd0\xa4\xc1\xb3\x3e\x7f\
+\xb6\x22\xa2\x7d\x50\x7c\xff\x21\x00\x41\x46\x61\xb2\x72\xd5\xf6\
+\x1a\x17\x49\xfa\x5f\x97\x00\xd8\x5c\xeb\x6c\x0f\x6a\x94\xd1\x62\
+\x68\x40\xbc\xc7\x18\x15\xd3\xa0\x61\xde\x87\x2b\x36\xc7\x1a\xa5\
+\x38\x38\xe5\x39\x19\x46\xe6\xf7\xfd\xf8\xf5\x15\x19\x41\x4c\x41\
+\x04\xfc\x98\xbe\x40\xca\x26\x62\x42\x78\x69\xaf\x97\x86\x00\xb4\
+\x27\xe3\xd5\xd7\xc1\x5c\x13\xd5\x2f\x56\x6c\xf1\x5a\xc3\xbd\xc4\
+\xf8\x9f\x5d\x83\x3f\x82\x94\x35\x2a\x21\xb8\x69\x32\xaa\xc6\x78\
+\x4f\xb5\x4e\x05\x58\x4a\x52\x72\x95\x6f\xe2\x5c\x4c\xa7\x24\x0e\
+\xaf\x4b\xce\xbf\x97\xf8\xf8\x99\x22\x1a\x72\xa2\x9a\xe8\x1d\xd3\
+\x51\x3d\x46\x26\xa3\x23\x7c\xbe\xb2\xfa\x75\xe3\x04\x3a\x7d\xea\
+\x84\xfe\x5e\x1f\x57\xe5\xeb\xe3\xea\x86\xbc\xfa\x96\x7e\x07\x3d\
+\xaa\xf2\xe7\x26\x35\x4e\x85\x6b\xd7\x53\x21\x22\x26\x88\xc3\xc4\
+\x71\x02\x29\x1b\x4c\xe1\x75\x41\xee\x93\x82\x48\xec\x90\xc4\x37\
+\x7e\xce\x52\x28\x89\xbc\xd7\x08\x7e\x1d\x5c\x97\x80\x8d\x20\xb2\
+\xa9\x0b\x71\x88\xd9\x78\xe5\x63\x2f\xd4\xf8\xc4\x5a\x75\xab\xd9\
+\x7f\x09\x31\x6b\xde\xf5\x7e\x5d\x26\x6c\xc2\xdc\xa8\x24\x5f\xaf\
+\x8b\x93\x2c\xcd\x31\x3b\xc9\x5b\x11\x88\x49\x27\x9b\x8e\x10\x0a\
+\x82\xac\xff\xce\xce\x63\x70\x07\x17\x45\x92\xfe\x1d\xe2\xd9\xaf\
+\xab\xc4\xa3\xaa\x5a\x2e\xa5\x2a\x13\x43\x62\x6b\x21\x5a\x03\x5a\
+\x62\x26\x44\xaa\x64\xb0\x57\x89\xd7\x60\x32\xa3\xdf\xc1\xdf\xcb\
+\x0f\x8c\xfe\xba\x09\x31\xb7\x82\x98\xda\x10\xcf\x50\xe3\x15\x59\
+\xd4\x43\x13\xfb\x81\xe2\x02\xa9\x36\x65\xd1\x99\xfb\x22\x96\xbc\
+\x79\xd2\xba\x36\xd7\xd7\xfe\x16\xc8\xd1\x24\xde\x8d\x82\xd0\xd6\
+\x8e\x68\x83\xe1\x4f\x5b\x75\x11\xda\x2d\xf2\xd3\x92\x1d\x70\x3b\
+\x46\xbf\x50\x81\x80\x1a\xe5\x4e\x0a\xa4\xc2\xfd\x96\x20\x2b\x25\
+\x2f\x2d\x0f\x81\xbd\x72\x8f\xbd\x96\x6f\x87\xf5\x74\x44\x21\xae\
+\xac\x95\xfa\xba\x99\x32\x97\x28\xc6\xf0\xd5\x8c\x7e\xbc\xf8\x6b\
+\x45\xa9\x5a\xfd\x82\xd8\x27\x3f\xf4\x7e\x90\xaa\x42\x68\x06\x47\
+\xd4\xa6\xec\x35\xc6\x98\xf5\x91\x36\x3f\x8b\xa4\x7c\xac\xbe\x51\
+\x2a\x1b\xdd\xf4\x0f\x9a\xa9\x5c\x16\x6a\xdc\x0e\x3e\x7b\xed\xf1\
+\xe0\x21\x45\x66\x90\xa6\x39\xd1\x25\x2b\x49\xd2\x47\x77\x78\x02\
+\xc0\x74\x14\xba\xa8\x16\xfc\x97\xa9\xec\xe9\x78\xfa\x67\x76\x10\
+\x83\x98\x71\xd4\x24\x86\xca\xe8\x7a\xe3\xe5\x2c\xbd\x98\xe1\x67\
+\xac\x7d\x0d\xf6\xa7\xb2\xc4\x7c\x94\x4e\x92\xce\xb4\x59\x75\x7e\
+\x3f\xcb\x3c\x30\x52\x51\x1d\x6e\x2c\x43\x05\x8c\x70\xa0\x1d\x42\
+\xcd\x8d\xf0\xef\x8f\xc0\xd7\x2b\x82\x7f\x27\x69\x0d\x20\x1a\x5c\
+\xa9\x69\x0d\x39\xbf\x61\x1b\xc1\x97\x86\x6d\x48\x0d\x8a\xa8\xcd\
+\x2f\x3f\x3f\x47\xac\x09\x3e\x87\xc1\x32\xd0\xea\x95\x7e\x5d\x8e\
+\xa8\x11\x58\x9f\xbd\x57\x1f\x3d\x4a\x23\x58\x02\x32\x84\xcb\x2b\
+\x13\x75\x45\x76\x3d\x8c\x84\x48\x8e\x32\x3d\x3f\x26\xb4\xe4\x56\
+\x94\x9c\xf3\x60\x2e\x85\x4c\xd7\x8d\xac\xe7\xf0\xb1\xd4\x92\x99\
+\x48\x08\x33\x05\xc2\x48\x8e\xd8\x99\x04\x3f\x41\xe8\x64\x52\xcb\
+\xf4\xda\xf0\xef\xb8\x24\xa9\x31\x04\x83\x94\xb5\x2f\x45\x56\x46\
+\x28\x04\x40\x68\x27\x90\x7b\x49\xdf\x77\xf5\xb1\x5c\x01\xb1\x4b\
+\x0a\x4a\xb1\x75\xd1\x10\x87\x4e\x45\xd4\x64\x92\xcb\x4c\x6f\x82\
+\xbe\x47\xa7\x8e\x08\xb0\x75\x23\x09\x04\x55\x45\x24\xcf\x83\xa6\
+\x20\x29\xd4\x17\xd9\xb3\xd3\x45\xd5\xf3\x5c\x09\x39\x07\x2d\x8e\
+\xb8\x65\x19\x83\xd9\xb5\xf7\x6d\xad\x2e\x13\xda\xb6\x41\xf0\xa8\
+\x01\x44\x33\xfb\xf3\xef\xa6\x8e\x32\x2a\xe5\x51\x95\x00\x24\xd5\
+\x08\xfb\xa3\xa2\x36\x89\xc5\xb1\x6b\xd2\xf6\x9e\x38\x21\x79\xe0\
+\x82\xbd\xde\x86\x88\x32\xbf\xe6\x0b\x19\xb5\x2f\x5e\x0f\x6a\xad\
+\xcf\xdf\xb8\x56\x7c\x3a\x6c\x15\x14\x24\x01\xda\x12\x80\x34\xb8\
+\x3e\x43\x79\xcf\xcf\x52\xe7\x0b\xc1\xb4\xce\xcd\xfb\xf0\xe6\x4d\
+\x31\x68\xd7\xe0\x29\x5f\x6f\x2a\xfe\x51\xd1\xec\x7c\x8d\x60\x1f\
+\x59\xe4\x7c\xf5\xaa\x3f\xca\xb8\x27\xa8\xd0\xb5\x35\x3b\xbb\x6f\
+\xab\x14\xd4\xf9\xa5\xd9\x31\xe7\x3d\x2f\xa1\x55\xd7\x5c\x6e\x30\
+\x3c\xd9\x09\xfa\x76\x83\x1b\x6e\xb9\x07\x6e\xb8\xf5\x5e\xb8\xf1\
+\xf6\x07\xe0\x96\x3b\x1e\x80\x9b\x6e\xbf\x1f\x6e\xbc\x0d\xff\x1d\
+\xff\xfb\xcd\xf8\xcf\xb7\xdc\xf5\x10\xac\xd6\xc9\xc8\x4c\xc4\xdc\
+\xe7\x86\xdb\xf0\xcf\xdd\xf9\x20\xfc\x0c\x7f\xbd\xe1\x96\xfb\xe0\
+\xfa\x9b\xee\x81\x9f\xdc\x78\x37\x3e\xf0\xeb\xdc\x72\x3f\x5c\x7e\
+\xcd\x8d\xf0\xa5\xa1\xeb\xd3\xc0\x84\x36\x9d\x04\x37\xe3\xd7\x1c\
+\xb3\xfe\xe6\xb2\x02\x2d\x93\x31\x43\xbf\x8f\x3b\xfa\xf5\xc1\x96\
+\x13\x0f\x83\x3b\xee\x7d\x18\x86\x8e\x44\x46\xff\x5a\xb4\x3c\x18\
+\x8c\xdc\x0d\xa3\xd7\xdd\x94\x9e\x23\x39\xa7\x9b\x6e\xbb\x0f\x1f\
+\xf7\xe3\x3f\xdf\x47\xff\x4e\x0f\xfc\x3e\xfb\x1f\xfe\x0d\x29\x2d\
+\x4b\xab\x58\x1c\x60\x88\xb9\xce\x09\xa7\x5e\x00\xf7\x3f\xf8\x07\
+\x78\xea\x99\x7f\xc0\x23\x7f\x7c\x0a\x2e\xbc\xe4\x1a\x58\x6f\xfc\
+\x56\xac\x3a\xe5\x49\x09\x83\xb7\xfb\xa4\x45\x2f\x59\xa7\x0d\xd0\
+\x0e\x70\xf1\x77\xae\x83\x3f\xff\xf5\x79\x78\xf5\xcd\x77\xe8\xef\
+\x13\x33\xa6\x0d\xd0\x8e\x0c\x69\xa0\x9e\x04\xbd\xb0\xe9\x76\x07\
+\xc1\xc3\x8f\x3e\x05\xeb\x05\x3b\xe1\xa4\x80\x0b\x12\x75\xf2\xc9\
+\x08\x92\xa8\x8c\xec\x83\xfa\xe6\xfb\xc2\x3d\xbf\x78\x04\x46\xac\
+\xb3\x29\x7c\x99\x26\x24\xe3\x68\xc0\x1f\xb3\xee\x04\xb8\xe0\xdb\
+\x57\xc3\xef\x1f\xfb\x1b\x3c\xfb\xc2\xab\xf0\xc8\xa3\x7f\x85\x6f\
+\x7e\xfb\x5a\x58\xaf\x6b\x1b\x59\x51\xeb\xe4\x3a\x41\xc8\x24\x6b\
+\x43\x82\xe8\x29\x67\x5c\x06\xd7\xfc\xf8\x76\xe6\xbc\xe8\x09\xf9\
+\x62\x21\x7f\x2b\xa6\x00\x18\x4a\xe1\x52\x94\x22\x82\xae\xde\x9d\
+\xe1\xca\x6b\x6f\x84\x27\x9f\x7e\x1e\xfe\xf9\xf2\x1b\xf0\xf0\x1f\
+\xfe\x02\xa7\x9d\x79\x09\x8c\x22\x26\x36\x62\x4c\x4f\x4e\x1e\xf0\
+\xde\x3e\x45\x6a\x10\xb5\x16\xbe\xfd\xae\x5f\xc2\xbf\x5e\x7d\x0b\
+\xde\x7e\xef\x3f\xf0\xf8\x93\xcf\xc0\x37\xce\xb9\x0c\x3a\xd7\xde\
+\x98\xcb\x34\xb3\xa4\x6e\x97\x7d\x27\xc3\x4d\x77\xfc\x12\x27\x18\
+\x38\xe9\x22\x89\x00\x3e\x57\x7a\xdd\x38\x21\x20\x4e\x8b\x07\x1e\
+\xf1\x75\xb8\x17\xdf\x93\x70\xe3\xbd\x38\x7a\xd1\x4e\xd8\x16\x65\
+\xec\x6d\x45\x2b\x57\xa4\x21\x66\x36\xfd\x7e\x94\xc2\xcb\x0a\x52\
+\xf6\x94\xbc\x0a\x39\x48\x11\x01\xca\x9a\x76\xe8\x8f\x00\x1b\x59\
+\x5a\x0d\x59\x46\x43\xa8\xcd\xd0\x7d\x5e\xd0\x47\x2d\x54\xfc\xc5\
+\xf7\xcd\x66\x5e\x63\x50\xf3\x01\x21\x0f\x22\xca\x73\xc2\x4b\x83\
+\xc4\x9b\xd1\x01\x40\x19\x62\x3a\x21\x64\x39\x03\xda\x3d\x07\x8a\
+\x40\xe6\x79\x46\x43\x41\xcc\x3f\x40\x83\xb0\x85\xbd\xb1\x67\x93\
+\xa6\x8c\x0a\x4c\x2a\xa0\x94\xf1\xcb\x20\xc7\x8f\x00\x35\xf9\xc0\
+\xdb\xd7\x33\xdb\x1c\x04\x65\x68\x17\x64\xf7\xbf\x8c\xde\x3b\x97\
+\x6d\x65\x6a\x69\x35\x08\x26\xec\x06\x77\xdd\xfb\x5b\xb8\xfb\xfe\
+\xdf\xc0\xbd\x0f\xfc\x16\xee\xfb\xe5\xef\xa8\xed\xe9\xaf\x1f\x7e\
+\x1c\x7e\xfb\xbb\xc7\xe0\x8b\x2f\xe6\x53\x6b\x53\xe2\x68\xf7\x65\
+\x5c\x65\xfe\xcf\xd0\xf5\xe0\xb3\xe9\xb3\xe1\x25\x1c\x34\x7e\xf5\
+\xbb\x27\xe0\x37\x8f\xfc\x19\x7e\x8d\x8f\x87\x1e\xfe\x13\x3c\xf8\
+\xdb\xc7\xe8\xd7\xeb\x6f\xbe\x0f\x06\xe3\x04\x80\xc0\xec\x13\xf7\
+\x3a\x9a\xba\xe5\xfd\x0a\x7f\x6f\x35\x0a\x8b\xf7\x32\xe8\xbe\x3a\
+\x81\xcb\xf8\xf6\xc1\x61\xc7\x9f\x05\x8b\x97\x2c\x87\xd5\x47\x06\
+\x34\x80\xb9\x31\xc5\x3a\x4a\xda\xc3\x41\x69\x1d\x1c\xb0\x97\x2c\
+\x03\x78\xe1\x9f\xaf\xc0\xef\x1f\x7f\x0a\x1e\x7d\xe2\x6f\xf0\xe8\
+\x9f\x9e\x62\x7f\xfe\xd3\xdf\xe0\x8f\x7f\x7a\x1a\x4e\xf8\xfa\xc5\
+\x4c\xa7\x9f\x70\x01\xf0\xef\x10\x37\xbe\x0f\xfe\x3b\x15\x3e\x9b\
+\xf6\x39\xdc\x83\xaf\xef\xea\xeb\x6e\x81\xdb\xee\xfc\x05\x7c\xf8\
+\xd1\x14\xea\x0e\x77\xfa\xb9\xdf\x81\x21\x74\x5a\x80\x9d\x17\x73\
+\xc0\xab\x53\xf8\xfe\xfc\x6f\x7f\x1f\xbe\x58\xb0\x08\xde\xfb\xf7\
+\x7f\xe1\x27\x3f\xbb\x0b\x2e\xfe\xee\x0f\x71\x82\x74\x3f\x7c\xf2\
+\xe9\x54\x98\x83\xd7\xe5\xf8\x53\xbe\x49\x2d\x8b\xcb\x23\xea\x34\
+\x28\x92\xeb\x44\x9b\xec\xc1\xc9\x89\xc2\xae\x96\xcd\xcc\x93\x6b\
+\x9d\xb8\xc7\xb1\xf4\x67\xd6\x1d\xbf\x2d\xf5\x0a\x20\x41\x90\x38\
+\xed\x7d\xf2\xd9\x4c\x78\xe3\xad\x0f\xe0\xba\x9f\xde\x01\x97\x7f\
+\xff\x67\x70\xcf\x7d\x0f\x53\x47\x45\x72\x7e\x67\x5e\x70\x25\x6f\
+\xbf\xf4\xf2\x79\xff\x1e\x45\xca\x22\x88\xc8\xf0\xf1\x38\xf1\xfa\
+\x39\x3c\xff\xe2\xab\xf0\xe5\xd5\xd7\xa7\x88\x02\x45\x19\x04\x9f\
+\x87\x57\xff\x65\xde\x26\x71\x47\x84\x70\xde\xb7\xaf\x82\x05\x0b\
+\x17\xc3\x07\xf8\xbe\xde\x8c\x13\xa9\xcb\x70\x42\x73\xfb\xdd\x0f\
+\xc1\x94\xa9\x9f\xc3\xa7\xf8\x5c\xf6\x3e\xe8\x24\xb6\xf6\xdc\x46\
+\x9a\x69\x42\xf4\xc1\xe8\xf5\xb6\xc4\xf7\xfc\x71\x6a\x27\x4c\x9c\
+\x10\x2f\xfb\xde\x8f\xe1\xfc\x8b\xae\x84\x3b\x7e\xfe\x20\x7c\x3e\
+\x67\x2e\xb5\x31\xde\x7a\xe7\x83\xf9\x54\x44\x1d\xce\x38\xe7\x72\
+\x98\xfb\xc5\x42\x1c\xf8\x71\x02\x40\xd0\x8e\xe1\xe3\xe9\x33\x44\
+\x10\x87\x7d\x0e\x3e\x09\xe6\xce\x5f\x0a\x67\x9c\x7f\x05\x6d\xcb\
+\xb4\x87\xd5\x9e\x65\x8d\x5b\xe4\xf5\x83\x16\xd8\xf6\xad\xce\xaf\
+\xa3\x8c\x00\xdb\x0a\xab\x3e\x6b\x1f\x8a\x0a\xc6\x24\x64\x39\xbf\
+\x08\x5a\x71\xee\x6b\x36\x71\x50\x89\x59\xd4\x0f\x50\x7f\xfe\xfd\
+\x77\xbc\xec\x7b\x3c\xa8\xfd\x8b\x80\x32\x82\x61\xd4\x30\xe1\x8f\
+\x41\x71\x45\xb5\xfd\x6d\xc1\x30\x0b\x6d\xc8\xaa\x54\x51\x0e\x31\
+\x23\x4b\x38\x22\xe3\x3a\x8d\x5e\x7f\xd6\x07\x36\x6b\x92\xc2\x36\
+\x87\x1a\xc4\x6e\x36\x6a\x92\x07\x80\x72\x10\x0e\xdd\xa1\x2e\xc8\
+\x11\x31\x0a\x0a\x24\x22\x51\x7a\xf0\x97\x24\x37\xe1\x96\x56\xe3\
+\xba\xf7\xc4\x92\x97\xc1\xf7\x4a\x37\xbe\x0b\x8e\x39\xe1\x0c\x58\
+\xb2\x74\x19\xec\xb4\xfb\xe1\xf4\xe7\xc8\xe6\xfd\xff\x0d\x5d\x07\
+\x3e\x9e\x36\x0b\x8e\xfd\xda\x79\xb4\xb2\x23\x7e\xed\xec\xc0\x7f\
+\xee\xd8\x80\x7d\xc5\x07\x6d\x21\xe0\x20\xb4\xeb\xbe\xc7\x53\xab\
+\xe2\xc5\x4b\x97\xc2\x05\xdf\xfa\x3e\x0e\x98\xa4\x32\xde\x18\x07\
+\xa2\x8d\xa9\xc9\x0f\x81\x95\x0f\x3b\xee\x4c\x58\xb8\x78\x39\x75\
+\x9b\x13\x09\x40\x59\xb0\xd9\xb9\x42\x1b\x81\x89\x49\xe0\xc4\x79\
+\x02\xec\xb2\xcf\xd1\x74\x12\x81\xb6\x24\xaa\xdc\x62\xb7\x1a\x4a\
+\xbb\x5e\x4a\x04\xc4\xdf\xdf\x19\x07\xff\xb9\x5f\x2c\xc1\x89\xcd\
+\x1f\xa8\x7b\xdb\x60\x02\xfd\x73\xc3\x9f\xca\xe8\x08\x2e\xc5\x01\
+\x6c\xc9\xf2\xe5\x70\xe1\xc5\xd7\x70\xdf\x81\x09\x34\xd0\x91\x75\
+\xba\xf8\xf2\x1f\xc1\x42\x9c\x6d\x9c\x83\x03\x30\x71\xce\x23\x30\
+\xbd\x43\x39\x03\xcc\xae\x97\xa0\x0d\x8b\x71\x20\xec\xdb\x72\x1f\
+\xda\xdf\xdf\x71\xf7\xa3\xa9\x57\x7c\x6d\xe3\x49\x94\x50\x59\xe6\
+\xda\x06\x62\x3c\xb0\x3c\x12\x27\x00\x7b\x1e\x0b\xf8\xf4\x61\xbd\
+\xda\x8e\x78\xad\x03\xf8\xd2\xb0\x8d\xe0\xa9\xe7\x5e\x86\x3f\x3c\
+\xf6\x34\xac\xe6\x8f\x67\x6d\x09\xde\x3a\xa9\xae\xd9\x03\x57\xfd\
+\xe0\x26\xf8\xf1\x8d\xf7\x70\x64\xa2\x6e\x8e\x65\xf2\xf1\xba\xc1\
+\x24\x01\xf8\xd9\xcf\xe1\xb9\x17\x5f\xc1\xd7\xb7\x81\x26\xb4\xa3\
+\x29\xed\xd1\xe4\x66\x02\x4d\x00\xbe\x7d\xc5\x8f\xa8\x65\xf4\xc5\
+\xdf\xbd\x0e\x86\x8d\x8a\xf8\x38\x2a\x33\x31\x1a\xb1\x76\x1f\xdc\
+\x75\xdf\x6f\x60\x11\xbe\xee\xdd\xf7\x39\x9e\xaf\x25\x4b\xd2\x86\
+\x8d\xee\x83\x67\x9e\x7f\x19\x66\xce\x9a\x03\x7b\xec\x3f\x19\xdf\
+\xdb\xf1\x8a\x34\x88\xcf\x79\xed\x8d\xb6\x80\x27\xfe\xfa\x2c\x7c\
+\xf8\xe9\x34\xa8\xac\xc1\x6c\x84\x49\x72\x35\x07\x27\x31\xb4\x45\
+\xe1\x75\xf1\xa4\x67\x2c\xec\xbc\xf7\xd1\x30\x67\xfe\x62\xb8\xe8\
+\xb2\x1f\xe2\xc4\xa0\x5b\x1b\x01\x44\x6d\x0e\x72\x41\xdb\x02\x4f\
+\x63\x3c\xa8\x46\x55\x60\x07\xde\xb0\xc7\x15\x93\x44\x1e\xca\x29\
+\x52\x50\x01\xee\x02\x6a\x1b\x94\x6e\x47\x3a\xda\x85\x38\x34\x9a\
+\xc4\xa1\x86\x51\x80\x41\xad\x3d\x3c\xa8\x40\x8f\x09\x15\x60\xae\
+\x86\x96\x3e\x7c\x9c\x44\x56\x04\x01\x08\x33\x12\x00\x1b\x91\x10\
+\x19\x4c\x7c\x37\x45\x4b\x3b\x29\x20\x11\x17\x00\x8a\x72\x3e\xd4\
+\xb5\x14\xa5\xc2\x3c\xf5\xbe\xc8\x98\xad\x4d\x0a\xea\x84\x86\x98\
+\x45\xfe\x28\x4f\x04\xc5\xed\x2f\xa3\x18\xa7\x22\xa6\x3c\xe6\xeb\
+\x1a\x0c\x8a\xfc\xa7\x8f\x8f\x65\xb7\x24\xd2\x3e\x9c\xe6\xfa\xea\
+\xec\x6f\x61\x98\xa2\xb3\xe1\x85\x9e\x7f\xef\xe6\x7b\xc0\xbc\xf9\
+\x0b\xe0\xfb\xd7\xdd\x4c\x45\x6a\x48\x6f\x99\x40\xb8\xff\x33\x6c\
+\x5d\xf8\x64\xfa\xe7\x30\xf9\xd4\x6f\x32\xc7\x3c\xe1\x2c\xc7\xb9\
+\x00\xcc\x5a\xb7\x8b\x29\xfe\x75\x46\xb0\xd7\xc1\x27\x02\x8e\xff\
+\x70\xe9\xe5\xd7\xd0\x64\x62\xd2\x7e\xc7\x33\xd1\x1e\x5e\xa5\x93\
+\xf7\x3a\xf4\x98\xd3\x61\xe1\xa2\x15\x30\x6c\x44\x4d\xd3\xce\xaf\
+\x99\x66\x42\x38\xd8\xac\x5f\xdb\x9e\x26\x00\xbb\x1f\x30\x19\x06\
+\x77\xe2\x80\xde\xd9\x43\x55\xf9\x4a\x23\x78\x4f\xbe\x53\x30\xf1\
+\x43\x18\x3e\xa6\x0e\x1f\x7c\x34\x15\xfe\xf8\xe7\xbf\x53\xeb\x64\
+\xda\x6b\xa6\x84\x45\x24\x47\x4d\x57\x1b\x11\xc1\x15\xd7\xdc\x08\
+\x8b\x97\x2c\xa5\x95\x3b\x23\x16\xf6\x40\xb8\xc9\x24\x58\xb4\x78\
+\x19\x4d\x02\x88\x2d\xaf\x64\xb0\x53\xf3\xa2\x2e\x7a\x4f\x88\xe5\
+\xf2\x76\xbb\x1e\x4e\x61\x7e\xa7\x33\x84\xed\x76\x3b\x12\x96\xe2\
+\xeb\x0c\x36\xde\x9d\x3d\x3f\x9d\x5c\x9c\x88\xf3\x02\x56\x1b\xd9\
+\x0b\xbb\xee\x73\x1c\x4d\x00\x36\x08\x27\xc2\x60\x7a\x8f\xbb\x70\
+\x20\x5c\x02\xc7\x7d\xed\x7c\xe6\x5c\x27\xd4\x15\x7d\xc6\xb9\x20\
+\x55\x34\xb1\xcf\xa5\x89\x84\xec\x17\x47\x72\x9a\x83\x21\x00\x5d\
+\x14\x01\x78\xee\xa5\x57\x61\xf0\xea\x1b\x52\x5b\x63\xe6\x03\x81\
+\xf8\x68\x64\xc4\xdc\x0a\xf1\xeb\x44\x5b\xee\x09\x4b\x96\x2d\x83\
+\x6b\x7f\x74\x2b\x9b\xe2\xa8\xd6\x95\xcc\x33\xd7\x09\x18\x8a\xd7\
+\xe4\xe1\xdf\xff\x19\x3e\xf9\x6c\x1a\xf8\x6b\x6e\xc2\x11\x91\x1e\
+\x38\xfb\x82\xef\xc1\x52\x9c\x38\x4c\xdc\xfb\x58\x9a\xd0\x50\xb2\
+\x24\x41\xdc\x3a\x94\xba\x1f\xb1\xdc\x5d\x7b\xfc\x36\x92\xd9\xff\
+\x8d\x73\xbe\x43\x11\x80\x32\xe9\xf9\xf3\x79\xf8\x1d\x76\x39\x18\
+\x3e\x9f\x37\x1f\x7e\x70\xfd\xed\x2c\xf1\xa8\x2a\xbd\x83\x2c\xdd\
+\x91\x46\x67\xd6\xd3\x3e\xb7\x6a\x5e\xdd\x34\xfc\xc9\xe3\x01\xd8\
+\xf7\xe9\xd6\x44\xd1\xe2\x24\x68\xbd\x45\x97\xb6\x3f\x26\xb9\x53\
+\xcd\xc4\x9a\xf4\x00\x67\xb4\x09\x2b\x29\x22\x3f\x95\x28\x65\x7d\
+\xda\x53\xfc\xda\xe2\x80\xd5\x38\x2b\x27\x96\x24\x9e\x23\xaf\x95\
+\xa4\xa0\x5f\x13\x80\x46\x6f\x5e\x9a\x15\x70\x1a\x6c\x8f\x52\xe6\
+\xf4\x35\xf6\x7d\x22\x88\xa7\x05\xbf\x3c\xd4\x01\x25\xc4\x32\x4a\
+\x99\x24\x97\x46\x75\xa9\x85\x99\x0f\x4a\x19\xe7\xc9\xf2\x05\x08\
+\x53\xaf\x2f\x6d\xd3\x71\xbc\x76\x65\xb9\x96\x7b\xe7\x17\xe1\x3b\
+\x04\xf9\x6d\x1d\x7d\x6e\x57\x8e\xfb\x85\xa9\x6a\x61\x22\x09\x90\
+\x96\xc3\xdc\xa8\xc5\xed\x60\x23\x7b\xa4\x97\xfb\xc6\x5b\xef\xc1\
+\x53\x7f\x7f\x01\x57\x7e\x5c\x0d\x90\x92\xd7\xc6\xc3\x97\x87\xad\
+\x0f\x9f\xce\x98\x0d\x93\x4f\xf9\x26\xad\x3e\x69\x55\xdc\xc1\x58\
+\xf5\xcc\x23\xbe\x8b\xf1\x30\xa8\xdd\x70\x2f\xec\x77\xd8\xc9\x34\
+\xe8\xad\x35\x76\x53\x78\xf0\x37\x8f\xc2\xcc\xcf\xe7\xc0\xf8\xfa\
+\x2e\x1c\xce\x66\x44\xb2\x43\x8f\xfe\x06\x2c\x20\x09\xc0\x48\x86\
+\x50\x49\xe3\x20\x9e\x00\x08\x94\x67\xfd\xee\xed\x70\x00\x5b\x01\
+\xbb\xed\x7b\x3c\x0c\xc6\x81\x6b\x30\x21\xed\xd1\xb1\xbf\x3a\x9f\
+\xf9\xe7\x63\x67\xf8\x3c\x0e\xa7\xa8\xc2\x32\x40\x38\x20\x3b\xa2\
+\x2f\x4e\xc7\xef\x18\xc1\x6f\x48\x27\x83\xfc\x89\x2f\xfd\xd4\x69\
+\x33\xe0\x7a\x52\x69\xf3\x5e\xfb\x75\xd7\xdf\x09\x9f\x4d\x99\x81\
+\xcf\x47\x8d\xae\x29\xe3\x23\x66\x6b\xec\x6a\x93\x19\xe4\x9c\xb7\
+\xc1\xc9\xc0\xa2\x65\x38\x01\x98\xb0\xbb\x52\xd2\xe4\xef\x21\x92\
+\x80\xdd\xf7\x3b\x81\xae\xc5\x46\xf5\xdd\xe8\xb4\x05\x39\xaf\x7f\
+\x7f\xf8\x29\x3c\xf2\xe8\x93\x38\xf0\xd6\x0c\x2f\x04\xda\x8e\x20\
+\xec\x7a\x32\x6f\xaf\xe9\x66\x08\x7f\x01\x87\x3b\x19\xd2\x16\xc0\
+\x0d\x04\x01\x78\x0d\xff\x79\x43\xae\xb6\x18\xa8\xd9\xff\x4e\x61\
+\xab\x8c\x28\x52\x30\x6b\xf6\x3c\x7c\xcd\x78\xdd\xc4\x67\x48\x68\
+\x1f\x54\x39\x89\x11\x1f\x5d\x3d\x13\x61\xd9\xb2\xe5\x30\xf9\xe4\
+\x0b\x29\x37\x82\x88\x1a\xbd\xff\xc1\x47\xb4\x8d\x43\xee\xab\x23\
+\xb4\x17\x68\x12\x12\xc4\x9c\x06\x6b\xd2\x29\xf2\xeb\x67\x5d\x02\
+\xb3\xe7\x2d\xc4\xe7\xcc\xd0\x82\xcd\xb7\xdb\x0f\x66\xcf\x99\x07\
+\x77\x3f\xf0\x30\x0c\x19\x21\x88\xa5\xdc\x68\xaa\x5f\x85\x5a\x50\
+\x6a\xf0\x35\x8a\x00\xc3\xde\x77\xe0\xc4\x63\xf2\x1d\x54\x57\x0e\
+\xa3\x5e\xad\x51\x64\xed\xbb\x0f\x14\xa3\xdf\x9c\x4e\x68\xc6\x3f\
+\x61\xe0\x44\x94\x06\xf5\xff\x83\x52\xa4\x57\xd3\x08\x54\x1d\xa5\
+\xc0\xf6\x61\x01\x52\x22\xca\x20\xb5\xf5\x17\x54\x83\x32\xe0\xbd\
+\x34\x72\x5c\x56\x52\xa4\x74\xe8\xb3\x1d\x19\x83\x16\x12\x00\xbb\
+\xa2\x97\x55\xdc\x23\x4e\x72\x2c\xa4\xeb\xa0\x9b\xa9\x58\x12\x80\
+\x4a\x14\x93\xfc\xd5\x18\xe5\x54\x13\x40\x78\xcf\x93\xca\x7d\x3c\
+\x3c\xf0\xd0\xef\x71\x05\x38\x15\xd6\x1e\xb7\x15\x67\x76\x33\xc8\
+\x99\xb0\xb7\xbf\x34\x6c\x3d\x98\x32\x7d\x0e\x9c\x76\xd6\xc5\x50\
+\xc1\x81\x84\x1c\xfe\x57\x22\xa8\xe0\x8a\xbb\xba\x56\x2f\x4e\x1e\
+\x26\x30\x35\xbe\x91\x84\x1c\xd7\x07\x07\x1c\x71\x2a\xed\x7b\xaf\
+\x35\x76\x2b\x18\xb1\xf6\x26\xf0\xe6\xdb\xff\x86\x7f\xbc\xf8\x3a\
+\x0c\x1f\x19\xf1\x76\x54\x37\x1c\x7c\xe4\x69\xb0\x70\x11\xe0\x7f\
+\x43\x2c\x88\xf8\xca\x03\x5e\x4a\x08\xe3\x73\xdc\xa0\xb6\x3d\x2c\
+\xc2\x11\x74\xa7\x49\x47\xa9\xe4\xa3\xc2\x20\x7d\x67\xf8\x38\xca\
+\x62\x27\xff\x4e\xd8\xfe\x3f\xbb\xe5\x5e\x78\xe5\xf5\xf7\xe1\xcb\
+\xab\x8f\x55\x9e\x05\xe4\xfa\x2b\xdc\xdf\x80\x8f\x12\x12\xf6\xfe\
+\xed\x3f\x7f\x10\xde\x79\xef\x03\x5a\xd5\x13\xb4\xe3\x5f\xaf\xbc\
+\x09\x77\xde\xfd\x90\xe2\x22\x68\x9e\x06\x52\xc5\x4e\x24\x67\x1e\
+\x6b\xa3\x6c\xbb\xf3\xa1\x38\x01\x58\x01\xb5\xbe\xdd\xf9\x1c\x7f\
+\xa4\x8d\x11\xb2\xc0\x3a\x69\xdf\x13\x69\x02\x30\xbe\x77\x0f\x56\
+\x59\xe3\x67\xee\xc8\x13\xce\xc1\x49\xcd\x72\x78\xed\xcd\x77\x71\
+\x95\x7d\x05\xf4\x6d\xb9\x37\x4e\x3c\xb8\x9c\x32\x61\xe9\xfb\x48\
+\xcd\xcb\xeb\x73\xf3\x7e\x4d\x26\x5f\x04\x01\x78\xf6\x1f\xaf\xd2\
+\xb1\x46\xa5\x62\x28\x84\x7e\x38\xda\x83\x7f\xee\xd5\x37\xde\x83\
+\xfb\x7f\xf9\x7b\x9a\x34\x50\x46\x3e\x9d\xaa\x10\xa3\x71\x75\x25\
+\xab\x8c\x93\x9c\x57\x5f\x7f\x1b\x6e\xbb\xeb\x41\xda\xb2\x59\x7b\
+\xdc\x76\xb4\xbd\x71\xdc\xc9\xe7\x51\x2e\x01\x13\x6d\x52\xb6\xba\
+\xcc\xc3\xa0\x26\x0f\xe6\x6b\xd0\x8d\x13\x80\x4b\xe1\xf3\xb9\x0b\
+\xf1\x7b\x8c\xa5\x89\xd8\xf4\x19\x9f\xc3\x9f\x9e\x7c\x1a\x86\xad\
+\xc1\x11\xa0\xce\x5e\xae\x67\xc0\x12\x00\x67\x40\x95\xed\x56\xb5\
+\x39\x76\xb4\x12\xdf\xbb\x75\x6b\xde\x95\x73\x4e\x8d\xfd\xbc\xd3\
+\xb2\x39\xd3\x4a\x4f\x00\x82\x42\x93\x04\x66\xa6\x84\x52\x34\x03\
+\xf2\x18\xef\x79\x0b\x15\x14\xd0\x1d\xe8\xcf\x75\x08\x1a\x1c\xe9\
+\x40\x19\x6d\x8e\x20\x43\x54\x29\x2f\xe9\x28\x70\xae\x54\x80\x26\
+\x83\xe3\x10\xb7\x24\xf6\xb3\x08\x99\x28\x5b\x29\x2d\x27\x01\xb0\
+\xeb\x1e\xb0\xaa\x8d\x10\xb5\xce\xfe\xe6\x15\xb8\x72\x5e\x0a\xdb\
+\xee\x72\x08\x3f\x97\x1e\xfe\xfb\x88\xc2\xc6\x5f\x1a\xbe\x01\x4c\
+\x9b\x39\x07\xbe\x58\xb4\x04\x66\xcf\x5f\x08\xf3\xe6\x2f\x82\x79\
+\x0b\xf0\x81\x23\xf8\x7c\x7c\xcc\x9c\xbb\x00\x86\x8e\xaa\xd3\xe0\
+\x3f\x04\x1f\x84\xe9\xbd\x1c\xa7\x00\x5f\xd9\x70\x0b\x1a\x98\xd0\
+\x84\x5d\x61\xc6\xec\x2f\xe0\xa7\xb7\xdc\x07\xa5\xe1\xe3\x68\xf0\
+\x3e\x08\xff\xcc\xfc\x85\x2b\x60\xf8\xe8\x50\x53\xec\x0b\xa4\x90\
+\x4e\x89\x2b\x0b\x6e\x18\xec\x04\x8b\x96\xae\x80\x0f\x3e\x9e\x0a\
+\x6f\xbc\xfd\x01\xbc\xf1\x2e\x3b\xde\x7e\xf7\x43\x1c\xc0\x3f\xc4\
+\xaf\xf9\x00\x65\xc2\x0f\x5e\x7d\x7d\x4a\x50\x24\x6c\x7f\x87\x56\
+\xa3\x42\x87\xa0\xc7\x70\x10\x24\x1c\x04\x72\x9e\x97\x5c\xfe\x63\
+\xf8\x1c\x9f\x13\xa9\xc2\xcb\x38\x29\xf9\x74\xca\x74\xb8\xe2\x9a\
+\x9f\xe1\xef\xe9\x4e\x84\x48\x73\x0d\xec\xe6\xc9\x41\x37\xd7\x12\
+\x18\x0f\xdb\x4e\x3c\x14\x16\x2e\x59\x01\x01\x4d\x00\xc4\xfd\x0c\
+\xb9\x43\x20\x4b\x38\x76\xdb\x67\x32\x4d\x00\xba\x27\xec\xc5\x78\
+\x10\xd5\x09\xf4\xf5\xb7\xdf\xe5\x08\xf8\xdd\x1f\x9e\x84\xb9\x5f\
+\x2c\xa0\x95\xf7\x94\xa9\xd3\xe1\xee\xfb\x7f\x0d\x3b\xec\x76\x04\
+\x6f\x41\x74\xab\x43\x17\x5a\x22\x7d\x75\x7c\x5c\x7f\x13\x49\x00\
+\x5e\xa1\xef\x39\xa4\xb3\xae\x39\x25\x86\x32\x71\x21\x1c\x06\x42\
+\xde\xbc\xea\x07\x37\xb3\xf1\x3b\xaf\x9b\x23\x36\x81\x01\x8d\xb3\
+\x91\x43\x04\x7f\x78\xec\xaf\xf0\x08\x3e\xa7\xa1\xf8\xb5\xea\x9b\
+\xee\x43\x93\x38\x82\xbc\xb8\x9d\xda\x44\x82\x66\xdd\x2b\xda\x34\
+\x22\x61\x23\x89\xd9\xa9\x67\x5f\x0a\x33\xe7\x2c\x80\x0d\xd0\x96\
+\xf0\xfe\x87\x9f\xc2\x02\xfc\x7c\xbc\xf8\xf2\x1b\xe0\xaf\xb5\x89\
+\xd2\x6f\x10\x16\xce\x0d\x6c\xb6\xae\xd7\x4a\x40\x59\xd5\x0c\x66\
+\x56\xe5\x73\x5b\x55\x12\xa5\x66\x74\x57\x50\x81\x02\xb6\x9d\xc9\
+\x19\x1a\x88\x04\x40\xdf\xdc\x51\x86\x88\x04\x2a\x78\x21\xc9\xea\
+\xd2\xcd\xb5\xd9\x0d\x21\xdd\xb6\x18\xb5\x88\x00\x14\xc8\xd4\xfd\
+\xd0\xa2\xad\x9d\xd5\xfb\x0f\x53\x46\xfc\xf4\xef\xc7\x89\x84\x69\
+\x2a\x64\xcd\x4c\x76\xa4\x0b\x18\x39\x7e\x6c\xfd\xfd\xf8\xa4\x43\
+\xda\x14\x45\xda\xf8\x51\x94\xf2\xac\xc4\x5b\x01\x9a\xfc\xab\x70\
+\x44\xc3\x41\x61\x87\xdd\x0e\xc1\x81\x7d\x31\x7c\xf3\x92\xab\xd9\
+\x4c\xb8\xac\x36\x11\xb7\xa0\x25\x63\x96\x1b\x51\x18\xf9\x27\x37\
+\xdd\x05\x3b\xec\x7e\x24\xec\xb8\x1b\x3e\x70\x45\xbe\xe3\x1e\x47\
+\xc1\x4e\xbb\x93\xaf\xc7\xe2\xc0\xdf\x23\x13\x80\xfd\x8f\x38\x95\
+\x06\xbd\x31\xeb\x6f\xc1\x21\xe3\x2e\xd8\xf7\x90\x93\x60\x3e\x2e\
+\xe5\x8f\x3f\xf9\x7c\x5a\xb9\x1f\x84\x7f\x86\x24\x00\x1d\xa3\x43\
+\xfe\x9e\x48\xf3\xaa\x67\x73\xec\xc4\x41\x70\x5c\x7d\x67\x58\x88\
+\x13\x80\x5b\xee\xfc\x05\x9c\x71\xde\x77\xe0\xf4\x73\x2f\x83\x6f\
+\xe0\xe3\xf4\x73\xf0\x71\xf6\x65\xb0\xc7\x7e\x93\xc1\x21\x09\x00\
+\x3e\xee\xba\xf7\xd7\xf0\xf4\xb3\xff\xc2\xc1\xa2\xcb\x60\xb3\x0b\
+\xcb\x63\x36\x97\x3f\x81\x22\x00\xd7\xfd\xf4\x76\xf8\xe8\x93\x29\
+\xb0\x1a\x0e\xf0\x43\xf0\xfb\xbc\xf7\xfe\x7f\xe8\x68\xe4\x90\x91\
+\x4c\x5e\x58\x4a\xfb\x52\x15\x3f\x2e\xba\x43\x0f\x12\x9c\xc7\xd1\
+\x80\xba\xd9\xf6\x07\xd0\xe4\xa4\xbe\xe9\x9e\xaa\xdd\x20\x21\x76\
+\x46\x0a\x9c\x84\xcf\x8f\x54\xd2\x5d\x7d\x7b\xf0\x0a\x78\x63\x7a\
+\x0c\xc1\xc7\x6a\x9d\x11\x8c\x5a\x7b\x13\x98\x88\xd7\x91\xb0\xeb\
+\xdf\x7c\xeb\x7d\x58\xb2\x74\x39\x5c\x79\x2d\x0e\xd8\xab\x6f\x04\
+\xa5\x61\xe3\x38\x61\x53\xa8\x2d\x2a\xf1\xa5\x9f\xde\x7c\x37\x4b\
+\x00\x08\x21\x52\x9e\xaf\xe2\xb3\x90\x35\xfd\x72\xc7\x86\xf0\xce\
+\xfb\x1f\xe3\x9f\xbd\x97\x69\x0f\xd0\x59\x7c\x8e\x00\x78\xcc\x69\
+\x50\x49\x0b\x77\xc3\xf3\xff\x7c\x05\xee\x7b\xe0\x61\x9c\x00\xd4\
+\x61\x6c\x30\x91\x26\x00\x87\x1e\xf3\x0d\x4d\x04\x28\x62\xda\x09\
+\xdc\xe9\x4f\x20\x14\xae\x14\x39\xea\xa2\x63\x85\x73\xe6\x2d\x84\
+\xb7\x70\x92\xf6\xf4\xf3\x2f\x43\x7d\xb3\x49\x30\x75\xc6\x2c\xb8\
+\xe7\x17\xbf\x63\xcf\x08\x49\xc0\x84\x01\x94\xc5\xe8\x27\x0d\x11\
+\x70\x0b\xf0\xa9\x92\xa3\xcc\x9a\xbf\x48\xc3\x90\x71\x7f\x56\xec\
+\xa8\xc9\xfd\x65\x20\x83\x7c\x54\x20\xbe\xf4\x57\x32\x14\xb5\x20\
+\xb9\x8e\x2c\x9e\x35\x61\x9b\xef\x9d\xf9\x4c\x0c\x1a\x38\x88\x08\
+\xe5\xf4\xaa\x8a\x56\xc7\x9a\xfe\xb7\xa7\x5b\x0b\x07\xd2\x22\xd3\
+\x9c\x1a\xc8\x0b\xac\xa1\x95\x80\xd6\x78\xff\x28\x43\x3a\xd3\x2b\
+\x6a\x4f\x1c\xaa\x7e\xac\x1f\xa5\xa0\x1d\x08\x0c\x43\xa2\xd4\x79\
+\x7f\x7d\x92\xa2\x91\x8d\x23\x43\xd6\xd8\xb7\xfb\x65\x2b\x5d\xf6\
+\x14\x5f\x03\x0e\xbd\x66\x91\x12\x6d\x55\x92\x84\xfd\xb5\x0f\x95\
+\x90\x8b\x5d\x67\xdc\xd6\xf0\xf1\x67\x33\xe0\x77\x7f\xfc\x0b\x94\
+\xbd\xb1\xac\xaf\x2f\x20\x5d\x22\x06\x24\xdd\xfe\xba\x61\xee\xbc\
+\x05\x70\xc6\xf9\xdf\xe5\xaa\x7d\x91\x64\xdf\xd3\xbe\xf5\x08\x36\
+\xdb\x3f\x64\xc4\x04\x9a\x00\xec\x77\xd8\x29\x34\x01\xf8\xca\x7a\
+\x9b\x73\x8d\xf9\x6e\x1a\x34\xaf\xb8\xfa\x67\x30\x67\xee\x22\xd8\
+\x6c\xbb\xfd\xe0\xc0\x23\x4e\xc1\x09\xc0\x72\xe8\x18\xc3\x66\xdb\
+\xcb\x9a\xab\x9e\x74\x18\xc4\xe7\x5d\xeb\xdb\x8d\xf6\xd9\x27\xed\
+\x77\x2c\x15\xbe\x11\x02\x44\x94\x39\x3f\x5c\x7d\x25\xdf\x3b\xfd\
+\xdc\x4b\xe9\x08\xdf\xa8\xb5\x71\x80\x25\x95\x36\xaf\xb8\xf5\xa3\
+\x3c\x62\x63\x4a\x04\x7c\xf3\xed\xf7\xe0\xd7\x0f\x3f\xc6\x46\xfa\
+\x70\x80\xbb\x17\x07\xa8\xb7\xde\xf9\x37\xfe\x5e\x40\x67\xfd\xa9\
+\xb0\x8f\xf0\xad\xe7\xc1\xad\x44\x27\x27\xd8\xfb\x11\xe4\xa4\xbb\
+\x6f\x17\x58\xb4\x64\x05\x4e\x8a\x8e\x60\x63\x6d\x42\xf2\x57\x04\
+\x46\x7c\x5d\x47\x1e\x77\x16\xe3\x43\x6c\xb4\x0d\x0e\xa4\x13\x70\
+\x10\x65\x09\x00\x39\x8f\x21\xf4\xe8\xa5\xef\x4f\xd6\x7a\xb5\x6a\
+\x17\x0e\xfe\x37\xd1\xe9\x88\xf1\xd1\x4e\xfc\xfa\xba\x78\xbf\x5d\
+\xa0\x10\x44\xa4\xa9\x06\x3f\xbb\xe5\x6e\x1a\xb0\xa9\xfb\x21\xd7\
+\x40\x70\x35\x67\x3b\x66\x48\x33\x1e\x1e\xf8\xd5\x1f\xe1\xd5\xd7\
+\xdf\xa7\x5c\x01\xa6\x86\xd8\x6d\xba\xe5\x51\xf3\xac\x1e\x18\x81\
+\xd7\x8c\x8c\x09\x12\x6d\x82\x21\x38\x21\x18\x8a\x5f\x77\xda\xf4\
+\x59\x54\x73\x81\xf1\x0a\x84\x1b\x60\xc4\x5a\x22\x5e\x4d\x29\x2c\
+\x0a\x25\xc8\xe1\xdd\x70\xda\xd9\xdf\x81\x05\x0b\x96\xc2\x73\x2f\
+\xbe\x0e\xa3\xd6\xdb\x94\xca\xe7\x4e\xda\x7f\x32\x2c\x5e\xba\x0c\
+\xce\xba\xe0\x0a\xf5\xcc\x08\x17\x4a\xcd\xab\xc2\x4c\x90\x9b\x65\
+\xd5\x47\xd6\x04\xa0\x75\xf2\x5a\xd1\xa9\x85\x7c\xad\x81\x55\x4d\
+\x3f\xdf\x5c\x1b\x1b\x02\xda\x82\xff\x89\x57\x64\x4a\x2a\x6c\x80\
+\x58\xdd\xf8\x88\xbd\xd3\x12\x92\x14\xe6\x9e\xdf\xa0\x95\x77\xf3\
+\xa2\x06\x66\x61\x33\xdc\x02\x8d\x04\x20\x8d\x6c\x17\x65\x54\xd5\
+\xa8\xad\x42\x15\xec\x26\x99\xb3\xfc\xea\xc6\xd9\x2a\xdf\x22\xd3\
+\x00\xba\x0b\x61\xa0\xac\x49\x73\x75\xc3\x35\xd7\x30\xaf\x68\xc0\
+\xb7\xe8\x1c\x18\x84\xcb\x5a\xc6\x14\x43\x90\xe2\x0d\x11\x6a\x9a\
+\x07\xe9\xf0\xa8\x5b\xa4\x1d\x82\x03\xd5\xea\x23\x11\x3c\xf5\xcc\
+\x8b\xf0\xce\xbf\x3f\x84\x91\x5f\xed\xa3\xc1\xa6\x34\xbc\x8b\x33\
+\xfa\x99\xba\x1c\xad\xf4\x48\x6f\x7f\x44\x0d\xe6\x7d\xb1\x10\xce\
+\xfe\xe6\x95\x94\xe4\xc7\xc4\x7c\x94\x34\x2f\x09\xfa\x64\xe6\x7d\
+\x35\xfa\xe7\x1e\x46\x02\xc4\xe5\xe3\x98\x75\x36\xe3\x04\x3d\x56\
+\x39\x97\x71\x80\x7b\xe4\x8f\x7f\x83\x77\x3e\xf8\x04\x57\x8a\x17\
+\xe1\x40\xb7\x02\x2a\x6b\xf6\x4a\x1d\x79\x61\x07\xcc\x48\x6c\xec\
+\x20\x7d\xe4\xc5\xf8\xc5\x76\xa7\x09\xc0\x38\x3a\x56\xe6\xf0\x09\
+\x04\x47\x54\x9e\x7c\x1a\x61\xad\x0d\xb7\x80\x2f\xe6\x2f\xc4\x89\
+\xc6\x0d\x2c\x80\x8f\x20\xd5\xa6\x18\x3d\xec\x63\x81\x17\x07\xcb\
+\x23\x8f\x3d\x8b\x56\xb7\x7b\x1e\x70\x22\xbb\x8e\x11\x8a\xad\x7f\
+\xc4\xf1\x67\x51\x16\xfe\x10\x9e\x00\xb0\x60\xd7\x45\x99\xf6\x04\
+\x52\xef\x5c\x13\x9f\x2b\x41\x1c\x70\xc2\xb4\x7a\x67\x17\xcc\x9a\
+\xbd\x00\x2e\xbd\xe2\x27\x52\xad\xd0\xe5\x4a\x95\x0e\x57\xff\x23\
+\xa8\xc4\x27\x9f\x4d\x67\x30\xfd\x88\x4d\xd8\x39\xe1\x00\xbb\x1a\
+\xa9\x84\x3b\x99\x2e\xc2\x10\xde\x6e\x20\xca\x87\x63\x83\x6d\x61\
+\x31\x4e\x2a\xf6\x39\xf0\x04\x36\x71\xd1\xc1\x47\x34\x3b\x6a\xca\
+\x17\x01\xaf\xcf\x8d\xb7\xde\xcb\x12\x00\x02\xf9\x73\x58\x9d\x55\
+\xe9\x5c\x3a\xb8\xca\xa6\x82\xf6\x3d\xe4\x64\x1c\x7c\x57\xc0\xde\
+\x07\x9e\xc8\x13\x27\xd6\x56\x70\x39\xb7\x80\xaa\xf3\xe1\xd7\xbd\
+\xf4\x8a\x1f\xc1\xa2\xc5\x4b\xf0\xfb\xef\xc8\xd0\x0b\xfc\x3a\x57\
+\xff\xe8\x36\xbc\x9e\x0b\x60\x23\xb4\x03\x57\xfd\xeb\xe5\xc8\x06\
+\xf3\x8c\xa7\xe8\x04\xbe\xaf\xfe\x9a\x75\x9e\x1c\x75\xc1\x19\xe7\
+\x7e\x17\x3f\x2b\x4b\x61\x0d\x12\xfc\xb9\xa1\x17\xb9\xb6\x0b\x2f\
+\xbd\x16\x96\x2c\x59\x06\xbb\xed\x7d\x9c\x52\x1a\xd4\x3e\xcb\x8e\
+\x74\x45\x0c\x35\x19\xf4\x66\xaa\xb2\x68\x95\xaa\xa8\x57\x86\x62\
+\x5e\x73\x2a\x80\x79\x42\x74\xb5\xa6\x92\x00\xb7\x69\x17\xc2\xa8\
+\x6d\x15\xbc\xf3\xbf\xcf\x0d\xb0\x15\x28\x29\xd9\xdb\x77\xb2\xec\
+\x31\x3d\xcd\x1b\x5b\xb8\x81\x59\xc9\x68\x08\x8a\xbb\x01\x36\x6e\
+\x7e\xa4\x2a\x7c\xcb\x21\xac\x52\xd3\x32\x53\xbf\x16\x13\x22\xca\
+\x51\x46\x8c\xf5\xe6\xed\xeb\x23\x1c\xcd\xf8\x35\x91\x24\xa0\x03\
+\x15\x4c\xc6\xf2\xf4\x0e\x6c\x6c\xff\x6c\xa2\xa3\x6b\xb4\x81\x92\
+\x09\x80\xb4\x6f\xcd\x0a\xfe\xf2\x3d\xbb\xe0\xfa\x1b\x7f\x0e\xf3\
+\x70\xb0\xec\xd9\x74\x57\x70\x88\x14\x6d\x07\x3b\x64\x55\x4d\x92\
+\x00\xd2\xd7\x25\x70\x3c\x4e\x00\xc8\x68\xd7\x59\xe7\x5f\x8e\x03\
+\x17\x83\xfa\x57\xa3\x41\x9f\x31\xdd\x49\x15\x4b\x93\x80\x91\x24\
+\x01\xa8\xc3\xfe\x87\x7d\x8d\x25\x00\x6b\x6f\xc2\x1d\xe6\xba\xa4\
+\x06\xff\xa8\x75\x36\xc6\x09\xc0\xc7\x94\x19\xbe\x04\x07\xa6\xce\
+\xaf\x4e\xe0\xcc\xf9\x3a\xaf\x0e\xb9\x5b\x1d\xef\x6b\x07\x1b\xef\
+\x06\xb8\x78\x84\xdd\xf7\x3d\x8e\x4b\xc8\x76\x49\xe9\x5a\x49\x90\
+\xa3\x49\x00\x4b\x0c\xce\xbe\xe0\x72\x4a\xb0\x3b\xe5\xf4\x8b\x71\
+\x45\x1d\xf2\x73\x9c\xc0\xbe\xe2\xd7\xdc\x65\xef\x63\x60\xce\xdc\
+\x2f\xe0\x37\xbf\x7b\x02\x5f\x0b\x1b\x25\x2c\x8f\xec\xa5\x89\x0b\
+\x11\xbc\x99\x33\x77\x1e\xec\xba\xe7\x51\x54\x28\x88\x08\x03\x51\
+\x19\x5b\x4a\xbc\xdb\x00\x76\xdf\xe7\x18\x98\x3a\x6d\x2e\xec\xba\
+\xd7\xb1\x54\x07\x81\xb4\x1e\x6e\xb9\xe3\x97\x30\x6b\xee\x7c\xd8\
+\x64\xab\xbd\x35\xcd\x05\xb6\xc6\xbb\xec\x75\x24\x1d\x83\xfc\xce\
+\x55\xd7\xd3\x24\x63\x08\x4e\x00\x46\xaf\xbf\x25\x3c\xf6\xe7\x67\
+\x60\xe2\xa4\x23\x29\xd9\x8e\xac\xe7\x10\x31\xe3\x8f\x13\x8c\x93\
+\x4e\xbb\x90\xa2\x0a\xf5\xcd\xf6\xe0\x09\x40\x97\x22\xed\x55\x42\
+\x39\xe6\x47\x2a\xf3\x17\x5e\x7c\x85\x8f\x1f\x6a\xeb\xc6\xb9\x07\
+\x34\x81\xa1\xb2\xc9\x35\x78\xf4\xf1\xa7\x61\xca\xd4\x59\xd0\xb7\
+\xf9\x1e\x94\x83\x41\xc7\x0f\x3b\xb8\x4c\xef\xf0\x8d\xe0\xb0\x63\
+\xcf\xa4\x1c\x90\xcb\xbf\x7f\x03\xb7\x2b\x66\x52\xc4\xa3\xd7\xdf\
+\x82\x0a\xfd\xbc\xfe\xe6\xbb\x30\x2e\xdc\x91\xbe\x2f\x1b\xbb\x8c\
+\xf0\xb9\x07\xf8\xdc\xbb\xe1\xea\xeb\x6e\x85\x0f\x3f\x99\x06\xa3\
+\xd6\xdd\x84\x72\x0c\xce\xba\xe0\x7b\x30\x7b\xee\x62\xfc\x3a\x8a\
+\xbf\x40\xd6\x85\xac\x27\x41\x9a\xe8\x44\x48\xb4\x73\x4c\xbb\x02\
+\x29\x24\xd2\xeb\x0f\xc9\xed\x76\x11\xce\xa2\x96\x11\x80\x55\xb7\
+\xd7\x9f\x35\x86\x2e\x12\xda\xfe\x48\x00\xfa\xa3\xf5\x32\xb0\x04\
+\xcb\x41\xed\x3f\x09\x54\x40\xff\x39\x0d\x0e\xe6\x42\x1f\xbe\xba\
+\xa1\x4e\xc2\x83\x3b\x2e\x14\x14\x48\x8f\x74\x1d\x0d\x70\x33\x05\
+\x89\xd2\x92\x83\xc8\x9a\x7d\x39\x95\xb4\x00\x9e\x4c\x5a\x5c\xce\
+\x32\x4e\xba\xe2\xa1\x8c\xcc\x34\xc8\x50\xb2\x0a\x2c\x24\xc7\x34\
+\x6b\x65\x1b\x3a\x62\x53\xe7\x4a\x4b\xb8\xf2\xc8\x88\x61\x93\x93\
+\x13\x48\x43\x20\x62\xe8\x88\x3c\xaf\x28\x57\x6e\x99\x6c\xf0\x47\
+\x4c\x3e\x1b\x96\xe3\x08\x7d\xfb\x9d\xf7\xc0\xa4\x7d\x8e\x84\xbd\
+\x0e\x3c\x16\xf6\x39\x68\x32\xec\x77\xc8\x89\xb0\xff\x21\x27\xc1\
+\x01\x87\x7e\x0d\x0e\x3c\xfc\x64\xca\xf6\x77\xc8\x46\x8f\x13\x80\
+\x2f\xe6\x2f\x82\xdb\x7f\x7e\x3f\x1c\x88\x83\x3b\x09\xf0\xfb\x1f\
+\x7a\x32\x1c\x70\xd8\x29\xf8\xe7\x4e\x81\x43\x8e\x3a\x0d\xf6\xc4\
+\x15\x26\xd1\xe8\x27\x41\x7b\x3f\xfc\xfd\xa5\xcb\x56\xc0\x1a\xeb\
+\x6e\xca\xab\xe7\x6e\x09\x13\x93\x44\x60\x8b\x1d\xf6\xa3\x70\xf3\
+\x32\x7c\x0e\xa3\xd7\xdd\x8c\xf7\xc6\x99\x33\x60\x99\x1b\xf2\x30\
+\x34\x20\xa4\x33\xf6\x38\x1e\xc2\x6e\xfb\x1e\x0b\x5f\xf6\x38\xfb\
+\xbf\xa3\x2b\x66\x81\x2b\xc8\x68\xdd\x38\x98\xd6\xe0\x7b\xd7\xdc\
+\x40\xe7\xd7\x09\xa1\xed\x88\xe3\xce\x84\xed\x76\x39\x9c\x9e\xef\
+\x5d\xf7\xfc\x8a\x06\xe4\xbf\x3e\xfd\x02\x7e\xdf\x2d\xe9\xfb\x12\
+\x28\xde\x1d\xc1\xaa\xf1\x91\x5f\xdd\x14\xfe\xf0\xf8\x53\x14\xae\
+\xbe\x13\x57\xee\x7b\xee\x3f\x19\x36\xdb\xee\x00\x5c\x45\x7f\x0d\
+\xee\xbe\xff\x61\x98\xbf\x70\x29\xdc\xf1\xf3\xdf\x50\xa8\x7e\x30\
+\x15\xf0\x19\x0f\x5f\xc1\xd7\xf8\xe6\xbb\xff\xa1\x49\xc5\xe5\x57\
+\xdd\x00\x7b\xec\x77\x2c\xec\x75\xc0\xf1\xf0\xa3\x1b\x6e\x83\x05\
+\x8b\x16\x53\x19\xe1\xca\x18\xd6\x8e\x20\xc7\xb8\x68\x57\x78\xf9\
+\xf5\xb7\xa9\xb2\xde\x6f\x70\xc2\x71\xe2\xa9\x17\xc1\x2e\x38\xe1\
+\xd8\xf3\x80\xc9\xf0\xe3\x1b\x70\x52\x86\xdf\xe3\x81\x87\x1e\xa5\
+\x92\xc1\xa2\xff\x2f\xc4\xa9\x18\x01\xaf\x4e\x13\x99\x5b\xef\x78\
+\x00\x3e\xfc\xef\xc7\x70\xc2\xc9\xe7\xc3\x31\x27\x9d\x07\x47\x9f\
+\x70\x36\x1c\x3d\xf9\x2c\x38\xea\xf8\xb3\xe1\x98\x13\xce\xc5\xf7\
+\xf4\x24\xe6\x9b\x80\x13\x1b\x02\xc5\x3f\xfe\xe4\xb3\x38\x30\x2f\
+\x80\x1f\xfc\xe8\x0e\xfc\x7e\x47\xc3\x16\xdb\x1d\x04\x07\x1d\x7e\
+\x2a\xfc\xea\xb7\x7f\xa2\xa3\x93\xf7\xfe\xe2\x11\x18\x5a\xad\x29\
+\xeb\x5f\x2e\xed\x5b\xdf\x74\x0f\xf8\xf7\x7f\x3e\x82\xcf\x67\xcf\
+\x85\xef\x5d\x7d\x03\x4e\x7e\x8e\x81\x6d\x76\x3e\x04\x27\x2a\x17\
+\xc0\x3f\xff\xf5\x1a\x2c\xc4\xd7\x38\xf9\xe4\x0b\xd8\x18\x20\x3e\
+\xce\xbb\xf0\xfb\x34\x01\x28\xfb\x5d\x5a\xfb\x82\x3d\x7f\xe4\x3c\
+\xde\xf9\xf7\x7f\xe1\xa5\xd7\xde\x06\x7f\x4c\xaf\x14\xc1\x72\x35\
+\x21\x2e\x57\x73\xe5\x74\x1b\x86\x6c\x91\x45\xa0\x27\x8b\x07\x55\
+\x94\x9c\xd7\x48\x4b\x02\xfd\x2f\x09\xf6\x45\x46\x12\x75\x3b\x64\
+\x94\x24\x1b\x7b\xfd\x8d\x6e\x47\x6d\x48\xda\x74\xf4\xb4\x31\x68\
+\xbf\x45\x12\x60\xfb\xb2\x90\xa2\x5a\xd6\xba\xb3\x15\xab\x0c\x63\
+\x10\x3f\xf7\xfc\x96\x1f\x4a\x4f\x1b\x33\xb2\x9a\xec\xe4\x29\x13\
+\x36\xc6\xfc\x97\x1f\x66\x21\xe3\xab\xf7\xf7\xc5\xd1\x81\xd4\x98\
+\x91\x67\xe9\x17\x79\xa6\x95\x6a\xbe\x74\xaf\x5e\xd1\x23\x23\x31\
+\x89\x67\xa7\xcc\xee\x56\x5b\x17\x63\xad\x90\xd6\x83\x8f\x32\xa6\
+\x29\xd2\x92\x85\xa2\x52\xa5\xb1\xb5\xb1\x41\x58\x5e\xd6\xc6\x67\
+\x23\x05\x22\xed\xa8\xc1\x0d\xb7\xde\x07\x33\x67\xcd\x86\x69\x33\
+\x67\xc3\xd4\x99\x73\x60\xfa\xcc\xb9\xf8\xeb\x3c\x98\x32\x03\x1f\
+\xf8\xeb\xb4\x59\xf3\x60\xfa\xe7\xf3\xa0\xab\x67\x67\xba\x0e\x44\
+\x15\xef\xe3\xcf\xa6\xe3\x20\x30\x0f\x57\xee\x5f\xe0\x60\x37\x1f\
+\xe6\xcc\x63\xc7\x5c\x7e\xbc\xfa\xfa\xbb\xe0\xd2\xca\x3c\xc0\xc1\
+\xe7\x44\xfc\x5a\x73\xa8\x8e\xbf\xac\x02\x85\x25\x2f\xef\x1b\x13\
+\x3e\xc1\x2c\xfc\x5a\x6b\x8d\xdd\x46\x26\x00\x4c\xff\xbe\xc7\x60\
+\xb4\x77\xf5\xec\x06\x9f\xe2\xea\x75\x27\x5c\x31\xb3\x80\x22\x66\
+\xcf\x03\x99\x28\x4a\x1f\x08\xee\x63\x5f\xc6\xf7\x63\xb7\xbd\x8f\
+\x86\xbf\x3c\xf5\x2c\x4d\x34\x08\x1a\x41\xc8\x75\x44\xc7\xfe\xd4\
+\x33\x2f\x81\x8e\xd1\x0c\x15\x60\x2a\x80\xfc\xbd\x79\x02\xb2\x7a\
+\x27\x82\xc9\xa7\x5c\x00\xcf\xbf\xf8\x1a\xcc\xfd\x62\x31\xe5\x29\
+\x10\x65\xc1\xbf\x3e\xf3\x22\x1c\x78\xc4\xa9\xdc\x51\x50\x25\x34\
+\x64\x4d\xd7\x58\x6f\x73\xf8\xe1\x4f\x6e\x83\x8f\x3f\x9d\x8a\x13\
+\x0f\xa0\xc9\xcf\xbb\xef\x7f\x08\xdf\xbc\xf8\x5a\xf0\xc6\x30\x09\
+\x64\x4a\xfc\xa3\x13\x00\x13\x60\xd8\xe8\x1e\x38\xe6\xc4\x73\xe1\
+\x89\x27\x9f\x81\x19\x78\xed\x89\x1e\xc2\x9c\x79\x4b\xf0\xf9\xbd\
+\x8b\x2b\xe8\x2b\x61\x68\x67\x37\x77\x5d\xac\xb1\x7b\x4d\xf8\x11\
+\x82\xcb\x81\xd7\x85\x18\x21\xfd\xe0\x27\xb7\xc3\xf4\x19\xb3\xf0\
+\xbd\xfb\x1c\x66\xe0\x7b\x39\x03\xdf\x4b\xf2\x67\x32\x76\x37\x0d\
+\xff\xfb\x93\x7f\x7b\x1e\x56\xf3\x89\x20\xd0\x04\xfc\xbe\x3d\xf8\
+\x35\x11\x9c\x72\xc6\x25\xf0\xca\x6b\xef\xc2\x82\x05\xcb\x60\xe1\
+\xc2\x15\xf8\x5e\x2e\x84\x27\xfe\xf2\x02\x1c\x7c\xf8\x69\x7c\x3a\
+\xa3\x26\x13\x4a\xaa\x40\x48\x50\x98\x91\x38\x81\x58\x77\x73\x9c\
+\xdc\x5c\x8f\x13\x81\x8f\x71\xd2\x06\x54\xe5\x91\xdc\xfb\x87\x7e\
+\xfb\x28\x4c\xd8\x72\x1f\x46\xd8\xa4\xaa\x85\x01\x9c\x75\xfe\x55\
+\xf0\xd9\xf4\x79\x4c\x07\x80\x23\x0d\xf2\xb3\x84\xd7\x2b\xdc\x78\
+\x37\xf8\xf0\xa3\xa9\x70\xf3\x1d\x0f\x32\x0d\x8a\x0e\x7c\x4d\x1d\
+\x9c\x73\xe4\xe9\xfb\x52\xd0\x70\x90\xb1\x5b\xf3\x06\xa9\x9f\x35\
+\x47\xfb\x3c\xb9\x5e\x24\x3f\xe3\xd2\x85\xd2\x6b\x6f\x25\x99\xd7\
+\x06\x70\x1a\xba\xde\x46\x34\x0b\x10\x14\x6f\x25\x07\xc9\x35\xa4\
+\xf7\x8f\x9b\xad\xf1\x75\x72\x75\x3f\x96\x16\xaf\xbb\xdf\x0e\x4f\
+\xdc\xdb\x76\x4f\x3b\xa8\x04\x93\x3c\xb7\x83\x06\xb6\xb7\x54\x0c\
+\xd2\x62\x02\x29\x28\x01\xf3\xb3\x87\x9b\x0b\xc0\xe8\x04\x40\x3d\
+\xf0\xeb\x0b\x26\x98\xe3\xb1\x07\xc3\xe5\x09\x86\x53\xe4\x66\x6b\
+\x3d\x74\x57\x37\xe7\xf1\x22\x93\xe0\xc7\xb5\xfd\xc5\x9c\x7a\x59\
+\xf7\x48\x27\xe4\x27\xe9\x16\x17\xc4\xdc\xff\xb2\xfc\x05\xec\xd5\
+\xb6\x2d\x01\x10\xeb\x21\x37\x80\x0e\x25\x98\x53\xf2\xe2\x86\x43\
+\xf1\xe4\x28\x82\x7c\x3b\x50\x94\xc2\x11\xd0\xae\xdd\x92\x00\xa4\
+\x11\x6b\x92\x26\x25\x69\xcf\x82\x66\xf7\xe9\x07\x74\xf6\x9d\x04\
+\x99\x21\x38\xb0\xaf\x56\x1d\x8f\xab\x66\x72\x6c\x84\xd7\x77\x23\
+\x18\x52\x19\x87\x37\xf2\x71\xf4\xdf\x18\x1f\x80\x11\xa8\x56\x1f\
+\x19\xc1\xf0\x91\x75\x76\x8c\x8a\xa8\x58\xd0\xf0\x51\x75\xe8\x18\
+\xd5\x0b\xc3\xd7\xe8\x85\x61\xa3\xea\x8c\x21\x4e\xd5\xf3\xc6\xc3\
+\x6a\x95\xf1\xbc\x9d\xd0\xcd\x9c\xfd\xb8\xbe\xbf\x08\xe0\x64\xc4\
+\x6f\xd8\xa8\x1e\x7c\x2e\xbd\x4a\x00\x87\xab\xfa\x95\xb9\x04\x2e\
+\x73\x09\x44\x38\x90\x31\xa6\x39\x51\xc0\x13\xf7\x84\xb9\x05\xb2\
+\x8d\xa8\xec\x85\xea\xbe\xd1\x04\x80\x91\x08\x87\xe0\x63\xc4\x57\
+\x37\xa1\x32\xbc\xa3\xd7\xdb\x82\xfa\x12\x50\x57\xbf\x6a\xaf\x64\
+\xa2\x33\x43\xa0\x3a\x57\xe1\xe3\x63\x6e\x24\xf0\x76\x8c\xc3\x55\
+\x6a\x04\x5f\xdd\x68\x33\xa8\x8e\x21\x33\xf5\x63\xb9\x7c\x72\x4d\
+\x9a\x15\x31\xa7\x40\x02\x87\xf7\xd2\x20\x3b\x1c\x07\xcb\x31\x1b\
+\x6c\x8d\xdf\x6b\x73\x4a\xa2\x73\xc5\x38\xa0\xcf\x8d\x8a\xa8\x62\
+\x61\x2f\xbf\x3e\x44\xd7\x69\x68\x67\x17\x8c\xfc\x6a\x2f\x54\x46\
+\xe1\xbf\x53\x79\xe5\xf1\x54\xb0\xc7\xd1\xac\x79\xc9\xf3\xef\xd0\
+\xf5\xe0\xba\x0e\xf8\x1a\x88\xa8\xce\xea\x9d\xe4\x5e\xd6\xf0\x6b\
+\xe0\xfb\x89\xff\x3e\x6c\x74\x48\xef\x09\xb9\x17\xab\x93\xb6\x06\
+\x75\x5e\xdc\x98\xb6\x3f\x86\x90\x9e\x3b\x59\x33\x7c\x4f\x47\x7f\
+\xb5\x0f\xd6\x19\xbb\x25\x78\xa3\xf0\x7b\xac\xbe\x11\xd3\xeb\x27\
+\x68\xc3\x30\x3e\x26\x58\x61\xc9\xb7\x44\x02\x68\xbb\xa7\x0e\x43\
+\x47\x86\xb0\xd6\x46\xdb\xc2\xfa\xb5\x89\x50\xf9\xca\xc6\x74\x7d\
+\x99\x98\x50\x1f\xb3\x46\xae\x32\x77\xc6\x61\xa3\x23\x8e\xfc\x08\
+\x31\xa6\x1a\x17\x0f\x62\xae\x92\xab\x55\xba\x28\xda\xc0\x92\x1c\
+\xbd\xfd\x27\x82\x6e\x2b\xde\x1b\xa1\x45\x32\x5d\xff\x7c\x46\xb2\
+\x18\x51\x09\x40\xc4\x0f\xf1\xd9\x12\x85\xd2\xc0\x42\xc9\x4e\xbf\
+\x55\xd5\x8d\xac\xa3\xad\xc5\x88\xb4\x3d\x5f\x2b\xe6\xbc\xf6\xc2\
+\xf2\x2d\x25\x0a\x9e\xb9\x8e\x4e\xa5\x68\xf0\x6f\xc6\xd3\x01\x69\
+\xf2\xf1\x68\x20\x13\x80\x3c\x9d\x62\x13\xc6\x28\x7b\x7a\xa6\x8b\
+\x92\x63\x7f\x7a\xe5\xcd\xff\x6e\x40\x3d\xa9\x8c\x55\x24\x1f\x8c\
+\x62\x42\x1e\x81\xa5\x27\x94\x05\xab\x05\x8a\x10\x94\x30\xb5\x89\
+\x12\x1e\xe2\xf9\x8e\x60\x41\x82\xab\x10\x4f\x00\x1c\x5f\x17\x38\
+\x89\xaf\x4d\xda\xfa\x07\x39\xbd\x7e\x94\x0a\xa9\xe9\x87\xa3\xdd\
+\x0f\xd7\x13\xeb\x5f\xec\x43\xeb\xa4\xa0\x10\x49\xd7\xac\xd0\x32\
+\xf6\xc9\x67\xcb\x2b\x2c\x28\x53\x26\xfb\xf0\xf1\x1a\xfb\xbc\x5b\
+\xb6\x62\xd4\x38\xa1\x98\xab\x67\x4e\x7a\xd4\xe5\x8f\x06\x70\x46\
+\x0e\xa3\x3c\x03\x32\x86\x27\x95\x02\xbb\xf8\x73\x25\x4c\x9c\x38\
+\x9b\x9d\x43\xcd\x25\x4e\x2a\x2c\x89\xc0\xc8\xa1\x7f\x36\x0a\x88\
+\x94\xd2\x9f\x20\xc2\x69\x15\x9a\xe0\x3e\xc8\x04\x40\x54\xaf\xe2\
+\xa0\xc9\x84\x20\x2d\x2a\xf2\x62\xd9\xe7\x73\xfe\xbc\xe5\xc0\xfa\
+\xf6\x88\x26\x0e\x22\x41\x16\x62\x3f\xba\xea\x21\x4b\x5e\xf8\xfb\
+\xf8\xa1\x7a\x8d\x2a\xe3\x31\x50\x42\x1f\x45\x12\x7a\x55\x4f\x9e\
+\x0a\x11\x85\x9c\x94\xc7\xc7\x31\x45\x70\xa2\x44\xba\xf1\x6c\xcd\
+\x29\xef\xa2\x4b\x26\x7f\x6e\x45\x30\xfa\x85\x74\x2f\x1f\xd9\xa3\
+\xa2\x3d\x3d\x5c\xec\x07\xc9\x69\x1d\x97\xeb\x0f\x94\xf8\xf9\x30\
+\xe2\xe3\x04\x39\x7b\xcf\xda\x2b\xac\x28\xa0\x48\x8d\xbc\xcf\xe3\
+\xd5\x41\x19\xfd\x1a\xfc\xce\x45\xa4\x86\x70\x51\x23\x97\xbf\xa6\
+\x72\x18\xec\x95\x04\x4b\x39\xda\x47\xe7\xfb\xf9\xfd\xe9\x10\x13\
+\x11\x66\x65\xcd\x2a\xc9\x40\x16\x21\x25\x2f\xc9\xf9\x29\x82\x30\
+\xa6\x4b\x77\x67\x69\x7b\x44\xc9\x40\xeb\x21\x43\x2e\x57\x47\x00\
+\x9c\xb6\xd9\xef\xe6\xa3\xa5\x4e\xe1\x9e\x79\xa3\xa3\x79\x8d\x39\
+\x89\x26\x11\xc4\x24\xb2\xd8\x78\x7b\xa6\x7f\x09\x9a\x6e\xc1\xb5\
+\x6b\xe7\x88\xa0\xc3\x15\x6a\x07\xe5\x5f\x68\x3b\x5d\xaf\x8a\x31\
+\x61\xdd\x84\x30\x4c\xac\x6f\xee\xd5\x62\x30\xba\x3d\xe3\x76\x72\
+\xdf\xb7\xc0\x4d\x95\x81\x4d\xf4\xf7\xf5\x40\x8c\x32\x7a\xea\x91\
+\x9c\x0d\x57\x41\x28\xd4\xfe\x4d\x69\x89\x17\x53\x4a\xcc\xb9\xd9\
+\x7a\x22\x64\x24\x00\x28\x67\x0c\x31\xad\x6a\x89\x72\x83\xbf\xde\
+\xda\x50\x55\xac\x86\x74\x58\xdb\x28\x69\x2d\x85\x20\x43\x6b\x1b\
+\x25\x78\x1f\x0e\x1f\xe7\x12\x9b\x31\xed\x37\x77\x70\x42\x5d\x87\
+\x10\x8d\xa9\x49\xe4\x43\x69\x09\xe8\x0e\x75\x75\x3e\xc2\x17\x4a\
+\x99\x5c\x96\xbc\x89\xd9\x70\x76\xb0\x16\x80\xb6\xd9\x73\x01\x9a\
+\x52\x67\xaf\xaa\x8a\x49\xb0\x11\xaf\x55\x35\xc5\x8b\xe8\xf9\x12\
+\x18\xb2\x23\xd4\x1c\x03\x03\x9e\x00\xa8\xea\x5f\x24\x89\x34\x01\
+\x10\xd2\xb8\x02\x55\xa8\xf2\x7f\x4b\x68\x89\xd7\xe5\xba\x1a\x9f\
+\x07\x61\x7c\xe3\x69\xeb\x51\x11\xeb\x40\xae\x5f\x9c\x7b\x9f\x44\
+\x15\xca\x55\x85\x62\xa8\x11\xcc\x90\x9f\x13\x4b\x56\xca\x1d\x48\
+\xb6\xe3\x9c\x58\xa2\xa4\xb8\x1a\x8c\xf0\x57\xe2\x52\xc1\xa5\x6a\
+\x24\x59\xfe\x4c\xec\x47\xc9\x4a\xbb\x5a\xe2\xce\xd6\x8d\x8f\x31\
+\x76\x8a\xf3\xd1\xa6\x04\xc8\x7a\x7a\x35\x45\x04\xe4\x89\x1e\xbd\
+\xc6\x8a\x18\x11\x44\x52\x48\xaa\x2c\xc5\x94\x7a\xa4\x74\x30\x35\
+\x0c\xea\x64\xf7\x8c\x92\x0d\xab\xc2\x8f\xa1\x47\x3d\x23\x5a\xf2\
+\xec\x50\xb4\x2f\x94\x9f\x7d\xf6\x2c\xd6\x8c\xd6\x8d\x54\xb5\xd4\
+\x3e\x6f\x6e\x53\xfb\x66\x90\xc2\x64\x4f\xd1\xc1\x37\xda\x6e\x5a\
+\x02\x20\xd0\x88\xc4\x44\x42\x04\xfd\x45\x66\x73\xda\x82\x06\x37\
+\x63\x94\x94\xb5\x77\x47\xb1\xf6\x62\xd4\x64\x00\x8d\x5a\x88\x8b\
+\x96\x91\xe8\x42\xa2\x51\x51\x9b\x26\x00\xec\x45\x5c\x6a\x02\xe0\
+\x36\x9c\x59\xb4\x93\xf1\xaa\x69\x5c\x57\x22\xe9\x00\x65\x04\x73\
+\x0f\xc5\xe6\xff\xcd\x80\xe2\x6a\x9a\xf8\x6e\x21\x68\x29\x8b\xd0\
+\x86\xcc\xbe\x5e\x5c\x67\xdf\xcb\xcf\x94\x5d\x3f\x66\x74\x93\xc8\
+\xf6\xda\xa3\xe1\x2d\x2a\x13\xa5\x8f\x60\x9e\xab\xeb\x05\xd0\xbc\
+\xfd\x27\x4a\x21\x2a\x86\x86\x1e\x83\x49\x7e\x0c\xec\xd7\xe7\x21\
+\x33\xa1\xf3\x02\x63\x13\x2d\x66\xbd\x1c\x9b\x0e\x11\x55\xaf\xc6\
+\x7f\x60\x04\xb4\x9a\x14\xb9\x71\xb5\x60\x23\xee\x8b\xeb\x23\x15\
+\x90\x35\x91\x23\x57\x8e\x94\xea\xbf\x1f\x33\x2a\x12\xbe\xf7\xbe\
+\x19\xa0\xb3\xcc\x3d\xe4\xc4\x83\x08\x28\xf2\x3c\x42\x59\xf9\x4b\
+\x09\x64\x19\x10\x51\xcc\x50\x04\x29\x93\x13\x43\xb3\x42\x5c\x0f\
+\x6f\x31\x70\xce\x04\x53\xe0\xab\x69\xda\x18\x91\x96\x00\xa8\x0a\
+\x5d\x05\x41\x5e\x6d\x57\xea\x7c\x34\x50\xcd\xbb\x97\x05\xc1\xb5\
+\x83\x21\x0d\x02\x7d\x31\xee\x85\x1f\xa8\x99\x7e\x91\x08\x55\x05\
+\xcb\x3f\x92\x6b\x6e\x40\xe7\x15\xdd\x50\x2a\x94\x08\x85\x44\x6b\
+\xf8\xdc\x7d\x49\x24\x54\x5a\x5f\x9e\xb9\x41\x72\xae\x86\x08\xd2\
+\x9a\xaf\x47\x5c\x52\xba\xc4\xdb\x19\xe5\xaa\x86\xb2\x88\xb9\x7e\
+\x9f\x21\x14\x32\x31\x97\xaf\xa7\x7f\x6e\x23\x15\x5c\xbd\xac\xc4\
+\xb8\x59\xa5\xd0\xa0\xb0\x9a\xa7\x59\xc5\x06\x19\xde\x28\x2b\x71\
+\x4e\x3f\x45\xed\xb3\x95\xf8\x50\x24\x11\x71\x3d\x33\x98\x1a\x9a\
+\x23\x4d\xb7\x18\xf2\xcc\xd6\xda\x19\x1f\xa3\x7e\xb8\x7f\xe6\xf3\
+\x6a\x4f\x00\xbc\x7a\x6c\xe1\x1a\xa9\xde\xdb\x85\x10\x68\x17\xef\
+\xa5\x08\xca\x48\x12\x87\x79\x03\x5d\x69\x92\x91\xd5\x02\x40\x39\
+\x8a\x81\x26\xa9\xcd\xd1\x84\x47\xf4\xbe\xbf\x9b\xb1\x16\xea\x3c\
+\x74\x21\x8f\x28\x06\xdf\x35\xb9\xa6\x9e\xfe\x80\xd7\xc1\x30\x02\
+\xea\xe0\x01\xb9\x43\xf0\x27\x90\x4a\x0e\x0a\x67\xbb\x61\x01\x78\
+\x12\x19\xd5\x87\x4a\x40\x6a\x46\xc2\x24\xc7\x6f\xf4\xfb\xe5\xc5\
+\x84\x9c\x1a\x42\x28\xd2\x46\x42\x6b\xe9\x64\xd1\x0e\xc6\x1b\xa1\
+\xb0\x6d\x45\x41\xf1\x94\xc4\x25\x9c\xc2\x64\xf0\x57\xc9\x94\x4c\
+\x16\x3c\xbb\x41\x91\x92\xdd\x8d\x0a\xb9\x7b\xc9\x40\x6a\x04\xfa\
+\x58\xe0\xd7\x60\xf3\xb2\xe6\x6a\x56\x32\x92\x14\x64\x71\x82\xe3\
+\x09\x80\x7e\x3f\x0c\x99\x66\x55\x61\xb2\x04\x80\xf3\x09\xfc\x1e\
+\xe5\x35\xe0\x6b\x55\x70\x85\x93\xf7\xf4\xea\x57\xa0\x29\xfc\x90\
+\x9a\xff\x5a\xf0\xd1\x93\x93\x52\x55\x5f\x27\xfe\xba\x55\xb6\xd6\
+\x65\xde\x82\x73\x7c\x8b\x9e\x07\x27\x7d\x32\x31\xa3\x7a\x0a\x37\
+\x87\xb7\x81\x44\x20\xee\x40\xc9\x04\x5d\xdb\x07\x14\xaa\xa1\xae\
+\x51\xfc\x9b\x7e\x8e\x34\xf8\xfb\x3d\xf2\x5e\x19\x09\x00\x39\x8f\
+\x0e\xc2\x11\x88\x54\xbf\x5d\xb4\x3d\xbc\xa8\x60\x90\x33\x9f\x75\
+\x47\xdb\x2b\x1c\x3f\xc8\xe1\xdd\x14\x40\x31\x05\xd9\xad\xe9\x6a\
+\xb7\x95\x0a\x33\x6a\x32\x01\x40\x0d\x20\x23\xed\x10\xf3\x59\x89\
+\x09\x91\x17\x0d\xb0\xe6\x43\x94\xc1\x05\xb0\x26\x00\x71\x6b\xc9\
+\x22\x6c\x79\xd4\x62\x25\x9b\x31\xc7\xe9\x89\x4a\x3b\x52\x24\x0e\
+\x5f\x78\x44\xd7\xac\x09\x8a\xac\x16\xfc\xd0\x2a\xd9\x69\x4f\x00\
+\x90\x75\x6e\xd6\xd1\x08\x3e\x12\x6a\xf5\x6c\x8e\x7e\x71\xa8\x07\
+\x99\x6a\x76\xb2\x97\x6d\xeb\xfb\x34\x31\xa3\x6a\x64\xb8\x26\x1c\
+\xaf\x98\xc8\x41\x86\x4f\x82\x5d\xb7\xc0\x08\x60\x1e\xca\x11\x65\
+\x32\x13\x01\x37\x91\x90\x59\x74\x02\x0c\xe2\x26\x4a\x6c\xfa\xc5\
+\x89\x91\x41\x42\x15\xd2\xb1\xa9\x44\x8a\x3f\x77\xd4\x24\xa9\xcb\
+\xe5\x23\x85\xaa\x72\x8e\x4c\x1b\x51\xd9\x47\xe6\x9b\x3f\x4f\x00\
+\x4a\x19\xc1\x5e\xb7\x2d\x36\xfe\x5d\x47\x0d\xb4\x2a\x32\x2b\x69\
+\x88\xff\x9e\x2e\x15\xeb\x1a\x6d\x25\xed\xbe\xc9\x23\xb2\x28\x50\
+\x8a\x24\x34\x52\xd7\x25\x5b\x01\x22\x00\x72\x7e\x81\x5f\x37\x79\
+\x2b\x9e\xb6\x1e\xb2\x7d\x81\x24\x97\xc0\x7c\x76\xcc\xd6\x44\x49\
+\xfb\x7b\x49\x5b\xdf\x92\x96\xb0\x24\x7b\xe6\x81\xa6\x1d\x81\x18\
+\x47\x82\x9f\x77\x92\x24\x87\x62\xd5\x38\xd2\xc4\x78\x50\xaa\x92\
+\x9d\xeb\xd7\x33\xd6\x1e\x29\xbe\x8e\x86\x46\x26\xab\xc7\x76\xcd\
+\xd5\x8b\xc4\x21\xc8\xe0\xdd\x34\x02\xb5\xa3\x9c\x7d\x75\xe0\x13\
+\x80\xd6\x5a\x0c\x51\x8b\x01\xd7\x3c\xda\x93\x18\x34\xc3\x63\x40\
+\x0d\xbd\xb7\xd3\xaf\xf7\x2c\x92\x3c\x00\x2b\x07\x20\xd3\xa3\xb8\
+\x8d\xca\x56\xa6\x75\x6d\x4c\x77\x3e\x4e\xf6\x13\xd5\x19\xef\x9d\
+\xbb\xc6\x6c\x7d\xf2\x81\x53\x55\x5b\x72\x1c\xcf\xb1\xf5\xbd\xbd\
+\x20\xf5\xc6\x39\x95\x5a\x62\x54\xcf\xa9\xe8\xac\x77\xbb\xfe\xbd\
+\x1b\x4b\x26\xec\xde\xd8\x3a\xa9\xcd\x46\x12\x8a\xac\x1f\x22\xe1\
+\x06\xe8\x18\xd6\xba\x41\x86\x28\x49\x90\xb9\x39\xc4\xfd\xb2\x93\
+\x44\x19\xa4\x8d\x13\x06\x89\x39\x5b\xf5\x81\x0b\xb4\xa4\xcd\xa6\
+\x4b\x80\x4c\x01\x27\x51\xa5\x1a\x48\x40\x9a\x4d\x74\x03\x28\x80\
+\x81\x50\xf0\x6a\x5e\x0f\x58\xf1\xe0\xac\x7b\x88\x93\x7e\x77\xec\
+\xef\x69\x81\xa3\x64\x04\x15\x8b\xcf\xb7\x20\xa4\x49\x5f\x72\x6d\
+\x2c\x4e\xfb\x37\x69\x6e\x23\xce\x2b\x66\x8b\xcc\x3e\x97\x75\xe3\
+\xf3\xe2\xc6\x92\x2f\x21\xa8\xe4\xc6\xde\x4b\x3d\x1f\x5a\x12\xc2\
+\x61\x7e\x89\x36\x48\x18\xbc\x47\x5d\x53\x45\x47\x20\xf8\x67\xce\
+\x0f\x2c\xc2\x4e\xf1\x64\xb7\x2e\xd7\xa6\x1c\x5b\x8b\x92\xaf\xb4\
+\x32\x04\x8f\xc7\xd1\x8e\xc4\xe7\x39\x55\x28\x2a\xd2\x36\xd3\x2c\
+\x7d\x8c\xf4\x4d\xd0\xb1\x31\xb8\xf9\xf3\x2b\x91\x95\x58\x02\x90\
+\x9c\x10\x42\xfd\x24\x05\x9b\x7e\x1d\x8e\xad\x3f\xed\x15\x99\x93\
+\x5f\x55\x15\xfd\x50\x41\x3f\x98\xa8\x7d\xeb\xec\x35\x5b\x39\x37\
+\x3b\xa6\x28\x10\xe0\xf8\x3e\xd7\xea\xf4\x43\x6b\x46\x41\x83\xfa\
+\x77\x06\x12\xe5\xbf\xae\x97\x84\x78\x5d\xe3\x50\x95\x25\x81\x4f\
+\x8c\xec\x5c\x93\xaa\x34\x2b\xa5\x38\xe1\x2c\x6e\xb8\x90\x56\x79\
+\xe8\x90\xba\x7d\x4c\x4d\x8d\xd3\x29\xd8\xdb\xac\x94\x6d\xad\x13\
+\x31\x7a\x11\x59\xe7\x31\x13\x0e\x79\x7e\x94\x14\x83\x30\xc4\x2c\
+\x90\x4a\x84\x7c\xa4\x92\x36\x63\xcc\x50\x27\x49\xe6\x67\xd9\x6e\
+\x0c\x2d\xb1\x31\x65\x85\xb7\xbb\x19\xf8\xcd\xd7\x75\x3d\xbd\x0a\
+\x4d\x11\x27\xea\xa8\x19\x68\x80\xa3\xc3\xc8\x5e\x9a\xea\x61\x90\
+\xee\x4f\x60\x19\xf3\x34\xbd\x04\x90\x32\xc7\xe1\x3d\x75\x55\xcd\
+\x23\x7b\xe0\x6e\xd7\x51\x31\x13\x05\x51\x61\x97\xad\x09\x48\x7c\
+\x62\x24\x9e\x84\xd7\x2d\x13\x31\xa1\x96\x68\xc4\x0f\xf6\x7e\xe5\
+\x8a\x48\x04\x92\x1b\x5b\xd2\x76\xb9\x27\x86\x5a\x21\x35\x9e\xa8\
+\x27\x00\x96\x02\xa1\xc8\x7a\x08\xc3\xa1\xa4\xba\xa4\x36\x3b\xef\
+\x99\xd3\x20\x99\x41\xb8\x85\xb1\xad\xf8\xfe\x11\xff\x7b\x02\xd5\
+\xa9\x14\x81\xf9\xd3\xda\x8b\x19\x45\x50\xa3\xd5\xa8\x1f\x6a\x7b\
+\x82\x86\x4c\xb6\x68\xff\xdd\xbc\xd1\x9b\xb6\x67\xc8\x7b\xd6\x4e\
+\xdf\x80\xe2\x08\x69\x62\x0f\x6b\x80\x65\xdf\xdc\x7a\x04\x4d\xa3\
+\x12\x09\x1e\x87\x1f\xb5\x4e\x7c\x5c\xf9\x52\xc0\x51\xea\x42\xc6\
+\x03\x8a\xa3\x09\xd4\x38\x9e\x65\xbc\x2f\x66\xf8\xe3\x1a\x55\x4c\
+\x1c\x92\x4d\x26\x02\x6e\x25\x8b\x03\x90\x26\x31\x9c\xc6\xf6\xac\
+\x4b\x68\xc6\xe1\x6a\x85\xae\xc6\x09\x48\x4e\x1c\x04\x39\x3e\x07\
+\x51\x4c\x20\x28\x85\xbb\xd0\x21\x36\xc6\x9a\x51\x85\xbb\x36\xb5\
+\x29\xcf\xe6\x8d\x50\x2b\xd4\x47\x74\x63\xec\x72\xbb\x9a\x1f\xd2\
+\x02\x38\x32\x35\x10\xb4\x6b\x74\x8c\x7e\x64\xdc\x9c\x29\x66\xe0\
+\x64\x23\x2e\x79\x36\x0f\x82\x82\x1e\xda\xbe\x9a\xd8\x70\x04\x83\
+\xdd\x8f\x34\xe2\x60\x3c\x58\x85\xb1\x6b\x0f\x2d\xc4\xbb\x48\x91\
+\xe5\x52\x02\xbc\x89\x06\xd8\x21\xfd\x92\xaf\x23\x6c\xf5\xf4\x4d\
+\xa9\x1a\xa9\x2a\xdd\x06\x51\xfb\x49\xb8\x9d\xbd\x3e\x2a\x18\x84\
+\xf3\x03\x61\xb2\x1d\x82\x14\x3c\xee\xa3\xcc\xc0\x99\x7f\x84\x96\
+\xcf\x39\x52\xbd\x7c\x7e\xc8\x4d\x32\xab\x62\x6b\x12\xca\x95\xf6\
+\xc0\x39\xcc\x6f\x57\x57\xb2\xf4\x9a\x79\xcf\xfe\x83\x72\x1d\x1d\
+\x81\xf0\x50\x21\x61\x9b\xb6\x9d\x9f\x97\xf5\x19\x34\xbf\x36\x3e\
+\xb7\x1e\xa4\xa8\xe9\x45\x4d\x9f\xab\xdb\x94\xb6\x3e\xea\x97\x04\
+\x60\x55\xb2\x3d\x1e\xb4\x72\x09\x11\xa1\x39\x3f\xcb\x03\x0a\x0d\
+\xb0\x9e\x9a\xc1\x15\x01\x52\xc2\xa8\x31\xcf\x78\xb3\xff\xa8\x38\
+\x00\xae\x87\xf2\xc9\x64\x71\x3d\x81\xd4\xf9\xf8\x24\x32\xa0\xf7\
+\xe0\xd3\x13\x80\x00\xb2\x0d\x8e\x62\x24\xc6\xf8\x46\xcd\xc9\x87\
+\x49\xfd\x03\xa4\x49\xe9\x86\x31\xc7\xbd\x5a\x8a\xcc\x70\x3a\xaa\
+\xa3\x4b\x36\x67\x13\x28\x83\x24\x37\xc0\xd2\x5b\x63\x28\x4b\x54\
+\xb0\x97\x9f\x02\x5d\xfa\x19\x1c\x8f\x4a\x94\x7d\x4d\x74\x3c\x8e\
+\xb3\xe9\xb5\xd9\xf0\x52\xa2\x45\x14\x0f\xac\xc9\x67\xa9\x7d\x68\
+\x40\xa8\xfa\xe2\x45\xc6\xa9\x7c\x5b\xb2\x92\x8e\x58\xd8\xfa\xf0\
+\xd9\x89\x40\x76\x05\x5f\xd2\xab\x4b\x0d\x51\x28\x59\x92\xc5\x78\
+\xcb\x23\x33\x21\x90\xf0\x3d\xd2\x92\xdf\x48\x4b\x04\xda\x11\x88\
+\x90\xbd\xdd\xe8\x85\x46\x21\x91\x8f\x78\x46\xf2\xb3\xe5\x58\xc4\
+\xc3\xf2\x49\xb4\xa8\x1f\x0a\x2c\x05\xfb\x3b\x56\xb9\xed\x95\x13\
+\x58\x5c\xaf\x48\x90\x2d\x92\x00\xa0\x96\xd1\x88\xbc\x49\x81\xf6\
+\x99\xec\x04\x03\x8e\x72\xb4\x13\xc1\x19\x34\xb0\x59\x87\xad\x5f\
+\x1f\x19\xbd\xda\x38\xf4\x2b\xe7\xfd\xb5\xf9\x5e\x13\x66\x8a\xcf\
+\x45\x87\x92\x68\x54\xf2\x6c\x64\x46\xdb\x51\x93\x82\x2f\x8e\xd5\
+\xdb\x3e\x8f\xa0\x12\xe4\x90\xec\x52\x74\xfb\x45\x80\xf3\x4d\x68\
+\x2f\xb9\x09\x23\x4e\x5a\xab\x69\xad\x91\x50\xc2\xbe\x25\x8d\x60\
+\x28\x24\x73\x5d\x2d\x78\xba\x31\x92\x56\xf6\x9c\x6b\xbc\x1d\x60\
+\x63\x19\x07\x1c\x09\x41\x19\xbd\x51\xdb\x66\x58\xcb\x08\xfe\xb6\
+\xc9\x8a\x20\xb5\x15\x63\x3b\x77\x41\xe8\x33\x7b\xd8\x48\xf6\xa1\
+\xf5\x3e\xbc\x5b\x89\x2c\xcf\x4d\xb3\xc1\x3d\x6c\xec\xf7\xb5\xb1\
+\xd6\x04\x8c\x6e\x24\x36\xf5\x04\xd3\xbf\x94\x48\x00\xb4\xa4\x42\
+\x70\x1c\x1a\x41\x02\x62\x04\x45\xb6\x86\x75\x03\xfe\x97\xcf\x9b\
+\x86\x74\x94\x2b\xa1\x96\x6c\x9b\x09\x40\x1e\x1a\x50\xd2\xbf\x36\
+\x05\x17\x67\xe9\xbf\xe7\x05\x89\xec\xf1\xe0\x24\x52\x12\x69\xe2\
+\x56\x41\xc6\xf8\x30\xca\x98\xa2\x59\xb5\xab\xc0\x56\xb4\x5b\x9c\
+\x5c\x31\x9b\x3c\x8e\x04\x6a\x70\x0c\xae\xbf\xd7\xd4\xe4\x73\xe5\
+\x3f\x97\x03\x27\xb6\xd4\x1f\xcf\xc2\x80\x26\x00\x8e\x65\x6e\xdf\
+\x49\xad\x10\x51\x8c\x17\x90\xac\x38\x4a\x46\xa5\x16\x6a\x63\x59\
+\xb1\x0d\xd2\xa8\x8a\x6b\x32\xe0\x9b\xcc\x79\xdb\x5c\x6f\x11\x59\
+\x4f\xd3\xaa\xd7\xb0\xd0\xf5\x83\x94\x19\xcc\x18\x24\xae\xb1\xba\
+\x6d\xbc\x06\x7d\x7d\xf4\x04\xa0\x9c\x06\x0d\xeb\x63\x62\xb2\x8a\
+\x23\x92\xac\x51\xa1\xca\x45\x30\xc6\xb3\x3f\x20\x8d\xf6\xa8\x10\
+\x64\x1b\x1f\x59\x1c\x22\xfd\xe2\xa3\x8b\x89\x20\x5e\xd1\xe6\xe9\
+\x35\x3e\x80\xc1\x72\xb7\x54\xfb\x45\x46\xfb\x5a\x3d\xec\x41\x27\
+\xb4\x26\x68\xe6\x94\x82\xfe\x33\x49\xf8\x5d\x21\x07\xe2\xb9\xca\
+\x98\x48\x90\x7a\x06\xf1\xd7\x46\x29\xa8\x88\x1e\xbc\x39\xd7\x43\
+\xe7\x09\xc4\xce\x3f\xb5\x15\x62\x39\xa7\xb2\x17\xe5\x38\x42\x16\
+\xdb\x2c\x8b\x24\x11\x46\xf5\x9f\xf2\x9e\x71\x94\xc4\x8e\x62\xf5\
+\xc7\xe6\xdd\x1f\xc1\x3a\xed\x7b\x51\x8b\x44\xba\xc0\xba\xf6\xae\
+\x55\x4f\x26\xaf\x80\x6a\xc5\x8d\xb5\x91\x96\xf4\xaa\x76\x6f\x8a\
+\x90\xe6\x51\x8b\x71\x17\xad\x6a\x2d\x00\x94\x21\x4d\x6b\x83\xcb\
+\x03\x03\xc2\x4d\xf6\x1f\xb3\xab\x2f\x7b\xb5\x1f\x43\x1c\x0c\x1f\
+\x6f\x1b\x73\x3d\x00\xbb\x91\x0e\xca\x99\x55\x0f\xc1\x66\xe1\x9b\
+\x4c\x30\xcc\xea\xaa\xa4\x55\x67\xa6\x59\x92\x56\x29\x27\x7a\xd4\
+\xf1\x4d\x36\x34\x59\xdd\x59\xf7\x43\x87\xda\xfd\xa0\xc0\x58\x27\
+\xca\x91\x0c\xce\xb0\x4e\x4e\xfc\x5e\x54\xf0\xf9\xc8\x22\x95\xd6\
+\x93\x50\x76\x25\x3e\xc6\x86\x0c\x5e\x88\x0a\x5c\xad\x06\x74\x94\
+\xf2\xe7\x46\x92\x01\x64\x85\xe2\x4b\x95\x38\x07\x21\x0d\xfe\x8f\
+\x11\x31\xb5\x96\x54\x63\xe7\x10\xa6\x8c\x33\x26\x51\x29\xf9\x7e\
+\x7e\xc4\x79\x17\x21\x47\x05\x8a\xf1\x01\x4c\xdf\x8f\xbc\xe0\x1f\
+\xb5\x15\x5a\x97\xcf\x85\x36\x61\x50\x74\x7d\x06\x66\xb4\xae\x1d\
+\x76\xb8\x69\xc9\x49\xff\x9c\xbb\x39\xdd\x54\x44\x35\x0f\x0d\x70\
+\x02\xb5\xb2\xee\x59\x1a\x2a\x1c\xc5\xc8\xe2\x2b\xe3\xfc\xa8\x17\
+\x00\xea\x87\xea\x3f\x05\xa2\xf3\x02\x2b\x2c\x6e\x06\xea\x30\x65\
+\x2a\x20\x26\x9d\x6b\x21\x43\x31\x75\xaf\xf8\x07\x37\xc5\x59\xcf\
+\x8b\x05\x68\x2f\x6e\xd3\x5b\x4b\x24\x00\x4e\x26\xbc\x1f\x42\xba\
+\xd3\x20\xca\xe8\x79\x5b\x38\x00\x15\x13\x4a\x35\x89\x2c\xc8\xb2\
+\xc1\xd6\x53\xc8\x6c\x9a\xc8\x48\x35\x59\xa1\xa5\xb7\x46\x8a\xe8\
+\x3a\x20\x0b\x12\x80\x2c\xd3\x0d\x28\x25\x21\xb2\x57\xf1\x8d\x66\
+\xc0\x62\xec\x2c\xce\x09\x30\xa7\x45\xb4\xe9\x90\x8a\x2d\xb0\xd9\
+\x84\x7e\xfa\x17\x05\x50\xf7\xa1\x9e\x72\x0e\x9a\x4a\x60\x35\x32\
+\xe5\x79\x63\xe7\x6f\x5b\x8f\xf8\x58\x62\xfa\xc4\x41\x28\xfd\x04\
+\x4a\x85\xda\x18\x49\x29\xe2\xb2\x6f\x69\xcf\x65\xb4\x3f\x74\xfe\
+\x85\x8e\xe6\xb5\x32\x8b\x6d\x23\x02\x97\x0a\x42\xfd\x45\xae\xb7\
+\xc8\x26\x1d\x4f\x6c\xb2\xf9\x34\xfd\x15\x60\x32\xc4\xc9\x32\x08\
+\xa0\xed\x46\x82\xd3\x09\x80\xf6\xaa\x5f\xdf\xcb\xfb\xc3\xf6\xb6\
+\x79\x85\xc6\x81\x4a\xd4\x6c\x1e\x06\x61\xe2\x19\x6f\x1d\x0d\x32\
+\xaf\x6f\x90\xd3\xb0\x44\x2c\xca\x57\xcf\x8b\x57\x7a\x1e\xb2\xcc\
+\x9d\x47\x86\xe0\x81\xea\xcd\x05\xb1\x7e\xb1\x56\x1d\xf8\x16\xe1\
+\x1d\x3f\x8c\x8d\x40\xc5\x1f\x24\x7d\x54\x2c\xae\x2d\x80\x62\x6c\
+\xf3\xb4\x0a\x3d\x48\x09\xf2\x59\x72\x9e\x59\xaf\x87\xc0\x6e\x84\
+\x14\x29\xe6\xba\x96\x04\x38\x7e\x72\xd4\x26\x4b\x8c\xa6\x2c\x75\
+\xcd\xd9\xd8\x98\x80\x79\x25\x91\x51\xfb\xe0\x3b\x15\x5d\xb1\x2f\
+\xff\x59\x88\x33\xfc\xd3\xfb\xb1\xb6\x51\x3d\x8e\x30\xe8\xfc\x04\
+\x03\x76\x8e\xb7\x6e\xf4\x16\x51\x36\x64\x99\x0c\x28\x1a\x8a\x62\
+\x8c\xd7\xe9\x4e\x91\x7a\xeb\x25\xb4\x24\x05\xa1\x6c\x29\x95\x1a\
+\xa8\xa8\x33\x05\x7e\xb4\xc3\x86\x1a\xe8\xbe\x11\x02\xf1\x31\x13\
+\xdb\x34\xf4\x2b\x34\x09\xb0\x45\xb9\x0d\x86\x36\x40\x5c\x07\x24\
+\x05\x0d\x10\x89\x4b\x55\xe7\x56\xe4\x57\xd2\xa6\x18\x52\x76\xef\
+\xd8\x2d\x3c\x12\x15\x59\xf8\x2a\xe9\xcf\x8a\xfd\xbc\xea\x89\xd6\
+\x44\x7a\xdb\xc6\xb6\x8f\x35\x33\xb2\x85\xda\x1a\xfc\xdd\x9c\x60\
+\x9f\xb4\x67\x0f\x4d\x85\xd2\xb6\x24\x00\x28\x21\x7d\x9e\x44\xb8\
+\x52\xda\x7d\x85\x51\x80\x66\x21\xfd\xa0\xb0\x66\x43\xf2\x5c\xfb\
+\x0b\x89\x28\x6a\x4b\x1f\xb4\x4d\x32\x3e\x91\x00\x34\x63\x27\x98\
+\xfd\xc1\x6c\xcc\x0e\xd3\xac\x44\xc2\x58\xc6\x1d\x40\xd2\x15\x2e\
+\x96\x91\x0b\x27\x34\x4b\x0f\x33\x7e\x3e\x8e\xd0\x8b\xcf\x15\x95\
+\x41\x85\x67\xcf\xcd\x0d\x20\x16\x40\xe3\x89\x87\x91\x68\x58\xdc\
+\x06\x63\xd5\xb9\xc3\x4d\x6c\x4a\xd6\x11\x35\x5b\xe0\xaf\xab\x0d\
+\x4d\x83\x72\xa9\xc4\xa9\x56\x19\xeb\x41\x51\xf9\x04\x44\x89\x0d\
+\xce\x98\x0c\xc8\x74\xa3\x42\xd9\xc9\x93\x6f\x39\x2a\x71\x45\xbb\
+\xe4\x06\x65\xca\xa5\x46\x19\x9b\x5a\x64\x51\xaf\x0b\x8d\x31\x32\
+\x45\x3a\xe3\xed\x80\xaa\xfe\xac\xd4\x73\xaa\xdd\xd0\x3a\x26\x99\
+\xa8\xe6\x2b\x8d\x13\x07\x75\xa4\x81\x39\xf4\x99\xc9\xae\x8e\x02\
+\xb8\x16\xd1\xa1\x7c\x55\x41\xd4\x7c\xa2\x52\xad\x1b\xe7\x69\x6f\
+\x0f\x14\xd3\x51\x28\x3a\x93\x6f\x4f\xe8\xec\xfe\x07\xd6\xe7\xd0\
+\x2f\x9e\x2c\x16\xd3\x70\xa8\x67\x38\xf7\x89\x7b\xa4\x3f\xd3\x45\
+\x89\x63\x41\x5b\xe1\xec\x54\x3e\x48\x61\x7e\x44\x7b\x4c\xdf\x4c\
+\xe1\xb5\x28\x21\x30\x66\x06\xbf\xb0\x25\x08\xdc\xf1\x50\x8b\x08\
+\x40\x64\xdd\x77\xd3\x83\x6f\xd4\x4f\xe8\x0d\x4a\x45\x40\x5d\xbf\
+\x3f\x5b\x00\x51\x3b\x38\x00\x28\x93\x24\xe6\xe8\x01\x25\x41\x7a\
+\x42\x29\xe3\x47\x05\x1e\x52\x3f\x9e\xf1\x86\xc6\x6b\x36\x2c\x27\
+\x6b\x0d\xd4\xb5\xec\xc9\x81\x04\x23\xb8\x40\x22\x11\x27\x0b\xe6\
+\xf4\x29\xe9\xf8\xa3\x01\x65\xe7\x6d\x5c\xf5\xec\xea\x4f\xc8\x40\
+\xfa\x69\x0f\x79\x12\xa5\x11\xef\xef\xf8\x4c\x0c\xa6\x5c\x09\x4d\
+\x67\x44\x59\xd1\x07\x29\x9c\x87\x9a\xb5\x3d\xa2\x57\x0b\x3a\x0a\
+\x90\xc8\xc2\x3d\xd3\xe3\xa1\xe8\x38\x52\x7c\x2c\x4a\x56\x49\x82\
+\x0b\x20\x44\x81\x52\x54\x30\xf3\x04\x63\x8a\x05\x93\x24\x64\x6f\
+\x12\x55\xed\x72\xd1\x12\x16\xa7\x36\xb9\xfc\x79\xb7\xbc\xae\xc9\
+\x13\x08\x33\x92\x80\x82\x42\x3d\xb9\x90\x7f\x7a\x52\x54\x84\x04\
+\x98\xb6\x76\xe9\x81\x3a\x4c\x70\x1c\xd2\x2a\xdb\xac\xcd\x32\xfd\
+\xdc\xf2\xf9\x20\xd9\x50\x6e\xad\x01\xb2\x6a\xbb\xe0\xe5\x76\x39\
+\xb4\xb6\xdb\xf2\x56\x20\x89\x59\xff\xbe\xaa\x70\x27\x9a\x59\xeb\
+\xa8\x2d\x41\xd7\x7c\xbd\xa8\xc0\x33\x81\xda\x86\x00\xb8\x86\x20\
+\x9e\x94\x02\x0e\x5a\xbc\x31\x59\xde\xf2\x41\x01\xf8\x54\xeb\x57\
+\x67\x26\x01\x48\x83\x76\x35\xb1\x1f\xcb\x46\xda\x7a\x02\x80\x2c\
+\x95\xba\x16\xc0\x13\x41\x2f\xd6\xe7\x4e\x04\xfa\x62\x93\x05\x09\
+\x25\x2b\x3f\x34\x15\x00\x63\xdc\x87\x84\xd9\x8a\x0e\x6b\x5a\xaa\
+\xb6\x72\x7c\x04\xcb\x53\x19\xb9\x9b\x78\xd8\xcc\x71\xba\x52\xea\
+\x86\x18\x68\x9b\x60\x60\x69\xbb\xd4\x12\x08\x41\x7a\x10\xb1\x9b\
+\xe8\x94\x0a\xb0\xc4\x8d\x5e\xb2\x6f\x72\x46\xe2\x23\x6a\xd4\x97\
+\x3e\x16\x44\xcb\xd5\xb0\xe1\x71\xc0\x52\xa3\x95\xb5\xbc\x57\x61\
+\x8c\xb7\xa2\xf1\x01\xb4\x7b\x26\x5c\xf5\xc4\x91\x44\x00\xcc\xa9\
+\x8d\x56\xc7\x14\xe3\x7e\x07\xc9\x67\xab\x6e\xb4\x23\xcc\xef\xa3\
+\x06\xf9\x0f\x29\x22\x41\x89\x29\x08\x94\x48\x0c\x93\xcf\x89\x2e\
+\x7d\x1c\xc6\xe4\x8a\x51\xaa\xd6\x46\xea\x39\x55\x14\x02\x90\x8e\
+\x76\xd9\x47\x66\x8b\x25\x39\x08\xda\xdd\x77\x2f\xde\xd3\xb7\xc1\
+\xd0\xa8\xe5\xe4\x22\xd9\x52\x40\x99\x88\x45\x7f\x26\x04\xe9\x49\
+\x3b\x4a\x24\xce\x69\xbf\x97\x27\x6c\xd7\x9a\x23\x5f\xbc\xe0\x18\
+\xc8\xe4\x48\xb5\x9b\x07\x39\x5e\xa3\x09\x40\x94\xd3\x8f\x89\x52\
+\xd0\x80\x9c\xea\x20\x03\xaa\x32\x36\x3a\xfe\xf3\x8e\xde\xf3\xac\
+\x26\xa5\x80\x93\x70\x53\xcd\x5a\x89\x3a\x5e\x60\x61\xf3\x9b\x30\
+\x95\xf9\xb0\xc6\x82\x7b\x62\xfc\x2f\x2f\xd0\xe7\xb4\x47\x7c\xa5\
+\x40\xc6\xaa\x75\xcd\x8a\xd6\x48\xa4\xea\x86\xef\xbc\xee\x4e\x57\
+\x8e\xb9\xb0\xa5\x19\xd5\xa8\x9e\xb8\xc6\x0f\x48\xcc\xd6\xc7\xc9\
+\x50\x61\x8c\xb4\xa9\x4d\x6b\xc4\xa7\x2e\xfc\x64\x52\xc5\xee\x21\
+\xb2\x8c\xb7\xa5\x91\xb8\xf2\xc6\x17\x93\x63\x48\x65\x43\x2e\xd5\
+\xa2\xad\xe0\xeb\x5a\xff\x8d\x56\xab\xf1\xca\x3b\x8c\x71\x0c\xe2\
+\x28\x4c\x3d\x51\x25\x9b\xa3\x86\xda\x88\xa2\x4c\xd8\xea\x5c\x70\
+\xc7\x8e\x26\xe8\x09\x84\x41\x24\xac\x64\x11\x0a\x63\x49\x46\x5a\
+\x32\x13\x7b\xa6\x54\xe2\xa1\xfb\x06\xa4\xb5\x03\xb2\x26\x08\xc2\
+\x82\x49\x14\xd2\xf4\x0e\xd2\x94\x0f\x63\xaf\x5f\xb5\xa9\x12\xda\
+\xab\xae\x74\x1f\x87\xc8\x08\xe8\xe6\xbd\x0f\x53\x92\x56\x3b\xf4\
+\x9e\xf6\xfc\xb4\xcf\x2b\x00\x25\x46\x14\x1d\x3f\x4d\xd9\x31\x2b\
+\x39\x48\x6b\xe1\x36\x1a\xec\x90\x15\xb5\xc9\x9e\xce\xd2\x47\x56\
+\x8b\x12\xd7\x50\x9b\x93\x84\xb4\x84\x12\xf5\x1b\xf4\xae\x9c\x3d\
+\x6d\xcf\x68\x5e\x3b\xa2\x0d\xea\x91\xd2\xdf\x06\xc1\x60\x8f\x92\
+\x00\xd3\xfa\x51\xad\xf8\x18\xa7\x13\x2f\x92\x0f\x45\xbd\x49\xe3\
+\xa1\x74\x98\x36\xdb\xfd\x2e\x2b\x08\xa3\x1c\x21\x8a\x2c\xce\x40\
+\x9e\x7d\x6d\x9a\x43\x5e\x68\xd9\x6c\xe2\x81\x2d\x48\x28\xf6\xd9\
+\x60\xe5\xa6\x99\xeb\x34\x1b\x8c\x72\x12\x00\x0b\xaa\xe2\xd7\x72\
+\x48\x92\x36\xbd\x83\xfc\x2a\xcc\xf8\x40\x24\xfc\xd8\xb3\x21\x60\
+\xd1\x3a\x71\x62\x6a\x7a\x4e\x7c\x63\xf7\xd3\x34\x10\xa2\xc6\x46\
+\xd8\x7c\x3d\xc9\xa8\x6b\xa3\x74\x61\x2c\xc8\x87\x56\xce\x86\x59\
+\x4d\x87\x31\x22\x60\x92\x89\xde\xb8\x40\x51\x1e\x12\x10\x5a\x34\
+\x01\xd2\xdd\x0d\x9b\x13\x43\xaa\xe7\x2a\x13\x8a\xf7\x53\xa4\xd5\
+\xf8\xe7\x22\x2d\xa0\xd8\x37\xec\x24\x3a\x80\x32\x8b\x0f\x5b\xc2\
+\xb2\xea\x8c\x92\x65\x54\x71\x7e\x1e\x81\xb2\x48\x71\x17\x53\xd6\
+\x6c\x38\x06\x04\xd6\xa4\xa3\x58\x40\x2b\x22\x0b\xdc\x48\xdb\x24\
+\x49\x52\x6f\x34\xb6\x38\x5e\xd0\x8f\xf7\x19\xe5\x68\x54\x34\x8b\
+\xea\x34\x96\x40\x92\xe7\x66\x30\x1b\x03\x1c\x38\x3d\x63\xfb\xe6\
+\x16\x41\xdc\x00\x27\x1f\x0e\x69\x6c\x14\xd1\xcc\xbe\xa3\x5c\x38\
+\xde\x1c\xfb\x89\x27\x03\x29\xfa\xf5\x16\x13\x9f\x6c\xd5\xbb\x30\
+\x75\x6e\x37\x3d\xfb\x0c\x62\x7c\x07\xbd\xbf\xdb\x8a\xa9\x8d\xde\
+\x83\x17\xd0\x26\xaf\x32\xbd\x9c\xf1\xbf\x44\x12\x10\x64\x4c\x41\
+\x08\x2e\x01\x6f\x31\x14\x1c\xdb\x92\x13\x22\x5e\x58\x00\xe6\xae\
+\x5b\x99\xd9\x8e\xa6\x01\xe0\x70\x04\xa9\xe4\x87\x09\x85\xc4\x86\
+\xf4\xec\x0d\x23\x9e\x7a\x82\x8b\x62\x17\xca\xa9\xc7\xaa\x4e\xa5\
+\xbe\xa7\x5a\x10\x28\xc1\xd6\x8e\x23\x30\xad\x25\x00\xa1\xf5\x99\
+\xa1\x09\x89\xaf\xa1\x46\x1c\x01\x28\xae\x87\xd0\xda\x94\x84\x90\
+\x70\x2e\xc5\xa7\x39\x52\xc6\x14\xe3\xe8\x60\x39\x73\xf4\x0c\x25\
+\x46\xac\xec\xeb\x54\xb7\x08\x62\xe5\xc1\xc4\x8d\x54\x6c\xad\xce\
+\x7d\x47\xd6\x73\x1a\xec\x17\x0d\x1a\x28\x17\xa2\x77\x9b\x68\x01\
+\xa7\xdb\xae\xf7\xf7\x98\x63\x91\x29\x35\xd4\x82\xd2\xe4\x00\x4a\
+\xe3\x57\xfa\x7b\x64\x34\xae\xe2\x38\x80\x09\x80\x0e\x59\x65\x3f\
+\x9c\x45\xc5\x36\x1a\xf7\xe2\xb6\x67\xf6\x71\xc6\x7e\x9c\xc0\x16\
+\x59\x98\xfd\xe6\x43\xe9\x6a\xe3\x6c\xa2\xf7\xec\xda\xaa\xd3\x02\
+\x7d\xaf\xf8\x58\x9c\x3d\x8b\x0f\x34\x51\xa0\xa0\x21\xc8\xcd\x36\
+\x87\x2e\xc6\xfa\xdc\xc2\xd2\x97\xc8\x82\x02\xa0\x1c\x45\x47\x64\
+\x65\x0a\x27\x03\xaf\xc5\xdc\xc7\x57\x82\x31\x59\x6c\xee\xb4\xfb\
+\xec\x66\x3c\x93\x83\x35\x79\x5d\x5b\xd5\x5b\xca\x08\xac\xc9\x39\
+\x7e\xdb\x58\x5e\x3d\x91\x04\x94\x04\x57\xc1\x0a\x8f\xa3\x36\xfa\
+\x10\x84\x39\x09\x5f\xf2\x99\x71\x34\xae\x41\xb9\xa2\x38\x08\xcd\
+\xbf\x5f\x68\x55\x0a\xd4\x83\x44\x59\x97\x48\xf6\x39\x9c\xcd\xcf\
+\x25\xef\x99\x56\x45\x05\xca\x9e\x0e\xd0\x64\x7d\x0d\x8b\x66\xcb\
+\xe8\x67\x91\x5e\xfb\xc0\x6a\xbe\xa7\x33\xd9\x9d\xb6\x40\xd5\xa6\
+\x11\x9a\xdb\x70\x10\x0c\x32\x10\x93\x95\x25\xbc\x83\x32\xe3\x40\
+\xff\x25\x00\xa8\x0d\xc5\xeb\x40\x24\x1b\x6c\xcf\x1f\xe4\x78\x79\
+\x2a\x4d\xcd\xdd\x00\xb7\xc0\x28\x8e\x10\xf4\x49\x8a\xe2\xa0\x0c\
+\xe2\x48\x5e\x05\x8d\x20\xdb\x7c\x27\xbd\x32\xb0\x19\xe3\xc4\x49\
+\x20\x71\x39\xd6\xb8\xed\x6c\x5c\x99\x8e\xf6\x65\x53\xd7\x21\xca\
+\x18\xa7\xb1\xcd\x17\xa3\x94\x51\x4b\x54\x10\xb2\xb6\xbc\xbf\x24\
+\x04\x46\x05\xb3\x76\x7d\xd6\x37\x7e\x0e\x3a\x63\x3b\x39\x06\x69\
+\x6a\xc7\x87\x6a\x2c\xcf\x1a\xfc\xc5\xe4\x48\xa0\xc6\xf9\xe2\xb3\
+\xeb\x29\xd5\xad\xae\x85\x4f\x03\x9a\x96\x78\x28\x2f\x00\xf6\xb3\
+\x4e\x25\x32\x14\x17\xf3\x19\xed\xb1\x20\xaf\x27\x1c\xb1\x51\x55\
+\x3d\x01\x10\x50\x7f\xbc\xb7\x5d\xd2\xd6\x43\xf5\xb4\x9b\x81\xe0\
+\x1b\x0b\xd2\x71\x6e\x48\xd9\x4f\xf2\x46\x32\xf9\x23\x4d\x20\x25\
+\xf6\xd1\x35\x5d\x9e\x97\xad\x89\x23\x12\x69\x9a\x8c\xd4\x8d\x96\
+\x40\xe2\x3a\x2c\x49\x4c\xaa\x63\x5e\xac\x95\x94\x44\xbf\xc8\xda\
+\x23\xf3\x19\x36\x3e\x8b\xf1\x0a\xbb\x19\xb1\x9f\x66\xab\x7f\x64\
+\x1d\xa9\xcb\x23\xa3\x36\xc6\xe5\x2a\x2e\xbe\x63\xeb\x99\xa7\x27\
+\x68\x03\x21\x88\x94\x46\x48\x44\x89\xd6\x73\xfb\xec\xee\x8b\x5b\
+\x13\xdb\x95\xff\x56\x4e\xf0\x77\x34\x07\xc9\x41\x03\x05\xfd\xdb\
+\x49\x30\xc8\xe8\x49\xd8\xe7\xe9\x6d\x93\x00\x41\x81\x0c\x1b\xa5\
+\x8e\xdb\xa9\x00\x1f\xb5\xe5\xe6\x16\x11\x3e\x71\x2b\x61\x41\xbf\
+\xee\xc8\x7a\x3d\xf6\x79\x5a\xb3\xc2\xce\x1a\x61\x6b\x24\xc1\x4b\
+\x37\x0c\xb2\xb9\x18\xc6\x44\x7e\x8c\xa9\x80\x78\x02\x90\xfe\xf0\
+\x93\x40\xe9\x24\x0c\x96\xb4\x7b\x69\xd1\xbf\x2f\x55\x22\x39\xce\
+\x57\x96\x3d\x6c\xb3\x5f\xee\x68\xd3\x00\x6e\x25\x4c\xd5\xd9\x4f\
+\x6e\x64\x61\x41\x48\xdb\xfe\x8c\x67\x4f\x39\x68\xcc\x76\xdf\xe4\
+\x27\xd8\x65\x80\xdb\x7f\x24\xb5\x23\x4c\x4e\x82\xfa\x5a\x6f\x81\
+\x17\x50\x64\xfe\xdf\x34\x15\x92\xb2\xd5\x1c\x79\xa0\x09\x9c\xb5\
+\xfd\x81\x52\x1d\x11\x1b\xb3\x04\x4e\x42\xaf\x26\xf2\x66\xe7\x89\
+\xb4\xaf\x25\x50\x7c\xbc\xba\x88\x0e\x46\xeb\x81\xaa\x35\x15\xbd\
+\x78\xbb\xaa\xfd\x0e\xb2\x0a\xbe\x1e\xec\xa3\xc2\x05\x55\xf6\xf5\
+\xa2\x7e\x8a\x75\x26\x67\xab\xb0\x5f\x45\x13\xf7\xd1\x6d\xa6\x05\
+\xe0\x05\xfd\x90\x00\x78\xf9\x2a\x5f\xfa\x87\xcb\x49\xd5\xd4\xcf\
+\xcb\x92\xea\x4d\xaa\x2d\x35\x27\xc2\x91\x79\x53\x8a\xf8\xae\x17\
+\x4e\x36\xa2\x5c\xd8\x50\x57\x89\xd3\xbf\x97\xce\x6a\x4d\x53\x2c\
+\x6c\xe4\xc1\x8f\x2c\x82\x3f\x71\xc6\x3f\x4a\x19\x99\x0a\x32\xb5\
+\x0f\x9c\x54\x87\x45\xe5\x13\xef\xea\x9b\xb3\x1f\x9a\x6e\x7f\xd5\
+\xb8\xb9\x4d\x8a\x2a\x5e\x25\x4a\x95\x1b\xb5\x43\xf0\x61\xe1\xd9\
+\x7e\x93\xf1\x5f\xb7\xc8\x33\x8b\x73\xaf\xab\xfb\x55\x4d\x56\x6f\
+\xa5\x6a\x4c\x6d\xaf\xc5\x00\x5f\x6c\x2c\x31\xb2\x90\x14\xdb\x93\
+\x7c\x14\xd3\x8e\x57\xb0\xbf\x31\x0d\x53\x4d\x47\xb2\x1a\x79\x3f\
+\xc7\xcb\xee\xbb\x9b\x68\x52\xdd\x8a\xfa\xb5\xd6\x23\x6f\x87\xf8\
+\x4f\x30\xa0\x15\xb4\xd9\xf6\xac\x15\x08\xa2\x61\xc6\x14\x56\x7f\
+\x9d\x5f\x50\x30\x18\xb7\x6f\x8e\xbe\x91\x18\x61\x12\xb8\xa3\x01\
+\xbe\x7f\xc5\xda\x24\x83\xda\x09\xb9\x58\xe7\x2a\x0b\xcc\x42\x96\
+\x3c\x21\x4c\x50\x2b\x00\x91\x44\x50\xac\xc7\x86\x0a\xb0\xf6\xf3\
+\xd9\xea\xb6\xcd\x44\x28\x50\x19\xc1\xb6\x92\xb7\xe9\x45\xd0\x5c\
+\x1f\x0b\xa5\xf4\x0d\xe3\x3d\xf6\xec\x2a\x25\xfb\xb5\x1a\x49\x00\
+\x50\x4a\x22\x60\x93\xf6\xcc\xf2\x48\x88\x2c\x99\xbd\x45\x49\xd0\
+\x30\x2a\x42\x9c\x13\x80\xec\xca\x8f\x55\x95\x04\x94\xb4\x91\x3f\
+\xd9\x27\xae\xc4\xdb\x37\xd9\x10\x7f\xa9\xe9\x80\x5b\xb7\x04\x6f\
+\x0d\x79\xb2\x24\x18\xf4\x33\x90\x40\x0c\xea\x6d\x84\xfd\xc3\xc2\
+\x04\xbe\xc6\x88\x86\xcd\x55\xff\x99\x32\xd3\xda\x94\x86\x1d\x4a\
+\xce\x12\xed\xc9\x4a\xa0\x83\x74\x01\x21\x03\xd1\x89\xa3\x50\x03\
+\x6d\xed\x8b\xfa\x59\x97\xbe\x19\xcb\x65\x54\x90\xc3\x80\x06\x3e\
+\x41\x19\x70\xab\xe4\x46\x0a\xc4\x60\x25\x3e\x33\x6d\x4b\x00\xa2\
+\x82\xd0\xb1\x29\x5c\xa3\x12\x80\x78\x16\x96\x15\xa4\x6d\x5a\xd1\
+\xcd\xdc\x5c\xd4\xb8\x00\x50\x42\xa9\x2e\xca\x61\xcf\x86\x86\x1f\
+\x81\x7d\x0c\xb1\x11\xaf\x85\x28\xe3\x83\x87\x62\x04\x37\xb3\x3a\
+\x29\x06\xfd\xb7\xe3\xc3\x11\xa4\x32\x9a\x93\x8a\x6d\xf1\x89\x81\
+\x20\x95\xd3\x40\xe4\x88\xa9\x24\xb1\x1f\x57\x58\xac\x19\xbe\x10\
+\xba\x7f\x7d\x29\xae\x1d\x60\x19\xb5\x63\x55\x36\x0f\x70\x89\x59\
+\xf0\x7a\x4c\x5e\x3a\x06\xd9\xa5\x92\xda\xf2\x92\x80\x3a\x75\x61\
+\x74\xb5\xaa\x36\x2e\xc3\x5c\xd2\x84\x95\x24\x14\x6d\xfc\x7e\xbd\
+\xad\x3d\xff\x6c\x0f\x01\xc4\x27\x10\xea\x85\xaf\xb5\x08\xd9\xb4\
+\x31\x9b\xde\x48\x43\xc9\x90\x95\x1c\x9a\xaf\x6c\x68\x4b\x26\xa2\
+\xd4\xd1\x5f\xdb\xc8\x70\x7a\xf2\x1f\xa5\xe8\xe9\x37\x6b\x4e\xd3\
+\x1f\x16\xec\xcd\xd8\x02\x17\x09\x20\x51\xc6\x68\xb4\x45\xab\xa5\
+\x5f\xab\x5e\xd4\x14\x12\xb0\x6a\xb8\x35\xf6\x97\x45\x31\x52\x7d\
+\xfd\x42\xd0\xbf\xfa\x3a\xa8\xb5\x4c\x03\x15\xd6\x2e\x4e\x06\xd3\
+\xd0\x0a\x23\x67\x8d\x3a\x35\x7e\x9e\xb6\xe4\x22\x4a\x19\x01\xb4\
+\xc3\xd4\x71\x26\x73\x7c\x44\x48\xa8\xe9\xb9\xd6\xc0\x5d\x44\x6f\
+\x20\xab\x4f\xa5\xf7\xd4\x51\x0c\xea\x0f\xdb\x56\x79\x15\x4b\xfe\
+\x22\xcb\x5c\xad\x49\xfc\x8b\x8f\x13\x26\xfc\x18\xfc\x74\x55\x44\
+\xd7\x30\x68\x0a\x0b\xdc\x8f\xe4\x7c\x78\x39\xd5\xd1\x2f\x9d\x04\
+\x64\x4a\x48\x47\x99\x3d\xdd\xa2\xca\x80\x44\xba\xb7\x2c\x12\x8f\
+\x2a\x23\x25\x92\x00\x5b\xf6\xeb\x31\x31\x9f\xba\xa5\x07\x5f\xef\
+\x97\x7e\xbf\xf9\xba\x48\x13\x8b\x0a\xf9\x61\x23\xfe\x85\x2d\x9d\
+\x4f\x3e\x5c\xdc\xc8\x88\x61\xbe\x05\x78\x29\xd5\xaf\x22\xcd\x3c\
+\x27\x4f\x63\x20\xca\x91\x0f\x8e\xda\xa0\x68\x97\x5f\x59\x9b\xc2\
+\x48\x79\x6b\x1e\xa4\x48\xd7\x36\x4b\x3c\x43\x09\x44\x2a\x4b\x22\
+\x5b\x4f\x00\xda\xcf\x03\xb0\x89\xca\xd9\xc7\x63\xf3\x62\x48\x33\
+\xf1\xa4\x98\xf7\x40\x36\xcf\x25\x69\xe3\x3d\x30\x89\x8a\xf1\x19\
+\xe1\x28\xb6\xd3\x1f\x24\xc0\xb8\x81\x86\xaa\x56\xf5\x60\x10\xc5\
+\x90\x80\xb4\x07\x34\x68\x01\x02\x41\x39\xd0\x73\xda\xa8\x5f\xfc\
+\x67\xd3\xaa\xf1\xc0\xd4\x9d\xb7\x66\xa4\xba\x14\x2e\x6a\x22\xb9\
+\x0a\x52\xa4\x76\x51\x13\x01\x3c\x84\xe2\x36\x91\xe9\xed\x88\xfc\
+\x1e\x1f\xb2\xf4\xdc\x50\x01\x59\xe4\x20\x67\xd2\x21\xad\x6a\xe4\
+\x15\xac\x6f\xaf\x60\x1b\xfb\x90\xd6\x5b\xaa\x7e\x55\x02\xc0\xcf\
+\xc7\x43\x96\x4d\xb4\xa7\x65\xa3\x9e\x46\x34\x1d\xec\xef\x11\x16\
+\xd2\xc0\x6f\x8f\xdd\x71\x63\x49\xa9\xbd\xa5\x12\x66\x4c\x16\x14\
+\x99\x7b\x37\x05\x50\xdc\xd8\xe7\x76\x60\x90\xb3\xa2\x7b\x15\xb2\
+\x0b\x92\xf9\x28\x87\xe4\x86\x5a\x84\x83\xc3\xd4\x89\xa8\x2c\xf2\
+\x6e\xfb\x2d\x78\x9b\x41\x00\xd0\x00\xa0\x2f\xa8\x01\xf2\x5d\x7f\
+\x9f\x4f\x8b\x53\x00\x5a\x1b\x7b\x50\xff\xc1\x26\x28\x87\x51\x6e\
+\x83\xf9\x5b\x4d\x00\x90\x1d\x7a\x4e\x04\x18\xad\x9a\x4d\x10\xdc\
+\xd2\x60\x6a\xfb\xfb\xe8\x23\x6a\x76\xa8\x31\x00\x65\x86\x91\x65\
+\xb9\x8b\x20\xd5\x4e\x37\x87\x44\xd7\xde\x5e\x5f\x11\xc7\xbf\xa2\
+\x89\x43\xda\xf5\x20\x4b\xa2\x84\xac\x3d\xdb\x2c\xc2\x5e\x42\x40\
+\xa3\x1a\x19\x2d\x91\xbc\x16\x92\x6b\x1d\x0f\xaa\x1b\x41\xd4\x3e\
+\xf2\x54\x60\x32\x40\x08\x03\x55\xe2\x9a\x02\x61\x8e\x74\x6e\xd4\
+\x14\xf2\xd0\x1e\x7d\x80\xa8\xe5\x04\x28\x0f\x8d\xca\x37\xff\x89\
+\x32\xfb\xfb\x69\x23\x78\xf2\x10\x9e\x11\xbe\x7d\x9a\xc4\x29\x80\
+\x58\x16\x9b\x13\x6f\x57\x02\x10\xdb\xb3\x7c\x94\xf3\x33\xab\x02\
+\x79\xac\x11\xfe\x52\x7f\x9f\x43\x91\x3d\x11\xf5\x5b\x02\x50\xe4\
+\xfb\x03\x47\x8c\x2c\x5e\x00\x16\x42\x00\x1c\x0f\x35\xc1\x60\xb5\
+\x05\x94\xa8\x81\x20\x53\xb4\xb7\x93\x7c\xd0\xdc\xd4\x31\xb5\x34\
+\xd2\x5a\xfc\x41\xaa\xe5\xa8\x75\xa1\x02\x01\xb0\xc6\x98\xeb\x46\
+\x02\x10\x41\xc2\x48\x28\x21\xa0\x53\xd4\xc1\xb0\xd6\x46\x46\x6b\
+\x23\x1a\xdc\xa8\xa0\xee\x42\xda\xef\x64\x55\xf3\x76\x0f\x06\xeb\
+\x98\x53\x35\x3e\xb7\x8f\xe4\x28\x5d\x7c\xb4\xcf\xb1\x3d\x77\x31\
+\xb3\x98\xc4\x88\x6a\xcc\x9c\xca\xce\xc6\x8e\xdb\x9d\x46\x86\x17\
+\x01\xd5\x17\xf0\x23\xed\x9c\x6c\xba\xdf\x05\x90\x04\x4d\xa6\xb6\
+\xf9\x64\x00\x35\x44\x08\x2c\x35\x68\x1e\x94\x25\x9a\xa4\x57\x48\
+\x6e\x83\xcf\x64\xd2\x14\x2b\xb2\xca\x7f\x17\x73\x10\x4d\x7b\xce\
+\x8a\xc0\xd4\x28\x57\xfb\x5e\x22\x9a\x5e\x2b\x42\x35\xa8\xe5\xaa\
+\xde\xe9\x87\x00\x98\x6c\xdd\xe6\x9d\x4b\x23\x9c\xa7\x66\x0a\xca\
+\x76\x88\x03\xb5\x7b\x9f\x44\x19\xf1\xaa\x91\xa2\x69\xe0\x51\x80\
+\x41\xed\xc9\x80\x8a\xb9\x04\xb2\x3e\x6d\x98\x22\x31\xdb\x48\x72\
+\x60\x5f\x78\xd7\xb3\x89\x04\x45\x19\x0a\x75\x59\x02\x43\x4d\x3a\
+\x62\x19\xbd\xec\x20\x87\xe4\x58\xa4\x2d\x50\xc4\x7f\x20\xef\x35\
+\x22\xc8\xf6\x36\x40\x96\x7b\x86\xda\x9c\xb1\x07\x05\x12\x3a\x93\
+\x4b\x91\xec\xf3\x65\xfb\x65\xeb\xd3\x18\x8a\x98\x89\x9a\x9a\xc4\
+\xd0\x0d\xaa\xf2\xb8\x1a\x86\xd1\x8f\x40\x0e\x32\xa6\x04\xd2\x8c\
+\x5a\x94\x2f\x83\x2d\x8b\xaf\xa7\xf4\x39\xc3\xfc\x4a\xbe\x22\xce\
+\x2d\xf9\xbd\xb4\x1e\x7f\x9c\xb8\x98\xe7\x25\x51\xee\x17\x2e\x0a\
+\x32\x46\x8b\xd3\x51\x85\xa2\x70\x6c\x10\x6b\x65\x05\x19\xf3\xdb\
+\x91\x65\x03\x8f\x5a\x9c\xbf\xce\x53\x06\xcc\x2b\x06\xb2\x95\x0a\
+\x9d\x7e\x67\xb6\xa3\x02\x9f\xe3\xf4\x44\xbe\xf5\xf9\xf5\x55\x69\
+\x84\x6e\xd5\x3d\x8a\x7c\xf6\xfa\x8d\x03\xd0\x88\xe8\x87\x5b\x88\
+\x10\x53\x04\x12\xb3\x21\x15\xfa\xe6\x91\x26\xf3\x9b\xce\xd6\x2f\
+\x9a\x69\x26\x88\x21\x9e\x2d\x70\xd7\x1a\xd4\x38\x08\x0b\xf4\xc9\
+\x51\x41\x44\x22\x6c\x32\x5b\x0f\x1a\x08\x98\x19\xd7\xe3\x69\x08\
+\x90\x27\x18\xff\x28\xc3\x63\x20\xb9\x39\xa8\x1e\x64\x94\x5a\x99\
+\x18\x93\x00\x92\xc5\xdf\x44\xc5\xd3\xf0\x6c\x76\xf6\x14\x46\x3c\
+\x28\x3a\xbe\xed\xfa\xcc\x60\xaa\x5b\x20\xa7\x99\x53\x99\x3e\x02\
+\x69\x64\x23\xdd\xab\x00\x59\x24\x7d\xc3\x1c\xb6\x7d\x72\x7a\x21\
+\x2b\x09\x68\xa7\xc9\x4d\x82\x79\xdf\x96\x56\x65\xd0\x84\x1c\x6f\
+\x7f\x6f\xf8\x41\x03\x50\xf6\xff\xbd\xc3\xfd\x5f\x17\x70\x83\x9c\
+\x73\x0b\x9a\xe4\x5a\x0d\x7c\x22\x42\x62\xd7\xff\x0f\x87\x4d\x15\
+\x2e\x29\x0b\x6c\x08\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\
+\x82\
+"
+
+qt_resource_name = b"\
+\x00\x05\x00\x6f\xa6\x53\x00\x69\x00\x63\x00\x6f\x00\x6e\x00\x73\
+\x00\x12\x00\x24\x62\x87\x00\x64\x00\x72\x00\x61\x00\x67\x00\x6f\
+\x00\x6e\x00\x5f\x00\x69\x00\x63\x00\x6f\x00\x6e\x00\x5f\x00\x34\
+\x00\x38\x00\x2e\x00\x70\x00\x6e\x00\x67\x00\x13\x0d\xb6\x0b\x47\
+\x00\x64\x00\x72\x00\x61\x00\x67\x00\x6f\x00\x6e\x00\x5f\x00\x69\
+\x00\x63\x00\x6f\x00\x6e\x00\x5f\x00\x35\x00\x31\x00\x32\x00\x2e\
+\x00\x70\x00\x6e\x00\x67\
+"
+
+qt_resource_struct_v1 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\x00\x00\
+\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x10\
+\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x3a\x00\x00\
+\x00\x00\x00\x01\x00\x00\x09\xd6\
+"
+
+qt_resource_struct_v2 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\
+\x00\x00\x00\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\
+\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x3a\x00\x00\x00\x00\x00\x01\x00\x00\x09\xd6\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+"
+
+qt_version = [int(v) for v in QtCore.qVersion().split('.')]
+if qt_version < [5, 8, 0]:
+    rcc_version = 1
+    qt_resource_struct = qt_resource_struct_v1
+else:
+    rcc_version = 2
+    qt_resource_struct = qt_resource_struct_v2
+
+def qInitResources():
+    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()